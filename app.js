@@ -1,4 +1,45 @@
-document.addEventListener('DOMContentLoaded', () => {
+// Map data is split into hashed per-layer modules listed in a small manifest
+// (see data_bundle.py); ward modules are imported per panchayat when first shown
+const MANIFEST_URL = 'layers/manifest.json';
+
+function createDataLoader(manifestUrl) {
+    const base = new URL(manifestUrl, document.baseURI);
+    const modules = new Map();
+    let manifestPromise = null;
+
+    function load(path) {
+        if (!modules.has(path)) {
+            modules.set(path, import(new URL(path, base).href).then(module => module.default));
+        }
+        return modules.get(path);
+    }
+
+    return {
+        manifest() {
+            if (!manifestPromise) {
+                // Module names change with their content, only the manifest is revalidated
+                manifestPromise = fetch(base, { cache: 'no-cache' }).then(response => {
+                    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+                    return response.json();
+                });
+            }
+            return manifestPromise;
+        },
+        async layer(name) {
+            const manifest = await this.manifest();
+            return load(manifest.layers[name]);
+        },
+        // Wards of the named panchayats, or of all of them
+        async wards(names = null) {
+            const manifest = await this.manifest();
+            const files = (names || Object.keys(manifest.wards)).map(name => manifest.wards[name]).filter(Boolean);
+            const collections = await Promise.all(files.map(load));
+            return { type: 'FeatureCollection', features: collections.flatMap(c => c.features) };
+        }
+    };
+}
+
+document.addEventListener('DOMContentLoaded', async () => {
     // Initialize map
     const map = L.map('map', {
         zoomControl: true,
@@ -12,6 +53,7 @@ document.addEventListener('DOMContentLoaded', () => {
     let history = []; // Stack to track navigation
     let currentFilter = null; // Track current filter for history
     let currentLabel = 'Thiruvalla AC'; // Track current label for breadcrumbs
+    let renderToken = 0; // Latest render wins when layers are still loading
 
     // UI Elements
     const backBtn = document.createElement('button');
@@ -26,13 +68,17 @@ document.addEventListener('DOMContentLoaded', () => {
     const legendContainer = document.getElementById('legend');
 
     // Check data
-    if (typeof thiruvallaData === 'undefined') {
-        console.error('Data not loaded');
+    const thiruvallaData = createDataLoader(MANIFEST_URL);
+    let manifest;
+    try {
+        manifest = await thiruvallaData.manifest();
+    } catch (err) {
+        console.error('Data not loaded', err);
         return;
     }
 
     // Update total stats
-    document.getElementById('total-wards').textContent = thiruvallaData.wards.features.length;
+    document.getElementById('total-wards').textContent = manifest.counts.wards;
 
     // Colors
     const colors = {
@@ -80,11 +126,8 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 
     // Render Function
-    function renderLevel(level, filterFn = null, label = null) {
-        if (currentLayer) {
-            map.removeLayer(currentLayer);
-        }
-
+    async function renderLevel(level, filterFn = null, label = null) {
+        const token = ++renderToken;
         currentFilter = filterFn;
         if (label) currentLabel = label;
 
@@ -92,21 +135,32 @@ document.addEventListener('DOMContentLoaded', () => {
 
         let data;
         if (level === 'AC') {
-            data = thiruvallaData.ac;
+            data = await thiruvallaData.layer('ac');
         } else if (level === 'MANDAL') {
-            data = thiruvallaData.mandals;
+            data = await thiruvallaData.layer('mandals');
         } else if (level === 'PANCHAYAT') {
+            const panchayats = await thiruvallaData.layer('panchayats');
             data = {
                 type: 'FeatureCollection',
-                features: thiruvallaData.panchayats.features.filter(safeFilter)
+                features: panchayats.features.filter(safeFilter)
             };
         } else if (level === 'WARD') {
+            // Panchayats carry the same LSGD / Mandal properties as their wards, so
+            // the filter picks out which ward modules are needed
+            const panchayats = await thiruvallaData.layer('panchayats');
+            const names = filterFn ? panchayats.features.filter(safeFilter).map(f => f.properties.LSGD) : null;
+            const wards = await thiruvallaData.wards(names);
             data = {
                 type: 'FeatureCollection',
-                features: thiruvallaData.wards.features.filter(safeFilter)
+                features: wards.features.filter(safeFilter)
             };
         }
 
+        if (token !== renderToken) return;
+        if (currentLayer) {
+            map.removeLayer(currentLayer);
+        }
+
         // Update Legend
         updateLegend(data.features, level);
 
@@ -366,7 +420,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
             // Get the correct dataset based on selection
             if (selectedLevel === 'AC') {
-                dataFeatures = thiruvallaData.ac.features;
+                dataFeatures = (await thiruvallaData.layer('ac')).features;
                 columns = ['Color', 'Name', 'Level'];
                 tableData = dataFeatures.map(f => [
                     '', // Color placeholder
@@ -374,7 +428,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     f.properties.Level
                 ]);
             } else if (selectedLevel === 'MANDAL') {
-                dataFeatures = thiruvallaData.mandals.features;
+                dataFeatures = (await thiruvallaData.layer('mandals')).features;
                 columns = ['Color', 'Mandal Name', 'Level'];
                 tableData = dataFeatures.map(f => [
                     '',
@@ -382,7 +436,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     f.properties.Level
                 ]);
             } else if (selectedLevel === 'PANCHAYAT') {
-                dataFeatures = thiruvallaData.panchayats.features;
+                dataFeatures = (await thiruvallaData.layer('panchayats')).features;
                 columns = ['Color', 'LSGD Name', 'Type', 'Mandal'];
                 tableData = dataFeatures.map(f => [
                     '',
@@ -391,7 +445,7 @@ document.addEventListener('DOMContentLoaded', () => {
                     f.properties.Mandal
                 ]);
             } else if (selectedLevel === 'WARD') {
-                dataFeatures = thiruvallaData.wards.features;
+                dataFeatures = (await thiruvallaData.wards()).features;
                 columns = ['Color', 'Ward No', 'Ward Name', 'LSGD Name', 'Mandal', 'District'];
                 // Sort by Ward No
                 dataFeatures.sort((a, b) => (parseInt(a.properties.Ward_No) || 0) - (parseInt(b.properties.Ward_No) || 0));
@@ -449,8 +503,11 @@ document.addEventListener('DOMContentLoaded', () => {
         document.getElementById('info-panel').classList.add('hidden'); // Hide info panel on transition
     }
 
-    // Initial Render
-    renderLevel('AC');
+    // Initial Render, then warm the next levels while the user looks at the AC
+    renderLevel('AC').then(() => {
+        thiruvallaData.layer('mandals');
+        thiruvallaData.layer('panchayats');
+    });
 
     // Info Panel Logic
     const infoPanel = document.getElementById('info-panel');
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Content-hash build cache for the boundary generators
+Dissolved geometries are keyed by the hash of their ward source files and CSV rows,
+so a rerun only recomputes the LB → mandal → AC → district chains that changed
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+from shapely import wkb
+
+CACHE_DIR = 'data/cache/build'
+MANIFEST_VERSION = 2
+
+
+def file_digest(data):
+    """SHA-1 of a source file's raw bytes"""
+    return hashlib.sha1(data).hexdigest()
+
+
+def make_key(*parts):
+    """Stable cache key for any JSON-serialisable combination of inputs"""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class BuildCache:
+    """
+    Per-generator store of dissolved geometries (WKB) with their ward counts and
+    the digests of the ward source files they were built from.
+    """
+
+    def __init__(self, namespace, cache_dir=CACHE_DIR, reuse=True):
+        self.root = os.path.join(cache_dir, namespace)
+        self.manifest_path = os.path.join(self.root, 'manifest.json')
+        self.reuse = reuse
+        self.hits = 0
+        self.misses = 0
+        self._manifest = {}
+        self._touched = {}
+
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            if manifest.get('version') == MANIFEST_VERSION:
+                self._manifest = manifest['entries']
+            else:
+                # Another layout: its geometries cannot be checked against their sources
+                shutil.rmtree(self.root, ignore_errors=True)
+
+    def _path(self, level, key):
+        return os.path.join(self.root, level, f'{key}.wkb')
+
+    def get(self, level, key):
+        """Return (geometry, ward_count) for a cached key, or None"""
+        entry = self._manifest.get(level, {}).get(key)
+        path = self._path(level, key)
+        if not self.reuse or entry is None or not os.path.exists(path):
+            self.misses += 1
+            return None
+
+        with open(path, 'rb') as f:
+            geom = wkb.loads(f.read())
+        self._touched.setdefault(level, {})[key] = entry
+        self.hits += 1
+        return geom, entry['wards']
+
+    def put(self, level, key, geom, count, sources=()):
+        """Store a geometry; sources are the digests of the ward files it was built from"""
+        path = self._path(level, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(wkb.dumps(geom))
+        os.replace(tmp_path, path)
+        self._touched.setdefault(level, {})[key] = {'wards': count, 'sources': sorted(s for s in sources if s)}
+
+    def export(self):
+        """Entries used in this process, for merging results from worker processes"""
+        return {'touched': self._touched, 'hits': self.hits, 'misses': self.misses}
+
+    def merge(self, exported):
+        for level, entries in exported['touched'].items():
+            self._touched.setdefault(level, {}).update(entries)
+        self.hits += exported['hits']
+        self.misses += exported['misses']
+
+    def save(self, live_sources=None):
+        """
+        Write the manifest. Entries this run did not use are kept while every
+        source they were built from is still among live_sources (a failed,
+        interrupted or filtered run keeps the rest of the cache); entries whose
+        sources are gone, or unknown, are deleted.
+        """
+        live_sources = set(live_sources or ())
+        for level, entries in self._manifest.items():
+            touched = self._touched.setdefault(level, {})
+            for key, entry in entries.items():
+                if key in touched:
+                    continue
+                if entry['sources'] and live_sources.issuperset(entry['sources']):
+                    touched[key] = entry
+                    continue
+                path = self._path(level, key)
+                if os.path.exists(path):
+                    os.remove(path)
+
+        self._manifest = self._touched
+        self._touched = {level: dict(entries) for level, entries in self._manifest.items()}
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self._manifest}, f, sort_keys=True)
+
+    def report(self):
+        total = self.hits + self.misses
+        if total:
+            print(f"\n♻️  Build cache: {self.hits} reused, {self.misses} rebuilt "
+                  f"({self.hits / total * 100:.1f}% reused)")
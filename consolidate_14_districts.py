@@ -3,10 +3,18 @@
 Consolidate 30 org districts into 14 actual Kerala government districts
 """
 
+import argparse
 import json
 import os
+import shutil
 from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
+
+from dissolve_engine import merge_parts
+from geostore import GeoStoreWriter, STORE_DIR, report as report_store
+from lsg_hierarchy import clean_id
+import metrics
+from output_writer import write_json
+from topology import TopologyBuilder, write_topology
 
 # Map 14 actual districts to their org districts
 DISTRICT_CONSOLIDATION = {
@@ -26,6 +34,169 @@ DISTRICT_CONSOLIDATION = {
     'kasaragod': ['Kasaragod']
 }
 
+def unique_id(name, seen):
+    """Clean id that is unique among its siblings"""
+    base = clean_id(name) or 'unnamed'
+    item_id, n = base, 2
+    while item_id in seen:
+        item_id, n = f'{base}_{n}', n + 1
+    seen.add(item_id)
+    return item_id
+
+def hierarchy_rows(district_id, consolidated):
+    """
+    (level, properties, geometry) for every unit of a consolidated district,
+    with ids in the shard layout: <district>/<ac>/<mandal>/<local body>/<ward number>
+    """
+    yield 'district', {'id': district_id, 'name': consolidated.get('name', district_id)}, consolidated.get('geometry')
+    ac_ids = set()
+    for ac in consolidated.get('acs', []):
+        ac_key = f"{district_id}/{unique_id(ac['name'], ac_ids)}"
+        yield 'ac', {'id': ac_key, 'name': ac['name'], 'parent': district_id}, ac.get('geometry')
+
+        mandal_ids = set()
+        for mandal in ac.get('mandals', []):
+            mandal_key = f"{ac_key}/{unique_id(mandal['name'], mandal_ids)}"
+            yield 'mandal', {'id': mandal_key, 'name': mandal['name'], 'parent': ac_key}, mandal.get('geometry')
+
+            lb_ids = set()
+            for lb in mandal.get('local_bodies', []):
+                lb_key = f"{mandal_key}/{unique_id(lb['name'], lb_ids)}"
+                yield 'local_body', {'id': lb_key, 'name': lb['name'], 'parent': mandal_key,
+                                     'code': lb.get('code'), 'type': lb.get('type')}, lb.get('geometry')
+
+                ward_ids = set()
+                for ward in lb.get('wards', []):
+                    ward_key = f"{lb_key}/{unique_id(str(ward.get('ward_number')), ward_ids)}"
+                    yield 'ward', {'id': ward_key, 'name': ward.get('ward_name'), 'parent': lb_key,
+                                   'ward_number': ward.get('ward_number')}, ward.get('geometry')
+
+def bbox(geometry):
+    """[minx, miny, maxx, maxy] of a geometry or feature, rounded for the index"""
+    if not geometry:
+        return None
+    try:
+        return [round(v, 6) for v in shape(geometry).bounds]
+    except Exception:
+        return None
+
+def write_district_topology(path, index, consolidated):
+    """
+    All levels of a district in one shared-arc topology: each ward edge is
+    stored once and reused by the local body, mandal and AC outlines on it
+    """
+    builder = TopologyBuilder()
+    for ac, ac_entry in zip(consolidated['acs'], index['acs']):
+        builder.add('acs', {'id': ac_entry['id'], 'name': ac['name']}, ac.get('geometry'))
+        for mandal, mandal_entry in zip(ac.get('mandals', []), ac_entry['mandals']):
+            mandal_key = f"{ac_entry['id']}/{mandal_entry['id']}"
+            builder.add('mandals', {'id': mandal_key, 'name': mandal['name']}, mandal.get('geometry'))
+            for lb, lb_entry in zip(mandal.get('local_bodies', []), mandal_entry['local_bodies']):
+                lb_key = f"{mandal_key}/{lb_entry['id']}"
+                builder.add('local_bodies', {'id': lb_key, 'name': lb['name'], 'code': lb.get('code'),
+                                             'type': lb.get('type')}, lb.get('geometry'))
+                for ward in lb.get('wards', []):
+                    builder.add('wards', {'local_body': lb_key,
+                                          'ward_number': ward.get('ward_number'),
+                                          'ward_name': ward.get('ward_name')}, ward.get('geometry'))
+    return write_topology(path, builder)
+
+def write_shards(output_dir, district_id, consolidated):
+    """
+    Split a consolidated district into lazily loadable shards:
+    a small index (names, ids, bboxes, counts) plus one geometry file per
+    district, AC, mandal and local body
+    """
+    shard_dir = os.path.join(output_dir, district_id)
+    if os.path.isdir(shard_dir):
+        shutil.rmtree(shard_dir)
+    
+    index = {
+        'id': district_id,
+        'name': consolidated['name'],
+        'bbox': bbox(consolidated.get('geometry')),
+        'shard': 'district.json',
+        'counts': {'acs': 0, 'mandals': 0, 'local_bodies': 0, 'wards': 0},
+        'acs': []
+    }
+    district_shard = {
+        'id': district_id,
+        'name': consolidated['name'],
+        'geometry': consolidated.get('geometry'),
+        'acs': []
+    }
+    
+    ac_ids = set()
+    for ac in consolidated['acs']:
+        ac_id = unique_id(ac['name'], ac_ids)
+        ac_entry = {
+            'id': ac_id,
+            'name': ac['name'],
+            'bbox': bbox(ac.get('geometry')),
+            'shard': f'{ac_id}/ac.json',
+            'counts': {'mandals': 0, 'local_bodies': 0, 'wards': 0},
+            'mandals': []
+        }
+        ac_shard = {'id': ac_id, 'name': ac['name'], 'geometry': ac.get('geometry'), 'mandals': []}
+        district_shard['acs'].append({'id': ac_id, 'name': ac['name'], 'geometry': ac.get('geometry')})
+        
+        mandal_ids = set()
+        for mandal in ac.get('mandals', []):
+            mandal_id = unique_id(mandal['name'], mandal_ids)
+            mandal_entry = {
+                'id': mandal_id,
+                'name': mandal['name'],
+                'bbox': bbox(mandal.get('geometry')),
+                'shard': f'{ac_id}/{mandal_id}/mandal.json',
+                'local_bodies': []
+            }
+            mandal_shard = {'id': mandal_id, 'name': mandal['name'],
+                            'geometry': mandal.get('geometry'), 'local_bodies': []}
+            ac_shard['mandals'].append({'id': mandal_id, 'name': mandal['name'],
+                                        'geometry': mandal.get('geometry')})
+            
+            lb_ids = set()
+            for lb in mandal.get('local_bodies', []):
+                lb_id = unique_id(lb['name'], lb_ids)
+                ward_count = len(lb.get('wards', []))
+                lb_shard_path = f'{ac_id}/{mandal_id}/{lb_id}.json'
+                mandal_entry['local_bodies'].append({
+                    'id': lb_id,
+                    'name': lb['name'],
+                    'code': lb.get('code'),
+                    'type': lb.get('type'),
+                    'wards': ward_count,
+                    'bbox': bbox(lb.get('geometry')),
+                    'shard': lb_shard_path
+                })
+                mandal_shard['local_bodies'].append({
+                    'id': lb_id,
+                    'name': lb['name'],
+                    'code': lb.get('code'),
+                    'type': lb.get('type'),
+                    'geometry': lb.get('geometry')
+                })
+                write_json(os.path.join(shard_dir, lb_shard_path), dict(lb, id=lb_id), report=False)
+                
+                ac_entry['counts']['local_bodies'] += 1
+                ac_entry['counts']['wards'] += ward_count
+            
+            ac_entry['counts']['mandals'] += 1
+            ac_entry['mandals'].append(mandal_entry)
+            write_json(os.path.join(shard_dir, mandal_entry['shard']), mandal_shard, report=False)
+        
+        for key in ('mandals', 'local_bodies', 'wards'):
+            index['counts'][key] += ac_entry['counts'][key]
+        index['counts']['acs'] += 1
+        index['acs'].append(ac_entry)
+        write_json(os.path.join(shard_dir, ac_entry['shard']), ac_shard, report=False)
+    
+    write_json(os.path.join(shard_dir, 'district.json'), district_shard, report=False)
+    write_district_topology(os.path.join(shard_dir, 'topology.json'), index, consolidated)
+    index['topology'] = 'topology.json'
+    write_json(os.path.join(shard_dir, 'index.json'), index, report=False)
+    return index
+
 def consolidate():
     print("🔄 Consolidating 30 org districts into 14 actual districts...")
     print("=" * 70)
@@ -33,59 +204,78 @@ def consolidate():
     input_dir = 'data/complete_hierarchy'
     output_dir = 'data/14_districts'
     os.makedirs(output_dir, exist_ok=True)
+    store = GeoStoreWriter()
+    run = metrics.current()
     
-    for actual_district, org_districts in DISTRICT_CONSOLIDATION.items():
-        print(f"\n📍 Processing: {actual_district.upper()}")
-        print(f"   Consolidating: {', '.join(org_districts)}")
+    with run.stage('districts'):
+        for actual_district, org_districts in DISTRICT_CONSOLIDATION.items():
+            print(f"\n📍 Processing: {actual_district.upper()}")
+            print(f"   Consolidating: {', '.join(org_districts)}")
         
-        consolidated = {
-            'name': actual_district,
-            'acs': []
-        }
+            consolidated = {
+                'name': actual_district,
+                'acs': []
+            }
         
-        all_geometries = []
+            all_geometries = []
         
-        for org_district in org_districts:
-            # Create clean filename
-            clean_name = org_district.lower().replace(' ', '').replace('-', '')
-            filepath = os.path.join(input_dir, f'{clean_name}.json')
+            for org_district in org_districts:
+                # Create clean filename
+                clean_name = org_district.lower().replace(' ', '').replace('-', '')
+                filepath = os.path.join(input_dir, f'{clean_name}.json')
             
-            if not os.path.exists(filepath):
-                print(f"   ⚠️  Warning: {filepath} not found")
-                continue
+                if not os.path.exists(filepath):
+                    print(f"   ⚠️  Warning: {filepath} not found")
+                    continue
             
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+                with open(filepath, 'r') as f:
+                    data = json.load(f)
                 
-            # Add all ACs from this org district
-            consolidated['acs'].extend(data.get('acs', []))
+                # Add all ACs from this org district
+                consolidated['acs'].extend(data.get('acs', []))
             
-            # Collect all geometries for district boundary
-            for ac in data.get('acs', []):
-                if 'geometry' in ac:
-                    geom = shape(ac['geometry'])
-                    all_geometries.append(geom)
+                # Collect all geometries for district boundary
+                for ac in data.get('acs', []):
+                    if 'geometry' in ac:
+                        geom = shape(ac['geometry'])
+                        all_geometries.append(geom)
         
-        # Create consolidated district boundary
-        if all_geometries:
-            try:
-                district_boundary = unary_union(all_geometries)
-                consolidated['geometry'] = mapping(district_boundary)
-                print(f"   ✅ Created boundary with {len(all_geometries)} AC geometries")
-            except Exception as e:
-                print(f"   ❌ Error creating boundary: {e}")
+            # Create consolidated district boundary
+            if all_geometries:
+                try:
+                    with run.stage(actual_district):
+                        district_boundary, path = merge_parts(all_geometries)
+                    run.geometries(all_geometries, 'acs')
+                    consolidated['geometry'] = mapping(district_boundary)
+                    print(f"   ✅ Created boundary with {len(all_geometries)} AC geometries ({path})")
+                except Exception as e:
+                    print(f"   ❌ Error creating boundary: {e}")
         
-        # Save consolidated district
-        output_file = os.path.join(output_dir, f'{actual_district}.json')
-        with open(output_file, 'w') as f:
-            json.dump(consolidated, f, indent=2)
+            # Save consolidated district
+            output_file = os.path.join(output_dir, f'{actual_district}.json')
+            write_json(output_file, consolidated)
         
-        print(f"   ✅ Saved: {output_file}")
-        print(f"   📊 Total ACs: {len(consolidated['acs'])}")
+            print(f"   ✅ Saved: {output_file}")
+            print(f"   📊 Total ACs: {len(consolidated['acs'])}")
+        
+            # Per-level shards so pages only download what they render
+            index = write_shards(output_dir, actual_district, consolidated)
+            counts = index['counts']
+            print(f"   🧩 Shards: {output_dir}/{actual_district}/ "
+                  f"({counts['mandals']} mandals, {counts['local_bodies']} local bodies)")
+            store.add(hierarchy_rows(actual_district, consolidated))
+    
+    # Binary copy of every level for readers that only need a bbox worth of rows
+    print()
+    with run.stage('store'):
+        report_store(store.write(STORE_DIR), STORE_DIR)
     
     print("\n" + "=" * 70)
     print("✅ Consolidation complete!")
     print("=" * 70)
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Consolidate the org districts into the 14 districts')
+    metrics.add_arguments(parser)
+    metrics.start_run('consolidate_14_districts', parser.parse_args())
     consolidate()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Topology cleaning for district / AC / mandal polygons (mandals are cleaned, the
+levels above are dissolved from them)
+Snaps neighbours onto each other, gives every overlap and every small gap to
+exactly one neighbour and returns a true coverage (no cracks, no overlaps),
+instead of buffering each polygon out and back in on its own
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import shapely
+from shapely.geometry import mapping, shape
+
+from consolidate_14_districts import write_shards
+from dissolve_engine import merge_parts
+from geometry_array import as_array, from_geojson, repair
+from geostore import build_store
+from output_writer import write_json
+
+DISTRICTS_DIR = 'data/14_districts'
+
+# Gaps narrower than this (degrees, ≈ 110 m) are closed; wider ones (lakes,
+# backwaters between districts) are real and kept
+GAP_WIDTH = 0.001
+# Vertex snapping distance / grid size (≈ 1 m)
+SNAP_TOLERANCE = 1e-5
+
+HAS_COVERAGE_CLEAN = hasattr(shapely, 'coverage_clean')
+
+
+def adjacency_pairs(geoms, tolerance=0.0):
+    """(i, j) index pairs, i < j, of polygons within tolerance of each other"""
+    geoms = as_array(geoms)
+    tree = shapely.STRtree(geoms)
+    if tolerance:
+        left, right = tree.query(geoms, predicate='dwithin', distance=tolerance)
+    else:
+        left, right = tree.query(geoms, predicate='intersects')
+    keep = left < right
+    return np.column_stack([left[keep], right[keep]])
+
+
+def _sliver_width(geom):
+    """Width of a thin polygon, approximated as 2 · area / perimeter"""
+    return 2 * geom.area / geom.length if geom.length else 0.0
+
+
+def _parts(geom):
+    return list(getattr(geom, 'geoms', [geom])) if geom is not None else []
+
+
+def _drop_thin_holes(geom, gap_width):
+    """Fill a polygon's own cracks (between its wards) without any overlay"""
+    polygons = []
+    for polygon in _parts(geom):
+        if polygon.geom_type != 'Polygon' or polygon.is_empty:
+            continue
+        keep = [ring for ring in polygon.interiors if _sliver_width(shapely.Polygon(ring)) >= gap_width]
+        polygons.append(shapely.Polygon(polygon.exterior, keep) if len(keep) != len(polygon.interiors) else polygon)
+    if not polygons:
+        return geom
+    return polygons[0] if len(polygons) == 1 else shapely.MultiPolygon(polygons)
+
+
+def _union(parts, grid_size):
+    """Union of coverage parts (grid_size None) or snap-rounded union on the grid"""
+    if grid_size is None:
+        try:
+            return shapely.coverage_union_all(parts)
+        except shapely.errors.GEOSException:
+            pass
+    return shapely.union_all(parts, grid_size=grid_size)
+
+
+def _polygonal(geom):
+    """Area part of an overlay result (drops touching lines and points), or None"""
+    parts = [part for part in shapely.get_parts(geom) if part.geom_type == 'Polygon' and part.area > 0]
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else shapely.MultiPolygon(parts)
+
+
+def _resolve_overlaps(geoms, pairs, grid_size):
+    """Each overlap stays with the larger polygon of the pair; returns how many were cut"""
+    overlaps = 0
+    for i, j in pairs:
+        overlap = _polygonal(shapely.intersection(geoms[i], geoms[j], grid_size=grid_size))
+        if overlap is not None:
+            loser = j if shapely.area(geoms[i]) >= shapely.area(geoms[j]) else i
+            geoms[loser] = _polygonal(shapely.difference(geoms[loser], overlap, grid_size=grid_size))
+            overlaps += 1
+    return overlaps
+
+
+def _fill_gaps(geoms, gap_width, grid_size=None):
+    """
+    Merge every thin hole between neighbours into the neighbour it shares the
+    longest border with. Returns the number of gaps filled.
+    """
+    union = _union(geoms, grid_size)
+    holes = [shapely.Polygon(ring) for polygon in _parts(union) if polygon.geom_type == 'Polygon'
+             for ring in polygon.interiors]
+    holes = np.array([hole for hole in holes if _sliver_width(hole) < gap_width], dtype=object)
+    if not len(holes):
+        return 0
+
+    # Few large polygons against many small holes: index the holes, so each
+    # polygon is prepared once for all of its candidate holes
+    poly_idx, hole_idx = shapely.STRtree(holes).query(geoms, predicate='intersects')
+    if not len(hole_idx):
+        return 0
+
+    # Shared border length, measured against the neighbour clipped to the hole's box
+    bounds = shapely.bounds(holes)
+    border = np.zeros(len(hole_idx))
+    for k, (hole, poly) in enumerate(zip(hole_idx, poly_idx)):
+        x0, y0, x1, y1 = bounds[hole]
+        local = shapely.clip_by_rect(geoms[poly], x0 - gap_width, y0 - gap_width, x1 + gap_width, y1 + gap_width)
+        try:
+            border[k] = shapely.length(shapely.intersection(holes[hole].exterior, local))
+        except shapely.errors.GEOSException:
+            pass
+
+    order = np.lexsort((-border, hole_idx))
+    hole_idx, poly_idx = hole_idx[order], poly_idx[order]
+    first = np.unique(hole_idx, return_index=True)[1]
+
+    owners = {}
+    for hole, owner in zip(hole_idx[first], poly_idx[first]):
+        owners.setdefault(owner, []).append(holes[hole])
+    for owner, gaps in owners.items():
+        geoms[owner] = _union(np.array([geoms[owner]] + gaps, dtype=object), grid_size)
+    return len(first)
+
+
+def clean_coverage(geoms, gap_width=GAP_WIDTH, snap_tolerance=None):
+    """
+    Clean polygons into a coverage. Returns (cleaned array, stats) with the
+    method used, neighbour pairs, gaps filled and whether the result is a
+    valid coverage.
+    """
+    started = time.perf_counter()
+    geoms = repair(as_array(geoms))
+    geoms = np.array([_drop_thin_holes(geom, gap_width) for geom in geoms], dtype=object)
+    pairs = adjacency_pairs(geoms)
+    snap = SNAP_TOLERANCE if snap_tolerance is None else snap_tolerance
+    overlaps = None
+
+    if HAS_COVERAGE_CLEAN:
+        # GEOS nodes, snaps and resolves overlaps; gaps are cheaper to fill here
+        # than through its own gap merging
+        method = 'coverage_clean'
+        geoms = shapely.coverage_clean(geoms, gap_width=0.0, snapping_distance=snap)
+        gaps = _fill_gaps(geoms, gap_width)
+    else:
+        # Common vertex grid, then snap-rounded overlays along the adjacency graph.
+        # Crack-free on that grid, but shared edges are not vertex-matched
+        method = 'grid snap'
+        geoms = repair(shapely.set_precision(geoms, snap))
+        geoms[:] = [_polygonal(geom) for geom in geoms]
+        overlaps = _resolve_overlaps(geoms, pairs, snap)
+        gaps = _fill_gaps(geoms, gap_width, snap)
+
+    stats = {
+        'method': method,
+        'polygons': len(geoms),
+        'neighbour_pairs': len(pairs),
+        'overlaps': overlaps,
+        'gaps': gaps,
+        'coverage_valid': bool(shapely.coverage_is_valid(geoms))
+        if hasattr(shapely, 'coverage_is_valid') else None,
+        'seconds': time.perf_counter() - started,
+    }
+    return geoms, stats
+
+
+def report(label, stats):
+    valid = {True: '✅ valid coverage', False: '⚠️  not edge-matched', None: ''}[stats['coverage_valid']]
+    overlaps = f", {stats['overlaps']} overlaps cut" if stats['overlaps'] is not None else ''
+    print(f"   {label:<10} {stats['polygons']:>5} polygons, {stats['neighbour_pairs']:>5} neighbour pairs, "
+          f"{stats['gaps']} gaps filled{overlaps} ({stats['method']}, {stats['seconds']:.2f}s) {valid}")
+
+
+def _dissolve_children(parents, children_key, label):
+    """
+    Replace each parent's geometry with the union of its (cleaned) children so
+    the levels keep nesting; parents without any child geometry keep their own.
+    """
+    dissolved = kept = 0
+    for parent in parents:
+        parts = [shape(child['geometry']) for child in parent.get(children_key, []) if child.get('geometry')]
+        if not parts:
+            kept += parent.get('geometry') is not None
+            continue
+        geom, _ = merge_parts(parts)
+        parent['geometry'] = mapping(geom)
+        dissolved += 1
+    kept_note = f", {kept} without child geometry kept as they were" if kept else ''
+    print(f"   {label:<10} {dissolved:>5} dissolved from their cleaned children{kept_note}")
+
+
+def clean_districts(districts_dir=DISTRICTS_DIR, gap_width=GAP_WIDTH, snap_tolerance=None):
+    """
+    Clean the mandals of every district file state-wide, then rebuild the ACs
+    and districts from them, so every level is a coverage and still nests.
+    Run after consolidate_14_districts.py and before generate_resolutions.py
+    (the shards, with their topology.json, are rewritten here).
+    """
+    files = sorted(f for f in os.listdir(districts_dir) if f.endswith('.json'))
+    districts = {}
+    for file in files:
+        with open(os.path.join(districts_dir, file), 'r', encoding='utf-8') as f:
+            districts[file[:-len('.json')]] = json.load(f)
+
+    acs = [ac for data in districts.values() for ac in data.get('acs', [])]
+    # Cleaned across the whole state so borders between districts match too
+    mandals = [mandal for ac in acs for mandal in ac.get('mandals', []) if mandal.get('geometry')]
+
+    print("🧹 Cleaning shared boundaries...")
+    if mandals:
+        geoms = from_geojson([mandal['geometry'] for mandal in mandals])
+        cleaned, stats = clean_coverage(geoms, gap_width, snap_tolerance)
+        for mandal, geom in zip(mandals, cleaned):
+            if geom is not None and not geom.is_empty:
+                mandal['geometry'] = mapping(geom)
+        report('mandal', stats)
+    # Unions of a coverage's parts cancel the shared edges exactly, so
+    # AC and district borders are the very same cleaned mandal edges
+    _dissolve_children(acs, 'mandals', 'ac')
+    _dissolve_children(districts.values(), 'acs', 'district')
+
+    for district_id, data in districts.items():
+        write_json(os.path.join(districts_dir, f'{district_id}.json'), data, report=False)
+        write_shards(districts_dir, district_id, data)
+    print(f"✅ Cleaned {len(districts)} district files ({districts_dir})")
+    build_store(districts_dir, os.path.join(os.path.dirname(districts_dir), '14_districts_store'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Clean district/AC/mandal polygons into a crack-free coverage')
+    parser.add_argument('--districts-dir', default=DISTRICTS_DIR)
+    parser.add_argument('--gap-width', type=float, default=GAP_WIDTH,
+                        help=f'Close gaps narrower than this, in degrees (default {GAP_WIDTH})')
+    parser.add_argument('--snap', type=float, default=None,
+                        help='Vertex snapping distance in degrees (default: automatic)')
+    args = parser.parse_args()
+    clean_districts(args.districts_dir, args.gap_width, args.snap)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,9 +5,11 @@ Consolidate 30 organizational districts into 14 actual Kerala government distric
 
 import json
 from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
 import os
 
+from dissolve_engine import merge_parts
+from output_writer import write_json
+
 # Mapping from 30 org districts to 14 actual districts
 ORG_TO_ACTUAL = {
     'thiruvananthapuram_south': 'thiruvananthapuram',
@@ -130,7 +132,7 @@ def main():
                 continue
             
             # Merge all geometries into one
-            merged_geometry = unary_union(geometries)
+            merged_geometry, path = merge_parts(geometries)
             
             # Create feature
             new_feature = {
@@ -144,7 +146,7 @@ def main():
             }
             
             new_features.append(new_feature)
-            print(f"   ✅ Created boundary for {DISTRICT_NAMES[district_id]}")
+            print(f"   ✅ Created boundary for {DISTRICT_NAMES[district_id]} ({path})")
             
         except Exception as e:
             print(f"   ❌ Error merging {district_id}: {e}")
@@ -157,8 +159,7 @@ def main():
     
     # Save consolidated GeoJSON
     output_path = 'data/kerala_14_districts.geojson'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(final_geojson, f, indent=2)
+    write_json(output_path, final_geojson)
     
     print(f"\n✅ Created 14-district GeoJSON: {output_path}")
     print(f"📊 Total districts: {len(new_features)}")
@@ -181,8 +182,7 @@ def main():
         }
         
         individual_path = f'{district_dir}/district_boundary.geojson'
-        with open(individual_path, 'w', encoding='utf-8') as f:
-            json.dump(individual_geojson, f, indent=2)
+        write_json(individual_path, individual_geojson)
         
         print(f"✅ {district_name} → {individual_path}")
     
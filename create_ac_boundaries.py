@@ -3,95 +3,125 @@
 Generate AC-level boundaries by merging ward GeoJSON files
 """
 
-import json
-import csv
+import argparse
 import os
-from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
+from shapely.geometry import mapping
 from collections import defaultdict
 
-# Base path for ward JSON files
-WARD_JSONS_PATH = '/Users/devandev/Desktop/ward_jsons'
-CSV_FILE = f'{WARD_JSONS_PATH}/LSG Mapped - Sheet1.csv'
+from build_cache import BuildCache, make_key
+from dissolve_engine import merge_parts, path_summary
+from lsg_hierarchy import WARD_JSONS_PATH, load_hierarchy
+import metrics
+from output_writer import write_json
+from ward_ingest import load_store
 
 def clean_name(name):
     """Clean name for file/ID usage"""
     return name.lower().replace(' ', '_').replace('(', '').replace(')', '').replace('-', '_')
 
+def parse_args():
+    parser = argparse.ArgumentParser(description='Generate AC boundaries from ward data')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='ignore the build cache and recompute every boundary')
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    run = metrics.start_run('create_ac_boundaries', args)
+    # Dissolved LB/AC boundaries keyed by the content of their ward files
+    cache = BuildCache('ac_boundaries', reuse=not args.rebuild)
+    
     print("🔄 Generating AC boundaries from ward data...")
     
     # Read CSV to map local bodies to ACs
     ac_to_lbs = defaultdict(lambda: defaultdict(set))
     ac_names = {}
     
-    with open(CSV_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            org_district = row['Org District'].strip()
-            ac = row['AC'].strip()
-            lb_name = row['LBName'].strip()
-            lb_type = row['LBType'].strip()
-            
-            # Map type
-            type_folder = 'Municipality' if lb_type == 'M' else ('Corporation' if lb_type == 'C' else 'Grama Panchayat')
-            
-            ac_id = clean_name(ac)
-            ac_names[ac_id] = ac
-            lb_file = clean_name(lb_name)
-            
-            ac_to_lbs[ac_id][(org_district, type_folder)].add(lb_file)
+    for lb in load_hierarchy().local_bodies():
+        # AC ids and source file names keep this script's own naming
+        ac_id = clean_name(lb.ac.name)
+        ac_names[ac_id] = lb.ac.name
+        ac_to_lbs[ac_id][(lb.district.name, lb.folder)].add(clean_name(lb.name))
     
     print(f"📊 Found {len(ac_names)} unique ACs")
     
+    # Parse every ward file once up front
+    with run.stage('ingest'):
+        store = load_store(WARD_JSONS_PATH)
+    
     # Process each AC
     ac_geometries = {}
+    paths = []
     
-    for ac_id, lb_data in sorted(ac_to_lbs.items()):
-        ac_name = ac_names[ac_id]
-        print(f"\n🔧 Processing AC: {ac_name}")
+    with run.stage('acs'):
+        for ac_id, lb_data in sorted(ac_to_lbs.items()):
+            ac_name = ac_names[ac_id]
+            print(f"\n🔧 Processing AC: {ac_name}")
         
-        geometries = []
-        processed_count = 0
+            geometries = []
+            lb_keys = []
+            sources = set()
+            ward_count = 0
+            processed_count = 0
         
-        for (org_district, type_folder), lb_files in lb_data.items():
-            for lb_file in lb_files:
-                # Construct path
-                ward_path = f"{WARD_JSONS_PATH}/{org_district}/{type_folder}/{lb_file}.json"
+            for (org_district, type_folder), lb_files in lb_data.items():
+                for lb_file in sorted(lb_files):
+                    # Construct path
+                    ward_path = f"{WARD_JSONS_PATH}/{org_district}/{type_folder}/{lb_file}.json"
                 
-                try:
-                    if os.path.exists(ward_path):
-                        with open(ward_path, 'r', encoding='utf-8') as f:
-                            geojson = json.load(f)
+                    try:
+                        if store.has(ward_path):
+                            digest = store.digest(ward_path)
+                            lb_key = make_key(digest, org_district, type_folder, lb_file)
+                            lb_keys.append(lb_key)
+                            sources.add(digest)
+                        
+                            # Reuse the dissolved LB while its source file is unchanged
+                            cached = cache.get('local_body', lb_key)
+                            if cached:
+                                geometries.append(cached[0])
+                                ward_count += cached[1]
+                            else:
+                                # Wards come pre-parsed from the ingest store (see ward_ingest.py)
+                                lb_geoms = [ward['shape'] for ward in store.wards_for(ward_path) if ward['valid']]
                             
-                            if 'features' in geojson:
-                                for feature in geojson['features']:
-                                    geom = shape(feature['geometry'])
-                                    if geom.is_valid:
-                                        geometries.append(geom)
-                            elif 'geometry' in geojson:
-                                geom = shape(geojson['geometry'])
-                                if geom.is_valid:
-                                    geometries.append(geom)
+                                if lb_geoms:
+                                    lb_geom, path = merge_parts(lb_geoms)
+                                    run.geometries(lb_geoms, 'wards')
+                                    paths.append(path)
+                                    cache.put('local_body', lb_key, lb_geom, len(lb_geoms), [digest])
+                                    geometries.append(lb_geom)
+                                    ward_count += len(lb_geoms)
                         
-                        processed_count += 1
-                        print(f"   ✅ {lb_file}")
-                except Exception as e:
-                    print(f"   ❌ Error with {lb_file}: {e}")
+                            processed_count += 1
+                            print(f"   ✅ {lb_file}")
+                    except Exception as e:
+                        print(f"   ❌ Error with {lb_file}: {e}")
         
-        if geometries:
-            print(f"   📊 Merging {len(geometries)} geometries...")
-            try:
-                merged = unary_union(geometries)
-                ac_geometries[ac_id] = {
-                    'name': ac_name,
-                    'geometry': merged
-                }
-                print(f"   ✅ Created boundary for {ac_name}")
-            except Exception as e:
-                print(f"   ❌ Error merging {ac_name}: {e}")
-        else:
-            print(f"   ⚠️  No geometries found for {ac_name}")
+            if geometries:
+                print(f"   📊 Merging {ward_count} geometries...")
+                try:
+                    ac_key = make_key(ac_id, sorted(lb_keys))
+                    cached = cache.get('ac', ac_key)
+                    if cached:
+                        merged = cached[0]
+                    else:
+                        # Substage per AC, so the slow merges stand out
+                        with run.stage(ac_id):
+                            merged, path = merge_parts(geometries)
+                            run.geometries([merged], 'acs')
+                        paths.append(path)
+                        cache.put('ac', ac_key, merged, ward_count, sources)
+                    ac_geometries[ac_id] = {
+                        'name': ac_name,
+                        'geometry': merged
+                    }
+                    print(f"   ✅ Created boundary for {ac_name}")
+                except Exception as e:
+                    print(f"   ❌ Error merging {ac_name}: {e}")
+            else:
+                print(f"   ⚠️  No geometries found for {ac_name}")
     
     # Create GeoJSON
     print(f"\n🔧 Creating AC boundaries GeoJSON...")
@@ -117,12 +147,17 @@ def main():
     output_path = 'data/kerala_ac_boundaries.geojson'
     os.makedirs('data', exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(geojson, f, indent=2)
+    with run.stage('write'):
+        write_json(output_path, geojson)
     
     print(f"\n✅ Created AC boundaries: {output_path}")
     print(f"📊 Total ACs: {len(features)}")
     
+    cache.report()
+    if paths:
+        print(f"🧩 Dissolve paths: {path_summary(paths)}")
+    cache.save(live_sources=store.files['digest'])
+    
     print("\n" + "="*70)
     print("🎉 AC boundaries generated successfully!")
     print("="*70)
@@ -4,17 +4,24 @@ Generate COMPLETE hierarchy boundaries with fuzzy matching
 Districts → ACs → Mandals → Local Bodies (with ward geometry)
 """
 
-import json
-import csv
+import argparse
+import io
 import os
-from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
-from collections import defaultdict
-from difflib import SequenceMatcher
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from shapely.geometry import mapping
 import re
 
-WARD_JSONS_PATH = '/Users/devandev/Desktop/ward_jsons'
-CSV_FILE = f'{WARD_JSONS_PATH}/LSG Mapped - Sheet1.csv'
+from build_cache import BuildCache, make_key
+from dissolve_engine import DissolveEngine
+from lb_resolver import ResolverRegistry
+from lsg_hierarchy import WARD_JSONS_PATH, load_hierarchy
+import metrics
+from output_writer import write_json
+from ward_ingest import WardStore, load_store
 
 # Map org districts (from CSV) to actual folder names
 ORG_TO_FOLDER = {
@@ -50,19 +57,14 @@ ORG_TO_FOLDER = {
     'Kasaragod': 'Kasaragod'
 }
 
+CACHE_NAMESPACE = 'complete_hierarchy'
+
 def clean_name(name):
     """Clean name for comparison"""
     return re.sub(r'[^a-z0-9]', '', name.lower())
 
-def fuzzy_match(name1, name2, threshold=0.7):
-    """Check if two names are similar enough"""
-    clean1 = clean_name(name1)
-    clean2 = clean_name(name2)
-    ratio = SequenceMatcher(None, clean1, clean2).ratio()
-    return ratio >= threshold
-
-def find_json_file(directory, lb_name, lb_type):
-    """Find JSON file with fuzzy matching"""
+def find_json_file(directory, lb_name, lb_type, resolvers):
+    """Find JSON file with exact then fuzzy (trigram-indexed) matching"""
     if not os.path.exists(directory):
         return None
     
@@ -72,240 +74,407 @@ def find_json_file(directory, lb_name, lb_type):
     if not os.path.exists(search_dir):
         return None
     
-    # Try exact match first
-    clean_lb = clean_name(lb_name)
-    
-    for filename in os.listdir(search_dir):
-        if filename.endswith('.json'):
-            clean_file = clean_name(filename.replace('.json', ''))
-            
-            # Exact match
-            if clean_lb == clean_file:
-                return os.path.join(search_dir, filename)
-            
-            # Fuzzy match
-            if fuzzy_match(lb_name, filename.replace('.json', ''), 0.8):
-                return os.path.join(search_dir, filename)
-    
-    return None
+    return resolvers.get(search_dir).resolve(lb_name)
 
-def main():
-    print("🔄 Generating COMPLETE hierarchy with fuzzy matching...")
-    print("=" * 70)
-    
-    # Read CSV and build hierarchy
-    hierarchy = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(list))))
+def build_district(org_district, acs, engine, resolvers, cache, store):
+    """Build and save one org district; returns its matched/missed/ward counts"""
+    result = {'matched': 0, 'missed': 0, 'wards': None}
     
-    print("\n📂 Reading CSV data...")
-    with open(CSV_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            org_district = row['Org District'].strip()
-            ac = row['AC'].strip()
-            mandal = row['Org Mandal'].strip()
-            lb_name = row['LBName'].strip()
-            lb_type = row['LBType'].strip()
-            lb_code = row['LBCode'].strip()
-            
-            hierarchy[org_district][ac][mandal][lb_name] = {
-                'type': lb_type,
-                'code': lb_code,
-                'org_district': org_district
-            }
-    
-    print(f"✅ Found {len(hierarchy)} org districts")
-    
-    # Create output structure
-    os.makedirs('data/complete_hierarchy', exist_ok=True)
+    print(f"\n{'='*70}")
+    print(f"📍 DISTRICT: {org_district}")
+    print(f"{'='*70}")
     
-    district_stats = {}
-    total_matched = 0
-    total_missed = 0
+    # Map org district to actual folder name
+    folder_district = ORG_TO_FOLDER.get(org_district, org_district)
+    district_dir = os.path.join(WARD_JSONS_PATH, folder_district)
+    district_parts = []
+    district_keys = []
+    # Ward source digests behind each level, kept with its cache entries
+    district_sources = set()
+    district_ward_count = 0
+    district_wards = []
+    district_info = {
+        'name': org_district,
+        'acs': []
+    }
     
-    # Process each level
-    for org_district, acs in sorted(hierarchy.items()):
-        print(f"\n{'='*70}")
-        print(f"📍 DISTRICT: {org_district}")
-        print(f"{'='*70}")
-        
-        # Map org district to actual folder name
-        folder_district = ORG_TO_FOLDER.get(org_district, org_district)
-        district_dir = os.path.join(WARD_JSONS_PATH, folder_district)
-        district_features = []
-        district_info = {
-            'name': org_district,
-            'acs': []
+    for ac, mandals in sorted(acs.items()):
+        print(f"\n  📌 AC: {ac}")
+        ac_parts = []
+        ac_keys = []
+        ac_sources = set()
+        ac_ward_count = 0
+        ac_wards = []
+        ac_info = {
+            'name': ac,
+            'mandals': []
         }
         
-        for ac, mandals in sorted(acs.items()):
-            print(f"\n  📌 AC: {ac}")
-            ac_features = []
-            ac_info = {
-                'name': ac,
-                'mandals': []
+        for mandal, lbs in sorted(mandals.items()):
+            print(f"    🔹 Mandal: {mandal}")
+            mandal_parts = []
+            mandal_keys = []
+            mandal_sources = set()
+            mandal_ward_count = 0
+            mandal_wards = []
+            mandal_info = {
+                'name': mandal,
+                'local_bodies': []
             }
             
-            for mandal, lbs in sorted(mandals.items()):
-                print(f"    🔹 Mandal: {mandal}")
-                mandal_features = []
-                mandal_info = {
-                    'name': mandal,
-                    'local_bodies': []
-                }
+            for lb_name, lb_data in sorted(lbs.items()):
+                # Find JSON file with fuzzy matching
+                json_path = find_json_file(district_dir, lb_name, lb_data['type'], resolvers)
                 
-                for lb_name, lb_data in sorted(lbs.items()):
-                    # Find JSON file with fuzzy matching
-                    json_path = find_json_file(district_dir, lb_name, lb_data['type'])
-                    
-                    if json_path:
-                        try:
-                            with open(json_path, 'r', encoding='utf-8') as f:
-                                geojson = json.load(f)
+                if json_path:
+                    try:
+                        # Wards come pre-parsed from the ingest store (see ward_ingest.py)
+                        features = store.wards_for(json_path)
+                        if features is None:
+                            raise ValueError('source could not be ingested')
+                        source_digest = store.digest(json_path)
+                        mandal_sources.add(source_digest)
+                        
+                        if features:
+                            # Store LB info with wards (including individual ward geometries)
+                            wards_data = []
+                            for idx, feature in enumerate(features):
+                                props = feature['properties']
+                                
+                                # Get ward number
+                                ward_no = props.get('Ward_No') or \
+                                         props.get('ward_no') or \
+                                         props.get('WARD_NO') or \
+                                         (idx + 1)
+                                
+                                # Get ward name
+                                ward_name = props.get('Ward_Name') or \
+                                           props.get('ward_name') or \
+                                           props.get('WARD_NAME') or \
+                                           props.get('name') or \
+                                           f'Ward {ward_no}'
                                 
-                                if 'features' in geojson:
-                                    features = geojson['features']
-                                elif 'geometry' in geojson:
-                                    features = [geojson]
-                                else:
-                                    features = []
+                                ward_info = {
+                                    'ward_number': str(ward_no),
+                                    'ward_name': ward_name,
+                                    'geometry': mapping(feature['shape'])  # Store ward geometry
+                                }
+                                wards_data.append(ward_info)
+                            
+                            lb_info = {
+                                'name': lb_name,
+                                'code': lb_data['code'],
+                                'type': lb_data['type'],  # Keep original M/C/G format
+                                'wards': wards_data  # Include ward geometries
+                            }
+                            
+                            mandal_info['local_bodies'].append(lb_info)
+                            
+                            # Reuse the dissolved LB while its source file and CSV row are unchanged
+                            lb_key = make_key(source_digest, lb_name, lb_data)
+                            mandal_keys.append(lb_key)
+                            cached = cache.get('local_body', lb_key)
+                            
+                            if cached:
+                                lb_geom, lb_ward_count = cached
+                                lb_info['geometry'] = mapping(lb_geom)
+                                mandal_parts.append(lb_geom)
+                                mandal_ward_count += lb_ward_count
+                            else:
+                                # Create LB boundary geometry (validity was checked at ingest)
+                                lb_geoms = [feature['shape'] for feature in features if feature['valid']]
                                 
-                                if features:
-                                    # Store LB info with wards (including individual ward geometries)
-                                    wards_data = []
-                                    for idx, feature in enumerate(features):
-                                        props = feature.get('properties', {})
-                                        
-                                        # Get ward number
-                                        ward_no = props.get('Ward_No') or \
-                                                 props.get('ward_no') or \
-                                                 props.get('WARD_NO') or \
-                                                 (idx + 1)
-                                        
-                                        # Get ward name
-                                        ward_name = props.get('Ward_Name') or \
-                                                   props.get('ward_name') or \
-                                                   props.get('WARD_NAME') or \
-                                                   props.get('name') or \
-                                                   f'Ward {ward_no}'
-                                        
-                                        ward_info = {
-                                            'ward_number': str(ward_no),
-                                            'ward_name': ward_name,
-                                            'geometry': feature['geometry']  # Store ward geometry
-                                        }
-                                        wards_data.append(ward_info)
-                                    
-                                    lb_info = {
-                                        'name': lb_name,
-                                        'code': lb_data['code'],
-                                        'type': lb_data['type'],  # Keep original M/C/G format
-                                        'wards': wards_data  # Include ward geometries
-                                    }
-                                    
-                                    mandal_info['local_bodies'].append(lb_info)
-                                    
-                                    # Collect geometries for boundary creation
-                                    for feature in features:
-                                        geom = shape(feature['geometry'])
-                                        if geom.is_valid:
-                                            mandal_features.append(geom)
-                                            ac_features.append(geom)
-                                            district_features.append(geom)
-                                    
-                                    # Create LB boundary geometry
+                                mandal_ward_count += len(lb_geoms)
+                                if engine.verify:
+                                    mandal_wards.extend(lb_geoms)
+                                
+                                if lb_geoms:
                                     try:
-                                        lb_geoms = [shape(w['geometry']) for w in wards_data if shape(w['geometry']).is_valid]
-                                        if lb_geoms:
-                                            lb_info['geometry'] = mapping(unary_union(lb_geoms))
+                                        lb_geom = engine.union('local_body', lb_geoms)
+                                        lb_info['geometry'] = mapping(lb_geom)
+                                        mandal_parts.append(lb_geom)
+                                        cache.put('local_body', lb_key, lb_geom, len(lb_geoms), [source_digest])
                                     except:
-                                        pass
-                                    
-                                    total_matched += 1
-                                    print(f"      ✅ {lb_name} ({len(features)} wards)")
-                                else:
-                                    total_missed += 1
-                                    print(f"      ⚠️  {lb_name} (no features)")
-                        except Exception as e:
-                            total_missed += 1
-                            print(f"      ❌ {lb_name}: {str(e)[:50]}")
-                    else:
-                        total_missed += 1
-                        print(f"      ❌ {lb_name} (file not found)")
-                
-                # Save Mandal boundary if we have geometries
-                if mandal_features:
-                    try:
-                        mandal_geom = unary_union(mandal_features)
-                        mandal_id = clean_name(mandal)
-                        
-                        mandal_geojson = {
-                            'type': 'Feature',
-                            'properties': {
-                                'mandal_id': mandal_id,
-                                'mandal_name': mandal,
-                                'ac_name': ac,
-                                'district_name': org_district,
-                                'local_bodies': len(mandal_info['local_bodies'])
-                            },
-                            'geometry': mapping(mandal_geom)
-                        }
-                        
-                        mandal_info['geometry'] = mandal_geojson
-                        ac_info['mandals'].append(mandal_info)
-                        print(f"    ✅ Mandal boundary created ({len(mandal_features)} geometries)")
+                                        # Let the mandal union fall back to the raw wards
+                                        mandal_parts.extend(lb_geoms)
+                            
+                            result['matched'] += 1
+                            print(f"      ✅ {lb_name} ({len(features)} wards)")
+                        else:
+                            result['missed'] += 1
+                            print(f"      ⚠️  {lb_name} (no features)")
                     except Exception as e:
-                        print(f"    ❌ Error creating mandal boundary: {e}")
+                        result['missed'] += 1
+                        print(f"      ❌ {lb_name}: {str(e)[:50]}")
+                else:
+                    result['missed'] += 1
+                    print(f"      ❌ {lb_name} (file not found)")
+            
+            # Save Mandal boundary if we have geometries
+            ac_ward_count += mandal_ward_count
+            ac_sources |= mandal_sources
+            if engine.verify:
+                ac_wards.extend(mandal_wards)
             
-            # Save AC boundary if we have geometries
-            if ac_features:
+            if mandal_parts:
                 try:
-                    ac_geom = unary_union(ac_features)
-                    ac_id = clean_name(ac)
+                    mandal_key = make_key(org_district, ac, mandal, mandal_keys)
+                    ac_keys.append(mandal_key)
+                    cached = cache.get('mandal', mandal_key)
+                    if cached:
+                        mandal_geom = cached[0]
+                    else:
+                        mandal_geom = engine.union('mandal', mandal_parts)
+                        engine.check('mandal', mandal, mandal_geom, mandal_wards)
+                        cache.put('mandal', mandal_key, mandal_geom, mandal_ward_count, mandal_sources)
+                    mandal_id = clean_name(mandal)
                     
-                    ac_geojson = {
+                    mandal_geojson = {
                         'type': 'Feature',
                         'properties': {
-                            'ac_id': ac_id,
+                            'mandal_id': mandal_id,
+                            'mandal_name': mandal,
                             'ac_name': ac,
                             'district_name': org_district,
-                            'mandals': len(ac_info['mandals'])
+                            'local_bodies': len(mandal_info['local_bodies'])
                         },
-                        'geometry': mapping(ac_geom)
+                        'geometry': mapping(mandal_geom)
                     }
                     
-                    ac_info['geometry'] = ac_geojson
-                    district_info['acs'].append(ac_info)
-                    print(f"  ✅ AC boundary created ({len(ac_features)} geometries)")
+                    mandal_info['geometry'] = mandal_geojson
+                    ac_info['mandals'].append(mandal_info)
+                    ac_parts.append(mandal_geom)
+                    print(f"    ✅ Mandal boundary created ({mandal_ward_count} geometries)")
                 except Exception as e:
-                    print(f"  ❌ Error creating AC boundary: {e}")
+                    ac_parts.extend(mandal_parts)
+                    print(f"    ❌ Error creating mandal boundary: {e}")
+        
+        # Save AC boundary if we have geometries
+        district_ward_count += ac_ward_count
+        district_sources |= ac_sources
+        if engine.verify:
+            district_wards.extend(ac_wards)
         
-        # Save District boundary
-        if district_features:
+        if ac_parts:
             try:
-                district_geom = unary_union(district_features)
-                district_id = clean_name(org_district)
+                ac_key = make_key(org_district, ac, ac_keys)
+                district_keys.append(ac_key)
+                cached = cache.get('ac', ac_key)
+                if cached:
+                    ac_geom = cached[0]
+                else:
+                    ac_geom = engine.union('ac', ac_parts)
+                    engine.check('ac', ac, ac_geom, ac_wards)
+                    cache.put('ac', ac_key, ac_geom, ac_ward_count, ac_sources)
+                ac_id = clean_name(ac)
                 
-                district_geojson = {
+                ac_geojson = {
                     'type': 'Feature',
                     'properties': {
-                        'district_id': district_id,
+                        'ac_id': ac_id,
+                        'ac_name': ac,
                         'district_name': org_district,
-                        'acs': len(district_info['acs'])
+                        'mandals': len(ac_info['mandals'])
                     },
-                    'geometry': mapping(district_geom)
+                    'geometry': mapping(ac_geom)
                 }
                 
-                district_info['geometry'] = district_geojson
-                
-                # Save complete district data
-                output_file = f'data/complete_hierarchy/{district_id}.json'
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(district_info, f, indent=2)
-                
-                district_stats[org_district] = len(district_features)
-                print(f"✅ District saved: {output_file} ({len(district_features)} geometries)")
+                ac_info['geometry'] = ac_geojson
+                district_info['acs'].append(ac_info)
+                district_parts.append(ac_geom)
+                print(f"  ✅ AC boundary created ({ac_ward_count} geometries)")
             except Exception as e:
-                print(f"❌ Error creating district boundary: {e}")
+                district_parts.extend(ac_parts)
+                print(f"  ❌ Error creating AC boundary: {e}")
+    
+    # Save District boundary
+    if district_parts:
+        try:
+            district_key = make_key(org_district, district_keys)
+            cached = cache.get('district', district_key)
+            if cached:
+                district_geom = cached[0]
+            else:
+                district_geom = engine.union('district', district_parts)
+                engine.check('district', org_district, district_geom, district_wards)
+                cache.put('district', district_key, district_geom, district_ward_count, district_sources)
+            district_id = clean_name(org_district)
+            
+            district_geojson = {
+                'type': 'Feature',
+                'properties': {
+                    'district_id': district_id,
+                    'district_name': org_district,
+                    'acs': len(district_info['acs'])
+                },
+                'geometry': mapping(district_geom)
+            }
+            
+            district_info['geometry'] = district_geojson
+            
+            # Save complete district data
+            output_file = f'data/complete_hierarchy/{district_id}.json'
+            write_json(output_file, district_info)
+            
+            result['wards'] = district_ward_count
+            print(f"✅ District saved: {output_file} ({district_ward_count} geometries)")
+        except Exception as e:
+            print(f"❌ Error creating district boundary: {e}")
+    
+    return result
+
+def build_district_job(org_district, acs, verify, reuse):
+    """Process-pool entry point: builds one district with its own engine and log"""
+    engine = DissolveEngine(verify=verify)
+    resolvers = ResolverRegistry()
+    cache = BuildCache(CACHE_NAMESPACE, reuse=reuse)
+    store = WardStore()
+    log = io.StringIO()
+    start, cpu_start = time.perf_counter(), time.process_time()
+    # Files written here are counted in this process; the parent adds them to its run
+    with metrics.tally() as counts:
+        try:
+            with redirect_stdout(log):
+                result = build_district(org_district, acs, engine, resolvers, cache, store)
+            result['error'] = None
+        except Exception:
+            result = {'matched': 0, 'missed': 0, 'wards': None,
+                      'error': traceback.format_exc()}
+    # Timed here, the parent records it as a substage (see metrics.Run.add_stage)
+    result['counts'] = counts
+    result['seconds'] = time.perf_counter() - start
+    result['cpu_seconds'] = time.process_time() - cpu_start
+    result['log'] = log.getvalue()
+    result['engine'] = engine
+    result['resolutions'] = resolvers.export()
+    result['cache'] = cache.export()
+    return result
+
+def failed_job(error):
+    return {'matched': 0, 'missed': 0, 'wards': None, 'error': error, 'log': ''}
+
+def run_isolated(org_district, acs, verify, reuse):
+    """One district in a process of its own, so a crash takes down only that district"""
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        try:
+            return pool.submit(build_district_job, org_district, acs, verify, reuse).result()
+        except Exception as e:
+            return failed_job(f'{type(e).__name__}: {e}')
+
+def run_district_jobs(jobs, workers, verify, reuse):
+    """
+    {district: result} over a process pool. A worker that dies (OOM, a GEOS
+    crash) breaks the whole pool, so the districts still unfinished then are
+    retried in a process each; only one that crashes on its own is failed.
+    """
+    results, retry = {}, []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(build_district_job, org_district, acs, verify, reuse): (org_district, acs)
+                   for org_district, acs in jobs}
+        for future in as_completed(futures):
+            org_district, acs = futures[future]
+            try:
+                results[org_district] = future.result()
+            except BrokenProcessPool:
+                retry.append((org_district, acs))
+            except Exception as e:
+                results[org_district] = failed_job(f'{type(e).__name__}: {e}')
+    
+    if retry:
+        print(f"⚠️  A worker died; retrying {len(retry)} districts in separate processes...")
+        with ThreadPoolExecutor(max_workers=workers) as threads:
+            retried = threads.map(lambda job: run_isolated(*job, verify, reuse), retry)
+            for (org_district, _), result in zip(retry, retried):
+                results[org_district] = result
+    return results
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Generate the complete Kerala hierarchy')
+    parser.add_argument('--verify', action='store_true',
+                        help='check every dissolved boundary against the flat union of its wards')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='number of districts built in parallel (default: 1)')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='ignore the build cache and recompute every boundary')
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    run = metrics.start_run('create_complete_hierarchy', args)
+    engine = DissolveEngine(verify=args.verify)
+    # Local body → ward JSON resolutions, cached in data/cache/ between runs
+    resolvers = ResolverRegistry()
+    # Dissolved boundaries keyed by source content; --verify always recomputes
+    reuse = not (args.rebuild or args.verify)
+    cache = BuildCache(CACHE_NAMESPACE, reuse=reuse)
+    
+    print("🔄 Generating COMPLETE hierarchy with fuzzy matching...")
+    print("=" * 70)
+    
+    # Read CSV and build hierarchy (reused from its snapshot while the CSV is unchanged)
+    print("\n📂 Reading CSV data...")
+    with run.stage('csv'):
+        hierarchy = load_hierarchy()
+    
+    print(f"✅ Found {len(hierarchy.districts)} org districts")
+    
+    # Parse every ward file once up front; workers open the same store read-only
+    with run.stage('ingest'):
+        store = load_store(WARD_JSONS_PATH)
+    
+    # Create output structure
+    os.makedirs('data/complete_hierarchy', exist_ok=True)
+    
+    district_stats = {}
+    failed_districts = {}
+    total_matched = 0
+    total_missed = 0
+    
+    # Plain dicts so districts can be sent to worker processes
+    jobs = [
+        (org_district, {ac: {mandal: {lb_name: {'type': lb.type_code, 'code': lb.code, 'org_district': org_district}
+                                      for lb_name, lb in m.local_bodies.items()}
+                             for mandal, m in a.mandals.items()}
+                        for ac, a in district.acs.items()})
+        for org_district, district in sorted(hierarchy.districts.items())
+    ]
+    
+    with run.stage('districts'):
+        if args.workers > 1:
+            print(f"⚙️  Building {len(jobs)} districts with {args.workers} workers...")
+            results = run_district_jobs(jobs, args.workers, args.verify, reuse)
+            # Replayed in district order so logs and summary stay deterministic
+            for org_district, _ in jobs:
+                result = results[org_district]
+                print(result['log'], end='')
+                if result.get('engine'):
+                    engine.merge(result['engine'])
+                    resolvers.merge(result['resolutions'])
+                    cache.merge(result['cache'])
+                if result['error']:
+                    failed_districts[org_district] = result['error']
+                    print(f"❌ District {org_district} failed: {result['error'].strip().splitlines()[-1]}")
+                total_matched += result['matched']
+                total_missed += result['missed']
+                if result['wards'] is not None:
+                    district_stats[org_district] = result['wards']
+                run.add_stage(org_district, result.get('seconds', 0), result.get('cpu_seconds'),
+                              dict(result.get('counts', {}), wards=result['wards'] or 0))
+        else:
+            for org_district, acs in jobs:
+                try:
+                    with run.stage(org_district):
+                        result = build_district(org_district, acs, engine, resolvers, cache, store)
+                except Exception as e:
+                    failed_districts[org_district] = traceback.format_exc()
+                    print(f"❌ District {org_district} failed: {e}")
+                    continue
+                total_matched += result['matched']
+                total_missed += result['missed']
+                if result['wards'] is not None:
+                    district_stats[org_district] = result['wards']
+                    run.count('wards', result['wards'])
     
     # Create summary
     print(f"\n{'='*70}")
@@ -313,10 +482,21 @@ def main():
     print(f"{'='*70}")
     print(f"Total Local Bodies Matched: {total_matched}")
     print(f"Total Local Bodies Missed: {total_missed}")
-    print(f"Success Rate: {(total_matched/(total_matched+total_missed)*100):.1f}%")
+    if total_matched + total_missed:
+        print(f"Success Rate: {(total_matched/(total_matched+total_missed)*100):.1f}%")
     print(f"\nDistricts processed: {len(district_stats)}")
     for district, count in sorted(district_stats.items()):
         print(f"  • {district}: {count} ward geometries")
+    if failed_districts:
+        print(f"\n❌ Districts failed: {len(failed_districts)}")
+        for district in sorted(failed_districts):
+            print(f"  • {district}")
+    
+    engine.report()
+    cache.report()
+    resolvers.save()
+    # Entries of districts that failed or did not run stay while their sources exist
+    cache.save(live_sources=store.files['digest'])
     
     print(f"\n✅ Complete hierarchy saved to: data/complete_hierarchy/")
     print("="*70)
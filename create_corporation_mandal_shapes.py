@@ -1,19 +1,58 @@
+import argparse
 import csv
 import json
 import os
-from collections import defaultdict
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
-from typing import Dict, List, Tuple
+from difflib import SequenceMatcher
+from itertools import islice
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
 
-from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
+import shapely
+from shapely.geometry import mapping
+
+from consolidate_14_districts import unique_id
+from dissolve_engine import dissolve, path_summary
+from geojson_stream import LOCAL_BODIES, WARDS, iter_items, stream
+from geometry_array import from_geojson
+from lb_resolver import trigrams
+import metrics
+
+from output_writer import write_json
+from topology import TopologyBuilder, write_topology
 
 CSV_PATH = "data/corporation_ward_mapping.csv"
 DISTRICT_DATA_DIR = "data/14_districts"
 OUTPUT_PATH = "data/corporation_mandals.json"
+TOPOLOGY_PATH = "data/corporation_mandals.topojson"
 KOVALAM_LB_PATH = (
     "data/thiruvananthapuram_south/kovalam/kovalam/tvm_corporation_kovalam.geojson"
 )
+ALIASES_PATH = "data/corporation_ward_aliases.csv"
+ALIAS_COLUMNS = (
+    "district_id",
+    "corporation",
+    "ward_name",
+    "corporation_key",
+    "ward_key",
+    "score",
+    "source",
+)
+# Alias sources: rows written by the fuzzy matcher, and rows a person checked
+# (only a reviewed empty ward_key is trusted as "no such ward")
+AUTO, REVIEWED = "auto", "reviewed"
+CORPORATION_CUTOFF = 0.7
+WARD_CUTOFF = 0.68
+# Byte budget for local bodies held in memory by WardIndex
+CACHE_BUDGET_MB = 64
+# AC, mandal and local body names, then ward names (a local body's type
+# precedes its wards in the district files, so it is known by then)
+INDEX_PATTERNS = (
+    "acs.*.name",
+    "acs.*.mandals.*.name",
+    f"{LOCAL_BODIES}.name",
+    f"{WARDS}.ward_name",
+)
 
 
 def clean_id(text: str) -> str:
@@ -24,114 +63,321 @@ def clean_id(text: str) -> str:
     return cleaned.lower().strip("_")
 
 
-def ensure_dir(path: str):
-    directory = os.path.dirname(path)
-    if directory and not os.path.exists(directory):
-        os.makedirs(directory, exist_ok=True)
+class LRUCache:
+    """Least-recently-used cache of loaded values, bounded by their total byte size."""
+
+    def __init__(
+        self, budget_bytes: int, loader: Callable[[Hashable], Tuple[object, int]]
+    ):
+        self.budget_bytes = budget_bytes
+        self.loader = loader
+        self._entries: "OrderedDict[Hashable, Tuple[object, int]]" = OrderedDict()
+        self.size = 0
+        self.peak_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        value, size = self.loader(key)
+        self._entries[key] = (value, size)
+        self.size += size
+        self.peak_size = max(self.peak_size, self.size)
+        # The newest entry always stays, even when it alone is over budget
+        while self.size > self.budget_bytes and len(self._entries) > 1:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+        return value
+
+    def summary(self) -> str:
+        mb = 1024 * 1024
+        return (
+            f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions, "
+            f"peak {self.peak_size / mb:.1f} / {self.budget_bytes / mb:.0f} MB"
+        )
 
 
-def load_json(path: str):
-    with open(path, "r", encoding="utf-8") as handle:
-        return json.load(handle)
+class TrigramMatcher:
+    """Closest of a fixed set of names, scored like difflib, ranked via trigrams."""
+
+    def __init__(self, names: Iterable[str]):
+        self.names = sorted(names)
+        self._grams: Dict[str, set] = defaultdict(set)
+        for idx, name in enumerate(self.names):
+            for gram in trigrams(name):
+                self._grams[gram].add(idx)
+
+    @staticmethod
+    def _best(
+        word: str, names: Iterable[str], cutoff: float
+    ) -> Tuple[Optional[str], float]:
+        best, best_score = None, cutoff
+        for name in names:
+            matcher = SequenceMatcher(None, name, word)
+            if (
+                matcher.real_quick_ratio() < best_score
+                or matcher.quick_ratio() < best_score
+            ):
+                continue
+            score = matcher.ratio()
+            # Ties go to the larger name, as in difflib.get_close_matches
+            tie = score == best_score and (best is None or name > best)
+            if score > best_score or tie:
+                best, best_score = name, score
+        return best, best_score if best else 0.0
+
+    def match(self, word: str, cutoff: float) -> Tuple[Optional[str], float]:
+        """(name, similarity) of the closest name scoring >= cutoff, or (None, 0)"""
+        counts: Dict[int, int] = defaultdict(int)
+        for gram in trigrams(word):
+            for idx in self._grams.get(gram, ()):
+                counts[idx] += 1
+        # Best overlap first, so the score bar rises early and the quick ratio
+        # bounds skip most of the remaining candidates
+        ranked = sorted(counts, key=lambda idx: (-counts[idx], idx))
+        best = self._best(word, [self.names[idx] for idx in ranked], cutoff)
+        if best[0] is None:
+            # Names too short to share trigrams still get the full scan
+            best = self._best(word, self.names, cutoff)
+        return best
 
 
 class WardIndex:
-    """Caches ward geometries per (district, corporation, ward)."""
-
-    def __init__(self):
-        self._district_cache: Dict[str, Dict] = {}
-        self._corp_index: Dict[str, Dict[str, Dict[str, Dict]]] = {}
+    """
+    Looks up ward geometries per (district, corporation, ward). Only ward names
+    and the local body each one lives in are indexed; the wards themselves are
+    loaded per local body on demand through a byte-budgeted LRU cache. Names
+    that do not match exactly go through the persisted alias table.
+    """
+
+    def __init__(self, cache_mb: float = CACHE_BUDGET_MB):
+        self._loaded_districts: set = set()
+        # district → corporation → ward key → local body reference
+        self._corp_index: Dict[str, Dict[str, Dict[str, Tuple]]] = {}
+        self.cache = LRUCache(int(cache_mb * 1024 * 1024), self._load_local_body)
+        # (district, corporation key, ward key) → reviewed or fuzzy match
+        self.aliases: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+        self.aliases_path = None
 
     def load_district(self, district_slug: str):
-        if district_slug in self._district_cache:
-            return self._district_cache[district_slug]
+        if district_slug in self._loaded_districts:
+            return
 
         path = os.path.join(DISTRICT_DATA_DIR, f"{district_slug}.json")
         if not os.path.exists(path):
             raise FileNotFoundError(f"District data not found: {path}")
 
-        data = load_json(path)
-        self._district_cache[district_slug] = data
-        self._build_corp_index(district_slug, data)
-        return data
-
-    def _build_corp_index(self, district_slug: str, data: Dict):
-        corp_lookup: Dict[str, Dict[str, Dict]] = defaultdict(dict)
-        acs = data.get("acs") or data.get("assembly_constituencies") or []
-
-        for ac in acs:
-            for mandal in ac.get("mandals", []):
-                for lb in mandal.get("local_bodies", []):
-                    lb_type = (lb.get("type") or "").lower()
-                    if lb_type not in ("c", "corporation"):
-                        continue
-                    corp_key = clean_id(lb.get("name"))
-                    ward_map = corp_lookup[corp_key]
-
-                    for ward in lb.get("wards", []):
-                        ward_key = clean_id(ward.get("ward_name"))
-                        if not ward_key:
-                            continue
-                        ward_map[ward_key] = ward
+        self._build_corp_index(district_slug, path)
+        self._loaded_districts.add(district_slug)
+
+    def _build_corp_index(self, district_slug: str, path: str):
+        # Only names are read here; ward geometries are skipped by the stream.
+        # Ids follow the shard layout of consolidate_14_districts.write_shards.
+        corp_lookup: Dict[str, Dict[str, Tuple]] = defaultdict(dict)
+        ac_ids: set = set()
+        mandal_ids: set = set()
+        lb_ids: set = set()
+        lb_ref = None
+        lb_ordinal = -1
+
+        for pattern, parents, value in stream(path, *INDEX_PATTERNS):
+            if pattern == INDEX_PATTERNS[0]:
+                ac_id = unique_id(value, ac_ids)
+                mandal_ids = set()
+            elif pattern == INDEX_PATTERNS[1]:
+                mandal_id = unique_id(value, mandal_ids)
+                lb_ids = set()
+            elif pattern == INDEX_PATTERNS[2]:
+                lb_ordinal += 1
+                shard = os.path.join(
+                    DISTRICT_DATA_DIR, district_slug, ac_id, mandal_id,
+                    f"{unique_id(value, lb_ids)}.json",
+                )
+                lb_ref = (shard, path, lb_ordinal)
+            else:
+                lb = parents[-2]
+                if (lb.get("type") or "").lower() not in ("c", "corporation"):
+                    continue
+                ward_key = clean_id(value)
+                if ward_key:
+                    corp_lookup[clean_id(lb.get("name"))][ward_key] = lb_ref
 
         self._corp_index[district_slug] = corp_lookup
 
-    def get_ward(
-        self, district_slug: str, corporation_name: str, ward_name: str
-    ) -> Dict:
-        import difflib
+    @staticmethod
+    def _load_local_body(lb_ref: Tuple) -> Tuple[Dict[str, Dict], int]:
+        """{ward key: ward} of one local body, from its shard or the district file"""
+        shard, district_path, ordinal = lb_ref
+        if os.path.exists(shard):
+            with open(shard, "r", encoding="utf-8") as handle:
+                raw = handle.read()
+            lb, size = json.loads(raw), len(raw)
+        else:
+            local_bodies = (lb for _, lb in iter_items(district_path, LOCAL_BODIES))
+            lb = next(islice(local_bodies, ordinal, None))
+            size = len(json.dumps(lb))
+
+        wards = {}
+        for ward in lb.get("wards", []):
+            ward_key = clean_id(ward.get("ward_name"))
+            if ward_key:
+                wards[ward_key] = ward
+        return wards, size
+
+    def _exact(self, key: Tuple[str, str, str]):
+        district_slug, corp_key, ward_key = key
+        if ward_key in self._corp_index[district_slug].get(corp_key, {}):
+            return corp_key, ward_key
+        return None
 
-        self.load_district(district_slug)
-        corp_key = clean_id(corporation_name)
-        ward_key = clean_id(ward_name)
-        district_corps = self._corp_index.get(district_slug, {})
-        corp_wards = district_corps.get(corp_key)
-        if corp_wards is None:
-            corp_match = difflib.get_close_matches(
-                corp_key, district_corps.keys(), n=1, cutoff=0.7
-            )
-            if corp_match:
-                corp_key = corp_match[0]
-                corp_wards = district_corps[corp_key]
+    def _alias(self, key: Tuple[str, str, str]):
+        """(corporation key, ward key) from the alias table, unless it went stale"""
+        alias = self.aliases.get(key)
+        if alias is None:
+            return None
+        corp_key, ward_key = alias["corporation_key"], alias["ward_key"]
+        if not ward_key:
+            # Automatic failures are matched again, in case the ward data was fixed
+            return (corp_key, ward_key) if alias["source"] == REVIEWED else None
+        # Any ward named must still exist
+        if ward_key not in self._corp_index[key[0]].get(corp_key, {}):
+            return None
+        return corp_key, ward_key
+
+    def resolve(self, names: Iterable[Tuple[str, str, str]]) -> Counter:
+        """
+        Match every distinct (district, corporation, ward name) once, up front.
+        Names without an exact match or a valid alias are fuzzy-matched through
+        a trigram index and added to the alias table.
+        """
+        counts: Counter = Counter()
+        seen = set()
+        corp_matches: Dict[Tuple[str, str], str] = {}
+        matchers: Dict[Tuple[str, str], TrigramMatcher] = {}
+
+        for district_slug, corporation_name, ward_name in names:
+            self.load_district(district_slug)
+            key = (district_slug, clean_id(corporation_name), clean_id(ward_name))
+            if key in seen:
+                continue
+            seen.add(key)
+            if self._exact(key):
+                counts["exact"] += 1
+                continue
+            alias = self._alias(key)
+            if alias:
+                counts["alias" if alias[1] else "unmatched"] += 1
+                continue
+
+            district_corps = self._corp_index[district_slug]
+            corp_key = key[1]
+            if corp_key not in district_corps:
+                if (district_slug, corp_key) not in corp_matches:
+                    corp_matches[(district_slug, corp_key)] = TrigramMatcher(
+                        district_corps
+                    ).match(corp_key, CORPORATION_CUTOFF)[0]
+                corp_key = corp_matches[(district_slug, corp_key)]
+
+            ward_key, score = None, 0.0
+            if corp_key:
+                if (district_slug, corp_key) not in matchers:
+                    matchers[(district_slug, corp_key)] = TrigramMatcher(
+                        district_corps[corp_key]
+                    )
+                ward_key, score = matchers[(district_slug, corp_key)].match(
+                    key[2], WARD_CUTOFF
+                )
+
+            self.aliases[key] = {
+                "district_id": district_slug,
+                "corporation": corporation_name,
+                "ward_name": ward_name,
+                "corporation_key": corp_key or "",
+                "ward_key": ward_key or "",
+                "score": f"{score:.3f}" if ward_key else "",
+                "source": AUTO,
+            }
+            if ward_key:
+                counts["matched"] += 1
                 print(
-                    f"ℹ️  Using fuzzy match '{corp_key}' for corporation "
-                    f"'{corporation_name}'"
+                    f"ℹ️  New alias '{ward_name}' → '{ward_key}' in corporation "
+                    f"'{corporation_name}' ({score:.2f})"
                 )
             else:
-                corp_wards = {}
-        ward = corp_wards.get(ward_key)
-        if ward:
-            return ward
-        # Attempt fuzzy matching for spelling variations
-        candidates = difflib.get_close_matches(
-            ward_key, corp_wards.keys(), n=1, cutoff=0.68
-        )
-        if candidates:
-            match = candidates[0]
-            print(
-                f"ℹ️  Using fuzzy match '{match}' for ward '{ward_name}' "
-                f"in corporation '{corporation_name}'"
-            )
-            return corp_wards[match]
-        raise KeyError(
-            f"Ward '{ward_name}' not found in corporation '{corporation_name}' "
-            f"for district '{district_slug}'"
+                counts["unmatched"] += 1
+        return counts
+
+    def load_aliases(self, path: str):
+        self.aliases_path = path
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8", newline="") as handle:
+            for row in csv.DictReader(handle):
+                key = (
+                    row["district_id"],
+                    clean_id(row["corporation"]),
+                    clean_id(row["ward_name"]),
+                )
+                alias = {column: row.get(column) or "" for column in ALIAS_COLUMNS}
+                # Tables from before the source column only held matcher output
+                alias["source"] = alias["source"] or AUTO
+                self.aliases[key] = alias
+
+    def save_aliases(self):
+        """Write the alias table sorted, so reviews see stable diffs"""
+        if not self.aliases_path:
+            return
+        rows = sorted(
+            self.aliases.values(), key=lambda row: [row[c] for c in ALIAS_COLUMNS]
         )
+        tmp_path = f"{self.aliases_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=ALIAS_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, self.aliases_path)
 
+    def get_ward(
+        self, district_slug: str, corporation_name: str, ward_name: str
+    ) -> Dict:
+        self.load_district(district_slug)
+        key = (district_slug, clean_id(corporation_name), clean_id(ward_name))
+        match = self._exact(key) or self._alias(key)
+        if match is None:
+            # Not seen by resolve(): match it now, it lands in the alias table too
+            self.resolve([(district_slug, corporation_name, ward_name)])
+            match = self._alias(key)
+
+        if match is None or not match[1]:
+            raise KeyError(
+                f"Ward '{ward_name}' not found in corporation '{corporation_name}' "
+                f"for district '{district_slug}'"
+            )
+        corp_key, ward_key = match
+        lb_ref = self._corp_index[district_slug][corp_key][ward_key]
+        return self.cache.get(lb_ref)[ward_key]
 
-def dissolve_wards(wards: List[Dict]):
-    ward_geoms = []
-    for ward in wards:
-        geom = ward.get("geometry")
-        if not geom:
-            continue
-        geom_shape = shape(geom).buffer(0)
-        ward_geoms.append(geom_shape)
 
-    if not ward_geoms:
-        return None
+def dissolve_groups(groups: Dict[Tuple[str, str, str], Dict]) -> Dict:
+    """Dissolved geometry per mandal group; all wards are parsed and repaired in one batch."""
+    keys, geometries = [], []
+    for key, data in groups.items():
+        for ward in data["wards"]:
+            keys.append(key)
+            geometries.append(ward.get("geometry"))
 
-    return mapping(unary_union(ward_geoms))
+    ward_geoms = shapely.buffer(from_geojson(geometries), 0)
+    merged, paths = dissolve(ward_geoms, keys)
+    print(f"🧩 Dissolved {len(merged)} mandal groups ({path_summary(paths)})")
+    return {key: mapping(geom) for key, geom in merged.items()}
 
 
 def load_csv_rows() -> List[Dict]:
@@ -191,9 +437,10 @@ def group_by_mandal(rows: List[Dict], ward_index: WardIndex):
 def build_features(groups: Dict[Tuple[str, str, str], Dict]):
     features = []
     kovalam_group = None
+    dissolved = dissolve_groups(groups)
 
-    for data in groups.values():
-        geometry = dissolve_wards(data["wards"])
+    for key, data in groups.items():
+        geometry = dissolved.get(key)
         if not geometry:
             print(
                 f"⚠️  Skipping {data['ac_name']} / {data['mandal_name']} "
@@ -261,9 +508,24 @@ def write_feature_collection(path: str, features: List[Dict], extra: Dict = None
     }
     if extra:
         payload.update(extra)
-    ensure_dir(path)
-    with open(path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False)
+    write_json(path, payload, ensure_ascii=False)
+
+
+def write_corporation_topology(path: str, features: List[Dict]) -> int:
+    """Mandals and their wards as one topology; ward edges are shared, not repeated."""
+    builder = TopologyBuilder()
+    for feature in features:
+        props = feature["properties"]
+        mandal_key = "/".join((props["district_id"], props["ac_id"], props["mandal_id"]))
+        mandal_props = {k: v for k, v in props.items() if k != "ward_features"}
+        mandal_props["mandal_key"] = mandal_key
+        builder.add("mandals", mandal_props, feature["geometry"])
+
+        for ward in props["ward_features"]:
+            ward_props = dict(ward["properties"], mandal_key=mandal_key)
+            builder.add("wards", ward_props, ward["geometry"])
+
+    return write_topology(path, builder)
 
 
 def write_kovalam_local_body(group: Dict):
@@ -301,23 +563,74 @@ def write_kovalam_local_body(group: Dict):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate corporation mandal shapes")
+    parser.add_argument(
+        "--cache-mb",
+        type=float,
+        default=CACHE_BUDGET_MB,
+        help=f"Memory budget for cached local bodies (default {CACHE_BUDGET_MB} MB)",
+    )
+    parser.add_argument(
+        "--aliases",
+        default=ALIASES_PATH,
+        help=f"Reviewable ward name alias table (default {ALIASES_PATH})",
+    )
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    run = metrics.start_run("create_corporation_mandal_shapes", args)
+
     if not os.path.exists(CSV_PATH):
         raise FileNotFoundError(
             f"Corporation mapping CSV not found at {CSV_PATH}. "
             "Please place the sheet in the data directory."
         )
 
-    ward_index = WardIndex()
+    ward_index = WardIndex(args.cache_mb)
+    ward_index.load_aliases(args.aliases)
     rows = load_csv_rows()
-    groups = group_by_mandal(rows, ward_index)
-    features, kovalam_group = build_features(groups)
+    run.count("rows", len(rows))
+
+    # Every distinct name is matched once; only names new to the alias table
+    # are fuzzy-matched
+    with run.stage("resolve"):
+        counts = ward_index.resolve(
+            (
+                clean_id(row["District Name"].strip()),
+                row["Corporation"].strip(),
+                row["Ward Name"].strip(),
+            )
+            for row in rows
+        )
+    ward_index.save_aliases()
+    print(
+        f"🔤 Ward names: {counts['exact']} exact, {counts['alias']} from aliases, "
+        f"{counts['matched']} newly matched, {counts['unmatched']} unmatched "
+        f"({args.aliases})"
+    )
 
-    write_feature_collection(OUTPUT_PATH, features)
+    with run.stage("group"):
+        groups = group_by_mandal(rows, ward_index)
+    print(f"🗃️  Ward cache: {ward_index.cache.summary()}")
+    run.count("cache_hits", ward_index.cache.hits)
+    run.count("cache_misses", ward_index.cache.misses)
+    with run.stage("dissolve"):
+        features, kovalam_group = build_features(groups)
+    run.count("features", len(features))
+
+    with run.stage("write"):
+        write_feature_collection(OUTPUT_PATH, features)
     print(
         f"✅ Generated corporation mandal shapes: {len(features)} features "
         f"({OUTPUT_PATH})"
     )
 
+    with run.stage("topology"):
+        size = write_corporation_topology(TOPOLOGY_PATH, features)
+    print(
+        f"✅ Generated shared-arc topology: {size / 1024:.1f} KB "
+        f"vs {os.path.getsize(OUTPUT_PATH) / 1024:.1f} KB GeoJSON ({TOPOLOGY_PATH})"
+    )
+
     write_kovalam_local_body(kovalam_group)
 
 
@@ -1,66 +1,87 @@
-import json
+import argparse
 import os
 import glob
-from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
+from shapely.geometry import mapping
 
-# Path to ward JSON files
-ward_jsons_path = "/Users/devandev/Desktop/ward_jsons"
+from build_cache import BuildCache, make_key
+from dissolve_engine import merge_parts, path_summary
+from lsg_hierarchy import load_hierarchy
+import metrics
+from output_writer import write_json
+from ward_ingest import load_store
 
-# Load CSV mapping
-import csv
+parser = argparse.ArgumentParser(description='Generate org district boundaries from ward data')
+parser.add_argument('--rebuild', action='store_true',
+                    help='ignore the build cache and recompute every boundary')
+metrics.add_arguments(parser)
+args = parser.parse_args()
+run = metrics.start_run('create_district_boundaries', args)
 
-csv_path = "/Users/devandev/Desktop/ward_jsons/LSG Mapped - Sheet1.csv"
+# Dissolved LB/district boundaries keyed by the content of their ward files
+cache = BuildCache('district_boundaries', reuse=not args.rebuild)
 
-# Map LBName to Org District
-lb_to_district = {}
+# Path to ward JSON files
+ward_jsons_path = "/Users/devandev/Desktop/ward_jsons"
 
+# Map LBName to Org District (the last CSV row wins, as before)
 print("📖 Reading CSV mapping...")
-with open(csv_path, 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        lb_name = row['LBName'].strip()
-        district = row['Org District'].strip()
-        lb_to_district[lb_name] = district
+lb_to_district = {lb.name: lb.district.name
+                  for lb in sorted(load_hierarchy().local_bodies(), key=lambda lb: lb.row)}
 
 print(f"✅ Loaded {len(lb_to_district)} LB to District mappings\n")
 
-# Collect geometries by district
+# Collect geometries by district (one dissolved geometry per LB file)
 district_geometries = {}
+district_ward_counts = {}
+district_lb_keys = {}
+district_sources = {}
+paths = []
 
 print("🗺️ Processing ward JSON files...")
 
-# Find all JSON files recursively
-for root, dirs, files in os.walk(ward_jsons_path):
-    for file in files:
-        if file.endswith('.json') and not file.startswith('.'):
-            file_path = os.path.join(root, file)
-            lb_name = os.path.splitext(file)[0]
-            
-            # Get district for this LB
-            district = lb_to_district.get(lb_name)
-            
-            if not district:
-                print(f"⚠️  No district mapping for: {lb_name}")
-                continue
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    if 'features' in data:
-                        for feature in data['features']:
-                            geom = shape(feature['geometry'])
-                            
-                            if district not in district_geometries:
-                                district_geometries[district] = []
-                            
-                            district_geometries[district].append(geom)
-                
-                print(f"✅ Processed: {lb_name} → {district}")
-                
-            except Exception as e:
-                print(f"❌ Error processing {file_path}: {e}")
+# Every ward JSON file is parsed once into the ingest store (see ward_ingest.py)
+with run.stage('ingest'):
+    store = load_store(ward_jsons_path)
+
+with run.stage('local_bodies'):
+    for file_path in store.paths():
+        lb_name = os.path.splitext(os.path.basename(file_path))[0]
+    
+        # Get district for this LB
+        district = lb_to_district.get(lb_name)
+    
+        if not district:
+            print(f"⚠️  No district mapping for: {lb_name}")
+            continue
+    
+        try:
+            digest = store.digest(file_path)
+            lb_key = make_key(digest, lb_name, district)
+        
+            # Reuse the dissolved LB while its source file is unchanged
+            cached = cache.get('local_body', lb_key)
+            if cached:
+                lb_geom, ward_count = cached
+            else:
+                lb_geom, ward_count = None, 0
+                geoms = [ward['shape'] for ward in store.wards_for(file_path)]
+                if geoms:
+                    lb_geom, path = merge_parts(geoms)
+                    run.geometries(geoms, 'wards')
+                    paths.append(path)
+                    ward_count = len(geoms)
+                    cache.put('local_body', lb_key, lb_geom, ward_count, [digest])
+        
+            if lb_geom is not None:
+                district_geometries.setdefault(district, []).append(lb_geom)
+                district_ward_counts[district] = district_ward_counts.get(district, 0) + ward_count
+                district_lb_keys.setdefault(district, []).append(lb_key)
+                district_sources.setdefault(district, set()).add(digest)
+        
+            print(f"✅ Processed: {lb_name} → {district}")
+        
+        except Exception as e:
+            print(f"❌ Error processing {file_path}: {e}")
 
 print(f"\n📊 Found {len(district_geometries)} districts with geometries\n")
 
@@ -69,31 +90,44 @@ print("🔧 Creating unified Kerala districts GeoJSON...")
 
 features = []
 
-for district_name, geometries in district_geometries.items():
-    if geometries:
-        try:
-            # Union all geometries for this district
-            print(f"   Merging {len(geometries)} geometries for {district_name}...")
-            district_boundary = unary_union(geometries)
+with run.stage('districts'):
+    for district_name, geometries in district_geometries.items():
+        if geometries:
+            try:
+                # Union all geometries for this district
+                ward_count = district_ward_counts[district_name]
+                print(f"   Merging {ward_count} geometries for {district_name}...")
+                district_key = make_key(district_name, sorted(district_lb_keys[district_name]))
+                cached = cache.get('district', district_key)
+                if cached:
+                    district_boundary = cached[0]
+                else:
+                    # Substage per district, so the slow merges stand out
+                    with run.stage(district_name):
+                        district_boundary, path = merge_parts(geometries)
+                        run.geometries([district_boundary], 'districts')
+                    paths.append(path)
+                    cache.put('district', district_key, district_boundary, ward_count,
+                              district_sources[district_name])
             
-            # Create clean district ID
-            district_id = district_name.lower().replace(' ', '_')
+                # Create clean district ID
+                district_id = district_name.lower().replace(' ', '_')
             
-            feature = {
-                'type': 'Feature',
-                'properties': {
-                    'district_id': district_id,
-                    'district_name': district_name,
-                    'geometries_count': len(geometries)
-                },
-                'geometry': mapping(district_boundary)
-            }
+                feature = {
+                    'type': 'Feature',
+                    'properties': {
+                        'district_id': district_id,
+                        'district_name': district_name,
+                        'geometries_count': ward_count
+                    },
+                    'geometry': mapping(district_boundary)
+                }
             
-            features.append(feature)
-            print(f"   ✅ Created boundary for {district_name}")
+                features.append(feature)
+                print(f"   ✅ Created boundary for {district_name}")
             
-        except Exception as e:
-            print(f"   ❌ Error creating boundary for {district_name}: {e}")
+            except Exception as e:
+                print(f"   ❌ Error creating boundary for {district_name}: {e}")
 
 # Create final GeoJSON
 kerala_geojson = {
@@ -105,30 +139,35 @@ kerala_geojson = {
 os.makedirs('data', exist_ok=True)
 output_path = 'data/kerala_districts.geojson'
 
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(kerala_geojson, f, indent=2)
+with run.stage('write'):
+    write_json(output_path, kerala_geojson)
 
 print(f"\n✅ Kerala districts boundary saved to: {output_path}")
 print(f"📊 Total districts: {len(features)}")
 
+cache.report()
+if paths:
+    print(f"🧩 Dissolve paths: {path_summary(paths)}")
+cache.save(live_sources=store.files['digest'])
+
 # Also save individual district boundaries
 print("\n🔧 Creating individual district boundary files...")
 
-for feature in features:
-    district_id = feature['properties']['district_id']
-    district_dir = f"data/{district_id}"
-    os.makedirs(district_dir, exist_ok=True)
+with run.stage('write_districts'):
+    for feature in features:
+        district_id = feature['properties']['district_id']
+        district_dir = f"data/{district_id}"
+        os.makedirs(district_dir, exist_ok=True)
     
-    district_geojson = {
-        'type': 'FeatureCollection',
-        'features': [feature]
-    }
+        district_geojson = {
+            'type': 'FeatureCollection',
+            'features': [feature]
+        }
     
-    district_path = f"{district_dir}/district_boundary.geojson"
-    with open(district_path, 'w', encoding='utf-8') as f:
-        json.dump(district_geojson, f, indent=2)
+        district_path = f"{district_dir}/district_boundary.geojson"
+        write_json(district_path, district_geojson)
     
-    print(f"✅ {feature['properties']['district_name']} → {district_path}")
+        print(f"✅ {feature['properties']['district_name']} → {district_path}")
 
 print("\n" + "="*70)
 print("🎉 District boundaries created successfully!")
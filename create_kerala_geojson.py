@@ -4,10 +4,20 @@ Create a proper GeoJSON file for all 14 Kerala districts
 Each district should be a single unified geometry
 """
 
-import json
+import argparse
 import os
-from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
+import numpy as np
+import shapely
+from shapely.geometry import mapping
+
+from dissolve_engine import merge_parts
+from geojson_stream import WARDS, stream
+from geometry_array import from_geojson, validity
+import metrics
+from output_writer import write_json
+
+WARD_GEOMETRIES = f'{WARDS}.geometry'
+WARD_BATCH = 2000
 
 def create_kerala_geojson():
     print("🗺️  Creating Kerala 14 Districts GeoJSON...")
@@ -17,66 +27,72 @@ def create_kerala_geojson():
     output_file = 'data/kerala_14_districts.geojson'
     
     features = []
+    run = metrics.current()
     
     # Process each district
     district_files = sorted([f for f in os.listdir(districts_dir) if f.endswith('.json')])
     
-    for district_file in district_files:
-        district_name = district_file.replace('.json', '')
-        filepath = os.path.join(districts_dir, district_file)
+    with run.stage('districts'):
+        for district_file in district_files:
+            district_name = district_file.replace('.json', '')
+            filepath = os.path.join(districts_dir, district_file)
         
-        print(f"\n📍 Processing: {district_name.upper()}")
+            print(f"\n📍 Processing: {district_name.upper()}")
         
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+            # Stream the wards so only one batch of geometry dicts is held at a time
+            ward_batches = []
+            batch = []
+            ac_count = 0
         
-        # Collect all ward geometries to create proper district boundary
-        all_ward_geometries = []
-        ac_count = 0
-        ward_count = 0
+            for pattern, _, value in stream(filepath, 'acs.*.name', WARD_GEOMETRIES):
+                if pattern == 'acs.*.name':
+                    ac_count += 1
+                    continue
+                batch.append(value)
+                if len(batch) >= WARD_BATCH:
+                    ward_batches.append(from_geojson(batch))
+                    batch = []
+            ward_batches.append(from_geojson(batch))
         
-        for ac in data.get('acs', []):
-            ac_count += 1
-            for mandal in ac.get('mandals', []):
-                for lb in mandal.get('local_bodies', []):
-                    for ward in lb.get('wards', []):
-                        if 'geometry' in ward:
-                            try:
-                                geom = shape(ward['geometry'])
-                                if geom.is_valid:
-                                    all_ward_geometries.append(geom)
-                                    ward_count += 1
-                            except Exception as e:
-                                print(f"   ⚠️  Error processing ward geometry: {e}")
+            # Validate every ward of the district in one batch
+            geoms = np.concatenate(ward_batches)
+            unreadable = int(shapely.is_missing(geoms).sum())
+            if unreadable:
+                print(f"   ⚠️  {unreadable} ward geometries could not be read")
+            all_ward_geometries = geoms[validity(geoms)]
+            ward_count = len(all_ward_geometries)
+            run.geometries(all_ward_geometries, 'wards')
         
-        print(f"   ACs: {ac_count}, Wards: {ward_count}")
+            print(f"   ACs: {ac_count}, Wards: {ward_count}")
         
-        # Create unified district boundary from all wards
-        if all_ward_geometries:
-            try:
-                print(f"   🔄 Merging {len(all_ward_geometries)} ward geometries...")
-                district_boundary = unary_union(all_ward_geometries)
+            # Create unified district boundary from all wards
+            if ward_count:
+                try:
+                    print(f"   🔄 Merging {len(all_ward_geometries)} ward geometries...")
+                    with run.stage(district_name):
+                        district_boundary, path = merge_parts(all_ward_geometries)
+                    run.geometries([district_boundary], 'districts')
                 
-                # Create feature
-                feature = {
-                    'type': 'Feature',
-                    'properties': {
-                        'district': district_name,
-                        'name': district_name.title(),
-                        'acs': ac_count,
-                        'wards': ward_count
-                    },
-                    'geometry': mapping(district_boundary)
-                }
+                    # Create feature
+                    feature = {
+                        'type': 'Feature',
+                        'properties': {
+                            'district': district_name,
+                            'name': district_name.title(),
+                            'acs': ac_count,
+                            'wards': ward_count
+                        },
+                        'geometry': mapping(district_boundary)
+                    }
                 
-                features.append(feature)
-                geom_type = feature['geometry']['type']
-                print(f"   ✅ Created {geom_type} boundary")
+                    features.append(feature)
+                    geom_type = feature['geometry']['type']
+                    print(f"   ✅ Created {geom_type} boundary ({path})")
                 
-            except Exception as e:
-                print(f"   ❌ Error creating boundary: {e}")
-        else:
-            print(f"   ⚠️  No ward geometries found!")
+                except Exception as e:
+                    print(f"   ❌ Error creating boundary: {e}")
+            else:
+                print(f"   ⚠️  No ward geometries found!")
     
     # Create GeoJSON FeatureCollection
     geojson = {
@@ -85,8 +101,8 @@ def create_kerala_geojson():
     }
     
     # Save to file
-    with open(output_file, 'w') as f:
-        json.dump(geojson, f, indent=2)
+    with run.stage('write'):
+        write_json(output_file, geojson)
     
     print("\n" + "=" * 70)
     print(f"✅ Created: {output_file}")
@@ -94,4 +110,7 @@ def create_kerala_geojson():
     print("=" * 70)
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Create the Kerala 14 districts GeoJSON')
+    metrics.add_arguments(parser)
+    metrics.start_run('create_kerala_geojson', parser.parse_args())
     create_kerala_geojson()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Split bundler for the Thiruvalla map data
+Writes one lazily importable ES module per layer (ac, mandals, panchayats)
+and one per panchayat for the wards, each with quantized coordinates and a
+content hash in its filename, plus a small manifest.json the page reads first.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+from output_writer import COORD_PRECISION, quantize, write_json
+
+LAYERS = ('ac', 'mandals', 'panchayats')
+# Wards are split into one module per local body, on this property
+WARD_SPLIT = 'LSGD'
+HASH_LENGTH = 10
+MANIFEST_VERSION = 1
+
+
+def slug(text):
+    cleaned = re.sub(r'[^\w\s-]', '', text or '')
+    return re.sub(r'[-\s]+', '_', cleaned).lower().strip('_') or 'unnamed'
+
+
+def module_source(data, precision=COORD_PRECISION):
+    """
+    ES module exporting the data. A JSON.parse of a string literal parses
+    faster than the same data written as an object literal.
+    """
+    payload = json.dumps(quantize(data, precision), separators=(',', ':'), ensure_ascii=False)
+    return f'export default JSON.parse({json.dumps(payload)});\n'
+
+
+def write_module(output_dir, name, data, precision=COORD_PRECISION):
+    """Write <name>.<content hash>.js and return its path relative to output_dir"""
+    source = module_source(data, precision).encode('utf-8')
+    digest = hashlib.sha1(source).hexdigest()[:HASH_LENGTH]
+    rel_path = f'{name}.{digest}.js'
+    path = os.path.join(output_dir, rel_path)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f'{path}.tmp', 'wb') as f:
+            f.write(source)
+        os.replace(f'{path}.tmp', path)
+    return rel_path, len(source)
+
+
+def write_bundle(output_dir, data, precision=COORD_PRECISION):
+    """
+    Split {'ac', 'mandals', 'panchayats', 'wards'} feature collections into
+    hashed modules under output_dir and write manifest.json. Returns the manifest.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {'version': MANIFEST_VERSION, 'layers': {}, 'wards': {}, 'counts': {}}
+    sizes = {}
+
+    for layer in LAYERS:
+        collection = data.get(layer) or {'type': 'FeatureCollection', 'features': []}
+        manifest['layers'][layer], sizes[layer] = write_module(output_dir, layer, collection, precision)
+        manifest['counts'][layer] = len(collection['features'])
+
+    groups = {}
+    for feature in data.get('wards', {}).get('features', []):
+        groups.setdefault(feature['properties'].get(WARD_SPLIT) or '', []).append(feature)
+    sizes['wards'] = 0
+    for name, features in groups.items():
+        rel_path, size = write_module(output_dir, f'wards/{slug(name)}',
+                                      {'type': 'FeatureCollection', 'features': features}, precision)
+        manifest['wards'][name] = rel_path
+        sizes['wards'] += size
+    manifest['counts']['wards'] = sum(len(features) for features in groups.values())
+
+    # Modules from earlier builds are dropped; the manifest is written last
+    current = set(manifest['layers'].values()) | set(manifest['wards'].values())
+    for folder in (output_dir, os.path.join(output_dir, 'wards')):
+        if not os.path.isdir(folder):
+            continue
+        for file in os.listdir(folder):
+            rel_path = os.path.relpath(os.path.join(folder, file), output_dir).replace(os.sep, '/')
+            if file.endswith('.js') and rel_path not in current:
+                os.remove(os.path.join(folder, file))
+    write_json(os.path.join(output_dir, 'manifest.json'), manifest, precision=None,
+               ensure_ascii=False, report=False)
+
+    for layer, size in sizes.items():
+        count = manifest['counts'][layer]
+        print(f"   {layer:<11} {count:>5} features, {size / 1024:>8.1f} KB")
+    print(f"📦 Bundle written: {output_dir}/manifest.json "
+          f"({len(manifest['wards'])} ward modules)")
+    return manifest
+
+
+def read_legacy(path):
+    """Data object of a single-file `const thiruvallaData = {...};` bundle"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    start, end = text.index('{'), text.rindex('}')
+    return json.loads(text[start:end + 1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split a single-file data.js into lazily loaded modules')
+    parser.add_argument('input', help='Legacy data.js (const thiruvallaData = ...)')
+    parser.add_argument('--output-dir', default='layers')
+    parser.add_argument('--precision', type=int, default=COORD_PRECISION)
+    args = parser.parse_args()
+    write_bundle(args.output_dir, read_legacy(args.input), args.precision)
+
+
+if __name__ == '__main__':
+    main()
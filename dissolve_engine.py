@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Bottom-up dissolve engine for the boundary generators
+Wards → Local Bodies → Mandals → ACs → Districts, each level reusing the one below
+"""
+
+import time
+from collections import Counter, OrderedDict
+
+import numpy as np
+import shapely
+from shapely.ops import unary_union
+
+# Dissolve levels in build order (smallest unit first)
+LEVELS = ('local_body', 'mandal', 'ac', 'district')
+
+# Relative area tolerance used when checking a dissolved geometry against
+# the flat ward union it replaces
+VERIFY_TOLERANCE = 1e-7
+
+# coverage_union needs GEOS >= 3.8, coverage_is_valid GEOS >= 3.12
+HAS_COVERAGE = hasattr(shapely, 'coverage_is_valid') and hasattr(shapely, 'coverage_union_all')
+
+
+def merge_parts(parts):
+    """
+    Union of one group of polygons, as (geometry, path).
+    Ward polygons tile the state without overlaps, so when the parts form a
+    valid coverage (no overlaps, shared edges noded alike) their shared edges
+    are simply cancelled ('coverage'); anything else goes through the general
+    overlay ('union').
+    """
+    geoms = np.empty(len(parts), dtype=object)
+    geoms[:] = list(parts)
+    if HAS_COVERAGE and len(geoms) > 1:
+        try:
+            if shapely.coverage_is_valid(geoms):
+                return shapely.coverage_union_all(geoms), 'coverage'
+        except shapely.errors.GEOSException:
+            pass
+    return shapely.union_all(geoms), 'union'
+
+
+def dissolve(geometries, keys):
+    """
+    Dissolve geometries grouped by key.
+    Returns ({key: geometry}, {key: path}) where path is 'coverage' or 'union';
+    missing geometries are skipped and keys without any geometry are left out.
+    """
+    groups = OrderedDict()
+    for geom, key in zip(geometries, keys):
+        if geom is not None:
+            groups.setdefault(key, []).append(geom)
+
+    merged, paths = OrderedDict(), OrderedDict()
+    for key, parts in groups.items():
+        merged[key], paths[key] = merge_parts(parts)
+    return merged, paths
+
+
+def path_summary(paths):
+    """'N coverage, M union' for a {key: path} mapping or an iterable of paths"""
+    counts = Counter(paths.values() if isinstance(paths, dict) else paths)
+    return ', '.join(f"{counts[path]} {path}" for path in ('coverage', 'union') if counts[path])
+
+
+class DissolveEngine:
+    """Unions geometries level by level and keeps per-level timings."""
+
+    def __init__(self, verify=False, tolerance=VERIFY_TOLERANCE):
+        self.verify = verify
+        self.tolerance = tolerance
+        self.timings = OrderedDict((level, 0.0) for level in LEVELS)
+        self.calls = OrderedDict((level, 0) for level in LEVELS)
+        self.inputs = OrderedDict((level, 0) for level in LEVELS)
+        self.paths = OrderedDict((level, Counter()) for level in LEVELS)
+        self.mismatches = []
+
+    def union(self, level, parts):
+        """Union already-dissolved parts of the level below into one geometry"""
+        started = time.perf_counter()
+        merged, path = merge_parts(parts)
+        self.timings[level] += time.perf_counter() - started
+        self.calls[level] += 1
+        self.inputs[level] += len(parts)
+        self.paths[level][path] += 1
+        return merged
+
+    def check(self, level, name, merged, ward_geoms):
+        """Compare a dissolved geometry with the flat union of its wards"""
+        if not self.verify or not ward_geoms:
+            return True
+
+        flat = unary_union(ward_geoms)
+        reference = max(flat.area, merged.area)
+        diff = merged.symmetric_difference(flat).area
+        if reference and diff / reference > self.tolerance:
+            self.mismatches.append((level, name, diff / reference))
+            print(f"      ⚠️  {level} '{name}' differs from flat union "
+                  f"(rel. area diff {diff / reference:.2e})")
+            return False
+        return True
+
+    def merge(self, other):
+        """Fold in the counters of an engine used by a worker process"""
+        for level in LEVELS:
+            self.timings[level] += other.timings[level]
+            self.calls[level] += other.calls[level]
+            self.inputs[level] += other.inputs[level]
+            self.paths[level].update(other.paths[level])
+        self.mismatches.extend(other.mismatches)
+
+    def report(self):
+        """Print per-level dissolve timings"""
+        print("\n⏱️  Dissolve timings")
+        total = 0.0
+        for level in LEVELS:
+            seconds = self.timings[level]
+            total += seconds
+            paths = path_summary(self.paths[level].elements())
+            print(f"  • {level:<11} {seconds:8.2f}s  "
+                  f"({self.calls[level]} unions, {self.inputs[level]} inputs"
+                  f"{'; ' + paths if paths else ''})")
+        print(f"  • {'total':<11} {total:8.2f}s")
+
+        if self.verify:
+            if self.mismatches:
+                print(f"⚠️  {len(self.mismatches)} geometries differ from the flat ward union")
+            else:
+                print("✅ All dissolved geometries match the flat ward union")
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Export the district → AC → mandal → LB → ward hierarchy as Mapbox Vector Tiles
+Writes a static z/x/y.pbf pyramid (servable from GitHub Pages) or an MBTiles file,
+one layer per hierarchy level, simplified per zoom
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import sqlite3
+from collections import defaultdict
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+DISTRICTS_DIR = 'data/14_districts'
+OUTPUT_DIR = 'tiles'
+
+EXTENT = 4096
+BUFFER = 64
+EARTH_RADIUS = 6378137.0
+WORLD_HALF = math.pi * EARTH_RADIUS
+
+# Zoom range in which each layer is present
+LAYER_ZOOMS = {
+    'district': (5, 14),
+    'ac': (7, 14),
+    'mandal': (9, 14),
+    'local_body': (10, 14),
+    'ward': (12, 14),
+}
+
+# Simplification tolerance in tile units (1 unit = 1/4096 of a tile)
+SIMPLIFY_UNITS = 1.0
+
+
+# ---------------------------------------------------------------------------
+# Minimal protobuf / MVT encoding (vector_tile.proto, spec version 2)
+# ---------------------------------------------------------------------------
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        bits = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(bits | 0x80)
+        else:
+            out.append(bits)
+            return bytes(out)
+
+
+def _zigzag(n):
+    return (n << 1) ^ (n >> 63)
+
+
+def _field(number, wire_type, payload):
+    key = _varint((number << 3) | wire_type)
+    if wire_type == 2:
+        return key + _varint(len(payload)) + payload
+    return key + payload
+
+
+def _packed(number, values):
+    return _field(number, 2, b''.join(_varint(v) for v in values))
+
+
+def _encode_value(value):
+    if isinstance(value, bool):
+        return _field(7, 0, _varint(int(value)))
+    if isinstance(value, int):
+        return _field(6, 0, _varint(_zigzag(value)))
+    if isinstance(value, float):
+        return _field(3, 1, np.float64(value).tobytes())
+    return _field(1, 2, str(value).encode('utf-8'))
+
+
+def _ring_area(coords):
+    """Surveyor's formula in tile coordinates (positive = exterior in MVT)"""
+    x, y = coords[:, 0], coords[:, 1]
+    return 0.5 * float(np.sum(x[:-1] * y[1:] - x[1:] * y[:-1]))
+
+
+def _ring_commands(coords, exterior):
+    # Drop repeated points created by quantization, then the closing point
+    keep = np.ones(len(coords), dtype=bool)
+    keep[1:] = np.any(coords[1:] != coords[:-1], axis=1)
+    coords = coords[keep]
+    if len(coords) > 1 and np.array_equal(coords[0], coords[-1]):
+        coords = coords[:-1]
+    if len(coords) < 3:
+        return None, None
+
+    closed = np.vstack([coords, coords[:1]])
+    area = _ring_area(closed)
+    if area == 0:
+        return None, None
+    if (area > 0) != exterior:
+        coords = coords[::-1]
+    return coords, area
+
+
+def encode_polygons(geom):
+    """MVT geometry command stream for a (Multi)Polygon in integer tile coordinates"""
+    commands = []
+    cursor = np.zeros(2, dtype=np.int64)
+
+    for polygon in getattr(geom, 'geoms', [geom]):
+        if polygon.geom_type != 'Polygon' or polygon.is_empty:
+            continue
+        rings = [(np.asarray(polygon.exterior.coords, dtype=np.int64), True)]
+        rings += [(np.asarray(r.coords, dtype=np.int64), False) for r in polygon.interiors]
+
+        for i, (coords, exterior) in enumerate(rings):
+            coords, _ = _ring_commands(coords, exterior)
+            if coords is None:
+                if i == 0:
+                    break  # collapsed exterior: drop the whole polygon
+                continue
+            deltas = np.diff(np.vstack([cursor, coords]), axis=0)
+            cursor = coords[-1]
+            commands.append((1 << 3) | 1)  # MoveTo, count 1
+            commands += [_zigzag(int(d)) for d in deltas[0]]
+            commands.append(((len(deltas) - 1) << 3) | 2)  # LineTo
+            for dx, dy in deltas[1:]:
+                commands += [_zigzag(int(dx)), _zigzag(int(dy))]
+            commands.append((1 << 3) | 7)  # ClosePath
+    return commands
+
+
+def encode_tile(layers):
+    """Serialize {layer_name: [(properties, tile_geometry), ...]} to MVT bytes"""
+    tile = b''
+    for name, features in layers.items():
+        keys, values = {}, {}
+        encoded = b''
+        for properties, geom in features:
+            commands = encode_polygons(geom)
+            if not commands:
+                continue
+            tags = []
+            for key, value in properties.items():
+                if value is None:
+                    continue
+                tags.append(keys.setdefault(key, len(keys)))
+                value_key = (type(value).__name__, value)
+                tags.append(values.setdefault(value_key, len(values)))
+            feature = _packed(2, tags) + _field(3, 0, _varint(3)) + _packed(4, commands)
+            encoded += _field(2, 2, feature)
+        if not encoded:
+            continue
+
+        layer = _field(15, 0, _varint(2)) + _field(1, 2, name.encode('utf-8')) + encoded
+        layer += b''.join(_field(3, 2, key.encode('utf-8')) for key in keys)
+        layer += b''.join(_field(4, 2, _encode_value(value)) for _, value in values)
+        layer += _field(5, 0, _varint(EXTENT))
+        tile += _field(3, 2, layer)
+    return tile
+
+
+# ---------------------------------------------------------------------------
+# Hierarchy → projected features
+# ---------------------------------------------------------------------------
+
+def to_mercator(geom):
+    """Project lon/lat geometry to Web Mercator metres"""
+    def project(coords):
+        lon = np.radians(coords[:, 0])
+        lat = np.radians(np.clip(coords[:, 1], -85.0511, 85.0511))
+        return np.column_stack([EARTH_RADIUS * lon,
+                                EARTH_RADIUS * np.log(np.tan(np.pi / 4 + lat / 2))])
+    return shapely.transform(geom, project)
+
+
+def _geometry(item):
+    """Geometry of a hierarchy item (ACs and mandals store a Feature)"""
+    geometry = item.get('geometry')
+    if not geometry:
+        return None
+    try:
+        geom = shape(geometry)
+    except Exception:
+        return None
+    return None if geom.is_empty else geom
+
+
+def iter_hierarchy(districts_dir):
+    """Yield (layer, properties, lon/lat geometry) for every level of every district"""
+    for district_file in sorted(f for f in os.listdir(districts_dir) if f.endswith('.json')):
+        district_id = district_file.replace('.json', '')
+        with open(os.path.join(districts_dir, district_file), 'r') as f:
+            data = json.load(f)
+
+        geom = _geometry(data)
+        if geom is not None:
+            yield 'district', {'id': district_id, 'name': data.get('name', district_id)}, geom
+
+        for ac in data.get('acs', []):
+            geom = _geometry(ac)
+            if geom is not None:
+                yield 'ac', {'name': ac['name'], 'district': district_id}, geom
+
+            for mandal in ac.get('mandals', []):
+                geom = _geometry(mandal)
+                if geom is not None:
+                    yield 'mandal', {'name': mandal['name'], 'ac': ac['name'],
+                                     'district': district_id}, geom
+
+                for lb in mandal.get('local_bodies', []):
+                    geom = _geometry(lb)
+                    if geom is not None:
+                        yield 'local_body', {'name': lb['name'], 'code': lb.get('code'),
+                                             'type': lb.get('type'), 'mandal': mandal['name'],
+                                             'ac': ac['name'], 'district': district_id}, geom
+
+                    for ward in lb.get('wards', []):
+                        geom = _geometry(ward)
+                        if geom is not None:
+                            yield 'ward', {'ward_number': ward.get('ward_number'),
+                                           'ward_name': ward.get('ward_name'),
+                                           'local_body': lb['name'], 'code': lb.get('code')}, geom
+
+
+def tile_size(zoom):
+    return 2 * WORLD_HALF / (1 << zoom)
+
+
+def tiles_for_zoom(features, zoom):
+    """Clip, simplify and quantize every feature visible at this zoom into its tiles"""
+    size = tile_size(zoom)
+    scale = EXTENT / size
+    pad = BUFFER / scale
+    tolerance = SIMPLIFY_UNITS / scale
+    last = (1 << zoom) - 1
+    tiles = defaultdict(lambda: defaultdict(list))
+
+    for layer, properties, geom in features:
+        low, high = LAYER_ZOOMS[layer]
+        if not low <= zoom <= high:
+            continue
+
+        simplified = geom.simplify(tolerance, preserve_topology=True)
+        if simplified.is_empty:
+            continue
+        minx, miny, maxx, maxy = simplified.bounds
+        col0 = max(0, int((minx - pad + WORLD_HALF) // size))
+        col1 = min(last, int((maxx + pad + WORLD_HALF) // size))
+        row0 = max(0, int((WORLD_HALF - maxy - pad) // size))
+        row1 = min(last, int((WORLD_HALF - miny + pad) // size))
+
+        for col in range(col0, col1 + 1):
+            left = col * size - WORLD_HALF
+            for row in range(row0, row1 + 1):
+                top = WORLD_HALF - row * size
+                clipped = shapely.clip_by_rect(simplified, left - pad, top - size - pad,
+                                               left + size + pad, top + pad)
+                if clipped.is_empty:
+                    continue
+
+                def quantize(coords, left=left, top=top):
+                    return np.column_stack([np.round((coords[:, 0] - left) * scale),
+                                            np.round((top - coords[:, 1]) * scale)])
+                tiles[(col, row)][layer].append((properties, shapely.transform(clipped, quantize)))
+    return tiles
+
+
+# ---------------------------------------------------------------------------
+# Writers
+# ---------------------------------------------------------------------------
+
+class DirectoryWriter:
+    """Static {z}/{x}/{y}.pbf pyramid plus a metadata.json"""
+
+    def __init__(self, path):
+        self.path = path
+        self.bytes = 0
+
+    def write(self, zoom, col, row, data):
+        tile_path = os.path.join(self.path, str(zoom), str(col), f'{row}.pbf')
+        os.makedirs(os.path.dirname(tile_path), exist_ok=True)
+        with open(tile_path, 'wb') as f:
+            f.write(data)
+        self.bytes += len(data)
+
+    def close(self, metadata):
+        with open(os.path.join(self.path, 'metadata.json'), 'w') as f:
+            json.dump(metadata, f, indent=2)
+
+
+class MBTilesWriter:
+    """MBTiles 1.3 (SQLite, TMS row order, gzip-compressed tiles)"""
+
+    def __init__(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+        self.db = sqlite3.connect(path)
+        self.db.execute('CREATE TABLE metadata (name TEXT, value TEXT)')
+        self.db.execute('CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, '
+                        'tile_row INTEGER, tile_data BLOB)')
+        self.db.execute('CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)')
+        self.bytes = 0
+
+    def write(self, zoom, col, row, data):
+        data = gzip.compress(data)
+        tms_row = (1 << zoom) - 1 - row
+        self.db.execute('INSERT INTO tiles VALUES (?, ?, ?, ?)', (zoom, col, tms_row, data))
+        self.bytes += len(data)
+
+    def close(self, metadata):
+        rows = [(key, value if isinstance(value, str) else json.dumps(value))
+                for key, value in metadata.items() if key != 'vector_layers']
+        rows.append(('json', json.dumps({'vector_layers': metadata['vector_layers']})))
+        self.db.executemany('INSERT INTO metadata VALUES (?, ?)', rows)
+        self.db.commit()
+        self.db.close()
+
+
+def export(districts_dir, output, minzoom, maxzoom):
+    print("🧱 Exporting vector tiles...")
+    print("=" * 70)
+
+    features = []
+    bounds = [180.0, 90.0, -180.0, -90.0]
+    counts = defaultdict(int)
+    for layer, properties, geom in iter_hierarchy(districts_dir):
+        minx, miny, maxx, maxy = geom.bounds
+        bounds = [min(bounds[0], minx), min(bounds[1], miny),
+                  max(bounds[2], maxx), max(bounds[3], maxy)]
+        features.append((layer, properties, to_mercator(geom)))
+        counts[layer] += 1
+
+    for layer in LAYER_ZOOMS:
+        print(f"   {layer:<11} {counts[layer]:>6} features (z{LAYER_ZOOMS[layer][0]}+)")
+
+    writer = MBTilesWriter(output) if output.endswith('.mbtiles') else DirectoryWriter(output)
+    total_tiles = 0
+    for zoom in range(minzoom, maxzoom + 1):
+        tiles = tiles_for_zoom(features, zoom)
+        written = 0
+        for (col, row), layers in sorted(tiles.items()):
+            data = encode_tile(layers)
+            if data:
+                writer.write(zoom, col, row, data)
+                written += 1
+        total_tiles += written
+        print(f"   ✅ z{zoom}: {written} tiles")
+
+    metadata = {
+        'name': 'kerala_hierarchy',
+        'format': 'pbf',
+        'minzoom': minzoom,
+        'maxzoom': maxzoom,
+        'bounds': ','.join(f'{v:.6f}' for v in bounds),
+        'vector_layers': [
+            {'id': layer, 'minzoom': max(minzoom, low), 'maxzoom': min(maxzoom, high), 'fields': {}}
+            for layer, (low, high) in LAYER_ZOOMS.items()
+        ],
+    }
+    writer.close(metadata)
+
+    print("=" * 70)
+    print(f"✅ {total_tiles} tiles ({writer.bytes / (1024 * 1024):.2f} MB) → {output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export the Kerala hierarchy as vector tiles')
+    parser.add_argument('--districts-dir', default=DISTRICTS_DIR)
+    parser.add_argument('--output', default=OUTPUT_DIR,
+                        help='tile directory, or a path ending in .mbtiles')
+    parser.add_argument('--minzoom', type=int, default=5)
+    parser.add_argument('--maxzoom', type=int, default=14)
+    args = parser.parse_args()
+    export(args.districts_dir, args.output, args.minzoom, args.maxzoom)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
 """
-Fix gaps between district boundaries by applying a small buffer operation
+Fix gaps between district boundaries by cleaning them into a shared coverage
 """
 
+import argparse
 import json
 from shapely.geometry import shape, mapping
 from shapely.ops import unary_union
 
+from coverage_cleaner import clean_coverage, report
+from generate_resolutions import simplify_coverage
+from geometry_array import from_geojson
+import metrics
+from output_writer import write_json
+
 def main():
+    parser = argparse.ArgumentParser(description='Fix gaps between district boundaries')
+    metrics.add_arguments(parser)
+    run = metrics.start_run('fix_district_gaps', parser.parse_args())
+    
     print("="*80)
     print("🔧 FIXING GAPS BETWEEN DISTRICT BOUNDARIES")
     print("="*80)
@@ -15,45 +26,41 @@ def main():
     # Load the existing GeoJSON
     input_path = 'data/kerala_14_districts.geojson'
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with run.stage('load'):
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     
     print(f"\n📂 Loaded {len(data['features'])} districts")
     
-    # Process each district
-    fixed_features = []
+    # Clean all districts together: neighbours are snapped onto each other and
+    # every crack or overlap between them is given to exactly one district
+    print("\n🔧 Cleaning shared district boundaries...")
+    geoms = from_geojson([feature['geometry'] for feature in data['features']])
+    run.geometries(geoms, 'districts')
+    with run.stage('clean'):
+        cleaned, stats = clean_coverage(geoms)
+    report('district', stats)
+    
+    # Simplify very slightly to reduce point density (0.0001 degrees ≈ 11 meters);
+    # shared edges are simplified once so no new cracks open
+    with run.stage('simplify'):
+        simplified, method = simplify_coverage(list(cleaned), 0.0001)
+    run.geometries(simplified, 'simplified')
     
-    for feature in data['features']:
+    fixed_features = []
+    for feature, geom in zip(data['features'], simplified):
         district_name = feature['properties']['name']
-        print(f"\n🔧 Processing {district_name}...")
-        
-        try:
-            # Get the geometry
-            geom = shape(feature['geometry'])
-            
-            # Apply a buffer to close gaps (0.005 degrees ≈ 555 meters)
-            # This creates overlaps that eliminate visible cracks
-            buffered = geom.buffer(0.005).buffer(-0.005)
-            
-            # Simplify very slightly to reduce point density (0.0001 degrees ≈ 11 meters)
-            # This removes unnecessary detail that can cause rendering issues
-            simplified = buffered.simplify(0.0001, preserve_topology=True)
-            
-            # Create new feature with fixed geometry
-            new_feature = {
-                'type': 'Feature',
-                'properties': feature['properties'],
-                'geometry': mapping(simplified)
-            }
-            
-            fixed_features.append(new_feature)
-            
-            print(f"   ✅ Fixed - Geometry type: {simplified.geom_type}")
-            
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            # Use original if fixing fails
+        if geom is None or geom.is_empty:
+            print(f"   ❌ {district_name}: cleaning failed, keeping original")
             fixed_features.append(feature)
+            continue
+        
+        fixed_features.append({
+            'type': 'Feature',
+            'properties': feature['properties'],
+            'geometry': mapping(geom)
+        })
+        print(f"   ✅ {district_name} - Geometry type: {geom.geom_type} ({method} simplify)")
     
     # Create fixed GeoJSON
     fixed_geojson = {
@@ -66,8 +73,9 @@ def main():
     print("🔍 VERIFYING FIXED BOUNDARIES")
     print("="*80)
     
-    geometries = [shape(f['geometry']) for f in fixed_features]
-    full_kerala = unary_union(geometries)
+    with run.stage('verify'):
+        geometries = [shape(f['geometry']) for f in fixed_features]
+        full_kerala = unary_union(geometries)
     
     print(f"\nUnion result: {full_kerala.geom_type}")
     if full_kerala.geom_type == 'MultiPolygon':
@@ -77,8 +85,8 @@ def main():
     
     # Save the fixed GeoJSON
     output_path = 'data/kerala_14_districts_fixed.geojson'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(fixed_geojson, f, indent=2)
+    with run.stage('write'):
+        write_json(output_path, fixed_geojson)
     
     print("\n" + "="*80)
     print(f"✅ Fixed GeoJSON saved to: {output_path}")
@@ -8,6 +8,8 @@ import json
 from shapely.geometry import shape, mapping
 from shapely.ops import unary_union
 
+from output_writer import write_json
+
 print("🔧 Fixing Kerala District Boundaries...")
 print("=" * 60)
 
@@ -55,10 +57,7 @@ output_data = {
 
 # Save the fixed version
 print(f"\n💾 Saving fixed boundaries to: {output_file}")
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(output_data, f)
-
-file_size = len(json.dumps(output_data)) / (1024 * 1024)
+file_size = write_json(output_file, output_data) / (1024 * 1024)
 print(f"✅ Done! File size: {file_size:.2f} MB")
 print(f"\n📌 Original file: {input_file}")
 print(f"📌 Fixed file: {output_file}")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Precompute neighbour graphs for wards, local bodies, mandals and ACs
+Neighbours are found through an STRtree (no all-pairs intersects) and every
+edge carries the length of the shared boundary in metres. Ward polygons are
+not cleaned, so boundaries only need to run within a small tolerance of each
+other rather than coincide exactly. The result is one
+compact edge list per level in data/adjacency.json.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import shapely
+
+from consolidate_14_districts import hierarchy_rows
+from geometry_array import from_geojson
+from output_writer import write_json
+
+DISTRICTS_DIR = 'data/14_districts'
+OUTPUT_PATH = 'data/adjacency.json'
+LEVELS = ('ward', 'local_body', 'mandal', 'ac')
+
+# Local equirectangular scale for Kerala (~10.5° N), good to well under 1%
+KERALA_LATITUDE = 10.5
+METERS_PER_DEGREE_LAT = 110574.0
+METERS_PER_DEGREE_LON = 111320.0 * np.cos(np.radians(KERALA_LATITUDE))
+# Boundaries closer than this (metres) count as shared
+TOLERANCE = 1.0
+
+
+def collect_nodes(districts_dir=DISTRICTS_DIR):
+    """
+    {level: (ids, names, geometry dicts)} for every district file. Ids follow
+    the shard layout: <district>/<ac>/<mandal>/<local body>/<ward number>.
+    """
+    nodes = {level: ([], [], []) for level in LEVELS}
+
+    for file in sorted(f for f in os.listdir(districts_dir) if f.endswith('.json')):
+        district_id = file[:-len('.json')]
+        with open(os.path.join(districts_dir, file), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        for level, properties, geometry in hierarchy_rows(district_id, data):
+            if level in nodes and geometry:
+                ids, names, geometries = nodes[level]
+                ids.append(properties['id'])
+                names.append(properties['name'])
+                geometries.append(geometry)
+    return nodes
+
+
+def to_meters(geoms):
+    """Project lon/lat geometries onto a local metric plane"""
+    scale = np.array([METERS_PER_DEGREE_LON, METERS_PER_DEGREE_LAT])
+    return shapely.transform(geoms, lambda coords: coords * scale)
+
+
+def adjacency(geoms, min_length=1.0, tolerance=TOLERANCE):
+    """
+    Edges (i, j, shared boundary in metres) between polygons whose boundaries
+    run within tolerance of each other for more than min_length. The shared
+    length is the shorter of each boundary measured inside a tolerance buffer
+    around the other, less the 2 · tolerance the buffer adds past the ends of
+    the edge, so corner-only contacts come out near zero and are dropped.
+    """
+    geoms = to_meters(geoms)
+    present = ~shapely.is_missing(geoms)
+    tree = shapely.STRtree(geoms)
+    left, right = tree.query(geoms, predicate='dwithin', distance=tolerance)
+    keep = (left < right) & present[left] & present[right]
+    left, right = left[keep], right[keep]
+    if not len(left):
+        return []
+
+    boundaries = shapely.boundary(geoms)
+    zones = shapely.buffer(boundaries, tolerance, quad_segs=2)
+    shapely.prepare(zones)
+    shared = np.minimum(shapely.length(shapely.intersection(boundaries[left], zones[right])),
+                        shapely.length(shapely.intersection(boundaries[right], zones[left]))) - 2 * tolerance
+    strong = shared >= min_length
+    return [[int(i), int(j), int(round(length))]
+            for i, j, length in zip(left[strong], right[strong], shared[strong])]
+
+
+def generate(districts_dir=DISTRICTS_DIR, output_path=OUTPUT_PATH, tolerance=TOLERANCE):
+    print("🔗 Building adjacency graphs...")
+    print("=" * 70)
+
+    graph = {'units': 'm', 'tolerance': tolerance, 'levels': {}}
+    for level, (ids, names, geometries) in collect_nodes(districts_dir).items():
+        geoms = from_geojson(geometries)
+        edges = adjacency(geoms, tolerance=tolerance)
+        graph['levels'][level] = {'ids': ids, 'names': names, 'edges': edges}
+        print(f"   {level:<11} {len(ids):>6} nodes, {len(edges):>7} edges")
+
+    # Geometry-free, so no coordinate quantization is needed
+    write_json(output_path, graph, precision=None, ensure_ascii=False)
+    print("=" * 70)
+    print(f"✅ Adjacency written to {output_path}")
+    return graph
+
+
+def load_adjacency(path=OUTPUT_PATH, level='ward'):
+    """{id: [(neighbour id, shared metres), ...]} for one level"""
+    with open(path, 'r', encoding='utf-8') as f:
+        graph = json.load(f)['levels'][level]
+
+    ids = graph['ids']
+    neighbours = {node_id: [] for node_id in ids}
+    for i, j, length in graph['edges']:
+        neighbours[ids[i]].append((ids[j], length))
+        neighbours[ids[j]].append((ids[i], length))
+    return neighbours
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute ward/LB/mandal/AC adjacency')
+    parser.add_argument('--districts-dir', default=DISTRICTS_DIR)
+    parser.add_argument('--output', default=OUTPUT_PATH)
+    parser.add_argument('--tolerance', type=float, default=TOLERANCE,
+                        help=f'Boundaries closer than this many metres count as shared (default {TOLERANCE})')
+    args = parser.parse_args()
+    generate(args.districts_dir, args.output, args.tolerance)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,7 @@
-import csv
 import json
-import re
 import os
 
-csv_path = "/Users/devandev/Desktop/ward_jsons/LSG Mapped - Sheet1.csv"
-
-def clean_id(text):
-    """Remove all spaces and special characters, convert to lowercase"""
-    cleaned = re.sub(r'[^\w\s-]', '', text)
-    cleaned = re.sub(r'[-\s]+', '_', cleaned)
-    return cleaned.lower().strip('_')
+from lsg_hierarchy import load_hierarchy
 
 # District colors (14+ unique colors for all org districts)
 DISTRICT_COLORS = {
@@ -45,64 +37,19 @@ DISTRICT_COLORS = {
     'kasaragod': '#E17055'
 }
 
-# Build hierarchy
-hierarchy = {}
-
 print("📖 Reading CSV and creating complete Kerala structure...\n")
 print("=" * 70)
 
-with open(csv_path, 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        district_orig = row['Org District'].strip()
-        district_clean = clean_id(district_orig)
-        
-        ac_orig = row['AC'].strip()
-        ac_clean = clean_id(ac_orig)
-        
-        mandal_orig = row['Org Mandal'].strip()
-        mandal_clean = clean_id(mandal_orig)
-        
-        lb_name_orig = row['LBName'].strip()
-        lb_name_clean = clean_id(lb_name_orig)
-        
-        lb_type = 'Municipality' if row['LBType'] == 'M' else 'Corporation' if row['LBType'] == 'C' else 'Panchayat'
-        lb_code = row['LBCode'].strip()
-        total_wards = int(row['Ward Number'])
-        
-        # Initialize nested structure
-        if district_clean not in hierarchy:
-            hierarchy[district_clean] = {
-                'original_name': district_orig,
-                'acs': {}
-            }
-            
-        if ac_clean not in hierarchy[district_clean]['acs']:
-            hierarchy[district_clean]['acs'][ac_clean] = {
-                'original_name': ac_orig,
-                'mandals': {}
-            }
-            
-        if mandal_clean not in hierarchy[district_clean]['acs'][ac_clean]['mandals']:
-            hierarchy[district_clean]['acs'][ac_clean]['mandals'][mandal_clean] = {
-                'original_name': mandal_orig,
-                'local_bodies': {}
-            }
-            
-        hierarchy[district_clean]['acs'][ac_clean]['mandals'][mandal_clean]['local_bodies'][lb_name_clean] = {
-            'original_name': lb_name_orig,
-            'type': lb_type,
-            'code': lb_code,
-            'total_wards': total_wards
-        }
+# Parsed once and reused from its snapshot while the CSV is unchanged (see lsg_hierarchy.py)
+hierarchy = load_hierarchy()
 
 # Create final JSON structure
 output = {
     'state': {
         'id': 'kerala',
         'name': 'Kerala',
-        'total_districts': len(hierarchy),
-        'total_acs': sum(len(d['acs']) for d in hierarchy.values())
+        'total_districts': len(hierarchy.districts),
+        'total_acs': sum(len(d.acs) for d in hierarchy.districts.values())
     },
     'district_colors': DISTRICT_COLORS,
     'districts': []
@@ -114,45 +61,50 @@ total_mandals = 0
 total_lbs = 0
 total_wards = 0
 
-for district_id, district_data in sorted(hierarchy.items()):
+def by_id(units):
+    return sorted(units.values(), key=lambda unit: unit.id)
+
+for district in by_id(hierarchy.districts):
     district_obj = {
-        'id': district_id,
-        'name': district_data['original_name'],
-        'color': DISTRICT_COLORS.get(district_id, '#95A5A6'),
-        'total_acs': len(district_data['acs']),
+        'id': district.id,
+        'name': district.name,
+        'color': DISTRICT_COLORS.get(district.id, '#95A5A6'),
+        'total_acs': len(district.acs),
         'assembly_constituencies': []
     }
     
-    for ac_id, ac_data in sorted(district_data['acs'].items()):
+    for ac in by_id(district.acs):
         ac_obj = {
-            'id': ac_id,
-            'name': ac_data['original_name'],
-            'district_id': district_id,
-            'total_mandals': len(ac_data['mandals']),
+            'id': ac.id,
+            'name': ac.name,
+            'district_id': district.id,
+            'total_mandals': len(ac.mandals),
             'mandals': []
         }
         
-        for mandal_id, mandal_data in sorted(ac_data['mandals'].items()):
+        for mandal in by_id(ac.mandals):
             mandal_obj = {
-                'id': mandal_id,
-                'name': mandal_data['original_name'],
-                'total_local_bodies': len(mandal_data['local_bodies']),
+                'id': mandal.id,
+                'name': mandal.name,
+                'total_local_bodies': len(mandal.local_bodies),
                 'local_bodies': []
             }
             
-            for lb_id, lb_data in sorted(mandal_data['local_bodies'].items()):
+            for lb in by_id(mandal.local_bodies):
+                if lb.total_wards is None:
+                    print(f"⚠️  {lb.name} ({lb.code}): ward count {lb.ward_count!r} is not a number, counted as 0")
                 lb_obj = {
-                    'id': lb_id,
-                    'name': lb_data['original_name'],
-                    'code': lb_data['code'],
-                    'type': lb_data['type'],
-                    'total_wards': lb_data['total_wards'],
-                    'data_path': f"data/{district_id}/{ac_id}/{mandal_id}/{lb_id}.geojson"
+                    'id': lb.id,
+                    'name': lb.name,
+                    'code': lb.code,
+                    'type': lb.type,
+                    'total_wards': lb.total_wards or 0,
+                    'data_path': f"data/{district.id}/{ac.id}/{mandal.id}/{lb.id}.geojson"
                 }
                 
                 mandal_obj['local_bodies'].append(lb_obj)
                 total_lbs += 1
-                total_wards += lb_data['total_wards']
+                total_wards += lb.total_wards or 0
             
             ac_obj['mandals'].append(mandal_obj)
             total_mandals += 1
@@ -160,7 +112,7 @@ for district_id, district_data in sorted(hierarchy.items()):
         district_obj['assembly_constituencies'].append(ac_obj)
     
     output['districts'].append(district_obj)
-    print(f"✅ {district_data['original_name']}: {len(district_data['acs'])} ACs")
+    print(f"✅ {district.name}: {len(district.acs)} ACs")
 
 # Create config directory
 os.makedirs('config', exist_ok=True)
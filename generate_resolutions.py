@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Precompute zoom-aware geometry resolutions for every hierarchy level
+Each level is simplified as a coverage (shared edges simplified once), so
+neighbouring wards, local bodies, mandals and ACs never open slivers.
+Run after consolidate_14_districts.py (which rewrites the shard folders).
+"""
+
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+import shapely
+from shapely.geometry import shape, mapping
+
+from coverage_cleaner import clean_coverage
+from output_writer import write_json
+
+DISTRICTS_DIR = 'data/14_districts'
+# Kept outside DISTRICTS_DIR so tools globbing district files don't pick it up
+STATE_PATH = 'data/kerala_lod_z{zoom}.json'
+
+# Zoom → hierarchy levels shipped at that resolution. State and district
+# views only ever get the coarse geometry; wards only exist at full detail.
+RESOLUTIONS = OrderedDict([
+    (8, ('district', 'ac')),
+    (11, ('district', 'ac', 'mandal', 'local_body')),
+    (14, ('district', 'ac', 'mandal', 'local_body', 'ward')),
+])
+
+
+def tolerance_for_zoom(zoom):
+    """About half a 256px-tile pixel at the equator, in degrees"""
+    return 180.0 / (256 * (1 << zoom))
+
+
+def _is_coverage(arr):
+    try:
+        return bool(shapely.coverage_is_valid(arr))
+    except shapely.errors.GEOSException:
+        return False
+
+
+def _unmatched(arr):
+    """Polygons with edges that do not match their neighbours' (None when GEOS cannot tell)"""
+    try:
+        return int((~shapely.is_empty(shapely.coverage_invalid_edges(arr))).sum())
+    except (AttributeError, shapely.errors.GEOSException):
+        return None
+
+
+def simplify_coverage(geoms, tolerance):
+    """
+    Simplify polygons that tile the plane without moving shared edges apart.
+    Polygons that are not yet a valid coverage are noded and snapped onto
+    each other first (no gaps are filled); only if that fails are they
+    simplified one by one, with a warning. Returns (simplified geometries, method used).
+    """
+    if not geoms:
+        return [], 'empty'
+
+    arr = np.array(geoms, dtype=object)
+    if not hasattr(shapely, 'coverage_simplify'):
+        # GEOS < 3.12: per-polygon topology-preserving fallback
+        return list(shapely.simplify(arr, tolerance, preserve_topology=True)), 'per-geometry'
+
+    method = 'coverage'
+    present = ~shapely.is_missing(arr)
+    if not _is_coverage(arr[present]):
+        before = _unmatched(arr[present])
+        cleaned, _ = clean_coverage(arr[present], gap_width=0.0)
+        # Anything the cleaning dropped keeps its original shape
+        lost = shapely.is_missing(cleaned) | shapely.is_empty(cleaned)
+        cleaned[lost] = arr[present][lost]
+        arr = arr.copy()
+        arr[present] = cleaned
+        method = 'cleaned coverage'
+        if not _is_coverage(arr[present]):
+            after = _unmatched(arr[present])
+            print(f"   ⚠️  {after if after is not None else '?'} of {int(present.sum())} polygons still not "
+                  f"edge-matched after cleaning (were {before if before is not None else '?'}); "
+                  f"simplifying one by one, slivers may open")
+            return list(shapely.simplify(arr, tolerance, preserve_topology=True)), 'per-geometry'
+
+    try:
+        simplified = arr.copy()
+        simplified[present] = shapely.coverage_simplify(arr[present], tolerance)
+        return list(simplified), method
+    except shapely.errors.GEOSException as e:
+        print(f"   ⚠️  Coverage simplification failed ({e}); simplifying {len(arr)} polygons one by one")
+        return list(shapely.simplify(arr, tolerance, preserve_topology=True)), 'per-geometry'
+
+
+def _geometry(item):
+    geometry = item.get('geometry')
+    if not geometry:
+        return None
+    try:
+        geom = shape(geometry)
+    except Exception:
+        return None
+    if geom.is_empty or geom.geom_type not in ('Polygon', 'MultiPolygon'):
+        return None
+    return geom
+
+
+def collect_levels(district_id, data):
+    """(properties, geometry) pairs for every level of one district"""
+    levels = {level: [] for level in ('district', 'ac', 'mandal', 'local_body', 'ward')}
+
+    geom = _geometry(data)
+    if geom is not None:
+        levels['district'].append(({'district': district_id, 'name': data.get('name', district_id)}, geom))
+
+    for ac in data.get('acs', []):
+        geom = _geometry(ac)
+        if geom is not None:
+            levels['ac'].append(({'district': district_id, 'name': ac['name']}, geom))
+
+        for mandal in ac.get('mandals', []):
+            geom = _geometry(mandal)
+            if geom is not None:
+                levels['mandal'].append(({'district': district_id, 'ac': ac['name'],
+                                          'name': mandal['name']}, geom))
+
+            for lb in mandal.get('local_bodies', []):
+                geom = _geometry(lb)
+                if geom is not None:
+                    levels['local_body'].append(({'district': district_id, 'ac': ac['name'],
+                                                  'mandal': mandal['name'], 'name': lb['name'],
+                                                  'code': lb.get('code'), 'type': lb.get('type')}, geom))
+
+                for ward in lb.get('wards', []):
+                    geom = _geometry(ward)
+                    if geom is not None:
+                        levels['ward'].append(({'district': district_id, 'local_body': lb['name'],
+                                                'code': lb.get('code'),
+                                                'ward_number': ward.get('ward_number'),
+                                                'ward_name': ward.get('ward_name')}, geom))
+    return levels
+
+
+def vertex_count(geoms):
+    return int(shapely.get_num_coordinates(np.array(geoms, dtype=object)).sum()) if geoms else 0
+
+
+def generate(districts_dir=DISTRICTS_DIR):
+    print("🔍 Generating multi-resolution geometry...")
+    print("=" * 70)
+
+    district_files = sorted(f for f in os.listdir(districts_dir) if f.endswith('.json'))
+
+    # Simplify each level across the whole state so edges between districts stay shared
+    state = {level: [] for level in ('district', 'ac', 'mandal', 'local_body', 'ward')}
+    for district_file in district_files:
+        district_id = district_file.replace('.json', '')
+        with open(os.path.join(districts_dir, district_file), 'r') as f:
+            data = json.load(f)
+        for level, items in collect_levels(district_id, data).items():
+            state[level].extend(items)
+
+    outputs = {}  # (district, zoom) → {level: [features]}
+    for zoom, levels in RESOLUTIONS.items():
+        tolerance = tolerance_for_zoom(zoom)
+        print(f"\n📐 z{zoom} (tolerance {tolerance:.6f}°)")
+
+        for level in levels:
+            items = state[level]
+            geoms = [geom for _, geom in items]
+            simplified, method = simplify_coverage(geoms, tolerance)
+            print(f"   {level:<11} {len(geoms):>6} features, "
+                  f"{vertex_count(geoms):>9} → {vertex_count(simplified):>9} vertices ({method})")
+
+            for (properties, _), geom in zip(items, simplified):
+                if geom is None or geom.is_empty:
+                    continue
+                key = (properties['district'], zoom)
+                outputs.setdefault(key, {l: [] for l in levels})[level].append({
+                    'type': 'Feature',
+                    'properties': properties,
+                    'geometry': mapping(geom)
+                })
+
+    # District files: data/14_districts/<district>/lod/z<N>.json
+    for (district_id, zoom), levels in sorted(outputs.items()):
+        lod_dir = os.path.join(districts_dir, district_id, 'lod')
+        os.makedirs(lod_dir, exist_ok=True)
+        payload = {
+            'zoom': zoom,
+            'tolerance': tolerance_for_zoom(zoom),
+            'levels': {level: {'type': 'FeatureCollection', 'features': features}
+                       for level, features in levels.items()}
+        }
+        write_json(os.path.join(lod_dir, f'z{zoom}.json'), payload, report=False)
+
+        # Advertise the resolutions in the shard index when it exists
+        index_path = os.path.join(districts_dir, district_id, 'index.json')
+        if os.path.exists(index_path):
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+            index.setdefault('lod', {})[f'z{zoom}'] = f'lod/z{zoom}.json'
+            write_json(index_path, index, report=False)
+
+    # State view: coarsest district outlines for the whole of Kerala in one file
+    coarse = min(RESOLUTIONS)
+    state_features = [feature
+                      for (district_id, zoom), levels in sorted(outputs.items()) if zoom == coarse
+                      for feature in levels['district']]
+    state_path = STATE_PATH.format(zoom=coarse)
+    write_json(state_path, {'type': 'FeatureCollection', 'features': state_features})
+
+    print("\n" + "=" * 70)
+    print(f"✅ Resolutions written to {districts_dir}/<district>/lod/ and {state_path}")
+    print("=" * 70)
+
+
+if __name__ == '__main__':
+    generate()
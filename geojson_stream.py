@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Incremental JSON reader for ward and district files
+Walks a file chunk by chunk and yields only the values under the requested
+paths (e.g. every local body of a district, or every feature of a ward file),
+so memory is bounded by one yielded item rather than the whole document.
+Values that are not wanted are skipped without being decoded.
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 20
+
+# Path patterns are dotted keys; '*' steps into every element of an array
+LOCAL_BODIES = 'acs.*.mandals.*.local_bodies.*'
+WARDS = 'acs.*.mandals.*.local_bodies.*.wards.*'
+
+_WHITESPACE = re.compile(r'\s*')
+# Strings (possibly cut off at the end of the buffer) and brackets, for skipping
+_SKIP_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*("|\\?\Z)|[\[\]{}]')
+# Characters a number can still continue with
+_NUMBER_TAIL = re.compile(r'[\d.eE+-]*\Z')
+_DECODER = json.JSONDecoder()
+
+
+class _Buffer:
+    """A text window over the file that grows only while one value is being read."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def more(self):
+        """Drop consumed text and read at least as much again; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(self.chunk_size, len(self.text) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.more():
+                raise ValueError('unexpected end of JSON input')
+
+    def take(self, expected):
+        char = self.peek()
+        if char not in expected:
+            raise ValueError(f"expected {' or '.join(map(repr, expected))}, found {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.more():
+                    raise
+                continue
+            # A number running up to the end of the window may continue in the next chunk
+            if isinstance(value, (int, float)) and _NUMBER_TAIL.match(self.text, end) and self.more():
+                continue
+            self.pos = end
+            return value
+
+    def skip(self):
+        """Move past the next value without decoding it"""
+        if self.peek() not in '[{':
+            self.value()
+            return
+        depth = 0
+        while True:
+            for match in _SKIP_TOKEN.finditer(self.text, self.pos):
+                token = match.group()
+                if token[0] == '"':
+                    if match.group(1) != '"':
+                        break  # string cut off by the end of the window
+                elif token in '[{':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth:
+                        self.pos = match.end()
+                        return
+                self.pos = match.end()
+            else:
+                self.pos = len(self.text)
+            if not self.more():
+                raise ValueError('unexpected end of JSON input')
+
+
+def _member(buffer, active, parents):
+    """Read one object member or array element against the patterns still active"""
+    finished = [pattern for pattern, steps in active if not steps]
+    if finished:
+        value = buffer.value()
+        for pattern in finished:
+            yield pattern, parents, value
+    elif active and buffer.peek() in '[{':
+        yield from _walk(buffer, active, parents)
+    else:
+        buffer.skip()
+
+
+def _walk(buffer, active, parents):
+    if buffer.take('[{') == '[':
+        elements = [(pattern, steps[1:]) for pattern, steps in active if steps[0] == '*']
+        if buffer.peek() == ']':
+            buffer.pos += 1
+            return
+        while True:
+            yield from _member(buffer, elements, parents)
+            if buffer.take(',]') == ']':
+                return
+
+    # Scalar fields of each enclosing object are handed out with the items below it
+    fields = {}
+    parents = parents + (fields,)
+    if buffer.peek() == '}':
+        buffer.pos += 1
+        return
+    while True:
+        key = buffer.value()
+        buffer.take(':')
+        matching = [(pattern, steps[1:]) for pattern, steps in active if steps[0] == key]
+        if matching and buffer.peek() not in '[{':
+            # Matched scalars stay visible to the items further down as well
+            fields[key] = buffer.value()
+            for pattern, steps in matching:
+                if not steps:
+                    yield pattern, parents, fields[key]
+        elif matching:
+            yield from _member(buffer, matching, parents)
+        elif buffer.peek() in '[{':
+            buffer.skip()
+        else:
+            fields[key] = buffer.value()
+        if buffer.take(',}') == '}':
+            return
+
+
+def stream(path, *patterns, chunk_size=CHUNK_SIZE):
+    """
+    Yield (pattern, parents, value) for every value of the file at one of the
+    patterns. parents holds the scalar fields of each enclosing object,
+    outermost first, as read so far (keys after the matched one are not known yet).
+    """
+    active = [(pattern, pattern.split('.')) for pattern in patterns]
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = _Buffer(f, chunk_size)
+        if buffer.peek() in '[{':
+            yield from _walk(buffer, active, ())
+
+
+def iter_items(path, pattern, chunk_size=CHUNK_SIZE):
+    """(parents, value) for every value at one pattern, e.g. LOCAL_BODIES"""
+    for _, parents, value in stream(path, pattern, chunk_size=chunk_size):
+        yield parents, value
+
+
+def iter_features(path, chunk_size=CHUNK_SIZE):
+    """Features of a GeoJSON file one at a time, whether it is a collection or a single feature"""
+    found = False
+    single = {}
+    for pattern, parents, value in stream(path, 'features.*', 'geometry', 'properties', chunk_size=chunk_size):
+        if pattern == 'features.*':
+            found = True
+            yield value
+        else:
+            single[pattern] = value
+            single_fields = parents[0]
+    if not found and 'geometry' in single:
+        yield {**single_fields, 'properties': single.get('properties') or {}, 'geometry': single['geometry']}
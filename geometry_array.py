@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Vectorized geometry layer over Shapely 2 arrays
+Wards are held as NumPy object arrays so parsing, validity checks, repair and
+area/bounds run as GEOS ufuncs instead of per-feature calls; grouped unions
+live in dissolve_engine.dissolve
+"""
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+POLYGON_TYPES = ('Polygon', 'MultiPolygon')
+
+
+def as_array(geoms):
+    return np.asarray(geoms, dtype=object) if not isinstance(geoms, np.ndarray) else geoms
+
+
+def _ragged_polygons(geometries):
+    """(Multi)Polygon dicts → MultiPolygon array through one from_ragged_array call"""
+    coords = []
+    ring_offsets, polygon_offsets, geometry_offsets = [0], [0], [0]
+    for geometry in geometries:
+        polygons = [geometry['coordinates']] if geometry['type'] == 'Polygon' else geometry['coordinates']
+        for polygon in polygons:
+            for ring in polygon:
+                coords.extend(ring)
+                ring_offsets.append(len(coords))
+            polygon_offsets.append(len(ring_offsets) - 1)
+        geometry_offsets.append(len(polygon_offsets) - 1)
+
+    # One row per position: (x, y) or (x, y, z) as shape() would keep them;
+    # positions of mixed dimension raise and are parsed one at a time
+    xy = np.array(coords, dtype=float) if coords else np.empty((0, 2))
+    if xy.ndim != 2 or xy.shape[1] < 2:
+        raise ValueError(f'unsupported coordinate array of shape {xy.shape}')
+    xy = xy[:, :3]
+    offsets = (np.array(ring_offsets), np.array(polygon_offsets), np.array(geometry_offsets))
+    return shapely.from_ragged_array(shapely.GeometryType.MULTIPOLYGON, xy, offsets)
+
+
+def from_geojson(geometries):
+    """
+    GeoJSON geometry dicts → geometry array (None where a geometry is missing or
+    unreadable). Polygon inputs come back as Polygons, as shape() would return them.
+    """
+    result = np.empty(len(geometries), dtype=object)
+    polygon_idx = [i for i, g in enumerate(geometries)
+                   if g and g.get('type') in POLYGON_TYPES and g.get('coordinates')]
+
+    if polygon_idx:
+        batch = [geometries[i] for i in polygon_idx]
+        try:
+            parsed = _ragged_polygons(batch)
+            single = np.array([g['type'] == 'Polygon' for g in batch])
+            parsed[single] = shapely.get_geometry(parsed[single], 0)
+            result[polygon_idx] = parsed
+        except (ValueError, TypeError, shapely.errors.GEOSException):
+            # Mixed 2D/3D rings or malformed coordinates: parse those one at a time
+            polygon_idx = []
+
+    done = set(polygon_idx)
+    for i, geometry in enumerate(geometries):
+        if i in done or not geometry:
+            continue
+        try:
+            result[i] = shape(geometry)
+        except Exception:
+            result[i] = None
+    return result
+
+
+def validity(geoms):
+    """Boolean validity per geometry; missing geometries are invalid"""
+    geoms = as_array(geoms)
+    return shapely.is_valid(geoms) & ~shapely.is_missing(geoms)
+
+
+def repair(geoms, valid=None):
+    """Copy with invalid geometries replaced by their buffer(0) repair"""
+    geoms = as_array(geoms).copy()
+    if valid is None:
+        valid = validity(geoms)
+    broken = ~valid & ~shapely.is_missing(geoms)
+    if broken.any():
+        geoms[broken] = shapely.buffer(geoms[broken], 0)
+    return geoms
+
+
+def measure(geoms):
+    """Areas and [minx, miny, maxx, maxy] bounds of every geometry"""
+    geoms = as_array(geoms)
+    return shapely.area(geoms), shapely.bounds(geoms)
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Binary geometry store of the hierarchy, one table per level
+Each table is a WKB blob in Hilbert order, a memory-mappable row index
+(offset, length, bbox) and a packed R-tree over the row boxes, so a reader
+can fetch just the rows a bbox touches instead of parsing the district JSONs.
+A GeoParquet copy of each table is written as well when pyarrow is installed.
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import shapely
+
+from geometry_array import from_geojson
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+DISTRICTS_DIR = 'data/14_districts'
+STORE_DIR = 'data/14_districts_store'
+STORE_VERSION = 1
+LEVELS = ('district', 'ac', 'mandal', 'local_body', 'ward')
+NODE_SIZE = 16
+HILBERT_BITS = 16
+
+BOX_FIELDS = [('minx', '<f8'), ('miny', '<f8'), ('maxx', '<f8'), ('maxy', '<f8')]
+ROW_DTYPE = np.dtype([('offset', '<u8'), ('length', '<u4')] + BOX_FIELDS)
+NODE_DTYPE = np.dtype(BOX_FIELDS)
+
+
+def hilbert_index(x, y, bits=HILBERT_BITS):
+    """Position along the Hilbert curve of integer grid coordinates (vectorized)"""
+    x, y = x.astype(np.int64), y.astype(np.int64)
+    d = np.zeros_like(x)
+    s = 1 << (bits - 1)
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the curve stays continuous
+        flip = rx & ~ry
+        x, y = np.where(flip, s - 1 - x, x), np.where(flip, s - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+    return d
+
+
+def hilbert_order(bounds):
+    """Row order sorting the box centres along a Hilbert curve over their extent"""
+    if not len(bounds):
+        return np.arange(0)
+    lo = bounds[:, :2].min(axis=0)
+    span = np.maximum(bounds[:, 2:].max(axis=0) - lo, 1e-12)
+    centers = (bounds[:, :2] + bounds[:, 2:]) / 2
+    grid = ((centers - lo) / span * ((1 << HILBERT_BITS) - 1)).astype(np.int64)
+    return np.argsort(hilbert_index(grid[:, 0], grid[:, 1]), kind='stable')
+
+
+def pack_rtree(bounds, node_size=NODE_SIZE):
+    """
+    Packed R-tree over boxes already in spatial order: each node covers
+    node_size consecutive children. Returns the node levels, lowest first.
+    """
+    levels = []
+    child = bounds
+    while len(child) > 1:
+        starts = np.arange(0, len(child), node_size)
+        child = np.column_stack([
+            np.minimum.reduceat(child[:, 0], starts), np.minimum.reduceat(child[:, 1], starts),
+            np.maximum.reduceat(child[:, 2], starts), np.maximum.reduceat(child[:, 3], starts),
+        ])
+        levels.append(child)
+    return levels
+
+
+def write_geoparquet(path, columns, blobs, bounds):
+    """GeoParquet 1.1 table: WKB geometry plus a bbox covering column"""
+    table = pa.table({
+        **{key: pa.array(values) for key, values in columns.items()},
+        'geometry': pa.array(blobs, type=pa.binary()),
+        'bbox': pa.StructArray.from_arrays([pa.array(bounds[:, i]) for i in range(4)],
+                                           names=['xmin', 'ymin', 'xmax', 'ymax']),
+    })
+    geo = {
+        'version': '1.1.0',
+        'primary_column': 'geometry',
+        'columns': {'geometry': {
+            'encoding': 'WKB',
+            'geometry_types': ['Polygon', 'MultiPolygon'],
+            'covering': {'bbox': {key: ['bbox', key] for key in ('xmin', 'ymin', 'xmax', 'ymax')}},
+        }},
+    }
+    table = table.replace_schema_metadata({'geo': json.dumps(geo)})
+    pq.write_table(table, path, row_group_size=4096)
+
+
+class GeoStoreWriter:
+    """Collects hierarchy rows as WKB, then writes one table per level."""
+
+    def __init__(self):
+        self.tables = {level: ([], []) for level in LEVELS}
+        # Every unit in document order, with or without geometry, for the hierarchy index
+        self.units = []
+        self.locations = {}
+
+    def add(self, rows):
+        """Add (level, properties, geometry dict) rows; rows without geometry are skipped"""
+        batch = {level: ([], []) for level in LEVELS}
+        for level, properties, geometry in rows:
+            self.units.append((level, properties))
+            batch[level][0].append(properties)
+            batch[level][1].append(geometry)
+
+        for level, (properties, geometries) in batch.items():
+            geoms = from_geojson(geometries)
+            present = ~shapely.is_missing(geoms)
+            self.tables[level][0].extend(p for p, ok in zip(properties, present) if ok)
+            self.tables[level][1].extend(shapely.to_wkb(geoms[present]))
+
+    def _write_table(self, store_dir, level):
+        properties, blobs = self.tables[level]
+        blobs = np.array(blobs, dtype=object)
+        bounds = shapely.bounds(shapely.from_wkb(blobs)).reshape(-1, 4)
+
+        # Hilbert order keeps neighbours close on disk and the packed tree tight
+        order = hilbert_order(bounds)
+        blobs, bounds = blobs[order], bounds[order]
+        lengths = np.array([len(blob) for blob in blobs], dtype=np.int64)
+
+        rows = np.zeros(len(blobs), dtype=ROW_DTYPE)
+        rows['offset'] = np.concatenate([[0], np.cumsum(lengths)[:-1]]) if len(blobs) else []
+        rows['length'] = lengths
+        for i, field in enumerate(('minx', 'miny', 'maxx', 'maxy')):
+            rows[field] = bounds[:, i]
+
+        tree = pack_rtree(bounds)
+        nodes = np.zeros(sum(len(level_nodes) for level_nodes in tree), dtype=NODE_DTYPE)
+        tree_levels, start = [], 0
+        for level_nodes in tree:
+            for i, field in enumerate(('minx', 'miny', 'maxx', 'maxy')):
+                nodes[field][start:start + len(level_nodes)] = level_nodes[:, i]
+            tree_levels.append([start, len(level_nodes)])
+            start += len(level_nodes)
+
+        blob_path = os.path.join(store_dir, f'{level}.wkb')
+        with open(f'{blob_path}.tmp', 'wb') as f:
+            f.write(b''.join(blobs))
+        os.replace(f'{blob_path}.tmp', blob_path)
+        np.save(os.path.join(store_dir, f'{level}.rows.npy'), rows)
+        np.save(os.path.join(store_dir, f'{level}.rtree.npy'), nodes)
+
+        ordered = [properties[i] for i in order]
+        for row, (p, offset, length) in enumerate(zip(ordered, rows['offset'], rows['length'])):
+            self.locations[(level, p.get('id'))] = (row, int(offset), int(length))
+        columns = {key: [p.get(key) for p in ordered]
+                   for key in dict.fromkeys(k for p in ordered for k in p)}
+        with open(os.path.join(store_dir, f'{level}.columns.json'), 'w', encoding='utf-8') as f:
+            json.dump(columns, f, ensure_ascii=False, separators=(',', ':'))
+
+        if pa is not None:
+            write_geoparquet(os.path.join(store_dir, f'{level}.parquet'), columns, list(blobs), bounds)
+        return {'rows': len(blobs), 'bytes': int(lengths.sum()), 'tree': tree_levels}
+
+    def write(self, store_dir=STORE_DIR, districts_dir=DISTRICTS_DIR):
+        from hierarchy_index import write_index
+
+        os.makedirs(store_dir, exist_ok=True)
+        manifest = {'version': STORE_VERSION, 'node_size': NODE_SIZE,
+                    'geoparquet': pa is not None, 'tables': {}}
+        for level in LEVELS:
+            manifest['tables'][level] = self._write_table(store_dir, level)
+        write_index(store_dir, self.units, self.locations, districts_dir)
+
+        # Written last, so a reader never sees a manifest ahead of its tables
+        manifest_path = os.path.join(store_dir, 'manifest.json')
+        with open(f'{manifest_path}.tmp', 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(f'{manifest_path}.tmp', manifest_path)
+        return manifest
+
+
+class GeoTable:
+    """One level of the store: memory-mapped row index, bbox queries and ranged WKB reads."""
+
+    def __init__(self, store_dir, level, manifest):
+        self.level = level
+        self.rows = np.load(os.path.join(store_dir, f'{level}.rows.npy'), mmap_mode='r')
+        self.nodes = np.load(os.path.join(store_dir, f'{level}.rtree.npy'), mmap_mode='r')
+        self.tree = manifest['tables'][level]['tree']
+        self.node_size = manifest['node_size']
+        self.blob_path = os.path.join(store_dir, f'{level}.wkb')
+        self.columns_path = os.path.join(store_dir, f'{level}.columns.json')
+        self._columns = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def columns(self):
+        if self._columns is None:
+            with open(self.columns_path, 'r', encoding='utf-8') as f:
+                self._columns = json.load(f)
+        return self._columns
+
+    def query(self, bounds):
+        """Row numbers whose bbox intersects (minx, miny, maxx, maxy), walking the packed tree"""
+        minx, miny, maxx, maxy = bounds
+
+        def hits(boxes, candidates):
+            b = boxes[candidates]
+            return candidates[(b['minx'] <= maxx) & (b['maxx'] >= minx) &
+                              (b['miny'] <= maxy) & (b['maxy'] >= miny)]
+
+        # Each level's size bounds the child numbers coming from the level above
+        sizes = [len(self.rows)] + [count for _, count in self.tree]
+        candidates = np.arange(sizes[-1])
+        for depth in range(len(self.tree) - 1, -1, -1):
+            start, count = self.tree[depth]
+            candidates = hits(self.nodes[start:start + count], candidates)
+            candidates = (candidates[:, None] * self.node_size + np.arange(self.node_size)).ravel()
+            candidates = candidates[candidates < sizes[depth]]
+        return hits(self.rows, candidates)
+
+    def geometries(self, rows):
+        """Geometries of the given rows; only their byte ranges are read"""
+        blobs = np.empty(len(rows), dtype=object)
+        with open(self.blob_path, 'rb') as f:
+            for k, row in enumerate(rows):
+                f.seek(int(self.rows['offset'][row]))
+                blobs[k] = f.read(int(self.rows['length'][row]))
+        return shapely.from_wkb(blobs)
+
+    def properties(self, rows):
+        columns = self.columns
+        return [{key: values[row] for key, values in columns.items()} for row in rows]
+
+
+class GeoStore:
+    """Per-level tables written by GeoStoreWriter, opened on first use."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self._tables = {}
+
+    def table(self, level):
+        if level not in self._tables:
+            self._tables[level] = GeoTable(self.store_dir, level, self.manifest)
+        return self._tables[level]
+
+
+def report(manifest, store_dir):
+    for level, table in manifest['tables'].items():
+        print(f"   {level:<11} {table['rows']:>6} rows, {table['bytes'] / 1024 / 1024:>6.1f} MB WKB")
+    parquet = ' + GeoParquet' if manifest['geoparquet'] else ''
+    print(f"🗄️  Geometry store written: {store_dir}{parquet}")
+
+
+def build_store(districts_dir=DISTRICTS_DIR, store_dir=STORE_DIR):
+    """Rebuild the store from the district files (e.g. after they were cleaned)"""
+    from consolidate_14_districts import hierarchy_rows
+
+    writer = GeoStoreWriter()
+    for file in sorted(f for f in os.listdir(districts_dir) if f.endswith('.json')):
+        with open(os.path.join(districts_dir, file), 'r', encoding='utf-8') as f:
+            writer.add(hierarchy_rows(file[:-len('.json')], json.load(f)))
+    manifest = writer.write(store_dir, districts_dir)
+    report(manifest, store_dir)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the binary geometry store')
+    parser.add_argument('--districts-dir', default=DISTRICTS_DIR)
+    parser.add_argument('--store-dir', default=STORE_DIR)
+    parser.add_argument('--bbox', nargs=4, type=float, metavar=('MINX', 'MINY', 'MAXX', 'MAXY'),
+                        help='List the rows of --level intersecting this box instead of building')
+    parser.add_argument('--level', default='ward', choices=LEVELS)
+    args = parser.parse_args()
+
+    if not args.bbox:
+        build_store(args.districts_dir, args.store_dir)
+        return
+
+    table = GeoStore(args.store_dir).table(args.level)
+    rows = table.query(args.bbox)
+    geoms = table.geometries(rows)
+    box = shapely.box(*args.bbox)
+    for properties, hit in zip(table.properties(rows), shapely.intersects(geoms, box)):
+        if hit:
+            print(properties['id'])
+    print(f"✅ {int(shapely.intersects(geoms, box).sum())} {args.level} rows intersect the box")
+
+
+if __name__ == '__main__':
+    main()
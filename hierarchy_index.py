@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Persistent id/code index over the district → AC → mandal → local body → ward hierarchy
+Every unit is keyed by its shard-layout id (<district>/<ac>/<mandal>/<local body>/<ward
+number>), local bodies also by their LBCode. Entries carry the parent id, the ordinal
+path into the district JSON, the shard holding the unit and the byte range of its WKB
+in the geometry store, so a single ward is read without parsing its district.
+"""
+
+import argparse
+import json
+import os
+
+from consolidate_14_districts import clean_id
+from geostore import DISTRICTS_DIR, STORE_DIR, GeoStore
+
+INDEX_NAME = 'hierarchy_index.json'
+INDEX_VERSION = 1
+# Child lists below each depth of the district JSON, for the ordinal paths
+CHILD_LISTS = ('acs', 'mandals', 'local_bodies', 'wards')
+
+
+def shard_path(level, item_id):
+    """Shard file (relative to the districts dir) that holds a unit, as laid out by write_shards"""
+    parts = item_id.split('/')
+    if level == 'district':
+        return f'{item_id}/district.json'
+    if level == 'ac':
+        return f'{item_id}/ac.json'
+    if level == 'mandal':
+        return f'{item_id}/mandal.json'
+    # Wards live inside their local body's shard
+    return '/'.join(parts[:4]) + '.json'
+
+
+def write_index(store_dir, units, locations, districts_dir=DISTRICTS_DIR):
+    """
+    Write the index for (level, properties) units in document order.
+    locations: {(level, id): (row, offset, length)} of the units stored with a geometry.
+    """
+    entries, codes, child_counts = {}, {}, {}
+    for level, props in units:
+        item_id, parent = props['id'], props.get('parent')
+        path = []
+        if parent:
+            path = entries[parent]['path'] + [child_counts.get(parent, 0)]
+            child_counts[parent] = path[-1] + 1
+        entry = {'level': level, 'name': props.get('name'), 'parent': parent,
+                 'path': path, 'shard': shard_path(level, item_id)}
+        for key in ('code', 'type', 'ward_number'):
+            if props.get(key) is not None:
+                entry[key] = props[key]
+        if (level, item_id) in locations:
+            entry['row'], entry['offset'], entry['length'] = locations[(level, item_id)]
+        entries[item_id] = entry
+        if level == 'local_body' and props.get('code'):
+            codes.setdefault(str(props['code']), item_id)
+
+    index = {'version': INDEX_VERSION,
+             'shards': os.path.relpath(districts_dir, store_dir).replace(os.sep, '/'),
+             'entries': entries, 'codes': codes}
+    path = os.path.join(store_dir, INDEX_NAME)
+    with open(f'{path}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(f'{path}.tmp', path)
+    print(f"🗂️  Hierarchy index written: {path} ({len(entries)} units, {len(codes)} LB codes)")
+    return index
+
+
+class HierarchyIndex:
+    """Dictionary lookups over a written index; geometries are read from the store on demand."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        with open(os.path.join(store_dir, INDEX_NAME), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        self.entries = index['entries']
+        self.codes = index['codes']
+        self.shards_dir = os.path.normpath(os.path.join(store_dir, index['shards']))
+        self._store = None
+
+    def __contains__(self, item_id):
+        return item_id in self.entries
+
+    def get(self, item_id):
+        return self.entries.get(item_id)
+
+    def by_code(self, code):
+        """Local body id of an LBCode (None when unknown)"""
+        return self.codes.get(str(code).strip())
+
+    def find(self, district, ac=None, mandal=None, local_body=None, ward_number=None):
+        """Id of a unit given by names (and ward number), or None"""
+        parts = [clean_id(district)]
+        for name in (ac, mandal, local_body):
+            if name is None:
+                break
+            parts.append(clean_id(name))
+        if ward_number is not None:
+            parts.append(clean_id(str(ward_number)))
+        item_id = '/'.join(parts)
+        return item_id if item_id in self.entries else None
+
+    def ward(self, local_body, ward_number):
+        """Ward id of a local body (id or LBCode) and ward number"""
+        lb_id = local_body if local_body in self.entries else self.by_code(local_body)
+        ward_id = f'{lb_id}/{clean_id(str(ward_number))}'
+        return ward_id if lb_id and ward_id in self.entries else None
+
+    def parents(self, item_id):
+        """Ids of the enclosing units, outermost first"""
+        chain = []
+        parent = self.entries[item_id]['parent']
+        while parent:
+            chain.append(parent)
+            parent = self.entries[parent]['parent']
+        return chain[::-1]
+
+    def shard(self, item_id):
+        return os.path.join(self.shards_dir, self.entries[item_id]['shard'])
+
+    def locate(self, district, item_id):
+        """The unit's own dict inside a loaded district JSON, by its ordinal path"""
+        node = district
+        for depth, ordinal in enumerate(self.entries[item_id]['path']):
+            node = node[CHILD_LISTS[depth]][ordinal]
+        return node
+
+    def geometry(self, item_id):
+        """Shapely geometry of one unit from its WKB byte range (None when it has none)"""
+        entry = self.entries[item_id]
+        if 'row' not in entry:
+            return None
+        if self._store is None:
+            self._store = GeoStore(self.store_dir)
+        return self._store.table(entry['level']).geometries([entry['row']])[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Look up units in the hierarchy index')
+    parser.add_argument('key', help='Unit id (e.g. kollam/chavara) or LBCode')
+    parser.add_argument('--ward', help='Ward number within the local body')
+    parser.add_argument('--store-dir', default=STORE_DIR)
+    args = parser.parse_args()
+
+    index = HierarchyIndex(args.store_dir)
+    item_id = args.key if args.key in index else index.by_code(args.key)
+    if item_id and args.ward:
+        item_id = index.ward(item_id, args.ward)
+    if not item_id:
+        print(f"❌ Not found: {args.key}" + (f" ward {args.ward}" if args.ward else ''))
+        return
+
+    entry = index.get(item_id)
+    print(f"📍 {item_id} ({entry['level']}): {entry['name']}")
+    for parent in index.parents(item_id):
+        print(f"   ↳ in {parent}: {index.get(parent)['name']}")
+    print(f"   shard: {index.shard(item_id)}")
+    geometry = index.geometry(item_id)
+    if geometry is not None:
+        print(f"   geometry: {geometry.geom_type}, bytes {entry['offset']}+{entry['length']}, "
+              f"bounds {tuple(round(v, 5) for v in geometry.bounds)}")
+
+
+if __name__ == '__main__':
+    main()
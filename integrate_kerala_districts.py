@@ -5,7 +5,11 @@ Process Kerala_districts.geojson to extract 14 main districts and make them crac
 
 import json
 from shapely.geometry import shape, mapping
-from shapely.ops import unary_union
+
+from coverage_cleaner import clean_coverage, report
+from generate_resolutions import simplify_coverage
+from geometry_array import from_geojson
+from output_writer import write_json
 
 print("=" * 80)
 print("🔧 PROCESSING YOUR KERALA DISTRICTS FILE")
@@ -45,22 +49,19 @@ for feature in data['features']:
 
 print(f"\n📊 Extracted {len(main_districts)} main districts")
 
-# Process each district to remove cracks
+# Remove cracks: clean all districts together into one shared coverage
+print(f"\n🔧 Cleaning shared district boundaries...")
+cleaned, stats = clean_coverage(from_geojson([feature['geometry'] for feature in main_districts]))
+report('district', stats)
+
+# Simplify shared edges once so neighbours stay crack-free
+simplified_geoms, _ = simplify_coverage(list(cleaned), 0.0001)
+
 fixed_features = []
-for feature in main_districts:
+for feature, simplified in zip(main_districts, simplified_geoms):
     district_name = feature['properties']['name']
-    print(f"\n🔧 Processing {district_name}...")
-    
-    # Convert to shapely geometry
-    geom = shape(feature['geometry'])
-    
-    # Apply buffer to close gaps (0.005 degrees ≈ 555 meters)
-    print(f"   → Applying 555m buffer to close gaps...")
-    buffered = geom.buffer(0.005).buffer(-0.005)
-    
-    # Simplify to reduce complexity while preserving topology
-    print(f"   → Simplifying geometry...")
-    simplified = buffered.simplify(0.0001, preserve_topology=True)
+    if simplified is None or simplified.is_empty:
+        simplified = shape(feature['geometry'])
     
     # Create new feature with clean properties
     district_id = district_name.lower().replace(' ', '')
@@ -89,10 +90,7 @@ output_data = {
 output_file = 'data/kerala_14_districts_fixed.geojson'
 print(f"\n💾 Saving to: {output_file}")
 
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(output_data, f)
-
-file_size = len(json.dumps(output_data)) / (1024 * 1024)
+file_size = write_json(output_file, output_data) / (1024 * 1024)
 print(f"✅ Done! File size: {file_size:.2f} MB")
 print(f"✅ Created crack-free 14 districts map!")
 print("=" * 80)
@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.533154,9.325473],[76.532861,9.326011],[76.532769,9.326238],[76.532607,9.326759],[76.532482,9.329058],[76.532208,9.329438],[76.531884,9.329661],[76.531617,9.329687],[76.531554,9.329677],[76.531166,9.329614],[76.531104,9.329583],[76.530852,9.329455],[76.530461,9.329142],[76.530126,9.328838],[76.529945,9.328554],[76.529695,9.328141],[76.529253,9.327727],[76.528949,9.327441],[76.528657,9.32712],[76.527964,9.326472],[76.527455,9.326266],[76.526881,9.326095],[76.526152,9.326038],[76.525684,9.326107],[76.524967,9.326258],[76.524575,9.326346],[76.524092,9.326496],[76.523533,9.32664],[76.52318,9.326727],[76.522254,9.326864],[76.521095,9.326978],[76.520504,9.327011],[76.519491,9.327112],[76.518699,9.327194],[76.517833,9.327277],[76.517158,9.327297],[76.516481,9.327158],[76.515808,9.326981],[76.514972,9.326659],[76.514269,9.326382],[76.513797,9.326227],[76.512704,9.326089],[76.511721,9.32595],[76.510708,9.325756],[76.509675,9.32549],[76.508434,9.325153],[76.507222,9.324823],[76.506328,9.324635],[76.505279,9.324474],[76.504295,9.324289],[76.503813,9.324193],[76.503076,9.323893],[76.502997,9.323834],[76.501931,9.323563],[76.50142,9.323539],[76.500933,9.323603],[76.499848,9.323651],[76.497173,9.324265],[76.495341,9.325142],[76.493673,9.327137],[76.490018,9.328673],[76.489779,9.328663],[76.489678,9.328839],[76.487716,9.32943],[76.487235,9.329456],[76.485471,9.329404],[76.484107,9.329113],[76.482503,9.32885],[76.48028,9.328616],[76.477901,9.328668],[76.474398,9.328879],[76.474398,9.329671],[76.474719,9.33041],[76.474398,9.330937],[76.473649,9.331344],[76.473273,9.331752],[76.47327,9.332119],[76.473398,9.332524],[76.473607,9.333003],[76.473864,9.333312],[76.474211,9.333655],[76.474745,9.334347],[76.475134,9.334855],[76.47525,9.335035],[76.475342,9.335221],[76.475976,9.336161],[76.476029,9.336768],[76.475601,9.337058],[76.474779,9.33728],[76.474957,9.337566],[76.475109,9.337729],[76.475212,9.337833],[76.47532,9.337917],[76.475334,9.337928],[76.476377,9.338667],[76.476377,9.339063],[76.476992,9.338852],[76.478516,9.339274],[76.478302,9.34025],[76.478596,9.341121],[76.479639,9.340778],[76.479949,9.340524],[76.479912,9.340787],[76.480074,9.340956],[76.480322,9.340932],[76.480475,9.34142],[76.481321,9.342625],[76.482362,9.343929],[76.48283,9.345141],[76.484059,9.345776],[76.485229,9.345834],[76.486012,9.34608],[76.486487,9.3463],[76.487102,9.346585],[76.488596,9.34716],[76.489878,9.346926],[76.490978,9.346781],[76.493332,9.346956],[76.494524,9.347071],[76.495385,9.346898],[76.495893,9.346763],[76.496616,9.347303],[76.497163,9.348151],[76.498004,9.348537],[76.498844,9.348884],[76.499587,9.349347],[76.500487,9.350036],[76.501403,9.350394],[76.501938,9.350475],[76.503061,9.350473],[76.504077,9.350648],[76.505513,9.351306],[76.505884,9.351741],[76.506507,9.352424],[76.507141,9.353048],[76.50756,9.353483],[76.508901,9.354707],[76.510033,9.354617],[76.511434,9.354818],[76.512351,9.354494],[76.512731,9.353643],[76.513335,9.353778],[76.514492,9.354329],[76.515328,9.354297],[76.516751,9.354178],[76.51674,9.354356],[76.51682,9.354867],[76.516578,9.355976],[76.516246,9.356225],[76.516266,9.356567],[76.516201,9.356876],[76.51618,9.357249],[76.516536,9.357313],[76.51659,9.35759],[76.516201,9.357526],[76.516072,9.357643],[76.516126,9.358165],[76.516238,9.358295],[76.51639,9.358514],[76.516379,9.358642],[76.516433,9.358845],[76.516417,9.358979],[76.516597,9.359794],[76.51665,9.359928],[76.516395,9.36003],[76.516573,9.360371],[76.516997,9.360894],[76.517143,9.361377],[76.517084,9.361484],[76.516934,9.361558],[76.516773,9.361646],[76.516739,9.361798],[76.516689,9.361837],[76.516531,9.361979],[76.516431,9.362061],[76.516417,9.36211],[76.516409,9.362151],[76.516407,9.362315],[76.516431,9.362522],[76.516431,9.362701],[76.51632,9.362947],[76.516222,9.363008],[76.51606,9.363142],[76.516021,9.36336],[76.515886,9.363782],[76.51572,9.364033],[76.515986,9.364461],[76.516026,9.364521],[76.516191,9.364872],[76.516402,9.365231],[76.516636,9.365456],[76.516838,9.365674],[76.517016,9.365776],[76.517266,9.365945],[76.517637,9.366027],[76.517783,9.366021],[76.518199,9.365993],[76.518659,9.365859],[76.519204,9.365669],[76.519842,9.365444],[76.520311,9.365331],[76.520981,9.365197],[76.521646,9.365059],[76.522341,9.364979],[76.524054,9.365335],[76.524124,9.365575],[76.524176,9.365919],[76.524179,9.366676],[76.524175,9.367015],[76.524054,9.367733],[76.523931,9.368073],[76.523775,9.368307],[76.523597,9.368452],[76.523206,9.368549],[76.521506,9.368903],[76.520641,9.369173],[76.519105,9.369643],[76.518451,9.369819],[76.517881,9.369898],[76.517885,9.369914],[76.517501,9.369939],[76.516921,9.36996],[76.515306,9.370067],[76.51495,9.370093],[76.51469,9.370265],[76.514465,9.370509],[76.514433,9.37082],[76.514621,9.371761],[76.514768,9.372151],[76.51479,9.373088],[76.514679,9.373364],[76.514605,9.373411],[76.513949,9.37344],[76.513305,9.373452],[76.512875,9.373481],[76.512684,9.373615],[76.512474,9.373884],[76.51218,9.37438],[76.51181,9.374747],[76.511125,9.375319],[76.510509,9.375657],[76.510312,9.375796],[76.510177,9.375888],[76.509887,9.376263],[76.509858,9.376315],[76.509776,9.376734],[76.50995,9.377808],[76.510167,9.378368],[76.510382,9.378975],[76.510488,9.379485],[76.510624,9.379971],[76.510634,9.38018],[76.510622,9.380422],[76.510579,9.380622],[76.510672,9.380997],[76.510727,9.381206],[76.510852,9.381633],[76.510978,9.381892],[76.511007,9.381986],[76.511233,9.382202],[76.511604,9.382202],[76.511902,9.382274],[76.512014,9.382453],[76.511994,9.382724],[76.511973,9.38301],[76.511929,9.383243],[76.511878,9.383624],[76.51181,9.383897],[76.511756,9.384125],[76.511746,9.38435],[76.511616,9.385687],[76.511727,9.386332],[76.511959,9.386778],[76.512206,9.387325],[76.512228,9.387407],[76.512767,9.387863],[76.513281,9.3883],[76.51354,9.388661],[76.513933,9.389309],[76.51407,9.390021],[76.514079,9.390383],[76.513921,9.390426],[76.513912,9.390424],[76.513425,9.390668],[76.512722,9.390774],[76.51203,9.390783],[76.511508,9.390868],[76.511068,9.391057],[76.510733,9.391461],[76.510684,9.391898],[76.510742,9.392017],[76.51099,9.393064],[76.511281,9.39426],[76.511319,9.394514],[76.511348,9.395144],[76.511398,9.395689],[76.511453,9.396221],[76.511709,9.397119],[76.511911,9.39775],[76.512081,9.398451],[76.512192,9.399273],[76.512101,9.399545],[76.511958,9.400002],[76.51196,9.40048],[76.512261,9.400463],[76.512551,9.400318],[76.512955,9.400237],[76.513218,9.400226],[76.513822,9.400298],[76.514727,9.400512],[76.514975,9.400521],[76.515459,9.40028],[76.516165,9.399825],[76.516274,9.400089],[76.516331,9.400424],[76.516339,9.400654],[76.51633,9.400943],[76.516282,9.401363],[76.516206,9.401703],[76.516183,9.402144],[76.516075,9.402633],[76.516056,9.402704],[76.516229,9.402736],[76.516135,9.403153],[76.516157,9.403522],[76.516062,9.403888],[76.515815,9.404139],[76.515731,9.404251],[76.516069,9.405029],[76.516144,9.405427],[76.515971,9.405796],[76.515889,9.406199],[76.515874,9.406578],[76.515866,9.406768],[76.516062,9.406867],[76.516274,9.406965],[76.516331,9.407],[76.516189,9.407227],[76.516101,9.407499],[76.516281,9.407603],[76.516475,9.407735],[76.516581,9.4078],[76.516743,9.40801],[76.516834,9.408144],[76.517002,9.408326],[76.516999,9.408414],[76.517248,9.408636],[76.517657,9.408959],[76.517923,9.409179],[76.518333,9.409434],[76.518699,9.409589],[76.518974,9.409804],[76.519278,9.409736],[76.51939,9.409083],[76.519542,9.408863],[76.52,9.40872],[76.520487,9.408657],[76.521037,9.408675],[76.521786,9.408623],[76.522078,9.408594],[76.522853,9.408614],[76.523346,9.408712],[76.523965,9.409056],[76.524322,9.409291],[76.524648,9.409322],[76.524939,9.409349],[76.525196,9.409373],[76.525285,9.409373],[76.525494,9.409321],[76.525635,9.410258],[76.525618,9.411187],[76.52578,9.411391],[76.525753,9.41169],[76.526123,9.412643],[76.526316,9.413596],[76.527426,9.412933],[76.528642,9.413024],[76.529596,9.413117],[76.52974,9.413385],[76.531118,9.413268],[76.531009,9.414155],[76.530789,9.414699],[76.530631,9.41568],[76.530658,9.416432],[76.530906,9.416539],[76.531734,9.416321],[76.532745,9.416226],[76.532885,9.416849],[76.533753,9.416458],[76.534642,9.416374],[76.534734,9.416821],[76.53539,9.416719],[76.535678,9.416764],[76.536068,9.416687],[76.536481,9.416676],[76.536795,9.41659],[76.536691,9.416165],[76.536857,9.415311],[76.537128,9.414946],[76.537288,9.414689],[76.537254,9.414463],[76.537505,9.414161],[76.537502,9.413869],[76.537987,9.413899],[76.538765,9.414176],[76.539205,9.414222],[76.539431,9.414989],[76.539637,9.415433],[76.53972,9.415563],[76.539649,9.415755],[76.539611,9.416286],[76.53981,9.416427],[76.540256,9.416569],[76.540185,9.416867],[76.540436,9.416954],[76.54056,9.417216],[76.540937,9.417369],[76.541326,9.4178],[76.541678,9.417976],[76.541273,9.418691],[76.54108,9.419026],[76.541021,9.41923],[76.540952,9.419756],[76.540754,9.419948],[76.540423,9.420598],[76.540535,9.42067],[76.541441,9.420716],[76.541572,9.420766],[76.541708,9.420817],[76.541896,9.420888],[76.541809,9.420755],[76.54202,9.420787],[76.542154,9.420796],[76.542335,9.420798],[76.542462,9.420794],[76.542628,9.420784],[76.542832,9.420756],[76.543008,9.420739],[76.543316,9.420773],[76.543569,9.420804],[76.54359,9.420861],[76.543728,9.420897],[76.543849,9.421055],[76.543823,9.421165],[76.543716,9.421576],[76.543693,9.421685],[76.543686,9.42178],[76.543633,9.422017],[76.543576,9.422429],[76.543573,9.422635],[76.543721,9.422769],[76.544007,9.422945],[76.54436,9.42288],[76.544833,9.422801],[76.545421,9.422756],[76.545771,9.422713],[76.546041,9.422666],[76.546113,9.422688],[76.546233,9.422683],[76.546295,9.422679],[76.546419,9.422653],[76.546566,9.422626],[76.546704,9.422594],[76.546881,9.42255],[76.547041,9.422521],[76.547194,9.422488],[76.547239,9.422487],[76.547374,9.422473],[76.547514,9.422479],[76.547871,9.422532],[76.547971,9.422541],[76.548138,9.422532],[76.548283,9.422506],[76.548307,9.42246],[76.548443,9.42233],[76.548528,9.422255],[76.548616,9.422128],[76.548671,9.422051],[76.548694,9.42201],[76.548883,9.422021],[76.549076,9.422042],[76.549133,9.42204],[76.549195,9.422047],[76.549316,9.422141],[76.549436,9.422295],[76.549565,9.422541],[76.549748,9.422835],[76.549857,9.422952],[76.549969,9.422919],[76.550071,9.422884],[76.550224,9.422912],[76.550354,9.422906],[76.550666,9.422924],[76.550798,9.423395],[76.550949,9.423372],[76.551122,9.423341],[76.551291,9.423364],[76.551575,9.42341],[76.55187,9.423444],[76.552072,9.423558],[76.552225,9.42357],[76.552239,9.423719],[76.552352,9.42388],[76.552685,9.423889],[76.552773,9.42402],[76.552922,9.42396],[76.553025,9.423974],[76.553067,9.42396],[76.553112,9.423937],[76.553164,9.423934],[76.553391,9.42387],[76.553663,9.423892],[76.553786,9.42393],[76.553734,9.422523],[76.553691,9.422132],[76.55414,9.421414],[76.554644,9.420719],[76.554704,9.420332],[76.554749,9.41937],[76.554928,9.417571],[76.555051,9.416392],[76.555316,9.413825],[76.555327,9.41359],[76.555385,9.413177],[76.555549,9.413078],[76.555688,9.413055],[76.555843,9.413025],[76.555992,9.412999],[76.556142,9.412957],[76.556316,9.412911],[76.556376,9.412822],[76.556378,9.41278],[76.556595,9.41273],[76.556952,9.41267],[76.557092,9.412656],[76.557204,9.412649],[76.557376,9.412627],[76.557517,9.412576],[76.557623,9.412524],[76.557738,9.412458],[76.557881,9.412364],[76.558027,9.412279],[76.55819,9.41217],[76.558338,9.41207],[76.558503,9.411966],[76.558638,9.411877],[76.558759,9.411794],[76.558913,9.411702],[76.559034,9.41163],[76.559164,9.411564],[76.559292,9.411505],[76.55943,9.411411],[76.559574,9.41135],[76.559774,9.411263],[76.559943,9.411193],[76.560109,9.411189],[76.560244,9.411217],[76.560487,9.411175],[76.560698,9.411159],[76.560824,9.411078],[76.561039,9.411042],[76.561241,9.411023],[76.561473,9.411015],[76.562018,9.410993],[76.562416,9.410986],[76.562753,9.410945],[76.563124,9.410875],[76.563436,9.410698],[76.563716,9.410623],[76.564045,9.410575],[76.564293,9.410477],[76.564669,9.41046],[76.564877,9.410631],[76.565532,9.411108],[76.566176,9.411691],[76.566646,9.412007],[76.567093,9.412302],[76.567808,9.412842],[76.568579,9.413735],[76.568822,9.413937],[76.569046,9.414162],[76.569241,9.414376],[76.569569,9.414707],[76.569746,9.414902],[76.569799,9.415102],[76.569884,9.415231],[76.570053,9.415358],[76.570326,9.415552],[76.570516,9.415638],[76.570788,9.415756],[76.571088,9.415893],[76.57136,9.416027],[76.571604,9.41617],[76.571868,9.416455],[76.572157,9.416598],[76.572373,9.416717],[76.572654,9.416852],[76.572918,9.416979],[76.573104,9.417041],[76.573326,9.417136],[76.57513,9.418025],[76.576659,9.420036],[76.578235,9.421336],[76.579329,9.422323],[76.579335,9.422324],[76.57964,9.422635],[76.58006,9.422614],[76.580282,9.422466],[76.580286,9.422466],[76.58072,9.422303],[76.580981,9.422156],[76.581612,9.42201],[76.581959,9.421853],[76.581939,9.421683],[76.582477,9.421515],[76.582625,9.421168],[76.582574,9.421006],[76.582757,9.421003],[76.583461,9.420255],[76.584142,9.420099],[76.584712,9.420095],[76.584884,9.420116],[76.585027,9.420106],[76.585659,9.419864],[76.585897,9.420128],[76.586159,9.420271],[76.586497,9.420252],[76.586652,9.420376],[76.586996,9.420114],[76.587327,9.419924],[76.58749,9.419811],[76.588091,9.419515],[76.588119,9.419425],[76.589012,9.419117],[76.589089,9.418948],[76.589223,9.419003],[76.589274,9.418978],[76.589301,9.419047],[76.589344,9.419069],[76.589467,9.419864],[76.590268,9.419689],[76.590519,9.419686],[76.590765,9.419586],[76.59075,9.419518],[76.590766,9.419318],[76.590851,9.419233],[76.590984,9.419051],[76.591146,9.418944],[76.591202,9.418875],[76.591254,9.418809],[76.591381,9.418516],[76.591425,9.41841],[76.591559,9.418007],[76.591555,9.417787],[76.591542,9.417372],[76.59168,9.417097],[76.591804,9.416928],[76.591833,9.416841],[76.59178,9.416677],[76.591734,9.416673],[76.591743,9.416572],[76.591916,9.416464],[76.59191,9.41641],[76.59184,9.416249],[76.591909,9.41602],[76.592095,9.415962],[76.592214,9.415992],[76.592279,9.415979],[76.592339,9.415912],[76.592428,9.415773],[76.592616,9.415248],[76.592572,9.415009],[76.592618,9.414815],[76.592689,9.414749],[76.592734,9.414563],[76.592847,9.414428],[76.592932,9.414378],[76.593021,9.414277],[76.593163,9.41431],[76.593246,9.414319],[76.593699,9.414513],[76.593838,9.414773],[76.59398,9.415051],[76.593973,9.415108],[76.594015,9.415271],[76.59406,9.415489],[76.594079,9.415792],[76.594117,9.415957],[76.594132,9.416026],[76.594204,9.416176],[76.594351,9.416484],[76.594475,9.416677],[76.59454,9.41694],[76.59464,9.417147],[76.594723,9.417469],[76.594717,9.417739],[76.594848,9.41827],[76.594881,9.4191],[76.595108,9.419126],[76.595335,9.419042],[76.595447,9.418933],[76.595634,9.418814],[76.595729,9.418802],[76.595894,9.418651],[76.596018,9.418719],[76.59613,9.418827],[76.596377,9.418968],[76.596455,9.419259],[76.596578,9.419712],[76.59656,9.420094],[76.596487,9.420183],[76.596572,9.420269],[76.596744,9.420531],[76.596673,9.420782],[76.596303,9.421568],[76.59626,9.421652],[76.595991,9.421859],[76.59566,9.422132],[76.595487,9.422151],[76.595289,9.422204],[76.595119,9.422304],[76.594527,9.422455],[76.594039,9.422604],[76.593741,9.422715],[76.593412,9.422751],[76.593119,9.422983],[76.592847,9.423125],[76.592742,9.423209],[76.592727,9.423249],[76.592787,9.423325],[76.593896,9.423855],[76.593574,9.424259],[76.593425,9.424528],[76.593335,9.424599],[76.593313,9.424721],[76.593152,9.425006],[76.59317,9.425273],[76.593079,9.425496],[76.593091,9.425597],[76.593008,9.425678],[76.593037,9.425849],[76.592975,9.426066],[76.593011,9.42614],[76.592932,9.42625],[76.592855,9.426302],[76.592855,9.426478],[76.592775,9.426666],[76.592663,9.426875],[76.592275,9.427244],[76.592146,9.427421],[76.592117,9.427501],[76.592084,9.427552],[76.592061,9.427718],[76.591981,9.42795],[76.592023,9.428021],[76.591958,9.428066],[76.591931,9.428158],[76.591921,9.428433],[76.592021,9.428533],[76.592158,9.428918],[76.59215,9.429296],[76.592279,9.429502],[76.592449,9.429852],[76.592427,9.430004],[76.592506,9.430049],[76.592616,9.430295],[76.592649,9.430493],[76.592787,9.430559],[76.592934,9.431024],[76.59318,9.431085],[76.593283,9.431149],[76.593298,9.431307],[76.593304,9.431439],[76.593224,9.431486],[76.59305,9.431477],[76.592809,9.43166],[76.592739,9.431792],[76.592617,9.43217],[76.592567,9.432327],[76.592489,9.432633],[76.592447,9.432968],[76.592465,9.433408],[76.592529,9.433627],[76.59256,9.433672],[76.592609,9.433745],[76.592657,9.433793],[76.592755,9.433923],[76.592963,9.434208],[76.593057,9.434324],[76.593196,9.434383],[76.593339,9.434446],[76.593511,9.434721],[76.593645,9.434842],[76.594096,9.435404],[76.594242,9.435526],[76.594173,9.435692],[76.594028,9.435838],[76.593986,9.435927],[76.59403,9.436246],[76.593628,9.436467],[76.593556,9.436554],[76.593381,9.436593],[76.593395,9.436781],[76.59322,9.436806],[76.59311,9.436872],[76.593109,9.437458],[76.593214,9.438236],[76.593289,9.438475],[76.593305,9.438585],[76.593459,9.438941],[76.593591,9.439391],[76.593639,9.43958],[76.593639,9.439719],[76.593494,9.439758],[76.593248,9.439731],[76.592929,9.439881],[76.59265,9.43994],[76.592591,9.439933],[76.59237,9.440001],[76.592038,9.440007],[76.592036,9.440046],[76.592188,9.440247],[76.591915,9.440573],[76.591626,9.440784],[76.591334,9.441255],[76.591378,9.441418],[76.591383,9.441713],[76.591286,9.441758],[76.591257,9.442184],[76.59129,9.442632],[76.591291,9.442844],[76.591245,9.443217],[76.591204,9.443408],[76.591201,9.443599],[76.591241,9.443748],[76.591126,9.444233],[76.591122,9.444509],[76.59112,9.444582],[76.591372,9.444941],[76.591394,9.445034],[76.591572,9.445216],[76.59195,9.445387],[76.592271,9.445678],[76.592368,9.445831],[76.592537,9.446432],[76.592618,9.446427],[76.592883,9.446281],[76.593088,9.446132],[76.593463,9.446044],[76.594021,9.446004],[76.594484,9.446057],[76.594837,9.446188],[76.595199,9.446396],[76.595377,9.446445],[76.595399,9.446507],[76.595456,9.446487],[76.595519,9.446534],[76.595458,9.446643],[76.59548,9.44674],[76.595615,9.44678],[76.595647,9.446904],[76.595921,9.4471],[76.596198,9.44737],[76.596351,9.448036],[76.596483,9.448078],[76.596492,9.448442],[76.597122,9.448446],[76.597169,9.448393],[76.597594,9.448666],[76.597976,9.448771],[76.598117,9.44877],[76.598486,9.448773],[76.598457,9.449015],[76.599179,9.449287],[76.599777,9.449822],[76.599718,9.449915],[76.599749,9.45005],[76.59972,9.450181],[76.599769,9.450342],[76.600227,9.450334],[76.600231,9.450268],[76.600558,9.450153],[76.600721,9.450168],[76.60096,9.450129],[76.601166,9.450138],[76.601234,9.450146],[76.601357,9.449929],[76.601751,9.450123],[76.60212,9.450214],[76.602642,9.45021],[76.602809,9.450151],[76.603217,9.450095],[76.603628,9.449934],[76.604012,9.449781],[76.604527,9.44979],[76.604894,9.449849],[76.604902,9.450161],[76.604816,9.450251],[76.604838,9.45075],[76.604825,9.450946],[76.604843,9.451062],[76.604835,9.451511],[76.604794,9.45163],[76.604711,9.452079],[76.604541,9.452533],[76.604139,9.453092],[76.603858,9.453391],[76.603911,9.453584],[76.604017,9.454535],[76.603873,9.455186],[76.603729,9.455689],[76.603413,9.456287],[76.603326,9.456445],[76.6032,9.45659],[76.603125,9.456687],[76.603008,9.456825],[76.60292,9.456941],[76.602839,9.457043],[76.602766,9.457128],[76.602644,9.457283],[76.602618,9.457301],[76.602312,9.457564],[76.602123,9.457723],[76.602351,9.457744],[76.602553,9.457692],[76.602789,9.457664],[76.603101,9.457648],[76.603491,9.457635],[76.603807,9.457609],[76.604057,9.457587],[76.604178,9.457583],[76.604413,9.457593],[76.604685,9.457603],[76.60493,9.457612],[76.605193,9.457615],[76.605384,9.457615],[76.605544,9.457616],[76.60557,9.457535],[76.605632,9.457509],[76.606036,9.457182],[76.606305,9.457026],[76.606667,9.456906],[76.606648,9.456773],[76.606821,9.456518],[76.60747,9.456469],[76.607705,9.456404],[76.607772,9.456358],[76.608108,9.456248],[76.608424,9.456142],[76.608654,9.45597],[76.608714,9.455963],[76.609023,9.45569],[76.609073,9.455495],[76.609174,9.455338],[76.609238,9.455047],[76.609279,9.45476],[76.609496,9.454332],[76.609646,9.45439],[76.609813,9.454079],[76.609943,9.45403],[76.610406,9.453951],[76.61062,9.453982],[76.610778,9.45405],[76.610775,9.454123],[76.610656,9.454278],[76.610508,9.45439],[76.610181,9.454637],[76.61002,9.454853],[76.609862,9.455056],[76.609746,9.455239],[76.609644,9.455383],[76.609618,9.455429],[76.609553,9.455609],[76.609489,9.455819],[76.609422,9.456007],[76.609433,9.456245],[76.609413,9.456514],[76.609393,9.456979],[76.609362,9.457421],[76.609355,9.457582],[76.609309,9.457786],[76.609269,9.458011],[76.609234,9.458234],[76.609191,9.458499],[76.609169,9.458652],[76.609129,9.458907],[76.609234,9.45935],[76.609258,9.45968],[76.609565,9.45988],[76.609926,9.460022],[76.609905,9.460202],[76.61059,9.460549],[76.610872,9.460729],[76.611004,9.46081],[76.611299,9.460905],[76.611517,9.461063],[76.611613,9.461124],[76.611983,9.461079],[76.612548,9.460575],[76.612593,9.460543],[76.612647,9.460503],[76.612741,9.460517],[76.612982,9.460444],[76.613079,9.460499],[76.613212,9.4606],[76.613513,9.460645],[76.613749,9.46056],[76.613911,9.4606],[76.614074,9.460571],[76.614102,9.460691],[76.614084,9.460755],[76.614232,9.460782],[76.614532,9.460837],[76.614861,9.461025],[76.615022,9.461118],[76.615122,9.461177],[76.615265,9.461308],[76.615483,9.461513],[76.615682,9.461813],[76.615868,9.461745],[76.615894,9.461671],[76.616003,9.461666],[76.61634,9.461481],[76.616359,9.461414],[76.616424,9.46139],[76.616762,9.461292],[76.616982,9.46123],[76.617318,9.461196],[76.617453,9.461231],[76.617732,9.46122],[76.618131,9.461208],[76.618395,9.461136],[76.618535,9.461187],[76.618852,9.461204],[76.619299,9.461224],[76.619394,9.461212],[76.619948,9.46115],[76.62011,9.460863],[76.620222,9.460859],[76.620333,9.460863],[76.62081,9.460952],[76.620697,9.461194],[76.620675,9.461281],[76.620541,9.4618],[76.620698,9.461842],[76.621113,9.461965],[76.621215,9.461917],[76.621256,9.461857],[76.621324,9.461639],[76.621444,9.461726],[76.62184,9.461821],[76.622543,9.461975],[76.622922,9.462039],[76.623479,9.462618],[76.623542,9.462933],[76.623717,9.462996],[76.623812,9.463079],[76.623978,9.46293],[76.624187,9.462841],[76.62463,9.462608],[76.62468,9.462491],[76.624752,9.462434],[76.624862,9.462425],[76.624882,9.462413],[76.625379,9.462007],[76.625445,9.461883],[76.625629,9.461745],[76.625773,9.461501],[76.625911,9.461573],[76.626137,9.461506],[76.626178,9.461564],[76.626188,9.461686],[76.626191,9.462306],[76.626116,9.462416],[76.626139,9.462756],[76.626095,9.463264],[76.625824,9.464138],[76.625718,9.46544],[76.625791,9.465708],[76.625848,9.466263],[76.625955,9.466934],[76.625979,9.467043],[76.626116,9.467759],[76.62613,9.468337],[76.62639,9.46921],[76.626552,9.469427],[76.626599,9.469394],[76.626608,9.469469],[76.627,9.469828],[76.62728,9.470046],[76.627708,9.470382],[76.627961,9.470603],[76.628142,9.470781],[76.628285,9.470997],[76.628382,9.471257],[76.628521,9.471536],[76.62865,9.47162],[76.628786,9.471657],[76.629125,9.471661],[76.629867,9.472054],[76.630032,9.472094],[76.630143,9.472085],[76.630301,9.472096],[76.63049,9.472072],[76.630617,9.472095],[76.630853,9.472112],[76.630961,9.472046],[76.631193,9.472082],[76.63127,9.472026],[76.63138,9.47189],[76.631658,9.471525],[76.631973,9.471071],[76.632002,9.470868],[76.632102,9.470718],[76.632222,9.470496],[76.632715,9.469551],[76.632881,9.469491],[76.632964,9.469509],[76.633081,9.469326],[76.633203,9.469337],[76.633366,9.46912],[76.633269,9.468739],[76.633342,9.468595],[76.633308,9.468473],[76.633067,9.468437],[76.633238,9.468248],[76.63337,9.468104],[76.633589,9.467885],[76.63377,9.467664],[76.633841,9.467553],[76.634061,9.467504],[76.634182,9.467519],[76.634374,9.467391],[76.634465,9.467055],[76.634542,9.466741],[76.634587,9.466555],[76.634609,9.466391],[76.634563,9.466136],[76.634595,9.465994],[76.634551,9.465812],[76.634787,9.465226],[76.634841,9.465213],[76.634933,9.465065],[76.635049,9.465041],[76.635158,9.464941],[76.635173,9.464607],[76.635223,9.464369],[76.635296,9.464192],[76.635311,9.464069],[76.635326,9.46404],[76.635419,9.463835],[76.635549,9.463516],[76.635662,9.463344],[76.6358,9.46311],[76.635735,9.463016],[76.635674,9.462907],[76.635472,9.462827],[76.635546,9.462752],[76.635569,9.462747],[76.635549,9.462722],[76.635522,9.462689],[76.635508,9.462671],[76.635494,9.462655],[76.635473,9.462629],[76.635492,9.462593],[76.635502,9.462574],[76.635518,9.462544],[76.635533,9.462514],[76.635536,9.462511],[76.635544,9.4625],[76.635564,9.462473],[76.635576,9.462464],[76.635595,9.462449],[76.635651,9.462415],[76.635705,9.462408],[76.635751,9.462418],[76.635784,9.46244],[76.635815,9.462564],[76.635863,9.462703],[76.6359,9.4628],[76.635936,9.462846],[76.635957,9.462861],[76.636001,9.462889],[76.636044,9.462907],[76.6361,9.462907],[76.636129,9.462886],[76.636149,9.46287],[76.636207,9.462814],[76.636243,9.462779],[76.63629,9.462776],[76.636325,9.462783],[76.636355,9.462805],[76.636375,9.462834],[76.63644,9.463234],[76.636442,9.463358],[76.636454,9.463652],[76.636465,9.463711],[76.636489,9.463755],[76.636536,9.463826],[76.636552,9.463848],[76.636609,9.463875],[76.636701,9.463923],[76.636775,9.46395],[76.636856,9.463974],[76.636914,9.463983],[76.637014,9.463979],[76.637096,9.463949],[76.637148,9.463915],[76.637226,9.463863],[76.637275,9.46383],[76.637335,9.463806],[76.637398,9.4638],[76.637424,9.4638],[76.637449,9.463818],[76.637462,9.463842],[76.637453,9.463935],[76.637445,9.464001],[76.637443,9.464073],[76.637466,9.464155],[76.637479,9.464199],[76.637532,9.464324],[76.637555,9.464371],[76.637658,9.464575],[76.637687,9.464627],[76.637724,9.464811],[76.637778,9.464954],[76.637898,9.46503],[76.638029,9.465089],[76.638138,9.465157],[76.638389,9.465331],[76.63842,9.465355],[76.63846,9.465443],[76.638463,9.465662],[76.638466,9.465721],[76.638487,9.465812],[76.638532,9.465885],[76.638774,9.466008],[76.638884,9.466099],[76.639026,9.466315],[76.639213,9.466597],[76.639178,9.466629],[76.639285,9.466758],[76.639332,9.466837],[76.63932,9.466944],[76.639298,9.467125],[76.63929,9.467239],[76.639336,9.467378],[76.639456,9.467516],[76.639578,9.467591],[76.639715,9.467627],[76.639884,9.467631],[76.639978,9.467621],[76.640177,9.467633],[76.640252,9.467628],[76.640342,9.467614],[76.640491,9.467557],[76.640599,9.467504],[76.640727,9.467384],[76.640769,9.46735],[76.640865,9.467208],[76.640907,9.467148],[76.640972,9.46711],[76.641035,9.46709],[76.641172,9.467104],[76.641275,9.4672],[76.641292,9.467278],[76.641301,9.467384],[76.641299,9.467447],[76.641267,9.467506],[76.641208,9.467549],[76.641112,9.467669],[76.641098,9.467716],[76.6411,9.467749],[76.64112,9.467818],[76.641137,9.467967],[76.64115,9.468108],[76.641203,9.468202],[76.641271,9.468295],[76.641337,9.468332],[76.641274,9.468701],[76.641077,9.469234],[76.641046,9.469459],[76.641121,9.469826],[76.641192,9.469916],[76.641392,9.470617],[76.641296,9.471039],[76.64144,9.471156],[76.641432,9.471894],[76.64155,9.47279],[76.641404,9.473204],[76.641655,9.47361],[76.64168,9.473793],[76.641713,9.47404],[76.641783,9.474267],[76.641732,9.474509],[76.641512,9.474861],[76.641456,9.47514],[76.641452,9.475355],[76.641477,9.475428],[76.641528,9.475526],[76.641836,9.475747],[76.641933,9.475835],[76.641997,9.475907],[76.642014,9.475982],[76.641998,9.476042],[76.641914,9.47611],[76.641901,9.47616],[76.641944,9.476287],[76.641937,9.476396],[76.641896,9.476505],[76.641853,9.476543],[76.64168,9.476654],[76.641628,9.476853],[76.64164,9.477044],[76.64178,9.477212],[76.641774,9.477371],[76.641841,9.477466],[76.64223,9.477697],[76.642438,9.477832],[76.642396,9.478126],[76.642279,9.478374],[76.642207,9.478528],[76.642214,9.478676],[76.642445,9.478947],[76.642835,9.479169],[76.643467,9.47924],[76.643679,9.479106],[76.644355,9.478896],[76.644645,9.478791],[76.64529,9.478689],[76.646353,9.478762],[76.647039,9.478692],[76.647143,9.478674],[76.647337,9.478704],[76.647377,9.478707],[76.6475,9.478776],[76.647811,9.47881],[76.648014,9.478827],[76.648092,9.478894],[76.648263,9.479041],[76.649958,9.479799],[76.649747,9.479959],[76.650217,9.480268],[76.650813,9.481343],[76.651157,9.481502],[76.653032,9.481589],[76.653969,9.481706],[76.654752,9.482063],[76.655329,9.482148],[76.655467,9.482183],[76.655536,9.482009],[76.655874,9.482023],[76.65626,9.482209],[76.656344,9.482217],[76.656517,9.48223],[76.656658,9.482228],[76.65675,9.482238],[76.656816,9.482247],[76.656869,9.482255],[76.656927,9.482259],[76.657173,9.482278],[76.657595,9.482209],[76.657927,9.482168],[76.65824,9.482158],[76.658352,9.482147],[76.658501,9.482175],[76.658662,9.482237],[76.658731,9.482312],[76.658792,9.482456],[76.659011,9.482479],[76.659231,9.48268],[76.659522,9.482658],[76.659825,9.482641],[76.661617,9.482535],[76.661896,9.482332],[76.661931,9.482191],[76.662124,9.482199],[76.66254,9.482029],[76.662948,9.48202],[76.663739,9.481716],[76.663928,9.481657],[76.664045,9.481622],[76.664752,9.481466],[76.664836,9.481455],[76.664936,9.481496],[76.665052,9.481479],[76.665236,9.481328],[76.665323,9.481344],[76.665905,9.481385],[76.665956,9.481435],[76.666008,9.481469],[76.666179,9.481486],[76.66623,9.481526],[76.666387,9.481817],[76.666724,9.481979],[76.667444,9.482176],[76.667578,9.482185],[76.667638,9.482031],[76.667788,9.481847],[76.668149,9.481496],[76.669146,9.481178],[76.669625,9.481004],[76.669944,9.480858],[76.670112,9.480801],[76.670493,9.480655],[76.670569,9.480624],[76.671811,9.480131],[76.671704,9.480184],[76.672749,9.479741],[76.6736,9.479873],[76.67372,9.480562],[76.673587,9.480852],[76.673567,9.481387],[76.673507,9.481558],[76.673641,9.481938],[76.673978,9.482426],[76.674026,9.482466],[76.674503,9.482639],[76.677645,9.481898],[76.67804,9.481915],[76.678288,9.481998],[76.679125,9.483029],[76.679468,9.4833],[76.679691,9.483367],[76.680026,9.483395],[76.680087,9.483366],[76.680168,9.483339],[76.680337,9.483255],[76.68039,9.483211],[76.681114,9.482601],[76.681455,9.481851],[76.681446,9.481652],[76.681539,9.481381],[76.681651,9.481239],[76.681823,9.4811],[76.682619,9.480855],[76.683772,9.480398],[76.684174,9.480331],[76.68466,9.480224],[76.685006,9.480123],[76.685343,9.480024],[76.68566,9.479927],[76.685787,9.479869],[76.686236,9.479478],[76.686477,9.479059],[76.687263,9.478593],[76.688343,9.478051],[76.688847,9.477857],[76.690457,9.478007],[76.691693,9.477304],[76.6923,9.477113],[76.694066,9.477223],[76.695285,9.476987],[76.696892,9.477077],[76.697761,9.476791],[76.69847,9.477005],[76.698749,9.477188],[76.699327,9.477012],[76.7001,9.4766],[76.700582,9.476287],[76.700965,9.475572],[76.701184,9.47512],[76.701214,9.473737],[76.700904,9.472836],[76.700968,9.472608],[76.701073,9.472404],[76.700969,9.472322],[76.700847,9.472004],[76.700801,9.471916],[76.700804,9.471868],[76.700766,9.471806],[76.700651,9.471638],[76.700606,9.471534],[76.700514,9.471457],[76.700409,9.471313],[76.700405,9.471204],[76.700351,9.471142],[76.700263,9.471037],[76.700078,9.470809],[76.700201,9.470354],[76.700075,9.470059],[76.699876,9.469706],[76.699548,9.469318],[76.699523,9.468957],[76.699642,9.468674],[76.699835,9.468181],[76.699625,9.468038],[76.699449,9.46764],[76.699291,9.467318],[76.699093,9.467065],[76.700251,9.466874],[76.700436,9.466832],[76.700734,9.46676],[76.70084,9.466448],[76.70096,9.466256],[76.701062,9.466129],[76.701194,9.465844],[76.701299,9.465671],[76.701461,9.465537],[76.701584,9.465362],[76.701672,9.465276],[76.701742,9.465077],[76.701837,9.464929],[76.70205,9.464746],[76.702197,9.464616],[76.702333,9.464492],[76.702603,9.464096],[76.702704,9.463972],[76.702807,9.463895],[76.702841,9.463882],[76.702905,9.463862],[76.702906,9.463843],[76.702909,9.463828],[76.702926,9.463768],[76.702971,9.463725],[76.70303,9.46366],[76.703065,9.463589],[76.703077,9.463501],[76.703041,9.463457],[76.702998,9.463397],[76.702962,9.463354],[76.702915,9.463299],[76.702848,9.463248],[76.702801,9.463154],[76.702724,9.463033],[76.703119,9.462809],[76.703454,9.462171],[76.704169,9.461902],[76.704582,9.461751],[76.704791,9.461511],[76.705086,9.460878],[76.705617,9.460357],[76.708066,9.456125],[76.708125,9.455686],[76.708068,9.455529],[76.70783,9.455239],[76.707783,9.455076],[76.707857,9.454899],[76.708359,9.454384],[76.708114,9.453317],[76.708326,9.452124],[76.708466,9.451336],[76.708639,9.45036],[76.708338,9.449781],[76.708035,9.449199],[76.707506,9.448883],[76.707118,9.44865],[76.706902,9.44852],[76.706767,9.448439],[76.706186,9.448268],[76.70581,9.448158],[76.705408,9.448035],[76.70508,9.447996],[76.704849,9.44801],[76.704535,9.448028],[76.704277,9.448044],[76.704156,9.448051],[76.703883,9.448262],[76.703536,9.44853],[76.703401,9.448635],[76.702985,9.44902],[76.702702,9.449294],[76.702163,9.44985],[76.70202,9.45],[76.701765,9.450345],[76.701385,9.450839],[76.701049,9.451341],[76.700391,9.45207],[76.700238,9.452239],[76.700146,9.452348],[76.699953,9.452577],[76.699867,9.452679],[76.699803,9.452755],[76.699687,9.452863],[76.699617,9.452929],[76.699274,9.453047],[76.699266,9.453046],[76.699158,9.453104],[76.69875,9.453206],[76.698334,9.453335],[76.698067,9.453173],[76.696967,9.452505],[76.696625,9.452302],[76.696448,9.452195],[76.696193,9.452016],[76.696097,9.451949],[76.695911,9.451818],[76.695685,9.45166],[76.695531,9.451552],[76.695435,9.451512],[76.694843,9.451265],[76.694521,9.451136],[76.694402,9.451088],[76.69428,9.451111],[76.693602,9.451306],[76.692672,9.451573],[76.692383,9.451696],[76.691655,9.452006],[76.69138,9.452178],[76.69056,9.452555],[76.689917,9.452881],[76.689753,9.452964],[76.68966,9.453011],[76.689464,9.45311],[76.689198,9.453245],[76.689091,9.453299],[76.688948,9.453365],[76.6888,9.453434],[76.688647,9.453522],[76.68841,9.453517],[76.688172,9.45351],[76.688012,9.453507],[76.687781,9.453508],[76.687557,9.453503],[76.68739,9.453496],[76.687292,9.453484],[76.687097,9.453459],[76.686965,9.453443],[76.686818,9.453425],[76.686664,9.453413],[76.686543,9.4534],[76.686426,9.453387],[76.686295,9.453372],[76.686134,9.453363],[76.686004,9.453355],[76.685887,9.45335],[76.68577,9.453358],[76.685577,9.45337],[76.68538,9.453374],[76.685276,9.453377],[76.685098,9.45338],[76.684997,9.453383],[76.68489,9.453387],[76.684764,9.453392],[76.684603,9.453406],[76.684447,9.453426],[76.684288,9.453453],[76.684087,9.453482],[76.683994,9.453496],[76.683819,9.453521],[76.683632,9.453548],[76.68359,9.453368],[76.683549,9.453194],[76.683565,9.453063],[76.683535,9.452934],[76.683684,9.452863],[76.683798,9.452579],[76.683861,9.452437],[76.684008,9.452146],[76.684087,9.451993],[76.684165,9.451839],[76.684234,9.451652],[76.684308,9.451398],[76.684348,9.451271],[76.684512,9.451145],[76.684544,9.451017],[76.684568,9.450912],[76.684597,9.450727],[76.684601,9.450611],[76.684605,9.450498],[76.684605,9.450273],[76.684589,9.450125],[76.684557,9.449864],[76.684543,9.449663],[76.684586,9.449529],[76.684674,9.449255],[76.684705,9.449158],[76.684735,9.449062],[76.684763,9.448932],[76.684793,9.448764],[76.684816,9.448638],[76.684814,9.448546],[76.684803,9.448419],[76.684796,9.44821],[76.684783,9.448067],[76.684791,9.447956],[76.684788,9.447856],[76.684799,9.447704],[76.684775,9.447565],[76.684741,9.447362],[76.684701,9.447245],[76.684653,9.447104],[76.684558,9.446907],[76.684454,9.446725],[76.684385,9.446613],[76.684294,9.446497],[76.68424,9.446345],[76.684198,9.446206],[76.684162,9.446111],[76.68404,9.445944],[76.683889,9.445744],[76.683846,9.445626],[76.683931,9.445576],[76.684135,9.445443],[76.684295,9.445339],[76.684443,9.445225],[76.684569,9.445128],[76.684858,9.444905],[76.685063,9.444616],[76.685382,9.444355],[76.685309,9.444267],[76.685257,9.444135],[76.68511,9.443761],[76.68506,9.443635],[76.68518,9.443606],[76.685276,9.443596],[76.68538,9.443583],[76.6855,9.443558],[76.685638,9.443526],[76.686044,9.443432],[76.68619,9.443469],[76.686399,9.443523],[76.686757,9.443522],[76.686957,9.443535],[76.687049,9.443784],[76.687586,9.443789],[76.687728,9.44379],[76.687728,9.443585],[76.688005,9.443203],[76.687969,9.4431],[76.688051,9.443024],[76.688178,9.442906],[76.688093,9.442792],[76.687965,9.442621],[76.687826,9.442617],[76.687676,9.442597],[76.687559,9.442577],[76.687144,9.442449],[76.686659,9.441696],[76.686631,9.441585],[76.686604,9.44148],[76.686605,9.441356],[76.686608,9.441212],[76.686613,9.440812],[76.686867,9.44049],[76.687072,9.440231],[76.687134,9.440124],[76.687197,9.440015],[76.687194,9.439913],[76.687187,9.439642],[76.687175,9.439499],[76.687173,9.439376],[76.687171,9.439111],[76.687334,9.438812],[76.687746,9.438503],[76.687888,9.438418],[76.688133,9.438301],[76.688401,9.438172],[76.688597,9.438078],[76.688785,9.437933],[76.689037,9.43774],[76.689121,9.437645],[76.689254,9.437543],[76.689355,9.437466],[76.689504,9.437377],[76.689641,9.437284],[76.689784,9.437171],[76.689881,9.437095],[76.689956,9.437036],[76.690049,9.436986],[76.69017,9.43692],[76.690309,9.436839],[76.690418,9.436761],[76.6905,9.436706],[76.690593,9.436644],[76.690725,9.436498],[76.690792,9.436423],[76.690968,9.436182],[76.691044,9.436078],[76.691268,9.435813],[76.691358,9.435707],[76.691496,9.435593],[76.691923,9.435433],[76.692127,9.435359],[76.692257,9.435312],[76.692531,9.435223],[76.692678,9.435179],[76.69295,9.435096],[76.693471,9.434979],[76.693682,9.434888],[76.694341,9.434798],[76.694594,9.434742],[76.694802,9.4347],[76.694855,9.434577],[76.694908,9.434455],[76.694857,9.434243],[76.69496,9.433921],[76.694827,9.433712],[76.694801,9.433499],[76.694683,9.433374],[76.694728,9.433225],[76.694618,9.432958],[76.694635,9.43282],[76.694508,9.432473],[76.694418,9.432358],[76.694325,9.432245],[76.694263,9.432131],[76.694212,9.43199],[76.694177,9.431782],[76.694166,9.431687],[76.694129,9.431391],[76.694108,9.431228],[76.694024,9.431048],[76.694015,9.430851],[76.694004,9.430623],[76.694059,9.430481],[76.694115,9.430337],[76.694138,9.430096],[76.694259,9.429915],[76.694337,9.429851],[76.694337,9.429609],[76.694379,9.42952],[76.694313,9.429436],[76.694222,9.429322],[76.694131,9.429206],[76.694064,9.429121],[76.693987,9.42899],[76.694052,9.428729],[76.693919,9.428642],[76.693827,9.428593],[76.693815,9.428369],[76.693935,9.428243],[76.69402,9.428098],[76.693848,9.427955],[76.693808,9.42777],[76.693786,9.427649],[76.693687,9.427596],[76.693715,9.427335],[76.693427,9.427247],[76.69332,9.427229],[76.6931,9.427189],[76.693005,9.427273],[76.692894,9.427241],[76.692704,9.427086],[76.692554,9.426602],[76.692585,9.42644],[76.692699,9.426338],[76.692618,9.425967],[76.692451,9.425837],[76.69234,9.425647],[76.692266,9.425492],[76.692187,9.425329],[76.692137,9.425202],[76.692003,9.425014],[76.691867,9.424647],[76.69192,9.424564],[76.691989,9.424456],[76.692104,9.424468],[76.692341,9.424326],[76.692344,9.424224],[76.692616,9.424102],[76.692795,9.424043],[76.692976,9.423983],[76.693061,9.423936],[76.693202,9.423941],[76.69337,9.423915],[76.693599,9.423751],[76.693699,9.423599],[76.69387,9.423481],[76.693934,9.423371],[76.694029,9.423362],[76.694178,9.423199],[76.694308,9.423114],[76.694497,9.422952],[76.694686,9.422791],[76.694762,9.422713],[76.694925,9.422546],[76.694926,9.422394],[76.694992,9.422323],[76.695086,9.422222],[76.695109,9.422119],[76.695213,9.422031],[76.695296,9.421992],[76.695345,9.421822],[76.69549,9.421713],[76.695635,9.421603],[76.695767,9.421525],[76.695863,9.421387],[76.69596,9.42125],[76.69602,9.421115],[76.696253,9.421066],[76.696471,9.421032],[76.696659,9.421002],[76.696848,9.420812],[76.696748,9.420557],[76.69672,9.42018],[76.69671,9.420043],[76.696687,9.419912],[76.696672,9.41973],[76.696743,9.419478],[76.696813,9.419226],[76.696709,9.418963],[76.696498,9.418719],[76.696351,9.418758],[76.696151,9.418849],[76.695951,9.418939],[76.695772,9.418735],[76.695791,9.418487],[76.69572,9.418234],[76.695666,9.417943],[76.695623,9.417706],[76.695467,9.417668],[76.695214,9.417624],[76.695029,9.417592],[76.694927,9.417566],[76.694675,9.417504],[76.694532,9.417468],[76.694264,9.417414],[76.694142,9.41741],[76.69405,9.417407],[76.693938,9.417403],[76.693765,9.417406],[76.693637,9.417408],[76.693505,9.41741],[76.693398,9.417411],[76.693214,9.417414],[76.69268,9.417414],[76.692431,9.41741],[76.69224,9.417382],[76.692108,9.417376],[76.691832,9.417352],[76.691548,9.417332],[76.691189,9.417346],[76.691031,9.417361],[76.690855,9.417378],[76.690671,9.417372],[76.690518,9.417366],[76.69039,9.417361],[76.690243,9.417356],[76.6901,9.41735],[76.689981,9.417339],[76.689818,9.417324],[76.689566,9.417309],[76.68945,9.417302],[76.689325,9.417294],[76.68905,9.41727],[76.688846,9.41725],[76.688723,9.417238],[76.688438,9.41715],[76.688316,9.417002],[76.688248,9.416887],[76.6882,9.416808],[76.688086,9.416583],[76.688014,9.416441],[76.687964,9.41624],[76.687921,9.416061],[76.687863,9.415884],[76.687813,9.415807],[76.687777,9.415722],[76.687721,9.415592],[76.68768,9.415504],[76.687805,9.415362],[76.687842,9.415202],[76.687658,9.415078],[76.68762,9.414988],[76.687591,9.414811],[76.687627,9.414399],[76.687635,9.414308],[76.687654,9.414103],[76.687675,9.413867],[76.687677,9.413732],[76.68768,9.413612],[76.687621,9.413514],[76.687506,9.413303],[76.687354,9.41316],[76.687331,9.413032],[76.687252,9.41281],[76.687158,9.412544],[76.687107,9.412433],[76.687091,9.412268],[76.687073,9.412082],[76.687037,9.411702],[76.687085,9.411192],[76.687074,9.411071],[76.687043,9.410727],[76.68685,9.41038],[76.686754,9.410205],[76.686716,9.410088],[76.686597,9.409877],[76.686556,9.409736],[76.686402,9.409211],[76.686298,9.4089],[76.686268,9.40881],[76.686104,9.408845],[76.685941,9.408958],[76.685781,9.409068],[76.685691,9.409124],[76.685473,9.409258],[76.685303,9.409363],[76.685134,9.409467],[76.685027,9.409533],[76.684816,9.409616],[76.684604,9.4097],[76.684339,9.409792],[76.68421,9.409859],[76.684011,9.409962],[76.683803,9.410138],[76.683553,9.410339],[76.683384,9.410406],[76.683151,9.410499],[76.682525,9.410494],[76.682351,9.410531],[76.681967,9.410611],[76.68175,9.41041],[76.681821,9.410184],[76.681851,9.41009],[76.681877,9.409865],[76.681799,9.409799],[76.681708,9.409733],[76.681666,9.409614],[76.681576,9.40932],[76.681536,9.409136],[76.681485,9.408902],[76.681409,9.40865],[76.681306,9.408392],[76.681217,9.408159],[76.681208,9.407999],[76.681192,9.407696],[76.681184,9.407449],[76.681174,9.407124],[76.681201,9.406725],[76.681098,9.406516],[76.680998,9.406315],[76.680945,9.405941],[76.680893,9.405572],[76.680615,9.405437],[76.680504,9.405383],[76.680563,9.405079],[76.680499,9.405006],[76.68036,9.404849],[76.680263,9.404808],[76.680102,9.40474],[76.679858,9.4047],[76.679685,9.404652],[76.679525,9.404607],[76.679389,9.404542],[76.679219,9.404462],[76.679055,9.40443],[76.678532,9.404186],[76.678212,9.404036],[76.67805,9.403968],[76.677952,9.403939],[76.677769,9.403885],[76.677529,9.403815],[76.676701,9.403486],[76.676658,9.403088],[76.676688,9.40285],[76.676665,9.402588],[76.676652,9.40244],[76.676584,9.402055],[76.676494,9.401855],[76.676469,9.401615],[76.676421,9.401494],[76.676362,9.401169],[76.676188,9.401282],[76.675792,9.401369],[76.675558,9.40153],[76.675275,9.401727],[76.6752,9.401779],[76.675078,9.40188],[76.674771,9.402146],[76.67456,9.402288],[76.674183,9.402539],[76.674085,9.402548],[76.674005,9.402602],[76.67381,9.40265],[76.673733,9.402563],[76.673659,9.402634],[76.673457,9.402856],[76.673379,9.402942],[76.673291,9.40302],[76.673305,9.403235],[76.673093,9.403305],[76.672898,9.403394],[76.672782,9.403423],[76.672691,9.403445],[76.672466,9.403501],[76.67249,9.403633],[76.672335,9.404233],[76.672229,9.40422],[76.672013,9.40434],[76.671938,9.404398],[76.6718,9.404527],[76.671673,9.404647],[76.671512,9.404606],[76.671512,9.404393],[76.671477,9.404174],[76.671413,9.404071],[76.671258,9.403811],[76.671165,9.403785],[76.670983,9.403732],[76.670859,9.403696],[76.670547,9.403599],[76.670354,9.403577],[76.670177,9.403557],[76.67001,9.40363],[76.669929,9.40343],[76.67001,9.403136],[76.670063,9.402947],[76.669873,9.402926],[76.669694,9.402821],[76.669545,9.402735],[76.66943,9.402698],[76.669263,9.402658],[76.668999,9.402588],[76.668751,9.402612],[76.668468,9.402682],[76.668284,9.402771],[76.668185,9.402857],[76.668092,9.402938],[76.668055,9.402828],[76.667966,9.40256],[76.667942,9.402469],[76.667916,9.40237],[76.667869,9.402174],[76.668185,9.402156],[76.668468,9.40214],[76.668744,9.402089],[76.668947,9.402051],[76.669245,9.401961],[76.669395,9.401915],[76.669583,9.401859],[76.669796,9.401794],[76.670118,9.401696],[76.670203,9.40162],[76.670442,9.401513],[76.670563,9.401425],[76.670809,9.401282],[76.670942,9.401169],[76.671313,9.400981],[76.671653,9.400804],[76.67193,9.400668],[76.672129,9.400528],[76.67232,9.400471],[76.672734,9.400346],[76.672877,9.400291],[76.672986,9.400275],[76.673228,9.400212],[76.673686,9.40013],[76.673846,9.400065],[76.674044,9.399966],[76.674202,9.399823],[76.67407,9.399587],[76.673981,9.399423],[76.673897,9.399216],[76.673826,9.399094],[76.673855,9.398889],[76.673762,9.398715],[76.673672,9.39857],[76.673756,9.398451],[76.673961,9.398423],[76.674144,9.398398],[76.67444,9.398115],[76.674535,9.398035],[76.674625,9.397945],[76.674744,9.39784],[76.67486,9.397723],[76.674871,9.397574],[76.67509,9.397315],[76.675217,9.397165],[76.675344,9.397016],[76.675433,9.396834],[76.675486,9.396641],[76.675581,9.396445],[76.675751,9.39622],[76.675822,9.396127],[76.675648,9.395823],[76.675462,9.395738],[76.67517,9.395605],[76.675343,9.395109],[76.675244,9.394717],[76.675078,9.39434],[76.67502,9.394077],[76.674982,9.393907],[76.67494,9.393718],[76.674902,9.393612],[76.674813,9.393366],[76.67511,9.393242],[76.675413,9.393115],[76.675632,9.393024],[76.675896,9.392914],[76.676059,9.392862],[76.676295,9.392788],[76.676305,9.392592],[76.676535,9.392498],[76.676667,9.392445],[76.676865,9.392377],[76.676992,9.392324],[76.677121,9.392271],[76.677326,9.39219],[76.677458,9.392149],[76.677606,9.392103],[76.677778,9.392062],[76.678001,9.392044],[76.678215,9.392012],[76.678463,9.391976],[76.678786,9.391892],[76.678981,9.391864],[76.679083,9.391817],[76.679226,9.391783],[76.679583,9.391697],[76.679606,9.391827],[76.67986,9.391833],[76.680086,9.391774],[76.680237,9.391735],[76.680322,9.391656],[76.680323,9.391544],[76.680344,9.39127],[76.680356,9.391127],[76.680497,9.391086],[76.680556,9.391003],[76.680589,9.390892],[76.680542,9.390763],[76.680415,9.390419],[76.680236,9.389932],[76.6802,9.389714],[76.68018,9.389595],[76.68016,9.389474],[76.680107,9.389159],[76.680057,9.388855],[76.680491,9.388522],[76.680678,9.388326],[76.680164,9.388244],[76.679691,9.388168],[76.679442,9.387882],[76.67981,9.387445],[76.679973,9.386656],[76.679979,9.386164],[76.679983,9.385881],[76.680059,9.385528],[76.679929,9.385472],[76.680023,9.384585],[76.680038,9.384032],[76.680051,9.383545],[76.680057,9.383305],[76.680055,9.383159],[76.680053,9.383039],[76.680051,9.382909],[76.680043,9.382416],[76.679977,9.382168],[76.679936,9.382013],[76.679839,9.381647],[76.679802,9.381508],[76.679454,9.381476],[76.679279,9.381236],[76.679136,9.380762],[76.679155,9.380473],[76.679198,9.380214],[76.679167,9.379731],[76.679226,9.379239],[76.679248,9.379057],[76.678656,9.378876],[76.678462,9.378719],[76.678342,9.378622],[76.678065,9.378537],[76.677928,9.378495],[76.677839,9.378454],[76.677639,9.378362],[76.677471,9.378364],[76.677302,9.378374],[76.677122,9.378384],[76.676805,9.378301],[76.676644,9.378292],[76.676398,9.378279],[76.676271,9.378274],[76.67617,9.378271],[76.675922,9.378262],[76.675718,9.378202],[76.675572,9.37811],[76.675492,9.377952],[76.675429,9.377745],[76.675186,9.377576],[76.675063,9.377573],[76.67479,9.377567],[76.674536,9.377493],[76.674435,9.377463],[76.674346,9.377368],[76.674172,9.37737],[76.674046,9.377377],[76.673897,9.377385],[76.673666,9.377413],[76.673569,9.377496],[76.673377,9.377758],[76.673468,9.377855],[76.673434,9.37794],[76.673369,9.378043],[76.673311,9.37819],[76.673213,9.378191],[76.673156,9.378302],[76.673094,9.378423],[76.672956,9.378583],[76.67292,9.378677],[76.672774,9.378886],[76.672774,9.379021],[76.672875,9.379218],[76.672962,9.379389],[76.672938,9.379675],[76.672798,9.379752],[76.672585,9.379886],[76.672329,9.380045],[76.67227,9.380146],[76.672224,9.380226],[76.672111,9.380234],[76.671998,9.380243],[76.671906,9.380249],[76.671729,9.380262],[76.671598,9.380215],[76.671479,9.380172],[76.671306,9.380178],[76.671185,9.380197],[76.671013,9.380218],[76.670838,9.380297],[76.670696,9.380406],[76.670652,9.380199],[76.670669,9.380058],[76.670511,9.379983],[76.670173,9.379823],[76.670052,9.379766],[76.670149,9.379639],[76.669906,9.379349],[76.669814,9.379249],[76.669688,9.379112],[76.669622,9.37904],[76.669483,9.378901],[76.669386,9.378803],[76.669269,9.378655],[76.669288,9.378513],[76.669305,9.378379],[76.669204,9.378313],[76.669126,9.378263],[76.669028,9.378198],[76.668947,9.378146],[76.668831,9.378151],[76.6687,9.378157],[76.668568,9.378162],[76.66844,9.378168],[76.668321,9.378173],[76.668003,9.378217],[76.667858,9.378202],[76.667716,9.378188],[76.667615,9.378177],[76.667426,9.378164],[76.667322,9.378156],[76.667196,9.378143],[76.667043,9.378115],[76.666963,9.37801],[76.666902,9.377931],[76.666838,9.377846],[76.666777,9.377766],[76.666683,9.377623],[76.666587,9.37766],[76.666445,9.377658],[76.666327,9.377704],[76.666206,9.377828],[76.666119,9.377915],[76.666024,9.378009],[76.665575,9.378324],[76.66554,9.378479],[76.665276,9.378673],[76.665111,9.37862],[76.66475,9.378521],[76.664556,9.378544],[76.664457,9.378556],[76.66421,9.378642],[76.664049,9.378697],[76.663717,9.378811],[76.663479,9.378975],[76.663333,9.379052],[76.66284,9.379311],[76.662437,9.379205],[76.662469,9.379062],[76.662567,9.378948],[76.662679,9.378813],[76.662786,9.378685],[76.662768,9.378428],[76.662751,9.378189],[76.662647,9.377837],[76.662556,9.377533],[76.662423,9.377416],[76.662359,9.377097],[76.662236,9.376914],[76.662109,9.376725],[76.661995,9.376629],[76.661833,9.376493],[76.661659,9.376327],[76.661459,9.376093],[76.661251,9.375791],[76.661214,9.375408],[76.66119,9.375155],[76.661233,9.374886],[76.661243,9.374631],[76.661121,9.374476],[76.660913,9.374334],[76.66069,9.374251],[76.660527,9.374191],[76.660191,9.374207],[76.659858,9.374223],[76.659707,9.37423],[76.659334,9.374248],[76.659234,9.374252],[76.65894,9.374264],[76.65874,9.374291],[76.658227,9.374339],[76.658164,9.374499],[76.657978,9.374607],[76.657744,9.374576],[76.657764,9.374228],[76.657658,9.374121],[76.657663,9.373949],[76.657755,9.373667],[76.657725,9.373476],[76.657657,9.373383],[76.65738,9.373303],[76.656861,9.37309],[76.656343,9.372877],[76.656198,9.372916],[76.655456,9.373119],[76.655405,9.3729],[76.655369,9.372745],[76.655345,9.372585],[76.654942,9.372403],[76.65461,9.372386],[76.654083,9.372446],[76.653832,9.372474],[76.653084,9.372558],[76.652749,9.372781],[76.652414,9.373003],[76.652112,9.373039],[76.651641,9.373095],[76.651478,9.373063],[76.651038,9.372979],[76.650763,9.373042],[76.650594,9.37308],[76.650492,9.373103],[76.650321,9.373143],[76.650358,9.373288],[76.650391,9.373419],[76.650424,9.373549],[76.650408,9.373845],[76.650396,9.374073],[76.650678,9.374161],[76.65062,9.374393],[76.650461,9.374524],[76.650435,9.374614],[76.650221,9.37535],[76.649978,9.375331],[76.649736,9.375312],[76.649764,9.375593],[76.64978,9.375736],[76.649792,9.375831],[76.649832,9.376088],[76.649855,9.376237],[76.649967,9.37703],[76.64999,9.377253],[76.649953,9.377339],[76.649785,9.377666],[76.649754,9.377777],[76.649674,9.377923],[76.649593,9.378071],[76.649527,9.37819],[76.649465,9.378303],[76.649358,9.378512],[76.649423,9.378683],[76.649425,9.378909],[76.649575,9.378988],[76.649556,9.379146],[76.649544,9.379254],[76.649529,9.379382],[76.649507,9.37958],[76.649454,9.380044],[76.649661,9.380558],[76.649747,9.380774],[76.649782,9.380861],[76.649834,9.381176],[76.649866,9.381365],[76.649765,9.381401],[76.649667,9.381656],[76.649661,9.381755],[76.649626,9.382359],[76.649622,9.382898],[76.649613,9.382989],[76.649585,9.383257],[76.649581,9.383361],[76.649572,9.383558],[76.649565,9.383715],[76.649555,9.383922],[76.649521,9.384102],[76.649502,9.384205],[76.649412,9.384679],[76.649391,9.384786],[76.649319,9.384895],[76.649265,9.384977],[76.649196,9.385082],[76.649113,9.385207],[76.649043,9.385313],[76.648564,9.385453],[76.648425,9.385659],[76.647978,9.385757],[76.647741,9.385745],[76.647609,9.385739],[76.647521,9.385945],[76.647447,9.386119],[76.647019,9.386144],[76.646919,9.386537],[76.646895,9.386633],[76.646881,9.386909],[76.64687,9.387116],[76.646516,9.387193],[76.646337,9.387217],[76.645998,9.387263],[76.645674,9.387307],[76.645553,9.387356],[76.645441,9.387401],[76.645018,9.38757],[76.644686,9.387978],[76.64459,9.388095],[76.644566,9.388201],[76.644499,9.388501],[76.644471,9.388626],[76.644214,9.388697],[76.64405,9.388743],[76.64404,9.389069],[76.64403,9.389389],[76.6436,9.389608],[76.643,9.389889],[76.642761,9.389631],[76.642456,9.389302],[76.642299,9.389235],[76.64193,9.389079],[76.641758,9.389094],[76.641384,9.389128],[76.64103,9.38921],[76.640825,9.389258],[76.638836,9.389696],[76.638249,9.389755],[76.636722,9.38997],[76.635885,9.389973],[76.635527,9.389935],[76.635152,9.389873],[76.634745,9.389807],[76.634303,9.389757],[76.633945,9.389763],[76.633546,9.389772],[76.632876,9.389892],[76.632654,9.390042],[76.632475,9.390163],[76.632203,9.390359],[76.631973,9.390505],[76.631892,9.390557],[76.631798,9.39072],[76.631131,9.391692],[76.63055,9.392538],[76.630415,9.392742],[76.630311,9.392889],[76.630132,9.393137],[76.62999,9.393333],[76.629538,9.39393],[76.629498,9.393946],[76.629297,9.393991],[76.629116,9.393984],[76.628935,9.393965],[76.628766,9.393914],[76.628589,9.393827],[76.628267,9.393663],[76.628068,9.393492],[76.627836,9.393293],[76.627389,9.392937],[76.627062,9.39256],[76.626222,9.392014],[76.626063,9.391887],[76.624836,9.391189],[76.624552,9.390979],[76.624227,9.390757],[76.623995,9.390575],[76.623733,9.390369],[76.623864,9.390163],[76.623747,9.389824],[76.62376,9.389319],[76.623769,9.388972],[76.623786,9.388557],[76.623797,9.388157],[76.623794,9.388016],[76.623779,9.387713],[76.623773,9.387598],[76.623706,9.387147],[76.623666,9.386878],[76.623622,9.386706],[76.623555,9.386563],[76.623491,9.386391],[76.623398,9.386256],[76.623295,9.386157],[76.623183,9.386052],[76.623057,9.385953],[76.622928,9.385844],[76.622805,9.385753],[76.622643,9.385676],[76.622476,9.385637],[76.622345,9.385636],[76.622104,9.385712],[76.621971,9.385822],[76.621894,9.385907],[76.621836,9.386014],[76.621822,9.386061],[76.621785,9.386187],[76.621766,9.386252],[76.621726,9.386385],[76.621669,9.386623],[76.621588,9.386825],[76.621515,9.386983],[76.621442,9.387119],[76.621429,9.387138],[76.621361,9.387241],[76.621299,9.387322],[76.621229,9.387403],[76.621078,9.387469],[76.620986,9.38751],[76.620805,9.38758],[76.620573,9.387607],[76.62037,9.387557],[76.620284,9.387528],[76.620188,9.38747],[76.620151,9.387437],[76.620096,9.387389],[76.620003,9.387302],[76.619952,9.387243],[76.619862,9.387141],[76.619758,9.387002],[76.619687,9.386863],[76.619624,9.386687],[76.619616,9.386666],[76.619642,9.386347],[76.619619,9.386093],[76.619586,9.385737],[76.619539,9.385417],[76.619497,9.38513],[76.619442,9.384805],[76.619387,9.38456],[76.619293,9.384163],[76.619252,9.384001],[76.619226,9.383896],[76.619083,9.383503],[76.619056,9.383042],[76.618802,9.382471],[76.6185,9.381989],[76.618256,9.38176],[76.618023,9.381638],[76.617856,9.381504],[76.617549,9.38139],[76.616668,9.381402],[76.616408,9.381406],[76.616015,9.381524],[76.6155,9.38168],[76.615341,9.381728],[76.615182,9.381792],[76.615012,9.38186],[76.614885,9.381916],[76.614788,9.381965],[76.614591,9.382065],[76.614424,9.382131],[76.61416,9.382234],[76.614058,9.38226],[76.613791,9.382322],[76.613544,9.38238],[76.61321,9.38241],[76.612875,9.382441],[76.612434,9.382564],[76.611696,9.382507],[76.61112,9.382501],[76.610691,9.382452],[76.610178,9.382454],[76.609285,9.382458],[76.60901,9.38246],[76.608827,9.38249],[76.608571,9.382548],[76.608296,9.38261],[76.608119,9.382665],[76.607967,9.382732],[76.607651,9.382846],[76.607513,9.382895],[76.607407,9.382932],[76.60725,9.383014],[76.606747,9.383271],[76.606099,9.383773],[76.605532,9.384095],[76.605353,9.384187],[76.604467,9.384645],[76.603815,9.3847],[76.603107,9.384556],[76.602955,9.384241],[76.602801,9.383926],[76.602728,9.383774],[76.602443,9.383187],[76.602294,9.382882],[76.602211,9.382732],[76.602052,9.382434],[76.601998,9.382332],[76.601792,9.381947],[76.6017,9.381768],[76.601548,9.381404],[76.601502,9.381297],[76.601173,9.380529],[76.600809,9.379924],[76.600753,9.37983],[76.600618,9.379665],[76.600411,9.379411],[76.600084,9.37929],[76.599796,9.379034],[76.599656,9.378916],[76.599455,9.378667],[76.599307,9.377823],[76.599433,9.376801],[76.599299,9.376446],[76.599027,9.375776],[76.598637,9.374778],[76.598529,9.374476],[76.59808,9.373077],[76.598022,9.372938],[76.597933,9.372724],[76.597755,9.372298],[76.597665,9.372083],[76.5976,9.371926],[76.597563,9.371839],[76.597553,9.371735],[76.597438,9.371579],[76.597367,9.371483],[76.597197,9.371253],[76.597124,9.371156],[76.596909,9.371003],[76.596634,9.370808],[76.596636,9.370401],[76.596792,9.370321],[76.597163,9.370132],[76.597279,9.370073],[76.597479,9.370041],[76.597812,9.370084],[76.597956,9.370099],[76.59809,9.370105],[76.598483,9.370113],[76.598626,9.370064],[76.59881,9.369993],[76.599091,9.36995],[76.599303,9.37004],[76.599656,9.369735],[76.599654,9.369503],[76.600237,9.36921],[76.600905,9.368688],[76.601282,9.368852],[76.601456,9.368684],[76.60156,9.368522],[76.601936,9.368258],[76.602019,9.36804],[76.602171,9.368008],[76.602384,9.367965],[76.602578,9.367849],[76.60271,9.367771],[76.603107,9.367059],[76.603271,9.366855],[76.603672,9.36634],[76.603721,9.366325],[76.60377,9.366322],[76.60379,9.366325],[76.603842,9.366338],[76.603889,9.366365],[76.603915,9.366386],[76.603941,9.366402],[76.603983,9.366426],[76.604014,9.366442],[76.604057,9.366468],[76.604082,9.366485],[76.604099,9.366494],[76.604162,9.366565],[76.604179,9.366606],[76.6042,9.366642],[76.604216,9.366665],[76.604241,9.366705],[76.604271,9.366735],[76.604303,9.366755],[76.604344,9.366774],[76.604409,9.366781],[76.60444,9.366788],[76.604503,9.366796],[76.604536,9.366803],[76.604582,9.366805],[76.604632,9.366822],[76.604645,9.366833],[76.604652,9.36684],[76.604682,9.366858],[76.604761,9.36689],[76.604834,9.366913],[76.604874,9.366922],[76.605001,9.36697],[76.605065,9.36698],[76.605129,9.366988],[76.605181,9.367015],[76.60522,9.367032],[76.605268,9.36705],[76.605354,9.367056],[76.605413,9.367054],[76.60549,9.367039],[76.605535,9.367028],[76.60557,9.367016],[76.605625,9.366974],[76.605679,9.36694],[76.605723,9.366916],[76.605929,9.36686],[76.605998,9.36686],[76.606067,9.366874],[76.606117,9.366891],[76.606131,9.3669],[76.60615,9.366911],[76.606185,9.366936],[76.606214,9.366956],[76.606279,9.366983],[76.606313,9.36699],[76.606355,9.366976],[76.606376,9.366961],[76.606404,9.366942],[76.606448,9.36691],[76.606968,9.366865],[76.607155,9.367093],[76.607462,9.367046],[76.60827,9.366767],[76.608563,9.366631],[76.608906,9.366436],[76.609575,9.366044],[76.609845,9.365876],[76.61017,9.365707],[76.610527,9.365533],[76.610912,9.365386],[76.611215,9.365266],[76.611507,9.365206],[76.612185,9.365052],[76.612586,9.365001],[76.612857,9.365],[76.613199,9.364988],[76.613541,9.364992],[76.613774,9.364985],[76.613861,9.365028],[76.61435,9.364988],[76.614509,9.365019],[76.615455,9.365205],[76.615868,9.365267],[76.615968,9.365294],[76.616337,9.365321],[76.616817,9.365372],[76.616832,9.365363],[76.616877,9.365333],[76.616953,9.365198],[76.617001,9.36509],[76.617033,9.364993],[76.617065,9.36488],[76.617162,9.364707],[76.617281,9.364572],[76.617372,9.364356],[76.617431,9.364232],[76.617443,9.364218],[76.617461,9.36417],[76.617504,9.364073],[76.617572,9.363965],[76.61764,9.363886],[76.617737,9.363766],[76.617792,9.363628],[76.617906,9.363084],[76.61856,9.363294],[76.619027,9.362905],[76.619204,9.362648],[76.619342,9.362493],[76.619458,9.362412],[76.619585,9.362347],[76.619737,9.362284],[76.619888,9.362243],[76.620073,9.362234],[76.62026,9.362258],[76.620384,9.362293],[76.620595,9.362303],[76.620909,9.362319],[76.621145,9.362217],[76.62166,9.362001],[76.622443,9.361624],[76.622619,9.361488],[76.622892,9.361279],[76.623135,9.36106],[76.623432,9.360873],[76.623708,9.360704],[76.623906,9.360577],[76.624081,9.360474],[76.624179,9.360434],[76.624336,9.360343],[76.624564,9.360288],[76.624802,9.360281],[76.624965,9.360297],[76.625166,9.360387],[76.625367,9.360495],[76.625482,9.36065],[76.625618,9.360757],[76.625776,9.360796],[76.625944,9.360885],[76.626134,9.360863],[76.62634,9.360722],[76.626485,9.360468],[76.626522,9.360332],[76.626647,9.360104],[76.626759,9.359899],[76.626822,9.359784],[76.626903,9.359637],[76.626736,9.359551],[76.626573,9.359467],[76.626513,9.359377],[76.626511,9.359144],[76.62651,9.359031],[76.626509,9.358855],[76.626596,9.358636],[76.626471,9.358516],[76.626293,9.358538],[76.625875,9.35859],[76.625542,9.358581],[76.625272,9.358574],[76.625134,9.358426],[76.625029,9.358312],[76.624949,9.358227],[76.624909,9.358097],[76.624852,9.357915],[76.624771,9.357657],[76.624784,9.357503],[76.624797,9.357357],[76.624811,9.3572],[76.624842,9.357056],[76.6248,9.356942],[76.624582,9.356742],[76.624367,9.356527],[76.624258,9.356247],[76.624221,9.356151],[76.624184,9.356057],[76.624147,9.355961],[76.62403,9.355661],[76.62393,9.354863],[76.623939,9.354423],[76.623774,9.354063],[76.62353,9.353599],[76.623299,9.353521],[76.623203,9.353488],[76.623029,9.353429],[76.622852,9.353369],[76.62241,9.353218],[76.622142,9.353065],[76.622003,9.35304],[76.620797,9.352828],[76.620187,9.35276],[76.619769,9.352715],[76.619522,9.352309],[76.619632,9.352189],[76.619711,9.352054],[76.619598,9.351986],[76.61947,9.35191],[76.6192,9.351941],[76.618898,9.35193],[76.618751,9.351938],[76.618659,9.351944],[76.618484,9.351983],[76.618272,9.35195],[76.618061,9.351916],[76.617796,9.351953],[76.617692,9.352018],[76.617423,9.352186],[76.616978,9.352169],[76.616949,9.351936],[76.616923,9.351751],[76.616903,9.351615],[76.616865,9.351385],[76.61682,9.351133],[76.616972,9.350892],[76.617081,9.350719],[76.617101,9.350596],[76.61694,9.350379],[76.616753,9.350126],[76.616673,9.349994],[76.616606,9.349928],[76.616483,9.349821],[76.616359,9.349742],[76.6161,9.349617],[76.615776,9.349418],[76.615557,9.348746],[76.615906,9.348527],[76.616123,9.348391],[76.616247,9.348133],[76.616308,9.347893],[76.616424,9.347531],[76.616469,9.34718],[76.616499,9.346989],[76.616541,9.346725],[76.616401,9.346663],[76.616298,9.346592],[76.61619,9.346589],[76.616081,9.34656],[76.615887,9.346508],[76.615791,9.346265],[76.615812,9.346101],[76.615701,9.345915],[76.615552,9.345651],[76.615714,9.345505],[76.615758,9.345394],[76.615855,9.345338],[76.61602,9.345156],[76.616112,9.345016],[76.616196,9.344889],[76.616016,9.344469],[76.615711,9.344444],[76.615341,9.344414],[76.615027,9.344393],[76.614753,9.344375],[76.614649,9.344422],[76.614284,9.344467],[76.614029,9.344486],[76.613719,9.34446],[76.613625,9.344524],[76.613428,9.344359],[76.613309,9.343796],[76.613216,9.34326],[76.612944,9.343331],[76.612723,9.343344],[76.612408,9.343295],[76.61218,9.343324],[76.611929,9.343295],[76.611772,9.343201],[76.611533,9.343081],[76.611392,9.342879],[76.611233,9.342707],[76.610979,9.342384],[76.610818,9.342273],[76.610616,9.342077],[76.610356,9.341908],[76.610177,9.341908],[76.609997,9.341964],[76.609813,9.342089],[76.609667,9.34222],[76.609511,9.342368],[76.609337,9.342487],[76.609207,9.342598],[76.609105,9.342695],[76.608979,9.342813],[76.608808,9.342908],[76.608299,9.343139],[76.607842,9.343421],[76.607585,9.343696],[76.607568,9.343847],[76.607672,9.34425],[76.607665,9.344458],[76.607473,9.344715],[76.606964,9.344986],[76.606655,9.345065],[76.606409,9.345141],[76.605986,9.34519],[76.605456,9.345183],[76.605225,9.345111],[76.604771,9.344932],[76.604379,9.34483],[76.604148,9.344633],[76.603964,9.344378],[76.603867,9.344037],[76.603725,9.343908],[76.603648,9.343942],[76.60346,9.344113],[76.603233,9.344416],[76.602895,9.344887],[76.602625,9.345114],[76.602226,9.345391],[76.601733,9.345797],[76.601664,9.346192],[76.601633,9.346613],[76.60158,9.346909],[76.60153,9.347106],[76.601322,9.347243],[76.601149,9.347235],[76.600784,9.347171],[76.600372,9.347125],[76.600034,9.347065],[76.59973,9.346882],[76.599396,9.346587],[76.599126,9.34634],[76.59885,9.346215],[76.598592,9.346146],[76.598292,9.346173],[76.598223,9.346222],[76.597907,9.346518],[76.597658,9.346814],[76.597346,9.347103],[76.597154,9.347569],[76.597035,9.347937],[76.59695,9.348332],[76.596854,9.348639],[76.596777,9.348996],[76.596654,9.349292],[76.596573,9.349493],[76.596485,9.349622],[76.596312,9.349782],[76.596037,9.350001],[76.595765,9.350121],[76.595489,9.350398],[76.59554,9.350634],[76.595543,9.350641],[76.595669,9.350885],[76.595792,9.351039],[76.595984,9.351379],[76.596132,9.351712],[76.595953,9.351909],[76.595867,9.352046],[76.5957,9.352152],[76.595497,9.352274],[76.595108,9.352395],[76.594824,9.35241],[76.594455,9.352397],[76.594219,9.352349],[76.593443,9.352076],[76.593066,9.351933],[76.592763,9.351732],[76.592571,9.35162],[76.592162,9.351396],[76.591917,9.351245],[76.591662,9.351107],[76.591453,9.350998],[76.591231,9.35086],[76.591071,9.350784],[76.590974,9.350767],[76.590146,9.350733],[76.589951,9.350751],[76.589774,9.350788],[76.589617,9.350859],[76.589337,9.350975],[76.589163,9.35107],[76.588965,9.351176],[76.588765,9.351301],[76.588624,9.351392],[76.588393,9.35155],[76.588231,9.35162],[76.588026,9.351694],[76.587887,9.351698],[76.587756,9.351675],[76.58765,9.351601],[76.587515,9.351484],[76.587375,9.35129],[76.587364,9.351201],[76.587301,9.351067],[76.587216,9.350896],[76.587153,9.350777],[76.587077,9.350685],[76.587005,9.350584],[76.586951,9.350433],[76.586843,9.350157],[76.586776,9.3499],[76.586727,9.349686],[76.586647,9.349412],[76.586592,9.349229],[76.586506,9.349034],[76.586424,9.348857],[76.586199,9.348566],[76.586065,9.348491],[76.58596,9.348392],[76.585827,9.348325],[76.585598,9.348235],[76.585388,9.348189],[76.585158,9.348153],[76.585021,9.348126],[76.584847,9.348117],[76.584729,9.348129],[76.584621,9.348156],[76.584481,9.348187],[76.584344,9.348215],[76.584181,9.348262],[76.584087,9.348292],[76.583956,9.348343],[76.583827,9.348403],[76.58373,9.348486],[76.5836,9.348582],[76.583468,9.348727],[76.58336,9.34889],[76.583208,9.349114],[76.583124,9.349187],[76.583035,9.349251],[76.582995,9.349259],[76.582845,9.349264],[76.582577,9.349187],[76.582629,9.348495],[76.582691,9.348221],[76.582643,9.347561],[76.582507,9.347368],[76.582208,9.347158],[76.581719,9.347097],[76.58152,9.347177],[76.58139,9.347689],[76.580851,9.348335],[76.580489,9.348742],[76.579877,9.349403],[76.579823,9.34955],[76.579543,9.350314],[76.579289,9.351085],[76.579308,9.35149],[76.579538,9.351806],[76.579835,9.352276],[76.579963,9.352539],[76.580035,9.353019],[76.579847,9.353172],[76.579671,9.35332],[76.579388,9.353216],[76.578986,9.353103],[76.578636,9.353029],[76.5784,9.352989],[76.578253,9.352964],[76.577849,9.353058],[76.577435,9.353236],[76.577075,9.353396],[76.576062,9.353382],[76.575918,9.353391],[76.575778,9.353359],[76.575586,9.353394],[76.575408,9.353367],[76.574971,9.35344],[76.57469,9.353526],[76.574305,9.353708],[76.574122,9.353841],[76.573918,9.354235],[76.573813,9.354604],[76.573712,9.355017],[76.573544,9.355316],[76.5734,9.355491],[76.573039,9.355567],[76.572634,9.35568],[76.571998,9.355691],[76.570345,9.35578],[76.568601,9.355699],[76.567932,9.355688],[76.567341,9.355719],[76.567016,9.355704],[76.566666,9.355606],[76.566413,9.355231],[76.566167,9.35469],[76.565792,9.353788],[76.565742,9.353508],[76.56566,9.352992],[76.565228,9.353018],[76.564986,9.353602],[76.564296,9.354062],[76.563669,9.354292],[76.563079,9.353998],[76.562375,9.353589],[76.561743,9.353402],[76.561825,9.353128],[76.561782,9.352703],[76.561644,9.352027],[76.56151,9.351684],[76.56123,9.351226],[76.560931,9.350946],[76.560436,9.350668],[76.559751,9.350499],[76.559034,9.350326],[76.558547,9.350207],[76.558045,9.350056],[76.557532,9.349904],[76.557021,9.349812],[76.556187,9.349736],[76.555659,9.349833],[76.555205,9.350169],[76.555003,9.350376],[76.55483,9.350564],[76.554428,9.351029],[76.55408,9.35142],[76.553439,9.351916],[76.552636,9.351904],[76.552349,9.351721],[76.552352,9.351719],[76.552356,9.351716],[76.552297,9.351686],[76.55201,9.351503],[76.551805,9.351346],[76.55143,9.351029],[76.550702,9.350449],[76.55072,9.350342],[76.551135,9.349239],[76.551194,9.349103],[76.551711,9.34822],[76.551991,9.347676],[76.552562,9.347021],[76.553719,9.346411],[76.554566,9.345895],[76.555706,9.345569],[76.557678,9.345006],[76.557881,9.344541],[76.558077,9.34389],[76.558138,9.34357],[76.558085,9.343238],[76.557958,9.342983],[76.557873,9.342711],[76.557852,9.342621],[76.557811,9.342481],[76.557758,9.342366],[76.557574,9.342222],[76.557428,9.342106],[76.557375,9.342065],[76.557308,9.342003],[76.557189,9.342007],[76.557084,9.342014],[76.556978,9.341975],[76.556891,9.341927],[76.55684,9.341826],[76.556774,9.34176],[76.556709,9.341694],[76.556656,9.341646],[76.556574,9.341565],[76.556509,9.341435],[76.556476,9.34137],[76.55644,9.3413],[76.556378,9.341246],[76.556353,9.341225],[76.556321,9.341199],[76.556289,9.341171],[76.556256,9.341145],[76.556229,9.341121],[76.556196,9.341092],[76.55616,9.341063],[76.556129,9.341056],[76.556081,9.341045],[76.556031,9.341035],[76.555984,9.340987],[76.555907,9.34091],[76.555904,9.340906],[76.555849,9.340871],[76.555799,9.34084],[76.555798,9.340915],[76.555675,9.340952],[76.55565,9.340855],[76.555637,9.340756],[76.555628,9.340654],[76.555622,9.340592],[76.555617,9.340472],[76.55561,9.340325],[76.555593,9.340216],[76.555607,9.340162],[76.555608,9.340156],[76.555613,9.340133],[76.555617,9.340118],[76.555636,9.340063],[76.555637,9.34006],[76.555656,9.339962],[76.556742,9.339701],[76.556861,9.339601],[76.55697,9.339358],[76.556905,9.339111],[76.556926,9.338768],[76.556922,9.338372],[76.556766,9.338014],[76.556599,9.33765],[76.55637,9.337229],[76.556095,9.33682],[76.555724,9.336373],[76.555414,9.336046],[76.555116,9.33577],[76.554792,9.335664],[76.554278,9.335562],[76.553836,9.335314],[76.553552,9.33498],[76.553569,9.334272],[76.553624,9.33358],[76.553797,9.332539],[76.554108,9.331535],[76.553478,9.329366],[76.552706,9.327195],[76.552077,9.325888],[76.551391,9.325009],[76.550225,9.324566],[76.549282,9.324502],[76.548194,9.324814],[76.54643,9.325469],[76.546161,9.3254],[76.545951,9.325281],[76.545501,9.325023],[76.545224,9.324808],[76.544781,9.32443],[76.544336,9.324045],[76.544211,9.323922],[76.544044,9.323775],[76.543791,9.323651],[76.543559,9.323532],[76.543317,9.323406],[76.543102,9.323307],[76.542677,9.323098],[76.542343,9.322919],[76.542027,9.322763],[76.54154,9.322611],[76.541218,9.322479],[76.540943,9.322385],[76.540495,9.322312],[76.540389,9.322298],[76.539395,9.32213],[76.53804,9.322096],[76.536721,9.322123],[76.535701,9.32251],[76.534905,9.323038],[76.534522,9.323617],[76.534205,9.323984],[76.533968,9.324054],[76.533154,9.325473]]]},\"properties\":{\"Name\":\"Thiruvalla AC\",\"Level\":\"AC\"}}]}");
@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.56253,9.367629],[76.562373,9.36745],[76.56214,9.367183],[76.56194,9.366934],[76.561903,9.366792],[76.561848,9.366593],[76.56174,9.366202],[76.561664,9.365925],[76.561713,9.365578],[76.561748,9.365329],[76.561813,9.364988],[76.561875,9.364662],[76.561892,9.364304],[76.561907,9.363981],[76.561711,9.363745],[76.561374,9.363705],[76.5611,9.363707],[76.560847,9.363709],[76.560672,9.363923],[76.560615,9.364019],[76.560444,9.364203],[76.56035,9.364339],[76.560212,9.36454],[76.560169,9.36462],[76.559912,9.364918],[76.559653,9.365233],[76.559509,9.3653],[76.559082,9.365499],[76.558759,9.365649],[76.55843,9.365744],[76.558081,9.365844],[76.557617,9.365977],[76.557491,9.366128],[76.5573,9.366357],[76.557199,9.366411],[76.557122,9.366473],[76.55692,9.366637],[76.556593,9.366768],[76.556323,9.366973],[76.556085,9.367093],[76.555863,9.367206],[76.555597,9.367682],[76.555464,9.367921],[76.555358,9.368088],[76.55522,9.368305],[76.555096,9.368501],[76.554869,9.36864],[76.554694,9.368747],[76.554472,9.368883],[76.554397,9.368948],[76.554279,9.369],[76.554123,9.36907],[76.553902,9.369169],[76.553793,9.369203],[76.553678,9.369192],[76.553485,9.369148],[76.553293,9.369104],[76.552874,9.368764],[76.552685,9.368611],[76.552533,9.368769],[76.552585,9.369004],[76.552636,9.369192],[76.552665,9.3693],[76.552749,9.369539],[76.552812,9.369718],[76.552848,9.369818],[76.552807,9.370018],[76.55278,9.370156],[76.552709,9.370381],[76.552708,9.3705],[76.55263,9.370626],[76.552614,9.370748],[76.552594,9.3709],[76.552659,9.371194],[76.552604,9.371379],[76.552603,9.371473],[76.55251,9.371646],[76.552594,9.37181],[76.552692,9.372058],[76.55282,9.372381],[76.552941,9.372783],[76.553006,9.373],[76.553048,9.373143],[76.553152,9.37346],[76.553065,9.373589],[76.552811,9.373893],[76.552675,9.373981],[76.552213,9.374142],[76.551851,9.374269],[76.551617,9.374615],[76.551509,9.374881],[76.551496,9.375244],[76.551414,9.375495],[76.551397,9.375639],[76.551387,9.375735],[76.551387,9.375879],[76.551926,9.376125],[76.552118,9.376095],[76.552584,9.376023],[76.552721,9.376143],[76.552847,9.376253],[76.553013,9.376422],[76.553306,9.376812],[76.553334,9.37701],[76.553365,9.377232],[76.553545,9.377427],[76.553789,9.377639],[76.553905,9.378106],[76.553905,9.378514],[76.553917,9.378608],[76.553748,9.379109],[76.553564,9.379461],[76.55341,9.379754],[76.553299,9.379892],[76.553181,9.380007],[76.553026,9.380159],[76.552735,9.380376],[76.552523,9.380526],[76.552368,9.380596],[76.552183,9.380683],[76.551788,9.380801],[76.551493,9.380889],[76.551391,9.381644],[76.55109,9.381709],[76.550799,9.381754],[76.550573,9.381972],[76.550478,9.382138],[76.550355,9.382595],[76.550403,9.382915],[76.550417,9.383306],[76.550425,9.383527],[76.550094,9.383745],[76.549813,9.383969],[76.549505,9.384216],[76.549431,9.384285],[76.549337,9.384447],[76.549199,9.384658],[76.549184,9.384763],[76.549236,9.385004],[76.549473,9.385152],[76.549721,9.385083],[76.549853,9.385047],[76.550097,9.384802],[76.550253,9.384708],[76.550347,9.384651],[76.550829,9.38461],[76.550986,9.384699],[76.551144,9.384837],[76.551287,9.385001],[76.551357,9.385102],[76.551365,9.385399],[76.551382,9.385707],[76.551368,9.385843],[76.551343,9.386074],[76.551331,9.386179],[76.551247,9.386572],[76.551074,9.386679],[76.550551,9.387005],[76.550339,9.387165],[76.550166,9.387173],[76.550188,9.387279],[76.550168,9.387467],[76.550064,9.387848],[76.549954,9.388008],[76.549711,9.38803],[76.549616,9.388086],[76.54959,9.388212],[76.549569,9.388317],[76.549656,9.388499],[76.549716,9.388625],[76.549757,9.388941],[76.549705,9.389171],[76.549645,9.38944],[76.549432,9.389612],[76.549442,9.389821],[76.549249,9.389734],[76.549097,9.389798],[76.548982,9.389833],[76.54884,9.389987],[76.548741,9.390052],[76.548311,9.390021],[76.548112,9.390239],[76.548098,9.390368],[76.548153,9.390699],[76.548169,9.390854],[76.548186,9.391028],[76.548234,9.391183],[76.548268,9.391276],[76.548328,9.391441],[76.548372,9.39153],[76.548487,9.391725],[76.548564,9.391983],[76.548611,9.392072],[76.548601,9.392171],[76.548602,9.392388],[76.548582,9.392618],[76.548721,9.392669],[76.548816,9.392704],[76.549044,9.392698],[76.549272,9.392693],[76.549331,9.392609],[76.549638,9.392564],[76.549695,9.392984],[76.549854,9.392914],[76.55023,9.392899],[76.550463,9.39289],[76.550695,9.392912],[76.550858,9.392928],[76.550934,9.392621],[76.551333,9.392599],[76.551358,9.392755],[76.551387,9.392939],[76.5516,9.39288],[76.551695,9.392688],[76.551779,9.392305],[76.552046,9.392359],[76.552043,9.39249],[76.552148,9.392724],[76.552383,9.392727],[76.55263,9.392682],[76.552764,9.392658],[76.55288,9.392658],[76.552984,9.392625],[76.553136,9.392587],[76.55344,9.392509],[76.553526,9.392737],[76.553556,9.392916],[76.553553,9.393085],[76.553485,9.393233],[76.553361,9.393673],[76.553194,9.393676],[76.553207,9.393839],[76.553321,9.394145],[76.553716,9.394247],[76.553889,9.394291],[76.554208,9.394262],[76.554455,9.39424],[76.554629,9.394224],[76.554642,9.393963],[76.554746,9.393961],[76.554904,9.394228],[76.555208,9.394204],[76.555197,9.394079],[76.555078,9.393917],[76.555098,9.39375],[76.555114,9.393616],[76.555092,9.393339],[76.555014,9.39322],[76.555107,9.393084],[76.555277,9.392963],[76.555497,9.392913],[76.555602,9.392882],[76.555696,9.392854],[76.556017,9.392758],[76.556259,9.392608],[76.556472,9.392625],[76.556754,9.392676],[76.556847,9.392656],[76.557033,9.392683],[76.557131,9.392402],[76.557216,9.392205],[76.557181,9.391946],[76.556937,9.391827],[76.55694,9.391176],[76.557018,9.390808],[76.557405,9.390884],[76.557411,9.390787],[76.557511,9.390764],[76.557595,9.390882],[76.557802,9.390989],[76.558044,9.39104],[76.558141,9.391056],[76.558424,9.391104],[76.558444,9.390863],[76.558678,9.390651],[76.558759,9.390493],[76.558761,9.390326],[76.558945,9.390327],[76.558996,9.390549],[76.558827,9.390608],[76.55889,9.390752],[76.559049,9.390694],[76.559101,9.390899],[76.559122,9.391075],[76.559327,9.391118],[76.5595,9.391054],[76.559632,9.391006],[76.559691,9.390871],[76.559998,9.39072],[76.560121,9.390956],[76.560208,9.39106],[76.560314,9.391185],[76.560519,9.391407],[76.560952,9.391946],[76.561127,9.392163],[76.561265,9.392142],[76.561374,9.392399],[76.561302,9.39251],[76.561168,9.39255],[76.561166,9.392872],[76.561165,9.392994],[76.561079,9.393036],[76.561002,9.393151],[76.56084,9.393099],[76.560704,9.393114],[76.560686,9.393217],[76.560643,9.393461],[76.560652,9.393642],[76.560493,9.393708],[76.560455,9.393883],[76.560437,9.393972],[76.560508,9.394283],[76.560499,9.394424],[76.560491,9.394557],[76.56051,9.394705],[76.560577,9.394914],[76.560786,9.395262],[76.560645,9.395325],[76.560534,9.395383],[76.560447,9.395558],[76.560374,9.395706],[76.56051,9.395771],[76.560811,9.395725],[76.561017,9.39551],[76.561153,9.3955],[76.561281,9.39549],[76.561486,9.39547],[76.561919,9.395503],[76.562051,9.39533],[76.562111,9.395192],[76.562219,9.395094],[76.56251,9.394834],[76.562814,9.394768],[76.562913,9.394563],[76.562979,9.394427],[76.563461,9.394414],[76.563669,9.394648],[76.563762,9.394863],[76.563796,9.394958],[76.563786,9.395168],[76.563781,9.395269],[76.563777,9.395361],[76.563768,9.395557],[76.563773,9.39567],[76.563777,9.395784],[76.563751,9.396101],[76.563688,9.39625],[76.563639,9.396384],[76.56353,9.396555],[76.563502,9.396729],[76.563442,9.397102],[76.563463,9.397532],[76.56339,9.397963],[76.563376,9.398117],[76.563356,9.398342],[76.563197,9.39838],[76.562862,9.398461],[76.562762,9.398453],[76.562628,9.398444],[76.562125,9.398448],[76.562005,9.398447],[76.561705,9.398446],[76.561555,9.398457],[76.561406,9.398468],[76.561232,9.398455],[76.561079,9.398449],[76.56097,9.398444],[76.560675,9.398456],[76.56049,9.398473],[76.560293,9.398605],[76.560094,9.398677],[76.559919,9.398797],[76.559973,9.398882],[76.560101,9.399004],[76.560217,9.399113],[76.560348,9.399238],[76.560417,9.399351],[76.560498,9.399483],[76.560526,9.399578],[76.560554,9.399678],[76.560602,9.399812],[76.560677,9.400142],[76.560884,9.400407],[76.561131,9.400647],[76.561209,9.400742],[76.561261,9.400874],[76.561238,9.401062],[76.561276,9.401241],[76.561305,9.40138],[76.561289,9.401549],[76.561292,9.401743],[76.561251,9.401919],[76.561286,9.402093],[76.561377,9.402319],[76.561454,9.402492],[76.561513,9.402625],[76.561577,9.402798],[76.561637,9.402961],[76.56176,9.40315],[76.561858,9.403301],[76.561959,9.403428],[76.562037,9.403506],[76.562194,9.403632],[76.562288,9.403709],[76.562403,9.403771],[76.562643,9.403829],[76.562761,9.403854],[76.562862,9.403875],[76.563148,9.403925],[76.563347,9.403952],[76.563485,9.403971],[76.563672,9.403991],[76.563808,9.404091],[76.563918,9.404172],[76.564084,9.404345],[76.564193,9.404406],[76.564489,9.404573],[76.564707,9.404695],[76.564833,9.404773],[76.564954,9.404867],[76.565078,9.404987],[76.565253,9.405183],[76.565489,9.405477],[76.565729,9.406241],[76.565744,9.406706],[76.56576,9.407197],[76.565863,9.407743],[76.565769,9.408157],[76.565708,9.408425],[76.565412,9.408731],[76.565061,9.409102],[76.564745,9.409437],[76.564606,9.40959],[76.564498,9.40967],[76.564367,9.409775],[76.56416,9.409957],[76.564073,9.41002],[76.564001,9.410086],[76.563615,9.41044],[76.563716,9.410623],[76.564045,9.410575],[76.564293,9.410477],[76.564669,9.41046],[76.564877,9.410631],[76.565532,9.411108],[76.566176,9.411691],[76.566646,9.412007],[76.567093,9.412302],[76.567808,9.412842],[76.568579,9.413735],[76.568822,9.413937],[76.569046,9.414162],[76.569241,9.414376],[76.569569,9.414707],[76.569746,9.414902],[76.569799,9.415102],[76.569884,9.415231],[76.570053,9.415358],[76.570326,9.415552],[76.570516,9.415638],[76.570788,9.415756],[76.571088,9.415893],[76.57136,9.416027],[76.571604,9.41617],[76.571868,9.416455],[76.572157,9.416598],[76.572373,9.416717],[76.572654,9.416852],[76.572918,9.416979],[76.573104,9.417041],[76.573326,9.417136],[76.57513,9.418025],[76.576659,9.420036],[76.578235,9.421336],[76.579329,9.422323],[76.579335,9.422324],[76.57964,9.422635],[76.58006,9.422614],[76.580282,9.422466],[76.580286,9.422466],[76.58072,9.422303],[76.580981,9.422156],[76.581612,9.42201],[76.581959,9.421853],[76.581939,9.421683],[76.582477,9.421515],[76.582625,9.421168],[76.582574,9.421006],[76.582757,9.421003],[76.583461,9.420255],[76.584142,9.420099],[76.584712,9.420095],[76.584884,9.420116],[76.585027,9.420106],[76.585659,9.419864],[76.585897,9.420128],[76.586159,9.420271],[76.586497,9.420252],[76.586652,9.420376],[76.586996,9.420114],[76.587327,9.419924],[76.58749,9.419811],[76.588091,9.419515],[76.588119,9.419425],[76.589012,9.419117],[76.589089,9.418948],[76.589223,9.419003],[76.589274,9.418978],[76.589301,9.419047],[76.589344,9.419069],[76.589467,9.419864],[76.590268,9.419689],[76.590231,9.419354],[76.590184,9.418926],[76.590261,9.418849],[76.590418,9.418693],[76.590495,9.418615],[76.590649,9.418461],[76.590614,9.418323],[76.590765,9.418183],[76.590955,9.418007],[76.590968,9.417893],[76.590777,9.417636],[76.590756,9.417537],[76.590841,9.417411],[76.590862,9.417322],[76.59089,9.417207],[76.590967,9.417021],[76.59103,9.416899],[76.591072,9.416797],[76.591169,9.416561],[76.591243,9.416468],[76.591265,9.416374],[76.591397,9.41615],[76.59157,9.415877],[76.591625,9.415791],[76.591801,9.415665],[76.591852,9.415557],[76.591995,9.415251],[76.59212,9.415091],[76.59227,9.414768],[76.59242,9.414558],[76.592538,9.414352],[76.592604,9.414236],[76.592651,9.414149],[76.592746,9.413982],[76.592919,9.413677],[76.593122,9.413342],[76.593271,9.413096],[76.59349,9.41294],[76.593692,9.412492],[76.593758,9.412343],[76.59401,9.411943],[76.59411,9.411801],[76.594464,9.411597],[76.594603,9.411517],[76.594875,9.411375],[76.595172,9.411287],[76.595403,9.411245],[76.595613,9.411399],[76.595698,9.41131],[76.596154,9.411073],[76.59641,9.410449],[76.596509,9.410208],[76.59634,9.410103],[76.596185,9.410006],[76.596199,9.409906],[76.596266,9.409347],[76.596282,9.409218],[76.596302,9.408834],[76.596312,9.408685],[76.59633,9.408495],[76.596347,9.408346],[76.596362,9.408125],[76.596376,9.407928],[76.596419,9.40748],[76.596438,9.407284],[76.596447,9.407188],[76.596456,9.407095],[76.596469,9.406961],[76.596478,9.406869],[76.596487,9.406776],[76.596522,9.40641],[76.596545,9.406169],[76.596492,9.405848],[76.596422,9.405425],[76.596385,9.405203],[76.596373,9.405084],[76.59632,9.404554],[76.596289,9.404237],[76.596278,9.404132],[76.596268,9.404032],[76.596356,9.403223],[76.596371,9.403083],[76.596403,9.402643],[76.596441,9.402332],[76.596476,9.402042],[76.596761,9.401445],[76.596845,9.401321],[76.596973,9.401132],[76.597037,9.401046],[76.597139,9.400904],[76.597318,9.400647],[76.597397,9.400503],[76.597445,9.400408],[76.597563,9.400172],[76.597543,9.399685],[76.597525,9.399529],[76.597494,9.399253],[76.597569,9.39894],[76.597633,9.39867],[76.597648,9.398244],[76.597663,9.397829],[76.597707,9.397532],[76.597743,9.397288],[76.597772,9.397088],[76.597789,9.396975],[76.59781,9.396834],[76.597851,9.396591],[76.597807,9.396465],[76.597834,9.39606],[76.597904,9.394987],[76.597672,9.394441],[76.59763,9.394329],[76.597517,9.393959],[76.597485,9.393545],[76.597435,9.393441],[76.597404,9.393125],[76.597384,9.392926],[76.597376,9.392747],[76.597385,9.392612],[76.59741,9.392256],[76.597466,9.391949],[76.597383,9.391806],[76.59723,9.391541],[76.597156,9.391445],[76.597006,9.391251],[76.597208,9.391061],[76.59746,9.390822],[76.597523,9.390741],[76.597932,9.390393],[76.598341,9.390067],[76.59852,9.389924],[76.598708,9.389739],[76.598951,9.389588],[76.599167,9.389345],[76.599601,9.389014],[76.59984,9.388831],[76.600384,9.388534],[76.600406,9.388329],[76.600424,9.388174],[76.600625,9.387824],[76.60066,9.387703],[76.600742,9.387406],[76.600831,9.387083],[76.600865,9.386959],[76.600969,9.386656],[76.601063,9.386382],[76.601084,9.386282],[76.601127,9.386069],[76.601145,9.385977],[76.601102,9.385894],[76.601039,9.385771],[76.600981,9.385659],[76.601066,9.38555],[76.601155,9.385433],[76.601274,9.385277],[76.601385,9.385027],[76.60155,9.384815],[76.601675,9.384672],[76.601747,9.384581],[76.601808,9.384502],[76.601937,9.38431],[76.60215,9.384161],[76.602289,9.384134],[76.602441,9.384009],[76.602801,9.383926],[76.602728,9.383774],[76.602443,9.383187],[76.602294,9.382882],[76.602211,9.382732],[76.602052,9.382434],[76.601998,9.382332],[76.601792,9.381947],[76.6017,9.381768],[76.601548,9.381404],[76.601502,9.381297],[76.601173,9.380529],[76.600809,9.379924],[76.600753,9.37983],[76.600618,9.379665],[76.600411,9.379411],[76.600084,9.37929],[76.599796,9.379034],[76.599656,9.378916],[76.599455,9.378667],[76.599307,9.377823],[76.599433,9.376801],[76.599299,9.376446],[76.599027,9.375776],[76.598637,9.374778],[76.598529,9.374476],[76.59808,9.373077],[76.598022,9.372938],[76.597933,9.372724],[76.597755,9.372298],[76.597665,9.372083],[76.5976,9.371926],[76.597563,9.371839],[76.597553,9.371735],[76.597438,9.371579],[76.597367,9.371483],[76.597197,9.371253],[76.597124,9.371156],[76.596909,9.371003],[76.596634,9.370808],[76.596168,9.370654],[76.596052,9.370623],[76.595571,9.370322],[76.595326,9.370175],[76.595063,9.37003],[76.594907,9.369935],[76.594494,9.369716],[76.59417,9.369513],[76.593786,9.369273],[76.593487,9.369108],[76.593334,9.36906],[76.592947,9.368943],[76.592513,9.368812],[76.592416,9.368796],[76.591795,9.3687],[76.591445,9.368638],[76.591257,9.368603],[76.590821,9.368501],[76.59056,9.36834],[76.590465,9.368282],[76.590297,9.368036],[76.590198,9.367669],[76.590098,9.367302],[76.589881,9.366535],[76.589817,9.365828],[76.589781,9.365619],[76.589828,9.365069],[76.589781,9.364774],[76.589803,9.364455],[76.589692,9.36389],[76.589673,9.363792],[76.589277,9.36318],[76.589023,9.362947],[76.588695,9.362646],[76.588438,9.362409],[76.588065,9.362051],[76.587798,9.361795],[76.587515,9.361508],[76.587311,9.3613],[76.587123,9.36119],[76.586957,9.361068],[76.58683,9.360975],[76.586648,9.360947],[76.586327,9.360929],[76.586234,9.360924],[76.585918,9.361016],[76.585707,9.361129],[76.585466,9.361258],[76.584895,9.361727],[76.584812,9.361793],[76.584287,9.362263],[76.584073,9.362445],[76.583428,9.36296],[76.583264,9.363073],[76.58311,9.363154],[76.582839,9.363236],[76.582697,9.363268],[76.582321,9.363264],[76.581756,9.36307],[76.58114,9.362679],[76.580993,9.362563],[76.580716,9.362346],[76.580548,9.362229],[76.580233,9.36201],[76.580155,9.361962],[76.579715,9.361702],[76.579415,9.361529],[76.578923,9.361265],[76.578703,9.361153],[76.577896,9.360804],[76.577022,9.360385],[76.576752,9.360295],[76.576372,9.360226],[76.5762,9.360216],[76.57553,9.360175],[76.575492,9.360264],[76.575255,9.360811],[76.575119,9.361124],[76.575059,9.361344],[76.574959,9.361714],[76.57491,9.362091],[76.574892,9.362313],[76.574879,9.362585],[76.574877,9.362778],[76.574904,9.363552],[76.575135,9.364064],[76.57526,9.364336],[76.575351,9.364526],[76.575497,9.364822],[76.57567,9.365166],[76.575861,9.365371],[76.576336,9.365882],[76.57643,9.366028],[76.57665,9.366371],[76.576862,9.366682],[76.576957,9.36684],[76.577029,9.366961],[76.577053,9.367097],[76.577103,9.367381],[76.576965,9.367644],[76.576789,9.36798],[76.576559,9.368083],[76.57618,9.368252],[76.575802,9.368251],[76.575542,9.368282],[76.575186,9.368283],[76.575076,9.368283],[76.574859,9.36825],[76.574687,9.368224],[76.574566,9.368212],[76.574475,9.368194],[76.574273,9.368154],[76.574179,9.368148],[76.573972,9.368144],[76.573697,9.368193],[76.573485,9.368292],[76.573324,9.368367],[76.573077,9.368449],[76.572765,9.368505],[76.572591,9.368535],[76.572435,9.368513],[76.572208,9.368479],[76.572081,9.368461],[76.571715,9.368385],[76.571426,9.368325],[76.571225,9.368283],[76.57102,9.368236],[76.570511,9.368121],[76.570265,9.368061],[76.570003,9.367996],[76.569762,9.367893],[76.569318,9.367705],[76.568943,9.367545],[76.568793,9.367455],[76.568105,9.367044],[76.568016,9.366985],[76.56789,9.366923],[76.567631,9.366817],[76.567512,9.366761],[76.567364,9.366717],[76.566959,9.366573],[76.566478,9.366574],[76.56636,9.366563],[76.565907,9.366521],[76.565619,9.366547],[76.565327,9.366595],[76.565082,9.366654],[76.564836,9.366747],[76.564579,9.366846],[76.564384,9.366925],[76.564239,9.366986],[76.564054,9.36706],[76.563667,9.367216],[76.563406,9.367334],[76.563314,9.367375],[76.563026,9.367601],[76.56277,9.367681],[76.56253,9.367629]]]},\"properties\":{\"LSGD\":\"Thiruvalla\",\"Mandal\":\"Thiruvalla\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.672648,9.456402],[76.672524,9.456366],[76.672422,9.456337],[76.672305,9.456296],[76.67196,9.456175],[76.671738,9.456099],[76.671562,9.456021],[76.671184,9.455845],[76.670947,9.455715],[76.670569,9.455404],[76.670389,9.455075],[76.67034,9.45499],[76.670243,9.454771],[76.669995,9.454226],[76.66991,9.453906],[76.669847,9.453673],[76.669758,9.453531],[76.669681,9.45341],[76.669633,9.45316],[76.669583,9.452657],[76.669543,9.452516],[76.669501,9.452406],[76.669523,9.452265],[76.669532,9.452148],[76.669547,9.451934],[76.669561,9.451742],[76.66958,9.451479],[76.669591,9.451328],[76.669619,9.450933],[76.66957,9.450607],[76.66951,9.450212],[76.669474,9.449976],[76.669287,9.449758],[76.669207,9.449664],[76.66896,9.449524],[76.668626,9.449335],[76.66831,9.449277],[76.667864,9.449195],[76.667521,9.449131],[76.667092,9.449052],[76.666961,9.449142],[76.666776,9.449267],[76.666623,9.449371],[76.666344,9.44956],[76.66567,9.449776],[76.665403,9.449861],[76.664467,9.450291],[76.664612,9.450487],[76.664689,9.450591],[76.664762,9.450713],[76.664809,9.450792],[76.66494,9.451008],[76.664999,9.451398],[76.665082,9.451585],[76.664866,9.451702],[76.664634,9.451584],[76.664419,9.451819],[76.664307,9.451916],[76.664087,9.452107],[76.663876,9.452153],[76.66335,9.452205],[76.663411,9.452739],[76.662991,9.452639],[76.662853,9.452561],[76.662684,9.452699],[76.662439,9.452791],[76.662471,9.453085],[76.662404,9.453248],[76.662332,9.453421],[76.662111,9.45367],[76.662,9.453788],[76.661888,9.453813],[76.661627,9.453919],[76.661333,9.454027],[76.661206,9.454044],[76.660931,9.454112],[76.660823,9.454138],[76.660649,9.454181],[76.66046,9.454237],[76.660319,9.454279],[76.660098,9.454344],[76.66015,9.454503],[76.660214,9.4547],[76.660185,9.454786],[76.66014,9.455062],[76.660174,9.455421],[76.660057,9.455698],[76.659797,9.455681],[76.659617,9.455609],[76.65973,9.455014],[76.659692,9.454842],[76.659667,9.454712],[76.659463,9.454715],[76.659208,9.454581],[76.659137,9.454515],[76.658743,9.454626],[76.658431,9.454714],[76.658329,9.454822],[76.658304,9.454917],[76.658219,9.455247],[76.6578,9.455465],[76.65746,9.455642],[76.657334,9.455708],[76.657218,9.455768],[76.657287,9.455949],[76.657352,9.456029],[76.657347,9.456191],[76.65734,9.456375],[76.657354,9.456663],[76.657341,9.457037],[76.657176,9.457034],[76.656878,9.457161],[76.656473,9.457178],[76.656349,9.457179],[76.655961,9.457183],[76.655814,9.457176],[76.655714,9.457171],[76.655465,9.457149],[76.655293,9.457134],[76.655001,9.457109],[76.654968,9.457201],[76.654834,9.457216],[76.654811,9.457376],[76.654944,9.457408],[76.655006,9.457752],[76.655042,9.457957],[76.6547,9.458043],[76.654384,9.458121],[76.654132,9.458183],[76.654033,9.458207],[76.653726,9.458294],[76.653433,9.458382],[76.653236,9.45844],[76.653083,9.458469],[76.65287,9.458316],[76.652662,9.458166],[76.652451,9.458014],[76.652042,9.45772],[76.651622,9.457418],[76.650989,9.457707],[76.650746,9.457818],[76.650524,9.45799],[76.650545,9.458151],[76.650596,9.458535],[76.650631,9.458804],[76.650453,9.458943],[76.650235,9.459192],[76.650128,9.459314],[76.649988,9.459475],[76.648869,9.459534],[76.648647,9.459533],[76.648534,9.459532],[76.648374,9.459724],[76.648193,9.459941],[76.648009,9.460162],[76.647864,9.460336],[76.647766,9.460454],[76.647802,9.460598],[76.64779,9.460741],[76.647758,9.461051],[76.64772,9.461411],[76.647478,9.461467],[76.647358,9.461495],[76.647069,9.461563],[76.646909,9.4616],[76.646648,9.461661],[76.646533,9.461528],[76.64621,9.461152],[76.64615,9.461083],[76.64594,9.460679],[76.645783,9.460375],[76.645672,9.460162],[76.645528,9.460066],[76.64511,9.459786],[76.644932,9.459645],[76.644842,9.459574],[76.644632,9.459494],[76.644519,9.459849],[76.644443,9.46009],[76.64438,9.460287],[76.644321,9.460474],[76.644292,9.460565],[76.644174,9.460936],[76.644115,9.461123],[76.64404,9.461292],[76.643988,9.461407],[76.643929,9.46154],[76.643848,9.46172],[76.643589,9.462299],[76.643587,9.462495],[76.643583,9.462855],[76.64358,9.463123],[76.643575,9.463642],[76.643662,9.464054],[76.643714,9.464301],[76.643752,9.464483],[76.643757,9.464655],[76.643539,9.464705],[76.643537,9.464974],[76.643399,9.464996],[76.643338,9.464691],[76.643047,9.464743],[76.642895,9.46477],[76.642778,9.46479],[76.642739,9.46502],[76.642714,9.465162],[76.642704,9.465397],[76.642678,9.465533],[76.642605,9.465925],[76.642773,9.466346],[76.642866,9.466577],[76.642954,9.466845],[76.642973,9.466946],[76.643066,9.467142],[76.643159,9.467451],[76.643311,9.467815],[76.643364,9.467975],[76.642379,9.468155],[76.641564,9.468305],[76.641595,9.468569],[76.641473,9.468668],[76.641274,9.468701],[76.641077,9.469234],[76.641046,9.469459],[76.641121,9.469826],[76.641192,9.469916],[76.641392,9.470617],[76.641296,9.471039],[76.64144,9.471156],[76.641432,9.471894],[76.64155,9.47279],[76.641404,9.473204],[76.641655,9.47361],[76.64168,9.473793],[76.641713,9.47404],[76.641783,9.474267],[76.641732,9.474509],[76.641512,9.474861],[76.641456,9.47514],[76.641452,9.475355],[76.641477,9.475428],[76.641528,9.475526],[76.641836,9.475747],[76.641933,9.475835],[76.641997,9.475907],[76.642014,9.475982],[76.641998,9.476042],[76.641914,9.47611],[76.641901,9.47616],[76.641944,9.476287],[76.641937,9.476396],[76.641896,9.476505],[76.641853,9.476543],[76.64168,9.476654],[76.641628,9.476853],[76.64164,9.477044],[76.64178,9.477212],[76.641774,9.477371],[76.641841,9.477466],[76.64223,9.477697],[76.642438,9.477832],[76.642396,9.478126],[76.642279,9.478374],[76.642207,9.478528],[76.642214,9.478676],[76.642445,9.478947],[76.642835,9.479169],[76.643467,9.47924],[76.643679,9.479106],[76.644355,9.478896],[76.644645,9.478791],[76.64529,9.478689],[76.646353,9.478762],[76.647039,9.478692],[76.647143,9.478674],[76.647337,9.478704],[76.647377,9.478707],[76.6475,9.478776],[76.647811,9.47881],[76.648014,9.478827],[76.648092,9.478894],[76.648263,9.479041],[76.649958,9.479799],[76.649747,9.479959],[76.650217,9.480268],[76.650813,9.481343],[76.651157,9.481502],[76.653032,9.481589],[76.653969,9.481706],[76.654752,9.482063],[76.655329,9.482148],[76.655467,9.482183],[76.655536,9.482009],[76.655874,9.482023],[76.65626,9.482209],[76.656344,9.482217],[76.656517,9.48223],[76.656658,9.482228],[76.65675,9.482238],[76.656816,9.482247],[76.656869,9.482255],[76.656927,9.482259],[76.657173,9.482278],[76.657595,9.482209],[76.657927,9.482168],[76.65824,9.482158],[76.658352,9.482147],[76.658501,9.482175],[76.658662,9.482237],[76.658731,9.482312],[76.658792,9.482456],[76.659011,9.482479],[76.659231,9.48268],[76.659522,9.482658],[76.659825,9.482641],[76.661617,9.482535],[76.661896,9.482332],[76.661931,9.482191],[76.662124,9.482199],[76.66254,9.482029],[76.662948,9.48202],[76.663739,9.481716],[76.663928,9.481657],[76.664045,9.481622],[76.664752,9.481466],[76.664836,9.481455],[76.664936,9.481496],[76.665052,9.481479],[76.665236,9.481328],[76.665323,9.481344],[76.665905,9.481385],[76.665956,9.481435],[76.666008,9.481469],[76.666179,9.481486],[76.66623,9.481526],[76.666387,9.481817],[76.666724,9.481979],[76.667444,9.482176],[76.667578,9.482185],[76.667638,9.482031],[76.667788,9.481847],[76.668149,9.481496],[76.669146,9.481178],[76.669625,9.481004],[76.669944,9.480858],[76.670112,9.480801],[76.670493,9.480655],[76.670569,9.480624],[76.671811,9.480131],[76.671704,9.480184],[76.672749,9.479741],[76.6736,9.479873],[76.67372,9.480562],[76.673587,9.480852],[76.673567,9.481387],[76.673507,9.481558],[76.673641,9.481938],[76.673978,9.482426],[76.674026,9.482466],[76.674503,9.482639],[76.677645,9.481898],[76.67804,9.481915],[76.678288,9.481998],[76.679125,9.483029],[76.679468,9.4833],[76.679691,9.483367],[76.680026,9.483395],[76.680087,9.483366],[76.680168,9.483339],[76.680337,9.483255],[76.68039,9.483211],[76.681114,9.482601],[76.681455,9.481851],[76.681446,9.481652],[76.681539,9.481381],[76.681651,9.481239],[76.681823,9.4811],[76.682619,9.480855],[76.683772,9.480398],[76.684174,9.480331],[76.68466,9.480224],[76.685006,9.480123],[76.685343,9.480024],[76.68566,9.479927],[76.685787,9.479869],[76.686236,9.479478],[76.686477,9.479059],[76.687263,9.478593],[76.688343,9.478051],[76.688847,9.477857],[76.690457,9.478007],[76.691693,9.477304],[76.6923,9.477113],[76.694066,9.477223],[76.695285,9.476987],[76.696892,9.477077],[76.697761,9.476791],[76.69847,9.477005],[76.698749,9.477188],[76.699327,9.477012],[76.7001,9.4766],[76.700582,9.476287],[76.700965,9.475572],[76.701184,9.47512],[76.701214,9.473737],[76.700904,9.472836],[76.700968,9.472608],[76.701073,9.472404],[76.700969,9.472322],[76.700847,9.472004],[76.700801,9.471916],[76.700804,9.471868],[76.700766,9.471806],[76.700651,9.471638],[76.700606,9.471534],[76.700514,9.471457],[76.700409,9.471313],[76.700405,9.471204],[76.700351,9.471142],[76.700263,9.471037],[76.700078,9.470809],[76.700201,9.470354],[76.700075,9.470059],[76.699876,9.469706],[76.699548,9.469318],[76.699523,9.468957],[76.699642,9.468674],[76.699835,9.468181],[76.699625,9.468038],[76.699449,9.46764],[76.699291,9.467318],[76.699093,9.467065],[76.700251,9.466874],[76.700436,9.466832],[76.700734,9.46676],[76.70084,9.466448],[76.70096,9.466256],[76.701062,9.466129],[76.701194,9.465844],[76.701299,9.465671],[76.701461,9.465537],[76.701584,9.465362],[76.701672,9.465276],[76.701742,9.465077],[76.701837,9.464929],[76.70205,9.464746],[76.702197,9.464616],[76.702333,9.464492],[76.702603,9.464096],[76.702704,9.463972],[76.702807,9.463895],[76.702841,9.463882],[76.702905,9.463862],[76.702906,9.463843],[76.702909,9.463828],[76.702926,9.463768],[76.702971,9.463725],[76.70303,9.46366],[76.703065,9.463589],[76.703077,9.463501],[76.703041,9.463457],[76.702998,9.463397],[76.702962,9.463354],[76.702915,9.463299],[76.702848,9.463248],[76.702801,9.463154],[76.702724,9.463033],[76.703119,9.462809],[76.703454,9.462171],[76.704169,9.461902],[76.704582,9.461751],[76.704791,9.461511],[76.705086,9.460878],[76.705617,9.460357],[76.708066,9.456125],[76.708125,9.455686],[76.708068,9.455529],[76.70783,9.455239],[76.707783,9.455076],[76.707857,9.454899],[76.708359,9.454384],[76.708114,9.453317],[76.708326,9.452124],[76.708466,9.451336],[76.708639,9.45036],[76.708338,9.449781],[76.708035,9.449199],[76.707506,9.448883],[76.707118,9.44865],[76.706902,9.44852],[76.706767,9.448439],[76.706186,9.448268],[76.70581,9.448158],[76.705408,9.448035],[76.70508,9.447996],[76.704849,9.44801],[76.704535,9.448028],[76.704277,9.448044],[76.704156,9.448051],[76.703883,9.448262],[76.703536,9.44853],[76.703401,9.448635],[76.702985,9.44902],[76.702702,9.449294],[76.702163,9.44985],[76.70202,9.45],[76.701765,9.450345],[76.701385,9.450839],[76.701049,9.451341],[76.700391,9.45207],[76.700238,9.452239],[76.700146,9.452348],[76.699953,9.452577],[76.699867,9.452679],[76.699803,9.452755],[76.699687,9.452863],[76.699617,9.452929],[76.699274,9.453047],[76.699266,9.453046],[76.699158,9.453104],[76.69875,9.453206],[76.698334,9.453335],[76.698067,9.453173],[76.696967,9.452505],[76.696625,9.452302],[76.696448,9.452195],[76.696193,9.452016],[76.696097,9.451949],[76.695911,9.451818],[76.695685,9.45166],[76.695531,9.451552],[76.695435,9.451512],[76.694843,9.451265],[76.694521,9.451136],[76.694402,9.451088],[76.69428,9.451111],[76.693602,9.451306],[76.692672,9.451573],[76.692383,9.451696],[76.691655,9.452006],[76.69138,9.452178],[76.69056,9.452555],[76.689917,9.452881],[76.689753,9.452964],[76.68966,9.453011],[76.689464,9.45311],[76.689198,9.453245],[76.689091,9.453299],[76.688948,9.453365],[76.6888,9.453434],[76.688647,9.453522],[76.68841,9.453517],[76.688172,9.45351],[76.688012,9.453507],[76.687781,9.453508],[76.687557,9.453503],[76.68739,9.453496],[76.687292,9.453484],[76.687097,9.453459],[76.686965,9.453443],[76.686818,9.453425],[76.686664,9.453413],[76.686543,9.4534],[76.686426,9.453387],[76.686295,9.453372],[76.686134,9.453363],[76.686004,9.453355],[76.685887,9.45335],[76.68577,9.453358],[76.685577,9.45337],[76.68538,9.453374],[76.685276,9.453377],[76.685098,9.45338],[76.684997,9.453383],[76.68489,9.453387],[76.684764,9.453392],[76.684603,9.453406],[76.684447,9.453426],[76.684288,9.453453],[76.684087,9.453482],[76.683994,9.453496],[76.683819,9.453521],[76.683632,9.453548],[76.683532,9.453528],[76.683396,9.453577],[76.683092,9.453685],[76.682649,9.453837],[76.681947,9.454079],[76.681242,9.454257],[76.68086,9.454354],[76.680619,9.454353],[76.68028,9.454351],[76.679886,9.454348],[76.679321,9.454344],[76.678211,9.453981],[76.677609,9.453784],[76.676513,9.453426],[76.676139,9.453425],[76.676041,9.453462],[76.675946,9.453497],[76.675696,9.453657],[76.675575,9.453768],[76.675479,9.453855],[76.675421,9.454003],[76.675348,9.454238],[76.675158,9.454851],[76.675097,9.455047],[76.675011,9.455201],[76.674903,9.455462],[76.674773,9.455773],[76.67463,9.455979],[76.674559,9.456044],[76.674354,9.45623],[76.674021,9.456302],[76.673793,9.45635],[76.673457,9.456422],[76.673085,9.456558],[76.67288,9.456485],[76.672648,9.456402]]]},\"properties\":{\"LSGD\":\"Anicadu\",\"Mandal\":\"Mallappally\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.534522,9.323617],[76.534205,9.323984],[76.533968,9.324054],[76.533154,9.325473],[76.532861,9.326011],[76.532769,9.326238],[76.532607,9.326759],[76.532482,9.329058],[76.532208,9.329438],[76.531884,9.329661],[76.531617,9.329687],[76.531554,9.329677],[76.531166,9.329614],[76.531104,9.329583],[76.530852,9.329455],[76.530461,9.329142],[76.530126,9.328838],[76.529945,9.328554],[76.529695,9.328141],[76.529253,9.327727],[76.528949,9.327441],[76.528657,9.32712],[76.527964,9.326472],[76.527455,9.326266],[76.526881,9.326095],[76.526152,9.326038],[76.525684,9.326107],[76.524967,9.326258],[76.524575,9.326346],[76.524092,9.326496],[76.523533,9.32664],[76.52318,9.326727],[76.522254,9.326864],[76.521095,9.326978],[76.520504,9.327011],[76.519491,9.327112],[76.518699,9.327194],[76.517833,9.327277],[76.517158,9.327297],[76.516481,9.327158],[76.515808,9.326981],[76.514972,9.326659],[76.514269,9.326382],[76.513797,9.326227],[76.512704,9.326089],[76.511721,9.32595],[76.510708,9.325756],[76.509675,9.32549],[76.508434,9.325153],[76.507222,9.324823],[76.506328,9.324635],[76.505279,9.324474],[76.504295,9.324289],[76.503813,9.324193],[76.503076,9.323893],[76.502997,9.323834],[76.501931,9.323563],[76.50142,9.323539],[76.500933,9.323603],[76.499848,9.323651],[76.497173,9.324265],[76.495341,9.325142],[76.493673,9.327137],[76.490018,9.328673],[76.489779,9.328663],[76.489678,9.328839],[76.489248,9.329584],[76.48949,9.329714],[76.489135,9.330092],[76.488991,9.330363],[76.488852,9.330548],[76.488729,9.330722],[76.488616,9.330837],[76.488561,9.330951],[76.48849,9.331149],[76.488517,9.331286],[76.4886,9.331706],[76.488679,9.332107],[76.488771,9.332571],[76.48885,9.33297],[76.488912,9.333204],[76.488957,9.333373],[76.488866,9.333613],[76.488792,9.33382],[76.488613,9.334574],[76.488608,9.334801],[76.488657,9.335083],[76.488754,9.335278],[76.488852,9.335468],[76.489054,9.335757],[76.48947,9.335614],[76.489764,9.335512],[76.490099,9.335563],[76.49031,9.335664],[76.490427,9.33572],[76.490587,9.335828],[76.490696,9.335893],[76.491124,9.336146],[76.491271,9.336158],[76.491684,9.336217],[76.492593,9.336383],[76.492683,9.336409],[76.493022,9.336536],[76.493227,9.336617],[76.493597,9.336815],[76.493753,9.336884],[76.49407,9.337096],[76.494423,9.337254],[76.494594,9.337245],[76.494788,9.337234],[76.494953,9.337225],[76.496019,9.337168],[76.496132,9.337168],[76.497464,9.337177],[76.497891,9.337163],[76.498019,9.337158],[76.498155,9.33715],[76.498711,9.337231],[76.498903,9.336953],[76.498982,9.336776],[76.499552,9.335919],[76.499583,9.335698],[76.49961,9.335504],[76.499616,9.335163],[76.499628,9.334565],[76.499636,9.334188],[76.49976,9.334105],[76.499894,9.334012],[76.499844,9.333627],[76.499829,9.333518],[76.499804,9.33332],[76.499786,9.333181],[76.499754,9.332939],[76.499721,9.332689],[76.499704,9.332556],[76.499683,9.332398],[76.499651,9.332152],[76.499612,9.332052],[76.499517,9.331808],[76.499446,9.331628],[76.499269,9.331598],[76.499151,9.331192],[76.499108,9.331046],[76.499336,9.330927],[76.499696,9.330975],[76.499823,9.330991],[76.500041,9.331031],[76.500297,9.331091],[76.500431,9.33136],[76.500472,9.331442],[76.500822,9.331461],[76.500806,9.331928],[76.500937,9.331907],[76.500982,9.331779],[76.501363,9.331757],[76.501471,9.331661],[76.501954,9.331874],[76.50209,9.331837],[76.502245,9.331794],[76.502546,9.331711],[76.502774,9.331701],[76.502858,9.331627],[76.503055,9.33146],[76.503389,9.331578],[76.503635,9.331665],[76.503731,9.3317],[76.503861,9.331726],[76.504146,9.331784],[76.504354,9.331826],[76.504617,9.331728],[76.505082,9.332015],[76.505195,9.332084],[76.505371,9.332193],[76.505487,9.332216],[76.505628,9.332245],[76.505806,9.332281],[76.506013,9.332323],[76.506161,9.332353],[76.506302,9.332381],[76.506442,9.332409],[76.506653,9.332452],[76.506804,9.332446],[76.507135,9.332434],[76.507355,9.332426],[76.507551,9.332419],[76.507901,9.332406],[76.508007,9.332393],[76.508281,9.33236],[76.508502,9.332334],[76.508759,9.332303],[76.508992,9.332275],[76.509169,9.332254],[76.509281,9.332241],[76.509459,9.33222],[76.509624,9.3322],[76.509727,9.332188],[76.509806,9.332114],[76.509876,9.33205],[76.509999,9.331936],[76.510412,9.331847],[76.510541,9.332511],[76.511106,9.332503],[76.511359,9.332499],[76.512415,9.332456],[76.5125,9.332709],[76.512556,9.332809],[76.513286,9.332831],[76.513407,9.332835],[76.513534,9.332909],[76.513708,9.333156],[76.514556,9.333051],[76.515181,9.332974],[76.515387,9.333361],[76.515632,9.333435],[76.515778,9.33348],[76.516029,9.333876],[76.516183,9.334068],[76.516961,9.334151],[76.517624,9.334221],[76.517704,9.333637],[76.518113,9.333483],[76.518706,9.333597],[76.519154,9.333683],[76.519306,9.333712],[76.520029,9.33385],[76.520141,9.333382],[76.520958,9.333362],[76.521059,9.334339],[76.521403,9.334388],[76.521494,9.334402],[76.522308,9.334571],[76.522533,9.334534],[76.52268,9.33451],[76.522749,9.334577],[76.52286,9.334575],[76.523835,9.334431],[76.523992,9.334444],[76.524112,9.334616],[76.524385,9.334619],[76.524385,9.334342],[76.524655,9.334423],[76.524868,9.334487],[76.524975,9.334519],[76.525188,9.334583],[76.525296,9.334615],[76.525403,9.334647],[76.525512,9.334679],[76.525619,9.334711],[76.525727,9.334743],[76.525938,9.334807],[76.526047,9.334839],[76.526154,9.334871],[76.526133,9.335102],[76.526217,9.335155],[76.5263,9.335208],[76.5264,9.335271],[76.526599,9.335387],[76.5267,9.335446],[76.52684,9.335527],[76.527633,9.335988],[76.528023,9.335985],[76.528186,9.335984],[76.528356,9.33627],[76.528455,9.336436],[76.528763,9.336457],[76.528891,9.336466],[76.529125,9.336482],[76.529234,9.336489],[76.529335,9.336496],[76.529503,9.336507],[76.52954,9.336683],[76.529563,9.33692],[76.529802,9.337336],[76.529911,9.337199],[76.530211,9.336833],[76.531025,9.336804],[76.531196,9.336831],[76.531312,9.336851],[76.53155,9.336892],[76.531754,9.336927],[76.531987,9.336956],[76.532179,9.337027],[76.532269,9.33706],[76.532443,9.337124],[76.53274,9.337234],[76.53282,9.337292],[76.532903,9.337351],[76.533082,9.337655],[76.53322,9.337888],[76.533225,9.338102],[76.533241,9.338823],[76.533244,9.338955],[76.533017,9.339166],[76.532615,9.339538],[76.532387,9.339639],[76.532225,9.33971],[76.531935,9.339751],[76.531666,9.33979],[76.531383,9.339836],[76.531079,9.33993],[76.530977,9.340043],[76.530829,9.340114],[76.530696,9.340166],[76.53051,9.340244],[76.529959,9.340439],[76.529613,9.340752],[76.529347,9.340992],[76.529054,9.341204],[76.528962,9.341271],[76.528883,9.341328],[76.528737,9.341434],[76.528561,9.341531],[76.528254,9.341701],[76.527943,9.341871],[76.527668,9.341707],[76.527524,9.341778],[76.527443,9.341875],[76.52718,9.342192],[76.527032,9.34237],[76.526854,9.342397],[76.52685,9.342649],[76.526135,9.342815],[76.525954,9.342857],[76.526005,9.3433],[76.526058,9.34376],[76.526609,9.344473],[76.526617,9.344737],[76.526762,9.34526],[76.526933,9.345497],[76.527039,9.345644],[76.527142,9.345788],[76.527431,9.346071],[76.527577,9.346215],[76.527752,9.346273],[76.528017,9.346156],[76.528254,9.346062],[76.528382,9.345963],[76.528522,9.345853],[76.528668,9.345734],[76.528757,9.345662],[76.528919,9.345591],[76.529037,9.34554],[76.529166,9.345525],[76.529306,9.345559],[76.529592,9.34563],[76.529682,9.346215],[76.52971,9.346411],[76.529728,9.34653],[76.529742,9.346627],[76.529834,9.346791],[76.530051,9.346784],[76.530323,9.346774],[76.530229,9.346926],[76.530161,9.347051],[76.530089,9.347186],[76.529767,9.347308],[76.529622,9.347494],[76.529555,9.347665],[76.529539,9.347773],[76.529506,9.347996],[76.529486,9.348292],[76.529492,9.348626],[76.529617,9.348878],[76.52976,9.34908],[76.529958,9.349359],[76.530227,9.349419],[76.530466,9.349507],[76.530765,9.349612],[76.531102,9.349762],[76.531507,9.350379],[76.531673,9.350488],[76.531995,9.350097],[76.532238,9.350416],[76.532366,9.350563],[76.532462,9.350792],[76.532333,9.351113],[76.532406,9.351339],[76.53248,9.351569],[76.532532,9.351728],[76.532613,9.351984],[76.532618,9.35213],[76.532625,9.352319],[76.532195,9.352259],[76.532002,9.352291],[76.531428,9.352387],[76.531373,9.352807],[76.531011,9.353101],[76.530611,9.353044],[76.530503,9.353503],[76.530424,9.353843],[76.530366,9.35412],[76.530338,9.354253],[76.530282,9.354554],[76.530243,9.35476],[76.530201,9.355031],[76.530135,9.355198],[76.530077,9.355365],[76.530013,9.355551],[76.529938,9.355787],[76.529909,9.355884],[76.529847,9.356087],[76.529794,9.356298],[76.52973,9.356549],[76.529711,9.356647],[76.529693,9.356743],[76.529626,9.356969],[76.529594,9.357079],[76.529535,9.357272],[76.529428,9.357548],[76.529319,9.357818],[76.529243,9.358005],[76.529171,9.35826],[76.529096,9.358526],[76.529061,9.358619],[76.529019,9.358725],[76.528978,9.358832],[76.528895,9.358983],[76.528741,9.359072],[76.528531,9.359193],[76.528445,9.359243],[76.528196,9.359406],[76.527911,9.359583],[76.527792,9.359658],[76.527687,9.359727],[76.527475,9.359871],[76.527192,9.360056],[76.52694,9.360181],[76.526829,9.36024],[76.526645,9.360336],[76.52648,9.360374],[76.526253,9.360427],[76.525846,9.360526],[76.525276,9.360666],[76.524881,9.360705],[76.52459,9.360999],[76.524341,9.361356],[76.524232,9.361733],[76.524428,9.362181],[76.524431,9.362707],[76.524242,9.363182],[76.5241,9.363537],[76.52393,9.363712],[76.523866,9.364405],[76.523994,9.365132],[76.524054,9.365335],[76.524124,9.365575],[76.524176,9.365919],[76.524179,9.366676],[76.524175,9.367015],[76.524054,9.367733],[76.523931,9.368073],[76.523775,9.368307],[76.523885,9.368394],[76.524241,9.368539],[76.524764,9.36875],[76.524923,9.368814],[76.525561,9.369095],[76.526079,9.369391],[76.526278,9.3694],[76.526573,9.369367],[76.526891,9.369375],[76.527203,9.369301],[76.527398,9.369197],[76.52772,9.368997],[76.528092,9.368767],[76.528458,9.368325],[76.528567,9.368206],[76.528666,9.368054],[76.528947,9.367639],[76.529125,9.367377],[76.529217,9.367198],[76.529385,9.366868],[76.529605,9.366481],[76.529911,9.365555],[76.530334,9.365007],[76.530673,9.364567],[76.531266,9.364182],[76.532051,9.3638],[76.532459,9.3637],[76.532868,9.3636],[76.533523,9.363456],[76.533691,9.363417],[76.534246,9.363303],[76.534429,9.363262],[76.534951,9.363137],[76.53584,9.362922],[76.536746,9.362461],[76.537432,9.362112],[76.537533,9.36206],[76.537773,9.361975],[76.537989,9.36182],[76.538101,9.361741],[76.538212,9.361697],[76.538455,9.3616],[76.538755,9.361481],[76.53904,9.361368],[76.539571,9.361071],[76.539852,9.360914],[76.540038,9.360881],[76.540344,9.360828],[76.540881,9.360808],[76.541172,9.360826],[76.541442,9.360844],[76.541547,9.36085],[76.541854,9.360905],[76.542051,9.36094],[76.542217,9.360987],[76.543084,9.361276],[76.543903,9.36155],[76.544914,9.361888],[76.545687,9.362146],[76.546345,9.362082],[76.547083,9.362009],[76.547923,9.361864],[76.54811,9.361796],[76.548843,9.361492],[76.548965,9.361431],[76.549163,9.361254],[76.54921,9.361157],[76.549546,9.360475],[76.54958,9.360361],[76.549602,9.360147],[76.549366,9.359433],[76.549259,9.359108],[76.549191,9.359004],[76.549076,9.358809],[76.548803,9.35847],[76.548738,9.358354],[76.548485,9.358206],[76.547891,9.357791],[76.547475,9.357634],[76.547171,9.357522],[76.546786,9.357372],[76.546701,9.3573],[76.546582,9.357275],[76.546387,9.357105],[76.546202,9.356875],[76.546122,9.356801],[76.546076,9.356634],[76.546055,9.356388],[76.546029,9.356248],[76.546123,9.355897],[76.546166,9.355735],[76.546406,9.355305],[76.546714,9.35482],[76.546822,9.354657],[76.547061,9.354405],[76.547389,9.354045],[76.547666,9.35376],[76.54794,9.353477],[76.548719,9.352611],[76.548802,9.352515],[76.549126,9.352063],[76.549404,9.351732],[76.549568,9.351486],[76.550134,9.350908],[76.550263,9.350802],[76.550593,9.350531],[76.550702,9.350449],[76.55072,9.350342],[76.551135,9.349239],[76.551194,9.349103],[76.551711,9.34822],[76.551991,9.347676],[76.552562,9.347021],[76.553719,9.346411],[76.554566,9.345895],[76.555706,9.345569],[76.557678,9.345006],[76.557881,9.344541],[76.558077,9.34389],[76.558138,9.34357],[76.558085,9.343238],[76.557958,9.342983],[76.557873,9.342711],[76.557852,9.342621],[76.557811,9.342481],[76.557758,9.342366],[76.557574,9.342222],[76.557428,9.342106],[76.557375,9.342065],[76.557308,9.342003],[76.557189,9.342007],[76.557084,9.342014],[76.556978,9.341975],[76.556891,9.341927],[76.55684,9.341826],[76.556774,9.34176],[76.556709,9.341694],[76.556656,9.341646],[76.556574,9.341565],[76.556509,9.341435],[76.556476,9.34137],[76.55644,9.3413],[76.556378,9.341246],[76.556353,9.341225],[76.556321,9.341199],[76.556289,9.341171],[76.556256,9.341145],[76.556229,9.341121],[76.556196,9.341092],[76.55616,9.341063],[76.556129,9.341056],[76.556081,9.341045],[76.556031,9.341035],[76.555984,9.340987],[76.555907,9.34091],[76.555904,9.340906],[76.555849,9.340871],[76.555799,9.34084],[76.555798,9.340915],[76.555675,9.340952],[76.55565,9.340855],[76.555637,9.340756],[76.555628,9.340654],[76.555622,9.340592],[76.555617,9.340472],[76.55561,9.340325],[76.555593,9.340216],[76.555607,9.340162],[76.555608,9.340156],[76.555613,9.340133],[76.555617,9.340118],[76.555636,9.340063],[76.555637,9.34006],[76.555656,9.339962],[76.556742,9.339701],[76.556861,9.339601],[76.55697,9.339358],[76.556905,9.339111],[76.556926,9.338768],[76.556922,9.338372],[76.556766,9.338014],[76.556599,9.33765],[76.55637,9.337229],[76.556095,9.33682],[76.555724,9.336373],[76.555414,9.336046],[76.555116,9.33577],[76.554792,9.335664],[76.554278,9.335562],[76.553836,9.335314],[76.553552,9.33498],[76.553569,9.334272],[76.553624,9.33358],[76.553797,9.332539],[76.554108,9.331535],[76.553478,9.329366],[76.552706,9.327195],[76.552077,9.325888],[76.551391,9.325009],[76.550225,9.324566],[76.549282,9.324502],[76.548194,9.324814],[76.54643,9.325469],[76.546161,9.3254],[76.545951,9.325281],[76.545501,9.325023],[76.545224,9.324808],[76.544781,9.32443],[76.544336,9.324045],[76.544211,9.323922],[76.544044,9.323775],[76.543791,9.323651],[76.543559,9.323532],[76.543317,9.323406],[76.543102,9.323307],[76.542677,9.323098],[76.542343,9.322919],[76.542027,9.322763],[76.54154,9.322611],[76.541218,9.322479],[76.540943,9.322385],[76.540495,9.322312],[76.540389,9.322298],[76.539395,9.32213],[76.53804,9.322096],[76.536721,9.322123],[76.535701,9.32251],[76.534905,9.323038],[76.534522,9.323617]]]},\"properties\":{\"LSGD\":\"Kadapra\",\"Mandal\":\"Thiruvalla\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.637727,9.399174],[76.637761,9.398629],[76.637785,9.398239],[76.63781,9.39784],[76.637837,9.397396],[76.637883,9.397008],[76.637952,9.396636],[76.63821,9.396409],[76.63834,9.396296],[76.638516,9.396198],[76.638646,9.396126],[76.638826,9.396023],[76.63907,9.395874],[76.639365,9.395695],[76.640058,9.395449],[76.64041,9.395318],[76.640763,9.395187],[76.640883,9.395155],[76.641047,9.395081],[76.641164,9.395046],[76.641628,9.394778],[76.641888,9.394572],[76.642156,9.394359],[76.642355,9.394202],[76.642604,9.394005],[76.642733,9.393825],[76.642821,9.3937],[76.643013,9.393431],[76.643191,9.393088],[76.643371,9.392741],[76.643507,9.39236],[76.643558,9.392216],[76.64349,9.391985],[76.643443,9.391756],[76.643411,9.391632],[76.643235,9.390868],[76.643,9.389889],[76.642761,9.389631],[76.642456,9.389302],[76.642299,9.389235],[76.64193,9.389079],[76.641758,9.389094],[76.641384,9.389128],[76.64103,9.38921],[76.640825,9.389258],[76.638836,9.389696],[76.638249,9.389755],[76.636722,9.38997],[76.635885,9.389973],[76.635527,9.389935],[76.635152,9.389873],[76.634745,9.389807],[76.634303,9.389757],[76.633945,9.389763],[76.633546,9.389772],[76.632876,9.389892],[76.632654,9.390042],[76.632475,9.390163],[76.632203,9.390359],[76.631973,9.390505],[76.631892,9.390557],[76.631798,9.39072],[76.631131,9.391692],[76.63055,9.392538],[76.630415,9.392742],[76.630311,9.392889],[76.630132,9.393137],[76.62999,9.393333],[76.629538,9.39393],[76.629498,9.393946],[76.629297,9.393991],[76.629116,9.393984],[76.628935,9.393965],[76.628766,9.393914],[76.628589,9.393827],[76.628267,9.393663],[76.628068,9.393492],[76.627836,9.393293],[76.627705,9.393678],[76.627659,9.393813],[76.627565,9.394124],[76.6275,9.394337],[76.62748,9.394434],[76.627382,9.394912],[76.627272,9.395449],[76.627227,9.39567],[76.626904,9.395794],[76.626653,9.396017],[76.626567,9.396311],[76.626453,9.396422],[76.626395,9.396572],[76.626363,9.396659],[76.626206,9.396975],[76.626068,9.397253],[76.625982,9.397402],[76.625864,9.397605],[76.62577,9.397776],[76.625654,9.397978],[76.625598,9.398074],[76.625366,9.398371],[76.625252,9.398517],[76.625336,9.39872],[76.62545,9.398877],[76.625619,9.399041],[76.625776,9.399243],[76.625959,9.399428],[76.626177,9.399567],[76.626288,9.399637],[76.626369,9.399688],[76.626578,9.399514],[76.626694,9.399417],[76.62686,9.399284],[76.626948,9.399209],[76.627074,9.399141],[76.627292,9.399024],[76.627422,9.399012],[76.627545,9.399056],[76.627661,9.399035],[76.627794,9.399009],[76.627976,9.399128],[76.628093,9.399394],[76.628129,9.399546],[76.628113,9.399671],[76.628149,9.399935],[76.628239,9.400052],[76.62836,9.400211],[76.628494,9.400385],[76.62842,9.400549],[76.628337,9.400736],[76.628258,9.400907],[76.628162,9.401119],[76.628113,9.401226],[76.628035,9.401396],[76.627981,9.401658],[76.62796,9.401757],[76.627893,9.402113],[76.627871,9.40223],[76.627859,9.402347],[76.627761,9.402526],[76.627693,9.402728],[76.627652,9.402852],[76.627662,9.403013],[76.627671,9.40315],[76.627688,9.403504],[76.627698,9.40385],[76.62768,9.404092],[76.627671,9.404292],[76.627672,9.404414],[76.627673,9.40455],[76.627717,9.404811],[76.627742,9.404956],[76.627769,9.405098],[76.627791,9.405262],[76.627815,9.405446],[76.627861,9.405788],[76.627918,9.406147],[76.627936,9.406264],[76.627983,9.406619],[76.627982,9.406791],[76.627981,9.406914],[76.628035,9.407179],[76.628074,9.40737],[76.628122,9.407681],[76.628134,9.408015],[76.628112,9.40829],[76.6281,9.408415],[76.628079,9.408582],[76.62804,9.408861],[76.627977,9.409097],[76.627956,9.409205],[76.627931,9.409292],[76.627907,9.409412],[76.627886,9.409512],[76.627965,9.409728],[76.628083,9.409917],[76.628144,9.410073],[76.628205,9.41028],[76.62831,9.410589],[76.628349,9.410762],[76.62843,9.411111],[76.628464,9.411224],[76.628512,9.411448],[76.628573,9.411675],[76.628604,9.411879],[76.628623,9.412132],[76.628635,9.412255],[76.62865,9.412373],[76.628671,9.412547],[76.628697,9.412732],[76.628728,9.412909],[76.628781,9.413087],[76.628831,9.413258],[76.628897,9.413526],[76.628945,9.41376],[76.628981,9.413945],[76.629019,9.414152],[76.629054,9.414344],[76.628949,9.414505],[76.628826,9.414644],[76.628746,9.414734],[76.628549,9.414931],[76.628322,9.415142],[76.628208,9.415273],[76.628165,9.41551],[76.628136,9.415667],[76.628123,9.41589],[76.628059,9.416143],[76.627931,9.416137],[76.627825,9.416132],[76.627609,9.416016],[76.627376,9.415891],[76.627121,9.415753],[76.627074,9.415894],[76.627001,9.416205],[76.626944,9.416608],[76.62693,9.416744],[76.6269,9.417042],[76.62689,9.417146],[76.626873,9.417345],[76.626855,9.417548],[76.626838,9.417891],[76.626834,9.417987],[76.626829,9.418121],[76.626823,9.418318],[76.626805,9.418534],[76.626799,9.418631],[76.626778,9.418724],[76.626755,9.418832],[76.626729,9.418934],[76.626677,9.419139],[76.626634,9.419321],[76.626607,9.419437],[76.626546,9.419712],[76.626531,9.419898],[76.626511,9.420163],[76.626512,9.420387],[76.626522,9.420585],[76.626529,9.420702],[76.626537,9.420867],[76.626549,9.420974],[76.626565,9.421127],[76.626587,9.421348],[76.62662,9.421444],[76.626657,9.421556],[76.626704,9.421697],[76.6268,9.421822],[76.626934,9.421967],[76.626914,9.422177],[76.626895,9.422377],[76.626892,9.422505],[76.62689,9.422636],[76.626898,9.422836],[76.626903,9.422959],[76.626878,9.423145],[76.626853,9.423264],[76.626825,9.423402],[76.626819,9.423694],[76.626896,9.424078],[76.626916,9.42435],[76.626914,9.424512],[76.626943,9.424633],[76.626963,9.424728],[76.627005,9.424927],[76.627026,9.42503],[76.627095,9.425363],[76.627112,9.42553],[76.62708,9.425815],[76.627051,9.426081],[76.627187,9.426451],[76.627246,9.42668],[76.627293,9.426862],[76.627317,9.427046],[76.62734,9.427219],[76.627345,9.427567],[76.627371,9.427787],[76.627451,9.428083],[76.627522,9.428241],[76.627628,9.428474],[76.627811,9.428762],[76.627883,9.428875],[76.627983,9.429017],[76.628158,9.429327],[76.628405,9.429933],[76.628586,9.430381],[76.628654,9.430548],[76.628688,9.430758],[76.628714,9.430915],[76.628731,9.431036],[76.628739,9.431214],[76.628744,9.43138],[76.628687,9.431616],[76.628632,9.431838],[76.628598,9.431979],[76.628569,9.432096],[76.628527,9.43227],[76.628421,9.432688],[76.628452,9.432872],[76.62863,9.432896],[76.628891,9.432932],[76.628875,9.433025],[76.62883,9.433298],[76.628746,9.433506],[76.628662,9.433715],[76.62861,9.433893],[76.62858,9.433997],[76.628627,9.434146],[76.628783,9.434699],[76.629182,9.434894],[76.629331,9.434966],[76.629444,9.435039],[76.629507,9.435184],[76.629571,9.435444],[76.629617,9.435627],[76.629689,9.43592],[76.629324,9.436286],[76.629245,9.436519],[76.629282,9.436787],[76.629389,9.436872],[76.629465,9.436933],[76.629622,9.437057],[76.629796,9.437143],[76.630103,9.437287],[76.630275,9.437368],[76.630429,9.43744],[76.630705,9.437549],[76.630893,9.437749],[76.631004,9.437906],[76.631089,9.438027],[76.631117,9.438274],[76.631146,9.438394],[76.631212,9.438673],[76.63132,9.439116],[76.631495,9.439458],[76.631607,9.439595],[76.631708,9.439718],[76.631536,9.439855],[76.631253,9.440039],[76.630962,9.440213],[76.630795,9.440328],[76.630649,9.44043],[76.630461,9.440588],[76.630375,9.440689],[76.630124,9.440984],[76.629979,9.441176],[76.629747,9.441482],[76.629514,9.441604],[76.62927,9.441775],[76.629071,9.441949],[76.628806,9.442183],[76.628582,9.442286],[76.628419,9.442362],[76.628238,9.442595],[76.628058,9.442963],[76.627964,9.443157],[76.627943,9.443452],[76.627942,9.443724],[76.627941,9.44383],[76.627941,9.443928],[76.62811,9.444083],[76.628138,9.44425],[76.628328,9.444283],[76.628666,9.444285],[76.62936,9.444288],[76.629576,9.444293],[76.629812,9.444298],[76.629939,9.444047],[76.630134,9.443957],[76.630323,9.44387],[76.630523,9.443715],[76.630608,9.443591],[76.630733,9.443475],[76.630826,9.443373],[76.630926,9.443281],[76.631158,9.443027],[76.631277,9.442905],[76.631398,9.442781],[76.632214,9.442415],[76.632579,9.442245],[76.633181,9.442205],[76.633352,9.442193],[76.633468,9.442203],[76.633673,9.442414],[76.633774,9.442557],[76.633833,9.442644],[76.633931,9.442924],[76.633999,9.443122],[76.634077,9.443242],[76.634202,9.443437],[76.634368,9.443408],[76.634585,9.443347],[76.634797,9.443305],[76.635529,9.443079],[76.635885,9.442969],[76.636021,9.442908],[76.636283,9.442789],[76.636582,9.442653],[76.636713,9.442925],[76.637049,9.44298],[76.637096,9.44287],[76.637202,9.442637],[76.637339,9.442328],[76.637346,9.442176],[76.637565,9.442069],[76.637737,9.442102],[76.637844,9.442123],[76.637884,9.442513],[76.638057,9.442707],[76.638188,9.44291],[76.638357,9.443027],[76.638433,9.443146],[76.638571,9.443365],[76.638706,9.443459],[76.638841,9.443552],[76.638892,9.443654],[76.638916,9.44379],[76.638969,9.443904],[76.639166,9.443829],[76.639305,9.44409],[76.639448,9.444223],[76.639606,9.444371],[76.639658,9.444596],[76.639835,9.444961],[76.640085,9.445165],[76.640241,9.445231],[76.640336,9.44527],[76.640461,9.445324],[76.640767,9.445375],[76.64096,9.445443],[76.64105,9.445422],[76.641271,9.445371],[76.641497,9.445318],[76.641664,9.44519],[76.64184,9.445055],[76.641977,9.44495],[76.642196,9.444797],[76.642406,9.44479],[76.642582,9.444783],[76.642784,9.444711],[76.643018,9.444628],[76.64316,9.444598],[76.64361,9.444352],[76.64372,9.444293],[76.643889,9.444191],[76.644231,9.444177],[76.64436,9.444134],[76.64441,9.444006],[76.644511,9.443983],[76.644885,9.443897],[76.645019,9.443587],[76.645206,9.443203],[76.645598,9.442803],[76.645718,9.442573],[76.645805,9.442404],[76.645856,9.442266],[76.646017,9.442191],[76.646124,9.44214],[76.646313,9.441945],[76.646356,9.441594],[76.64644,9.441435],[76.646501,9.44132],[76.646586,9.441159],[76.646685,9.440978],[76.646888,9.440886],[76.647067,9.440939],[76.647237,9.441046],[76.647337,9.441156],[76.647452,9.441283],[76.647557,9.441394],[76.64779,9.441274],[76.648068,9.441179],[76.648201,9.441105],[76.648326,9.441032],[76.648292,9.440899],[76.648224,9.440747],[76.648151,9.440538],[76.648109,9.44041],[76.648015,9.440174],[76.647942,9.440041],[76.647801,9.439838],[76.647744,9.439691],[76.647756,9.439531],[76.647768,9.439374],[76.648027,9.439411],[76.648264,9.439453],[76.648539,9.439318],[76.64857,9.439177],[76.648632,9.439016],[76.648694,9.438859],[76.648832,9.438967],[76.649258,9.439023],[76.649374,9.439039],[76.649606,9.439197],[76.64974,9.439248],[76.649844,9.439136],[76.650059,9.438904],[76.650233,9.438681],[76.650375,9.4385],[76.650454,9.438401],[76.650547,9.438295],[76.650593,9.438197],[76.650716,9.437967],[76.650741,9.437629],[76.650768,9.437314],[76.650853,9.437046],[76.650907,9.436935],[76.650981,9.436778],[76.65114,9.43647],[76.651266,9.436132],[76.651327,9.436058],[76.65139,9.43598],[76.651415,9.435808],[76.651439,9.435647],[76.651467,9.435438],[76.651511,9.435123],[76.651735,9.435102],[76.651961,9.435081],[76.652272,9.435128],[76.65241,9.434932],[76.652508,9.434967],[76.652624,9.434659],[76.652723,9.434679],[76.652796,9.43454],[76.652797,9.434446],[76.6528,9.434136],[76.653158,9.434236],[76.653332,9.434284],[76.653721,9.434393],[76.65434,9.434399],[76.654494,9.4344],[76.654632,9.434394],[76.654867,9.434383],[76.654925,9.434128],[76.654985,9.433867],[76.654945,9.43378],[76.655042,9.433614],[76.655025,9.433485],[76.655018,9.433169],[76.655053,9.433058],[76.655092,9.432932],[76.655146,9.432751],[76.655199,9.432633],[76.655035,9.432528],[76.655047,9.432318],[76.655084,9.432103],[76.655117,9.431908],[76.655257,9.431776],[76.655562,9.431486],[76.655681,9.431372],[76.655821,9.43124],[76.655987,9.431309],[76.656513,9.431527],[76.656629,9.43141],[76.656796,9.43124],[76.65693,9.431102],[76.657034,9.430946],[76.657064,9.430845],[76.657092,9.430753],[76.657097,9.430659],[76.657106,9.430496],[76.657116,9.430313],[76.657273,9.430274],[76.65751,9.430214],[76.657926,9.430078],[76.657996,9.430218],[76.658304,9.430209],[76.658496,9.430203],[76.658597,9.430095],[76.658531,9.429933],[76.658466,9.429778],[76.658425,9.429677],[76.658361,9.429525],[76.658285,9.429222],[76.658492,9.429185],[76.658619,9.429224],[76.658812,9.429159],[76.658941,9.429216],[76.659058,9.429183],[76.659174,9.42915],[76.659298,9.42913],[76.659421,9.42911],[76.659486,9.429039],[76.6596,9.428914],[76.659829,9.428699],[76.659919,9.42868],[76.66005,9.428609],[76.660175,9.428541],[76.660418,9.42841],[76.66062,9.428454],[76.660666,9.428223],[76.660625,9.428112],[76.660797,9.428028],[76.660923,9.42794],[76.661002,9.427886],[76.661161,9.427777],[76.661259,9.427708],[76.661356,9.427642],[76.661467,9.427565],[76.661583,9.427642],[76.661753,9.427754],[76.66188,9.427706],[76.661984,9.427667],[76.662101,9.427596],[76.662272,9.427491],[76.662496,9.427386],[76.662724,9.427279],[76.662868,9.427183],[76.662857,9.42703],[76.662842,9.426801],[76.662827,9.426499],[76.662829,9.426278],[76.662831,9.42613],[76.662852,9.425809],[76.662865,9.425581],[76.662987,9.425161],[76.663128,9.424797],[76.663341,9.424586],[76.663465,9.424479],[76.663706,9.424291],[76.664082,9.424231],[76.664206,9.424211],[76.664491,9.424165],[76.664769,9.424136],[76.664885,9.424124],[76.664993,9.424091],[76.665145,9.424099],[76.665461,9.424116],[76.665602,9.424062],[76.665818,9.42411],[76.666069,9.424167],[76.666316,9.424108],[76.666624,9.424034],[76.667,9.424035],[76.66719,9.424003],[76.667318,9.423993],[76.667564,9.42391],[76.667906,9.423628],[76.668087,9.423297],[76.668148,9.423184],[76.668274,9.422955],[76.668382,9.422758],[76.668519,9.422466],[76.668708,9.422065],[76.668798,9.421872],[76.668864,9.421704],[76.66895,9.421487],[76.668985,9.421236],[76.669019,9.420985],[76.669032,9.420891],[76.669032,9.420282],[76.669033,9.420084],[76.669041,9.419793],[76.66905,9.419512],[76.669013,9.419263],[76.668973,9.418989],[76.668859,9.418682],[76.668825,9.418591],[76.668477,9.418303],[76.668313,9.418245],[76.668207,9.418232],[76.667746,9.418234],[76.666973,9.41834],[76.666569,9.418395],[76.665798,9.418519],[76.665707,9.418517],[76.665192,9.418509],[76.665003,9.418511],[76.664875,9.418474],[76.664515,9.418385],[76.664277,9.418311],[76.663902,9.418117],[76.663544,9.417903],[76.663138,9.417604],[76.663131,9.417482],[76.663123,9.417353],[76.663111,9.417146],[76.663123,9.416859],[76.663131,9.416539],[76.663127,9.416308],[76.663127,9.416212],[76.66308,9.415748],[76.663038,9.415331],[76.663052,9.414897],[76.663063,9.414574],[76.663105,9.413909],[76.663115,9.413643],[76.663125,9.41334],[76.663106,9.413037],[76.663082,9.412722],[76.66301,9.412413],[76.66287,9.411815],[76.662633,9.41151],[76.662387,9.411194],[76.662247,9.411135],[76.66187,9.410749],[76.661668,9.410542],[76.6616,9.410472],[76.661408,9.410306],[76.661174,9.410083],[76.661009,9.409926],[76.660939,9.409851],[76.660691,9.409566],[76.660536,9.409387],[76.660432,9.40929],[76.660279,9.40901],[76.660091,9.408522],[76.65998,9.408235],[76.659824,9.407829],[76.659889,9.407684],[76.659951,9.407548],[76.660027,9.407191],[76.659983,9.407087],[76.660119,9.406705],[76.660375,9.406365],[76.660422,9.406266],[76.660409,9.406146],[76.660813,9.405609],[76.661161,9.4052],[76.661227,9.405095],[76.661794,9.404572],[76.662013,9.404274],[76.662126,9.403787],[76.662107,9.40363],[76.662087,9.403466],[76.661914,9.403343],[76.661741,9.403219],[76.661323,9.403197],[76.661194,9.40317],[76.660824,9.403091],[76.660634,9.403055],[76.660483,9.403011],[76.660304,9.402958],[76.660158,9.402903],[76.659791,9.402755],[76.659414,9.40259],[76.659303,9.402534],[76.65894,9.402118],[76.658721,9.401855],[76.658562,9.401512],[76.658444,9.401313],[76.658286,9.401044],[76.658276,9.400945],[76.658117,9.400615],[76.658102,9.400436],[76.657953,9.399985],[76.657832,9.399621],[76.657847,9.399423],[76.657729,9.399133],[76.657579,9.398764],[76.657465,9.398439],[76.657366,9.398161],[76.657312,9.398069],[76.657238,9.397898],[76.657133,9.397714],[76.657014,9.397505],[76.656965,9.39742],[76.656799,9.397322],[76.656638,9.397226],[76.656527,9.397161],[76.656091,9.397233],[76.655889,9.397361],[76.655681,9.397509],[76.655487,9.397638],[76.655338,9.397823],[76.655074,9.398056],[76.655,9.398282],[76.654925,9.398507],[76.655045,9.398878],[76.655158,9.399231],[76.655209,9.399325],[76.655527,9.399919],[76.655757,9.400418],[76.65577,9.40092],[76.655791,9.401012],[76.655646,9.401324],[76.654955,9.401585],[76.654451,9.401877],[76.653941,9.402075],[76.653847,9.402179],[76.653249,9.402299],[76.653137,9.402321],[76.652741,9.402471],[76.652524,9.402525],[76.652201,9.402606],[76.651995,9.40262],[76.651846,9.402631],[76.651727,9.402653],[76.651426,9.402748],[76.651098,9.402921],[76.650915,9.403018],[76.650546,9.403254],[76.650406,9.4034],[76.650229,9.403586],[76.650102,9.403743],[76.649797,9.404129],[76.649662,9.404295],[76.649424,9.404604],[76.649316,9.404736],[76.648914,9.405165],[76.648827,9.405258],[76.648578,9.405457],[76.648426,9.405579],[76.648313,9.405668],[76.648216,9.405746],[76.648111,9.405767],[76.647934,9.405801],[76.647651,9.405878],[76.647335,9.405822],[76.647198,9.405799],[76.647095,9.405772],[76.646854,9.405713],[76.646615,9.405655],[76.646449,9.405509],[76.646289,9.405429],[76.645923,9.405094],[76.645762,9.404946],[76.645654,9.404832],[76.64521,9.404264],[76.644924,9.4039],[76.644546,9.403662],[76.644399,9.40357],[76.644279,9.403397],[76.643979,9.403149],[76.643632,9.402862],[76.64342,9.402697],[76.643331,9.402624],[76.642833,9.402272],[76.642233,9.401846],[76.642078,9.401789],[76.64163,9.401504],[76.64146,9.401489],[76.641069,9.401345],[76.640797,9.401245],[76.640398,9.401069],[76.640194,9.401057],[76.639885,9.400991],[76.63942,9.400921],[76.639244,9.400895],[76.63888,9.400798],[76.638335,9.400608],[76.638163,9.400547],[76.638064,9.400504],[76.637844,9.400166],[76.637715,9.399956],[76.637702,9.399719],[76.637727,9.399174]]]},\"properties\":{\"LSGD\":\"Kallooppara\",\"Mandal\":\"Mallappally\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.608119,9.382665],[76.607967,9.382732],[76.607651,9.382846],[76.607513,9.382895],[76.607407,9.382932],[76.60725,9.383014],[76.606747,9.383271],[76.606099,9.383773],[76.605532,9.384095],[76.605353,9.384187],[76.604467,9.384645],[76.603815,9.3847],[76.603107,9.384556],[76.602955,9.384241],[76.602801,9.383926],[76.602728,9.383774],[76.602441,9.384009],[76.602289,9.384134],[76.60215,9.384161],[76.601937,9.38431],[76.601808,9.384502],[76.601747,9.384581],[76.601675,9.384672],[76.60155,9.384815],[76.601385,9.385027],[76.601274,9.385277],[76.601155,9.385433],[76.601066,9.38555],[76.600981,9.385659],[76.601039,9.385771],[76.601102,9.385894],[76.601145,9.385977],[76.601127,9.386069],[76.601084,9.386282],[76.601063,9.386382],[76.600969,9.386656],[76.600865,9.386959],[76.600831,9.387083],[76.600742,9.387406],[76.60066,9.387703],[76.600625,9.387824],[76.600424,9.388174],[76.600406,9.388329],[76.600384,9.388534],[76.59984,9.388831],[76.599601,9.389014],[76.599167,9.389345],[76.598951,9.389588],[76.598708,9.389739],[76.59852,9.389924],[76.598341,9.390067],[76.597932,9.390393],[76.597523,9.390741],[76.59746,9.390822],[76.597208,9.391061],[76.597006,9.391251],[76.597156,9.391445],[76.59723,9.391541],[76.597383,9.391806],[76.597466,9.391949],[76.59741,9.392256],[76.597385,9.392612],[76.597376,9.392747],[76.597384,9.392926],[76.597404,9.393125],[76.597435,9.393441],[76.597485,9.393545],[76.597517,9.393959],[76.59763,9.394329],[76.597672,9.394441],[76.597738,9.394996],[76.597765,9.395674],[76.597834,9.39606],[76.597807,9.396465],[76.597851,9.396591],[76.59781,9.396834],[76.597789,9.396975],[76.597772,9.397088],[76.597743,9.397288],[76.597707,9.397532],[76.597663,9.397829],[76.597648,9.398244],[76.597633,9.39867],[76.597569,9.39894],[76.597494,9.399253],[76.597525,9.399529],[76.597543,9.399685],[76.597563,9.400172],[76.597445,9.400408],[76.597397,9.400503],[76.597318,9.400647],[76.597139,9.400904],[76.597037,9.401046],[76.596973,9.401132],[76.596845,9.401321],[76.596761,9.401445],[76.596476,9.402042],[76.596441,9.402332],[76.596403,9.402643],[76.596371,9.403083],[76.596356,9.403223],[76.596268,9.404032],[76.596278,9.404132],[76.596289,9.404237],[76.59632,9.404554],[76.596373,9.405084],[76.596385,9.405203],[76.596422,9.405425],[76.596492,9.405848],[76.596545,9.406169],[76.598047,9.406292],[76.598318,9.406467],[76.598622,9.406634],[76.598867,9.406772],[76.599132,9.406889],[76.599672,9.407088],[76.600027,9.407219],[76.600236,9.407259],[76.600398,9.40737],[76.600496,9.407421],[76.600685,9.407527],[76.600817,9.407614],[76.600945,9.407698],[76.60103,9.407753],[76.601205,9.407818],[76.601339,9.407868],[76.601695,9.407999],[76.601881,9.408084],[76.602015,9.408145],[76.602214,9.408196],[76.602425,9.408191],[76.602537,9.408195],[76.602669,9.408199],[76.602776,9.408202],[76.603051,9.40817],[76.603187,9.408155],[76.603355,9.408109],[76.603736,9.40804],[76.603956,9.408007],[76.60421,9.408036],[76.604364,9.408098],[76.604493,9.408102],[76.604578,9.408233],[76.604862,9.408227],[76.605047,9.408266],[76.605226,9.408281],[76.60536,9.408281],[76.605464,9.408385],[76.605529,9.408479],[76.605606,9.408589],[76.605749,9.40888],[76.605796,9.408975],[76.605846,9.409106],[76.60588,9.409197],[76.605945,9.409275],[76.606046,9.409395],[76.606105,9.409495],[76.606154,9.409577],[76.606199,9.409692],[76.606247,9.409813],[76.606283,9.409905],[76.606321,9.410075],[76.606346,9.410187],[76.606429,9.410281],[76.606508,9.410369],[76.606602,9.410473],[76.606839,9.410503],[76.606969,9.410546],[76.607123,9.410597],[76.607202,9.410782],[76.607125,9.410904],[76.607025,9.411062],[76.607054,9.411311],[76.607081,9.411544],[76.607195,9.411732],[76.607262,9.411843],[76.607316,9.411967],[76.607366,9.412121],[76.607398,9.41222],[76.607452,9.412388],[76.607507,9.412558],[76.607544,9.412672],[76.60776,9.41262],[76.607791,9.412877],[76.607917,9.413143],[76.607969,9.413254],[76.60813,9.413224],[76.608303,9.413206],[76.608468,9.413188],[76.608643,9.413169],[76.608723,9.413371],[76.608792,9.413545],[76.608954,9.413731],[76.609086,9.413881],[76.609205,9.413857],[76.609294,9.413888],[76.609422,9.413932],[76.609564,9.414215],[76.609713,9.414513],[76.609831,9.41475],[76.60995,9.414932],[76.610072,9.415118],[76.61013,9.415252],[76.610182,9.415371],[76.610225,9.415455],[76.610301,9.415719],[76.610347,9.415877],[76.610392,9.416031],[76.610545,9.416172],[76.610556,9.416357],[76.610393,9.416622],[76.610364,9.416729],[76.610331,9.416834],[76.610277,9.417007],[76.610287,9.417199],[76.610297,9.4174],[76.610305,9.417534],[76.610314,9.417738],[76.610321,9.417903],[76.610279,9.418165],[76.610263,9.418321],[76.610229,9.418505],[76.610195,9.418693],[76.610132,9.41876],[76.610091,9.41887],[76.61004,9.419006],[76.609977,9.419385],[76.60993,9.41947],[76.609882,9.419556],[76.609784,9.419727],[76.609609,9.419753],[76.609476,9.419927],[76.609454,9.420091],[76.609418,9.420363],[76.609368,9.420728],[76.609332,9.420999],[76.609316,9.421094],[76.609294,9.421232],[76.609252,9.421487],[76.609145,9.422056],[76.608977,9.422525],[76.608862,9.422843],[76.608576,9.422794],[76.608473,9.422872],[76.608424,9.423147],[76.608407,9.423244],[76.608446,9.423579],[76.608521,9.42378],[76.608645,9.424111],[76.608621,9.424279],[76.608508,9.424409],[76.608444,9.424529],[76.608331,9.42474],[76.608168,9.424871],[76.608052,9.424965],[76.607953,9.425092],[76.607868,9.425202],[76.607811,9.425308],[76.607515,9.425411],[76.607222,9.425502],[76.607038,9.425532],[76.60686,9.425664],[76.606602,9.425798],[76.606497,9.425852],[76.606371,9.425918],[76.606217,9.425998],[76.606067,9.426075],[76.60596,9.426131],[76.605868,9.426135],[76.60574,9.42614],[76.605572,9.426147],[76.605366,9.42608],[76.605213,9.426018],[76.605055,9.425955],[76.604943,9.425923],[76.604735,9.425903],[76.604593,9.42586],[76.604504,9.425839],[76.604222,9.425773],[76.604104,9.425744],[76.604012,9.425633],[76.60385,9.42562],[76.603665,9.425757],[76.603544,9.425905],[76.603385,9.426092],[76.603269,9.426228],[76.603171,9.426343],[76.603349,9.426462],[76.60339,9.426651],[76.603531,9.426815],[76.603689,9.426928],[76.60378,9.426993],[76.60397,9.427161],[76.604049,9.427231],[76.604149,9.427358],[76.604212,9.427438],[76.60432,9.427487],[76.604454,9.427548],[76.604596,9.427613],[76.604684,9.427652],[76.604787,9.427699],[76.60493,9.427764],[76.605009,9.427839],[76.605141,9.427963],[76.605216,9.428046],[76.605356,9.42818],[76.605507,9.428506],[76.605548,9.428642],[76.605678,9.428833],[76.605778,9.428961],[76.605864,9.429207],[76.605967,9.429544],[76.606078,9.429834],[76.606183,9.429967],[76.606281,9.430091],[76.606414,9.430259],[76.606468,9.430395],[76.606563,9.430511],[76.606672,9.430764],[76.606738,9.431011],[76.606805,9.431225],[76.606835,9.43132],[76.607043,9.43162],[76.607255,9.431926],[76.60732,9.432027],[76.607483,9.432282],[76.60773,9.43244],[76.607946,9.432789],[76.608156,9.432858],[76.608396,9.4332],[76.608505,9.43333],[76.608585,9.433409],[76.608422,9.433652],[76.608635,9.433895],[76.608729,9.434002],[76.609084,9.433948],[76.609454,9.433891],[76.609649,9.433781],[76.610094,9.433528],[76.610257,9.433435],[76.610474,9.433369],[76.610705,9.433334],[76.610923,9.433268],[76.611045,9.433221],[76.611133,9.433187],[76.611258,9.433129],[76.61137,9.433076],[76.611508,9.43301],[76.611713,9.432905],[76.612219,9.432643],[76.612665,9.432261],[76.612896,9.432139],[76.613189,9.431925],[76.61324,9.43178],[76.613622,9.431497],[76.613855,9.431446],[76.614081,9.431348],[76.614324,9.431237],[76.614548,9.431147],[76.61466,9.431083],[76.614781,9.431008],[76.615068,9.430772],[76.615448,9.430479],[76.61571,9.43027],[76.616056,9.430004],[76.616179,9.429909],[76.616301,9.429814],[76.616608,9.429573],[76.616836,9.429394],[76.616928,9.429305],[76.617055,9.429242],[76.617198,9.429198],[76.617369,9.429088],[76.617601,9.428939],[76.618035,9.428856],[76.618142,9.428883],[76.618336,9.428836],[76.61869,9.428687],[76.618795,9.428718],[76.619004,9.428661],[76.619181,9.428613],[76.619409,9.428498],[76.619553,9.428475],[76.62006,9.428398],[76.620446,9.428723],[76.62068,9.428861],[76.620901,9.428992],[76.620989,9.429044],[76.621165,9.429197],[76.621389,9.429318],[76.621753,9.429039],[76.621865,9.428932],[76.621996,9.428807],[76.62219,9.428591],[76.622327,9.42839],[76.622463,9.428199],[76.622582,9.428033],[76.62275,9.427799],[76.622878,9.42762],[76.622974,9.427545],[76.623051,9.427485],[76.623272,9.427495],[76.62352,9.427475],[76.623531,9.427375],[76.623823,9.427382],[76.624061,9.427117],[76.624219,9.42701],[76.62444,9.426859],[76.624592,9.42681],[76.624677,9.426755],[76.624781,9.426679],[76.624937,9.426624],[76.625059,9.426581],[76.62523,9.426515],[76.62538,9.426457],[76.625365,9.42667],[76.625349,9.426903],[76.62533,9.427159],[76.625425,9.4272],[76.625527,9.427243],[76.625749,9.427078],[76.625989,9.427184],[76.626273,9.427309],[76.626381,9.427378],[76.626842,9.427675],[76.627371,9.427787],[76.627345,9.427567],[76.62734,9.427219],[76.627317,9.427046],[76.627293,9.426862],[76.627246,9.42668],[76.627187,9.426451],[76.627051,9.426081],[76.62708,9.425815],[76.627112,9.42553],[76.627095,9.425363],[76.627026,9.42503],[76.627005,9.424927],[76.626963,9.424728],[76.626943,9.424633],[76.626914,9.424512],[76.626916,9.42435],[76.626896,9.424078],[76.626819,9.423694],[76.626825,9.423402],[76.626853,9.423264],[76.626878,9.423145],[76.626903,9.422959],[76.626898,9.422836],[76.62689,9.422636],[76.626892,9.422505],[76.626895,9.422377],[76.626914,9.422177],[76.626934,9.421967],[76.6268,9.421822],[76.626704,9.421697],[76.626657,9.421556],[76.62662,9.421444],[76.626587,9.421348],[76.626565,9.421127],[76.626549,9.420974],[76.626537,9.420867],[76.626529,9.420702],[76.626522,9.420585],[76.626512,9.420387],[76.626511,9.420163],[76.626531,9.419898],[76.626546,9.419712],[76.626607,9.419437],[76.626634,9.419321],[76.626677,9.419139],[76.626729,9.418934],[76.626755,9.418832],[76.626778,9.418724],[76.626799,9.418631],[76.626805,9.418534],[76.626823,9.418318],[76.626829,9.418121],[76.626834,9.417987],[76.626838,9.417891],[76.626855,9.417548],[76.626873,9.417345],[76.62689,9.417146],[76.6269,9.417042],[76.62693,9.416744],[76.626944,9.416608],[76.627001,9.416205],[76.627074,9.415894],[76.627121,9.415753],[76.627376,9.415891],[76.627609,9.416016],[76.627825,9.416132],[76.627931,9.416137],[76.628059,9.416143],[76.628123,9.41589],[76.628136,9.415667],[76.628165,9.41551],[76.628208,9.415273],[76.628322,9.415142],[76.628549,9.414931],[76.628746,9.414734],[76.628826,9.414644],[76.628949,9.414505],[76.629054,9.414344],[76.629019,9.414152],[76.628981,9.413945],[76.628945,9.41376],[76.628897,9.413526],[76.628831,9.413258],[76.628781,9.413087],[76.628728,9.412909],[76.628697,9.412732],[76.628671,9.412547],[76.62865,9.412373],[76.628635,9.412255],[76.628623,9.412132],[76.628604,9.411879],[76.628573,9.411675],[76.628512,9.411448],[76.628464,9.411224],[76.62843,9.411111],[76.628349,9.410762],[76.62831,9.410589],[76.628205,9.41028],[76.628144,9.410073],[76.628083,9.409917],[76.627965,9.409728],[76.627886,9.409512],[76.627907,9.409412],[76.627931,9.409292],[76.627956,9.409205],[76.627977,9.409097],[76.62804,9.408861],[76.628079,9.408582],[76.6281,9.408415],[76.628112,9.40829],[76.628134,9.408015],[76.628122,9.407681],[76.628074,9.40737],[76.628035,9.407179],[76.627981,9.406914],[76.627982,9.406791],[76.627983,9.406619],[76.627936,9.406264],[76.627918,9.406147],[76.627861,9.405788],[76.627815,9.405446],[76.627791,9.405262],[76.627769,9.405098],[76.627742,9.404956],[76.627717,9.404811],[76.627673,9.40455],[76.627672,9.404414],[76.627671,9.404292],[76.62768,9.404092],[76.627698,9.40385],[76.627688,9.403504],[76.627671,9.40315],[76.627662,9.403013],[76.627652,9.402852],[76.627693,9.402728],[76.627761,9.402526],[76.627859,9.402347],[76.627871,9.40223],[76.627893,9.402113],[76.62796,9.401757],[76.627981,9.401658],[76.628035,9.401396],[76.628113,9.401226],[76.628162,9.401119],[76.628258,9.400907],[76.628337,9.400736],[76.62842,9.400549],[76.628494,9.400385],[76.62836,9.400211],[76.628239,9.400052],[76.628149,9.399935],[76.628113,9.399671],[76.628129,9.399546],[76.628093,9.399394],[76.627976,9.399128],[76.627794,9.399009],[76.627661,9.399035],[76.627545,9.399056],[76.627422,9.399012],[76.627292,9.399024],[76.627074,9.399141],[76.626948,9.399209],[76.62686,9.399284],[76.626694,9.399417],[76.626578,9.399514],[76.626369,9.399688],[76.626288,9.399637],[76.626177,9.399567],[76.625959,9.399428],[76.625776,9.399243],[76.625619,9.399041],[76.62545,9.398877],[76.625336,9.39872],[76.625252,9.398517],[76.625366,9.398371],[76.625598,9.398074],[76.625654,9.397978],[76.62577,9.397776],[76.625864,9.397605],[76.625982,9.397402],[76.626068,9.397253],[76.626206,9.396975],[76.626363,9.396659],[76.626395,9.396572],[76.626453,9.396422],[76.626567,9.396311],[76.627227,9.39567],[76.627272,9.395449],[76.627382,9.394912],[76.62748,9.394434],[76.6275,9.394337],[76.627565,9.394124],[76.627659,9.393813],[76.627705,9.393678],[76.627836,9.393293],[76.627389,9.392937],[76.627062,9.39256],[76.626222,9.392014],[76.626063,9.391887],[76.624836,9.391189],[76.624552,9.390979],[76.624227,9.390757],[76.623995,9.390575],[76.623733,9.390369],[76.623864,9.390163],[76.623747,9.389824],[76.62376,9.389319],[76.623769,9.388972],[76.623786,9.388557],[76.623797,9.388157],[76.623794,9.388016],[76.623779,9.387713],[76.623773,9.387598],[76.623706,9.387147],[76.623666,9.386878],[76.623622,9.386706],[76.623555,9.386563],[76.623491,9.386391],[76.623398,9.386256],[76.623295,9.386157],[76.623183,9.386052],[76.623057,9.385953],[76.622928,9.385844],[76.622805,9.385753],[76.622643,9.385676],[76.622476,9.385637],[76.622345,9.385636],[76.622104,9.385712],[76.621971,9.385822],[76.621894,9.385907],[76.621836,9.386014],[76.621822,9.386061],[76.621785,9.386187],[76.621766,9.386252],[76.621726,9.386385],[76.621669,9.386623],[76.621588,9.386825],[76.621515,9.386983],[76.621442,9.387119],[76.621429,9.387138],[76.621361,9.387241],[76.621299,9.387322],[76.621229,9.387403],[76.621078,9.387469],[76.620986,9.38751],[76.620805,9.38758],[76.620573,9.387607],[76.62037,9.387557],[76.620284,9.387528],[76.620188,9.38747],[76.620151,9.387437],[76.620096,9.387389],[76.620003,9.387302],[76.619952,9.387243],[76.619862,9.387141],[76.619758,9.387002],[76.619687,9.386863],[76.619624,9.386687],[76.619616,9.386666],[76.619642,9.386347],[76.619619,9.386093],[76.619586,9.385737],[76.619539,9.385417],[76.619497,9.38513],[76.619442,9.384805],[76.619387,9.38456],[76.619293,9.384163],[76.619252,9.384001],[76.619226,9.383896],[76.619083,9.383503],[76.619056,9.383042],[76.618802,9.382471],[76.6185,9.381989],[76.618256,9.38176],[76.618023,9.381638],[76.617856,9.381504],[76.617549,9.38139],[76.616668,9.381402],[76.616408,9.381406],[76.616015,9.381524],[76.6155,9.38168],[76.615341,9.381728],[76.615182,9.381792],[76.615012,9.38186],[76.614885,9.381916],[76.614788,9.381965],[76.614591,9.382065],[76.614424,9.382131],[76.61416,9.382234],[76.614058,9.38226],[76.613791,9.382322],[76.613544,9.38238],[76.61321,9.38241],[76.612875,9.382441],[76.612434,9.382564],[76.611696,9.382507],[76.61112,9.382501],[76.610691,9.382452],[76.610178,9.382454],[76.609285,9.382458],[76.60901,9.38246],[76.608827,9.38249],[76.608571,9.382548],[76.608296,9.38261],[76.608119,9.382665]]]},\"properties\":{\"LSGD\":\"Kaviyoor\",\"Mandal\":\"Mallappally\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.596282,9.409218],[76.596266,9.409347],[76.596199,9.409906],[76.596185,9.410006],[76.59634,9.410103],[76.596509,9.410208],[76.59641,9.410449],[76.596154,9.411073],[76.595698,9.41131],[76.595613,9.411399],[76.595403,9.411245],[76.595172,9.411287],[76.594875,9.411375],[76.594603,9.411517],[76.594464,9.411597],[76.59411,9.411801],[76.59401,9.411943],[76.593758,9.412343],[76.593692,9.412492],[76.59349,9.41294],[76.593271,9.413096],[76.593122,9.413342],[76.592919,9.413677],[76.592746,9.413982],[76.592651,9.414149],[76.592604,9.414236],[76.592538,9.414352],[76.59242,9.414558],[76.59227,9.414768],[76.59212,9.415091],[76.591995,9.415251],[76.591852,9.415557],[76.591801,9.415665],[76.591625,9.415791],[76.59157,9.415877],[76.591397,9.41615],[76.591265,9.416374],[76.591243,9.416468],[76.591169,9.416561],[76.591072,9.416797],[76.59103,9.416899],[76.590967,9.417021],[76.59089,9.417207],[76.590862,9.417322],[76.590841,9.417411],[76.590756,9.417537],[76.590777,9.417636],[76.590968,9.417893],[76.590955,9.418007],[76.590765,9.418183],[76.590614,9.418323],[76.590649,9.418461],[76.590495,9.418615],[76.590418,9.418693],[76.590261,9.418849],[76.590184,9.418926],[76.590231,9.419354],[76.590268,9.419689],[76.590519,9.419686],[76.590765,9.419586],[76.59075,9.419518],[76.590766,9.419318],[76.590851,9.419233],[76.590984,9.419051],[76.591146,9.418944],[76.591202,9.418875],[76.591254,9.418809],[76.591381,9.418516],[76.591425,9.41841],[76.591559,9.418007],[76.591555,9.417787],[76.591542,9.417372],[76.59168,9.417097],[76.591804,9.416928],[76.591833,9.416841],[76.59178,9.416677],[76.591734,9.416673],[76.591743,9.416572],[76.591916,9.416464],[76.59191,9.41641],[76.59184,9.416249],[76.591909,9.41602],[76.592095,9.415962],[76.592214,9.415992],[76.592279,9.415979],[76.592339,9.415912],[76.592428,9.415773],[76.592616,9.415248],[76.592572,9.415009],[76.592618,9.414815],[76.592689,9.414749],[76.592734,9.414563],[76.592847,9.414428],[76.592932,9.414378],[76.593021,9.414277],[76.593163,9.41431],[76.593246,9.414319],[76.593699,9.414513],[76.593838,9.414773],[76.59398,9.415051],[76.593973,9.415108],[76.594015,9.415271],[76.59406,9.415489],[76.594079,9.415792],[76.594117,9.415957],[76.594132,9.416026],[76.594204,9.416176],[76.594351,9.416484],[76.594475,9.416677],[76.59454,9.41694],[76.59464,9.417147],[76.594723,9.417469],[76.594717,9.417739],[76.594848,9.41827],[76.594881,9.4191],[76.595108,9.419126],[76.595335,9.419042],[76.595447,9.418933],[76.595634,9.418814],[76.595729,9.418802],[76.595894,9.418651],[76.596018,9.418719],[76.59613,9.418827],[76.596377,9.418968],[76.596455,9.419259],[76.596578,9.419712],[76.59656,9.420094],[76.596487,9.420183],[76.596572,9.420269],[76.596744,9.420531],[76.596673,9.420782],[76.596303,9.421568],[76.59626,9.421652],[76.595991,9.421859],[76.59566,9.422132],[76.595487,9.422151],[76.595289,9.422204],[76.595119,9.422304],[76.594527,9.422455],[76.594039,9.422604],[76.593741,9.422715],[76.593412,9.422751],[76.593119,9.422983],[76.592847,9.423125],[76.592742,9.423209],[76.592727,9.423249],[76.592787,9.423325],[76.593896,9.423855],[76.593574,9.424259],[76.593425,9.424528],[76.593335,9.424599],[76.593313,9.424721],[76.593152,9.425006],[76.59317,9.425273],[76.593079,9.425496],[76.593091,9.425597],[76.593008,9.425678],[76.593037,9.425849],[76.592975,9.426066],[76.593011,9.42614],[76.592932,9.42625],[76.592855,9.426302],[76.592855,9.426478],[76.592775,9.426666],[76.592663,9.426875],[76.592275,9.427244],[76.592146,9.427421],[76.592117,9.427501],[76.592084,9.427552],[76.592061,9.427718],[76.591981,9.42795],[76.592023,9.428021],[76.591958,9.428066],[76.591931,9.428158],[76.591921,9.428433],[76.592021,9.428533],[76.592158,9.428918],[76.59215,9.429296],[76.592279,9.429502],[76.592449,9.429852],[76.592427,9.430004],[76.592506,9.430049],[76.592616,9.430295],[76.592649,9.430493],[76.592787,9.430559],[76.592934,9.431024],[76.59318,9.431085],[76.593283,9.431149],[76.593298,9.431307],[76.593304,9.431439],[76.593224,9.431486],[76.59305,9.431477],[76.592809,9.43166],[76.592739,9.431792],[76.592617,9.43217],[76.592567,9.432327],[76.592489,9.432633],[76.592447,9.432968],[76.592465,9.433408],[76.592529,9.433627],[76.59256,9.433672],[76.592609,9.433745],[76.592657,9.433793],[76.592755,9.433923],[76.592963,9.434208],[76.593057,9.434324],[76.593196,9.434383],[76.593339,9.434446],[76.593511,9.434721],[76.593645,9.434842],[76.594096,9.435404],[76.594242,9.435526],[76.594173,9.435692],[76.594028,9.435838],[76.593986,9.435927],[76.59403,9.436246],[76.593628,9.436467],[76.593556,9.436554],[76.593381,9.436593],[76.593395,9.436781],[76.59322,9.436806],[76.59311,9.436872],[76.593109,9.437458],[76.593214,9.438236],[76.593289,9.438475],[76.593305,9.438585],[76.593459,9.438941],[76.593591,9.439391],[76.593639,9.43958],[76.593639,9.439719],[76.593494,9.439758],[76.593248,9.439731],[76.592929,9.439881],[76.59265,9.43994],[76.592591,9.439933],[76.59237,9.440001],[76.592038,9.440007],[76.592036,9.440046],[76.592188,9.440247],[76.591915,9.440573],[76.591626,9.440784],[76.591334,9.441255],[76.591378,9.441418],[76.591383,9.441713],[76.591286,9.441758],[76.591257,9.442184],[76.59129,9.442632],[76.591291,9.442844],[76.591245,9.443217],[76.591204,9.443408],[76.591201,9.443599],[76.591241,9.443748],[76.591126,9.444233],[76.591122,9.444509],[76.59112,9.444582],[76.591372,9.444941],[76.591394,9.445034],[76.591572,9.445216],[76.59195,9.445387],[76.592271,9.445678],[76.592368,9.445831],[76.592537,9.446432],[76.592618,9.446427],[76.592883,9.446281],[76.593088,9.446132],[76.593463,9.446044],[76.594021,9.446004],[76.594484,9.446057],[76.594837,9.446188],[76.595199,9.446396],[76.595377,9.446445],[76.595399,9.446507],[76.595456,9.446487],[76.595519,9.446534],[76.595458,9.446643],[76.59548,9.44674],[76.595615,9.44678],[76.595647,9.446904],[76.595921,9.4471],[76.596198,9.44737],[76.596351,9.448036],[76.596483,9.448078],[76.596492,9.448442],[76.597122,9.448446],[76.597169,9.448393],[76.597594,9.448666],[76.597976,9.448771],[76.598117,9.44877],[76.598486,9.448773],[76.598457,9.449015],[76.599179,9.449287],[76.599777,9.449822],[76.599718,9.449915],[76.599749,9.45005],[76.59972,9.450181],[76.599769,9.450342],[76.600227,9.450334],[76.600231,9.450268],[76.600558,9.450153],[76.600721,9.450168],[76.60096,9.450129],[76.601166,9.450138],[76.601234,9.450146],[76.601357,9.449929],[76.601751,9.450123],[76.60212,9.450214],[76.602642,9.45021],[76.602809,9.450151],[76.603217,9.450095],[76.603628,9.449934],[76.604012,9.449781],[76.604527,9.44979],[76.604894,9.449849],[76.604902,9.450161],[76.604816,9.450251],[76.604838,9.45075],[76.604825,9.450946],[76.604843,9.451062],[76.604835,9.451511],[76.604794,9.45163],[76.604711,9.452079],[76.604541,9.452533],[76.604139,9.453092],[76.603858,9.453391],[76.603911,9.453584],[76.604017,9.454535],[76.603873,9.455186],[76.603729,9.455689],[76.603413,9.456287],[76.603326,9.456445],[76.6032,9.45659],[76.603125,9.456687],[76.603008,9.456825],[76.60292,9.456941],[76.602839,9.457043],[76.602766,9.457128],[76.602644,9.457283],[76.602618,9.457301],[76.602312,9.457564],[76.602123,9.457723],[76.602351,9.457744],[76.602553,9.457692],[76.602789,9.457664],[76.603101,9.457648],[76.603491,9.457635],[76.603807,9.457609],[76.604057,9.457587],[76.604178,9.457583],[76.604413,9.457593],[76.604685,9.457603],[76.60493,9.457612],[76.605193,9.457615],[76.605384,9.457615],[76.605544,9.457616],[76.60557,9.457535],[76.605632,9.457509],[76.606036,9.457182],[76.606305,9.457026],[76.606667,9.456906],[76.606648,9.456773],[76.606821,9.456518],[76.60747,9.456469],[76.607705,9.456404],[76.607772,9.456358],[76.608108,9.456248],[76.608424,9.456142],[76.608654,9.45597],[76.608714,9.455963],[76.609023,9.45569],[76.609073,9.455495],[76.609174,9.455338],[76.609238,9.455047],[76.609279,9.45476],[76.609496,9.454332],[76.609646,9.45439],[76.609813,9.454079],[76.609943,9.45403],[76.610406,9.453951],[76.61062,9.453982],[76.610778,9.45405],[76.610775,9.454123],[76.610656,9.454278],[76.610508,9.45439],[76.610181,9.454637],[76.61002,9.454853],[76.609862,9.455056],[76.609746,9.455239],[76.609644,9.455383],[76.609618,9.455429],[76.609553,9.455609],[76.609489,9.455819],[76.609422,9.456007],[76.609433,9.456245],[76.609413,9.456514],[76.609393,9.456979],[76.609362,9.457421],[76.609355,9.457582],[76.609309,9.457786],[76.609269,9.458011],[76.609234,9.458234],[76.609191,9.458499],[76.609169,9.458652],[76.609129,9.458907],[76.609234,9.45935],[76.609258,9.45968],[76.609565,9.45988],[76.609926,9.460022],[76.609905,9.460202],[76.61059,9.460549],[76.610872,9.460729],[76.611004,9.46081],[76.611299,9.460905],[76.611517,9.461063],[76.611613,9.461124],[76.611983,9.461079],[76.612548,9.460575],[76.612593,9.460543],[76.612647,9.460503],[76.612741,9.460517],[76.612982,9.460444],[76.613079,9.460499],[76.613212,9.4606],[76.613513,9.460645],[76.613749,9.46056],[76.613911,9.4606],[76.614074,9.460571],[76.614102,9.460691],[76.614084,9.460755],[76.614232,9.460782],[76.614532,9.460837],[76.614861,9.461025],[76.615022,9.461118],[76.615122,9.461177],[76.615265,9.461308],[76.615483,9.461513],[76.615682,9.461813],[76.615868,9.461745],[76.615894,9.461671],[76.616003,9.461666],[76.61634,9.461481],[76.616359,9.461414],[76.616424,9.46139],[76.616762,9.461292],[76.616982,9.46123],[76.617318,9.461196],[76.617453,9.461231],[76.617732,9.46122],[76.618131,9.461208],[76.618395,9.461136],[76.618535,9.461187],[76.618852,9.461204],[76.619299,9.461224],[76.619394,9.461212],[76.619948,9.46115],[76.62011,9.460863],[76.620222,9.460859],[76.620333,9.460863],[76.62081,9.460952],[76.620697,9.461194],[76.620675,9.461281],[76.620541,9.4618],[76.620698,9.461842],[76.621113,9.461965],[76.621215,9.461917],[76.621256,9.461857],[76.621324,9.461639],[76.621444,9.461726],[76.62184,9.461821],[76.622543,9.461975],[76.622922,9.462039],[76.623479,9.462618],[76.623542,9.462933],[76.623717,9.462996],[76.623812,9.463079],[76.623978,9.46293],[76.624187,9.462841],[76.62463,9.462608],[76.62468,9.462491],[76.624752,9.462434],[76.624862,9.462425],[76.624882,9.462413],[76.625379,9.462007],[76.625445,9.461883],[76.625629,9.461745],[76.625773,9.461501],[76.625911,9.461573],[76.626137,9.461506],[76.626178,9.461564],[76.626188,9.461686],[76.626191,9.462306],[76.626116,9.462416],[76.626139,9.462756],[76.626095,9.463264],[76.625824,9.464138],[76.625718,9.46544],[76.625791,9.465708],[76.625848,9.466263],[76.625955,9.466934],[76.625979,9.467043],[76.626116,9.467759],[76.62613,9.468337],[76.62639,9.46921],[76.626552,9.469427],[76.626599,9.469394],[76.626608,9.469469],[76.627,9.469828],[76.62728,9.470046],[76.627708,9.470382],[76.627961,9.470603],[76.628142,9.470781],[76.628285,9.470997],[76.628382,9.471257],[76.628521,9.471536],[76.62865,9.47162],[76.628786,9.471657],[76.629125,9.471661],[76.629867,9.472054],[76.630032,9.472094],[76.630143,9.472085],[76.630301,9.472096],[76.63049,9.472072],[76.630617,9.472095],[76.630853,9.472112],[76.630961,9.472046],[76.631193,9.472082],[76.63127,9.472026],[76.63138,9.47189],[76.631658,9.471525],[76.631973,9.471071],[76.632002,9.470868],[76.632102,9.470718],[76.632222,9.470496],[76.632715,9.469551],[76.632881,9.469491],[76.632964,9.469509],[76.633081,9.469326],[76.633203,9.469337],[76.633366,9.46912],[76.633269,9.468739],[76.633342,9.468595],[76.633308,9.468473],[76.633067,9.468437],[76.633238,9.468248],[76.63337,9.468104],[76.633589,9.467885],[76.63377,9.467664],[76.633841,9.467553],[76.634061,9.467504],[76.634182,9.467519],[76.634374,9.467391],[76.634465,9.467055],[76.634542,9.466741],[76.634587,9.466555],[76.634609,9.466391],[76.634563,9.466136],[76.634595,9.465994],[76.634551,9.465812],[76.634787,9.465226],[76.634841,9.465213],[76.634933,9.465065],[76.635049,9.465041],[76.635158,9.464941],[76.635173,9.464607],[76.635223,9.464369],[76.635296,9.464192],[76.635311,9.464069],[76.635326,9.46404],[76.635419,9.463835],[76.635549,9.463516],[76.635662,9.463344],[76.6358,9.46311],[76.635735,9.463016],[76.635674,9.462907],[76.635472,9.462827],[76.635373,9.462788],[76.635249,9.462709],[76.635144,9.46258],[76.635031,9.462475],[76.634847,9.462271],[76.634833,9.462116],[76.63482,9.461963],[76.634953,9.461813],[76.635142,9.461719],[76.635256,9.461294],[76.635321,9.460976],[76.635341,9.460837],[76.635388,9.460752],[76.635442,9.460652],[76.635487,9.460559],[76.635545,9.46044],[76.63565,9.459904],[76.63493,9.459518],[76.634811,9.459339],[76.634658,9.45918],[76.634468,9.459037],[76.634387,9.458937],[76.634339,9.45885],[76.634358,9.458709],[76.634485,9.458251],[76.634594,9.457859],[76.634678,9.457552],[76.634751,9.457283],[76.634689,9.457209],[76.634513,9.457001],[76.633999,9.456832],[76.633871,9.456612],[76.633881,9.45586],[76.633618,9.455757],[76.633559,9.455867],[76.63331,9.456084],[76.633002,9.456142],[76.632624,9.456093],[76.632444,9.456018],[76.632453,9.455866],[76.632469,9.455618],[76.632734,9.455167],[76.632578,9.454774],[76.63249,9.454555],[76.632173,9.454082],[76.63181,9.453749],[76.631705,9.453423],[76.631695,9.453149],[76.63148,9.45279],[76.631436,9.452652],[76.631482,9.452474],[76.631822,9.45199],[76.63209,9.451609],[76.63211,9.451464],[76.632066,9.451201],[76.632169,9.450828],[76.632169,9.450222],[76.63196,9.449497],[76.631086,9.449278],[76.630968,9.449196],[76.630695,9.448377],[76.630612,9.44733],[76.630702,9.447184],[76.631098,9.446537],[76.631169,9.446217],[76.63101,9.44593],[76.630646,9.445603],[76.630511,9.4453],[76.630494,9.445106],[76.629812,9.44487],[76.629812,9.444298],[76.629576,9.444293],[76.62936,9.444288],[76.628666,9.444285],[76.628328,9.444283],[76.62811,9.444083],[76.627941,9.443928],[76.627941,9.44383],[76.627942,9.443724],[76.627943,9.443452],[76.627964,9.443157],[76.628058,9.442963],[76.628238,9.442595],[76.628419,9.442362],[76.628582,9.442286],[76.628806,9.442183],[76.629071,9.441949],[76.62927,9.441775],[76.629514,9.441604],[76.629747,9.441482],[76.629944,9.441379],[76.629979,9.441176],[76.630124,9.440984],[76.630375,9.440689],[76.630461,9.440588],[76.630649,9.44043],[76.630795,9.440328],[76.630962,9.440213],[76.631253,9.440039],[76.631536,9.439855],[76.631708,9.439718],[76.631607,9.439595],[76.631495,9.439458],[76.63132,9.439116],[76.631212,9.438673],[76.631146,9.438394],[76.631117,9.438274],[76.631089,9.438027],[76.631004,9.437906],[76.630893,9.437749],[76.630705,9.437549],[76.630429,9.43744],[76.630275,9.437368],[76.630103,9.437287],[76.629796,9.437143],[76.629622,9.437057],[76.629465,9.436933],[76.629389,9.436872],[76.629282,9.436787],[76.629245,9.436519],[76.629324,9.436286],[76.629689,9.43592],[76.629617,9.435627],[76.629571,9.435444],[76.629507,9.435184],[76.629444,9.435039],[76.629331,9.434966],[76.629182,9.434894],[76.628783,9.434699],[76.628627,9.434146],[76.62858,9.433997],[76.62861,9.433893],[76.628662,9.433715],[76.628746,9.433506],[76.62883,9.433298],[76.628875,9.433025],[76.628891,9.432932],[76.62863,9.432896],[76.628452,9.432872],[76.628421,9.432688],[76.628527,9.43227],[76.628569,9.432096],[76.628598,9.431979],[76.628632,9.431838],[76.628687,9.431616],[76.628744,9.43138],[76.628739,9.431214],[76.628731,9.431036],[76.628714,9.430915],[76.628688,9.430758],[76.628654,9.430548],[76.628586,9.430381],[76.628405,9.429933],[76.628158,9.429327],[76.627983,9.429017],[76.627883,9.428875],[76.627811,9.428762],[76.627628,9.428474],[76.627522,9.428241],[76.627451,9.428083],[76.627371,9.427787],[76.626842,9.427675],[76.626381,9.427378],[76.626273,9.427309],[76.625989,9.427184],[76.625749,9.427078],[76.625527,9.427243],[76.625425,9.4272],[76.62533,9.427159],[76.625349,9.426903],[76.625365,9.42667],[76.62538,9.426457],[76.62523,9.426515],[76.625059,9.426581],[76.624937,9.426624],[76.624781,9.426679],[76.624677,9.426755],[76.624592,9.42681],[76.62444,9.426859],[76.624219,9.42701],[76.624061,9.427117],[76.623823,9.427382],[76.623531,9.427375],[76.62352,9.427475],[76.623272,9.427495],[76.623051,9.427485],[76.622974,9.427545],[76.622878,9.42762],[76.62275,9.427799],[76.622582,9.428033],[76.622463,9.428199],[76.622327,9.42839],[76.62219,9.428591],[76.621996,9.428807],[76.621865,9.428932],[76.621753,9.429039],[76.621389,9.429318],[76.621165,9.429197],[76.620989,9.429044],[76.620901,9.428992],[76.62068,9.428861],[76.620446,9.428723],[76.62006,9.428398],[76.619553,9.428475],[76.619409,9.428498],[76.619181,9.428613],[76.619004,9.428661],[76.618795,9.428718],[76.61869,9.428687],[76.618336,9.428836],[76.618142,9.428883],[76.618035,9.428856],[76.617601,9.428939],[76.617369,9.429088],[76.617198,9.429198],[76.617055,9.429242],[76.616928,9.429305],[76.616836,9.429394],[76.616608,9.429573],[76.616301,9.429814],[76.616179,9.429909],[76.616056,9.430004],[76.61571,9.43027],[76.615448,9.430479],[76.615068,9.430772],[76.614781,9.431008],[76.61466,9.431083],[76.614548,9.431147],[76.614324,9.431237],[76.614081,9.431348],[76.613855,9.431446],[76.613622,9.431497],[76.61324,9.43178],[76.613189,9.431925],[76.612896,9.432139],[76.612665,9.432261],[76.612219,9.432643],[76.611713,9.432905],[76.611508,9.43301],[76.61137,9.433076],[76.611258,9.433129],[76.611133,9.433187],[76.611045,9.433221],[76.610923,9.433268],[76.610705,9.433334],[76.610474,9.433369],[76.610257,9.433435],[76.610094,9.433528],[76.609649,9.433781],[76.609454,9.433891],[76.609084,9.433948],[76.608729,9.434002],[76.608635,9.433895],[76.608422,9.433652],[76.608585,9.433409],[76.608505,9.43333],[76.608396,9.4332],[76.608404,9.433038],[76.608156,9.432858],[76.607946,9.432789],[76.60773,9.43244],[76.607483,9.432282],[76.60732,9.432027],[76.607255,9.431926],[76.607043,9.43162],[76.606835,9.43132],[76.606805,9.431225],[76.606738,9.431011],[76.606672,9.430764],[76.606563,9.430511],[76.606468,9.430395],[76.606414,9.430259],[76.606281,9.430091],[76.606183,9.429967],[76.606078,9.429834],[76.605967,9.429544],[76.605864,9.429207],[76.605778,9.428961],[76.605678,9.428833],[76.605548,9.428642],[76.605507,9.428506],[76.605356,9.42818],[76.605216,9.428046],[76.605141,9.427963],[76.605009,9.427839],[76.60493,9.427764],[76.604787,9.427699],[76.604684,9.427652],[76.604596,9.427613],[76.604454,9.427548],[76.60432,9.427487],[76.604212,9.427438],[76.604149,9.427358],[76.604049,9.427231],[76.60397,9.427161],[76.60378,9.426993],[76.603689,9.426928],[76.603531,9.426815],[76.60339,9.426651],[76.603349,9.426462],[76.603171,9.426343],[76.603269,9.426228],[76.603385,9.426092],[76.603544,9.425905],[76.603665,9.425757],[76.60385,9.42562],[76.604012,9.425633],[76.604104,9.425744],[76.604222,9.425773],[76.604504,9.425839],[76.604593,9.42586],[76.604735,9.425903],[76.604943,9.425923],[76.605055,9.425955],[76.605213,9.426018],[76.605366,9.42608],[76.605572,9.426147],[76.60574,9.42614],[76.605868,9.426135],[76.60596,9.426131],[76.606067,9.426075],[76.606217,9.425998],[76.606371,9.425918],[76.606497,9.425852],[76.606602,9.425798],[76.60686,9.425664],[76.607038,9.425532],[76.607222,9.425502],[76.607515,9.425411],[76.607811,9.425308],[76.607868,9.425202],[76.607953,9.425092],[76.608052,9.424965],[76.608168,9.424871],[76.608331,9.42474],[76.608444,9.424529],[76.608508,9.424409],[76.608621,9.424279],[76.608645,9.424111],[76.608521,9.42378],[76.608446,9.423579],[76.608407,9.423244],[76.608424,9.423147],[76.608473,9.422872],[76.608576,9.422794],[76.608862,9.422843],[76.608977,9.422525],[76.609145,9.422056],[76.609252,9.421487],[76.609294,9.421232],[76.609316,9.421094],[76.609332,9.420999],[76.609368,9.420728],[76.609418,9.420363],[76.609454,9.420091],[76.609591,9.419971],[76.609784,9.419727],[76.609882,9.419556],[76.60993,9.41947],[76.609977,9.419385],[76.61004,9.419006],[76.610091,9.41887],[76.610132,9.41876],[76.610195,9.418693],[76.610229,9.418505],[76.610263,9.418321],[76.610279,9.418165],[76.610321,9.417903],[76.610314,9.417738],[76.610305,9.417534],[76.610297,9.4174],[76.610287,9.417199],[76.610277,9.417007],[76.610331,9.416834],[76.610364,9.416729],[76.610393,9.416622],[76.610556,9.416357],[76.610545,9.416172],[76.610392,9.416031],[76.610347,9.415877],[76.610301,9.415719],[76.610225,9.415455],[76.610182,9.415371],[76.61013,9.415252],[76.610072,9.415118],[76.60995,9.414932],[76.609831,9.41475],[76.609713,9.414513],[76.609564,9.414215],[76.609422,9.413932],[76.609294,9.413888],[76.609205,9.413857],[76.609086,9.413881],[76.608954,9.413731],[76.608792,9.413545],[76.608723,9.413371],[76.608643,9.413169],[76.608468,9.413188],[76.608303,9.413206],[76.60813,9.413224],[76.607969,9.413254],[76.607917,9.413143],[76.607791,9.412877],[76.60776,9.41262],[76.607544,9.412672],[76.607507,9.412558],[76.607452,9.412388],[76.607398,9.41222],[76.607366,9.412121],[76.607316,9.411967],[76.607262,9.411843],[76.607195,9.411732],[76.607081,9.411544],[76.607054,9.411311],[76.607025,9.411062],[76.607125,9.410904],[76.607202,9.410782],[76.607123,9.410597],[76.606969,9.410546],[76.606839,9.410503],[76.606602,9.410473],[76.606508,9.410369],[76.606429,9.410281],[76.606346,9.410187],[76.606321,9.410075],[76.606283,9.409905],[76.606247,9.409813],[76.606199,9.409692],[76.606154,9.409577],[76.606105,9.409495],[76.606046,9.409395],[76.605945,9.409275],[76.60588,9.409197],[76.605846,9.409106],[76.605796,9.408975],[76.605749,9.40888],[76.605606,9.408589],[76.605529,9.408479],[76.605464,9.408385],[76.60536,9.408281],[76.605226,9.408281],[76.605047,9.408266],[76.604862,9.408227],[76.604578,9.408233],[76.604493,9.408102],[76.604364,9.408098],[76.60421,9.408036],[76.603956,9.408007],[76.603736,9.40804],[76.603355,9.408109],[76.603187,9.408155],[76.603051,9.40817],[76.602776,9.408202],[76.602669,9.408199],[76.602537,9.408195],[76.602425,9.408191],[76.602214,9.408196],[76.602015,9.408145],[76.601881,9.408084],[76.601695,9.407999],[76.601339,9.407868],[76.601205,9.407818],[76.60103,9.407753],[76.600945,9.407698],[76.600817,9.407614],[76.600685,9.407527],[76.600496,9.407421],[76.600398,9.40737],[76.600236,9.407259],[76.600027,9.407219],[76.599672,9.407088],[76.599132,9.406889],[76.598867,9.406772],[76.598622,9.406634],[76.598318,9.406467],[76.598047,9.406292],[76.596545,9.406169],[76.596522,9.40641],[76.596487,9.406776],[76.596478,9.406869],[76.596469,9.406961],[76.596456,9.407095],[76.596447,9.407188],[76.596438,9.407284],[76.596419,9.40748],[76.596376,9.407928],[76.596362,9.408125],[76.596347,9.408346],[76.59633,9.408495],[76.596312,9.408685],[76.596302,9.408834],[76.596282,9.409218]]]},\"properties\":{\"LSGD\":\"Kunnathanam\",\"Mandal\":\"Mallappally\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.592162,9.351396],[76.591917,9.351245],[76.591662,9.351107],[76.591453,9.350998],[76.591231,9.35086],[76.591071,9.350784],[76.590974,9.350767],[76.590146,9.350733],[76.589951,9.350751],[76.589774,9.350788],[76.589617,9.350859],[76.589337,9.350975],[76.589163,9.35107],[76.588965,9.351176],[76.588765,9.351301],[76.588624,9.351392],[76.588393,9.35155],[76.588231,9.35162],[76.588026,9.351694],[76.587887,9.351698],[76.587756,9.351675],[76.58765,9.351601],[76.587515,9.351484],[76.587375,9.35129],[76.587364,9.351201],[76.587301,9.351067],[76.587216,9.350896],[76.587153,9.350777],[76.587077,9.350685],[76.587005,9.350584],[76.586951,9.350433],[76.586843,9.350157],[76.586776,9.3499],[76.586727,9.349686],[76.586647,9.349412],[76.586592,9.349229],[76.586506,9.349034],[76.586424,9.348857],[76.586199,9.348566],[76.586065,9.348491],[76.58596,9.348392],[76.585827,9.348325],[76.585598,9.348235],[76.585388,9.348189],[76.585158,9.348153],[76.585021,9.348126],[76.584847,9.348117],[76.584729,9.348129],[76.584621,9.348156],[76.584481,9.348187],[76.584344,9.348215],[76.584181,9.348262],[76.584087,9.348292],[76.583956,9.348343],[76.583827,9.348403],[76.58373,9.348486],[76.5836,9.348582],[76.583468,9.348727],[76.58336,9.34889],[76.583208,9.349114],[76.583124,9.349187],[76.583035,9.349251],[76.582995,9.349259],[76.582845,9.349264],[76.582577,9.349187],[76.582629,9.348495],[76.582691,9.348221],[76.582643,9.347561],[76.582507,9.347368],[76.582208,9.347158],[76.581719,9.347097],[76.58152,9.347177],[76.58139,9.347689],[76.580851,9.348335],[76.580489,9.348742],[76.579877,9.349403],[76.579823,9.34955],[76.579543,9.350314],[76.579289,9.351085],[76.579308,9.35149],[76.579538,9.351806],[76.579835,9.352276],[76.579963,9.352539],[76.580035,9.353019],[76.579847,9.353172],[76.579671,9.35332],[76.579388,9.353216],[76.578986,9.353103],[76.578636,9.353029],[76.5784,9.352989],[76.578253,9.352964],[76.577849,9.353058],[76.577435,9.353236],[76.577075,9.353396],[76.576062,9.353382],[76.575918,9.353391],[76.575778,9.353359],[76.575586,9.353394],[76.575408,9.353367],[76.574971,9.35344],[76.57469,9.353526],[76.574305,9.353708],[76.574122,9.353841],[76.573918,9.354235],[76.573813,9.354604],[76.573712,9.355017],[76.573544,9.355316],[76.5734,9.355491],[76.573039,9.355567],[76.572634,9.35568],[76.571998,9.355691],[76.570345,9.35578],[76.568601,9.355699],[76.567932,9.355688],[76.567341,9.355719],[76.567016,9.355704],[76.566666,9.355606],[76.566413,9.355231],[76.566167,9.35469],[76.565792,9.353788],[76.565742,9.353508],[76.56566,9.352992],[76.565228,9.353018],[76.564986,9.353602],[76.564296,9.354062],[76.563669,9.354292],[76.563079,9.353998],[76.562375,9.353589],[76.561743,9.353402],[76.561355,9.353853],[76.561221,9.353973],[76.56103,9.35415],[76.560929,9.354216],[76.560691,9.354371],[76.560637,9.354726],[76.560649,9.354871],[76.560724,9.355208],[76.56154,9.355755],[76.561625,9.355826],[76.562036,9.356111],[76.5628,9.356666],[76.562843,9.356824],[76.562916,9.357316],[76.562928,9.357488],[76.562888,9.358027],[76.562872,9.35839],[76.562749,9.359013],[76.56277,9.359188],[76.562743,9.359579],[76.562802,9.359788],[76.562246,9.360236],[76.562182,9.360521],[76.562154,9.360649],[76.562115,9.360985],[76.562085,9.361246],[76.562056,9.361487],[76.562011,9.361669],[76.561979,9.361795],[76.56202,9.361885],[76.562004,9.362143],[76.56192,9.362335],[76.561733,9.362475],[76.561592,9.362517],[76.561464,9.362549],[76.561269,9.362632],[76.561133,9.362688],[76.560699,9.362865],[76.56073,9.363031],[76.560786,9.363356],[76.560847,9.363709],[76.5611,9.363707],[76.561374,9.363705],[76.561711,9.363745],[76.561892,9.364304],[76.561875,9.364662],[76.561813,9.364988],[76.561748,9.365329],[76.561713,9.365578],[76.561664,9.365925],[76.56174,9.366202],[76.561848,9.366593],[76.561903,9.366792],[76.56194,9.366934],[76.56214,9.367183],[76.562373,9.36745],[76.56253,9.367629],[76.56277,9.367681],[76.563026,9.367601],[76.563314,9.367375],[76.563406,9.367334],[76.563667,9.367216],[76.564054,9.36706],[76.564239,9.366986],[76.564384,9.366925],[76.564579,9.366846],[76.564836,9.366747],[76.565082,9.366654],[76.565327,9.366595],[76.565619,9.366547],[76.565907,9.366521],[76.56636,9.366563],[76.566478,9.366574],[76.566959,9.366573],[76.567364,9.366717],[76.567512,9.366761],[76.567631,9.366817],[76.56789,9.366923],[76.568016,9.366985],[76.568105,9.367044],[76.568793,9.367455],[76.568943,9.367545],[76.569318,9.367705],[76.569762,9.367893],[76.570003,9.367996],[76.570265,9.368061],[76.570511,9.368121],[76.57102,9.368236],[76.571225,9.368283],[76.571426,9.368325],[76.571715,9.368385],[76.572081,9.368461],[76.572208,9.368479],[76.572435,9.368513],[76.572591,9.368535],[76.572765,9.368505],[76.573077,9.368449],[76.573324,9.368367],[76.573485,9.368292],[76.573697,9.368193],[76.573972,9.368144],[76.574179,9.368148],[76.574273,9.368154],[76.574475,9.368194],[76.574566,9.368212],[76.574687,9.368224],[76.574859,9.36825],[76.575076,9.368283],[76.575186,9.368283],[76.575542,9.368282],[76.575802,9.368251],[76.57618,9.368252],[76.576559,9.368083],[76.576789,9.36798],[76.576965,9.367644],[76.577103,9.367381],[76.577053,9.367097],[76.577029,9.366961],[76.576957,9.36684],[76.576862,9.366682],[76.57665,9.366371],[76.57643,9.366028],[76.576336,9.365882],[76.575861,9.365371],[76.57567,9.365166],[76.575497,9.364822],[76.575351,9.364526],[76.57526,9.364336],[76.575135,9.364064],[76.574904,9.363552],[76.574877,9.362778],[76.574879,9.362585],[76.574892,9.362313],[76.57491,9.362091],[76.574959,9.361714],[76.575059,9.361344],[76.575119,9.361124],[76.575255,9.360811],[76.575492,9.360264],[76.57553,9.360175],[76.5762,9.360216],[76.576372,9.360226],[76.576752,9.360295],[76.577022,9.360385],[76.577896,9.360804],[76.578703,9.361153],[76.578923,9.361265],[76.579415,9.361529],[76.579715,9.361702],[76.580155,9.361962],[76.580233,9.36201],[76.580548,9.362229],[76.580716,9.362346],[76.580993,9.362563],[76.58114,9.362679],[76.581756,9.36307],[76.582321,9.363264],[76.582697,9.363268],[76.582839,9.363236],[76.58311,9.363154],[76.583264,9.363073],[76.583428,9.36296],[76.584073,9.362445],[76.584287,9.362263],[76.584812,9.361793],[76.584895,9.361727],[76.585466,9.361258],[76.585707,9.361129],[76.585918,9.361016],[76.586234,9.360924],[76.586327,9.360929],[76.586648,9.360947],[76.58683,9.360975],[76.586957,9.361068],[76.587123,9.36119],[76.587311,9.3613],[76.587515,9.361508],[76.587798,9.361795],[76.588065,9.362051],[76.588438,9.362409],[76.588695,9.362646],[76.589023,9.362947],[76.589277,9.36318],[76.589673,9.363792],[76.589692,9.36389],[76.589803,9.364455],[76.589781,9.364774],[76.589828,9.365069],[76.589781,9.365619],[76.589817,9.365828],[76.589881,9.366535],[76.590098,9.367302],[76.590198,9.367669],[76.590297,9.368036],[76.590465,9.368282],[76.59056,9.36834],[76.590821,9.368501],[76.591257,9.368603],[76.591445,9.368638],[76.591795,9.3687],[76.592416,9.368796],[76.592513,9.368812],[76.592947,9.368943],[76.593334,9.36906],[76.593487,9.369108],[76.593786,9.369273],[76.59417,9.369513],[76.594494,9.369716],[76.594907,9.369935],[76.595063,9.37003],[76.595326,9.370175],[76.595571,9.370322],[76.596052,9.370623],[76.596168,9.370654],[76.596634,9.370808],[76.596636,9.370401],[76.596792,9.370321],[76.597163,9.370132],[76.597279,9.370073],[76.597479,9.370041],[76.597812,9.370084],[76.597956,9.370099],[76.59809,9.370105],[76.598483,9.370113],[76.598626,9.370064],[76.59881,9.369993],[76.599091,9.36995],[76.599303,9.37004],[76.599656,9.369735],[76.599654,9.369503],[76.600237,9.36921],[76.600905,9.368688],[76.601282,9.368852],[76.601456,9.368684],[76.60156,9.368522],[76.601936,9.368258],[76.602019,9.36804],[76.602171,9.368008],[76.602384,9.367965],[76.602578,9.367849],[76.60271,9.367771],[76.603107,9.367059],[76.603271,9.366855],[76.603672,9.36634],[76.603721,9.366325],[76.60377,9.366322],[76.60379,9.366325],[76.603842,9.366338],[76.603889,9.366365],[76.603915,9.366386],[76.603941,9.366402],[76.603983,9.366426],[76.604014,9.366442],[76.604057,9.366468],[76.604082,9.366485],[76.604099,9.366494],[76.604162,9.366565],[76.604179,9.366606],[76.6042,9.366642],[76.604216,9.366665],[76.604241,9.366705],[76.604271,9.366735],[76.604303,9.366755],[76.604344,9.366774],[76.604409,9.366781],[76.60444,9.366788],[76.604503,9.366796],[76.604536,9.366803],[76.604582,9.366805],[76.604632,9.366822],[76.604645,9.366833],[76.604652,9.36684],[76.604682,9.366858],[76.604761,9.36689],[76.604834,9.366913],[76.604874,9.366922],[76.605001,9.36697],[76.605065,9.36698],[76.605129,9.366988],[76.605181,9.367015],[76.60522,9.367032],[76.605268,9.36705],[76.605354,9.367056],[76.605413,9.367054],[76.60549,9.367039],[76.605535,9.367028],[76.60557,9.367016],[76.605625,9.366974],[76.605679,9.36694],[76.605723,9.366916],[76.605929,9.36686],[76.605998,9.36686],[76.606067,9.366874],[76.606117,9.366891],[76.606131,9.3669],[76.60615,9.366911],[76.606185,9.366936],[76.606214,9.366956],[76.606279,9.366983],[76.606313,9.36699],[76.606355,9.366976],[76.606376,9.366961],[76.606404,9.366942],[76.606448,9.36691],[76.606968,9.366865],[76.607155,9.367093],[76.607462,9.367046],[76.60827,9.366767],[76.608563,9.366631],[76.608906,9.366436],[76.609575,9.366044],[76.609845,9.365876],[76.61017,9.365707],[76.610527,9.365533],[76.610912,9.365386],[76.611215,9.365266],[76.611507,9.365206],[76.612185,9.365052],[76.612586,9.365001],[76.612857,9.365],[76.613199,9.364988],[76.613541,9.364992],[76.613774,9.364985],[76.613861,9.365028],[76.61435,9.364988],[76.614509,9.365019],[76.615455,9.365205],[76.615868,9.365267],[76.615968,9.365294],[76.616337,9.365321],[76.616817,9.365372],[76.616832,9.365363],[76.616877,9.365333],[76.616953,9.365198],[76.617001,9.36509],[76.617033,9.364993],[76.617065,9.36488],[76.617162,9.364707],[76.617281,9.364572],[76.617372,9.364356],[76.617431,9.364232],[76.617443,9.364218],[76.617461,9.36417],[76.617504,9.364073],[76.617572,9.363965],[76.61764,9.363886],[76.617737,9.363766],[76.617792,9.363628],[76.617906,9.363084],[76.61856,9.363294],[76.619027,9.362905],[76.619204,9.362648],[76.619342,9.362493],[76.619458,9.362412],[76.619585,9.362347],[76.619737,9.362284],[76.619888,9.362243],[76.620073,9.362234],[76.62026,9.362258],[76.620384,9.362293],[76.620595,9.362303],[76.620909,9.362319],[76.621145,9.362217],[76.62166,9.362001],[76.622443,9.361624],[76.622619,9.361488],[76.622892,9.361279],[76.623135,9.36106],[76.623432,9.360873],[76.623708,9.360704],[76.623906,9.360577],[76.624081,9.360474],[76.624179,9.360434],[76.624336,9.360343],[76.624564,9.360288],[76.624802,9.360281],[76.624965,9.360297],[76.625166,9.360387],[76.625367,9.360495],[76.625482,9.36065],[76.625618,9.360757],[76.625776,9.360796],[76.625944,9.360885],[76.626134,9.360863],[76.62634,9.360722],[76.626485,9.360468],[76.626522,9.360332],[76.626647,9.360104],[76.626759,9.359899],[76.626822,9.359784],[76.626903,9.359637],[76.626736,9.359551],[76.626573,9.359467],[76.626513,9.359377],[76.626511,9.359144],[76.62651,9.359031],[76.626509,9.358855],[76.626596,9.358636],[76.626471,9.358516],[76.626293,9.358538],[76.625875,9.35859],[76.625542,9.358581],[76.625272,9.358574],[76.625134,9.358426],[76.625029,9.358312],[76.624949,9.358227],[76.624909,9.358097],[76.624852,9.357915],[76.624771,9.357657],[76.624784,9.357503],[76.624797,9.357357],[76.624811,9.3572],[76.624842,9.357056],[76.6248,9.356942],[76.624582,9.356742],[76.624367,9.356527],[76.624258,9.356247],[76.624221,9.356151],[76.624184,9.356057],[76.624147,9.355961],[76.62403,9.355661],[76.62393,9.354863],[76.623939,9.354423],[76.623774,9.354063],[76.62353,9.353599],[76.623299,9.353521],[76.623203,9.353488],[76.623029,9.353429],[76.622852,9.353369],[76.62241,9.353218],[76.622142,9.353065],[76.622003,9.35304],[76.620797,9.352828],[76.620187,9.35276],[76.619769,9.352715],[76.619522,9.352309],[76.619632,9.352189],[76.619711,9.352054],[76.619598,9.351986],[76.61947,9.35191],[76.6192,9.351941],[76.618898,9.35193],[76.618751,9.351938],[76.618659,9.351944],[76.618484,9.351983],[76.618272,9.35195],[76.618061,9.351916],[76.617796,9.351953],[76.617692,9.352018],[76.617423,9.352186],[76.616978,9.352169],[76.616949,9.351936],[76.616923,9.351751],[76.616903,9.351615],[76.616865,9.351385],[76.61682,9.351133],[76.616972,9.350892],[76.617081,9.350719],[76.617101,9.350596],[76.61694,9.350379],[76.616753,9.350126],[76.616673,9.349994],[76.616606,9.349928],[76.616483,9.349821],[76.616359,9.349742],[76.6161,9.349617],[76.615776,9.349418],[76.615557,9.348746],[76.615906,9.348527],[76.616123,9.348391],[76.616247,9.348133],[76.616308,9.347893],[76.616424,9.347531],[76.616469,9.34718],[76.616499,9.346989],[76.616541,9.346725],[76.616401,9.346663],[76.616298,9.346592],[76.61619,9.346589],[76.616081,9.34656],[76.615887,9.346508],[76.615791,9.346265],[76.615812,9.346101],[76.615701,9.345915],[76.615552,9.345651],[76.615714,9.345505],[76.615758,9.345394],[76.615855,9.345338],[76.61602,9.345156],[76.616112,9.345016],[76.616196,9.344889],[76.616016,9.344469],[76.615711,9.344444],[76.615341,9.344414],[76.615027,9.344393],[76.614753,9.344375],[76.614649,9.344422],[76.614284,9.344467],[76.614029,9.344486],[76.613719,9.34446],[76.613625,9.344524],[76.613428,9.344359],[76.613309,9.343796],[76.613216,9.34326],[76.612944,9.343331],[76.612723,9.343344],[76.612408,9.343295],[76.61218,9.343324],[76.611929,9.343295],[76.611772,9.343201],[76.611533,9.343081],[76.611392,9.342879],[76.611233,9.342707],[76.610979,9.342384],[76.610818,9.342273],[76.610616,9.342077],[76.610356,9.341908],[76.610177,9.341908],[76.609997,9.341964],[76.609813,9.342089],[76.609667,9.34222],[76.609511,9.342368],[76.609337,9.342487],[76.609207,9.342598],[76.609105,9.342695],[76.608979,9.342813],[76.608808,9.342908],[76.608299,9.343139],[76.607842,9.343421],[76.607585,9.343696],[76.607568,9.343847],[76.607672,9.34425],[76.607665,9.344458],[76.607473,9.344715],[76.606964,9.344986],[76.606655,9.345065],[76.606409,9.345141],[76.605986,9.34519],[76.605456,9.345183],[76.605225,9.345111],[76.604771,9.344932],[76.604379,9.34483],[76.604148,9.344633],[76.603964,9.344378],[76.603867,9.344037],[76.603725,9.343908],[76.603648,9.343942],[76.60346,9.344113],[76.603233,9.344416],[76.602895,9.344887],[76.602625,9.345114],[76.602226,9.345391],[76.601733,9.345797],[76.601664,9.346192],[76.601633,9.346613],[76.60158,9.346909],[76.60153,9.347106],[76.601322,9.347243],[76.601149,9.347235],[76.600784,9.347171],[76.600372,9.347125],[76.600034,9.347065],[76.59973,9.346882],[76.599396,9.346587],[76.599126,9.34634],[76.59885,9.346215],[76.598592,9.346146],[76.598292,9.346173],[76.598223,9.346222],[76.597907,9.346518],[76.597658,9.346814],[76.597346,9.347103],[76.597154,9.347569],[76.597035,9.347937],[76.59695,9.348332],[76.596854,9.348639],[76.596777,9.348996],[76.596654,9.349292],[76.596573,9.349493],[76.596485,9.349622],[76.596312,9.349782],[76.596037,9.350001],[76.595765,9.350121],[76.595489,9.350398],[76.59554,9.350634],[76.595543,9.350641],[76.595669,9.350885],[76.595792,9.351039],[76.595984,9.351379],[76.596132,9.351712],[76.595953,9.351909],[76.595867,9.352046],[76.5957,9.352152],[76.595497,9.352274],[76.595108,9.352395],[76.594824,9.35241],[76.594455,9.352397],[76.594219,9.352349],[76.593443,9.352076],[76.593066,9.351933],[76.592763,9.351732],[76.592571,9.35162],[76.592162,9.351396]]]},\"properties\":{\"LSGD\":\"Kuttoor\",\"Mandal\":\"Thiruvalla\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.662496,9.427386],[76.662272,9.427491],[76.662101,9.427596],[76.661984,9.427667],[76.66188,9.427706],[76.661753,9.427754],[76.661583,9.427642],[76.661467,9.427565],[76.661356,9.427642],[76.661259,9.427708],[76.661161,9.427777],[76.661002,9.427886],[76.660923,9.42794],[76.660797,9.428028],[76.660625,9.428112],[76.660666,9.428223],[76.66062,9.428454],[76.660418,9.42841],[76.660175,9.428541],[76.66005,9.428609],[76.659919,9.42868],[76.659829,9.428699],[76.6596,9.428914],[76.659486,9.429039],[76.659421,9.42911],[76.659298,9.42913],[76.659174,9.42915],[76.659058,9.429183],[76.658941,9.429216],[76.658812,9.429159],[76.658619,9.429224],[76.658492,9.429185],[76.658285,9.429222],[76.658361,9.429525],[76.658425,9.429677],[76.658466,9.429778],[76.658531,9.429933],[76.658597,9.430095],[76.658496,9.430203],[76.658304,9.430209],[76.657996,9.430218],[76.657926,9.430078],[76.65751,9.430214],[76.657273,9.430274],[76.657116,9.430313],[76.657106,9.430496],[76.657097,9.430659],[76.657092,9.430753],[76.657064,9.430845],[76.657034,9.430946],[76.65693,9.431102],[76.656796,9.43124],[76.656629,9.43141],[76.656513,9.431527],[76.655987,9.431309],[76.655821,9.43124],[76.655681,9.431372],[76.655562,9.431486],[76.65536,9.431539],[76.655257,9.431776],[76.655117,9.431908],[76.655084,9.432103],[76.655047,9.432318],[76.655035,9.432528],[76.655199,9.432633],[76.655146,9.432751],[76.655092,9.432932],[76.655053,9.433058],[76.655018,9.433169],[76.655025,9.433485],[76.655042,9.433614],[76.654945,9.43378],[76.654985,9.433867],[76.654925,9.434128],[76.654867,9.434383],[76.654632,9.434394],[76.654494,9.4344],[76.65434,9.434399],[76.654025,9.434278],[76.653855,9.434253],[76.653721,9.434393],[76.653332,9.434284],[76.653158,9.434236],[76.6528,9.434136],[76.652797,9.434446],[76.652796,9.43454],[76.652723,9.434679],[76.652624,9.434659],[76.652508,9.434967],[76.65241,9.434932],[76.652272,9.435128],[76.651961,9.435081],[76.651735,9.435102],[76.651511,9.435123],[76.651467,9.435438],[76.651439,9.435647],[76.651415,9.435808],[76.65139,9.43598],[76.651327,9.436058],[76.651266,9.436132],[76.65114,9.43647],[76.650981,9.436778],[76.650907,9.436935],[76.650853,9.437046],[76.650768,9.437314],[76.650741,9.437629],[76.650716,9.437967],[76.650593,9.438197],[76.650547,9.438295],[76.650454,9.438401],[76.650375,9.4385],[76.650233,9.438681],[76.650059,9.438904],[76.649844,9.439136],[76.64974,9.439248],[76.649606,9.439197],[76.649374,9.439039],[76.649258,9.439023],[76.648832,9.438967],[76.648694,9.438859],[76.648632,9.439016],[76.64857,9.439177],[76.648539,9.439318],[76.648264,9.439453],[76.648027,9.439411],[76.647768,9.439374],[76.647756,9.439531],[76.647744,9.439691],[76.647801,9.439838],[76.647942,9.440041],[76.648015,9.440174],[76.648109,9.44041],[76.648151,9.440538],[76.648224,9.440747],[76.648292,9.440899],[76.648326,9.441032],[76.648201,9.441105],[76.648068,9.441179],[76.64779,9.441274],[76.647557,9.441394],[76.647452,9.441283],[76.647337,9.441156],[76.647237,9.441046],[76.647067,9.440939],[76.646888,9.440886],[76.646685,9.440978],[76.646586,9.441159],[76.646501,9.44132],[76.64644,9.441435],[76.646356,9.441594],[76.646313,9.441945],[76.646124,9.44214],[76.646017,9.442191],[76.645856,9.442266],[76.645805,9.442404],[76.645718,9.442573],[76.645598,9.442803],[76.645206,9.443203],[76.645019,9.443587],[76.644885,9.443897],[76.644511,9.443983],[76.64441,9.444006],[76.64436,9.444134],[76.644231,9.444177],[76.643889,9.444191],[76.64372,9.444293],[76.64361,9.444352],[76.64316,9.444598],[76.643018,9.444628],[76.642784,9.444711],[76.642582,9.444783],[76.642406,9.44479],[76.642196,9.444797],[76.641977,9.44495],[76.64184,9.445055],[76.641664,9.44519],[76.641497,9.445318],[76.641271,9.445371],[76.64105,9.445422],[76.64096,9.445443],[76.640767,9.445375],[76.640461,9.445324],[76.640336,9.44527],[76.640241,9.445231],[76.640085,9.445165],[76.639835,9.444961],[76.639658,9.444596],[76.639606,9.444371],[76.639448,9.444223],[76.639305,9.44409],[76.639166,9.443829],[76.638969,9.443904],[76.638916,9.44379],[76.638892,9.443654],[76.638841,9.443552],[76.638706,9.443459],[76.638571,9.443365],[76.638433,9.443146],[76.638357,9.443027],[76.638188,9.44291],[76.638057,9.442707],[76.637884,9.442513],[76.637844,9.442123],[76.637737,9.442102],[76.637565,9.442069],[76.637346,9.442176],[76.637339,9.442328],[76.637202,9.442637],[76.637096,9.44287],[76.637049,9.44298],[76.636713,9.442925],[76.636582,9.442653],[76.636283,9.442789],[76.636021,9.442908],[76.635885,9.442969],[76.635529,9.443079],[76.634797,9.443305],[76.634585,9.443347],[76.634368,9.443408],[76.634202,9.443437],[76.634077,9.443242],[76.633999,9.443122],[76.633931,9.442924],[76.633833,9.442644],[76.633774,9.442557],[76.633673,9.442414],[76.633468,9.442203],[76.633352,9.442193],[76.633181,9.442205],[76.632579,9.442245],[76.632214,9.442415],[76.631398,9.442781],[76.631277,9.442905],[76.631158,9.443027],[76.630926,9.443281],[76.630826,9.443373],[76.630733,9.443475],[76.630608,9.443591],[76.630523,9.443715],[76.630323,9.44387],[76.630134,9.443957],[76.629939,9.444047],[76.629812,9.444298],[76.629812,9.44487],[76.630494,9.445106],[76.630511,9.4453],[76.630646,9.445603],[76.63101,9.44593],[76.631169,9.446217],[76.631098,9.446537],[76.630702,9.447184],[76.630612,9.44733],[76.630695,9.448377],[76.630968,9.449196],[76.631086,9.449278],[76.63196,9.449497],[76.632169,9.450222],[76.632169,9.450828],[76.632066,9.451201],[76.63211,9.451464],[76.63209,9.451609],[76.631822,9.45199],[76.631482,9.452474],[76.631436,9.452652],[76.63148,9.45279],[76.631695,9.453149],[76.631705,9.453423],[76.63181,9.453749],[76.632173,9.454082],[76.63249,9.454555],[76.632578,9.454774],[76.632734,9.455167],[76.632469,9.455618],[76.632453,9.455866],[76.632444,9.456018],[76.632624,9.456093],[76.633002,9.456142],[76.63331,9.456084],[76.633559,9.455867],[76.633618,9.455757],[76.633881,9.45586],[76.633871,9.456612],[76.633999,9.456832],[76.634513,9.457001],[76.634689,9.457209],[76.634751,9.457283],[76.634678,9.457552],[76.634594,9.457859],[76.634485,9.458251],[76.634358,9.458709],[76.634339,9.45885],[76.634387,9.458937],[76.634468,9.459037],[76.634658,9.45918],[76.634811,9.459339],[76.63493,9.459518],[76.63565,9.459904],[76.635545,9.46044],[76.635487,9.460559],[76.635442,9.460652],[76.635388,9.460752],[76.635341,9.460837],[76.635321,9.460976],[76.635256,9.461294],[76.635142,9.461719],[76.634953,9.461813],[76.63482,9.461963],[76.634833,9.462116],[76.634847,9.462271],[76.635031,9.462475],[76.635144,9.46258],[76.635249,9.462709],[76.635373,9.462788],[76.635472,9.462827],[76.635546,9.462752],[76.635569,9.462747],[76.635549,9.462722],[76.635522,9.462689],[76.635508,9.462671],[76.635494,9.462655],[76.635473,9.462629],[76.635492,9.462593],[76.635502,9.462574],[76.635518,9.462544],[76.635533,9.462514],[76.635536,9.462511],[76.635544,9.4625],[76.635564,9.462473],[76.635576,9.462464],[76.635595,9.462449],[76.635651,9.462415],[76.635705,9.462408],[76.635751,9.462418],[76.635784,9.46244],[76.635815,9.462564],[76.635863,9.462703],[76.6359,9.4628],[76.635936,9.462846],[76.635957,9.462861],[76.636001,9.462889],[76.636044,9.462907],[76.6361,9.462907],[76.636129,9.462886],[76.636149,9.46287],[76.636207,9.462814],[76.636243,9.462779],[76.63629,9.462776],[76.636325,9.462783],[76.636355,9.462805],[76.636375,9.462834],[76.63644,9.463234],[76.636442,9.463358],[76.636454,9.463652],[76.636465,9.463711],[76.636489,9.463755],[76.636536,9.463826],[76.636552,9.463848],[76.636609,9.463875],[76.636701,9.463923],[76.636775,9.46395],[76.636856,9.463974],[76.636914,9.463983],[76.637014,9.463979],[76.637096,9.463949],[76.637148,9.463915],[76.637226,9.463863],[76.637275,9.46383],[76.637335,9.463806],[76.637398,9.4638],[76.637424,9.4638],[76.637449,9.463818],[76.637462,9.463842],[76.637453,9.463935],[76.637445,9.464001],[76.637443,9.464073],[76.637466,9.464155],[76.637479,9.464199],[76.637532,9.464324],[76.637555,9.464371],[76.637658,9.464575],[76.637687,9.464627],[76.637724,9.464811],[76.637778,9.464954],[76.637898,9.46503],[76.638029,9.465089],[76.638138,9.465157],[76.638389,9.465331],[76.63842,9.465355],[76.63846,9.465443],[76.638463,9.465662],[76.638466,9.465721],[76.638487,9.465812],[76.638532,9.465885],[76.638774,9.466008],[76.638884,9.466099],[76.639026,9.466315],[76.639213,9.466597],[76.639178,9.466629],[76.639285,9.466758],[76.639332,9.466837],[76.63932,9.466944],[76.639298,9.467125],[76.63929,9.467239],[76.639336,9.467378],[76.639456,9.467516],[76.639578,9.467591],[76.639715,9.467627],[76.639884,9.467631],[76.639978,9.467621],[76.640177,9.467633],[76.640252,9.467628],[76.640342,9.467614],[76.640491,9.467557],[76.640599,9.467504],[76.640727,9.467384],[76.640769,9.46735],[76.640865,9.467208],[76.640907,9.467148],[76.640972,9.46711],[76.641035,9.46709],[76.641172,9.467104],[76.641275,9.4672],[76.641292,9.467278],[76.641301,9.467384],[76.641299,9.467447],[76.641267,9.467506],[76.641208,9.467549],[76.641112,9.467669],[76.641098,9.467716],[76.6411,9.467749],[76.64112,9.467818],[76.641137,9.467967],[76.64115,9.468108],[76.641203,9.468202],[76.641271,9.468295],[76.641337,9.468332],[76.641274,9.468701],[76.641473,9.468668],[76.641595,9.468569],[76.641564,9.468305],[76.642379,9.468155],[76.643364,9.467975],[76.643311,9.467815],[76.643159,9.467451],[76.643066,9.467142],[76.642973,9.466946],[76.642954,9.466845],[76.642866,9.466577],[76.642773,9.466346],[76.642605,9.465925],[76.642678,9.465533],[76.642704,9.465397],[76.642714,9.465162],[76.642739,9.46502],[76.642778,9.46479],[76.642895,9.46477],[76.643047,9.464743],[76.643338,9.464691],[76.643399,9.464996],[76.643537,9.464974],[76.643539,9.464705],[76.643757,9.464655],[76.643752,9.464483],[76.643714,9.464301],[76.643662,9.464054],[76.643575,9.463642],[76.64358,9.463123],[76.643583,9.462855],[76.643587,9.462495],[76.643589,9.462299],[76.643848,9.46172],[76.643929,9.46154],[76.643988,9.461407],[76.64404,9.461292],[76.644115,9.461123],[76.644174,9.460936],[76.644292,9.460565],[76.644321,9.460474],[76.64438,9.460287],[76.644443,9.46009],[76.644519,9.459849],[76.644632,9.459494],[76.644842,9.459574],[76.644932,9.459645],[76.64511,9.459786],[76.645528,9.460066],[76.645672,9.460162],[76.645783,9.460375],[76.64594,9.460679],[76.64615,9.461083],[76.64621,9.461152],[76.646533,9.461528],[76.646648,9.461661],[76.646909,9.4616],[76.647069,9.461563],[76.647358,9.461495],[76.647478,9.461467],[76.64772,9.461411],[76.647822,9.461391],[76.647758,9.461051],[76.64779,9.460741],[76.647802,9.460598],[76.647766,9.460454],[76.647864,9.460336],[76.648009,9.460162],[76.648193,9.459941],[76.648374,9.459724],[76.648534,9.459532],[76.648647,9.459533],[76.648869,9.459534],[76.649988,9.459475],[76.650128,9.459314],[76.650235,9.459192],[76.650453,9.458943],[76.650631,9.458804],[76.650596,9.458535],[76.650545,9.458151],[76.650524,9.45799],[76.650746,9.457818],[76.650989,9.457707],[76.651622,9.457418],[76.652042,9.45772],[76.652451,9.458014],[76.652662,9.458166],[76.65287,9.458316],[76.653083,9.458469],[76.653236,9.45844],[76.653433,9.458382],[76.653726,9.458294],[76.654033,9.458207],[76.654132,9.458183],[76.654384,9.458121],[76.6547,9.458043],[76.655042,9.457957],[76.655006,9.457752],[76.654944,9.457408],[76.654811,9.457376],[76.654834,9.457216],[76.654968,9.457201],[76.655001,9.457109],[76.655293,9.457134],[76.655465,9.457149],[76.655714,9.457171],[76.655814,9.457176],[76.655961,9.457183],[76.656349,9.457179],[76.656473,9.457178],[76.656878,9.457161],[76.657176,9.457034],[76.657341,9.457037],[76.657354,9.456663],[76.65734,9.456375],[76.657347,9.456191],[76.657352,9.456029],[76.657287,9.455949],[76.657218,9.455768],[76.657334,9.455708],[76.65746,9.455642],[76.6578,9.455465],[76.658219,9.455247],[76.658304,9.454917],[76.658329,9.454822],[76.658431,9.454714],[76.658743,9.454626],[76.659137,9.454515],[76.659208,9.454581],[76.659463,9.454715],[76.659667,9.454712],[76.659692,9.454842],[76.65973,9.455014],[76.659617,9.455609],[76.659797,9.455681],[76.660057,9.455698],[76.660174,9.455421],[76.66014,9.455062],[76.660185,9.454786],[76.660214,9.4547],[76.66015,9.454503],[76.660098,9.454344],[76.660319,9.454279],[76.66046,9.454237],[76.660649,9.454181],[76.660823,9.454138],[76.660931,9.454112],[76.661206,9.454044],[76.661333,9.454027],[76.661627,9.453919],[76.661888,9.453813],[76.662,9.453788],[76.662111,9.45367],[76.662332,9.453421],[76.662404,9.453248],[76.662471,9.453085],[76.662439,9.452791],[76.662684,9.452699],[76.662853,9.452561],[76.662991,9.452639],[76.663411,9.452739],[76.66335,9.452205],[76.663876,9.452153],[76.664087,9.452107],[76.664307,9.451916],[76.664419,9.451819],[76.664634,9.451584],[76.664866,9.451702],[76.665082,9.451585],[76.664999,9.451398],[76.66494,9.451008],[76.664809,9.450792],[76.664762,9.450713],[76.664689,9.450591],[76.664612,9.450487],[76.664467,9.450291],[76.665403,9.449861],[76.66567,9.449776],[76.666344,9.44956],[76.666623,9.449371],[76.666776,9.449267],[76.666961,9.449142],[76.667092,9.449052],[76.667521,9.449131],[76.667864,9.449195],[76.66831,9.449277],[76.668626,9.449335],[76.66896,9.449524],[76.669207,9.449664],[76.669287,9.449758],[76.669474,9.449976],[76.66951,9.450212],[76.66957,9.450607],[76.669619,9.450933],[76.669591,9.451328],[76.66958,9.451479],[76.669561,9.451742],[76.669547,9.451934],[76.669532,9.452148],[76.669523,9.452265],[76.669501,9.452406],[76.669543,9.452516],[76.669583,9.452657],[76.669633,9.45316],[76.669681,9.45341],[76.669758,9.453531],[76.669847,9.453673],[76.66991,9.453906],[76.669995,9.454226],[76.670243,9.454771],[76.67034,9.45499],[76.670389,9.455075],[76.670569,9.455404],[76.670947,9.455715],[76.671184,9.455845],[76.671562,9.456021],[76.671738,9.456099],[76.67196,9.456175],[76.672305,9.456296],[76.672422,9.456337],[76.672524,9.456366],[76.672648,9.456402],[76.67288,9.456485],[76.673085,9.456558],[76.673457,9.456422],[76.673793,9.45635],[76.674021,9.456302],[76.674354,9.45623],[76.674559,9.456044],[76.67463,9.455979],[76.674773,9.455773],[76.674903,9.455462],[76.675011,9.455201],[76.675097,9.455047],[76.675158,9.454851],[76.675348,9.454238],[76.675421,9.454003],[76.675479,9.453855],[76.675575,9.453768],[76.675696,9.453657],[76.675946,9.453497],[76.676041,9.453462],[76.676139,9.453425],[76.676513,9.453426],[76.677609,9.453784],[76.678211,9.453981],[76.679321,9.454344],[76.679886,9.454348],[76.68028,9.454351],[76.680619,9.454353],[76.68086,9.454354],[76.681242,9.454257],[76.681947,9.454079],[76.682649,9.453837],[76.683092,9.453685],[76.683396,9.453577],[76.683532,9.453528],[76.683632,9.453548],[76.68359,9.453368],[76.683549,9.453194],[76.683565,9.453063],[76.683535,9.452934],[76.683684,9.452863],[76.683798,9.452579],[76.683861,9.452437],[76.684008,9.452146],[76.684087,9.451993],[76.684165,9.451839],[76.684234,9.451652],[76.684308,9.451398],[76.684348,9.451271],[76.684512,9.451145],[76.684544,9.451017],[76.684568,9.450912],[76.684597,9.450727],[76.684601,9.450611],[76.684605,9.450498],[76.684605,9.450273],[76.684589,9.450125],[76.684557,9.449864],[76.684543,9.449663],[76.684586,9.449529],[76.684674,9.449255],[76.684705,9.449158],[76.684735,9.449062],[76.684763,9.448932],[76.684793,9.448764],[76.684816,9.448638],[76.684814,9.448546],[76.684803,9.448419],[76.684796,9.44821],[76.684783,9.448067],[76.684791,9.447956],[76.684788,9.447856],[76.684799,9.447704],[76.684775,9.447565],[76.684741,9.447362],[76.684701,9.447245],[76.684653,9.447104],[76.684558,9.446907],[76.684454,9.446725],[76.684385,9.446613],[76.684294,9.446497],[76.68424,9.446345],[76.684198,9.446206],[76.684162,9.446111],[76.68404,9.445944],[76.683889,9.445744],[76.683846,9.445626],[76.683931,9.445576],[76.684135,9.445443],[76.684295,9.445339],[76.684443,9.445225],[76.684569,9.445128],[76.684858,9.444905],[76.685063,9.444616],[76.685382,9.444355],[76.685309,9.444267],[76.685257,9.444135],[76.68511,9.443761],[76.68506,9.443635],[76.68518,9.443606],[76.685276,9.443596],[76.68538,9.443583],[76.6855,9.443558],[76.685638,9.443526],[76.686044,9.443432],[76.68619,9.443469],[76.686399,9.443523],[76.686757,9.443522],[76.686957,9.443535],[76.687049,9.443784],[76.687586,9.443789],[76.687728,9.44379],[76.687728,9.443585],[76.688005,9.443203],[76.687969,9.4431],[76.688051,9.443024],[76.688178,9.442906],[76.688093,9.442792],[76.687965,9.442621],[76.687826,9.442617],[76.687676,9.442597],[76.687559,9.442577],[76.687144,9.442449],[76.686659,9.441696],[76.686631,9.441585],[76.686604,9.44148],[76.686605,9.441356],[76.686608,9.441212],[76.686613,9.440812],[76.686867,9.44049],[76.687072,9.440231],[76.687134,9.440124],[76.687197,9.440015],[76.687194,9.439913],[76.687187,9.439642],[76.687175,9.439499],[76.687173,9.439376],[76.687171,9.439111],[76.687334,9.438812],[76.687746,9.438503],[76.687888,9.438418],[76.688133,9.438301],[76.688401,9.438172],[76.688597,9.438078],[76.688785,9.437933],[76.689037,9.43774],[76.689121,9.437645],[76.689254,9.437543],[76.689355,9.437466],[76.689504,9.437377],[76.689641,9.437284],[76.689784,9.437171],[76.689881,9.437095],[76.689956,9.437036],[76.690049,9.436986],[76.69017,9.43692],[76.690309,9.436839],[76.690418,9.436761],[76.6905,9.436706],[76.690593,9.436644],[76.690725,9.436498],[76.690792,9.436423],[76.690968,9.436182],[76.691044,9.436078],[76.691268,9.435813],[76.691358,9.435707],[76.691496,9.435593],[76.691923,9.435433],[76.692127,9.435359],[76.692257,9.435312],[76.692531,9.435223],[76.692678,9.435179],[76.69295,9.435096],[76.693471,9.434979],[76.693682,9.434888],[76.694341,9.434798],[76.694594,9.434742],[76.694802,9.4347],[76.694855,9.434577],[76.694908,9.434455],[76.694857,9.434243],[76.69496,9.433921],[76.694827,9.433712],[76.694801,9.433499],[76.694683,9.433374],[76.694728,9.433225],[76.694618,9.432958],[76.694635,9.43282],[76.694508,9.432473],[76.694418,9.432358],[76.694325,9.432245],[76.694263,9.432131],[76.694212,9.43199],[76.694177,9.431782],[76.694166,9.431687],[76.694129,9.431391],[76.694108,9.431228],[76.694024,9.431048],[76.694015,9.430851],[76.694004,9.430623],[76.694059,9.430481],[76.694115,9.430337],[76.694138,9.430096],[76.694259,9.429915],[76.694337,9.429851],[76.694337,9.429609],[76.694379,9.42952],[76.694313,9.429436],[76.694222,9.429322],[76.694131,9.429206],[76.694064,9.429121],[76.693987,9.42899],[76.694052,9.428729],[76.693919,9.428642],[76.693827,9.428593],[76.693815,9.428369],[76.693935,9.428243],[76.69402,9.428098],[76.693848,9.427955],[76.693808,9.42777],[76.693786,9.427649],[76.693687,9.427596],[76.693715,9.427335],[76.693427,9.427247],[76.69332,9.427229],[76.6931,9.427189],[76.693005,9.427273],[76.692894,9.427241],[76.692704,9.427086],[76.692554,9.426602],[76.692585,9.42644],[76.692699,9.426338],[76.692618,9.425967],[76.692451,9.425837],[76.69234,9.425647],[76.692266,9.425492],[76.692187,9.425329],[76.692137,9.425202],[76.692003,9.425014],[76.691867,9.424647],[76.69192,9.424564],[76.691989,9.424456],[76.692104,9.424468],[76.692341,9.424326],[76.692344,9.424224],[76.692616,9.424102],[76.692795,9.424043],[76.692976,9.423983],[76.693061,9.423936],[76.693202,9.423941],[76.69337,9.423915],[76.693599,9.423751],[76.693699,9.423599],[76.69387,9.423481],[76.693934,9.423371],[76.694029,9.423362],[76.694178,9.423199],[76.694308,9.423114],[76.694497,9.422952],[76.694686,9.422791],[76.694762,9.422713],[76.694925,9.422546],[76.694926,9.422394],[76.694992,9.422323],[76.695086,9.422222],[76.695109,9.422119],[76.695213,9.422031],[76.695296,9.421992],[76.695345,9.421822],[76.69549,9.421713],[76.695635,9.421603],[76.695767,9.421525],[76.695863,9.421387],[76.69596,9.42125],[76.69602,9.421115],[76.696253,9.421066],[76.696471,9.421032],[76.696659,9.421002],[76.696848,9.420812],[76.696748,9.420557],[76.69672,9.42018],[76.69671,9.420043],[76.696687,9.419912],[76.696672,9.41973],[76.696743,9.419478],[76.696813,9.419226],[76.696709,9.418963],[76.696498,9.418719],[76.696351,9.418758],[76.696151,9.418849],[76.695951,9.418939],[76.695772,9.418735],[76.695791,9.418487],[76.69572,9.418234],[76.695666,9.417943],[76.695623,9.417706],[76.695467,9.417668],[76.695214,9.417624],[76.695029,9.417592],[76.694927,9.417566],[76.694675,9.417504],[76.694532,9.417468],[76.694264,9.417414],[76.694142,9.41741],[76.69405,9.417407],[76.693938,9.417403],[76.693765,9.417406],[76.693637,9.417408],[76.693505,9.41741],[76.693398,9.417411],[76.693214,9.417414],[76.69268,9.417414],[76.692431,9.41741],[76.69224,9.417382],[76.692108,9.417376],[76.691832,9.417352],[76.691548,9.417332],[76.691189,9.417346],[76.691031,9.417361],[76.690855,9.417378],[76.690671,9.417372],[76.690518,9.417366],[76.69039,9.417361],[76.690243,9.417356],[76.6901,9.41735],[76.689981,9.417339],[76.689818,9.417324],[76.689566,9.417309],[76.68945,9.417302],[76.689325,9.417294],[76.68905,9.41727],[76.688846,9.41725],[76.688723,9.417238],[76.688438,9.41715],[76.688316,9.417002],[76.688248,9.416887],[76.6882,9.416808],[76.688086,9.416583],[76.688014,9.416441],[76.687964,9.41624],[76.687921,9.416061],[76.687863,9.415884],[76.687813,9.415807],[76.687777,9.415722],[76.687721,9.415592],[76.68768,9.415504],[76.687805,9.415362],[76.687842,9.415202],[76.687658,9.415078],[76.68762,9.414988],[76.687591,9.414811],[76.687627,9.414399],[76.687635,9.414308],[76.687654,9.414103],[76.687675,9.413867],[76.687677,9.413732],[76.68768,9.413612],[76.687621,9.413514],[76.687506,9.413303],[76.687354,9.41316],[76.687331,9.413032],[76.687252,9.41281],[76.687158,9.412544],[76.687107,9.412433],[76.687091,9.412268],[76.687073,9.412082],[76.687037,9.411702],[76.686705,9.411625],[76.686567,9.411606],[76.686311,9.411577],[76.68612,9.411672],[76.686004,9.41176],[76.685834,9.411883],[76.685601,9.412052],[76.685271,9.412359],[76.685185,9.412459],[76.685061,9.412602],[76.684728,9.412964],[76.684621,9.41308],[76.684354,9.413155],[76.684055,9.413237],[76.683658,9.413371],[76.683473,9.413474],[76.68311,9.413681],[76.682875,9.413764],[76.682622,9.413854],[76.682409,9.414038],[76.682299,9.414133],[76.682208,9.414215],[76.68213,9.414286],[76.681952,9.414448],[76.681762,9.414592],[76.68163,9.414691],[76.681423,9.414785],[76.681296,9.414842],[76.681151,9.414909],[76.680924,9.414959],[76.680672,9.415014],[76.680458,9.41506],[76.680232,9.415129],[76.680125,9.415174],[76.68002,9.415217],[76.679889,9.415266],[76.679531,9.415379],[76.679377,9.415442],[76.679219,9.415492],[76.679075,9.415538],[76.678911,9.41559],[76.67877,9.415635],[76.678623,9.415739],[76.678525,9.415766],[76.678336,9.415818],[76.678141,9.415964],[76.677894,9.41616],[76.677731,9.41629],[76.677632,9.416369],[76.677415,9.416398],[76.677201,9.416426],[76.676802,9.416479],[76.676739,9.416192],[76.676423,9.416247],[76.676089,9.416271],[76.675913,9.416284],[76.675703,9.416415],[76.675505,9.416427],[76.6753,9.416353],[76.67517,9.416504],[76.675122,9.416616],[76.675058,9.416766],[76.674921,9.416875],[76.674831,9.417172],[76.674589,9.417104],[76.674469,9.417109],[76.674343,9.417147],[76.674185,9.417127],[76.674062,9.417074],[76.673896,9.417003],[76.67373,9.41693],[76.673556,9.416887],[76.673419,9.416888],[76.673181,9.416905],[76.673057,9.416917],[76.672909,9.417033],[76.672813,9.417195],[76.672791,9.417343],[76.672651,9.417363],[76.672419,9.417397],[76.67221,9.417398],[76.672146,9.417578],[76.672081,9.417679],[76.672007,9.417795],[76.671777,9.417836],[76.671642,9.417784],[76.671529,9.417783],[76.671405,9.417829],[76.671256,9.417912],[76.670937,9.418092],[76.670686,9.418106],[76.670502,9.418116],[76.670209,9.418163],[76.669918,9.418185],[76.669819,9.418177],[76.669664,9.418197],[76.66955,9.41822],[76.669412,9.418246],[76.669166,9.418295],[76.668953,9.41848],[76.668825,9.418591],[76.668859,9.418682],[76.668973,9.418989],[76.669013,9.419263],[76.66905,9.419512],[76.669041,9.419793],[76.669033,9.420084],[76.669032,9.420282],[76.669032,9.420891],[76.669019,9.420985],[76.668985,9.421236],[76.66895,9.421487],[76.668864,9.421704],[76.668798,9.421872],[76.668708,9.422065],[76.668519,9.422466],[76.668382,9.422758],[76.668274,9.422955],[76.668148,9.423184],[76.668087,9.423297],[76.667838,9.423535],[76.667716,9.423632],[76.667564,9.42391],[76.667318,9.423993],[76.66719,9.424003],[76.667,9.424035],[76.666624,9.424034],[76.666316,9.424108],[76.666075,9.42404],[76.665818,9.42411],[76.665602,9.424062],[76.665461,9.424116],[76.665145,9.424099],[76.664993,9.424091],[76.664885,9.424124],[76.664769,9.424136],[76.664491,9.424165],[76.664206,9.424211],[76.664082,9.424231],[76.663706,9.424291],[76.663465,9.424479],[76.663341,9.424586],[76.663128,9.424797],[76.662972,9.42496],[76.662896,9.425121],[76.662865,9.425581],[76.662852,9.425809],[76.662831,9.42613],[76.662829,9.426278],[76.662827,9.426499],[76.662842,9.426801],[76.662857,9.42703],[76.662868,9.427183],[76.662724,9.427279],[76.662496,9.427386]]]},\"properties\":{\"LSGD\":\"Mallappally\",\"Mandal\":\"Mallappally\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.542051,9.36094],[76.541854,9.360905],[76.541547,9.36085],[76.541442,9.360844],[76.541172,9.360826],[76.540881,9.360808],[76.540344,9.360828],[76.540038,9.360881],[76.539852,9.360914],[76.539571,9.361071],[76.539264,9.361123],[76.538978,9.361288],[76.538755,9.361481],[76.538455,9.3616],[76.538212,9.361697],[76.538101,9.361741],[76.537989,9.36182],[76.537773,9.361975],[76.537533,9.36206],[76.537432,9.362112],[76.536746,9.362461],[76.53584,9.362922],[76.534951,9.363137],[76.534429,9.363262],[76.534246,9.363303],[76.533691,9.363417],[76.533523,9.363456],[76.532868,9.3636],[76.532459,9.3637],[76.532051,9.3638],[76.531266,9.364182],[76.530673,9.364567],[76.530334,9.365007],[76.529911,9.365555],[76.529605,9.366481],[76.529385,9.366868],[76.529217,9.367198],[76.529125,9.367377],[76.528947,9.367639],[76.528666,9.368054],[76.528567,9.368206],[76.528458,9.368325],[76.528092,9.368767],[76.52772,9.368997],[76.527398,9.369197],[76.527203,9.369301],[76.526891,9.369375],[76.526573,9.369367],[76.526278,9.3694],[76.526079,9.369391],[76.525561,9.369095],[76.524923,9.368814],[76.524764,9.36875],[76.524241,9.368539],[76.523885,9.368394],[76.523775,9.368307],[76.523597,9.368452],[76.523206,9.368549],[76.521506,9.368903],[76.520641,9.369173],[76.519105,9.369643],[76.518451,9.369819],[76.517881,9.369898],[76.517885,9.369914],[76.517501,9.369939],[76.516921,9.36996],[76.515306,9.370067],[76.51495,9.370093],[76.51469,9.370265],[76.514465,9.370509],[76.514433,9.37082],[76.514621,9.371761],[76.514768,9.372151],[76.51479,9.373088],[76.514679,9.373364],[76.514605,9.373411],[76.513949,9.37344],[76.513305,9.373452],[76.512875,9.373481],[76.512684,9.373615],[76.512474,9.373884],[76.51218,9.37438],[76.51181,9.374747],[76.511125,9.375319],[76.510509,9.375657],[76.510312,9.375796],[76.510177,9.375888],[76.509887,9.376263],[76.509858,9.376315],[76.509776,9.376734],[76.50995,9.377808],[76.510167,9.378368],[76.510382,9.378975],[76.510488,9.379485],[76.510624,9.379971],[76.510634,9.38018],[76.510622,9.380422],[76.510579,9.380622],[76.510672,9.380997],[76.510727,9.381206],[76.510852,9.381633],[76.510978,9.381892],[76.511007,9.381986],[76.511233,9.382202],[76.511604,9.382202],[76.511902,9.382274],[76.512014,9.382453],[76.511994,9.382724],[76.511973,9.38301],[76.511929,9.383243],[76.511878,9.383624],[76.51181,9.383897],[76.511756,9.384125],[76.511746,9.38435],[76.511943,9.38431],[76.512097,9.384279],[76.512183,9.38424],[76.512336,9.384171],[76.512479,9.384111],[76.512574,9.384071],[76.512729,9.383979],[76.512797,9.383881],[76.512918,9.383839],[76.513024,9.383802],[76.513158,9.383756],[76.513362,9.38368],[76.513501,9.383628],[76.513631,9.383575],[76.51385,9.383485],[76.514012,9.383528],[76.514102,9.383479],[76.514273,9.383386],[76.514448,9.383322],[76.514554,9.38326],[76.514669,9.382986],[76.514705,9.3829],[76.514758,9.38282],[76.514941,9.382537],[76.51501,9.382471],[76.515088,9.382397],[76.51517,9.382319],[76.515366,9.382188],[76.515465,9.382123],[76.515554,9.38202],[76.515709,9.38184],[76.515982,9.381466],[76.516014,9.381304],[76.516012,9.381145],[76.515998,9.380928],[76.516008,9.380614],[76.516401,9.380324],[76.516641,9.380163],[76.516913,9.37998],[76.517093,9.379973],[76.517537,9.379707],[76.517385,9.379422],[76.517176,9.379032],[76.517116,9.378859],[76.51771,9.378689],[76.51761,9.378353],[76.517544,9.378127],[76.51748,9.377913],[76.517416,9.377696],[76.51732,9.377371],[76.51727,9.377201],[76.517218,9.377026],[76.517182,9.376902],[76.517122,9.3767],[76.517383,9.376533],[76.517608,9.376407],[76.517801,9.376335],[76.517947,9.376315],[76.518047,9.376302],[76.518229,9.376277],[76.518333,9.376263],[76.518476,9.376204],[76.518617,9.376145],[76.518785,9.376169],[76.518932,9.376319],[76.519152,9.376292],[76.519257,9.376279],[76.5195,9.37619],[76.51959,9.376156],[76.5198,9.376074],[76.520064,9.375972],[76.520456,9.375972],[76.520802,9.376114],[76.521004,9.376236],[76.521103,9.376296],[76.521115,9.376397],[76.52101,9.376429],[76.520904,9.376461],[76.520931,9.376709],[76.520946,9.376857],[76.520972,9.376947],[76.521038,9.377182],[76.521158,9.376803],[76.521251,9.376771],[76.521474,9.376696],[76.521623,9.376623],[76.521708,9.376582],[76.522062,9.37638],[76.522224,9.37632],[76.52239,9.376259],[76.522347,9.376103],[76.522637,9.376008],[76.522773,9.375973],[76.523135,9.375866],[76.523471,9.375779],[76.523611,9.375743],[76.523733,9.375528],[76.52411,9.375461],[76.524102,9.37562],[76.524212,9.375685],[76.524706,9.375472],[76.524816,9.375428],[76.525022,9.375346],[76.525075,9.37543],[76.52517,9.375413],[76.525606,9.375355],[76.525756,9.375391],[76.526,9.375315],[76.52621,9.37525],[76.526294,9.375209],[76.52664,9.375041],[76.526752,9.374982],[76.526896,9.375057],[76.527006,9.375209],[76.527273,9.375071],[76.527428,9.375051],[76.527691,9.375154],[76.527977,9.375162],[76.528111,9.375175],[76.528332,9.375196],[76.528514,9.375227],[76.528747,9.375266],[76.528884,9.37529],[76.528988,9.375309],[76.529081,9.375327],[76.529279,9.375506],[76.529519,9.375569],[76.529657,9.375665],[76.529779,9.375617],[76.529952,9.37573],[76.530127,9.37578],[76.530337,9.375865],[76.530489,9.375902],[76.530419,9.376023],[76.530314,9.376207],[76.530141,9.376371],[76.530016,9.376456],[76.530053,9.376645],[76.53003,9.376868],[76.529936,9.376935],[76.529656,9.377209],[76.529826,9.377512],[76.529955,9.37783],[76.529938,9.378066],[76.529924,9.378269],[76.529733,9.378271],[76.529373,9.37824],[76.529143,9.378322],[76.529013,9.378537],[76.528892,9.378706],[76.528824,9.378843],[76.528632,9.379244],[76.528637,9.379468],[76.528613,9.379625],[76.528637,9.379794],[76.528532,9.380044],[76.528614,9.380124],[76.528865,9.38018],[76.528987,9.380208],[76.529133,9.380209],[76.529235,9.380218],[76.529356,9.380227],[76.529574,9.380203],[76.529726,9.380186],[76.529983,9.380225],[76.530226,9.380262],[76.530508,9.380216],[76.53077,9.380173],[76.530882,9.380155],[76.530866,9.380054],[76.531182,9.37999],[76.531302,9.379965],[76.531437,9.379938],[76.531552,9.37985],[76.531516,9.37959],[76.531499,9.379461],[76.531718,9.379366],[76.531669,9.379239],[76.531764,9.379103],[76.531865,9.378855],[76.532424,9.378681],[76.5334,9.378306],[76.533496,9.378295],[76.533612,9.378238],[76.534015,9.378049],[76.534349,9.377901],[76.534536,9.377854],[76.534695,9.377813],[76.534557,9.377745],[76.534559,9.377621],[76.53475,9.377636],[76.534901,9.377648],[76.535164,9.377669],[76.535229,9.377837],[76.535288,9.377948],[76.53534,9.378033],[76.53541,9.378147],[76.535501,9.378161],[76.535691,9.37794],[76.535678,9.37779],[76.535754,9.377667],[76.535952,9.377623],[76.535962,9.37753],[76.536053,9.377501],[76.536173,9.377522],[76.536286,9.377541],[76.536399,9.377586],[76.536585,9.377633],[76.536688,9.37763],[76.536804,9.377627],[76.53702,9.377592],[76.536975,9.37742],[76.536954,9.377322],[76.537051,9.377298],[76.537153,9.377272],[76.537366,9.377219],[76.53765,9.377128],[76.537755,9.377094],[76.537848,9.377056],[76.538027,9.376979],[76.538013,9.376872],[76.538544,9.376927],[76.538699,9.376817],[76.538774,9.376763],[76.538882,9.376623],[76.538928,9.376808],[76.53917,9.376792],[76.539383,9.376763],[76.539663,9.376759],[76.539807,9.376757],[76.540053,9.37677],[76.540254,9.376833],[76.540457,9.376752],[76.54059,9.376683],[76.540673,9.376605],[76.540786,9.376498],[76.540865,9.376392],[76.541035,9.376367],[76.54117,9.376334],[76.541611,9.376202],[76.54178,9.376151],[76.54199,9.376109],[76.542159,9.376076],[76.542273,9.376053],[76.542421,9.376024],[76.542513,9.376006],[76.542532,9.376126],[76.542552,9.376242],[76.542585,9.376397],[76.54263,9.376603],[76.543094,9.37651],[76.543243,9.376518],[76.543431,9.376453],[76.54353,9.376436],[76.543692,9.376408],[76.544089,9.376341],[76.544351,9.376267],[76.544559,9.376209],[76.544882,9.376109],[76.544972,9.376082],[76.545387,9.375927],[76.545643,9.375904],[76.545607,9.375741],[76.546006,9.375613],[76.546143,9.375685],[76.546082,9.375814],[76.546133,9.375957],[76.546344,9.37587],[76.546675,9.375857],[76.546939,9.375853],[76.547083,9.375911],[76.54721,9.375901],[76.547423,9.375957],[76.547497,9.375833],[76.547634,9.375715],[76.547757,9.375685],[76.547876,9.375641],[76.54817,9.375584],[76.548322,9.375565],[76.548447,9.375549],[76.548632,9.375542],[76.548635,9.375692],[76.548693,9.375847],[76.5489,9.375844],[76.549048,9.375842],[76.549283,9.375865],[76.549531,9.37589],[76.549546,9.376003],[76.549572,9.376166],[76.549596,9.37629],[76.549611,9.376389],[76.549797,9.376395],[76.55011,9.376405],[76.550545,9.376153],[76.550711,9.376056],[76.550629,9.375827],[76.55088,9.375701],[76.551387,9.375735],[76.551397,9.375639],[76.551414,9.375495],[76.551496,9.375244],[76.551509,9.374881],[76.551617,9.374615],[76.551851,9.374269],[76.552213,9.374142],[76.552675,9.373981],[76.552811,9.373893],[76.553065,9.373589],[76.553152,9.37346],[76.553048,9.373143],[76.553006,9.373],[76.552941,9.372783],[76.55282,9.372381],[76.552692,9.372058],[76.552594,9.37181],[76.55251,9.371646],[76.552603,9.371473],[76.552604,9.371379],[76.552659,9.371194],[76.552594,9.3709],[76.552614,9.370748],[76.55263,9.370626],[76.552708,9.3705],[76.552709,9.370381],[76.55278,9.370156],[76.552807,9.370018],[76.552848,9.369818],[76.552812,9.369718],[76.552749,9.369539],[76.552665,9.3693],[76.552636,9.369192],[76.552585,9.369004],[76.552533,9.368769],[76.552685,9.368611],[76.552874,9.368764],[76.552917,9.368931],[76.553293,9.369104],[76.553485,9.369148],[76.553678,9.369192],[76.553793,9.369203],[76.553902,9.369169],[76.554123,9.36907],[76.554279,9.369],[76.554397,9.368948],[76.554472,9.368883],[76.554694,9.368747],[76.554869,9.36864],[76.555096,9.368501],[76.55522,9.368305],[76.555358,9.368088],[76.555464,9.367921],[76.555597,9.367682],[76.555863,9.367206],[76.556085,9.367093],[76.556323,9.366973],[76.556593,9.366768],[76.55692,9.366637],[76.557122,9.366473],[76.557199,9.366411],[76.5573,9.366357],[76.557491,9.366128],[76.557617,9.365977],[76.558081,9.365844],[76.55843,9.365744],[76.558759,9.365649],[76.559082,9.365499],[76.559509,9.3653],[76.559653,9.365233],[76.559912,9.364918],[76.560169,9.36462],[76.560212,9.36454],[76.56035,9.364339],[76.560444,9.364203],[76.560615,9.364019],[76.560672,9.363923],[76.560847,9.363709],[76.560786,9.363356],[76.56073,9.363031],[76.561133,9.362688],[76.561269,9.362632],[76.561464,9.362549],[76.561592,9.362517],[76.561733,9.362475],[76.56192,9.362335],[76.562004,9.362143],[76.56202,9.361885],[76.561979,9.361795],[76.562011,9.361669],[76.562056,9.361487],[76.562085,9.361246],[76.562115,9.360985],[76.562154,9.360649],[76.562182,9.360521],[76.562246,9.360236],[76.562802,9.359788],[76.562743,9.359579],[76.56277,9.359188],[76.562749,9.359013],[76.562872,9.35839],[76.562888,9.358027],[76.562928,9.357488],[76.562916,9.357316],[76.562843,9.356824],[76.5628,9.356666],[76.562721,9.356374],[76.562036,9.356111],[76.561625,9.355826],[76.56154,9.355755],[76.560724,9.355208],[76.560649,9.354871],[76.560637,9.354726],[76.560691,9.354371],[76.560929,9.354216],[76.56103,9.35415],[76.561221,9.353973],[76.561355,9.353853],[76.561743,9.353402],[76.561825,9.353128],[76.561782,9.352703],[76.561644,9.352027],[76.56151,9.351684],[76.56123,9.351226],[76.560931,9.350946],[76.560436,9.350668],[76.559751,9.350499],[76.559034,9.350326],[76.558547,9.350207],[76.558045,9.350056],[76.557532,9.349904],[76.557021,9.349812],[76.556187,9.349736],[76.555659,9.349833],[76.555205,9.350169],[76.555003,9.350376],[76.55483,9.350564],[76.554428,9.351029],[76.55408,9.35142],[76.553439,9.351916],[76.552636,9.351904],[76.552349,9.351721],[76.552352,9.351719],[76.552356,9.351716],[76.552297,9.351686],[76.55201,9.351503],[76.551805,9.351346],[76.55143,9.351029],[76.550702,9.350449],[76.550593,9.350531],[76.550263,9.350802],[76.550134,9.350908],[76.549568,9.351486],[76.549404,9.351732],[76.549126,9.352063],[76.548802,9.352515],[76.548719,9.352611],[76.54794,9.353477],[76.547666,9.35376],[76.547389,9.354045],[76.547061,9.354405],[76.546822,9.354657],[76.546714,9.35482],[76.546406,9.355305],[76.546166,9.355735],[76.546123,9.355897],[76.546029,9.356248],[76.546055,9.356388],[76.546076,9.356634],[76.546122,9.356801],[76.546202,9.356875],[76.546387,9.357105],[76.546582,9.357275],[76.546701,9.3573],[76.546786,9.357372],[76.547171,9.357522],[76.547475,9.357634],[76.547891,9.357791],[76.548485,9.358206],[76.548738,9.358354],[76.548803,9.35847],[76.549076,9.358809],[76.549191,9.359004],[76.549259,9.359108],[76.549366,9.359433],[76.549602,9.360147],[76.54958,9.360361],[76.549546,9.360475],[76.54921,9.361157],[76.549163,9.361254],[76.548965,9.361431],[76.548843,9.361492],[76.54811,9.361796],[76.547923,9.361864],[76.547083,9.362009],[76.546345,9.362082],[76.545687,9.362146],[76.544914,9.361888],[76.543903,9.36155],[76.543084,9.361276],[76.542217,9.360987],[76.542051,9.36094]]]},\"properties\":{\"LSGD\":\"Nedumpuram\",\"Mandal\":\"Thiruvalla\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.488729,9.330722],[76.488852,9.330548],[76.488991,9.330363],[76.489135,9.330092],[76.48949,9.329714],[76.489594,9.329603],[76.489248,9.329584],[76.489678,9.328839],[76.487716,9.32943],[76.487235,9.329456],[76.485471,9.329404],[76.484107,9.329113],[76.482503,9.32885],[76.48028,9.328616],[76.477901,9.328668],[76.474398,9.328879],[76.474398,9.329671],[76.474719,9.33041],[76.474398,9.330937],[76.473649,9.331344],[76.473273,9.331752],[76.47327,9.332119],[76.473398,9.332524],[76.473607,9.333003],[76.473864,9.333312],[76.474211,9.333655],[76.474745,9.334347],[76.475134,9.334855],[76.47525,9.335035],[76.475342,9.335221],[76.475976,9.336161],[76.476029,9.336768],[76.475601,9.337058],[76.474779,9.33728],[76.474957,9.337566],[76.475109,9.337729],[76.475212,9.337833],[76.47532,9.337917],[76.475334,9.337928],[76.476377,9.338667],[76.476377,9.339063],[76.476992,9.338852],[76.478516,9.339274],[76.478302,9.34025],[76.478596,9.341121],[76.479639,9.340778],[76.479949,9.340524],[76.479912,9.340787],[76.480074,9.340956],[76.480322,9.340932],[76.480475,9.34142],[76.481321,9.342625],[76.482362,9.343929],[76.48283,9.345141],[76.484059,9.345776],[76.485229,9.345834],[76.486012,9.34608],[76.486487,9.3463],[76.487102,9.346585],[76.488596,9.34716],[76.489878,9.346926],[76.490978,9.346781],[76.493332,9.346956],[76.494524,9.347071],[76.495385,9.346898],[76.495893,9.346763],[76.496616,9.347303],[76.497163,9.348151],[76.498004,9.348537],[76.498844,9.348884],[76.499587,9.349347],[76.500487,9.350036],[76.501403,9.350394],[76.501938,9.350475],[76.503061,9.350473],[76.504077,9.350648],[76.505513,9.351306],[76.505884,9.351741],[76.506507,9.352424],[76.507141,9.353048],[76.50756,9.353483],[76.508901,9.354707],[76.510033,9.354617],[76.511434,9.354818],[76.512351,9.354494],[76.512731,9.353643],[76.513335,9.353778],[76.514492,9.354329],[76.515328,9.354297],[76.516751,9.354178],[76.51674,9.354356],[76.51682,9.354867],[76.516578,9.355976],[76.516246,9.356225],[76.516266,9.356567],[76.516201,9.356876],[76.51618,9.357249],[76.516536,9.357313],[76.51659,9.35759],[76.516201,9.357526],[76.516072,9.357643],[76.516126,9.358165],[76.516238,9.358295],[76.51639,9.358514],[76.516379,9.358642],[76.516433,9.358845],[76.516417,9.358979],[76.516597,9.359794],[76.51665,9.359928],[76.516395,9.36003],[76.516573,9.360371],[76.516997,9.360894],[76.517143,9.361377],[76.517084,9.361484],[76.516934,9.361558],[76.516773,9.361646],[76.516739,9.361798],[76.516689,9.361837],[76.516531,9.361979],[76.516431,9.362061],[76.516417,9.36211],[76.516409,9.362151],[76.516407,9.362315],[76.516431,9.362522],[76.516431,9.362701],[76.51632,9.362947],[76.516222,9.363008],[76.51606,9.363142],[76.516021,9.36336],[76.515886,9.363782],[76.51572,9.364033],[76.515986,9.364461],[76.516026,9.364521],[76.516191,9.364872],[76.516402,9.365231],[76.516636,9.365456],[76.516838,9.365674],[76.517016,9.365776],[76.517266,9.365945],[76.517637,9.366027],[76.517783,9.366021],[76.518199,9.365993],[76.518659,9.365859],[76.519204,9.365669],[76.519842,9.365444],[76.520311,9.365331],[76.520981,9.365197],[76.521646,9.365059],[76.522341,9.364979],[76.524054,9.365335],[76.523994,9.365132],[76.523866,9.364405],[76.5241,9.363537],[76.524242,9.363182],[76.524431,9.362707],[76.524428,9.362181],[76.52435,9.361674],[76.52459,9.360999],[76.525276,9.360666],[76.525846,9.360526],[76.526253,9.360427],[76.52648,9.360374],[76.526645,9.360336],[76.526829,9.36024],[76.52694,9.360181],[76.527192,9.360056],[76.527475,9.359871],[76.527687,9.359727],[76.527792,9.359658],[76.527911,9.359583],[76.528196,9.359406],[76.528445,9.359243],[76.528531,9.359193],[76.528741,9.359072],[76.528895,9.358983],[76.528978,9.358832],[76.529019,9.358725],[76.529061,9.358619],[76.529096,9.358526],[76.529171,9.35826],[76.529243,9.358005],[76.529319,9.357818],[76.529428,9.357548],[76.529535,9.357272],[76.529594,9.357079],[76.529626,9.356969],[76.529693,9.356743],[76.529711,9.356647],[76.52973,9.356549],[76.529794,9.356298],[76.529847,9.356087],[76.529909,9.355884],[76.529938,9.355787],[76.530013,9.355551],[76.530077,9.355365],[76.530135,9.355198],[76.530201,9.355031],[76.530243,9.35476],[76.530282,9.354554],[76.530338,9.354253],[76.530366,9.35412],[76.530424,9.353843],[76.530503,9.353503],[76.530611,9.353044],[76.531011,9.353101],[76.531373,9.352807],[76.531428,9.352387],[76.532002,9.352291],[76.532195,9.352259],[76.532625,9.352319],[76.532618,9.35213],[76.532613,9.351984],[76.532532,9.351728],[76.53248,9.351569],[76.532406,9.351339],[76.532333,9.351113],[76.532462,9.350792],[76.532366,9.350563],[76.532238,9.350416],[76.531995,9.350097],[76.531673,9.350488],[76.531507,9.350379],[76.531102,9.349762],[76.530765,9.349612],[76.530466,9.349507],[76.530227,9.349419],[76.529958,9.349359],[76.52976,9.34908],[76.529617,9.348878],[76.529492,9.348626],[76.529486,9.348292],[76.529506,9.347996],[76.529539,9.347773],[76.529555,9.347665],[76.529622,9.347494],[76.529767,9.347308],[76.530089,9.347186],[76.530161,9.347051],[76.530229,9.346926],[76.530323,9.346774],[76.530234,9.346685],[76.530051,9.346784],[76.529834,9.346791],[76.529742,9.346627],[76.529728,9.34653],[76.52971,9.346411],[76.529682,9.346215],[76.529592,9.34563],[76.529306,9.345559],[76.529166,9.345525],[76.529037,9.34554],[76.528919,9.345591],[76.528757,9.345662],[76.528668,9.345734],[76.528522,9.345853],[76.528382,9.345963],[76.528254,9.346062],[76.528017,9.346156],[76.527431,9.346071],[76.527142,9.345788],[76.527039,9.345644],[76.526933,9.345497],[76.526762,9.34526],[76.526617,9.344737],[76.526609,9.344473],[76.526058,9.34376],[76.526005,9.3433],[76.525954,9.342857],[76.526135,9.342815],[76.52685,9.342649],[76.527032,9.34237],[76.52718,9.342192],[76.527443,9.341875],[76.527524,9.341778],[76.527668,9.341707],[76.527943,9.341871],[76.528254,9.341701],[76.528561,9.341531],[76.528737,9.341434],[76.528883,9.341328],[76.528962,9.341271],[76.529054,9.341204],[76.529347,9.340992],[76.529613,9.340752],[76.529959,9.340439],[76.53051,9.340244],[76.530696,9.340166],[76.530829,9.340114],[76.530977,9.340043],[76.531079,9.33993],[76.531383,9.339836],[76.531666,9.33979],[76.531935,9.339751],[76.532225,9.33971],[76.532387,9.339639],[76.532615,9.339538],[76.533017,9.339166],[76.533244,9.338955],[76.533241,9.338823],[76.533225,9.338102],[76.53322,9.337888],[76.533082,9.337655],[76.532903,9.337351],[76.53282,9.337292],[76.53274,9.337234],[76.532443,9.337124],[76.532269,9.33706],[76.532179,9.337027],[76.531987,9.336956],[76.531754,9.336927],[76.53155,9.336892],[76.531312,9.336851],[76.531196,9.336831],[76.531025,9.336804],[76.530211,9.336833],[76.529911,9.337199],[76.529802,9.337336],[76.529563,9.33692],[76.52954,9.336683],[76.529503,9.336507],[76.529335,9.336496],[76.529234,9.336489],[76.529125,9.336482],[76.528891,9.336466],[76.528763,9.336457],[76.528455,9.336436],[76.528356,9.33627],[76.528186,9.335984],[76.528023,9.335985],[76.527633,9.335988],[76.52684,9.335527],[76.5267,9.335446],[76.526599,9.335387],[76.5264,9.335271],[76.5263,9.335208],[76.526217,9.335155],[76.526133,9.335102],[76.526154,9.334871],[76.526047,9.334839],[76.525938,9.334807],[76.525727,9.334743],[76.525619,9.334711],[76.525512,9.334679],[76.525403,9.334647],[76.525296,9.334615],[76.525188,9.334583],[76.524975,9.334519],[76.524868,9.334487],[76.524655,9.334423],[76.524385,9.334342],[76.524385,9.334619],[76.524112,9.334616],[76.523992,9.334444],[76.523835,9.334431],[76.52286,9.334575],[76.522749,9.334577],[76.52268,9.33451],[76.522533,9.334534],[76.522308,9.334571],[76.521494,9.334402],[76.521403,9.334388],[76.521059,9.334339],[76.520958,9.333362],[76.520141,9.333382],[76.520037,9.333385],[76.520029,9.33385],[76.519306,9.333712],[76.519154,9.333683],[76.518706,9.333597],[76.518113,9.333483],[76.517704,9.333637],[76.517624,9.334221],[76.516961,9.334151],[76.516183,9.334068],[76.516029,9.333876],[76.515778,9.33348],[76.515632,9.333435],[76.515387,9.333361],[76.515181,9.332974],[76.514556,9.333051],[76.513708,9.333156],[76.513534,9.332909],[76.513407,9.332835],[76.513286,9.332831],[76.512556,9.332809],[76.5125,9.332709],[76.512415,9.332456],[76.511359,9.332499],[76.511106,9.332503],[76.510541,9.332511],[76.510412,9.331847],[76.509999,9.331936],[76.509876,9.33205],[76.509806,9.332114],[76.509727,9.332188],[76.509624,9.3322],[76.509459,9.33222],[76.509281,9.332241],[76.509169,9.332254],[76.508992,9.332275],[76.508759,9.332303],[76.508502,9.332334],[76.508281,9.33236],[76.508007,9.332393],[76.507901,9.332406],[76.507551,9.332419],[76.507355,9.332426],[76.507135,9.332434],[76.506804,9.332446],[76.506653,9.332452],[76.506442,9.332409],[76.506302,9.332381],[76.506161,9.332353],[76.506013,9.332323],[76.505806,9.332281],[76.505628,9.332245],[76.505487,9.332216],[76.505371,9.332193],[76.505195,9.332084],[76.505082,9.332015],[76.504617,9.331728],[76.504354,9.331826],[76.504146,9.331784],[76.503861,9.331726],[76.503731,9.3317],[76.503635,9.331665],[76.503389,9.331578],[76.503055,9.33146],[76.502858,9.331627],[76.502774,9.331701],[76.502546,9.331711],[76.502245,9.331794],[76.50209,9.331837],[76.501954,9.331874],[76.501471,9.331661],[76.501363,9.331757],[76.500982,9.331779],[76.500937,9.331907],[76.500806,9.331928],[76.500822,9.331461],[76.500472,9.331442],[76.500431,9.33136],[76.500297,9.331091],[76.500041,9.331031],[76.499823,9.330991],[76.499696,9.330975],[76.499336,9.330927],[76.499108,9.331046],[76.499151,9.331192],[76.499269,9.331598],[76.499446,9.331628],[76.499517,9.331808],[76.499612,9.332052],[76.499651,9.332152],[76.499683,9.332398],[76.499704,9.332556],[76.499721,9.332689],[76.499754,9.332939],[76.499786,9.333181],[76.499804,9.33332],[76.499829,9.333518],[76.499844,9.333627],[76.499894,9.334012],[76.49976,9.334105],[76.499636,9.334188],[76.499628,9.334565],[76.499616,9.335163],[76.49961,9.335504],[76.499583,9.335698],[76.499552,9.335919],[76.498982,9.336776],[76.498903,9.336953],[76.498711,9.337231],[76.498155,9.33715],[76.498019,9.337158],[76.497891,9.337163],[76.497464,9.337177],[76.496132,9.337168],[76.496019,9.337168],[76.494953,9.337225],[76.494788,9.337234],[76.494594,9.337245],[76.494423,9.337254],[76.49407,9.337096],[76.493753,9.336884],[76.493597,9.336815],[76.493227,9.336617],[76.493022,9.336536],[76.492683,9.336409],[76.492593,9.336383],[76.491684,9.336217],[76.491271,9.336158],[76.491124,9.336146],[76.490696,9.335893],[76.490587,9.335828],[76.490427,9.33572],[76.49031,9.335664],[76.490099,9.335563],[76.489764,9.335512],[76.48947,9.335614],[76.489054,9.335757],[76.488852,9.335468],[76.488754,9.335278],[76.488657,9.335083],[76.488608,9.334801],[76.488613,9.334574],[76.488792,9.33382],[76.488866,9.333613],[76.488957,9.333373],[76.488912,9.333204],[76.48885,9.33297],[76.488771,9.332571],[76.488679,9.332107],[76.4886,9.331706],[76.488517,9.331286],[76.48849,9.331149],[76.488561,9.330951],[76.488616,9.330837],[76.488729,9.330722]]]},\"properties\":{\"LSGD\":\"Niranam\",\"Mandal\":\"Thiruvalla\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.538013,9.376872],[76.538027,9.376979],[76.537848,9.377056],[76.537755,9.377094],[76.53765,9.377128],[76.537366,9.377219],[76.537153,9.377272],[76.537051,9.377298],[76.536954,9.377322],[76.536975,9.37742],[76.53702,9.377592],[76.536804,9.377627],[76.536688,9.37763],[76.536585,9.377633],[76.536399,9.377586],[76.536286,9.377541],[76.536173,9.377522],[76.536053,9.377501],[76.535962,9.37753],[76.535952,9.377623],[76.535754,9.377667],[76.535678,9.37779],[76.535691,9.37794],[76.535501,9.378161],[76.53541,9.378147],[76.53534,9.378033],[76.535288,9.377948],[76.535229,9.377837],[76.535164,9.377669],[76.534901,9.377648],[76.53475,9.377636],[76.534559,9.377621],[76.534557,9.377745],[76.534695,9.377813],[76.534536,9.377854],[76.534349,9.377901],[76.534015,9.378049],[76.533612,9.378238],[76.533496,9.378295],[76.5334,9.378306],[76.532484,9.378414],[76.532424,9.378681],[76.531865,9.378855],[76.531561,9.378951],[76.531527,9.379216],[76.531438,9.379297],[76.531499,9.379461],[76.531516,9.37959],[76.531552,9.37985],[76.531437,9.379938],[76.531302,9.379965],[76.531182,9.37999],[76.530866,9.380054],[76.530882,9.380155],[76.53077,9.380173],[76.530508,9.380216],[76.530226,9.380262],[76.529983,9.380225],[76.529726,9.380186],[76.529574,9.380203],[76.529356,9.380227],[76.529235,9.380218],[76.529133,9.380209],[76.528987,9.380208],[76.528865,9.38018],[76.528614,9.380124],[76.528532,9.380044],[76.528637,9.379794],[76.528613,9.379625],[76.528637,9.379468],[76.528632,9.379244],[76.528824,9.378843],[76.528892,9.378706],[76.529013,9.378537],[76.529143,9.378322],[76.529373,9.37824],[76.529733,9.378271],[76.529924,9.378269],[76.529938,9.378066],[76.529955,9.37783],[76.529826,9.377512],[76.529656,9.377209],[76.529936,9.376935],[76.53003,9.376868],[76.530053,9.376645],[76.530016,9.376456],[76.530141,9.376371],[76.530314,9.376207],[76.530419,9.376023],[76.530489,9.375902],[76.530337,9.375865],[76.530127,9.37578],[76.529952,9.37573],[76.529779,9.375617],[76.529657,9.375665],[76.529519,9.375569],[76.529279,9.375506],[76.529081,9.375327],[76.528988,9.375309],[76.528884,9.37529],[76.528747,9.375266],[76.528514,9.375227],[76.528332,9.375196],[76.528111,9.375175],[76.527977,9.375162],[76.527691,9.375154],[76.527428,9.375051],[76.527273,9.375071],[76.527006,9.375209],[76.526896,9.375057],[76.526752,9.374982],[76.52664,9.375041],[76.526294,9.375209],[76.52621,9.37525],[76.526,9.375315],[76.525756,9.375391],[76.525606,9.375355],[76.52517,9.375413],[76.525075,9.37543],[76.525022,9.375346],[76.524816,9.375428],[76.524706,9.375472],[76.524212,9.375685],[76.524102,9.37562],[76.52411,9.375461],[76.523733,9.375528],[76.523611,9.375743],[76.523471,9.375779],[76.523135,9.375866],[76.522773,9.375973],[76.522637,9.376008],[76.522347,9.376103],[76.52239,9.376259],[76.522224,9.37632],[76.522062,9.37638],[76.521708,9.376582],[76.521623,9.376623],[76.521474,9.376696],[76.521251,9.376771],[76.521158,9.376803],[76.521038,9.377182],[76.520972,9.376947],[76.520946,9.376857],[76.520931,9.376709],[76.520904,9.376461],[76.52101,9.376429],[76.521115,9.376397],[76.521103,9.376296],[76.521004,9.376236],[76.520802,9.376114],[76.520456,9.375972],[76.520064,9.375972],[76.5198,9.376074],[76.51959,9.376156],[76.5195,9.37619],[76.519257,9.376279],[76.519152,9.376292],[76.518932,9.376319],[76.518785,9.376169],[76.518617,9.376145],[76.518476,9.376204],[76.518333,9.376263],[76.518229,9.376277],[76.518047,9.376302],[76.517947,9.376315],[76.517801,9.376335],[76.517608,9.376407],[76.517383,9.376533],[76.517122,9.3767],[76.517182,9.376902],[76.517218,9.377026],[76.51727,9.377201],[76.51732,9.377371],[76.517416,9.377696],[76.51748,9.377913],[76.517544,9.378127],[76.51761,9.378353],[76.51771,9.378689],[76.517116,9.378859],[76.517176,9.379032],[76.517385,9.379422],[76.517537,9.379707],[76.517093,9.379973],[76.516913,9.37998],[76.516641,9.380163],[76.516401,9.380324],[76.516008,9.380614],[76.515998,9.380928],[76.516012,9.381145],[76.516014,9.381304],[76.515982,9.381466],[76.515709,9.38184],[76.515554,9.38202],[76.515465,9.382123],[76.515366,9.382188],[76.51517,9.382319],[76.515088,9.382397],[76.51501,9.382471],[76.514941,9.382537],[76.514758,9.38282],[76.514705,9.3829],[76.514669,9.382986],[76.514554,9.38326],[76.514448,9.383322],[76.514273,9.383386],[76.514102,9.383479],[76.514012,9.383528],[76.51385,9.383485],[76.513631,9.383575],[76.513501,9.383628],[76.513362,9.38368],[76.513158,9.383756],[76.513024,9.383802],[76.512918,9.383839],[76.512797,9.383881],[76.512729,9.383979],[76.512574,9.384071],[76.512479,9.384111],[76.512336,9.384171],[76.512183,9.38424],[76.512097,9.384279],[76.511943,9.38431],[76.511746,9.38435],[76.511616,9.385687],[76.511727,9.386332],[76.511959,9.386778],[76.512206,9.387325],[76.512228,9.387407],[76.512767,9.387863],[76.513281,9.3883],[76.51354,9.388661],[76.513933,9.389309],[76.51407,9.390021],[76.514079,9.390383],[76.513921,9.390426],[76.513912,9.390424],[76.513425,9.390668],[76.512722,9.390774],[76.51203,9.390783],[76.511508,9.390868],[76.511068,9.391057],[76.510733,9.391461],[76.510684,9.391898],[76.510742,9.392017],[76.51099,9.393064],[76.511281,9.39426],[76.511319,9.394514],[76.511348,9.395144],[76.511398,9.395689],[76.511453,9.396221],[76.511709,9.397119],[76.511911,9.39775],[76.512081,9.398451],[76.512192,9.399273],[76.512101,9.399545],[76.511958,9.400002],[76.51196,9.40048],[76.512261,9.400463],[76.512551,9.400318],[76.512955,9.400237],[76.513218,9.400226],[76.513822,9.400298],[76.514727,9.400512],[76.514975,9.400521],[76.515459,9.40028],[76.516165,9.399825],[76.516274,9.400089],[76.516331,9.400424],[76.516339,9.400654],[76.51633,9.400943],[76.516282,9.401363],[76.516206,9.401703],[76.516183,9.402144],[76.516075,9.402633],[76.516056,9.402704],[76.516229,9.402736],[76.516135,9.403153],[76.516157,9.403522],[76.516062,9.403888],[76.515815,9.404139],[76.515731,9.404251],[76.516069,9.405029],[76.516144,9.405427],[76.515971,9.405796],[76.515889,9.406199],[76.515874,9.406578],[76.515866,9.406768],[76.516062,9.406867],[76.516274,9.406965],[76.516331,9.407],[76.516189,9.407227],[76.516101,9.407499],[76.516281,9.407603],[76.516475,9.407735],[76.516581,9.4078],[76.516743,9.40801],[76.516834,9.408144],[76.517002,9.408326],[76.516999,9.408414],[76.517248,9.408636],[76.517657,9.408959],[76.517923,9.409179],[76.518333,9.409434],[76.518699,9.409589],[76.518974,9.409804],[76.519278,9.409736],[76.51939,9.409083],[76.519542,9.408863],[76.52,9.40872],[76.520487,9.408657],[76.521037,9.408675],[76.521786,9.408623],[76.522078,9.408594],[76.522853,9.408614],[76.523346,9.408712],[76.523965,9.409056],[76.524322,9.409291],[76.524648,9.409322],[76.524939,9.409349],[76.525196,9.409373],[76.525285,9.409373],[76.525494,9.409321],[76.525635,9.410258],[76.525618,9.411187],[76.52578,9.411391],[76.525753,9.41169],[76.526123,9.412643],[76.526316,9.413596],[76.527426,9.412933],[76.528642,9.413024],[76.529596,9.413117],[76.52974,9.413385],[76.531118,9.413268],[76.531009,9.414155],[76.530789,9.414699],[76.530631,9.41568],[76.530658,9.416432],[76.530906,9.416539],[76.531734,9.416321],[76.532745,9.416226],[76.532885,9.416849],[76.533753,9.416458],[76.534642,9.416374],[76.534734,9.416821],[76.53539,9.416719],[76.535678,9.416764],[76.536068,9.416687],[76.536481,9.416676],[76.536795,9.41659],[76.536691,9.416165],[76.536857,9.415311],[76.537128,9.414946],[76.537288,9.414689],[76.537254,9.414463],[76.537505,9.414161],[76.537502,9.413869],[76.537987,9.413899],[76.538765,9.414176],[76.539205,9.414222],[76.539431,9.414989],[76.539637,9.415433],[76.53972,9.415563],[76.539649,9.415755],[76.539611,9.416286],[76.53981,9.416427],[76.540256,9.416569],[76.540185,9.416867],[76.540436,9.416954],[76.54056,9.417216],[76.540937,9.417369],[76.541326,9.4178],[76.541678,9.417976],[76.541273,9.418691],[76.54108,9.419026],[76.541021,9.41923],[76.540952,9.419756],[76.540754,9.419948],[76.540423,9.420598],[76.540535,9.42067],[76.541441,9.420716],[76.541572,9.420766],[76.541708,9.420817],[76.541896,9.420888],[76.541809,9.420755],[76.54202,9.420787],[76.542154,9.420796],[76.542335,9.420798],[76.542462,9.420794],[76.542628,9.420784],[76.542832,9.420756],[76.543008,9.420739],[76.543316,9.420773],[76.543569,9.420804],[76.54359,9.420861],[76.543728,9.420897],[76.543849,9.421055],[76.543823,9.421165],[76.543716,9.421576],[76.543693,9.421685],[76.543686,9.42178],[76.543633,9.422017],[76.543576,9.422429],[76.543573,9.422635],[76.543721,9.422769],[76.544007,9.422945],[76.54436,9.42288],[76.544833,9.422801],[76.545421,9.422756],[76.545771,9.422713],[76.546041,9.422666],[76.546113,9.422688],[76.546233,9.422683],[76.546295,9.422679],[76.546419,9.422653],[76.546566,9.422626],[76.546704,9.422594],[76.546881,9.42255],[76.547041,9.422521],[76.547194,9.422488],[76.547239,9.422487],[76.547374,9.422473],[76.547514,9.422479],[76.547871,9.422532],[76.547971,9.422541],[76.548138,9.422532],[76.548283,9.422506],[76.548307,9.42246],[76.548443,9.42233],[76.548528,9.422255],[76.548616,9.422128],[76.548671,9.422051],[76.548694,9.42201],[76.548883,9.422021],[76.549076,9.422042],[76.549133,9.42204],[76.549195,9.422047],[76.549316,9.422141],[76.549436,9.422295],[76.549565,9.422541],[76.549748,9.422835],[76.549857,9.422952],[76.549969,9.422919],[76.550071,9.422884],[76.550224,9.422912],[76.550354,9.422906],[76.550666,9.422924],[76.550798,9.423395],[76.550949,9.423372],[76.551122,9.423341],[76.551291,9.423364],[76.551575,9.42341],[76.55187,9.423444],[76.552072,9.423558],[76.552225,9.42357],[76.552239,9.423719],[76.552352,9.42388],[76.552685,9.423889],[76.552773,9.42402],[76.552922,9.42396],[76.553025,9.423974],[76.553067,9.42396],[76.553112,9.423937],[76.553164,9.423934],[76.553391,9.42387],[76.553663,9.423892],[76.553786,9.42393],[76.553734,9.422523],[76.553691,9.422132],[76.55414,9.421414],[76.554644,9.420719],[76.554704,9.420332],[76.554749,9.41937],[76.554928,9.417571],[76.555051,9.416392],[76.555316,9.413825],[76.555327,9.41359],[76.555385,9.413177],[76.555549,9.413078],[76.555688,9.413055],[76.555843,9.413025],[76.555992,9.412999],[76.556142,9.412957],[76.556316,9.412911],[76.556376,9.412822],[76.556378,9.41278],[76.556595,9.41273],[76.556952,9.41267],[76.557092,9.412656],[76.557204,9.412649],[76.557376,9.412627],[76.557517,9.412576],[76.557623,9.412524],[76.557738,9.412458],[76.557881,9.412364],[76.558027,9.412279],[76.55819,9.41217],[76.558338,9.41207],[76.558503,9.411966],[76.558638,9.411877],[76.558759,9.411794],[76.558913,9.411702],[76.559034,9.41163],[76.559164,9.411564],[76.559292,9.411505],[76.55943,9.411411],[76.559574,9.41135],[76.559774,9.411263],[76.559943,9.411193],[76.560109,9.411189],[76.560244,9.411217],[76.560487,9.411175],[76.560698,9.411159],[76.560824,9.411078],[76.561039,9.411042],[76.561241,9.411023],[76.561473,9.411015],[76.562018,9.410993],[76.562416,9.410986],[76.562753,9.410945],[76.563124,9.410875],[76.563436,9.410698],[76.563716,9.410623],[76.563615,9.41044],[76.564001,9.410086],[76.564073,9.41002],[76.56416,9.409957],[76.564367,9.409775],[76.564498,9.40967],[76.564606,9.40959],[76.564745,9.409437],[76.565061,9.409102],[76.565412,9.408731],[76.565708,9.408425],[76.565769,9.408157],[76.565863,9.407743],[76.56576,9.407197],[76.565744,9.406706],[76.565729,9.406241],[76.565489,9.405477],[76.565253,9.405183],[76.565078,9.404987],[76.564954,9.404867],[76.564833,9.404773],[76.564707,9.404695],[76.564489,9.404573],[76.564193,9.404406],[76.564084,9.404345],[76.563918,9.404172],[76.563808,9.404091],[76.563672,9.403991],[76.563485,9.403971],[76.563347,9.403952],[76.563148,9.403925],[76.562862,9.403875],[76.562761,9.403854],[76.562643,9.403829],[76.562403,9.403771],[76.562288,9.403709],[76.562194,9.403632],[76.562037,9.403506],[76.561959,9.403428],[76.561858,9.403301],[76.56176,9.40315],[76.561637,9.402961],[76.561577,9.402798],[76.561513,9.402625],[76.561454,9.402492],[76.561377,9.402319],[76.561286,9.402093],[76.561251,9.401919],[76.561292,9.401743],[76.561289,9.401549],[76.561305,9.40138],[76.561276,9.401241],[76.561238,9.401062],[76.561261,9.400874],[76.561209,9.400742],[76.561131,9.400647],[76.560884,9.400407],[76.560677,9.400142],[76.560602,9.399812],[76.560554,9.399678],[76.560526,9.399578],[76.560498,9.399483],[76.560417,9.399351],[76.560348,9.399238],[76.560217,9.399113],[76.560101,9.399004],[76.559973,9.398882],[76.559919,9.398797],[76.560094,9.398677],[76.560293,9.398605],[76.56049,9.398473],[76.560675,9.398456],[76.56097,9.398444],[76.561079,9.398449],[76.561232,9.398455],[76.561406,9.398468],[76.561555,9.398457],[76.561705,9.398446],[76.562005,9.398447],[76.562125,9.398448],[76.562628,9.398444],[76.562762,9.398453],[76.562862,9.398461],[76.563197,9.39838],[76.563356,9.398342],[76.563376,9.398117],[76.56339,9.397963],[76.563463,9.397532],[76.563442,9.397102],[76.563502,9.396729],[76.56353,9.396555],[76.563639,9.396384],[76.563688,9.39625],[76.563751,9.396101],[76.563777,9.395784],[76.563773,9.39567],[76.563768,9.395557],[76.563777,9.395361],[76.563781,9.395269],[76.563786,9.395168],[76.563796,9.394958],[76.563762,9.394863],[76.563669,9.394648],[76.563461,9.394414],[76.563291,9.394208],[76.562979,9.394427],[76.562913,9.394563],[76.56251,9.394834],[76.562219,9.395094],[76.562111,9.395192],[76.562051,9.39533],[76.561919,9.395503],[76.561486,9.39547],[76.561281,9.39549],[76.561153,9.3955],[76.561017,9.39551],[76.560811,9.395725],[76.56051,9.395771],[76.560447,9.395558],[76.560534,9.395383],[76.560645,9.395325],[76.560786,9.395262],[76.560577,9.394914],[76.56051,9.394705],[76.560491,9.394557],[76.560499,9.394424],[76.560508,9.394283],[76.560437,9.393972],[76.560455,9.393883],[76.560493,9.393708],[76.560652,9.393642],[76.560643,9.393461],[76.560686,9.393217],[76.560704,9.393114],[76.56084,9.393099],[76.561002,9.393151],[76.561079,9.393036],[76.561165,9.392994],[76.561166,9.392872],[76.561168,9.39255],[76.561302,9.39251],[76.561374,9.392399],[76.561265,9.392142],[76.561127,9.392163],[76.560952,9.391946],[76.560519,9.391407],[76.560314,9.391185],[76.560208,9.39106],[76.560121,9.390956],[76.559998,9.39072],[76.559691,9.390871],[76.559632,9.391006],[76.5595,9.391054],[76.559327,9.391118],[76.559101,9.390899],[76.559049,9.390694],[76.55889,9.390752],[76.558827,9.390608],[76.558996,9.390549],[76.558945,9.390327],[76.558761,9.390326],[76.558759,9.390493],[76.558678,9.390651],[76.558444,9.390863],[76.558424,9.391104],[76.558141,9.391056],[76.558044,9.39104],[76.557802,9.390989],[76.557595,9.390882],[76.557511,9.390764],[76.557411,9.390787],[76.557405,9.390884],[76.557018,9.390808],[76.55694,9.391176],[76.556937,9.391827],[76.557181,9.391946],[76.557216,9.392205],[76.557131,9.392402],[76.557033,9.392683],[76.556847,9.392656],[76.556754,9.392676],[76.556472,9.392625],[76.556259,9.392608],[76.556017,9.392758],[76.555696,9.392854],[76.555602,9.392882],[76.555497,9.392913],[76.555277,9.392963],[76.555107,9.393084],[76.555014,9.39322],[76.555092,9.393339],[76.555114,9.393616],[76.555098,9.39375],[76.555078,9.393917],[76.555197,9.394079],[76.555208,9.394204],[76.554904,9.394228],[76.554746,9.393961],[76.554642,9.393963],[76.554629,9.394224],[76.554455,9.39424],[76.554208,9.394262],[76.553889,9.394291],[76.553716,9.394247],[76.553321,9.394145],[76.553207,9.393839],[76.553194,9.393676],[76.553361,9.393673],[76.553485,9.393233],[76.553553,9.393085],[76.553556,9.392916],[76.553526,9.392737],[76.55344,9.392509],[76.553136,9.392587],[76.552984,9.392625],[76.55288,9.392658],[76.552764,9.392658],[76.55263,9.392682],[76.552383,9.392727],[76.552148,9.392724],[76.552043,9.39249],[76.552046,9.392359],[76.551779,9.392305],[76.551695,9.392688],[76.5516,9.39288],[76.551358,9.392755],[76.551333,9.392599],[76.550934,9.392621],[76.550858,9.392928],[76.550695,9.392912],[76.550463,9.39289],[76.55023,9.392899],[76.549854,9.392914],[76.549695,9.392984],[76.549638,9.392564],[76.549331,9.392609],[76.549272,9.392693],[76.549044,9.392698],[76.548816,9.392704],[76.548721,9.392669],[76.548582,9.392618],[76.548703,9.392541],[76.548602,9.392388],[76.548732,9.392308],[76.548601,9.392171],[76.548611,9.392072],[76.548564,9.391983],[76.548487,9.391725],[76.548372,9.39153],[76.548328,9.391441],[76.548268,9.391276],[76.548234,9.391183],[76.548186,9.391028],[76.548169,9.390854],[76.548153,9.390699],[76.548098,9.390368],[76.548112,9.390239],[76.548311,9.390021],[76.548741,9.390052],[76.54884,9.389987],[76.548982,9.389833],[76.549097,9.389798],[76.549249,9.389734],[76.549442,9.389821],[76.549432,9.389612],[76.549645,9.38944],[76.549705,9.389171],[76.549757,9.388941],[76.549716,9.388625],[76.549656,9.388499],[76.549569,9.388317],[76.54959,9.388212],[76.549616,9.388086],[76.549711,9.38803],[76.549954,9.388008],[76.550064,9.387848],[76.550287,9.387701],[76.550168,9.387467],[76.550188,9.387279],[76.550339,9.387165],[76.550551,9.387005],[76.551074,9.386679],[76.551247,9.386572],[76.551331,9.386179],[76.551343,9.386074],[76.551368,9.385843],[76.551382,9.385707],[76.551365,9.385399],[76.551357,9.385102],[76.551287,9.385001],[76.551144,9.384837],[76.550986,9.384699],[76.550829,9.38461],[76.550647,9.384508],[76.550347,9.384651],[76.550253,9.384708],[76.550097,9.384802],[76.549853,9.385047],[76.549721,9.385083],[76.549473,9.385152],[76.549236,9.385004],[76.549184,9.384763],[76.549199,9.384658],[76.549337,9.384447],[76.549431,9.384285],[76.549505,9.384216],[76.549813,9.383969],[76.550094,9.383745],[76.550425,9.383527],[76.550417,9.383306],[76.550403,9.382915],[76.550355,9.382595],[76.550478,9.382138],[76.550573,9.381972],[76.551162,9.381842],[76.551391,9.381644],[76.551551,9.381173],[76.551788,9.380801],[76.552183,9.380683],[76.552368,9.380596],[76.552523,9.380526],[76.552735,9.380376],[76.553026,9.380159],[76.553181,9.380007],[76.553299,9.379892],[76.55341,9.379754],[76.553564,9.379461],[76.553748,9.379109],[76.553917,9.378608],[76.553905,9.378514],[76.553905,9.378106],[76.553789,9.377639],[76.553545,9.377427],[76.553365,9.377232],[76.553334,9.37701],[76.553306,9.376812],[76.553013,9.376422],[76.552847,9.376253],[76.552721,9.376143],[76.552584,9.376023],[76.552118,9.376095],[76.551926,9.376125],[76.551387,9.375879],[76.551387,9.375735],[76.551397,9.375639],[76.55088,9.375701],[76.550629,9.375827],[76.550711,9.376056],[76.550545,9.376153],[76.55011,9.376405],[76.549797,9.376395],[76.549611,9.376389],[76.549596,9.37629],[76.549572,9.376166],[76.549546,9.376003],[76.549531,9.37589],[76.549283,9.375865],[76.549048,9.375842],[76.5489,9.375844],[76.548693,9.375847],[76.548635,9.375692],[76.548632,9.375542],[76.548447,9.375549],[76.548322,9.375565],[76.54817,9.375584],[76.547876,9.375641],[76.547757,9.375685],[76.547634,9.375715],[76.547497,9.375833],[76.547423,9.375957],[76.54721,9.375901],[76.547083,9.375911],[76.546939,9.375853],[76.546675,9.375857],[76.546344,9.37587],[76.546133,9.375957],[76.546082,9.375814],[76.546143,9.375685],[76.546006,9.375613],[76.545607,9.375741],[76.545643,9.375904],[76.545387,9.375927],[76.544972,9.376082],[76.544882,9.376109],[76.544559,9.376209],[76.544351,9.376267],[76.544089,9.376341],[76.543692,9.376408],[76.54353,9.376436],[76.543431,9.376453],[76.543243,9.376518],[76.543094,9.37651],[76.54263,9.376603],[76.542585,9.376397],[76.542552,9.376242],[76.542532,9.376126],[76.542513,9.376006],[76.542421,9.376024],[76.542273,9.376053],[76.542159,9.376076],[76.54199,9.376109],[76.54178,9.376151],[76.541611,9.376202],[76.54117,9.376334],[76.541035,9.376367],[76.540865,9.376392],[76.540786,9.376498],[76.540673,9.376605],[76.54059,9.376683],[76.540457,9.376752],[76.540254,9.376833],[76.540053,9.37677],[76.539807,9.376757],[76.539663,9.376759],[76.539383,9.376763],[76.53917,9.376792],[76.538928,9.376808],[76.538882,9.376623],[76.538774,9.376763],[76.538699,9.376817],[76.538544,9.376927],[76.538013,9.376872]]]},\"properties\":{\"LSGD\":\"Peringara\",\"Mandal\":\"Thiruvalla\",\"Level\":\"Panchayat\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.667426,9.378164],[76.667322,9.378156],[76.667196,9.378143],[76.667043,9.378115],[76.666963,9.37801],[76.666902,9.377931],[76.666838,9.377846],[76.666777,9.377766],[76.666683,9.377623],[76.666587,9.37766],[76.666445,9.377658],[76.666327,9.377704],[76.666206,9.377828],[76.666119,9.377915],[76.666024,9.378009],[76.665575,9.378324],[76.66554,9.378479],[76.665276,9.378673],[76.665111,9.37862],[76.66475,9.378521],[76.664556,9.378544],[76.664457,9.378556],[76.66421,9.378642],[76.664049,9.378697],[76.663717,9.378811],[76.663479,9.378975],[76.663333,9.379052],[76.66284,9.379311],[76.662437,9.379205],[76.662469,9.379062],[76.662567,9.378948],[76.662679,9.378813],[76.662786,9.378685],[76.662768,9.378428],[76.662751,9.378189],[76.662647,9.377837],[76.662556,9.377533],[76.662423,9.377416],[76.662359,9.377097],[76.662236,9.376914],[76.662109,9.376725],[76.661995,9.376629],[76.661833,9.376493],[76.661659,9.376327],[76.661459,9.376093],[76.661251,9.375791],[76.661214,9.375408],[76.66119,9.375155],[76.661233,9.374886],[76.661243,9.374631],[76.661121,9.374476],[76.660913,9.374334],[76.66069,9.374251],[76.660527,9.374191],[76.660191,9.374207],[76.659858,9.374223],[76.659707,9.37423],[76.659334,9.374248],[76.659234,9.374252],[76.65894,9.374264],[76.65874,9.374291],[76.658227,9.374339],[76.658164,9.374499],[76.657978,9.374607],[76.657744,9.374576],[76.657764,9.374228],[76.657658,9.374121],[76.657663,9.373949],[76.657755,9.373667],[76.657725,9.373476],[76.657657,9.373383],[76.65738,9.373303],[76.656861,9.37309],[76.656343,9.372877],[76.656198,9.372916],[76.655456,9.373119],[76.655405,9.3729],[76.655369,9.372745],[76.655345,9.372585],[76.654942,9.372403],[76.65461,9.372386],[76.654083,9.372446],[76.653832,9.372474],[76.653084,9.372558],[76.652749,9.372781],[76.652414,9.373003],[76.652112,9.373039],[76.651641,9.373095],[76.651478,9.373063],[76.651038,9.372979],[76.650763,9.373042],[76.650594,9.37308],[76.650492,9.373103],[76.650321,9.373143],[76.650358,9.373288],[76.650391,9.373419],[76.650424,9.373549],[76.650408,9.373845],[76.650396,9.374073],[76.650678,9.374161],[76.65062,9.374393],[76.650461,9.374524],[76.650435,9.374614],[76.650221,9.37535],[76.649978,9.375331],[76.649736,9.375312],[76.649764,9.375593],[76.64978,9.375736],[76.649792,9.375831],[76.649832,9.376088],[76.649855,9.376237],[76.649967,9.37703],[76.64999,9.377253],[76.649953,9.377339],[76.649785,9.377666],[76.649754,9.377777],[76.649674,9.377923],[76.649593,9.378071],[76.649527,9.37819],[76.649465,9.378303],[76.649358,9.378512],[76.649423,9.378683],[76.649425,9.378909],[76.649575,9.378988],[76.649556,9.379146],[76.649544,9.379254],[76.649529,9.379382],[76.649507,9.37958],[76.649454,9.380044],[76.649661,9.380558],[76.649747,9.380774],[76.649782,9.380861],[76.649834,9.381176],[76.649866,9.381365],[76.649765,9.381401],[76.649667,9.381656],[76.649661,9.381755],[76.649626,9.382359],[76.649622,9.382898],[76.649613,9.382989],[76.649585,9.383257],[76.649581,9.383361],[76.649572,9.383558],[76.649565,9.383715],[76.649555,9.383922],[76.649521,9.384102],[76.649502,9.384205],[76.649412,9.384679],[76.649391,9.384786],[76.649319,9.384895],[76.649265,9.384977],[76.649196,9.385082],[76.649113,9.385207],[76.649043,9.385313],[76.648564,9.385453],[76.648425,9.385659],[76.647978,9.385757],[76.647741,9.385745],[76.647609,9.385739],[76.647521,9.385945],[76.647447,9.386119],[76.647019,9.386144],[76.646919,9.386537],[76.646895,9.386633],[76.646881,9.386909],[76.64687,9.387116],[76.646516,9.387193],[76.646337,9.387217],[76.645998,9.387263],[76.645674,9.387307],[76.645553,9.387356],[76.645441,9.387401],[76.645018,9.38757],[76.644686,9.387978],[76.64459,9.388095],[76.644566,9.388201],[76.644499,9.388501],[76.644471,9.388626],[76.644214,9.388697],[76.64405,9.388743],[76.64404,9.389069],[76.64403,9.389389],[76.6436,9.389608],[76.643,9.389889],[76.643235,9.390868],[76.643411,9.391632],[76.643443,9.391756],[76.64349,9.391985],[76.643558,9.392216],[76.643507,9.39236],[76.643371,9.392741],[76.643191,9.393088],[76.643013,9.393431],[76.642821,9.3937],[76.642733,9.393825],[76.642604,9.394005],[76.642355,9.394202],[76.642156,9.394359],[76.641888,9.394572],[76.641628,9.394778],[76.641164,9.395046],[76.641047,9.395081],[76.640883,9.395155],[76.640763,9.395187],[76.64041,9.395318],[76.640058,9.395449],[76.639365,9.395695],[76.63907,9.395874],[76.638826,9.396023],[76.638646,9.396126],[76.638516,9.396198],[76.63834,9.396296],[76.63821,9.396409],[76.637952,9.396636],[76.637883,9.397008],[76.637837,9.397396],[76.63781,9.39784],[76.637785,9.398239],[76.637761,9.398629],[76.637727,9.399174],[76.637702,9.399719],[76.637715,9.399956],[76.637844,9.400166],[76.638064,9.400504],[76.638163,9.400547],[76.638335,9.400608],[76.63888,9.400798],[76.639244,9.400895],[76.63942,9.400921],[76.639885,9.400991],[76.640194,9.401057],[76.640398,9.401069],[76.640797,9.401245],[76.641069,9.401345],[76.64146,9.401489],[76.64163,9.401504],[76.642078,9.401789],[76.642233,9.401846],[76.642833,9.402272],[76.643331,9.402624],[76.64342,9.402697],[76.643632,9.402862],[76.643979,9.403149],[76.644279,9.403397],[76.644399,9.40357],[76.644546,9.403662],[76.644924,9.4039],[76.64521,9.404264],[76.645654,9.404832],[76.645762,9.404946],[76.645923,9.405094],[76.646289,9.405429],[76.646449,9.405509],[76.646615,9.405655],[76.646854,9.405713],[76.647095,9.405772],[76.647198,9.405799],[76.647335,9.405822],[76.647651,9.405878],[76.647934,9.405801],[76.648111,9.405767],[76.648216,9.405746],[76.648313,9.405668],[76.648426,9.405579],[76.648578,9.405457],[76.648827,9.405258],[76.648914,9.405165],[76.649316,9.404736],[76.649424,9.404604],[76.649662,9.404295],[76.649797,9.404129],[76.650102,9.403743],[76.650229,9.403586],[76.650406,9.4034],[76.650546,9.403254],[76.650915,9.403018],[76.651098,9.402921],[76.651426,9.402748],[76.651727,9.402653],[76.651846,9.402631],[76.651995,9.40262],[76.652201,9.402606],[76.652524,9.402525],[76.652741,9.402471],[76.653137,9.402321],[76.653249,9.402299],[76.653847,9.402179],[76.653941,9.402075],[76.654451,9.401877],[76.654955,9.401585],[76.655646,9.401324],[76.655791,9.401012],[76.65577,9.40092],[76.655757,9.400418],[76.655527,9.399919],[76.655209,9.399325],[76.655158,9.399231],[76.655045,9.398878],[76.654925,9.398507],[76.655,9.398282],[76.655074,9.398056],[76.655338,9.397823],[76.655487,9.397638],[76.655681,9.397509],[76.655889,9.397361],[76.656091,9.397233],[76.656527,9.397161],[76.656638,9.397226],[76.656799,9.397322],[76.656965,9.39742],[76.657014,9.397505],[76.657133,9.397714],[76.657238,9.397898],[76.657312,9.398069],[76.657366,9.398161],[76.657465,9.398439],[76.657579,9.398764],[76.657729,9.399133],[76.657847,9.399423],[76.657832,9.399621],[76.657953,9.399985],[76.658102,9.400436],[76.658117,9.400615],[76.658276,9.400945],[76.658286,9.401044],[76.658444,9.401313],[76.658562,9.401512],[76.658721,9.401855],[76.65894,9.402118],[76.659303,9.402534],[76.659414,9.40259],[76.659791,9.402755],[76.660158,9.402903],[76.660304,9.402958],[76.660483,9.403011],[76.660634,9.403055],[76.660824,9.403091],[76.661194,9.40317],[76.661323,9.403197],[76.661741,9.403219],[76.661914,9.403343],[76.662087,9.403466],[76.662107,9.40363],[76.662126,9.403787],[76.662013,9.404274],[76.661794,9.404572],[76.661227,9.405095],[76.661161,9.4052],[76.660813,9.405609],[76.660409,9.406146],[76.660422,9.406266],[76.660375,9.406365],[76.660119,9.406705],[76.659983,9.407087],[76.660027,9.407191],[76.659951,9.407548],[76.659889,9.407684],[76.659824,9.407829],[76.65998,9.408235],[76.660091,9.408522],[76.660279,9.40901],[76.660432,9.40929],[76.660536,9.409387],[76.660691,9.409566],[76.660939,9.409851],[76.661009,9.409926],[76.661174,9.410083],[76.661408,9.410306],[76.6616,9.410472],[76.661668,9.410542],[76.66187,9.410749],[76.662247,9.411135],[76.662387,9.411194],[76.662633,9.41151],[76.66287,9.411815],[76.66301,9.412413],[76.663082,9.412722],[76.663106,9.413037],[76.663125,9.41334],[76.663115,9.413643],[76.663105,9.413909],[76.663063,9.414574],[76.663052,9.414897],[76.663038,9.415331],[76.66308,9.415748],[76.663127,9.416212],[76.663127,9.416308],[76.663131,9.416539],[76.663123,9.416859],[76.663111,9.417146],[76.663123,9.417353],[76.663131,9.417482],[76.663138,9.417604],[76.663544,9.417903],[76.663902,9.418117],[76.664277,9.418311],[76.664515,9.418385],[76.664875,9.418474],[76.665003,9.418511],[76.665192,9.418509],[76.665707,9.418517],[76.665798,9.418519],[76.666569,9.418395],[76.666973,9.41834],[76.667746,9.418234],[76.668207,9.418232],[76.668313,9.418245],[76.668477,9.418303],[76.668825,9.418591],[76.668953,9.41848],[76.669166,9.418295],[76.669412,9.418246],[76.66955,9.41822],[76.669664,9.418197],[76.669819,9.418177],[76.669918,9.418185],[76.670209,9.418163],[76.670502,9.418116],[76.670686,9.418106],[76.670937,9.418092],[76.671256,9.417912],[76.671405,9.417829],[76.671529,9.417783],[76.671642,9.417784],[76.671777,9.417836],[76.672007,9.417795],[76.672081,9.417679],[76.672146,9.417578],[76.67221,9.417398],[76.672419,9.417397],[76.672651,9.417363],[76.672791,9.417343],[76.672813,9.417195],[76.672909,9.417033],[76.673057,9.416917],[76.673181,9.416905],[76.673419,9.416888],[76.673556,9.416887],[76.67373,9.41693],[76.673896,9.417003],[76.674062,9.417074],[76.674185,9.417127],[76.674343,9.417147],[76.674469,9.417109],[76.674589,9.417104],[76.674831,9.417172],[76.674921,9.416875],[76.675058,9.416766],[76.675122,9.416616],[76.67517,9.416504],[76.6753,9.416353],[76.675505,9.416427],[76.675703,9.416415],[76.675913,9.416284],[76.676089,9.416271],[76.676423,9.416247],[76.676739,9.416192],[76.676802,9.416479],[76.677201,9.416426],[76.677415,9.416398],[76.677632,9.416369],[76.677731,9.41629],[76.677894,9.41616],[76.678141,9.415964],[76.678336,9.415818],[76.678525,9.415766],[76.678623,9.415739],[76.67877,9.415635],[76.678911,9.41559],[76.679075,9.415538],[76.679219,9.415492],[76.679377,9.415442],[76.679531,9.415379],[76.679889,9.415266],[76.68002,9.415217],[76.680125,9.415174],[76.680232,9.415129],[76.680458,9.41506],[76.680672,9.415014],[76.680924,9.414959],[76.681151,9.414909],[76.681296,9.414842],[76.681423,9.414785],[76.68163,9.414691],[76.681762,9.414592],[76.681952,9.414448],[76.68213,9.414286],[76.682208,9.414215],[76.682299,9.414133],[76.682409,9.414038],[76.682622,9.413854],[76.682875,9.413764],[76.68311,9.413681],[76.683473,9.413474],[76.683658,9.413371],[76.684055,9.413237],[76.684354,9.413155],[76.684621,9.41308],[76.684728,9.412964],[76.685061,9.412602],[76.685185,9.412459],[76.685271,9.412359],[76.685601,9.412052],[76.685834,9.411883],[76.686004,9.41176],[76.68612,9.411672],[76.686311,9.411577],[76.686567,9.411606],[76.686705,9.411625],[76.687037,9.411702],[76.687085,9.411192],[76.687074,9.411071],[76.687043,9.410727],[76.68685,9.41038],[76.686754,9.410205],[76.686716,9.410088],[76.686597,9.409877],[76.686556,9.409736],[76.686402,9.409211],[76.686298,9.4089],[76.686268,9.40881],[76.686104,9.408845],[76.685941,9.408958],[76.685781,9.409068],[76.685691,9.409124],[76.685473,9.409258],[76.685303,9.409363],[76.685134,9.409467],[76.685027,9.409533],[76.684816,9.409616],[76.684604,9.4097],[76.684339,9.409792],[76.68421,9.409859],[76.684011,9.409962],[76.683803,9.410138],[76.683553,9.410339],[76.683384,9.410406],[76.683151,9.410499],[76.682525,9.410494],[76.682351,9.410531],[76.681967,9.410611],[76.68175,9.41041],[76.681821,9.410184],[76.681851,9.41009],[76.681877,9.409865],[76.681799,9.409799],[76.681708,9.409733],[76.681666,9.409614],[76.681576,9.40932],[76.681536,9.409136],[76.681485,9.408902],[76.681409,9.40865],[76.681306,9.408392],[76.681217,9.408159],[76.681208,9.407999],[76.681192,9.407696],[76.681184,9.407449],[76.681174,9.407124],[76.681201,9.406725],[76.681098,9.406516],[76.680998,9.406315],[76.680945,9.405941],[76.680893,9.405572],[76.680615,9.405437],[76.680504,9.405383],[76.680563,9.405079],[76.680499,9.405006],[76.68036,9.404849],[76.680263,9.404808],[76.680102,9.40474],[76.679858,9.4047],[76.679685,9.404652],[76.679525,9.404607],[76.679389,9.404542],[76.679219,9.404462],[76.679055,9.40443],[76.678532,9.404186],[76.678212,9.404036],[76.67805,9.403968],[76.677952,9.403939],[76.677769,9.403885],[76.677529,9.403815],[76.676701,9.403486],[76.676658,9.403088],[76.676688,9.40285],[76.676665,9.402588],[76.676652,9.40244],[76.676584,9.402055],[76.676494,9.401855],[76.676469,9.401615],[76.676421,9.401494],[76.676362,9.401169],[76.676188,9.401282],[76.675792,9.401369],[76.675558,9.40153],[76.675275,9.401727],[76.6752,9.401779],[76.675078,9.40188],[76.674771,9.402146],[76.67456,9.402288],[76.674183,9.402539],[76.674085,9.402548],[76.674005,9.402602],[76.67381,9.40265],[76.673733,9.402563],[76.673659,9.402634],[76.673457,9.402856],[76.673379,9.402942],[76.673291,9.40302],[76.673305,9.403235],[76.673093,9.403305],[76.672898,9.403394],[76.672782,9.403423],[76.672691,9.403445],[76.672466,9.403501],[76.67249,9.403633],[76.672335,9.404233],[76.672229,9.40422],[76.672013,9.40434],[76.671938,9.404398],[76.6718,9.404527],[76.671673,9.404647],[76.671512,9.404606],[76.671512,9.404393],[76.671477,9.404174],[76.671413,9.404071],[76.671258,9.403811],[76.671165,9.403785],[76.670983,9.403732],[76.670859,9.403696],[76.670547,9.403599],[76.670354,9.403577],[76.670177,9.403557],[76.67001,9.40363],[76.669929,9.40343],[76.67001,9.403136],[76.670063,9.402947],[76.669873,9.402926],[76.669694,9.402821],[76.669545,9.402735],[76.66943,9.402698],[76.669263,9.402658],[76.668999,9.402588],[76.668751,9.402612],[76.668468,9.402682],[76.668284,9.402771],[76.668185,9.402857],[76.668092,9.402938],[76.668055,9.402828],[76.667966,9.40256],[76.667942,9.402469],[76.667916,9.40237],[76.667869,9.402174],[76.668185,9.402156],[76.668468,9.40214],[76.668744,9.402089],[76.668947,9.402051],[76.669245,9.401961],[76.669395,9.401915],[76.669583,9.401859],[76.669796,9.401794],[76.670118,9.401696],[76.670203,9.40162],[76.670442,9.401513],[76.670563,9.401425],[76.670809,9.401282],[76.670942,9.401169],[76.671313,9.400981],[76.671653,9.400804],[76.67193,9.400668],[76.672129,9.400528],[76.67232,9.400471],[76.672734,9.400346],[76.672877,9.400291],[76.672986,9.400275],[76.673228,9.400212],[76.673686,9.40013],[76.673846,9.400065],[76.674044,9.399966],[76.674202,9.399823],[76.67407,9.399587],[76.673981,9.399423],[76.673897,9.399216],[76.673826,9.399094],[76.673855,9.398889],[76.673762,9.398715],[76.673672,9.39857],[76.673756,9.398451],[76.673961,9.398423],[76.674144,9.398398],[76.67444,9.398115],[76.674535,9.398035],[76.674625,9.397945],[76.674744,9.39784],[76.67486,9.397723],[76.674871,9.397574],[76.67509,9.397315],[76.675217,9.397165],[76.675344,9.397016],[76.675433,9.396834],[76.675486,9.396641],[76.675581,9.396445],[76.675751,9.39622],[76.675822,9.396127],[76.675648,9.395823],[76.675462,9.395738],[76.67517,9.395605],[76.675343,9.395109],[76.675244,9.394717],[76.675078,9.39434],[76.67502,9.394077],[76.674982,9.393907],[76.67494,9.393718],[76.674902,9.393612],[76.674813,9.393366],[76.67511,9.393242],[76.675413,9.393115],[76.675632,9.393024],[76.675896,9.392914],[76.676059,9.392862],[76.676295,9.392788],[76.676305,9.392592],[76.676535,9.392498],[76.676667,9.392445],[76.676865,9.392377],[76.676992,9.392324],[76.677121,9.392271],[76.677326,9.39219],[76.677458,9.392149],[76.677606,9.392103],[76.677778,9.392062],[76.678001,9.392044],[76.678215,9.392012],[76.678463,9.391976],[76.678786,9.391892],[76.678981,9.391864],[76.679083,9.391817],[76.679226,9.391783],[76.679583,9.391697],[76.679606,9.391827],[76.67986,9.391833],[76.680086,9.391774],[76.680237,9.391735],[76.680322,9.391656],[76.680323,9.391544],[76.680344,9.39127],[76.680356,9.391127],[76.680497,9.391086],[76.680556,9.391003],[76.680589,9.390892],[76.680542,9.390763],[76.680415,9.390419],[76.680236,9.389932],[76.6802,9.389714],[76.68018,9.389595],[76.68016,9.389474],[76.680107,9.389159],[76.680057,9.388855],[76.680491,9.388522],[76.680678,9.388326],[76.680164,9.388244],[76.679691,9.388168],[76.679442,9.387882],[76.67981,9.387445],[76.679973,9.386656],[76.679979,9.386164],[76.679983,9.385881],[76.680059,9.385528],[76.679929,9.385472],[76.680023,9.384585],[76.680038,9.384032],[76.680051,9.383545],[76.680057,9.383305],[76.680055,9.383159],[76.680053,9.383039],[76.680051,9.382909],[76.680043,9.382416],[76.679977,9.382168],[76.679936,9.382013],[76.679839,9.381647],[76.679802,9.381508],[76.679454,9.381476],[76.679279,9.381236],[76.679136,9.380762],[76.679155,9.380473],[76.679198,9.380214],[76.679167,9.379731],[76.679226,9.379239],[76.679248,9.379057],[76.678656,9.378876],[76.678462,9.378719],[76.678342,9.378622],[76.678065,9.378537],[76.677928,9.378495],[76.677839,9.378454],[76.677639,9.378362],[76.677471,9.378364],[76.677302,9.378374],[76.677122,9.378384],[76.676805,9.378301],[76.676644,9.378292],[76.676398,9.378279],[76.676271,9.378274],[76.67617,9.378271],[76.675922,9.378262],[76.675718,9.378202],[76.675572,9.37811],[76.675492,9.377952],[76.675429,9.377745],[76.675186,9.377576],[76.675063,9.377573],[76.67479,9.377567],[76.674536,9.377493],[76.674435,9.377463],[76.674346,9.377368],[76.674172,9.37737],[76.674046,9.377377],[76.673897,9.377385],[76.673666,9.377413],[76.673569,9.377496],[76.673377,9.377758],[76.673468,9.377855],[76.673434,9.37794],[76.673369,9.378043],[76.673311,9.37819],[76.673213,9.378191],[76.673156,9.378302],[76.673094,9.378423],[76.672956,9.378583],[76.67292,9.378677],[76.672774,9.378886],[76.672774,9.379021],[76.672875,9.379218],[76.672962,9.379389],[76.672938,9.379675],[76.672798,9.379752],[76.672585,9.379886],[76.672329,9.380045],[76.67227,9.380146],[76.672224,9.380226],[76.672111,9.380234],[76.671998,9.380243],[76.671906,9.380249],[76.671729,9.380262],[76.671598,9.380215],[76.671479,9.380172],[76.671306,9.380178],[76.671185,9.380197],[76.671013,9.380218],[76.670838,9.380297],[76.670696,9.380406],[76.670652,9.380199],[76.670669,9.380058],[76.670511,9.379983],[76.670173,9.379823],[76.670052,9.379766],[76.670149,9.379639],[76.669906,9.379349],[76.669814,9.379249],[76.669688,9.379112],[76.669622,9.37904],[76.669483,9.378901],[76.669386,9.378803],[76.669269,9.378655],[76.669288,9.378513],[76.669305,9.378379],[76.669204,9.378313],[76.669126,9.378263],[76.669028,9.378198],[76.668947,9.378146],[76.668831,9.378151],[76.6687,9.378157],[76.668568,9.378162],[76.66844,9.378168],[76.668321,9.378173],[76.668003,9.378217],[76.667858,9.378202],[76.667716,9.378188],[76.667615,9.378177],[76.667426,9.378164]]]},\"properties\":{\"LSGD\":\"Puramattom\",\"Mandal\":\"Mallappally\",\"Level\":\"Panchayat\"}}]}");
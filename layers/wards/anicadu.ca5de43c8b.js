@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.675362,9.478593],[76.675535,9.478584],[76.675848,9.478624],[76.676043,9.478677],[76.676392,9.478777],[76.676394,9.478893],[76.6764,9.478984],[76.676423,9.479316],[76.676992,9.479776],[76.677164,9.479828],[76.677295,9.479812],[76.67741,9.479835],[76.677598,9.479897],[76.677798,9.479995],[76.678034,9.479812],[76.678214,9.479626],[76.678335,9.479602],[76.678446,9.479582],[76.678561,9.479561],[76.678709,9.479514],[76.678876,9.479447],[76.679012,9.479393],[76.679155,9.479336],[76.679265,9.479331],[76.679557,9.479329],[76.679755,9.479423],[76.679949,9.479746],[76.679998,9.479919],[76.680048,9.480092],[76.680164,9.480427],[76.680262,9.48059],[76.68036,9.480752],[76.680772,9.480964],[76.681216,9.481231],[76.681446,9.481652],[76.681455,9.481851],[76.681114,9.482601],[76.68039,9.483211],[76.680337,9.483255],[76.680168,9.483339],[76.680087,9.483366],[76.680026,9.483395],[76.679691,9.483367],[76.679468,9.4833],[76.679125,9.483029],[76.678288,9.481998],[76.67804,9.481915],[76.677645,9.481898],[76.674503,9.482639],[76.674026,9.482466],[76.673978,9.482426],[76.673641,9.481938],[76.673507,9.481558],[76.673567,9.481387],[76.673587,9.480852],[76.67372,9.480562],[76.6736,9.479873],[76.672749,9.479741],[76.671704,9.480184],[76.671811,9.480131],[76.670569,9.480624],[76.670493,9.480655],[76.670112,9.480801],[76.669944,9.480858],[76.669625,9.481004],[76.669146,9.481178],[76.668149,9.481496],[76.667788,9.481847],[76.667638,9.482031],[76.667578,9.482185],[76.667444,9.482176],[76.666724,9.481979],[76.666387,9.481817],[76.66623,9.481526],[76.666179,9.481486],[76.666008,9.481469],[76.665956,9.481435],[76.665905,9.481385],[76.665323,9.481344],[76.665236,9.481328],[76.665052,9.481479],[76.664936,9.481496],[76.664836,9.481455],[76.664752,9.481466],[76.664045,9.481622],[76.663928,9.481657],[76.663739,9.481716],[76.662948,9.48202],[76.66254,9.482029],[76.662124,9.482199],[76.661931,9.482191],[76.661896,9.482332],[76.661617,9.482535],[76.659825,9.482641],[76.659522,9.482658],[76.659231,9.48268],[76.659011,9.482479],[76.659591,9.482274],[76.659814,9.482173],[76.660111,9.482039],[76.660795,9.482015],[76.661295,9.48202],[76.66176,9.481981],[76.662067,9.481731],[76.662625,9.481275],[76.663757,9.481101],[76.663607,9.480418],[76.663635,9.48031],[76.663676,9.480149],[76.663765,9.479578],[76.663793,9.478958],[76.66358,9.47857],[76.663462,9.478431],[76.663371,9.478355],[76.663266,9.478267],[76.662917,9.478052],[76.662833,9.477999],[76.662656,9.477774],[76.66264,9.477632],[76.662643,9.477472],[76.662521,9.477037],[76.662201,9.476793],[76.66219,9.476699],[76.662251,9.476595],[76.662416,9.476431],[76.662538,9.476355],[76.662636,9.476323],[76.662774,9.4762],[76.662917,9.476082],[76.663627,9.475804],[76.663836,9.47547],[76.664398,9.475673],[76.664368,9.475956],[76.664338,9.47624],[76.664342,9.476578],[76.664634,9.477047],[76.664777,9.477176],[76.665098,9.477239],[76.665401,9.477271],[76.666141,9.47751],[76.666978,9.476636],[76.66807,9.475496],[76.668188,9.475408],[76.668861,9.474911],[76.669422,9.474409],[76.669793,9.474072],[76.670243,9.473604],[76.6708,9.473315],[76.671297,9.473063],[76.671526,9.472888],[76.671902,9.472052],[76.671842,9.471859],[76.671826,9.471517],[76.671852,9.471219],[76.671843,9.471027],[76.671833,9.470813],[76.671994,9.47082],[76.672218,9.470874],[76.672311,9.470917],[76.672737,9.471111],[76.673117,9.471078],[76.673221,9.471087],[76.673325,9.471095],[76.673369,9.470939],[76.673412,9.470799],[76.673457,9.470668],[76.673513,9.470508],[76.673597,9.470393],[76.673734,9.470337],[76.674032,9.470471],[76.674137,9.470482],[76.674495,9.470536],[76.674647,9.470624],[76.674999,9.47072],[76.675269,9.470644],[76.675519,9.470463],[76.675615,9.470349],[76.675702,9.470258],[76.675846,9.470191],[76.67608,9.470195],[76.676235,9.470136],[76.67652,9.470008],[76.676799,9.469963],[76.676891,9.46987],[76.67695,9.46977],[76.677227,9.46976],[76.677659,9.469788],[76.677828,9.469799],[76.677921,9.46982],[76.677925,9.470159],[76.677906,9.470269],[76.677874,9.470408],[76.677802,9.47061],[76.67771,9.470812],[76.677639,9.470986],[76.677644,9.471145],[76.677654,9.4714],[76.677529,9.471495],[76.677359,9.471519],[76.677092,9.471737],[76.677028,9.47187],[76.676969,9.471973],[76.676863,9.472079],[76.676543,9.472202],[76.675943,9.472562],[76.675719,9.472696],[76.675606,9.472764],[76.675283,9.473013],[76.674926,9.473468],[76.675005,9.473533],[76.675165,9.473666],[76.675204,9.473767],[76.67523,9.473926],[76.675275,9.474153],[76.675408,9.474307],[76.675598,9.474477],[76.675611,9.474578],[76.675696,9.474711],[76.675315,9.475008],[76.674961,9.476374],[76.674894,9.476633],[76.674865,9.476807],[76.674888,9.477198],[76.674947,9.477463],[76.675048,9.477726],[76.675169,9.47793],[76.675298,9.478149],[76.675422,9.478358],[76.675362,9.478593]]]},\"properties\":{\"Created_Da\":\"2024-10-21T10:33:45.959Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"kulathunkalkavala\",\"Surveyor\":\"sandhya j\",\"Ward_Name\":\"KULATHUNKALKAVALA\",\"Ward_No\":\"4\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.661143,9.459506],[76.661167,9.459401],[76.661485,9.458915],[76.661555,9.458809],[76.661491,9.458736],[76.661256,9.458606],[76.661015,9.458471],[76.660817,9.458245],[76.660659,9.458118],[76.660404,9.457915],[76.660627,9.457674],[76.660967,9.457383],[76.661072,9.457154],[76.661089,9.456983],[76.66115,9.456666],[76.661226,9.456395],[76.661357,9.456209],[76.661514,9.456069],[76.661721,9.456003],[76.661927,9.455912],[76.662007,9.455517],[76.661985,9.455225],[76.662015,9.454971],[76.66206,9.454709],[76.661831,9.454389],[76.661627,9.453919],[76.661888,9.453813],[76.662,9.453788],[76.662111,9.45367],[76.662332,9.453421],[76.662404,9.453248],[76.662471,9.453085],[76.662439,9.452791],[76.662684,9.452699],[76.662853,9.452561],[76.662991,9.452639],[76.663411,9.452739],[76.66335,9.452205],[76.663876,9.452153],[76.664087,9.452107],[76.664307,9.451916],[76.664419,9.451819],[76.664634,9.451584],[76.664866,9.451702],[76.665082,9.451585],[76.664999,9.451398],[76.66494,9.451008],[76.664809,9.450792],[76.664762,9.450713],[76.664689,9.450591],[76.664612,9.450487],[76.664467,9.450291],[76.665403,9.449861],[76.66567,9.449776],[76.666344,9.44956],[76.666623,9.449371],[76.666776,9.449267],[76.666961,9.449142],[76.667092,9.449052],[76.667521,9.449131],[76.667864,9.449195],[76.66831,9.449277],[76.668626,9.449335],[76.66896,9.449524],[76.669207,9.449664],[76.669287,9.449758],[76.669474,9.449976],[76.66951,9.450212],[76.66957,9.450607],[76.669619,9.450933],[76.669591,9.451328],[76.66958,9.451479],[76.669561,9.451742],[76.669547,9.451934],[76.669532,9.452148],[76.669523,9.452265],[76.669501,9.452406],[76.669543,9.452516],[76.669583,9.452657],[76.669633,9.45316],[76.669681,9.45341],[76.669758,9.453531],[76.669847,9.453673],[76.66991,9.453906],[76.669995,9.454226],[76.670243,9.454771],[76.67034,9.45499],[76.670389,9.455075],[76.670569,9.455404],[76.670947,9.455715],[76.671184,9.455845],[76.671562,9.456021],[76.671738,9.456099],[76.67196,9.456175],[76.672305,9.456296],[76.672422,9.456337],[76.672524,9.456366],[76.672648,9.456402],[76.67288,9.456485],[76.67255,9.456905],[76.67241,9.457372],[76.672332,9.45758],[76.672255,9.457786],[76.672292,9.457901],[76.672328,9.458015],[76.672433,9.458153],[76.672636,9.458283],[76.672683,9.458495],[76.672332,9.459086],[76.672212,9.459287],[76.672086,9.459499],[76.671981,9.459728],[76.671874,9.459962],[76.671729,9.459977],[76.671522,9.459999],[76.671285,9.460025],[76.670686,9.460323],[76.670328,9.460519],[76.669916,9.460822],[76.669611,9.461082],[76.669142,9.461549],[76.668595,9.461636],[76.668026,9.46144],[76.667885,9.461392],[76.667471,9.461237],[76.667466,9.461085],[76.667456,9.460786],[76.667447,9.460485],[76.667611,9.460111],[76.667851,9.459891],[76.667948,9.459802],[76.668031,9.459754],[76.668201,9.459655],[76.668332,9.459494],[76.668461,9.459333],[76.668458,9.459171],[76.668701,9.458373],[76.668802,9.458016],[76.668927,9.457577],[76.668975,9.457408],[76.668941,9.457068],[76.668903,9.456949],[76.668716,9.456898],[76.668389,9.456809],[76.668204,9.456759],[76.668012,9.456678],[76.667569,9.456668],[76.667454,9.456772],[76.667309,9.456714],[76.667046,9.456698],[76.666776,9.457236],[76.666733,9.457323],[76.666494,9.457653],[76.666305,9.458144],[76.666167,9.458503],[76.666111,9.458649],[76.665716,9.45909],[76.665427,9.459476],[76.665321,9.459619],[76.66503,9.459916],[76.664458,9.459594],[76.664388,9.459905],[76.664331,9.460041],[76.66415,9.460104],[76.664005,9.460213],[76.66386,9.460413],[76.663519,9.460787],[76.66333,9.460721],[76.663017,9.460596],[76.662764,9.46043],[76.66267,9.460336],[76.662505,9.460217],[76.662365,9.460226],[76.66225,9.460387],[76.662056,9.460657],[76.66194,9.460831],[76.661905,9.461016],[76.661714,9.461146],[76.661549,9.461208],[76.661377,9.461316],[76.661168,9.461457],[76.660955,9.461375],[76.660861,9.461339],[76.660669,9.461265],[76.6605,9.461156],[76.660326,9.461045],[76.660344,9.4609],[76.660785,9.460411],[76.660997,9.460146],[76.661041,9.459954],[76.661143,9.459506]]]},\"properties\":{\"Created_Da\":\"2024-10-16T07:30:21.618Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"sandhya j\",\"Ward_Name\":\"PATHIKKADU\",\"Ward_No\":\"13\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.700146,9.452348],[76.700238,9.452239],[76.700391,9.45207],[76.701049,9.451341],[76.701385,9.450839],[76.701765,9.450345],[76.70202,9.45],[76.702163,9.44985],[76.702702,9.449294],[76.702985,9.44902],[76.703401,9.448635],[76.703536,9.44853],[76.703883,9.448262],[76.704156,9.448051],[76.704277,9.448044],[76.704535,9.448028],[76.704849,9.44801],[76.70508,9.447996],[76.705408,9.448035],[76.70581,9.448158],[76.706186,9.448268],[76.706767,9.448439],[76.706902,9.44852],[76.707118,9.44865],[76.707506,9.448883],[76.708035,9.449199],[76.708338,9.449781],[76.708639,9.45036],[76.708466,9.451336],[76.708326,9.452124],[76.708114,9.453317],[76.708359,9.454384],[76.707857,9.454899],[76.707783,9.455076],[76.70783,9.455239],[76.708068,9.455529],[76.708125,9.455686],[76.708066,9.456125],[76.705617,9.460357],[76.705086,9.460878],[76.704791,9.461511],[76.704582,9.461751],[76.704169,9.461902],[76.703454,9.462171],[76.703119,9.462809],[76.702724,9.463033],[76.702801,9.463154],[76.702848,9.463248],[76.702915,9.463299],[76.702962,9.463354],[76.702998,9.463397],[76.703041,9.463457],[76.703077,9.463501],[76.703065,9.463589],[76.70303,9.46366],[76.702971,9.463725],[76.702926,9.463768],[76.702909,9.463828],[76.702906,9.463843],[76.702905,9.463862],[76.702841,9.463882],[76.702807,9.463895],[76.702704,9.463972],[76.702603,9.464096],[76.702333,9.464492],[76.702197,9.464616],[76.70205,9.464746],[76.701837,9.464929],[76.701742,9.465077],[76.701672,9.465276],[76.701584,9.465362],[76.701461,9.465537],[76.701299,9.465671],[76.701194,9.465844],[76.701062,9.466129],[76.70096,9.466256],[76.70084,9.466448],[76.700734,9.46676],[76.700436,9.466832],[76.700251,9.466874],[76.699093,9.467065],[76.699291,9.467318],[76.699449,9.46764],[76.699625,9.468038],[76.699835,9.468181],[76.699642,9.468674],[76.699523,9.468957],[76.699548,9.469318],[76.699876,9.469706],[76.700075,9.470059],[76.700201,9.470354],[76.700078,9.470809],[76.699979,9.47067],[76.699885,9.470667],[76.699762,9.470821],[76.69825,9.470804],[76.695471,9.469997],[76.694962,9.469839],[76.69491,9.469647],[76.694789,9.469522],[76.694795,9.469281],[76.694781,9.469133],[76.694766,9.468984],[76.694794,9.468885],[76.694866,9.468627],[76.695136,9.468209],[76.69546,9.467845],[76.695636,9.4677],[76.696132,9.467291],[76.696676,9.466843],[76.696767,9.466767],[76.697237,9.466392],[76.697761,9.465898],[76.697843,9.465808],[76.697663,9.465424],[76.697407,9.4652],[76.696953,9.465013],[76.697213,9.464825],[76.697595,9.46471],[76.698363,9.464499],[76.698673,9.464333],[76.698905,9.4642],[76.699007,9.464138],[76.699145,9.464061],[76.699347,9.463908],[76.699439,9.463826],[76.699718,9.4635],[76.700277,9.463162],[76.700441,9.463021],[76.700523,9.462926],[76.700569,9.462763],[76.700602,9.462629],[76.700756,9.462224],[76.700829,9.462034],[76.700753,9.460402],[76.700679,9.460118],[76.700646,9.459882],[76.700457,9.459433],[76.700406,9.459291],[76.700335,9.459145],[76.698991,9.459365],[76.698831,9.459208],[76.698729,9.459158],[76.698409,9.459033],[76.698286,9.459032],[76.698127,9.459061],[76.69791,9.459097],[76.697543,9.45883],[76.697466,9.458773],[76.69743,9.458599],[76.697206,9.458425],[76.697066,9.458229],[76.69728,9.458103],[76.697372,9.457995],[76.697451,9.457774],[76.697557,9.45748],[76.697641,9.457387],[76.697765,9.457283],[76.697849,9.457115],[76.697925,9.457063],[76.698115,9.456912],[76.698222,9.456804],[76.698303,9.456754],[76.69844,9.456734],[76.698575,9.456714],[76.698675,9.456693],[76.6988,9.456666],[76.699001,9.456456],[76.699132,9.456197],[76.69941,9.455842],[76.6995,9.455733],[76.699527,9.455417],[76.699555,9.455184],[76.699628,9.455021],[76.699657,9.454885],[76.699761,9.453807],[76.699876,9.453187],[76.699803,9.452755],[76.699867,9.452679],[76.699953,9.452577],[76.700146,9.452348]]]},\"properties\":{\"Created_Da\":\"2024-10-19T08:00:55.186Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"chakkalakkunnu\",\"Surveyor\":\"lino thomas\",\"Ward_Name\":\"CHAKKALAKKUNNU\",\"Ward_No\":\"7\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.680956,9.465395],[76.680466,9.465701],[76.680292,9.46581],[76.680197,9.465891],[76.680068,9.466001],[76.679958,9.466102],[76.679485,9.466535],[76.679002,9.466978],[76.678224,9.467398],[76.677867,9.46759],[76.677457,9.467542],[76.677314,9.467544],[76.676489,9.467692],[76.676317,9.46777],[76.675387,9.467853],[76.675179,9.467858],[76.675909,9.467113],[76.676124,9.466833],[76.676247,9.466574],[76.676182,9.466325],[76.676049,9.466182],[76.675984,9.466039],[76.675939,9.465939],[76.675923,9.465751],[76.675895,9.465416],[76.675961,9.465136],[76.676425,9.464478],[76.676528,9.464355],[76.676522,9.464051],[76.676528,9.463545],[76.676545,9.463149],[76.677229,9.462565],[76.677601,9.462135],[76.677712,9.461963],[76.677793,9.461669],[76.677745,9.461374],[76.677359,9.460133],[76.676826,9.458628],[76.676801,9.458017],[76.676797,9.457922],[76.676706,9.457503],[76.676641,9.457202],[76.676529,9.455665],[76.676505,9.45533],[76.67591,9.455362],[76.675097,9.455047],[76.675158,9.454851],[76.675348,9.454238],[76.675421,9.454003],[76.675479,9.453855],[76.675575,9.453768],[76.675696,9.453657],[76.675946,9.453497],[76.676041,9.453462],[76.676139,9.453425],[76.676513,9.453426],[76.677609,9.453784],[76.678211,9.453981],[76.679321,9.454344],[76.679886,9.454348],[76.68028,9.454351],[76.680619,9.454353],[76.68086,9.454354],[76.681242,9.454257],[76.681947,9.454079],[76.682649,9.453837],[76.683092,9.453685],[76.683396,9.453577],[76.683532,9.453528],[76.683632,9.453548],[76.683819,9.453521],[76.683994,9.453496],[76.684087,9.453482],[76.684288,9.453453],[76.684385,9.454614],[76.684432,9.455066],[76.684502,9.455586],[76.684658,9.45575],[76.684639,9.456011],[76.684765,9.456376],[76.685056,9.456583],[76.685116,9.456732],[76.685117,9.456971],[76.685282,9.457406],[76.685271,9.457765],[76.685352,9.458132],[76.685346,9.458239],[76.685221,9.458331],[76.684729,9.458405],[76.684461,9.45814],[76.684039,9.458188],[76.683901,9.458117],[76.683764,9.458046],[76.683603,9.457338],[76.68323,9.457666],[76.683056,9.457841],[76.68296,9.457968],[76.682863,9.458035],[76.682385,9.458515],[76.681961,9.458899],[76.681887,9.458966],[76.68164,9.459084],[76.681399,9.459207],[76.680942,9.459452],[76.68087,9.45951],[76.680638,9.459697],[76.680262,9.459694],[76.679954,9.459692],[76.679065,9.459739],[76.678892,9.459874],[76.678718,9.460009],[76.67851,9.460159],[76.678545,9.46036],[76.678927,9.460409],[76.679508,9.460501],[76.679499,9.460822],[76.679446,9.46093],[76.679533,9.46105],[76.679655,9.461131],[76.679708,9.461265],[76.67982,9.461406],[76.67988,9.461486],[76.67976,9.461558],[76.679634,9.461637],[76.679606,9.461835],[76.679657,9.461961],[76.679755,9.4622],[76.679934,9.462329],[76.680664,9.462853],[76.680902,9.463032],[76.681081,9.463157],[76.681236,9.463194],[76.681547,9.463427],[76.683434,9.464208],[76.683087,9.46451],[76.682679,9.464368],[76.682438,9.464345],[76.682114,9.464461],[76.681641,9.464922],[76.681126,9.465294],[76.680956,9.465395]]]},\"properties\":{\"Created_Da\":\"2024-10-17T07:35:10.594Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"lino thomas\",\"Ward_Name\":\"PULLUKUTHI\",\"Ward_No\":\"10\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.681286,9.466109],[76.681317,9.466375],[76.681389,9.46656],[76.681427,9.466656],[76.681467,9.466746],[76.681507,9.466833],[76.681557,9.466943],[76.681644,9.467092],[76.681691,9.467254],[76.68175,9.467462],[76.681858,9.467806],[76.681735,9.46818],[76.681855,9.468197],[76.681951,9.468118],[76.682046,9.468039],[76.682349,9.467886],[76.682855,9.467408],[76.683113,9.467352],[76.683223,9.467328],[76.683467,9.467],[76.683419,9.466565],[76.683376,9.466457],[76.683444,9.466342],[76.683975,9.466027],[76.684186,9.465938],[76.68433,9.465877],[76.684429,9.465835],[76.684558,9.46578],[76.684785,9.466051],[76.684894,9.466176],[76.685002,9.466308],[76.685064,9.466387],[76.685163,9.466336],[76.685309,9.466258],[76.68553,9.466182],[76.685604,9.466253],[76.685679,9.466333],[76.685736,9.466409],[76.685794,9.466493],[76.685939,9.466713],[76.686041,9.466868],[76.686096,9.466951],[76.686203,9.467114],[76.686326,9.467093],[76.68645,9.467069],[76.686585,9.467041],[76.686769,9.466969],[76.686882,9.466872],[76.687046,9.466731],[76.687273,9.466538],[76.687405,9.466463],[76.687574,9.466245],[76.687714,9.466205],[76.68793,9.466016],[76.687959,9.465904],[76.688023,9.465798],[76.68818,9.465635],[76.688278,9.465533],[76.688489,9.465253],[76.688609,9.465106],[76.688902,9.464904],[76.689286,9.464594],[76.689622,9.464315],[76.690077,9.464026],[76.69019,9.463864],[76.690255,9.463765],[76.690314,9.46366],[76.690444,9.463681],[76.690487,9.463934],[76.690492,9.464025],[76.69053,9.464244],[76.690583,9.464341],[76.690716,9.464509],[76.690787,9.46459],[76.690879,9.464687],[76.691021,9.464775],[76.69112,9.464812],[76.691034,9.467315],[76.690948,9.469833],[76.688657,9.470213],[76.686845,9.470514],[76.685506,9.470393],[76.684991,9.470347],[76.684704,9.470321],[76.682093,9.470707],[76.68122,9.471484],[76.681144,9.471548],[76.679631,9.47137],[76.679293,9.47197],[76.677809,9.472795],[76.677865,9.473042],[76.678225,9.472771],[76.678334,9.472876],[76.678417,9.472956],[76.678854,9.474853],[76.678641,9.474928],[76.678501,9.474977],[76.678346,9.4751],[76.678237,9.47555],[76.678188,9.475665],[76.67875,9.475746],[76.678887,9.475827],[76.679023,9.475907],[76.679172,9.476014],[76.679257,9.476074],[76.679368,9.476153],[76.679552,9.476231],[76.679735,9.476308],[76.679863,9.47638],[76.679991,9.476451],[76.680079,9.476505],[76.680191,9.476572],[76.680376,9.476666],[76.680713,9.476836],[76.681029,9.476966],[76.681311,9.477082],[76.68168,9.477135],[76.682129,9.477639],[76.682321,9.477597],[76.684757,9.479194],[76.685787,9.479869],[76.68566,9.479927],[76.685343,9.480024],[76.685006,9.480123],[76.68466,9.480224],[76.684174,9.480331],[76.683772,9.480398],[76.682619,9.480855],[76.681823,9.4811],[76.681651,9.481239],[76.681539,9.481381],[76.681446,9.481652],[76.681216,9.481231],[76.680772,9.480964],[76.68036,9.480752],[76.680262,9.48059],[76.680164,9.480427],[76.680048,9.480092],[76.679998,9.479919],[76.679949,9.479746],[76.679755,9.479423],[76.679557,9.479329],[76.679265,9.479331],[76.679155,9.479336],[76.679012,9.479393],[76.678876,9.479447],[76.678709,9.479514],[76.678561,9.479561],[76.678446,9.479582],[76.678335,9.479602],[76.678214,9.479626],[76.678034,9.479812],[76.677798,9.479995],[76.677598,9.479897],[76.67741,9.479835],[76.677295,9.479812],[76.677164,9.479828],[76.676992,9.479776],[76.676423,9.479316],[76.6764,9.478984],[76.676394,9.478893],[76.676392,9.478777],[76.676043,9.478677],[76.675848,9.478624],[76.675535,9.478584],[76.675362,9.478593],[76.675422,9.478358],[76.675298,9.478149],[76.675169,9.47793],[76.675048,9.477726],[76.674947,9.477463],[76.674888,9.477198],[76.674865,9.476807],[76.674894,9.476633],[76.674961,9.476374],[76.675315,9.475008],[76.675696,9.474711],[76.675611,9.474578],[76.675598,9.474477],[76.675408,9.474307],[76.675275,9.474153],[76.67523,9.473926],[76.675204,9.473767],[76.675165,9.473666],[76.675005,9.473533],[76.674926,9.473468],[76.675283,9.473013],[76.675606,9.472764],[76.675719,9.472696],[76.675943,9.472562],[76.676543,9.472202],[76.676863,9.472079],[76.676969,9.471973],[76.677028,9.47187],[76.677092,9.471737],[76.677359,9.471519],[76.677529,9.471495],[76.677654,9.4714],[76.677644,9.471145],[76.677639,9.470986],[76.67771,9.470812],[76.677802,9.47061],[76.677874,9.470408],[76.677906,9.470269],[76.677925,9.470159],[76.677921,9.46982],[76.677828,9.469799],[76.677659,9.469788],[76.677227,9.46976],[76.67695,9.46977],[76.676891,9.46987],[76.676799,9.469963],[76.67652,9.470008],[76.676235,9.470136],[76.67608,9.470195],[76.675846,9.470191],[76.675702,9.470258],[76.675615,9.470349],[76.675519,9.470463],[76.675269,9.470644],[76.674999,9.47072],[76.674647,9.470624],[76.674495,9.470536],[76.674137,9.470482],[76.674032,9.470471],[76.673734,9.470337],[76.673597,9.470393],[76.673513,9.470508],[76.673457,9.470668],[76.673412,9.470799],[76.673369,9.470939],[76.673325,9.471095],[76.673221,9.471087],[76.673117,9.471078],[76.672737,9.471111],[76.672311,9.470917],[76.672218,9.470874],[76.671994,9.47082],[76.671833,9.470813],[76.671993,9.470244],[76.67203,9.47011],[76.672107,9.46987],[76.672218,9.469528],[76.67319,9.469198],[76.673627,9.469053],[76.674156,9.468738],[76.674341,9.468498],[76.674453,9.468354],[76.674665,9.468117],[76.675071,9.467861],[76.675179,9.467858],[76.675387,9.467853],[76.676317,9.46777],[76.676489,9.467692],[76.677314,9.467544],[76.677457,9.467542],[76.677867,9.46759],[76.678224,9.467398],[76.679002,9.466978],[76.679485,9.466535],[76.679958,9.466102],[76.680068,9.466001],[76.680197,9.465891],[76.680292,9.46581],[76.680466,9.465701],[76.680956,9.465395],[76.681104,9.465416],[76.681151,9.465659],[76.681176,9.465754],[76.681237,9.465926],[76.681286,9.466109]]]},\"properties\":{\"Created_Da\":\"2024-10-21T11:41:53.806Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"chakkattupadi\",\"Surveyor\":\"lino thomas\",\"Ward_Name\":\"CHAKKATTUPADI\",\"Ward_No\":\"5\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.665427,9.459476],[76.665716,9.45909],[76.666111,9.458649],[76.666167,9.458503],[76.6661,9.458343],[76.666305,9.458144],[76.666494,9.457653],[76.666733,9.457323],[76.666776,9.457236],[76.667046,9.456698],[76.667309,9.456714],[76.667454,9.456772],[76.667569,9.456668],[76.668012,9.456678],[76.668204,9.456759],[76.668389,9.456809],[76.668716,9.456898],[76.668903,9.456949],[76.668941,9.457068],[76.668975,9.457408],[76.668927,9.457577],[76.668802,9.458016],[76.668701,9.458373],[76.668458,9.459171],[76.668461,9.459333],[76.668332,9.459494],[76.668201,9.459655],[76.668031,9.459754],[76.667948,9.459802],[76.667851,9.459891],[76.667611,9.460111],[76.667447,9.460485],[76.667456,9.460786],[76.667466,9.461085],[76.667471,9.461237],[76.667885,9.461392],[76.667872,9.461505],[76.667857,9.461639],[76.667836,9.461825],[76.667725,9.462165],[76.667682,9.462557],[76.66767,9.462744],[76.667654,9.463007],[76.667882,9.46316],[76.668035,9.463219],[76.668192,9.463288],[76.668324,9.463345],[76.668285,9.463659],[76.668245,9.463972],[76.668296,9.464193],[76.668427,9.464368],[76.668508,9.464475],[76.668599,9.464594],[76.66869,9.464669],[76.668648,9.464799],[76.668711,9.465437],[76.668583,9.465491],[76.668287,9.465572],[76.668067,9.465732],[76.667868,9.466309],[76.667725,9.466831],[76.667533,9.46719],[76.667427,9.467385],[76.667322,9.467547],[76.667247,9.46774],[76.667223,9.467839],[76.667102,9.468149],[76.667019,9.468364],[76.666841,9.468668],[76.666701,9.469011],[76.66639,9.469231],[76.666242,9.469225],[76.666093,9.469219],[76.665505,9.469564],[76.664602,9.469726],[76.664507,9.469785],[76.663879,9.47017],[76.663599,9.470419],[76.663203,9.470769],[76.663111,9.470851],[76.663086,9.470972],[76.662981,9.471477],[76.662953,9.471613],[76.662875,9.471907],[76.662827,9.47209],[76.662813,9.472445],[76.662801,9.472724],[76.66279,9.472974],[76.662782,9.473143],[76.662746,9.473671],[76.662588,9.47397],[76.661957,9.475171],[76.661535,9.476051],[76.661474,9.476178],[76.66076,9.477268],[76.660626,9.477096],[76.660624,9.476859],[76.660621,9.47662],[76.660732,9.476438],[76.660804,9.476317],[76.660821,9.476222],[76.660138,9.476332],[76.659777,9.477105],[76.658867,9.47672],[76.658302,9.476502],[76.658141,9.476436],[76.657965,9.476405],[76.657882,9.476262],[76.657831,9.476141],[76.657819,9.476028],[76.657784,9.475858],[76.657749,9.475689],[76.657716,9.475546],[76.657706,9.475332],[76.65767,9.475197],[76.657635,9.475062],[76.657526,9.474826],[76.657483,9.474611],[76.657438,9.474469],[76.657069,9.474141],[76.657657,9.473385],[76.658501,9.472434],[76.658649,9.47223],[76.658718,9.472101],[76.658903,9.471881],[76.659076,9.471646],[76.659381,9.471447],[76.659463,9.471355],[76.659616,9.471186],[76.659768,9.470951],[76.659856,9.470772],[76.659975,9.470504],[76.660049,9.470316],[76.660279,9.470043],[76.660499,9.469464],[76.660663,9.468833],[76.66072,9.468267],[76.660713,9.468087],[76.66068,9.467944],[76.660604,9.467698],[76.660527,9.46745],[76.660349,9.46707],[76.660235,9.466812],[76.660202,9.466586],[76.660232,9.465812],[76.660253,9.465283],[76.66025,9.465155],[76.66022,9.464912],[76.660207,9.464768],[76.660128,9.464553],[76.660086,9.464446],[76.659931,9.463966],[76.65986,9.463745],[76.659646,9.463209],[76.659358,9.462857],[76.659146,9.462537],[76.658993,9.462464],[76.658714,9.462413],[76.658528,9.462378],[76.658211,9.462606],[76.657894,9.462622],[76.657667,9.462631],[76.657497,9.462524],[76.657421,9.462306],[76.65758,9.461546],[76.657916,9.461669],[76.657905,9.461402],[76.658048,9.461191],[76.658473,9.460748],[76.658595,9.460537],[76.658771,9.460229],[76.658866,9.460054],[76.658926,9.459965],[76.659504,9.459018],[76.659631,9.458875],[76.659757,9.458732],[76.660173,9.458206],[76.660404,9.457915],[76.660659,9.458118],[76.660817,9.458245],[76.661015,9.458471],[76.661256,9.458606],[76.661491,9.458736],[76.661555,9.458809],[76.661485,9.458915],[76.661167,9.459401],[76.661143,9.459506],[76.661041,9.459954],[76.660997,9.460146],[76.660785,9.460411],[76.660344,9.4609],[76.660326,9.461045],[76.6605,9.461156],[76.660669,9.461265],[76.660861,9.461339],[76.660955,9.461375],[76.661168,9.461457],[76.661377,9.461316],[76.661549,9.461208],[76.661714,9.461146],[76.661905,9.461016],[76.66194,9.460831],[76.662056,9.460657],[76.66225,9.460387],[76.662365,9.460226],[76.662505,9.460217],[76.66267,9.460336],[76.662764,9.46043],[76.663017,9.460596],[76.66333,9.460721],[76.663519,9.460787],[76.66386,9.460413],[76.664005,9.460213],[76.66415,9.460104],[76.664331,9.460041],[76.664388,9.459905],[76.664458,9.459594],[76.66503,9.459916],[76.665321,9.459619],[76.665427,9.459476]]]},\"properties\":{\"Created_Da\":\"2024-10-16T08:49:19.543Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"sandhya j\",\"Ward_Name\":\"POOVANPARA\",\"Ward_No\":\"12\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.69112,9.464812],[76.691021,9.464775],[76.690879,9.464687],[76.690787,9.46459],[76.690716,9.464509],[76.690583,9.464341],[76.69053,9.464244],[76.690492,9.464025],[76.690487,9.463934],[76.690444,9.463681],[76.690541,9.463505],[76.690601,9.463386],[76.690709,9.463185],[76.690906,9.462806],[76.690986,9.462583],[76.690941,9.462472],[76.690809,9.462332],[76.690857,9.462226],[76.690922,9.462105],[76.69104,9.461694],[76.690954,9.461319],[76.690928,9.461114],[76.690949,9.460848],[76.690967,9.460751],[76.691151,9.459728],[76.690985,9.459426],[76.690928,9.459218],[76.691054,9.458959],[76.691117,9.458852],[76.691339,9.458476],[76.691469,9.458275],[76.691481,9.458145],[76.691425,9.458073],[76.690932,9.457826],[76.69079,9.457641],[76.690661,9.457519],[76.690294,9.457718],[76.689968,9.457894],[76.689876,9.457818],[76.689741,9.457706],[76.689721,9.457557],[76.689708,9.457455],[76.689632,9.457029],[76.689496,9.456554],[76.689555,9.456223],[76.689614,9.455871],[76.689563,9.455454],[76.689535,9.455328],[76.689437,9.454879],[76.689451,9.454656],[76.689588,9.454425],[76.689624,9.454293],[76.689577,9.454049],[76.689492,9.45397],[76.68909,9.453851],[76.68909,9.453711],[76.689091,9.453556],[76.689091,9.453299],[76.689198,9.453245],[76.689464,9.45311],[76.68966,9.453011],[76.689753,9.452964],[76.689917,9.452881],[76.69056,9.452555],[76.69138,9.452178],[76.691655,9.452006],[76.692383,9.451696],[76.692672,9.451573],[76.693602,9.451306],[76.69428,9.451111],[76.694402,9.451088],[76.694521,9.451136],[76.694843,9.451265],[76.695435,9.451512],[76.695531,9.451552],[76.695685,9.45166],[76.695911,9.451818],[76.696097,9.451949],[76.696193,9.452016],[76.696448,9.452195],[76.696625,9.452302],[76.696967,9.452505],[76.698067,9.453173],[76.698334,9.453335],[76.69875,9.453206],[76.699158,9.453104],[76.699266,9.453046],[76.699274,9.453047],[76.699617,9.452929],[76.699687,9.452863],[76.699803,9.452755],[76.699876,9.453187],[76.699761,9.453807],[76.699657,9.454885],[76.699628,9.455021],[76.699555,9.455184],[76.699527,9.455417],[76.6995,9.455733],[76.69941,9.455842],[76.699132,9.456197],[76.699001,9.456456],[76.6988,9.456666],[76.698675,9.456693],[76.698575,9.456714],[76.69844,9.456734],[76.698303,9.456754],[76.698222,9.456804],[76.698115,9.456912],[76.697925,9.457063],[76.697849,9.457115],[76.697765,9.457283],[76.697641,9.457387],[76.697557,9.45748],[76.697451,9.457774],[76.697372,9.457995],[76.69728,9.458103],[76.697066,9.458229],[76.697206,9.458425],[76.69743,9.458599],[76.697466,9.458773],[76.697543,9.45883],[76.69791,9.459097],[76.698127,9.459061],[76.698286,9.459032],[76.698409,9.459033],[76.698729,9.459158],[76.698831,9.459208],[76.698991,9.459365],[76.700335,9.459145],[76.700406,9.459291],[76.700457,9.459433],[76.700646,9.459882],[76.700679,9.460118],[76.700753,9.460402],[76.700829,9.462034],[76.700756,9.462224],[76.700602,9.462629],[76.700569,9.462763],[76.700523,9.462926],[76.700441,9.463021],[76.700277,9.463162],[76.699718,9.4635],[76.699439,9.463826],[76.699347,9.463908],[76.699145,9.464061],[76.699007,9.464138],[76.698905,9.4642],[76.698673,9.464333],[76.698363,9.464499],[76.697595,9.46471],[76.697213,9.464825],[76.696953,9.465013],[76.696746,9.46514],[76.696438,9.465309],[76.69638,9.465399],[76.696303,9.46549],[76.696104,9.465507],[76.69601,9.46556],[76.695931,9.46568],[76.695859,9.465758],[76.695059,9.465569],[76.694937,9.465578],[76.694747,9.465663],[76.694477,9.465834],[76.694238,9.465932],[76.694111,9.465961],[76.694022,9.46593],[76.693927,9.465897],[76.693779,9.465846],[76.69351,9.465754],[76.693365,9.465704],[76.693258,9.465683],[76.69313,9.465658],[76.692885,9.46563],[76.692685,9.465554],[76.692391,9.465476],[76.692279,9.465446],[76.69211,9.465401],[76.692035,9.46535],[76.691841,9.465219],[76.691589,9.465003],[76.691508,9.464933],[76.691386,9.464913],[76.69112,9.464812]]]},\"properties\":{\"Created_Da\":\"2024-10-17T12:01:08.607Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"lino thomas\",\"Ward_Name\":\"VAIPUR\",\"Ward_No\":\"8\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.667725,9.466831],[76.667868,9.466309],[76.668067,9.465732],[76.668287,9.465572],[76.668583,9.465491],[76.668711,9.465437],[76.668648,9.464799],[76.66869,9.464669],[76.668599,9.464594],[76.668508,9.464475],[76.668427,9.464368],[76.668296,9.464193],[76.668245,9.463972],[76.668285,9.463659],[76.668324,9.463345],[76.668192,9.463288],[76.668035,9.463219],[76.667882,9.46316],[76.667654,9.463007],[76.66767,9.462744],[76.667682,9.462557],[76.667725,9.462165],[76.667836,9.461825],[76.667857,9.461639],[76.667872,9.461505],[76.667885,9.461392],[76.668026,9.46144],[76.668595,9.461636],[76.669142,9.461549],[76.669611,9.461082],[76.669916,9.460822],[76.670328,9.460519],[76.670686,9.460323],[76.671285,9.460025],[76.671522,9.459999],[76.671729,9.459977],[76.671874,9.459962],[76.671981,9.459728],[76.672086,9.459499],[76.672212,9.459287],[76.672332,9.459086],[76.672683,9.458495],[76.672636,9.458283],[76.672433,9.458153],[76.672328,9.458015],[76.672292,9.457901],[76.672255,9.457786],[76.672332,9.45758],[76.67241,9.457372],[76.67255,9.456905],[76.67288,9.456485],[76.673085,9.456558],[76.673457,9.456422],[76.673793,9.45635],[76.674021,9.456302],[76.674354,9.45623],[76.674559,9.456044],[76.67463,9.455979],[76.674773,9.455773],[76.674903,9.455462],[76.675011,9.455201],[76.675097,9.455047],[76.67591,9.455362],[76.676505,9.45533],[76.676529,9.455665],[76.676641,9.457202],[76.676706,9.457503],[76.676797,9.457922],[76.676801,9.458017],[76.676826,9.458628],[76.677359,9.460133],[76.677745,9.461374],[76.677793,9.461669],[76.677712,9.461963],[76.677601,9.462135],[76.677229,9.462565],[76.676545,9.463149],[76.676528,9.463545],[76.676522,9.464051],[76.676528,9.464355],[76.676425,9.464478],[76.675961,9.465136],[76.675895,9.465416],[76.675923,9.465751],[76.675939,9.465939],[76.675984,9.466039],[76.676049,9.466182],[76.676182,9.466325],[76.676247,9.466574],[76.676124,9.466833],[76.675909,9.467113],[76.675179,9.467858],[76.675071,9.467861],[76.674665,9.468117],[76.674453,9.468354],[76.674341,9.468498],[76.674156,9.468738],[76.673627,9.469053],[76.67319,9.469198],[76.672218,9.469528],[76.672107,9.46987],[76.67203,9.47011],[76.671993,9.470244],[76.671833,9.470813],[76.671843,9.471027],[76.671852,9.471219],[76.671826,9.471517],[76.671842,9.471859],[76.670412,9.472032],[76.669341,9.472423],[76.668055,9.472113],[76.667676,9.471779],[76.66754,9.471555],[76.667592,9.470961],[76.667657,9.470211],[76.667563,9.469761],[76.667137,9.46922],[76.666841,9.468668],[76.667019,9.468364],[76.667102,9.468149],[76.667223,9.467839],[76.667247,9.46774],[76.667322,9.467547],[76.667427,9.467385],[76.667533,9.46719],[76.667725,9.466831]]]},\"properties\":{\"Created_Da\":\"2024-10-17T06:51:20.547Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Muttathumavu\",\"Surveyor\":\"lino thomas\",\"Ward_Name\":\"MUTTATHUMAVU\",\"Ward_No\":\"11\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.656533,9.463119],[76.656531,9.46175],[76.656661,9.461357],[76.656778,9.461196],[76.657081,9.461354],[76.657235,9.461419],[76.65758,9.461546],[76.657421,9.462306],[76.657497,9.462524],[76.657667,9.462631],[76.657894,9.462622],[76.658211,9.462606],[76.658528,9.462378],[76.658714,9.462413],[76.658993,9.462464],[76.659146,9.462537],[76.659358,9.462857],[76.659646,9.463209],[76.65986,9.463745],[76.659931,9.463966],[76.660086,9.464446],[76.660128,9.464553],[76.660207,9.464768],[76.66022,9.464912],[76.66025,9.465155],[76.660253,9.465283],[76.660232,9.465812],[76.660202,9.466586],[76.660235,9.466812],[76.660349,9.46707],[76.660527,9.46745],[76.660604,9.467698],[76.66068,9.467944],[76.660713,9.468087],[76.66072,9.468267],[76.660663,9.468833],[76.660499,9.469464],[76.660279,9.470043],[76.660049,9.470316],[76.659975,9.470504],[76.659856,9.470772],[76.659768,9.470951],[76.659616,9.471186],[76.659463,9.471355],[76.659381,9.471447],[76.659076,9.471646],[76.658903,9.471881],[76.658718,9.472101],[76.658649,9.47223],[76.658501,9.472434],[76.657657,9.473385],[76.657069,9.474141],[76.656817,9.473975],[76.656566,9.47381],[76.656123,9.473528],[76.655565,9.473156],[76.655421,9.472933],[76.655247,9.472723],[76.655163,9.472653],[76.654798,9.472353],[76.654602,9.472369],[76.654448,9.472466],[76.654257,9.472793],[76.654122,9.472963],[76.653986,9.4732],[76.65385,9.473436],[76.65374,9.473736],[76.653623,9.473979],[76.653482,9.474271],[76.653393,9.474379],[76.653307,9.474488],[76.653184,9.474645],[76.653062,9.474803],[76.652938,9.474927],[76.652837,9.475076],[76.652781,9.475173],[76.652591,9.475474],[76.652493,9.475714],[76.652475,9.476006],[76.652557,9.476616],[76.652438,9.476666],[76.652329,9.476699],[76.651878,9.476835],[76.649913,9.47733],[76.649394,9.477288],[76.649863,9.476824],[76.649952,9.476736],[76.650787,9.476006],[76.650863,9.475939],[76.651335,9.475083],[76.65054,9.474778],[76.650345,9.474706],[76.649957,9.474824],[76.649298,9.475114],[76.648947,9.475245],[76.648433,9.474914],[76.648108,9.47473],[76.647815,9.474557],[76.647678,9.474461],[76.647603,9.474408],[76.647499,9.474427],[76.647309,9.474492],[76.647176,9.474565],[76.646988,9.47457],[76.646873,9.474589],[76.646568,9.474307],[76.646429,9.474272],[76.646398,9.473244],[76.646888,9.472631],[76.646971,9.472528],[76.647436,9.471866],[76.647683,9.471319],[76.647819,9.471099],[76.647998,9.470945],[76.648295,9.470921],[76.648734,9.471031],[76.649346,9.470865],[76.649774,9.470587],[76.650354,9.470092],[76.651351,9.469399],[76.652,9.469134],[76.653365,9.467676],[76.653787,9.46719],[76.654049,9.46689],[76.655255,9.46562],[76.655413,9.465453],[76.655967,9.464779],[76.65625,9.464166],[76.656382,9.463867],[76.656443,9.463672],[76.656533,9.463119]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Linto\",\"Ward_Name\":\"VALLIYAKULAM\",\"Ward_No\":\"2\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.700965,9.475572],[76.700582,9.476287],[76.7001,9.4766],[76.699327,9.477012],[76.698749,9.477188],[76.69847,9.477005],[76.697761,9.476791],[76.696892,9.477077],[76.695285,9.476987],[76.694066,9.477223],[76.6923,9.477113],[76.691693,9.477304],[76.690457,9.478007],[76.688847,9.477857],[76.688343,9.478051],[76.687263,9.478593],[76.686477,9.479059],[76.686236,9.479478],[76.685787,9.479869],[76.684757,9.479194],[76.682321,9.477597],[76.682129,9.477639],[76.681999,9.477668],[76.68168,9.477135],[76.681311,9.477082],[76.681029,9.476966],[76.680713,9.476836],[76.680376,9.476666],[76.680191,9.476572],[76.680079,9.476505],[76.679991,9.476451],[76.679863,9.47638],[76.679735,9.476308],[76.679552,9.476231],[76.679368,9.476153],[76.679257,9.476074],[76.679172,9.476014],[76.679023,9.475907],[76.678887,9.475827],[76.67875,9.475746],[76.678188,9.475665],[76.678237,9.47555],[76.678346,9.4751],[76.678501,9.474977],[76.678641,9.474928],[76.678854,9.474853],[76.678417,9.472956],[76.678334,9.472876],[76.678225,9.472771],[76.677865,9.473042],[76.677809,9.472795],[76.679293,9.47197],[76.679631,9.47137],[76.681144,9.471548],[76.68122,9.471484],[76.682093,9.470707],[76.684704,9.470321],[76.684991,9.470347],[76.685506,9.470393],[76.686845,9.470514],[76.688657,9.470213],[76.690948,9.469833],[76.691034,9.467315],[76.69112,9.464812],[76.691386,9.464913],[76.691508,9.464933],[76.691589,9.465003],[76.691841,9.465219],[76.692035,9.46535],[76.69211,9.465401],[76.692279,9.465446],[76.692391,9.465476],[76.692685,9.465554],[76.692885,9.46563],[76.69313,9.465658],[76.693258,9.465683],[76.693365,9.465704],[76.69351,9.465754],[76.693779,9.465846],[76.693927,9.465897],[76.694022,9.46593],[76.694111,9.465961],[76.694238,9.465932],[76.694477,9.465834],[76.694747,9.465663],[76.694937,9.465578],[76.695059,9.465569],[76.695859,9.465758],[76.695931,9.46568],[76.69601,9.46556],[76.696104,9.465507],[76.696303,9.46549],[76.69638,9.465399],[76.696438,9.465309],[76.696746,9.46514],[76.696953,9.465013],[76.697407,9.4652],[76.697663,9.465424],[76.697843,9.465808],[76.697761,9.465898],[76.697237,9.466392],[76.696767,9.466767],[76.696676,9.466843],[76.696132,9.467291],[76.695636,9.4677],[76.69546,9.467845],[76.695136,9.468209],[76.694866,9.468627],[76.694794,9.468885],[76.694766,9.468984],[76.694781,9.469133],[76.694795,9.469281],[76.694789,9.469522],[76.69491,9.469647],[76.694962,9.469839],[76.695471,9.469997],[76.69825,9.470804],[76.699762,9.470821],[76.699885,9.470667],[76.699979,9.47067],[76.700078,9.470809],[76.700263,9.471037],[76.700351,9.471142],[76.700405,9.471204],[76.700409,9.471313],[76.700514,9.471457],[76.700606,9.471534],[76.700651,9.471638],[76.700766,9.471806],[76.700804,9.471868],[76.700801,9.471916],[76.700847,9.472004],[76.700969,9.472322],[76.701073,9.472404],[76.700968,9.472608],[76.700904,9.472836],[76.701214,9.473737],[76.701184,9.47512],[76.700965,9.475572]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:41:23.576Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Lino thomas\",\"Ward_Name\":\"PUNNAVELY\",\"Ward_No\":\"6\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.643364,9.467975],[76.643311,9.467815],[76.643159,9.467451],[76.643066,9.467142],[76.642973,9.466946],[76.642954,9.466845],[76.642866,9.466577],[76.642773,9.466346],[76.642605,9.465925],[76.642678,9.465533],[76.642704,9.465397],[76.642714,9.465162],[76.642739,9.46502],[76.642778,9.46479],[76.642895,9.46477],[76.643047,9.464743],[76.643338,9.464691],[76.643399,9.464996],[76.643537,9.464974],[76.643539,9.464705],[76.643757,9.464655],[76.643752,9.464483],[76.644212,9.464554],[76.644911,9.464425],[76.645919,9.464428],[76.646582,9.464571],[76.646593,9.464888],[76.646643,9.465515],[76.647007,9.465506],[76.647084,9.464779],[76.647302,9.464746],[76.647767,9.464676],[76.648676,9.465034],[76.649013,9.465041],[76.649114,9.465073],[76.649372,9.465101],[76.649491,9.465116],[76.649205,9.465493],[76.650227,9.46614],[76.650312,9.46626],[76.650543,9.466593],[76.650641,9.466726],[76.650817,9.466593],[76.650868,9.466509],[76.651565,9.466012],[76.651777,9.465852],[76.651861,9.465806],[76.652011,9.465732],[76.652201,9.465625],[76.652149,9.465408],[76.652083,9.46513],[76.654587,9.463149],[76.655584,9.464021],[76.65625,9.464166],[76.655967,9.464779],[76.655413,9.465453],[76.655255,9.46562],[76.654049,9.46689],[76.653787,9.46719],[76.653365,9.467676],[76.652,9.469134],[76.651351,9.469399],[76.650354,9.470092],[76.649774,9.470587],[76.649346,9.470865],[76.648734,9.471031],[76.648295,9.470921],[76.647998,9.470945],[76.647819,9.471099],[76.647683,9.471319],[76.647436,9.471866],[76.646971,9.472528],[76.646888,9.472631],[76.646398,9.473244],[76.646429,9.474272],[76.646568,9.474307],[76.646873,9.474589],[76.646988,9.47457],[76.647176,9.474565],[76.647309,9.474492],[76.647499,9.474427],[76.647603,9.474408],[76.647678,9.474461],[76.647815,9.474557],[76.648108,9.47473],[76.648433,9.474914],[76.648947,9.475245],[76.649298,9.475114],[76.649957,9.474824],[76.650345,9.474706],[76.65054,9.474778],[76.651335,9.475083],[76.650863,9.475939],[76.650787,9.476006],[76.649952,9.476736],[76.649863,9.476824],[76.649394,9.477288],[76.649913,9.47733],[76.651878,9.476835],[76.652329,9.476699],[76.652438,9.476666],[76.652557,9.476616],[76.652826,9.476705],[76.653175,9.476866],[76.653812,9.477161],[76.654185,9.477555],[76.653964,9.477956],[76.653757,9.478332],[76.653546,9.478713],[76.653395,9.478887],[76.653301,9.478999],[76.653243,9.479116],[76.653218,9.479263],[76.653177,9.479626],[76.653232,9.480238],[76.653386,9.480839],[76.653763,9.481397],[76.653859,9.481538],[76.653969,9.481706],[76.653032,9.481589],[76.651157,9.481502],[76.650813,9.481343],[76.650217,9.480268],[76.649747,9.479959],[76.649958,9.479799],[76.648263,9.479041],[76.648092,9.478894],[76.648014,9.478827],[76.647811,9.47881],[76.6475,9.478776],[76.647377,9.478707],[76.647337,9.478704],[76.647143,9.478674],[76.647039,9.478692],[76.646353,9.478762],[76.64529,9.478689],[76.644645,9.478791],[76.644355,9.478896],[76.643679,9.479106],[76.643467,9.47924],[76.642835,9.479169],[76.642445,9.478947],[76.642214,9.478676],[76.642207,9.478528],[76.642279,9.478374],[76.642396,9.478126],[76.642438,9.477832],[76.64223,9.477697],[76.641841,9.477466],[76.641774,9.477371],[76.64178,9.477212],[76.64164,9.477044],[76.641628,9.476853],[76.64168,9.476654],[76.641853,9.476543],[76.641896,9.476505],[76.641937,9.476396],[76.641944,9.476287],[76.641901,9.47616],[76.641914,9.47611],[76.641998,9.476042],[76.642014,9.475982],[76.641997,9.475907],[76.641933,9.475835],[76.641836,9.475747],[76.641528,9.475526],[76.641477,9.475428],[76.641452,9.475355],[76.641456,9.47514],[76.641512,9.474861],[76.641732,9.474509],[76.641783,9.474267],[76.641713,9.47404],[76.64168,9.473793],[76.641655,9.47361],[76.641404,9.473204],[76.64155,9.47279],[76.641432,9.471894],[76.64144,9.471156],[76.641296,9.471039],[76.641392,9.470617],[76.641192,9.469916],[76.641121,9.469826],[76.641046,9.469459],[76.641077,9.469234],[76.641274,9.468701],[76.641473,9.468668],[76.641595,9.468569],[76.641564,9.468305],[76.642379,9.468155],[76.643364,9.467975]]]},\"properties\":{\"Created_Da\":\"2024-10-15T09:31:28.403Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"sandhya j\",\"Ward_Name\":\"NALLORPPADAVU\",\"Ward_No\":\"1\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.664777,9.477176],[76.664634,9.477047],[76.664342,9.476578],[76.664338,9.47624],[76.664368,9.475956],[76.664398,9.475673],[76.663836,9.47547],[76.663627,9.475804],[76.662917,9.476082],[76.662774,9.4762],[76.662636,9.476323],[76.662538,9.476355],[76.662416,9.476431],[76.662251,9.476595],[76.66219,9.476699],[76.662201,9.476793],[76.662521,9.477037],[76.662643,9.477472],[76.66264,9.477632],[76.662656,9.477774],[76.662833,9.477999],[76.662917,9.478052],[76.663266,9.478267],[76.663371,9.478355],[76.663462,9.478431],[76.66358,9.47857],[76.663793,9.478958],[76.663765,9.479578],[76.663676,9.480149],[76.663635,9.48031],[76.663607,9.480418],[76.663757,9.481101],[76.662625,9.481275],[76.662067,9.481731],[76.66176,9.481981],[76.661295,9.48202],[76.660795,9.482015],[76.660111,9.482039],[76.659814,9.482173],[76.659591,9.482274],[76.659011,9.482479],[76.658792,9.482456],[76.658731,9.482312],[76.658662,9.482237],[76.658501,9.482175],[76.658352,9.482147],[76.65824,9.482158],[76.657927,9.482168],[76.657595,9.482209],[76.657173,9.482278],[76.656927,9.482259],[76.656869,9.482255],[76.656816,9.482247],[76.65675,9.482238],[76.656658,9.482228],[76.656517,9.48223],[76.656344,9.482217],[76.65626,9.482209],[76.655874,9.482023],[76.655536,9.482009],[76.655467,9.482183],[76.655329,9.482148],[76.654752,9.482063],[76.653969,9.481706],[76.653859,9.481538],[76.653763,9.481397],[76.653386,9.480839],[76.653232,9.480238],[76.653177,9.479626],[76.653218,9.479263],[76.653243,9.479116],[76.653301,9.478999],[76.653395,9.478887],[76.653546,9.478713],[76.653757,9.478332],[76.653964,9.477956],[76.654185,9.477555],[76.653812,9.477161],[76.653175,9.476866],[76.652826,9.476705],[76.652557,9.476616],[76.652475,9.476006],[76.652493,9.475714],[76.652591,9.475474],[76.652781,9.475173],[76.652837,9.475076],[76.652938,9.474927],[76.653062,9.474803],[76.653184,9.474645],[76.653307,9.474488],[76.653393,9.474379],[76.653482,9.474271],[76.653623,9.473979],[76.65374,9.473736],[76.65385,9.473436],[76.653986,9.4732],[76.654122,9.472963],[76.654257,9.472793],[76.654448,9.472466],[76.654602,9.472369],[76.654798,9.472353],[76.655163,9.472653],[76.655247,9.472723],[76.655421,9.472933],[76.655565,9.473156],[76.656123,9.473528],[76.656566,9.47381],[76.656817,9.473975],[76.657069,9.474141],[76.657438,9.474469],[76.657483,9.474611],[76.657526,9.474826],[76.657635,9.475062],[76.65767,9.475197],[76.657706,9.475332],[76.657716,9.475546],[76.657749,9.475689],[76.657784,9.475858],[76.657819,9.476028],[76.657831,9.476141],[76.657882,9.476262],[76.657965,9.476405],[76.658141,9.476436],[76.658302,9.476502],[76.658867,9.47672],[76.659777,9.477105],[76.660138,9.476332],[76.660821,9.476222],[76.660804,9.476317],[76.660732,9.476438],[76.660621,9.47662],[76.660624,9.476859],[76.660626,9.477096],[76.66076,9.477268],[76.661474,9.476178],[76.661535,9.476051],[76.661957,9.475171],[76.662588,9.47397],[76.662746,9.473671],[76.662782,9.473143],[76.66279,9.472974],[76.662801,9.472724],[76.662813,9.472445],[76.662827,9.47209],[76.662875,9.471907],[76.662953,9.471613],[76.662981,9.471477],[76.663086,9.470972],[76.663111,9.470851],[76.663203,9.470769],[76.663599,9.470419],[76.663879,9.47017],[76.664507,9.469785],[76.664602,9.469726],[76.665505,9.469564],[76.666093,9.469219],[76.666242,9.469225],[76.66639,9.469231],[76.666701,9.469011],[76.666841,9.468668],[76.667137,9.46922],[76.667563,9.469761],[76.667657,9.470211],[76.667592,9.470961],[76.66754,9.471555],[76.667676,9.471779],[76.668055,9.472113],[76.669341,9.472423],[76.670412,9.472032],[76.671842,9.471859],[76.671902,9.472052],[76.671526,9.472888],[76.671297,9.473063],[76.6708,9.473315],[76.670243,9.473604],[76.669793,9.474072],[76.669422,9.474409],[76.668861,9.474911],[76.668188,9.475408],[76.66807,9.475496],[76.666978,9.476636],[76.666141,9.47751],[76.665401,9.477271],[76.665098,9.477239],[76.664777,9.477176]]]},\"properties\":{\"Created_Da\":\"2024-10-16T10:44:56.116Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"sandhya j\",\"Ward_Name\":\"ANICADU\",\"Ward_No\":\"3\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.690941,9.462472],[76.690986,9.462583],[76.690906,9.462806],[76.690709,9.463185],[76.690601,9.463386],[76.690541,9.463505],[76.690444,9.463681],[76.690314,9.46366],[76.690255,9.463765],[76.69019,9.463864],[76.690077,9.464026],[76.689622,9.464315],[76.689286,9.464594],[76.688902,9.464904],[76.688609,9.465106],[76.688489,9.465253],[76.688278,9.465533],[76.68818,9.465635],[76.688023,9.465798],[76.687959,9.465904],[76.68793,9.466016],[76.687714,9.466205],[76.687574,9.466245],[76.687405,9.466463],[76.687273,9.466538],[76.687046,9.466731],[76.686882,9.466872],[76.686769,9.466969],[76.686585,9.467041],[76.68645,9.467069],[76.686326,9.467093],[76.686203,9.467114],[76.686096,9.466951],[76.686041,9.466868],[76.685939,9.466713],[76.685794,9.466493],[76.685736,9.466409],[76.685679,9.466333],[76.685604,9.466253],[76.68553,9.466182],[76.685309,9.466258],[76.685163,9.466336],[76.685064,9.466387],[76.685002,9.466308],[76.684894,9.466176],[76.684785,9.466051],[76.684558,9.46578],[76.684429,9.465835],[76.68433,9.465877],[76.684186,9.465938],[76.683975,9.466027],[76.683444,9.466342],[76.683376,9.466457],[76.683419,9.466565],[76.683467,9.467],[76.683223,9.467328],[76.683113,9.467352],[76.682855,9.467408],[76.682349,9.467886],[76.682046,9.468039],[76.681951,9.468118],[76.681855,9.468197],[76.681735,9.46818],[76.681858,9.467806],[76.68175,9.467462],[76.681691,9.467254],[76.681644,9.467092],[76.681557,9.466943],[76.681507,9.466833],[76.681467,9.466746],[76.681427,9.466656],[76.681389,9.46656],[76.681317,9.466375],[76.681286,9.466109],[76.681237,9.465926],[76.681176,9.465754],[76.681151,9.465659],[76.681104,9.465416],[76.680956,9.465395],[76.681126,9.465294],[76.681641,9.464922],[76.682114,9.464461],[76.682438,9.464345],[76.682679,9.464368],[76.683087,9.46451],[76.683434,9.464208],[76.681547,9.463427],[76.681236,9.463194],[76.681081,9.463157],[76.680902,9.463032],[76.680664,9.462853],[76.679934,9.462329],[76.679755,9.4622],[76.679657,9.461961],[76.679606,9.461835],[76.679634,9.461637],[76.67976,9.461558],[76.67988,9.461486],[76.67982,9.461406],[76.679708,9.461265],[76.679655,9.461131],[76.679533,9.46105],[76.679446,9.46093],[76.679499,9.460822],[76.679508,9.460501],[76.678927,9.460409],[76.678545,9.46036],[76.67851,9.460159],[76.678718,9.460009],[76.678892,9.459874],[76.679065,9.459739],[76.679954,9.459692],[76.680262,9.459694],[76.680638,9.459697],[76.68087,9.45951],[76.680942,9.459452],[76.681399,9.459207],[76.68164,9.459084],[76.681887,9.458966],[76.681961,9.458899],[76.682385,9.458515],[76.682863,9.458035],[76.68296,9.457968],[76.683056,9.457841],[76.68323,9.457666],[76.683603,9.457338],[76.683764,9.458046],[76.683901,9.458117],[76.684039,9.458188],[76.684461,9.45814],[76.684729,9.458405],[76.685221,9.458331],[76.685346,9.458239],[76.685352,9.458132],[76.685271,9.457765],[76.685282,9.457406],[76.685117,9.456971],[76.685116,9.456732],[76.685056,9.456583],[76.684765,9.456376],[76.684639,9.456011],[76.684658,9.45575],[76.684502,9.455586],[76.684432,9.455066],[76.684385,9.454614],[76.684288,9.453453],[76.684447,9.453426],[76.684603,9.453406],[76.684764,9.453392],[76.68489,9.453387],[76.684997,9.453383],[76.685098,9.45338],[76.685276,9.453377],[76.68538,9.453374],[76.685577,9.45337],[76.68577,9.453358],[76.685887,9.45335],[76.686004,9.453355],[76.686134,9.453363],[76.686295,9.453372],[76.686426,9.453387],[76.686543,9.4534],[76.686664,9.453413],[76.686818,9.453425],[76.686965,9.453443],[76.687097,9.453459],[76.687292,9.453484],[76.68739,9.453496],[76.687557,9.453503],[76.687781,9.453508],[76.688012,9.453507],[76.688172,9.45351],[76.68841,9.453517],[76.688647,9.453522],[76.6888,9.453434],[76.688948,9.453365],[76.689091,9.453299],[76.689091,9.453556],[76.68909,9.453711],[76.68909,9.453851],[76.689492,9.45397],[76.689577,9.454049],[76.689624,9.454293],[76.689588,9.454425],[76.689451,9.454656],[76.689437,9.454879],[76.689535,9.455328],[76.689563,9.455454],[76.689614,9.455871],[76.689555,9.456223],[76.689496,9.456554],[76.689632,9.457029],[76.689708,9.457455],[76.689721,9.457557],[76.689741,9.457706],[76.689876,9.457818],[76.689968,9.457894],[76.690294,9.457718],[76.690661,9.457519],[76.69079,9.457641],[76.690932,9.457826],[76.691425,9.458073],[76.691481,9.458145],[76.691469,9.458275],[76.691339,9.458476],[76.691117,9.458852],[76.691054,9.458959],[76.690928,9.459218],[76.690985,9.459426],[76.691151,9.459728],[76.690967,9.460751],[76.690949,9.460848],[76.690928,9.461114],[76.690954,9.461319],[76.69104,9.461694],[76.690922,9.462105],[76.690857,9.462226],[76.690809,9.462332],[76.690941,9.462472]]]},\"properties\":{\"Created_Da\":\"2024-10-17T09:35:21.990Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"lino thomas\",\"Ward_Name\":\"VADAKKEMURY\",\"Ward_No\":\"9\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.659208,9.454581],[76.659463,9.454715],[76.659667,9.454712],[76.659692,9.454842],[76.65973,9.455014],[76.659617,9.455609],[76.659797,9.455681],[76.660057,9.455698],[76.660174,9.455421],[76.66014,9.455062],[76.660185,9.454786],[76.660214,9.4547],[76.66015,9.454503],[76.660098,9.454344],[76.660319,9.454279],[76.66046,9.454237],[76.660649,9.454181],[76.660823,9.454138],[76.660931,9.454112],[76.661206,9.454044],[76.661333,9.454027],[76.661627,9.453919],[76.661831,9.454389],[76.66206,9.454709],[76.662015,9.454971],[76.661985,9.455225],[76.662007,9.455517],[76.661927,9.455912],[76.661721,9.456003],[76.661514,9.456069],[76.661357,9.456209],[76.661226,9.456395],[76.66115,9.456666],[76.661089,9.456983],[76.661072,9.457154],[76.660967,9.457383],[76.660627,9.457674],[76.660404,9.457915],[76.660173,9.458206],[76.659757,9.458732],[76.659631,9.458875],[76.659504,9.459018],[76.658926,9.459965],[76.658866,9.460054],[76.658771,9.460229],[76.658595,9.460537],[76.658473,9.460748],[76.658048,9.461191],[76.657905,9.461402],[76.657916,9.461669],[76.65758,9.461546],[76.657235,9.461419],[76.657081,9.461354],[76.656778,9.461196],[76.656661,9.461357],[76.656531,9.46175],[76.656533,9.463119],[76.656443,9.463672],[76.656382,9.463867],[76.65625,9.464166],[76.655584,9.464021],[76.654587,9.463149],[76.652083,9.46513],[76.652149,9.465408],[76.652201,9.465625],[76.652011,9.465732],[76.651861,9.465806],[76.651777,9.465852],[76.651565,9.466012],[76.650868,9.466509],[76.650817,9.466593],[76.650641,9.466726],[76.650543,9.466593],[76.650312,9.46626],[76.650227,9.46614],[76.649205,9.465493],[76.649491,9.465116],[76.649372,9.465101],[76.649114,9.465073],[76.649013,9.465041],[76.648676,9.465034],[76.647767,9.464676],[76.647302,9.464746],[76.647084,9.464779],[76.647007,9.465506],[76.646643,9.465515],[76.646593,9.464888],[76.646582,9.464571],[76.645919,9.464428],[76.644911,9.464425],[76.644212,9.464554],[76.643752,9.464483],[76.643714,9.464301],[76.643662,9.464054],[76.643575,9.463642],[76.64358,9.463123],[76.643583,9.462855],[76.643587,9.462495],[76.643589,9.462299],[76.643848,9.46172],[76.643929,9.46154],[76.643988,9.461407],[76.64404,9.461292],[76.644115,9.461123],[76.644174,9.460936],[76.644292,9.460565],[76.644321,9.460474],[76.64438,9.460287],[76.644443,9.46009],[76.644519,9.459849],[76.644632,9.459494],[76.644842,9.459574],[76.644932,9.459645],[76.64511,9.459786],[76.645528,9.460066],[76.645672,9.460162],[76.645783,9.460375],[76.64594,9.460679],[76.64615,9.461083],[76.64621,9.461152],[76.646533,9.461528],[76.646648,9.461661],[76.646909,9.4616],[76.647069,9.461563],[76.647358,9.461495],[76.647478,9.461467],[76.64772,9.461411],[76.647758,9.461051],[76.64779,9.460741],[76.647802,9.460598],[76.647766,9.460454],[76.647864,9.460336],[76.648009,9.460162],[76.648193,9.459941],[76.648374,9.459724],[76.648534,9.459532],[76.648647,9.459533],[76.648869,9.459534],[76.649988,9.459475],[76.650128,9.459314],[76.650235,9.459192],[76.650453,9.458943],[76.650631,9.458804],[76.650596,9.458535],[76.650545,9.458151],[76.650524,9.45799],[76.650746,9.457818],[76.650989,9.457707],[76.651622,9.457418],[76.652042,9.45772],[76.652451,9.458014],[76.652662,9.458166],[76.65287,9.458316],[76.653083,9.458469],[76.653236,9.45844],[76.653433,9.458382],[76.653726,9.458294],[76.654033,9.458207],[76.654132,9.458183],[76.654384,9.458121],[76.6547,9.458043],[76.655042,9.457957],[76.655006,9.457752],[76.654944,9.457408],[76.654811,9.457376],[76.654834,9.457216],[76.654968,9.457201],[76.655001,9.457109],[76.655293,9.457134],[76.655465,9.457149],[76.655714,9.457171],[76.655814,9.457176],[76.655961,9.457183],[76.656349,9.457179],[76.656473,9.457178],[76.656878,9.457161],[76.657176,9.457034],[76.657341,9.457037],[76.657354,9.456663],[76.65734,9.456375],[76.657347,9.456191],[76.657352,9.456029],[76.657287,9.455949],[76.657218,9.455768],[76.657334,9.455708],[76.65746,9.455642],[76.6578,9.455465],[76.658219,9.455247],[76.658304,9.454917],[76.658329,9.454822],[76.658431,9.454714],[76.658743,9.454626],[76.659137,9.454515],[76.659208,9.454581]]]},\"properties\":{\"Created_Da\":\"2024-10-14T12:17:58.839Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Anicadu\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"sandhya j\",\"Ward_Name\":\"MARRICKAL\",\"Ward_No\":\"14\",\"Mandal\":\"Mallappally\"}}]}");
@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.511359,9.332499],[76.511106,9.332503],[76.510541,9.332511],[76.510412,9.331847],[76.509999,9.331936],[76.509876,9.33205],[76.509806,9.332114],[76.509727,9.332188],[76.509624,9.3322],[76.509459,9.33222],[76.509281,9.332241],[76.509169,9.332254],[76.508992,9.332275],[76.508759,9.332303],[76.508502,9.332334],[76.508281,9.33236],[76.508007,9.332393],[76.507901,9.332406],[76.507551,9.332419],[76.507355,9.332426],[76.507135,9.332434],[76.506804,9.332446],[76.506653,9.332452],[76.506442,9.332409],[76.506302,9.332381],[76.506161,9.332353],[76.506013,9.332323],[76.505806,9.332281],[76.505628,9.332245],[76.505487,9.332216],[76.505371,9.332193],[76.505195,9.332084],[76.505082,9.332015],[76.504617,9.331728],[76.504354,9.331826],[76.504146,9.331784],[76.503861,9.331726],[76.503731,9.3317],[76.503635,9.331665],[76.503389,9.331578],[76.503055,9.33146],[76.503051,9.331102],[76.503204,9.330788],[76.503299,9.33049],[76.503362,9.330249],[76.503415,9.33011],[76.503493,9.329892],[76.503528,9.329687],[76.503547,9.329595],[76.503573,9.329437],[76.503596,9.329266],[76.503615,9.329145],[76.50363,9.32902],[76.503653,9.328843],[76.503672,9.328689],[76.503707,9.328317],[76.503703,9.328042],[76.503727,9.327798],[76.503865,9.327558],[76.503968,9.327495],[76.503968,9.327402],[76.503972,9.326948],[76.504027,9.326858],[76.504132,9.326806],[76.504199,9.326695],[76.504104,9.326405],[76.504061,9.326196],[76.504019,9.325987],[76.503992,9.325772],[76.503871,9.324705],[76.503813,9.324193],[76.504295,9.324289],[76.505279,9.324474],[76.506328,9.324635],[76.507222,9.324823],[76.508434,9.325153],[76.509675,9.32549],[76.510708,9.325756],[76.511721,9.32595],[76.512704,9.326089],[76.513797,9.326227],[76.514269,9.326382],[76.514972,9.326659],[76.515808,9.326981],[76.516481,9.327158],[76.517158,9.327297],[76.517833,9.327277],[76.518699,9.327194],[76.519491,9.327112],[76.520504,9.327011],[76.521095,9.326978],[76.522254,9.326864],[76.52318,9.326727],[76.523281,9.327236],[76.523337,9.327797],[76.523388,9.328249],[76.523566,9.328578],[76.523612,9.328662],[76.523727,9.328707],[76.524058,9.328668],[76.524336,9.328802],[76.524358,9.329089],[76.524363,9.329262],[76.524368,9.329488],[76.524377,9.329935],[76.524382,9.330164],[76.524387,9.330399],[76.524396,9.330845],[76.524377,9.331061],[76.524358,9.331273],[76.523707,9.33141],[76.52352,9.331449],[76.522221,9.332392],[76.521867,9.333654],[76.521494,9.334402],[76.521403,9.334388],[76.521059,9.334339],[76.520958,9.333362],[76.520141,9.333382],[76.520029,9.33385],[76.519306,9.333712],[76.519154,9.333683],[76.518706,9.333597],[76.518113,9.333483],[76.517704,9.333637],[76.517624,9.334221],[76.516961,9.334151],[76.516183,9.334068],[76.516029,9.333876],[76.515778,9.33348],[76.515632,9.333435],[76.515387,9.333361],[76.515181,9.332974],[76.514556,9.333051],[76.513708,9.333156],[76.513534,9.332909],[76.513407,9.332835],[76.513286,9.332831],[76.512556,9.332809],[76.5125,9.332709],[76.512415,9.332456],[76.511359,9.332499]]]},\"properties\":{\"Created_Da\":\"2024-10-20T06:57:59.634Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"sudheermon\",\"Ward_Name\":\"KADAPRA MANNAR\",\"Ward_No\":\"13\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.531941,9.331082],[76.531955,9.331206],[76.532057,9.331486],[76.532092,9.331584],[76.532217,9.331887],[76.532388,9.332302],[76.532452,9.33244],[76.532986,9.333142],[76.533609,9.33374],[76.534023,9.334134],[76.534457,9.334513],[76.534511,9.33464],[76.534505,9.334932],[76.534384,9.334963],[76.534291,9.334988],[76.534189,9.335014],[76.534027,9.335154],[76.533357,9.335263],[76.532693,9.335246],[76.532406,9.335285],[76.531895,9.335325],[76.531096,9.335543],[76.531018,9.335102],[76.530948,9.334683],[76.530005,9.334736],[76.529779,9.334678],[76.529634,9.334811],[76.529313,9.334833],[76.529244,9.334943],[76.529137,9.335112],[76.529012,9.335264],[76.528157,9.335216],[76.527877,9.335097],[76.527831,9.334942],[76.52783,9.334675],[76.527878,9.334147],[76.527928,9.334042],[76.527592,9.333951],[76.52749,9.33391],[76.526876,9.334026],[76.526772,9.333716],[76.526662,9.333695],[76.52654,9.333678],[76.526107,9.333713],[76.525705,9.333751],[76.525158,9.333726],[76.524893,9.333675],[76.524672,9.333624],[76.524511,9.333645],[76.524519,9.333832],[76.524416,9.334005],[76.524375,9.334134],[76.524385,9.334342],[76.524385,9.334619],[76.524112,9.334616],[76.523992,9.334444],[76.523835,9.334431],[76.52286,9.334575],[76.522749,9.334577],[76.52268,9.33451],[76.522533,9.334534],[76.522308,9.334571],[76.521494,9.334402],[76.522221,9.332392],[76.52352,9.331449],[76.523707,9.33141],[76.524358,9.331273],[76.524377,9.331061],[76.524396,9.330845],[76.524387,9.330399],[76.524382,9.330164],[76.524377,9.329935],[76.524368,9.329488],[76.524363,9.329262],[76.524358,9.329089],[76.524336,9.328802],[76.524058,9.328668],[76.523727,9.328707],[76.523612,9.328662],[76.523566,9.328578],[76.523388,9.328249],[76.523337,9.327797],[76.523281,9.327236],[76.52318,9.326727],[76.523533,9.32664],[76.524092,9.326496],[76.524575,9.326346],[76.524967,9.326258],[76.525684,9.326107],[76.526152,9.326038],[76.526881,9.326095],[76.527455,9.326266],[76.527964,9.326472],[76.528657,9.32712],[76.528949,9.327441],[76.529253,9.327727],[76.529695,9.328141],[76.529945,9.328554],[76.530126,9.328838],[76.530461,9.329142],[76.530852,9.329455],[76.531104,9.329583],[76.531166,9.329614],[76.531554,9.329677],[76.531617,9.329687],[76.531884,9.329661],[76.531905,9.330241],[76.531917,9.330603],[76.531931,9.330987],[76.531941,9.331082]]]},\"properties\":{\"Created_Da\":\"2024-10-20T09:13:14.502Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"sudheermon\",\"Ward_Name\":\"KADAPRA SOUTH\",\"Ward_No\":\"12\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.524868,9.334487],[76.524655,9.334423],[76.524385,9.334342],[76.524375,9.334134],[76.524416,9.334005],[76.524519,9.333832],[76.524511,9.333645],[76.524672,9.333624],[76.524893,9.333675],[76.525158,9.333726],[76.525705,9.333751],[76.526107,9.333713],[76.52654,9.333678],[76.526662,9.333695],[76.526772,9.333716],[76.526876,9.334026],[76.52749,9.33391],[76.527592,9.333951],[76.527928,9.334042],[76.527878,9.334147],[76.52783,9.334675],[76.527831,9.334942],[76.527877,9.335097],[76.528157,9.335216],[76.529012,9.335264],[76.529137,9.335112],[76.529244,9.334943],[76.529313,9.334833],[76.529634,9.334811],[76.529779,9.334678],[76.530005,9.334736],[76.530948,9.334683],[76.531018,9.335102],[76.531096,9.335543],[76.531895,9.335325],[76.532406,9.335285],[76.532693,9.335246],[76.533357,9.335263],[76.534027,9.335154],[76.534189,9.335014],[76.534291,9.334988],[76.534384,9.334963],[76.534505,9.334932],[76.534531,9.335296],[76.534535,9.335438],[76.534436,9.336426],[76.534392,9.336762],[76.534366,9.336958],[76.534276,9.337479],[76.534202,9.337894],[76.53418,9.338013],[76.534025,9.33875],[76.533968,9.339033],[76.533928,9.339271],[76.533813,9.339946],[76.533785,9.340115],[76.53376,9.340263],[76.533739,9.340391],[76.533708,9.340575],[76.533742,9.341018],[76.533961,9.341595],[76.534038,9.34174],[76.534176,9.341997],[76.53444,9.342827],[76.534509,9.342995],[76.534691,9.34344],[76.534825,9.343922],[76.534932,9.344131],[76.535102,9.344465],[76.535295,9.345048],[76.535371,9.345621],[76.534995,9.345613],[76.534171,9.345595],[76.534046,9.345634],[76.533489,9.345873],[76.533229,9.345768],[76.53299,9.34567],[76.532864,9.345619],[76.532702,9.345575],[76.532475,9.345521],[76.531963,9.345462],[76.531327,9.345532],[76.530806,9.345592],[76.530541,9.345623],[76.530452,9.345653],[76.530345,9.345646],[76.530133,9.345633],[76.529922,9.345619],[76.529816,9.345612],[76.529592,9.34563],[76.529306,9.345559],[76.529166,9.345525],[76.529037,9.34554],[76.528919,9.345591],[76.528757,9.345662],[76.528668,9.345734],[76.528522,9.345853],[76.528382,9.345963],[76.528254,9.346062],[76.528017,9.346156],[76.527752,9.346273],[76.527577,9.346215],[76.527431,9.346071],[76.527142,9.345788],[76.527039,9.345644],[76.526933,9.345497],[76.526762,9.34526],[76.526617,9.344737],[76.526609,9.344473],[76.526058,9.34376],[76.526005,9.3433],[76.525954,9.342857],[76.526135,9.342815],[76.52685,9.342649],[76.526854,9.342397],[76.527032,9.34237],[76.52718,9.342192],[76.527443,9.341875],[76.527524,9.341778],[76.527668,9.341707],[76.527943,9.341871],[76.528254,9.341701],[76.528561,9.341531],[76.528737,9.341434],[76.528883,9.341328],[76.528962,9.341271],[76.529054,9.341204],[76.529347,9.340992],[76.529613,9.340752],[76.529959,9.340439],[76.53051,9.340244],[76.530696,9.340166],[76.530829,9.340114],[76.530977,9.340043],[76.531079,9.33993],[76.531383,9.339836],[76.531666,9.33979],[76.531935,9.339751],[76.532225,9.33971],[76.532387,9.339639],[76.532615,9.339538],[76.533017,9.339166],[76.533244,9.338955],[76.533241,9.338823],[76.533225,9.338102],[76.53322,9.337888],[76.533082,9.337655],[76.532903,9.337351],[76.53282,9.337292],[76.53274,9.337234],[76.532443,9.337124],[76.532269,9.33706],[76.532179,9.337027],[76.531987,9.336956],[76.531754,9.336927],[76.53155,9.336892],[76.531312,9.336851],[76.531196,9.336831],[76.531025,9.336804],[76.530211,9.336833],[76.529911,9.337199],[76.529802,9.337336],[76.529563,9.33692],[76.52954,9.336683],[76.529503,9.336507],[76.529335,9.336496],[76.529234,9.336489],[76.529125,9.336482],[76.528891,9.336466],[76.528763,9.336457],[76.528455,9.336436],[76.528356,9.33627],[76.528186,9.335984],[76.528023,9.335985],[76.527633,9.335988],[76.52684,9.335527],[76.5267,9.335446],[76.526599,9.335387],[76.5264,9.335271],[76.5263,9.335208],[76.526217,9.335155],[76.526133,9.335102],[76.526154,9.334871],[76.526047,9.334839],[76.525938,9.334807],[76.525727,9.334743],[76.525619,9.334711],[76.525512,9.334679],[76.525403,9.334647],[76.525296,9.334615],[76.525188,9.334583],[76.524975,9.334519],[76.524868,9.334487]]]},\"properties\":{\"Created_Da\":\"2024-10-21T08:52:26.642Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"abhijith\",\"Ward_Name\":\"KADAPRA WEST\",\"Ward_No\":\"15\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.503813,9.324193],[76.503871,9.324705],[76.503992,9.325772],[76.504019,9.325987],[76.504061,9.326196],[76.504104,9.326405],[76.504199,9.326695],[76.504132,9.326806],[76.504027,9.326858],[76.503972,9.326948],[76.503968,9.327402],[76.503968,9.327495],[76.503865,9.327558],[76.503727,9.327798],[76.503703,9.328042],[76.503707,9.328317],[76.503672,9.328689],[76.503653,9.328843],[76.50363,9.32902],[76.503615,9.329145],[76.503596,9.329266],[76.503573,9.329437],[76.503547,9.329595],[76.503528,9.329687],[76.503493,9.329892],[76.503415,9.33011],[76.503362,9.330249],[76.503299,9.33049],[76.503204,9.330788],[76.503051,9.331102],[76.503055,9.33146],[76.502858,9.331627],[76.502774,9.331701],[76.502546,9.331711],[76.502245,9.331794],[76.50209,9.331837],[76.501954,9.331874],[76.501471,9.331661],[76.501363,9.331757],[76.500982,9.331779],[76.500937,9.331907],[76.500806,9.331928],[76.500822,9.331461],[76.500472,9.331442],[76.500431,9.33136],[76.500297,9.331091],[76.500041,9.331031],[76.499823,9.330991],[76.499696,9.330975],[76.499336,9.330927],[76.499108,9.331046],[76.499151,9.331192],[76.499269,9.331598],[76.499446,9.331628],[76.499517,9.331808],[76.499612,9.332052],[76.499651,9.332152],[76.499683,9.332398],[76.499704,9.332556],[76.499721,9.332689],[76.499754,9.332939],[76.499786,9.333181],[76.499804,9.33332],[76.499829,9.333518],[76.499844,9.333627],[76.499894,9.334012],[76.49976,9.334105],[76.499636,9.334188],[76.499628,9.334565],[76.499616,9.335163],[76.49961,9.335504],[76.499583,9.335698],[76.499552,9.335919],[76.498982,9.336776],[76.498903,9.336953],[76.498711,9.337231],[76.498155,9.33715],[76.498019,9.337158],[76.497891,9.337163],[76.497464,9.337177],[76.496132,9.337168],[76.496019,9.337168],[76.494953,9.337225],[76.494788,9.337234],[76.494594,9.337245],[76.494423,9.337254],[76.49407,9.337096],[76.493753,9.336884],[76.493597,9.336815],[76.493227,9.336617],[76.493022,9.336536],[76.492683,9.336409],[76.492593,9.336383],[76.491684,9.336217],[76.491271,9.336158],[76.491124,9.336146],[76.490696,9.335893],[76.490587,9.335828],[76.490427,9.33572],[76.49031,9.335664],[76.490099,9.335563],[76.489764,9.335512],[76.48947,9.335614],[76.489054,9.335757],[76.488852,9.335468],[76.488754,9.335278],[76.488657,9.335083],[76.488608,9.334801],[76.488613,9.334574],[76.488792,9.33382],[76.488866,9.333613],[76.488957,9.333373],[76.488912,9.333204],[76.48885,9.33297],[76.488771,9.332571],[76.488679,9.332107],[76.4886,9.331706],[76.488517,9.331286],[76.48849,9.331149],[76.488561,9.330951],[76.488616,9.330837],[76.488729,9.330722],[76.488852,9.330548],[76.488991,9.330363],[76.489135,9.330092],[76.48949,9.329714],[76.489248,9.329584],[76.489678,9.328839],[76.489779,9.328663],[76.490018,9.328673],[76.493673,9.327137],[76.495341,9.325142],[76.497173,9.324265],[76.499848,9.323651],[76.500933,9.323603],[76.50142,9.323539],[76.501931,9.323563],[76.502997,9.323834],[76.503076,9.323893],[76.503813,9.324193]]]},\"properties\":{\"Created_Da\":\"2024-10-19T11:25:45.106Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"sudheermon\",\"Ward_Name\":\"THEVERI\",\"Ward_No\":\"14\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.534461,9.359563],[76.534261,9.359599],[76.534141,9.35961],[76.533953,9.359626],[76.533628,9.359695],[76.5334,9.359438],[76.533209,9.359223],[76.532526,9.359298],[76.532084,9.359757],[76.531857,9.359826],[76.531662,9.359871],[76.531545,9.359861],[76.531448,9.359825],[76.531134,9.359707],[76.530794,9.359579],[76.530462,9.359346],[76.530242,9.359183],[76.530108,9.359083],[76.52973,9.359031],[76.529507,9.359],[76.529389,9.358983],[76.529259,9.359],[76.529102,9.35902],[76.528895,9.358983],[76.528978,9.358832],[76.529019,9.358725],[76.529061,9.358619],[76.529096,9.358526],[76.529171,9.35826],[76.529243,9.358005],[76.529319,9.357818],[76.529428,9.357548],[76.529535,9.357272],[76.529594,9.357079],[76.529626,9.356969],[76.529693,9.356743],[76.529711,9.356647],[76.52973,9.356549],[76.529794,9.356298],[76.529847,9.356087],[76.529909,9.355884],[76.529938,9.355787],[76.530013,9.355551],[76.530077,9.355365],[76.530135,9.355198],[76.530201,9.355031],[76.530243,9.35476],[76.530282,9.354554],[76.530338,9.354253],[76.530366,9.35412],[76.530424,9.353843],[76.530503,9.353503],[76.530611,9.353044],[76.531011,9.353101],[76.531373,9.352807],[76.531428,9.352387],[76.532002,9.352291],[76.532195,9.352259],[76.532625,9.352319],[76.532618,9.35213],[76.532613,9.351984],[76.532532,9.351728],[76.53248,9.351569],[76.532406,9.351339],[76.532333,9.351113],[76.532462,9.350792],[76.532366,9.350563],[76.532238,9.350416],[76.531995,9.350097],[76.531673,9.350488],[76.531507,9.350379],[76.531102,9.349762],[76.530765,9.349612],[76.530466,9.349507],[76.530227,9.349419],[76.529958,9.349359],[76.52976,9.34908],[76.529617,9.348878],[76.529492,9.348626],[76.529486,9.348292],[76.529506,9.347996],[76.529539,9.347773],[76.529555,9.347665],[76.529622,9.347494],[76.529767,9.347308],[76.530089,9.347186],[76.530161,9.347051],[76.530229,9.346926],[76.530323,9.346774],[76.530051,9.346784],[76.529834,9.346791],[76.529742,9.346627],[76.529728,9.34653],[76.52971,9.346411],[76.529682,9.346215],[76.529592,9.34563],[76.529816,9.345612],[76.529922,9.345619],[76.530133,9.345633],[76.530345,9.345646],[76.530452,9.345653],[76.530541,9.345623],[76.530806,9.345592],[76.531327,9.345532],[76.531963,9.345462],[76.532475,9.345521],[76.532702,9.345575],[76.532864,9.345619],[76.53299,9.34567],[76.533229,9.345768],[76.533489,9.345873],[76.534046,9.345634],[76.534171,9.345595],[76.534995,9.345613],[76.535371,9.345621],[76.535393,9.346002],[76.535397,9.346103],[76.53544,9.346393],[76.535526,9.346659],[76.535656,9.346918],[76.535774,9.34714],[76.535947,9.347462],[76.536093,9.347698],[76.536219,9.347902],[76.536351,9.34814],[76.536546,9.348482],[76.536692,9.348747],[76.536885,9.349076],[76.537176,9.349511],[76.537258,9.349683],[76.537387,9.349893],[76.537628,9.350335],[76.537993,9.350978],[76.538137,9.351291],[76.538236,9.35151],[76.538576,9.352006],[76.538958,9.352491],[76.539364,9.352822],[76.539523,9.35285],[76.539814,9.352862],[76.540167,9.352927],[76.54027,9.352955],[76.540402,9.353057],[76.540572,9.35319],[76.540771,9.353584],[76.540893,9.353991],[76.540936,9.354136],[76.541114,9.354769],[76.541196,9.355157],[76.541222,9.355277],[76.541031,9.355284],[76.540899,9.355293],[76.540724,9.355322],[76.540624,9.355345],[76.540516,9.355372],[76.54043,9.3554],[76.540323,9.355424],[76.540223,9.355452],[76.540095,9.355474],[76.539982,9.355468],[76.539844,9.355444],[76.53975,9.355457],[76.539659,9.355479],[76.539559,9.355501],[76.539381,9.355559],[76.539282,9.355583],[76.539065,9.355631],[76.538893,9.355712],[76.538729,9.355782],[76.538569,9.355855],[76.538442,9.355907],[76.538346,9.355935],[76.538231,9.355992],[76.538111,9.356066],[76.538026,9.356154],[76.537916,9.356341],[76.537752,9.356544],[76.537648,9.356638],[76.537551,9.356709],[76.537392,9.356792],[76.537245,9.356866],[76.537112,9.356946],[76.537013,9.357006],[76.536923,9.357039],[76.536759,9.357118],[76.536569,9.357215],[76.536378,9.357313],[76.536237,9.357358],[76.536068,9.357386],[76.535919,9.357401],[76.535817,9.357428],[76.535709,9.357463],[76.535684,9.357767],[76.535697,9.358001],[76.535783,9.358429],[76.535865,9.358682],[76.535759,9.358739],[76.53559,9.35883],[76.535413,9.358912],[76.535322,9.35895],[76.535222,9.358988],[76.53499,9.359076],[76.534789,9.359165],[76.534732,9.359249],[76.534705,9.359364],[76.534633,9.359467],[76.534573,9.359543],[76.534461,9.359563]]]},\"properties\":{\"Created_Da\":\"2024-10-21T07:49:11.836Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"abhijith\",\"Ward_Name\":\"ALUMTHURUTHY\",\"Ward_No\":\"16\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.53804,9.322096],[76.539395,9.32213],[76.540389,9.322298],[76.54039,9.322552],[76.540372,9.322682],[76.540359,9.322777],[76.540339,9.322918],[76.54032,9.32306],[76.540305,9.323238],[76.540294,9.323364],[76.540306,9.323463],[76.540365,9.323687],[76.540411,9.323798],[76.540453,9.323879],[76.540513,9.323996],[76.540513,9.324278],[76.540481,9.324469],[76.540476,9.324616],[76.540473,9.324909],[76.540487,9.325024],[76.540534,9.325304],[76.540551,9.325402],[76.540607,9.325676],[76.540631,9.325793],[76.540651,9.325887],[76.540673,9.325996],[76.540736,9.326285],[76.54078,9.326434],[76.540841,9.326649],[76.540872,9.326761],[76.540903,9.326853],[76.540985,9.327104],[76.541072,9.327407],[76.541208,9.32769],[76.541247,9.32778],[76.541287,9.327871],[76.541401,9.328136],[76.541418,9.328311],[76.541437,9.328527],[76.541449,9.328635],[76.541462,9.328747],[76.541474,9.328859],[76.541493,9.329022],[76.541511,9.329287],[76.541525,9.32949],[76.541299,9.329526],[76.54113,9.329546],[76.540994,9.329559],[76.540515,9.329598],[76.540345,9.329617],[76.54017,9.32963],[76.539995,9.329642],[76.53979,9.329662],[76.539824,9.329865],[76.539858,9.330062],[76.539888,9.330233],[76.539915,9.330387],[76.539995,9.330579],[76.540084,9.33079],[76.540134,9.330911],[76.540187,9.331034],[76.540239,9.331157],[76.540296,9.331295],[76.540377,9.331511],[76.540418,9.331706],[76.540387,9.331843],[76.540295,9.331887],[76.53994,9.332005],[76.539666,9.332107],[76.539567,9.332152],[76.539467,9.332197],[76.539317,9.332264],[76.539175,9.332324],[76.538932,9.332423],[76.538669,9.332504],[76.538509,9.33259],[76.538378,9.332669],[76.538324,9.332744],[76.538232,9.332868],[76.538034,9.332962],[76.537894,9.332988],[76.537631,9.333013],[76.537521,9.333026],[76.53733,9.333049],[76.537131,9.332994],[76.537103,9.332754],[76.537008,9.332683],[76.536858,9.332517],[76.536814,9.332395],[76.536717,9.332289],[76.536388,9.332272],[76.536152,9.332269],[76.535615,9.332148],[76.535135,9.332105],[76.53501,9.332095],[76.534859,9.332091],[76.534373,9.332223],[76.533557,9.330548],[76.533389,9.330203],[76.533108,9.330034],[76.532813,9.329864],[76.532703,9.32984],[76.532272,9.329745],[76.531884,9.329661],[76.532208,9.329438],[76.532482,9.329058],[76.532607,9.326759],[76.532769,9.326238],[76.532861,9.326011],[76.533154,9.325473],[76.533968,9.324054],[76.534205,9.323984],[76.534522,9.323617],[76.534905,9.323038],[76.535701,9.32251],[76.536721,9.322123],[76.53804,9.322096]]]},\"properties\":{\"Created_Da\":\"2024-10-20T10:37:27.891Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"praseega\",\"Ward_Name\":\"HOSPITAL WARD\",\"Ward_No\":\"11\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.545647,9.328525],[76.545849,9.327503],[76.545906,9.327302],[76.546021,9.326901],[76.546079,9.326697],[76.546193,9.326298],[76.546271,9.326027],[76.546385,9.325627],[76.54643,9.325469],[76.548194,9.324814],[76.549282,9.324502],[76.550225,9.324566],[76.551391,9.325009],[76.552077,9.325888],[76.552706,9.327195],[76.553478,9.329366],[76.554108,9.331535],[76.553797,9.332539],[76.553624,9.33358],[76.553569,9.334272],[76.553552,9.33498],[76.553836,9.335314],[76.553599,9.335503],[76.553424,9.335644],[76.553256,9.335663],[76.553163,9.33566],[76.552832,9.335607],[76.552653,9.335624],[76.552536,9.335636],[76.552418,9.335647],[76.552454,9.335794],[76.552485,9.335923],[76.552526,9.336027],[76.552575,9.336126],[76.55263,9.336232],[76.552727,9.336418],[76.552849,9.336686],[76.552921,9.336836],[76.552946,9.337178],[76.552953,9.337319],[76.553066,9.337648],[76.553263,9.337903],[76.553439,9.338005],[76.553457,9.33816],[76.55327,9.338244],[76.553141,9.338308],[76.552932,9.338369],[76.552715,9.338434],[76.552623,9.338473],[76.552555,9.338612],[76.552606,9.338871],[76.552449,9.338987],[76.552301,9.339013],[76.552086,9.33902],[76.551794,9.33903],[76.551565,9.338908],[76.551491,9.338625],[76.551444,9.338487],[76.551413,9.338396],[76.55138,9.338299],[76.551333,9.33816],[76.551369,9.337976],[76.551369,9.337862],[76.551333,9.337728],[76.551256,9.33748],[76.551232,9.337362],[76.551163,9.337139],[76.551101,9.336945],[76.551059,9.33676],[76.551045,9.336605],[76.551056,9.336456],[76.551083,9.336295],[76.551136,9.335988],[76.551145,9.335873],[76.551156,9.335702],[76.551155,9.335476],[76.551132,9.335345],[76.551108,9.335214],[76.550989,9.334876],[76.55088,9.334755],[76.550788,9.334648],[76.550736,9.33457],[76.550692,9.334384],[76.550641,9.334183],[76.550539,9.333828],[76.550483,9.333667],[76.550446,9.333377],[76.55043,9.333272],[76.550404,9.333095],[76.550372,9.332905],[76.550295,9.332658],[76.5502,9.332425],[76.549933,9.332418],[76.549735,9.332421],[76.549541,9.332431],[76.549324,9.332439],[76.549092,9.332433],[76.548946,9.332414],[76.548743,9.332397],[76.548651,9.332377],[76.548493,9.332343],[76.548247,9.3323],[76.548151,9.332279],[76.548013,9.332252],[76.54782,9.332234],[76.547551,9.332216],[76.547285,9.332204],[76.547142,9.332195],[76.547036,9.332187],[76.546935,9.33218],[76.546817,9.332165],[76.546799,9.332064],[76.546796,9.331951],[76.54681,9.331798],[76.54682,9.331678],[76.546825,9.331586],[76.54683,9.331487],[76.546803,9.331268],[76.546793,9.331167],[76.546785,9.33107],[76.54678,9.330914],[76.546772,9.330741],[76.546763,9.330577],[76.546742,9.330393],[76.546732,9.330262],[76.546695,9.329997],[76.546678,9.329886],[76.546602,9.32969],[76.546421,9.329694],[76.546324,9.329494],[76.546289,9.329401],[76.546221,9.329241],[76.54618,9.32912],[76.546115,9.329006],[76.546024,9.328872],[76.545849,9.328694],[76.545647,9.328525]]]},\"properties\":{\"Created_Da\":\"2024-10-19T06:16:01.671Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"praseega\",\"Ward_Name\":\"ILLIMALA\",\"Ward_No\":\"9\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.537258,9.349683],[76.537176,9.349511],[76.536885,9.349076],[76.536692,9.348747],[76.536546,9.348482],[76.536351,9.34814],[76.536219,9.347902],[76.536093,9.347698],[76.535947,9.347462],[76.535774,9.34714],[76.535656,9.346918],[76.535526,9.346659],[76.53544,9.346393],[76.535397,9.346103],[76.535578,9.34608],[76.535736,9.346037],[76.53586,9.345982],[76.536004,9.345915],[76.536117,9.345856],[76.536291,9.345774],[76.53668,9.345664],[76.536789,9.345686],[76.536936,9.345644],[76.537087,9.34563],[76.537311,9.345617],[76.537568,9.34562],[76.537701,9.345604],[76.537823,9.345586],[76.538043,9.34544],[76.538155,9.345283],[76.538224,9.345088],[76.5383,9.344987],[76.538575,9.34495],[76.538918,9.344888],[76.53904,9.344875],[76.539158,9.34481],[76.539275,9.344788],[76.539371,9.344786],[76.539529,9.344812],[76.539689,9.344839],[76.539926,9.344839],[76.54017,9.344848],[76.540371,9.344828],[76.540569,9.344779],[76.540712,9.34475],[76.540804,9.344716],[76.54097,9.344676],[76.541093,9.344655],[76.541236,9.344624],[76.541554,9.344588],[76.541691,9.344573],[76.541837,9.344549],[76.542017,9.344584],[76.542191,9.344676],[76.54235,9.344762],[76.542462,9.344854],[76.542587,9.344968],[76.542695,9.345071],[76.542915,9.345287],[76.543002,9.345387],[76.543097,9.345497],[76.543167,9.345655],[76.543249,9.345778],[76.543336,9.345843],[76.543634,9.345905],[76.543733,9.345893],[76.54383,9.345881],[76.544268,9.34581],[76.54437,9.346059],[76.544398,9.346148],[76.544453,9.346289],[76.54454,9.346422],[76.544698,9.346685],[76.544794,9.34681],[76.544855,9.346881],[76.54507,9.347116],[76.545234,9.347258],[76.54534,9.347328],[76.545513,9.347423],[76.545626,9.347485],[76.545878,9.347635],[76.545781,9.347909],[76.545749,9.348066],[76.545634,9.348258],[76.545581,9.348561],[76.545733,9.348566],[76.545745,9.34868],[76.545755,9.348789],[76.545757,9.348893],[76.545811,9.349116],[76.545867,9.349255],[76.546066,9.349511],[76.546191,9.349635],[76.546227,9.349737],[76.546304,9.349826],[76.546349,9.349995],[76.546312,9.350129],[76.546446,9.350193],[76.546544,9.350204],[76.546712,9.350219],[76.54687,9.350223],[76.547028,9.350228],[76.547152,9.350228],[76.547298,9.350225],[76.547443,9.35022],[76.54763,9.350251],[76.547927,9.350289],[76.548035,9.350311],[76.548137,9.350332],[76.548241,9.350349],[76.548437,9.350366],[76.548648,9.350362],[76.548693,9.350563],[76.548689,9.350676],[76.548633,9.351002],[76.548432,9.351006],[76.548138,9.351144],[76.548057,9.351198],[76.547941,9.351276],[76.547822,9.351323],[76.547736,9.351356],[76.547706,9.351453],[76.547714,9.351593],[76.547721,9.351733],[76.547612,9.351952],[76.547656,9.352276],[76.54769,9.352438],[76.547612,9.352537],[76.54747,9.352642],[76.547361,9.35283],[76.54724,9.352918],[76.54666,9.352802],[76.54652,9.352702],[76.546422,9.352661],[76.546295,9.35264],[76.545991,9.35263],[76.545873,9.352654],[76.545751,9.352756],[76.545634,9.352862],[76.545548,9.352924],[76.545251,9.353197],[76.545092,9.353157],[76.544991,9.353131],[76.544676,9.353026],[76.544565,9.352966],[76.544301,9.352802],[76.544095,9.352626],[76.543991,9.352536],[76.543885,9.352445],[76.543742,9.352373],[76.543772,9.352158],[76.543834,9.35195],[76.543883,9.351764],[76.543883,9.351307],[76.543893,9.351156],[76.543903,9.350991],[76.543937,9.350761],[76.543967,9.350632],[76.543689,9.350559],[76.54357,9.350483],[76.543381,9.350351],[76.543053,9.350269],[76.542922,9.350284],[76.542821,9.350295],[76.542655,9.350317],[76.542532,9.350327],[76.542388,9.350332],[76.542124,9.350314],[76.542024,9.350291],[76.541945,9.35023],[76.541851,9.350114],[76.541806,9.349977],[76.541695,9.349802],[76.541538,9.3498],[76.541159,9.349936],[76.540763,9.350024],[76.540472,9.350005],[76.540359,9.349932],[76.540206,9.349743],[76.540059,9.349614],[76.539916,9.349489],[76.53978,9.349379],[76.539535,9.349199],[76.539374,9.349156],[76.538482,9.349266],[76.538331,9.349304],[76.538119,9.349356],[76.538029,9.349378],[76.537706,9.349522],[76.537481,9.349625],[76.53736,9.349639],[76.537258,9.349683]]]},\"properties\":{\"Created_Da\":\"2024-10-14T09:44:28.654Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"praseega\",\"Ward_Name\":\"ALUMTHURUTHY EAST\",\"Ward_No\":\"3\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.540359,9.322777],[76.540372,9.322682],[76.54039,9.322552],[76.540389,9.322298],[76.540495,9.322312],[76.540943,9.322385],[76.541218,9.322479],[76.54154,9.322611],[76.542027,9.322763],[76.542343,9.322919],[76.542677,9.323098],[76.543102,9.323307],[76.543317,9.323406],[76.543559,9.323532],[76.543791,9.323651],[76.544044,9.323775],[76.544211,9.323922],[76.544336,9.324045],[76.544781,9.32443],[76.545224,9.324808],[76.545501,9.325023],[76.545951,9.325281],[76.546161,9.3254],[76.54643,9.325469],[76.546385,9.325627],[76.546271,9.326027],[76.546193,9.326298],[76.546079,9.326697],[76.546021,9.326901],[76.545906,9.327302],[76.545849,9.327503],[76.545647,9.328525],[76.545849,9.328694],[76.546024,9.328872],[76.546115,9.329006],[76.54618,9.32912],[76.546221,9.329241],[76.546289,9.329401],[76.546324,9.329494],[76.546421,9.329694],[76.546602,9.32969],[76.546678,9.329886],[76.546695,9.329997],[76.546732,9.330262],[76.546742,9.330393],[76.546763,9.330577],[76.546772,9.330741],[76.54678,9.330914],[76.546785,9.33107],[76.546793,9.331167],[76.546803,9.331268],[76.54683,9.331487],[76.546825,9.331586],[76.54682,9.331678],[76.54681,9.331798],[76.546796,9.331951],[76.546799,9.332064],[76.546817,9.332165],[76.546715,9.332164],[76.546567,9.332156],[76.546393,9.332144],[76.54622,9.332132],[76.546061,9.332118],[76.54593,9.332107],[76.545768,9.332094],[76.545578,9.332077],[76.545306,9.33205],[76.545079,9.331985],[76.544813,9.331909],[76.544611,9.331854],[76.544404,9.331795],[76.544252,9.331751],[76.543989,9.331706],[76.543885,9.331693],[76.543605,9.331692],[76.543341,9.331692],[76.543192,9.331694],[76.543076,9.331695],[76.542758,9.331698],[76.542497,9.331722],[76.542364,9.331735],[76.54214,9.331755],[76.541916,9.331774],[76.541725,9.331793],[76.541535,9.331813],[76.541295,9.331827],[76.541183,9.33183],[76.541033,9.331834],[76.540867,9.331837],[76.540741,9.331821],[76.540625,9.331776],[76.540418,9.331706],[76.540377,9.331511],[76.540296,9.331295],[76.540239,9.331157],[76.540187,9.331034],[76.540134,9.330911],[76.540084,9.33079],[76.539995,9.330579],[76.539915,9.330387],[76.539888,9.330233],[76.539858,9.330062],[76.539824,9.329865],[76.53979,9.329662],[76.539995,9.329642],[76.54017,9.32963],[76.540345,9.329617],[76.540515,9.329598],[76.540994,9.329559],[76.54113,9.329546],[76.541299,9.329526],[76.541525,9.32949],[76.541511,9.329287],[76.541493,9.329022],[76.541474,9.328859],[76.541462,9.328747],[76.541449,9.328635],[76.541437,9.328527],[76.541418,9.328311],[76.541401,9.328136],[76.541287,9.327871],[76.541247,9.32778],[76.541208,9.32769],[76.541072,9.327407],[76.540985,9.327104],[76.540903,9.326853],[76.540872,9.326761],[76.540841,9.326649],[76.54078,9.326434],[76.540736,9.326285],[76.540673,9.325996],[76.540651,9.325887],[76.540631,9.325793],[76.540607,9.325676],[76.540551,9.325402],[76.540534,9.325304],[76.540487,9.325024],[76.540473,9.324909],[76.540476,9.324616],[76.540481,9.324469],[76.540513,9.324278],[76.540513,9.323996],[76.540453,9.323879],[76.540411,9.323798],[76.540365,9.323687],[76.540306,9.323463],[76.540294,9.323364],[76.540305,9.323238],[76.54032,9.32306],[76.540339,9.322918],[76.540359,9.322777]]]},\"properties\":{\"Created_Da\":\"2024-10-20T09:42:41.737Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"praseega\",\"Ward_Name\":\"UZHATHIL\",\"Ward_No\":\"10\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.543849,9.345007],[76.543838,9.344895],[76.543825,9.344741],[76.54383,9.344539],[76.543891,9.344235],[76.543992,9.344241],[76.545313,9.344133],[76.546276,9.34396],[76.546539,9.343982],[76.547017,9.343814],[76.54845,9.343039],[76.54902,9.342736],[76.549104,9.342691],[76.550655,9.341951],[76.552047,9.341019],[76.553714,9.340387],[76.555005,9.340104],[76.555184,9.340065],[76.555402,9.340017],[76.55553,9.339989],[76.555656,9.339962],[76.555637,9.34006],[76.555636,9.340063],[76.555617,9.340118],[76.555613,9.340133],[76.555608,9.340156],[76.555607,9.340162],[76.555593,9.340216],[76.55561,9.340325],[76.555617,9.340472],[76.555622,9.340592],[76.555628,9.340654],[76.555637,9.340756],[76.55565,9.340855],[76.555675,9.340952],[76.555798,9.340915],[76.555799,9.34084],[76.555849,9.340871],[76.555904,9.340906],[76.555907,9.34091],[76.555984,9.340987],[76.556031,9.341035],[76.556081,9.341045],[76.556129,9.341056],[76.55616,9.341063],[76.556196,9.341092],[76.556229,9.341121],[76.556256,9.341145],[76.556289,9.341171],[76.556321,9.341199],[76.556353,9.341225],[76.556378,9.341246],[76.55644,9.3413],[76.556476,9.34137],[76.556509,9.341435],[76.556574,9.341565],[76.556656,9.341646],[76.556709,9.341694],[76.556774,9.34176],[76.55684,9.341826],[76.556891,9.341927],[76.556978,9.341975],[76.557084,9.342014],[76.557189,9.342007],[76.557308,9.342003],[76.557375,9.342065],[76.557428,9.342106],[76.557574,9.342222],[76.557758,9.342366],[76.557811,9.342481],[76.557852,9.342621],[76.557873,9.342711],[76.557958,9.342983],[76.558085,9.343238],[76.558138,9.34357],[76.558077,9.34389],[76.557881,9.344541],[76.557678,9.345006],[76.555706,9.345569],[76.554566,9.345895],[76.553719,9.346411],[76.552562,9.347021],[76.551991,9.347676],[76.551711,9.34822],[76.551194,9.349103],[76.551135,9.349239],[76.55072,9.350342],[76.550702,9.350449],[76.550593,9.350531],[76.550263,9.350802],[76.550134,9.350908],[76.549568,9.351486],[76.549404,9.351732],[76.549126,9.352063],[76.548802,9.352515],[76.548719,9.352611],[76.54794,9.353477],[76.547666,9.35376],[76.54724,9.352918],[76.547361,9.35283],[76.54747,9.352642],[76.547612,9.352537],[76.54769,9.352438],[76.547656,9.352276],[76.547612,9.351952],[76.547721,9.351733],[76.547714,9.351593],[76.547706,9.351453],[76.547736,9.351356],[76.547822,9.351323],[76.547941,9.351276],[76.548057,9.351198],[76.548138,9.351144],[76.548432,9.351006],[76.548633,9.351002],[76.548689,9.350676],[76.548693,9.350563],[76.548648,9.350362],[76.548437,9.350366],[76.548241,9.350349],[76.548137,9.350332],[76.548035,9.350311],[76.547927,9.350289],[76.54763,9.350251],[76.547443,9.35022],[76.547298,9.350225],[76.547152,9.350228],[76.547028,9.350228],[76.54687,9.350223],[76.546712,9.350219],[76.546544,9.350204],[76.546446,9.350193],[76.546312,9.350129],[76.546349,9.349995],[76.546304,9.349826],[76.546227,9.349737],[76.546191,9.349635],[76.546066,9.349511],[76.545867,9.349255],[76.545811,9.349116],[76.545757,9.348893],[76.545755,9.348789],[76.545745,9.34868],[76.545733,9.348566],[76.545581,9.348561],[76.545634,9.348258],[76.545749,9.348066],[76.545781,9.347909],[76.545878,9.347635],[76.545626,9.347485],[76.545513,9.347423],[76.54534,9.347328],[76.545234,9.347258],[76.54507,9.347116],[76.544855,9.346881],[76.544794,9.34681],[76.544698,9.346685],[76.54454,9.346422],[76.544453,9.346289],[76.544398,9.346148],[76.54437,9.346059],[76.544268,9.34581],[76.544549,9.345727],[76.544735,9.345609],[76.544432,9.345473],[76.544331,9.345427],[76.543983,9.345247],[76.543849,9.345007]]]},\"properties\":{\"Created_Da\":\"2024-10-20T08:43:43.992Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"abhijith\",\"Ward_Name\":\"VALANJAVATTOM EAST\",\"Ward_No\":\"4\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.53736,9.349639],[76.537481,9.349625],[76.537706,9.349522],[76.538029,9.349378],[76.538119,9.349356],[76.538331,9.349304],[76.538482,9.349266],[76.539374,9.349156],[76.539535,9.349199],[76.53978,9.349379],[76.539916,9.349489],[76.540059,9.349614],[76.540206,9.349743],[76.540359,9.349932],[76.540472,9.350005],[76.540763,9.350024],[76.541159,9.349936],[76.541538,9.3498],[76.541695,9.349802],[76.541806,9.349977],[76.541851,9.350114],[76.541945,9.35023],[76.542024,9.350291],[76.542124,9.350314],[76.542388,9.350332],[76.542532,9.350327],[76.542655,9.350317],[76.542821,9.350295],[76.542922,9.350284],[76.543053,9.350269],[76.543381,9.350351],[76.54357,9.350483],[76.543689,9.350559],[76.543967,9.350632],[76.543937,9.350761],[76.543903,9.350991],[76.543893,9.351156],[76.543883,9.351307],[76.543883,9.351764],[76.543834,9.35195],[76.543772,9.352158],[76.543742,9.352373],[76.543885,9.352445],[76.543991,9.352536],[76.544095,9.352626],[76.544301,9.352802],[76.544565,9.352966],[76.544676,9.353026],[76.544991,9.353131],[76.545092,9.353157],[76.545251,9.353197],[76.545548,9.352924],[76.545634,9.352862],[76.545751,9.352756],[76.545873,9.352654],[76.545991,9.35263],[76.546295,9.35264],[76.546422,9.352661],[76.54652,9.352702],[76.54666,9.352802],[76.54724,9.352918],[76.547666,9.35376],[76.547389,9.354045],[76.547061,9.354405],[76.546822,9.354657],[76.546714,9.35482],[76.546406,9.355305],[76.546166,9.355735],[76.546123,9.355897],[76.546029,9.356248],[76.546055,9.356388],[76.546076,9.356634],[76.546122,9.356801],[76.546202,9.356875],[76.546387,9.357105],[76.546582,9.357275],[76.546701,9.3573],[76.546786,9.357372],[76.547171,9.357522],[76.547475,9.357634],[76.547891,9.357791],[76.548485,9.358206],[76.548738,9.358354],[76.548803,9.35847],[76.549076,9.358809],[76.549191,9.359004],[76.549259,9.359108],[76.549366,9.359433],[76.549602,9.360147],[76.54958,9.360361],[76.549546,9.360475],[76.54921,9.361157],[76.549163,9.361254],[76.548965,9.361431],[76.548843,9.361492],[76.54811,9.361796],[76.547923,9.361864],[76.547083,9.362009],[76.546345,9.362082],[76.545687,9.362146],[76.544914,9.361888],[76.543903,9.36155],[76.543084,9.361276],[76.542217,9.360987],[76.5422,9.360844],[76.542157,9.360491],[76.542058,9.35972],[76.5417,9.358811],[76.541656,9.358716],[76.541363,9.358087],[76.541264,9.357654],[76.54125,9.357125],[76.541242,9.356857],[76.541223,9.355886],[76.541223,9.355773],[76.541222,9.355277],[76.541196,9.355157],[76.541114,9.354769],[76.540936,9.354136],[76.540893,9.353991],[76.540771,9.353584],[76.540572,9.35319],[76.540402,9.353057],[76.54027,9.352955],[76.540167,9.352927],[76.539814,9.352862],[76.539523,9.35285],[76.539364,9.352822],[76.538958,9.352491],[76.538576,9.352006],[76.538236,9.35151],[76.538137,9.351291],[76.537993,9.350978],[76.537628,9.350335],[76.537387,9.349893],[76.537258,9.349683],[76.53736,9.349639]]]},\"properties\":{\"Created_Da\":\"2024-10-16T05:32:19.760Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"abhijith\",\"Ward_Name\":\"SUGAR FACTORY\",\"Ward_No\":\"2\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.548279,9.332897],[76.548618,9.333049],[76.548677,9.333412],[76.549184,9.334251],[76.548747,9.334405],[76.54851,9.334512],[76.548354,9.334587],[76.548049,9.334727],[76.547798,9.334904],[76.547351,9.335207],[76.546067,9.336894],[76.545633,9.336742],[76.545529,9.336686],[76.545313,9.336631],[76.545138,9.336574],[76.544996,9.336535],[76.544843,9.336493],[76.54466,9.336452],[76.544481,9.336398],[76.544235,9.336394],[76.543877,9.336397],[76.543681,9.33645],[76.543742,9.336557],[76.543836,9.336715],[76.544078,9.337061],[76.544181,9.337226],[76.544333,9.337491],[76.544414,9.337746],[76.544459,9.337973],[76.544476,9.338117],[76.544484,9.338323],[76.544451,9.338468],[76.544434,9.338573],[76.544423,9.338719],[76.544479,9.338931],[76.544511,9.339025],[76.544544,9.339118],[76.544582,9.339229],[76.544725,9.339501],[76.544863,9.339742],[76.544943,9.339858],[76.54507,9.339998],[76.545166,9.340103],[76.545285,9.340234],[76.545393,9.340353],[76.545517,9.340484],[76.545669,9.340691],[76.545815,9.340913],[76.545881,9.341033],[76.545927,9.341118],[76.546042,9.341334],[76.546136,9.341516],[76.546211,9.34181],[76.546275,9.342215],[76.546298,9.342429],[76.546288,9.342587],[76.546273,9.342789],[76.546257,9.342898],[76.546186,9.343198],[76.546215,9.343471],[76.546276,9.34396],[76.545313,9.344133],[76.543992,9.344241],[76.543891,9.344235],[76.54286,9.344149],[76.542271,9.343944],[76.541934,9.343827],[76.541318,9.343324],[76.541112,9.343156],[76.541062,9.342867],[76.540763,9.34113],[76.540745,9.340993],[76.540542,9.339594],[76.540238,9.33875],[76.542841,9.337057],[76.542946,9.33673],[76.542842,9.336503],[76.542701,9.336201],[76.542675,9.335934],[76.542681,9.335566],[76.542834,9.334996],[76.542864,9.334889],[76.542925,9.334677],[76.542985,9.334466],[76.543015,9.334358],[76.54306,9.334203],[76.54322,9.333898],[76.54311,9.33366],[76.54316,9.333431],[76.5432,9.333278],[76.543156,9.333147],[76.54313,9.332908],[76.543126,9.332802],[76.543109,9.332673],[76.543076,9.33257],[76.543066,9.332381],[76.543059,9.332272],[76.543046,9.332137],[76.542998,9.331909],[76.543005,9.331805],[76.543076,9.331695],[76.543192,9.331694],[76.543341,9.331692],[76.543605,9.331692],[76.543885,9.331693],[76.543989,9.331706],[76.544252,9.331751],[76.544404,9.331795],[76.544611,9.331854],[76.544813,9.331909],[76.545079,9.331985],[76.545306,9.33205],[76.545578,9.332077],[76.545768,9.332094],[76.54593,9.332107],[76.546061,9.332118],[76.54622,9.332132],[76.546393,9.332144],[76.546567,9.332156],[76.546715,9.332164],[76.546817,9.332165],[76.546935,9.33218],[76.547036,9.332187],[76.547142,9.332195],[76.547285,9.332204],[76.547551,9.332216],[76.54782,9.332234],[76.548013,9.332252],[76.548151,9.332279],[76.548247,9.3323],[76.548267,9.332673],[76.548274,9.332795],[76.548279,9.332897]]]},\"properties\":{\"Created_Da\":\"2024-10-19T12:24:03.323Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"praseega\",\"Ward_Name\":\"UPADESIKADAVU\",\"Ward_No\":\"7\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.543849,9.345007],[76.543983,9.345247],[76.544331,9.345427],[76.544432,9.345473],[76.544735,9.345609],[76.544549,9.345727],[76.544268,9.34581],[76.54383,9.345881],[76.543733,9.345893],[76.543634,9.345905],[76.543336,9.345843],[76.543249,9.345778],[76.543167,9.345655],[76.543097,9.345497],[76.543002,9.345387],[76.542915,9.345287],[76.542695,9.345071],[76.542587,9.344968],[76.542462,9.344854],[76.54235,9.344762],[76.542191,9.344676],[76.542017,9.344584],[76.541837,9.344549],[76.541691,9.344573],[76.541554,9.344588],[76.541236,9.344624],[76.541093,9.344655],[76.54097,9.344676],[76.540804,9.344716],[76.540712,9.34475],[76.540569,9.344779],[76.540371,9.344828],[76.54017,9.344848],[76.539926,9.344839],[76.539689,9.344839],[76.539529,9.344812],[76.539371,9.344786],[76.539275,9.344788],[76.539158,9.34481],[76.53904,9.344875],[76.538918,9.344888],[76.538575,9.34495],[76.5383,9.344987],[76.538224,9.345088],[76.538155,9.345283],[76.538043,9.34544],[76.537823,9.345586],[76.537701,9.345604],[76.537568,9.34562],[76.537311,9.345617],[76.537087,9.34563],[76.536936,9.345644],[76.536789,9.345686],[76.53668,9.345664],[76.536291,9.345774],[76.536117,9.345856],[76.536004,9.345915],[76.53586,9.345982],[76.535736,9.346037],[76.535578,9.34608],[76.535397,9.346103],[76.535393,9.346002],[76.535371,9.345621],[76.535295,9.345048],[76.535102,9.344465],[76.534932,9.344131],[76.534825,9.343922],[76.534691,9.34344],[76.534509,9.342995],[76.53444,9.342827],[76.534176,9.341997],[76.534038,9.34174],[76.533961,9.341595],[76.533742,9.341018],[76.533708,9.340575],[76.533739,9.340391],[76.53376,9.340263],[76.533785,9.340115],[76.533813,9.339946],[76.533928,9.339271],[76.533968,9.339033],[76.534025,9.33875],[76.53418,9.338013],[76.534202,9.337894],[76.534276,9.337479],[76.534366,9.336958],[76.534392,9.336762],[76.534436,9.336426],[76.534535,9.335438],[76.534531,9.335296],[76.534505,9.334932],[76.534511,9.33464],[76.534457,9.334513],[76.534023,9.334134],[76.533609,9.33374],[76.532986,9.333142],[76.532452,9.33244],[76.532388,9.332302],[76.532217,9.331887],[76.532092,9.331584],[76.532057,9.331486],[76.531955,9.331206],[76.531941,9.331082],[76.531931,9.330987],[76.531917,9.330603],[76.531905,9.330241],[76.531884,9.329661],[76.532272,9.329745],[76.532703,9.32984],[76.532813,9.329864],[76.533108,9.330034],[76.533389,9.330203],[76.533557,9.330548],[76.534373,9.332223],[76.534412,9.332316],[76.534457,9.332401],[76.534513,9.332519],[76.534964,9.333509],[76.535307,9.334262],[76.535449,9.334573],[76.535535,9.334771],[76.535573,9.33486],[76.536033,9.335536],[76.536339,9.335836],[76.537156,9.336636],[76.537815,9.337116],[76.538829,9.337621],[76.539953,9.338531],[76.54009,9.338643],[76.540238,9.33875],[76.540542,9.339594],[76.540745,9.340993],[76.540763,9.34113],[76.541062,9.342867],[76.541112,9.343156],[76.541318,9.343324],[76.541934,9.343827],[76.542271,9.343944],[76.54286,9.344149],[76.543891,9.344235],[76.54383,9.344539],[76.543825,9.344741],[76.543838,9.344895],[76.543849,9.345007]]]},\"properties\":{\"Created_Da\":\"2024-10-20T07:34:26.351Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"abhijith\",\"Ward_Name\":\"KADAPRA\",\"Ward_No\":\"5\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.528531,9.359193],[76.528741,9.359072],[76.528895,9.358983],[76.529102,9.35902],[76.529259,9.359],[76.529389,9.358983],[76.529507,9.359],[76.52973,9.359031],[76.530108,9.359083],[76.530242,9.359183],[76.530462,9.359346],[76.530794,9.359579],[76.531134,9.359707],[76.531448,9.359825],[76.531545,9.359861],[76.531662,9.359871],[76.531857,9.359826],[76.532084,9.359757],[76.532526,9.359298],[76.533209,9.359223],[76.5334,9.359438],[76.533628,9.359695],[76.533953,9.359626],[76.534141,9.35961],[76.534261,9.359599],[76.534461,9.359563],[76.534573,9.359543],[76.534633,9.359467],[76.534705,9.359364],[76.534732,9.359249],[76.534789,9.359165],[76.53499,9.359076],[76.535222,9.358988],[76.535322,9.35895],[76.535413,9.358912],[76.53559,9.35883],[76.535759,9.358739],[76.535865,9.358682],[76.535783,9.358429],[76.535697,9.358001],[76.535684,9.357767],[76.535709,9.357463],[76.535817,9.357428],[76.535919,9.357401],[76.536068,9.357386],[76.536237,9.357358],[76.536378,9.357313],[76.536569,9.357215],[76.536759,9.357118],[76.536923,9.357039],[76.537013,9.357006],[76.537112,9.356946],[76.537245,9.356866],[76.537392,9.356792],[76.537551,9.356709],[76.537648,9.356638],[76.537752,9.356544],[76.537916,9.356341],[76.538026,9.356154],[76.538111,9.356066],[76.538231,9.355992],[76.538346,9.355935],[76.538442,9.355907],[76.538569,9.355855],[76.538729,9.355782],[76.538893,9.355712],[76.539065,9.355631],[76.539282,9.355583],[76.539381,9.355559],[76.539559,9.355501],[76.539659,9.355479],[76.53975,9.355457],[76.539844,9.355444],[76.539982,9.355468],[76.540095,9.355474],[76.540223,9.355452],[76.540323,9.355424],[76.54043,9.3554],[76.540516,9.355372],[76.540624,9.355345],[76.540724,9.355322],[76.540899,9.355293],[76.541031,9.355284],[76.541222,9.355277],[76.541223,9.355773],[76.541223,9.355886],[76.541242,9.356857],[76.54125,9.357125],[76.541264,9.357654],[76.541363,9.358087],[76.541656,9.358716],[76.5417,9.358811],[76.542058,9.35972],[76.542157,9.360491],[76.5422,9.360844],[76.542217,9.360987],[76.542051,9.36094],[76.541854,9.360905],[76.541547,9.36085],[76.541442,9.360844],[76.541172,9.360826],[76.540881,9.360808],[76.540344,9.360828],[76.540038,9.360881],[76.539852,9.360914],[76.539571,9.361071],[76.53904,9.361368],[76.538755,9.361481],[76.538455,9.3616],[76.538212,9.361697],[76.538101,9.361741],[76.537989,9.36182],[76.537773,9.361975],[76.537533,9.36206],[76.537432,9.362112],[76.536746,9.362461],[76.53584,9.362922],[76.534951,9.363137],[76.534429,9.363262],[76.534246,9.363303],[76.533691,9.363417],[76.533523,9.363456],[76.532868,9.3636],[76.532459,9.3637],[76.532051,9.3638],[76.531266,9.364182],[76.530673,9.364567],[76.530334,9.365007],[76.529911,9.365555],[76.529605,9.366481],[76.529385,9.366868],[76.529217,9.367198],[76.529125,9.367377],[76.528947,9.367639],[76.528666,9.368054],[76.528567,9.368206],[76.528458,9.368325],[76.528092,9.368767],[76.52772,9.368997],[76.527398,9.369197],[76.527203,9.369301],[76.526891,9.369375],[76.526573,9.369367],[76.526278,9.3694],[76.526079,9.369391],[76.525561,9.369095],[76.524923,9.368814],[76.524764,9.36875],[76.524241,9.368539],[76.523885,9.368394],[76.523775,9.368307],[76.523931,9.368073],[76.524054,9.367733],[76.524175,9.367015],[76.524179,9.366676],[76.524176,9.365919],[76.524124,9.365575],[76.524054,9.365335],[76.523994,9.365132],[76.523866,9.364405],[76.52393,9.363712],[76.5241,9.363537],[76.524242,9.363182],[76.524431,9.362707],[76.524428,9.362181],[76.524232,9.361733],[76.524341,9.361356],[76.52459,9.360999],[76.524881,9.360705],[76.525276,9.360666],[76.525846,9.360526],[76.526253,9.360427],[76.52648,9.360374],[76.526645,9.360336],[76.526829,9.36024],[76.52694,9.360181],[76.527192,9.360056],[76.527475,9.359871],[76.527687,9.359727],[76.527792,9.359658],[76.527911,9.359583],[76.528196,9.359406],[76.528445,9.359243],[76.528531,9.359193]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:47:22.250Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"abhijith\",\"Ward_Name\":\"VALANJAVATTOM\",\"Ward_No\":\"1\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.548279,9.332897],[76.548274,9.332795],[76.548267,9.332673],[76.548247,9.3323],[76.548493,9.332343],[76.548651,9.332377],[76.548743,9.332397],[76.548946,9.332414],[76.549092,9.332433],[76.549324,9.332439],[76.549541,9.332431],[76.549735,9.332421],[76.549933,9.332418],[76.5502,9.332425],[76.550295,9.332658],[76.550372,9.332905],[76.550404,9.333095],[76.55043,9.333272],[76.550446,9.333377],[76.550483,9.333667],[76.550539,9.333828],[76.550641,9.334183],[76.550692,9.334384],[76.550736,9.33457],[76.550788,9.334648],[76.55088,9.334755],[76.550989,9.334876],[76.551108,9.335214],[76.551132,9.335345],[76.551155,9.335476],[76.551156,9.335702],[76.551145,9.335873],[76.551136,9.335988],[76.551083,9.336295],[76.551056,9.336456],[76.551045,9.336605],[76.551059,9.33676],[76.551101,9.336945],[76.551163,9.337139],[76.551232,9.337362],[76.551256,9.33748],[76.551333,9.337728],[76.551369,9.337862],[76.551369,9.337976],[76.551333,9.33816],[76.55138,9.338299],[76.551413,9.338396],[76.551444,9.338487],[76.551491,9.338625],[76.551565,9.338908],[76.551794,9.33903],[76.552086,9.33902],[76.552301,9.339013],[76.552449,9.338987],[76.552606,9.338871],[76.552555,9.338612],[76.552623,9.338473],[76.552715,9.338434],[76.552932,9.338369],[76.553141,9.338308],[76.55327,9.338244],[76.553457,9.33816],[76.553439,9.338005],[76.553263,9.337903],[76.553066,9.337648],[76.552953,9.337319],[76.552946,9.337178],[76.552921,9.336836],[76.552849,9.336686],[76.552727,9.336418],[76.55263,9.336232],[76.552575,9.336126],[76.552526,9.336027],[76.552485,9.335923],[76.552454,9.335794],[76.552418,9.335647],[76.552536,9.335636],[76.552653,9.335624],[76.552832,9.335607],[76.553163,9.33566],[76.553256,9.335663],[76.553424,9.335644],[76.553599,9.335503],[76.553836,9.335314],[76.554278,9.335562],[76.554792,9.335664],[76.555116,9.33577],[76.555414,9.336046],[76.555724,9.336373],[76.556095,9.33682],[76.55637,9.337229],[76.556599,9.33765],[76.556766,9.338014],[76.556922,9.338372],[76.556926,9.338768],[76.556905,9.339111],[76.55697,9.339358],[76.556861,9.339601],[76.556742,9.339701],[76.555656,9.339962],[76.55553,9.339989],[76.555402,9.340017],[76.555184,9.340065],[76.555005,9.340104],[76.553714,9.340387],[76.552047,9.341019],[76.550655,9.341951],[76.549104,9.342691],[76.54902,9.342736],[76.54845,9.343039],[76.547017,9.343814],[76.546539,9.343982],[76.546276,9.34396],[76.546215,9.343471],[76.546186,9.343198],[76.546257,9.342898],[76.546273,9.342789],[76.546288,9.342587],[76.546298,9.342429],[76.546275,9.342215],[76.546211,9.34181],[76.546136,9.341516],[76.546042,9.341334],[76.545927,9.341118],[76.545881,9.341033],[76.545815,9.340913],[76.545669,9.340691],[76.545517,9.340484],[76.545393,9.340353],[76.545285,9.340234],[76.545166,9.340103],[76.54507,9.339998],[76.544943,9.339858],[76.544863,9.339742],[76.544725,9.339501],[76.544582,9.339229],[76.544544,9.339118],[76.544511,9.339025],[76.544479,9.338931],[76.544423,9.338719],[76.544434,9.338573],[76.544451,9.338468],[76.544484,9.338323],[76.544476,9.338117],[76.544459,9.337973],[76.544414,9.337746],[76.544333,9.337491],[76.544181,9.337226],[76.544078,9.337061],[76.543836,9.336715],[76.543742,9.336557],[76.543681,9.33645],[76.543877,9.336397],[76.544235,9.336394],[76.544481,9.336398],[76.54466,9.336452],[76.544843,9.336493],[76.544996,9.336535],[76.545138,9.336574],[76.545313,9.336631],[76.545529,9.336686],[76.545633,9.336742],[76.546067,9.336894],[76.547351,9.335207],[76.547798,9.334904],[76.548049,9.334727],[76.548354,9.334587],[76.54851,9.334512],[76.548747,9.334405],[76.549184,9.334251],[76.548677,9.333412],[76.548618,9.333049],[76.548279,9.332897]]]},\"properties\":{\"Created_Da\":\"2024-10-19T07:03:54.155Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Remarks\":\"Nakkada\",\"Surveyor\":\"praseega\",\"Ward_Name\":\"NAKKADA\",\"Ward_No\":\"8\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.542758,9.331698],[76.543076,9.331695],[76.543005,9.331805],[76.542998,9.331909],[76.543046,9.332137],[76.543059,9.332272],[76.543066,9.332381],[76.543076,9.33257],[76.543109,9.332673],[76.543126,9.332802],[76.54313,9.332908],[76.543156,9.333147],[76.5432,9.333278],[76.54316,9.333431],[76.54311,9.33366],[76.54322,9.333898],[76.54306,9.334203],[76.543015,9.334358],[76.542985,9.334466],[76.542925,9.334677],[76.542864,9.334889],[76.542834,9.334996],[76.542681,9.335566],[76.542675,9.335934],[76.542701,9.336201],[76.542842,9.336503],[76.542946,9.33673],[76.542841,9.337057],[76.540238,9.33875],[76.54009,9.338643],[76.539953,9.338531],[76.538829,9.337621],[76.537815,9.337116],[76.537156,9.336636],[76.536339,9.335836],[76.536033,9.335536],[76.535573,9.33486],[76.535535,9.334771],[76.535449,9.334573],[76.535307,9.334262],[76.534964,9.333509],[76.534513,9.332519],[76.534457,9.332401],[76.534412,9.332316],[76.534373,9.332223],[76.534859,9.332091],[76.53501,9.332095],[76.535135,9.332105],[76.535615,9.332148],[76.536152,9.332269],[76.536388,9.332272],[76.536717,9.332289],[76.536814,9.332395],[76.536858,9.332517],[76.537008,9.332683],[76.537103,9.332754],[76.537131,9.332994],[76.53733,9.333049],[76.537521,9.333026],[76.537631,9.333013],[76.537894,9.332988],[76.538034,9.332962],[76.538232,9.332868],[76.538324,9.332744],[76.538378,9.332669],[76.538509,9.33259],[76.538669,9.332504],[76.538932,9.332423],[76.539175,9.332324],[76.539317,9.332264],[76.539467,9.332197],[76.539567,9.332152],[76.539666,9.332107],[76.53994,9.332005],[76.540295,9.331887],[76.540387,9.331843],[76.540418,9.331706],[76.540625,9.331776],[76.540741,9.331821],[76.540867,9.331837],[76.541033,9.331834],[76.541183,9.33183],[76.541295,9.331827],[76.541535,9.331813],[76.541725,9.331793],[76.541916,9.331774],[76.54214,9.331755],[76.542364,9.331735],[76.542497,9.331722],[76.542758,9.331698]]]},\"properties\":{\"Created_Da\":\"2024-10-20T07:01:05.629Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kadapra\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8129180582\",\"Surveyor\":\"praseega\",\"Ward_Name\":\"THIKKAPUZHA\",\"Ward_No\":\"6\",\"Mandal\":\"Thiruvalla\"}}]}");
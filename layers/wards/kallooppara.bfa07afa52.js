@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.62831,9.410589],[76.628205,9.41028],[76.628144,9.410073],[76.628083,9.409917],[76.627965,9.409728],[76.62817,9.409633],[76.628285,9.409608],[76.628463,9.409637],[76.628611,9.40972],[76.628799,9.409825],[76.628957,9.409915],[76.629106,9.409907],[76.629277,9.40985],[76.629456,9.409777],[76.629716,9.409616],[76.629808,9.409553],[76.629981,9.409449],[76.630209,9.409409],[76.630366,9.409383],[76.630553,9.409416],[76.630656,9.409457],[76.630725,9.409551],[76.630829,9.409669],[76.630973,9.409746],[76.631145,9.409812],[76.631316,9.409847],[76.631432,9.409875],[76.631643,9.409926],[76.631729,9.409956],[76.63184,9.410011],[76.631923,9.410087],[76.632111,9.410146],[76.632245,9.410178],[76.632491,9.410173],[76.632846,9.410127],[76.632948,9.410117],[76.633164,9.410113],[76.63334,9.410128],[76.633529,9.410135],[76.633697,9.410123],[76.633914,9.410047],[76.634053,9.41],[76.634035,9.409758],[76.633975,9.409584],[76.633917,9.409436],[76.63386,9.409291],[76.633801,9.409145],[76.633771,9.408969],[76.633712,9.408761],[76.633677,9.408647],[76.633644,9.408542],[76.6336,9.408392],[76.633551,9.408216],[76.633517,9.408097],[76.633493,9.407961],[76.633464,9.407824],[76.633399,9.407641],[76.633321,9.407452],[76.633284,9.407307],[76.633263,9.407165],[76.633258,9.406991],[76.63329,9.40685],[76.633339,9.406738],[76.633431,9.40659],[76.633511,9.406478],[76.63359,9.406369],[76.633669,9.406283],[76.633804,9.406138],[76.633864,9.40604],[76.633843,9.405809],[76.633757,9.405707],[76.633703,9.405629],[76.633671,9.405481],[76.633638,9.405342],[76.633583,9.405213],[76.633463,9.405075],[76.633289,9.404854],[76.633205,9.404658],[76.633183,9.404543],[76.633221,9.404351],[76.633273,9.40418],[76.633315,9.404068],[76.633436,9.403801],[76.633521,9.403626],[76.633572,9.403514],[76.633667,9.403287],[76.633703,9.40319],[76.633734,9.403088],[76.633795,9.402918],[76.633866,9.402741],[76.633953,9.402581],[76.634102,9.402288],[76.634392,9.402542],[76.634582,9.402628],[76.634701,9.402689],[76.634872,9.402778],[76.635057,9.40277],[76.635297,9.402823],[76.635431,9.402848],[76.635527,9.402868],[76.63571,9.402934],[76.635819,9.402929],[76.636088,9.402919],[76.636434,9.4029],[76.636668,9.402698],[76.636722,9.402404],[76.636741,9.402301],[76.637013,9.401873],[76.637257,9.401584],[76.637513,9.401311],[76.637661,9.401253],[76.637766,9.401585],[76.637857,9.401913],[76.6379,9.402176],[76.637931,9.402383],[76.637938,9.402563],[76.637963,9.402749],[76.638,9.40296],[76.637987,9.403171],[76.637775,9.40328],[76.637639,9.403351],[76.637506,9.403496],[76.637406,9.403559],[76.637316,9.403639],[76.637214,9.403723],[76.637125,9.403816],[76.63704,9.403902],[76.63697,9.404029],[76.636913,9.404125],[76.636863,9.404247],[76.63682,9.404428],[76.636871,9.404585],[76.636974,9.404738],[76.63704,9.40482],[76.637107,9.404902],[76.637201,9.405049],[76.637289,9.405199],[76.637425,9.405568],[76.637502,9.405934],[76.637537,9.406051],[76.637616,9.406418],[76.637612,9.407781],[76.637618,9.407937],[76.637595,9.40819],[76.637605,9.408373],[76.637675,9.408577],[76.637706,9.408771],[76.637744,9.409055],[76.637767,9.409259],[76.637777,9.409366],[76.637786,9.409551],[76.637824,9.40978],[76.637903,9.410099],[76.637945,9.410307],[76.637955,9.41043],[76.637963,9.410626],[76.637951,9.41075],[76.637854,9.410919],[76.637767,9.411091],[76.637676,9.41124],[76.637566,9.411387],[76.637534,9.411609],[76.637507,9.41184],[76.637508,9.412024],[76.637491,9.412149],[76.637565,9.41231],[76.637616,9.412441],[76.63764,9.412622],[76.63769,9.412776],[76.637502,9.412834],[76.637395,9.412852],[76.637195,9.412889],[76.637008,9.412913],[76.636876,9.412924],[76.636715,9.412928],[76.636611,9.412923],[76.636468,9.41291],[76.6363,9.412886],[76.636186,9.412868],[76.636026,9.412846],[76.6359,9.412849],[76.635755,9.412849],[76.635641,9.41285],[76.63554,9.412813],[76.635409,9.412755],[76.635249,9.412732],[76.635117,9.412795],[76.635022,9.412838],[76.634839,9.412936],[76.634683,9.41302],[76.634565,9.413091],[76.634402,9.413171],[76.634288,9.413228],[76.634148,9.413285],[76.63402,9.413341],[76.633898,9.413398],[76.633756,9.413459],[76.633635,9.413528],[76.633547,9.413589],[76.633444,9.413699],[76.63333,9.413815],[76.633231,9.413862],[76.63313,9.413905],[76.633027,9.41394],[76.632895,9.41399],[76.632785,9.414025],[76.63264,9.414063],[76.632506,9.414099],[76.632376,9.414157],[76.63224,9.41424],[76.632114,9.41433],[76.632012,9.414445],[76.631918,9.41458],[76.631844,9.414816],[76.631799,9.415055],[76.631743,9.415172],[76.631641,9.41529],[76.63151,9.415477],[76.631575,9.41556],[76.631663,9.415607],[76.631803,9.41563],[76.631941,9.415604],[76.632106,9.415579],[76.632142,9.415824],[76.632198,9.416128],[76.632206,9.416344],[76.632198,9.416551],[76.63217,9.416791],[76.632118,9.416981],[76.63207,9.417159],[76.632037,9.417245],[76.631935,9.417284],[76.631844,9.417314],[76.631713,9.417354],[76.631591,9.41738],[76.631478,9.417408],[76.631368,9.417603],[76.631269,9.417746],[76.631205,9.417889],[76.631166,9.418002],[76.631104,9.418172],[76.630843,9.418409],[76.630477,9.418633],[76.630191,9.41892],[76.629957,9.419025],[76.629706,9.419038],[76.62943,9.418968],[76.629323,9.418918],[76.629215,9.418885],[76.629089,9.418862],[76.62885,9.418737],[76.628736,9.418689],[76.628603,9.418627],[76.62846,9.418585],[76.628366,9.41853],[76.628183,9.418409],[76.627943,9.418239],[76.627408,9.417873],[76.626838,9.417891],[76.626855,9.417548],[76.626873,9.417345],[76.62689,9.417146],[76.6269,9.417042],[76.62693,9.416744],[76.626944,9.416608],[76.627001,9.416205],[76.627074,9.415894],[76.627121,9.415753],[76.627376,9.415891],[76.627609,9.416016],[76.627825,9.416132],[76.627931,9.416137],[76.628059,9.416143],[76.628123,9.41589],[76.628136,9.415667],[76.628165,9.41551],[76.628208,9.415273],[76.628322,9.415142],[76.628549,9.414931],[76.628746,9.414734],[76.628826,9.414644],[76.628949,9.414505],[76.629054,9.414344],[76.629019,9.414152],[76.628981,9.413945],[76.628945,9.41376],[76.628897,9.413526],[76.628831,9.413258],[76.628781,9.413087],[76.628728,9.412909],[76.628697,9.412732],[76.628671,9.412547],[76.62865,9.412373],[76.628635,9.412255],[76.628623,9.412132],[76.628604,9.411879],[76.628573,9.411675],[76.628512,9.411448],[76.628464,9.411224],[76.62843,9.411111],[76.628349,9.410762],[76.62831,9.410589]]]},\"properties\":{\"Created_Da\":\"2024-10-19T05:12:54.970Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"KADAMANKULAM\",\"Ward_No\":\"12\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.628238,9.442595],[76.628419,9.442362],[76.628582,9.442286],[76.628806,9.442183],[76.629071,9.441949],[76.62927,9.441775],[76.629514,9.441604],[76.629747,9.441482],[76.629979,9.441176],[76.630124,9.440984],[76.630375,9.440689],[76.630461,9.440588],[76.630649,9.44043],[76.630795,9.440328],[76.630962,9.440213],[76.631253,9.440039],[76.631536,9.439855],[76.631708,9.439718],[76.631607,9.439595],[76.631495,9.439458],[76.63132,9.439116],[76.631212,9.438673],[76.631146,9.438394],[76.631117,9.438274],[76.631089,9.438027],[76.631004,9.437906],[76.630893,9.437749],[76.630705,9.437549],[76.630429,9.43744],[76.630275,9.437368],[76.630103,9.437287],[76.629796,9.437143],[76.629622,9.437057],[76.629465,9.436933],[76.629389,9.436872],[76.629282,9.436787],[76.629245,9.436519],[76.629324,9.436286],[76.629689,9.43592],[76.629617,9.435627],[76.629571,9.435444],[76.629507,9.435184],[76.629444,9.435039],[76.629331,9.434966],[76.629182,9.434894],[76.628783,9.434699],[76.628627,9.434146],[76.62858,9.433997],[76.62861,9.433893],[76.628662,9.433715],[76.628746,9.433506],[76.62883,9.433298],[76.628875,9.433025],[76.628891,9.432932],[76.62863,9.432896],[76.628452,9.432872],[76.628421,9.432688],[76.628527,9.43227],[76.628569,9.432096],[76.628598,9.431979],[76.628632,9.431838],[76.628687,9.431616],[76.628744,9.43138],[76.628739,9.431214],[76.628731,9.431036],[76.628714,9.430915],[76.628688,9.430758],[76.628654,9.430548],[76.628586,9.430381],[76.628405,9.429933],[76.628158,9.429327],[76.627983,9.429017],[76.627883,9.428875],[76.627811,9.428762],[76.627628,9.428474],[76.627522,9.428241],[76.627451,9.428083],[76.627371,9.427787],[76.627345,9.427567],[76.62734,9.427219],[76.627317,9.427046],[76.627293,9.426862],[76.627246,9.42668],[76.627187,9.426451],[76.627051,9.426081],[76.629184,9.426019],[76.629291,9.426098],[76.629584,9.426383],[76.629858,9.426606],[76.63047,9.426777],[76.630755,9.426858],[76.63096,9.426873],[76.63114,9.426886],[76.631458,9.426888],[76.631772,9.426891],[76.632124,9.426993],[76.632637,9.427142],[76.635316,9.427661],[76.635286,9.427789],[76.63526,9.427883],[76.635183,9.428041],[76.635152,9.428156],[76.635149,9.428271],[76.635157,9.428368],[76.635177,9.428631],[76.635194,9.42875],[76.63521,9.428849],[76.635217,9.42895],[76.635237,9.429115],[76.635262,9.429245],[76.635273,9.429452],[76.635238,9.429638],[76.63519,9.42986],[76.63519,9.430038],[76.635186,9.430144],[76.6352,9.430246],[76.635225,9.430413],[76.635272,9.430556],[76.635317,9.43066],[76.63538,9.430792],[76.63541,9.430913],[76.635473,9.431071],[76.63554,9.431204],[76.635588,9.431294],[76.635654,9.431364],[76.635716,9.431449],[76.635782,9.431568],[76.635829,9.431653],[76.63598,9.431883],[76.636115,9.43211],[76.636201,9.432332],[76.636343,9.432349],[76.636301,9.432555],[76.63627,9.432726],[76.636214,9.432866],[76.636173,9.43296],[76.636138,9.433182],[76.636121,9.433339],[76.636043,9.433563],[76.636051,9.433747],[76.636173,9.433848],[76.636277,9.433872],[76.636446,9.433912],[76.636614,9.433951],[76.636711,9.433975],[76.636812,9.433993],[76.636902,9.434008],[76.637141,9.434066],[76.6373,9.434163],[76.63727,9.434269],[76.637137,9.43463],[76.63711,9.434915],[76.637112,9.435164],[76.637111,9.435366],[76.637096,9.435522],[76.637103,9.43578],[76.637115,9.436009],[76.637114,9.436115],[76.637112,9.436233],[76.637107,9.436444],[76.637088,9.436705],[76.63707,9.4369],[76.637042,9.437052],[76.637025,9.437157],[76.637031,9.437351],[76.637035,9.437553],[76.63703,9.437755],[76.637029,9.437868],[76.637027,9.437983],[76.637028,9.438187],[76.63702,9.438435],[76.63702,9.438558],[76.637017,9.438741],[76.637014,9.438842],[76.637013,9.438938],[76.637011,9.439039],[76.637004,9.439238],[76.636986,9.43933],[76.636857,9.439426],[76.636753,9.439426],[76.636663,9.439398],[76.636516,9.439346],[76.636386,9.439314],[76.636206,9.439293],[76.636012,9.439303],[76.635856,9.439312],[76.635759,9.439318],[76.63555,9.439493],[76.635508,9.439655],[76.635427,9.439779],[76.635374,9.439861],[76.63531,9.439976],[76.635209,9.440143],[76.635085,9.440291],[76.634868,9.440504],[76.634715,9.440646],[76.634613,9.440735],[76.634443,9.440659],[76.634319,9.440578],[76.634204,9.440525],[76.633984,9.440505],[76.633885,9.440458],[76.633771,9.44039],[76.633588,9.440282],[76.633482,9.440218],[76.633386,9.440147],[76.633286,9.440076],[76.633169,9.439986],[76.633093,9.439931],[76.632996,9.439875],[76.63288,9.439813],[76.632782,9.43976],[76.632696,9.439714],[76.632521,9.439709],[76.632406,9.439745],[76.632523,9.439857],[76.632622,9.439919],[76.632747,9.440019],[76.632851,9.440118],[76.632954,9.440217],[76.633021,9.440298],[76.633088,9.44038],[76.633181,9.440559],[76.633252,9.4407],[76.633314,9.440833],[76.633344,9.440976],[76.633347,9.441069],[76.633283,9.441337],[76.633242,9.441466],[76.633199,9.441616],[76.633174,9.441714],[76.633166,9.441952],[76.63325,9.442074],[76.633352,9.442193],[76.633181,9.442205],[76.632579,9.442245],[76.632214,9.442415],[76.631398,9.442781],[76.631277,9.442905],[76.631158,9.443027],[76.630926,9.443281],[76.630826,9.443373],[76.630733,9.443475],[76.630608,9.443591],[76.630523,9.443715],[76.630323,9.44387],[76.630134,9.443957],[76.629939,9.444047],[76.629812,9.444298],[76.629576,9.444293],[76.62936,9.444288],[76.628666,9.444285],[76.628328,9.444283],[76.628138,9.44425],[76.62811,9.444083],[76.627941,9.443928],[76.627941,9.44383],[76.627942,9.443724],[76.627943,9.443452],[76.627964,9.443157],[76.628058,9.442963],[76.628238,9.442595]]]},\"properties\":{\"Created_Da\":\"2024-10-16T08:04:48.904Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Vishnu s\",\"Ward_Name\":\"CHENGAROOR\",\"Ward_No\":\"1\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.640858,9.413665],[76.640907,9.413524],[76.640973,9.413152],[76.640954,9.412976],[76.640903,9.412819],[76.640778,9.412706],[76.640619,9.412573],[76.640487,9.412402],[76.640335,9.412093],[76.640264,9.411967],[76.640131,9.411895],[76.640005,9.41187],[76.639827,9.411869],[76.639627,9.411952],[76.639491,9.412022],[76.639358,9.412091],[76.638999,9.41229],[76.638842,9.412352],[76.638589,9.412444],[76.638421,9.412506],[76.638238,9.412573],[76.638029,9.412657],[76.63769,9.412776],[76.63764,9.412622],[76.637616,9.412441],[76.637565,9.41231],[76.637491,9.412149],[76.637508,9.412024],[76.637507,9.41184],[76.637534,9.411609],[76.637566,9.411387],[76.637676,9.41124],[76.637767,9.411091],[76.637854,9.410919],[76.637951,9.41075],[76.637963,9.410626],[76.637955,9.41043],[76.637945,9.410307],[76.637903,9.410099],[76.637824,9.40978],[76.637786,9.409551],[76.637777,9.409366],[76.637767,9.409259],[76.637744,9.409055],[76.637706,9.408771],[76.637675,9.408577],[76.637605,9.408373],[76.637595,9.40819],[76.637618,9.407937],[76.637612,9.407781],[76.637616,9.406418],[76.637537,9.406051],[76.637502,9.405934],[76.637425,9.405568],[76.637289,9.405199],[76.637201,9.405049],[76.637107,9.404902],[76.63704,9.40482],[76.636974,9.404738],[76.636871,9.404585],[76.63682,9.404428],[76.636863,9.404247],[76.636913,9.404125],[76.63697,9.404029],[76.63704,9.403902],[76.637125,9.403816],[76.637214,9.403723],[76.637316,9.403639],[76.637406,9.403559],[76.637506,9.403496],[76.637639,9.403351],[76.637775,9.40328],[76.637987,9.403171],[76.638,9.40296],[76.637963,9.402749],[76.637938,9.402563],[76.637931,9.402383],[76.6379,9.402176],[76.637857,9.401913],[76.637766,9.401585],[76.637661,9.401253],[76.637513,9.401311],[76.637257,9.401584],[76.637013,9.401873],[76.636741,9.402301],[76.636722,9.402404],[76.636668,9.402698],[76.636434,9.4029],[76.636088,9.402919],[76.635819,9.402929],[76.63571,9.402934],[76.635527,9.402868],[76.635431,9.402848],[76.635297,9.402823],[76.635057,9.40277],[76.634872,9.402778],[76.634701,9.402689],[76.634582,9.402628],[76.634392,9.402542],[76.634102,9.402288],[76.634151,9.40217],[76.634198,9.402022],[76.634247,9.401888],[76.634437,9.401342],[76.634566,9.400793],[76.634631,9.400285],[76.635608,9.399913],[76.63594,9.399787],[76.636455,9.399766],[76.636752,9.399782],[76.637047,9.399807],[76.637453,9.399753],[76.637702,9.399719],[76.637715,9.399956],[76.637844,9.400166],[76.638064,9.400504],[76.638163,9.400547],[76.638335,9.400608],[76.63888,9.400798],[76.639244,9.400895],[76.63942,9.400921],[76.639885,9.400991],[76.640194,9.401057],[76.640398,9.401069],[76.640797,9.401245],[76.641069,9.401345],[76.64146,9.401489],[76.64163,9.401504],[76.642078,9.401789],[76.642233,9.401846],[76.642833,9.402272],[76.643331,9.402624],[76.64342,9.402697],[76.643632,9.402862],[76.643979,9.403149],[76.644279,9.403397],[76.644399,9.40357],[76.644546,9.403662],[76.644924,9.4039],[76.64521,9.404264],[76.645654,9.404832],[76.645117,9.405436],[76.64505,9.405548],[76.64491,9.405912],[76.644821,9.406085],[76.644759,9.406199],[76.644699,9.406342],[76.644634,9.406507],[76.644589,9.406626],[76.644511,9.406796],[76.644457,9.406965],[76.644399,9.407167],[76.644366,9.407292],[76.644381,9.407488],[76.644552,9.407576],[76.644741,9.407641],[76.644872,9.407678],[76.644979,9.407696],[76.645107,9.407715],[76.6452,9.407735],[76.64528,9.407797],[76.645444,9.407862],[76.64563,9.407922],[76.645795,9.408008],[76.645899,9.408133],[76.646133,9.408178],[76.646289,9.408222],[76.646511,9.408235],[76.6465,9.408444],[76.64647,9.40855],[76.646439,9.408842],[76.646453,9.409043],[76.646536,9.409132],[76.646692,9.409316],[76.646726,9.409718],[76.646768,9.410047],[76.646765,9.410243],[76.646699,9.410399],[76.64664,9.41057],[76.64658,9.410741],[76.64652,9.410979],[76.6464,9.411315],[76.646308,9.411394],[76.646114,9.411487],[76.646029,9.411653],[76.645943,9.411818],[76.645865,9.412096],[76.645817,9.412468],[76.64598,9.41319],[76.644447,9.4136],[76.644153,9.413877],[76.643853,9.414068],[76.643681,9.414219],[76.643601,9.414347],[76.643371,9.414734],[76.643436,9.414811],[76.643762,9.415299],[76.643805,9.415416],[76.643916,9.415709],[76.644075,9.416383],[76.643943,9.416822],[76.643757,9.416928],[76.643608,9.417015],[76.643333,9.41714],[76.643232,9.417154],[76.643057,9.417179],[76.642585,9.417241],[76.642245,9.417267],[76.642117,9.416972],[76.641932,9.416973],[76.641594,9.417052],[76.641456,9.41711],[76.641245,9.416512],[76.641225,9.416293],[76.641204,9.416057],[76.641289,9.415834],[76.641366,9.41568],[76.64148,9.415414],[76.641542,9.415248],[76.641535,9.414973],[76.64147,9.414842],[76.641411,9.414754],[76.641266,9.414602],[76.641037,9.414469],[76.640785,9.414296],[76.640652,9.414105],[76.640689,9.41394],[76.640738,9.413854],[76.640803,9.413756],[76.640858,9.413665]]]},\"properties\":{\"Created_Da\":\"2024-10-18T05:32:16.014Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"CHERUMATHA\",\"Ward_No\":\"9\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.628267,9.393663],[76.628589,9.393827],[76.628766,9.393914],[76.628935,9.393965],[76.629116,9.393984],[76.629297,9.393991],[76.629498,9.393946],[76.629538,9.39393],[76.62999,9.393333],[76.630976,9.394052],[76.630881,9.394364],[76.630743,9.394716],[76.630625,9.395021],[76.630476,9.395174],[76.630283,9.395358],[76.630941,9.395904],[76.63119,9.39611],[76.631437,9.396342],[76.631676,9.396568],[76.631843,9.396699],[76.632011,9.39683],[76.632125,9.396861],[76.632224,9.396868],[76.632658,9.396768],[76.633107,9.396688],[76.633539,9.396642],[76.633939,9.396644],[76.634203,9.396572],[76.634556,9.39651],[76.634864,9.396605],[76.635029,9.396772],[76.635087,9.396862],[76.635166,9.39703],[76.635162,9.39724],[76.635028,9.397555],[76.634932,9.397755],[76.634882,9.397922],[76.634866,9.398042],[76.634841,9.398227],[76.634828,9.398319],[76.634807,9.398535],[76.634789,9.398716],[76.634771,9.398898],[76.63475,9.399089],[76.634721,9.399333],[76.634681,9.399644],[76.634631,9.400285],[76.634566,9.400793],[76.634437,9.401342],[76.634247,9.401888],[76.634198,9.402022],[76.634151,9.40217],[76.634102,9.402288],[76.633953,9.402581],[76.633866,9.402741],[76.633795,9.402918],[76.633734,9.403088],[76.633703,9.40319],[76.633667,9.403287],[76.633572,9.403514],[76.633521,9.403626],[76.633436,9.403801],[76.633315,9.404068],[76.633273,9.40418],[76.633221,9.404351],[76.633183,9.404543],[76.633205,9.404658],[76.633289,9.404854],[76.633463,9.405075],[76.633583,9.405213],[76.633638,9.405342],[76.633671,9.405481],[76.633703,9.405629],[76.633757,9.405707],[76.633843,9.405809],[76.633864,9.40604],[76.633804,9.406138],[76.633669,9.406283],[76.63359,9.406369],[76.633511,9.406478],[76.633431,9.40659],[76.633339,9.406738],[76.63329,9.40685],[76.633258,9.406991],[76.633263,9.407165],[76.633284,9.407307],[76.633321,9.407452],[76.633399,9.407641],[76.633464,9.407824],[76.633493,9.407961],[76.633517,9.408097],[76.633551,9.408216],[76.6336,9.408392],[76.633644,9.408542],[76.633677,9.408647],[76.633712,9.408761],[76.633771,9.408969],[76.633801,9.409145],[76.63386,9.409291],[76.633917,9.409436],[76.633975,9.409584],[76.634035,9.409758],[76.634053,9.41],[76.633914,9.410047],[76.633697,9.410123],[76.633529,9.410135],[76.63334,9.410128],[76.633164,9.410113],[76.632948,9.410117],[76.632846,9.410127],[76.632491,9.410173],[76.632245,9.410178],[76.632111,9.410146],[76.631923,9.410087],[76.63184,9.410011],[76.631729,9.409956],[76.631643,9.409926],[76.631432,9.409875],[76.631316,9.409847],[76.631145,9.409812],[76.630973,9.409746],[76.630829,9.409669],[76.630725,9.409551],[76.630656,9.409457],[76.630553,9.409416],[76.630366,9.409383],[76.630209,9.409409],[76.629981,9.409449],[76.629808,9.409553],[76.629716,9.409616],[76.629456,9.409777],[76.629277,9.40985],[76.629106,9.409907],[76.628957,9.409915],[76.628799,9.409825],[76.628611,9.40972],[76.628463,9.409637],[76.628285,9.409608],[76.62817,9.409633],[76.627965,9.409728],[76.627886,9.409512],[76.627907,9.409412],[76.627931,9.409292],[76.627956,9.409205],[76.627977,9.409097],[76.62804,9.408861],[76.628079,9.408582],[76.6281,9.408415],[76.628112,9.40829],[76.628134,9.408015],[76.628122,9.407681],[76.628074,9.40737],[76.628035,9.407179],[76.627981,9.406914],[76.627982,9.406791],[76.627983,9.406619],[76.627936,9.406264],[76.627918,9.406147],[76.627861,9.405788],[76.627815,9.405446],[76.627791,9.405262],[76.627769,9.405098],[76.627742,9.404956],[76.627717,9.404811],[76.627673,9.40455],[76.627672,9.404414],[76.627671,9.404292],[76.62768,9.404092],[76.627698,9.40385],[76.627688,9.403504],[76.627671,9.40315],[76.627662,9.403013],[76.627652,9.402852],[76.627693,9.402728],[76.627761,9.402526],[76.627859,9.402347],[76.627871,9.40223],[76.627893,9.402113],[76.62796,9.401757],[76.627981,9.401658],[76.628035,9.401396],[76.628113,9.401226],[76.628162,9.401119],[76.628258,9.400907],[76.628337,9.400736],[76.62842,9.400549],[76.628494,9.400385],[76.62836,9.400211],[76.628239,9.400052],[76.628149,9.399935],[76.628113,9.399671],[76.628129,9.399546],[76.628093,9.399394],[76.627976,9.399128],[76.627794,9.399009],[76.627661,9.399035],[76.627545,9.399056],[76.627422,9.399012],[76.627292,9.399024],[76.627074,9.399141],[76.626948,9.399209],[76.62686,9.399284],[76.626694,9.399417],[76.626578,9.399514],[76.626369,9.399688],[76.626288,9.399637],[76.626177,9.399567],[76.625959,9.399428],[76.625776,9.399243],[76.625619,9.399041],[76.62545,9.398877],[76.625336,9.39872],[76.625252,9.398517],[76.625366,9.398371],[76.625598,9.398074],[76.625654,9.397978],[76.62577,9.397776],[76.625864,9.397605],[76.625982,9.397402],[76.626068,9.397253],[76.626206,9.396975],[76.626363,9.396659],[76.626395,9.396572],[76.626453,9.396422],[76.626567,9.396311],[76.626653,9.396017],[76.626904,9.395794],[76.627227,9.39567],[76.627272,9.395449],[76.627382,9.394912],[76.62748,9.394434],[76.6275,9.394337],[76.627565,9.394124],[76.627659,9.393813],[76.627705,9.393678],[76.627836,9.393293],[76.628068,9.393492],[76.628267,9.393663]]]},\"properties\":{\"Created_Da\":\"2024-10-18T09:02:20.639Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"CHACKOM BHAGOM\",\"Ward_No\":\"11\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.651527,9.41322],[76.651595,9.413147],[76.65174,9.41308],[76.6519,9.41306],[76.652115,9.413012],[76.652278,9.412973],[76.652438,9.412935],[76.652525,9.41289],[76.65261,9.41284],[76.65277,9.412782],[76.652942,9.412687],[76.653006,9.412566],[76.653367,9.411995],[76.653592,9.41199],[76.653774,9.411988],[76.653955,9.411983],[76.654046,9.41199],[76.65416,9.412013],[76.654307,9.412042],[76.654448,9.412063],[76.654682,9.412187],[76.65484,9.412292],[76.654954,9.412366],[76.655117,9.412466],[76.655318,9.412565],[76.655447,9.412617],[76.655657,9.412652],[76.65585,9.412665],[76.656027,9.412683],[76.65619,9.412662],[76.656344,9.412637],[76.65646,9.4126],[76.656588,9.412542],[76.656708,9.412497],[76.656884,9.412452],[76.656937,9.412368],[76.656921,9.412204],[76.656895,9.412093],[76.65686,9.41199],[76.656817,9.411882],[76.65676,9.411767],[76.656703,9.411638],[76.656665,9.411513],[76.65664,9.411365],[76.656658,9.411167],[76.656677,9.41107],[76.656722,9.41098],[76.656787,9.410882],[76.656858,9.410757],[76.656972,9.410567],[76.657041,9.410465],[76.657146,9.410315],[76.65725,9.410165],[76.6573,9.410088],[76.657434,9.409898],[76.657502,9.409805],[76.657648,9.409628],[76.657803,9.40948],[76.657913,9.409383],[76.65803,9.409272],[76.65814,9.409165],[76.658258,9.409062],[76.658373,9.408953],[76.658483,9.408853],[76.658617,9.408701],[76.658707,9.408562],[76.658833,9.408377],[76.658915,9.408266],[76.658989,9.408167],[76.659062,9.40806],[76.659173,9.407913],[76.659315,9.407894],[76.659824,9.407829],[76.65998,9.408235],[76.660091,9.408522],[76.660279,9.40901],[76.660432,9.40929],[76.660536,9.409387],[76.660691,9.409566],[76.660939,9.409851],[76.661009,9.409926],[76.661174,9.410083],[76.661408,9.410306],[76.6616,9.410472],[76.661668,9.410542],[76.66187,9.410749],[76.662247,9.411135],[76.662387,9.411194],[76.662633,9.41151],[76.66287,9.411815],[76.66301,9.412413],[76.663082,9.412722],[76.663106,9.413037],[76.663125,9.41334],[76.663115,9.413643],[76.663105,9.413909],[76.663063,9.414574],[76.662944,9.414559],[76.662692,9.41453],[76.662285,9.414508],[76.661858,9.414557],[76.661628,9.414619],[76.661325,9.414714],[76.661026,9.414846],[76.660718,9.414979],[76.660454,9.415191],[76.660202,9.415501],[76.66007,9.415631],[76.659896,9.415765],[76.659641,9.415939],[76.65956,9.416037],[76.659488,9.416183],[76.659407,9.416341],[76.659281,9.416549],[76.659138,9.416785],[76.659001,9.416992],[76.658902,9.417106],[76.658799,9.417217],[76.658705,9.417315],[76.658624,9.417408],[76.658568,9.417493],[76.65852,9.417582],[76.658432,9.417775],[76.658319,9.417999],[76.658213,9.418212],[76.658105,9.418386],[76.657994,9.418541],[76.657903,9.418624],[76.657822,9.418683],[76.657703,9.418751],[76.657615,9.418809],[76.657524,9.418883],[76.657424,9.418981],[76.657314,9.419054],[76.657192,9.419092],[76.657062,9.419132],[76.656825,9.41918],[76.656579,9.419155],[76.656415,9.41886],[76.656256,9.418675],[76.656077,9.418528],[76.655951,9.418388],[76.655704,9.418199],[76.655609,9.41821],[76.655368,9.418241],[76.655018,9.418269],[76.655009,9.418366],[76.655007,9.418472],[76.654891,9.418728],[76.654837,9.418816],[76.654721,9.419002],[76.654607,9.419175],[76.654531,9.419249],[76.654432,9.41936],[76.654359,9.419443],[76.654163,9.419702],[76.654057,9.419821],[76.653867,9.42],[76.653716,9.420094],[76.653587,9.420166],[76.653445,9.42025],[76.653264,9.420357],[76.65315,9.42041],[76.653022,9.420469],[76.652944,9.420534],[76.65283,9.42063],[76.652651,9.420811],[76.652524,9.42091],[76.652395,9.421005],[76.652282,9.421124],[76.652192,9.42122],[76.652062,9.421359],[76.651909,9.421524],[76.651749,9.421625],[76.651571,9.421728],[76.651451,9.421798],[76.651318,9.421876],[76.651213,9.421942],[76.650994,9.42208],[76.650823,9.422187],[76.650691,9.422265],[76.650601,9.42231],[76.650423,9.4224],[76.650268,9.422479],[76.650086,9.422571],[76.649897,9.422666],[76.649726,9.422761],[76.64957,9.422855],[76.649421,9.422944],[76.649282,9.423028],[76.649108,9.423349],[76.649069,9.423673],[76.649073,9.423996],[76.649187,9.4244],[76.648995,9.42452],[76.648855,9.424594],[76.648751,9.424669],[76.648644,9.424672],[76.648508,9.424562],[76.648353,9.424431],[76.64821,9.424315],[76.648072,9.424221],[76.647931,9.424148],[76.647805,9.424104],[76.647612,9.424059],[76.647441,9.424029],[76.647224,9.423939],[76.647353,9.423688],[76.647533,9.423336],[76.647654,9.423065],[76.647706,9.42294],[76.647759,9.422816],[76.647934,9.422597],[76.648049,9.422494],[76.648182,9.422377],[76.648451,9.422248],[76.648534,9.422208],[76.648755,9.422041],[76.648863,9.421937],[76.648963,9.421851],[76.649085,9.421487],[76.649166,9.420928],[76.649238,9.420457],[76.649301,9.420215],[76.649031,9.420295],[76.648773,9.420458],[76.648593,9.420496],[76.648471,9.420539],[76.648372,9.42063],[76.648279,9.420516],[76.648145,9.42044],[76.648041,9.420378],[76.647833,9.420395],[76.647494,9.420394],[76.647294,9.420385],[76.64719,9.420355],[76.647093,9.420311],[76.646997,9.42022],[76.646889,9.42011],[76.6466,9.420021],[76.646407,9.419991],[76.646253,9.419982],[76.646106,9.419992],[76.64598,9.419987],[76.645803,9.419953],[76.645667,9.419855],[76.64554,9.41979],[76.645361,9.419722],[76.645051,9.419586],[76.644853,9.4195],[76.64467,9.419402],[76.644563,9.419367],[76.644649,9.419056],[76.644735,9.418878],[76.644859,9.418771],[76.6451,9.418523],[76.645302,9.418383],[76.645486,9.418208],[76.645614,9.41802],[76.645673,9.417757],[76.645765,9.417434],[76.645903,9.416985],[76.646019,9.416646],[76.646093,9.416436],[76.645992,9.416302],[76.645811,9.416263],[76.645707,9.41624],[76.645608,9.416168],[76.645568,9.416038],[76.645586,9.415838],[76.645653,9.415595],[76.64582,9.415678],[76.645916,9.415748],[76.646024,9.415746],[76.646163,9.415727],[76.646366,9.415699],[76.646553,9.415671],[76.646668,9.415634],[76.646944,9.41548],[76.647122,9.415314],[76.647306,9.415152],[76.647506,9.414933],[76.647777,9.414609],[76.647987,9.414343],[76.648261,9.413908],[76.648413,9.413741],[76.648544,9.413656],[76.648634,9.413611],[76.648886,9.413678],[76.649013,9.413793],[76.649169,9.41403],[76.649234,9.414115],[76.649392,9.414178],[76.649558,9.41419],[76.649668,9.41413],[76.649707,9.413911],[76.649708,9.413788],[76.649707,9.413655],[76.649698,9.413482],[76.64968,9.413362],[76.64967,9.41323],[76.649658,9.413067],[76.649655,9.412843],[76.649675,9.412725],[76.64971,9.412605],[76.649787,9.41245],[76.649878,9.412345],[76.64997,9.412277],[76.650095,9.412202],[76.650243,9.412142],[76.650353,9.412413],[76.650362,9.412522],[76.650393,9.41281],[76.650612,9.41302],[76.650778,9.413242],[76.650863,9.413325],[76.650955,9.413412],[76.651037,9.413495],[76.651217,9.413475],[76.651415,9.413313],[76.651527,9.41322]]]},\"properties\":{\"Created_Da\":\"2024-10-20T06:43:26Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"KUMBHAMALA\",\"Ward_No\":\"6\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.650198,9.425235],[76.649833,9.42498],[76.649571,9.424707],[76.64933,9.42448],[76.649187,9.4244],[76.649073,9.423996],[76.649069,9.423673],[76.649108,9.423349],[76.649282,9.423028],[76.649421,9.422944],[76.64957,9.422855],[76.649726,9.422761],[76.649897,9.422666],[76.650086,9.422571],[76.650268,9.422479],[76.650423,9.4224],[76.650601,9.42231],[76.650691,9.422265],[76.650823,9.422187],[76.650994,9.42208],[76.651213,9.421942],[76.651318,9.421876],[76.651451,9.421798],[76.651571,9.421728],[76.651749,9.421625],[76.651909,9.421524],[76.652062,9.421359],[76.652192,9.42122],[76.652282,9.421124],[76.652395,9.421005],[76.652524,9.42091],[76.652651,9.420811],[76.65283,9.42063],[76.652944,9.420534],[76.653022,9.420469],[76.65315,9.42041],[76.653264,9.420357],[76.653445,9.42025],[76.653587,9.420166],[76.653716,9.420094],[76.653867,9.42],[76.654057,9.419821],[76.654163,9.419702],[76.654359,9.419443],[76.654432,9.41936],[76.654531,9.419249],[76.654607,9.419175],[76.654721,9.419002],[76.654837,9.418816],[76.654891,9.418728],[76.655007,9.418472],[76.655009,9.418366],[76.655018,9.418269],[76.655368,9.418241],[76.655609,9.41821],[76.655704,9.418199],[76.655951,9.418388],[76.656077,9.418528],[76.656256,9.418675],[76.656415,9.41886],[76.656579,9.419155],[76.656825,9.41918],[76.657062,9.419132],[76.657192,9.419092],[76.657314,9.419054],[76.657424,9.418981],[76.657524,9.418883],[76.657615,9.418809],[76.657703,9.418751],[76.657822,9.418683],[76.657903,9.418624],[76.657994,9.418541],[76.658105,9.418386],[76.658213,9.418212],[76.658319,9.417999],[76.658432,9.417775],[76.65852,9.417582],[76.658568,9.417493],[76.658624,9.417408],[76.658705,9.417315],[76.658799,9.417217],[76.658902,9.417106],[76.659001,9.416992],[76.659138,9.416785],[76.659281,9.416549],[76.659407,9.416341],[76.659488,9.416183],[76.65956,9.416037],[76.659641,9.415939],[76.659896,9.415765],[76.66007,9.415631],[76.660202,9.415501],[76.660454,9.415191],[76.660718,9.414979],[76.661026,9.414846],[76.661325,9.414714],[76.661628,9.414619],[76.661858,9.414557],[76.662285,9.414508],[76.662692,9.41453],[76.662944,9.414559],[76.663063,9.414574],[76.663052,9.414897],[76.663038,9.415331],[76.66308,9.415748],[76.663127,9.416212],[76.663127,9.416308],[76.663131,9.416539],[76.663123,9.416859],[76.663111,9.417146],[76.663123,9.417353],[76.663131,9.417482],[76.663138,9.417604],[76.663544,9.417903],[76.663902,9.418117],[76.664277,9.418311],[76.664515,9.418385],[76.664875,9.418474],[76.665003,9.418511],[76.665192,9.418509],[76.665707,9.418517],[76.665798,9.418519],[76.666569,9.418395],[76.666973,9.41834],[76.667746,9.418234],[76.668207,9.418232],[76.668313,9.418245],[76.668477,9.418303],[76.668825,9.418591],[76.668859,9.418682],[76.668973,9.418989],[76.669013,9.419263],[76.66905,9.419512],[76.669041,9.419793],[76.669033,9.420084],[76.669032,9.420282],[76.669032,9.420891],[76.669019,9.420985],[76.668985,9.421236],[76.66895,9.421487],[76.668864,9.421704],[76.668798,9.421872],[76.668708,9.422065],[76.668519,9.422466],[76.668382,9.422758],[76.668274,9.422955],[76.668148,9.423184],[76.668087,9.423297],[76.667906,9.423628],[76.667564,9.42391],[76.667318,9.423993],[76.66719,9.424003],[76.667,9.424035],[76.666624,9.424034],[76.666316,9.424108],[76.666069,9.424167],[76.665818,9.42411],[76.665602,9.424062],[76.665461,9.424116],[76.665145,9.424099],[76.664993,9.424091],[76.664885,9.424124],[76.664769,9.424136],[76.664491,9.424165],[76.664206,9.424211],[76.664082,9.424231],[76.663706,9.424291],[76.663465,9.424479],[76.663341,9.424586],[76.663128,9.424797],[76.662987,9.425161],[76.662896,9.425121],[76.661771,9.424619],[76.661489,9.424635],[76.660666,9.424702],[76.66026,9.424869],[76.659799,9.42526],[76.659293,9.425661],[76.658529,9.426232],[76.658314,9.426452],[76.658098,9.426704],[76.657891,9.426864],[76.657797,9.426925],[76.657622,9.426735],[76.657467,9.426494],[76.657312,9.426188],[76.657187,9.425922],[76.657126,9.425636],[76.657075,9.425449],[76.657019,9.42533],[76.656907,9.425176],[76.657124,9.424989],[76.657397,9.4248],[76.657256,9.424729],[76.657105,9.424688],[76.657018,9.424661],[76.656925,9.424643],[76.656832,9.424642],[76.656729,9.424647],[76.656589,9.424695],[76.656501,9.424755],[76.6564,9.424836],[76.656244,9.424948],[76.65606,9.42502],[76.655898,9.425076],[76.655734,9.425125],[76.655597,9.425167],[76.655488,9.425189],[76.655287,9.425237],[76.65516,9.425312],[76.655077,9.42551],[76.65504,9.425599],[76.654966,9.42568],[76.654808,9.425721],[76.65462,9.425675],[76.654532,9.425649],[76.65441,9.425581],[76.654289,9.425459],[76.654132,9.425302],[76.654034,9.425279],[76.653907,9.42529],[76.65365,9.425315],[76.653501,9.425311],[76.65333,9.425357],[76.653238,9.425343],[76.653121,9.425299],[76.65294,9.425217],[76.652826,9.425201],[76.652733,9.425214],[76.652581,9.425263],[76.652459,9.425335],[76.65231,9.425457],[76.652238,9.425564],[76.652152,9.42577],[76.652041,9.425878],[76.651963,9.42594],[76.651774,9.425899],[76.651609,9.425777],[76.651459,9.425632],[76.651221,9.425596],[76.651003,9.425565],[76.650793,9.425522],[76.650668,9.425473],[76.650429,9.42533],[76.650198,9.425235]]]},\"properties\":{\"Created_Da\":\"2024-10-20T09:11:46.757Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"THURUTHICAD\",\"Ward_No\":\"5\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.633811,9.419948],[76.633695,9.420002],[76.633592,9.420058],[76.633383,9.42015],[76.63319,9.420238],[76.633092,9.420288],[76.632985,9.42034],[76.632872,9.420392],[76.632776,9.42044],[76.632678,9.420492],[76.632493,9.420597],[76.632387,9.42064],[76.632168,9.4207],[76.632035,9.420733],[76.631805,9.420792],[76.631627,9.420873],[76.631445,9.420983],[76.631327,9.421048],[76.631234,9.421096],[76.631067,9.42118],[76.630878,9.421222],[76.63069,9.421248],[76.630589,9.421268],[76.630457,9.421296],[76.630345,9.421323],[76.630213,9.421332],[76.630051,9.421307],[76.629942,9.42129],[76.629787,9.421252],[76.629683,9.421227],[76.629512,9.42117],[76.628805,9.421039],[76.628252,9.420955],[76.62736,9.420866],[76.626868,9.420859],[76.626537,9.420867],[76.626529,9.420702],[76.626522,9.420585],[76.626512,9.420387],[76.626511,9.420163],[76.626531,9.419898],[76.626546,9.419712],[76.626607,9.419437],[76.626634,9.419321],[76.626677,9.419139],[76.626729,9.418934],[76.626755,9.418832],[76.626778,9.418724],[76.626799,9.418631],[76.626805,9.418534],[76.626823,9.418318],[76.626829,9.418121],[76.626834,9.417987],[76.626838,9.417891],[76.627408,9.417873],[76.627943,9.418239],[76.628183,9.418409],[76.628366,9.41853],[76.62846,9.418585],[76.628603,9.418627],[76.628736,9.418689],[76.62885,9.418737],[76.629089,9.418862],[76.629215,9.418885],[76.629323,9.418918],[76.62943,9.418968],[76.629706,9.419038],[76.629957,9.419025],[76.630191,9.41892],[76.630477,9.418633],[76.630843,9.418409],[76.631104,9.418172],[76.631166,9.418002],[76.631205,9.417889],[76.631269,9.417746],[76.631368,9.417603],[76.631478,9.417408],[76.631591,9.41738],[76.631713,9.417354],[76.631844,9.417314],[76.631935,9.417284],[76.632037,9.417245],[76.63207,9.417159],[76.632118,9.416981],[76.63217,9.416791],[76.632198,9.416551],[76.632206,9.416344],[76.632198,9.416128],[76.632142,9.415824],[76.632106,9.415579],[76.631941,9.415604],[76.631803,9.41563],[76.631663,9.415607],[76.631575,9.41556],[76.63151,9.415477],[76.631641,9.41529],[76.631743,9.415172],[76.631799,9.415055],[76.631844,9.414816],[76.631918,9.41458],[76.632012,9.414445],[76.632114,9.41433],[76.63224,9.41424],[76.632376,9.414157],[76.632506,9.414099],[76.63264,9.414063],[76.632785,9.414025],[76.632895,9.41399],[76.633027,9.41394],[76.63313,9.413905],[76.633231,9.413862],[76.63333,9.413815],[76.633444,9.413699],[76.633547,9.413589],[76.633635,9.413528],[76.633756,9.413459],[76.633898,9.413398],[76.63402,9.413341],[76.634148,9.413285],[76.634288,9.413228],[76.634402,9.413171],[76.634565,9.413091],[76.634683,9.41302],[76.634839,9.412936],[76.635022,9.412838],[76.635117,9.412795],[76.635249,9.412732],[76.635409,9.412755],[76.63554,9.412813],[76.635641,9.41285],[76.635755,9.412849],[76.6359,9.412849],[76.636026,9.412846],[76.636186,9.412868],[76.6363,9.412886],[76.636468,9.41291],[76.636611,9.412923],[76.636715,9.412928],[76.636876,9.412924],[76.637008,9.412913],[76.637195,9.412889],[76.637395,9.412852],[76.637502,9.412834],[76.63769,9.412776],[76.638029,9.412657],[76.638238,9.412573],[76.638421,9.412506],[76.638589,9.412444],[76.638842,9.412352],[76.638999,9.41229],[76.639358,9.412091],[76.639491,9.412022],[76.639627,9.411952],[76.639827,9.411869],[76.640005,9.41187],[76.640131,9.411895],[76.640264,9.411967],[76.640335,9.412093],[76.640487,9.412402],[76.640619,9.412573],[76.640778,9.412706],[76.640903,9.412819],[76.640954,9.412976],[76.640973,9.413152],[76.640907,9.413524],[76.640858,9.413665],[76.640803,9.413756],[76.640738,9.413854],[76.640689,9.41394],[76.640652,9.414105],[76.640785,9.414296],[76.641037,9.414469],[76.641266,9.414602],[76.641411,9.414754],[76.64147,9.414842],[76.641535,9.414973],[76.641542,9.415248],[76.64148,9.415414],[76.641366,9.41568],[76.641289,9.415834],[76.641204,9.416057],[76.641225,9.416293],[76.641245,9.416512],[76.641456,9.41711],[76.641591,9.417778],[76.641591,9.418457],[76.641602,9.418844],[76.641542,9.418959],[76.641403,9.419061],[76.641179,9.419158],[76.640846,9.419277],[76.640645,9.419391],[76.640451,9.419534],[76.640288,9.419695],[76.640169,9.419854],[76.640066,9.420086],[76.640068,9.420233],[76.640053,9.42034],[76.63974,9.42014],[76.639623,9.420057],[76.639517,9.419977],[76.639417,9.4199],[76.639275,9.419813],[76.639168,9.419765],[76.639038,9.41972],[76.638858,9.419655],[76.638722,9.419612],[76.638621,9.419577],[76.638498,9.419532],[76.638382,9.419483],[76.638265,9.419422],[76.638143,9.419352],[76.638027,9.419313],[76.637827,9.41928],[76.637607,9.419218],[76.63738,9.419182],[76.637259,9.419275],[76.637163,9.419353],[76.637056,9.419426],[76.63697,9.419497],[76.63687,9.419588],[76.636658,9.419815],[76.636487,9.419995],[76.636316,9.420152],[76.63619,9.420277],[76.636077,9.420387],[76.635935,9.420522],[76.63583,9.420597],[76.635646,9.420601],[76.635532,9.420565],[76.635377,9.420511],[76.635288,9.420484],[76.635122,9.420397],[76.63498,9.420277],[76.634818,9.420172],[76.634747,9.420115],[76.634634,9.420053],[76.634449,9.419884],[76.634375,9.419786],[76.634206,9.419611],[76.634124,9.419677],[76.633936,9.419845],[76.633811,9.419948]]]},\"properties\":{\"Created_Da\":\"2024-10-19T10:03:11.356Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"SASTHAMGAL\",\"Ward_No\":\"13\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.649169,9.41403],[76.649013,9.413793],[76.648886,9.413678],[76.648828,9.413487],[76.648732,9.41337],[76.64865,9.413278],[76.648572,9.413177],[76.6485,9.413023],[76.648468,9.412873],[76.648452,9.41274],[76.648437,9.412577],[76.648423,9.412387],[76.648378,9.412267],[76.648302,9.412155],[76.648175,9.411968],[76.648,9.411712],[76.647932,9.411605],[76.647862,9.411298],[76.64786,9.411158],[76.647902,9.41096],[76.648023,9.410765],[76.648122,9.410647],[76.648212,9.410535],[76.648287,9.410417],[76.648363,9.410287],[76.648443,9.410152],[76.64852,9.410015],[76.648605,9.409872],[76.648663,9.409738],[76.64869,9.409598],[76.648683,9.409467],[76.648658,9.409338],[76.648648,9.409227],[76.648648,9.409132],[76.648642,9.40904],[76.648627,9.40894],[76.648647,9.408832],[76.648695,9.408735],[76.64876,9.40866],[76.648827,9.408593],[76.648908,9.408527],[76.64898,9.408458],[76.649038,9.40837],[76.649072,9.408252],[76.649087,9.408123],[76.649093,9.407987],[76.649105,9.407845],[76.649108,9.407707],[76.649107,9.407453],[76.649105,9.407315],[76.649102,9.407183],[76.649,9.406883],[76.648937,9.406803],[76.648783,9.406672],[76.648618,9.406562],[76.648537,9.406395],[76.648542,9.406215],[76.648311,9.406065],[76.648216,9.405746],[76.648313,9.405668],[76.648426,9.405579],[76.648578,9.405457],[76.648827,9.405258],[76.648914,9.405165],[76.649316,9.404736],[76.649424,9.404604],[76.649662,9.404295],[76.649797,9.404129],[76.650102,9.403743],[76.650229,9.403586],[76.650406,9.4034],[76.650546,9.403254],[76.650915,9.403018],[76.651098,9.402921],[76.651426,9.402748],[76.651727,9.402653],[76.651846,9.402631],[76.651995,9.40262],[76.652201,9.402606],[76.652524,9.402525],[76.652741,9.402471],[76.653137,9.402321],[76.653249,9.402299],[76.653847,9.402179],[76.653941,9.402075],[76.654451,9.401877],[76.654955,9.401585],[76.655646,9.401324],[76.655791,9.401012],[76.65577,9.40092],[76.655757,9.400418],[76.655527,9.399919],[76.655209,9.399325],[76.655158,9.399231],[76.655045,9.398878],[76.654925,9.398507],[76.655,9.398282],[76.655074,9.398056],[76.655338,9.397823],[76.655487,9.397638],[76.655681,9.397509],[76.655889,9.397361],[76.656091,9.397233],[76.656527,9.397161],[76.656638,9.397226],[76.656799,9.397322],[76.656965,9.39742],[76.657014,9.397505],[76.657133,9.397714],[76.657238,9.397898],[76.657312,9.398069],[76.657366,9.398161],[76.657465,9.398439],[76.657579,9.398764],[76.657729,9.399133],[76.657847,9.399423],[76.657832,9.399621],[76.657953,9.399985],[76.658102,9.400436],[76.658117,9.400615],[76.658276,9.400945],[76.658286,9.401044],[76.658444,9.401313],[76.658562,9.401512],[76.658721,9.401855],[76.65894,9.402118],[76.659303,9.402534],[76.659414,9.40259],[76.659791,9.402755],[76.660158,9.402903],[76.660304,9.402958],[76.660483,9.403011],[76.660634,9.403055],[76.660824,9.403091],[76.661194,9.40317],[76.661323,9.403197],[76.661741,9.403219],[76.661914,9.403343],[76.662087,9.403466],[76.662107,9.40363],[76.662126,9.403787],[76.662013,9.404274],[76.661794,9.404572],[76.661227,9.405095],[76.661161,9.4052],[76.660813,9.405609],[76.660409,9.406146],[76.660422,9.406266],[76.660375,9.406365],[76.660119,9.406705],[76.659983,9.407087],[76.660027,9.407191],[76.659951,9.407548],[76.659889,9.407684],[76.659824,9.407829],[76.659315,9.407894],[76.659173,9.407913],[76.659062,9.40806],[76.658989,9.408167],[76.658915,9.408266],[76.658833,9.408377],[76.658707,9.408562],[76.658617,9.408701],[76.658483,9.408853],[76.658373,9.408953],[76.658258,9.409062],[76.65814,9.409165],[76.65803,9.409272],[76.657913,9.409383],[76.657803,9.40948],[76.657648,9.409628],[76.657502,9.409805],[76.657434,9.409898],[76.6573,9.410088],[76.65725,9.410165],[76.657146,9.410315],[76.657041,9.410465],[76.656972,9.410567],[76.656858,9.410757],[76.656787,9.410882],[76.656722,9.41098],[76.656677,9.41107],[76.656658,9.411167],[76.65664,9.411365],[76.656665,9.411513],[76.656703,9.411638],[76.65676,9.411767],[76.656817,9.411882],[76.65686,9.41199],[76.656895,9.412093],[76.656921,9.412204],[76.656937,9.412368],[76.656884,9.412452],[76.656708,9.412497],[76.656588,9.412542],[76.65646,9.4126],[76.656344,9.412637],[76.65619,9.412662],[76.656027,9.412683],[76.65585,9.412665],[76.655657,9.412652],[76.655447,9.412617],[76.655318,9.412565],[76.655117,9.412466],[76.654954,9.412366],[76.65484,9.412292],[76.654682,9.412187],[76.654448,9.412063],[76.654307,9.412042],[76.65416,9.412013],[76.654046,9.41199],[76.653955,9.411983],[76.653774,9.411988],[76.653592,9.41199],[76.653367,9.411995],[76.653006,9.412566],[76.652942,9.412687],[76.65277,9.412782],[76.65261,9.41284],[76.652525,9.41289],[76.652438,9.412935],[76.652278,9.412973],[76.652115,9.413012],[76.6519,9.41306],[76.65174,9.41308],[76.651595,9.413147],[76.651527,9.41322],[76.651415,9.413313],[76.651217,9.413475],[76.651037,9.413495],[76.650955,9.413412],[76.650863,9.413325],[76.650778,9.413242],[76.650612,9.41302],[76.650393,9.41281],[76.650362,9.412522],[76.650353,9.412413],[76.650243,9.412142],[76.650095,9.412202],[76.64997,9.412277],[76.649878,9.412345],[76.649787,9.41245],[76.64971,9.412605],[76.649675,9.412725],[76.649655,9.412843],[76.649658,9.413067],[76.64967,9.41323],[76.64968,9.413362],[76.649698,9.413482],[76.649707,9.413655],[76.649708,9.413788],[76.649707,9.413911],[76.649668,9.41413],[76.649558,9.41419],[76.649392,9.414178],[76.649234,9.414115],[76.649169,9.41403]]]},\"properties\":{\"Created_Da\":\"2024-10-19T09:47:16.919Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Vishnu s\",\"Ward_Name\":\"AMBATTUBHAGOM\",\"Ward_No\":\"7\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.626934,9.421967],[76.6268,9.421822],[76.626704,9.421697],[76.626657,9.421556],[76.62662,9.421444],[76.626587,9.421348],[76.626565,9.421127],[76.626549,9.420974],[76.626537,9.420867],[76.626868,9.420859],[76.62736,9.420866],[76.628252,9.420955],[76.628805,9.421039],[76.629512,9.42117],[76.629683,9.421227],[76.629787,9.421252],[76.629942,9.42129],[76.630051,9.421307],[76.630213,9.421332],[76.630345,9.421323],[76.630457,9.421296],[76.630589,9.421268],[76.63069,9.421248],[76.630878,9.421222],[76.631067,9.42118],[76.631234,9.421096],[76.631327,9.421048],[76.631445,9.420983],[76.631627,9.420873],[76.631805,9.420792],[76.632035,9.420733],[76.632168,9.4207],[76.632387,9.42064],[76.632493,9.420597],[76.632678,9.420492],[76.632776,9.42044],[76.632872,9.420392],[76.632985,9.42034],[76.633092,9.420288],[76.63319,9.420238],[76.633383,9.42015],[76.633592,9.420058],[76.633695,9.420002],[76.633811,9.419948],[76.633936,9.419845],[76.634124,9.419677],[76.634206,9.419611],[76.634375,9.419786],[76.634449,9.419884],[76.634634,9.420053],[76.634747,9.420115],[76.634818,9.420172],[76.63498,9.420277],[76.635122,9.420397],[76.635288,9.420484],[76.635377,9.420511],[76.635532,9.420565],[76.635646,9.420601],[76.63583,9.420597],[76.635935,9.420522],[76.636077,9.420387],[76.63619,9.420277],[76.636316,9.420152],[76.636487,9.419995],[76.636658,9.419815],[76.63687,9.419588],[76.63697,9.419497],[76.637056,9.419426],[76.637163,9.419353],[76.637259,9.419275],[76.63738,9.419182],[76.637607,9.419218],[76.637827,9.41928],[76.638027,9.419313],[76.638143,9.419352],[76.638265,9.419422],[76.638382,9.419483],[76.638498,9.419532],[76.638621,9.419577],[76.638722,9.419612],[76.638858,9.419655],[76.639038,9.41972],[76.639168,9.419765],[76.639275,9.419813],[76.639417,9.4199],[76.639517,9.419977],[76.639623,9.420057],[76.63974,9.42014],[76.640053,9.42034],[76.640208,9.420572],[76.640679,9.420993],[76.641552,9.421726],[76.641602,9.421836],[76.641598,9.422155],[76.641668,9.422512],[76.641731,9.422975],[76.641796,9.423439],[76.641822,9.423651],[76.641829,9.423746],[76.641832,9.423951],[76.641841,9.424189],[76.641985,9.424409],[76.642354,9.42491],[76.642426,9.425117],[76.642549,9.425419],[76.642646,9.425664],[76.6427,9.425865],[76.64255,9.425967],[76.642263,9.426129],[76.642103,9.42624],[76.641984,9.426329],[76.64188,9.426398],[76.641757,9.426408],[76.641485,9.426409],[76.641196,9.426361],[76.641027,9.426316],[76.640915,9.426286],[76.640765,9.426308],[76.640655,9.426376],[76.640574,9.426423],[76.640366,9.42656],[76.640243,9.426605],[76.640091,9.42666],[76.639977,9.426755],[76.639946,9.426874],[76.63991,9.427007],[76.639867,9.427189],[76.639875,9.427338],[76.639893,9.427435],[76.639897,9.427554],[76.639893,9.42769],[76.639902,9.427913],[76.639924,9.428103],[76.639924,9.428306],[76.639958,9.428403],[76.639935,9.428599],[76.639676,9.428707],[76.639455,9.428789],[76.639237,9.428829],[76.638986,9.428796],[76.638685,9.428626],[76.638481,9.428665],[76.638168,9.428729],[76.637858,9.428767],[76.637604,9.428775],[76.637313,9.42881],[76.637048,9.42879],[76.636756,9.428714],[76.636679,9.428619],[76.636601,9.428455],[76.636528,9.42827],[76.636427,9.428089],[76.63636,9.427992],[76.636172,9.42791],[76.635955,9.427811],[76.635851,9.427781],[76.635762,9.427756],[76.635478,9.427672],[76.635316,9.427661],[76.632637,9.427142],[76.632124,9.426993],[76.631772,9.426891],[76.631458,9.426888],[76.63114,9.426886],[76.63096,9.426873],[76.630755,9.426858],[76.63047,9.426777],[76.629858,9.426606],[76.629584,9.426383],[76.629291,9.426098],[76.629184,9.426019],[76.627051,9.426081],[76.62708,9.425815],[76.627112,9.42553],[76.627095,9.425363],[76.627026,9.42503],[76.627005,9.424927],[76.626963,9.424728],[76.626943,9.424633],[76.626914,9.424512],[76.626916,9.42435],[76.626896,9.424078],[76.626819,9.423694],[76.626825,9.423402],[76.626853,9.423264],[76.626878,9.423145],[76.626903,9.422959],[76.626898,9.422836],[76.62689,9.422636],[76.626892,9.422505],[76.626895,9.422377],[76.626914,9.422177],[76.626934,9.421967]]]},\"properties\":{\"Created_Da\":\"2024-10-20T09:03:23.101Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"PUTHUSSERRY\",\"Ward_No\":\"14\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.644814,9.426785],[76.644689,9.426601],[76.644377,9.426154],[76.643975,9.425432],[76.643786,9.425219],[76.643579,9.42494],[76.64339,9.424718],[76.64324,9.424524],[76.643061,9.424365],[76.642864,9.424215],[76.642625,9.424073],[76.642385,9.423937],[76.642106,9.423799],[76.641829,9.423746],[76.641822,9.423651],[76.641796,9.423439],[76.641731,9.422975],[76.641668,9.422512],[76.641598,9.422155],[76.641602,9.421836],[76.641552,9.421726],[76.640679,9.420993],[76.640208,9.420572],[76.640053,9.42034],[76.640068,9.420233],[76.640066,9.420086],[76.640169,9.419854],[76.640288,9.419695],[76.640451,9.419534],[76.640645,9.419391],[76.640846,9.419277],[76.641179,9.419158],[76.641403,9.419061],[76.641542,9.418959],[76.641602,9.418844],[76.641591,9.418457],[76.641591,9.417778],[76.641456,9.41711],[76.641594,9.417052],[76.641932,9.416973],[76.642117,9.416972],[76.642245,9.417267],[76.642585,9.417241],[76.643057,9.417179],[76.643232,9.417154],[76.643333,9.41714],[76.643608,9.417015],[76.643757,9.416928],[76.643943,9.416822],[76.644075,9.416383],[76.643916,9.415709],[76.643805,9.415416],[76.643762,9.415299],[76.643436,9.414811],[76.643371,9.414734],[76.643601,9.414347],[76.643681,9.414219],[76.643853,9.414068],[76.644153,9.413877],[76.644447,9.4136],[76.64598,9.41319],[76.645817,9.412468],[76.645865,9.412096],[76.645943,9.411818],[76.646029,9.411653],[76.646114,9.411487],[76.646308,9.411394],[76.6464,9.411315],[76.64652,9.410979],[76.64658,9.410741],[76.64664,9.41057],[76.646699,9.410399],[76.646765,9.410243],[76.646768,9.410047],[76.646726,9.409718],[76.646692,9.409316],[76.646536,9.409132],[76.646453,9.409043],[76.646439,9.408842],[76.64647,9.40855],[76.6465,9.408444],[76.646511,9.408235],[76.646289,9.408222],[76.646133,9.408178],[76.645899,9.408133],[76.645795,9.408008],[76.64563,9.407922],[76.645444,9.407862],[76.64528,9.407797],[76.6452,9.407735],[76.645107,9.407715],[76.644979,9.407696],[76.644872,9.407678],[76.644741,9.407641],[76.644552,9.407576],[76.644381,9.407488],[76.644366,9.407292],[76.644399,9.407167],[76.644457,9.406965],[76.644511,9.406796],[76.644589,9.406626],[76.644634,9.406507],[76.644699,9.406342],[76.644759,9.406199],[76.644821,9.406085],[76.64491,9.405912],[76.64505,9.405548],[76.645117,9.405436],[76.645654,9.404832],[76.645762,9.404946],[76.645923,9.405094],[76.646289,9.405429],[76.646449,9.405509],[76.646615,9.405655],[76.646854,9.405713],[76.647095,9.405772],[76.647198,9.405799],[76.647335,9.405822],[76.647651,9.405878],[76.647934,9.405801],[76.648111,9.405767],[76.648216,9.405746],[76.648311,9.406065],[76.648542,9.406215],[76.648537,9.406395],[76.648618,9.406562],[76.648783,9.406672],[76.648937,9.406803],[76.649,9.406883],[76.649102,9.407183],[76.649105,9.407315],[76.649107,9.407453],[76.649108,9.407707],[76.649105,9.407845],[76.649093,9.407987],[76.649087,9.408123],[76.649072,9.408252],[76.649038,9.40837],[76.64898,9.408458],[76.648908,9.408527],[76.648827,9.408593],[76.64876,9.40866],[76.648695,9.408735],[76.648647,9.408832],[76.648627,9.40894],[76.648642,9.40904],[76.648648,9.409132],[76.648648,9.409227],[76.648658,9.409338],[76.648683,9.409467],[76.64869,9.409598],[76.648663,9.409738],[76.648605,9.409872],[76.64852,9.410015],[76.648443,9.410152],[76.648363,9.410287],[76.648287,9.410417],[76.648212,9.410535],[76.648122,9.410647],[76.648023,9.410765],[76.647902,9.41096],[76.64786,9.411158],[76.647862,9.411298],[76.647932,9.411605],[76.648,9.411712],[76.648175,9.411968],[76.648302,9.412155],[76.648378,9.412267],[76.648423,9.412387],[76.648437,9.412577],[76.648452,9.41274],[76.648468,9.412873],[76.6485,9.413023],[76.648572,9.413177],[76.64865,9.413278],[76.648732,9.41337],[76.648828,9.413487],[76.648886,9.413678],[76.648634,9.413611],[76.648544,9.413656],[76.648413,9.413741],[76.648261,9.413908],[76.647987,9.414343],[76.647777,9.414609],[76.647506,9.414933],[76.647306,9.415152],[76.647122,9.415314],[76.646944,9.41548],[76.646668,9.415634],[76.646553,9.415671],[76.646366,9.415699],[76.646163,9.415727],[76.646024,9.415746],[76.645916,9.415748],[76.64582,9.415678],[76.645653,9.415595],[76.645586,9.415838],[76.645568,9.416038],[76.645608,9.416168],[76.645707,9.41624],[76.645811,9.416263],[76.645992,9.416302],[76.646093,9.416436],[76.646019,9.416646],[76.645903,9.416985],[76.645765,9.417434],[76.645673,9.417757],[76.645614,9.41802],[76.645486,9.418208],[76.645302,9.418383],[76.6451,9.418523],[76.644859,9.418771],[76.644735,9.418878],[76.644649,9.419056],[76.644563,9.419367],[76.64467,9.419402],[76.644853,9.4195],[76.645051,9.419586],[76.645361,9.419722],[76.64554,9.41979],[76.645667,9.419855],[76.645803,9.419953],[76.64598,9.419987],[76.646106,9.419992],[76.646253,9.419982],[76.646407,9.419991],[76.6466,9.420021],[76.646889,9.42011],[76.646997,9.42022],[76.647093,9.420311],[76.64719,9.420355],[76.647294,9.420385],[76.647494,9.420394],[76.647833,9.420395],[76.648041,9.420378],[76.648145,9.42044],[76.648279,9.420516],[76.648372,9.42063],[76.648471,9.420539],[76.648593,9.420496],[76.648773,9.420458],[76.649031,9.420295],[76.649301,9.420215],[76.649238,9.420457],[76.649166,9.420928],[76.649085,9.421487],[76.648963,9.421851],[76.648863,9.421937],[76.648755,9.422041],[76.648534,9.422208],[76.648451,9.422248],[76.648182,9.422377],[76.648049,9.422494],[76.647934,9.422597],[76.647759,9.422816],[76.647706,9.42294],[76.647654,9.423065],[76.647533,9.423336],[76.647353,9.423688],[76.647224,9.423939],[76.647441,9.424029],[76.647612,9.424059],[76.647805,9.424104],[76.647931,9.424148],[76.648072,9.424221],[76.64821,9.424315],[76.648353,9.424431],[76.648508,9.424562],[76.648644,9.424672],[76.648751,9.424669],[76.648855,9.424594],[76.648995,9.42452],[76.649187,9.4244],[76.64933,9.42448],[76.649571,9.424707],[76.649833,9.42498],[76.650198,9.425235],[76.65003,9.425444],[76.649806,9.425706],[76.649648,9.42591],[76.649563,9.425988],[76.649446,9.426095],[76.649098,9.426348],[76.648806,9.42664],[76.648639,9.426732],[76.648464,9.426821],[76.648101,9.427047],[76.648,9.427135],[76.647891,9.427231],[76.647811,9.427301],[76.647729,9.427371],[76.64763,9.427454],[76.64754,9.427612],[76.647494,9.427746],[76.647449,9.427863],[76.647402,9.427981],[76.647344,9.428302],[76.647299,9.428381],[76.647199,9.428556],[76.647051,9.428686],[76.64697,9.428753],[76.646791,9.428851],[76.646688,9.428917],[76.646568,9.429001],[76.646457,9.429083],[76.646274,9.429207],[76.646147,9.429271],[76.646036,9.429293],[76.645791,9.429423],[76.645717,9.42952],[76.645553,9.429623],[76.645379,9.429697],[76.645114,9.429766],[76.645023,9.429821],[76.644879,9.429524],[76.644766,9.429321],[76.644637,9.429034],[76.644591,9.42884],[76.644546,9.428647],[76.644531,9.428532],[76.644543,9.428394],[76.644554,9.428257],[76.644593,9.428104],[76.644696,9.427831],[76.644806,9.427525],[76.644831,9.427335],[76.644843,9.426991],[76.644814,9.426785]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:06:51.140Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"MADATHUMBHAGOM NORTH\",\"Ward_No\":\"8\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.638541,9.43297],[76.63842,9.433029],[76.638244,9.43312],[76.63837,9.433376],[76.638513,9.433581],[76.638593,9.433725],[76.638713,9.433874],[76.638823,9.434043],[76.638927,9.434182],[76.639071,9.434351],[76.63916,9.434432],[76.63934,9.434574],[76.639509,9.434686],[76.639688,9.434776],[76.639816,9.434829],[76.640054,9.434879],[76.640258,9.434917],[76.640481,9.434947],[76.640665,9.434993],[76.640857,9.435053],[76.641073,9.435121],[76.641282,9.435175],[76.641515,9.435247],[76.641697,9.435265],[76.641786,9.43531],[76.641809,9.435402],[76.641783,9.435584],[76.641751,9.435776],[76.641705,9.436002],[76.641686,9.436127],[76.641505,9.436165],[76.641383,9.436187],[76.641184,9.436272],[76.641081,9.436312],[76.640976,9.436345],[76.64087,9.436349],[76.640713,9.436358],[76.640547,9.436357],[76.640384,9.436345],[76.640228,9.436331],[76.640239,9.436567],[76.64024,9.436683],[76.640244,9.436908],[76.640248,9.437043],[76.640246,9.437177],[76.640246,9.43731],[76.640285,9.43741],[76.640357,9.437487],[76.640495,9.437654],[76.640631,9.437832],[76.640781,9.437998],[76.640985,9.438164],[76.641119,9.43826],[76.641369,9.43842],[76.641545,9.438411],[76.641676,9.438541],[76.641846,9.438893],[76.642049,9.439268],[76.642093,9.439393],[76.642277,9.439908],[76.642311,9.440165],[76.642324,9.440265],[76.642373,9.44066],[76.642411,9.44097],[76.642488,9.441199],[76.64257,9.441412],[76.642694,9.441728],[76.642727,9.441972],[76.642675,9.44222],[76.642594,9.442546],[76.642554,9.442702],[76.642513,9.442786],[76.642356,9.442836],[76.642204,9.442855],[76.642158,9.443063],[76.642167,9.443214],[76.642146,9.443346],[76.642085,9.443495],[76.641965,9.443689],[76.641977,9.443947],[76.642073,9.444062],[76.642172,9.444077],[76.642292,9.444077],[76.642405,9.44416],[76.642478,9.444318],[76.642531,9.444409],[76.642609,9.444504],[76.642784,9.444711],[76.642582,9.444783],[76.642406,9.44479],[76.642196,9.444797],[76.641977,9.44495],[76.64184,9.445055],[76.641664,9.44519],[76.641497,9.445318],[76.641271,9.445371],[76.64105,9.445422],[76.64096,9.445443],[76.640767,9.445375],[76.640461,9.445324],[76.640336,9.44527],[76.640241,9.445231],[76.640085,9.445165],[76.639835,9.444961],[76.639658,9.444596],[76.639606,9.444371],[76.639448,9.444223],[76.639305,9.44409],[76.639166,9.443829],[76.638969,9.443904],[76.638916,9.44379],[76.638892,9.443654],[76.638841,9.443552],[76.638706,9.443459],[76.638571,9.443365],[76.638433,9.443146],[76.638357,9.443027],[76.638188,9.44291],[76.638057,9.442707],[76.637884,9.442513],[76.637844,9.442123],[76.637737,9.442102],[76.637565,9.442069],[76.637346,9.442176],[76.637339,9.442328],[76.637202,9.442637],[76.637096,9.44287],[76.637049,9.44298],[76.636713,9.442925],[76.636582,9.442653],[76.636283,9.442789],[76.636021,9.442908],[76.635885,9.442969],[76.635529,9.443079],[76.634797,9.443305],[76.634585,9.443347],[76.634368,9.443408],[76.634202,9.443437],[76.634077,9.443242],[76.633999,9.443122],[76.633931,9.442924],[76.633833,9.442644],[76.633774,9.442557],[76.633673,9.442414],[76.633468,9.442203],[76.633352,9.442193],[76.63325,9.442074],[76.633166,9.441952],[76.633174,9.441714],[76.633199,9.441616],[76.633242,9.441466],[76.633283,9.441337],[76.633347,9.441069],[76.633344,9.440976],[76.633314,9.440833],[76.633252,9.4407],[76.633181,9.440559],[76.633088,9.44038],[76.633021,9.440298],[76.632954,9.440217],[76.632851,9.440118],[76.632747,9.440019],[76.632622,9.439919],[76.632523,9.439857],[76.632406,9.439745],[76.632521,9.439709],[76.632696,9.439714],[76.632782,9.43976],[76.63288,9.439813],[76.632996,9.439875],[76.633093,9.439931],[76.633169,9.439986],[76.633286,9.440076],[76.633386,9.440147],[76.633482,9.440218],[76.633588,9.440282],[76.633771,9.44039],[76.633885,9.440458],[76.633984,9.440505],[76.634204,9.440525],[76.634319,9.440578],[76.634443,9.440659],[76.634613,9.440735],[76.634715,9.440646],[76.634868,9.440504],[76.635085,9.440291],[76.635209,9.440143],[76.63531,9.439976],[76.635374,9.439861],[76.635427,9.439779],[76.635508,9.439655],[76.63555,9.439493],[76.635759,9.439318],[76.635856,9.439312],[76.636012,9.439303],[76.636206,9.439293],[76.636386,9.439314],[76.636516,9.439346],[76.636663,9.439398],[76.636753,9.439426],[76.636857,9.439426],[76.636986,9.43933],[76.637004,9.439238],[76.637011,9.439039],[76.637013,9.438938],[76.637014,9.438842],[76.637017,9.438741],[76.63702,9.438558],[76.63702,9.438435],[76.637028,9.438187],[76.637027,9.437983],[76.637029,9.437868],[76.63703,9.437755],[76.637035,9.437553],[76.637031,9.437351],[76.637025,9.437157],[76.637042,9.437052],[76.63707,9.4369],[76.637088,9.436705],[76.637107,9.436444],[76.637112,9.436233],[76.637114,9.436115],[76.637115,9.436009],[76.637103,9.43578],[76.637096,9.435522],[76.637111,9.435366],[76.637112,9.435164],[76.63711,9.434915],[76.637137,9.43463],[76.63727,9.434269],[76.6373,9.434163],[76.637141,9.434066],[76.636902,9.434008],[76.636812,9.433993],[76.636711,9.433975],[76.636614,9.433951],[76.636446,9.433912],[76.636277,9.433872],[76.636173,9.433848],[76.636051,9.433747],[76.636043,9.433563],[76.636121,9.433339],[76.636138,9.433182],[76.636173,9.43296],[76.636214,9.432866],[76.63627,9.432726],[76.636301,9.432555],[76.636343,9.432349],[76.636201,9.432332],[76.636115,9.43211],[76.63598,9.431883],[76.635829,9.431653],[76.635782,9.431568],[76.635716,9.431449],[76.635654,9.431364],[76.635588,9.431294],[76.63554,9.431204],[76.635473,9.431071],[76.63541,9.430913],[76.63538,9.430792],[76.635317,9.43066],[76.635272,9.430556],[76.635225,9.430413],[76.6352,9.430246],[76.635186,9.430144],[76.63519,9.430038],[76.63519,9.42986],[76.635238,9.429638],[76.635273,9.429452],[76.635262,9.429245],[76.635237,9.429115],[76.635217,9.42895],[76.63521,9.428849],[76.635194,9.42875],[76.635177,9.428631],[76.635157,9.428368],[76.635149,9.428271],[76.635152,9.428156],[76.635183,9.428041],[76.63526,9.427883],[76.635286,9.427789],[76.635316,9.427661],[76.635478,9.427672],[76.635762,9.427756],[76.635851,9.427781],[76.635955,9.427811],[76.636172,9.42791],[76.63636,9.427992],[76.636427,9.428089],[76.636528,9.42827],[76.636601,9.428455],[76.636679,9.428619],[76.636756,9.428714],[76.637048,9.42879],[76.637313,9.42881],[76.637604,9.428775],[76.637858,9.428767],[76.638168,9.428729],[76.638481,9.428665],[76.638685,9.428626],[76.638986,9.428796],[76.639237,9.428829],[76.639455,9.428789],[76.639676,9.428707],[76.639935,9.428599],[76.63997,9.429327],[76.63997,9.430087],[76.639819,9.430697],[76.639496,9.431097],[76.639489,9.431687],[76.639386,9.432277],[76.639181,9.432523],[76.639057,9.432718],[76.638871,9.432824],[76.638694,9.432902],[76.638541,9.43297]]]},\"properties\":{\"Created_Da\":\"2024-10-16T07:38:50.633Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"NA\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"KANJIRATHINKAL\",\"Ward_No\":\"2\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.65003,9.425444],[76.650198,9.425235],[76.650429,9.42533],[76.650668,9.425473],[76.650793,9.425522],[76.651003,9.425565],[76.651221,9.425596],[76.651459,9.425632],[76.651609,9.425777],[76.651774,9.425899],[76.651963,9.42594],[76.652041,9.425878],[76.652152,9.42577],[76.652238,9.425564],[76.65231,9.425457],[76.652459,9.425335],[76.652581,9.425263],[76.652733,9.425214],[76.652826,9.425201],[76.65294,9.425217],[76.653121,9.425299],[76.653238,9.425343],[76.65333,9.425357],[76.653501,9.425311],[76.65365,9.425315],[76.653907,9.42529],[76.654034,9.425279],[76.654132,9.425302],[76.654289,9.425459],[76.65441,9.425581],[76.654532,9.425649],[76.65462,9.425675],[76.654808,9.425721],[76.654966,9.42568],[76.65504,9.425599],[76.655077,9.42551],[76.65516,9.425312],[76.655287,9.425237],[76.655488,9.425189],[76.655597,9.425167],[76.655734,9.425125],[76.655898,9.425076],[76.65606,9.42502],[76.656244,9.424948],[76.6564,9.424836],[76.656501,9.424755],[76.656589,9.424695],[76.656729,9.424647],[76.656832,9.424642],[76.656925,9.424643],[76.657018,9.424661],[76.657105,9.424688],[76.657256,9.424729],[76.657397,9.4248],[76.657124,9.424989],[76.656907,9.425176],[76.657019,9.42533],[76.657075,9.425449],[76.657126,9.425636],[76.657187,9.425922],[76.657312,9.426188],[76.657467,9.426494],[76.657622,9.426735],[76.657797,9.426925],[76.657891,9.426864],[76.658098,9.426704],[76.658314,9.426452],[76.658529,9.426232],[76.659293,9.425661],[76.659799,9.42526],[76.66026,9.424869],[76.660666,9.424702],[76.661489,9.424635],[76.661771,9.424619],[76.662896,9.425121],[76.662987,9.425161],[76.662865,9.425581],[76.662852,9.425809],[76.662831,9.42613],[76.662829,9.426278],[76.662827,9.426499],[76.662842,9.426801],[76.662857,9.42703],[76.662868,9.427183],[76.662724,9.427279],[76.662496,9.427386],[76.662272,9.427491],[76.662101,9.427596],[76.661984,9.427667],[76.66188,9.427706],[76.661753,9.427754],[76.661583,9.427642],[76.661467,9.427565],[76.661356,9.427642],[76.661259,9.427708],[76.661161,9.427777],[76.661002,9.427886],[76.660923,9.42794],[76.660797,9.428028],[76.660625,9.428112],[76.660666,9.428223],[76.66062,9.428454],[76.660418,9.42841],[76.660175,9.428541],[76.66005,9.428609],[76.659919,9.42868],[76.659829,9.428699],[76.6596,9.428914],[76.659486,9.429039],[76.659421,9.42911],[76.659298,9.42913],[76.659174,9.42915],[76.659058,9.429183],[76.658941,9.429216],[76.658812,9.429159],[76.658619,9.429224],[76.658492,9.429185],[76.658285,9.429222],[76.658361,9.429525],[76.658425,9.429677],[76.658466,9.429778],[76.658531,9.429933],[76.658597,9.430095],[76.658496,9.430203],[76.658304,9.430209],[76.657996,9.430218],[76.657926,9.430078],[76.65751,9.430214],[76.657273,9.430274],[76.657116,9.430313],[76.657106,9.430496],[76.657097,9.430659],[76.657092,9.430753],[76.657064,9.430845],[76.657034,9.430946],[76.65693,9.431102],[76.656796,9.43124],[76.656629,9.43141],[76.656513,9.431527],[76.655987,9.431309],[76.655821,9.43124],[76.655681,9.431372],[76.655562,9.431486],[76.655257,9.431776],[76.655117,9.431908],[76.655084,9.432103],[76.655047,9.432318],[76.655035,9.432528],[76.655199,9.432633],[76.655146,9.432751],[76.655092,9.432932],[76.655053,9.433058],[76.655018,9.433169],[76.655025,9.433485],[76.655042,9.433614],[76.654945,9.43378],[76.654985,9.433867],[76.654925,9.434128],[76.654867,9.434383],[76.654632,9.434394],[76.654494,9.4344],[76.65434,9.434399],[76.653721,9.434393],[76.653332,9.434284],[76.653158,9.434236],[76.6528,9.434136],[76.652797,9.434446],[76.652796,9.43454],[76.652723,9.434679],[76.652624,9.434659],[76.652508,9.434967],[76.65241,9.434932],[76.652272,9.435128],[76.651961,9.435081],[76.651735,9.435102],[76.651511,9.435123],[76.651467,9.435438],[76.651439,9.435647],[76.651415,9.435808],[76.65139,9.43598],[76.651327,9.436058],[76.651266,9.436132],[76.65114,9.43647],[76.650981,9.436778],[76.650907,9.436935],[76.650853,9.437046],[76.650768,9.437314],[76.650741,9.437629],[76.650716,9.437967],[76.650593,9.438197],[76.650547,9.438295],[76.650454,9.438401],[76.650375,9.4385],[76.650233,9.438681],[76.650059,9.438904],[76.649844,9.439136],[76.64974,9.439248],[76.649606,9.439197],[76.649374,9.439039],[76.649258,9.439023],[76.648832,9.438967],[76.648694,9.438859],[76.648632,9.439016],[76.64857,9.439177],[76.648539,9.439318],[76.648264,9.439453],[76.648027,9.439411],[76.647768,9.439374],[76.647756,9.439531],[76.647744,9.439691],[76.647801,9.439838],[76.647622,9.439886],[76.64752,9.439833],[76.647314,9.439584],[76.647223,9.439425],[76.647182,9.43933],[76.647026,9.438938],[76.646815,9.438486],[76.646659,9.438292],[76.646446,9.438016],[76.646345,9.437692],[76.646391,9.437488],[76.646596,9.437045],[76.646799,9.43668],[76.646962,9.436458],[76.647173,9.436031],[76.647135,9.435816],[76.647104,9.435652],[76.647026,9.435454],[76.64693,9.435229],[76.646893,9.435108],[76.64689,9.435007],[76.646894,9.434856],[76.646904,9.434704],[76.646933,9.434418],[76.646948,9.434146],[76.646947,9.433966],[76.646916,9.433874],[76.646828,9.433628],[76.646738,9.433354],[76.646686,9.433171],[76.646615,9.432971],[76.646505,9.432664],[76.64642,9.432421],[76.646372,9.432242],[76.646328,9.432149],[76.646226,9.43203],[76.646087,9.43191],[76.645943,9.431775],[76.645812,9.431648],[76.645701,9.431558],[76.645591,9.431467],[76.645522,9.431382],[76.645461,9.43127],[76.645372,9.431132],[76.645274,9.430979],[76.645196,9.430816],[76.645128,9.430622],[76.645087,9.430427],[76.645078,9.430229],[76.645073,9.430048],[76.645061,9.429932],[76.645023,9.429821],[76.645114,9.429766],[76.645379,9.429697],[76.645553,9.429623],[76.645717,9.42952],[76.645791,9.429423],[76.646036,9.429293],[76.646147,9.429271],[76.646274,9.429207],[76.646457,9.429083],[76.646568,9.429001],[76.646688,9.428917],[76.646791,9.428851],[76.64697,9.428753],[76.647051,9.428686],[76.647199,9.428556],[76.647299,9.428381],[76.647344,9.428302],[76.647402,9.427981],[76.647449,9.427863],[76.647494,9.427746],[76.64754,9.427612],[76.64763,9.427454],[76.647729,9.427371],[76.647811,9.427301],[76.647891,9.427231],[76.648,9.427135],[76.648101,9.427047],[76.648464,9.426821],[76.648639,9.426732],[76.648806,9.42664],[76.649098,9.426348],[76.649446,9.426095],[76.649563,9.425988],[76.649648,9.42591],[76.649806,9.425706],[76.65003,9.425444]]]},\"properties\":{\"Created_Da\":\"2024-10-20T10:28:05.524Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"THUNDIYAMKULAM\",\"Ward_No\":\"4\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.635885,9.389973],[76.636722,9.38997],[76.638249,9.389755],[76.638836,9.389696],[76.640825,9.389258],[76.64103,9.38921],[76.641384,9.389128],[76.641758,9.389094],[76.64193,9.389079],[76.642299,9.389235],[76.642456,9.389302],[76.642761,9.389631],[76.643,9.389889],[76.643235,9.390868],[76.643411,9.391632],[76.643443,9.391756],[76.64349,9.391985],[76.643558,9.392216],[76.643507,9.39236],[76.643371,9.392741],[76.643191,9.393088],[76.643013,9.393431],[76.642821,9.3937],[76.642733,9.393825],[76.642604,9.394005],[76.642355,9.394202],[76.642156,9.394359],[76.641888,9.394572],[76.641628,9.394778],[76.641164,9.395046],[76.641047,9.395081],[76.640883,9.395155],[76.640763,9.395187],[76.64041,9.395318],[76.640058,9.395449],[76.639365,9.395695],[76.63907,9.395874],[76.638826,9.396023],[76.638646,9.396126],[76.638516,9.396198],[76.63834,9.396296],[76.63821,9.396409],[76.637952,9.396636],[76.637883,9.397008],[76.637837,9.397396],[76.63781,9.39784],[76.637785,9.398239],[76.637761,9.398629],[76.637727,9.399174],[76.637702,9.399719],[76.637453,9.399753],[76.637047,9.399807],[76.636752,9.399782],[76.636455,9.399766],[76.63594,9.399787],[76.635608,9.399913],[76.634631,9.400285],[76.634681,9.399644],[76.634721,9.399333],[76.63475,9.399089],[76.634771,9.398898],[76.634789,9.398716],[76.634807,9.398535],[76.634828,9.398319],[76.634841,9.398227],[76.634866,9.398042],[76.634882,9.397922],[76.634932,9.397755],[76.635028,9.397555],[76.635162,9.39724],[76.635166,9.39703],[76.635087,9.396862],[76.635029,9.396772],[76.634864,9.396605],[76.634556,9.39651],[76.634203,9.396572],[76.633939,9.396644],[76.633539,9.396642],[76.633107,9.396688],[76.632658,9.396768],[76.632224,9.396868],[76.632125,9.396861],[76.632011,9.39683],[76.631843,9.396699],[76.631676,9.396568],[76.631437,9.396342],[76.63119,9.39611],[76.630941,9.395904],[76.630283,9.395358],[76.630476,9.395174],[76.630625,9.395021],[76.630743,9.394716],[76.630881,9.394364],[76.630976,9.394052],[76.62999,9.393333],[76.630132,9.393137],[76.630311,9.392889],[76.630415,9.392742],[76.63055,9.392538],[76.631131,9.391692],[76.631798,9.39072],[76.631892,9.390557],[76.631973,9.390505],[76.632203,9.390359],[76.632475,9.390163],[76.632654,9.390042],[76.632876,9.389892],[76.633546,9.389772],[76.633945,9.389763],[76.634303,9.389757],[76.634745,9.389807],[76.635152,9.389873],[76.635527,9.389935],[76.635885,9.389973]]]},\"properties\":{\"Created_Da\":\"2024-10-18T06:42:52.932Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"KALLOOR\",\"Ward_No\":\"10\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.646391,9.437488],[76.646345,9.437692],[76.646446,9.438016],[76.646659,9.438292],[76.646815,9.438486],[76.647026,9.438938],[76.647182,9.43933],[76.647223,9.439425],[76.647314,9.439584],[76.64752,9.439833],[76.647622,9.439886],[76.647801,9.439838],[76.647942,9.440041],[76.648015,9.440174],[76.648109,9.44041],[76.648151,9.440538],[76.648224,9.440747],[76.648292,9.440899],[76.648326,9.441032],[76.648201,9.441105],[76.648068,9.441179],[76.64779,9.441274],[76.647557,9.441394],[76.647452,9.441283],[76.647337,9.441156],[76.647237,9.441046],[76.647067,9.440939],[76.646888,9.440886],[76.646685,9.440978],[76.646586,9.441159],[76.646501,9.44132],[76.64644,9.441435],[76.646356,9.441594],[76.646313,9.441945],[76.646124,9.44214],[76.646017,9.442191],[76.645856,9.442266],[76.645805,9.442404],[76.645718,9.442573],[76.645598,9.442803],[76.645206,9.443203],[76.645019,9.443587],[76.644885,9.443897],[76.644511,9.443983],[76.64441,9.444006],[76.64436,9.444134],[76.644231,9.444177],[76.643889,9.444191],[76.64372,9.444293],[76.64361,9.444352],[76.64316,9.444598],[76.643018,9.444628],[76.642784,9.444711],[76.642609,9.444504],[76.642531,9.444409],[76.642478,9.444318],[76.642405,9.44416],[76.642292,9.444077],[76.642172,9.444077],[76.642073,9.444062],[76.641977,9.443947],[76.641965,9.443689],[76.642085,9.443495],[76.642146,9.443346],[76.642167,9.443214],[76.642158,9.443063],[76.642204,9.442855],[76.642356,9.442836],[76.642513,9.442786],[76.642554,9.442702],[76.642594,9.442546],[76.642675,9.44222],[76.642727,9.441972],[76.642694,9.441728],[76.64257,9.441412],[76.642488,9.441199],[76.642411,9.44097],[76.642373,9.44066],[76.642324,9.440265],[76.642311,9.440165],[76.642277,9.439908],[76.642093,9.439393],[76.642049,9.439268],[76.641846,9.438893],[76.641676,9.438541],[76.641545,9.438411],[76.641369,9.43842],[76.641119,9.43826],[76.640985,9.438164],[76.640781,9.437998],[76.640631,9.437832],[76.640495,9.437654],[76.640357,9.437487],[76.640285,9.43741],[76.640246,9.43731],[76.640246,9.437177],[76.640248,9.437043],[76.640244,9.436908],[76.64024,9.436683],[76.640239,9.436567],[76.640228,9.436331],[76.640384,9.436345],[76.640547,9.436357],[76.640713,9.436358],[76.64087,9.436349],[76.640976,9.436345],[76.641081,9.436312],[76.641184,9.436272],[76.641383,9.436187],[76.641505,9.436165],[76.641686,9.436127],[76.641705,9.436002],[76.641751,9.435776],[76.641783,9.435584],[76.641809,9.435402],[76.641786,9.43531],[76.641697,9.435265],[76.641515,9.435247],[76.641282,9.435175],[76.641073,9.435121],[76.640857,9.435053],[76.640665,9.434993],[76.640481,9.434947],[76.640258,9.434917],[76.640054,9.434879],[76.639816,9.434829],[76.639688,9.434776],[76.639509,9.434686],[76.63934,9.434574],[76.63916,9.434432],[76.639071,9.434351],[76.638927,9.434182],[76.638823,9.434043],[76.638713,9.433874],[76.638593,9.433725],[76.638513,9.433581],[76.63837,9.433376],[76.638244,9.43312],[76.63842,9.433029],[76.638541,9.43297],[76.638694,9.432902],[76.638871,9.432824],[76.639057,9.432718],[76.639181,9.432523],[76.639386,9.432277],[76.639489,9.431687],[76.639496,9.431097],[76.639819,9.430697],[76.63997,9.430087],[76.63997,9.429327],[76.639935,9.428599],[76.639958,9.428403],[76.639924,9.428306],[76.639924,9.428103],[76.639902,9.427913],[76.639893,9.42769],[76.639897,9.427554],[76.639893,9.427435],[76.639875,9.427338],[76.639867,9.427189],[76.63991,9.427007],[76.639946,9.426874],[76.639977,9.426755],[76.640091,9.42666],[76.640243,9.426605],[76.640366,9.42656],[76.640574,9.426423],[76.640655,9.426376],[76.640765,9.426308],[76.640915,9.426286],[76.641027,9.426316],[76.641196,9.426361],[76.641485,9.426409],[76.641757,9.426408],[76.64188,9.426398],[76.641984,9.426329],[76.642103,9.42624],[76.642263,9.426129],[76.64255,9.425967],[76.6427,9.425865],[76.642646,9.425664],[76.642549,9.425419],[76.642426,9.425117],[76.642354,9.42491],[76.641985,9.424409],[76.641841,9.424189],[76.641832,9.423951],[76.641829,9.423746],[76.642106,9.423799],[76.642385,9.423937],[76.642625,9.424073],[76.642864,9.424215],[76.643061,9.424365],[76.64324,9.424524],[76.64339,9.424718],[76.643579,9.42494],[76.643786,9.425219],[76.643975,9.425432],[76.644377,9.426154],[76.644689,9.426601],[76.644814,9.426785],[76.644843,9.426991],[76.644831,9.427335],[76.644806,9.427525],[76.644696,9.427831],[76.644593,9.428104],[76.644554,9.428257],[76.644543,9.428394],[76.644531,9.428532],[76.644546,9.428647],[76.644591,9.42884],[76.644637,9.429034],[76.644766,9.429321],[76.644879,9.429524],[76.645023,9.429821],[76.645061,9.429932],[76.645073,9.430048],[76.645078,9.430229],[76.645087,9.430427],[76.645128,9.430622],[76.645196,9.430816],[76.645274,9.430979],[76.645372,9.431132],[76.645461,9.43127],[76.645522,9.431382],[76.645591,9.431467],[76.645701,9.431558],[76.645812,9.431648],[76.645943,9.431775],[76.646087,9.43191],[76.646226,9.43203],[76.646328,9.432149],[76.646372,9.432242],[76.64642,9.432421],[76.646505,9.432664],[76.646615,9.432971],[76.646686,9.433171],[76.646738,9.433354],[76.646828,9.433628],[76.646916,9.433874],[76.646947,9.433966],[76.646948,9.434146],[76.646933,9.434418],[76.646904,9.434704],[76.646894,9.434856],[76.64689,9.435007],[76.646893,9.435108],[76.64693,9.435229],[76.647026,9.435454],[76.647104,9.435652],[76.647135,9.435816],[76.647173,9.436031],[76.646962,9.436458],[76.646799,9.43668],[76.646596,9.437045],[76.646391,9.437488]]]},\"properties\":{\"Created_Da\":\"2024-10-15T05:44:45Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kallooppara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Rajesh V\",\"Ward_Name\":\"MADUKKOLI\",\"Ward_No\":\"3\",\"Mandal\":\"Mallappally\"}}]}");
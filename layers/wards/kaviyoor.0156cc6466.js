@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.600576,9.406722],[76.60044,9.406988],[76.600236,9.407259],[76.600027,9.407219],[76.599672,9.407088],[76.599132,9.406889],[76.598867,9.406772],[76.598622,9.406634],[76.598318,9.406467],[76.598047,9.406292],[76.596545,9.406169],[76.596492,9.405848],[76.596422,9.405425],[76.596385,9.405203],[76.596373,9.405084],[76.59632,9.404554],[76.596289,9.404237],[76.596278,9.404132],[76.596268,9.404032],[76.596356,9.403223],[76.596371,9.403083],[76.596403,9.402643],[76.596441,9.402332],[76.596476,9.402042],[76.596761,9.401445],[76.597164,9.401329],[76.598675,9.400907],[76.598892,9.400865],[76.599058,9.400823],[76.599153,9.400797],[76.599302,9.40078],[76.599479,9.400759],[76.599659,9.400752],[76.599796,9.400767],[76.599907,9.400771],[76.60021,9.400784],[76.600308,9.400797],[76.600469,9.400796],[76.600692,9.400918],[76.600866,9.400963],[76.60103,9.400923],[76.601201,9.400914],[76.601332,9.400967],[76.601563,9.400991],[76.601726,9.400988],[76.601915,9.400969],[76.60221,9.400974],[76.602241,9.400839],[76.602268,9.400715],[76.602298,9.400586],[76.602329,9.400483],[76.602361,9.400323],[76.602383,9.400184],[76.602395,9.400061],[76.602403,9.399951],[76.602403,9.399848],[76.602392,9.399748],[76.602353,9.399602],[76.60244,9.399382],[76.60255,9.399365],[76.602966,9.39936],[76.603103,9.399365],[76.603218,9.399376],[76.603363,9.3994],[76.603488,9.399421],[76.603628,9.399459],[76.603804,9.39948],[76.604015,9.399398],[76.604194,9.399353],[76.60434,9.399305],[76.604468,9.399272],[76.604664,9.399221],[76.60485,9.399239],[76.604853,9.399362],[76.60487,9.399461],[76.604909,9.39957],[76.604999,9.399788],[76.605022,9.39993],[76.605011,9.400145],[76.60499,9.400346],[76.605017,9.400516],[76.605042,9.400651],[76.605075,9.400788],[76.605117,9.401019],[76.605099,9.401171],[76.605134,9.401313],[76.605231,9.401693],[76.605255,9.401833],[76.605279,9.401989],[76.605314,9.402219],[76.605301,9.402387],[76.605211,9.40248],[76.605349,9.402875],[76.605502,9.402857],[76.605624,9.402856],[76.605771,9.402855],[76.606057,9.402861],[76.606468,9.402837],[76.606639,9.402827],[76.606738,9.402822],[76.607036,9.402745],[76.607155,9.40274],[76.607166,9.402867],[76.607214,9.403179],[76.607316,9.403496],[76.607375,9.403649],[76.607463,9.40379],[76.607613,9.40393],[76.6077,9.404013],[76.607792,9.404102],[76.607872,9.404172],[76.608128,9.404398],[76.608226,9.404494],[76.60838,9.404633],[76.608506,9.404748],[76.608671,9.404806],[76.608878,9.404915],[76.608974,9.405012],[76.60908,9.405198],[76.609135,9.405333],[76.609192,9.405513],[76.609322,9.405869],[76.609067,9.406202],[76.6089,9.406374],[76.608756,9.406512],[76.608592,9.406641],[76.6084,9.406786],[76.608207,9.406923],[76.608089,9.407042],[76.607952,9.40718],[76.607797,9.407326],[76.607658,9.407436],[76.607482,9.407568],[76.607364,9.407658],[76.607208,9.407775],[76.607135,9.407865],[76.607061,9.407954],[76.606894,9.408143],[76.60673,9.408282],[76.606653,9.408151],[76.606641,9.407955],[76.606617,9.40784],[76.606594,9.407726],[76.606504,9.407553],[76.606403,9.40736],[76.606226,9.40711],[76.606134,9.406963],[76.606042,9.406815],[76.605957,9.406685],[76.605884,9.406524],[76.605824,9.406423],[76.605796,9.40629],[76.605784,9.406179],[76.605773,9.406082],[76.60576,9.405976],[76.605758,9.405797],[76.60574,9.405689],[76.605757,9.405569],[76.605736,9.405418],[76.605675,9.405183],[76.605606,9.405026],[76.605537,9.404868],[76.605423,9.404662],[76.605303,9.404466],[76.605244,9.404377],[76.605203,9.40429],[76.60514,9.404221],[76.605003,9.404098],[76.604908,9.404018],[76.604811,9.403907],[76.604753,9.403834],[76.604632,9.403715],[76.604561,9.403622],[76.604407,9.403664],[76.60425,9.403673],[76.604148,9.403684],[76.604026,9.403693],[76.603902,9.403705],[76.603852,9.403812],[76.603847,9.403926],[76.603861,9.404126],[76.603931,9.404236],[76.603989,9.404353],[76.604085,9.404458],[76.604035,9.404582],[76.604005,9.404813],[76.603856,9.404951],[76.603786,9.405035],[76.603664,9.405106],[76.603494,9.40517],[76.603324,9.405365],[76.603249,9.405483],[76.603187,9.40559],[76.603077,9.405795],[76.60297,9.405804],[76.602708,9.405804],[76.602404,9.405734],[76.60232,9.40568],[76.602202,9.405631],[76.60206,9.405561],[76.601797,9.405454],[76.601615,9.405347],[76.601534,9.405301],[76.601239,9.405147],[76.601147,9.405235],[76.600987,9.405526],[76.600927,9.40566],[76.600809,9.405774],[76.60078,9.405888],[76.600737,9.406075],[76.600725,9.406166],[76.600678,9.406422],[76.600576,9.406722]]]},\"properties\":{\"Created_Da\":\"2024-10-16T06:55:52.349Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9496808134\",\"Surveyor\":\"sam k salam\",\"Ward_Name\":\"MAKATTIKKAVALA\",\"Ward_No\":\"13\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.607708,9.396163],[76.607721,9.396002],[76.607719,9.395886],[76.607812,9.395889],[76.607937,9.395887],[76.608059,9.395893],[76.608265,9.395912],[76.608364,9.395915],[76.608503,9.395899],[76.608664,9.395875],[76.608819,9.395808],[76.608921,9.395784],[76.609068,9.395754],[76.609199,9.395738],[76.609368,9.395724],[76.609522,9.395724],[76.609638,9.395726],[76.609736,9.395734],[76.609902,9.395751],[76.610177,9.395767],[76.610411,9.395781],[76.610536,9.395783],[76.610684,9.395803],[76.610842,9.395801],[76.610986,9.395818],[76.611179,9.395837],[76.611337,9.395896],[76.611384,9.396003],[76.611404,9.396209],[76.611405,9.39632],[76.611432,9.396438],[76.61157,9.39668],[76.611349,9.396784],[76.611302,9.396904],[76.611316,9.397059],[76.611324,9.397203],[76.611314,9.397473],[76.611137,9.397488],[76.610864,9.397509],[76.610873,9.397693],[76.610879,9.397878],[76.610888,9.398013],[76.610929,9.398151],[76.610948,9.39834],[76.611074,9.398363],[76.611208,9.398375],[76.611309,9.398206],[76.611447,9.398148],[76.611638,9.398125],[76.611829,9.398116],[76.611982,9.398122],[76.612133,9.398101],[76.612295,9.398049],[76.612345,9.397968],[76.612521,9.398062],[76.612511,9.398319],[76.612526,9.398417],[76.612582,9.398685],[76.612568,9.39879],[76.612525,9.398876],[76.61248,9.398956],[76.612425,9.399069],[76.612373,9.39923],[76.612337,9.399364],[76.612315,9.399514],[76.612309,9.399635],[76.612304,9.399778],[76.612303,9.400004],[76.612294,9.400257],[76.6123,9.400404],[76.612294,9.400518],[76.612242,9.400632],[76.612147,9.400753],[76.612024,9.400898],[76.611939,9.400988],[76.611776,9.40116],[76.611705,9.401243],[76.611624,9.401359],[76.611566,9.401441],[76.611489,9.401547],[76.611383,9.401673],[76.611317,9.40174],[76.61123,9.401839],[76.611158,9.40192],[76.611067,9.401998],[76.610978,9.402069],[76.610806,9.402207],[76.610635,9.402365],[76.610559,9.402484],[76.610492,9.402631],[76.610435,9.40276],[76.610374,9.402902],[76.610338,9.402994],[76.610272,9.403161],[76.610225,9.403283],[76.610165,9.40345],[76.610078,9.403642],[76.610033,9.40374],[76.609983,9.403849],[76.609873,9.404056],[76.609812,9.40416],[76.609741,9.404302],[76.609714,9.404393],[76.609695,9.40464],[76.609691,9.404745],[76.609692,9.404882],[76.609674,9.405045],[76.609632,9.405234],[76.609603,9.405337],[76.609567,9.405454],[76.609423,9.405702],[76.609322,9.405869],[76.609192,9.405513],[76.609135,9.405333],[76.60908,9.405198],[76.608974,9.405012],[76.608878,9.404915],[76.608671,9.404806],[76.608506,9.404748],[76.60838,9.404633],[76.608226,9.404494],[76.608128,9.404398],[76.607872,9.404172],[76.607792,9.404102],[76.6077,9.404013],[76.607613,9.40393],[76.607463,9.40379],[76.607375,9.403649],[76.607316,9.403496],[76.607214,9.403179],[76.607166,9.402867],[76.607155,9.40274],[76.607036,9.402745],[76.606738,9.402822],[76.606639,9.402827],[76.606468,9.402837],[76.606057,9.402861],[76.605771,9.402855],[76.605624,9.402856],[76.605502,9.402857],[76.605349,9.402875],[76.605211,9.40248],[76.605301,9.402387],[76.605314,9.402219],[76.605279,9.401989],[76.605255,9.401833],[76.605231,9.401693],[76.605134,9.401313],[76.605099,9.401171],[76.605117,9.401019],[76.605075,9.400788],[76.605042,9.400651],[76.605017,9.400516],[76.60499,9.400346],[76.605011,9.400145],[76.605022,9.39993],[76.604999,9.399788],[76.604909,9.39957],[76.60487,9.399461],[76.604853,9.399362],[76.60485,9.399239],[76.604664,9.399221],[76.604468,9.399272],[76.60434,9.399305],[76.604194,9.399353],[76.604015,9.399398],[76.604009,9.399208],[76.604083,9.399041],[76.604133,9.398904],[76.604175,9.398784],[76.604233,9.398645],[76.604275,9.398558],[76.604364,9.398405],[76.604439,9.398285],[76.604528,9.398152],[76.604601,9.398024],[76.604678,9.397882],[76.604723,9.397788],[76.604763,9.397704],[76.604818,9.397368],[76.604808,9.397226],[76.604772,9.397016],[76.604982,9.396897],[76.605046,9.396829],[76.605209,9.396698],[76.605361,9.396596],[76.605617,9.396504],[76.605803,9.396497],[76.605916,9.396566],[76.606051,9.396654],[76.606149,9.396653],[76.606256,9.396642],[76.606366,9.39663],[76.606595,9.396607],[76.60674,9.396601],[76.606965,9.396604],[76.607073,9.396609],[76.607182,9.396614],[76.607296,9.396633],[76.607388,9.396617],[76.607536,9.396556],[76.60765,9.396455],[76.607696,9.396285],[76.607708,9.396163]]]},\"properties\":{\"Created_Da\":\"2024-10-15T12:38:19.208Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9496808134\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"POLACHIRA\",\"Ward_No\":\"12\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.597765,9.395674],[76.597738,9.394996],[76.597672,9.394441],[76.59763,9.394329],[76.597517,9.393959],[76.597485,9.393545],[76.597435,9.393441],[76.597404,9.393125],[76.597384,9.392926],[76.597376,9.392747],[76.597385,9.392612],[76.59741,9.392256],[76.597466,9.391949],[76.597383,9.391806],[76.59723,9.391541],[76.597156,9.391445],[76.597006,9.391251],[76.597208,9.391061],[76.59746,9.390822],[76.597523,9.390741],[76.597932,9.390393],[76.598341,9.390067],[76.59852,9.389924],[76.598708,9.389739],[76.598951,9.389588],[76.599167,9.389345],[76.599601,9.389014],[76.59984,9.388831],[76.600384,9.388534],[76.600406,9.388329],[76.600424,9.388174],[76.600625,9.387824],[76.60066,9.387703],[76.600742,9.387406],[76.600831,9.387083],[76.600865,9.386959],[76.600969,9.386656],[76.601063,9.386382],[76.601084,9.386282],[76.601127,9.386069],[76.601145,9.385977],[76.601102,9.385894],[76.601039,9.385771],[76.600981,9.385659],[76.601066,9.38555],[76.601155,9.385433],[76.601274,9.385277],[76.601385,9.385027],[76.60155,9.384815],[76.601675,9.384672],[76.601747,9.384581],[76.601808,9.384502],[76.601937,9.38431],[76.60215,9.384161],[76.602289,9.384134],[76.602441,9.384009],[76.602728,9.383774],[76.602801,9.383926],[76.602955,9.384241],[76.603107,9.384556],[76.603815,9.3847],[76.604467,9.384645],[76.605353,9.384187],[76.605532,9.384095],[76.605769,9.384449],[76.605889,9.384604],[76.606011,9.384789],[76.606111,9.385035],[76.606184,9.385195],[76.606242,9.385466],[76.606287,9.385607],[76.606302,9.385699],[76.606353,9.385912],[76.606548,9.386044],[76.606594,9.386136],[76.606616,9.386271],[76.606635,9.386503],[76.606644,9.386654],[76.606654,9.386806],[76.60666,9.386898],[76.60667,9.387147],[76.606677,9.387289],[76.606684,9.387433],[76.60669,9.387558],[76.606715,9.387667],[76.606766,9.387851],[76.606829,9.388081],[76.606937,9.388428],[76.606958,9.388563],[76.606976,9.38868],[76.606972,9.388885],[76.606984,9.38908],[76.606994,9.389407],[76.607002,9.389612],[76.607088,9.389875],[76.60721,9.390073],[76.607264,9.390203],[76.607289,9.390318],[76.607322,9.390499],[76.607313,9.390647],[76.607299,9.390765],[76.607286,9.390908],[76.607272,9.391066],[76.607256,9.39118],[76.60724,9.391295],[76.607206,9.391661],[76.607193,9.391869],[76.607174,9.392041],[76.60716,9.39219],[76.607152,9.392406],[76.607134,9.392583],[76.607125,9.392718],[76.607121,9.392898],[76.607151,9.393021],[76.607185,9.393213],[76.607208,9.393355],[76.607328,9.393893],[76.607388,9.394133],[76.607427,9.394267],[76.607481,9.394416],[76.60752,9.394537],[76.607556,9.394622],[76.607605,9.394732],[76.607652,9.394863],[76.607678,9.394998],[76.607722,9.395228],[76.607711,9.395536],[76.607721,9.395784],[76.607719,9.395886],[76.607721,9.396002],[76.607708,9.396163],[76.607696,9.396285],[76.60765,9.396455],[76.607536,9.396556],[76.607388,9.396617],[76.607296,9.396633],[76.607182,9.396614],[76.607073,9.396609],[76.606965,9.396604],[76.60674,9.396601],[76.606595,9.396607],[76.606366,9.39663],[76.606256,9.396642],[76.606149,9.396653],[76.606051,9.396654],[76.605916,9.396566],[76.605803,9.396497],[76.605617,9.396504],[76.605361,9.396596],[76.605209,9.396698],[76.605046,9.396829],[76.604982,9.396897],[76.604772,9.397016],[76.604808,9.397226],[76.604818,9.397368],[76.604763,9.397704],[76.604723,9.397788],[76.604678,9.397882],[76.604601,9.398024],[76.604528,9.398152],[76.604439,9.398285],[76.604364,9.398405],[76.604275,9.398558],[76.604233,9.398645],[76.604175,9.398784],[76.604133,9.398904],[76.604083,9.399041],[76.604009,9.399208],[76.604015,9.399398],[76.603804,9.39948],[76.603628,9.399459],[76.603488,9.399421],[76.603363,9.3994],[76.603218,9.399376],[76.603103,9.399365],[76.602966,9.39936],[76.60255,9.399365],[76.60244,9.399382],[76.602353,9.399602],[76.602392,9.399748],[76.602403,9.399848],[76.602403,9.399951],[76.602395,9.400061],[76.602383,9.400184],[76.602361,9.400323],[76.602329,9.400483],[76.602298,9.400586],[76.602268,9.400715],[76.602241,9.400839],[76.60221,9.400974],[76.601915,9.400969],[76.601726,9.400988],[76.601563,9.400991],[76.601332,9.400967],[76.601201,9.400914],[76.60103,9.400923],[76.600866,9.400963],[76.600692,9.400918],[76.600469,9.400796],[76.600308,9.400797],[76.60021,9.400784],[76.599907,9.400771],[76.599796,9.400767],[76.599659,9.400752],[76.599479,9.400759],[76.599302,9.40078],[76.599153,9.400797],[76.599058,9.400823],[76.598892,9.400865],[76.598675,9.400907],[76.597164,9.401329],[76.596761,9.401445],[76.596845,9.401321],[76.596973,9.401132],[76.597037,9.401046],[76.597139,9.400904],[76.597318,9.400647],[76.597397,9.400503],[76.597445,9.400408],[76.597563,9.400172],[76.597543,9.399685],[76.597525,9.399529],[76.597494,9.399253],[76.597569,9.39894],[76.597633,9.39867],[76.597648,9.398244],[76.597663,9.397829],[76.597707,9.397532],[76.597743,9.397288],[76.597772,9.397088],[76.597789,9.396975],[76.59781,9.396834],[76.597851,9.396591],[76.597807,9.396465],[76.597834,9.39606],[76.597765,9.395674]]]},\"properties\":{\"Created_Da\":\"2024-10-16T05:59:33.877Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"sam k salam\",\"Ward_Name\":\"PADINJATTUMSSERY\",\"Ward_No\":\"11\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.600576,9.406722],[76.600678,9.406422],[76.600725,9.406166],[76.600737,9.406075],[76.60078,9.405888],[76.600809,9.405774],[76.600927,9.40566],[76.600987,9.405526],[76.601147,9.405235],[76.601239,9.405147],[76.601534,9.405301],[76.601615,9.405347],[76.601797,9.405454],[76.60206,9.405561],[76.602202,9.405631],[76.60232,9.40568],[76.602404,9.405734],[76.602708,9.405804],[76.60297,9.405804],[76.603077,9.405795],[76.603187,9.40559],[76.603249,9.405483],[76.603324,9.405365],[76.603494,9.40517],[76.603664,9.405106],[76.603786,9.405035],[76.603856,9.404951],[76.604005,9.404813],[76.604035,9.404582],[76.604085,9.404458],[76.603989,9.404353],[76.603931,9.404236],[76.603861,9.404126],[76.603847,9.403926],[76.603852,9.403812],[76.603902,9.403705],[76.604026,9.403693],[76.604148,9.403684],[76.60425,9.403673],[76.604407,9.403664],[76.604561,9.403622],[76.604632,9.403715],[76.604753,9.403834],[76.604811,9.403907],[76.604908,9.404018],[76.605003,9.404098],[76.60514,9.404221],[76.605203,9.40429],[76.605244,9.404377],[76.605303,9.404466],[76.605423,9.404662],[76.605537,9.404868],[76.605606,9.405026],[76.605675,9.405183],[76.605736,9.405418],[76.605757,9.405569],[76.60574,9.405689],[76.605758,9.405797],[76.60576,9.405976],[76.605773,9.406082],[76.605784,9.406179],[76.605796,9.40629],[76.605824,9.406423],[76.605884,9.406524],[76.605957,9.406685],[76.606042,9.406815],[76.606134,9.406963],[76.606226,9.40711],[76.606403,9.40736],[76.606504,9.407553],[76.606594,9.407726],[76.606617,9.40784],[76.606641,9.407955],[76.606653,9.408151],[76.60673,9.408282],[76.606894,9.408143],[76.607061,9.407954],[76.607135,9.407865],[76.607208,9.407775],[76.607364,9.407658],[76.607482,9.407568],[76.607658,9.407436],[76.607797,9.407326],[76.607952,9.40718],[76.608089,9.407042],[76.608207,9.406923],[76.6084,9.406786],[76.608592,9.406641],[76.608756,9.406512],[76.6089,9.406374],[76.609067,9.406202],[76.609322,9.405869],[76.60935,9.406016],[76.609368,9.406196],[76.609384,9.406341],[76.609394,9.406436],[76.609418,9.406703],[76.60944,9.407005],[76.609478,9.407198],[76.609532,9.407372],[76.609618,9.40757],[76.609709,9.407754],[76.609827,9.408003],[76.609915,9.408138],[76.610016,9.409059],[76.610019,9.409186],[76.610023,9.409313],[76.610027,9.40949],[76.610048,9.409772],[76.610064,9.410028],[76.610067,9.41014],[76.610069,9.410252],[76.610073,9.410466],[76.610161,9.410986],[76.610218,9.411152],[76.610252,9.41126],[76.610327,9.411538],[76.610463,9.411767],[76.61071,9.412092],[76.610774,9.412191],[76.61083,9.412377],[76.611059,9.412302],[76.611393,9.412181],[76.611589,9.412136],[76.611798,9.412118],[76.611951,9.412113],[76.612062,9.412109],[76.612262,9.412077],[76.612432,9.412021],[76.612632,9.411921],[76.612784,9.411803],[76.612979,9.411647],[76.61318,9.41149],[76.613369,9.411365],[76.613462,9.411331],[76.61379,9.411268],[76.613941,9.411256],[76.614067,9.411233],[76.614226,9.411191],[76.614736,9.410974],[76.614909,9.410891],[76.615059,9.410804],[76.615157,9.410754],[76.615273,9.4107],[76.61537,9.410598],[76.615464,9.410514],[76.615804,9.410408],[76.615951,9.410358],[76.616134,9.410269],[76.616272,9.410178],[76.616476,9.410065],[76.616635,9.409971],[76.616828,9.409863],[76.617293,9.409647],[76.617617,9.4095],[76.617725,9.409504],[76.617703,9.409613],[76.617697,9.409745],[76.61773,9.409932],[76.617784,9.410055],[76.617828,9.410153],[76.617901,9.410306],[76.617987,9.410502],[76.618064,9.410732],[76.618152,9.410847],[76.618238,9.410958],[76.618373,9.411182],[76.618473,9.411338],[76.618498,9.411457],[76.618435,9.411577],[76.618306,9.411683],[76.618181,9.411813],[76.618131,9.411928],[76.6181,9.412096],[76.618081,9.412191],[76.618088,9.412332],[76.61811,9.412478],[76.618161,9.412636],[76.618214,9.412762],[76.618266,9.412859],[76.618311,9.413022],[76.618281,9.41313],[76.618264,9.41328],[76.618235,9.41344],[76.618214,9.413591],[76.618245,9.41376],[76.618273,9.413921],[76.61829,9.414029],[76.61825,9.41422],[76.61821,9.414362],[76.618147,9.414586],[76.618098,9.414873],[76.617979,9.414851],[76.61786,9.414775],[76.617778,9.414731],[76.617635,9.414692],[76.617523,9.414681],[76.617386,9.414668],[76.617206,9.414674],[76.617036,9.414693],[76.616858,9.414677],[76.616743,9.414659],[76.61661,9.414632],[76.616429,9.414573],[76.616322,9.414538],[76.616165,9.4145],[76.616034,9.414469],[76.615928,9.414587],[76.615776,9.414668],[76.615663,9.4147],[76.615454,9.414647],[76.615234,9.414638],[76.615029,9.414665],[76.614862,9.414708],[76.614718,9.414764],[76.614705,9.414872],[76.614693,9.414966],[76.614687,9.41511],[76.614688,9.415355],[76.614682,9.41549],[76.614691,9.415657],[76.614705,9.415821],[76.614715,9.415934],[76.614728,9.416061],[76.614743,9.416227],[76.614764,9.416378],[76.614754,9.416507],[76.614688,9.416653],[76.614539,9.416708],[76.614394,9.416724],[76.614252,9.41674],[76.614023,9.416636],[76.613827,9.416596],[76.613527,9.416531],[76.613475,9.416844],[76.613454,9.417008],[76.613414,9.41723],[76.613386,9.417334],[76.613365,9.417502],[76.613355,9.41763],[76.613336,9.417816],[76.613308,9.417986],[76.613294,9.418193],[76.613286,9.418311],[76.613272,9.41843],[76.613246,9.41865],[76.613227,9.418836],[76.61324,9.419017],[76.613236,9.419182],[76.613225,9.41935],[76.6132,9.419507],[76.613154,9.419699],[76.613118,9.419873],[76.613052,9.420175],[76.61301,9.42036],[76.612932,9.420664],[76.612888,9.420835],[76.612746,9.420791],[76.612552,9.420731],[76.612115,9.420595],[76.611915,9.420532],[76.611683,9.420452],[76.611588,9.420416],[76.611469,9.420369],[76.611296,9.4203],[76.611202,9.42027],[76.610982,9.420197],[76.610713,9.420093],[76.610616,9.420081],[76.61033,9.420062],[76.610153,9.420037],[76.609858,9.419994],[76.609591,9.419971],[76.609476,9.419927],[76.609609,9.419753],[76.609784,9.419727],[76.609882,9.419556],[76.60993,9.41947],[76.609977,9.419385],[76.61004,9.419006],[76.610091,9.41887],[76.610132,9.41876],[76.610195,9.418693],[76.610229,9.418505],[76.610263,9.418321],[76.610279,9.418165],[76.610321,9.417903],[76.610314,9.417738],[76.610305,9.417534],[76.610297,9.4174],[76.610287,9.417199],[76.610277,9.417007],[76.610331,9.416834],[76.610364,9.416729],[76.610393,9.416622],[76.610556,9.416357],[76.610545,9.416172],[76.610392,9.416031],[76.610347,9.415877],[76.610301,9.415719],[76.610225,9.415455],[76.610182,9.415371],[76.61013,9.415252],[76.610072,9.415118],[76.60995,9.414932],[76.609831,9.41475],[76.609713,9.414513],[76.609564,9.414215],[76.609422,9.413932],[76.609294,9.413888],[76.609205,9.413857],[76.609086,9.413881],[76.608954,9.413731],[76.608792,9.413545],[76.608723,9.413371],[76.608643,9.413169],[76.608468,9.413188],[76.608303,9.413206],[76.60813,9.413224],[76.607969,9.413254],[76.607917,9.413143],[76.607791,9.412877],[76.60776,9.41262],[76.607544,9.412672],[76.607507,9.412558],[76.607452,9.412388],[76.607398,9.41222],[76.607366,9.412121],[76.607316,9.411967],[76.607262,9.411843],[76.607195,9.411732],[76.607081,9.411544],[76.607054,9.411311],[76.607025,9.411062],[76.607125,9.410904],[76.607202,9.410782],[76.607123,9.410597],[76.606969,9.410546],[76.606839,9.410503],[76.606602,9.410473],[76.606508,9.410369],[76.606429,9.410281],[76.606346,9.410187],[76.606321,9.410075],[76.606283,9.409905],[76.606247,9.409813],[76.606199,9.409692],[76.606154,9.409577],[76.606105,9.409495],[76.606046,9.409395],[76.605945,9.409275],[76.60588,9.409197],[76.605846,9.409106],[76.605796,9.408975],[76.605749,9.40888],[76.605606,9.408589],[76.605529,9.408479],[76.605464,9.408385],[76.60536,9.408281],[76.605226,9.408281],[76.605047,9.408266],[76.604862,9.408227],[76.604578,9.408233],[76.604493,9.408102],[76.604364,9.408098],[76.60421,9.408036],[76.603956,9.408007],[76.603736,9.40804],[76.603355,9.408109],[76.603187,9.408155],[76.603051,9.40817],[76.602776,9.408202],[76.602669,9.408199],[76.602537,9.408195],[76.602425,9.408191],[76.602214,9.408196],[76.602015,9.408145],[76.601881,9.408084],[76.601695,9.407999],[76.601339,9.407868],[76.601205,9.407818],[76.60103,9.407753],[76.600945,9.407698],[76.600817,9.407614],[76.600685,9.407527],[76.600496,9.407421],[76.600398,9.40737],[76.600236,9.407259],[76.60044,9.406988],[76.600576,9.406722]]]},\"properties\":{\"Created_Da\":\"2024-10-16T07:59:47.502Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"sam k salam\",\"Ward_Name\":\"ELAVINAL\",\"Ward_No\":\"14\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.618296,9.421108],[76.618169,9.421271],[76.618042,9.421139],[76.617939,9.42099],[76.617902,9.420904],[76.617876,9.420792],[76.61785,9.420682],[76.617835,9.42041],[76.617814,9.420249],[76.617796,9.420132],[76.617752,9.419932],[76.617747,9.419819],[76.617743,9.419725],[76.617739,9.419623],[76.617736,9.419524],[76.617515,9.419553],[76.617371,9.419583],[76.617137,9.41964],[76.616948,9.419685],[76.616843,9.419701],[76.616602,9.419733],[76.616483,9.419751],[76.616389,9.419765],[76.616296,9.419778],[76.616188,9.419832],[76.616127,9.420256],[76.616104,9.420479],[76.615899,9.420525],[76.615795,9.420536],[76.61569,9.420547],[76.615599,9.420557],[76.615508,9.420566],[76.615551,9.420862],[76.615515,9.420945],[76.615473,9.421041],[76.615432,9.421136],[76.615382,9.42125],[76.615269,9.421282],[76.615149,9.421297],[76.615001,9.421323],[76.614838,9.421358],[76.614691,9.421389],[76.614392,9.42153],[76.614293,9.421884],[76.614269,9.421991],[76.614239,9.422126],[76.614214,9.422241],[76.614104,9.422252],[76.614002,9.422256],[76.613819,9.42226],[76.613664,9.422228],[76.613471,9.422203],[76.613253,9.422198],[76.613029,9.422233],[76.612992,9.422048],[76.612956,9.421864],[76.612932,9.421714],[76.612916,9.421609],[76.612893,9.421465],[76.612878,9.421374],[76.612876,9.42122],[76.612872,9.421018],[76.612888,9.420835],[76.612932,9.420664],[76.61301,9.42036],[76.613052,9.420175],[76.613118,9.419873],[76.613154,9.419699],[76.6132,9.419507],[76.613225,9.41935],[76.613236,9.419182],[76.61324,9.419017],[76.613227,9.418836],[76.613246,9.41865],[76.613272,9.41843],[76.613286,9.418311],[76.613294,9.418193],[76.613308,9.417986],[76.613336,9.417816],[76.613355,9.41763],[76.613365,9.417502],[76.613386,9.417334],[76.613414,9.41723],[76.613454,9.417008],[76.613475,9.416844],[76.613527,9.416531],[76.613827,9.416596],[76.614023,9.416636],[76.614252,9.41674],[76.614394,9.416724],[76.614539,9.416708],[76.614688,9.416653],[76.614754,9.416507],[76.614764,9.416378],[76.614743,9.416227],[76.614728,9.416061],[76.614715,9.415934],[76.614705,9.415821],[76.614691,9.415657],[76.614682,9.41549],[76.614688,9.415355],[76.614687,9.41511],[76.614693,9.414966],[76.614705,9.414872],[76.614718,9.414764],[76.614862,9.414708],[76.615029,9.414665],[76.615234,9.414638],[76.615454,9.414647],[76.615663,9.4147],[76.615776,9.414668],[76.615928,9.414587],[76.616034,9.414469],[76.616165,9.4145],[76.616322,9.414538],[76.616429,9.414573],[76.61661,9.414632],[76.616743,9.414659],[76.616858,9.414677],[76.617036,9.414693],[76.617206,9.414674],[76.617386,9.414668],[76.617523,9.414681],[76.617635,9.414692],[76.617778,9.414731],[76.61786,9.414775],[76.617979,9.414851],[76.618098,9.414873],[76.618147,9.414586],[76.61821,9.414362],[76.61825,9.41422],[76.61829,9.414029],[76.618273,9.413921],[76.618245,9.41376],[76.618214,9.413591],[76.618235,9.41344],[76.618264,9.41328],[76.618281,9.41313],[76.618311,9.413022],[76.618266,9.412859],[76.618214,9.412762],[76.618161,9.412636],[76.61811,9.412478],[76.618088,9.412332],[76.618081,9.412191],[76.6181,9.412096],[76.618131,9.411928],[76.618181,9.411813],[76.618306,9.411683],[76.618435,9.411577],[76.618498,9.411457],[76.618473,9.411338],[76.618642,9.411218],[76.618756,9.411123],[76.618857,9.411038],[76.61897,9.410944],[76.619063,9.410866],[76.61917,9.410814],[76.619333,9.410737],[76.619418,9.410694],[76.61953,9.410571],[76.619587,9.410498],[76.619614,9.410389],[76.619711,9.410387],[76.619824,9.410383],[76.619953,9.410375],[76.620128,9.410369],[76.620247,9.410374],[76.620363,9.410452],[76.620359,9.410593],[76.62033,9.410862],[76.620336,9.410964],[76.620357,9.411136],[76.620382,9.41133],[76.620391,9.411446],[76.620418,9.411543],[76.620484,9.411751],[76.620565,9.411892],[76.620719,9.411914],[76.620862,9.411999],[76.621092,9.411988],[76.621202,9.411992],[76.621287,9.412062],[76.621303,9.412168],[76.621351,9.412387],[76.621398,9.412572],[76.621532,9.412561],[76.621713,9.412531],[76.621865,9.412499],[76.622008,9.412484],[76.622114,9.412485],[76.622226,9.412481],[76.622326,9.41249],[76.622429,9.412514],[76.622607,9.412515],[76.62279,9.412425],[76.622937,9.412351],[76.623027,9.412285],[76.623136,9.412205],[76.623227,9.412139],[76.623313,9.412076],[76.623452,9.411976],[76.62353,9.411919],[76.623616,9.411856],[76.62375,9.411745],[76.623862,9.411618],[76.623882,9.411513],[76.624022,9.41162],[76.624129,9.411768],[76.62423,9.411882],[76.624337,9.412003],[76.624422,9.412096],[76.624543,9.412225],[76.624701,9.412351],[76.624802,9.412433],[76.624898,9.412527],[76.625001,9.412628],[76.625114,9.412739],[76.625198,9.412823],[76.625287,9.412956],[76.625358,9.413128],[76.625372,9.413301],[76.625374,9.413501],[76.62539,9.413682],[76.625399,9.413838],[76.625405,9.413977],[76.625461,9.414103],[76.625521,9.41423],[76.625614,9.414381],[76.625721,9.414556],[76.625783,9.414656],[76.62589,9.414824],[76.626027,9.415012],[76.626195,9.41522],[76.626393,9.415412],[76.626545,9.415496],[76.626691,9.415574],[76.626854,9.415643],[76.627003,9.415706],[76.627121,9.415753],[76.627074,9.415894],[76.627001,9.416205],[76.626944,9.416608],[76.626771,9.416597],[76.626606,9.41662],[76.626425,9.416641],[76.626316,9.416678],[76.626093,9.416763],[76.625856,9.416834],[76.625732,9.416866],[76.625607,9.416898],[76.625428,9.416926],[76.625226,9.416982],[76.625028,9.417027],[76.624841,9.417088],[76.624673,9.417141],[76.624536,9.417191],[76.624429,9.41723],[76.624283,9.417308],[76.624129,9.417385],[76.623921,9.417473],[76.623722,9.417499],[76.623585,9.417516],[76.623445,9.417533],[76.623438,9.417637],[76.623418,9.417743],[76.623379,9.417918],[76.623354,9.418167],[76.623345,9.418325],[76.623377,9.418412],[76.623197,9.418544],[76.623017,9.41865],[76.622807,9.418817],[76.622719,9.418889],[76.622591,9.418992],[76.622372,9.419145],[76.622274,9.419161],[76.622064,9.41923],[76.6219,9.41929],[76.621658,9.41938],[76.621438,9.419461],[76.621329,9.419499],[76.621221,9.419537],[76.620852,9.419655],[76.620622,9.419729],[76.620331,9.419822],[76.620204,9.419863],[76.62009,9.419899],[76.619977,9.419917],[76.619793,9.419971],[76.619651,9.420019],[76.619566,9.420056],[76.619449,9.420138],[76.619233,9.420288],[76.619122,9.420367],[76.618958,9.420483],[76.618858,9.420554],[76.618723,9.420672],[76.618628,9.420748],[76.618552,9.420816],[76.618483,9.420883],[76.618408,9.420967],[76.618296,9.421108]]]},\"properties\":{\"Created_Da\":\"2024-10-15T07:38:39.854Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"PUNNILAM\",\"Ward_No\":\"3\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.627121,9.415753],[76.627003,9.415706],[76.626854,9.415643],[76.626691,9.415574],[76.626545,9.415496],[76.626393,9.415412],[76.626195,9.41522],[76.626027,9.415012],[76.62589,9.414824],[76.625783,9.414656],[76.625721,9.414556],[76.625614,9.414381],[76.625521,9.41423],[76.625461,9.414103],[76.625405,9.413977],[76.625399,9.413838],[76.62539,9.413682],[76.625374,9.413501],[76.625372,9.413301],[76.625358,9.413128],[76.625287,9.412956],[76.625198,9.412823],[76.625114,9.412739],[76.625001,9.412628],[76.624898,9.412527],[76.624802,9.412433],[76.624701,9.412351],[76.624543,9.412225],[76.624422,9.412096],[76.624337,9.412003],[76.62423,9.411882],[76.624129,9.411768],[76.624022,9.41162],[76.623882,9.411513],[76.623862,9.411618],[76.62375,9.411745],[76.623616,9.411856],[76.62353,9.411919],[76.623452,9.411976],[76.623313,9.412076],[76.623227,9.412139],[76.623136,9.412205],[76.623027,9.412285],[76.622937,9.412351],[76.62279,9.412425],[76.622607,9.412515],[76.622429,9.412514],[76.622326,9.41249],[76.622226,9.412481],[76.622114,9.412485],[76.622008,9.412484],[76.621865,9.412499],[76.621713,9.412531],[76.621532,9.412561],[76.621398,9.412572],[76.621351,9.412387],[76.621303,9.412168],[76.621287,9.412062],[76.621202,9.411992],[76.621092,9.411988],[76.620862,9.411999],[76.620719,9.411914],[76.620565,9.411892],[76.620484,9.411751],[76.620418,9.411543],[76.620391,9.411446],[76.620382,9.41133],[76.620357,9.411136],[76.620336,9.410964],[76.62033,9.410862],[76.620359,9.410593],[76.620363,9.410452],[76.620247,9.410374],[76.620128,9.410369],[76.619953,9.410375],[76.619824,9.410383],[76.619711,9.410387],[76.619614,9.410389],[76.619587,9.410165],[76.619616,9.410007],[76.619668,9.409861],[76.619742,9.409659],[76.619786,9.409561],[76.620044,9.409412],[76.620365,9.409018],[76.620559,9.408816],[76.620722,9.408628],[76.6208,9.408468],[76.620902,9.408261],[76.62102,9.407996],[76.621075,9.407838],[76.621082,9.407723],[76.621101,9.407597],[76.621186,9.407381],[76.621261,9.407267],[76.6214,9.407096],[76.621499,9.40697],[76.621581,9.406843],[76.621722,9.406548],[76.621763,9.406363],[76.621724,9.406228],[76.621638,9.406168],[76.621558,9.406111],[76.62144,9.406011],[76.621353,9.405923],[76.621239,9.405702],[76.621177,9.405529],[76.62113,9.405431],[76.621081,9.405324],[76.620999,9.405144],[76.620935,9.405009],[76.620851,9.404845],[76.620736,9.404641],[76.620646,9.404511],[76.620536,9.404381],[76.620428,9.404247],[76.620365,9.404181],[76.620262,9.404104],[76.620196,9.404031],[76.620098,9.403936],[76.620016,9.403849],[76.619924,9.403755],[76.619854,9.403687],[76.619727,9.403567],[76.619639,9.403483],[76.619555,9.403403],[76.619443,9.403288],[76.619301,9.403143],[76.619165,9.403026],[76.619035,9.402905],[76.618922,9.402781],[76.61884,9.402692],[76.618754,9.402596],[76.618666,9.402439],[76.618628,9.402347],[76.618567,9.402202],[76.618502,9.402085],[76.618427,9.401951],[76.618332,9.401837],[76.618252,9.401725],[76.618209,9.401638],[76.618111,9.401416],[76.618062,9.401306],[76.61797,9.401139],[76.617833,9.401055],[76.617847,9.400858],[76.617972,9.400803],[76.618132,9.400798],[76.61823,9.400797],[76.618408,9.400794],[76.618516,9.400792],[76.618665,9.40079],[76.618771,9.400794],[76.618904,9.400795],[76.618951,9.400652],[76.61899,9.400557],[76.619031,9.400456],[76.619099,9.400298],[76.619154,9.400194],[76.619214,9.400102],[76.619362,9.399862],[76.619415,9.399724],[76.619447,9.399581],[76.619577,9.399466],[76.619808,9.399448],[76.619913,9.399402],[76.620007,9.399339],[76.620119,9.39926],[76.620239,9.399178],[76.620369,9.399126],[76.620461,9.399048],[76.620564,9.398956],[76.620707,9.398832],[76.620814,9.398711],[76.620889,9.398628],[76.620975,9.398548],[76.621055,9.398453],[76.621179,9.398305],[76.6213,9.398162],[76.62143,9.398017],[76.621544,9.397893],[76.62168,9.397749],[76.621791,9.397642],[76.621913,9.397703],[76.621989,9.397851],[76.622036,9.397941],[76.622213,9.397871],[76.622364,9.397811],[76.622449,9.397778],[76.622598,9.397828],[76.622699,9.397877],[76.622798,9.397923],[76.622887,9.397999],[76.622915,9.398136],[76.622864,9.398334],[76.622838,9.398455],[76.622881,9.398629],[76.622959,9.398706],[76.623129,9.3987],[76.623264,9.39868],[76.623461,9.398649],[76.623508,9.398768],[76.623798,9.398677],[76.6241,9.398582],[76.624196,9.398552],[76.624337,9.398504],[76.62443,9.398467],[76.62456,9.398442],[76.625106,9.398475],[76.625252,9.398517],[76.625336,9.39872],[76.62545,9.398877],[76.625619,9.399041],[76.625776,9.399243],[76.625959,9.399428],[76.626177,9.399567],[76.626288,9.399637],[76.626369,9.399688],[76.626578,9.399514],[76.626694,9.399417],[76.62686,9.399284],[76.626948,9.399209],[76.627074,9.399141],[76.627292,9.399024],[76.627422,9.399012],[76.627545,9.399056],[76.627661,9.399035],[76.627794,9.399009],[76.627976,9.399128],[76.628093,9.399394],[76.628129,9.399546],[76.628113,9.399671],[76.628149,9.399935],[76.628239,9.400052],[76.62836,9.400211],[76.628494,9.400385],[76.62842,9.400549],[76.628337,9.400736],[76.628258,9.400907],[76.628162,9.401119],[76.628113,9.401226],[76.628035,9.401396],[76.627981,9.401658],[76.62796,9.401757],[76.627893,9.402113],[76.627871,9.40223],[76.627859,9.402347],[76.627761,9.402526],[76.627693,9.402728],[76.627652,9.402852],[76.627662,9.403013],[76.627671,9.40315],[76.627688,9.403504],[76.627698,9.40385],[76.62768,9.404092],[76.627671,9.404292],[76.627672,9.404414],[76.627673,9.40455],[76.627717,9.404811],[76.627742,9.404956],[76.627769,9.405098],[76.627791,9.405262],[76.627815,9.405446],[76.627861,9.405788],[76.627918,9.406147],[76.627936,9.406264],[76.627983,9.406619],[76.627982,9.406791],[76.627981,9.406914],[76.628035,9.407179],[76.628074,9.40737],[76.628122,9.407681],[76.628134,9.408015],[76.628112,9.40829],[76.6281,9.408415],[76.628079,9.408582],[76.62804,9.408861],[76.627977,9.409097],[76.627956,9.409205],[76.627931,9.409292],[76.627907,9.409412],[76.627886,9.409512],[76.627965,9.409728],[76.628083,9.409917],[76.628144,9.410073],[76.628205,9.41028],[76.62831,9.410589],[76.628349,9.410762],[76.62843,9.411111],[76.628464,9.411224],[76.628512,9.411448],[76.628573,9.411675],[76.628604,9.411879],[76.628623,9.412132],[76.628635,9.412255],[76.62865,9.412373],[76.628671,9.412547],[76.628697,9.412732],[76.628728,9.412909],[76.628781,9.413087],[76.628831,9.413258],[76.628897,9.413526],[76.628945,9.41376],[76.628981,9.413945],[76.629019,9.414152],[76.629054,9.414344],[76.628949,9.414505],[76.628826,9.414644],[76.628746,9.414734],[76.628549,9.414931],[76.628322,9.415142],[76.628208,9.415273],[76.628165,9.41551],[76.628136,9.415667],[76.628123,9.41589],[76.628059,9.416143],[76.627931,9.416137],[76.627825,9.416132],[76.627609,9.416016],[76.627376,9.415891],[76.627121,9.415753]]]},\"properties\":{\"Created_Da\":\"2024-10-15T10:07:22.531Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"NAZHIPPARA\",\"Ward_No\":\"4\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.612665,9.432261],[76.612219,9.432643],[76.611713,9.432905],[76.611508,9.43301],[76.61137,9.433076],[76.611258,9.433129],[76.611133,9.433187],[76.611045,9.433221],[76.610923,9.433268],[76.610705,9.433334],[76.610474,9.433369],[76.610257,9.433435],[76.610249,9.433205],[76.610247,9.433104],[76.610259,9.432936],[76.610273,9.432805],[76.610277,9.432617],[76.610247,9.432301],[76.610226,9.432178],[76.610189,9.431983],[76.610161,9.431829],[76.610133,9.431664],[76.610115,9.431526],[76.610104,9.431426],[76.6101,9.431312],[76.610097,9.431184],[76.610094,9.431079],[76.610092,9.430941],[76.610103,9.430819],[76.610194,9.430628],[76.610335,9.43047],[76.610453,9.430339],[76.610602,9.430167],[76.610741,9.430025],[76.610916,9.429883],[76.611121,9.429697],[76.611308,9.429634],[76.611426,9.429604],[76.611595,9.429573],[76.611962,9.429502],[76.612144,9.429488],[76.612363,9.429456],[76.612549,9.429423],[76.613185,9.429275],[76.61349,9.429189],[76.613806,9.429107],[76.614077,9.429049],[76.614313,9.428978],[76.614566,9.428869],[76.614709,9.428708],[76.614813,9.428544],[76.615035,9.428192],[76.61513,9.428032],[76.615175,9.427834],[76.61519,9.427651],[76.615205,9.427476],[76.615236,9.427229],[76.615273,9.427049],[76.615318,9.426849],[76.61531,9.426686],[76.615306,9.426435],[76.615234,9.426241],[76.615121,9.426026],[76.61502,9.425834],[76.614961,9.425722],[76.6149,9.425606],[76.614824,9.425469],[76.614738,9.425309],[76.614697,9.4252],[76.614643,9.425047],[76.614587,9.424897],[76.614542,9.424776],[76.614502,9.424667],[76.614458,9.42455],[76.614405,9.424405],[76.61433,9.424168],[76.61426,9.423926],[76.6142,9.423763],[76.614161,9.423671],[76.614058,9.423521],[76.613951,9.423384],[76.613859,9.423283],[76.613752,9.42317],[76.613639,9.423051],[76.613508,9.422909],[76.613408,9.422801],[76.613296,9.422676],[76.613149,9.422471],[76.613076,9.422332],[76.613029,9.422233],[76.613253,9.422198],[76.613471,9.422203],[76.613664,9.422228],[76.613819,9.42226],[76.614002,9.422256],[76.614104,9.422252],[76.614214,9.422241],[76.614239,9.422126],[76.614269,9.421991],[76.614293,9.421884],[76.614392,9.42153],[76.614691,9.421389],[76.614838,9.421358],[76.615001,9.421323],[76.615149,9.421297],[76.615269,9.421282],[76.615382,9.42125],[76.615432,9.421136],[76.615473,9.421041],[76.615515,9.420945],[76.615551,9.420862],[76.615508,9.420566],[76.615599,9.420557],[76.61569,9.420547],[76.615795,9.420536],[76.615899,9.420525],[76.616104,9.420479],[76.616127,9.420256],[76.616188,9.419832],[76.616296,9.419778],[76.616389,9.419765],[76.616483,9.419751],[76.616602,9.419733],[76.616843,9.419701],[76.616948,9.419685],[76.617137,9.41964],[76.617371,9.419583],[76.617515,9.419553],[76.617736,9.419524],[76.617739,9.419623],[76.617743,9.419725],[76.617747,9.419819],[76.617752,9.419932],[76.617796,9.420132],[76.617814,9.420249],[76.617835,9.42041],[76.61785,9.420682],[76.617876,9.420792],[76.617902,9.420904],[76.617939,9.42099],[76.618042,9.421139],[76.618169,9.421271],[76.618296,9.421108],[76.618408,9.420967],[76.618483,9.420883],[76.618552,9.420816],[76.618628,9.420748],[76.618723,9.420672],[76.618858,9.420554],[76.618958,9.420483],[76.619122,9.420367],[76.619233,9.420288],[76.619449,9.420138],[76.619566,9.420056],[76.619651,9.420019],[76.619793,9.419971],[76.619977,9.419917],[76.62009,9.419899],[76.620204,9.419863],[76.620331,9.419822],[76.620622,9.419729],[76.620852,9.419655],[76.621221,9.419537],[76.621329,9.419499],[76.621438,9.419461],[76.621658,9.41938],[76.6219,9.41929],[76.622064,9.41923],[76.622274,9.419161],[76.622372,9.419145],[76.622591,9.418992],[76.622719,9.418889],[76.622807,9.418817],[76.623017,9.41865],[76.623197,9.418544],[76.623377,9.418412],[76.623345,9.418325],[76.623354,9.418167],[76.623379,9.417918],[76.623418,9.417743],[76.623438,9.417637],[76.623445,9.417533],[76.623585,9.417516],[76.623722,9.417499],[76.623921,9.417473],[76.624129,9.417385],[76.624283,9.417308],[76.624429,9.41723],[76.624536,9.417191],[76.624673,9.417141],[76.624841,9.417088],[76.625028,9.417027],[76.625226,9.416982],[76.625428,9.416926],[76.625607,9.416898],[76.625732,9.416866],[76.625856,9.416834],[76.626093,9.416763],[76.626316,9.416678],[76.626425,9.416641],[76.626606,9.41662],[76.626771,9.416597],[76.626944,9.416608],[76.62693,9.416744],[76.6269,9.417042],[76.62689,9.417146],[76.626873,9.417345],[76.626855,9.417548],[76.626838,9.417891],[76.626834,9.417987],[76.626829,9.418121],[76.626823,9.418318],[76.626805,9.418534],[76.626799,9.418631],[76.626778,9.418724],[76.626755,9.418832],[76.626729,9.418934],[76.626677,9.419139],[76.626634,9.419321],[76.626607,9.419437],[76.626546,9.419712],[76.626531,9.419898],[76.626511,9.420163],[76.626512,9.420387],[76.626522,9.420585],[76.626529,9.420702],[76.626537,9.420867],[76.626549,9.420974],[76.626565,9.421127],[76.626587,9.421348],[76.62662,9.421444],[76.626657,9.421556],[76.626704,9.421697],[76.6268,9.421822],[76.626934,9.421967],[76.626914,9.422177],[76.626895,9.422377],[76.626892,9.422505],[76.62689,9.422636],[76.626898,9.422836],[76.626903,9.422959],[76.626878,9.423145],[76.626853,9.423264],[76.626825,9.423402],[76.626819,9.423694],[76.626896,9.424078],[76.626916,9.42435],[76.626914,9.424512],[76.626943,9.424633],[76.626963,9.424728],[76.627005,9.424927],[76.627026,9.42503],[76.627095,9.425363],[76.627112,9.42553],[76.62708,9.425815],[76.627051,9.426081],[76.627187,9.426451],[76.627246,9.42668],[76.627293,9.426862],[76.627317,9.427046],[76.62734,9.427219],[76.627345,9.427567],[76.627371,9.427787],[76.626842,9.427675],[76.626381,9.427378],[76.626273,9.427309],[76.625989,9.427184],[76.625749,9.427078],[76.625527,9.427243],[76.625425,9.4272],[76.62533,9.427159],[76.625349,9.426903],[76.625365,9.42667],[76.62538,9.426457],[76.62523,9.426515],[76.625059,9.426581],[76.624937,9.426624],[76.624781,9.426679],[76.624677,9.426755],[76.624592,9.42681],[76.62444,9.426859],[76.624219,9.42701],[76.624061,9.427117],[76.623823,9.427382],[76.623531,9.427375],[76.62352,9.427475],[76.623272,9.427495],[76.623051,9.427485],[76.622974,9.427545],[76.622878,9.42762],[76.62275,9.427799],[76.622582,9.428033],[76.622463,9.428199],[76.622327,9.42839],[76.62219,9.428591],[76.621996,9.428807],[76.621865,9.428932],[76.621753,9.429039],[76.621389,9.429318],[76.621165,9.429197],[76.620989,9.429044],[76.620901,9.428992],[76.62068,9.428861],[76.620446,9.428723],[76.62006,9.428398],[76.619553,9.428475],[76.619409,9.428498],[76.619181,9.428613],[76.619004,9.428661],[76.618795,9.428718],[76.61869,9.428687],[76.618336,9.428836],[76.618142,9.428883],[76.618035,9.428856],[76.617601,9.428939],[76.617369,9.429088],[76.617198,9.429198],[76.617055,9.429242],[76.616928,9.429305],[76.616836,9.429394],[76.616608,9.429573],[76.616301,9.429814],[76.616179,9.429909],[76.616056,9.430004],[76.61571,9.43027],[76.615448,9.430479],[76.615068,9.430772],[76.614781,9.431008],[76.61466,9.431083],[76.614548,9.431147],[76.614324,9.431237],[76.614081,9.431348],[76.613855,9.431446],[76.613622,9.431497],[76.61324,9.43178],[76.613189,9.431925],[76.612896,9.432139],[76.612665,9.432261]]]},\"properties\":{\"Created_Da\":\"2024-10-15T06:44:37.441Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"MUNDIYAPPALLY\",\"Ward_No\":\"2\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.613249,9.396404],[76.613333,9.396199],[76.613464,9.396143],[76.613652,9.396082],[76.613809,9.396042],[76.613921,9.396015],[76.614083,9.39597],[76.614188,9.39594],[76.614295,9.395912],[76.614433,9.395876],[76.614574,9.395835],[76.614783,9.395773],[76.614929,9.395746],[76.615097,9.395713],[76.615251,9.395675],[76.615466,9.395642],[76.615575,9.395623],[76.615776,9.395586],[76.615945,9.395563],[76.616081,9.395544],[76.616247,9.395511],[76.616415,9.395478],[76.61678,9.395414],[76.616818,9.395566],[76.616854,9.395679],[76.616927,9.39584],[76.617019,9.395965],[76.617082,9.3961],[76.617143,9.396234],[76.617214,9.396371],[76.617285,9.396489],[76.617367,9.396601],[76.617466,9.396679],[76.617516,9.396764],[76.617558,9.396872],[76.617597,9.397031],[76.617607,9.397126],[76.617627,9.397408],[76.617639,9.397552],[76.617628,9.397739],[76.617625,9.397975],[76.617618,9.398099],[76.61759,9.398192],[76.617554,9.398312],[76.617466,9.398445],[76.617352,9.398623],[76.617254,9.398738],[76.617156,9.398855],[76.617109,9.398954],[76.61708,9.399045],[76.617104,9.399135],[76.61717,9.399303],[76.617235,9.399454],[76.617304,9.39957],[76.617414,9.399703],[76.617494,9.399824],[76.617587,9.39997],[76.617637,9.400065],[76.617676,9.400175],[76.617736,9.40036],[76.617763,9.400498],[76.617779,9.400605],[76.617796,9.400709],[76.617847,9.400858],[76.617833,9.401055],[76.617724,9.401093],[76.617612,9.401131],[76.617435,9.401196],[76.61731,9.401255],[76.617094,9.401323],[76.617017,9.401238],[76.616922,9.401134],[76.616848,9.401031],[76.616698,9.401103],[76.616525,9.401183],[76.616385,9.401264],[76.615856,9.401269],[76.615544,9.401199],[76.615377,9.401173],[76.615277,9.401171],[76.615171,9.401204],[76.615065,9.401238],[76.61485,9.40124],[76.614757,9.401243],[76.614228,9.401226],[76.614091,9.401228],[76.613813,9.401313],[76.613611,9.401325],[76.613449,9.401362],[76.613274,9.401396],[76.613222,9.40153],[76.613141,9.401579],[76.613043,9.401604],[76.612938,9.401622],[76.612775,9.401671],[76.612826,9.401821],[76.612907,9.401989],[76.612962,9.40208],[76.613028,9.402158],[76.613125,9.402303],[76.613247,9.402472],[76.613308,9.402541],[76.613385,9.402633],[76.613469,9.402755],[76.613513,9.402851],[76.613566,9.402966],[76.613612,9.403068],[76.613658,9.403177],[76.613682,9.403352],[76.6137,9.403482],[76.613719,9.403655],[76.613766,9.403849],[76.61379,9.403942],[76.613848,9.404149],[76.61392,9.404224],[76.614045,9.404219],[76.614151,9.404257],[76.614278,9.404376],[76.61439,9.404481],[76.614461,9.404557],[76.614299,9.40472],[76.614193,9.404792],[76.614033,9.404837],[76.613866,9.404872],[76.613742,9.404914],[76.613598,9.404986],[76.613425,9.405093],[76.613048,9.40526],[76.612885,9.405385],[76.612625,9.405587],[76.6125,9.40574],[76.612365,9.405839],[76.612268,9.405887],[76.612145,9.406041],[76.61186,9.406403],[76.61175,9.406543],[76.611694,9.406615],[76.611504,9.406892],[76.611389,9.406843],[76.611193,9.406756],[76.611023,9.406715],[76.610904,9.406704],[76.610706,9.406683],[76.610583,9.406673],[76.610452,9.406658],[76.61029,9.406649],[76.610143,9.406653],[76.609998,9.406662],[76.60978,9.406685],[76.609637,9.406699],[76.609515,9.406699],[76.609418,9.406703],[76.609394,9.406436],[76.609384,9.406341],[76.609368,9.406196],[76.60935,9.406016],[76.609322,9.405869],[76.609423,9.405702],[76.609567,9.405454],[76.609603,9.405337],[76.609632,9.405234],[76.609674,9.405045],[76.609692,9.404882],[76.609691,9.404745],[76.609695,9.40464],[76.609714,9.404393],[76.609741,9.404302],[76.609812,9.40416],[76.609873,9.404056],[76.609983,9.403849],[76.610033,9.40374],[76.610078,9.403642],[76.610165,9.40345],[76.610225,9.403283],[76.610272,9.403161],[76.610338,9.402994],[76.610374,9.402902],[76.610435,9.40276],[76.610492,9.402631],[76.610559,9.402484],[76.610635,9.402365],[76.610806,9.402207],[76.610978,9.402069],[76.611067,9.401998],[76.611158,9.40192],[76.61123,9.401839],[76.611317,9.40174],[76.611383,9.401673],[76.611489,9.401547],[76.611566,9.401441],[76.611624,9.401359],[76.611705,9.401243],[76.611776,9.40116],[76.611939,9.400988],[76.612024,9.400898],[76.612147,9.400753],[76.612242,9.400632],[76.612294,9.400518],[76.6123,9.400404],[76.612294,9.400257],[76.612303,9.400004],[76.612304,9.399778],[76.612309,9.399635],[76.612315,9.399514],[76.612337,9.399364],[76.612373,9.39923],[76.612425,9.399069],[76.61248,9.398956],[76.612525,9.398876],[76.612568,9.39879],[76.612582,9.398685],[76.612526,9.398417],[76.612511,9.398319],[76.612521,9.398062],[76.612615,9.397962],[76.612755,9.397926],[76.613002,9.397898],[76.613224,9.397854],[76.61334,9.397733],[76.613339,9.397625],[76.613335,9.397507],[76.613276,9.39733],[76.613254,9.397241],[76.613211,9.39708],[76.613158,9.396898],[76.613123,9.396756],[76.613111,9.396582],[76.613182,9.39651],[76.613249,9.396404]]]},\"properties\":{\"Created_Da\":\"2024-10-15T08:49:38.792Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9496808134\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"MATHIMALA\",\"Ward_No\":\"6\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.612197,9.385484],[76.612533,9.385413],[76.612841,9.385349],[76.612868,9.385622],[76.612866,9.385734],[76.612867,9.385838],[76.612908,9.38629],[76.612926,9.386397],[76.612946,9.386693],[76.61297,9.386835],[76.612977,9.387055],[76.612952,9.387177],[76.612946,9.387347],[76.612945,9.387475],[76.612942,9.387592],[76.613121,9.387627],[76.613257,9.387603],[76.613464,9.387537],[76.613528,9.387471],[76.613719,9.387489],[76.613919,9.387518],[76.614053,9.387591],[76.614157,9.38772],[76.614261,9.387819],[76.614474,9.387942],[76.614575,9.388025],[76.61472,9.388195],[76.614832,9.388262],[76.615018,9.38836],[76.615167,9.388501],[76.615267,9.388665],[76.615419,9.388799],[76.615709,9.388835],[76.615857,9.38885],[76.616014,9.388833],[76.616109,9.38882],[76.616216,9.388766],[76.616294,9.388699],[76.616462,9.388729],[76.616647,9.38879],[76.616906,9.388722],[76.617143,9.388668],[76.617227,9.388708],[76.617329,9.388823],[76.617488,9.389037],[76.61755,9.389127],[76.617732,9.389408],[76.617753,9.389508],[76.617774,9.389689],[76.617774,9.389825],[76.617761,9.389992],[76.617756,9.390154],[76.617761,9.390324],[76.617762,9.390492],[76.617789,9.390668],[76.617798,9.390884],[76.617847,9.391195],[76.617861,9.391286],[76.617922,9.391474],[76.617973,9.391575],[76.618048,9.391712],[76.618104,9.391818],[76.618159,9.391924],[76.618258,9.392137],[76.618312,9.392284],[76.618403,9.392524],[76.618398,9.392665],[76.618329,9.392796],[76.618205,9.39293],[76.618064,9.393024],[76.617894,9.393011],[76.61774,9.393015],[76.617596,9.393017],[76.61745,9.393027],[76.617325,9.39304],[76.617194,9.39303],[76.617029,9.393047],[76.616891,9.393085],[76.6168,9.393114],[76.616697,9.393141],[76.616554,9.393176],[76.616461,9.3932],[76.616348,9.393228],[76.616241,9.393254],[76.61614,9.393284],[76.616018,9.39332],[76.615846,9.393363],[76.615712,9.393396],[76.615552,9.393435],[76.615396,9.393436],[76.615259,9.393434],[76.615092,9.393452],[76.614962,9.393486],[76.614863,9.393499],[76.61474,9.393516],[76.614604,9.393323],[76.61456,9.393154],[76.614517,9.392985],[76.614445,9.392698],[76.614385,9.392464],[76.614316,9.392191],[76.61427,9.392007],[76.614004,9.391914],[76.613644,9.391762],[76.613502,9.391628],[76.613359,9.391495],[76.613009,9.39106],[76.612759,9.391071],[76.612459,9.391085],[76.61231,9.391092],[76.612104,9.391101],[76.611775,9.391141],[76.61155,9.391169],[76.611208,9.391205],[76.611066,9.39121],[76.610851,9.391211],[76.610558,9.391164],[76.610287,9.391113],[76.610128,9.391084],[76.609928,9.391096],[76.609702,9.39111],[76.609297,9.391135],[76.609146,9.391144],[76.609082,9.391347],[76.609057,9.391501],[76.609035,9.391633],[76.609089,9.392126],[76.609154,9.39219],[76.609309,9.392167],[76.60934,9.392538],[76.609343,9.392729],[76.609344,9.392848],[76.609354,9.3931],[76.609377,9.393294],[76.609384,9.393476],[76.609378,9.393683],[76.609205,9.393725],[76.609052,9.393763],[76.608815,9.39381],[76.608489,9.393878],[76.60836,9.393917],[76.608236,9.393955],[76.607936,9.394032],[76.607825,9.394055],[76.607716,9.394078],[76.607388,9.394133],[76.607328,9.393893],[76.607208,9.393355],[76.607185,9.393213],[76.607151,9.393021],[76.607121,9.392898],[76.607125,9.392718],[76.607134,9.392583],[76.607152,9.392406],[76.60716,9.39219],[76.607174,9.392041],[76.607193,9.391869],[76.607206,9.391661],[76.60724,9.391295],[76.607256,9.39118],[76.607272,9.391066],[76.607286,9.390908],[76.607299,9.390765],[76.607313,9.390647],[76.607322,9.390499],[76.607289,9.390318],[76.607264,9.390203],[76.60721,9.390073],[76.607088,9.389875],[76.607002,9.389612],[76.606994,9.389407],[76.606984,9.38908],[76.606972,9.388885],[76.606976,9.38868],[76.606958,9.388563],[76.606937,9.388428],[76.606829,9.388081],[76.606766,9.387851],[76.606715,9.387667],[76.60669,9.387558],[76.606684,9.387433],[76.606677,9.387289],[76.60667,9.387147],[76.60666,9.386898],[76.606654,9.386806],[76.606644,9.386654],[76.606635,9.386503],[76.606616,9.386271],[76.606594,9.386136],[76.606548,9.386044],[76.606353,9.385912],[76.606302,9.385699],[76.606287,9.385607],[76.606242,9.385466],[76.606184,9.385195],[76.606111,9.385035],[76.606011,9.384789],[76.605889,9.384604],[76.605769,9.384449],[76.605532,9.384095],[76.606099,9.383773],[76.606747,9.383271],[76.60725,9.383014],[76.607407,9.382932],[76.607513,9.382895],[76.607651,9.382846],[76.607967,9.382732],[76.608119,9.382665],[76.608296,9.38261],[76.608433,9.38306],[76.608522,9.383192],[76.608594,9.383301],[76.60883,9.383531],[76.608901,9.383609],[76.609027,9.383727],[76.609091,9.383829],[76.609167,9.38391],[76.609259,9.384003],[76.60937,9.384121],[76.609488,9.384225],[76.609575,9.384344],[76.609649,9.384472],[76.6097,9.384559],[76.609723,9.384671],[76.609745,9.384773],[76.609753,9.384868],[76.609785,9.385128],[76.609795,9.385234],[76.609826,9.385462],[76.609893,9.385671],[76.609969,9.385789],[76.610063,9.38594],[76.61015,9.386106],[76.610229,9.386178],[76.610429,9.386098],[76.610542,9.386056],[76.610655,9.386015],[76.611111,9.38585],[76.611223,9.385806],[76.611333,9.385765],[76.611443,9.385723],[76.611781,9.385622],[76.612197,9.385484]]]},\"properties\":{\"Created_Da\":\"2024-10-16T11:35:35.911Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"sam k salam\",\"Ward_Name\":\"MANACKACHIRA\",\"Ward_No\":\"10\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.60944,9.407005],[76.609418,9.406703],[76.609515,9.406699],[76.609637,9.406699],[76.60978,9.406685],[76.609998,9.406662],[76.610143,9.406653],[76.61029,9.406649],[76.610452,9.406658],[76.610583,9.406673],[76.610706,9.406683],[76.610904,9.406704],[76.611023,9.406715],[76.611193,9.406756],[76.611389,9.406843],[76.611504,9.406892],[76.611694,9.406615],[76.61175,9.406543],[76.61186,9.406403],[76.612145,9.406041],[76.612268,9.405887],[76.612365,9.405839],[76.6125,9.40574],[76.612625,9.405587],[76.612885,9.405385],[76.613048,9.40526],[76.613425,9.405093],[76.613598,9.404986],[76.613742,9.404914],[76.613866,9.404872],[76.614033,9.404837],[76.614193,9.404792],[76.614299,9.40472],[76.614461,9.404557],[76.61439,9.404481],[76.614278,9.404376],[76.614151,9.404257],[76.614045,9.404219],[76.61392,9.404224],[76.613848,9.404149],[76.61379,9.403942],[76.613766,9.403849],[76.613719,9.403655],[76.6137,9.403482],[76.613682,9.403352],[76.613658,9.403177],[76.613612,9.403068],[76.613566,9.402966],[76.613513,9.402851],[76.613469,9.402755],[76.613385,9.402633],[76.613308,9.402541],[76.613247,9.402472],[76.613125,9.402303],[76.613028,9.402158],[76.612962,9.40208],[76.612907,9.401989],[76.612826,9.401821],[76.612775,9.401671],[76.612938,9.401622],[76.613043,9.401604],[76.613141,9.401579],[76.613222,9.40153],[76.613274,9.401396],[76.613449,9.401362],[76.613611,9.401325],[76.613813,9.401313],[76.614091,9.401228],[76.614228,9.401226],[76.614757,9.401243],[76.61485,9.40124],[76.615065,9.401238],[76.615171,9.401204],[76.615277,9.401171],[76.615377,9.401173],[76.615544,9.401199],[76.615856,9.401269],[76.616385,9.401264],[76.616525,9.401183],[76.616698,9.401103],[76.616848,9.401031],[76.616922,9.401134],[76.617017,9.401238],[76.617094,9.401323],[76.61731,9.401255],[76.617435,9.401196],[76.617612,9.401131],[76.617724,9.401093],[76.617833,9.401055],[76.61797,9.401139],[76.618062,9.401306],[76.618111,9.401416],[76.618209,9.401638],[76.618252,9.401725],[76.618332,9.401837],[76.618427,9.401951],[76.618502,9.402085],[76.618567,9.402202],[76.618628,9.402347],[76.618666,9.402439],[76.618754,9.402596],[76.61884,9.402692],[76.618922,9.402781],[76.619035,9.402905],[76.619165,9.403026],[76.619301,9.403143],[76.619443,9.403288],[76.619555,9.403403],[76.619639,9.403483],[76.619727,9.403567],[76.619854,9.403687],[76.619924,9.403755],[76.620016,9.403849],[76.620098,9.403936],[76.620196,9.404031],[76.620262,9.404104],[76.620365,9.404181],[76.620428,9.404247],[76.620536,9.404381],[76.620646,9.404511],[76.620736,9.404641],[76.620851,9.404845],[76.620935,9.405009],[76.620999,9.405144],[76.621081,9.405324],[76.62113,9.405431],[76.621177,9.405529],[76.621239,9.405702],[76.621353,9.405923],[76.62144,9.406011],[76.621558,9.406111],[76.621638,9.406168],[76.621724,9.406228],[76.621763,9.406363],[76.621722,9.406548],[76.621581,9.406843],[76.621499,9.40697],[76.6214,9.407096],[76.621261,9.407267],[76.621186,9.407381],[76.621101,9.407597],[76.621082,9.407723],[76.621075,9.407838],[76.62102,9.407996],[76.620902,9.408261],[76.6208,9.408468],[76.620722,9.408628],[76.620559,9.408816],[76.620365,9.409018],[76.620044,9.409412],[76.619786,9.409561],[76.619742,9.409659],[76.619668,9.409861],[76.619616,9.410007],[76.619587,9.410165],[76.619614,9.410389],[76.619587,9.410498],[76.61953,9.410571],[76.619418,9.410694],[76.619333,9.410737],[76.61917,9.410814],[76.619063,9.410866],[76.61897,9.410944],[76.618857,9.411038],[76.618756,9.411123],[76.618642,9.411218],[76.618473,9.411338],[76.618373,9.411182],[76.618238,9.410958],[76.618152,9.410847],[76.618064,9.410732],[76.617987,9.410502],[76.617901,9.410306],[76.617828,9.410153],[76.617784,9.410055],[76.61773,9.409932],[76.617697,9.409745],[76.617703,9.409613],[76.617725,9.409504],[76.617617,9.4095],[76.617293,9.409647],[76.616828,9.409863],[76.616635,9.409971],[76.616476,9.410065],[76.616272,9.410178],[76.616134,9.410269],[76.615951,9.410358],[76.615804,9.410408],[76.615464,9.410514],[76.61537,9.410598],[76.615273,9.4107],[76.615157,9.410754],[76.615059,9.410804],[76.614909,9.410891],[76.614736,9.410974],[76.614226,9.411191],[76.614067,9.411233],[76.613941,9.411256],[76.61379,9.411268],[76.613462,9.411331],[76.613369,9.411365],[76.61318,9.41149],[76.612979,9.411647],[76.612784,9.411803],[76.612632,9.411921],[76.612432,9.412021],[76.612262,9.412077],[76.612062,9.412109],[76.611951,9.412113],[76.611798,9.412118],[76.611589,9.412136],[76.611393,9.412181],[76.611059,9.412302],[76.61083,9.412377],[76.610774,9.412191],[76.61071,9.412092],[76.610463,9.411767],[76.610327,9.411538],[76.610252,9.41126],[76.610218,9.411152],[76.610161,9.410986],[76.610073,9.410466],[76.610069,9.410252],[76.610067,9.41014],[76.610064,9.410028],[76.610048,9.409772],[76.610027,9.40949],[76.610023,9.409313],[76.610019,9.409186],[76.610016,9.409059],[76.609915,9.408138],[76.609827,9.408003],[76.609709,9.407754],[76.609618,9.40757],[76.609532,9.407372],[76.609478,9.407198],[76.60944,9.407005]]]},\"properties\":{\"Created_Da\":\"2024-10-15T09:26:14.798Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9496808134\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"KOTTOOR\",\"Ward_No\":\"5\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.620986,9.38751],[76.621078,9.387469],[76.621229,9.387403],[76.621299,9.387322],[76.621361,9.387241],[76.621429,9.387138],[76.621442,9.387119],[76.621515,9.386983],[76.621588,9.386825],[76.621669,9.386623],[76.621726,9.386385],[76.621766,9.386252],[76.621785,9.386187],[76.621822,9.386061],[76.621836,9.386014],[76.621894,9.385907],[76.621971,9.385822],[76.622104,9.385712],[76.622345,9.385636],[76.622476,9.385637],[76.622643,9.385676],[76.622805,9.385753],[76.622928,9.385844],[76.623057,9.385953],[76.623183,9.386052],[76.623295,9.386157],[76.623398,9.386256],[76.623491,9.386391],[76.623555,9.386563],[76.623622,9.386706],[76.623666,9.386878],[76.623706,9.387147],[76.623773,9.387598],[76.623779,9.387713],[76.623794,9.388016],[76.623797,9.388157],[76.623786,9.388557],[76.623769,9.388972],[76.62376,9.389319],[76.623747,9.389824],[76.623864,9.390163],[76.623733,9.390369],[76.623794,9.391555],[76.623873,9.393421],[76.623711,9.393394],[76.62356,9.393368],[76.623464,9.393346],[76.623371,9.393313],[76.623334,9.393162],[76.623227,9.392924],[76.623184,9.392791],[76.623116,9.392634],[76.622998,9.392506],[76.62292,9.39245],[76.622771,9.392377],[76.622672,9.392357],[76.622569,9.392336],[76.622442,9.3923],[76.622307,9.392261],[76.622162,9.392231],[76.621979,9.392167],[76.621752,9.392092],[76.621617,9.392032],[76.621477,9.391955],[76.62131,9.391918],[76.621158,9.391879],[76.62106,9.391855],[76.620939,9.391787],[76.620997,9.391644],[76.621107,9.391473],[76.621167,9.391386],[76.621355,9.391118],[76.621399,9.390965],[76.621439,9.390756],[76.621506,9.390654],[76.621572,9.390579],[76.621455,9.390338],[76.621401,9.390222],[76.621362,9.390116],[76.621291,9.389898],[76.621276,9.389799],[76.621196,9.38966],[76.621123,9.389522],[76.621113,9.389398],[76.621103,9.389275],[76.621068,9.389187],[76.620984,9.388979],[76.620864,9.388867],[76.620886,9.388634],[76.620896,9.388498],[76.620687,9.38849],[76.620554,9.388486],[76.620389,9.388472],[76.620297,9.388366],[76.620033,9.388277],[76.619922,9.388276],[76.619785,9.388303],[76.619666,9.388324],[76.619465,9.388361],[76.619365,9.388464],[76.619384,9.388555],[76.619248,9.388654],[76.619155,9.388746],[76.619058,9.388825],[76.618955,9.388892],[76.618773,9.38897],[76.618674,9.389004],[76.618578,9.389037],[76.61843,9.389112],[76.618327,9.389169],[76.618245,9.389214],[76.618117,9.389263],[76.618021,9.389298],[76.617877,9.389353],[76.617732,9.389408],[76.61755,9.389127],[76.617488,9.389037],[76.617329,9.388823],[76.617227,9.388708],[76.617143,9.388668],[76.616906,9.388722],[76.616647,9.38879],[76.616462,9.388729],[76.616294,9.388699],[76.616216,9.388766],[76.616109,9.38882],[76.616014,9.388833],[76.615857,9.38885],[76.615709,9.388835],[76.615419,9.388799],[76.615267,9.388665],[76.615167,9.388501],[76.615018,9.38836],[76.614832,9.388262],[76.61472,9.388195],[76.614575,9.388025],[76.614474,9.387942],[76.614261,9.387819],[76.614157,9.38772],[76.614053,9.387591],[76.613919,9.387518],[76.613719,9.387489],[76.613528,9.387471],[76.613464,9.387537],[76.613257,9.387603],[76.613121,9.387627],[76.612942,9.387592],[76.612945,9.387475],[76.612946,9.387347],[76.612952,9.387177],[76.612977,9.387055],[76.61297,9.386835],[76.612946,9.386693],[76.612926,9.386397],[76.612908,9.38629],[76.612867,9.385838],[76.612866,9.385734],[76.612868,9.385622],[76.612841,9.385349],[76.612533,9.385413],[76.612197,9.385484],[76.611781,9.385622],[76.611443,9.385723],[76.611333,9.385765],[76.611223,9.385806],[76.611111,9.38585],[76.610655,9.386015],[76.610542,9.386056],[76.610429,9.386098],[76.610229,9.386178],[76.61015,9.386106],[76.610063,9.38594],[76.609969,9.385789],[76.609893,9.385671],[76.609826,9.385462],[76.609795,9.385234],[76.609785,9.385128],[76.609753,9.384868],[76.609745,9.384773],[76.609723,9.384671],[76.6097,9.384559],[76.609649,9.384472],[76.609575,9.384344],[76.609488,9.384225],[76.60937,9.384121],[76.609259,9.384003],[76.609167,9.38391],[76.609091,9.383829],[76.609027,9.383727],[76.608901,9.383609],[76.60883,9.383531],[76.608594,9.383301],[76.608522,9.383192],[76.608433,9.38306],[76.608296,9.38261],[76.608571,9.382548],[76.608827,9.38249],[76.60901,9.38246],[76.609285,9.382458],[76.610178,9.382454],[76.610691,9.382452],[76.61112,9.382501],[76.611696,9.382507],[76.612434,9.382564],[76.612875,9.382441],[76.61321,9.38241],[76.613544,9.38238],[76.613791,9.382322],[76.614058,9.38226],[76.61416,9.382234],[76.614424,9.382131],[76.614591,9.382065],[76.614788,9.381965],[76.614885,9.381916],[76.615012,9.38186],[76.615182,9.381792],[76.615341,9.381728],[76.6155,9.38168],[76.616015,9.381524],[76.616408,9.381406],[76.616668,9.381402],[76.617549,9.38139],[76.617856,9.381504],[76.618023,9.381638],[76.618256,9.38176],[76.6185,9.381989],[76.618802,9.382471],[76.619056,9.383042],[76.619083,9.383503],[76.619226,9.383896],[76.619252,9.384001],[76.619293,9.384163],[76.619387,9.38456],[76.619442,9.384805],[76.619497,9.38513],[76.619539,9.385417],[76.619586,9.385737],[76.619619,9.386093],[76.619642,9.386347],[76.619616,9.386666],[76.619624,9.386687],[76.619687,9.386863],[76.619758,9.387002],[76.619862,9.387141],[76.619952,9.387243],[76.620003,9.387302],[76.620096,9.387389],[76.620151,9.387437],[76.620188,9.38747],[76.620284,9.387528],[76.62037,9.387557],[76.620573,9.387607],[76.620805,9.38758],[76.620986,9.38751]]]},\"properties\":{\"Created_Da\":\"2024-10-16T11:12:31.927Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"sam k salam\",\"Ward_Name\":\"THOTTABHAGOM\",\"Ward_No\":\"9\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.623733,9.390369],[76.623995,9.390575],[76.624227,9.390757],[76.624552,9.390979],[76.624836,9.391189],[76.626063,9.391887],[76.626222,9.392014],[76.627062,9.39256],[76.627389,9.392937],[76.627836,9.393293],[76.627705,9.393678],[76.627659,9.393813],[76.627565,9.394124],[76.6275,9.394337],[76.62748,9.394434],[76.627382,9.394912],[76.627272,9.395449],[76.627227,9.39567],[76.626567,9.396311],[76.626453,9.396422],[76.626395,9.396572],[76.626363,9.396659],[76.626206,9.396975],[76.626068,9.397253],[76.625982,9.397402],[76.625864,9.397605],[76.62577,9.397776],[76.625654,9.397978],[76.625598,9.398074],[76.625366,9.398371],[76.625252,9.398517],[76.625106,9.398475],[76.62456,9.398442],[76.62443,9.398467],[76.624337,9.398504],[76.624196,9.398552],[76.6241,9.398582],[76.623798,9.398677],[76.623508,9.398768],[76.623461,9.398649],[76.623264,9.39868],[76.623129,9.3987],[76.622959,9.398706],[76.622881,9.398629],[76.622838,9.398455],[76.622864,9.398334],[76.622915,9.398136],[76.622887,9.397999],[76.622798,9.397923],[76.622699,9.397877],[76.622598,9.397828],[76.622449,9.397778],[76.622364,9.397811],[76.622213,9.397871],[76.622036,9.397941],[76.621989,9.397851],[76.621913,9.397703],[76.621791,9.397642],[76.62168,9.397749],[76.621544,9.397893],[76.62143,9.398017],[76.6213,9.398162],[76.621179,9.398305],[76.621055,9.398453],[76.620975,9.398548],[76.620889,9.398628],[76.620814,9.398711],[76.620707,9.398832],[76.620564,9.398956],[76.620461,9.399048],[76.620369,9.399126],[76.620239,9.399178],[76.620119,9.39926],[76.620007,9.399339],[76.619913,9.399402],[76.619808,9.399448],[76.619577,9.399466],[76.619447,9.399581],[76.619415,9.399724],[76.619362,9.399862],[76.619214,9.400102],[76.619154,9.400194],[76.619099,9.400298],[76.619031,9.400456],[76.61899,9.400557],[76.618951,9.400652],[76.618904,9.400795],[76.618771,9.400794],[76.618665,9.40079],[76.618516,9.400792],[76.618408,9.400794],[76.61823,9.400797],[76.618132,9.400798],[76.617972,9.400803],[76.617847,9.400858],[76.617796,9.400709],[76.617779,9.400605],[76.617763,9.400498],[76.617736,9.40036],[76.617676,9.400175],[76.617637,9.400065],[76.617587,9.39997],[76.617494,9.399824],[76.617414,9.399703],[76.617304,9.39957],[76.617235,9.399454],[76.61717,9.399303],[76.617104,9.399135],[76.61708,9.399045],[76.617109,9.398954],[76.617156,9.398855],[76.617254,9.398738],[76.617352,9.398623],[76.617466,9.398445],[76.617554,9.398312],[76.61759,9.398192],[76.617618,9.398099],[76.617625,9.397975],[76.617628,9.397739],[76.617639,9.397552],[76.617795,9.397564],[76.617976,9.397578],[76.618075,9.397581],[76.618168,9.397586],[76.61826,9.397603],[76.61838,9.397615],[76.61849,9.397635],[76.618641,9.397646],[76.618734,9.397659],[76.618863,9.397613],[76.61911,9.397506],[76.619265,9.397439],[76.619347,9.397333],[76.619475,9.397227],[76.619612,9.39714],[76.619781,9.397075],[76.620071,9.397015],[76.620229,9.396971],[76.620286,9.396808],[76.620223,9.39667],[76.620173,9.396556],[76.620123,9.396457],[76.619975,9.396405],[76.619906,9.396256],[76.619807,9.396087],[76.619756,9.395973],[76.619708,9.395871],[76.619681,9.395714],[76.619655,9.395468],[76.619647,9.395364],[76.619654,9.395151],[76.619642,9.395025],[76.619518,9.394844],[76.619468,9.394761],[76.619422,9.394663],[76.619382,9.394472],[76.619337,9.394147],[76.619318,9.393854],[76.619306,9.393692],[76.619284,9.393416],[76.619196,9.393395],[76.619101,9.393407],[76.618989,9.393413],[76.618866,9.393437],[76.618543,9.39353],[76.618402,9.393561],[76.618113,9.393511],[76.61811,9.393356],[76.61813,9.393189],[76.618064,9.393024],[76.618205,9.39293],[76.618329,9.392796],[76.618398,9.392665],[76.618403,9.392524],[76.618312,9.392284],[76.618258,9.392137],[76.618159,9.391924],[76.618104,9.391818],[76.618048,9.391712],[76.617973,9.391575],[76.617922,9.391474],[76.617861,9.391286],[76.617847,9.391195],[76.617798,9.390884],[76.617789,9.390668],[76.617762,9.390492],[76.617761,9.390324],[76.617756,9.390154],[76.617761,9.389992],[76.617774,9.389825],[76.617774,9.389689],[76.617753,9.389508],[76.617732,9.389408],[76.617877,9.389353],[76.618021,9.389298],[76.618117,9.389263],[76.618245,9.389214],[76.618327,9.389169],[76.61843,9.389112],[76.618578,9.389037],[76.618674,9.389004],[76.618773,9.38897],[76.618955,9.388892],[76.619058,9.388825],[76.619155,9.388746],[76.619248,9.388654],[76.619384,9.388555],[76.619365,9.388464],[76.619465,9.388361],[76.619666,9.388324],[76.619785,9.388303],[76.619922,9.388276],[76.620033,9.388277],[76.620297,9.388366],[76.620389,9.388472],[76.620554,9.388486],[76.620687,9.38849],[76.620896,9.388498],[76.620886,9.388634],[76.620864,9.388867],[76.620984,9.388979],[76.621068,9.389187],[76.621103,9.389275],[76.621113,9.389398],[76.621123,9.389522],[76.621196,9.38966],[76.621276,9.389799],[76.621291,9.389898],[76.621362,9.390116],[76.621401,9.390222],[76.621455,9.390338],[76.621572,9.390579],[76.621506,9.390654],[76.621439,9.390756],[76.621399,9.390965],[76.621355,9.391118],[76.621167,9.391386],[76.621107,9.391473],[76.620997,9.391644],[76.620939,9.391787],[76.62106,9.391855],[76.621158,9.391879],[76.62131,9.391918],[76.621477,9.391955],[76.621617,9.392032],[76.621752,9.392092],[76.621979,9.392167],[76.622162,9.392231],[76.622307,9.392261],[76.622442,9.3923],[76.622569,9.392336],[76.622672,9.392357],[76.622771,9.392377],[76.62292,9.39245],[76.622998,9.392506],[76.623116,9.392634],[76.623184,9.392791],[76.623227,9.392924],[76.623334,9.393162],[76.623371,9.393313],[76.623464,9.393346],[76.62356,9.393368],[76.623711,9.393394],[76.623873,9.393421],[76.623794,9.391555],[76.623733,9.390369]]]},\"properties\":{\"Created_Da\":\"2024-10-15T11:28:46.011Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"NJALBHAGOM\",\"Ward_No\":\"8\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.61774,9.393015],[76.617894,9.393011],[76.618064,9.393024],[76.61813,9.393189],[76.61811,9.393356],[76.618113,9.393511],[76.618402,9.393561],[76.618543,9.39353],[76.618866,9.393437],[76.618989,9.393413],[76.619101,9.393407],[76.619196,9.393395],[76.619284,9.393416],[76.619306,9.393692],[76.619318,9.393854],[76.619337,9.394147],[76.619382,9.394472],[76.619422,9.394663],[76.619468,9.394761],[76.619518,9.394844],[76.619642,9.395025],[76.619654,9.395151],[76.619647,9.395364],[76.619655,9.395468],[76.619681,9.395714],[76.619708,9.395871],[76.619756,9.395973],[76.619807,9.396087],[76.619906,9.396256],[76.619975,9.396405],[76.620123,9.396457],[76.620173,9.396556],[76.620223,9.39667],[76.620286,9.396808],[76.620229,9.396971],[76.620071,9.397015],[76.619781,9.397075],[76.619612,9.39714],[76.619475,9.397227],[76.619347,9.397333],[76.619265,9.397439],[76.61911,9.397506],[76.618863,9.397613],[76.618734,9.397659],[76.618641,9.397646],[76.61849,9.397635],[76.61838,9.397615],[76.61826,9.397603],[76.618168,9.397586],[76.618075,9.397581],[76.617976,9.397578],[76.617795,9.397564],[76.617639,9.397552],[76.617627,9.397408],[76.617607,9.397126],[76.617597,9.397031],[76.617558,9.396872],[76.617516,9.396764],[76.617466,9.396679],[76.617367,9.396601],[76.617285,9.396489],[76.617214,9.396371],[76.617143,9.396234],[76.617082,9.3961],[76.617019,9.395965],[76.616927,9.39584],[76.616854,9.395679],[76.616818,9.395566],[76.61678,9.395414],[76.616415,9.395478],[76.616247,9.395511],[76.616081,9.395544],[76.615945,9.395563],[76.615776,9.395586],[76.615575,9.395623],[76.615466,9.395642],[76.615251,9.395675],[76.615097,9.395713],[76.614929,9.395746],[76.614783,9.395773],[76.614574,9.395835],[76.614433,9.395876],[76.614295,9.395912],[76.614188,9.39594],[76.614083,9.39597],[76.613921,9.396015],[76.613809,9.396042],[76.613652,9.396082],[76.613464,9.396143],[76.613333,9.396199],[76.613249,9.396404],[76.613182,9.39651],[76.613111,9.396582],[76.613123,9.396756],[76.613158,9.396898],[76.613211,9.39708],[76.613254,9.397241],[76.613276,9.39733],[76.613335,9.397507],[76.613339,9.397625],[76.61334,9.397733],[76.613224,9.397854],[76.613002,9.397898],[76.612755,9.397926],[76.612615,9.397962],[76.612521,9.398062],[76.612345,9.397968],[76.612295,9.398049],[76.612133,9.398101],[76.611982,9.398122],[76.611829,9.398116],[76.611638,9.398125],[76.611447,9.398148],[76.611309,9.398206],[76.611208,9.398375],[76.611074,9.398363],[76.610948,9.39834],[76.610929,9.398151],[76.610888,9.398013],[76.610879,9.397878],[76.610873,9.397693],[76.610864,9.397509],[76.611137,9.397488],[76.611314,9.397473],[76.611324,9.397203],[76.611316,9.397059],[76.611302,9.396904],[76.611349,9.396784],[76.61157,9.39668],[76.611432,9.396438],[76.611405,9.39632],[76.611404,9.396209],[76.611384,9.396003],[76.611337,9.395896],[76.611179,9.395837],[76.610986,9.395818],[76.610842,9.395801],[76.610684,9.395803],[76.610536,9.395783],[76.610411,9.395781],[76.610177,9.395767],[76.609902,9.395751],[76.609736,9.395734],[76.609638,9.395726],[76.609522,9.395724],[76.609368,9.395724],[76.609199,9.395738],[76.609068,9.395754],[76.608921,9.395784],[76.608819,9.395808],[76.608664,9.395875],[76.608503,9.395899],[76.608364,9.395915],[76.608265,9.395912],[76.608059,9.395893],[76.607937,9.395887],[76.607812,9.395889],[76.607719,9.395886],[76.607721,9.395784],[76.607711,9.395536],[76.607722,9.395228],[76.607678,9.394998],[76.607652,9.394863],[76.607605,9.394732],[76.607556,9.394622],[76.60752,9.394537],[76.607481,9.394416],[76.607427,9.394267],[76.607388,9.394133],[76.607716,9.394078],[76.607825,9.394055],[76.607936,9.394032],[76.608236,9.393955],[76.60836,9.393917],[76.608489,9.393878],[76.608815,9.39381],[76.609052,9.393763],[76.609205,9.393725],[76.609378,9.393683],[76.609384,9.393476],[76.609377,9.393294],[76.609354,9.3931],[76.609344,9.392848],[76.609343,9.392729],[76.60934,9.392538],[76.609309,9.392167],[76.609154,9.39219],[76.609089,9.392126],[76.609035,9.391633],[76.609057,9.391501],[76.609082,9.391347],[76.609146,9.391144],[76.609297,9.391135],[76.609702,9.39111],[76.609928,9.391096],[76.610128,9.391084],[76.610287,9.391113],[76.610558,9.391164],[76.610851,9.391211],[76.611066,9.39121],[76.611208,9.391205],[76.61155,9.391169],[76.611775,9.391141],[76.612104,9.391101],[76.61231,9.391092],[76.612459,9.391085],[76.612759,9.391071],[76.613009,9.39106],[76.613359,9.391495],[76.613502,9.391628],[76.613644,9.391762],[76.614004,9.391914],[76.61427,9.392007],[76.614316,9.392191],[76.614385,9.392464],[76.614445,9.392698],[76.614517,9.392985],[76.61456,9.393154],[76.614604,9.393323],[76.61474,9.393516],[76.614863,9.393499],[76.614962,9.393486],[76.615092,9.393452],[76.615259,9.393434],[76.615396,9.393436],[76.615552,9.393435],[76.615712,9.393396],[76.615846,9.393363],[76.616018,9.39332],[76.61614,9.393284],[76.616241,9.393254],[76.616348,9.393228],[76.616461,9.3932],[76.616554,9.393176],[76.616697,9.393141],[76.6168,9.393114],[76.616891,9.393085],[76.617029,9.393047],[76.617194,9.39303],[76.617325,9.39304],[76.61745,9.393027],[76.617596,9.393017],[76.61774,9.393015]]]},\"properties\":{\"Created_Da\":\"2024-10-15T12:12:18.731Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9496808134\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"KAVIYOOR\",\"Ward_No\":\"7\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.604049,9.427231],[76.60397,9.427161],[76.60378,9.426993],[76.603689,9.426928],[76.603531,9.426815],[76.60339,9.426651],[76.603349,9.426462],[76.603171,9.426343],[76.603269,9.426228],[76.603385,9.426092],[76.603544,9.425905],[76.603665,9.425757],[76.60385,9.42562],[76.604012,9.425633],[76.604104,9.425744],[76.604222,9.425773],[76.604504,9.425839],[76.604593,9.42586],[76.604735,9.425903],[76.604943,9.425923],[76.605055,9.425955],[76.605213,9.426018],[76.605366,9.42608],[76.605572,9.426147],[76.60574,9.42614],[76.605868,9.426135],[76.60596,9.426131],[76.606067,9.426075],[76.606217,9.425998],[76.606371,9.425918],[76.606497,9.425852],[76.606602,9.425798],[76.60686,9.425664],[76.607038,9.425532],[76.607222,9.425502],[76.607515,9.425411],[76.607811,9.425308],[76.607868,9.425202],[76.607953,9.425092],[76.608052,9.424965],[76.608168,9.424871],[76.608331,9.42474],[76.608444,9.424529],[76.608508,9.424409],[76.608621,9.424279],[76.608645,9.424111],[76.608521,9.42378],[76.608446,9.423579],[76.608407,9.423244],[76.608424,9.423147],[76.608473,9.422872],[76.608576,9.422794],[76.608862,9.422843],[76.608977,9.422525],[76.609145,9.422056],[76.609252,9.421487],[76.609294,9.421232],[76.609316,9.421094],[76.609332,9.420999],[76.609368,9.420728],[76.609418,9.420363],[76.609454,9.420091],[76.609476,9.419927],[76.609591,9.419971],[76.609858,9.419994],[76.610153,9.420037],[76.61033,9.420062],[76.610616,9.420081],[76.610713,9.420093],[76.610982,9.420197],[76.611202,9.42027],[76.611296,9.4203],[76.611469,9.420369],[76.611588,9.420416],[76.611683,9.420452],[76.611915,9.420532],[76.612115,9.420595],[76.612552,9.420731],[76.612746,9.420791],[76.612888,9.420835],[76.612872,9.421018],[76.612876,9.42122],[76.612878,9.421374],[76.612893,9.421465],[76.612916,9.421609],[76.612932,9.421714],[76.612956,9.421864],[76.612992,9.422048],[76.613029,9.422233],[76.613076,9.422332],[76.613149,9.422471],[76.613296,9.422676],[76.613408,9.422801],[76.613508,9.422909],[76.613639,9.423051],[76.613752,9.42317],[76.613859,9.423283],[76.613951,9.423384],[76.614058,9.423521],[76.614161,9.423671],[76.6142,9.423763],[76.61426,9.423926],[76.61433,9.424168],[76.614405,9.424405],[76.614458,9.42455],[76.614502,9.424667],[76.614542,9.424776],[76.614587,9.424897],[76.614643,9.425047],[76.614697,9.4252],[76.614738,9.425309],[76.614824,9.425469],[76.6149,9.425606],[76.614961,9.425722],[76.61502,9.425834],[76.615121,9.426026],[76.615234,9.426241],[76.615306,9.426435],[76.61531,9.426686],[76.615318,9.426849],[76.615273,9.427049],[76.615236,9.427229],[76.615205,9.427476],[76.61519,9.427651],[76.615175,9.427834],[76.61513,9.428032],[76.615035,9.428192],[76.614813,9.428544],[76.614709,9.428708],[76.614566,9.428869],[76.614313,9.428978],[76.614077,9.429049],[76.613806,9.429107],[76.61349,9.429189],[76.613185,9.429275],[76.612549,9.429423],[76.612363,9.429456],[76.612144,9.429488],[76.611962,9.429502],[76.611595,9.429573],[76.611426,9.429604],[76.611308,9.429634],[76.611121,9.429697],[76.610916,9.429883],[76.610741,9.430025],[76.610602,9.430167],[76.610453,9.430339],[76.610335,9.43047],[76.610194,9.430628],[76.610103,9.430819],[76.610092,9.430941],[76.610094,9.431079],[76.610097,9.431184],[76.6101,9.431312],[76.610104,9.431426],[76.610115,9.431526],[76.610133,9.431664],[76.610161,9.431829],[76.610189,9.431983],[76.610226,9.432178],[76.610247,9.432301],[76.610277,9.432617],[76.610273,9.432805],[76.610259,9.432936],[76.610247,9.433104],[76.610249,9.433205],[76.610257,9.433435],[76.610094,9.433528],[76.609649,9.433781],[76.609454,9.433891],[76.609084,9.433948],[76.608729,9.434002],[76.608635,9.433895],[76.608422,9.433652],[76.608585,9.433409],[76.608505,9.43333],[76.608396,9.4332],[76.608156,9.432858],[76.607946,9.432789],[76.60773,9.43244],[76.607483,9.432282],[76.60732,9.432027],[76.607255,9.431926],[76.607043,9.43162],[76.606835,9.43132],[76.606805,9.431225],[76.606738,9.431011],[76.606672,9.430764],[76.606563,9.430511],[76.606468,9.430395],[76.606414,9.430259],[76.606281,9.430091],[76.606183,9.429967],[76.606078,9.429834],[76.605967,9.429544],[76.605864,9.429207],[76.605778,9.428961],[76.605678,9.428833],[76.605548,9.428642],[76.605507,9.428506],[76.605356,9.42818],[76.605216,9.428046],[76.605141,9.427963],[76.605009,9.427839],[76.60493,9.427764],[76.604787,9.427699],[76.604684,9.427652],[76.604596,9.427613],[76.604454,9.427548],[76.60432,9.427487],[76.604212,9.427438],[76.604149,9.427358],[76.604049,9.427231]]]},\"properties\":{\"Created_Da\":\"2024-10-15T05:48:24.581Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kaviyoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9020506095\",\"Surveyor\":\"Rajeev R\",\"Ward_Name\":\"AIKKUZHI\",\"Ward_No\":\"1\",\"Mandal\":\"Mallappally\"}}]}");
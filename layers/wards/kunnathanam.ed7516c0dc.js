@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.601333,9.44208],[76.600918,9.442115],[76.60061,9.442813],[76.600571,9.44292],[76.600438,9.44328],[76.600099,9.44404],[76.599906,9.444258],[76.599705,9.444381],[76.599584,9.444457],[76.599464,9.444533],[76.598943,9.444889],[76.598863,9.444956],[76.598503,9.445253],[76.59828,9.445584],[76.598209,9.445292],[76.598033,9.445354],[76.597695,9.445433],[76.597599,9.445409],[76.597457,9.445374],[76.597368,9.445311],[76.597018,9.445248],[76.596852,9.4451],[76.596761,9.444981],[76.596712,9.444811],[76.596692,9.44443],[76.596392,9.444065],[76.596273,9.443605],[76.596175,9.443341],[76.596078,9.443076],[76.596012,9.44279],[76.596011,9.442649],[76.59601,9.442422],[76.596115,9.442059],[76.596199,9.441853],[76.596317,9.441566],[76.596183,9.441525],[76.595989,9.441471],[76.596021,9.441172],[76.596049,9.441029],[76.596092,9.440814],[76.59613,9.44045],[76.596142,9.440219],[76.596126,9.439992],[76.596112,9.439853],[76.5961,9.439726],[76.59608,9.439526],[76.596105,9.439385],[76.596121,9.43929],[76.59615,9.439131],[76.596214,9.438825],[76.596156,9.438713],[76.595901,9.438266],[76.59582,9.438123],[76.595682,9.437939],[76.595641,9.437845],[76.595627,9.437435],[76.59569,9.43672],[76.595902,9.436694],[76.59618,9.436637],[76.596443,9.436575],[76.596637,9.436487],[76.596936,9.436324],[76.597152,9.436264],[76.597258,9.43625],[76.597397,9.436423],[76.597629,9.436713],[76.597861,9.437004],[76.598331,9.437596],[76.598485,9.437615],[76.598568,9.437275],[76.598517,9.43718],[76.598147,9.43641],[76.597853,9.435949],[76.597672,9.435712],[76.598517,9.434802],[76.598193,9.434451],[76.598079,9.434326],[76.598185,9.434217],[76.598316,9.434086],[76.598459,9.433942],[76.598618,9.43378],[76.598776,9.433618],[76.599093,9.43328],[76.599324,9.433033],[76.599433,9.432916],[76.599529,9.432814],[76.600163,9.432768],[76.600426,9.432808],[76.600599,9.43284],[76.600778,9.432921],[76.601033,9.433058],[76.601319,9.433295],[76.601599,9.433554],[76.602046,9.433876],[76.602179,9.433975],[76.6023,9.433946],[76.601897,9.432524],[76.602018,9.432571],[76.602185,9.432636],[76.602308,9.432684],[76.602473,9.432749],[76.602721,9.432845],[76.602808,9.432879],[76.602933,9.432928],[76.603056,9.432976],[76.60318,9.433024],[76.603267,9.433058],[76.60337,9.433098],[76.603606,9.43321],[76.603745,9.433277],[76.60396,9.433379],[76.604179,9.433483],[76.604293,9.433537],[76.604599,9.433724],[76.604877,9.433819],[76.605034,9.433873],[76.605182,9.433903],[76.605481,9.433962],[76.605822,9.43403],[76.605993,9.434064],[76.606329,9.434154],[76.60657,9.434238],[76.606812,9.434322],[76.606915,9.43436],[76.607235,9.434466],[76.607656,9.434592],[76.607938,9.434671],[76.608233,9.434778],[76.60844,9.434863],[76.608756,9.435023],[76.609073,9.435185],[76.608489,9.435369],[76.608233,9.435449],[76.607889,9.435558],[76.607337,9.43575],[76.606969,9.435902],[76.606709,9.436008],[76.606484,9.436109],[76.606321,9.436182],[76.605794,9.436426],[76.60515,9.436705],[76.605005,9.43677],[76.604642,9.436932],[76.604365,9.437056],[76.603875,9.437278],[76.603651,9.437379],[76.603481,9.437456],[76.603059,9.437697],[76.602973,9.437745],[76.602872,9.437854],[76.602753,9.437981],[76.602619,9.438124],[76.602542,9.438207],[76.603471,9.438753],[76.603677,9.43869],[76.603794,9.438661],[76.604214,9.438636],[76.604382,9.438795],[76.604923,9.440949],[76.604771,9.441016],[76.60471,9.441097],[76.604665,9.441376],[76.604537,9.441659],[76.604402,9.44171],[76.604263,9.442102],[76.603272,9.442122],[76.602664,9.442083],[76.602295,9.442151],[76.602118,9.442184],[76.601637,9.442267],[76.601485,9.442174],[76.601333,9.44208]]]},\"properties\":{\"Created_Da\":\"2024-10-21T14:21:25.171Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"Sachin K Biju\",\"Ward_Name\":\"THOTTAPADY\",\"Ward_No\":\"15\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.602753,9.437981],[76.602872,9.437854],[76.602973,9.437745],[76.603059,9.437697],[76.603481,9.437456],[76.603651,9.437379],[76.603875,9.437278],[76.604365,9.437056],[76.604642,9.436932],[76.605005,9.43677],[76.60515,9.436705],[76.605794,9.436426],[76.606321,9.436182],[76.606484,9.436109],[76.606709,9.436008],[76.606969,9.435902],[76.607337,9.43575],[76.607889,9.435558],[76.608233,9.435449],[76.608489,9.435369],[76.609073,9.435185],[76.609299,9.435125],[76.609455,9.435101],[76.609631,9.435063],[76.60981,9.435028],[76.610169,9.434959],[76.610348,9.434924],[76.610709,9.434855],[76.610888,9.43482],[76.611267,9.435173],[76.611335,9.435246],[76.611448,9.435368],[76.611507,9.43544],[76.611577,9.435583],[76.611694,9.435823],[76.61186,9.436163],[76.611924,9.436413],[76.611988,9.436661],[76.612,9.436818],[76.611943,9.436981],[76.611905,9.437113],[76.611997,9.437229],[76.612088,9.437344],[76.612166,9.437522],[76.612213,9.437629],[76.612406,9.437915],[76.612473,9.43802],[76.612568,9.438141],[76.612944,9.438651],[76.613129,9.439013],[76.613187,9.439132],[76.613639,9.439954],[76.613763,9.440129],[76.613886,9.440305],[76.614116,9.440872],[76.614497,9.441234],[76.614674,9.441623],[76.614905,9.442155],[76.61493,9.442409],[76.614861,9.442548],[76.615395,9.442967],[76.615438,9.443141],[76.615549,9.443625],[76.615267,9.443651],[76.615171,9.443661],[76.614925,9.44369],[76.614735,9.443697],[76.614433,9.443706],[76.614172,9.443749],[76.614004,9.443774],[76.613854,9.443837],[76.613348,9.44409],[76.612909,9.44429],[76.612815,9.444338],[76.612499,9.444504],[76.6123,9.444609],[76.612159,9.444644],[76.611913,9.444708],[76.611762,9.444748],[76.611593,9.444794],[76.611406,9.44483],[76.611214,9.444788],[76.610991,9.444722],[76.610874,9.444663],[76.610398,9.444461],[76.610127,9.444376],[76.61001,9.444348],[76.609921,9.444325],[76.609823,9.444303],[76.609562,9.444274],[76.60945,9.444277],[76.609341,9.444279],[76.609234,9.444281],[76.609076,9.444295],[76.608935,9.444312],[76.60862,9.444052],[76.608497,9.443999],[76.608373,9.44401],[76.608148,9.444045],[76.607862,9.444063],[76.607505,9.444167],[76.607229,9.444318],[76.607037,9.444401],[76.606793,9.444506],[76.606578,9.444588],[76.606271,9.444729],[76.606213,9.444093],[76.605972,9.44317],[76.605895,9.442996],[76.60573,9.442627],[76.605648,9.442443],[76.605094,9.442117],[76.604795,9.442138],[76.60455,9.442105],[76.604263,9.442102],[76.604402,9.44171],[76.604537,9.441659],[76.604665,9.441376],[76.60471,9.441097],[76.604771,9.441016],[76.604923,9.440949],[76.604382,9.438795],[76.604214,9.438636],[76.603794,9.438661],[76.603677,9.43869],[76.603471,9.438753],[76.602542,9.438207],[76.602619,9.438124],[76.602753,9.437981]]]},\"properties\":{\"Created_Da\":\"2024-10-23T08:20:46.497Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8606286224\",\"Remarks\":\"KUNNAMTHANAM\",\"Surveyor\":\"Abhijith\",\"Ward_Name\":\"KUNNAMTHANAM\",\"Ward_No\":\"10\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.622922,9.462039],[76.622543,9.461975],[76.62184,9.461821],[76.621874,9.46171],[76.621984,9.461356],[76.622045,9.461161],[76.622223,9.460733],[76.622268,9.460599],[76.622333,9.460374],[76.622375,9.46015],[76.622429,9.45975],[76.622472,9.459427],[76.622382,9.459391],[76.622272,9.459362],[76.622159,9.459307],[76.621982,9.459258],[76.621847,9.459232],[76.62174,9.459204],[76.621596,9.459184],[76.62129,9.459121],[76.621049,9.459106],[76.620918,9.459096],[76.620718,9.459078],[76.620578,9.459055],[76.620428,9.459016],[76.620321,9.458949],[76.620213,9.458882],[76.620082,9.4588],[76.620002,9.458735],[76.619885,9.458614],[76.619811,9.458547],[76.619714,9.458458],[76.619552,9.458329],[76.619445,9.458245],[76.619362,9.458175],[76.619278,9.458105],[76.619191,9.458027],[76.619065,9.457912],[76.618978,9.457774],[76.619128,9.457667],[76.619301,9.45758],[76.619505,9.457527],[76.619601,9.457504],[76.619966,9.457364],[76.620215,9.457268],[76.620298,9.457226],[76.620589,9.457034],[76.620908,9.456825],[76.621081,9.45687],[76.621138,9.456991],[76.621184,9.45709],[76.621237,9.457219],[76.621372,9.457408],[76.62151,9.45755],[76.621643,9.457686],[76.621756,9.457769],[76.621833,9.457856],[76.621924,9.457972],[76.62203,9.458113],[76.622187,9.458298],[76.622346,9.458527],[76.622405,9.458628],[76.622583,9.45862],[76.622789,9.458598],[76.622994,9.458596],[76.623187,9.458627],[76.623328,9.458656],[76.623658,9.458739],[76.623748,9.458758],[76.623938,9.458808],[76.624115,9.458905],[76.624298,9.459003],[76.624475,9.459046],[76.624682,9.459103],[76.624909,9.459156],[76.625181,9.459183],[76.625457,9.459278],[76.625483,9.459413],[76.625475,9.4596],[76.625442,9.459829],[76.625422,9.460085],[76.625433,9.46026],[76.62546,9.460397],[76.625535,9.460593],[76.625696,9.460689],[76.625852,9.460703],[76.626008,9.460716],[76.626145,9.460707],[76.626339,9.460689],[76.626433,9.460656],[76.626518,9.46062],[76.6266,9.460576],[76.626691,9.460524],[76.626886,9.460421],[76.627021,9.460352],[76.6273,9.460184],[76.627394,9.460118],[76.627546,9.459994],[76.627683,9.459884],[76.627796,9.459792],[76.627869,9.459732],[76.628027,9.459635],[76.628161,9.459631],[76.628356,9.459663],[76.628469,9.459617],[76.628664,9.459504],[76.628758,9.45945],[76.628854,9.45942],[76.629006,9.459373],[76.62932,9.459259],[76.629512,9.459208],[76.629673,9.459167],[76.629902,9.45904],[76.630024,9.458984],[76.630194,9.458946],[76.6303,9.458932],[76.630444,9.458908],[76.630602,9.458883],[76.630786,9.458865],[76.630929,9.458871],[76.631067,9.458911],[76.631209,9.459053],[76.631256,9.459136],[76.631353,9.459303],[76.631492,9.459515],[76.631575,9.45967],[76.631786,9.459891],[76.631875,9.459975],[76.631988,9.460076],[76.632101,9.460152],[76.632458,9.460267],[76.632557,9.460295],[76.632655,9.460322],[76.63283,9.460397],[76.632942,9.460453],[76.633071,9.460488],[76.633327,9.460507],[76.633568,9.459811],[76.633744,9.459758],[76.633848,9.459731],[76.634065,9.459684],[76.634259,9.459641],[76.634434,9.45962],[76.634599,9.459667],[76.6347,9.459775],[76.634891,9.460063],[76.634949,9.460147],[76.635077,9.460329],[76.635191,9.460496],[76.635241,9.460573],[76.635306,9.460688],[76.635341,9.460837],[76.635321,9.460976],[76.635256,9.461294],[76.635142,9.461719],[76.634953,9.461813],[76.63482,9.461963],[76.634833,9.462116],[76.634847,9.462271],[76.635031,9.462475],[76.635144,9.46258],[76.635249,9.462709],[76.635373,9.462788],[76.635472,9.462827],[76.635674,9.462907],[76.635735,9.463016],[76.6358,9.46311],[76.635662,9.463344],[76.635549,9.463516],[76.635419,9.463835],[76.635326,9.46404],[76.635311,9.464069],[76.635296,9.464192],[76.635223,9.464369],[76.635173,9.464607],[76.635158,9.464941],[76.635049,9.465041],[76.634933,9.465065],[76.634841,9.465213],[76.634787,9.465226],[76.634551,9.465812],[76.634595,9.465994],[76.634563,9.466136],[76.634609,9.466391],[76.634587,9.466555],[76.634542,9.466741],[76.634465,9.467055],[76.634374,9.467391],[76.634182,9.467519],[76.634061,9.467504],[76.633841,9.467553],[76.63377,9.467664],[76.633589,9.467885],[76.63337,9.468104],[76.633238,9.468248],[76.633067,9.468437],[76.633308,9.468473],[76.633342,9.468595],[76.633269,9.468739],[76.633366,9.46912],[76.633203,9.469337],[76.633081,9.469326],[76.632964,9.469509],[76.632881,9.469491],[76.632715,9.469551],[76.632222,9.470496],[76.632102,9.470718],[76.632002,9.470868],[76.631973,9.471071],[76.631658,9.471525],[76.63138,9.47189],[76.63127,9.472026],[76.631193,9.472082],[76.630961,9.472046],[76.630853,9.472112],[76.630617,9.472095],[76.63049,9.472072],[76.630301,9.472096],[76.630143,9.472085],[76.630032,9.472094],[76.629867,9.472054],[76.629125,9.471661],[76.628786,9.471657],[76.62865,9.47162],[76.628521,9.471536],[76.628382,9.471257],[76.628285,9.470997],[76.628142,9.470781],[76.627961,9.470603],[76.627708,9.470382],[76.62728,9.470046],[76.627,9.469828],[76.626608,9.469469],[76.626599,9.469394],[76.626552,9.469427],[76.62639,9.46921],[76.62613,9.468337],[76.626116,9.467759],[76.625979,9.467043],[76.625955,9.466934],[76.625848,9.466263],[76.625791,9.465708],[76.625718,9.46544],[76.625824,9.464138],[76.626095,9.463264],[76.626139,9.462756],[76.626116,9.462416],[76.626191,9.462306],[76.626188,9.461686],[76.626178,9.461564],[76.626137,9.461506],[76.625911,9.461573],[76.625773,9.461501],[76.625629,9.461745],[76.625445,9.461883],[76.625379,9.462007],[76.624882,9.462413],[76.624862,9.462425],[76.624752,9.462434],[76.62468,9.462491],[76.62463,9.462608],[76.624187,9.462841],[76.623978,9.46293],[76.623812,9.463079],[76.623717,9.462996],[76.623542,9.462933],[76.623479,9.462618],[76.622922,9.462039]]]},\"properties\":{\"Created_Da\":\"2024-10-19T07:32:45.855Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"ABHIJITH VR\",\"Ward_Name\":\"KARACKADU\",\"Ward_No\":\"4\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.63101,9.44593],[76.631169,9.446217],[76.631098,9.446537],[76.630702,9.447184],[76.630612,9.44733],[76.630695,9.448377],[76.630968,9.449196],[76.631086,9.449278],[76.63196,9.449497],[76.632169,9.450222],[76.632169,9.450828],[76.632066,9.451201],[76.63211,9.451464],[76.63209,9.451609],[76.631822,9.45199],[76.631482,9.452474],[76.631436,9.452652],[76.63148,9.45279],[76.631695,9.453149],[76.631705,9.453423],[76.63181,9.453749],[76.632173,9.454082],[76.63249,9.454555],[76.632578,9.454774],[76.632734,9.455167],[76.632469,9.455618],[76.632453,9.455866],[76.632444,9.456018],[76.632624,9.456093],[76.633002,9.456142],[76.63331,9.456084],[76.633559,9.455867],[76.633618,9.455757],[76.633881,9.45586],[76.633871,9.456612],[76.633999,9.456832],[76.634513,9.457001],[76.634689,9.457209],[76.634751,9.457283],[76.634678,9.457552],[76.634594,9.457859],[76.634485,9.458251],[76.634358,9.458709],[76.634339,9.45885],[76.634387,9.458937],[76.634468,9.459037],[76.634658,9.45918],[76.634811,9.459339],[76.63493,9.459518],[76.63565,9.459904],[76.635545,9.46044],[76.635487,9.460559],[76.635442,9.460652],[76.635388,9.460752],[76.635341,9.460837],[76.635306,9.460688],[76.635241,9.460573],[76.635191,9.460496],[76.635077,9.460329],[76.634949,9.460147],[76.634891,9.460063],[76.6347,9.459775],[76.634599,9.459667],[76.634434,9.45962],[76.634259,9.459641],[76.634065,9.459684],[76.633848,9.459731],[76.633744,9.459758],[76.633568,9.459811],[76.633327,9.460507],[76.633071,9.460488],[76.632942,9.460453],[76.63283,9.460397],[76.632655,9.460322],[76.632557,9.460295],[76.632458,9.460267],[76.632101,9.460152],[76.631988,9.460076],[76.631875,9.459975],[76.631786,9.459891],[76.631575,9.45967],[76.631492,9.459515],[76.631353,9.459303],[76.631256,9.459136],[76.631209,9.459053],[76.631067,9.458911],[76.630929,9.458871],[76.630786,9.458865],[76.630602,9.458883],[76.630444,9.458908],[76.6303,9.458932],[76.630194,9.458946],[76.630024,9.458984],[76.629902,9.45904],[76.629673,9.459167],[76.629512,9.459208],[76.62932,9.459259],[76.629006,9.459373],[76.628854,9.45942],[76.628758,9.45945],[76.628664,9.459504],[76.628469,9.459617],[76.628356,9.459663],[76.628161,9.459631],[76.628027,9.459635],[76.627869,9.459732],[76.627796,9.459792],[76.627683,9.459884],[76.627546,9.459994],[76.627394,9.460118],[76.6273,9.460184],[76.627021,9.460352],[76.626886,9.460421],[76.626691,9.460524],[76.6266,9.460576],[76.626518,9.46062],[76.626433,9.460656],[76.626339,9.460689],[76.626145,9.460707],[76.626008,9.460716],[76.625852,9.460703],[76.625696,9.460689],[76.625535,9.460593],[76.62546,9.460397],[76.625433,9.46026],[76.625422,9.460085],[76.625442,9.459829],[76.625475,9.4596],[76.625483,9.459413],[76.625457,9.459278],[76.625181,9.459183],[76.624909,9.459156],[76.624682,9.459103],[76.624475,9.459046],[76.624298,9.459003],[76.624115,9.458905],[76.623938,9.458808],[76.623748,9.458758],[76.623658,9.458739],[76.623328,9.458656],[76.623187,9.458627],[76.622994,9.458596],[76.622789,9.458598],[76.622583,9.45862],[76.622405,9.458628],[76.622346,9.458527],[76.622187,9.458298],[76.62203,9.458113],[76.621924,9.457972],[76.621833,9.457856],[76.621756,9.457769],[76.621643,9.457686],[76.62151,9.45755],[76.621372,9.457408],[76.621237,9.457219],[76.621184,9.45709],[76.621138,9.456991],[76.621081,9.45687],[76.620908,9.456825],[76.620889,9.456439],[76.620878,9.456209],[76.621055,9.456173],[76.621222,9.456161],[76.621388,9.456149],[76.62169,9.45611],[76.621874,9.456096],[76.622053,9.456095],[76.622246,9.456093],[76.622476,9.456087],[76.622629,9.456093],[76.622899,9.456036],[76.62302,9.456028],[76.623154,9.45603],[76.623454,9.456026],[76.623584,9.456012],[76.62371,9.455941],[76.62377,9.455872],[76.623878,9.455736],[76.623981,9.455648],[76.624095,9.455579],[76.624221,9.455568],[76.624422,9.455576],[76.624586,9.455622],[76.624799,9.455685],[76.624961,9.455741],[76.625236,9.455862],[76.625497,9.455959],[76.62571,9.456038],[76.625916,9.456091],[76.626119,9.456105],[76.6263,9.456089],[76.626598,9.455971],[76.626735,9.455917],[76.626949,9.455788],[76.627213,9.455605],[76.627474,9.45543],[76.627521,9.455329],[76.627546,9.455144],[76.627572,9.45496],[76.627573,9.454789],[76.62758,9.454438],[76.62759,9.454105],[76.627607,9.453915],[76.627617,9.453656],[76.627628,9.453533],[76.627668,9.453369],[76.627762,9.453165],[76.627976,9.452781],[76.628061,9.452615],[76.628117,9.452433],[76.628174,9.452251],[76.628182,9.451983],[76.62814,9.4517],[76.628125,9.451511],[76.628166,9.451264],[76.628209,9.451143],[76.628317,9.450892],[76.628389,9.450677],[76.628031,9.450599],[76.627672,9.45052],[76.627576,9.450498],[76.627434,9.450304],[76.627573,9.450065],[76.627721,9.449853],[76.627863,9.449556],[76.627882,9.449296],[76.627584,9.449154],[76.627265,9.448947],[76.627039,9.448737],[76.6269,9.448515],[76.626827,9.448283],[76.626838,9.448116],[76.62684,9.44786],[76.626838,9.447754],[76.626826,9.447493],[76.626846,9.447271],[76.626914,9.447129],[76.627132,9.446921],[76.627507,9.446575],[76.627776,9.446336],[76.627918,9.446149],[76.627997,9.446006],[76.62803,9.445883],[76.628228,9.445136],[76.628494,9.445129],[76.628762,9.445213],[76.628955,9.445295],[76.629327,9.445761],[76.629402,9.445893],[76.62948,9.446015],[76.629615,9.446046],[76.63014,9.446165],[76.6303,9.446201],[76.630428,9.446202],[76.630736,9.446046],[76.63101,9.44593]]]},\"properties\":{\"Created_Da\":\"2024-10-19T13:52:10.823Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"ABHIJITH VR\",\"Ward_Name\":\"MUKKOOR\",\"Ward_No\":\"5\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.600627,9.430001],[76.600241,9.429815],[76.600076,9.42971],[76.599962,9.429637],[76.599821,9.429547],[76.599754,9.429428],[76.599864,9.429222],[76.599911,9.429136],[76.600024,9.428924],[76.600075,9.428745],[76.600184,9.42836],[76.600295,9.427968],[76.600255,9.427675],[76.600193,9.427223],[76.600172,9.427068],[76.60015,9.426913],[76.600069,9.426739],[76.599933,9.426451],[76.599884,9.426331],[76.599775,9.426064],[76.599626,9.425697],[76.599551,9.425597],[76.599479,9.425502],[76.599336,9.425312],[76.599162,9.425082],[76.599002,9.424869],[76.598974,9.424721],[76.598934,9.424505],[76.598899,9.424314],[76.598865,9.424133],[76.598836,9.423975],[76.598813,9.423854],[76.598787,9.423716],[76.598735,9.423431],[76.598787,9.423304],[76.59886,9.42312],[76.598806,9.422932],[76.598775,9.422822],[76.598612,9.422139],[76.598586,9.422027],[76.598353,9.421999],[76.597762,9.421927],[76.597673,9.421396],[76.597621,9.421086],[76.597535,9.420576],[76.597429,9.419944],[76.597541,9.419928],[76.597766,9.419893],[76.598077,9.419844],[76.598223,9.419691],[76.598318,9.419592],[76.598507,9.419395],[76.598702,9.419371],[76.598786,9.419323],[76.598958,9.419224],[76.599192,9.419085],[76.599516,9.418893],[76.599643,9.418823],[76.599851,9.418709],[76.600193,9.418521],[76.600316,9.418475],[76.600486,9.418394],[76.600684,9.418299],[76.601002,9.418493],[76.60108,9.41859],[76.601142,9.418667],[76.601208,9.418749],[76.601313,9.418768],[76.601509,9.418804],[76.601564,9.418893],[76.601557,9.419205],[76.601557,9.419356],[76.601548,9.419518],[76.601832,9.419475],[76.602013,9.419448],[76.602195,9.419393],[76.602668,9.419249],[76.602598,9.418894],[76.602547,9.41864],[76.602563,9.418475],[76.602576,9.418343],[76.602637,9.417994],[76.602836,9.418008],[76.603375,9.418044],[76.603635,9.418113],[76.603892,9.418181],[76.604025,9.418354],[76.604014,9.418597],[76.604077,9.418804],[76.604294,9.418819],[76.604492,9.418922],[76.604523,9.41909],[76.604564,9.419327],[76.604564,9.419535],[76.604565,9.419891],[76.604568,9.420187],[76.604567,9.420457],[76.604587,9.420623],[76.604615,9.42091],[76.604625,9.421009],[76.604733,9.421322],[76.604817,9.4215],[76.604872,9.421616],[76.604927,9.421911],[76.604982,9.422207],[76.605006,9.422547],[76.605023,9.422773],[76.605038,9.422988],[76.605059,9.423081],[76.605111,9.423307],[76.605156,9.423507],[76.605181,9.423618],[76.605233,9.423735],[76.605354,9.424011],[76.605377,9.424249],[76.605387,9.424349],[76.605415,9.424639],[76.605595,9.424908],[76.605703,9.424975],[76.605813,9.425043],[76.606032,9.425056],[76.606203,9.425098],[76.606635,9.425203],[76.606722,9.425261],[76.606759,9.42537],[76.606803,9.425497],[76.60686,9.425664],[76.606602,9.425798],[76.606497,9.425852],[76.606371,9.425918],[76.606217,9.425998],[76.606067,9.426075],[76.60596,9.426131],[76.605868,9.426135],[76.60574,9.42614],[76.605572,9.426147],[76.605366,9.42608],[76.605213,9.426018],[76.605055,9.425955],[76.604943,9.425923],[76.604735,9.425903],[76.604593,9.42586],[76.604504,9.425839],[76.604222,9.425773],[76.604104,9.425744],[76.604012,9.425633],[76.60385,9.42562],[76.603665,9.425757],[76.603544,9.425905],[76.603385,9.426092],[76.603269,9.426228],[76.603171,9.426343],[76.603349,9.426462],[76.60339,9.426651],[76.603531,9.426815],[76.603689,9.426928],[76.60378,9.426993],[76.60397,9.427161],[76.604049,9.427231],[76.604149,9.427358],[76.604212,9.427438],[76.60432,9.427487],[76.604454,9.427548],[76.604596,9.427613],[76.604684,9.427652],[76.604787,9.427699],[76.60493,9.427764],[76.60477,9.427922],[76.604675,9.428011],[76.604489,9.428184],[76.604244,9.42846],[76.604096,9.428768],[76.60431,9.428962],[76.60453,9.429163],[76.604632,9.429294],[76.604769,9.42947],[76.605045,9.429853],[76.605225,9.42982],[76.605329,9.429923],[76.605408,9.430081],[76.605469,9.430199],[76.605549,9.430386],[76.605567,9.430544],[76.605578,9.430697],[76.605281,9.430776],[76.605141,9.430774],[76.605035,9.430772],[76.604941,9.430771],[76.604716,9.43078],[76.604616,9.430816],[76.604518,9.430851],[76.604474,9.431016],[76.604449,9.431107],[76.60438,9.43136],[76.604339,9.431529],[76.604329,9.43183],[76.604341,9.431927],[76.604364,9.432116],[76.604393,9.432359],[76.604412,9.43252],[76.604425,9.432623],[76.604441,9.43276],[76.604441,9.433112],[76.604436,9.433404],[76.604293,9.433537],[76.604179,9.433483],[76.60396,9.433379],[76.603745,9.433277],[76.603606,9.43321],[76.60337,9.433098],[76.603267,9.433058],[76.60318,9.433024],[76.603056,9.432976],[76.602933,9.432928],[76.602808,9.432879],[76.602721,9.432845],[76.602473,9.432749],[76.602308,9.432684],[76.602185,9.432636],[76.602018,9.432571],[76.601897,9.432524],[76.601806,9.432489],[76.601714,9.432453],[76.6015,9.431882],[76.601452,9.431755],[76.601405,9.431627],[76.601369,9.431532],[76.601312,9.43138],[76.601231,9.431163],[76.601194,9.431064],[76.601148,9.430941],[76.601105,9.430825],[76.601055,9.430693],[76.601018,9.430595],[76.600985,9.430506],[76.600941,9.430388],[76.60089,9.430252],[76.600834,9.430102],[76.600627,9.430001]]]},\"properties\":{\"Created_Da\":\"2024-10-22T06:36:04.936Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"Abhijith vr\",\"Ward_Name\":\"PALAKUZHY\",\"Ward_No\":\"11\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.604769,9.42947],[76.604632,9.429294],[76.60453,9.429163],[76.60431,9.428962],[76.604096,9.428768],[76.604244,9.42846],[76.604489,9.428184],[76.604675,9.428011],[76.60477,9.427922],[76.60493,9.427764],[76.605009,9.427839],[76.605141,9.427963],[76.605216,9.428046],[76.605356,9.42818],[76.605507,9.428506],[76.605548,9.428642],[76.605678,9.428833],[76.605778,9.428961],[76.605864,9.429207],[76.605967,9.429544],[76.606078,9.429834],[76.606183,9.429967],[76.606281,9.430091],[76.606414,9.430259],[76.606468,9.430395],[76.606563,9.430511],[76.606672,9.430764],[76.606738,9.431011],[76.606805,9.431225],[76.606835,9.43132],[76.607043,9.43162],[76.607255,9.431926],[76.60732,9.432027],[76.607483,9.432282],[76.60773,9.43244],[76.607946,9.432789],[76.608156,9.432858],[76.608404,9.433038],[76.608396,9.4332],[76.608505,9.43333],[76.608585,9.433409],[76.608422,9.433652],[76.608635,9.433895],[76.608729,9.434002],[76.609084,9.433948],[76.609454,9.433891],[76.609649,9.433781],[76.610094,9.433528],[76.610257,9.433435],[76.610474,9.433369],[76.610705,9.433334],[76.610923,9.433268],[76.611045,9.433221],[76.611133,9.433187],[76.611258,9.433129],[76.61137,9.433076],[76.611508,9.43301],[76.611713,9.432905],[76.612219,9.432643],[76.612665,9.432261],[76.612896,9.432139],[76.613189,9.431925],[76.61324,9.43178],[76.613622,9.431497],[76.613855,9.431446],[76.614081,9.431348],[76.614324,9.431237],[76.614548,9.431147],[76.61466,9.431083],[76.614781,9.431008],[76.615068,9.430772],[76.615448,9.430479],[76.61571,9.43027],[76.616056,9.430004],[76.616179,9.429909],[76.616301,9.429814],[76.616608,9.429573],[76.616836,9.429394],[76.616928,9.429305],[76.617055,9.429242],[76.617198,9.429198],[76.617369,9.429088],[76.617601,9.428939],[76.618035,9.428856],[76.618142,9.428883],[76.618336,9.428836],[76.61869,9.428687],[76.618795,9.428718],[76.619004,9.428661],[76.619181,9.428613],[76.619409,9.428498],[76.619553,9.428475],[76.62006,9.428398],[76.620446,9.428723],[76.62068,9.428861],[76.620901,9.428992],[76.620989,9.429044],[76.621165,9.429197],[76.621389,9.429318],[76.621753,9.429039],[76.621865,9.428932],[76.621996,9.428807],[76.62219,9.428591],[76.622327,9.42839],[76.622463,9.428199],[76.622582,9.428033],[76.62275,9.427799],[76.622878,9.42762],[76.622974,9.427545],[76.623051,9.427485],[76.623272,9.427495],[76.62352,9.427475],[76.623531,9.427375],[76.623823,9.427382],[76.624061,9.427117],[76.624219,9.42701],[76.62444,9.426859],[76.624592,9.42681],[76.624677,9.426755],[76.624781,9.426679],[76.624937,9.426624],[76.625059,9.426581],[76.62523,9.426515],[76.62538,9.426457],[76.625365,9.42667],[76.625349,9.426903],[76.62533,9.427159],[76.625425,9.4272],[76.625527,9.427243],[76.625749,9.427078],[76.625989,9.427184],[76.626273,9.427309],[76.626381,9.427378],[76.626842,9.427675],[76.627371,9.427787],[76.627451,9.428083],[76.627522,9.428241],[76.627628,9.428474],[76.627811,9.428762],[76.627883,9.428875],[76.627983,9.429017],[76.628158,9.429327],[76.628405,9.429933],[76.628586,9.430381],[76.628654,9.430548],[76.628688,9.430758],[76.628714,9.430915],[76.628731,9.431036],[76.628739,9.431214],[76.628744,9.43138],[76.628687,9.431616],[76.628632,9.431838],[76.628598,9.431979],[76.628569,9.432096],[76.628527,9.43227],[76.628421,9.432688],[76.628452,9.432872],[76.62863,9.432896],[76.628891,9.432932],[76.628875,9.433025],[76.62883,9.433298],[76.628746,9.433506],[76.628662,9.433715],[76.628525,9.433761],[76.628432,9.433774],[76.628159,9.433785],[76.627824,9.433806],[76.627311,9.433751],[76.627052,9.433723],[76.626704,9.433626],[76.626321,9.433433],[76.625932,9.433152],[76.625544,9.432871],[76.625432,9.432801],[76.62532,9.432732],[76.625223,9.432675],[76.625119,9.432591],[76.624693,9.432188],[76.624488,9.432135],[76.623876,9.431976],[76.62376,9.431967],[76.623358,9.432032],[76.622953,9.432098],[76.622839,9.432119],[76.622724,9.43214],[76.622632,9.432165],[76.622519,9.432237],[76.622274,9.432443],[76.622092,9.432696],[76.621793,9.433124],[76.621056,9.434136],[76.620797,9.434437],[76.620626,9.434612],[76.620436,9.434743],[76.6203,9.434836],[76.620122,9.434905],[76.619942,9.434959],[76.6196,9.435025],[76.619313,9.435117],[76.619163,9.43514],[76.618946,9.435115],[76.6187,9.435086],[76.618242,9.434948],[76.61811,9.434908],[76.617832,9.43485],[76.617424,9.434813],[76.617174,9.434791],[76.617044,9.434794],[76.616915,9.434798],[76.616642,9.434779],[76.616465,9.434765],[76.616264,9.434784],[76.616143,9.434827],[76.616021,9.43487],[76.615884,9.434927],[76.615782,9.434955],[76.615501,9.435004],[76.615154,9.435039],[76.61472,9.435005],[76.614384,9.435055],[76.614111,9.435107],[76.61383,9.435118],[76.61349,9.435086],[76.61305,9.435025],[76.612544,9.434926],[76.612152,9.434857],[76.611691,9.434817],[76.611537,9.434806],[76.611387,9.434795],[76.611137,9.434808],[76.610888,9.43482],[76.610709,9.434855],[76.610348,9.434924],[76.610169,9.434959],[76.60981,9.435028],[76.609631,9.435063],[76.609455,9.435101],[76.609299,9.435125],[76.609073,9.435185],[76.608756,9.435023],[76.60844,9.434863],[76.608233,9.434778],[76.607938,9.434671],[76.607656,9.434592],[76.607235,9.434466],[76.606915,9.43436],[76.606812,9.434322],[76.60657,9.434238],[76.606329,9.434154],[76.605993,9.434064],[76.605822,9.43403],[76.605481,9.433962],[76.605182,9.433903],[76.605034,9.433873],[76.604877,9.433819],[76.604599,9.433724],[76.604293,9.433537],[76.604441,9.433112],[76.604441,9.43276],[76.604425,9.432623],[76.604412,9.43252],[76.604393,9.432359],[76.604364,9.432116],[76.604341,9.431927],[76.604329,9.43183],[76.604339,9.431529],[76.60438,9.43136],[76.604449,9.431107],[76.604474,9.431016],[76.604518,9.430851],[76.604616,9.430816],[76.604716,9.43078],[76.604941,9.430771],[76.605035,9.430772],[76.605141,9.430774],[76.605281,9.430776],[76.605578,9.430697],[76.605567,9.430544],[76.605549,9.430386],[76.605469,9.430199],[76.605408,9.430081],[76.605329,9.429923],[76.605225,9.42982],[76.605045,9.429853],[76.604769,9.42947]]]},\"properties\":{\"Created_Da\":\"2024-10-19T17:25:22.054Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8606286224\",\"Surveyor\":\"ABHIJITH SURESH\",\"Ward_Name\":\"MUNDACKAMON\",\"Ward_No\":\"9\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.608473,9.422872],[76.608424,9.423147],[76.608407,9.423244],[76.608446,9.423579],[76.608521,9.42378],[76.608645,9.424111],[76.608621,9.424279],[76.608508,9.424409],[76.608444,9.424529],[76.608331,9.42474],[76.608168,9.424871],[76.608052,9.424965],[76.607953,9.425092],[76.607868,9.425202],[76.607811,9.425308],[76.607515,9.425411],[76.607222,9.425502],[76.607038,9.425532],[76.60686,9.425664],[76.606803,9.425497],[76.606759,9.42537],[76.606722,9.425261],[76.606635,9.425203],[76.606203,9.425098],[76.606032,9.425056],[76.605813,9.425043],[76.605703,9.424975],[76.605595,9.424908],[76.605415,9.424639],[76.605387,9.424349],[76.605377,9.424249],[76.605354,9.424011],[76.605233,9.423735],[76.605181,9.423618],[76.605156,9.423507],[76.605111,9.423307],[76.605059,9.423081],[76.605038,9.422988],[76.605023,9.422773],[76.605006,9.422547],[76.604982,9.422207],[76.604927,9.421911],[76.604872,9.421616],[76.604817,9.4215],[76.604733,9.421322],[76.604625,9.421009],[76.604615,9.42091],[76.604587,9.420623],[76.604567,9.420457],[76.604568,9.420187],[76.604565,9.419891],[76.604564,9.419535],[76.604564,9.419327],[76.604523,9.41909],[76.604492,9.418922],[76.604294,9.418819],[76.604077,9.418804],[76.604014,9.418597],[76.604025,9.418354],[76.603892,9.418181],[76.603635,9.418113],[76.603375,9.418044],[76.602836,9.418008],[76.602637,9.417994],[76.602576,9.418343],[76.602563,9.418475],[76.602547,9.41864],[76.602598,9.418894],[76.602668,9.419249],[76.602195,9.419393],[76.602013,9.419448],[76.601832,9.419475],[76.601548,9.419518],[76.601557,9.419356],[76.601557,9.419205],[76.601564,9.418893],[76.601509,9.418804],[76.601313,9.418768],[76.601208,9.418749],[76.601142,9.418667],[76.60108,9.41859],[76.601002,9.418493],[76.600684,9.418299],[76.600486,9.418394],[76.600316,9.418475],[76.600193,9.418521],[76.599851,9.418709],[76.599643,9.418823],[76.599516,9.418893],[76.599192,9.419085],[76.598958,9.419224],[76.598786,9.419323],[76.598702,9.419371],[76.598507,9.419395],[76.598556,9.419264],[76.598586,9.419146],[76.598642,9.41881],[76.598817,9.418403],[76.598971,9.418209],[76.599051,9.418109],[76.599226,9.417941],[76.599337,9.417837],[76.599448,9.417734],[76.599596,9.417594],[76.599811,9.417386],[76.599992,9.417229],[76.600111,9.417117],[76.600218,9.417014],[76.600351,9.416837],[76.600542,9.416583],[76.600678,9.416317],[76.600824,9.41598],[76.600965,9.415739],[76.601118,9.415597],[76.601258,9.415444],[76.601439,9.415191],[76.601559,9.414879],[76.601602,9.414725],[76.601802,9.414512],[76.60201,9.414326],[76.602104,9.414168],[76.602169,9.414028],[76.602277,9.413797],[76.602391,9.413518],[76.602464,9.413341],[76.602517,9.413213],[76.60255,9.413115],[76.602608,9.41294],[76.602529,9.412651],[76.602439,9.412445],[76.602395,9.412333],[76.602314,9.412142],[76.602234,9.411951],[76.602165,9.411796],[76.602044,9.411497],[76.601927,9.410943],[76.601902,9.410843],[76.601876,9.410743],[76.601814,9.410521],[76.601721,9.410134],[76.601651,9.40976],[76.601622,9.409607],[76.601557,9.409535],[76.601321,9.409581],[76.601131,9.409626],[76.60098,9.409636],[76.600712,9.409645],[76.60055,9.409648],[76.600411,9.409661],[76.600274,9.409674],[76.599795,9.409759],[76.599709,9.409726],[76.599691,9.409623],[76.599674,9.409519],[76.59963,9.409263],[76.599597,9.409127],[76.599563,9.408991],[76.599492,9.408921],[76.599393,9.408906],[76.599295,9.408891],[76.599068,9.40885],[76.598959,9.408829],[76.598858,9.408814],[76.598573,9.408792],[76.598348,9.408775],[76.598071,9.408794],[76.597694,9.408802],[76.597624,9.408573],[76.597306,9.408481],[76.596347,9.408346],[76.596362,9.408125],[76.596376,9.407928],[76.596419,9.40748],[76.596438,9.407284],[76.596447,9.407188],[76.596456,9.407095],[76.596469,9.406961],[76.596478,9.406869],[76.596487,9.406776],[76.596522,9.40641],[76.596545,9.406169],[76.598047,9.406292],[76.598318,9.406467],[76.598622,9.406634],[76.598867,9.406772],[76.599132,9.406889],[76.599672,9.407088],[76.600027,9.407219],[76.600236,9.407259],[76.600398,9.40737],[76.600496,9.407421],[76.600685,9.407527],[76.600817,9.407614],[76.600945,9.407698],[76.60103,9.407753],[76.601205,9.407818],[76.601339,9.407868],[76.601695,9.407999],[76.601881,9.408084],[76.602015,9.408145],[76.602214,9.408196],[76.602425,9.408191],[76.602537,9.408195],[76.602669,9.408199],[76.602776,9.408202],[76.603051,9.40817],[76.603187,9.408155],[76.603355,9.408109],[76.603736,9.40804],[76.603956,9.408007],[76.60421,9.408036],[76.604364,9.408098],[76.604493,9.408102],[76.604578,9.408233],[76.604862,9.408227],[76.605047,9.408266],[76.605226,9.408281],[76.60536,9.408281],[76.605464,9.408385],[76.605529,9.408479],[76.605606,9.408589],[76.605749,9.40888],[76.605796,9.408975],[76.605846,9.409106],[76.60588,9.409197],[76.605945,9.409275],[76.606046,9.409395],[76.606105,9.409495],[76.606154,9.409577],[76.606199,9.409692],[76.606247,9.409813],[76.606283,9.409905],[76.606321,9.410075],[76.606346,9.410187],[76.606429,9.410281],[76.606508,9.410369],[76.606602,9.410473],[76.606839,9.410503],[76.606969,9.410546],[76.607123,9.410597],[76.607202,9.410782],[76.607125,9.410904],[76.607025,9.411062],[76.607054,9.411311],[76.607081,9.411544],[76.607195,9.411732],[76.607262,9.411843],[76.607316,9.411967],[76.607366,9.412121],[76.607398,9.41222],[76.607452,9.412388],[76.607507,9.412558],[76.607544,9.412672],[76.60776,9.41262],[76.607791,9.412877],[76.607917,9.413143],[76.607969,9.413254],[76.60813,9.413224],[76.608303,9.413206],[76.608468,9.413188],[76.608643,9.413169],[76.608723,9.413371],[76.608792,9.413545],[76.608954,9.413731],[76.609086,9.413881],[76.609205,9.413857],[76.609294,9.413888],[76.609422,9.413932],[76.609564,9.414215],[76.609713,9.414513],[76.609831,9.41475],[76.60995,9.414932],[76.610072,9.415118],[76.61013,9.415252],[76.610182,9.415371],[76.610225,9.415455],[76.610301,9.415719],[76.610347,9.415877],[76.610392,9.416031],[76.610545,9.416172],[76.610556,9.416357],[76.610393,9.416622],[76.610364,9.416729],[76.610331,9.416834],[76.610277,9.417007],[76.610287,9.417199],[76.610297,9.4174],[76.610305,9.417534],[76.610314,9.417738],[76.610321,9.417903],[76.610279,9.418165],[76.610263,9.418321],[76.610229,9.418505],[76.610195,9.418693],[76.610132,9.41876],[76.610091,9.41887],[76.61004,9.419006],[76.609977,9.419385],[76.60993,9.41947],[76.609882,9.419556],[76.609784,9.419727],[76.609591,9.419971],[76.609454,9.420091],[76.609418,9.420363],[76.609368,9.420728],[76.609332,9.420999],[76.609316,9.421094],[76.609294,9.421232],[76.609252,9.421487],[76.609145,9.422056],[76.608977,9.422525],[76.608862,9.422843],[76.608576,9.422794],[76.608473,9.422872]]]},\"properties\":{\"Created_Da\":\"2024-10-19T15:18:31.583Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"Sachin K Biju\",\"Ward_Name\":\"KOLATHU\",\"Ward_No\":\"12\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.611413,9.460724],[76.611299,9.460905],[76.611004,9.46081],[76.610872,9.460729],[76.61059,9.460549],[76.609905,9.460202],[76.609926,9.460022],[76.609565,9.45988],[76.609258,9.45968],[76.609234,9.45935],[76.609129,9.458907],[76.609169,9.458652],[76.609191,9.458499],[76.609234,9.458234],[76.609269,9.458011],[76.609309,9.457786],[76.609355,9.457582],[76.609362,9.457421],[76.609393,9.456979],[76.609413,9.456514],[76.609433,9.456245],[76.609422,9.456007],[76.609489,9.455819],[76.609553,9.455609],[76.609618,9.455429],[76.609644,9.455383],[76.609746,9.455239],[76.609862,9.455056],[76.61002,9.454853],[76.610181,9.454637],[76.610508,9.45439],[76.610656,9.454278],[76.610775,9.454123],[76.610778,9.45405],[76.61062,9.453982],[76.610406,9.453951],[76.609943,9.45403],[76.609813,9.454079],[76.609646,9.45439],[76.609496,9.454332],[76.609279,9.45476],[76.609238,9.455047],[76.609174,9.455338],[76.609073,9.455495],[76.609023,9.45569],[76.608714,9.455963],[76.608654,9.45597],[76.608424,9.456142],[76.608108,9.456248],[76.607772,9.456358],[76.607705,9.456404],[76.60747,9.456469],[76.606821,9.456518],[76.606648,9.456773],[76.606667,9.456906],[76.606305,9.457026],[76.606036,9.457182],[76.605632,9.457509],[76.60557,9.457535],[76.605544,9.457616],[76.605384,9.457615],[76.605193,9.457615],[76.60493,9.457612],[76.604685,9.457603],[76.604413,9.457593],[76.604178,9.457583],[76.604057,9.457587],[76.603807,9.457609],[76.603491,9.457635],[76.603101,9.457648],[76.602789,9.457664],[76.602553,9.457692],[76.602351,9.457744],[76.602123,9.457723],[76.602312,9.457564],[76.602618,9.457301],[76.602644,9.457283],[76.602766,9.457128],[76.602839,9.457043],[76.60292,9.456941],[76.603008,9.456825],[76.603125,9.456687],[76.6032,9.45659],[76.603326,9.456445],[76.603413,9.456287],[76.603608,9.45629],[76.603953,9.456325],[76.604369,9.456257],[76.604914,9.456098],[76.605061,9.456045],[76.605159,9.455954],[76.605241,9.455746],[76.605339,9.455314],[76.605516,9.454809],[76.605859,9.454204],[76.606113,9.453705],[76.606279,9.453188],[76.60635,9.45294],[76.606498,9.452854],[76.606659,9.452758],[76.606788,9.452717],[76.606887,9.452691],[76.607036,9.452685],[76.607403,9.452685],[76.607774,9.452694],[76.607997,9.452696],[76.608212,9.452593],[76.608459,9.452426],[76.608587,9.452224],[76.608626,9.452011],[76.60866,9.451826],[76.608835,9.451346],[76.608995,9.450811],[76.609043,9.450704],[76.60922,9.450314],[76.609527,9.449619],[76.609603,9.449323],[76.609666,9.449218],[76.609776,9.449163],[76.610058,9.449014],[76.610316,9.448863],[76.610813,9.448509],[76.611102,9.448244],[76.611338,9.447904],[76.611446,9.447688],[76.611583,9.447195],[76.611674,9.446773],[76.611766,9.446317],[76.611898,9.446144],[76.611963,9.446059],[76.611975,9.445867],[76.612371,9.445785],[76.612651,9.445781],[76.61266,9.445119],[76.612807,9.445078],[76.61294,9.445041],[76.613231,9.445035],[76.613393,9.445023],[76.613703,9.444771],[76.613984,9.44445],[76.61432,9.444337],[76.614445,9.444316],[76.614728,9.443944],[76.614925,9.44369],[76.615171,9.443661],[76.615267,9.443651],[76.615549,9.443625],[76.61599,9.443584],[76.616267,9.443582],[76.61641,9.44358],[76.61683,9.443571],[76.617081,9.443578],[76.617235,9.443582],[76.617441,9.443599],[76.617534,9.443607],[76.617779,9.44369],[76.617882,9.443717],[76.618035,9.443756],[76.618387,9.443853],[76.618761,9.443951],[76.618879,9.443976],[76.618984,9.444006],[76.619603,9.444178],[76.619819,9.444311],[76.620001,9.444422],[76.620082,9.444469],[76.620451,9.444626],[76.620866,9.444686],[76.62121,9.444717],[76.621643,9.444855],[76.621797,9.444907],[76.62188,9.445085],[76.621906,9.445409],[76.62188,9.445614],[76.621749,9.445973],[76.621614,9.446157],[76.621375,9.446423],[76.621295,9.446523],[76.621173,9.446676],[76.62109,9.446787],[76.620999,9.446909],[76.620922,9.447012],[76.620868,9.447115],[76.620773,9.447297],[76.620751,9.447574],[76.620728,9.447858],[76.620703,9.448172],[76.620691,9.448329],[76.620471,9.44878],[76.620105,9.448683],[76.620001,9.448665],[76.619664,9.448592],[76.619283,9.448557],[76.61908,9.448356],[76.618885,9.448232],[76.618743,9.448103],[76.618639,9.448008],[76.618473,9.447731],[76.618294,9.447454],[76.618198,9.447307],[76.618148,9.44723],[76.618069,9.447157],[76.618022,9.447025],[76.617947,9.446817],[76.617795,9.446616],[76.617663,9.446553],[76.617344,9.446434],[76.616886,9.446263],[76.616767,9.446293],[76.616685,9.446537],[76.616707,9.446739],[76.616717,9.446838],[76.616723,9.44697],[76.616667,9.447145],[76.616511,9.447281],[76.616318,9.447391],[76.616025,9.447508],[76.615922,9.447583],[76.615813,9.447725],[76.615743,9.447929],[76.615694,9.448079],[76.615644,9.448229],[76.615597,9.448383],[76.615537,9.448717],[76.615522,9.448821],[76.615496,9.449018],[76.615462,9.449128],[76.615421,9.449267],[76.61538,9.449405],[76.615349,9.449519],[76.615318,9.449634],[76.615234,9.449994],[76.615213,9.450135],[76.615166,9.450303],[76.615122,9.450443],[76.615075,9.450542],[76.614906,9.450912],[76.614849,9.451184],[76.61483,9.451293],[76.614839,9.451498],[76.614874,9.45176],[76.614865,9.451867],[76.614851,9.452041],[76.614827,9.452238],[76.614811,9.452359],[76.614761,9.452763],[76.614772,9.452904],[76.614789,9.453104],[76.614807,9.45325],[76.614824,9.453375],[76.614869,9.453515],[76.614965,9.45373],[76.614815,9.453807],[76.614711,9.453859],[76.614625,9.4539],[76.614524,9.453946],[76.614384,9.45401],[76.614293,9.454048],[76.614184,9.454094],[76.613915,9.454198],[76.613819,9.454229],[76.613679,9.454257],[76.61355,9.454284],[76.613382,9.454328],[76.613283,9.454355],[76.61311,9.454409],[76.613019,9.454438],[76.612904,9.454441],[76.612807,9.454444],[76.612681,9.454453],[76.612587,9.454462],[76.612383,9.454489],[76.612237,9.454525],[76.612107,9.454579],[76.612147,9.454723],[76.612174,9.454841],[76.612208,9.454992],[76.612237,9.455213],[76.612255,9.455406],[76.612269,9.455593],[76.612277,9.455771],[76.612221,9.455891],[76.612166,9.456011],[76.612156,9.456288],[76.612184,9.456612],[76.612212,9.456723],[76.612251,9.456821],[76.612267,9.456916],[76.612257,9.457011],[76.612197,9.457179],[76.612087,9.457221],[76.611886,9.457247],[76.611732,9.457269],[76.611538,9.457305],[76.611434,9.457344],[76.611411,9.457579],[76.611459,9.457833],[76.611488,9.458076],[76.611501,9.458179],[76.611526,9.458366],[76.611549,9.458544],[76.61156,9.458704],[76.611571,9.458855],[76.611581,9.459014],[76.611588,9.459161],[76.611596,9.459309],[76.611602,9.459416],[76.611609,9.459534],[76.611621,9.459632],[76.611676,9.460007],[76.611659,9.460183],[76.611541,9.460288],[76.611489,9.460412],[76.611455,9.460525],[76.611413,9.460724]]]},\"properties\":{\"Created_Da\":\"2024-10-18T05:40:50.830Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9061834676\",\"Surveyor\":\"ABHIJITH VR\",\"Ward_Name\":\"VALLOKKUNNU\",\"Ward_No\":\"2\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.620471,9.44878],[76.620416,9.448877],[76.620272,9.44913],[76.620191,9.449273],[76.620127,9.449434],[76.620094,9.449525],[76.620064,9.449826],[76.620054,9.449925],[76.620007,9.450126],[76.619912,9.450538],[76.619889,9.450751],[76.619879,9.450854],[76.619849,9.451142],[76.619858,9.451301],[76.61993,9.451819],[76.620038,9.452238],[76.620073,9.452324],[76.620136,9.452443],[76.620349,9.452776],[76.620446,9.452957],[76.620507,9.453235],[76.620526,9.453331],[76.620579,9.453684],[76.62059,9.453773],[76.620636,9.454141],[76.62069,9.454537],[76.620766,9.455038],[76.620787,9.45518],[76.620795,9.455358],[76.620796,9.455561],[76.620847,9.455908],[76.620864,9.456078],[76.620878,9.456209],[76.620889,9.456439],[76.620908,9.456825],[76.620589,9.457034],[76.620298,9.457226],[76.620215,9.457268],[76.619966,9.457364],[76.619601,9.457504],[76.619505,9.457527],[76.619301,9.45758],[76.619128,9.457667],[76.618978,9.457774],[76.619065,9.457912],[76.619191,9.458027],[76.619278,9.458105],[76.619362,9.458175],[76.619445,9.458245],[76.619552,9.458329],[76.619714,9.458458],[76.619811,9.458547],[76.619885,9.458614],[76.620002,9.458735],[76.620082,9.4588],[76.620213,9.458882],[76.620321,9.458949],[76.620428,9.459016],[76.620578,9.459055],[76.620718,9.459078],[76.620918,9.459096],[76.621049,9.459106],[76.62129,9.459121],[76.621596,9.459184],[76.62174,9.459204],[76.621847,9.459232],[76.621982,9.459258],[76.622159,9.459307],[76.622272,9.459362],[76.622382,9.459391],[76.622472,9.459427],[76.622429,9.45975],[76.622375,9.46015],[76.622333,9.460374],[76.622268,9.460599],[76.622223,9.460733],[76.622045,9.461161],[76.621984,9.461356],[76.621874,9.46171],[76.62184,9.461821],[76.621444,9.461726],[76.621324,9.461639],[76.621256,9.461857],[76.621215,9.461917],[76.621113,9.461965],[76.620698,9.461842],[76.620541,9.4618],[76.620675,9.461281],[76.620697,9.461194],[76.62081,9.460952],[76.620333,9.460863],[76.620222,9.460859],[76.62011,9.460863],[76.619948,9.46115],[76.619394,9.461212],[76.619299,9.461224],[76.618852,9.461204],[76.618535,9.461187],[76.618395,9.461136],[76.618131,9.461208],[76.617732,9.46122],[76.617453,9.461231],[76.617318,9.461196],[76.616982,9.46123],[76.616762,9.461292],[76.616424,9.46139],[76.616359,9.461414],[76.61634,9.461481],[76.616003,9.461666],[76.615894,9.461671],[76.615868,9.461745],[76.615682,9.461813],[76.615483,9.461513],[76.615265,9.461308],[76.615122,9.461177],[76.615022,9.461118],[76.614861,9.461025],[76.614532,9.460837],[76.614232,9.460782],[76.614084,9.460755],[76.614102,9.460691],[76.614074,9.460571],[76.613911,9.4606],[76.613749,9.46056],[76.613513,9.460645],[76.613212,9.4606],[76.613079,9.460499],[76.612982,9.460444],[76.612741,9.460517],[76.612647,9.460503],[76.612593,9.460543],[76.612548,9.460575],[76.611983,9.461079],[76.611613,9.461124],[76.611517,9.461063],[76.611299,9.460905],[76.611413,9.460724],[76.611455,9.460525],[76.611489,9.460412],[76.611541,9.460288],[76.611659,9.460183],[76.611676,9.460007],[76.611621,9.459632],[76.611609,9.459534],[76.611602,9.459416],[76.611596,9.459309],[76.611588,9.459161],[76.611581,9.459014],[76.611571,9.458855],[76.61156,9.458704],[76.611549,9.458544],[76.611526,9.458366],[76.611501,9.458179],[76.611488,9.458076],[76.611459,9.457833],[76.611411,9.457579],[76.611434,9.457344],[76.611538,9.457305],[76.611732,9.457269],[76.611886,9.457247],[76.612087,9.457221],[76.612197,9.457179],[76.612257,9.457011],[76.612267,9.456916],[76.612251,9.456821],[76.612212,9.456723],[76.612184,9.456612],[76.612156,9.456288],[76.612166,9.456011],[76.612221,9.455891],[76.612277,9.455771],[76.612269,9.455593],[76.612255,9.455406],[76.612237,9.455213],[76.612208,9.454992],[76.612174,9.454841],[76.612147,9.454723],[76.612107,9.454579],[76.612237,9.454525],[76.612383,9.454489],[76.612587,9.454462],[76.612681,9.454453],[76.612807,9.454444],[76.612904,9.454441],[76.613019,9.454438],[76.61311,9.454409],[76.613283,9.454355],[76.613382,9.454328],[76.61355,9.454284],[76.613679,9.454257],[76.613819,9.454229],[76.613915,9.454198],[76.614184,9.454094],[76.614293,9.454048],[76.614384,9.45401],[76.614524,9.453946],[76.614625,9.4539],[76.614711,9.453859],[76.614815,9.453807],[76.614965,9.45373],[76.614869,9.453515],[76.614824,9.453375],[76.614807,9.45325],[76.614789,9.453104],[76.614772,9.452904],[76.614761,9.452763],[76.614811,9.452359],[76.614827,9.452238],[76.614851,9.452041],[76.614865,9.451867],[76.614874,9.45176],[76.614839,9.451498],[76.61483,9.451293],[76.614849,9.451184],[76.614906,9.450912],[76.615075,9.450542],[76.615122,9.450443],[76.615166,9.450303],[76.615213,9.450135],[76.615234,9.449994],[76.615318,9.449634],[76.615349,9.449519],[76.61538,9.449405],[76.615421,9.449267],[76.615462,9.449128],[76.615496,9.449018],[76.615522,9.448821],[76.615537,9.448717],[76.615597,9.448383],[76.615644,9.448229],[76.615694,9.448079],[76.615743,9.447929],[76.615813,9.447725],[76.615922,9.447583],[76.616025,9.447508],[76.616318,9.447391],[76.616511,9.447281],[76.616667,9.447145],[76.616723,9.44697],[76.616717,9.446838],[76.616707,9.446739],[76.616685,9.446537],[76.616767,9.446293],[76.616886,9.446263],[76.617344,9.446434],[76.617663,9.446553],[76.617795,9.446616],[76.617947,9.446817],[76.618022,9.447025],[76.618069,9.447157],[76.618148,9.44723],[76.618198,9.447307],[76.618294,9.447454],[76.618473,9.447731],[76.618639,9.448008],[76.618743,9.448103],[76.618885,9.448232],[76.61908,9.448356],[76.619283,9.448557],[76.619664,9.448592],[76.620001,9.448665],[76.620105,9.448683],[76.620471,9.44878]]]},\"properties\":{\"Created_Da\":\"2024-10-18T11:25:53.952Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"ABHIJITH VR\",\"Ward_Name\":\"PALACKATHAKIDI\",\"Ward_No\":\"3\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.599749,9.45005],[76.599718,9.449915],[76.599777,9.449822],[76.599179,9.449287],[76.598457,9.449015],[76.598486,9.448773],[76.598117,9.44877],[76.59824,9.447644],[76.598642,9.447663],[76.598809,9.447641],[76.598976,9.44762],[76.599163,9.447564],[76.599315,9.447529],[76.599545,9.447416],[76.59998,9.44718],[76.600352,9.44697],[76.600492,9.446912],[76.601152,9.446602],[76.601252,9.44654],[76.601743,9.446235],[76.602248,9.445919],[76.602713,9.445628],[76.603133,9.445454],[76.603386,9.445399],[76.603712,9.445378],[76.603819,9.445374],[76.60418,9.445315],[76.604313,9.445277],[76.604447,9.44524],[76.604745,9.445155],[76.604968,9.445093],[76.605344,9.444931],[76.605541,9.444881],[76.605704,9.44486],[76.605875,9.444838],[76.606036,9.444826],[76.606153,9.444778],[76.606271,9.444729],[76.606578,9.444588],[76.606793,9.444506],[76.607037,9.444401],[76.607229,9.444318],[76.607505,9.444167],[76.607862,9.444063],[76.608148,9.444045],[76.608373,9.44401],[76.608497,9.443999],[76.60862,9.444052],[76.608935,9.444312],[76.609076,9.444295],[76.609234,9.444281],[76.609341,9.444279],[76.60945,9.444277],[76.609562,9.444274],[76.609823,9.444303],[76.609921,9.444325],[76.61001,9.444348],[76.610127,9.444376],[76.610398,9.444461],[76.610874,9.444663],[76.610991,9.444722],[76.611214,9.444788],[76.611406,9.44483],[76.611593,9.444794],[76.611762,9.444748],[76.611913,9.444708],[76.612159,9.444644],[76.6123,9.444609],[76.612499,9.444504],[76.612815,9.444338],[76.612909,9.44429],[76.613348,9.44409],[76.613854,9.443837],[76.614004,9.443774],[76.614172,9.443749],[76.614433,9.443706],[76.614735,9.443697],[76.614925,9.44369],[76.614728,9.443944],[76.614445,9.444316],[76.61432,9.444337],[76.613984,9.44445],[76.613703,9.444771],[76.613393,9.445023],[76.613231,9.445035],[76.61294,9.445041],[76.612807,9.445078],[76.61266,9.445119],[76.612651,9.445781],[76.612371,9.445785],[76.611975,9.445867],[76.611963,9.446059],[76.611898,9.446144],[76.611766,9.446317],[76.611674,9.446773],[76.611583,9.447195],[76.611446,9.447688],[76.611338,9.447904],[76.611102,9.448244],[76.610813,9.448509],[76.610316,9.448863],[76.610058,9.449014],[76.609776,9.449163],[76.609666,9.449218],[76.609603,9.449323],[76.609527,9.449619],[76.60922,9.450314],[76.609043,9.450704],[76.608995,9.450811],[76.608835,9.451346],[76.60866,9.451826],[76.608626,9.452011],[76.608587,9.452224],[76.608459,9.452426],[76.608212,9.452593],[76.607997,9.452696],[76.607774,9.452694],[76.607403,9.452685],[76.607036,9.452685],[76.606887,9.452691],[76.606788,9.452717],[76.606659,9.452758],[76.606498,9.452854],[76.60635,9.45294],[76.606279,9.453188],[76.606113,9.453705],[76.605859,9.454204],[76.605516,9.454809],[76.605339,9.455314],[76.605241,9.455746],[76.605159,9.455954],[76.605061,9.456045],[76.604914,9.456098],[76.604369,9.456257],[76.603953,9.456325],[76.603608,9.45629],[76.603413,9.456287],[76.603729,9.455689],[76.603873,9.455186],[76.604017,9.454535],[76.603911,9.453584],[76.603858,9.453391],[76.604139,9.453092],[76.604541,9.452533],[76.604711,9.452079],[76.604794,9.45163],[76.604835,9.451511],[76.604843,9.451062],[76.604825,9.450946],[76.604838,9.45075],[76.604816,9.450251],[76.604902,9.450161],[76.604894,9.449849],[76.604527,9.44979],[76.604012,9.449781],[76.603628,9.449934],[76.603217,9.450095],[76.602809,9.450151],[76.602642,9.45021],[76.60212,9.450214],[76.601751,9.450123],[76.601357,9.449929],[76.601234,9.450146],[76.601166,9.450138],[76.60096,9.450129],[76.600721,9.450168],[76.600558,9.450153],[76.600231,9.450268],[76.600227,9.450334],[76.599769,9.450342],[76.59972,9.450181],[76.599749,9.45005]]]},\"properties\":{\"Created_Da\":\"2024-10-18T05:14:40.813Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9061834676\",\"Surveyor\":\"ABHIJITH VR\",\"Ward_Name\":\"VALLIKKAD\",\"Ward_No\":\"1\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.594415,9.443367],[76.59439,9.443198],[76.593901,9.443146],[76.592527,9.443183],[76.592419,9.443105],[76.592333,9.442998],[76.591962,9.442542],[76.59179,9.442314],[76.591664,9.442166],[76.591286,9.441758],[76.591383,9.441713],[76.591378,9.441418],[76.591334,9.441255],[76.591626,9.440784],[76.591915,9.440573],[76.592188,9.440247],[76.592036,9.440046],[76.592038,9.440007],[76.59237,9.440001],[76.592591,9.439933],[76.59265,9.43994],[76.592929,9.439881],[76.593248,9.439731],[76.593494,9.439758],[76.593639,9.439719],[76.593639,9.43958],[76.593591,9.439391],[76.593459,9.438941],[76.593305,9.438585],[76.593289,9.438475],[76.593214,9.438236],[76.593109,9.437458],[76.59311,9.436872],[76.59322,9.436806],[76.593395,9.436781],[76.593381,9.436593],[76.593556,9.436554],[76.593628,9.436467],[76.59403,9.436246],[76.593986,9.435927],[76.594028,9.435838],[76.594173,9.435692],[76.594242,9.435526],[76.594096,9.435404],[76.593645,9.434842],[76.593511,9.434721],[76.593339,9.434446],[76.593196,9.434383],[76.593057,9.434324],[76.592963,9.434208],[76.592755,9.433923],[76.592657,9.433793],[76.592609,9.433745],[76.59256,9.433672],[76.592529,9.433627],[76.592465,9.433408],[76.592447,9.432968],[76.592489,9.432633],[76.592567,9.432327],[76.592617,9.43217],[76.592739,9.431792],[76.592809,9.43166],[76.59305,9.431477],[76.593224,9.431486],[76.593304,9.431439],[76.593298,9.431307],[76.593283,9.431149],[76.59318,9.431085],[76.592934,9.431024],[76.592787,9.430559],[76.592649,9.430493],[76.592616,9.430295],[76.592506,9.430049],[76.592427,9.430004],[76.592449,9.429852],[76.592279,9.429502],[76.59215,9.429296],[76.592158,9.428918],[76.592021,9.428533],[76.591921,9.428433],[76.591931,9.428158],[76.591958,9.428066],[76.592023,9.428021],[76.591981,9.42795],[76.592061,9.427718],[76.592084,9.427552],[76.592117,9.427501],[76.592146,9.427421],[76.592275,9.427244],[76.592663,9.426875],[76.592775,9.426666],[76.592855,9.426478],[76.592855,9.426302],[76.592932,9.42625],[76.593011,9.42614],[76.592975,9.426066],[76.593037,9.425849],[76.593008,9.425678],[76.593091,9.425597],[76.593079,9.425496],[76.59317,9.425273],[76.593152,9.425006],[76.593313,9.424721],[76.593335,9.424599],[76.593425,9.424528],[76.593574,9.424259],[76.593896,9.423855],[76.592787,9.423325],[76.592727,9.423249],[76.592742,9.423209],[76.592847,9.423125],[76.593119,9.422983],[76.593412,9.422751],[76.593741,9.422715],[76.594039,9.422604],[76.594527,9.422455],[76.595119,9.422304],[76.595289,9.422204],[76.595487,9.422151],[76.59566,9.422132],[76.595991,9.421859],[76.59626,9.421652],[76.596303,9.421568],[76.596673,9.420782],[76.596744,9.420531],[76.596572,9.420269],[76.596487,9.420183],[76.59656,9.420094],[76.596715,9.420074],[76.596853,9.420057],[76.596942,9.420033],[76.597105,9.419991],[76.597267,9.419968],[76.597429,9.419944],[76.597535,9.420576],[76.597621,9.421086],[76.597673,9.421396],[76.597762,9.421927],[76.598353,9.421999],[76.598586,9.422027],[76.598612,9.422139],[76.598775,9.422822],[76.598806,9.422932],[76.59886,9.42312],[76.598787,9.423304],[76.598735,9.423431],[76.598787,9.423716],[76.598813,9.423854],[76.598836,9.423975],[76.598865,9.424133],[76.598899,9.424314],[76.598934,9.424505],[76.598974,9.424721],[76.599002,9.424869],[76.599162,9.425082],[76.599336,9.425312],[76.599479,9.425502],[76.599551,9.425597],[76.599626,9.425697],[76.599775,9.426064],[76.599884,9.426331],[76.599933,9.426451],[76.600069,9.426739],[76.60015,9.426913],[76.600172,9.427068],[76.600193,9.427223],[76.600255,9.427675],[76.600295,9.427968],[76.600184,9.42836],[76.600075,9.428745],[76.600024,9.428924],[76.599911,9.429136],[76.599864,9.429222],[76.599754,9.429428],[76.599821,9.429547],[76.599962,9.429637],[76.600076,9.42971],[76.600241,9.429815],[76.600627,9.430001],[76.600834,9.430102],[76.60089,9.430252],[76.600941,9.430388],[76.600985,9.430506],[76.601018,9.430595],[76.601055,9.430693],[76.601105,9.430825],[76.601148,9.430941],[76.601194,9.431064],[76.601231,9.431163],[76.601312,9.43138],[76.601369,9.431532],[76.601405,9.431627],[76.601452,9.431755],[76.6015,9.431882],[76.601714,9.432453],[76.601806,9.432489],[76.601897,9.432524],[76.6023,9.433946],[76.602179,9.433975],[76.602046,9.433876],[76.601599,9.433554],[76.601319,9.433295],[76.601033,9.433058],[76.600778,9.432921],[76.600599,9.43284],[76.600426,9.432808],[76.600163,9.432768],[76.599529,9.432814],[76.599433,9.432916],[76.599324,9.433033],[76.599093,9.43328],[76.598776,9.433618],[76.598618,9.43378],[76.598459,9.433942],[76.598316,9.434086],[76.598185,9.434217],[76.598079,9.434326],[76.598193,9.434451],[76.598517,9.434802],[76.597672,9.435712],[76.597853,9.435949],[76.598147,9.43641],[76.598517,9.43718],[76.598568,9.437275],[76.598485,9.437615],[76.598331,9.437596],[76.597861,9.437004],[76.597629,9.436713],[76.597397,9.436423],[76.597258,9.43625],[76.597152,9.436264],[76.596936,9.436324],[76.596637,9.436487],[76.596443,9.436575],[76.59618,9.436637],[76.595902,9.436694],[76.59569,9.43672],[76.595627,9.437435],[76.595641,9.437845],[76.595682,9.437939],[76.59582,9.438123],[76.595901,9.438266],[76.596156,9.438713],[76.596214,9.438825],[76.59615,9.439131],[76.596121,9.43929],[76.596105,9.439385],[76.59608,9.439526],[76.5961,9.439726],[76.596112,9.439853],[76.596126,9.439992],[76.596142,9.440219],[76.59613,9.44045],[76.596092,9.440814],[76.596049,9.441029],[76.596021,9.441172],[76.595989,9.441471],[76.596183,9.441525],[76.596317,9.441566],[76.596199,9.441853],[76.596115,9.442059],[76.59601,9.442422],[76.596011,9.442649],[76.596012,9.44279],[76.596078,9.443076],[76.596175,9.443341],[76.596273,9.443605],[76.595867,9.443549],[76.595732,9.443535],[76.594437,9.443541],[76.594415,9.443367]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:28:59.451Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9061834676\",\"Surveyor\":\"Abhijith\",\"Ward_Name\":\"MYLAMON\",\"Ward_No\":\"14\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.597429,9.419944],[76.597267,9.419968],[76.597105,9.419991],[76.596942,9.420033],[76.596853,9.420057],[76.596715,9.420074],[76.59656,9.420094],[76.596578,9.419712],[76.596455,9.419259],[76.596377,9.418968],[76.59613,9.418827],[76.596018,9.418719],[76.595894,9.418651],[76.595729,9.418802],[76.595634,9.418814],[76.595447,9.418933],[76.595335,9.419042],[76.595108,9.419126],[76.594881,9.4191],[76.594848,9.41827],[76.594717,9.417739],[76.594723,9.417469],[76.59464,9.417147],[76.59454,9.41694],[76.594475,9.416677],[76.594351,9.416484],[76.594204,9.416176],[76.594132,9.416026],[76.594117,9.415957],[76.594079,9.415792],[76.59406,9.415489],[76.594015,9.415271],[76.593973,9.415108],[76.59398,9.415051],[76.593838,9.414773],[76.593699,9.414513],[76.593246,9.414319],[76.593163,9.41431],[76.593021,9.414277],[76.592932,9.414378],[76.592847,9.414428],[76.592734,9.414563],[76.592689,9.414749],[76.592618,9.414815],[76.592572,9.415009],[76.592616,9.415248],[76.592428,9.415773],[76.592339,9.415912],[76.592279,9.415979],[76.592214,9.415992],[76.592095,9.415962],[76.591909,9.41602],[76.59184,9.416249],[76.59191,9.41641],[76.591916,9.416464],[76.591743,9.416572],[76.591734,9.416673],[76.59178,9.416677],[76.591833,9.416841],[76.591804,9.416928],[76.59168,9.417097],[76.591542,9.417372],[76.591555,9.417787],[76.591559,9.418007],[76.591425,9.41841],[76.591381,9.418516],[76.591254,9.418809],[76.591202,9.418875],[76.591146,9.418944],[76.590984,9.419051],[76.590851,9.419233],[76.590766,9.419318],[76.59075,9.419518],[76.590765,9.419586],[76.590519,9.419686],[76.590268,9.419689],[76.590231,9.419354],[76.590184,9.418926],[76.590261,9.418849],[76.590418,9.418693],[76.590495,9.418615],[76.590649,9.418461],[76.590614,9.418323],[76.590765,9.418183],[76.590955,9.418007],[76.590968,9.417893],[76.590777,9.417636],[76.590756,9.417537],[76.590841,9.417411],[76.590862,9.417322],[76.59089,9.417207],[76.590967,9.417021],[76.59103,9.416899],[76.591072,9.416797],[76.591169,9.416561],[76.591243,9.416468],[76.591265,9.416374],[76.591397,9.41615],[76.59157,9.415877],[76.591625,9.415791],[76.591801,9.415665],[76.591852,9.415557],[76.591995,9.415251],[76.59212,9.415091],[76.59227,9.414768],[76.59242,9.414558],[76.592538,9.414352],[76.592604,9.414236],[76.592651,9.414149],[76.592746,9.413982],[76.592919,9.413677],[76.593122,9.413342],[76.593271,9.413096],[76.59349,9.41294],[76.593692,9.412492],[76.593758,9.412343],[76.59401,9.411943],[76.59411,9.411801],[76.594464,9.411597],[76.594603,9.411517],[76.594875,9.411375],[76.595172,9.411287],[76.595403,9.411245],[76.595613,9.411399],[76.595698,9.41131],[76.596154,9.411073],[76.59641,9.410449],[76.596509,9.410208],[76.59634,9.410103],[76.596185,9.410006],[76.596199,9.409906],[76.596266,9.409347],[76.596282,9.409218],[76.596302,9.408834],[76.596312,9.408685],[76.59633,9.408495],[76.596347,9.408346],[76.597306,9.408481],[76.597624,9.408573],[76.597694,9.408802],[76.598071,9.408794],[76.598348,9.408775],[76.598573,9.408792],[76.598858,9.408814],[76.598959,9.408829],[76.599068,9.40885],[76.599295,9.408891],[76.599393,9.408906],[76.599492,9.408921],[76.599563,9.408991],[76.599597,9.409127],[76.59963,9.409263],[76.599674,9.409519],[76.599691,9.409623],[76.599709,9.409726],[76.599795,9.409759],[76.600274,9.409674],[76.600411,9.409661],[76.60055,9.409648],[76.600712,9.409645],[76.60098,9.409636],[76.601131,9.409626],[76.601321,9.409581],[76.601557,9.409535],[76.601622,9.409607],[76.601651,9.40976],[76.601721,9.410134],[76.601814,9.410521],[76.601876,9.410743],[76.601902,9.410843],[76.601927,9.410943],[76.602044,9.411497],[76.602165,9.411796],[76.602234,9.411951],[76.602314,9.412142],[76.602395,9.412333],[76.602439,9.412445],[76.602529,9.412651],[76.602608,9.41294],[76.60255,9.413115],[76.602517,9.413213],[76.602464,9.413341],[76.602391,9.413518],[76.602277,9.413797],[76.602169,9.414028],[76.602104,9.414168],[76.60201,9.414326],[76.601802,9.414512],[76.601602,9.414725],[76.601559,9.414879],[76.601439,9.415191],[76.601258,9.415444],[76.601118,9.415597],[76.600965,9.415739],[76.600824,9.41598],[76.600678,9.416317],[76.600542,9.416583],[76.600351,9.416837],[76.600218,9.417014],[76.600111,9.417117],[76.599992,9.417229],[76.599811,9.417386],[76.599596,9.417594],[76.599448,9.417734],[76.599337,9.417837],[76.599226,9.417941],[76.599051,9.418109],[76.598971,9.418209],[76.598817,9.418403],[76.598642,9.41881],[76.598586,9.419146],[76.598556,9.419264],[76.598507,9.419395],[76.598318,9.419592],[76.598223,9.419691],[76.598077,9.419844],[76.597766,9.419893],[76.597541,9.419928],[76.597429,9.419944]]]},\"properties\":{\"Created_Da\":\"2024-10-19T16:05:23.475Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"Sachin K Biju\",\"Ward_Name\":\"ANJILITHANAM\",\"Ward_No\":\"13\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.615549,9.443625],[76.615438,9.443141],[76.615395,9.442967],[76.614861,9.442548],[76.61493,9.442409],[76.614905,9.442155],[76.614674,9.441623],[76.614497,9.441234],[76.614116,9.440872],[76.613886,9.440305],[76.613763,9.440129],[76.613639,9.439954],[76.613187,9.439132],[76.613129,9.439013],[76.612944,9.438651],[76.612568,9.438141],[76.612473,9.43802],[76.612406,9.437915],[76.612213,9.437629],[76.612166,9.437522],[76.612088,9.437344],[76.611997,9.437229],[76.611905,9.437113],[76.611943,9.436981],[76.612,9.436818],[76.611988,9.436661],[76.611924,9.436413],[76.61186,9.436163],[76.611694,9.435823],[76.611577,9.435583],[76.611507,9.43544],[76.611448,9.435368],[76.611335,9.435246],[76.611267,9.435173],[76.610888,9.43482],[76.611137,9.434808],[76.611387,9.434795],[76.611537,9.434806],[76.611691,9.434817],[76.612152,9.434857],[76.612544,9.434926],[76.61305,9.435025],[76.61349,9.435086],[76.61383,9.435118],[76.614111,9.435107],[76.614384,9.435055],[76.61472,9.435005],[76.615154,9.435039],[76.615501,9.435004],[76.615782,9.434955],[76.615884,9.434927],[76.616021,9.43487],[76.616143,9.434827],[76.616264,9.434784],[76.616465,9.434765],[76.616642,9.434779],[76.616915,9.434798],[76.617044,9.434794],[76.617174,9.434791],[76.617424,9.434813],[76.617832,9.43485],[76.61811,9.434908],[76.618242,9.434948],[76.6187,9.435086],[76.618946,9.435115],[76.619163,9.43514],[76.619313,9.435117],[76.6196,9.435025],[76.619942,9.434959],[76.620122,9.434905],[76.6203,9.434836],[76.620436,9.434743],[76.620626,9.434612],[76.620797,9.434437],[76.621056,9.434136],[76.621793,9.433124],[76.622092,9.432696],[76.622274,9.432443],[76.622519,9.432237],[76.622632,9.432165],[76.622724,9.43214],[76.622839,9.432119],[76.622953,9.432098],[76.623358,9.432032],[76.62376,9.431967],[76.623876,9.431976],[76.624488,9.432135],[76.624693,9.432188],[76.625119,9.432591],[76.625223,9.432675],[76.62532,9.432732],[76.625432,9.432801],[76.625544,9.432871],[76.625932,9.433152],[76.626321,9.433433],[76.626704,9.433626],[76.627052,9.433723],[76.626937,9.43483],[76.626931,9.435196],[76.626642,9.43572],[76.626238,9.43606],[76.626127,9.436151],[76.626008,9.43629],[76.625937,9.436574],[76.625914,9.436746],[76.625917,9.437018],[76.625917,9.437164],[76.62591,9.437282],[76.625425,9.43719],[76.625171,9.437142],[76.625031,9.437109],[76.62489,9.437077],[76.624578,9.437218],[76.624391,9.437434],[76.623748,9.437596],[76.623708,9.43803],[76.623289,9.438112],[76.622928,9.43878],[76.622468,9.439103],[76.622222,9.439586],[76.621973,9.439647],[76.621724,9.439707],[76.621431,9.44003],[76.621204,9.440509],[76.620599,9.440019],[76.620305,9.439839],[76.619907,9.440138],[76.6196,9.440529],[76.619268,9.440856],[76.619288,9.441044],[76.619816,9.44137],[76.620228,9.441612],[76.62097,9.442161],[76.620831,9.442664],[76.620991,9.442819],[76.62152,9.443332],[76.621858,9.443637],[76.621794,9.444058],[76.621797,9.444907],[76.621643,9.444855],[76.62121,9.444717],[76.620866,9.444686],[76.620451,9.444626],[76.620082,9.444469],[76.620001,9.444422],[76.619819,9.444311],[76.619603,9.444178],[76.618984,9.444006],[76.618879,9.443976],[76.618761,9.443951],[76.618387,9.443853],[76.618035,9.443756],[76.617882,9.443717],[76.617779,9.44369],[76.617534,9.443607],[76.617441,9.443599],[76.617235,9.443582],[76.617081,9.443578],[76.61683,9.443571],[76.61641,9.44358],[76.616267,9.443582],[76.61599,9.443584],[76.615549,9.443625]]]},\"properties\":{\"Created_Da\":\"2024-10-21T14:17:02.443Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Surveyor\":\"ABHIJITH SURESH\",\"Ward_Name\":\"NADACKAL\",\"Ward_No\":\"8\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.601333,9.44208],[76.601485,9.442174],[76.601637,9.442267],[76.602118,9.442184],[76.602295,9.442151],[76.602664,9.442083],[76.603272,9.442122],[76.604263,9.442102],[76.60455,9.442105],[76.604795,9.442138],[76.605094,9.442117],[76.605648,9.442443],[76.60573,9.442627],[76.605895,9.442996],[76.605972,9.44317],[76.606213,9.444093],[76.606271,9.444729],[76.606153,9.444778],[76.606036,9.444826],[76.605875,9.444838],[76.605704,9.44486],[76.605541,9.444881],[76.605344,9.444931],[76.604968,9.445093],[76.604745,9.445155],[76.604447,9.44524],[76.604313,9.445277],[76.60418,9.445315],[76.603819,9.445374],[76.603712,9.445378],[76.603386,9.445399],[76.603133,9.445454],[76.602713,9.445628],[76.602248,9.445919],[76.601743,9.446235],[76.601252,9.44654],[76.601152,9.446602],[76.600492,9.446912],[76.600352,9.44697],[76.59998,9.44718],[76.599545,9.447416],[76.599315,9.447529],[76.599163,9.447564],[76.598976,9.44762],[76.598809,9.447641],[76.598642,9.447663],[76.59824,9.447644],[76.598117,9.44877],[76.597976,9.448771],[76.597594,9.448666],[76.597169,9.448393],[76.597122,9.448446],[76.596492,9.448442],[76.596483,9.448078],[76.596351,9.448036],[76.596198,9.44737],[76.595921,9.4471],[76.595647,9.446904],[76.595615,9.44678],[76.59548,9.44674],[76.595458,9.446643],[76.595519,9.446534],[76.595456,9.446487],[76.595399,9.446507],[76.595377,9.446445],[76.595199,9.446396],[76.594837,9.446188],[76.594484,9.446057],[76.594021,9.446004],[76.593463,9.446044],[76.593088,9.446132],[76.592883,9.446281],[76.592618,9.446427],[76.592537,9.446432],[76.592368,9.445831],[76.592271,9.445678],[76.59195,9.445387],[76.591572,9.445216],[76.591394,9.445034],[76.591372,9.444941],[76.59112,9.444582],[76.591122,9.444509],[76.591126,9.444233],[76.591241,9.443748],[76.591201,9.443599],[76.591204,9.443408],[76.591245,9.443217],[76.591291,9.442844],[76.59129,9.442632],[76.591257,9.442184],[76.591286,9.441758],[76.591664,9.442166],[76.59179,9.442314],[76.591962,9.442542],[76.592333,9.442998],[76.592419,9.443105],[76.592527,9.443183],[76.593901,9.443146],[76.59439,9.443198],[76.594415,9.443367],[76.594437,9.443541],[76.595732,9.443535],[76.595867,9.443549],[76.596273,9.443605],[76.596392,9.444065],[76.596692,9.44443],[76.596712,9.444811],[76.596761,9.444981],[76.596852,9.4451],[76.597018,9.445248],[76.597368,9.445311],[76.597457,9.445374],[76.597599,9.445409],[76.597695,9.445433],[76.598033,9.445354],[76.598209,9.445292],[76.59828,9.445584],[76.598503,9.445253],[76.598863,9.444956],[76.598943,9.444889],[76.599464,9.444533],[76.599584,9.444457],[76.599705,9.444381],[76.599906,9.444258],[76.600099,9.44404],[76.600438,9.44328],[76.600571,9.44292],[76.60061,9.442813],[76.600918,9.442115],[76.601333,9.44208]]]},\"properties\":{\"Created_Da\":\"2024-10-22T05:14:07.745Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9061834676\",\"Surveyor\":\"AJITH KUMAR P\",\"Ward_Name\":\"MANTHANAM\",\"Ward_No\":\"16\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.628582,9.442286],[76.628419,9.442362],[76.628238,9.442595],[76.628058,9.442963],[76.627964,9.443157],[76.627943,9.443452],[76.627942,9.443724],[76.627941,9.44383],[76.627941,9.443928],[76.62811,9.444083],[76.628328,9.444283],[76.628666,9.444285],[76.62936,9.444288],[76.629576,9.444293],[76.629812,9.444298],[76.629812,9.44487],[76.630494,9.445106],[76.630511,9.4453],[76.630646,9.445603],[76.63101,9.44593],[76.630736,9.446046],[76.630428,9.446202],[76.6303,9.446201],[76.63014,9.446165],[76.629615,9.446046],[76.62948,9.446015],[76.629402,9.445893],[76.629327,9.445761],[76.628955,9.445295],[76.628762,9.445213],[76.628494,9.445129],[76.628228,9.445136],[76.62803,9.445883],[76.627997,9.446006],[76.627918,9.446149],[76.627776,9.446336],[76.627507,9.446575],[76.627132,9.446921],[76.626914,9.447129],[76.626846,9.447271],[76.62672,9.4473],[76.62653,9.447343],[76.625723,9.447721],[76.625331,9.448284],[76.624945,9.448833],[76.624801,9.449096],[76.624722,9.449239],[76.624453,9.449724],[76.624143,9.449702],[76.623892,9.449461],[76.623839,9.449031],[76.62382,9.448831],[76.623828,9.448604],[76.623851,9.448215],[76.623952,9.447722],[76.624017,9.447613],[76.624119,9.447444],[76.624337,9.447082],[76.624567,9.4467],[76.624649,9.446469],[76.624695,9.446342],[76.624674,9.446114],[76.624644,9.445785],[76.624545,9.44546],[76.624231,9.445605],[76.623829,9.445781],[76.623674,9.445842],[76.623387,9.445924],[76.623129,9.445988],[76.622249,9.446157],[76.622025,9.446188],[76.62192,9.446189],[76.621614,9.446157],[76.621749,9.445973],[76.62188,9.445614],[76.621906,9.445409],[76.62188,9.445085],[76.621797,9.444907],[76.621794,9.444058],[76.621858,9.443637],[76.62152,9.443332],[76.620991,9.442819],[76.620831,9.442664],[76.62097,9.442161],[76.620228,9.441612],[76.619816,9.44137],[76.619288,9.441044],[76.619268,9.440856],[76.6196,9.440529],[76.619907,9.440138],[76.620305,9.439839],[76.620599,9.440019],[76.621204,9.440509],[76.621431,9.44003],[76.621724,9.439707],[76.621973,9.439647],[76.622222,9.439586],[76.622468,9.439103],[76.622928,9.43878],[76.623289,9.438112],[76.623708,9.43803],[76.623748,9.437596],[76.624391,9.437434],[76.624578,9.437218],[76.62489,9.437077],[76.625031,9.437109],[76.625171,9.437142],[76.625425,9.43719],[76.62591,9.437282],[76.625917,9.437164],[76.625917,9.437018],[76.625914,9.436746],[76.625937,9.436574],[76.626008,9.43629],[76.626127,9.436151],[76.626238,9.43606],[76.626642,9.43572],[76.626931,9.435196],[76.626937,9.43483],[76.627052,9.433723],[76.627311,9.433751],[76.627824,9.433806],[76.628159,9.433785],[76.628432,9.433774],[76.628525,9.433761],[76.628662,9.433715],[76.62861,9.433893],[76.62858,9.433997],[76.628627,9.434146],[76.628783,9.434699],[76.629182,9.434894],[76.629331,9.434966],[76.629444,9.435039],[76.629507,9.435184],[76.629571,9.435444],[76.629617,9.435627],[76.629689,9.43592],[76.629324,9.436286],[76.629245,9.436519],[76.629282,9.436787],[76.629389,9.436872],[76.629465,9.436933],[76.629622,9.437057],[76.629796,9.437143],[76.630103,9.437287],[76.630275,9.437368],[76.630429,9.43744],[76.630705,9.437549],[76.630893,9.437749],[76.631004,9.437906],[76.631089,9.438027],[76.631117,9.438274],[76.631146,9.438394],[76.631212,9.438673],[76.63132,9.439116],[76.631495,9.439458],[76.631607,9.439595],[76.631708,9.439718],[76.631536,9.439855],[76.631253,9.440039],[76.630962,9.440213],[76.630795,9.440328],[76.630649,9.44043],[76.630461,9.440588],[76.630375,9.440689],[76.630124,9.440984],[76.629979,9.441176],[76.629944,9.441379],[76.629747,9.441482],[76.629514,9.441604],[76.62927,9.441775],[76.629071,9.441949],[76.628806,9.442183],[76.628582,9.442286]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:50:37.867Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9645305673\",\"Remarks\":\"Chengaroor Chira\",\"Surveyor\":\"Sachin K Biju\",\"Ward_Name\":\"CHENGAROOR CHIRA\",\"Ward_No\":\"7\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.620878,9.456209],[76.620864,9.456078],[76.620847,9.455908],[76.620796,9.455561],[76.620795,9.455358],[76.620787,9.45518],[76.620766,9.455038],[76.62069,9.454537],[76.620636,9.454141],[76.62059,9.453773],[76.620579,9.453684],[76.620526,9.453331],[76.620507,9.453235],[76.620446,9.452957],[76.620349,9.452776],[76.620136,9.452443],[76.620073,9.452324],[76.620038,9.452238],[76.61993,9.451819],[76.619858,9.451301],[76.619849,9.451142],[76.619879,9.450854],[76.619889,9.450751],[76.619912,9.450538],[76.620007,9.450126],[76.620054,9.449925],[76.620064,9.449826],[76.620094,9.449525],[76.620127,9.449434],[76.620191,9.449273],[76.620272,9.44913],[76.620416,9.448877],[76.620471,9.44878],[76.620691,9.448329],[76.620703,9.448172],[76.620728,9.447858],[76.620751,9.447574],[76.620773,9.447297],[76.620868,9.447115],[76.620922,9.447012],[76.620999,9.446909],[76.62109,9.446787],[76.621173,9.446676],[76.621295,9.446523],[76.621375,9.446423],[76.621614,9.446157],[76.62192,9.446189],[76.622025,9.446188],[76.622249,9.446157],[76.623129,9.445988],[76.623387,9.445924],[76.623674,9.445842],[76.623829,9.445781],[76.624231,9.445605],[76.624545,9.44546],[76.624644,9.445785],[76.624674,9.446114],[76.624695,9.446342],[76.624649,9.446469],[76.624567,9.4467],[76.624337,9.447082],[76.624119,9.447444],[76.624017,9.447613],[76.623952,9.447722],[76.623851,9.448215],[76.623828,9.448604],[76.62382,9.448831],[76.623839,9.449031],[76.623892,9.449461],[76.624143,9.449702],[76.624453,9.449724],[76.624722,9.449239],[76.624801,9.449096],[76.624945,9.448833],[76.625331,9.448284],[76.625723,9.447721],[76.62653,9.447343],[76.62672,9.4473],[76.626846,9.447271],[76.626826,9.447493],[76.626838,9.447754],[76.62684,9.44786],[76.626838,9.448116],[76.626827,9.448283],[76.6269,9.448515],[76.627039,9.448737],[76.627265,9.448947],[76.627584,9.449154],[76.627882,9.449296],[76.627863,9.449556],[76.627721,9.449853],[76.627573,9.450065],[76.627434,9.450304],[76.627576,9.450498],[76.627672,9.45052],[76.628031,9.450599],[76.628389,9.450677],[76.628317,9.450892],[76.628209,9.451143],[76.628166,9.451264],[76.628125,9.451511],[76.62814,9.4517],[76.628182,9.451983],[76.628174,9.452251],[76.628117,9.452433],[76.628061,9.452615],[76.627976,9.452781],[76.627762,9.453165],[76.627668,9.453369],[76.627628,9.453533],[76.627617,9.453656],[76.627607,9.453915],[76.62759,9.454105],[76.62758,9.454438],[76.627573,9.454789],[76.627572,9.45496],[76.627546,9.455144],[76.627521,9.455329],[76.627474,9.45543],[76.627213,9.455605],[76.626949,9.455788],[76.626735,9.455917],[76.626598,9.455971],[76.6263,9.456089],[76.626119,9.456105],[76.625916,9.456091],[76.62571,9.456038],[76.625497,9.455959],[76.625236,9.455862],[76.624961,9.455741],[76.624799,9.455685],[76.624586,9.455622],[76.624422,9.455576],[76.624221,9.455568],[76.624095,9.455579],[76.623981,9.455648],[76.623878,9.455736],[76.62377,9.455872],[76.62371,9.455941],[76.623584,9.456012],[76.623454,9.456026],[76.623154,9.45603],[76.62302,9.456028],[76.622899,9.456036],[76.622629,9.456093],[76.622476,9.456087],[76.622246,9.456093],[76.622053,9.456095],[76.621874,9.456096],[76.62169,9.45611],[76.621388,9.456149],[76.621222,9.456161],[76.621055,9.456173],[76.620878,9.456209]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:20:05.091Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kunnathanam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8606286224\",\"Surveyor\":\"Abhijith\",\"Ward_Name\":\"PULINTHANAM\",\"Ward_No\":\"6\",\"Mandal\":\"Mallappally\"}}]}");
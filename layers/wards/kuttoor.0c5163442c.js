@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.617443,9.364218],[76.617431,9.364232],[76.617372,9.364356],[76.617281,9.364572],[76.617162,9.364707],[76.617065,9.36488],[76.617033,9.364993],[76.617001,9.36509],[76.616953,9.365198],[76.616877,9.365333],[76.616832,9.365363],[76.616817,9.365372],[76.616337,9.365321],[76.615968,9.365294],[76.615868,9.365267],[76.615455,9.365205],[76.614509,9.365019],[76.61435,9.364988],[76.613861,9.365028],[76.613676,9.364151],[76.61339,9.362713],[76.613363,9.362577],[76.613437,9.36251],[76.613826,9.362155],[76.613755,9.360646],[76.61364,9.360227],[76.613475,9.359635],[76.613281,9.358992],[76.614698,9.358865],[76.615837,9.358764],[76.617449,9.358554],[76.617655,9.358527],[76.617774,9.358499],[76.617893,9.358472],[76.618078,9.358407],[76.618239,9.358279],[76.618314,9.358096],[76.618514,9.357947],[76.618733,9.357863],[76.61894,9.357828],[76.619158,9.357778],[76.61941,9.357725],[76.619685,9.357678],[76.619899,9.357641],[76.620037,9.357616],[76.620174,9.357592],[76.620552,9.357497],[76.620855,9.357415],[76.621135,9.357335],[76.621405,9.35725],[76.621856,9.357116],[76.622026,9.357036],[76.622197,9.356956],[76.622425,9.356842],[76.622523,9.356807],[76.622853,9.356706],[76.623197,9.356653],[76.623667,9.356576],[76.623884,9.35655],[76.62407,9.356524],[76.624367,9.356527],[76.624582,9.356742],[76.6248,9.356942],[76.624842,9.357056],[76.624811,9.3572],[76.624797,9.357357],[76.624784,9.357503],[76.624771,9.357657],[76.624852,9.357915],[76.624909,9.358097],[76.624949,9.358227],[76.625029,9.358312],[76.625134,9.358426],[76.625272,9.358574],[76.625542,9.358581],[76.625875,9.35859],[76.626293,9.358538],[76.626471,9.358516],[76.626596,9.358636],[76.626509,9.358855],[76.62651,9.359031],[76.626511,9.359144],[76.626513,9.359377],[76.626573,9.359467],[76.626736,9.359551],[76.626903,9.359637],[76.626822,9.359784],[76.626759,9.359899],[76.626647,9.360104],[76.626522,9.360332],[76.626485,9.360468],[76.62634,9.360722],[76.626134,9.360863],[76.625944,9.360885],[76.625776,9.360796],[76.625618,9.360757],[76.625482,9.36065],[76.625367,9.360495],[76.625166,9.360387],[76.624965,9.360297],[76.624802,9.360281],[76.624564,9.360288],[76.624336,9.360343],[76.624179,9.360434],[76.624081,9.360474],[76.623906,9.360577],[76.623708,9.360704],[76.623432,9.360873],[76.623135,9.36106],[76.622892,9.361279],[76.622619,9.361488],[76.622443,9.361624],[76.62166,9.362001],[76.621145,9.362217],[76.620909,9.362319],[76.620595,9.362303],[76.620384,9.362293],[76.62026,9.362258],[76.620073,9.362234],[76.619888,9.362243],[76.619737,9.362284],[76.619585,9.362347],[76.619458,9.362412],[76.619342,9.362493],[76.619204,9.362648],[76.619027,9.362905],[76.61856,9.363294],[76.617906,9.363084],[76.617792,9.363628],[76.617737,9.363766],[76.61764,9.363886],[76.617572,9.363965],[76.617504,9.364073],[76.617461,9.36417],[76.617443,9.364218]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-19T09:42:07.980Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"West othera\",\"Surveyor\":\"Subeesh\",\"Ward_Name\":\"WEST OTHERA\",\"Ward_No\":\"7\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.605929,9.36686],[76.605723,9.366916],[76.605679,9.36694],[76.605625,9.366974],[76.60557,9.367016],[76.605535,9.367028],[76.60549,9.367039],[76.605413,9.367054],[76.605354,9.367056],[76.605268,9.36705],[76.60522,9.367032],[76.605181,9.367015],[76.605129,9.366988],[76.605065,9.36698],[76.605001,9.36697],[76.604874,9.366922],[76.604834,9.366913],[76.604761,9.36689],[76.604682,9.366858],[76.604652,9.36684],[76.604645,9.366833],[76.604632,9.366822],[76.604582,9.366805],[76.604536,9.366803],[76.604503,9.366796],[76.60444,9.366788],[76.604409,9.366781],[76.604344,9.366774],[76.604303,9.366755],[76.604271,9.366735],[76.604241,9.366705],[76.604216,9.366665],[76.6042,9.366642],[76.604179,9.366606],[76.604162,9.366565],[76.604099,9.366494],[76.604082,9.366485],[76.604057,9.366468],[76.604014,9.366442],[76.603983,9.366426],[76.603941,9.366402],[76.603915,9.366386],[76.603889,9.366365],[76.603842,9.366338],[76.60379,9.366325],[76.60377,9.366322],[76.603721,9.366325],[76.603672,9.36634],[76.603595,9.366259],[76.60355,9.366193],[76.60351,9.366133],[76.603458,9.366077],[76.603415,9.366034],[76.603383,9.365993],[76.60335,9.365977],[76.603295,9.365964],[76.603216,9.365924],[76.603167,9.365905],[76.603075,9.365847],[76.603037,9.365801],[76.603006,9.365742],[76.602995,9.365685],[76.602949,9.365537],[76.602905,9.365484],[76.602867,9.365441],[76.60275,9.365336],[76.602692,9.365283],[76.602637,9.365224],[76.602574,9.365127],[76.602522,9.365054],[76.602344,9.364793],[76.60228,9.364654],[76.602257,9.364604],[76.60223,9.364546],[76.602211,9.364506],[76.602166,9.36443],[76.602147,9.364379],[76.602147,9.364292],[76.602146,9.36423],[76.602154,9.364171],[76.602173,9.364112],[76.602202,9.364086],[76.602254,9.364047],[76.602311,9.364041],[76.602392,9.364011],[76.602427,9.363965],[76.602452,9.363914],[76.602473,9.363867],[76.602484,9.363815],[76.602489,9.36377],[76.602506,9.36367],[76.602495,9.36359],[76.602476,9.363539],[76.602447,9.363507],[76.602408,9.36348],[76.602365,9.363462],[76.602351,9.363454],[76.602319,9.363438],[76.602223,9.363383],[76.602174,9.36337],[76.601926,9.363396],[76.601934,9.363154],[76.60194,9.362809],[76.601946,9.362379],[76.602021,9.362269],[76.602161,9.362017],[76.602249,9.361688],[76.602,9.361235],[76.601913,9.361102],[76.601827,9.360968],[76.601676,9.360752],[76.601523,9.360464],[76.601321,9.360092],[76.601216,9.359931],[76.600979,9.359572],[76.600887,9.359428],[76.60069,9.359119],[76.600578,9.358822],[76.600531,9.358697],[76.60079,9.358499],[76.600997,9.358449],[76.601114,9.358416],[76.601312,9.35836],[76.60142,9.358287],[76.601617,9.358153],[76.601745,9.358111],[76.601908,9.358057],[76.602167,9.358098],[76.602414,9.358042],[76.602657,9.357987],[76.602787,9.35796],[76.603094,9.357888],[76.603562,9.357782],[76.603558,9.356871],[76.603557,9.356761],[76.603379,9.356202],[76.603257,9.355819],[76.603178,9.355573],[76.603187,9.355458],[76.603223,9.354978],[76.60324,9.354763],[76.603555,9.354715],[76.603695,9.354694],[76.60383,9.354673],[76.604036,9.354642],[76.604227,9.354586],[76.604419,9.35453],[76.604508,9.354912],[76.604705,9.354929],[76.60489,9.354944],[76.605042,9.354956],[76.605145,9.354965],[76.605273,9.354966],[76.605866,9.354973],[76.605987,9.354975],[76.605879,9.353872],[76.60584,9.353599],[76.605814,9.353476],[76.605735,9.353104],[76.605673,9.352809],[76.605583,9.352385],[76.605954,9.352248],[76.606113,9.352189],[76.606301,9.35212],[76.606966,9.351865],[76.607098,9.351804],[76.607232,9.351742],[76.607332,9.351745],[76.60746,9.351754],[76.607589,9.351763],[76.607706,9.351726],[76.607788,9.351683],[76.607926,9.35161],[76.608182,9.351493],[76.608291,9.351775],[76.608404,9.352065],[76.608474,9.352243],[76.608591,9.352534],[76.608634,9.352671],[76.608774,9.353104],[76.608814,9.353218],[76.608873,9.353499],[76.608952,9.353935],[76.609039,9.354412],[76.609026,9.354751],[76.60889,9.354941],[76.608789,9.355083],[76.608662,9.355261],[76.608515,9.355466],[76.608203,9.355776],[76.608111,9.355848],[76.608117,9.356115],[76.608143,9.356531],[76.60816,9.356773],[76.608173,9.357325],[76.608188,9.358227],[76.60816,9.35856],[76.608151,9.358668],[76.608132,9.358889],[76.608077,9.359023],[76.608032,9.359133],[76.607967,9.359337],[76.607911,9.359534],[76.607891,9.35963],[76.607856,9.3598],[76.607775,9.36011],[76.607662,9.360457],[76.607628,9.360603],[76.607598,9.360729],[76.607542,9.360974],[76.607513,9.361098],[76.60743,9.36114],[76.60734,9.361186],[76.607206,9.361193],[76.607104,9.361199],[76.607079,9.361297],[76.607066,9.361636],[76.607104,9.362094],[76.60718,9.362351],[76.607218,9.362705],[76.607228,9.362804],[76.607191,9.363072],[76.607155,9.363202],[76.607113,9.363323],[76.607062,9.363463],[76.606945,9.363683],[76.606894,9.363777],[76.606808,9.363951],[76.606755,9.364073],[76.606675,9.364417],[76.606597,9.364752],[76.606599,9.36506],[76.606602,9.365366],[76.606612,9.365759],[76.606612,9.365863],[76.606621,9.366069],[76.606719,9.366406],[76.606968,9.366865],[76.606448,9.36691],[76.606404,9.366942],[76.606376,9.366961],[76.606355,9.366976],[76.606313,9.36699],[76.606279,9.366983],[76.606214,9.366956],[76.606185,9.366936],[76.60615,9.366911],[76.606131,9.3669],[76.606117,9.366891],[76.606067,9.366874],[76.605998,9.36686],[76.605929,9.36686]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-19T11:53:29.802Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"subheesh\",\"Ward_Name\":\"ELAKUTTOOR\",\"Ward_No\":\"5\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.611225,9.353549],[76.611216,9.353542],[76.610988,9.35335],[76.610897,9.353133],[76.610811,9.352931],[76.610715,9.352588],[76.610743,9.352324],[76.610756,9.352214],[76.610779,9.351997],[76.610825,9.351583],[76.610835,9.351487],[76.610894,9.351388],[76.611083,9.351068],[76.611287,9.350725],[76.611502,9.350361],[76.611583,9.350225],[76.611686,9.3501],[76.611981,9.349741],[76.61208,9.34962],[76.612182,9.349496],[76.612184,9.349111],[76.612451,9.349064],[76.612578,9.349034],[76.612824,9.348972],[76.613062,9.348908],[76.613178,9.34886],[76.613411,9.348772],[76.613614,9.348726],[76.613725,9.348698],[76.613858,9.348677],[76.61398,9.348589],[76.614078,9.348554],[76.614176,9.348523],[76.614356,9.348481],[76.614581,9.348421],[76.614744,9.348396],[76.614907,9.348434],[76.614944,9.348557],[76.614981,9.348787],[76.615164,9.348807],[76.615263,9.348793],[76.615557,9.348746],[76.615776,9.349418],[76.6161,9.349617],[76.616359,9.349742],[76.616483,9.349821],[76.616606,9.349928],[76.616673,9.349994],[76.616753,9.350126],[76.61694,9.350379],[76.617101,9.350596],[76.617081,9.350719],[76.616972,9.350892],[76.61682,9.351133],[76.616865,9.351385],[76.616903,9.351615],[76.616923,9.351751],[76.616949,9.351936],[76.616978,9.352169],[76.617423,9.352186],[76.617692,9.352018],[76.617796,9.351953],[76.618061,9.351916],[76.618272,9.35195],[76.618484,9.351983],[76.618659,9.351944],[76.618751,9.351938],[76.618898,9.35193],[76.6192,9.351941],[76.61947,9.35191],[76.619598,9.351986],[76.619711,9.352054],[76.619632,9.352189],[76.619522,9.352309],[76.619769,9.352715],[76.620187,9.35276],[76.620797,9.352828],[76.622003,9.35304],[76.622142,9.353065],[76.62241,9.353218],[76.622852,9.353369],[76.623029,9.353429],[76.623203,9.353488],[76.623299,9.353521],[76.62353,9.353599],[76.623774,9.354063],[76.623939,9.354423],[76.62393,9.354863],[76.62403,9.355661],[76.624147,9.355961],[76.624184,9.356057],[76.624221,9.356151],[76.624258,9.356247],[76.624367,9.356527],[76.62407,9.356524],[76.623884,9.35655],[76.623667,9.356576],[76.623197,9.356653],[76.622853,9.356706],[76.622523,9.356807],[76.622425,9.356842],[76.622197,9.356956],[76.622026,9.357036],[76.621856,9.357116],[76.621405,9.35725],[76.621135,9.357335],[76.620855,9.357415],[76.620552,9.357497],[76.620174,9.357592],[76.620037,9.357616],[76.619899,9.357641],[76.619685,9.357678],[76.61941,9.357725],[76.619158,9.357778],[76.61894,9.357828],[76.618733,9.357863],[76.618514,9.357947],[76.618314,9.358096],[76.618239,9.358279],[76.618078,9.358407],[76.617893,9.358472],[76.617774,9.358499],[76.617655,9.358527],[76.617449,9.358554],[76.617384,9.358386],[76.617473,9.358126],[76.617572,9.357962],[76.617702,9.357768],[76.617763,9.357681],[76.617897,9.357489],[76.618058,9.357136],[76.61806,9.356761],[76.617962,9.356543],[76.617868,9.356332],[76.617773,9.35612],[76.617726,9.356015],[76.617631,9.355813],[76.617622,9.355663],[76.617765,9.355527],[76.617898,9.355468],[76.618066,9.355391],[76.618309,9.355266],[76.618403,9.355214],[76.61862,9.355061],[76.618838,9.354909],[76.618795,9.35474],[76.61876,9.354655],[76.618637,9.3545],[76.618569,9.354428],[76.618474,9.354334],[76.618364,9.35425],[76.618126,9.35411],[76.617864,9.354023],[76.617762,9.35403],[76.617062,9.354186],[76.616724,9.354239],[76.616281,9.354306],[76.616224,9.354315],[76.616104,9.35375],[76.616069,9.353695],[76.6158,9.353682],[76.615188,9.353571],[76.61458,9.353459],[76.614172,9.353442],[76.613999,9.353472],[76.613539,9.353733],[76.613313,9.353832],[76.612814,9.353849],[76.612107,9.353823],[76.611746,9.353729],[76.611417,9.353583],[76.611308,9.353541],[76.611225,9.353549]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-19T10:28:18.525Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Othera\",\"Surveyor\":\"subheesh\",\"Ward_Name\":\"OTHERA\",\"Ward_No\":\"8\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.588529,9.358851],[76.588723,9.358544],[76.589225,9.357756],[76.589448,9.357401],[76.58955,9.35724],[76.589651,9.35708],[76.589876,9.356732],[76.590532,9.355718],[76.590799,9.355282],[76.590949,9.355044],[76.591082,9.354832],[76.591138,9.354737],[76.591225,9.35464],[76.591501,9.354658],[76.591668,9.354668],[76.591782,9.354674],[76.591895,9.35468],[76.592147,9.354702],[76.592433,9.354741],[76.592788,9.354789],[76.59293,9.354803],[76.593072,9.354818],[76.593275,9.354863],[76.593339,9.354957],[76.593358,9.355073],[76.593349,9.355285],[76.593339,9.355445],[76.59333,9.355607],[76.593336,9.355731],[76.593362,9.355911],[76.593387,9.356091],[76.593404,9.3562],[76.59358,9.356518],[76.593734,9.356649],[76.593892,9.356859],[76.594057,9.35718],[76.5941,9.357264],[76.594177,9.357448],[76.594233,9.357613],[76.594275,9.357775],[76.594304,9.357891],[76.594321,9.358117],[76.594326,9.358236],[76.594333,9.35838],[76.594304,9.358535],[76.594286,9.358663],[76.594272,9.358765],[76.594256,9.359005],[76.594086,9.359387],[76.593876,9.35949],[76.593745,9.359544],[76.593651,9.359589],[76.593556,9.359634],[76.593412,9.359733],[76.593363,9.359898],[76.593418,9.360091],[76.593429,9.360234],[76.593437,9.360334],[76.593425,9.360584],[76.593205,9.3606],[76.593087,9.360606],[76.592873,9.360594],[76.592716,9.360553],[76.592577,9.360413],[76.592604,9.360175],[76.592458,9.360063],[76.592458,9.359879],[76.592433,9.359775],[76.592397,9.359627],[76.592356,9.35945],[76.592323,9.359271],[76.592096,9.359234],[76.591936,9.359209],[76.591503,9.359339],[76.591566,9.359595],[76.591595,9.359729],[76.59161,9.359843],[76.591628,9.359975],[76.591638,9.360137],[76.591645,9.360243],[76.591608,9.360385],[76.59154,9.360481],[76.591531,9.360746],[76.591626,9.360838],[76.591759,9.360835],[76.592012,9.360831],[76.592107,9.360831],[76.592373,9.360887],[76.592456,9.36106],[76.592529,9.361225],[76.592613,9.361537],[76.592643,9.361644],[76.592763,9.361913],[76.592516,9.362423],[76.592494,9.362574],[76.592436,9.362984],[76.592481,9.363321],[76.592508,9.363638],[76.592521,9.363791],[76.592585,9.364128],[76.592646,9.364406],[76.592731,9.364263],[76.592831,9.364085],[76.592929,9.363952],[76.593047,9.363871],[76.593137,9.363813],[76.593316,9.363723],[76.593418,9.363678],[76.593576,9.363609],[76.593843,9.363576],[76.594067,9.363502],[76.594289,9.363414],[76.594434,9.36338],[76.594661,9.363319],[76.594985,9.363274],[76.595238,9.363238],[76.595279,9.363457],[76.595319,9.363675],[76.595352,9.363769],[76.595404,9.363863],[76.595424,9.364183],[76.595448,9.364276],[76.595476,9.364495],[76.595472,9.364589],[76.595455,9.365034],[76.59545,9.365191],[76.595447,9.365299],[76.595443,9.365525],[76.595445,9.365852],[76.595418,9.36598],[76.59528,9.366132],[76.595136,9.366203],[76.594969,9.366273],[76.594827,9.366358],[76.594596,9.366585],[76.594469,9.366782],[76.594363,9.36701],[76.594315,9.367165],[76.594168,9.367075],[76.594101,9.366981],[76.593936,9.366746],[76.59384,9.366663],[76.593723,9.366641],[76.59349,9.366682],[76.593388,9.366716],[76.593285,9.366709],[76.593147,9.36667],[76.592979,9.366633],[76.592652,9.366514],[76.592485,9.36648],[76.592235,9.366438],[76.592117,9.366446],[76.592146,9.366631],[76.59218,9.366826],[76.592244,9.367119],[76.592313,9.367328],[76.592372,9.367503],[76.592425,9.367694],[76.592442,9.367837],[76.592473,9.368099],[76.592492,9.368272],[76.5925,9.368367],[76.592507,9.368469],[76.592513,9.368566],[76.592518,9.368685],[76.592513,9.368812],[76.592416,9.368796],[76.591795,9.3687],[76.591445,9.368638],[76.591257,9.368603],[76.590821,9.368501],[76.59056,9.36834],[76.590465,9.368282],[76.590297,9.368036],[76.590198,9.367669],[76.590098,9.367302],[76.589881,9.366535],[76.589817,9.365828],[76.589781,9.365619],[76.589828,9.365069],[76.589781,9.364774],[76.589803,9.364455],[76.589692,9.36389],[76.589673,9.363792],[76.589277,9.36318],[76.589023,9.362947],[76.588695,9.362646],[76.588438,9.362409],[76.588065,9.362051],[76.587798,9.361795],[76.587515,9.361508],[76.587311,9.3613],[76.587123,9.36119],[76.587205,9.361058],[76.587435,9.360639],[76.587637,9.360305],[76.587736,9.36015],[76.587812,9.36003],[76.588012,9.359721],[76.588176,9.359458],[76.58825,9.359339],[76.588396,9.359084],[76.588529,9.358851]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-18T11:28:06.794Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Mathirampuzha\",\"Surveyor\":\"umesh\",\"Ward_Name\":\"MATHIRAMPUZHA\",\"Ward_No\":\"3\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.595871,9.355056],[76.595917,9.354484],[76.59599,9.354412],[76.596455,9.353947],[76.596814,9.353589],[76.597163,9.353239],[76.597525,9.352878],[76.597848,9.352554],[76.598268,9.352132],[76.598371,9.351457],[76.598486,9.351451],[76.598953,9.351426],[76.599078,9.351428],[76.599203,9.351431],[76.599687,9.35146],[76.599835,9.351487],[76.600228,9.351561],[76.600622,9.351731],[76.600666,9.351848],[76.600912,9.352151],[76.601026,9.352274],[76.601143,9.352324],[76.601321,9.352363],[76.601444,9.35239],[76.601824,9.352458],[76.602061,9.352385],[76.602472,9.352257],[76.602585,9.352222],[76.60291,9.352196],[76.603241,9.35219],[76.603325,9.352621],[76.603342,9.35272],[76.603227,9.352977],[76.603324,9.353662],[76.602961,9.35378],[76.602887,9.353906],[76.602821,9.354082],[76.602756,9.354215],[76.602692,9.354347],[76.602601,9.354528],[76.602895,9.354609],[76.60324,9.354763],[76.603223,9.354978],[76.603187,9.355458],[76.603178,9.355573],[76.603257,9.355819],[76.603379,9.356202],[76.603557,9.356761],[76.603558,9.356871],[76.603562,9.357782],[76.603094,9.357888],[76.602787,9.35796],[76.602657,9.357987],[76.602414,9.358042],[76.602167,9.358098],[76.601908,9.358057],[76.601745,9.358111],[76.601617,9.358153],[76.60142,9.358287],[76.601312,9.35836],[76.601114,9.358416],[76.600997,9.358449],[76.60079,9.358499],[76.600531,9.358697],[76.600578,9.358822],[76.60069,9.359119],[76.600887,9.359428],[76.600979,9.359572],[76.601216,9.359931],[76.601321,9.360092],[76.601523,9.360464],[76.601676,9.360752],[76.601827,9.360968],[76.601913,9.361102],[76.602,9.361235],[76.602249,9.361688],[76.602161,9.362017],[76.602021,9.362269],[76.601946,9.362379],[76.60194,9.362809],[76.601934,9.363154],[76.601926,9.363396],[76.601421,9.363383],[76.60117,9.363414],[76.601071,9.36343],[76.600743,9.363484],[76.600312,9.363476],[76.600009,9.363471],[76.599543,9.363406],[76.59938,9.363371],[76.599216,9.363336],[76.598912,9.36325],[76.598809,9.363269],[76.598474,9.363331],[76.598304,9.363267],[76.598065,9.363177],[76.597889,9.363107],[76.597987,9.362911],[76.598175,9.362491],[76.598262,9.362298],[76.598349,9.362104],[76.598446,9.361889],[76.59854,9.361679],[76.598631,9.361476],[76.598709,9.361268],[76.598774,9.361082],[76.59885,9.360865],[76.598898,9.360728],[76.598677,9.360655],[76.598443,9.360661],[76.598196,9.360656],[76.597961,9.36058],[76.597963,9.360213],[76.59796,9.360053],[76.597956,9.359893],[76.597939,9.359749],[76.597929,9.359622],[76.597927,9.359489],[76.597904,9.359206],[76.597899,9.359114],[76.59789,9.358956],[76.597866,9.358768],[76.597829,9.358592],[76.597792,9.358415],[76.597726,9.358264],[76.597585,9.358261],[76.597275,9.358327],[76.597147,9.35835],[76.597019,9.358374],[76.596718,9.358446],[76.59656,9.3585],[76.596441,9.358538],[76.596263,9.358595],[76.596132,9.358617],[76.59597,9.358649],[76.595794,9.358674],[76.595574,9.358702],[76.595492,9.358451],[76.595436,9.358184],[76.595418,9.358066],[76.59533,9.357855],[76.595273,9.357635],[76.595284,9.357483],[76.595316,9.357359],[76.595378,9.357132],[76.59545,9.3569],[76.59552,9.356687],[76.595584,9.356461],[76.595621,9.356362],[76.595659,9.356264],[76.595689,9.35616],[76.595747,9.356061],[76.595801,9.355865],[76.595804,9.355731],[76.595787,9.35551],[76.595845,9.355285],[76.595871,9.355056]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-20T06:34:16.661Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Madukolil\",\"Surveyor\":\"subeesh\",\"Ward_Name\":\"MADUKOLIL\",\"Ward_No\":\"11\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.562373,9.36745],[76.56214,9.367183],[76.56194,9.366934],[76.561903,9.366792],[76.561848,9.366593],[76.56174,9.366202],[76.561664,9.365925],[76.561713,9.365578],[76.561748,9.365329],[76.561813,9.364988],[76.561875,9.364662],[76.561892,9.364304],[76.561711,9.363745],[76.561374,9.363705],[76.5611,9.363707],[76.560847,9.363709],[76.560786,9.363356],[76.56073,9.363031],[76.560699,9.362865],[76.561133,9.362688],[76.561269,9.362632],[76.561464,9.362549],[76.561592,9.362517],[76.561733,9.362475],[76.56192,9.362335],[76.562004,9.362143],[76.56202,9.361885],[76.561979,9.361795],[76.562011,9.361669],[76.562056,9.361487],[76.562085,9.361246],[76.562115,9.360985],[76.562154,9.360649],[76.562182,9.360521],[76.562246,9.360236],[76.562802,9.359788],[76.562743,9.359579],[76.56277,9.359188],[76.562749,9.359013],[76.562872,9.35839],[76.562888,9.358027],[76.562928,9.357488],[76.562916,9.357316],[76.562843,9.356824],[76.5628,9.356666],[76.562036,9.356111],[76.561625,9.355826],[76.56154,9.355755],[76.560724,9.355208],[76.560649,9.354871],[76.560637,9.354726],[76.560691,9.354371],[76.560929,9.354216],[76.56103,9.35415],[76.561221,9.353973],[76.561355,9.353853],[76.561743,9.353402],[76.562375,9.353589],[76.563079,9.353998],[76.563669,9.354292],[76.564296,9.354062],[76.564986,9.353602],[76.565228,9.353018],[76.56566,9.352992],[76.565742,9.353508],[76.565792,9.353788],[76.566167,9.35469],[76.566413,9.355231],[76.566666,9.355606],[76.567016,9.355704],[76.567341,9.355719],[76.567932,9.355688],[76.568601,9.355699],[76.570345,9.35578],[76.571998,9.355691],[76.572114,9.356915],[76.572305,9.358944],[76.572089,9.359702],[76.571912,9.359803],[76.571252,9.360182],[76.570015,9.36061],[76.568847,9.360711],[76.568482,9.360656],[76.568073,9.360593],[76.567721,9.360714],[76.567246,9.360986],[76.567068,9.360743],[76.566868,9.360469],[76.566381,9.359968],[76.566361,9.360394],[76.566352,9.360593],[76.566343,9.360771],[76.56585,9.360891],[76.565677,9.360933],[76.565243,9.361138],[76.564867,9.361317],[76.564832,9.361827],[76.564803,9.362246],[76.56475,9.363016],[76.564827,9.363651],[76.564897,9.364233],[76.564968,9.364307],[76.56508,9.364422],[76.565411,9.364396],[76.565704,9.364374],[76.56624,9.364249],[76.566595,9.364249],[76.567091,9.364248],[76.567388,9.364256],[76.567487,9.364258],[76.56761,9.364252],[76.568174,9.364312],[76.568135,9.364669],[76.568088,9.365101],[76.568044,9.365506],[76.568029,9.365638],[76.568011,9.365802],[76.567998,9.365953],[76.567928,9.366382],[76.567911,9.366488],[76.567893,9.366652],[76.567892,9.366753],[76.56789,9.366923],[76.567631,9.366817],[76.567512,9.366761],[76.567364,9.366717],[76.566959,9.366573],[76.566478,9.366574],[76.56636,9.366563],[76.565907,9.366521],[76.565619,9.366547],[76.565327,9.366595],[76.565082,9.366654],[76.564836,9.366747],[76.564579,9.366846],[76.564384,9.366925],[76.564239,9.366986],[76.564054,9.36706],[76.563667,9.367216],[76.563406,9.367334],[76.563314,9.367375],[76.563026,9.367601],[76.56277,9.367681],[76.56253,9.367629],[76.562373,9.36745]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-17T10:47:08.110Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Umesh\",\"Ward_Name\":\"VENPALA\",\"Ward_No\":\"1\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.601824,9.352458],[76.601444,9.35239],[76.601321,9.352363],[76.601143,9.352324],[76.601026,9.352274],[76.600912,9.352151],[76.600666,9.351848],[76.600622,9.351731],[76.600228,9.351561],[76.599835,9.351487],[76.599687,9.35146],[76.599203,9.351431],[76.599078,9.351428],[76.598953,9.351426],[76.598486,9.351451],[76.598371,9.351457],[76.597844,9.351486],[76.597168,9.351186],[76.596837,9.351039],[76.596718,9.351154],[76.596485,9.351375],[76.596328,9.351524],[76.596132,9.351712],[76.595984,9.351379],[76.595792,9.351039],[76.595669,9.350885],[76.595543,9.350641],[76.59554,9.350634],[76.595489,9.350398],[76.595765,9.350121],[76.596037,9.350001],[76.596312,9.349782],[76.596485,9.349622],[76.596573,9.349493],[76.596654,9.349292],[76.596777,9.348996],[76.596854,9.348639],[76.59695,9.348332],[76.597035,9.347937],[76.597154,9.347569],[76.597346,9.347103],[76.597658,9.346814],[76.597907,9.346518],[76.598223,9.346222],[76.598292,9.346173],[76.598592,9.346146],[76.59885,9.346215],[76.599126,9.34634],[76.599396,9.346587],[76.59973,9.346882],[76.600034,9.347065],[76.600372,9.347125],[76.600784,9.347171],[76.601149,9.347235],[76.601322,9.347243],[76.60153,9.347106],[76.60158,9.346909],[76.601633,9.346613],[76.601664,9.346192],[76.601733,9.345797],[76.602226,9.345391],[76.602625,9.345114],[76.602895,9.344887],[76.603233,9.344416],[76.60346,9.344113],[76.603648,9.343942],[76.603725,9.343908],[76.603867,9.344037],[76.603964,9.344378],[76.604148,9.344633],[76.604379,9.34483],[76.604771,9.344932],[76.605225,9.345111],[76.605456,9.345183],[76.605986,9.34519],[76.606409,9.345141],[76.606655,9.345065],[76.606636,9.345225],[76.606672,9.345561],[76.606689,9.345678],[76.606706,9.345806],[76.606716,9.345907],[76.606726,9.346009],[76.606744,9.346195],[76.606779,9.346433],[76.606835,9.346873],[76.60688,9.347191],[76.606969,9.347429],[76.607013,9.347509],[76.607105,9.347676],[76.607252,9.347846],[76.607441,9.347989],[76.607586,9.348099],[76.607974,9.348383],[76.608248,9.348481],[76.60858,9.3486],[76.609029,9.348776],[76.609128,9.348828],[76.609226,9.34888],[76.609378,9.34892],[76.609627,9.348868],[76.609741,9.34876],[76.609852,9.348654],[76.61009,9.348046],[76.610262,9.347944],[76.610396,9.347875],[76.610663,9.347821],[76.610936,9.347764],[76.61115,9.347735],[76.61136,9.347707],[76.61148,9.347699],[76.611461,9.347951],[76.611354,9.348099],[76.611232,9.348423],[76.610863,9.34922],[76.610774,9.349413],[76.61067,9.349459],[76.61053,9.349504],[76.610285,9.349582],[76.609923,9.349823],[76.60981,9.349909],[76.609711,9.349984],[76.609546,9.350135],[76.609465,9.350209],[76.609124,9.350521],[76.60887,9.351004],[76.608843,9.351106],[76.608791,9.351303],[76.608687,9.351333],[76.60846,9.351397],[76.608182,9.351493],[76.607926,9.35161],[76.607788,9.351683],[76.607706,9.351726],[76.607589,9.351763],[76.60746,9.351754],[76.607332,9.351745],[76.607232,9.351742],[76.607098,9.351804],[76.606966,9.351865],[76.606301,9.35212],[76.606113,9.352189],[76.605954,9.352248],[76.605583,9.352385],[76.605673,9.352809],[76.605735,9.353104],[76.605814,9.353476],[76.60584,9.353599],[76.605879,9.353872],[76.605987,9.354975],[76.605866,9.354973],[76.605273,9.354966],[76.605145,9.354965],[76.605042,9.354956],[76.60489,9.354944],[76.604705,9.354929],[76.604508,9.354912],[76.604419,9.35453],[76.604227,9.354586],[76.604036,9.354642],[76.60383,9.354673],[76.603695,9.354694],[76.603555,9.354715],[76.60324,9.354763],[76.602895,9.354609],[76.602601,9.354528],[76.602692,9.354347],[76.602756,9.354215],[76.602821,9.354082],[76.602887,9.353906],[76.602961,9.35378],[76.603324,9.353662],[76.603227,9.352977],[76.603342,9.35272],[76.603325,9.352621],[76.603241,9.35219],[76.60291,9.352196],[76.602585,9.352222],[76.602472,9.352257],[76.602061,9.352385],[76.601824,9.352458]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-20T05:52:51.847Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Subeesh\",\"Ward_Name\":\"THYMARAVUMKARA\",\"Ward_No\":\"10\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.57618,9.368252],[76.575802,9.368251],[76.575542,9.368282],[76.575186,9.368283],[76.575076,9.368283],[76.574859,9.36825],[76.574687,9.368224],[76.574566,9.368212],[76.574475,9.368194],[76.574273,9.368154],[76.574179,9.368148],[76.573972,9.368144],[76.573697,9.368193],[76.573485,9.368292],[76.573324,9.368367],[76.573077,9.368449],[76.572765,9.368505],[76.572591,9.368535],[76.572435,9.368513],[76.572208,9.368479],[76.572081,9.368461],[76.571715,9.368385],[76.571426,9.368325],[76.571225,9.368283],[76.57102,9.368236],[76.570511,9.368121],[76.570265,9.368061],[76.570003,9.367996],[76.569762,9.367893],[76.569318,9.367705],[76.568943,9.367545],[76.568793,9.367455],[76.568105,9.367044],[76.568016,9.366985],[76.56789,9.366923],[76.567892,9.366753],[76.567893,9.366652],[76.567911,9.366488],[76.567928,9.366382],[76.567998,9.365953],[76.568011,9.365802],[76.568029,9.365638],[76.568044,9.365506],[76.568088,9.365101],[76.568135,9.364669],[76.568174,9.364312],[76.56761,9.364252],[76.567487,9.364258],[76.567388,9.364256],[76.567091,9.364248],[76.566595,9.364249],[76.56624,9.364249],[76.565704,9.364374],[76.565411,9.364396],[76.56508,9.364422],[76.564968,9.364307],[76.564897,9.364233],[76.564827,9.363651],[76.56475,9.363016],[76.564803,9.362246],[76.564832,9.361827],[76.564867,9.361317],[76.565243,9.361138],[76.565677,9.360933],[76.56585,9.360891],[76.566343,9.360771],[76.566352,9.360593],[76.566361,9.360394],[76.566381,9.359968],[76.566868,9.360469],[76.567068,9.360743],[76.567246,9.360986],[76.56734,9.361124],[76.567393,9.361197],[76.567723,9.36155],[76.56791,9.361752],[76.568358,9.362235],[76.569163,9.362639],[76.56981,9.36293],[76.570058,9.36297],[76.570193,9.362991],[76.570351,9.363016],[76.570615,9.362988],[76.570949,9.362953],[76.571506,9.362984],[76.571952,9.362961],[76.572161,9.36295],[76.572317,9.362939],[76.572724,9.362633],[76.572959,9.36216],[76.573095,9.36172],[76.573137,9.361585],[76.57337,9.361069],[76.573447,9.360917],[76.573685,9.360697],[76.573895,9.360516],[76.574342,9.360429],[76.574562,9.360381],[76.575002,9.360324],[76.575492,9.360264],[76.575255,9.360811],[76.575119,9.361124],[76.575059,9.361344],[76.574959,9.361714],[76.57491,9.362091],[76.574892,9.362313],[76.574879,9.362585],[76.574877,9.362778],[76.574904,9.363552],[76.575135,9.364064],[76.57526,9.364336],[76.575351,9.364526],[76.575497,9.364822],[76.57567,9.365166],[76.575861,9.365371],[76.576336,9.365882],[76.57643,9.366028],[76.57665,9.366371],[76.576862,9.366682],[76.576957,9.36684],[76.577029,9.366961],[76.577053,9.367097],[76.577103,9.367381],[76.576965,9.367644],[76.576789,9.36798],[76.576559,9.368083],[76.57618,9.368252]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-17T10:34:57.358Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Umesh\",\"Ward_Name\":\"KADALIMANGALAM\",\"Ward_No\":\"2\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.60335,9.365977],[76.603383,9.365993],[76.603415,9.366034],[76.603458,9.366077],[76.60351,9.366133],[76.60355,9.366193],[76.603595,9.366259],[76.603672,9.36634],[76.603271,9.366855],[76.603107,9.367059],[76.60271,9.367771],[76.602578,9.367849],[76.602384,9.367965],[76.602171,9.368008],[76.602019,9.36804],[76.601936,9.368258],[76.60156,9.368522],[76.601456,9.368684],[76.601282,9.368852],[76.600905,9.368688],[76.600237,9.36921],[76.599654,9.369503],[76.599656,9.369735],[76.599303,9.37004],[76.599091,9.36995],[76.59881,9.369993],[76.598626,9.370064],[76.598483,9.370113],[76.59809,9.370105],[76.597956,9.370099],[76.597812,9.370084],[76.597479,9.370041],[76.597279,9.370073],[76.597163,9.370132],[76.596792,9.370321],[76.596636,9.370401],[76.596634,9.370808],[76.596168,9.370654],[76.596052,9.370623],[76.595571,9.370322],[76.595326,9.370175],[76.595063,9.37003],[76.594907,9.369935],[76.594494,9.369716],[76.59417,9.369513],[76.593786,9.369273],[76.593487,9.369108],[76.593334,9.36906],[76.592947,9.368943],[76.592513,9.368812],[76.592518,9.368685],[76.592513,9.368566],[76.592507,9.368469],[76.5925,9.368367],[76.592492,9.368272],[76.592473,9.368099],[76.592442,9.367837],[76.592425,9.367694],[76.592372,9.367503],[76.592313,9.367328],[76.592244,9.367119],[76.59218,9.366826],[76.592146,9.366631],[76.592117,9.366446],[76.592235,9.366438],[76.592485,9.36648],[76.592652,9.366514],[76.592979,9.366633],[76.593147,9.36667],[76.593285,9.366709],[76.593388,9.366716],[76.59349,9.366682],[76.593723,9.366641],[76.59384,9.366663],[76.593936,9.366746],[76.594101,9.366981],[76.594168,9.367075],[76.594315,9.367165],[76.594363,9.36701],[76.594469,9.366782],[76.594596,9.366585],[76.594827,9.366358],[76.594969,9.366273],[76.595136,9.366203],[76.59528,9.366132],[76.595418,9.36598],[76.595445,9.365852],[76.595443,9.365525],[76.595447,9.365299],[76.59545,9.365191],[76.595455,9.365034],[76.595472,9.364589],[76.595476,9.364495],[76.595448,9.364276],[76.595424,9.364183],[76.595404,9.363863],[76.595691,9.363761],[76.596047,9.363635],[76.596344,9.363529],[76.59654,9.363461],[76.596884,9.363372],[76.597222,9.363284],[76.597563,9.363196],[76.597796,9.363136],[76.597889,9.363107],[76.598065,9.363177],[76.598304,9.363267],[76.598474,9.363331],[76.598809,9.363269],[76.598912,9.36325],[76.599216,9.363336],[76.59938,9.363371],[76.599543,9.363406],[76.600009,9.363471],[76.600312,9.363476],[76.600743,9.363484],[76.601071,9.36343],[76.60117,9.363414],[76.601421,9.363383],[76.601926,9.363396],[76.602174,9.36337],[76.602223,9.363383],[76.602319,9.363438],[76.602351,9.363454],[76.602365,9.363462],[76.602408,9.36348],[76.602447,9.363507],[76.602476,9.363539],[76.602495,9.36359],[76.602506,9.36367],[76.602489,9.36377],[76.602484,9.363815],[76.602473,9.363867],[76.602452,9.363914],[76.602427,9.363965],[76.602392,9.364011],[76.602311,9.364041],[76.602254,9.364047],[76.602202,9.364086],[76.602173,9.364112],[76.602154,9.364171],[76.602146,9.36423],[76.602147,9.364292],[76.602147,9.364379],[76.602166,9.36443],[76.602211,9.364506],[76.60223,9.364546],[76.602257,9.364604],[76.60228,9.364654],[76.602344,9.364793],[76.602522,9.365054],[76.602574,9.365127],[76.602637,9.365224],[76.602692,9.365283],[76.60275,9.365336],[76.602867,9.365441],[76.602905,9.365484],[76.602949,9.365537],[76.602995,9.365685],[76.603006,9.365742],[76.603037,9.365801],[76.603075,9.365847],[76.603167,9.365905],[76.603216,9.365924],[76.603295,9.365964],[76.60335,9.365977]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-19T09:03:06.002Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Pandisseri\",\"Surveyor\":\"subeesh\",\"Ward_Name\":\"PANDISSERI\",\"Ward_No\":\"4\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.585147,9.355151],[76.585306,9.355091],[76.585403,9.355054],[76.585515,9.3551],[76.58562,9.355142],[76.585735,9.35518],[76.585836,9.355185],[76.586014,9.355137],[76.586127,9.355099],[76.586246,9.355055],[76.586383,9.355031],[76.58653,9.355052],[76.586519,9.354949],[76.586505,9.354819],[76.586445,9.354284],[76.587024,9.353968],[76.587346,9.353791],[76.588269,9.353727],[76.588426,9.353722],[76.588606,9.353723],[76.589038,9.353739],[76.589744,9.353896],[76.590241,9.354249],[76.59049,9.354385],[76.590878,9.354596],[76.591082,9.354832],[76.590949,9.355044],[76.590799,9.355282],[76.590532,9.355718],[76.589876,9.356732],[76.589651,9.35708],[76.58955,9.35724],[76.589448,9.357401],[76.589225,9.357756],[76.588723,9.358544],[76.588529,9.358851],[76.588396,9.359084],[76.58825,9.359339],[76.588176,9.359458],[76.588012,9.359721],[76.587812,9.36003],[76.587736,9.36015],[76.587637,9.360305],[76.587435,9.360639],[76.587205,9.361058],[76.587123,9.36119],[76.586957,9.361068],[76.58683,9.360975],[76.586648,9.360947],[76.586327,9.360929],[76.586234,9.360924],[76.585918,9.361016],[76.585707,9.361129],[76.585466,9.361258],[76.584895,9.361727],[76.584812,9.361793],[76.584287,9.362263],[76.584073,9.362445],[76.583428,9.36296],[76.583264,9.363073],[76.58311,9.363154],[76.582839,9.363236],[76.582697,9.363268],[76.582321,9.363264],[76.581756,9.36307],[76.58114,9.362679],[76.580993,9.362563],[76.580716,9.362346],[76.580548,9.362229],[76.580233,9.36201],[76.580155,9.361962],[76.579715,9.361702],[76.579415,9.361529],[76.579469,9.361429],[76.579598,9.361111],[76.579701,9.360886],[76.579832,9.360606],[76.579946,9.360285],[76.580177,9.359727],[76.580248,9.359455],[76.580328,9.359203],[76.580467,9.358457],[76.580509,9.35823],[76.580637,9.357627],[76.580667,9.357336],[76.580728,9.357049],[76.580727,9.356801],[76.580726,9.356681],[76.580697,9.356551],[76.580649,9.356335],[76.580927,9.356275],[76.581205,9.356216],[76.581612,9.355979],[76.581893,9.355826],[76.582173,9.355673],[76.582438,9.355655],[76.582657,9.355641],[76.582824,9.355672],[76.583016,9.355683],[76.583194,9.355708],[76.583308,9.355724],[76.583536,9.355778],[76.583683,9.355803],[76.583829,9.355828],[76.584085,9.355792],[76.584235,9.355745],[76.584386,9.355676],[76.584572,9.355566],[76.584679,9.355483],[76.584764,9.35542],[76.584906,9.355315],[76.58503,9.355276],[76.585147,9.355151]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-18T09:50:07.789Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Kuttoor\",\"Surveyor\":\"umesh\",\"Ward_Name\":\"KUTTOOR\",\"Ward_No\":\"14\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.594824,9.35241],[76.595108,9.352395],[76.595497,9.352274],[76.5957,9.352152],[76.595867,9.352046],[76.595953,9.351909],[76.596132,9.351712],[76.596328,9.351524],[76.596485,9.351375],[76.596718,9.351154],[76.596837,9.351039],[76.597168,9.351186],[76.597844,9.351486],[76.598371,9.351457],[76.598268,9.352132],[76.597848,9.352554],[76.597525,9.352878],[76.597163,9.353239],[76.596814,9.353589],[76.596455,9.353947],[76.59599,9.354412],[76.595917,9.354484],[76.595871,9.355056],[76.595845,9.355285],[76.595787,9.35551],[76.595804,9.355731],[76.595801,9.355865],[76.595747,9.356061],[76.595689,9.35616],[76.595659,9.356264],[76.595621,9.356362],[76.595584,9.356461],[76.59552,9.356687],[76.59545,9.3569],[76.595378,9.357132],[76.595316,9.357359],[76.595284,9.357483],[76.595273,9.357635],[76.59533,9.357855],[76.595418,9.358066],[76.595436,9.358184],[76.595492,9.358451],[76.595574,9.358702],[76.595794,9.358674],[76.59597,9.358649],[76.596132,9.358617],[76.596263,9.358595],[76.596441,9.358538],[76.59656,9.3585],[76.596718,9.358446],[76.597019,9.358374],[76.597147,9.35835],[76.597275,9.358327],[76.597585,9.358261],[76.597726,9.358264],[76.597792,9.358415],[76.597829,9.358592],[76.597866,9.358768],[76.59789,9.358956],[76.597899,9.359114],[76.597904,9.359206],[76.597927,9.359489],[76.597929,9.359622],[76.597939,9.359749],[76.597956,9.359893],[76.59796,9.360053],[76.597963,9.360213],[76.597961,9.36058],[76.598196,9.360656],[76.598443,9.360661],[76.598677,9.360655],[76.598898,9.360728],[76.59885,9.360865],[76.598774,9.361082],[76.598709,9.361268],[76.598631,9.361476],[76.59854,9.361679],[76.598446,9.361889],[76.598349,9.362104],[76.598262,9.362298],[76.598175,9.362491],[76.597987,9.362911],[76.597889,9.363107],[76.597796,9.363136],[76.597563,9.363196],[76.597222,9.363284],[76.596884,9.363372],[76.59654,9.363461],[76.596344,9.363529],[76.596047,9.363635],[76.595691,9.363761],[76.595404,9.363863],[76.595352,9.363769],[76.595319,9.363675],[76.595279,9.363457],[76.595238,9.363238],[76.594985,9.363274],[76.594661,9.363319],[76.594434,9.36338],[76.594289,9.363414],[76.594067,9.363502],[76.593843,9.363576],[76.593576,9.363609],[76.593418,9.363678],[76.593316,9.363723],[76.593137,9.363813],[76.593047,9.363871],[76.592929,9.363952],[76.592831,9.364085],[76.592731,9.364263],[76.592646,9.364406],[76.592585,9.364128],[76.592521,9.363791],[76.592508,9.363638],[76.592481,9.363321],[76.592436,9.362984],[76.592494,9.362574],[76.592516,9.362423],[76.592763,9.361913],[76.592643,9.361644],[76.592613,9.361537],[76.592529,9.361225],[76.592456,9.36106],[76.592373,9.360887],[76.592107,9.360831],[76.592012,9.360831],[76.591759,9.360835],[76.591626,9.360838],[76.591531,9.360746],[76.59154,9.360481],[76.591608,9.360385],[76.591645,9.360243],[76.591638,9.360137],[76.591628,9.359975],[76.59161,9.359843],[76.591595,9.359729],[76.591566,9.359595],[76.591503,9.359339],[76.591936,9.359209],[76.592096,9.359234],[76.592323,9.359271],[76.592356,9.35945],[76.592397,9.359627],[76.592433,9.359775],[76.592458,9.359879],[76.592458,9.360063],[76.592604,9.360175],[76.592577,9.360413],[76.592716,9.360553],[76.592873,9.360594],[76.593087,9.360606],[76.593205,9.3606],[76.593425,9.360584],[76.593437,9.360334],[76.593429,9.360234],[76.593418,9.360091],[76.593363,9.359898],[76.593412,9.359733],[76.593556,9.359634],[76.593651,9.359589],[76.593745,9.359544],[76.593876,9.35949],[76.594086,9.359387],[76.594256,9.359005],[76.594272,9.358765],[76.594286,9.358663],[76.594304,9.358535],[76.594333,9.35838],[76.594326,9.358236],[76.594321,9.358117],[76.594304,9.357891],[76.594275,9.357775],[76.594233,9.357613],[76.594177,9.357448],[76.5941,9.357264],[76.594057,9.35718],[76.593892,9.356859],[76.593734,9.356649],[76.59358,9.356518],[76.593404,9.3562],[76.593387,9.356091],[76.593362,9.355911],[76.593336,9.355731],[76.59333,9.355607],[76.593339,9.355445],[76.593349,9.355285],[76.593358,9.355073],[76.593339,9.354957],[76.593275,9.354863],[76.593072,9.354818],[76.59293,9.354803],[76.592788,9.354789],[76.592433,9.354741],[76.592147,9.354702],[76.591895,9.35468],[76.591782,9.354674],[76.591668,9.354668],[76.591501,9.354658],[76.591225,9.35464],[76.591308,9.354522],[76.591472,9.354291],[76.591624,9.354077],[76.591852,9.353705],[76.59211,9.35329],[76.592182,9.353173],[76.592229,9.353093],[76.592344,9.352935],[76.59245,9.352789],[76.592578,9.352623],[76.59269,9.352466],[76.592756,9.352369],[76.592837,9.352257],[76.592919,9.352145],[76.592975,9.35207],[76.593066,9.351933],[76.593443,9.352076],[76.594219,9.352349],[76.594455,9.352397],[76.594824,9.35241]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-20T06:48:12.090Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Amikulam\",\"Surveyor\":\"subheesh\",\"Ward_Name\":\"AMIKULAM\",\"Ward_No\":\"12\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.591453,9.350998],[76.591662,9.351107],[76.591917,9.351245],[76.592162,9.351396],[76.592571,9.35162],[76.592763,9.351732],[76.593066,9.351933],[76.592975,9.35207],[76.592919,9.352145],[76.592837,9.352257],[76.592756,9.352369],[76.59269,9.352466],[76.592578,9.352623],[76.59245,9.352789],[76.592344,9.352935],[76.592229,9.353093],[76.592182,9.353173],[76.59211,9.35329],[76.591852,9.353705],[76.591624,9.354077],[76.591472,9.354291],[76.591308,9.354522],[76.591225,9.35464],[76.591138,9.354737],[76.591082,9.354832],[76.590878,9.354596],[76.59049,9.354385],[76.590241,9.354249],[76.589744,9.353896],[76.589038,9.353739],[76.588606,9.353723],[76.588426,9.353722],[76.588269,9.353727],[76.587346,9.353791],[76.587024,9.353968],[76.586445,9.354284],[76.586505,9.354819],[76.586519,9.354949],[76.58653,9.355052],[76.586383,9.355031],[76.586246,9.355055],[76.586127,9.355099],[76.586014,9.355137],[76.585836,9.355185],[76.585735,9.35518],[76.58562,9.355142],[76.585515,9.3551],[76.585403,9.355054],[76.585306,9.355091],[76.585147,9.355151],[76.58503,9.355276],[76.584906,9.355315],[76.584764,9.35542],[76.584679,9.355483],[76.584572,9.355566],[76.584386,9.355676],[76.584235,9.355745],[76.584085,9.355792],[76.583829,9.355828],[76.583683,9.355803],[76.583536,9.355778],[76.583308,9.355724],[76.583194,9.355708],[76.583016,9.355683],[76.582824,9.355672],[76.582657,9.355641],[76.582438,9.355655],[76.582173,9.355673],[76.581893,9.355826],[76.581612,9.355979],[76.581369,9.355461],[76.580777,9.354885],[76.580525,9.35482],[76.580084,9.354705],[76.579537,9.354563],[76.579097,9.354448],[76.578697,9.353955],[76.578582,9.353579],[76.5784,9.352989],[76.578636,9.353029],[76.578986,9.353103],[76.579388,9.353216],[76.579671,9.35332],[76.579847,9.353172],[76.580035,9.353019],[76.579963,9.352539],[76.579835,9.352276],[76.579538,9.351806],[76.579308,9.35149],[76.579289,9.351085],[76.579543,9.350314],[76.579823,9.34955],[76.579877,9.349403],[76.580489,9.348742],[76.580851,9.348335],[76.58139,9.347689],[76.58152,9.347177],[76.581719,9.347097],[76.582208,9.347158],[76.582507,9.347368],[76.582643,9.347561],[76.582691,9.348221],[76.582629,9.348495],[76.582577,9.349187],[76.582845,9.349264],[76.582995,9.349259],[76.583035,9.349251],[76.583124,9.349187],[76.583208,9.349114],[76.58336,9.34889],[76.583468,9.348727],[76.5836,9.348582],[76.58373,9.348486],[76.583827,9.348403],[76.583956,9.348343],[76.584087,9.348292],[76.584181,9.348262],[76.584344,9.348215],[76.584481,9.348187],[76.584621,9.348156],[76.584729,9.348129],[76.584847,9.348117],[76.585021,9.348126],[76.585158,9.348153],[76.585388,9.348189],[76.585598,9.348235],[76.585827,9.348325],[76.58596,9.348392],[76.586065,9.348491],[76.586199,9.348566],[76.586424,9.348857],[76.586506,9.349034],[76.586592,9.349229],[76.586647,9.349412],[76.586727,9.349686],[76.586776,9.3499],[76.586843,9.350157],[76.586951,9.350433],[76.587005,9.350584],[76.587077,9.350685],[76.587153,9.350777],[76.587216,9.350896],[76.587301,9.351067],[76.587364,9.351201],[76.587375,9.35129],[76.587515,9.351484],[76.58765,9.351601],[76.587756,9.351675],[76.587887,9.351698],[76.588026,9.351694],[76.588231,9.35162],[76.588393,9.35155],[76.588624,9.351392],[76.588765,9.351301],[76.588965,9.351176],[76.589163,9.35107],[76.589337,9.350975],[76.589617,9.350859],[76.589774,9.350788],[76.589951,9.350751],[76.590146,9.350733],[76.590974,9.350767],[76.591071,9.350784],[76.591231,9.35086],[76.591453,9.350998]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-18T10:12:14.597Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Umesh\",\"Ward_Name\":\"THALAYAR\",\"Ward_No\":\"13\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.575492,9.360264],[76.575002,9.360324],[76.574562,9.360381],[76.574342,9.360429],[76.573895,9.360516],[76.573685,9.360697],[76.573447,9.360917],[76.57337,9.361069],[76.573137,9.361585],[76.573095,9.36172],[76.572959,9.36216],[76.572724,9.362633],[76.572317,9.362939],[76.572161,9.36295],[76.571952,9.362961],[76.571506,9.362984],[76.570949,9.362953],[76.570615,9.362988],[76.570351,9.363016],[76.570193,9.362991],[76.570058,9.36297],[76.56981,9.36293],[76.569163,9.362639],[76.568358,9.362235],[76.56791,9.361752],[76.567723,9.36155],[76.567393,9.361197],[76.56734,9.361124],[76.567246,9.360986],[76.567721,9.360714],[76.568073,9.360593],[76.568482,9.360656],[76.568847,9.360711],[76.570015,9.36061],[76.571252,9.360182],[76.571912,9.359803],[76.572089,9.359702],[76.572305,9.358944],[76.572114,9.356915],[76.571998,9.355691],[76.572634,9.35568],[76.573039,9.355567],[76.5734,9.355491],[76.573544,9.355316],[76.573712,9.355017],[76.573813,9.354604],[76.573918,9.354235],[76.574122,9.353841],[76.574305,9.353708],[76.57469,9.353526],[76.574971,9.35344],[76.575408,9.353367],[76.575586,9.353394],[76.575778,9.353359],[76.575918,9.353391],[76.576062,9.353382],[76.577075,9.353396],[76.577435,9.353236],[76.577849,9.353058],[76.578253,9.352964],[76.5784,9.352989],[76.578582,9.353579],[76.578697,9.353955],[76.579097,9.354448],[76.579537,9.354563],[76.580084,9.354705],[76.580525,9.35482],[76.580777,9.354885],[76.581369,9.355461],[76.581612,9.355979],[76.581205,9.356216],[76.580927,9.356275],[76.580649,9.356335],[76.580697,9.356551],[76.580726,9.356681],[76.580727,9.356801],[76.580728,9.357049],[76.580667,9.357336],[76.580637,9.357627],[76.580509,9.35823],[76.580467,9.358457],[76.580328,9.359203],[76.580248,9.359455],[76.580177,9.359727],[76.579946,9.360285],[76.579832,9.360606],[76.579701,9.360886],[76.579598,9.361111],[76.579469,9.361429],[76.579415,9.361529],[76.578923,9.361265],[76.578703,9.361153],[76.577896,9.360804],[76.577022,9.360385],[76.576752,9.360295],[76.576372,9.360226],[76.5762,9.360216],[76.57553,9.360175],[76.575492,9.360264]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-18T07:41:10.708Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"umesh\",\"Ward_Name\":\"THENGELI\",\"Ward_No\":\"15\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.614981,9.348787],[76.614944,9.348557],[76.614907,9.348434],[76.614744,9.348396],[76.614581,9.348421],[76.614356,9.348481],[76.614176,9.348523],[76.614078,9.348554],[76.61398,9.348589],[76.613858,9.348677],[76.613725,9.348698],[76.613614,9.348726],[76.613411,9.348772],[76.613178,9.34886],[76.613062,9.348908],[76.612824,9.348972],[76.612578,9.349034],[76.612451,9.349064],[76.612184,9.349111],[76.612182,9.349496],[76.61208,9.34962],[76.611981,9.349741],[76.611686,9.3501],[76.611583,9.350225],[76.611502,9.350361],[76.611287,9.350725],[76.611083,9.351068],[76.610894,9.351388],[76.610835,9.351487],[76.610825,9.351583],[76.610779,9.351997],[76.610756,9.352214],[76.610743,9.352324],[76.610715,9.352588],[76.610811,9.352931],[76.610897,9.353133],[76.610988,9.35335],[76.610732,9.353231],[76.610589,9.353105],[76.610401,9.352908],[76.610249,9.352747],[76.610082,9.35264],[76.609916,9.352468],[76.609721,9.352266],[76.609609,9.35215],[76.609511,9.352051],[76.609346,9.351756],[76.609171,9.351443],[76.609082,9.351284],[76.608791,9.351303],[76.608843,9.351106],[76.60887,9.351004],[76.609124,9.350521],[76.609465,9.350209],[76.609546,9.350135],[76.609711,9.349984],[76.60981,9.349909],[76.609923,9.349823],[76.610285,9.349582],[76.61053,9.349504],[76.61067,9.349459],[76.610774,9.349413],[76.610863,9.34922],[76.611232,9.348423],[76.611354,9.348099],[76.611461,9.347951],[76.61148,9.347699],[76.61136,9.347707],[76.61115,9.347735],[76.610936,9.347764],[76.610663,9.347821],[76.610396,9.347875],[76.610262,9.347944],[76.61009,9.348046],[76.609852,9.348654],[76.609741,9.34876],[76.609627,9.348868],[76.609378,9.34892],[76.609226,9.34888],[76.609128,9.348828],[76.609029,9.348776],[76.60858,9.3486],[76.608248,9.348481],[76.607974,9.348383],[76.607586,9.348099],[76.607441,9.347989],[76.607252,9.347846],[76.607105,9.347676],[76.607013,9.347509],[76.606969,9.347429],[76.60688,9.347191],[76.606835,9.346873],[76.606779,9.346433],[76.606744,9.346195],[76.606726,9.346009],[76.606716,9.345907],[76.606706,9.345806],[76.606689,9.345678],[76.606672,9.345561],[76.606636,9.345225],[76.606655,9.345065],[76.606964,9.344986],[76.607473,9.344715],[76.607665,9.344458],[76.607672,9.34425],[76.607568,9.343847],[76.607585,9.343696],[76.607842,9.343421],[76.608299,9.343139],[76.608808,9.342908],[76.608979,9.342813],[76.609105,9.342695],[76.609207,9.342598],[76.609337,9.342487],[76.609511,9.342368],[76.609667,9.34222],[76.609813,9.342089],[76.609997,9.341964],[76.610177,9.341908],[76.610356,9.341908],[76.610616,9.342077],[76.610818,9.342273],[76.610979,9.342384],[76.611233,9.342707],[76.611392,9.342879],[76.611533,9.343081],[76.611772,9.343201],[76.611929,9.343295],[76.61218,9.343324],[76.612408,9.343295],[76.612723,9.343344],[76.612944,9.343331],[76.613216,9.34326],[76.613309,9.343796],[76.613428,9.344359],[76.613625,9.344524],[76.613719,9.34446],[76.614029,9.344486],[76.614284,9.344467],[76.614649,9.344422],[76.614753,9.344375],[76.615027,9.344393],[76.615341,9.344414],[76.615711,9.344444],[76.616016,9.344469],[76.616196,9.344889],[76.616112,9.345016],[76.61602,9.345156],[76.615855,9.345338],[76.615758,9.345394],[76.615714,9.345505],[76.615552,9.345651],[76.615701,9.345915],[76.615812,9.346101],[76.615791,9.346265],[76.615887,9.346508],[76.616081,9.34656],[76.61619,9.346589],[76.616298,9.346592],[76.616401,9.346663],[76.616541,9.346725],[76.616499,9.346989],[76.616469,9.34718],[76.616424,9.347531],[76.616308,9.347893],[76.616247,9.348133],[76.616123,9.348391],[76.615906,9.348527],[76.615557,9.348746],[76.615263,9.348793],[76.615164,9.348807],[76.614981,9.348787]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-19T11:27:47.953Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"subheesh\",\"Ward_Name\":\"KOTHAVIRUTHI\",\"Ward_No\":\"9\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.611225,9.353549],[76.611308,9.353541],[76.611417,9.353583],[76.611746,9.353729],[76.612107,9.353823],[76.612814,9.353849],[76.613313,9.353832],[76.613539,9.353733],[76.613999,9.353472],[76.614172,9.353442],[76.61458,9.353459],[76.615188,9.353571],[76.6158,9.353682],[76.616069,9.353695],[76.616104,9.35375],[76.616224,9.354315],[76.616281,9.354306],[76.616724,9.354239],[76.617062,9.354186],[76.617762,9.35403],[76.617864,9.354023],[76.618126,9.35411],[76.618364,9.35425],[76.618474,9.354334],[76.618569,9.354428],[76.618637,9.3545],[76.61876,9.354655],[76.618795,9.35474],[76.618838,9.354909],[76.61862,9.355061],[76.618403,9.355214],[76.618309,9.355266],[76.618066,9.355391],[76.617898,9.355468],[76.617765,9.355527],[76.617622,9.355663],[76.617631,9.355813],[76.617726,9.356015],[76.617773,9.35612],[76.617868,9.356332],[76.617962,9.356543],[76.61806,9.356761],[76.618058,9.357136],[76.617897,9.357489],[76.617763,9.357681],[76.617702,9.357768],[76.617572,9.357962],[76.617473,9.358126],[76.617384,9.358386],[76.617449,9.358554],[76.615837,9.358764],[76.614698,9.358865],[76.613281,9.358992],[76.613475,9.359635],[76.61364,9.360227],[76.613755,9.360646],[76.613826,9.362155],[76.613437,9.36251],[76.613363,9.362577],[76.61339,9.362713],[76.613676,9.364151],[76.613861,9.365028],[76.613774,9.364985],[76.613541,9.364992],[76.613199,9.364988],[76.612857,9.365],[76.612586,9.365001],[76.612185,9.365052],[76.611507,9.365206],[76.611215,9.365266],[76.610912,9.365386],[76.610527,9.365533],[76.61017,9.365707],[76.609845,9.365876],[76.609575,9.366044],[76.608906,9.366436],[76.608563,9.366631],[76.60827,9.366767],[76.607462,9.367046],[76.607155,9.367093],[76.606968,9.366865],[76.606719,9.366406],[76.606621,9.366069],[76.606612,9.365863],[76.606612,9.365759],[76.606602,9.365366],[76.606599,9.36506],[76.606597,9.364752],[76.606675,9.364417],[76.606755,9.364073],[76.606808,9.363951],[76.606894,9.363777],[76.606945,9.363683],[76.607062,9.363463],[76.607113,9.363323],[76.607155,9.363202],[76.607191,9.363072],[76.607228,9.362804],[76.607218,9.362705],[76.60718,9.362351],[76.607104,9.362094],[76.607066,9.361636],[76.607079,9.361297],[76.607104,9.361199],[76.607206,9.361193],[76.60734,9.361186],[76.60743,9.36114],[76.607513,9.361098],[76.607542,9.360974],[76.607598,9.360729],[76.607628,9.360603],[76.607662,9.360457],[76.607775,9.36011],[76.607856,9.3598],[76.607891,9.35963],[76.607911,9.359534],[76.607967,9.359337],[76.608032,9.359133],[76.608077,9.359023],[76.608132,9.358889],[76.608151,9.358668],[76.60816,9.35856],[76.608188,9.358227],[76.608173,9.357325],[76.60816,9.356773],[76.608143,9.356531],[76.608117,9.356115],[76.608111,9.355848],[76.608203,9.355776],[76.608515,9.355466],[76.608662,9.355261],[76.608789,9.355083],[76.60889,9.354941],[76.609026,9.354751],[76.609039,9.354412],[76.608952,9.353935],[76.608873,9.353499],[76.608814,9.353218],[76.608774,9.353104],[76.608634,9.352671],[76.608591,9.352534],[76.608474,9.352243],[76.608404,9.352065],[76.608291,9.351775],[76.608182,9.351493],[76.60846,9.351397],[76.608687,9.351333],[76.608791,9.351303],[76.609082,9.351284],[76.609171,9.351443],[76.609346,9.351756],[76.609511,9.352051],[76.609609,9.35215],[76.609721,9.352266],[76.609916,9.352468],[76.610082,9.35264],[76.610249,9.352747],[76.610401,9.352908],[76.610589,9.353105],[76.610732,9.353231],[76.610988,9.35335],[76.611216,9.353542],[76.611225,9.353549]]]},\"properties\":{\"ORIG_FID\":0,\"Created_Da\":\"2024-10-22T06:21:44.746Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Kuttoor\",\"Lsgd_Type\":\"Grama Panchayat\",\"Remarks\":\"Thiruvanapuram\",\"Surveyor\":\"subeesh\",\"Ward_Name\":\"THIRUVANAPURAM\",\"Ward_No\":\"6\",\"Shape_Leng\":\"0\",\"Shape_Area\":\"0\",\"Mandal\":\"Thiruvalla\"}}]}");
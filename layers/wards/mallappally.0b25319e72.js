@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.675294,9.417289],[76.674982,9.417218],[76.674831,9.417172],[76.674921,9.416875],[76.675058,9.416766],[76.675122,9.416616],[76.67517,9.416504],[76.6753,9.416353],[76.675505,9.416427],[76.675703,9.416415],[76.675913,9.416284],[76.676089,9.416271],[76.676423,9.416247],[76.676739,9.416192],[76.676802,9.416479],[76.677201,9.416426],[76.677415,9.416398],[76.677632,9.416369],[76.677731,9.41629],[76.677894,9.41616],[76.678141,9.415964],[76.678336,9.415818],[76.678525,9.415766],[76.678623,9.415739],[76.67877,9.415635],[76.678911,9.41559],[76.679075,9.415538],[76.679219,9.415492],[76.679377,9.415442],[76.679531,9.415379],[76.679889,9.415266],[76.68002,9.415217],[76.680125,9.415174],[76.680232,9.415129],[76.680458,9.41506],[76.680672,9.415014],[76.680924,9.414959],[76.681151,9.414909],[76.681296,9.414842],[76.681423,9.414785],[76.68163,9.414691],[76.681762,9.414592],[76.681952,9.414448],[76.68213,9.414286],[76.682208,9.414215],[76.682299,9.414133],[76.682409,9.414038],[76.682622,9.413854],[76.682875,9.413764],[76.68311,9.413681],[76.683473,9.413474],[76.683658,9.413371],[76.684055,9.413237],[76.684354,9.413155],[76.684621,9.41308],[76.684728,9.412964],[76.685061,9.412602],[76.685185,9.412459],[76.685271,9.412359],[76.685601,9.412052],[76.685834,9.411883],[76.686004,9.41176],[76.68612,9.411672],[76.686311,9.411577],[76.686567,9.411606],[76.686705,9.411625],[76.687037,9.411702],[76.687073,9.412082],[76.687091,9.412268],[76.687107,9.412433],[76.687158,9.412544],[76.687252,9.41281],[76.687331,9.413032],[76.687354,9.41316],[76.687506,9.413303],[76.687621,9.413514],[76.68768,9.413612],[76.687677,9.413732],[76.687675,9.413867],[76.687654,9.414103],[76.687635,9.414308],[76.687627,9.414399],[76.687591,9.414811],[76.68762,9.414988],[76.687658,9.415078],[76.687842,9.415202],[76.687805,9.415362],[76.68768,9.415504],[76.687721,9.415592],[76.687777,9.415722],[76.687813,9.415807],[76.687863,9.415884],[76.687921,9.416061],[76.687964,9.41624],[76.688014,9.416441],[76.688086,9.416583],[76.6882,9.416808],[76.688248,9.416887],[76.688316,9.417002],[76.688438,9.41715],[76.688723,9.417238],[76.688846,9.41725],[76.68905,9.41727],[76.689325,9.417294],[76.68945,9.417302],[76.689566,9.417309],[76.689818,9.417324],[76.689981,9.417339],[76.6901,9.41735],[76.690243,9.417356],[76.69039,9.417361],[76.690518,9.417366],[76.690671,9.417372],[76.690855,9.417378],[76.691031,9.417361],[76.691189,9.417346],[76.691548,9.417332],[76.691832,9.417352],[76.692108,9.417376],[76.69224,9.417382],[76.692431,9.41741],[76.69268,9.417414],[76.693214,9.417414],[76.693398,9.417411],[76.693505,9.41741],[76.693637,9.417408],[76.693765,9.417406],[76.693938,9.417403],[76.69405,9.417407],[76.694142,9.41741],[76.694264,9.417414],[76.694532,9.417468],[76.694675,9.417504],[76.694927,9.417566],[76.695029,9.417592],[76.695214,9.417624],[76.695467,9.417668],[76.695623,9.417706],[76.695666,9.417943],[76.69572,9.418234],[76.695791,9.418487],[76.695772,9.418735],[76.695951,9.418939],[76.696151,9.418849],[76.696351,9.418758],[76.696498,9.418719],[76.696709,9.418963],[76.696813,9.419226],[76.696743,9.419478],[76.696672,9.41973],[76.696687,9.419912],[76.69671,9.420043],[76.69672,9.42018],[76.696748,9.420557],[76.696848,9.420812],[76.696659,9.421002],[76.696471,9.421032],[76.696253,9.421066],[76.69602,9.421115],[76.69596,9.42125],[76.695863,9.421387],[76.695767,9.421525],[76.695635,9.421603],[76.69549,9.421713],[76.695345,9.421822],[76.695296,9.421992],[76.695213,9.422031],[76.695109,9.422119],[76.695086,9.422222],[76.694992,9.422323],[76.694926,9.422394],[76.694925,9.422546],[76.694762,9.422713],[76.694686,9.422791],[76.694497,9.422952],[76.694308,9.423114],[76.694056,9.422981],[76.693952,9.422905],[76.693879,9.422768],[76.693805,9.422629],[76.693526,9.422536],[76.693376,9.422621],[76.693192,9.422811],[76.693084,9.422947],[76.692976,9.422968],[76.692811,9.423],[76.692718,9.422995],[76.692626,9.422989],[76.692445,9.422978],[76.692058,9.422955],[76.691165,9.422902],[76.690829,9.422881],[76.689885,9.42351],[76.687576,9.425304],[76.687433,9.425366],[76.687074,9.425458],[76.686973,9.425487],[76.686588,9.425603],[76.686469,9.425619],[76.685938,9.425602],[76.685817,9.425558],[76.685586,9.425378],[76.685468,9.42526],[76.685248,9.425143],[76.685005,9.425046],[76.684776,9.424971],[76.684562,9.425002],[76.684375,9.425047],[76.684243,9.425072],[76.684085,9.425058],[76.68379,9.42501],[76.683647,9.424991],[76.683473,9.424953],[76.683317,9.424895],[76.683212,9.424847],[76.683082,9.424765],[76.682995,9.424669],[76.682998,9.424576],[76.682726,9.424469],[76.682566,9.424394],[76.682245,9.424263],[76.682169,9.424174],[76.68209,9.424059],[76.682038,9.423984],[76.681893,9.423696],[76.681791,9.423495],[76.681764,9.423403],[76.681766,9.423302],[76.681759,9.42313],[76.681774,9.422937],[76.681713,9.422636],[76.681324,9.422341],[76.681065,9.42207],[76.680984,9.421986],[76.680828,9.421873],[76.680729,9.421555],[76.680526,9.421211],[76.680402,9.42104],[76.68023,9.420798],[76.680133,9.420664],[76.680092,9.420536],[76.68005,9.420404],[76.679876,9.420351],[76.679745,9.420296],[76.679511,9.420165],[76.679414,9.420111],[76.679325,9.420064],[76.678523,9.419645],[76.678392,9.419339],[76.678284,9.419089],[76.67799,9.418755],[76.677813,9.418555],[76.677287,9.41796],[76.677092,9.417738],[76.676354,9.417554],[76.675294,9.417289]]]},\"properties\":{\"Created_Da\":\"2024-10-20T08:50:35.109Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"NARAKATHANI\",\"Ward_No\":\"7\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.654568,9.439716],[76.654557,9.439838],[76.65454,9.439934],[76.654527,9.440133],[76.654544,9.440225],[76.654658,9.440418],[76.654783,9.440546],[76.654941,9.440669],[76.655131,9.440831],[76.655203,9.441034],[76.655266,9.441201],[76.65528,9.441419],[76.655276,9.441553],[76.65514,9.441687],[76.655018,9.441689],[76.654774,9.441716],[76.654587,9.441741],[76.654472,9.441719],[76.654322,9.441697],[76.654086,9.441667],[76.653892,9.441651],[76.653687,9.441629],[76.653566,9.441596],[76.65351,9.441504],[76.653435,9.441353],[76.653354,9.441204],[76.653199,9.441073],[76.65309,9.440965],[76.653,9.440839],[76.652936,9.440742],[76.65281,9.440609],[76.652727,9.440467],[76.65266,9.440351],[76.65261,9.440265],[76.652534,9.440125],[76.652457,9.440006],[76.652404,9.439805],[76.652424,9.439695],[76.652326,9.439689],[76.652102,9.439683],[76.652036,9.439751],[76.651981,9.439842],[76.651859,9.439998],[76.651804,9.440092],[76.651697,9.440205],[76.651574,9.440326],[76.65146,9.440436],[76.651318,9.440378],[76.651219,9.440329],[76.651082,9.440233],[76.65087,9.440091],[76.650744,9.440002],[76.650547,9.439908],[76.650279,9.439839],[76.65012,9.439781],[76.649932,9.439745],[76.649785,9.439692],[76.649555,9.439607],[76.649513,9.439708],[76.649461,9.439826],[76.649344,9.440019],[76.649212,9.440221],[76.649147,9.440396],[76.649098,9.440566],[76.649041,9.440741],[76.64897,9.44091],[76.648921,9.441005],[76.648738,9.441303],[76.648678,9.441445],[76.648607,9.441503],[76.648443,9.441278],[76.648326,9.441032],[76.648292,9.440899],[76.648224,9.440747],[76.648151,9.440538],[76.648109,9.44041],[76.648015,9.440174],[76.647942,9.440041],[76.647801,9.439838],[76.647744,9.439691],[76.647756,9.439531],[76.647768,9.439374],[76.648027,9.439411],[76.648264,9.439453],[76.648539,9.439318],[76.64857,9.439177],[76.648632,9.439016],[76.648694,9.438859],[76.648832,9.438967],[76.649258,9.439023],[76.649374,9.439039],[76.649606,9.439197],[76.64974,9.439248],[76.649844,9.439136],[76.650059,9.438904],[76.650233,9.438681],[76.650375,9.4385],[76.650454,9.438401],[76.650547,9.438295],[76.650593,9.438197],[76.650716,9.437967],[76.650741,9.437629],[76.650768,9.437314],[76.650853,9.437046],[76.650907,9.436935],[76.650981,9.436778],[76.65114,9.43647],[76.651266,9.436132],[76.651327,9.436058],[76.65139,9.43598],[76.651415,9.435808],[76.651439,9.435647],[76.651467,9.435438],[76.651511,9.435123],[76.651735,9.435102],[76.651961,9.435081],[76.652272,9.435128],[76.65241,9.434932],[76.652508,9.434967],[76.652624,9.434659],[76.652723,9.434679],[76.652796,9.43454],[76.652797,9.434446],[76.6528,9.434136],[76.653158,9.434236],[76.653332,9.434284],[76.653721,9.434393],[76.653855,9.434253],[76.654025,9.434278],[76.65434,9.434399],[76.654494,9.4344],[76.654632,9.434394],[76.654867,9.434383],[76.654925,9.434128],[76.654985,9.433867],[76.654945,9.43378],[76.655042,9.433614],[76.655025,9.433485],[76.655018,9.433169],[76.655053,9.433058],[76.655092,9.432932],[76.655146,9.432751],[76.655199,9.432633],[76.655035,9.432528],[76.655047,9.432318],[76.655084,9.432103],[76.655117,9.431908],[76.655257,9.431776],[76.65536,9.431539],[76.655562,9.431486],[76.655681,9.431372],[76.655821,9.43124],[76.655987,9.431309],[76.656513,9.431527],[76.656629,9.43141],[76.656796,9.43124],[76.65693,9.431102],[76.657034,9.430946],[76.657064,9.430845],[76.657092,9.430753],[76.657097,9.430659],[76.657106,9.430496],[76.657116,9.430313],[76.657273,9.430274],[76.65751,9.430214],[76.657926,9.430078],[76.657996,9.430218],[76.658304,9.430209],[76.658496,9.430203],[76.658597,9.430095],[76.658531,9.429933],[76.658466,9.429778],[76.658425,9.429677],[76.658361,9.429525],[76.658285,9.429222],[76.658492,9.429185],[76.658619,9.429224],[76.658812,9.429159],[76.658941,9.429216],[76.659058,9.429183],[76.659174,9.42915],[76.659298,9.42913],[76.659421,9.42911],[76.659486,9.429039],[76.6596,9.428914],[76.659829,9.428699],[76.659919,9.42868],[76.66005,9.428609],[76.660175,9.428541],[76.660418,9.42841],[76.66062,9.428454],[76.660666,9.428223],[76.660625,9.428112],[76.660797,9.428028],[76.660923,9.42794],[76.661002,9.427886],[76.661161,9.427777],[76.661259,9.427708],[76.661356,9.427642],[76.661467,9.427565],[76.661583,9.427642],[76.661753,9.427754],[76.66188,9.427706],[76.661984,9.427667],[76.662101,9.427596],[76.662272,9.427491],[76.662496,9.427386],[76.662724,9.427279],[76.662873,9.427575],[76.663038,9.427941],[76.663202,9.428305],[76.663315,9.428444],[76.663625,9.428826],[76.663846,9.429098],[76.663912,9.429181],[76.66431,9.429527],[76.664429,9.429628],[76.665102,9.430197],[76.665256,9.430327],[76.665757,9.430637],[76.666106,9.430753],[76.666749,9.430957],[76.667007,9.431144],[76.667233,9.431308],[76.667289,9.431469],[76.667358,9.431666],[76.66739,9.431758],[76.66745,9.431932],[76.66749,9.432097],[76.667491,9.432314],[76.667492,9.432529],[76.667481,9.432743],[76.667409,9.43289],[76.667288,9.433094],[76.667125,9.433328],[76.666529,9.43383],[76.66625,9.434066],[76.666126,9.434169],[76.665902,9.434354],[76.665835,9.434439],[76.665309,9.43498],[76.665077,9.435218],[76.664996,9.435302],[76.664887,9.435453],[76.664513,9.436056],[76.664166,9.436368],[76.663872,9.436649],[76.663777,9.436738],[76.663639,9.436867],[76.663522,9.437133],[76.663374,9.437469],[76.663116,9.437157],[76.663122,9.437066],[76.663152,9.436884],[76.663141,9.436754],[76.662027,9.436654],[76.661545,9.436383],[76.660969,9.435939],[76.660614,9.435716],[76.660351,9.435343],[76.660185,9.435501],[76.659776,9.435433],[76.659477,9.435297],[76.659125,9.435102],[76.658912,9.434785],[76.658642,9.434512],[76.658399,9.434403],[76.658229,9.434363],[76.658039,9.434406],[76.657915,9.434435],[76.657745,9.434465],[76.657539,9.434506],[76.657152,9.43453],[76.65693,9.43441],[76.656823,9.434421],[76.656584,9.434535],[76.656518,9.434647],[76.656563,9.434822],[76.656623,9.43519],[76.65666,9.435485],[76.656612,9.435936],[76.656592,9.43608],[76.656506,9.436328],[76.656434,9.436533],[76.656386,9.436647],[76.65629,9.436625],[76.65606,9.43657],[76.655575,9.436615],[76.6552,9.436799],[76.655062,9.436867],[76.654314,9.436921],[76.654292,9.437059],[76.654243,9.437218],[76.654183,9.437365],[76.65415,9.437514],[76.654147,9.43765],[76.654204,9.437796],[76.654306,9.43804],[76.654347,9.43827],[76.654381,9.438409],[76.654418,9.438506],[76.654478,9.438682],[76.654509,9.438806],[76.654542,9.438982],[76.654551,9.439153],[76.654569,9.439319],[76.654576,9.439423],[76.654581,9.439542],[76.654568,9.439716]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:29:27.150Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8078214174\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"PARIYARAM\",\"Ward_No\":\"12\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.641267,9.467506],[76.641299,9.467447],[76.641301,9.467384],[76.641292,9.467278],[76.641275,9.4672],[76.641172,9.467104],[76.641035,9.46709],[76.640972,9.46711],[76.640907,9.467148],[76.640865,9.467208],[76.640769,9.46735],[76.640727,9.467384],[76.640599,9.467504],[76.640491,9.467557],[76.640342,9.467614],[76.640252,9.467628],[76.640177,9.467633],[76.639978,9.467621],[76.639884,9.467631],[76.639715,9.467627],[76.639578,9.467591],[76.639456,9.467516],[76.639336,9.467378],[76.63929,9.467239],[76.639298,9.467125],[76.63932,9.466944],[76.639332,9.466837],[76.639285,9.466758],[76.639178,9.466629],[76.639213,9.466597],[76.639026,9.466315],[76.638884,9.466099],[76.638774,9.466008],[76.638532,9.465885],[76.638487,9.465812],[76.638466,9.465721],[76.638463,9.465662],[76.63846,9.465443],[76.63842,9.465355],[76.638389,9.465331],[76.638138,9.465157],[76.638029,9.465089],[76.637898,9.46503],[76.637778,9.464954],[76.637724,9.464811],[76.637687,9.464627],[76.637658,9.464575],[76.637555,9.464371],[76.637532,9.464324],[76.637479,9.464199],[76.637466,9.464155],[76.637443,9.464073],[76.637445,9.464001],[76.637453,9.463935],[76.637462,9.463842],[76.637449,9.463818],[76.637424,9.4638],[76.637398,9.4638],[76.637335,9.463806],[76.637275,9.46383],[76.637226,9.463863],[76.637148,9.463915],[76.637096,9.463949],[76.637014,9.463979],[76.636914,9.463983],[76.636856,9.463974],[76.636775,9.46395],[76.636701,9.463923],[76.636609,9.463875],[76.636552,9.463848],[76.636536,9.463826],[76.636489,9.463755],[76.636465,9.463711],[76.636454,9.463652],[76.636442,9.463358],[76.637053,9.463155],[76.637203,9.463107],[76.637529,9.462985],[76.637868,9.462875],[76.638375,9.462675],[76.638791,9.462483],[76.638874,9.462445],[76.63907,9.462299],[76.639463,9.462011],[76.639729,9.461759],[76.639964,9.461549],[76.640148,9.461282],[76.640345,9.461011],[76.640456,9.460627],[76.640495,9.460464],[76.641012,9.458608],[76.641143,9.458138],[76.641272,9.457877],[76.641777,9.457365],[76.641955,9.457213],[76.642044,9.457072],[76.642275,9.456853],[76.642571,9.456523],[76.642819,9.45622],[76.64319,9.45589],[76.643404,9.455682],[76.643882,9.455078],[76.644052,9.454968],[76.644472,9.454801],[76.644963,9.454642],[76.64548,9.454475],[76.645834,9.454333],[76.64592,9.454299],[76.646152,9.454205],[76.646403,9.454169],[76.646738,9.454102],[76.647097,9.454072],[76.647226,9.454056],[76.64745,9.454014],[76.647585,9.453984],[76.647849,9.453923],[76.647983,9.45389],[76.648257,9.45383],[76.648383,9.454106],[76.648612,9.454612],[76.648681,9.454741],[76.648759,9.454883],[76.648807,9.454996],[76.648911,9.455212],[76.648955,9.455295],[76.649002,9.455442],[76.649033,9.455656],[76.649088,9.45611],[76.649172,9.456368],[76.649202,9.456464],[76.649276,9.456699],[76.649307,9.456796],[76.649406,9.457019],[76.649745,9.456865],[76.649906,9.456769],[76.649979,9.456707],[76.65005,9.456648],[76.650184,9.456536],[76.650513,9.456373],[76.650857,9.456257],[76.651011,9.456226],[76.651114,9.456241],[76.651231,9.456279],[76.651535,9.456265],[76.65178,9.456191],[76.65225,9.456107],[76.652389,9.456063],[76.65253,9.456028],[76.652636,9.456002],[76.652731,9.455977],[76.652894,9.455936],[76.653037,9.455914],[76.653186,9.455882],[76.653394,9.455818],[76.653672,9.455662],[76.653789,9.455496],[76.653881,9.45542],[76.653952,9.45535],[76.654073,9.455255],[76.654146,9.4552],[76.6543,9.455162],[76.654567,9.455083],[76.654677,9.455074],[76.654852,9.455064],[76.654978,9.455074],[76.65508,9.455075],[76.655209,9.455083],[76.655326,9.455089],[76.655483,9.455099],[76.655817,9.455076],[76.65617,9.454973],[76.656389,9.454869],[76.656588,9.454804],[76.656748,9.454769],[76.656959,9.454684],[76.657066,9.454635],[76.657231,9.454568],[76.657342,9.454523],[76.657644,9.454437],[76.657813,9.454338],[76.657876,9.45426],[76.658018,9.454067],[76.658148,9.453943],[76.658277,9.453851],[76.658503,9.453701],[76.658692,9.453705],[76.658805,9.453708],[76.658969,9.453725],[76.659098,9.453758],[76.659205,9.453802],[76.65944,9.453933],[76.659607,9.454038],[76.659746,9.45413],[76.659886,9.454221],[76.660098,9.454344],[76.66015,9.454503],[76.660214,9.4547],[76.660185,9.454786],[76.66014,9.455062],[76.660174,9.455421],[76.660057,9.455698],[76.659797,9.455681],[76.659617,9.455609],[76.65973,9.455014],[76.659692,9.454842],[76.659667,9.454712],[76.659463,9.454715],[76.659208,9.454581],[76.659137,9.454515],[76.658743,9.454626],[76.658431,9.454714],[76.658329,9.454822],[76.658304,9.454917],[76.658219,9.455247],[76.6578,9.455465],[76.65746,9.455642],[76.657334,9.455708],[76.657218,9.455768],[76.657287,9.455949],[76.657352,9.456029],[76.657347,9.456191],[76.65734,9.456375],[76.657354,9.456663],[76.657341,9.457037],[76.657176,9.457034],[76.656878,9.457161],[76.656473,9.457178],[76.656349,9.457179],[76.655961,9.457183],[76.655814,9.457176],[76.655714,9.457171],[76.655465,9.457149],[76.655293,9.457134],[76.655001,9.457109],[76.654968,9.457201],[76.654834,9.457216],[76.654811,9.457376],[76.654944,9.457408],[76.655006,9.457752],[76.655042,9.457957],[76.6547,9.458043],[76.654384,9.458121],[76.654132,9.458183],[76.654033,9.458207],[76.653726,9.458294],[76.653433,9.458382],[76.653236,9.45844],[76.653083,9.458469],[76.65287,9.458316],[76.652662,9.458166],[76.652451,9.458014],[76.652042,9.45772],[76.651622,9.457418],[76.650989,9.457707],[76.650746,9.457818],[76.650524,9.45799],[76.650545,9.458151],[76.650596,9.458535],[76.650631,9.458804],[76.650453,9.458943],[76.650235,9.459192],[76.650128,9.459314],[76.649988,9.459475],[76.648869,9.459534],[76.648647,9.459533],[76.648534,9.459532],[76.648374,9.459724],[76.648193,9.459941],[76.648009,9.460162],[76.647864,9.460336],[76.647766,9.460454],[76.647802,9.460598],[76.64779,9.460741],[76.647758,9.461051],[76.647822,9.461391],[76.64772,9.461411],[76.647478,9.461467],[76.647358,9.461495],[76.647069,9.461563],[76.646909,9.4616],[76.646648,9.461661],[76.646533,9.461528],[76.64621,9.461152],[76.64615,9.461083],[76.64594,9.460679],[76.645783,9.460375],[76.645672,9.460162],[76.645528,9.460066],[76.64511,9.459786],[76.644932,9.459645],[76.644842,9.459574],[76.644632,9.459494],[76.644519,9.459849],[76.644443,9.46009],[76.64438,9.460287],[76.644321,9.460474],[76.644292,9.460565],[76.644174,9.460936],[76.644115,9.461123],[76.64404,9.461292],[76.643988,9.461407],[76.643929,9.46154],[76.643848,9.46172],[76.643589,9.462299],[76.643587,9.462495],[76.643583,9.462855],[76.64358,9.463123],[76.643575,9.463642],[76.643662,9.464054],[76.643714,9.464301],[76.643752,9.464483],[76.643757,9.464655],[76.643539,9.464705],[76.643537,9.464974],[76.643399,9.464996],[76.643338,9.464691],[76.643047,9.464743],[76.642895,9.46477],[76.642778,9.46479],[76.642739,9.46502],[76.642714,9.465162],[76.642704,9.465397],[76.642678,9.465533],[76.642605,9.465925],[76.642773,9.466346],[76.642866,9.466577],[76.642954,9.466845],[76.642973,9.466946],[76.643066,9.467142],[76.643159,9.467451],[76.643311,9.467815],[76.643364,9.467975],[76.642379,9.468155],[76.641564,9.468305],[76.641595,9.468569],[76.641473,9.468668],[76.641274,9.468701],[76.641337,9.468332],[76.641271,9.468295],[76.641203,9.468202],[76.64115,9.468108],[76.641137,9.467967],[76.64112,9.467818],[76.6411,9.467749],[76.641098,9.467716],[76.641112,9.467669],[76.641208,9.467549],[76.641267,9.467506]]]},\"properties\":{\"Created_Da\":\"2024-10-19T15:31:33.606Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"MANJATHANAM\",\"Ward_No\":\"2\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.660098,9.454344],[76.659886,9.454221],[76.659746,9.45413],[76.659607,9.454038],[76.65944,9.453933],[76.659205,9.453802],[76.659098,9.453758],[76.658969,9.453725],[76.658805,9.453708],[76.658692,9.453705],[76.658503,9.453701],[76.658277,9.453851],[76.658148,9.453943],[76.658018,9.454067],[76.657876,9.45426],[76.657813,9.454338],[76.657644,9.454437],[76.657342,9.454523],[76.657231,9.454568],[76.657066,9.454635],[76.656959,9.454684],[76.656748,9.454769],[76.656588,9.454804],[76.656389,9.454869],[76.65617,9.454973],[76.655817,9.455076],[76.655483,9.455099],[76.655326,9.455089],[76.655209,9.455083],[76.65508,9.455075],[76.654978,9.455074],[76.654852,9.455064],[76.654677,9.455074],[76.654567,9.455083],[76.6543,9.455162],[76.654146,9.4552],[76.654073,9.455255],[76.653952,9.45535],[76.653881,9.45542],[76.653789,9.455496],[76.653672,9.455662],[76.653394,9.455818],[76.653186,9.455882],[76.653037,9.455914],[76.652894,9.455936],[76.652731,9.455977],[76.652636,9.456002],[76.65253,9.456028],[76.652389,9.456063],[76.65225,9.456107],[76.65178,9.456191],[76.651535,9.456265],[76.651231,9.456279],[76.651114,9.456241],[76.651011,9.456226],[76.650857,9.456257],[76.650513,9.456373],[76.650184,9.456536],[76.65005,9.456648],[76.649979,9.456707],[76.649906,9.456769],[76.649745,9.456865],[76.649406,9.457019],[76.649307,9.456796],[76.649276,9.456699],[76.649202,9.456464],[76.649172,9.456368],[76.649088,9.45611],[76.649033,9.455656],[76.649002,9.455442],[76.648955,9.455295],[76.648911,9.455212],[76.648807,9.454996],[76.648759,9.454883],[76.648681,9.454741],[76.648612,9.454612],[76.648383,9.454106],[76.648257,9.45383],[76.648367,9.453779],[76.648594,9.453707],[76.648847,9.453618],[76.649072,9.453512],[76.649163,9.453447],[76.649382,9.453163],[76.649432,9.453042],[76.649522,9.452825],[76.649698,9.452304],[76.649883,9.451999],[76.650194,9.451768],[76.650357,9.451662],[76.650574,9.451394],[76.650668,9.451279],[76.650743,9.451136],[76.650926,9.450792],[76.651184,9.450467],[76.651485,9.450172],[76.651497,9.450021],[76.651559,9.449943],[76.651604,9.449731],[76.651639,9.449582],[76.651682,9.449415],[76.651777,9.449332],[76.651926,9.449201],[76.652171,9.449112],[76.652322,9.449057],[76.652714,9.448885],[76.652979,9.448745],[76.653283,9.448557],[76.653473,9.448375],[76.653608,9.448151],[76.65369,9.447943],[76.653791,9.447608],[76.653858,9.44739],[76.653959,9.447202],[76.654045,9.447141],[76.6541,9.447067],[76.654504,9.446999],[76.65463,9.446969],[76.654789,9.447018],[76.65521,9.446897],[76.655302,9.446794],[76.655419,9.446663],[76.655649,9.446478],[76.655923,9.446298],[76.656108,9.446268],[76.656378,9.44626],[76.656552,9.446269],[76.656848,9.44617],[76.657077,9.446005],[76.657301,9.445852],[76.657451,9.445687],[76.657636,9.445457],[76.657818,9.445279],[76.657929,9.445152],[76.658058,9.445035],[76.6582,9.444906],[76.65795,9.44471],[76.657738,9.444546],[76.65757,9.444417],[76.657496,9.444348],[76.657378,9.444236],[76.657239,9.444106],[76.657027,9.44384],[76.656778,9.443343],[76.656779,9.443135],[76.656781,9.442928],[76.656907,9.442447],[76.657188,9.442117],[76.65767,9.441981],[76.657843,9.442035],[76.657938,9.442071],[76.658023,9.442133],[76.658156,9.442231],[76.658661,9.442724],[76.65936,9.44324],[76.659727,9.44337],[76.659981,9.443336],[76.660458,9.443172],[76.660677,9.442997],[76.661093,9.442777],[76.661404,9.442685],[76.66162,9.442479],[76.661734,9.442359],[76.662041,9.442185],[76.662227,9.442071],[76.662322,9.442012],[76.662607,9.441824],[76.662709,9.441992],[76.662787,9.442124],[76.662933,9.442367],[76.663215,9.442763],[76.663339,9.442801],[76.663555,9.442871],[76.663685,9.442927],[76.663786,9.442963],[76.66396,9.442962],[76.664055,9.44295],[76.664202,9.442931],[76.664357,9.442893],[76.664534,9.44289],[76.664716,9.442921],[76.665008,9.442971],[76.665213,9.443029],[76.665302,9.443059],[76.665449,9.443136],[76.665557,9.443203],[76.665735,9.443212],[76.665923,9.443216],[76.666048,9.443226],[76.666289,9.443251],[76.666421,9.443259],[76.666141,9.443535],[76.666052,9.443637],[76.665931,9.443776],[76.665829,9.443927],[76.665765,9.444021],[76.665589,9.444349],[76.665489,9.444469],[76.665408,9.444551],[76.665329,9.444648],[76.66522,9.445009],[76.665171,9.445538],[76.665111,9.445938],[76.664986,9.446349],[76.664953,9.446457],[76.664854,9.446701],[76.66475,9.446883],[76.664665,9.446936],[76.664551,9.446931],[76.664385,9.446842],[76.664264,9.446722],[76.664109,9.446563],[76.66395,9.44636],[76.663849,9.446222],[76.663762,9.446101],[76.663627,9.445859],[76.663579,9.445774],[76.663414,9.445693],[76.66331,9.445662],[76.663065,9.445724],[76.66295,9.445883],[76.662844,9.446028],[76.662735,9.446236],[76.662338,9.446443],[76.662177,9.446507],[76.662009,9.446573],[76.66185,9.446616],[76.661522,9.446702],[76.661415,9.44673],[76.661323,9.446755],[76.66137,9.446909],[76.661546,9.447241],[76.661673,9.447613],[76.661683,9.447794],[76.661857,9.447966],[76.662057,9.448098],[76.662361,9.448302],[76.662565,9.448532],[76.662661,9.448662],[76.662737,9.448812],[76.662781,9.44893],[76.662813,9.449059],[76.66284,9.449223],[76.662899,9.449295],[76.663074,9.449266],[76.663325,9.449225],[76.663447,9.4492],[76.663661,9.449145],[76.664037,9.449066],[76.664285,9.44895],[76.664412,9.448875],[76.66455,9.44862],[76.664593,9.448393],[76.664673,9.448312],[76.66505,9.448156],[76.665355,9.448027],[76.665465,9.447982],[76.665831,9.44783],[76.666146,9.447722],[76.666312,9.447666],[76.666491,9.447621],[76.666599,9.447592],[76.666676,9.44784],[76.666785,9.448181],[76.666885,9.448483],[76.666939,9.448645],[76.66698,9.448759],[76.667092,9.449052],[76.666961,9.449142],[76.666776,9.449267],[76.666623,9.449371],[76.666344,9.44956],[76.66567,9.449776],[76.665403,9.449861],[76.664467,9.450291],[76.664612,9.450487],[76.664689,9.450591],[76.664762,9.450713],[76.664809,9.450792],[76.66494,9.451008],[76.664999,9.451398],[76.665082,9.451585],[76.664866,9.451702],[76.664634,9.451584],[76.664419,9.451819],[76.664307,9.451916],[76.664087,9.452107],[76.663876,9.452153],[76.66335,9.452205],[76.663411,9.452739],[76.662991,9.452639],[76.662853,9.452561],[76.662684,9.452699],[76.662439,9.452791],[76.662471,9.453085],[76.662404,9.453248],[76.662332,9.453421],[76.662111,9.45367],[76.662,9.453788],[76.661888,9.453813],[76.661627,9.453919],[76.661333,9.454027],[76.661206,9.454044],[76.660931,9.454112],[76.660823,9.454138],[76.660649,9.454181],[76.66046,9.454237],[76.660319,9.454279],[76.660098,9.454344]]]},\"properties\":{\"Created_Da\":\"2024-10-19T16:30:43.173Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"MALLAPPALLY TOWN\",\"Ward_No\":\"3\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.651497,9.450021],[76.651288,9.450078],[76.651127,9.450152],[76.650969,9.450183],[76.650765,9.450153],[76.650642,9.450117],[76.650566,9.450059],[76.650564,9.449857],[76.650589,9.449711],[76.650608,9.449608],[76.650603,9.44941],[76.650598,9.449235],[76.650583,9.449105],[76.65057,9.449011],[76.650557,9.448912],[76.650546,9.448735],[76.65054,9.4486],[76.650523,9.448503],[76.650409,9.448321],[76.65035,9.448205],[76.650351,9.448077],[76.650327,9.447942],[76.650297,9.447793],[76.650265,9.447559],[76.650203,9.447313],[76.650159,9.447157],[76.650137,9.447055],[76.650102,9.446906],[76.65008,9.446743],[76.65006,9.446543],[76.650069,9.446352],[76.649996,9.446195],[76.649957,9.446085],[76.649922,9.445958],[76.64989,9.445732],[76.649891,9.445591],[76.649884,9.445497],[76.649862,9.445279],[76.649837,9.445174],[76.649796,9.445003],[76.649782,9.444913],[76.649775,9.444801],[76.649761,9.444625],[76.649749,9.444455],[76.649707,9.444281],[76.64967,9.444179],[76.649642,9.444081],[76.649643,9.44394],[76.649821,9.44393],[76.649945,9.443898],[76.649907,9.443814],[76.649805,9.44379],[76.649591,9.443711],[76.649461,9.443632],[76.649345,9.443558],[76.649276,9.443498],[76.649194,9.443437],[76.649081,9.443262],[76.649033,9.44316],[76.648988,9.443002],[76.648957,9.442882],[76.648936,9.442719],[76.648929,9.442618],[76.648921,9.442505],[76.648912,9.442384],[76.648895,9.44224],[76.648877,9.442075],[76.64887,9.441966],[76.648801,9.441867],[76.648716,9.441704],[76.648668,9.44158],[76.648607,9.441503],[76.648678,9.441445],[76.648738,9.441303],[76.648921,9.441005],[76.64897,9.44091],[76.649041,9.440741],[76.649098,9.440566],[76.649147,9.440396],[76.649212,9.440221],[76.649344,9.440019],[76.649461,9.439826],[76.649513,9.439708],[76.649555,9.439607],[76.649785,9.439692],[76.649932,9.439745],[76.65012,9.439781],[76.650279,9.439839],[76.650547,9.439908],[76.650744,9.440002],[76.65087,9.440091],[76.651082,9.440233],[76.651219,9.440329],[76.651318,9.440378],[76.65146,9.440436],[76.651574,9.440326],[76.651697,9.440205],[76.651804,9.440092],[76.651859,9.439998],[76.651981,9.439842],[76.652036,9.439751],[76.652102,9.439683],[76.652326,9.439689],[76.652424,9.439695],[76.652404,9.439805],[76.652457,9.440006],[76.652534,9.440125],[76.65261,9.440265],[76.65266,9.440351],[76.652727,9.440467],[76.65281,9.440609],[76.652936,9.440742],[76.653,9.440839],[76.65309,9.440965],[76.653199,9.441073],[76.653354,9.441204],[76.653435,9.441353],[76.65351,9.441504],[76.653566,9.441596],[76.653687,9.441629],[76.653892,9.441651],[76.654086,9.441667],[76.654322,9.441697],[76.654472,9.441719],[76.654587,9.441741],[76.654774,9.441716],[76.655018,9.441689],[76.65514,9.441687],[76.655276,9.441553],[76.65528,9.441419],[76.655266,9.441201],[76.655203,9.441034],[76.655131,9.440831],[76.654941,9.440669],[76.654783,9.440546],[76.654658,9.440418],[76.654544,9.440225],[76.654527,9.440133],[76.65454,9.439934],[76.654557,9.439838],[76.654568,9.439716],[76.654581,9.439542],[76.654576,9.439423],[76.654569,9.439319],[76.654551,9.439153],[76.654542,9.438982],[76.654509,9.438806],[76.654478,9.438682],[76.654418,9.438506],[76.654381,9.438409],[76.654347,9.43827],[76.654306,9.43804],[76.654204,9.437796],[76.654147,9.43765],[76.65415,9.437514],[76.654183,9.437365],[76.654243,9.437218],[76.654292,9.437059],[76.654314,9.436921],[76.655062,9.436867],[76.6552,9.436799],[76.655575,9.436615],[76.65606,9.43657],[76.65629,9.436625],[76.656386,9.436647],[76.656434,9.436533],[76.656506,9.436328],[76.656592,9.43608],[76.656612,9.435936],[76.65666,9.435485],[76.656623,9.43519],[76.656563,9.434822],[76.656518,9.434647],[76.656584,9.434535],[76.656823,9.434421],[76.65693,9.43441],[76.657152,9.43453],[76.657539,9.434506],[76.657745,9.434465],[76.657915,9.434435],[76.658039,9.434406],[76.658229,9.434363],[76.658399,9.434403],[76.658642,9.434512],[76.658912,9.434785],[76.659125,9.435102],[76.659477,9.435297],[76.659776,9.435433],[76.660185,9.435501],[76.660351,9.435343],[76.660614,9.435716],[76.660969,9.435939],[76.661545,9.436383],[76.662027,9.436654],[76.663141,9.436754],[76.663152,9.436884],[76.663122,9.437066],[76.663116,9.437157],[76.663374,9.437469],[76.663297,9.437739],[76.663244,9.437922],[76.66321,9.438042],[76.663147,9.438265],[76.663087,9.438432],[76.663087,9.438529],[76.663078,9.438945],[76.663072,9.439206],[76.663173,9.439809],[76.663004,9.440364],[76.662893,9.440661],[76.662869,9.440863],[76.662592,9.441166],[76.662324,9.441461],[76.662394,9.441552],[76.662465,9.441643],[76.662607,9.441824],[76.662322,9.442012],[76.662227,9.442071],[76.662041,9.442185],[76.661734,9.442359],[76.66162,9.442479],[76.661404,9.442685],[76.661093,9.442777],[76.660677,9.442997],[76.660458,9.443172],[76.659981,9.443336],[76.659727,9.44337],[76.65936,9.44324],[76.658661,9.442724],[76.658156,9.442231],[76.658023,9.442133],[76.657938,9.442071],[76.657843,9.442035],[76.65767,9.441981],[76.657188,9.442117],[76.656907,9.442447],[76.656781,9.442928],[76.656779,9.443135],[76.656778,9.443343],[76.657027,9.44384],[76.657239,9.444106],[76.657378,9.444236],[76.657496,9.444348],[76.65757,9.444417],[76.657738,9.444546],[76.65795,9.44471],[76.6582,9.444906],[76.658058,9.445035],[76.657929,9.445152],[76.657818,9.445279],[76.657636,9.445457],[76.657451,9.445687],[76.657301,9.445852],[76.657077,9.446005],[76.656848,9.44617],[76.656552,9.446269],[76.656378,9.44626],[76.656108,9.446268],[76.655923,9.446298],[76.655649,9.446478],[76.655419,9.446663],[76.655302,9.446794],[76.65521,9.446897],[76.654789,9.447018],[76.65463,9.446969],[76.654504,9.446999],[76.6541,9.447067],[76.654045,9.447141],[76.653959,9.447202],[76.653858,9.44739],[76.653791,9.447608],[76.65369,9.447943],[76.653608,9.448151],[76.653473,9.448375],[76.653283,9.448557],[76.652979,9.448745],[76.652714,9.448885],[76.652322,9.449057],[76.652171,9.449112],[76.651926,9.449201],[76.651777,9.449332],[76.651682,9.449415],[76.651639,9.449582],[76.651604,9.449731],[76.651559,9.449943],[76.651497,9.450021]]]},\"properties\":{\"Created_Da\":\"2024-10-20T05:44:19.741Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8078214174\",\"Remarks\":\"MALLAPPALLY TOWN WEST\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"MALLAPPALLY TOWN WEST\",\"Ward_No\":\"13\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.68086,9.454354],[76.680619,9.454353],[76.68028,9.454351],[76.679886,9.454348],[76.679321,9.454344],[76.678211,9.453981],[76.677609,9.453784],[76.676513,9.453426],[76.676139,9.453425],[76.676041,9.453462],[76.675946,9.453497],[76.675696,9.453657],[76.675575,9.453768],[76.675479,9.453855],[76.675421,9.454003],[76.675348,9.454238],[76.675158,9.454851],[76.675097,9.455047],[76.674876,9.454979],[76.674772,9.45493],[76.674673,9.454883],[76.674529,9.454815],[76.674459,9.454754],[76.674328,9.454638],[76.67413,9.454189],[76.674007,9.453797],[76.674023,9.453347],[76.674115,9.452762],[76.674149,9.452528],[76.674232,9.451855],[76.674313,9.451368],[76.67444,9.451027],[76.674526,9.450799],[76.674656,9.450635],[76.674585,9.450559],[76.674423,9.450394],[76.67441,9.450217],[76.674385,9.449864],[76.674397,9.449542],[76.674403,9.449405],[76.6744,9.4493],[76.674388,9.448887],[76.674413,9.448571],[76.674429,9.448366],[76.674247,9.448197],[76.674146,9.448059],[76.673713,9.446997],[76.673656,9.446495],[76.673608,9.446256],[76.673576,9.446058],[76.673549,9.44597],[76.673462,9.445742],[76.673411,9.445627],[76.673346,9.445402],[76.673346,9.44519],[76.673354,9.444961],[76.673341,9.444829],[76.673342,9.444511],[76.673416,9.444153],[76.67344,9.444056],[76.673509,9.443749],[76.673539,9.443497],[76.673583,9.443259],[76.673603,9.443148],[76.673662,9.443015],[76.673807,9.442742],[76.673925,9.442596],[76.674159,9.442329],[76.674475,9.442233],[76.674708,9.442144],[76.67501,9.44195],[76.675363,9.441789],[76.675582,9.441768],[76.675919,9.441752],[76.676152,9.441591],[76.67641,9.441345],[76.676428,9.441219],[76.676503,9.441164],[76.676556,9.441079],[76.676638,9.440971],[76.67674,9.440895],[76.677103,9.440753],[76.677248,9.440755],[76.677407,9.440752],[76.677578,9.440619],[76.677623,9.440532],[76.677725,9.440345],[76.677846,9.440145],[76.677974,9.439966],[76.67813,9.439761],[76.678212,9.439642],[76.678359,9.439497],[76.678453,9.439441],[76.678666,9.439325],[76.678824,9.439318],[76.678948,9.439313],[76.679244,9.439279],[76.679475,9.439314],[76.679726,9.439356],[76.679874,9.439345],[76.680157,9.439293],[76.680364,9.43928],[76.680521,9.439301],[76.680613,9.439323],[76.680747,9.439397],[76.68096,9.439482],[76.68101,9.439404],[76.681077,9.43886],[76.68113,9.43876],[76.681248,9.4386],[76.681326,9.438521],[76.681601,9.438458],[76.681705,9.438436],[76.681807,9.438415],[76.682076,9.438392],[76.682348,9.438423],[76.682571,9.438408],[76.682678,9.43836],[76.682803,9.438191],[76.682896,9.438075],[76.683057,9.437999],[76.683322,9.43807],[76.683494,9.438205],[76.683578,9.438283],[76.683733,9.438451],[76.68387,9.438658],[76.683929,9.438751],[76.68401,9.438927],[76.684048,9.439017],[76.684107,9.439202],[76.684112,9.439303],[76.684102,9.439523],[76.684127,9.439721],[76.684231,9.439865],[76.684363,9.440019],[76.684408,9.44011],[76.684457,9.44032],[76.684495,9.440567],[76.684517,9.440741],[76.68448,9.440952],[76.68439,9.441141],[76.684307,9.441321],[76.684284,9.441409],[76.68421,9.441668],[76.684079,9.441879],[76.683978,9.442046],[76.683919,9.442253],[76.683793,9.44224],[76.683677,9.442228],[76.683513,9.442214],[76.683398,9.442203],[76.683308,9.442231],[76.683157,9.442278],[76.682986,9.442333],[76.68289,9.442366],[76.682739,9.442461],[76.682648,9.442535],[76.682436,9.442708],[76.682296,9.442822],[76.681861,9.443177],[76.681657,9.443343],[76.681524,9.443451],[76.681409,9.443545],[76.681293,9.44364],[76.681111,9.443788],[76.680606,9.4442],[76.680562,9.444295],[76.680498,9.444558],[76.680387,9.445149],[76.680462,9.445348],[76.680547,9.445573],[76.680659,9.445881],[76.68072,9.446055],[76.680785,9.446306],[76.680796,9.446522],[76.680805,9.446695],[76.680816,9.447028],[76.680836,9.447664],[76.680847,9.447991],[76.680848,9.448214],[76.680919,9.448522],[76.681043,9.448705],[76.681016,9.449222],[76.68101,9.449331],[76.681003,9.449464],[76.680992,9.449639],[76.68097,9.449785],[76.681001,9.449938],[76.681061,9.450108],[76.681278,9.450717],[76.681295,9.450806],[76.68132,9.45172],[76.681334,9.452389],[76.681454,9.452713],[76.681681,9.453119],[76.682114,9.453147],[76.682329,9.453258],[76.682522,9.453268],[76.682861,9.453216],[76.68319,9.453198],[76.683285,9.453192],[76.683389,9.453165],[76.683565,9.453063],[76.683549,9.453194],[76.68359,9.453368],[76.683632,9.453548],[76.683532,9.453528],[76.683396,9.453577],[76.683092,9.453685],[76.682649,9.453837],[76.681947,9.454079],[76.681242,9.454257],[76.68086,9.454354]]]},\"properties\":{\"Created_Da\":\"2024-10-19T17:13:06.090Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744459940\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"MURANI\",\"Ward_No\":\"5\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.667321,9.43904],[76.667308,9.439138],[76.667155,9.439088],[76.666905,9.439006],[76.666722,9.438947],[76.666662,9.438774],[76.666408,9.438733],[76.666246,9.438745],[76.666033,9.438717],[76.665879,9.43857],[76.665776,9.4385],[76.665586,9.438468],[76.665441,9.438438],[76.665317,9.43841],[76.665212,9.438382],[76.665063,9.438339],[76.664753,9.438231],[76.664656,9.438197],[76.664775,9.437839],[76.664801,9.437532],[76.664806,9.437361],[76.664867,9.437067],[76.664908,9.43687],[76.664693,9.436673],[76.664478,9.436477],[76.664513,9.436056],[76.664887,9.435453],[76.664996,9.435302],[76.665077,9.435218],[76.665309,9.43498],[76.665835,9.434439],[76.665902,9.434354],[76.666126,9.434169],[76.66625,9.434066],[76.666529,9.43383],[76.667125,9.433328],[76.667288,9.433094],[76.667409,9.43289],[76.667481,9.432743],[76.667492,9.432529],[76.667491,9.432314],[76.66749,9.432097],[76.66745,9.431932],[76.66739,9.431758],[76.667358,9.431666],[76.667289,9.431469],[76.667233,9.431308],[76.667007,9.431144],[76.666749,9.430957],[76.666106,9.430753],[76.665757,9.430637],[76.665256,9.430327],[76.665102,9.430197],[76.664429,9.429628],[76.66431,9.429527],[76.663912,9.429181],[76.663846,9.429098],[76.663625,9.428826],[76.663315,9.428444],[76.663202,9.428305],[76.663038,9.427941],[76.662873,9.427575],[76.662724,9.427279],[76.662868,9.427183],[76.662857,9.42703],[76.662842,9.426801],[76.662827,9.426499],[76.662829,9.426278],[76.662831,9.42613],[76.662852,9.425809],[76.662865,9.425581],[76.662896,9.425121],[76.662972,9.42496],[76.663128,9.424797],[76.663341,9.424586],[76.663465,9.424479],[76.663706,9.424291],[76.664082,9.424231],[76.664206,9.424211],[76.664491,9.424165],[76.664769,9.424136],[76.664885,9.424124],[76.664993,9.424091],[76.665145,9.424099],[76.665461,9.424116],[76.665602,9.424062],[76.665818,9.42411],[76.666075,9.42404],[76.666316,9.424108],[76.666624,9.424034],[76.667,9.424035],[76.66719,9.424003],[76.667318,9.423993],[76.667564,9.42391],[76.667716,9.423632],[76.667838,9.423535],[76.668087,9.423297],[76.668148,9.423184],[76.668274,9.422955],[76.668382,9.422758],[76.668519,9.422466],[76.668708,9.422065],[76.668798,9.421872],[76.668864,9.421704],[76.66895,9.421487],[76.668985,9.421236],[76.669019,9.420985],[76.669032,9.420891],[76.669032,9.420282],[76.669033,9.420084],[76.669041,9.419793],[76.66905,9.419512],[76.669013,9.419263],[76.668973,9.418989],[76.668859,9.418682],[76.668825,9.418591],[76.668953,9.41848],[76.669166,9.418295],[76.669412,9.418246],[76.66955,9.41822],[76.669664,9.418197],[76.669819,9.418177],[76.669918,9.418185],[76.670209,9.418163],[76.670502,9.418116],[76.670686,9.418106],[76.670937,9.418092],[76.671256,9.417912],[76.671405,9.417829],[76.671529,9.417783],[76.671642,9.417784],[76.671777,9.417836],[76.672007,9.417795],[76.672081,9.417679],[76.672146,9.417578],[76.67221,9.417398],[76.672419,9.417397],[76.672651,9.417363],[76.672791,9.417343],[76.672813,9.417195],[76.672909,9.417033],[76.673057,9.416917],[76.673181,9.416905],[76.673419,9.416888],[76.673556,9.416887],[76.67373,9.41693],[76.673896,9.417003],[76.674062,9.417074],[76.674185,9.417127],[76.674343,9.417147],[76.674469,9.417109],[76.674589,9.417104],[76.674831,9.417172],[76.674982,9.417218],[76.675294,9.417289],[76.676354,9.417554],[76.677092,9.417738],[76.677287,9.41796],[76.677813,9.418555],[76.67799,9.418755],[76.678284,9.419089],[76.678392,9.419339],[76.678523,9.419645],[76.679325,9.420064],[76.679414,9.420111],[76.679511,9.420165],[76.679745,9.420296],[76.679876,9.420351],[76.679727,9.420675],[76.679562,9.420779],[76.6792,9.420854],[76.678933,9.420935],[76.678782,9.420973],[76.678585,9.421094],[76.678408,9.421187],[76.677994,9.421499],[76.67748,9.422077],[76.677214,9.422361],[76.677144,9.422436],[76.676777,9.422993],[76.676551,9.423361],[76.676337,9.423661],[76.676248,9.423786],[76.676111,9.424196],[76.676015,9.424434],[76.675885,9.424756],[76.67588,9.424912],[76.675877,9.425015],[76.675873,9.425152],[76.675868,9.425289],[76.675859,9.425566],[76.675811,9.425813],[76.675775,9.426007],[76.67572,9.426298],[76.675692,9.426442],[76.675668,9.426564],[76.675625,9.426648],[76.675561,9.426713],[76.675482,9.426795],[76.675114,9.426815],[76.674948,9.426973],[76.674727,9.427247],[76.6745,9.427448],[76.67417,9.427685],[76.673935,9.427975],[76.673667,9.4284],[76.673561,9.428688],[76.673534,9.428775],[76.673497,9.428906],[76.673395,9.429252],[76.673327,9.429489],[76.673258,9.429681],[76.6732,9.429786],[76.673095,9.429972],[76.672883,9.430352],[76.672809,9.430573],[76.672732,9.43076],[76.672602,9.430958],[76.672326,9.431269],[76.671977,9.431466],[76.671761,9.43153],[76.671492,9.43162],[76.671309,9.431659],[76.671069,9.431586],[76.670792,9.431563],[76.670482,9.43154],[76.670097,9.431534],[76.669803,9.431542],[76.669571,9.431582],[76.669483,9.431607],[76.668702,9.431957],[76.668441,9.432082],[76.668342,9.432138],[76.668259,9.432336],[76.668142,9.43261],[76.668065,9.432793],[76.668022,9.432894],[76.668017,9.433013],[76.668003,9.433345],[76.668068,9.43346],[76.668149,9.433605],[76.668289,9.433802],[76.668352,9.433892],[76.668489,9.434089],[76.668605,9.434257],[76.668719,9.434434],[76.668799,9.434559],[76.668802,9.43471],[76.668805,9.434859],[76.668569,9.435084],[76.668379,9.43528],[76.668181,9.435484],[76.668043,9.435772],[76.66789,9.436064],[76.667711,9.436219],[76.667606,9.436309],[76.667521,9.436381],[76.66738,9.4365],[76.667274,9.436752],[76.667321,9.436941],[76.66725,9.437354],[76.667264,9.437534],[76.667286,9.437817],[76.667336,9.438235],[76.667359,9.43833],[76.667341,9.43867],[76.667321,9.43904]]]},\"properties\":{\"Created_Da\":\"2024-10-20T15:01:19.738Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8078214174\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"KEEZHVAIPUR SOUTH\",\"Ward_No\":\"8\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.637096,9.44287],[76.637202,9.442637],[76.637339,9.442328],[76.637346,9.442176],[76.637565,9.442069],[76.637737,9.442102],[76.637844,9.442123],[76.637884,9.442513],[76.638057,9.442707],[76.638188,9.44291],[76.638357,9.443027],[76.638433,9.443146],[76.638571,9.443365],[76.638706,9.443459],[76.638841,9.443552],[76.638892,9.443654],[76.638916,9.44379],[76.638969,9.443904],[76.639166,9.443829],[76.639305,9.44409],[76.639448,9.444223],[76.639606,9.444371],[76.639658,9.444596],[76.639835,9.444961],[76.640085,9.445165],[76.640241,9.445231],[76.640336,9.44527],[76.640461,9.445324],[76.640767,9.445375],[76.64096,9.445443],[76.64105,9.445422],[76.641271,9.445371],[76.641497,9.445318],[76.641664,9.44519],[76.64184,9.445055],[76.641977,9.44495],[76.642196,9.444797],[76.642406,9.44479],[76.642582,9.444783],[76.642784,9.444711],[76.643018,9.444628],[76.64316,9.444598],[76.64361,9.444352],[76.64372,9.444293],[76.643889,9.444191],[76.644231,9.444177],[76.64436,9.444134],[76.64441,9.444006],[76.644511,9.443983],[76.644885,9.443897],[76.645019,9.443587],[76.645206,9.443203],[76.645598,9.442803],[76.645718,9.442573],[76.645805,9.442404],[76.645856,9.442266],[76.646017,9.442191],[76.646124,9.44214],[76.646313,9.441945],[76.646356,9.441594],[76.64644,9.441435],[76.646501,9.44132],[76.646586,9.441159],[76.646685,9.440978],[76.646888,9.440886],[76.647067,9.440939],[76.647237,9.441046],[76.647337,9.441156],[76.647452,9.441283],[76.647557,9.441394],[76.64779,9.441274],[76.648068,9.441179],[76.648201,9.441105],[76.648326,9.441032],[76.648443,9.441278],[76.648607,9.441503],[76.648668,9.44158],[76.648716,9.441704],[76.648801,9.441867],[76.64887,9.441966],[76.648877,9.442075],[76.648895,9.44224],[76.648912,9.442384],[76.648921,9.442505],[76.648929,9.442618],[76.648936,9.442719],[76.648957,9.442882],[76.648988,9.443002],[76.649033,9.44316],[76.649081,9.443262],[76.649194,9.443437],[76.649276,9.443498],[76.649345,9.443558],[76.649461,9.443632],[76.649591,9.443711],[76.649805,9.44379],[76.649907,9.443814],[76.649945,9.443898],[76.649821,9.44393],[76.649643,9.44394],[76.649376,9.443972],[76.649266,9.444006],[76.649101,9.444068],[76.648875,9.444151],[76.648654,9.444213],[76.648484,9.444252],[76.648317,9.444289],[76.648189,9.444316],[76.64799,9.444351],[76.647857,9.444371],[76.647673,9.444379],[76.647548,9.444385],[76.647432,9.444423],[76.647312,9.44459],[76.647278,9.444751],[76.647261,9.444894],[76.647233,9.445115],[76.647202,9.445341],[76.647167,9.44558],[76.647068,9.445797],[76.646945,9.446007],[76.646742,9.44636],[76.646638,9.446603],[76.646584,9.446838],[76.64652,9.447059],[76.646487,9.447282],[76.646471,9.447394],[76.646463,9.447617],[76.646461,9.447863],[76.646436,9.448079],[76.646085,9.448483],[76.645881,9.448568],[76.645719,9.448649],[76.645449,9.448752],[76.645335,9.448783],[76.645178,9.448831],[76.64507,9.448853],[76.644961,9.448919],[76.644859,9.449096],[76.644795,9.449403],[76.644778,9.449566],[76.644808,9.449779],[76.644839,9.449912],[76.644832,9.450062],[76.644881,9.450288],[76.644921,9.450421],[76.644974,9.450552],[76.645102,9.450641],[76.645286,9.450763],[76.64538,9.450811],[76.645175,9.450942],[76.644859,9.451027],[76.644789,9.451127],[76.644678,9.451297],[76.644566,9.451416],[76.644385,9.451555],[76.644203,9.451755],[76.644167,9.451843],[76.644108,9.452002],[76.644023,9.452125],[76.643891,9.452278],[76.643832,9.452373],[76.643668,9.452601],[76.643503,9.452747],[76.643369,9.452818],[76.643267,9.452872],[76.643167,9.452902],[76.642965,9.452825],[76.642798,9.452666],[76.64271,9.452639],[76.642577,9.452637],[76.642476,9.452597],[76.642265,9.452572],[76.64208,9.452579],[76.641941,9.452572],[76.641756,9.452547],[76.641642,9.452525],[76.641495,9.452352],[76.641545,9.452082],[76.641555,9.451967],[76.641461,9.4519],[76.641368,9.451898],[76.641267,9.451872],[76.641128,9.451849],[76.640955,9.451827],[76.640854,9.451749],[76.640873,9.451578],[76.640883,9.4514],[76.640893,9.451212],[76.640868,9.451069],[76.640691,9.451081],[76.64054,9.451143],[76.64031,9.451207],[76.640008,9.451267],[76.63983,9.451279],[76.63968,9.451315],[76.63959,9.451349],[76.639545,9.451234],[76.639457,9.451028],[76.639384,9.450852],[76.639221,9.450415],[76.639112,9.450038],[76.639049,9.449863],[76.639002,9.449713],[76.638915,9.449432],[76.638718,9.449285],[76.638636,9.449217],[76.638409,9.449052],[76.637624,9.448463],[76.637324,9.448284],[76.63723,9.448165],[76.637126,9.448011],[76.63709,9.447881],[76.637224,9.447542],[76.637276,9.447134],[76.637231,9.447004],[76.637119,9.446709],[76.637064,9.446611],[76.636947,9.44636],[76.636896,9.446252],[76.63681,9.44598],[76.636435,9.445472],[76.636197,9.445167],[76.635948,9.444938],[76.63585,9.444848],[76.635589,9.444721],[76.635167,9.444596],[76.634914,9.444512],[76.634713,9.44432],[76.63465,9.444229],[76.634513,9.443865],[76.634202,9.443437],[76.634368,9.443408],[76.634585,9.443347],[76.634797,9.443305],[76.635529,9.443079],[76.635885,9.442969],[76.636021,9.442908],[76.636283,9.442789],[76.636582,9.442653],[76.636713,9.442925],[76.637049,9.44298],[76.637096,9.44287]]]},\"properties\":{\"Created_Da\":\"2024-10-20T19:12:50.063Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744459940\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"NELLIMOODU\",\"Ward_No\":\"15\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.668065,9.432793],[76.668142,9.43261],[76.668259,9.432336],[76.668342,9.432138],[76.668441,9.432082],[76.668702,9.431957],[76.669483,9.431607],[76.669571,9.431582],[76.669803,9.431542],[76.670097,9.431534],[76.670482,9.43154],[76.670792,9.431563],[76.671069,9.431586],[76.671309,9.431659],[76.67146,9.432041],[76.671627,9.432393],[76.671774,9.432757],[76.671835,9.432915],[76.671941,9.433148],[76.671997,9.433227],[76.672156,9.433438],[76.672245,9.433509],[76.672426,9.433671],[76.672693,9.43388],[76.672801,9.43395],[76.672911,9.434022],[76.673036,9.434049],[76.673218,9.434103],[76.673604,9.434298],[76.673778,9.434411],[76.673969,9.434556],[76.674123,9.434701],[76.674251,9.434775],[76.674517,9.434993],[76.674925,9.435268],[76.67511,9.435697],[76.675207,9.43582],[76.67532,9.435956],[76.675413,9.436058],[76.675525,9.43618],[76.675534,9.436313],[76.675471,9.436497],[76.675439,9.436652],[76.675358,9.436835],[76.675312,9.43695],[76.675285,9.437066],[76.675236,9.437184],[76.675253,9.437353],[76.675276,9.437532],[76.675303,9.437765],[76.675303,9.437868],[76.67531,9.437974],[76.675321,9.438116],[76.675323,9.438251],[76.675352,9.438415],[76.675401,9.438576],[76.675466,9.438749],[76.675517,9.438857],[76.675579,9.439011],[76.675607,9.439116],[76.67564,9.439216],[76.675672,9.439364],[76.675703,9.439483],[76.675767,9.439677],[76.675807,9.439821],[76.675808,9.439965],[76.675845,9.440155],[76.675893,9.440243],[76.675921,9.440373],[76.675946,9.440465],[76.676011,9.440616],[76.676057,9.4407],[76.676165,9.440845],[76.676248,9.440968],[76.676328,9.441097],[76.676428,9.441219],[76.67641,9.441345],[76.676152,9.441591],[76.675919,9.441752],[76.675582,9.441768],[76.675363,9.441789],[76.67501,9.44195],[76.674708,9.442144],[76.674475,9.442233],[76.674159,9.442329],[76.673925,9.442596],[76.673807,9.442742],[76.673452,9.443089],[76.67297,9.443288],[76.67253,9.443279],[76.672354,9.443285],[76.671932,9.443318],[76.671497,9.443279],[76.67125,9.443067],[76.670598,9.442377],[76.670345,9.442042],[76.670204,9.441856],[76.669955,9.44158],[76.669808,9.441418],[76.669473,9.441152],[76.669088,9.441013],[76.668835,9.44089],[76.668545,9.440703],[76.668373,9.440678],[76.668236,9.440767],[76.66783,9.441152],[76.667733,9.441273],[76.667545,9.441506],[76.667453,9.441798],[76.667354,9.442057],[76.667315,9.442147],[76.667221,9.442362],[76.667071,9.442666],[76.667021,9.442768],[76.666959,9.442864],[76.66682,9.442961],[76.666421,9.443259],[76.666289,9.443251],[76.666048,9.443226],[76.665923,9.443216],[76.665735,9.443212],[76.665557,9.443203],[76.665449,9.443136],[76.665302,9.443059],[76.665213,9.443029],[76.665008,9.442971],[76.664716,9.442921],[76.664534,9.44289],[76.664357,9.442893],[76.664202,9.442931],[76.664055,9.44295],[76.66396,9.442962],[76.663786,9.442963],[76.663685,9.442927],[76.663555,9.442871],[76.663339,9.442801],[76.663215,9.442763],[76.662933,9.442367],[76.662787,9.442124],[76.662709,9.441992],[76.662607,9.441824],[76.662465,9.441643],[76.662394,9.441552],[76.662324,9.441461],[76.662592,9.441166],[76.662869,9.440863],[76.662893,9.440661],[76.663004,9.440364],[76.663173,9.439809],[76.663072,9.439206],[76.663078,9.438945],[76.663087,9.438529],[76.663087,9.438432],[76.663147,9.438265],[76.66321,9.438042],[76.663244,9.437922],[76.663297,9.437739],[76.663374,9.437469],[76.663522,9.437133],[76.663639,9.436867],[76.663777,9.436738],[76.663872,9.436649],[76.664166,9.436368],[76.664513,9.436056],[76.664478,9.436477],[76.664693,9.436673],[76.664908,9.43687],[76.664867,9.437067],[76.664806,9.437361],[76.664801,9.437532],[76.664775,9.437839],[76.664656,9.438197],[76.664753,9.438231],[76.665063,9.438339],[76.665212,9.438382],[76.665317,9.43841],[76.665441,9.438438],[76.665586,9.438468],[76.665776,9.4385],[76.665879,9.43857],[76.666033,9.438717],[76.666246,9.438745],[76.666408,9.438733],[76.666662,9.438774],[76.666722,9.438947],[76.666905,9.439006],[76.667155,9.439088],[76.667321,9.43904],[76.667341,9.43867],[76.667359,9.43833],[76.667336,9.438235],[76.667286,9.437817],[76.667264,9.437534],[76.66725,9.437354],[76.667321,9.436941],[76.667274,9.436752],[76.66738,9.4365],[76.667521,9.436381],[76.667606,9.436309],[76.667711,9.436219],[76.66789,9.436064],[76.668043,9.435772],[76.668181,9.435484],[76.668379,9.43528],[76.668569,9.435084],[76.668805,9.434859],[76.668802,9.43471],[76.668799,9.434559],[76.668719,9.434434],[76.668605,9.434257],[76.668489,9.434089],[76.668352,9.433892],[76.668289,9.433802],[76.668149,9.433605],[76.668068,9.43346],[76.668003,9.433345],[76.668017,9.433013],[76.668022,9.432894],[76.668065,9.432793]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:52:10.483Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"8078214174\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"PUNNAMATTOM\",\"Ward_No\":\"11\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.637276,9.447134],[76.637224,9.447542],[76.63709,9.447881],[76.637126,9.448011],[76.63723,9.448165],[76.637324,9.448284],[76.637624,9.448463],[76.638409,9.449052],[76.638636,9.449217],[76.638718,9.449285],[76.638915,9.449432],[76.639002,9.449713],[76.639049,9.449863],[76.639112,9.450038],[76.639221,9.450415],[76.639384,9.450852],[76.639457,9.451028],[76.639545,9.451234],[76.63959,9.451349],[76.639632,9.451471],[76.639784,9.451939],[76.639831,9.452089],[76.639868,9.452235],[76.639935,9.452434],[76.639993,9.452509],[76.64008,9.452567],[76.640229,9.452646],[76.640682,9.452872],[76.64093,9.453179],[76.64099,9.4533],[76.640986,9.453804],[76.640999,9.453983],[76.641139,9.454273],[76.641235,9.454563],[76.641296,9.454747],[76.641321,9.454875],[76.641318,9.455036],[76.641311,9.45517],[76.641328,9.45558],[76.641372,9.455852],[76.641445,9.455974],[76.641588,9.45616],[76.641691,9.456312],[76.641742,9.456446],[76.641838,9.456629],[76.64191,9.456788],[76.642,9.456983],[76.642044,9.457072],[76.641955,9.457213],[76.641777,9.457365],[76.641272,9.457877],[76.641143,9.458138],[76.641012,9.458608],[76.640495,9.460464],[76.640456,9.460627],[76.640345,9.461011],[76.640148,9.461282],[76.639964,9.461549],[76.639729,9.461759],[76.639463,9.462011],[76.63907,9.462299],[76.638874,9.462445],[76.638791,9.462483],[76.638375,9.462675],[76.637868,9.462875],[76.637529,9.462985],[76.637203,9.463107],[76.637053,9.463155],[76.636442,9.463358],[76.63644,9.463234],[76.636375,9.462834],[76.636355,9.462805],[76.636325,9.462783],[76.63629,9.462776],[76.636243,9.462779],[76.636207,9.462814],[76.636149,9.46287],[76.636129,9.462886],[76.6361,9.462907],[76.636044,9.462907],[76.636001,9.462889],[76.635957,9.462861],[76.635936,9.462846],[76.6359,9.4628],[76.635863,9.462703],[76.635815,9.462564],[76.635784,9.46244],[76.635751,9.462418],[76.635705,9.462408],[76.635651,9.462415],[76.635595,9.462449],[76.635576,9.462464],[76.635564,9.462473],[76.635544,9.4625],[76.635536,9.462511],[76.635533,9.462514],[76.635518,9.462544],[76.635502,9.462574],[76.635492,9.462593],[76.635473,9.462629],[76.635494,9.462655],[76.635508,9.462671],[76.635522,9.462689],[76.635549,9.462722],[76.635569,9.462747],[76.635546,9.462752],[76.635472,9.462827],[76.635373,9.462788],[76.635249,9.462709],[76.635144,9.46258],[76.635031,9.462475],[76.634847,9.462271],[76.634833,9.462116],[76.63482,9.461963],[76.634953,9.461813],[76.635142,9.461719],[76.635256,9.461294],[76.635321,9.460976],[76.635341,9.460837],[76.635388,9.460752],[76.635442,9.460652],[76.635487,9.460559],[76.635545,9.46044],[76.63565,9.459904],[76.63493,9.459518],[76.634811,9.459339],[76.634658,9.45918],[76.634468,9.459037],[76.634387,9.458937],[76.634339,9.45885],[76.634358,9.458709],[76.634485,9.458251],[76.634594,9.457859],[76.634678,9.457552],[76.634751,9.457283],[76.634689,9.457209],[76.634513,9.457001],[76.633999,9.456832],[76.633871,9.456612],[76.633881,9.45586],[76.633618,9.455757],[76.633559,9.455867],[76.63331,9.456084],[76.633002,9.456142],[76.632624,9.456093],[76.632444,9.456018],[76.632453,9.455866],[76.632469,9.455618],[76.632734,9.455167],[76.632578,9.454774],[76.63249,9.454555],[76.632173,9.454082],[76.63181,9.453749],[76.631705,9.453423],[76.631695,9.453149],[76.63148,9.45279],[76.631436,9.452652],[76.631482,9.452474],[76.631822,9.45199],[76.63209,9.451609],[76.63211,9.451464],[76.632066,9.451201],[76.632169,9.450828],[76.632169,9.450222],[76.63196,9.449497],[76.631086,9.449278],[76.630968,9.449196],[76.630695,9.448377],[76.630612,9.44733],[76.630702,9.447184],[76.631098,9.446537],[76.631169,9.446217],[76.63101,9.44593],[76.630646,9.445603],[76.630511,9.4453],[76.630494,9.445106],[76.629812,9.44487],[76.629812,9.444298],[76.629939,9.444047],[76.630134,9.443957],[76.630323,9.44387],[76.630523,9.443715],[76.630608,9.443591],[76.630733,9.443475],[76.630826,9.443373],[76.630926,9.443281],[76.631158,9.443027],[76.631277,9.442905],[76.631398,9.442781],[76.632214,9.442415],[76.632579,9.442245],[76.633181,9.442205],[76.633352,9.442193],[76.633468,9.442203],[76.633673,9.442414],[76.633774,9.442557],[76.633833,9.442644],[76.633931,9.442924],[76.633999,9.443122],[76.634077,9.443242],[76.634202,9.443437],[76.634513,9.443865],[76.63465,9.444229],[76.634713,9.44432],[76.634914,9.444512],[76.635167,9.444596],[76.635589,9.444721],[76.63585,9.444848],[76.635948,9.444938],[76.636197,9.445167],[76.636435,9.445472],[76.63681,9.44598],[76.636896,9.446252],[76.636947,9.44636],[76.637064,9.446611],[76.637119,9.446709],[76.637231,9.447004],[76.637276,9.447134]]]},\"properties\":{\"Created_Da\":\"2024-10-19T14:21:46.612Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"MANKUZHI\",\"Ward_No\":\"1\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.674149,9.452528],[76.674115,9.452762],[76.674023,9.453347],[76.674007,9.453797],[76.67413,9.454189],[76.674328,9.454638],[76.674459,9.454754],[76.674529,9.454815],[76.674673,9.454883],[76.674772,9.45493],[76.674876,9.454979],[76.675097,9.455047],[76.675011,9.455201],[76.674903,9.455462],[76.674773,9.455773],[76.67463,9.455979],[76.674559,9.456044],[76.674354,9.45623],[76.674021,9.456302],[76.673793,9.45635],[76.673457,9.456422],[76.673085,9.456558],[76.67288,9.456485],[76.672648,9.456402],[76.672524,9.456366],[76.672422,9.456337],[76.672305,9.456296],[76.67196,9.456175],[76.671738,9.456099],[76.671562,9.456021],[76.671184,9.455845],[76.670947,9.455715],[76.670569,9.455404],[76.670389,9.455075],[76.67034,9.45499],[76.670243,9.454771],[76.669995,9.454226],[76.66991,9.453906],[76.669847,9.453673],[76.669758,9.453531],[76.669681,9.45341],[76.669633,9.45316],[76.669583,9.452657],[76.669543,9.452516],[76.669501,9.452406],[76.669523,9.452265],[76.669532,9.452148],[76.669547,9.451934],[76.669561,9.451742],[76.66958,9.451479],[76.669591,9.451328],[76.669619,9.450933],[76.66957,9.450607],[76.66951,9.450212],[76.669474,9.449976],[76.669287,9.449758],[76.669207,9.449664],[76.66896,9.449524],[76.668626,9.449335],[76.66831,9.449277],[76.667864,9.449195],[76.667521,9.449131],[76.667092,9.449052],[76.66698,9.448759],[76.666939,9.448645],[76.666885,9.448483],[76.666785,9.448181],[76.666676,9.44784],[76.666599,9.447592],[76.666491,9.447621],[76.666312,9.447666],[76.666146,9.447722],[76.665831,9.44783],[76.665465,9.447982],[76.665355,9.448027],[76.66505,9.448156],[76.664673,9.448312],[76.664593,9.448393],[76.66455,9.44862],[76.664412,9.448875],[76.664285,9.44895],[76.664037,9.449066],[76.663661,9.449145],[76.663447,9.4492],[76.663325,9.449225],[76.663074,9.449266],[76.662899,9.449295],[76.66284,9.449223],[76.662813,9.449059],[76.662781,9.44893],[76.662737,9.448812],[76.662661,9.448662],[76.662565,9.448532],[76.662361,9.448302],[76.662057,9.448098],[76.661857,9.447966],[76.661683,9.447794],[76.661673,9.447613],[76.661546,9.447241],[76.66137,9.446909],[76.661323,9.446755],[76.661415,9.44673],[76.661522,9.446702],[76.66185,9.446616],[76.662009,9.446573],[76.662177,9.446507],[76.662338,9.446443],[76.662735,9.446236],[76.662844,9.446028],[76.66295,9.445883],[76.663065,9.445724],[76.66331,9.445662],[76.663414,9.445693],[76.663579,9.445774],[76.663627,9.445859],[76.663762,9.446101],[76.663849,9.446222],[76.66395,9.44636],[76.664109,9.446563],[76.664264,9.446722],[76.664385,9.446842],[76.664551,9.446931],[76.664665,9.446936],[76.66475,9.446883],[76.664854,9.446701],[76.664953,9.446457],[76.664986,9.446349],[76.665111,9.445938],[76.665171,9.445538],[76.66522,9.445009],[76.665329,9.444648],[76.665408,9.444551],[76.665489,9.444469],[76.665589,9.444349],[76.665765,9.444021],[76.665829,9.443927],[76.665931,9.443776],[76.666052,9.443637],[76.666141,9.443535],[76.666421,9.443259],[76.66682,9.442961],[76.666959,9.442864],[76.667021,9.442768],[76.667071,9.442666],[76.667221,9.442362],[76.667315,9.442147],[76.667354,9.442057],[76.667453,9.441798],[76.667545,9.441506],[76.667733,9.441273],[76.66783,9.441152],[76.668236,9.440767],[76.668373,9.440678],[76.668545,9.440703],[76.668835,9.44089],[76.669088,9.441013],[76.669473,9.441152],[76.669808,9.441418],[76.669955,9.44158],[76.670204,9.441856],[76.670345,9.442042],[76.670598,9.442377],[76.67125,9.443067],[76.671497,9.443279],[76.671932,9.443318],[76.672354,9.443285],[76.67253,9.443279],[76.67297,9.443288],[76.673452,9.443089],[76.673807,9.442742],[76.673662,9.443015],[76.673603,9.443148],[76.673583,9.443259],[76.673539,9.443497],[76.673509,9.443749],[76.67344,9.444056],[76.673416,9.444153],[76.673342,9.444511],[76.673341,9.444829],[76.673354,9.444961],[76.673346,9.44519],[76.673346,9.445402],[76.673411,9.445627],[76.673462,9.445742],[76.673549,9.44597],[76.673576,9.446058],[76.673608,9.446256],[76.673656,9.446495],[76.673713,9.446997],[76.674146,9.448059],[76.674247,9.448197],[76.674429,9.448366],[76.674413,9.448571],[76.674388,9.448887],[76.6744,9.4493],[76.674403,9.449405],[76.674397,9.449542],[76.674385,9.449864],[76.67441,9.450217],[76.674423,9.450394],[76.674585,9.450559],[76.674656,9.450635],[76.674526,9.450799],[76.67444,9.451027],[76.674313,9.451368],[76.674232,9.451855],[76.674149,9.452528]]]},\"properties\":{\"Created_Da\":\"2024-10-19T16:54:13.487Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744459940\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"MUTTATHUMON\",\"Ward_No\":\"4\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.683861,9.452437],[76.683798,9.452579],[76.683684,9.452863],[76.683535,9.452934],[76.683565,9.453063],[76.683389,9.453165],[76.683285,9.453192],[76.68319,9.453198],[76.682861,9.453216],[76.682522,9.453268],[76.682329,9.453258],[76.682114,9.453147],[76.681681,9.453119],[76.681454,9.452713],[76.681334,9.452389],[76.68132,9.45172],[76.681295,9.450806],[76.681278,9.450717],[76.681061,9.450108],[76.681001,9.449938],[76.68097,9.449785],[76.680992,9.449639],[76.681003,9.449464],[76.68101,9.449331],[76.681016,9.449222],[76.681043,9.448705],[76.680919,9.448522],[76.680848,9.448214],[76.680847,9.447991],[76.680836,9.447664],[76.680816,9.447028],[76.680805,9.446695],[76.680796,9.446522],[76.680785,9.446306],[76.68072,9.446055],[76.680659,9.445881],[76.680547,9.445573],[76.680462,9.445348],[76.680387,9.445149],[76.680498,9.444558],[76.680562,9.444295],[76.680606,9.4442],[76.681111,9.443788],[76.681293,9.44364],[76.681409,9.443545],[76.681524,9.443451],[76.681657,9.443343],[76.681861,9.443177],[76.682296,9.442822],[76.682436,9.442708],[76.682648,9.442535],[76.682739,9.442461],[76.68289,9.442366],[76.682986,9.442333],[76.683157,9.442278],[76.683308,9.442231],[76.683398,9.442203],[76.683513,9.442214],[76.683677,9.442228],[76.683793,9.44224],[76.683919,9.442253],[76.684069,9.442228],[76.684223,9.442217],[76.684422,9.442134],[76.684649,9.44201],[76.684792,9.441899],[76.684889,9.441781],[76.685036,9.4416],[76.685108,9.441524],[76.685284,9.441331],[76.685388,9.441205],[76.685497,9.441081],[76.685574,9.44093],[76.685632,9.440761],[76.685671,9.44059],[76.685738,9.440423],[76.685846,9.44027],[76.68607,9.440106],[76.686206,9.440057],[76.6864,9.439994],[76.6866,9.439836],[76.686683,9.439697],[76.68675,9.439453],[76.686717,9.439271],[76.686709,9.439165],[76.686735,9.439019],[76.686782,9.438889],[76.686837,9.438754],[76.686882,9.438656],[76.686947,9.43853],[76.687027,9.438449],[76.687157,9.43837],[76.687265,9.438339],[76.687358,9.438311],[76.687496,9.438243],[76.687581,9.438186],[76.687833,9.438039],[76.688092,9.437905],[76.688174,9.437721],[76.688142,9.437567],[76.688073,9.437456],[76.687967,9.43732],[76.687937,9.437167],[76.688057,9.43694],[76.688166,9.436864],[76.688252,9.436817],[76.688414,9.436755],[76.688649,9.436764],[76.688733,9.436833],[76.68884,9.436928],[76.689069,9.437071],[76.689251,9.437142],[76.689372,9.43717],[76.689555,9.43711],[76.689708,9.436934],[76.689808,9.436679],[76.689865,9.436509],[76.689945,9.436345],[76.690079,9.436189],[76.690244,9.436036],[76.690426,9.435923],[76.690557,9.435879],[76.690807,9.435812],[76.69088,9.435672],[76.690839,9.435555],[76.690797,9.435467],[76.690724,9.435313],[76.690683,9.435226],[76.690643,9.435078],[76.690647,9.434935],[76.690723,9.434766],[76.69092,9.434646],[76.69104,9.434588],[76.691164,9.43449],[76.691229,9.434334],[76.691281,9.434174],[76.691336,9.43401],[76.691419,9.433869],[76.691511,9.433757],[76.691642,9.433568],[76.691775,9.433314],[76.691851,9.43314],[76.691893,9.432888],[76.691909,9.432726],[76.691903,9.4326],[76.691897,9.432464],[76.691891,9.432296],[76.691853,9.432134],[76.69172,9.432134],[76.691604,9.432124],[76.691463,9.43211],[76.691358,9.432108],[76.691212,9.432101],[76.691111,9.432133],[76.690997,9.43222],[76.690915,9.432298],[76.690748,9.43244],[76.690584,9.432537],[76.690473,9.432595],[76.690318,9.432638],[76.690202,9.43267],[76.690094,9.432685],[76.689941,9.432658],[76.689735,9.432516],[76.689558,9.432501],[76.689348,9.432528],[76.689208,9.432559],[76.688942,9.432621],[76.688814,9.432658],[76.688675,9.432719],[76.688549,9.432759],[76.688451,9.432745],[76.688357,9.43273],[76.688221,9.432709],[76.688093,9.432609],[76.688012,9.432522],[76.68791,9.432433],[76.687842,9.432352],[76.687737,9.432249],[76.687631,9.432154],[76.687557,9.432092],[76.687436,9.431971],[76.687313,9.431882],[76.68716,9.43179],[76.686981,9.43169],[76.686874,9.431635],[76.686766,9.431614],[76.686658,9.431589],[76.686567,9.431551],[76.686414,9.431431],[76.686301,9.431364],[76.686065,9.431266],[76.685892,9.431199],[76.68577,9.43119],[76.685599,9.43121],[76.685456,9.431268],[76.685296,9.431389],[76.685135,9.431516],[76.68502,9.431617],[76.684905,9.431691],[76.68482,9.431775],[76.684697,9.431905],[76.684519,9.43196],[76.684396,9.431987],[76.68423,9.431975],[76.684131,9.431787],[76.68409,9.43168],[76.683958,9.431525],[76.6838,9.431413],[76.683628,9.431349],[76.683397,9.431367],[76.683221,9.431467],[76.683142,9.431562],[76.683033,9.431634],[76.682835,9.431658],[76.682668,9.431747],[76.682575,9.431673],[76.682519,9.431377],[76.682488,9.431264],[76.68242,9.431102],[76.682316,9.430954],[76.682214,9.430698],[76.682158,9.430502],[76.682401,9.430373],[76.682544,9.430309],[76.682725,9.430229],[76.68306,9.430096],[76.68339,9.430002],[76.683618,9.429944],[76.683797,9.429879],[76.683914,9.429812],[76.68403,9.42972],[76.684252,9.429484],[76.684434,9.429277],[76.684511,9.429185],[76.684789,9.428816],[76.684994,9.428574],[76.685156,9.428568],[76.68531,9.428589],[76.685483,9.428608],[76.685626,9.428595],[76.685703,9.428541],[76.685697,9.428392],[76.685691,9.428253],[76.6857,9.428111],[76.68571,9.42801],[76.685744,9.427903],[76.685809,9.42781],[76.685881,9.427733],[76.686007,9.427655],[76.686056,9.42756],[76.685998,9.427452],[76.685951,9.427339],[76.685938,9.427199],[76.685921,9.426982],[76.685862,9.426811],[76.68578,9.426644],[76.685683,9.426484],[76.685526,9.426383],[76.685462,9.426274],[76.685447,9.42615],[76.685444,9.425985],[76.685426,9.425833],[76.685409,9.42569],[76.685404,9.425551],[76.685445,9.425465],[76.685586,9.425378],[76.685817,9.425558],[76.685938,9.425602],[76.686469,9.425619],[76.686588,9.425603],[76.686973,9.425487],[76.687074,9.425458],[76.687433,9.425366],[76.687576,9.425304],[76.689885,9.42351],[76.690829,9.422881],[76.691165,9.422902],[76.692058,9.422955],[76.692445,9.422978],[76.692626,9.422989],[76.692718,9.422995],[76.692811,9.423],[76.692976,9.422968],[76.693084,9.422947],[76.693192,9.422811],[76.693376,9.422621],[76.693526,9.422536],[76.693805,9.422629],[76.693879,9.422768],[76.693952,9.422905],[76.694056,9.422981],[76.694308,9.423114],[76.694178,9.423199],[76.694029,9.423362],[76.693934,9.423371],[76.69387,9.423481],[76.693699,9.423599],[76.693599,9.423751],[76.69337,9.423915],[76.693202,9.423941],[76.693061,9.423936],[76.692976,9.423983],[76.692795,9.424043],[76.692616,9.424102],[76.692344,9.424224],[76.692341,9.424326],[76.692104,9.424468],[76.691989,9.424456],[76.69192,9.424564],[76.691867,9.424647],[76.692003,9.425014],[76.692137,9.425202],[76.692187,9.425329],[76.692266,9.425492],[76.69234,9.425647],[76.692451,9.425837],[76.692618,9.425967],[76.692699,9.426338],[76.692585,9.42644],[76.692554,9.426602],[76.692704,9.427086],[76.692894,9.427241],[76.693005,9.427273],[76.6931,9.427189],[76.69332,9.427229],[76.693427,9.427247],[76.693715,9.427335],[76.693687,9.427596],[76.693786,9.427649],[76.693808,9.42777],[76.693848,9.427955],[76.69402,9.428098],[76.693935,9.428243],[76.693815,9.428369],[76.693827,9.428593],[76.693919,9.428642],[76.694052,9.428729],[76.693987,9.42899],[76.694064,9.429121],[76.694131,9.429206],[76.694222,9.429322],[76.694313,9.429436],[76.694379,9.42952],[76.694337,9.429609],[76.694337,9.429851],[76.694259,9.429915],[76.694138,9.430096],[76.694115,9.430337],[76.694059,9.430481],[76.694004,9.430623],[76.694015,9.430851],[76.694024,9.431048],[76.694108,9.431228],[76.694129,9.431391],[76.694166,9.431687],[76.694177,9.431782],[76.694212,9.43199],[76.694263,9.432131],[76.694325,9.432245],[76.694418,9.432358],[76.694508,9.432473],[76.694635,9.43282],[76.694618,9.432958],[76.694728,9.433225],[76.694683,9.433374],[76.694801,9.433499],[76.694827,9.433712],[76.69496,9.433921],[76.694857,9.434243],[76.694908,9.434455],[76.694855,9.434577],[76.694802,9.4347],[76.694594,9.434742],[76.694341,9.434798],[76.693682,9.434888],[76.693471,9.434979],[76.69295,9.435096],[76.692678,9.435179],[76.692531,9.435223],[76.692257,9.435312],[76.692127,9.435359],[76.691923,9.435433],[76.691496,9.435593],[76.691358,9.435707],[76.691268,9.435813],[76.691044,9.436078],[76.690968,9.436182],[76.690792,9.436423],[76.690725,9.436498],[76.690593,9.436644],[76.6905,9.436706],[76.690418,9.436761],[76.690309,9.436839],[76.69017,9.43692],[76.690049,9.436986],[76.689956,9.437036],[76.689881,9.437095],[76.689784,9.437171],[76.689641,9.437284],[76.689504,9.437377],[76.689355,9.437466],[76.689254,9.437543],[76.689121,9.437645],[76.689037,9.43774],[76.688785,9.437933],[76.688597,9.438078],[76.688401,9.438172],[76.688133,9.438301],[76.687888,9.438418],[76.687746,9.438503],[76.687334,9.438812],[76.687171,9.439111],[76.687173,9.439376],[76.687175,9.439499],[76.687187,9.439642],[76.687194,9.439913],[76.687197,9.440015],[76.687134,9.440124],[76.687072,9.440231],[76.686867,9.44049],[76.686613,9.440812],[76.686608,9.441212],[76.686605,9.441356],[76.686604,9.44148],[76.686631,9.441585],[76.686659,9.441696],[76.687144,9.442449],[76.687559,9.442577],[76.687676,9.442597],[76.687826,9.442617],[76.687965,9.442621],[76.688093,9.442792],[76.688178,9.442906],[76.688051,9.443024],[76.687969,9.4431],[76.688005,9.443203],[76.687728,9.443585],[76.687728,9.44379],[76.687586,9.443789],[76.687049,9.443784],[76.686957,9.443535],[76.686757,9.443522],[76.686399,9.443523],[76.68619,9.443469],[76.686044,9.443432],[76.685638,9.443526],[76.6855,9.443558],[76.68538,9.443583],[76.685276,9.443596],[76.68518,9.443606],[76.68506,9.443635],[76.68511,9.443761],[76.685257,9.444135],[76.685309,9.444267],[76.685382,9.444355],[76.685063,9.444616],[76.684858,9.444905],[76.684569,9.445128],[76.684443,9.445225],[76.684295,9.445339],[76.684135,9.445443],[76.683931,9.445576],[76.683846,9.445626],[76.683889,9.445744],[76.68404,9.445944],[76.684162,9.446111],[76.684198,9.446206],[76.68424,9.446345],[76.684294,9.446497],[76.684385,9.446613],[76.684454,9.446725],[76.684558,9.446907],[76.684653,9.447104],[76.684701,9.447245],[76.684741,9.447362],[76.684775,9.447565],[76.684799,9.447704],[76.684788,9.447856],[76.684791,9.447956],[76.684783,9.448067],[76.684796,9.44821],[76.684803,9.448419],[76.684814,9.448546],[76.684816,9.448638],[76.684793,9.448764],[76.684763,9.448932],[76.684735,9.449062],[76.684705,9.449158],[76.684674,9.449255],[76.684586,9.449529],[76.684543,9.449663],[76.684557,9.449864],[76.684589,9.450125],[76.684605,9.450273],[76.684605,9.450498],[76.684601,9.450611],[76.684597,9.450727],[76.684568,9.450912],[76.684544,9.451017],[76.684512,9.451145],[76.684348,9.451271],[76.684308,9.451398],[76.684234,9.451652],[76.684165,9.451839],[76.684087,9.451993],[76.684008,9.452146],[76.683861,9.452437]]]},\"properties\":{\"Created_Da\":\"2024-10-20T16:53:06.290Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"PARACKATHANAM\",\"Ward_No\":\"6\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.649643,9.44394],[76.649642,9.444081],[76.64967,9.444179],[76.649707,9.444281],[76.649749,9.444455],[76.649761,9.444625],[76.649775,9.444801],[76.649782,9.444913],[76.649796,9.445003],[76.649837,9.445174],[76.649862,9.445279],[76.649884,9.445497],[76.649891,9.445591],[76.64989,9.445732],[76.649922,9.445958],[76.649957,9.446085],[76.649996,9.446195],[76.650069,9.446352],[76.65006,9.446543],[76.65008,9.446743],[76.650102,9.446906],[76.650137,9.447055],[76.650159,9.447157],[76.650203,9.447313],[76.650265,9.447559],[76.650297,9.447793],[76.650327,9.447942],[76.650351,9.448077],[76.65035,9.448205],[76.650409,9.448321],[76.650523,9.448503],[76.65054,9.4486],[76.650546,9.448735],[76.650557,9.448912],[76.65057,9.449011],[76.650583,9.449105],[76.650598,9.449235],[76.650603,9.44941],[76.650608,9.449608],[76.650589,9.449711],[76.650564,9.449857],[76.650566,9.450059],[76.650642,9.450117],[76.650765,9.450153],[76.650969,9.450183],[76.651127,9.450152],[76.651288,9.450078],[76.651497,9.450021],[76.651485,9.450172],[76.651184,9.450467],[76.650926,9.450792],[76.650743,9.451136],[76.650668,9.451279],[76.650574,9.451394],[76.650357,9.451662],[76.650194,9.451768],[76.649883,9.451999],[76.649698,9.452304],[76.649522,9.452825],[76.649432,9.453042],[76.649382,9.453163],[76.649163,9.453447],[76.649072,9.453512],[76.648847,9.453618],[76.648594,9.453707],[76.648367,9.453779],[76.648257,9.45383],[76.647983,9.45389],[76.647849,9.453923],[76.647585,9.453984],[76.64745,9.454014],[76.647226,9.454056],[76.647097,9.454072],[76.646738,9.454102],[76.646403,9.454169],[76.646152,9.454205],[76.64592,9.454299],[76.645834,9.454333],[76.64548,9.454475],[76.644963,9.454642],[76.644472,9.454801],[76.644052,9.454968],[76.643882,9.455078],[76.643404,9.455682],[76.64319,9.45589],[76.642819,9.45622],[76.642571,9.456523],[76.642275,9.456853],[76.642044,9.457072],[76.642,9.456983],[76.64191,9.456788],[76.641838,9.456629],[76.641742,9.456446],[76.641691,9.456312],[76.641588,9.45616],[76.641445,9.455974],[76.641372,9.455852],[76.641328,9.45558],[76.641311,9.45517],[76.641318,9.455036],[76.641321,9.454875],[76.641296,9.454747],[76.641235,9.454563],[76.641139,9.454273],[76.640999,9.453983],[76.640986,9.453804],[76.64099,9.4533],[76.64093,9.453179],[76.640682,9.452872],[76.640229,9.452646],[76.64008,9.452567],[76.639993,9.452509],[76.639935,9.452434],[76.639868,9.452235],[76.639831,9.452089],[76.639784,9.451939],[76.639632,9.451471],[76.63959,9.451349],[76.63968,9.451315],[76.63983,9.451279],[76.640008,9.451267],[76.64031,9.451207],[76.64054,9.451143],[76.640691,9.451081],[76.640868,9.451069],[76.640893,9.451212],[76.640883,9.4514],[76.640873,9.451578],[76.640854,9.451749],[76.640955,9.451827],[76.641128,9.451849],[76.641267,9.451872],[76.641368,9.451898],[76.641461,9.4519],[76.641555,9.451967],[76.641545,9.452082],[76.641495,9.452352],[76.641642,9.452525],[76.641756,9.452547],[76.641941,9.452572],[76.64208,9.452579],[76.642265,9.452572],[76.642476,9.452597],[76.642577,9.452637],[76.64271,9.452639],[76.642798,9.452666],[76.642965,9.452825],[76.643167,9.452902],[76.643267,9.452872],[76.643369,9.452818],[76.643503,9.452747],[76.643668,9.452601],[76.643832,9.452373],[76.643891,9.452278],[76.644023,9.452125],[76.644108,9.452002],[76.644167,9.451843],[76.644203,9.451755],[76.644385,9.451555],[76.644566,9.451416],[76.644678,9.451297],[76.644789,9.451127],[76.644859,9.451027],[76.645175,9.450942],[76.64538,9.450811],[76.645286,9.450763],[76.645102,9.450641],[76.644974,9.450552],[76.644921,9.450421],[76.644881,9.450288],[76.644832,9.450062],[76.644839,9.449912],[76.644808,9.449779],[76.644778,9.449566],[76.644795,9.449403],[76.644859,9.449096],[76.644961,9.448919],[76.64507,9.448853],[76.645178,9.448831],[76.645335,9.448783],[76.645449,9.448752],[76.645719,9.448649],[76.645881,9.448568],[76.646085,9.448483],[76.646436,9.448079],[76.646461,9.447863],[76.646463,9.447617],[76.646471,9.447394],[76.646487,9.447282],[76.64652,9.447059],[76.646584,9.446838],[76.646638,9.446603],[76.646742,9.44636],[76.646945,9.446007],[76.647068,9.445797],[76.647167,9.44558],[76.647202,9.445341],[76.647233,9.445115],[76.647261,9.444894],[76.647278,9.444751],[76.647312,9.44459],[76.647432,9.444423],[76.647548,9.444385],[76.647673,9.444379],[76.647857,9.444371],[76.64799,9.444351],[76.648189,9.444316],[76.648317,9.444289],[76.648484,9.444252],[76.648654,9.444213],[76.648875,9.444151],[76.649101,9.444068],[76.649266,9.444006],[76.649376,9.443972],[76.649643,9.44394]]]},\"properties\":{\"Created_Da\":\"2024-10-20T15:34:13.887Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744459940\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"MALLAPPALLY WEST\",\"Ward_No\":\"14\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.682158,9.430502],[76.682023,9.430567],[76.681865,9.430589],[76.68176,9.430574],[76.681668,9.43055],[76.681584,9.4306],[76.681497,9.430651],[76.681301,9.430759],[76.681183,9.430848],[76.681107,9.430901],[76.680961,9.430961],[76.680839,9.431028],[76.680701,9.431128],[76.680575,9.431219],[76.680448,9.431314],[76.680332,9.431403],[76.680164,9.431549],[76.679995,9.431616],[76.679713,9.431819],[76.679647,9.4319],[76.679526,9.432097],[76.679374,9.432275],[76.67928,9.432366],[76.679172,9.432464],[76.679064,9.432588],[76.678996,9.432662],[76.67884,9.432763],[76.678728,9.432837],[76.678612,9.432916],[76.678521,9.433005],[76.678431,9.433079],[76.678282,9.433157],[76.678127,9.433186],[76.677941,9.433179],[76.677841,9.433163],[76.677739,9.433149],[76.677645,9.433137],[76.677536,9.433148],[76.677424,9.433155],[76.67732,9.433154],[76.677134,9.43316],[76.677039,9.43324],[76.676942,9.433357],[76.676849,9.433461],[76.676765,9.433523],[76.676667,9.433594],[76.676593,9.433649],[76.676515,9.43372],[76.676429,9.433824],[76.676358,9.433887],[76.676203,9.433973],[76.67604,9.433992],[76.675908,9.433932],[76.675786,9.433835],[76.675625,9.433839],[76.675393,9.433863],[76.675212,9.433908],[76.675008,9.433939],[76.674824,9.433912],[76.674674,9.433862],[76.674631,9.433954],[76.674617,9.434094],[76.674597,9.434273],[76.674512,9.434548],[76.674386,9.434683],[76.674251,9.434775],[76.674123,9.434701],[76.673969,9.434556],[76.673778,9.434411],[76.673604,9.434298],[76.673218,9.434103],[76.673036,9.434049],[76.672911,9.434022],[76.672801,9.43395],[76.672693,9.43388],[76.672426,9.433671],[76.672245,9.433509],[76.672156,9.433438],[76.671997,9.433227],[76.671941,9.433148],[76.671835,9.432915],[76.671774,9.432757],[76.671627,9.432393],[76.67146,9.432041],[76.671309,9.431659],[76.671492,9.43162],[76.671761,9.43153],[76.671977,9.431466],[76.672326,9.431269],[76.672602,9.430958],[76.672732,9.43076],[76.672809,9.430573],[76.672883,9.430352],[76.673095,9.429972],[76.6732,9.429786],[76.673258,9.429681],[76.673327,9.429489],[76.673395,9.429252],[76.673497,9.428906],[76.673534,9.428775],[76.673561,9.428688],[76.673667,9.4284],[76.673935,9.427975],[76.67417,9.427685],[76.6745,9.427448],[76.674727,9.427247],[76.674948,9.426973],[76.675114,9.426815],[76.675482,9.426795],[76.675561,9.426713],[76.675625,9.426648],[76.675668,9.426564],[76.675692,9.426442],[76.67572,9.426298],[76.675775,9.426007],[76.675811,9.425813],[76.675859,9.425566],[76.675868,9.425289],[76.675873,9.425152],[76.675877,9.425015],[76.67588,9.424912],[76.675885,9.424756],[76.676015,9.424434],[76.676111,9.424196],[76.676248,9.423786],[76.676337,9.423661],[76.676551,9.423361],[76.676777,9.422993],[76.677144,9.422436],[76.677214,9.422361],[76.67748,9.422077],[76.677994,9.421499],[76.678408,9.421187],[76.678585,9.421094],[76.678782,9.420973],[76.678933,9.420935],[76.6792,9.420854],[76.679562,9.420779],[76.679727,9.420675],[76.679876,9.420351],[76.68005,9.420404],[76.680092,9.420536],[76.680133,9.420664],[76.68023,9.420798],[76.680402,9.42104],[76.680526,9.421211],[76.680729,9.421555],[76.680828,9.421873],[76.680984,9.421986],[76.681065,9.42207],[76.681324,9.422341],[76.681713,9.422636],[76.681774,9.422937],[76.681759,9.42313],[76.681766,9.423302],[76.681764,9.423403],[76.681791,9.423495],[76.681893,9.423696],[76.682038,9.423984],[76.68209,9.424059],[76.682169,9.424174],[76.682245,9.424263],[76.682566,9.424394],[76.682726,9.424469],[76.682998,9.424576],[76.682995,9.424669],[76.683082,9.424765],[76.683212,9.424847],[76.683317,9.424895],[76.683473,9.424953],[76.683647,9.424991],[76.68379,9.42501],[76.684085,9.425058],[76.684243,9.425072],[76.684375,9.425047],[76.684562,9.425002],[76.684776,9.424971],[76.685005,9.425046],[76.685248,9.425143],[76.685468,9.42526],[76.685586,9.425378],[76.685445,9.425465],[76.685404,9.425551],[76.685409,9.42569],[76.685426,9.425833],[76.685444,9.425985],[76.685447,9.42615],[76.685462,9.426274],[76.685526,9.426383],[76.685683,9.426484],[76.68578,9.426644],[76.685862,9.426811],[76.685921,9.426982],[76.685938,9.427199],[76.685951,9.427339],[76.685998,9.427452],[76.686056,9.42756],[76.686007,9.427655],[76.685881,9.427733],[76.685809,9.42781],[76.685744,9.427903],[76.68571,9.42801],[76.6857,9.428111],[76.685691,9.428253],[76.685697,9.428392],[76.685703,9.428541],[76.685626,9.428595],[76.685483,9.428608],[76.68531,9.428589],[76.685156,9.428568],[76.684994,9.428574],[76.684789,9.428816],[76.684511,9.429185],[76.684434,9.429277],[76.684252,9.429484],[76.68403,9.42972],[76.683914,9.429812],[76.683797,9.429879],[76.683618,9.429944],[76.68339,9.430002],[76.68306,9.430096],[76.682725,9.430229],[76.682544,9.430309],[76.682401,9.430373],[76.682158,9.430502]]]},\"properties\":{\"Created_Da\":\"2024-10-20T11:27:02.964Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744459940\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"KIZHAKKEKKARA\",\"Ward_No\":\"9\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.674925,9.435268],[76.674517,9.434993],[76.674251,9.434775],[76.674386,9.434683],[76.674512,9.434548],[76.674597,9.434273],[76.674617,9.434094],[76.674631,9.433954],[76.674674,9.433862],[76.674824,9.433912],[76.675008,9.433939],[76.675212,9.433908],[76.675393,9.433863],[76.675625,9.433839],[76.675786,9.433835],[76.675908,9.433932],[76.67604,9.433992],[76.676203,9.433973],[76.676358,9.433887],[76.676429,9.433824],[76.676515,9.43372],[76.676593,9.433649],[76.676667,9.433594],[76.676765,9.433523],[76.676849,9.433461],[76.676942,9.433357],[76.677039,9.43324],[76.677134,9.43316],[76.67732,9.433154],[76.677424,9.433155],[76.677536,9.433148],[76.677645,9.433137],[76.677739,9.433149],[76.677841,9.433163],[76.677941,9.433179],[76.678127,9.433186],[76.678282,9.433157],[76.678431,9.433079],[76.678521,9.433005],[76.678612,9.432916],[76.678728,9.432837],[76.67884,9.432763],[76.678996,9.432662],[76.679064,9.432588],[76.679172,9.432464],[76.67928,9.432366],[76.679374,9.432275],[76.679526,9.432097],[76.679647,9.4319],[76.679713,9.431819],[76.679995,9.431616],[76.680164,9.431549],[76.680332,9.431403],[76.680448,9.431314],[76.680575,9.431219],[76.680701,9.431128],[76.680839,9.431028],[76.680961,9.430961],[76.681107,9.430901],[76.681183,9.430848],[76.681301,9.430759],[76.681497,9.430651],[76.681584,9.4306],[76.681668,9.43055],[76.68176,9.430574],[76.681865,9.430589],[76.682023,9.430567],[76.682158,9.430502],[76.682214,9.430698],[76.682316,9.430954],[76.68242,9.431102],[76.682488,9.431264],[76.682519,9.431377],[76.682575,9.431673],[76.682668,9.431747],[76.682835,9.431658],[76.683033,9.431634],[76.683142,9.431562],[76.683221,9.431467],[76.683397,9.431367],[76.683628,9.431349],[76.6838,9.431413],[76.683958,9.431525],[76.68409,9.43168],[76.684131,9.431787],[76.68423,9.431975],[76.684396,9.431987],[76.684519,9.43196],[76.684697,9.431905],[76.68482,9.431775],[76.684905,9.431691],[76.68502,9.431617],[76.685135,9.431516],[76.685296,9.431389],[76.685456,9.431268],[76.685599,9.43121],[76.68577,9.43119],[76.685892,9.431199],[76.686065,9.431266],[76.686301,9.431364],[76.686414,9.431431],[76.686567,9.431551],[76.686658,9.431589],[76.686766,9.431614],[76.686874,9.431635],[76.686981,9.43169],[76.68716,9.43179],[76.687313,9.431882],[76.687436,9.431971],[76.687557,9.432092],[76.687631,9.432154],[76.687737,9.432249],[76.687842,9.432352],[76.68791,9.432433],[76.688012,9.432522],[76.688093,9.432609],[76.688221,9.432709],[76.688357,9.43273],[76.688451,9.432745],[76.688549,9.432759],[76.688675,9.432719],[76.688814,9.432658],[76.688942,9.432621],[76.689208,9.432559],[76.689348,9.432528],[76.689558,9.432501],[76.689735,9.432516],[76.689941,9.432658],[76.690094,9.432685],[76.690202,9.43267],[76.690318,9.432638],[76.690473,9.432595],[76.690584,9.432537],[76.690748,9.43244],[76.690915,9.432298],[76.690997,9.43222],[76.691111,9.432133],[76.691212,9.432101],[76.691358,9.432108],[76.691463,9.43211],[76.691604,9.432124],[76.69172,9.432134],[76.691853,9.432134],[76.691891,9.432296],[76.691897,9.432464],[76.691903,9.4326],[76.691909,9.432726],[76.691893,9.432888],[76.691851,9.43314],[76.691775,9.433314],[76.691642,9.433568],[76.691511,9.433757],[76.691419,9.433869],[76.691336,9.43401],[76.691281,9.434174],[76.691229,9.434334],[76.691164,9.43449],[76.69104,9.434588],[76.69092,9.434646],[76.690723,9.434766],[76.690647,9.434935],[76.690643,9.435078],[76.690683,9.435226],[76.690724,9.435313],[76.690797,9.435467],[76.690839,9.435555],[76.69088,9.435672],[76.690807,9.435812],[76.690557,9.435879],[76.690426,9.435923],[76.690244,9.436036],[76.690079,9.436189],[76.689945,9.436345],[76.689865,9.436509],[76.689808,9.436679],[76.689708,9.436934],[76.689555,9.43711],[76.689372,9.43717],[76.689251,9.437142],[76.689069,9.437071],[76.68884,9.436928],[76.688733,9.436833],[76.688649,9.436764],[76.688414,9.436755],[76.688252,9.436817],[76.688166,9.436864],[76.688057,9.43694],[76.687937,9.437167],[76.687967,9.43732],[76.688073,9.437456],[76.688142,9.437567],[76.688174,9.437721],[76.688092,9.437905],[76.687833,9.438039],[76.687581,9.438186],[76.687496,9.438243],[76.687358,9.438311],[76.687265,9.438339],[76.687157,9.43837],[76.687027,9.438449],[76.686947,9.43853],[76.686882,9.438656],[76.686837,9.438754],[76.686782,9.438889],[76.686735,9.439019],[76.686709,9.439165],[76.686717,9.439271],[76.68675,9.439453],[76.686683,9.439697],[76.6866,9.439836],[76.6864,9.439994],[76.686206,9.440057],[76.68607,9.440106],[76.685846,9.44027],[76.685738,9.440423],[76.685671,9.44059],[76.685632,9.440761],[76.685574,9.44093],[76.685497,9.441081],[76.685388,9.441205],[76.685284,9.441331],[76.685108,9.441524],[76.685036,9.4416],[76.684889,9.441781],[76.684792,9.441899],[76.684649,9.44201],[76.684422,9.442134],[76.684223,9.442217],[76.684069,9.442228],[76.683919,9.442253],[76.683978,9.442046],[76.684079,9.441879],[76.68421,9.441668],[76.684284,9.441409],[76.684307,9.441321],[76.68439,9.441141],[76.68448,9.440952],[76.684517,9.440741],[76.684495,9.440567],[76.684457,9.44032],[76.684408,9.44011],[76.684363,9.440019],[76.684231,9.439865],[76.684127,9.439721],[76.684102,9.439523],[76.684112,9.439303],[76.684107,9.439202],[76.684048,9.439017],[76.68401,9.438927],[76.683929,9.438751],[76.68387,9.438658],[76.683733,9.438451],[76.683578,9.438283],[76.683494,9.438205],[76.683322,9.43807],[76.683057,9.437999],[76.682896,9.438075],[76.682803,9.438191],[76.682678,9.43836],[76.682571,9.438408],[76.682348,9.438423],[76.682076,9.438392],[76.681807,9.438415],[76.681705,9.438436],[76.681601,9.438458],[76.681326,9.438521],[76.681248,9.4386],[76.68113,9.43876],[76.681077,9.43886],[76.68101,9.439404],[76.68096,9.439482],[76.680747,9.439397],[76.680613,9.439323],[76.680521,9.439301],[76.680364,9.43928],[76.680157,9.439293],[76.679874,9.439345],[76.679726,9.439356],[76.679475,9.439314],[76.679244,9.439279],[76.678948,9.439313],[76.678824,9.439318],[76.678666,9.439325],[76.678453,9.439441],[76.678359,9.439497],[76.678212,9.439642],[76.67813,9.439761],[76.677974,9.439966],[76.677846,9.440145],[76.677725,9.440345],[76.677623,9.440532],[76.677578,9.440619],[76.677407,9.440752],[76.677248,9.440755],[76.677103,9.440753],[76.67674,9.440895],[76.676638,9.440971],[76.676556,9.441079],[76.676503,9.441164],[76.676428,9.441219],[76.676328,9.441097],[76.676248,9.440968],[76.676165,9.440845],[76.676057,9.4407],[76.676011,9.440616],[76.675946,9.440465],[76.675921,9.440373],[76.675893,9.440243],[76.675845,9.440155],[76.675808,9.439965],[76.675807,9.439821],[76.675767,9.439677],[76.675703,9.439483],[76.675672,9.439364],[76.67564,9.439216],[76.675607,9.439116],[76.675579,9.439011],[76.675517,9.438857],[76.675466,9.438749],[76.675401,9.438576],[76.675352,9.438415],[76.675323,9.438251],[76.675321,9.438116],[76.67531,9.437974],[76.675303,9.437868],[76.675303,9.437765],[76.675276,9.437532],[76.675253,9.437353],[76.675236,9.437184],[76.675285,9.437066],[76.675312,9.43695],[76.675358,9.436835],[76.675439,9.436652],[76.675471,9.436497],[76.675534,9.436313],[76.675525,9.43618],[76.675413,9.436058],[76.67532,9.435956],[76.675207,9.43582],[76.67511,9.435697],[76.674925,9.435268]]]},\"properties\":{\"Created_Da\":\"2024-10-20T14:11:41.963Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Mallappally\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744459940\",\"Surveyor\":\"Libu mathew\",\"Ward_Name\":\"KEEZHVAIPUR EAST\",\"Ward_No\":\"10\",\"Mandal\":\"Mallappally\"}}]}");
@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.528947,9.367639],[76.529125,9.367377],[76.529217,9.367198],[76.529385,9.366868],[76.529737,9.367338],[76.529844,9.367467],[76.529861,9.367668],[76.529665,9.367823],[76.529744,9.367992],[76.529817,9.368104],[76.529953,9.368158],[76.530115,9.368198],[76.530175,9.368358],[76.529874,9.368501],[76.52957,9.368633],[76.529359,9.368797],[76.529183,9.368983],[76.528947,9.369213],[76.528757,9.3694],[76.528479,9.369659],[76.528154,9.369948],[76.527738,9.37015],[76.527536,9.37021],[76.527238,9.370214],[76.526885,9.37022],[76.526721,9.370223],[76.526557,9.370227],[76.526376,9.370254],[76.526096,9.370295],[76.52595,9.370324],[76.525804,9.370352],[76.525399,9.370469],[76.525032,9.370569],[76.524836,9.370577],[76.52468,9.370557],[76.524342,9.370485],[76.524101,9.370455],[76.523798,9.37045],[76.523338,9.370488],[76.523066,9.37057],[76.522905,9.370633],[76.522743,9.370696],[76.522358,9.370859],[76.522018,9.370951],[76.52188,9.370984],[76.521785,9.371006],[76.521661,9.371025],[76.521458,9.371063],[76.521336,9.371078],[76.521202,9.371095],[76.521061,9.371121],[76.520946,9.371134],[76.52082,9.371147],[76.520682,9.371162],[76.520507,9.371184],[76.520339,9.371202],[76.520095,9.371244],[76.519927,9.371257],[76.519786,9.371284],[76.519695,9.371292],[76.519505,9.37132],[76.519376,9.371337],[76.519201,9.371361],[76.519042,9.37138],[76.518892,9.371405],[76.518756,9.37142],[76.518632,9.371433],[76.517868,9.371532],[76.517738,9.371553],[76.517549,9.371566],[76.517435,9.371585],[76.517266,9.371602],[76.517106,9.371615],[76.517003,9.37162],[76.516881,9.371637],[76.516618,9.371653],[76.516381,9.37165],[76.516293,9.371699],[76.516275,9.371876],[76.516188,9.372001],[76.516079,9.372107],[76.515997,9.372216],[76.515992,9.372372],[76.515979,9.372463],[76.515956,9.372556],[76.515934,9.372655],[76.515868,9.372743],[76.515796,9.372831],[76.515828,9.373005],[76.515899,9.373119],[76.515983,9.37327],[76.515955,9.373379],[76.515818,9.373447],[76.515701,9.373573],[76.515742,9.373753],[76.515785,9.373856],[76.515854,9.374],[76.515935,9.374153],[76.515993,9.374223],[76.516068,9.374432],[76.516008,9.37452],[76.515853,9.374599],[76.515737,9.374641],[76.515634,9.374683],[76.515476,9.374753],[76.515359,9.374783],[76.515193,9.374838],[76.515087,9.374873],[76.514862,9.374938],[76.514758,9.374947],[76.514592,9.374912],[76.514497,9.374917],[76.514334,9.374963],[76.514186,9.374991],[76.514104,9.374948],[76.514013,9.374782],[76.513901,9.374733],[76.513718,9.37475],[76.513579,9.374775],[76.513313,9.374852],[76.513183,9.374892],[76.513017,9.374944],[76.512297,9.375272],[76.512209,9.375305],[76.512055,9.37538],[76.512013,9.375541],[76.511975,9.375662],[76.511904,9.37582],[76.511855,9.375913],[76.511765,9.376028],[76.511644,9.376207],[76.511546,9.376307],[76.511468,9.376426],[76.511416,9.376625],[76.511382,9.376818],[76.511331,9.376984],[76.511289,9.377134],[76.511247,9.377298],[76.511194,9.377441],[76.511157,9.377564],[76.511125,9.377769],[76.511123,9.377906],[76.511134,9.378114],[76.511159,9.378345],[76.511209,9.378469],[76.511293,9.378609],[76.511332,9.378699],[76.511367,9.378838],[76.511405,9.378954],[76.511453,9.379047],[76.511497,9.379143],[76.511509,9.37924],[76.511514,9.379369],[76.511504,9.379484],[76.511531,9.379621],[76.511615,9.379776],[76.51165,9.379921],[76.511648,9.380052],[76.511636,9.380171],[76.511631,9.380269],[76.511604,9.380404],[76.511584,9.380517],[76.511596,9.380636],[76.511641,9.380761],[76.511757,9.380912],[76.51187,9.381029],[76.512023,9.381118],[76.512126,9.3812],[76.512288,9.381353],[76.512401,9.381421],[76.512495,9.381453],[76.512607,9.381455],[76.512714,9.3814],[76.512654,9.381144],[76.512748,9.381015],[76.512843,9.380867],[76.513049,9.380808],[76.513573,9.380745],[76.513628,9.380905],[76.513746,9.381252],[76.514512,9.380861],[76.515366,9.382188],[76.51517,9.382319],[76.515088,9.382397],[76.51501,9.382471],[76.514941,9.382537],[76.514758,9.38282],[76.514705,9.3829],[76.514669,9.382986],[76.514554,9.38326],[76.514448,9.383322],[76.514273,9.383386],[76.514102,9.383479],[76.514012,9.383528],[76.51385,9.383485],[76.513631,9.383575],[76.513501,9.383628],[76.513362,9.38368],[76.513158,9.383756],[76.513024,9.383802],[76.512918,9.383839],[76.512797,9.383881],[76.512729,9.383979],[76.512574,9.384071],[76.512479,9.384111],[76.512336,9.384171],[76.512183,9.38424],[76.512097,9.384279],[76.511943,9.38431],[76.511746,9.38435],[76.511756,9.384125],[76.51181,9.383897],[76.511878,9.383624],[76.511929,9.383243],[76.511973,9.38301],[76.511994,9.382724],[76.512014,9.382453],[76.511902,9.382274],[76.511604,9.382202],[76.511233,9.382202],[76.511007,9.381986],[76.510978,9.381892],[76.510852,9.381633],[76.510727,9.381206],[76.510672,9.380997],[76.510579,9.380622],[76.510622,9.380422],[76.510634,9.38018],[76.510624,9.379971],[76.510488,9.379485],[76.510382,9.378975],[76.510167,9.378368],[76.50995,9.377808],[76.509776,9.376734],[76.509858,9.376315],[76.509887,9.376263],[76.510177,9.375888],[76.510312,9.375796],[76.510509,9.375657],[76.511125,9.375319],[76.51181,9.374747],[76.51218,9.37438],[76.512474,9.373884],[76.512684,9.373615],[76.512875,9.373481],[76.513305,9.373452],[76.513949,9.37344],[76.514605,9.373411],[76.514679,9.373364],[76.51479,9.373088],[76.514768,9.372151],[76.514621,9.371761],[76.514433,9.37082],[76.514465,9.370509],[76.51469,9.370265],[76.51495,9.370093],[76.515306,9.370067],[76.516921,9.36996],[76.517501,9.369939],[76.517885,9.369914],[76.517881,9.369898],[76.518451,9.369819],[76.519105,9.369643],[76.520641,9.369173],[76.521506,9.368903],[76.523206,9.368549],[76.523597,9.368452],[76.523775,9.368307],[76.523885,9.368394],[76.524241,9.368539],[76.524764,9.36875],[76.524923,9.368814],[76.525561,9.369095],[76.526079,9.369391],[76.526278,9.3694],[76.526573,9.369367],[76.526891,9.369375],[76.527203,9.369301],[76.527398,9.369197],[76.52772,9.368997],[76.528092,9.368767],[76.528458,9.368325],[76.528567,9.368206],[76.528666,9.368054],[76.528947,9.367639]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947667106\",\"Surveyor\":\"Raji Ramesh\",\"Ward_Name\":\"JALAMELA\",\"Ward_No\":\"1\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.548143,9.367987],[76.548304,9.367998],[76.548483,9.368061],[76.548623,9.368089],[76.54873,9.368086],[76.548842,9.368108],[76.549005,9.368147],[76.549181,9.368122],[76.54943,9.368045],[76.549528,9.368018],[76.54963,9.368002],[76.549754,9.367999],[76.549928,9.367993],[76.550041,9.368017],[76.550148,9.368032],[76.550285,9.368093],[76.550413,9.368194],[76.550517,9.368419],[76.550537,9.368584],[76.550547,9.368678],[76.550556,9.368788],[76.550568,9.368908],[76.550584,9.369009],[76.550613,9.369141],[76.550732,9.369151],[76.550834,9.369146],[76.550954,9.369143],[76.551063,9.369211],[76.551164,9.369304],[76.551286,9.369372],[76.55143,9.36937],[76.551612,9.369346],[76.551746,9.369439],[76.551843,9.369509],[76.551845,9.369631],[76.551848,9.369815],[76.551851,9.370033],[76.551866,9.370273],[76.551882,9.370514],[76.551949,9.370674],[76.551924,9.370966],[76.552014,9.371047],[76.552033,9.371249],[76.552051,9.371449],[76.552109,9.371592],[76.552059,9.371942],[76.551894,9.372016],[76.551861,9.372184],[76.551827,9.372356],[76.551818,9.372464],[76.551763,9.372804],[76.551767,9.372905],[76.551995,9.372956],[76.552142,9.372964],[76.552493,9.372985],[76.552761,9.373136],[76.552949,9.373301],[76.553152,9.37346],[76.553065,9.373589],[76.552811,9.373893],[76.552675,9.373981],[76.552213,9.374142],[76.551851,9.374269],[76.551617,9.374615],[76.551509,9.374881],[76.551496,9.375244],[76.551414,9.375495],[76.551397,9.375639],[76.551387,9.375735],[76.55088,9.375701],[76.550629,9.375827],[76.550711,9.376056],[76.550545,9.376153],[76.55011,9.376405],[76.549797,9.376395],[76.549611,9.376389],[76.549596,9.37629],[76.549572,9.376166],[76.549546,9.376003],[76.549531,9.37589],[76.549283,9.375865],[76.549048,9.375842],[76.5489,9.375844],[76.548693,9.375847],[76.548635,9.375692],[76.548632,9.375542],[76.548632,9.375377],[76.548639,9.375182],[76.548663,9.375053],[76.548681,9.374882],[76.548688,9.374675],[76.548668,9.374489],[76.548675,9.374341],[76.548658,9.374151],[76.548646,9.374053],[76.54865,9.373928],[76.548643,9.373807],[76.548632,9.373631],[76.548631,9.373518],[76.548626,9.373424],[76.548616,9.373302],[76.548613,9.373171],[76.548596,9.372993],[76.548593,9.372875],[76.54858,9.372758],[76.548573,9.372655],[76.548588,9.372529],[76.548598,9.372362],[76.548624,9.372218],[76.548678,9.371985],[76.548723,9.371873],[76.548829,9.371732],[76.548939,9.371646],[76.548991,9.371547],[76.548941,9.371422],[76.5489,9.371281],[76.548856,9.371107],[76.548812,9.370961],[76.548791,9.370821],[76.548769,9.37066],[76.548747,9.370465],[76.548715,9.370261],[76.548692,9.370069],[76.548654,9.369849],[76.548621,9.369726],[76.548547,9.36958],[76.548474,9.369451],[76.548379,9.369324],[76.548307,9.369234],[76.548189,9.369117],[76.54807,9.36902],[76.547925,9.368914],[76.547737,9.36878],[76.547841,9.368637],[76.5479,9.368528],[76.547942,9.368436],[76.548006,9.368318],[76.548007,9.368212],[76.548062,9.368104],[76.548143,9.367987]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Sreelakshmi B Nair\",\"Ward_Name\":\"MANIPPUZHA\",\"Ward_No\":\"8\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.530899,9.368039],[76.531041,9.367971],[76.531179,9.367911],[76.531318,9.367849],[76.531457,9.367786],[76.531568,9.367748],[76.53171,9.367701],[76.531853,9.367653],[76.532027,9.36769],[76.53204,9.367786],[76.53206,9.367924],[76.532074,9.368036],[76.532036,9.36812],[76.531976,9.368227],[76.531904,9.368323],[76.531789,9.368447],[76.531789,9.368612],[76.53183,9.368733],[76.531869,9.368863],[76.531837,9.369007],[76.531757,9.369178],[76.531716,9.369325],[76.531667,9.369408],[76.531642,9.3695],[76.531606,9.369603],[76.531546,9.369677],[76.53143,9.369779],[76.531424,9.369896],[76.531447,9.370025],[76.531463,9.37017],[76.531465,9.370314],[76.531445,9.370407],[76.531421,9.370513],[76.531377,9.3706],[76.531319,9.370755],[76.531234,9.37101],[76.531145,9.371204],[76.53105,9.371267],[76.530943,9.371411],[76.530931,9.371506],[76.530833,9.371592],[76.530794,9.371682],[76.530757,9.371803],[76.530724,9.371909],[76.530861,9.371935],[76.531102,9.371982],[76.531253,9.371982],[76.531555,9.372132],[76.53169,9.37228],[76.531809,9.372544],[76.531702,9.37264],[76.531571,9.372705],[76.531321,9.3727],[76.531167,9.372742],[76.530938,9.372843],[76.530773,9.373029],[76.530807,9.373217],[76.530721,9.373341],[76.530591,9.373374],[76.530453,9.373419],[76.530303,9.373448],[76.530173,9.373596],[76.530073,9.373712],[76.530098,9.373889],[76.530107,9.373984],[76.530232,9.374189],[76.530376,9.374387],[76.530463,9.374502],[76.530638,9.374787],[76.530691,9.374956],[76.530709,9.375167],[76.530696,9.375336],[76.530676,9.375451],[76.530648,9.37557],[76.530611,9.375658],[76.530541,9.37582],[76.530489,9.375902],[76.530337,9.375865],[76.530127,9.37578],[76.529952,9.37573],[76.529779,9.375617],[76.529657,9.375665],[76.529519,9.375569],[76.529279,9.375506],[76.529081,9.375327],[76.528988,9.375309],[76.528884,9.37529],[76.528747,9.375266],[76.528514,9.375227],[76.528332,9.375196],[76.528111,9.375175],[76.527977,9.375162],[76.527691,9.375154],[76.527428,9.375051],[76.527273,9.375071],[76.527006,9.375209],[76.526896,9.375057],[76.526752,9.374982],[76.52664,9.375041],[76.526294,9.375209],[76.52621,9.37525],[76.526,9.375315],[76.525756,9.375391],[76.525606,9.375355],[76.52517,9.375413],[76.525176,9.374599],[76.524759,9.374604],[76.524536,9.374234],[76.524237,9.37416],[76.524129,9.374007],[76.524041,9.373884],[76.523741,9.373522],[76.523721,9.373294],[76.523455,9.373251],[76.523477,9.372904],[76.523065,9.372884],[76.522469,9.37286],[76.522278,9.372044],[76.522198,9.371682],[76.522171,9.371331],[76.522147,9.371215],[76.52209,9.371061],[76.522018,9.370951],[76.522358,9.370859],[76.522743,9.370696],[76.522905,9.370633],[76.523066,9.37057],[76.523338,9.370488],[76.523798,9.37045],[76.524101,9.370455],[76.524342,9.370485],[76.52468,9.370557],[76.524836,9.370577],[76.525032,9.370569],[76.525399,9.370469],[76.525804,9.370352],[76.52595,9.370324],[76.526096,9.370295],[76.526376,9.370254],[76.526557,9.370227],[76.526721,9.370223],[76.526885,9.37022],[76.527238,9.370214],[76.527536,9.37021],[76.527738,9.37015],[76.528154,9.369948],[76.528479,9.369659],[76.528757,9.3694],[76.528947,9.369213],[76.529183,9.368983],[76.529359,9.368797],[76.52957,9.368633],[76.529874,9.368501],[76.530175,9.368358],[76.530352,9.36828],[76.530536,9.368197],[76.530699,9.368126],[76.530799,9.368083],[76.530899,9.368039]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Raji Ramesh\",\"Ward_Name\":\"NEDUMPURAM\",\"Ward_No\":\"3\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.520507,9.371184],[76.520682,9.371162],[76.52082,9.371147],[76.520946,9.371134],[76.521061,9.371121],[76.521202,9.371095],[76.521336,9.371078],[76.521458,9.371063],[76.521661,9.371025],[76.521785,9.371006],[76.52188,9.370984],[76.522018,9.370951],[76.52209,9.371061],[76.522147,9.371215],[76.522171,9.371331],[76.522198,9.371682],[76.522278,9.372044],[76.522469,9.37286],[76.523065,9.372884],[76.523477,9.372904],[76.523455,9.373251],[76.523721,9.373294],[76.523741,9.373522],[76.524041,9.373884],[76.524129,9.374007],[76.524237,9.37416],[76.524536,9.374234],[76.524759,9.374604],[76.525176,9.374599],[76.52517,9.375413],[76.525075,9.37543],[76.525022,9.375346],[76.524816,9.375428],[76.524706,9.375472],[76.524212,9.375685],[76.524102,9.37562],[76.52411,9.375461],[76.523733,9.375528],[76.523611,9.375743],[76.523471,9.375779],[76.523135,9.375866],[76.522773,9.375973],[76.522637,9.376008],[76.522347,9.376103],[76.52239,9.376259],[76.522224,9.37632],[76.522062,9.37638],[76.521708,9.376582],[76.521623,9.376623],[76.521474,9.376696],[76.521251,9.376771],[76.521158,9.376803],[76.521038,9.377182],[76.520972,9.376947],[76.520946,9.376857],[76.520931,9.376709],[76.520904,9.376461],[76.52101,9.376429],[76.521115,9.376397],[76.521103,9.376296],[76.521004,9.376236],[76.520802,9.376114],[76.520456,9.375972],[76.520064,9.375972],[76.5198,9.376074],[76.51959,9.376156],[76.5195,9.37619],[76.519257,9.376279],[76.519152,9.376292],[76.518932,9.376319],[76.518785,9.376169],[76.518617,9.376145],[76.518476,9.376204],[76.518333,9.376263],[76.518229,9.376277],[76.518047,9.376302],[76.517947,9.376315],[76.517801,9.376335],[76.517608,9.376407],[76.517383,9.376533],[76.517122,9.3767],[76.517182,9.376902],[76.517218,9.377026],[76.51727,9.377201],[76.51732,9.377371],[76.517416,9.377696],[76.51748,9.377913],[76.517544,9.378127],[76.51761,9.378353],[76.51771,9.378689],[76.517116,9.378859],[76.517176,9.379032],[76.517385,9.379422],[76.517537,9.379707],[76.517093,9.379973],[76.516913,9.37998],[76.516641,9.380163],[76.516401,9.380324],[76.516008,9.380614],[76.515998,9.380928],[76.516012,9.381145],[76.516014,9.381304],[76.515982,9.381466],[76.515709,9.38184],[76.515554,9.38202],[76.515465,9.382123],[76.515366,9.382188],[76.514512,9.380861],[76.513746,9.381252],[76.513628,9.380905],[76.513573,9.380745],[76.513049,9.380808],[76.512843,9.380867],[76.512748,9.381015],[76.512654,9.381144],[76.512714,9.3814],[76.512607,9.381455],[76.512495,9.381453],[76.512401,9.381421],[76.512288,9.381353],[76.512126,9.3812],[76.512023,9.381118],[76.51187,9.381029],[76.511757,9.380912],[76.511641,9.380761],[76.511596,9.380636],[76.511584,9.380517],[76.511604,9.380404],[76.511631,9.380269],[76.511636,9.380171],[76.511648,9.380052],[76.51165,9.379921],[76.511615,9.379776],[76.511531,9.379621],[76.511504,9.379484],[76.511514,9.379369],[76.511509,9.37924],[76.511497,9.379143],[76.511453,9.379047],[76.511405,9.378954],[76.511367,9.378838],[76.511332,9.378699],[76.511293,9.378609],[76.511209,9.378469],[76.511159,9.378345],[76.511134,9.378114],[76.511123,9.377906],[76.511125,9.377769],[76.511157,9.377564],[76.511194,9.377441],[76.511247,9.377298],[76.511289,9.377134],[76.511331,9.376984],[76.511382,9.376818],[76.511416,9.376625],[76.511468,9.376426],[76.511546,9.376307],[76.511644,9.376207],[76.511765,9.376028],[76.511855,9.375913],[76.511904,9.37582],[76.511975,9.375662],[76.512013,9.375541],[76.512055,9.37538],[76.512209,9.375305],[76.512297,9.375272],[76.513017,9.374944],[76.513183,9.374892],[76.513313,9.374852],[76.513579,9.374775],[76.513718,9.37475],[76.513901,9.374733],[76.514013,9.374782],[76.514104,9.374948],[76.514186,9.374991],[76.514334,9.374963],[76.514497,9.374917],[76.514592,9.374912],[76.514758,9.374947],[76.514862,9.374938],[76.515087,9.374873],[76.515193,9.374838],[76.515359,9.374783],[76.515476,9.374753],[76.515634,9.374683],[76.515737,9.374641],[76.515853,9.374599],[76.516008,9.37452],[76.516068,9.374432],[76.515993,9.374223],[76.515935,9.374153],[76.515854,9.374],[76.515785,9.373856],[76.515742,9.373753],[76.515701,9.373573],[76.515818,9.373447],[76.515955,9.373379],[76.515983,9.37327],[76.515899,9.373119],[76.515828,9.373005],[76.515796,9.372831],[76.515868,9.372743],[76.515934,9.372655],[76.515956,9.372556],[76.515979,9.372463],[76.515992,9.372372],[76.515997,9.372216],[76.516079,9.372107],[76.516188,9.372001],[76.516275,9.371876],[76.516293,9.371699],[76.516381,9.37165],[76.516618,9.371653],[76.516881,9.371637],[76.517003,9.37162],[76.517106,9.371615],[76.517266,9.371602],[76.517435,9.371585],[76.517549,9.371566],[76.517738,9.371553],[76.517868,9.371532],[76.518632,9.371433],[76.518756,9.37142],[76.518892,9.371405],[76.519042,9.37138],[76.519201,9.371361],[76.519376,9.371337],[76.519505,9.37132],[76.519695,9.371292],[76.519786,9.371284],[76.519927,9.371257],[76.520095,9.371244],[76.520339,9.371202],[76.520507,9.371184]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Raji Ramesh\",\"Ward_Name\":\"AMICHAKARI\",\"Ward_No\":\"2\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.534232,9.367619],[76.533292,9.367496],[76.533156,9.367497],[76.532745,9.367532],[76.53248,9.367546],[76.532363,9.367566],[76.532148,9.367601],[76.532027,9.36769],[76.531853,9.367653],[76.53171,9.367701],[76.531568,9.367748],[76.531457,9.367786],[76.531318,9.367849],[76.531179,9.367911],[76.531041,9.367971],[76.530899,9.368039],[76.530799,9.368083],[76.530699,9.368126],[76.530536,9.368197],[76.530352,9.36828],[76.530175,9.368358],[76.530115,9.368198],[76.529953,9.368158],[76.529817,9.368104],[76.529744,9.367992],[76.529665,9.367823],[76.529861,9.367668],[76.529844,9.367467],[76.529737,9.367338],[76.529385,9.366868],[76.529605,9.366481],[76.529911,9.365555],[76.530334,9.365007],[76.530673,9.364567],[76.531266,9.364182],[76.532051,9.3638],[76.532459,9.3637],[76.532868,9.3636],[76.533523,9.363456],[76.533691,9.363417],[76.534246,9.363303],[76.534429,9.363262],[76.534951,9.363137],[76.53584,9.362922],[76.536746,9.362461],[76.537432,9.362112],[76.537533,9.36206],[76.537651,9.362324],[76.537765,9.362572],[76.537826,9.362643],[76.537819,9.362758],[76.537839,9.363027],[76.53787,9.363229],[76.538072,9.363814],[76.538237,9.364332],[76.538184,9.364431],[76.538046,9.364449],[76.537933,9.36444],[76.537856,9.364504],[76.537902,9.364606],[76.537839,9.364874],[76.537741,9.364902],[76.537631,9.364979],[76.53753,9.365013],[76.537393,9.365132],[76.537383,9.365306],[76.537294,9.365352],[76.537171,9.365404],[76.537081,9.365557],[76.537086,9.365717],[76.537142,9.365827],[76.537161,9.365921],[76.537004,9.366035],[76.536878,9.366102],[76.536749,9.366188],[76.536693,9.366281],[76.536712,9.366535],[76.536737,9.366696],[76.536754,9.366799],[76.536786,9.366912],[76.536824,9.367011],[76.536912,9.367124],[76.537012,9.367304],[76.537073,9.3674],[76.537148,9.367492],[76.537239,9.367621],[76.537416,9.367765],[76.537478,9.367937],[76.537485,9.368088],[76.537497,9.368283],[76.537538,9.368402],[76.537559,9.36857],[76.537592,9.368724],[76.537619,9.368839],[76.537685,9.369061],[76.537647,9.369202],[76.537286,9.368935],[76.536714,9.368611],[76.536099,9.368245],[76.535837,9.368093],[76.535573,9.367933],[76.535372,9.367861],[76.535095,9.367775],[76.534803,9.367718],[76.534576,9.367667],[76.534232,9.367619]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947667106\",\"Surveyor\":\"Sreelakshmi B Nair\",\"Ward_Name\":\"OTTATHENGU\",\"Ward_No\":\"14\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.544351,9.376267],[76.544089,9.376341],[76.543692,9.376408],[76.54353,9.376436],[76.543431,9.376453],[76.543243,9.376518],[76.543094,9.37651],[76.54263,9.376603],[76.542585,9.376397],[76.542552,9.376242],[76.542532,9.376126],[76.542513,9.376006],[76.542421,9.376024],[76.542273,9.376053],[76.542159,9.376076],[76.54199,9.376109],[76.54178,9.376151],[76.541611,9.376202],[76.54117,9.376334],[76.541035,9.376367],[76.540865,9.376392],[76.540786,9.376498],[76.540673,9.376605],[76.54059,9.376683],[76.540457,9.376752],[76.540254,9.376833],[76.540053,9.37677],[76.539807,9.376757],[76.539663,9.376759],[76.539383,9.376763],[76.53917,9.376792],[76.539164,9.376535],[76.539091,9.376238],[76.539085,9.375875],[76.538976,9.375553],[76.538931,9.37542],[76.538908,9.375267],[76.538855,9.374911],[76.538797,9.37442],[76.538771,9.374118],[76.538716,9.37384],[76.53855,9.373432],[76.538429,9.373052],[76.538214,9.373059],[76.538169,9.372819],[76.538143,9.372596],[76.538139,9.372201],[76.538138,9.371946],[76.538206,9.371768],[76.53834,9.371649],[76.538523,9.371633],[76.538669,9.371621],[76.538807,9.3716],[76.538942,9.371547],[76.539062,9.371452],[76.539193,9.371367],[76.539347,9.371304],[76.539503,9.371259],[76.539624,9.371237],[76.53972,9.371219],[76.539831,9.371307],[76.539988,9.371553],[76.540105,9.371618],[76.540195,9.371638],[76.540886,9.371635],[76.541071,9.371487],[76.541196,9.371514],[76.541354,9.371491],[76.541465,9.371482],[76.542826,9.371882],[76.542791,9.372116],[76.542757,9.37229],[76.54273,9.372391],[76.542676,9.372531],[76.54261,9.37266],[76.542567,9.372752],[76.542475,9.372892],[76.542395,9.372997],[76.542317,9.373074],[76.542243,9.373208],[76.542429,9.373253],[76.542523,9.373254],[76.542714,9.373238],[76.542878,9.373238],[76.542991,9.373207],[76.543133,9.373219],[76.543307,9.373227],[76.54351,9.37325],[76.543619,9.37327],[76.5438,9.373273],[76.543924,9.373257],[76.544054,9.373332],[76.544121,9.373486],[76.54426,9.373491],[76.54442,9.373602],[76.544618,9.373597],[76.544768,9.373596],[76.544964,9.373523],[76.545137,9.373476],[76.545305,9.373446],[76.545461,9.373478],[76.545606,9.373461],[76.545722,9.373177],[76.545877,9.373164],[76.546017,9.373152],[76.546139,9.373136],[76.546312,9.373191],[76.546337,9.373278],[76.546458,9.373394],[76.546549,9.373323],[76.546652,9.373203],[76.546797,9.373118],[76.546962,9.373036],[76.546954,9.372826],[76.547002,9.372691],[76.547208,9.372623],[76.547337,9.372587],[76.547418,9.372535],[76.547521,9.372404],[76.54762,9.372347],[76.547759,9.372362],[76.547893,9.372347],[76.547982,9.372316],[76.548166,9.372276],[76.54834,9.372213],[76.548456,9.372218],[76.548624,9.372218],[76.548598,9.372362],[76.548588,9.372529],[76.548573,9.372655],[76.54858,9.372758],[76.548593,9.372875],[76.548596,9.372993],[76.548613,9.373171],[76.548616,9.373302],[76.548626,9.373424],[76.548631,9.373518],[76.548632,9.373631],[76.548643,9.373807],[76.54865,9.373928],[76.548646,9.374053],[76.548658,9.374151],[76.548675,9.374341],[76.548668,9.374489],[76.548688,9.374675],[76.548681,9.374882],[76.548663,9.375053],[76.548639,9.375182],[76.548632,9.375377],[76.548632,9.375542],[76.548447,9.375549],[76.548322,9.375565],[76.54817,9.375584],[76.547876,9.375641],[76.547757,9.375685],[76.547634,9.375715],[76.547497,9.375833],[76.547423,9.375957],[76.54721,9.375901],[76.547083,9.375911],[76.546939,9.375853],[76.546675,9.375857],[76.546344,9.37587],[76.546133,9.375957],[76.546082,9.375814],[76.546143,9.375685],[76.546006,9.375613],[76.545607,9.375741],[76.545643,9.375904],[76.545387,9.375927],[76.544972,9.376082],[76.544882,9.376109],[76.544559,9.376209],[76.544351,9.376267]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Rajeev P D\",\"Ward_Name\":\"CHOONTHARA\",\"Ward_No\":\"6\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.550134,9.350908],[76.550263,9.350802],[76.550593,9.350531],[76.550702,9.350449],[76.55143,9.351029],[76.551805,9.351346],[76.55201,9.351503],[76.552297,9.351686],[76.552356,9.351716],[76.552352,9.351719],[76.552349,9.351721],[76.552636,9.351904],[76.553439,9.351916],[76.55408,9.35142],[76.554428,9.351029],[76.55483,9.350564],[76.555003,9.350376],[76.555205,9.350169],[76.555659,9.349833],[76.556187,9.349736],[76.557021,9.349812],[76.557532,9.349904],[76.557485,9.350293],[76.557458,9.350569],[76.557057,9.350543],[76.55664,9.350521],[76.556328,9.350479],[76.556137,9.350436],[76.555991,9.350409],[76.55587,9.350427],[76.555681,9.350536],[76.555558,9.350646],[76.555436,9.350903],[76.555396,9.351058],[76.555353,9.351196],[76.555265,9.351314],[76.555195,9.351528],[76.554966,9.351765],[76.554878,9.352043],[76.554865,9.352246],[76.554929,9.352548],[76.554997,9.352786],[76.5548,9.352821],[76.554578,9.352877],[76.554383,9.352952],[76.554186,9.353016],[76.553985,9.353108],[76.553796,9.353198],[76.553582,9.353242],[76.553382,9.35327],[76.553122,9.35334],[76.552882,9.353385],[76.552627,9.353451],[76.552648,9.353612],[76.552691,9.353788],[76.552731,9.353871],[76.552779,9.353991],[76.552893,9.354038],[76.553007,9.354044],[76.553103,9.354042],[76.553291,9.354148],[76.553359,9.354228],[76.553511,9.354307],[76.553607,9.354372],[76.553663,9.354448],[76.553699,9.354535],[76.553728,9.35467],[76.553761,9.354799],[76.553786,9.354929],[76.553823,9.35504],[76.553876,9.355136],[76.55393,9.355212],[76.554038,9.355367],[76.554153,9.355529],[76.554205,9.35574],[76.554221,9.355911],[76.554342,9.356031],[76.554477,9.356209],[76.554519,9.356392],[76.554525,9.356483],[76.554519,9.356701],[76.554504,9.356911],[76.554496,9.357082],[76.554435,9.357227],[76.554323,9.357522],[76.554225,9.357739],[76.554094,9.357966],[76.554021,9.358162],[76.553961,9.358419],[76.553939,9.358662],[76.553885,9.358895],[76.553854,9.359079],[76.553764,9.359275],[76.55372,9.359428],[76.553679,9.359546],[76.553655,9.359706],[76.553538,9.359892],[76.553413,9.36014],[76.553385,9.360249],[76.553372,9.360365],[76.553357,9.360627],[76.553251,9.360782],[76.553049,9.360899],[76.55292,9.361115],[76.552898,9.361416],[76.552904,9.361513],[76.552895,9.361655],[76.552799,9.361864],[76.552599,9.361888],[76.552328,9.361888],[76.552062,9.361887],[76.551911,9.361886],[76.551788,9.361884],[76.551655,9.361924],[76.55152,9.362045],[76.551436,9.36216],[76.551293,9.362325],[76.551203,9.362385],[76.551087,9.36242],[76.550874,9.362398],[76.550693,9.362378],[76.550549,9.362368],[76.550392,9.362363],[76.550248,9.362376],[76.550078,9.362387],[76.549982,9.362398],[76.550016,9.362571],[76.550005,9.362743],[76.550009,9.362842],[76.549989,9.362939],[76.550016,9.363162],[76.550048,9.363291],[76.550079,9.363382],[76.550121,9.363477],[76.550166,9.363603],[76.550185,9.363815],[76.550211,9.363987],[76.550224,9.364078],[76.550272,9.364266],[76.550303,9.364388],[76.550403,9.364375],[76.55057,9.36446],[76.550545,9.364683],[76.550528,9.36479],[76.550513,9.364918],[76.550487,9.365007],[76.550459,9.36512],[76.55038,9.365164],[76.550227,9.365178],[76.55023,9.365274],[76.550182,9.365397],[76.550083,9.365485],[76.550039,9.365574],[76.550024,9.365665],[76.550011,9.365766],[76.549971,9.365893],[76.549856,9.36594],[76.549748,9.36596],[76.549525,9.365999],[76.549361,9.365943],[76.5492,9.365864],[76.549102,9.365819],[76.548962,9.365731],[76.548821,9.365612],[76.548711,9.365535],[76.548624,9.365486],[76.548502,9.365338],[76.548349,9.365308],[76.54822,9.365259],[76.548127,9.365242],[76.547974,9.365206],[76.547799,9.365166],[76.547697,9.365149],[76.547465,9.36511],[76.54723,9.365002],[76.547135,9.364971],[76.547044,9.364941],[76.546913,9.36491],[76.546819,9.364886],[76.546707,9.364857],[76.546595,9.364835],[76.546495,9.364827],[76.54637,9.364807],[76.546276,9.364762],[76.546218,9.364591],[76.546211,9.364467],[76.546163,9.364313],[76.546001,9.364317],[76.545797,9.364347],[76.545704,9.36438],[76.545558,9.364439],[76.545461,9.364524],[76.545369,9.364587],[76.545276,9.364591],[76.545198,9.364535],[76.545127,9.364447],[76.545014,9.364385],[76.544849,9.364448],[76.544583,9.364502],[76.544551,9.364322],[76.544529,9.364187],[76.54447,9.363979],[76.544405,9.363801],[76.544354,9.363651],[76.544286,9.363527],[76.544213,9.363447],[76.544124,9.363362],[76.544023,9.363258],[76.543945,9.363199],[76.54385,9.363123],[76.543661,9.362962],[76.543546,9.362876],[76.543393,9.362818],[76.543222,9.362728],[76.543117,9.362676],[76.542859,9.362567],[76.542711,9.362504],[76.542547,9.362393],[76.542423,9.362227],[76.542367,9.362145],[76.542339,9.362056],[76.542325,9.361926],[76.542316,9.361768],[76.542305,9.361636],[76.542288,9.36152],[76.542276,9.361367],[76.542217,9.360987],[76.543084,9.361276],[76.543903,9.36155],[76.544914,9.361888],[76.545687,9.362146],[76.546345,9.362082],[76.547083,9.362009],[76.547923,9.361864],[76.54811,9.361796],[76.548843,9.361492],[76.548965,9.361431],[76.549163,9.361254],[76.54921,9.361157],[76.549546,9.360475],[76.54958,9.360361],[76.549602,9.360147],[76.549366,9.359433],[76.549259,9.359108],[76.549191,9.359004],[76.549076,9.358809],[76.548803,9.35847],[76.548738,9.358354],[76.548485,9.358206],[76.547891,9.357791],[76.547475,9.357634],[76.547171,9.357522],[76.546786,9.357372],[76.546701,9.3573],[76.546582,9.357275],[76.546387,9.357105],[76.546202,9.356875],[76.546122,9.356801],[76.546076,9.356634],[76.546055,9.356388],[76.546029,9.356248],[76.546123,9.355897],[76.546166,9.355735],[76.546406,9.355305],[76.546714,9.35482],[76.546822,9.354657],[76.547061,9.354405],[76.547389,9.354045],[76.547666,9.35376],[76.54794,9.353477],[76.548719,9.352611],[76.548802,9.352515],[76.549126,9.352063],[76.549404,9.351732],[76.549568,9.351486],[76.550134,9.350908]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Rajeev P D\",\"Ward_Name\":\"MURINJACHIRA\",\"Ward_No\":\"12\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.536655,9.372425],[76.536775,9.372302],[76.536893,9.372185],[76.537015,9.372039],[76.53708,9.371948],[76.53716,9.37182],[76.537278,9.371638],[76.537358,9.371554],[76.537448,9.371402],[76.537481,9.371303],[76.537526,9.371172],[76.537564,9.371087],[76.537605,9.371005],[76.537641,9.370904],[76.537693,9.370738],[76.537719,9.3706],[76.537758,9.370477],[76.537793,9.370359],[76.537839,9.370224],[76.537908,9.370072],[76.537973,9.369944],[76.538005,9.369829],[76.538029,9.369716],[76.538051,9.369609],[76.538049,9.36942],[76.538211,9.36942],[76.538337,9.369419],[76.538794,9.369412],[76.538958,9.369406],[76.539136,9.369416],[76.539321,9.369409],[76.539618,9.369384],[76.539708,9.369352],[76.539831,9.369299],[76.53997,9.369255],[76.540063,9.369238],[76.540167,9.369215],[76.540298,9.369187],[76.540446,9.36916],[76.54059,9.369134],[76.540688,9.36911],[76.540803,9.369087],[76.540931,9.369063],[76.541071,9.369031],[76.541188,9.368997],[76.541285,9.368978],[76.541416,9.368942],[76.541546,9.368931],[76.541647,9.36893],[76.54179,9.368921],[76.541914,9.368927],[76.542125,9.368883],[76.542233,9.368831],[76.542305,9.368731],[76.542371,9.368647],[76.542505,9.368472],[76.542645,9.368336],[76.542887,9.368074],[76.54292,9.368354],[76.542936,9.368578],[76.542952,9.368702],[76.542962,9.368906],[76.543002,9.369059],[76.543034,9.369226],[76.543031,9.369377],[76.543007,9.369565],[76.54297,9.369728],[76.542957,9.369853],[76.542941,9.37003],[76.542946,9.370141],[76.542958,9.37031],[76.542965,9.370558],[76.542954,9.370843],[76.542927,9.370998],[76.542897,9.371176],[76.542878,9.371376],[76.542826,9.371882],[76.541465,9.371482],[76.541354,9.371491],[76.541196,9.371514],[76.541071,9.371487],[76.540886,9.371635],[76.540195,9.371638],[76.540105,9.371618],[76.539988,9.371553],[76.539831,9.371307],[76.53972,9.371219],[76.539624,9.371237],[76.539503,9.371259],[76.539347,9.371304],[76.539193,9.371367],[76.539062,9.371452],[76.538942,9.371547],[76.538807,9.3716],[76.538669,9.371621],[76.538523,9.371633],[76.53834,9.371649],[76.538206,9.371768],[76.538138,9.371946],[76.538139,9.372201],[76.538143,9.372596],[76.538169,9.372819],[76.538214,9.373059],[76.538429,9.373052],[76.53855,9.373432],[76.538716,9.37384],[76.538771,9.374118],[76.538797,9.37442],[76.538855,9.374911],[76.538908,9.375267],[76.538931,9.37542],[76.538976,9.375553],[76.539085,9.375875],[76.539091,9.376238],[76.539164,9.376535],[76.53917,9.376792],[76.538928,9.376808],[76.538882,9.376623],[76.538774,9.376763],[76.538699,9.376817],[76.538544,9.376927],[76.538013,9.376872],[76.538027,9.376979],[76.537848,9.377056],[76.537755,9.377094],[76.53765,9.377128],[76.537366,9.377219],[76.537153,9.377272],[76.537051,9.377298],[76.536954,9.377322],[76.536975,9.37742],[76.53702,9.377592],[76.536804,9.377627],[76.536688,9.37763],[76.536585,9.377633],[76.536399,9.377586],[76.536286,9.377541],[76.536173,9.377522],[76.536053,9.377501],[76.535962,9.37753],[76.535952,9.377623],[76.535754,9.377667],[76.535678,9.37779],[76.535691,9.37794],[76.535501,9.378161],[76.53541,9.378147],[76.53534,9.378033],[76.535288,9.377948],[76.535229,9.377837],[76.535164,9.377669],[76.534901,9.377648],[76.53475,9.377636],[76.534559,9.377621],[76.534557,9.377745],[76.534695,9.377813],[76.534536,9.377854],[76.534349,9.377901],[76.534015,9.378049],[76.533612,9.378238],[76.533496,9.378295],[76.5334,9.378306],[76.532424,9.378681],[76.531865,9.378855],[76.531764,9.379103],[76.531669,9.379239],[76.531718,9.379366],[76.531499,9.379461],[76.531516,9.37959],[76.531552,9.37985],[76.531437,9.379938],[76.531302,9.379965],[76.531182,9.37999],[76.530866,9.380054],[76.530882,9.380155],[76.53077,9.380173],[76.530508,9.380216],[76.530226,9.380262],[76.529983,9.380225],[76.529726,9.380186],[76.529574,9.380203],[76.529356,9.380227],[76.529235,9.380218],[76.529133,9.380209],[76.528987,9.380208],[76.528865,9.38018],[76.528614,9.380124],[76.528532,9.380044],[76.528637,9.379794],[76.528613,9.379625],[76.528637,9.379468],[76.528632,9.379244],[76.528824,9.378843],[76.528892,9.378706],[76.529013,9.378537],[76.529143,9.378322],[76.529373,9.37824],[76.529733,9.378271],[76.529924,9.378269],[76.529938,9.378066],[76.529955,9.37783],[76.529826,9.377512],[76.529656,9.377209],[76.529936,9.376935],[76.53003,9.376868],[76.530053,9.376645],[76.530016,9.376456],[76.530141,9.376371],[76.530314,9.376207],[76.530419,9.376023],[76.530489,9.375902],[76.530707,9.37605],[76.53088,9.376097],[76.531081,9.376061],[76.531233,9.376018],[76.531255,9.375858],[76.531318,9.37572],[76.531452,9.375675],[76.531569,9.375649],[76.53168,9.375634],[76.531783,9.375611],[76.531854,9.375521],[76.531931,9.375373],[76.532111,9.375425],[76.532245,9.375449],[76.532398,9.37542],[76.532479,9.375367],[76.532602,9.37532],[76.532678,9.375268],[76.532755,9.375203],[76.532696,9.375101],[76.532634,9.374991],[76.532612,9.374853],[76.532577,9.374667],[76.532523,9.374527],[76.532484,9.37441],[76.532429,9.374223],[76.533033,9.373721],[76.533209,9.373575],[76.53333,9.373629],[76.533387,9.373766],[76.533527,9.373787],[76.533702,9.373778],[76.533804,9.373772],[76.533932,9.373747],[76.534097,9.373677],[76.534212,9.373622],[76.534379,9.37353],[76.534483,9.373382],[76.534483,9.373207],[76.534618,9.373196],[76.534817,9.373323],[76.53494,9.373401],[76.535103,9.373456],[76.535197,9.37338],[76.535372,9.373292],[76.535522,9.373257],[76.535734,9.373245],[76.535828,9.373274],[76.53605,9.373261],[76.536155,9.373213],[76.536244,9.373108],[76.536288,9.373017],[76.536364,9.372838],[76.536418,9.372746],[76.536514,9.372603],[76.536596,9.372513],[76.536655,9.372425]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Raji Ramesh\",\"Ward_Name\":\"VAYIKKATHILLAM\",\"Ward_No\":\"5\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.552749,9.369539],[76.552812,9.369718],[76.552848,9.369818],[76.552807,9.370018],[76.55278,9.370156],[76.552709,9.370381],[76.552708,9.3705],[76.55263,9.370626],[76.552614,9.370748],[76.552594,9.3709],[76.552659,9.371194],[76.552604,9.371379],[76.552603,9.371473],[76.55251,9.371646],[76.552594,9.37181],[76.552692,9.372058],[76.55282,9.372381],[76.552941,9.372783],[76.553006,9.373],[76.553048,9.373143],[76.553152,9.37346],[76.552949,9.373301],[76.552761,9.373136],[76.552493,9.372985],[76.552142,9.372964],[76.551995,9.372956],[76.551767,9.372905],[76.551763,9.372804],[76.551818,9.372464],[76.551827,9.372356],[76.551861,9.372184],[76.551894,9.372016],[76.552059,9.371942],[76.552109,9.371592],[76.552051,9.371449],[76.552033,9.371249],[76.552014,9.371047],[76.551924,9.370966],[76.551949,9.370674],[76.551882,9.370514],[76.551866,9.370273],[76.551851,9.370033],[76.551848,9.369815],[76.551845,9.369631],[76.551843,9.369509],[76.551746,9.369439],[76.551612,9.369346],[76.55143,9.36937],[76.551286,9.369372],[76.551164,9.369304],[76.551063,9.369211],[76.550954,9.369143],[76.550834,9.369146],[76.550732,9.369151],[76.550613,9.369141],[76.550584,9.369009],[76.550568,9.368908],[76.550556,9.368788],[76.550547,9.368678],[76.550537,9.368584],[76.550517,9.368419],[76.550413,9.368194],[76.550285,9.368093],[76.550148,9.368032],[76.550041,9.368017],[76.549928,9.367993],[76.549754,9.367999],[76.54963,9.368002],[76.549528,9.368018],[76.54943,9.368045],[76.549181,9.368122],[76.549005,9.368147],[76.548842,9.368108],[76.54873,9.368086],[76.548623,9.368089],[76.548483,9.368061],[76.548304,9.367998],[76.548143,9.367987],[76.548062,9.368104],[76.548007,9.368212],[76.548006,9.368318],[76.547942,9.368436],[76.5479,9.368528],[76.547841,9.368637],[76.547737,9.36878],[76.547598,9.368681],[76.547386,9.368493],[76.547243,9.368371],[76.547171,9.368306],[76.547068,9.368233],[76.547053,9.368421],[76.546986,9.368493],[76.546866,9.368488],[76.546777,9.368635],[76.546752,9.368769],[76.546694,9.3689],[76.546569,9.368867],[76.546478,9.368841],[76.546295,9.368828],[76.546195,9.368884],[76.546172,9.368975],[76.54615,9.369108],[76.546112,9.369212],[76.546004,9.369285],[76.545884,9.369343],[76.545732,9.369341],[76.545634,9.369342],[76.545602,9.369468],[76.545606,9.369626],[76.545659,9.369796],[76.545702,9.369895],[76.545746,9.370014],[76.545741,9.370164],[76.545635,9.370231],[76.545497,9.37026],[76.545387,9.370222],[76.545242,9.370181],[76.545083,9.370205],[76.544949,9.370163],[76.54481,9.370163],[76.544681,9.37017],[76.544665,9.370033],[76.544635,9.369833],[76.544617,9.369709],[76.544579,9.369561],[76.544571,9.369408],[76.544628,9.369265],[76.544688,9.369136],[76.544703,9.368978],[76.544701,9.368887],[76.544566,9.368758],[76.544525,9.368566],[76.544568,9.368427],[76.544605,9.368302],[76.544675,9.368131],[76.544719,9.368028],[76.544774,9.36778],[76.5449,9.367769],[76.544992,9.367708],[76.544954,9.367549],[76.544919,9.367414],[76.544844,9.367269],[76.544631,9.367183],[76.544527,9.367132],[76.544497,9.367039],[76.544457,9.366801],[76.544859,9.36661],[76.545121,9.366452],[76.544997,9.366356],[76.544903,9.366205],[76.54486,9.365903],[76.544796,9.36563],[76.544761,9.36545],[76.544721,9.365207],[76.544696,9.365021],[76.544631,9.36478],[76.544583,9.364502],[76.544849,9.364448],[76.545014,9.364385],[76.545127,9.364447],[76.545198,9.364535],[76.545276,9.364591],[76.545369,9.364587],[76.545461,9.364524],[76.545558,9.364439],[76.545704,9.36438],[76.545797,9.364347],[76.546001,9.364317],[76.546163,9.364313],[76.546211,9.364467],[76.546218,9.364591],[76.546276,9.364762],[76.54637,9.364807],[76.546495,9.364827],[76.546595,9.364835],[76.546707,9.364857],[76.546819,9.364886],[76.546913,9.36491],[76.547044,9.364941],[76.547135,9.364971],[76.54723,9.365002],[76.547465,9.36511],[76.547697,9.365149],[76.547799,9.365166],[76.547974,9.365206],[76.548127,9.365242],[76.54822,9.365259],[76.548349,9.365308],[76.548502,9.365338],[76.548624,9.365486],[76.548711,9.365535],[76.548821,9.365612],[76.548962,9.365731],[76.549102,9.365819],[76.5492,9.365864],[76.549361,9.365943],[76.549525,9.365999],[76.549748,9.36596],[76.549856,9.36594],[76.549971,9.365893],[76.550011,9.365766],[76.550024,9.365665],[76.550039,9.365574],[76.550083,9.365485],[76.550182,9.365397],[76.55023,9.365274],[76.550227,9.365178],[76.55038,9.365164],[76.550459,9.36512],[76.550487,9.365007],[76.550513,9.364918],[76.550528,9.36479],[76.550545,9.364683],[76.55057,9.36446],[76.550403,9.364375],[76.550303,9.364388],[76.550272,9.364266],[76.550224,9.364078],[76.550211,9.363987],[76.550185,9.363815],[76.550166,9.363603],[76.550121,9.363477],[76.550079,9.363382],[76.550048,9.363291],[76.550016,9.363162],[76.549989,9.362939],[76.550009,9.362842],[76.550005,9.362743],[76.550016,9.362571],[76.549982,9.362398],[76.550078,9.362387],[76.550248,9.362376],[76.550392,9.362363],[76.550549,9.362368],[76.550693,9.362378],[76.550874,9.362398],[76.551087,9.36242],[76.551203,9.362385],[76.551293,9.362325],[76.551436,9.36216],[76.55152,9.362045],[76.551655,9.361924],[76.551788,9.361884],[76.551911,9.361886],[76.552062,9.361887],[76.552328,9.361888],[76.552599,9.361888],[76.552799,9.361864],[76.553098,9.361983],[76.553181,9.362094],[76.553151,9.362252],[76.553097,9.362326],[76.553095,9.362472],[76.553115,9.362564],[76.553136,9.362673],[76.553152,9.362787],[76.553056,9.362923],[76.553076,9.363038],[76.553103,9.363208],[76.553127,9.363305],[76.553157,9.363412],[76.553192,9.363528],[76.553209,9.363644],[76.553248,9.363775],[76.553264,9.363878],[76.553295,9.36401],[76.553319,9.364123],[76.553353,9.364243],[76.553407,9.364392],[76.553441,9.36448],[76.553487,9.364608],[76.553512,9.364695],[76.553538,9.364797],[76.55357,9.364915],[76.553589,9.365009],[76.553577,9.3652],[76.553558,9.365361],[76.553494,9.365514],[76.553541,9.365657],[76.553597,9.365807],[76.553662,9.36598],[76.553695,9.366078],[76.553756,9.366322],[76.553796,9.366498],[76.553818,9.366636],[76.55395,9.366922],[76.55399,9.367014],[76.554063,9.36716],[76.554185,9.367173],[76.554283,9.367123],[76.55448,9.367034],[76.554578,9.367041],[76.554706,9.3671],[76.554895,9.366981],[76.555007,9.366927],[76.555099,9.366858],[76.55527,9.366797],[76.55542,9.366713],[76.555472,9.366538],[76.555473,9.366407],[76.55556,9.366368],[76.555663,9.36638],[76.55582,9.366328],[76.555962,9.366275],[76.55608,9.36635],[76.556192,9.366544],[76.556216,9.366671],[76.556323,9.366973],[76.556085,9.367093],[76.555863,9.367206],[76.555597,9.367682],[76.555464,9.367921],[76.555358,9.368088],[76.55522,9.368305],[76.555096,9.368501],[76.554869,9.36864],[76.554694,9.368747],[76.554472,9.368883],[76.554397,9.368948],[76.554279,9.369],[76.554123,9.36907],[76.553902,9.369169],[76.553793,9.369203],[76.553678,9.369192],[76.553485,9.369148],[76.553293,9.369104],[76.552917,9.368931],[76.552874,9.368764],[76.552685,9.368611],[76.552533,9.368769],[76.552585,9.369004],[76.552636,9.369192],[76.552665,9.3693],[76.552749,9.369539]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Sreelakshmi B Nair\",\"Ward_Name\":\"PODIYADI\",\"Ward_No\":\"9\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.539708,9.369352],[76.539618,9.369384],[76.539321,9.369409],[76.539136,9.369416],[76.538958,9.369406],[76.538794,9.369412],[76.538337,9.369419],[76.538211,9.36942],[76.538049,9.36942],[76.537832,9.369317],[76.537647,9.369202],[76.537685,9.369061],[76.537619,9.368839],[76.537592,9.368724],[76.537559,9.36857],[76.537538,9.368402],[76.537497,9.368283],[76.537485,9.368088],[76.537478,9.367937],[76.537416,9.367765],[76.537239,9.367621],[76.537148,9.367492],[76.537073,9.3674],[76.537012,9.367304],[76.536912,9.367124],[76.536824,9.367011],[76.536786,9.366912],[76.536754,9.366799],[76.536737,9.366696],[76.536712,9.366535],[76.536693,9.366281],[76.536749,9.366188],[76.536878,9.366102],[76.537004,9.366035],[76.537161,9.365921],[76.537142,9.365827],[76.537086,9.365717],[76.537081,9.365557],[76.537171,9.365404],[76.537294,9.365352],[76.537383,9.365306],[76.537393,9.365132],[76.53753,9.365013],[76.537631,9.364979],[76.537741,9.364902],[76.537839,9.364874],[76.537902,9.364606],[76.537856,9.364504],[76.537933,9.36444],[76.538046,9.364449],[76.538184,9.364431],[76.538237,9.364332],[76.538072,9.363814],[76.53787,9.363229],[76.537839,9.363027],[76.537819,9.362758],[76.537826,9.362643],[76.537765,9.362572],[76.537651,9.362324],[76.537533,9.36206],[76.537773,9.361975],[76.537989,9.36182],[76.538101,9.361741],[76.538212,9.361697],[76.538455,9.3616],[76.538755,9.361481],[76.538978,9.361288],[76.539264,9.361123],[76.539571,9.361071],[76.539852,9.360914],[76.540038,9.360881],[76.540344,9.360828],[76.540881,9.360808],[76.541172,9.360826],[76.541442,9.360844],[76.541547,9.36085],[76.541854,9.360905],[76.542051,9.36094],[76.542217,9.360987],[76.542276,9.361367],[76.542288,9.36152],[76.542305,9.361636],[76.542316,9.361768],[76.542325,9.361926],[76.542339,9.362056],[76.542367,9.362145],[76.542423,9.362227],[76.542547,9.362393],[76.542711,9.362504],[76.542859,9.362567],[76.543117,9.362676],[76.543222,9.362728],[76.543393,9.362818],[76.543546,9.362876],[76.543661,9.362962],[76.54385,9.363123],[76.543945,9.363199],[76.544023,9.363258],[76.544124,9.363362],[76.544213,9.363447],[76.544286,9.363527],[76.544354,9.363651],[76.544405,9.363801],[76.54447,9.363979],[76.544529,9.364187],[76.544551,9.364322],[76.544583,9.364502],[76.544631,9.36478],[76.544696,9.365021],[76.544721,9.365207],[76.544761,9.36545],[76.544796,9.36563],[76.54486,9.365903],[76.544903,9.366205],[76.544997,9.366356],[76.545121,9.366452],[76.544859,9.36661],[76.544457,9.366801],[76.544328,9.366863],[76.544177,9.366937],[76.544018,9.367027],[76.543917,9.367079],[76.543808,9.367153],[76.543677,9.36723],[76.543526,9.367337],[76.543448,9.367393],[76.54337,9.367444],[76.543291,9.367496],[76.543216,9.367571],[76.543141,9.367632],[76.54308,9.367754],[76.54297,9.367953],[76.542887,9.368074],[76.542645,9.368336],[76.542505,9.368472],[76.542371,9.368647],[76.542305,9.368731],[76.542233,9.368831],[76.542125,9.368883],[76.541914,9.368927],[76.54179,9.368921],[76.541647,9.36893],[76.541546,9.368931],[76.541416,9.368942],[76.541285,9.368978],[76.541188,9.368997],[76.541071,9.369031],[76.540931,9.369063],[76.540803,9.369087],[76.540688,9.36911],[76.54059,9.369134],[76.540446,9.36916],[76.540298,9.369187],[76.540167,9.369215],[76.540063,9.369238],[76.53997,9.369255],[76.539831,9.369299],[76.539708,9.369352]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947667106\",\"Surveyor\":\"Sreelakshmi B Nair\",\"Ward_Name\":\"PULIKKEEZHU\",\"Ward_No\":\"13\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.535372,9.367861],[76.535573,9.367933],[76.535837,9.368093],[76.536099,9.368245],[76.536714,9.368611],[76.537286,9.368935],[76.537647,9.369202],[76.537832,9.369317],[76.538049,9.36942],[76.538051,9.369609],[76.538029,9.369716],[76.538005,9.369829],[76.537973,9.369944],[76.537908,9.370072],[76.537839,9.370224],[76.537793,9.370359],[76.537758,9.370477],[76.537719,9.3706],[76.537693,9.370738],[76.537641,9.370904],[76.537605,9.371005],[76.537564,9.371087],[76.537526,9.371172],[76.537481,9.371303],[76.537448,9.371402],[76.537358,9.371554],[76.537278,9.371638],[76.53716,9.37182],[76.53708,9.371948],[76.537015,9.372039],[76.536893,9.372185],[76.536775,9.372302],[76.536655,9.372425],[76.536596,9.372513],[76.536514,9.372603],[76.536418,9.372746],[76.536364,9.372838],[76.536288,9.373017],[76.536244,9.373108],[76.536155,9.373213],[76.53605,9.373261],[76.535828,9.373274],[76.535734,9.373245],[76.535522,9.373257],[76.535372,9.373292],[76.535197,9.37338],[76.535103,9.373456],[76.53494,9.373401],[76.534817,9.373323],[76.534618,9.373196],[76.534483,9.373207],[76.534483,9.373382],[76.534379,9.37353],[76.534212,9.373622],[76.534097,9.373677],[76.533932,9.373747],[76.533804,9.373772],[76.533702,9.373778],[76.533527,9.373787],[76.533387,9.373766],[76.53333,9.373629],[76.533209,9.373575],[76.533033,9.373721],[76.532429,9.374223],[76.532484,9.37441],[76.532523,9.374527],[76.532577,9.374667],[76.532612,9.374853],[76.532634,9.374991],[76.532696,9.375101],[76.532755,9.375203],[76.532678,9.375268],[76.532602,9.37532],[76.532479,9.375367],[76.532398,9.37542],[76.532245,9.375449],[76.532111,9.375425],[76.531931,9.375373],[76.531854,9.375521],[76.531783,9.375611],[76.53168,9.375634],[76.531569,9.375649],[76.531452,9.375675],[76.531318,9.37572],[76.531255,9.375858],[76.531233,9.376018],[76.531081,9.376061],[76.53088,9.376097],[76.530707,9.37605],[76.530489,9.375902],[76.530541,9.37582],[76.530611,9.375658],[76.530648,9.37557],[76.530676,9.375451],[76.530696,9.375336],[76.530709,9.375167],[76.530691,9.374956],[76.530638,9.374787],[76.530463,9.374502],[76.530376,9.374387],[76.530232,9.374189],[76.530107,9.373984],[76.530098,9.373889],[76.530073,9.373712],[76.530173,9.373596],[76.530303,9.373448],[76.530453,9.373419],[76.530591,9.373374],[76.530721,9.373341],[76.530807,9.373217],[76.530773,9.373029],[76.530938,9.372843],[76.531167,9.372742],[76.531321,9.3727],[76.531571,9.372705],[76.531702,9.37264],[76.531809,9.372544],[76.53169,9.37228],[76.531555,9.372132],[76.531253,9.371982],[76.531102,9.371982],[76.530861,9.371935],[76.530724,9.371909],[76.530757,9.371803],[76.530794,9.371682],[76.530833,9.371592],[76.530931,9.371506],[76.530943,9.371411],[76.53105,9.371267],[76.531145,9.371204],[76.531234,9.37101],[76.531319,9.370755],[76.531377,9.3706],[76.531421,9.370513],[76.531445,9.370407],[76.531465,9.370314],[76.531463,9.37017],[76.531447,9.370025],[76.531424,9.369896],[76.53143,9.369779],[76.531546,9.369677],[76.531606,9.369603],[76.531642,9.3695],[76.531667,9.369408],[76.531716,9.369325],[76.531757,9.369178],[76.531837,9.369007],[76.531869,9.368863],[76.53183,9.368733],[76.531789,9.368612],[76.531789,9.368447],[76.531904,9.368323],[76.531976,9.368227],[76.532036,9.36812],[76.532074,9.368036],[76.53206,9.367924],[76.53204,9.367786],[76.532027,9.36769],[76.532148,9.367601],[76.532363,9.367566],[76.53248,9.367546],[76.532745,9.367532],[76.533156,9.367497],[76.533292,9.367496],[76.534232,9.367619],[76.534576,9.367667],[76.534803,9.367718],[76.535095,9.367775],[76.535372,9.367861]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Raji Ramesh\",\"Ward_Name\":\"PUTHIYAKAVU\",\"Ward_No\":\"4\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.553151,9.362252],[76.553181,9.362094],[76.553098,9.361983],[76.552799,9.361864],[76.552895,9.361655],[76.552904,9.361513],[76.552898,9.361416],[76.55292,9.361115],[76.553049,9.360899],[76.553251,9.360782],[76.553357,9.360627],[76.553372,9.360365],[76.553385,9.360249],[76.553413,9.36014],[76.553538,9.359892],[76.554316,9.359872],[76.55449,9.359854],[76.555819,9.359717],[76.556306,9.359667],[76.558059,9.359487],[76.558301,9.359459],[76.558467,9.359439],[76.558624,9.359424],[76.558699,9.359501],[76.558734,9.35964],[76.558775,9.359741],[76.558792,9.359854],[76.558797,9.359977],[76.558781,9.360103],[76.558789,9.360255],[76.558821,9.360421],[76.558854,9.36055],[76.558896,9.360669],[76.558942,9.360802],[76.558965,9.360945],[76.558956,9.361074],[76.558959,9.361214],[76.558975,9.361309],[76.559047,9.361397],[76.559216,9.36153],[76.559284,9.361637],[76.559346,9.361845],[76.559383,9.361968],[76.559432,9.362091],[76.55953,9.362247],[76.559553,9.362339],[76.559582,9.362489],[76.559615,9.362638],[76.559696,9.362926],[76.559684,9.363109],[76.55964,9.363351],[76.559552,9.363415],[76.559423,9.363418],[76.559333,9.363437],[76.559223,9.363489],[76.559032,9.363528],[76.558852,9.363583],[76.55888,9.363769],[76.558867,9.363922],[76.55872,9.363988],[76.55858,9.364051],[76.558593,9.364158],[76.558655,9.364307],[76.558679,9.36442],[76.558721,9.364619],[76.558815,9.364695],[76.558888,9.364786],[76.558941,9.364876],[76.55923,9.364781],[76.559447,9.364681],[76.559578,9.364626],[76.559758,9.364629],[76.559834,9.364783],[76.559912,9.364918],[76.559653,9.365233],[76.559509,9.3653],[76.559082,9.365499],[76.558759,9.365649],[76.55843,9.365744],[76.558081,9.365844],[76.557617,9.365977],[76.557491,9.366128],[76.5573,9.366357],[76.557199,9.366411],[76.557122,9.366473],[76.55692,9.366637],[76.556593,9.366768],[76.556323,9.366973],[76.556216,9.366671],[76.556192,9.366544],[76.55608,9.36635],[76.555962,9.366275],[76.55582,9.366328],[76.555663,9.36638],[76.55556,9.366368],[76.555473,9.366407],[76.555472,9.366538],[76.55542,9.366713],[76.55527,9.366797],[76.555099,9.366858],[76.555007,9.366927],[76.554895,9.366981],[76.554706,9.3671],[76.554578,9.367041],[76.55448,9.367034],[76.554283,9.367123],[76.554185,9.367173],[76.554063,9.36716],[76.55399,9.367014],[76.55395,9.366922],[76.553818,9.366636],[76.553796,9.366498],[76.553756,9.366322],[76.553695,9.366078],[76.553662,9.36598],[76.553597,9.365807],[76.553541,9.365657],[76.553494,9.365514],[76.553558,9.365361],[76.553577,9.3652],[76.553589,9.365009],[76.55357,9.364915],[76.553538,9.364797],[76.553512,9.364695],[76.553487,9.364608],[76.553441,9.36448],[76.553407,9.364392],[76.553353,9.364243],[76.553319,9.364123],[76.553295,9.36401],[76.553264,9.363878],[76.553248,9.363775],[76.553209,9.363644],[76.553192,9.363528],[76.553157,9.363412],[76.553127,9.363305],[76.553103,9.363208],[76.553076,9.363038],[76.553056,9.362923],[76.553152,9.362787],[76.553136,9.362673],[76.553115,9.362564],[76.553095,9.362472],[76.553097,9.362326],[76.553151,9.362252]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Rajeev P D\",\"Ward_Name\":\"MALAYITHRA\",\"Ward_No\":\"10\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.548991,9.371547],[76.548939,9.371646],[76.548829,9.371732],[76.548723,9.371873],[76.548678,9.371985],[76.548624,9.372218],[76.548456,9.372218],[76.54834,9.372213],[76.548166,9.372276],[76.547982,9.372316],[76.547893,9.372347],[76.547759,9.372362],[76.54762,9.372347],[76.547521,9.372404],[76.547418,9.372535],[76.547337,9.372587],[76.547208,9.372623],[76.547002,9.372691],[76.546954,9.372826],[76.546962,9.373036],[76.546797,9.373118],[76.546652,9.373203],[76.546549,9.373323],[76.546458,9.373394],[76.546337,9.373278],[76.546312,9.373191],[76.546139,9.373136],[76.546017,9.373152],[76.545877,9.373164],[76.545722,9.373177],[76.545606,9.373461],[76.545461,9.373478],[76.545305,9.373446],[76.545137,9.373476],[76.544964,9.373523],[76.544768,9.373596],[76.544618,9.373597],[76.54442,9.373602],[76.54426,9.373491],[76.544121,9.373486],[76.544054,9.373332],[76.543924,9.373257],[76.5438,9.373273],[76.543619,9.37327],[76.54351,9.37325],[76.543307,9.373227],[76.543133,9.373219],[76.542991,9.373207],[76.542878,9.373238],[76.542714,9.373238],[76.542523,9.373254],[76.542429,9.373253],[76.542243,9.373208],[76.542317,9.373074],[76.542395,9.372997],[76.542475,9.372892],[76.542567,9.372752],[76.54261,9.37266],[76.542676,9.372531],[76.54273,9.372391],[76.542757,9.37229],[76.542791,9.372116],[76.542826,9.371882],[76.542878,9.371376],[76.542897,9.371176],[76.542927,9.370998],[76.542954,9.370843],[76.542965,9.370558],[76.542958,9.37031],[76.542946,9.370141],[76.542941,9.37003],[76.542957,9.369853],[76.54297,9.369728],[76.543007,9.369565],[76.543031,9.369377],[76.543034,9.369226],[76.543002,9.369059],[76.542962,9.368906],[76.542952,9.368702],[76.542936,9.368578],[76.54292,9.368354],[76.542887,9.368074],[76.54297,9.367953],[76.54308,9.367754],[76.543141,9.367632],[76.543216,9.367571],[76.543291,9.367496],[76.54337,9.367444],[76.543448,9.367393],[76.543526,9.367337],[76.543677,9.36723],[76.543808,9.367153],[76.543917,9.367079],[76.544018,9.367027],[76.544177,9.366937],[76.544328,9.366863],[76.544457,9.366801],[76.544497,9.367039],[76.544527,9.367132],[76.544631,9.367183],[76.544844,9.367269],[76.544919,9.367414],[76.544954,9.367549],[76.544992,9.367708],[76.5449,9.367769],[76.544774,9.36778],[76.544719,9.368028],[76.544675,9.368131],[76.544605,9.368302],[76.544568,9.368427],[76.544525,9.368566],[76.544566,9.368758],[76.544701,9.368887],[76.544703,9.368978],[76.544688,9.369136],[76.544628,9.369265],[76.544571,9.369408],[76.544579,9.369561],[76.544617,9.369709],[76.544635,9.369833],[76.544665,9.370033],[76.544681,9.37017],[76.54481,9.370163],[76.544949,9.370163],[76.545083,9.370205],[76.545242,9.370181],[76.545387,9.370222],[76.545497,9.37026],[76.545635,9.370231],[76.545741,9.370164],[76.545746,9.370014],[76.545702,9.369895],[76.545659,9.369796],[76.545606,9.369626],[76.545602,9.369468],[76.545634,9.369342],[76.545732,9.369341],[76.545884,9.369343],[76.546004,9.369285],[76.546112,9.369212],[76.54615,9.369108],[76.546172,9.368975],[76.546195,9.368884],[76.546295,9.368828],[76.546478,9.368841],[76.546569,9.368867],[76.546694,9.3689],[76.546752,9.368769],[76.546777,9.368635],[76.546866,9.368488],[76.546986,9.368493],[76.547053,9.368421],[76.547068,9.368233],[76.547171,9.368306],[76.547243,9.368371],[76.547386,9.368493],[76.547598,9.368681],[76.547737,9.36878],[76.547925,9.368914],[76.54807,9.36902],[76.548189,9.369117],[76.548307,9.369234],[76.548379,9.369324],[76.548474,9.369451],[76.548547,9.36958],[76.548621,9.369726],[76.548654,9.369849],[76.548692,9.370069],[76.548715,9.370261],[76.548747,9.370465],[76.548769,9.37066],[76.548791,9.370821],[76.548812,9.370961],[76.548856,9.371107],[76.5489,9.371281],[76.548941,9.371422],[76.548991,9.371547]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947667106\",\"Remarks\":\"undaplavu\",\"Surveyor\":\"Rajeev P D\",\"Ward_Name\":\"UNDAPLAVU\",\"Ward_No\":\"7\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.559751,9.350499],[76.560436,9.350668],[76.560931,9.350946],[76.56123,9.351226],[76.56151,9.351684],[76.561644,9.352027],[76.561782,9.352703],[76.561825,9.353128],[76.561743,9.353402],[76.561355,9.353853],[76.561221,9.353973],[76.56103,9.35415],[76.560929,9.354216],[76.560691,9.354371],[76.560637,9.354726],[76.560649,9.354871],[76.560724,9.355208],[76.56154,9.355755],[76.561625,9.355826],[76.562036,9.356111],[76.562721,9.356374],[76.5628,9.356666],[76.562843,9.356824],[76.562916,9.357316],[76.562928,9.357488],[76.562888,9.358027],[76.562872,9.35839],[76.562749,9.359013],[76.56277,9.359188],[76.562743,9.359579],[76.562802,9.359788],[76.562246,9.360236],[76.562182,9.360521],[76.562154,9.360649],[76.562115,9.360985],[76.562085,9.361246],[76.562056,9.361487],[76.562011,9.361669],[76.561979,9.361795],[76.56202,9.361885],[76.562004,9.362143],[76.56192,9.362335],[76.561733,9.362475],[76.561592,9.362517],[76.561464,9.362549],[76.561269,9.362632],[76.561133,9.362688],[76.56073,9.363031],[76.560786,9.363356],[76.560847,9.363709],[76.560672,9.363923],[76.560615,9.364019],[76.560444,9.364203],[76.56035,9.364339],[76.560212,9.36454],[76.560169,9.36462],[76.559912,9.364918],[76.559834,9.364783],[76.559758,9.364629],[76.559578,9.364626],[76.559447,9.364681],[76.55923,9.364781],[76.558941,9.364876],[76.558888,9.364786],[76.558815,9.364695],[76.558721,9.364619],[76.558679,9.36442],[76.558655,9.364307],[76.558593,9.364158],[76.55858,9.364051],[76.55872,9.363988],[76.558867,9.363922],[76.55888,9.363769],[76.558852,9.363583],[76.559032,9.363528],[76.559223,9.363489],[76.559333,9.363437],[76.559423,9.363418],[76.559552,9.363415],[76.55964,9.363351],[76.559684,9.363109],[76.559696,9.362926],[76.559615,9.362638],[76.559582,9.362489],[76.559553,9.362339],[76.55953,9.362247],[76.559432,9.362091],[76.559383,9.361968],[76.559346,9.361845],[76.559284,9.361637],[76.559216,9.36153],[76.559047,9.361397],[76.558975,9.361309],[76.558959,9.361214],[76.558956,9.361074],[76.558965,9.360945],[76.558942,9.360802],[76.558896,9.360669],[76.558854,9.36055],[76.558821,9.360421],[76.558789,9.360255],[76.558781,9.360103],[76.558797,9.359977],[76.558792,9.359854],[76.558775,9.359741],[76.558734,9.35964],[76.558699,9.359501],[76.558624,9.359424],[76.558467,9.359439],[76.558301,9.359459],[76.558059,9.359487],[76.556306,9.359667],[76.555819,9.359717],[76.55449,9.359854],[76.554316,9.359872],[76.553538,9.359892],[76.553655,9.359706],[76.553679,9.359546],[76.55372,9.359428],[76.553764,9.359275],[76.553854,9.359079],[76.553885,9.358895],[76.553939,9.358662],[76.553961,9.358419],[76.554021,9.358162],[76.554094,9.357966],[76.554225,9.357739],[76.554323,9.357522],[76.554435,9.357227],[76.554496,9.357082],[76.554504,9.356911],[76.554519,9.356701],[76.554525,9.356483],[76.554519,9.356392],[76.554477,9.356209],[76.554342,9.356031],[76.554221,9.355911],[76.554205,9.35574],[76.554153,9.355529],[76.554038,9.355367],[76.55393,9.355212],[76.553876,9.355136],[76.553823,9.35504],[76.553786,9.354929],[76.553761,9.354799],[76.553728,9.35467],[76.553699,9.354535],[76.553663,9.354448],[76.553607,9.354372],[76.553511,9.354307],[76.553359,9.354228],[76.553291,9.354148],[76.553103,9.354042],[76.553007,9.354044],[76.552893,9.354038],[76.552779,9.353991],[76.552731,9.353871],[76.552691,9.353788],[76.552648,9.353612],[76.552627,9.353451],[76.552882,9.353385],[76.553122,9.35334],[76.553382,9.35327],[76.553582,9.353242],[76.553796,9.353198],[76.553985,9.353108],[76.554186,9.353016],[76.554383,9.352952],[76.554578,9.352877],[76.5548,9.352821],[76.554997,9.352786],[76.554929,9.352548],[76.554865,9.352246],[76.554878,9.352043],[76.554966,9.351765],[76.555195,9.351528],[76.555265,9.351314],[76.555353,9.351196],[76.555396,9.351058],[76.555436,9.350903],[76.555558,9.350646],[76.555681,9.350536],[76.55587,9.350427],[76.555991,9.350409],[76.556137,9.350436],[76.556328,9.350479],[76.55664,9.350521],[76.557057,9.350543],[76.557458,9.350569],[76.557485,9.350293],[76.557532,9.349904],[76.558045,9.350056],[76.558547,9.350207],[76.559034,9.350326],[76.559751,9.350499]]]},\"properties\":{\"District\":\"Pathanamthitta\",\"LSGD\":\"Nedumpuram\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9947529765\",\"Surveyor\":\"Rajeev P D\",\"Ward_Name\":\"KALLUMKAL\",\"Ward_No\":\"11\",\"Mandal\":\"Thiruvalla\"}}]}");
@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.508553,9.336406],[76.508095,9.336442],[76.507981,9.336441],[76.507861,9.336446],[76.507276,9.336468],[76.506995,9.336573],[76.506737,9.33672],[76.506604,9.336788],[76.506379,9.33684],[76.506001,9.336921],[76.505802,9.337155],[76.505533,9.337473],[76.505423,9.337477],[76.505443,9.337579],[76.504738,9.337551],[76.504537,9.33753],[76.504374,9.33752],[76.504189,9.337531],[76.504005,9.337541],[76.503575,9.337574],[76.503425,9.337586],[76.503133,9.337608],[76.502976,9.33762],[76.502347,9.337724],[76.502043,9.337777],[76.501668,9.337842],[76.500214,9.33776],[76.499944,9.337716],[76.499302,9.337611],[76.498956,9.337531],[76.498744,9.337583],[76.498613,9.337451],[76.498711,9.337231],[76.498903,9.336953],[76.498982,9.336776],[76.499552,9.335919],[76.499583,9.335698],[76.49961,9.335504],[76.499616,9.335163],[76.499628,9.334565],[76.499636,9.334188],[76.49976,9.334105],[76.499894,9.334012],[76.499844,9.333627],[76.499829,9.333518],[76.499804,9.33332],[76.499786,9.333181],[76.499754,9.332939],[76.499721,9.332689],[76.499704,9.332556],[76.499683,9.332398],[76.499651,9.332152],[76.499612,9.332052],[76.499517,9.331808],[76.499446,9.331628],[76.499269,9.331598],[76.499151,9.331192],[76.499108,9.331046],[76.499336,9.330927],[76.499696,9.330975],[76.499823,9.330991],[76.500041,9.331031],[76.500297,9.331091],[76.500431,9.33136],[76.500472,9.331442],[76.500822,9.331461],[76.500806,9.331928],[76.500937,9.331907],[76.500982,9.331779],[76.501363,9.331757],[76.501471,9.331661],[76.501954,9.331874],[76.50209,9.331837],[76.502245,9.331794],[76.502546,9.331711],[76.502774,9.331701],[76.502858,9.331627],[76.503055,9.33146],[76.503389,9.331578],[76.503635,9.331665],[76.503731,9.3317],[76.503861,9.331726],[76.504146,9.331784],[76.504354,9.331826],[76.504617,9.331728],[76.505082,9.332015],[76.505195,9.332084],[76.505371,9.332193],[76.505487,9.332216],[76.505628,9.332245],[76.505806,9.332281],[76.506013,9.332323],[76.506161,9.332353],[76.506302,9.332381],[76.506442,9.332409],[76.506653,9.332452],[76.506804,9.332446],[76.507135,9.332434],[76.507355,9.332426],[76.507551,9.332419],[76.507901,9.332406],[76.508007,9.332393],[76.508281,9.33236],[76.508502,9.332334],[76.508759,9.332303],[76.508992,9.332275],[76.509169,9.332254],[76.509281,9.332241],[76.509459,9.33222],[76.509624,9.3322],[76.509727,9.332188],[76.509806,9.332114],[76.509876,9.33205],[76.509999,9.331936],[76.510412,9.331847],[76.510541,9.332511],[76.511106,9.332503],[76.511359,9.332499],[76.512415,9.332456],[76.5125,9.332709],[76.512556,9.332809],[76.513286,9.332831],[76.513407,9.332835],[76.513534,9.332909],[76.513708,9.333156],[76.513423,9.333319],[76.513381,9.333716],[76.512723,9.333799],[76.512637,9.33407],[76.512887,9.33414],[76.512792,9.335268],[76.51328,9.335033],[76.51384,9.334986],[76.513946,9.33515],[76.514007,9.335244],[76.515197,9.335456],[76.516044,9.335531],[76.517414,9.336286],[76.517281,9.336417],[76.517115,9.336494],[76.516584,9.336355],[76.516328,9.336278],[76.515614,9.336443],[76.515507,9.336713],[76.51534,9.336901],[76.51528,9.3375],[76.5159,9.337559],[76.516182,9.337895],[76.516414,9.338172],[76.516589,9.338229],[76.517029,9.338375],[76.517555,9.338548],[76.517879,9.338548],[76.518356,9.338549],[76.519154,9.33855],[76.519592,9.338967],[76.519752,9.339119],[76.513621,9.339425],[76.513478,9.339248],[76.513043,9.338712],[76.5124,9.338189],[76.512447,9.338029],[76.512349,9.337994],[76.512154,9.337966],[76.512026,9.337889],[76.511691,9.337618],[76.51136,9.33735],[76.510956,9.337023],[76.510836,9.336926],[76.510754,9.336838],[76.510671,9.336777],[76.510496,9.336651],[76.510189,9.336432],[76.510011,9.336305],[76.509866,9.336201],[76.50949,9.336196],[76.509373,9.336214],[76.509263,9.336231],[76.509152,9.336248],[76.509035,9.336266],[76.508702,9.336317],[76.508553,9.336406]]]},\"properties\":{\"Created_Da\":\"2024-10-19T14:47:56.785Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9961871121\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"THOTTUMADA\",\"Ward_No\":\"11\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.529325,9.337508],[76.529802,9.337336],[76.529911,9.337199],[76.530211,9.336833],[76.531025,9.336804],[76.531196,9.336831],[76.531312,9.336851],[76.53155,9.336892],[76.531754,9.336927],[76.531987,9.336956],[76.532179,9.337027],[76.532269,9.33706],[76.532443,9.337124],[76.53274,9.337234],[76.53282,9.337292],[76.532903,9.337351],[76.533082,9.337655],[76.53322,9.337888],[76.533225,9.338102],[76.533241,9.338823],[76.533244,9.338955],[76.533017,9.339166],[76.532615,9.339538],[76.532387,9.339639],[76.532225,9.33971],[76.531935,9.339751],[76.531666,9.33979],[76.531383,9.339836],[76.531079,9.33993],[76.530977,9.340043],[76.530829,9.340114],[76.530696,9.340166],[76.53051,9.340244],[76.529959,9.340439],[76.529613,9.340752],[76.529347,9.340992],[76.529054,9.341204],[76.528962,9.341271],[76.528883,9.341328],[76.528737,9.341434],[76.528561,9.341531],[76.528254,9.341701],[76.527943,9.341871],[76.527668,9.341707],[76.527524,9.341778],[76.527443,9.341875],[76.52718,9.342192],[76.527032,9.34237],[76.52685,9.342649],[76.526135,9.342815],[76.525954,9.342857],[76.525755,9.34277],[76.524661,9.342252],[76.523599,9.341743],[76.52389,9.341694],[76.525503,9.341421],[76.525689,9.34139],[76.525294,9.340819],[76.525188,9.340665],[76.524349,9.340805],[76.524237,9.340828],[76.523472,9.340474],[76.523046,9.340331],[76.521788,9.339835],[76.520095,9.338907],[76.520246,9.338277],[76.520355,9.337825],[76.520193,9.337582],[76.52014,9.337503],[76.520299,9.337499],[76.52145,9.337476],[76.523021,9.337443],[76.523527,9.337428],[76.523834,9.337419],[76.524212,9.337407],[76.524399,9.337401],[76.524547,9.337859],[76.525002,9.338146],[76.525377,9.338125],[76.525696,9.338107],[76.525895,9.338095],[76.526156,9.338311],[76.526282,9.338415],[76.526275,9.337903],[76.526271,9.337605],[76.526383,9.337499],[76.526544,9.337347],[76.526525,9.336926],[76.526832,9.336944],[76.527479,9.336983],[76.527626,9.336749],[76.528318,9.337297],[76.528546,9.337477],[76.528723,9.337484],[76.529325,9.337508]]]},\"properties\":{\"Created_Da\":\"2024-10-19T10:13:35.505Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744995416\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"KIZHAKKUMMURI\",\"Ward_No\":\"7\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.506744,9.347263],[76.506548,9.34717],[76.506377,9.347088],[76.505878,9.346341],[76.505751,9.346151],[76.504979,9.345614],[76.504498,9.345523],[76.503489,9.345352],[76.502901,9.344394],[76.502374,9.343396],[76.501198,9.342364],[76.500917,9.342069],[76.500602,9.341694],[76.500561,9.341612],[76.500479,9.340724],[76.499497,9.340823],[76.499214,9.340632],[76.499055,9.34056],[76.498615,9.340363],[76.498614,9.340172],[76.49861,9.339287],[76.498609,9.339123],[76.498609,9.339025],[76.498613,9.337451],[76.498956,9.337531],[76.499302,9.337611],[76.499944,9.337716],[76.500214,9.33776],[76.501668,9.337842],[76.502043,9.337777],[76.502347,9.337724],[76.502976,9.33762],[76.503133,9.337608],[76.503425,9.337586],[76.503575,9.337574],[76.504005,9.337541],[76.504189,9.337531],[76.504374,9.33752],[76.504537,9.33753],[76.504738,9.337551],[76.505443,9.337579],[76.505423,9.337477],[76.505533,9.337473],[76.505802,9.337155],[76.506001,9.336921],[76.506379,9.33684],[76.506604,9.336788],[76.506737,9.33672],[76.506995,9.336573],[76.507276,9.336468],[76.507861,9.336446],[76.507981,9.336441],[76.508095,9.336442],[76.508553,9.336406],[76.508702,9.336317],[76.509035,9.336266],[76.509152,9.336248],[76.509263,9.336231],[76.509373,9.336214],[76.50949,9.336196],[76.509866,9.336201],[76.510011,9.336305],[76.510189,9.336432],[76.510496,9.336651],[76.510671,9.336777],[76.510754,9.336838],[76.510836,9.336926],[76.510956,9.337023],[76.51136,9.33735],[76.511691,9.337618],[76.512026,9.337889],[76.512154,9.337966],[76.512349,9.337994],[76.512447,9.338029],[76.5124,9.338189],[76.512334,9.338418],[76.512152,9.33905],[76.511746,9.339193],[76.51161,9.339295],[76.511436,9.339534],[76.511312,9.339678],[76.511223,9.339735],[76.510966,9.339897],[76.5106,9.340126],[76.510443,9.340406],[76.510342,9.340544],[76.51023,9.340588],[76.510072,9.340649],[76.509984,9.340736],[76.509925,9.34094],[76.509864,9.341473],[76.509576,9.3413],[76.509454,9.341226],[76.509227,9.341118],[76.50895,9.341304],[76.509048,9.341397],[76.510032,9.341834],[76.510452,9.341896],[76.510427,9.342046],[76.510404,9.34219],[76.51037,9.342399],[76.510353,9.342499],[76.510246,9.342628],[76.510171,9.34291],[76.510312,9.342947],[76.510334,9.343191],[76.510361,9.343506],[76.510387,9.343767],[76.510402,9.343925],[76.509984,9.343876],[76.510301,9.344538],[76.510401,9.344748],[76.51045,9.34485],[76.50931,9.346017],[76.508789,9.345944],[76.508267,9.34587],[76.507663,9.346291],[76.507682,9.346438],[76.507744,9.34726],[76.507395,9.347214],[76.506906,9.347238],[76.506744,9.347263]]]},\"properties\":{\"Created_Da\":\"2024-10-23T10:09:34.463Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9961871121\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"PHC\",\"Ward_No\":\"10\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.516838,9.365674],[76.516636,9.365456],[76.516402,9.365231],[76.516191,9.364872],[76.516026,9.364521],[76.515986,9.364461],[76.51572,9.364033],[76.515886,9.363782],[76.516021,9.36336],[76.51606,9.363142],[76.516222,9.363008],[76.51632,9.362947],[76.516431,9.362701],[76.516431,9.362522],[76.516407,9.362315],[76.516409,9.362151],[76.516417,9.36211],[76.516431,9.362061],[76.516531,9.361979],[76.516689,9.361837],[76.516739,9.361798],[76.516773,9.361646],[76.516934,9.361558],[76.517084,9.361484],[76.517143,9.361377],[76.517473,9.361621],[76.517804,9.361953],[76.518125,9.361863],[76.518283,9.361819],[76.518844,9.361663],[76.520726,9.361214],[76.521552,9.36101],[76.521703,9.361087],[76.522609,9.361557],[76.522586,9.360718],[76.523185,9.3599],[76.523056,9.359358],[76.523037,9.359263],[76.523369,9.358913],[76.523448,9.358845],[76.523666,9.358812],[76.524336,9.358631],[76.524558,9.358438],[76.52471,9.358312],[76.5251,9.358132],[76.52548,9.357662],[76.525686,9.357203],[76.525901,9.356596],[76.525955,9.356095],[76.525972,9.355965],[76.526103,9.355404],[76.526159,9.355168],[76.526461,9.354003],[76.526529,9.353203],[76.525848,9.352182],[76.526717,9.352116],[76.526824,9.35207],[76.527032,9.351981],[76.527214,9.351894],[76.527739,9.351764],[76.528418,9.351595],[76.52845,9.351995],[76.5288,9.352043],[76.529002,9.352071],[76.52914,9.352078],[76.529277,9.352084],[76.530525,9.352177],[76.530661,9.352224],[76.530796,9.352271],[76.531428,9.352387],[76.531373,9.352807],[76.531011,9.353101],[76.530611,9.353044],[76.530503,9.353503],[76.530424,9.353843],[76.530366,9.35412],[76.530338,9.354253],[76.530282,9.354554],[76.530243,9.35476],[76.530201,9.355031],[76.530135,9.355198],[76.530077,9.355365],[76.530013,9.355551],[76.529938,9.355787],[76.529909,9.355884],[76.529847,9.356087],[76.529794,9.356298],[76.52973,9.356549],[76.529711,9.356647],[76.529693,9.356743],[76.529626,9.356969],[76.529594,9.357079],[76.529535,9.357272],[76.529428,9.357548],[76.529319,9.357818],[76.529243,9.358005],[76.529171,9.35826],[76.529096,9.358526],[76.529061,9.358619],[76.529019,9.358725],[76.528978,9.358832],[76.528895,9.358983],[76.528741,9.359072],[76.528531,9.359193],[76.528445,9.359243],[76.528196,9.359406],[76.527911,9.359583],[76.527792,9.359658],[76.527687,9.359727],[76.527475,9.359871],[76.527192,9.360056],[76.52694,9.360181],[76.526829,9.36024],[76.526645,9.360336],[76.52648,9.360374],[76.526253,9.360427],[76.525846,9.360526],[76.525276,9.360666],[76.52459,9.360999],[76.52435,9.361674],[76.524428,9.362181],[76.524431,9.362707],[76.524242,9.363182],[76.5241,9.363537],[76.523866,9.364405],[76.523994,9.365132],[76.524054,9.365335],[76.522341,9.364979],[76.521646,9.365059],[76.520981,9.365197],[76.520311,9.365331],[76.519842,9.365444],[76.519204,9.365669],[76.518659,9.365859],[76.518199,9.365993],[76.517783,9.366021],[76.517637,9.366027],[76.517266,9.365945],[76.517016,9.365776],[76.516838,9.365674]]]},\"properties\":{\"Created_Da\":\"2024-10-22T15:28:29.525Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744995416\",\"Remarks\":\"Ward - 3\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"VADAKKUMBHAGOM KIZHAKKU\",\"Ward_No\":\"3\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.523599,9.341743],[76.524661,9.342252],[76.525755,9.34277],[76.525954,9.342857],[76.526005,9.3433],[76.526058,9.34376],[76.526609,9.344473],[76.526617,9.344737],[76.526762,9.34526],[76.526228,9.345172],[76.525682,9.345083],[76.525516,9.345061],[76.525109,9.344995],[76.524571,9.344885],[76.52421,9.344812],[76.523849,9.344738],[76.523674,9.344683],[76.52346,9.344615],[76.523033,9.34448],[76.522347,9.344294],[76.521474,9.344058],[76.520709,9.34385],[76.520221,9.343741],[76.519924,9.343675],[76.519499,9.343558],[76.519205,9.343477],[76.518762,9.34335],[76.516532,9.342592],[76.516282,9.342585],[76.515311,9.342562],[76.514939,9.342582],[76.514313,9.342789],[76.514178,9.342833],[76.514035,9.34288],[76.513926,9.342978],[76.513136,9.343688],[76.512404,9.344383],[76.510402,9.343925],[76.510387,9.343767],[76.510361,9.343506],[76.510334,9.343191],[76.510312,9.342947],[76.510171,9.34291],[76.510246,9.342628],[76.510353,9.342499],[76.51037,9.342399],[76.510404,9.34219],[76.510427,9.342046],[76.510452,9.341896],[76.510032,9.341834],[76.509048,9.341397],[76.50895,9.341304],[76.509227,9.341118],[76.509454,9.341226],[76.509576,9.3413],[76.509864,9.341473],[76.509925,9.34094],[76.509984,9.340736],[76.510072,9.340649],[76.51023,9.340588],[76.510342,9.340544],[76.510443,9.340406],[76.5106,9.340126],[76.510966,9.339897],[76.511223,9.339735],[76.511312,9.339678],[76.511436,9.339534],[76.51161,9.339295],[76.511746,9.339193],[76.512152,9.33905],[76.512334,9.338418],[76.5124,9.338189],[76.513043,9.338712],[76.513478,9.339248],[76.513621,9.339425],[76.519752,9.339119],[76.520095,9.338907],[76.521788,9.339835],[76.523046,9.340331],[76.523472,9.340474],[76.524237,9.340828],[76.524349,9.340805],[76.525188,9.340665],[76.525294,9.340819],[76.525689,9.34139],[76.525503,9.341421],[76.52389,9.341694],[76.523599,9.341743]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:18:54.654Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744995416\",\"Remarks\":\"Ward 9\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"PANCHAYATH OFFICE\",\"Ward_No\":\"9\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.530466,9.349507],[76.530765,9.349612],[76.531102,9.349762],[76.531507,9.350379],[76.531673,9.350488],[76.531995,9.350097],[76.532238,9.350416],[76.532366,9.350563],[76.532462,9.350792],[76.532333,9.351113],[76.532406,9.351339],[76.53248,9.351569],[76.532532,9.351728],[76.532613,9.351984],[76.532618,9.35213],[76.532625,9.352319],[76.532195,9.352259],[76.532002,9.352291],[76.531428,9.352387],[76.530796,9.352271],[76.530661,9.352224],[76.530525,9.352177],[76.529277,9.352084],[76.52914,9.352078],[76.529002,9.352071],[76.5288,9.352043],[76.52845,9.351995],[76.528418,9.351595],[76.527739,9.351764],[76.527214,9.351894],[76.527032,9.351981],[76.526824,9.35207],[76.526717,9.352116],[76.525848,9.352182],[76.526529,9.353203],[76.526461,9.354003],[76.526159,9.355168],[76.52596,9.355087],[76.525778,9.355012],[76.525598,9.354926],[76.525459,9.354859],[76.525218,9.354941],[76.525128,9.354972],[76.524944,9.354995],[76.524757,9.355018],[76.524013,9.355112],[76.523817,9.355105],[76.523459,9.355307],[76.523018,9.355467],[76.522683,9.355509],[76.522275,9.355626],[76.521319,9.355648],[76.520842,9.355659],[76.520706,9.35566],[76.520046,9.355876],[76.519205,9.355809],[76.5186,9.355873],[76.517531,9.355937],[76.517133,9.35605],[76.516578,9.355976],[76.51682,9.354867],[76.51674,9.354356],[76.516751,9.354178],[76.516775,9.353799],[76.516841,9.352746],[76.517379,9.351442],[76.517788,9.350903],[76.517858,9.350812],[76.518133,9.350801],[76.518385,9.350791],[76.519779,9.350736],[76.519935,9.350703],[76.520092,9.35067],[76.520452,9.350575],[76.520731,9.350413],[76.521114,9.350148],[76.521275,9.349774],[76.521369,9.349551],[76.521522,9.349488],[76.521909,9.349326],[76.522335,9.349147],[76.522951,9.348889],[76.523745,9.348557],[76.52394,9.348453],[76.524133,9.348349],[76.524521,9.348141],[76.524907,9.347934],[76.525799,9.347425],[76.526328,9.347312],[76.526842,9.347594],[76.527212,9.347797],[76.527363,9.34788],[76.527401,9.347962],[76.527465,9.348693],[76.527499,9.349093],[76.527547,9.349663],[76.527547,9.350176],[76.52755,9.350726],[76.527657,9.350727],[76.527765,9.350729],[76.528026,9.350729],[76.528166,9.350728],[76.528343,9.350716],[76.528477,9.350712],[76.528656,9.350758],[76.528762,9.350786],[76.528897,9.350815],[76.52922,9.350816],[76.529637,9.350816],[76.529744,9.350817],[76.529843,9.350817],[76.530188,9.350816],[76.530407,9.350873],[76.530526,9.350979],[76.530644,9.351084],[76.530671,9.350985],[76.530649,9.350626],[76.530874,9.350304],[76.53088,9.35018],[76.530834,9.349963],[76.530773,9.349874],[76.530601,9.349799],[76.530411,9.349628],[76.530466,9.349507]]]},\"properties\":{\"Created_Da\":\"2024-10-20T16:11:26.395Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9961871121\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"KANNASSA\",\"Ward_No\":\"4\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.513136,9.343688],[76.513926,9.342978],[76.514035,9.34288],[76.514178,9.342833],[76.514313,9.342789],[76.514939,9.342582],[76.515311,9.342562],[76.516282,9.342585],[76.516532,9.342592],[76.518762,9.34335],[76.519205,9.343477],[76.518871,9.343883],[76.518816,9.343999],[76.518766,9.344104],[76.518718,9.344276],[76.518698,9.344804],[76.51864,9.346364],[76.516513,9.347354],[76.516492,9.348139],[76.516493,9.348258],[76.516504,9.349224],[76.516364,9.349485],[76.516113,9.349957],[76.516006,9.350158],[76.515781,9.350579],[76.514066,9.351321],[76.513257,9.351377],[76.513074,9.35139],[76.51243,9.351439],[76.512979,9.350147],[76.513125,9.349745],[76.513318,9.349332],[76.513542,9.348835],[76.513612,9.348679],[76.513645,9.348566],[76.513686,9.348358],[76.513764,9.347957],[76.513844,9.347547],[76.513879,9.347333],[76.513903,9.347168],[76.513926,9.347005],[76.512976,9.34706],[76.511743,9.347149],[76.511623,9.347047],[76.511487,9.346799],[76.51045,9.34485],[76.510401,9.344748],[76.510301,9.344538],[76.509984,9.343876],[76.510402,9.343925],[76.512404,9.344383],[76.513136,9.343688]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:49:50.692Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9961871121\",\"Remarks\":\"Ward 6\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"DUCK FARM\",\"Ward_No\":\"6\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.523459,9.355307],[76.523817,9.355105],[76.524013,9.355112],[76.524757,9.355018],[76.524944,9.354995],[76.525128,9.354972],[76.525218,9.354941],[76.525459,9.354859],[76.525598,9.354926],[76.525778,9.355012],[76.52596,9.355087],[76.526159,9.355168],[76.526103,9.355404],[76.525972,9.355965],[76.525955,9.356095],[76.525901,9.356596],[76.525686,9.357203],[76.52548,9.357662],[76.5251,9.358132],[76.52471,9.358312],[76.524558,9.358438],[76.524336,9.358631],[76.523666,9.358812],[76.523448,9.358845],[76.523369,9.358913],[76.523037,9.359263],[76.523056,9.359358],[76.523185,9.3599],[76.522586,9.360718],[76.522609,9.361557],[76.521703,9.361087],[76.521552,9.36101],[76.520726,9.361214],[76.518844,9.361663],[76.518283,9.361819],[76.518125,9.361863],[76.517804,9.361953],[76.517473,9.361621],[76.517143,9.361377],[76.516997,9.360894],[76.516573,9.360371],[76.516395,9.36003],[76.51665,9.359928],[76.516597,9.359794],[76.516417,9.358979],[76.516433,9.358845],[76.516379,9.358642],[76.51639,9.358514],[76.516238,9.358295],[76.516126,9.358165],[76.516072,9.357643],[76.516201,9.357526],[76.51659,9.35759],[76.516536,9.357313],[76.51618,9.357249],[76.516201,9.356876],[76.516266,9.356567],[76.516246,9.356225],[76.516578,9.355976],[76.517133,9.35605],[76.517531,9.355937],[76.5186,9.355873],[76.519205,9.355809],[76.520046,9.355876],[76.520706,9.35566],[76.520842,9.355659],[76.521319,9.355648],[76.522275,9.355626],[76.522683,9.355509],[76.523018,9.355467],[76.523459,9.355307]]]},\"properties\":{\"Created_Da\":\"2024-10-19T06:35:50.959Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9961871121\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"VADAKKUMBHAGOM PADINJARU\",\"Ward_No\":\"2\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.489678,9.328839],[76.489248,9.329584],[76.489594,9.329603],[76.48949,9.329714],[76.489135,9.330092],[76.488991,9.330363],[76.488852,9.330548],[76.488729,9.330722],[76.488616,9.330837],[76.488561,9.330951],[76.48849,9.331149],[76.487944,9.331222],[76.487551,9.33168],[76.487543,9.331863],[76.487538,9.331981],[76.487564,9.332322],[76.487577,9.332499],[76.487623,9.333124],[76.487701,9.33419],[76.487702,9.334442],[76.487704,9.335049],[76.48762,9.335234],[76.486864,9.335362],[76.486646,9.335398],[76.486473,9.335416],[76.485987,9.335464],[76.485417,9.335732],[76.484771,9.336099],[76.48392,9.336791],[76.483508,9.337029],[76.482977,9.337336],[76.482712,9.337541],[76.482566,9.337651],[76.482175,9.337949],[76.481101,9.338766],[76.480869,9.338942],[76.480165,9.339775],[76.480102,9.339886],[76.479978,9.340314],[76.479949,9.340524],[76.479639,9.340778],[76.478596,9.341121],[76.478302,9.34025],[76.478516,9.339274],[76.476992,9.338852],[76.476377,9.339063],[76.476377,9.338667],[76.475334,9.337928],[76.47532,9.337917],[76.475212,9.337833],[76.475109,9.337729],[76.474957,9.337566],[76.474779,9.33728],[76.475601,9.337058],[76.476029,9.336768],[76.475976,9.336161],[76.475342,9.335221],[76.47525,9.335035],[76.475134,9.334855],[76.474745,9.334347],[76.474211,9.333655],[76.473864,9.333312],[76.473607,9.333003],[76.473398,9.332524],[76.47327,9.332119],[76.473273,9.331752],[76.473649,9.331344],[76.474398,9.330937],[76.474719,9.33041],[76.474398,9.329671],[76.474398,9.328879],[76.477901,9.328668],[76.48028,9.328616],[76.482503,9.32885],[76.484107,9.329113],[76.485471,9.329404],[76.487235,9.329456],[76.487716,9.32943],[76.489678,9.328839]]]},\"properties\":{\"Created_Da\":\"2024-10-20T11:28:34.658Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744995416\",\"Remarks\":\"Ward - 12\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"ERATHODU\",\"Ward_No\":\"12\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.490763,9.341127],[76.490246,9.341891],[76.48999,9.34258],[76.489929,9.342743],[76.489821,9.343035],[76.489789,9.343122],[76.489712,9.34333],[76.489683,9.34398],[76.489669,9.344301],[76.489654,9.34463],[76.489626,9.345277],[76.489385,9.345615],[76.4888,9.346436],[76.488767,9.346556],[76.488596,9.34716],[76.487102,9.346585],[76.486487,9.3463],[76.486012,9.34608],[76.485229,9.345834],[76.484059,9.345776],[76.48283,9.345141],[76.482362,9.343929],[76.481321,9.342625],[76.480475,9.34142],[76.480322,9.340932],[76.480074,9.340956],[76.479912,9.340787],[76.479949,9.340524],[76.479978,9.340314],[76.480102,9.339886],[76.480165,9.339775],[76.480869,9.338942],[76.481101,9.338766],[76.482175,9.337949],[76.482566,9.337651],[76.482712,9.337541],[76.482977,9.337336],[76.483508,9.337029],[76.48392,9.336791],[76.484771,9.336099],[76.485417,9.335732],[76.485987,9.335464],[76.486473,9.335416],[76.486646,9.335398],[76.486864,9.335362],[76.48762,9.335234],[76.487704,9.335049],[76.487702,9.334442],[76.487701,9.33419],[76.487623,9.333124],[76.487577,9.332499],[76.487564,9.332322],[76.487538,9.331981],[76.487543,9.331863],[76.487551,9.33168],[76.487944,9.331222],[76.48849,9.331149],[76.488517,9.331286],[76.4886,9.331706],[76.488679,9.332107],[76.488771,9.332571],[76.48885,9.33297],[76.488912,9.333204],[76.488957,9.333373],[76.488866,9.333613],[76.488792,9.33382],[76.488613,9.334574],[76.488608,9.334801],[76.488657,9.335083],[76.488754,9.335278],[76.488852,9.335468],[76.489054,9.335757],[76.48947,9.335614],[76.489764,9.335512],[76.490099,9.335563],[76.49031,9.335664],[76.490427,9.33572],[76.490587,9.335828],[76.490696,9.335893],[76.491124,9.336146],[76.491271,9.336158],[76.491684,9.336217],[76.492593,9.336383],[76.492683,9.336409],[76.493022,9.336536],[76.493227,9.336617],[76.493597,9.336815],[76.493753,9.336884],[76.49407,9.337096],[76.494423,9.337254],[76.494594,9.337245],[76.494788,9.337234],[76.494953,9.337225],[76.496019,9.337168],[76.496132,9.337168],[76.497464,9.337177],[76.497891,9.337163],[76.498019,9.337158],[76.498155,9.33715],[76.498711,9.337231],[76.498613,9.337451],[76.498609,9.339025],[76.498609,9.339123],[76.49861,9.339287],[76.498614,9.340172],[76.498615,9.340363],[76.498165,9.340452],[76.497818,9.340522],[76.495914,9.340851],[76.495599,9.340906],[76.495407,9.340932],[76.494315,9.34101],[76.493103,9.341096],[76.492768,9.341141],[76.492229,9.341062],[76.490936,9.340871],[76.490763,9.341127]]]},\"properties\":{\"Created_Da\":\"2024-10-20T15:01:47.129Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744995416\",\"Remarks\":\"ward - 13\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"KOMBANKERY\",\"Ward_No\":\"13\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.517788,9.350903],[76.517379,9.351442],[76.516841,9.352746],[76.516775,9.353799],[76.516751,9.354178],[76.515109,9.353196],[76.51376,9.352341],[76.51313,9.351914],[76.512552,9.351522],[76.51243,9.351439],[76.513074,9.35139],[76.513257,9.351377],[76.514066,9.351321],[76.515781,9.350579],[76.516006,9.350158],[76.516113,9.349957],[76.516364,9.349485],[76.516504,9.349224],[76.516493,9.348258],[76.516492,9.348139],[76.516513,9.347354],[76.51864,9.346364],[76.518698,9.344804],[76.518718,9.344276],[76.518766,9.344104],[76.518816,9.343999],[76.518871,9.343883],[76.519205,9.343477],[76.519499,9.343558],[76.519924,9.343675],[76.520221,9.343741],[76.520709,9.34385],[76.521474,9.344058],[76.522347,9.344294],[76.523033,9.34448],[76.52346,9.344615],[76.523674,9.344683],[76.523849,9.344738],[76.52421,9.344812],[76.524571,9.344885],[76.525109,9.344995],[76.525516,9.345061],[76.525682,9.345083],[76.526228,9.345172],[76.526762,9.34526],[76.526933,9.345497],[76.527039,9.345644],[76.527142,9.345788],[76.527431,9.346071],[76.528017,9.346156],[76.528254,9.346062],[76.528382,9.345963],[76.528522,9.345853],[76.528668,9.345734],[76.528757,9.345662],[76.528919,9.345591],[76.529037,9.34554],[76.529166,9.345525],[76.529306,9.345559],[76.529592,9.34563],[76.529682,9.346215],[76.52971,9.346411],[76.529728,9.34653],[76.529742,9.346627],[76.529834,9.346791],[76.530051,9.346784],[76.530234,9.346685],[76.530323,9.346774],[76.530229,9.346926],[76.530161,9.347051],[76.530089,9.347186],[76.529767,9.347308],[76.529622,9.347494],[76.529555,9.347665],[76.529539,9.347773],[76.529506,9.347996],[76.529486,9.348292],[76.529492,9.348626],[76.529617,9.348878],[76.52976,9.34908],[76.529958,9.349359],[76.530227,9.349419],[76.530466,9.349507],[76.530411,9.349628],[76.530601,9.349799],[76.530773,9.349874],[76.530834,9.349963],[76.53088,9.35018],[76.530874,9.350304],[76.530649,9.350626],[76.530671,9.350985],[76.530644,9.351084],[76.530526,9.350979],[76.530407,9.350873],[76.530188,9.350816],[76.529843,9.350817],[76.529744,9.350817],[76.529637,9.350816],[76.52922,9.350816],[76.528897,9.350815],[76.528762,9.350786],[76.528656,9.350758],[76.528477,9.350712],[76.528343,9.350716],[76.528166,9.350728],[76.528026,9.350729],[76.527765,9.350729],[76.527657,9.350727],[76.52755,9.350726],[76.527547,9.350176],[76.527547,9.349663],[76.527499,9.349093],[76.527465,9.348693],[76.527401,9.347962],[76.527363,9.34788],[76.527212,9.347797],[76.526842,9.347594],[76.526328,9.347312],[76.525799,9.347425],[76.524907,9.347934],[76.524521,9.348141],[76.524133,9.348349],[76.52394,9.348453],[76.523745,9.348557],[76.522951,9.348889],[76.522335,9.349147],[76.521909,9.349326],[76.521522,9.349488],[76.521369,9.349551],[76.521275,9.349774],[76.521114,9.350148],[76.520731,9.350413],[76.520452,9.350575],[76.520092,9.35067],[76.519935,9.350703],[76.519779,9.350736],[76.518385,9.350791],[76.518133,9.350801],[76.517858,9.350812],[76.517788,9.350903]]]},\"properties\":{\"Created_Da\":\"2024-10-22T14:36:46.898Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744995416\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"YMCA\",\"Ward_No\":\"5\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.502717,9.347098],[76.502845,9.3474],[76.503001,9.347771],[76.5025,9.348113],[76.502368,9.348149],[76.501737,9.348325],[76.501551,9.348434],[76.501209,9.348633],[76.500916,9.349096],[76.500487,9.350036],[76.499587,9.349347],[76.498844,9.348884],[76.498004,9.348537],[76.497163,9.348151],[76.496616,9.347303],[76.495893,9.346763],[76.495385,9.346898],[76.494524,9.347071],[76.493332,9.346956],[76.490978,9.346781],[76.489878,9.346926],[76.488596,9.34716],[76.488767,9.346556],[76.4888,9.346436],[76.489385,9.345615],[76.489626,9.345277],[76.489654,9.34463],[76.489669,9.344301],[76.489683,9.34398],[76.489712,9.34333],[76.489789,9.343122],[76.489821,9.343035],[76.489929,9.342743],[76.48999,9.34258],[76.49002,9.342223],[76.490246,9.341891],[76.490763,9.341127],[76.490936,9.340871],[76.492229,9.341062],[76.492768,9.341141],[76.493103,9.341096],[76.494315,9.34101],[76.495407,9.340932],[76.495599,9.340906],[76.495914,9.340851],[76.497818,9.340522],[76.498165,9.340452],[76.498615,9.340363],[76.499055,9.34056],[76.499214,9.340632],[76.499497,9.340823],[76.500479,9.340724],[76.500561,9.341612],[76.500602,9.341694],[76.500647,9.341957],[76.500655,9.34209],[76.500682,9.342256],[76.500705,9.342435],[76.500738,9.342579],[76.500783,9.342783],[76.500827,9.342954],[76.500869,9.343115],[76.500918,9.343251],[76.500952,9.343335],[76.501021,9.343436],[76.501146,9.343618],[76.501211,9.343722],[76.501301,9.343922],[76.501702,9.344812],[76.501893,9.345194],[76.502099,9.34567],[76.502643,9.346923],[76.502717,9.347098]]]},\"properties\":{\"Created_Da\":\"2024-10-20T15:36:48.884Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9961871121\",\"Remarks\":\"ward - 14\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"THOTTADI\",\"Ward_No\":\"14\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.507744,9.34726],[76.507682,9.346438],[76.507663,9.346291],[76.508267,9.34587],[76.508789,9.345944],[76.50931,9.346017],[76.51045,9.34485],[76.511487,9.346799],[76.511623,9.347047],[76.511743,9.347149],[76.512976,9.34706],[76.513926,9.347005],[76.513903,9.347168],[76.513879,9.347333],[76.513844,9.347547],[76.513764,9.347957],[76.513686,9.348358],[76.513645,9.348566],[76.513612,9.348679],[76.513542,9.348835],[76.513318,9.349332],[76.513125,9.349745],[76.512979,9.350147],[76.51243,9.351439],[76.512552,9.351522],[76.51313,9.351914],[76.51376,9.352341],[76.515109,9.353196],[76.516751,9.354178],[76.515328,9.354297],[76.514492,9.354329],[76.513335,9.353778],[76.512731,9.353643],[76.512351,9.354494],[76.511434,9.354818],[76.510033,9.354617],[76.508901,9.354707],[76.50756,9.353483],[76.507141,9.353048],[76.506507,9.352424],[76.505884,9.351741],[76.505513,9.351306],[76.504077,9.350648],[76.503061,9.350473],[76.501938,9.350475],[76.501403,9.350394],[76.500487,9.350036],[76.500916,9.349096],[76.501209,9.348633],[76.501551,9.348434],[76.501737,9.348325],[76.502368,9.348149],[76.5025,9.348113],[76.503001,9.347771],[76.502845,9.3474],[76.502717,9.347098],[76.502643,9.346923],[76.502099,9.34567],[76.501893,9.345194],[76.501702,9.344812],[76.501301,9.343922],[76.501211,9.343722],[76.501146,9.343618],[76.501021,9.343436],[76.500952,9.343335],[76.500918,9.343251],[76.500869,9.343115],[76.500827,9.342954],[76.500783,9.342783],[76.500738,9.342579],[76.500705,9.342435],[76.500682,9.342256],[76.500655,9.34209],[76.500647,9.341957],[76.500602,9.341694],[76.500917,9.342069],[76.501198,9.342364],[76.502374,9.343396],[76.502901,9.344394],[76.503489,9.345352],[76.504498,9.345523],[76.504979,9.345614],[76.505751,9.346151],[76.505878,9.346341],[76.506377,9.347088],[76.506548,9.34717],[76.506744,9.347263],[76.506906,9.347238],[76.507395,9.347214],[76.507744,9.34726]]]},\"properties\":{\"Created_Da\":\"2024-10-23T05:16:57.144Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9961871121\",\"Remarks\":\"Ward 1\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"KATTUNILAM\",\"Ward_No\":\"1\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.524212,9.337407],[76.523834,9.337419],[76.523527,9.337428],[76.523021,9.337443],[76.52145,9.337476],[76.520299,9.337499],[76.520193,9.337582],[76.520355,9.337825],[76.520246,9.338277],[76.520095,9.338907],[76.519752,9.339119],[76.519592,9.338967],[76.519154,9.33855],[76.518356,9.338549],[76.517879,9.338548],[76.517555,9.338548],[76.517029,9.338375],[76.516589,9.338229],[76.516414,9.338172],[76.516182,9.337895],[76.5159,9.337559],[76.51528,9.3375],[76.51534,9.336901],[76.515507,9.336713],[76.515614,9.336443],[76.516328,9.336278],[76.516584,9.336355],[76.517115,9.336494],[76.517281,9.336417],[76.517414,9.336286],[76.516044,9.335531],[76.515197,9.335456],[76.514007,9.335244],[76.513946,9.33515],[76.51384,9.334986],[76.51328,9.335033],[76.512792,9.335268],[76.512887,9.33414],[76.512637,9.33407],[76.512723,9.333799],[76.513381,9.333716],[76.513423,9.333319],[76.513708,9.333156],[76.514556,9.333051],[76.515181,9.332974],[76.515387,9.333361],[76.515632,9.333435],[76.515778,9.33348],[76.516029,9.333876],[76.516183,9.334068],[76.516961,9.334151],[76.517624,9.334221],[76.517704,9.333637],[76.518113,9.333483],[76.518706,9.333597],[76.519154,9.333683],[76.519306,9.333712],[76.520029,9.33385],[76.520037,9.333385],[76.520141,9.333382],[76.520958,9.333362],[76.521059,9.334339],[76.521403,9.334388],[76.521494,9.334402],[76.522308,9.334571],[76.522533,9.334534],[76.52268,9.33451],[76.522749,9.334577],[76.52286,9.334575],[76.523835,9.334431],[76.523992,9.334444],[76.524112,9.334616],[76.524385,9.334619],[76.524385,9.334342],[76.524655,9.334423],[76.524868,9.334487],[76.524975,9.334519],[76.525188,9.334583],[76.525296,9.334615],[76.525403,9.334647],[76.525512,9.334679],[76.525619,9.334711],[76.525727,9.334743],[76.525938,9.334807],[76.526047,9.334839],[76.526154,9.334871],[76.526133,9.335102],[76.526217,9.335155],[76.5263,9.335208],[76.5264,9.335271],[76.526599,9.335387],[76.5267,9.335446],[76.52684,9.335527],[76.527633,9.335988],[76.528023,9.335985],[76.528186,9.335984],[76.528356,9.33627],[76.528455,9.336436],[76.528763,9.336457],[76.528891,9.336466],[76.529125,9.336482],[76.529234,9.336489],[76.529335,9.336496],[76.529503,9.336507],[76.52954,9.336683],[76.529563,9.33692],[76.529802,9.337336],[76.529325,9.337508],[76.528723,9.337484],[76.528546,9.337477],[76.528318,9.337297],[76.527626,9.336749],[76.527479,9.336983],[76.526832,9.336944],[76.526525,9.336926],[76.526544,9.337347],[76.526383,9.337499],[76.526271,9.337605],[76.526275,9.337903],[76.526282,9.338415],[76.526156,9.338311],[76.525895,9.338095],[76.525696,9.338107],[76.525377,9.338125],[76.525002,9.338146],[76.524547,9.337859],[76.524399,9.337401],[76.524212,9.337407]]]},\"properties\":{\"Created_Da\":\"2024-10-19T14:25:21.079Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Niranam\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9744995416\",\"Remarks\":\"New Ward name Mannamthottuvazhi\",\"Surveyor\":\"indukpurushothaman\",\"Ward_Name\":\"MANNAMTHOTTUVAZHI\",\"Ward_No\":\"8\",\"Mandal\":\"Thiruvalla\"}}]}");
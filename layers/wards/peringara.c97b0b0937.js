@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.526554,9.379264],[76.526413,9.379244],[76.526301,9.379239],[76.525833,9.379281],[76.525618,9.379343],[76.5255,9.379333],[76.525423,9.379255],[76.525253,9.379272],[76.525044,9.379344],[76.524907,9.37937],[76.524609,9.379441],[76.524481,9.379299],[76.524071,9.379251],[76.523976,9.379128],[76.523767,9.379016],[76.52381,9.378916],[76.523815,9.378806],[76.523908,9.378707],[76.523986,9.378544],[76.523862,9.378223],[76.523834,9.378121],[76.523962,9.378079],[76.524157,9.378026],[76.524137,9.377864],[76.524212,9.377769],[76.524327,9.377697],[76.524572,9.377635],[76.524559,9.37731],[76.524665,9.377198],[76.524744,9.377068],[76.524772,9.376887],[76.524746,9.376754],[76.524868,9.376549],[76.524961,9.376391],[76.525093,9.376281],[76.525235,9.376259],[76.525446,9.376249],[76.525825,9.37621],[76.526116,9.376196],[76.526386,9.376206],[76.526617,9.376056],[76.526787,9.375933],[76.527057,9.375902],[76.527205,9.375894],[76.527262,9.375792],[76.527413,9.37567],[76.527591,9.375612],[76.527693,9.375473],[76.527691,9.375154],[76.527977,9.375162],[76.528111,9.375175],[76.528332,9.375196],[76.528514,9.375227],[76.528747,9.375266],[76.528884,9.37529],[76.528988,9.375309],[76.529081,9.375327],[76.529279,9.375506],[76.529519,9.375569],[76.529657,9.375665],[76.529779,9.375617],[76.529952,9.37573],[76.530127,9.37578],[76.530337,9.375865],[76.530489,9.375902],[76.530419,9.376023],[76.530314,9.376207],[76.530141,9.376371],[76.530016,9.376456],[76.530053,9.376645],[76.53003,9.376868],[76.529936,9.376935],[76.529656,9.377209],[76.529826,9.377512],[76.529955,9.37783],[76.529938,9.378066],[76.529924,9.378269],[76.529733,9.378271],[76.529373,9.37824],[76.529143,9.378322],[76.529013,9.378537],[76.528892,9.378706],[76.528824,9.378843],[76.528632,9.379244],[76.528637,9.379468],[76.528613,9.379625],[76.528637,9.379794],[76.528532,9.380044],[76.528614,9.380124],[76.528865,9.38018],[76.528987,9.380208],[76.529133,9.380209],[76.529235,9.380218],[76.529356,9.380227],[76.529574,9.380203],[76.529726,9.380186],[76.529983,9.380225],[76.530226,9.380262],[76.530508,9.380216],[76.53077,9.380173],[76.530882,9.380155],[76.530866,9.380054],[76.531182,9.37999],[76.531302,9.379965],[76.531437,9.379938],[76.531552,9.37985],[76.531516,9.37959],[76.531499,9.379461],[76.531438,9.379297],[76.531527,9.379216],[76.531561,9.378951],[76.531865,9.378855],[76.532424,9.378681],[76.532484,9.378414],[76.5334,9.378306],[76.533496,9.378295],[76.533612,9.378238],[76.534015,9.378049],[76.534349,9.377901],[76.534536,9.377854],[76.534695,9.377813],[76.534557,9.377745],[76.534559,9.377621],[76.53475,9.377636],[76.534901,9.377648],[76.535164,9.377669],[76.535229,9.377837],[76.535288,9.377948],[76.53534,9.378033],[76.53541,9.378147],[76.535501,9.378161],[76.535691,9.37794],[76.535678,9.37779],[76.535754,9.377667],[76.535952,9.377623],[76.535962,9.37753],[76.536053,9.377501],[76.536173,9.377522],[76.536286,9.377541],[76.536399,9.377586],[76.536585,9.377633],[76.536688,9.37763],[76.536804,9.377627],[76.53702,9.377592],[76.536975,9.37742],[76.536954,9.377322],[76.537051,9.377298],[76.537153,9.377272],[76.537366,9.377219],[76.53765,9.377128],[76.537755,9.377094],[76.537848,9.377056],[76.538027,9.376979],[76.538013,9.376872],[76.538544,9.376927],[76.538669,9.377049],[76.538875,9.37725],[76.538984,9.377357],[76.539019,9.377464],[76.539071,9.377793],[76.539069,9.377906],[76.539066,9.378161],[76.538973,9.37837],[76.538935,9.378454],[76.538912,9.378546],[76.53888,9.37867],[76.538755,9.378931],[76.538581,9.379104],[76.538485,9.379387],[76.538395,9.37969],[76.53832,9.379938],[76.538264,9.380125],[76.538181,9.380237],[76.538156,9.380438],[76.538081,9.380572],[76.538053,9.38069],[76.537953,9.380884],[76.537853,9.380984],[76.537534,9.38103],[76.537375,9.380993],[76.53723,9.38096],[76.537032,9.380964],[76.536908,9.380967],[76.53659,9.381004],[76.536355,9.381146],[76.536277,9.381341],[76.536299,9.381525],[76.536358,9.381754],[76.536313,9.381861],[76.536268,9.381966],[76.536158,9.382116],[76.536093,9.382205],[76.53596,9.382388],[76.535833,9.382545],[76.535685,9.382622],[76.535545,9.382636],[76.535443,9.382646],[76.535203,9.382593],[76.534667,9.382603],[76.534362,9.382892],[76.534241,9.383049],[76.534214,9.383205],[76.534088,9.383456],[76.534137,9.383753],[76.533876,9.383655],[76.533769,9.383647],[76.533755,9.383757],[76.533614,9.383839],[76.533314,9.38378],[76.532979,9.383821],[76.532708,9.383822],[76.53261,9.383797],[76.532494,9.383915],[76.532248,9.384005],[76.531944,9.384232],[76.531673,9.384428],[76.531587,9.384554],[76.531365,9.384732],[76.531208,9.384873],[76.530869,9.384988],[76.530455,9.384888],[76.529894,9.384918],[76.52961,9.38509],[76.529555,9.384938],[76.529495,9.384591],[76.52941,9.384425],[76.529224,9.384343],[76.52907,9.384039],[76.528973,9.383825],[76.528936,9.383655],[76.528795,9.383563],[76.528504,9.38349],[76.528514,9.383363],[76.528608,9.383239],[76.528683,9.383049],[76.528727,9.382711],[76.528746,9.382152],[76.528502,9.381941],[76.528362,9.381552],[76.528228,9.381286],[76.52829,9.380947],[76.528332,9.380813],[76.527975,9.38085],[76.527855,9.380624],[76.527688,9.380398],[76.527598,9.380309],[76.527568,9.380042],[76.527557,9.379833],[76.527577,9.379658],[76.527561,9.379492],[76.527394,9.379449],[76.527196,9.379356],[76.527011,9.379302],[76.526832,9.379305],[76.526705,9.379318],[76.526554,9.379264]]]},\"properties\":{\"Created_Da\":\"2024-10-19T11:08:56.451Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"shyma\",\"Ward_Name\":\"PERINGARA PADINJARU\",\"Ward_No\":\"14\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.556316,9.412911],[76.556142,9.412957],[76.555992,9.412999],[76.555843,9.413025],[76.555688,9.413055],[76.555549,9.413078],[76.555385,9.413177],[76.555024,9.413276],[76.554946,9.413534],[76.554859,9.413662],[76.554563,9.414115],[76.554433,9.41425],[76.554204,9.414388],[76.554085,9.414459],[76.553855,9.414597],[76.55374,9.414667],[76.553386,9.414567],[76.553163,9.414461],[76.552653,9.414219],[76.55278,9.414034],[76.552844,9.413954],[76.552917,9.413864],[76.553017,9.413651],[76.553125,9.413395],[76.553256,9.413104],[76.55331,9.412967],[76.553415,9.412726],[76.553625,9.41224],[76.55373,9.411998],[76.553941,9.411511],[76.554318,9.410837],[76.554475,9.410627],[76.55422,9.410555],[76.554092,9.410552],[76.553806,9.410546],[76.553335,9.410544],[76.553013,9.410541],[76.552646,9.410464],[76.552521,9.410444],[76.552273,9.41042],[76.552188,9.410593],[76.55209,9.410872],[76.551987,9.411009],[76.55183,9.411025],[76.551628,9.411045],[76.551563,9.411141],[76.551446,9.411327],[76.551277,9.411312],[76.551118,9.411293],[76.550969,9.41127],[76.550753,9.411231],[76.550645,9.411192],[76.550438,9.411118],[76.550209,9.41105],[76.550077,9.411023],[76.549883,9.410955],[76.549888,9.410834],[76.549908,9.410565],[76.549921,9.410413],[76.549936,9.410248],[76.54995,9.410042],[76.549957,9.409883],[76.549963,9.409788],[76.549996,9.409335],[76.55002,9.408733],[76.550053,9.408199],[76.550091,9.407701],[76.550115,9.407202],[76.550132,9.406897],[76.550142,9.406532],[76.55014,9.406192],[76.550179,9.405733],[76.5502,9.405369],[76.550266,9.405018],[76.550286,9.40462],[76.550237,9.40418],[76.550218,9.403723],[76.550645,9.403776],[76.551051,9.40381],[76.551488,9.403802],[76.551884,9.403715],[76.552176,9.403544],[76.55274,9.403308],[76.553692,9.402903],[76.554056,9.402777],[76.554052,9.402659],[76.554052,9.402265],[76.55415,9.401854],[76.554371,9.401512],[76.554446,9.401026],[76.554641,9.400571],[76.554693,9.40045],[76.554797,9.400401],[76.555103,9.400254],[76.555631,9.399867],[76.555917,9.399636],[76.556698,9.399269],[76.557835,9.398986],[76.558674,9.39882],[76.559055,9.398763],[76.559176,9.398745],[76.559354,9.398697],[76.559863,9.398605],[76.559919,9.398797],[76.559973,9.398882],[76.560101,9.399004],[76.560217,9.399113],[76.560348,9.399238],[76.560417,9.399351],[76.560498,9.399483],[76.560526,9.399578],[76.560554,9.399678],[76.560602,9.399812],[76.560677,9.400142],[76.560884,9.400407],[76.561131,9.400647],[76.561209,9.400742],[76.561261,9.400874],[76.561238,9.401062],[76.561276,9.401241],[76.561305,9.40138],[76.561289,9.401549],[76.561292,9.401743],[76.561251,9.401919],[76.561286,9.402093],[76.561377,9.402319],[76.561454,9.402492],[76.561513,9.402625],[76.561577,9.402798],[76.561637,9.402961],[76.56176,9.40315],[76.561858,9.403301],[76.561959,9.403428],[76.562037,9.403506],[76.562194,9.403632],[76.562288,9.403709],[76.562403,9.403771],[76.562643,9.403829],[76.562761,9.403854],[76.562862,9.403875],[76.563148,9.403925],[76.563347,9.403952],[76.563485,9.403971],[76.563672,9.403991],[76.563808,9.404091],[76.563918,9.404172],[76.564084,9.404345],[76.564193,9.404406],[76.564489,9.404573],[76.564707,9.404695],[76.564833,9.404773],[76.564954,9.404867],[76.565078,9.404987],[76.565253,9.405183],[76.565489,9.405477],[76.565729,9.406241],[76.565744,9.406706],[76.56576,9.407197],[76.565863,9.407743],[76.565769,9.408157],[76.565708,9.408425],[76.565412,9.408731],[76.565061,9.409102],[76.564745,9.409437],[76.564606,9.40959],[76.564498,9.40967],[76.564367,9.409775],[76.56416,9.409957],[76.564073,9.41002],[76.564001,9.410086],[76.563615,9.41044],[76.563716,9.410623],[76.563436,9.410698],[76.563124,9.410875],[76.562753,9.410945],[76.562416,9.410986],[76.562018,9.410993],[76.561473,9.411015],[76.561241,9.411023],[76.561039,9.411042],[76.560824,9.411078],[76.560698,9.411159],[76.560487,9.411175],[76.560244,9.411217],[76.560109,9.411189],[76.559943,9.411193],[76.559774,9.411263],[76.559574,9.41135],[76.55943,9.411411],[76.559292,9.411505],[76.559164,9.411564],[76.559034,9.41163],[76.558913,9.411702],[76.558759,9.411794],[76.558638,9.411877],[76.558503,9.411966],[76.558338,9.41207],[76.55819,9.41217],[76.558027,9.412279],[76.557881,9.412364],[76.557738,9.412458],[76.557623,9.412524],[76.557517,9.412576],[76.557376,9.412627],[76.557204,9.412649],[76.557092,9.412656],[76.556952,9.41267],[76.556595,9.41273],[76.556378,9.41278],[76.556376,9.412822],[76.556316,9.412911]]]},\"properties\":{\"Created_Da\":\"2024-10-16T12:53:58.097Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"PERUMTHURUTHY\",\"Ward_No\":\"5\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.511721,9.392319],[76.511761,9.392489],[76.511796,9.392612],[76.511846,9.392792],[76.511844,9.393189],[76.511879,9.393525],[76.511811,9.393885],[76.511837,9.394004],[76.511978,9.394318],[76.511843,9.394382],[76.511319,9.394514],[76.511281,9.39426],[76.51099,9.393064],[76.510742,9.392017],[76.510684,9.391898],[76.510733,9.391461],[76.511068,9.391057],[76.511508,9.390868],[76.51203,9.390783],[76.512722,9.390774],[76.513425,9.390668],[76.513912,9.390424],[76.513921,9.390426],[76.514079,9.390383],[76.51407,9.390021],[76.513933,9.389309],[76.51354,9.388661],[76.513281,9.3883],[76.512767,9.387863],[76.512228,9.387407],[76.512206,9.387325],[76.511959,9.386778],[76.511727,9.386332],[76.511616,9.385687],[76.511746,9.38435],[76.511943,9.38431],[76.512097,9.384279],[76.512183,9.38424],[76.512336,9.384171],[76.512479,9.384111],[76.512574,9.384071],[76.512729,9.383979],[76.512797,9.383881],[76.512918,9.383839],[76.513024,9.383802],[76.513158,9.383756],[76.513362,9.38368],[76.513501,9.383628],[76.513631,9.383575],[76.51385,9.383485],[76.514012,9.383528],[76.514102,9.383479],[76.514273,9.383386],[76.514448,9.383322],[76.514554,9.38326],[76.514669,9.382986],[76.514705,9.3829],[76.514758,9.38282],[76.514941,9.382537],[76.51501,9.382471],[76.515088,9.382397],[76.51517,9.382319],[76.515366,9.382188],[76.515465,9.382123],[76.515554,9.38202],[76.515709,9.38184],[76.515982,9.381466],[76.516014,9.381304],[76.516012,9.381145],[76.515998,9.380928],[76.516008,9.380614],[76.516401,9.380324],[76.516641,9.380163],[76.516913,9.37998],[76.517093,9.379973],[76.517537,9.379707],[76.517385,9.379422],[76.517176,9.379032],[76.517116,9.378859],[76.51771,9.378689],[76.51761,9.378353],[76.517544,9.378127],[76.51748,9.377913],[76.517416,9.377696],[76.51732,9.377371],[76.51727,9.377201],[76.517218,9.377026],[76.517182,9.376902],[76.517122,9.3767],[76.517383,9.376533],[76.517608,9.376407],[76.517801,9.376335],[76.517947,9.376315],[76.518047,9.376302],[76.518229,9.376277],[76.518333,9.376263],[76.518476,9.376204],[76.518617,9.376145],[76.518785,9.376169],[76.518932,9.376319],[76.519152,9.376292],[76.519257,9.376279],[76.5195,9.37619],[76.51959,9.376156],[76.5198,9.376074],[76.520064,9.375972],[76.520456,9.375972],[76.520802,9.376114],[76.521004,9.376236],[76.521103,9.376296],[76.521115,9.376397],[76.52101,9.376429],[76.520904,9.376461],[76.520931,9.376709],[76.520946,9.376857],[76.520972,9.376947],[76.521038,9.377182],[76.521158,9.376803],[76.521251,9.376771],[76.521474,9.376696],[76.521623,9.376623],[76.521708,9.376582],[76.522062,9.37638],[76.522224,9.37632],[76.52239,9.376259],[76.522347,9.376103],[76.522637,9.376008],[76.522773,9.375973],[76.523135,9.375866],[76.523471,9.375779],[76.523611,9.375743],[76.523733,9.375528],[76.52411,9.375461],[76.524102,9.37562],[76.524212,9.375685],[76.524706,9.375472],[76.524816,9.375428],[76.525022,9.375346],[76.525075,9.37543],[76.52517,9.375413],[76.525606,9.375355],[76.525756,9.375391],[76.526,9.375315],[76.52621,9.37525],[76.526294,9.375209],[76.52664,9.375041],[76.526752,9.374982],[76.526896,9.375057],[76.527006,9.375209],[76.527273,9.375071],[76.527428,9.375051],[76.527691,9.375154],[76.527693,9.375473],[76.527591,9.375612],[76.527413,9.37567],[76.527262,9.375792],[76.527205,9.375894],[76.527057,9.375902],[76.526787,9.375933],[76.526617,9.376056],[76.526386,9.376206],[76.526116,9.376196],[76.525825,9.37621],[76.525446,9.376249],[76.525235,9.376259],[76.525093,9.376281],[76.524961,9.376391],[76.524868,9.376549],[76.524746,9.376754],[76.524772,9.376887],[76.524744,9.377068],[76.524665,9.377198],[76.524559,9.37731],[76.524572,9.377635],[76.524327,9.377697],[76.524212,9.377769],[76.524137,9.377864],[76.524157,9.378026],[76.523962,9.378079],[76.523834,9.378121],[76.523862,9.378223],[76.523986,9.378544],[76.523908,9.378707],[76.523815,9.378806],[76.52381,9.378916],[76.523767,9.379016],[76.523976,9.379128],[76.524071,9.379251],[76.524225,9.379583],[76.524345,9.380013],[76.524473,9.380208],[76.524513,9.380393],[76.5248,9.380663],[76.525075,9.381274],[76.525181,9.381554],[76.525447,9.382039],[76.525593,9.382314],[76.525698,9.382566],[76.52572,9.38274],[76.525897,9.382842],[76.52606,9.383096],[76.526126,9.383428],[76.525894,9.38342],[76.525746,9.383369],[76.52562,9.383287],[76.525183,9.383336],[76.524574,9.383642],[76.524186,9.383887],[76.523777,9.383987],[76.523336,9.383868],[76.523105,9.383817],[76.522588,9.383851],[76.522443,9.383882],[76.521862,9.383847],[76.52155,9.383944],[76.521328,9.384051],[76.521727,9.384758],[76.521565,9.385011],[76.521458,9.385099],[76.521552,9.385358],[76.521584,9.385489],[76.521308,9.3861],[76.520557,9.386386],[76.5207,9.386651],[76.52159,9.38637],[76.521957,9.386474],[76.521999,9.38658],[76.521777,9.386699],[76.521503,9.386824],[76.521392,9.386977],[76.521229,9.38712],[76.520914,9.387273],[76.520591,9.387418],[76.520495,9.387552],[76.520143,9.387894],[76.519945,9.388008],[76.519657,9.388082],[76.519257,9.388138],[76.518897,9.388134],[76.518643,9.388137],[76.518388,9.388054],[76.517956,9.388277],[76.517738,9.388475],[76.517561,9.388598],[76.51719,9.388733],[76.516903,9.388854],[76.516483,9.389089],[76.516366,9.389229],[76.51618,9.389395],[76.516064,9.389561],[76.515993,9.38976],[76.515927,9.389855],[76.515691,9.39],[76.515441,9.390112],[76.515249,9.390274],[76.514926,9.390388],[76.514768,9.390549],[76.514618,9.390655],[76.514368,9.390635],[76.514188,9.390744],[76.514083,9.390822],[76.513867,9.391001],[76.513803,9.391124],[76.51369,9.391194],[76.513455,9.391257],[76.513195,9.39134],[76.512989,9.391398],[76.51281,9.391396],[76.512599,9.391482],[76.512235,9.391686],[76.51192,9.392045],[76.511721,9.392319]]]},\"properties\":{\"Created_Da\":\"2024-10-21T11:02:55.985Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"shyma\",\"Ward_Name\":\"CHATHENKARY\",\"Ward_No\":\"15\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.55889,9.390752],[76.559049,9.390694],[76.559101,9.390899],[76.559327,9.391118],[76.559197,9.391405],[76.559207,9.391695],[76.55925,9.391901],[76.559305,9.392136],[76.559314,9.392389],[76.559223,9.392402],[76.558858,9.392452],[76.558441,9.392534],[76.558266,9.392574],[76.558112,9.392699],[76.557922,9.392814],[76.557754,9.392926],[76.55747,9.393246],[76.557415,9.393336],[76.557404,9.393468],[76.557386,9.393616],[76.557204,9.393856],[76.557105,9.393974],[76.556948,9.394056],[76.556824,9.394139],[76.556786,9.394332],[76.556823,9.394485],[76.556767,9.394605],[76.556731,9.39471],[76.556767,9.394803],[76.556784,9.394903],[76.556802,9.395009],[76.556791,9.395149],[76.55665,9.395089],[76.556471,9.395109],[76.556246,9.395239],[76.556033,9.395303],[76.555916,9.39529],[76.555789,9.39527],[76.555577,9.395318],[76.555386,9.395408],[76.555248,9.395454],[76.555086,9.395512],[76.554974,9.395585],[76.554878,9.395646],[76.554758,9.395762],[76.554575,9.395821],[76.554329,9.395905],[76.554041,9.395977],[76.553728,9.395995],[76.553473,9.395975],[76.553257,9.396003],[76.55293,9.396076],[76.55258,9.396223],[76.552443,9.396313],[76.552382,9.396415],[76.55231,9.39661],[76.552175,9.396719],[76.552015,9.39677],[76.551674,9.396768],[76.55143,9.396827],[76.551377,9.396632],[76.551317,9.396464],[76.551267,9.396282],[76.551198,9.396207],[76.551052,9.396193],[76.550972,9.396331],[76.550829,9.396471],[76.550706,9.396531],[76.550614,9.396568],[76.550462,9.396618],[76.5503,9.396585],[76.550045,9.39654],[76.550077,9.396787],[76.549948,9.39722],[76.549896,9.397499],[76.549863,9.397707],[76.549822,9.397995],[76.549753,9.398338],[76.549685,9.398627],[76.549685,9.398735],[76.549755,9.399168],[76.549805,9.399538],[76.549817,9.399633],[76.549872,9.40011],[76.549914,9.400602],[76.549719,9.400568],[76.549571,9.400587],[76.549472,9.400581],[76.549358,9.400472],[76.54928,9.400421],[76.549154,9.40043],[76.549051,9.400438],[76.548852,9.400518],[76.54863,9.400497],[76.548267,9.400448],[76.548122,9.400408],[76.547883,9.400342],[76.547782,9.40051],[76.547774,9.400743],[76.547839,9.400949],[76.547761,9.401101],[76.547573,9.401062],[76.547248,9.40102],[76.547106,9.401067],[76.547039,9.401151],[76.546942,9.401244],[76.546748,9.401309],[76.546652,9.401269],[76.546368,9.401221],[76.546236,9.401182],[76.54609,9.401167],[76.545912,9.401176],[76.545818,9.401184],[76.545694,9.401346],[76.545626,9.40154],[76.545539,9.40163],[76.545396,9.401671],[76.54521,9.40181],[76.545102,9.401907],[76.545051,9.402057],[76.54485,9.402072],[76.544729,9.402045],[76.54467,9.401934],[76.544656,9.401791],[76.544542,9.401622],[76.544503,9.401413],[76.544493,9.401205],[76.544464,9.40101],[76.544271,9.400727],[76.544101,9.400721],[76.543925,9.400746],[76.54376,9.400793],[76.543555,9.400761],[76.543422,9.400728],[76.54324,9.400661],[76.543347,9.400258],[76.543373,9.400091],[76.543409,9.399862],[76.543666,9.399922],[76.543779,9.399701],[76.543965,9.399561],[76.544003,9.399384],[76.544022,9.399161],[76.544112,9.398697],[76.544235,9.398462],[76.544357,9.398049],[76.544426,9.397818],[76.544475,9.397733],[76.54462,9.397801],[76.544825,9.397851],[76.545116,9.397818],[76.545199,9.397497],[76.545345,9.397455],[76.545378,9.397251],[76.545447,9.397166],[76.545709,9.397107],[76.546002,9.397131],[76.546105,9.396902],[76.546134,9.396653],[76.546391,9.396535],[76.546667,9.396436],[76.546847,9.396401],[76.546828,9.395832],[76.546953,9.395783],[76.546866,9.395574],[76.54679,9.395425],[76.546738,9.395284],[76.546684,9.39516],[76.546621,9.395014],[76.546753,9.394951],[76.546742,9.394804],[76.546792,9.394691],[76.54691,9.394443],[76.547012,9.394255],[76.547128,9.394114],[76.547241,9.394075],[76.547381,9.394086],[76.547513,9.394025],[76.547608,9.393868],[76.547753,9.393872],[76.547939,9.393855],[76.547929,9.393747],[76.547868,9.393542],[76.547829,9.393412],[76.547881,9.393331],[76.54797,9.393257],[76.548,9.393128],[76.547921,9.392947],[76.547917,9.392751],[76.547915,9.39264],[76.547853,9.392497],[76.547795,9.392376],[76.547651,9.392307],[76.547505,9.392273],[76.547329,9.392193],[76.547422,9.392072],[76.547552,9.391899],[76.547649,9.391839],[76.547765,9.391816],[76.548078,9.391794],[76.548246,9.391807],[76.548487,9.391725],[76.548564,9.391983],[76.548611,9.392072],[76.548601,9.392171],[76.548732,9.392308],[76.548602,9.392388],[76.548703,9.392541],[76.548582,9.392618],[76.548721,9.392669],[76.548816,9.392704],[76.549044,9.392698],[76.549272,9.392693],[76.549331,9.392609],[76.549638,9.392564],[76.549695,9.392984],[76.549854,9.392914],[76.55023,9.392899],[76.550463,9.39289],[76.550695,9.392912],[76.550858,9.392928],[76.550934,9.392621],[76.551333,9.392599],[76.551358,9.392755],[76.5516,9.39288],[76.551695,9.392688],[76.551779,9.392305],[76.552046,9.392359],[76.552043,9.39249],[76.552148,9.392724],[76.552383,9.392727],[76.55263,9.392682],[76.552764,9.392658],[76.55288,9.392658],[76.552984,9.392625],[76.553136,9.392587],[76.55344,9.392509],[76.553526,9.392737],[76.553556,9.392916],[76.553553,9.393085],[76.553485,9.393233],[76.553361,9.393673],[76.553194,9.393676],[76.553207,9.393839],[76.553321,9.394145],[76.553716,9.394247],[76.553889,9.394291],[76.554208,9.394262],[76.554455,9.39424],[76.554629,9.394224],[76.554642,9.393963],[76.554746,9.393961],[76.554904,9.394228],[76.555208,9.394204],[76.555197,9.394079],[76.555078,9.393917],[76.555098,9.39375],[76.555114,9.393616],[76.555092,9.393339],[76.555014,9.39322],[76.555107,9.393084],[76.555277,9.392963],[76.555497,9.392913],[76.555602,9.392882],[76.555696,9.392854],[76.556017,9.392758],[76.556259,9.392608],[76.556472,9.392625],[76.556754,9.392676],[76.556847,9.392656],[76.557033,9.392683],[76.557131,9.392402],[76.557216,9.392205],[76.557181,9.391946],[76.556937,9.391827],[76.55694,9.391176],[76.557018,9.390808],[76.557405,9.390884],[76.557411,9.390787],[76.557511,9.390764],[76.557595,9.390882],[76.557802,9.390989],[76.558044,9.39104],[76.558141,9.391056],[76.558424,9.391104],[76.558444,9.390863],[76.558678,9.390651],[76.558759,9.390493],[76.558761,9.390326],[76.558945,9.390327],[76.558996,9.390549],[76.558827,9.390608],[76.55889,9.390752]]]},\"properties\":{\"Created_Da\":\"2024-10-22T10:40:58.041Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"KUZHIVELIPURAM\",\"Ward_No\":\"7\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.528035,9.396386],[76.528137,9.396182],[76.528262,9.396129],[76.528596,9.396039],[76.528819,9.395994],[76.529029,9.39595],[76.529279,9.395895],[76.529518,9.395845],[76.529684,9.39581],[76.529773,9.395789],[76.529968,9.395742],[76.530266,9.395673],[76.530541,9.395626],[76.530815,9.395581],[76.531111,9.395528],[76.5318,9.395384],[76.532158,9.395293],[76.532445,9.395261],[76.532632,9.395218],[76.532843,9.395171],[76.533071,9.395119],[76.533127,9.39541],[76.533155,9.395505],[76.533182,9.3956],[76.533254,9.395761],[76.533397,9.396078],[76.533499,9.396341],[76.533577,9.39647],[76.533626,9.396678],[76.533792,9.39669],[76.533913,9.396686],[76.534011,9.39678],[76.533969,9.397174],[76.534018,9.397466],[76.534098,9.397695],[76.534163,9.397781],[76.534355,9.397875],[76.534416,9.397977],[76.534511,9.398195],[76.534637,9.398337],[76.534672,9.398506],[76.534643,9.398738],[76.534604,9.398951],[76.534336,9.399009],[76.534027,9.399094],[76.533949,9.399044],[76.533698,9.398936],[76.533474,9.398877],[76.533321,9.398855],[76.533129,9.398921],[76.533085,9.399092],[76.533039,9.399261],[76.532924,9.399423],[76.532843,9.39962],[76.532955,9.399765],[76.533,9.399856],[76.533039,9.399994],[76.533039,9.400304],[76.533109,9.400444],[76.533219,9.400582],[76.53312,9.400805],[76.533003,9.400844],[76.532849,9.400868],[76.532722,9.400884],[76.532701,9.401007],[76.53269,9.401099],[76.532668,9.401206],[76.532595,9.40131],[76.532317,9.401342],[76.532142,9.401338],[76.531985,9.401361],[76.531803,9.401464],[76.531824,9.401609],[76.531869,9.401758],[76.531803,9.401872],[76.531697,9.401885],[76.531498,9.401939],[76.531345,9.401998],[76.531206,9.401991],[76.531038,9.401962],[76.530842,9.402023],[76.53072,9.402069],[76.530604,9.402111],[76.530494,9.402126],[76.530266,9.402164],[76.530045,9.40214],[76.529906,9.402217],[76.529729,9.402324],[76.5295,9.402481],[76.529318,9.402555],[76.529173,9.40261],[76.529032,9.402648],[76.528896,9.402692],[76.528617,9.402774],[76.528735,9.403229],[76.528866,9.403725],[76.52856,9.403805],[76.528633,9.404393],[76.5285,9.404795],[76.528639,9.405074],[76.528669,9.40526],[76.528768,9.405393],[76.528773,9.405497],[76.528979,9.40563],[76.528905,9.405999],[76.528938,9.406162],[76.528771,9.406168],[76.528529,9.406194],[76.528313,9.406226],[76.528309,9.406331],[76.528215,9.406379],[76.528158,9.406574],[76.52797,9.406634],[76.527807,9.406672],[76.527488,9.406754],[76.527414,9.406836],[76.527315,9.406859],[76.527223,9.406846],[76.527106,9.406811],[76.526901,9.406856],[76.527026,9.407297],[76.52706,9.407536],[76.527035,9.407722],[76.527068,9.408014],[76.527044,9.408118],[76.526966,9.408418],[76.526977,9.408632],[76.526916,9.408872],[76.526847,9.408944],[76.526447,9.40904],[76.526209,9.409123],[76.525992,9.409206],[76.525796,9.409247],[76.525494,9.409321],[76.525285,9.409373],[76.525196,9.409373],[76.524939,9.409349],[76.524648,9.409322],[76.524322,9.409291],[76.523965,9.409056],[76.523346,9.408712],[76.522853,9.408614],[76.522078,9.408594],[76.521786,9.408623],[76.521037,9.408675],[76.520487,9.408657],[76.52,9.40872],[76.519542,9.408863],[76.51939,9.409083],[76.519278,9.409736],[76.518974,9.409804],[76.518699,9.409589],[76.518333,9.409434],[76.517923,9.409179],[76.517657,9.408959],[76.517248,9.408636],[76.516999,9.408414],[76.517002,9.408326],[76.516834,9.408144],[76.516743,9.40801],[76.516581,9.4078],[76.516475,9.407735],[76.516281,9.407603],[76.516101,9.407499],[76.516189,9.407227],[76.516331,9.407],[76.516274,9.406965],[76.516062,9.406867],[76.515866,9.406768],[76.515874,9.406578],[76.515889,9.406199],[76.515971,9.405796],[76.516144,9.405427],[76.516069,9.405029],[76.515731,9.404251],[76.515815,9.404139],[76.516062,9.403888],[76.516157,9.403522],[76.516135,9.403153],[76.516229,9.402736],[76.516056,9.402704],[76.516075,9.402633],[76.516183,9.402144],[76.516206,9.401703],[76.516282,9.401363],[76.51633,9.400943],[76.516339,9.400654],[76.516331,9.400424],[76.516274,9.400089],[76.516165,9.399825],[76.516256,9.399767],[76.516378,9.399427],[76.516607,9.398971],[76.516805,9.398631],[76.517031,9.398362],[76.517282,9.398161],[76.517552,9.398062],[76.51769,9.398065],[76.517984,9.398102],[76.518249,9.398234],[76.518524,9.398263],[76.518751,9.398242],[76.518972,9.398174],[76.519097,9.398104],[76.519348,9.39804],[76.519627,9.398011],[76.519847,9.398059],[76.520069,9.398031],[76.520205,9.398018],[76.520373,9.398023],[76.520751,9.39805],[76.520946,9.397985],[76.521036,9.397921],[76.521217,9.397909],[76.521291,9.397815],[76.521411,9.39774],[76.521519,9.397718],[76.521596,9.397628],[76.52178,9.397551],[76.522075,9.397439],[76.522248,9.397409],[76.522411,9.397342],[76.522684,9.397216],[76.522807,9.397194],[76.522976,9.397155],[76.523195,9.397117],[76.523395,9.397016],[76.523614,9.396999],[76.523859,9.396988],[76.523973,9.396985],[76.524113,9.397008],[76.524401,9.397141],[76.524616,9.397266],[76.524715,9.397324],[76.525024,9.397429],[76.525122,9.397462],[76.525501,9.397567],[76.525853,9.39764],[76.526046,9.397742],[76.526118,9.397837],[76.52641,9.397898],[76.526786,9.397975],[76.527177,9.39814],[76.52745,9.398279],[76.527511,9.39835],[76.527717,9.398592],[76.527922,9.3989],[76.528139,9.399021],[76.528365,9.398997],[76.528564,9.398696],[76.528552,9.39858],[76.528543,9.398384],[76.528543,9.398233],[76.528241,9.397659],[76.528065,9.397168],[76.528008,9.396784],[76.528004,9.396632],[76.528035,9.396386]]]},\"properties\":{\"Created_Da\":\"2024-10-17T12:27:10.421Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"vineetha\",\"Ward_Name\":\"MEPRAL PADINJARU\",\"Ward_No\":\"1\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.53909,9.405029],[76.53893,9.405264],[76.538712,9.40535],[76.538473,9.405182],[76.53823,9.404878],[76.538003,9.40468],[76.537789,9.404631],[76.537484,9.404649],[76.537299,9.404801],[76.537255,9.40494],[76.537296,9.405146],[76.537365,9.40539],[76.537484,9.40561],[76.53755,9.405962],[76.5375,9.40626],[76.537353,9.406525],[76.537035,9.406688],[76.536841,9.40685],[76.536655,9.407039],[76.536569,9.407247],[76.536591,9.407444],[76.53669,9.407691],[76.536757,9.40798],[76.536747,9.408155],[76.536669,9.408268],[76.536384,9.408454],[76.536179,9.408572],[76.536124,9.40893],[76.536136,9.409293],[76.536259,9.409594],[76.536426,9.409718],[76.536729,9.409755],[76.537037,9.410023],[76.537222,9.410243],[76.536989,9.410272],[76.53646,9.410129],[76.535926,9.409967],[76.535289,9.409777],[76.534716,9.409545],[76.534283,9.409415],[76.533865,9.409306],[76.533423,9.409186],[76.53298,9.409109],[76.532273,9.409112],[76.531823,9.409128],[76.531282,9.409158],[76.530665,9.4092],[76.530069,9.409222],[76.529568,9.409182],[76.52904,9.409105],[76.52849,9.409058],[76.528057,9.40904],[76.52754,9.409007],[76.527137,9.40891],[76.526916,9.408872],[76.526977,9.408632],[76.526966,9.408418],[76.527044,9.408118],[76.527068,9.408014],[76.527035,9.407722],[76.52706,9.407536],[76.527026,9.407297],[76.526901,9.406856],[76.527106,9.406811],[76.527223,9.406846],[76.527315,9.406859],[76.527414,9.406836],[76.527488,9.406754],[76.527807,9.406672],[76.52797,9.406634],[76.528158,9.406574],[76.528215,9.406379],[76.528309,9.406331],[76.528313,9.406226],[76.528529,9.406194],[76.528771,9.406168],[76.528938,9.406162],[76.528905,9.405999],[76.528979,9.40563],[76.528773,9.405497],[76.528768,9.405393],[76.528669,9.40526],[76.528639,9.405074],[76.5285,9.404795],[76.528633,9.404393],[76.52856,9.403805],[76.528866,9.403725],[76.528735,9.403229],[76.528617,9.402774],[76.528896,9.402692],[76.529032,9.402648],[76.529173,9.40261],[76.529318,9.402555],[76.5295,9.402481],[76.529729,9.402324],[76.529906,9.402217],[76.530045,9.40214],[76.530266,9.402164],[76.530494,9.402126],[76.530604,9.402111],[76.53072,9.402069],[76.530842,9.402023],[76.531038,9.401962],[76.531206,9.401991],[76.531345,9.401998],[76.531498,9.401939],[76.531697,9.401885],[76.531803,9.401872],[76.531869,9.401758],[76.531824,9.401609],[76.531803,9.401464],[76.531985,9.401361],[76.532142,9.401338],[76.532317,9.401342],[76.532595,9.40131],[76.532668,9.401206],[76.53269,9.401099],[76.532701,9.401007],[76.532722,9.400884],[76.532849,9.400868],[76.533003,9.400844],[76.53312,9.400805],[76.533219,9.400582],[76.533109,9.400444],[76.533039,9.400304],[76.533039,9.399994],[76.533,9.399856],[76.532955,9.399765],[76.532843,9.39962],[76.532924,9.399423],[76.533039,9.399261],[76.533085,9.399092],[76.533129,9.398921],[76.533321,9.398855],[76.533474,9.398877],[76.533698,9.398936],[76.533949,9.399044],[76.534027,9.399094],[76.534336,9.399009],[76.534604,9.398951],[76.534643,9.398738],[76.534672,9.398506],[76.534637,9.398337],[76.534511,9.398195],[76.534416,9.397977],[76.534355,9.397875],[76.534163,9.397781],[76.534098,9.397695],[76.534018,9.397466],[76.533969,9.397174],[76.534011,9.39678],[76.533913,9.396686],[76.533792,9.39669],[76.533626,9.396678],[76.533577,9.39647],[76.533499,9.396341],[76.533397,9.396078],[76.533254,9.395761],[76.533182,9.3956],[76.533155,9.395505],[76.533127,9.39541],[76.533071,9.395119],[76.533232,9.395042],[76.533625,9.394989],[76.534005,9.39493],[76.534244,9.39485],[76.534487,9.394693],[76.534851,9.394462],[76.535366,9.394583],[76.53561,9.394579],[76.535789,9.394499],[76.535913,9.394491],[76.536187,9.394499],[76.536458,9.394502],[76.536603,9.394443],[76.536796,9.394249],[76.537077,9.393978],[76.537285,9.393788],[76.537731,9.393447],[76.537902,9.393391],[76.538099,9.39339],[76.538401,9.393401],[76.538706,9.393356],[76.539013,9.393256],[76.539321,9.393103],[76.539707,9.392861],[76.539992,9.392778],[76.540208,9.392788],[76.540726,9.392881],[76.54096,9.392927],[76.541092,9.392921],[76.541221,9.392877],[76.541414,9.39283],[76.541752,9.392762],[76.542259,9.392651],[76.54226,9.392975],[76.542326,9.393401],[76.54234,9.393722],[76.542348,9.393915],[76.54223,9.393983],[76.542196,9.39411],[76.542116,9.394315],[76.542027,9.394472],[76.54178,9.394588],[76.541757,9.394812],[76.541802,9.395031],[76.541932,9.395277],[76.542041,9.395561],[76.541951,9.395692],[76.541782,9.395721],[76.541789,9.39586],[76.541911,9.396042],[76.542035,9.396198],[76.542155,9.396437],[76.542166,9.3966],[76.542157,9.396798],[76.542244,9.396898],[76.542467,9.396975],[76.542995,9.397096],[76.543381,9.397186],[76.543469,9.397019],[76.543732,9.396924],[76.543791,9.396665],[76.543911,9.396562],[76.544194,9.3967],[76.544344,9.396837],[76.544379,9.396951],[76.544459,9.397067],[76.544583,9.397085],[76.544752,9.397052],[76.544862,9.396922],[76.545078,9.396636],[76.545362,9.396493],[76.545699,9.396392],[76.545972,9.396311],[76.54623,9.396109],[76.54647,9.395827],[76.546567,9.395769],[76.546828,9.395832],[76.546847,9.396401],[76.546667,9.396436],[76.546391,9.396535],[76.546134,9.396653],[76.546105,9.396902],[76.546002,9.397131],[76.545709,9.397107],[76.545447,9.397166],[76.545378,9.397251],[76.545345,9.397455],[76.545199,9.397497],[76.545116,9.397818],[76.544825,9.397851],[76.54462,9.397801],[76.544475,9.397733],[76.544426,9.397818],[76.544357,9.398049],[76.544235,9.398462],[76.544112,9.398697],[76.544022,9.399161],[76.544003,9.399384],[76.543965,9.399561],[76.543779,9.399701],[76.543666,9.399922],[76.543409,9.399862],[76.543373,9.400091],[76.543347,9.400258],[76.54324,9.400661],[76.543059,9.40061],[76.542891,9.40061],[76.542768,9.400664],[76.542582,9.400661],[76.542399,9.400614],[76.542197,9.400537],[76.542058,9.400549],[76.541951,9.400653],[76.541798,9.400807],[76.541721,9.400882],[76.541628,9.400951],[76.541519,9.401035],[76.541375,9.401127],[76.541253,9.401197],[76.541056,9.401378],[76.541065,9.401549],[76.541086,9.401715],[76.541024,9.401912],[76.540942,9.40222],[76.540888,9.402429],[76.540809,9.402661],[76.540777,9.402763],[76.540739,9.402927],[76.54066,9.403],[76.540599,9.403083],[76.540563,9.40322],[76.540531,9.403413],[76.540514,9.4036],[76.540546,9.403746],[76.540573,9.40395],[76.540563,9.404185],[76.540555,9.404475],[76.540523,9.404704],[76.540522,9.404874],[76.540607,9.40512],[76.540764,9.405335],[76.540789,9.40551],[76.540438,9.405515],[76.540285,9.405571],[76.540164,9.405603],[76.540006,9.405619],[76.539804,9.405649],[76.539593,9.405485],[76.539531,9.405413],[76.539402,9.405484],[76.539336,9.405411],[76.539214,9.40523],[76.53909,9.405029]]]},\"properties\":{\"Created_Da\":\"2024-10-22T11:40:11.010Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"MEPRAL KIZHAKKU\",\"Ward_No\":\"2\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.562628,9.398444],[76.562125,9.398448],[76.562005,9.398447],[76.561705,9.398446],[76.561555,9.398457],[76.561406,9.398468],[76.561232,9.398455],[76.561079,9.398449],[76.56097,9.398444],[76.560675,9.398456],[76.56049,9.398473],[76.560293,9.398605],[76.560094,9.398677],[76.559919,9.398797],[76.559863,9.398605],[76.559354,9.398697],[76.559176,9.398745],[76.559055,9.398763],[76.558674,9.39882],[76.557835,9.398986],[76.556698,9.399269],[76.555917,9.399636],[76.555631,9.399867],[76.555103,9.400254],[76.554797,9.400401],[76.554693,9.40045],[76.554641,9.400571],[76.554446,9.401026],[76.554371,9.401512],[76.55415,9.401854],[76.554052,9.402265],[76.554052,9.402659],[76.554056,9.402777],[76.553692,9.402903],[76.55274,9.403308],[76.552176,9.403544],[76.551884,9.403715],[76.551488,9.403802],[76.551051,9.40381],[76.550645,9.403776],[76.550218,9.403723],[76.550211,9.403508],[76.55018,9.403104],[76.550165,9.40291],[76.550156,9.402805],[76.550143,9.402648],[76.550116,9.402367],[76.55011,9.402085],[76.550083,9.401884],[76.550069,9.401778],[76.550031,9.40152],[76.550006,9.401237],[76.549956,9.40097],[76.549926,9.400712],[76.549914,9.400602],[76.549872,9.40011],[76.549817,9.399633],[76.549805,9.399538],[76.549755,9.399168],[76.549685,9.398735],[76.549685,9.398627],[76.549753,9.398338],[76.549822,9.397995],[76.549863,9.397707],[76.549896,9.397499],[76.549948,9.39722],[76.550077,9.396787],[76.550045,9.39654],[76.5503,9.396585],[76.550462,9.396618],[76.550614,9.396568],[76.550706,9.396531],[76.550829,9.396471],[76.550972,9.396331],[76.551052,9.396193],[76.551198,9.396207],[76.551267,9.396282],[76.551317,9.396464],[76.551377,9.396632],[76.55143,9.396827],[76.551674,9.396768],[76.552015,9.39677],[76.552175,9.396719],[76.55231,9.39661],[76.552382,9.396415],[76.552443,9.396313],[76.55258,9.396223],[76.55293,9.396076],[76.553257,9.396003],[76.553473,9.395975],[76.553728,9.395995],[76.554041,9.395977],[76.554329,9.395905],[76.554575,9.395821],[76.554758,9.395762],[76.554878,9.395646],[76.554974,9.395585],[76.555086,9.395512],[76.555248,9.395454],[76.555386,9.395408],[76.555577,9.395318],[76.555789,9.39527],[76.555916,9.39529],[76.556033,9.395303],[76.556246,9.395239],[76.556471,9.395109],[76.55665,9.395089],[76.556791,9.395149],[76.556802,9.395009],[76.556784,9.394903],[76.556767,9.394803],[76.556731,9.39471],[76.556767,9.394605],[76.556823,9.394485],[76.556786,9.394332],[76.556824,9.394139],[76.556948,9.394056],[76.557105,9.393974],[76.557204,9.393856],[76.557386,9.393616],[76.557404,9.393468],[76.557415,9.393336],[76.55747,9.393246],[76.557754,9.392926],[76.557922,9.392814],[76.558112,9.392699],[76.558266,9.392574],[76.558441,9.392534],[76.558858,9.392452],[76.559223,9.392402],[76.559314,9.392389],[76.559305,9.392136],[76.55925,9.391901],[76.559207,9.391695],[76.559197,9.391405],[76.559327,9.391118],[76.5595,9.391054],[76.559632,9.391006],[76.559691,9.390871],[76.559998,9.39072],[76.560121,9.390956],[76.560208,9.39106],[76.560314,9.391185],[76.560519,9.391407],[76.560952,9.391946],[76.561127,9.392163],[76.561265,9.392142],[76.561374,9.392399],[76.561302,9.39251],[76.561168,9.39255],[76.561166,9.392872],[76.561165,9.392994],[76.561079,9.393036],[76.561002,9.393151],[76.56084,9.393099],[76.560704,9.393114],[76.560686,9.393217],[76.560643,9.393461],[76.560652,9.393642],[76.560493,9.393708],[76.560455,9.393883],[76.560437,9.393972],[76.560508,9.394283],[76.560499,9.394424],[76.560491,9.394557],[76.56051,9.394705],[76.560577,9.394914],[76.560786,9.395262],[76.560645,9.395325],[76.560534,9.395383],[76.560447,9.395558],[76.56051,9.395771],[76.560811,9.395725],[76.561017,9.39551],[76.561153,9.3955],[76.561281,9.39549],[76.561486,9.39547],[76.561919,9.395503],[76.562051,9.39533],[76.562111,9.395192],[76.562219,9.395094],[76.56251,9.394834],[76.562913,9.394563],[76.562979,9.394427],[76.563291,9.394208],[76.563461,9.394414],[76.563669,9.394648],[76.563762,9.394863],[76.563796,9.394958],[76.563786,9.395168],[76.563781,9.395269],[76.563777,9.395361],[76.563768,9.395557],[76.563773,9.39567],[76.563777,9.395784],[76.563751,9.396101],[76.563688,9.39625],[76.563639,9.396384],[76.56353,9.396555],[76.563502,9.396729],[76.563442,9.397102],[76.563463,9.397532],[76.56339,9.397963],[76.563376,9.398117],[76.563356,9.398342],[76.563197,9.39838],[76.562862,9.398461],[76.562762,9.398453],[76.562628,9.398444]]]},\"properties\":{\"Created_Da\":\"2024-10-22T09:57:04.793Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"CHALAKKUZHY\",\"Ward_No\":\"6\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.546939,9.375853],[76.547083,9.375911],[76.54721,9.375901],[76.547423,9.375957],[76.547497,9.375833],[76.547634,9.375715],[76.547757,9.375685],[76.547876,9.375641],[76.54817,9.375584],[76.548322,9.375565],[76.548447,9.375549],[76.548632,9.375542],[76.548635,9.375692],[76.548693,9.375847],[76.5489,9.375844],[76.549048,9.375842],[76.549283,9.375865],[76.549531,9.37589],[76.549546,9.376003],[76.549572,9.376166],[76.549596,9.37629],[76.549611,9.376389],[76.549797,9.376395],[76.55011,9.376405],[76.550545,9.376153],[76.550711,9.376056],[76.550629,9.375827],[76.55088,9.375701],[76.551397,9.375639],[76.551387,9.375735],[76.551387,9.375879],[76.551926,9.376125],[76.552118,9.376095],[76.552584,9.376023],[76.552721,9.376143],[76.552847,9.376253],[76.553013,9.376422],[76.553306,9.376812],[76.553334,9.37701],[76.553365,9.377232],[76.553545,9.377427],[76.553789,9.377639],[76.553905,9.378106],[76.553905,9.378514],[76.553917,9.378608],[76.553748,9.379109],[76.553543,9.379006],[76.553345,9.378888],[76.553069,9.378747],[76.552896,9.378882],[76.55273,9.379081],[76.552574,9.379266],[76.552339,9.37935],[76.551924,9.379479],[76.551589,9.379586],[76.551249,9.379703],[76.551014,9.379741],[76.550774,9.37981],[76.550629,9.379929],[76.550453,9.379908],[76.550221,9.3799],[76.549945,9.379899],[76.549766,9.379887],[76.549556,9.379827],[76.549337,9.379732],[76.54913,9.379615],[76.549002,9.379542],[76.548786,9.379541],[76.54847,9.379569],[76.548228,9.379569],[76.547919,9.379509],[76.547643,9.379515],[76.547257,9.379557],[76.54695,9.379567],[76.546746,9.379572],[76.546587,9.379572],[76.546317,9.379578],[76.546171,9.379544],[76.545974,9.37947],[76.545775,9.379427],[76.545554,9.379415],[76.545411,9.379395],[76.545314,9.379431],[76.545066,9.37951],[76.544846,9.379611],[76.544753,9.379636],[76.5446,9.379678],[76.544285,9.379737],[76.54407,9.379759],[76.543812,9.379774],[76.543576,9.379828],[76.543522,9.379554],[76.543433,9.379108],[76.543293,9.3787],[76.543228,9.378386],[76.543208,9.378292],[76.542799,9.378363],[76.542377,9.378497],[76.541988,9.378558],[76.54156,9.378571],[76.54101,9.378584],[76.540479,9.378578],[76.539942,9.378589],[76.539769,9.378598],[76.539251,9.378627],[76.539113,9.378625],[76.538912,9.378546],[76.538935,9.378454],[76.538973,9.37837],[76.539066,9.378161],[76.539069,9.377906],[76.539071,9.377793],[76.539019,9.377464],[76.538984,9.377357],[76.538875,9.37725],[76.538669,9.377049],[76.538544,9.376927],[76.538699,9.376817],[76.538774,9.376763],[76.538882,9.376623],[76.538928,9.376808],[76.53917,9.376792],[76.539383,9.376763],[76.539663,9.376759],[76.539807,9.376757],[76.540053,9.37677],[76.540254,9.376833],[76.540457,9.376752],[76.54059,9.376683],[76.540673,9.376605],[76.540786,9.376498],[76.540865,9.376392],[76.541035,9.376367],[76.54117,9.376334],[76.541611,9.376202],[76.54178,9.376151],[76.54199,9.376109],[76.542159,9.376076],[76.542273,9.376053],[76.542421,9.376024],[76.542513,9.376006],[76.542532,9.376126],[76.542552,9.376242],[76.542585,9.376397],[76.54263,9.376603],[76.543094,9.37651],[76.543243,9.376518],[76.543431,9.376453],[76.54353,9.376436],[76.543692,9.376408],[76.544089,9.376341],[76.544351,9.376267],[76.544559,9.376209],[76.544882,9.376109],[76.544972,9.376082],[76.545387,9.375927],[76.545643,9.375904],[76.545607,9.375741],[76.546006,9.375613],[76.546143,9.375685],[76.546082,9.375814],[76.546133,9.375957],[76.546344,9.37587],[76.546675,9.375857],[76.546939,9.375853]]]},\"properties\":{\"Created_Da\":\"2024-10-21T13:01:41.597Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"PERINGARA\",\"Ward_No\":\"11\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.553748,9.379109],[76.553564,9.379461],[76.55341,9.379754],[76.553299,9.379892],[76.553181,9.380007],[76.553026,9.380159],[76.552735,9.380376],[76.552523,9.380526],[76.552368,9.380596],[76.552183,9.380683],[76.551788,9.380801],[76.551551,9.381173],[76.551391,9.381644],[76.551162,9.381842],[76.550573,9.381972],[76.550478,9.382138],[76.550355,9.382595],[76.550403,9.382915],[76.550417,9.383306],[76.550425,9.383527],[76.550094,9.383745],[76.549813,9.383969],[76.549505,9.384216],[76.549431,9.384285],[76.549337,9.384447],[76.549199,9.384658],[76.549184,9.384763],[76.549236,9.385004],[76.549473,9.385152],[76.549721,9.385083],[76.549853,9.385047],[76.550097,9.384802],[76.550253,9.384708],[76.550347,9.384651],[76.550647,9.384508],[76.550829,9.38461],[76.550986,9.384699],[76.551144,9.384837],[76.551287,9.385001],[76.551357,9.385102],[76.551365,9.385399],[76.551382,9.385707],[76.551368,9.385843],[76.551343,9.386074],[76.551331,9.386179],[76.551247,9.386572],[76.551074,9.386679],[76.550551,9.387005],[76.550339,9.387165],[76.550188,9.387279],[76.54981,9.387281],[76.549629,9.387274],[76.549515,9.387269],[76.548805,9.387339],[76.548579,9.387413],[76.548421,9.387565],[76.548072,9.387593],[76.547699,9.387541],[76.547489,9.387561],[76.547237,9.38759],[76.547024,9.387633],[76.546966,9.387513],[76.546859,9.387143],[76.546532,9.38717],[76.546377,9.38711],[76.546404,9.386984],[76.546427,9.386829],[76.546526,9.386695],[76.546613,9.386558],[76.546674,9.386401],[76.546751,9.386347],[76.546894,9.386318],[76.547022,9.386305],[76.547135,9.386269],[76.547219,9.386154],[76.547314,9.3861],[76.547487,9.386059],[76.547693,9.386015],[76.547789,9.385895],[76.547806,9.385657],[76.547811,9.385539],[76.547823,9.385257],[76.547867,9.385113],[76.547946,9.38485],[76.547978,9.384664],[76.547861,9.384669],[76.547616,9.384682],[76.547344,9.384706],[76.547126,9.384582],[76.546909,9.38447],[76.546721,9.384368],[76.54655,9.384283],[76.546291,9.384174],[76.546177,9.384108],[76.546087,9.384019],[76.545898,9.383912],[76.545578,9.38385],[76.545487,9.383794],[76.545362,9.383776],[76.545177,9.383816],[76.545061,9.38384],[76.544915,9.383812],[76.544764,9.383795],[76.544618,9.383714],[76.544554,9.383517],[76.544544,9.383401],[76.544531,9.38324],[76.544485,9.383011],[76.544382,9.382749],[76.544284,9.382494],[76.54425,9.382407],[76.544191,9.382225],[76.544121,9.382014],[76.544053,9.381872],[76.544042,9.381735],[76.544036,9.381431],[76.54393,9.381308],[76.543881,9.381059],[76.543833,9.380899],[76.543745,9.380606],[76.5437,9.380481],[76.543666,9.380308],[76.543636,9.380153],[76.543595,9.37998],[76.543576,9.379828],[76.543812,9.379774],[76.54407,9.379759],[76.544285,9.379737],[76.5446,9.379678],[76.544753,9.379636],[76.544846,9.379611],[76.545066,9.37951],[76.545314,9.379431],[76.545411,9.379395],[76.545554,9.379415],[76.545775,9.379427],[76.545974,9.37947],[76.546171,9.379544],[76.546317,9.379578],[76.546587,9.379572],[76.546746,9.379572],[76.54695,9.379567],[76.547257,9.379557],[76.547643,9.379515],[76.547919,9.379509],[76.548228,9.379569],[76.54847,9.379569],[76.548786,9.379541],[76.549002,9.379542],[76.54913,9.379615],[76.549337,9.379732],[76.549556,9.379827],[76.549766,9.379887],[76.549945,9.379899],[76.550221,9.3799],[76.550453,9.379908],[76.550629,9.379929],[76.550774,9.37981],[76.551014,9.379741],[76.551249,9.379703],[76.551589,9.379586],[76.551924,9.379479],[76.552339,9.37935],[76.552574,9.379266],[76.55273,9.379081],[76.552896,9.378882],[76.553069,9.378747],[76.553345,9.378888],[76.553543,9.379006],[76.553748,9.379109]]]},\"properties\":{\"Created_Da\":\"2024-10-18T07:11:18.120Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"shyma\",\"Ward_Name\":\"PERINGARA KIZHAKKU\",\"Ward_No\":\"10\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.549487,9.409845],[76.549963,9.409788],[76.549957,9.409883],[76.54995,9.410042],[76.549936,9.410248],[76.549921,9.410413],[76.549908,9.410565],[76.549888,9.410834],[76.549883,9.410955],[76.550077,9.411023],[76.550209,9.41105],[76.550438,9.411118],[76.550645,9.411192],[76.550753,9.411231],[76.550969,9.41127],[76.551118,9.411293],[76.551277,9.411312],[76.551446,9.411327],[76.551563,9.411141],[76.551628,9.411045],[76.55183,9.411025],[76.551987,9.411009],[76.55209,9.410872],[76.552188,9.410593],[76.552273,9.41042],[76.552521,9.410444],[76.552646,9.410464],[76.553013,9.410541],[76.553335,9.410544],[76.553806,9.410546],[76.554092,9.410552],[76.55422,9.410555],[76.554475,9.410627],[76.554318,9.410837],[76.553941,9.411511],[76.55373,9.411998],[76.553625,9.41224],[76.553415,9.412726],[76.55331,9.412967],[76.553256,9.413104],[76.553125,9.413395],[76.553017,9.413651],[76.552917,9.413864],[76.552844,9.413954],[76.55278,9.414034],[76.552653,9.414219],[76.553163,9.414461],[76.553386,9.414567],[76.55374,9.414667],[76.553855,9.414597],[76.554085,9.414459],[76.554204,9.414388],[76.554433,9.41425],[76.554563,9.414115],[76.554859,9.413662],[76.554946,9.413534],[76.555024,9.413276],[76.555385,9.413177],[76.555327,9.41359],[76.555316,9.413825],[76.555051,9.416392],[76.554928,9.417571],[76.554749,9.41937],[76.554704,9.420332],[76.554644,9.420719],[76.55414,9.421414],[76.553691,9.422132],[76.553734,9.422523],[76.553786,9.42393],[76.553663,9.423892],[76.553391,9.42387],[76.553164,9.423934],[76.553112,9.423937],[76.553067,9.42396],[76.553025,9.423974],[76.552922,9.42396],[76.552773,9.42402],[76.552685,9.423889],[76.552352,9.42388],[76.552239,9.423719],[76.552225,9.42357],[76.552072,9.423558],[76.55187,9.423444],[76.551575,9.42341],[76.551291,9.423364],[76.551122,9.423341],[76.550949,9.423372],[76.550798,9.423395],[76.550666,9.422924],[76.550354,9.422906],[76.550224,9.422912],[76.550071,9.422884],[76.549969,9.422919],[76.549857,9.422952],[76.549748,9.422835],[76.549565,9.422541],[76.549436,9.422295],[76.549316,9.422141],[76.549195,9.422047],[76.549133,9.42204],[76.549076,9.422042],[76.548883,9.422021],[76.548694,9.42201],[76.548671,9.422051],[76.548616,9.422128],[76.548528,9.422255],[76.548443,9.42233],[76.548307,9.42246],[76.548283,9.422506],[76.548138,9.422532],[76.547971,9.422541],[76.547871,9.422532],[76.547514,9.422479],[76.547374,9.422473],[76.547239,9.422487],[76.547194,9.422488],[76.547041,9.422521],[76.546881,9.42255],[76.546704,9.422594],[76.546566,9.422626],[76.546419,9.422653],[76.546295,9.422679],[76.546233,9.422683],[76.546113,9.422688],[76.546041,9.422666],[76.545771,9.422713],[76.545421,9.422756],[76.544833,9.422801],[76.54436,9.42288],[76.544007,9.422945],[76.543721,9.422769],[76.543573,9.422635],[76.543576,9.422429],[76.543633,9.422017],[76.543686,9.42178],[76.543693,9.421685],[76.543716,9.421576],[76.543823,9.421165],[76.543849,9.421055],[76.543728,9.420897],[76.54359,9.420861],[76.543569,9.420804],[76.543316,9.420773],[76.543008,9.420739],[76.542832,9.420756],[76.542628,9.420784],[76.542462,9.420794],[76.542335,9.420798],[76.542154,9.420796],[76.54202,9.420787],[76.541809,9.420755],[76.541708,9.420817],[76.541572,9.420766],[76.541603,9.420292],[76.541601,9.419782],[76.541416,9.419749],[76.541274,9.419718],[76.541134,9.419547],[76.5411,9.419407],[76.541179,9.41935],[76.541292,9.41925],[76.54139,9.419191],[76.541508,9.419154],[76.541753,9.419114],[76.541984,9.419174],[76.542169,9.419186],[76.542438,9.41919],[76.542545,9.419191],[76.542799,9.419236],[76.542915,9.419271],[76.543166,9.419284],[76.543376,9.419226],[76.543255,9.418754],[76.54337,9.418666],[76.543589,9.418462],[76.543676,9.418254],[76.543833,9.418111],[76.543999,9.417803],[76.543853,9.417273],[76.543629,9.416939],[76.543498,9.416866],[76.54339,9.416807],[76.543236,9.416628],[76.54308,9.416273],[76.543061,9.416113],[76.543034,9.41589],[76.542964,9.415518],[76.542968,9.415248],[76.542983,9.415076],[76.542927,9.415001],[76.542783,9.41495],[76.542665,9.41492],[76.542686,9.414746],[76.542623,9.414669],[76.542474,9.414629],[76.542345,9.414594],[76.542208,9.414557],[76.542065,9.414514],[76.541931,9.414489],[76.541833,9.414469],[76.541739,9.41445],[76.541643,9.414443],[76.541478,9.414443],[76.5413,9.414431],[76.541138,9.414401],[76.540957,9.414362],[76.540866,9.414341],[76.540708,9.414314],[76.540561,9.414223],[76.540635,9.413992],[76.540709,9.413829],[76.540806,9.413658],[76.54087,9.413554],[76.54093,9.41347],[76.541044,9.413371],[76.541127,9.413297],[76.541201,9.413183],[76.54131,9.413063],[76.541374,9.412982],[76.541487,9.412903],[76.5416,9.41282],[76.541736,9.412749],[76.541855,9.412706],[76.541971,9.412667],[76.542075,9.412624],[76.542205,9.412575],[76.542325,9.412552],[76.542459,9.412529],[76.542577,9.412508],[76.542716,9.412492],[76.542839,9.41247],[76.542957,9.412463],[76.543098,9.41236],[76.543182,9.412286],[76.543303,9.412223],[76.543433,9.412172],[76.543558,9.412127],[76.543668,9.412075],[76.543748,9.412013],[76.543829,9.41191],[76.544019,9.411867],[76.544102,9.411776],[76.544096,9.411649],[76.544075,9.411487],[76.544064,9.411256],[76.544057,9.41107],[76.543973,9.410939],[76.544004,9.410838],[76.544109,9.410668],[76.544131,9.41057],[76.544144,9.410463],[76.544153,9.410341],[76.544203,9.410161],[76.544252,9.409955],[76.544247,9.409838],[76.54422,9.409665],[76.544163,9.409444],[76.5444,9.409345],[76.544522,9.409218],[76.544806,9.409168],[76.544912,9.409051],[76.54502,9.409071],[76.545195,9.409129],[76.545294,9.409184],[76.545554,9.409214],[76.54562,9.408979],[76.545779,9.408784],[76.545868,9.408762],[76.546,9.408793],[76.546249,9.408851],[76.546378,9.40888],[76.54676,9.408965],[76.547014,9.409019],[76.547203,9.409063],[76.547383,9.409106],[76.547731,9.409186],[76.54789,9.409224],[76.548017,9.409254],[76.548254,9.409318],[76.548441,9.409423],[76.548628,9.409555],[76.548709,9.409611],[76.548967,9.409804],[76.549157,9.409864],[76.549312,9.409872],[76.549487,9.409845]]]},\"properties\":{\"Created_Da\":\"2024-10-16T12:27:36.679Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"IDINIJILLAM\",\"Ward_No\":\"4\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.534685,9.383768],[76.534561,9.383473],[76.534457,9.383319],[76.534492,9.383227],[76.534214,9.383205],[76.534241,9.383049],[76.534362,9.382892],[76.534667,9.382603],[76.535203,9.382593],[76.535443,9.382646],[76.535545,9.382636],[76.535685,9.382622],[76.535833,9.382545],[76.53596,9.382388],[76.536093,9.382205],[76.536158,9.382116],[76.536268,9.381966],[76.536313,9.381861],[76.536358,9.381754],[76.536299,9.381525],[76.536277,9.381341],[76.536355,9.381146],[76.53659,9.381004],[76.536908,9.380967],[76.537032,9.380964],[76.53723,9.38096],[76.537375,9.380993],[76.537534,9.38103],[76.537853,9.380984],[76.537953,9.380884],[76.538053,9.38069],[76.538081,9.380572],[76.538156,9.380438],[76.538181,9.380237],[76.538264,9.380125],[76.53832,9.379938],[76.538395,9.37969],[76.538485,9.379387],[76.538581,9.379104],[76.538755,9.378931],[76.53888,9.37867],[76.538912,9.378546],[76.539113,9.378625],[76.539251,9.378627],[76.539769,9.378598],[76.539942,9.378589],[76.540479,9.378578],[76.54101,9.378584],[76.54156,9.378571],[76.541988,9.378558],[76.542377,9.378497],[76.542799,9.378363],[76.543208,9.378292],[76.543228,9.378386],[76.543293,9.3787],[76.543433,9.379108],[76.543522,9.379554],[76.543576,9.379828],[76.543595,9.37998],[76.543636,9.380153],[76.543666,9.380308],[76.5437,9.380481],[76.543745,9.380606],[76.543833,9.380899],[76.543881,9.381059],[76.54393,9.381308],[76.544036,9.381431],[76.544042,9.381735],[76.544053,9.381872],[76.544121,9.382014],[76.544191,9.382225],[76.54425,9.382407],[76.544284,9.382494],[76.544382,9.382749],[76.544485,9.383011],[76.544531,9.38324],[76.544544,9.383401],[76.544554,9.383517],[76.544618,9.383714],[76.544426,9.383739],[76.544323,9.383752],[76.543991,9.383739],[76.543898,9.383736],[76.543742,9.383731],[76.543479,9.383755],[76.54317,9.383821],[76.54279,9.383921],[76.542375,9.38409],[76.542129,9.384218],[76.541949,9.384333],[76.541821,9.38444],[76.5417,9.384554],[76.541538,9.384674],[76.541697,9.384971],[76.541725,9.38507],[76.5416,9.385213],[76.541622,9.385301],[76.541765,9.385701],[76.541896,9.385993],[76.541827,9.386068],[76.541729,9.386095],[76.541694,9.386183],[76.541719,9.386331],[76.541814,9.386477],[76.541862,9.386624],[76.541902,9.386804],[76.542005,9.386893],[76.541984,9.387027],[76.542041,9.38711],[76.542198,9.387115],[76.542437,9.387191],[76.542755,9.387191],[76.542931,9.38712],[76.543037,9.387089],[76.543166,9.387132],[76.54329,9.387237],[76.543401,9.387365],[76.543508,9.387751],[76.543265,9.38782],[76.543119,9.387862],[76.542955,9.387927],[76.542728,9.38808],[76.542505,9.388254],[76.542255,9.388359],[76.541793,9.388666],[76.541599,9.388719],[76.541378,9.388857],[76.541246,9.388578],[76.541137,9.388349],[76.540905,9.388301],[76.540811,9.38823],[76.540744,9.388024],[76.540745,9.387798],[76.540597,9.387687],[76.540566,9.387534],[76.540594,9.387304],[76.540722,9.387145],[76.540875,9.387035],[76.540827,9.38684],[76.540795,9.386443],[76.540769,9.386144],[76.540761,9.38582],[76.540596,9.385691],[76.540583,9.385443],[76.540527,9.385225],[76.540272,9.385223],[76.540044,9.385221],[76.53979,9.385219],[76.539564,9.38525],[76.539314,9.385234],[76.539046,9.385235],[76.538897,9.385207],[76.538627,9.385142],[76.538392,9.385065],[76.538194,9.385023],[76.538058,9.385025],[76.537929,9.384986],[76.537841,9.38496],[76.537715,9.384976],[76.537551,9.385016],[76.537021,9.385117],[76.536702,9.385276],[76.535955,9.385585],[76.535574,9.385671],[76.535258,9.385725],[76.535089,9.3857],[76.534991,9.385715],[76.534746,9.385731],[76.534653,9.385571],[76.534521,9.385233],[76.534575,9.385012],[76.534664,9.384935],[76.534724,9.384668],[76.534706,9.384335],[76.534683,9.383922],[76.534685,9.383768]]]},\"properties\":{\"Created_Da\":\"2024-10-22T11:20:28.509Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"KARACKAL THEKKU\",\"Ward_No\":\"12\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.516165,9.399825],[76.515459,9.40028],[76.514975,9.400521],[76.514727,9.400512],[76.513822,9.400298],[76.513218,9.400226],[76.512955,9.400237],[76.512551,9.400318],[76.512261,9.400463],[76.51196,9.40048],[76.511958,9.400002],[76.512101,9.399545],[76.512192,9.399273],[76.512081,9.398451],[76.511911,9.39775],[76.511709,9.397119],[76.511453,9.396221],[76.511398,9.395689],[76.511348,9.395144],[76.511319,9.394514],[76.511843,9.394382],[76.511978,9.394318],[76.511837,9.394004],[76.511811,9.393885],[76.511879,9.393525],[76.511844,9.393189],[76.511846,9.392792],[76.511796,9.392612],[76.511761,9.392489],[76.511721,9.392319],[76.51192,9.392045],[76.512235,9.391686],[76.512599,9.391482],[76.51281,9.391396],[76.512989,9.391398],[76.513195,9.39134],[76.513455,9.391257],[76.51369,9.391194],[76.513803,9.391124],[76.513867,9.391001],[76.514083,9.390822],[76.514188,9.390744],[76.514368,9.390635],[76.514618,9.390655],[76.514768,9.390549],[76.514926,9.390388],[76.515249,9.390274],[76.515441,9.390112],[76.515691,9.39],[76.515927,9.389855],[76.515993,9.38976],[76.516064,9.389561],[76.51618,9.389395],[76.516366,9.389229],[76.516483,9.389089],[76.516903,9.388854],[76.51719,9.388733],[76.517561,9.388598],[76.517738,9.388475],[76.517956,9.388277],[76.518388,9.388054],[76.518643,9.388137],[76.518897,9.388134],[76.519257,9.388138],[76.519657,9.388082],[76.519945,9.388008],[76.520143,9.387894],[76.520495,9.387552],[76.520591,9.387418],[76.520914,9.387273],[76.521229,9.38712],[76.521392,9.386977],[76.521503,9.386824],[76.521777,9.386699],[76.521999,9.38658],[76.522133,9.386625],[76.5223,9.386617],[76.522466,9.386608],[76.522792,9.38657],[76.523053,9.38658],[76.523508,9.386586],[76.523805,9.386543],[76.524095,9.386402],[76.524441,9.386148],[76.524638,9.386019],[76.524928,9.385909],[76.525171,9.385846],[76.525873,9.386045],[76.5261,9.386159],[76.526179,9.386323],[76.526216,9.386438],[76.526446,9.386442],[76.526899,9.386478],[76.527215,9.386535],[76.527838,9.386723],[76.528044,9.386775],[76.528218,9.386796],[76.528399,9.386759],[76.528527,9.386669],[76.528561,9.387],[76.528573,9.387374],[76.528561,9.387637],[76.52859,9.387864],[76.528732,9.388088],[76.528787,9.388344],[76.52886,9.388666],[76.528844,9.389039],[76.528748,9.389434],[76.528624,9.389786],[76.52839,9.39024],[76.528285,9.390533],[76.528281,9.390706],[76.528374,9.391067],[76.528518,9.391456],[76.528619,9.391823],[76.528715,9.391776],[76.528903,9.39173],[76.52905,9.391678],[76.529134,9.391556],[76.529177,9.39146],[76.529367,9.391311],[76.529638,9.391193],[76.529784,9.390938],[76.530017,9.39064],[76.530035,9.390389],[76.530212,9.390216],[76.530525,9.389904],[76.530866,9.390083],[76.531105,9.390199],[76.531412,9.390564],[76.531318,9.390903],[76.531234,9.391395],[76.531206,9.391564],[76.531179,9.391749],[76.531139,9.392034],[76.530578,9.39292],[76.529344,9.393433],[76.528923,9.39392],[76.528699,9.394389],[76.52852,9.394753],[76.528346,9.395372],[76.528282,9.395599],[76.528137,9.396182],[76.528035,9.396386],[76.528004,9.396632],[76.528008,9.396784],[76.528065,9.397168],[76.528241,9.397659],[76.528543,9.398233],[76.528543,9.398384],[76.528552,9.39858],[76.528564,9.398696],[76.528365,9.398997],[76.528139,9.399021],[76.527922,9.3989],[76.527717,9.398592],[76.527511,9.39835],[76.52745,9.398279],[76.527177,9.39814],[76.526786,9.397975],[76.52641,9.397898],[76.526118,9.397837],[76.526046,9.397742],[76.525853,9.39764],[76.525501,9.397567],[76.525122,9.397462],[76.525024,9.397429],[76.524715,9.397324],[76.524616,9.397266],[76.524401,9.397141],[76.524113,9.397008],[76.523973,9.396985],[76.523859,9.396988],[76.523614,9.396999],[76.523395,9.397016],[76.523195,9.397117],[76.522976,9.397155],[76.522807,9.397194],[76.522684,9.397216],[76.522411,9.397342],[76.522248,9.397409],[76.522075,9.397439],[76.52178,9.397551],[76.521596,9.397628],[76.521519,9.397718],[76.521411,9.39774],[76.521291,9.397815],[76.521217,9.397909],[76.521036,9.397921],[76.520946,9.397985],[76.520751,9.39805],[76.520373,9.398023],[76.520205,9.398018],[76.520069,9.398031],[76.519847,9.398059],[76.519627,9.398011],[76.519348,9.39804],[76.519097,9.398104],[76.518972,9.398174],[76.518751,9.398242],[76.518524,9.398263],[76.518249,9.398234],[76.517984,9.398102],[76.51769,9.398065],[76.517552,9.398062],[76.517282,9.398161],[76.517031,9.398362],[76.516805,9.398631],[76.516607,9.398971],[76.516378,9.399427],[76.516256,9.399767],[76.516165,9.399825]]]},\"properties\":{\"Created_Da\":\"2024-10-21T10:06:30.687Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"sreejith\",\"Ward_Name\":\"CHATHENKARY VADAKKU\",\"Ward_No\":\"16\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.541753,9.419114],[76.541508,9.419154],[76.54139,9.419191],[76.541292,9.41925],[76.541179,9.41935],[76.5411,9.419407],[76.541134,9.419547],[76.541274,9.419718],[76.541416,9.419749],[76.541601,9.419782],[76.541603,9.420292],[76.541572,9.420766],[76.541441,9.420716],[76.540535,9.42067],[76.540423,9.420598],[76.540754,9.419948],[76.540952,9.419756],[76.541021,9.41923],[76.54108,9.419026],[76.541273,9.418691],[76.541678,9.417976],[76.541326,9.4178],[76.540937,9.417369],[76.54056,9.417216],[76.540436,9.416954],[76.540185,9.416867],[76.540256,9.416569],[76.53981,9.416427],[76.539611,9.416286],[76.539649,9.415755],[76.53972,9.415563],[76.539637,9.415433],[76.539431,9.414989],[76.539205,9.414222],[76.538765,9.414176],[76.537987,9.413899],[76.537502,9.413869],[76.537505,9.414161],[76.537254,9.414463],[76.537288,9.414689],[76.537128,9.414946],[76.536857,9.415311],[76.536691,9.416165],[76.536795,9.41659],[76.536481,9.416676],[76.536068,9.416687],[76.535678,9.416764],[76.53539,9.416719],[76.534734,9.416821],[76.534642,9.416374],[76.533753,9.416458],[76.532885,9.416849],[76.532745,9.416226],[76.531734,9.416321],[76.530906,9.416539],[76.530658,9.416432],[76.530631,9.41568],[76.530789,9.414699],[76.531009,9.414155],[76.531118,9.413268],[76.52974,9.413385],[76.529596,9.413117],[76.528642,9.413024],[76.527426,9.412933],[76.526316,9.413596],[76.526123,9.412643],[76.525753,9.41169],[76.52578,9.411391],[76.525618,9.411187],[76.525635,9.410258],[76.525494,9.409321],[76.525796,9.409247],[76.525992,9.409206],[76.526209,9.409123],[76.526447,9.40904],[76.526847,9.408944],[76.526916,9.408872],[76.527137,9.40891],[76.52754,9.409007],[76.528057,9.40904],[76.52849,9.409058],[76.52904,9.409105],[76.529568,9.409182],[76.530069,9.409222],[76.530665,9.4092],[76.531282,9.409158],[76.531823,9.409128],[76.532273,9.409112],[76.53298,9.409109],[76.533423,9.409186],[76.533865,9.409306],[76.534283,9.409415],[76.534716,9.409545],[76.535289,9.409777],[76.535926,9.409967],[76.53646,9.410129],[76.536989,9.410272],[76.537222,9.410243],[76.537037,9.410023],[76.536729,9.409755],[76.536426,9.409718],[76.536259,9.409594],[76.536136,9.409293],[76.536124,9.40893],[76.536179,9.408572],[76.536384,9.408454],[76.536669,9.408268],[76.536747,9.408155],[76.536757,9.40798],[76.53669,9.407691],[76.536591,9.407444],[76.536569,9.407247],[76.536655,9.407039],[76.536841,9.40685],[76.537035,9.406688],[76.537353,9.406525],[76.5375,9.40626],[76.53755,9.405962],[76.537484,9.40561],[76.537365,9.40539],[76.537296,9.405146],[76.537255,9.40494],[76.537299,9.404801],[76.537484,9.404649],[76.537789,9.404631],[76.538003,9.40468],[76.53823,9.404878],[76.538473,9.405182],[76.538712,9.40535],[76.53893,9.405264],[76.53909,9.405029],[76.539214,9.40523],[76.539336,9.405411],[76.539402,9.405484],[76.539531,9.405413],[76.539593,9.405485],[76.539804,9.405649],[76.540006,9.405619],[76.540164,9.405603],[76.540285,9.405571],[76.540438,9.405515],[76.540789,9.40551],[76.540764,9.405335],[76.540607,9.40512],[76.540522,9.404874],[76.540523,9.404704],[76.540555,9.404475],[76.540563,9.404185],[76.540573,9.40395],[76.540546,9.403746],[76.540514,9.4036],[76.540531,9.403413],[76.540563,9.40322],[76.540599,9.403083],[76.54066,9.403],[76.540739,9.402927],[76.540777,9.402763],[76.540809,9.402661],[76.540888,9.402429],[76.540942,9.40222],[76.541024,9.401912],[76.541086,9.401715],[76.541065,9.401549],[76.541056,9.401378],[76.541253,9.401197],[76.541375,9.401127],[76.541519,9.401035],[76.541628,9.400951],[76.541721,9.400882],[76.541798,9.400807],[76.541951,9.400653],[76.542058,9.400549],[76.542197,9.400537],[76.542399,9.400614],[76.542582,9.400661],[76.542768,9.400664],[76.542891,9.40061],[76.543059,9.40061],[76.54324,9.400661],[76.543422,9.400728],[76.543555,9.400761],[76.54376,9.400793],[76.543925,9.400746],[76.544101,9.400721],[76.544271,9.400727],[76.544464,9.40101],[76.544493,9.401205],[76.544503,9.401413],[76.544542,9.401622],[76.544656,9.401791],[76.54467,9.401934],[76.544729,9.402045],[76.54485,9.402072],[76.545051,9.402057],[76.545102,9.401907],[76.54521,9.40181],[76.545396,9.401671],[76.545539,9.40163],[76.545626,9.40154],[76.545694,9.401346],[76.545818,9.401184],[76.545912,9.401176],[76.54609,9.401167],[76.546236,9.401182],[76.546368,9.401221],[76.546652,9.401269],[76.546748,9.401309],[76.546942,9.401244],[76.547039,9.401151],[76.547106,9.401067],[76.547248,9.40102],[76.547573,9.401062],[76.547761,9.401101],[76.547839,9.400949],[76.547774,9.400743],[76.547782,9.40051],[76.547883,9.400342],[76.548122,9.400408],[76.548267,9.400448],[76.54863,9.400497],[76.548852,9.400518],[76.549051,9.400438],[76.549154,9.40043],[76.54928,9.400421],[76.549358,9.400472],[76.549472,9.400581],[76.549571,9.400587],[76.549719,9.400568],[76.549914,9.400602],[76.549926,9.400712],[76.549956,9.40097],[76.550006,9.401237],[76.550031,9.40152],[76.550069,9.401778],[76.550083,9.401884],[76.55011,9.402085],[76.550116,9.402367],[76.550143,9.402648],[76.550156,9.402805],[76.550165,9.40291],[76.55018,9.403104],[76.550211,9.403508],[76.550218,9.403723],[76.550237,9.40418],[76.550286,9.40462],[76.550266,9.405018],[76.5502,9.405369],[76.550179,9.405733],[76.55014,9.406192],[76.550142,9.406532],[76.550132,9.406897],[76.550115,9.407202],[76.550091,9.407701],[76.550053,9.408199],[76.55002,9.408733],[76.549996,9.409335],[76.549963,9.409788],[76.549487,9.409845],[76.549312,9.409872],[76.549157,9.409864],[76.548967,9.409804],[76.548709,9.409611],[76.548628,9.409555],[76.548441,9.409423],[76.548254,9.409318],[76.548017,9.409254],[76.54789,9.409224],[76.547731,9.409186],[76.547383,9.409106],[76.547203,9.409063],[76.547014,9.409019],[76.54676,9.408965],[76.546378,9.40888],[76.546249,9.408851],[76.546,9.408793],[76.545868,9.408762],[76.545779,9.408784],[76.54562,9.408979],[76.545554,9.409214],[76.545294,9.409184],[76.545195,9.409129],[76.54502,9.409071],[76.544912,9.409051],[76.544806,9.409168],[76.544522,9.409218],[76.5444,9.409345],[76.544163,9.409444],[76.54422,9.409665],[76.544247,9.409838],[76.544252,9.409955],[76.544203,9.410161],[76.544153,9.410341],[76.544144,9.410463],[76.544131,9.41057],[76.544109,9.410668],[76.544004,9.410838],[76.543973,9.410939],[76.544057,9.41107],[76.544064,9.411256],[76.544075,9.411487],[76.544096,9.411649],[76.544102,9.411776],[76.544019,9.411867],[76.543829,9.41191],[76.543748,9.412013],[76.543668,9.412075],[76.543558,9.412127],[76.543433,9.412172],[76.543303,9.412223],[76.543182,9.412286],[76.543098,9.41236],[76.542957,9.412463],[76.542839,9.41247],[76.542716,9.412492],[76.542577,9.412508],[76.542459,9.412529],[76.542325,9.412552],[76.542205,9.412575],[76.542075,9.412624],[76.541971,9.412667],[76.541855,9.412706],[76.541736,9.412749],[76.5416,9.41282],[76.541487,9.412903],[76.541374,9.412982],[76.54131,9.413063],[76.541201,9.413183],[76.541127,9.413297],[76.541044,9.413371],[76.54093,9.41347],[76.54087,9.413554],[76.540806,9.413658],[76.540709,9.413829],[76.540635,9.413992],[76.540561,9.414223],[76.540708,9.414314],[76.540866,9.414341],[76.540957,9.414362],[76.541138,9.414401],[76.5413,9.414431],[76.541478,9.414443],[76.541643,9.414443],[76.541739,9.41445],[76.541833,9.414469],[76.541931,9.414489],[76.542065,9.414514],[76.542208,9.414557],[76.542345,9.414594],[76.542474,9.414629],[76.542623,9.414669],[76.542686,9.414746],[76.542665,9.41492],[76.542783,9.41495],[76.542927,9.415001],[76.542983,9.415076],[76.542968,9.415248],[76.542964,9.415518],[76.543034,9.41589],[76.543061,9.416113],[76.54308,9.416273],[76.543236,9.416628],[76.54339,9.416807],[76.543498,9.416866],[76.543629,9.416939],[76.543853,9.417273],[76.543999,9.417803],[76.543833,9.418111],[76.543676,9.418254],[76.543589,9.418462],[76.54337,9.418666],[76.543255,9.418754],[76.543376,9.419226],[76.543166,9.419284],[76.542915,9.419271],[76.542799,9.419236],[76.542545,9.419191],[76.542438,9.41919],[76.542169,9.419186],[76.541984,9.419174],[76.541753,9.419114]]]},\"properties\":{\"Created_Da\":\"2024-10-17T14:07:18.394Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"vineetha\",\"Ward_Name\":\"ALUMTHURUTHY\",\"Ward_No\":\"3\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.541809,9.420755],[76.541896,9.420888],[76.541708,9.420817],[76.541809,9.420755]]]},\"properties\":{\"Created_Da\":\"2024-10-17T14:07:18.394Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"vineetha\",\"Ward_Name\":\"ALUMTHURUTHY\",\"Ward_No\":\"3\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.54223,9.393983],[76.542348,9.393915],[76.54234,9.393722],[76.542326,9.393401],[76.54226,9.392975],[76.542259,9.392651],[76.54254,9.392555],[76.542849,9.392453],[76.543131,9.392416],[76.54355,9.392385],[76.543956,9.392429],[76.544167,9.392457],[76.544134,9.392171],[76.544151,9.392011],[76.544228,9.391837],[76.544274,9.391674],[76.544413,9.391596],[76.544605,9.391518],[76.544785,9.391426],[76.544919,9.391337],[76.545087,9.391276],[76.545226,9.391277],[76.545318,9.391216],[76.545371,9.391094],[76.545396,9.390825],[76.545827,9.390648],[76.546033,9.390557],[76.546364,9.390522],[76.546439,9.3904],[76.546562,9.390205],[76.546859,9.39031],[76.546968,9.390428],[76.547196,9.390496],[76.547433,9.390553],[76.547512,9.390285],[76.547532,9.390127],[76.54755,9.389945],[76.547479,9.389738],[76.547371,9.389563],[76.547294,9.389215],[76.54723,9.388882],[76.547194,9.38872],[76.547156,9.388428],[76.547139,9.388167],[76.547107,9.38804],[76.547076,9.387914],[76.546886,9.387931],[76.54665,9.387944],[76.54655,9.387932],[76.546443,9.387919],[76.546191,9.387953],[76.545895,9.388041],[76.54554,9.388127],[76.545153,9.388177],[76.545063,9.388194],[76.544672,9.388272],[76.544426,9.388314],[76.544332,9.38833],[76.544068,9.388362],[76.543859,9.388352],[76.543605,9.388407],[76.543323,9.388466],[76.543065,9.388559],[76.5428,9.388686],[76.542526,9.388789],[76.542422,9.388717],[76.542383,9.388543],[76.542255,9.388359],[76.542505,9.388254],[76.542728,9.38808],[76.542955,9.387927],[76.543119,9.387862],[76.543265,9.38782],[76.543508,9.387751],[76.543401,9.387365],[76.54329,9.387237],[76.543166,9.387132],[76.543037,9.387089],[76.542931,9.38712],[76.542755,9.387191],[76.542437,9.387191],[76.542198,9.387115],[76.542041,9.38711],[76.541984,9.387027],[76.542005,9.386893],[76.541902,9.386804],[76.541862,9.386624],[76.541814,9.386477],[76.541719,9.386331],[76.541694,9.386183],[76.541729,9.386095],[76.541827,9.386068],[76.541896,9.385993],[76.541765,9.385701],[76.541622,9.385301],[76.5416,9.385213],[76.541725,9.38507],[76.541697,9.384971],[76.541538,9.384674],[76.5417,9.384554],[76.541821,9.38444],[76.541949,9.384333],[76.542129,9.384218],[76.542375,9.38409],[76.54279,9.383921],[76.54317,9.383821],[76.543479,9.383755],[76.543742,9.383731],[76.543898,9.383736],[76.543991,9.383739],[76.544323,9.383752],[76.544426,9.383739],[76.544618,9.383714],[76.544764,9.383795],[76.544915,9.383812],[76.545061,9.38384],[76.545177,9.383816],[76.545362,9.383776],[76.545487,9.383794],[76.545578,9.38385],[76.545898,9.383912],[76.546087,9.384019],[76.546177,9.384108],[76.546291,9.384174],[76.54655,9.384283],[76.546721,9.384368],[76.546909,9.38447],[76.547126,9.384582],[76.547344,9.384706],[76.547616,9.384682],[76.547861,9.384669],[76.547978,9.384664],[76.547946,9.38485],[76.547867,9.385113],[76.547823,9.385257],[76.547811,9.385539],[76.547806,9.385657],[76.547789,9.385895],[76.547693,9.386015],[76.547487,9.386059],[76.547314,9.3861],[76.547219,9.386154],[76.547135,9.386269],[76.547022,9.386305],[76.546894,9.386318],[76.546751,9.386347],[76.546674,9.386401],[76.546613,9.386558],[76.546526,9.386695],[76.546427,9.386829],[76.546404,9.386984],[76.546377,9.38711],[76.546532,9.38717],[76.546859,9.387143],[76.546966,9.387513],[76.547024,9.387633],[76.547237,9.38759],[76.547489,9.387561],[76.547699,9.387541],[76.548072,9.387593],[76.548421,9.387565],[76.548579,9.387413],[76.548805,9.387339],[76.549515,9.387269],[76.549629,9.387274],[76.54981,9.387281],[76.550188,9.387279],[76.550168,9.387467],[76.550287,9.387701],[76.550064,9.387848],[76.549954,9.388008],[76.549711,9.38803],[76.549616,9.388086],[76.54959,9.388212],[76.549569,9.388317],[76.549656,9.388499],[76.549716,9.388625],[76.549757,9.388941],[76.549705,9.389171],[76.549645,9.38944],[76.549432,9.389612],[76.549442,9.389821],[76.549249,9.389734],[76.549097,9.389798],[76.548982,9.389833],[76.54884,9.389987],[76.548741,9.390052],[76.548311,9.390021],[76.548112,9.390239],[76.548098,9.390368],[76.548153,9.390699],[76.548169,9.390854],[76.548186,9.391028],[76.548234,9.391183],[76.548268,9.391276],[76.548328,9.391441],[76.548372,9.39153],[76.548487,9.391725],[76.548246,9.391807],[76.548078,9.391794],[76.547765,9.391816],[76.547649,9.391839],[76.547552,9.391899],[76.547422,9.392072],[76.547329,9.392193],[76.547505,9.392273],[76.547651,9.392307],[76.547795,9.392376],[76.547853,9.392497],[76.547915,9.39264],[76.547917,9.392751],[76.547921,9.392947],[76.548,9.393128],[76.54797,9.393257],[76.547881,9.393331],[76.547829,9.393412],[76.547868,9.393542],[76.547929,9.393747],[76.547939,9.393855],[76.547753,9.393872],[76.547608,9.393868],[76.547513,9.394025],[76.547381,9.394086],[76.547241,9.394075],[76.547128,9.394114],[76.547012,9.394255],[76.54691,9.394443],[76.546792,9.394691],[76.546742,9.394804],[76.546753,9.394951],[76.546621,9.395014],[76.546684,9.39516],[76.546738,9.395284],[76.54679,9.395425],[76.546866,9.395574],[76.546953,9.395783],[76.546828,9.395832],[76.546567,9.395769],[76.54647,9.395827],[76.54623,9.396109],[76.545972,9.396311],[76.545699,9.396392],[76.545362,9.396493],[76.545078,9.396636],[76.544862,9.396922],[76.544752,9.397052],[76.544583,9.397085],[76.544459,9.397067],[76.544379,9.396951],[76.544344,9.396837],[76.544194,9.3967],[76.543911,9.396562],[76.543791,9.396665],[76.543732,9.396924],[76.543469,9.397019],[76.543381,9.397186],[76.542995,9.397096],[76.542467,9.396975],[76.542244,9.396898],[76.542157,9.396798],[76.542166,9.3966],[76.542155,9.396437],[76.542035,9.396198],[76.541911,9.396042],[76.541789,9.39586],[76.541782,9.395721],[76.541951,9.395692],[76.542041,9.395561],[76.541932,9.395277],[76.541802,9.395031],[76.541757,9.394812],[76.54178,9.394588],[76.542027,9.394472],[76.542116,9.394315],[76.542196,9.39411],[76.54223,9.393983]]]},\"properties\":{\"Created_Da\":\"2024-10-22T11:06:49.607Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"KARACKAL\",\"Ward_No\":\"8\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.531105,9.390199],[76.530866,9.390083],[76.530525,9.389904],[76.530212,9.390216],[76.530035,9.390389],[76.530017,9.39064],[76.529784,9.390938],[76.529638,9.391193],[76.529367,9.391311],[76.529177,9.39146],[76.529134,9.391556],[76.52905,9.391678],[76.528903,9.39173],[76.528715,9.391776],[76.528619,9.391823],[76.528518,9.391456],[76.528374,9.391067],[76.528281,9.390706],[76.528285,9.390533],[76.52839,9.39024],[76.528624,9.389786],[76.528748,9.389434],[76.528844,9.389039],[76.52886,9.388666],[76.528787,9.388344],[76.528732,9.388088],[76.52859,9.387864],[76.528561,9.387637],[76.528573,9.387374],[76.528561,9.387],[76.528527,9.386669],[76.528399,9.386759],[76.528218,9.386796],[76.528044,9.386775],[76.527838,9.386723],[76.527215,9.386535],[76.526899,9.386478],[76.526446,9.386442],[76.526216,9.386438],[76.526179,9.386323],[76.5261,9.386159],[76.525873,9.386045],[76.525171,9.385846],[76.524928,9.385909],[76.524638,9.386019],[76.524441,9.386148],[76.524095,9.386402],[76.523805,9.386543],[76.523508,9.386586],[76.523053,9.38658],[76.522792,9.38657],[76.522466,9.386608],[76.5223,9.386617],[76.522133,9.386625],[76.521999,9.38658],[76.521957,9.386474],[76.52159,9.38637],[76.5207,9.386651],[76.520557,9.386386],[76.521308,9.3861],[76.521584,9.385489],[76.521552,9.385358],[76.521458,9.385099],[76.521565,9.385011],[76.521727,9.384758],[76.521328,9.384051],[76.52155,9.383944],[76.521862,9.383847],[76.522443,9.383882],[76.522588,9.383851],[76.523105,9.383817],[76.523336,9.383868],[76.523777,9.383987],[76.524186,9.383887],[76.524574,9.383642],[76.525183,9.383336],[76.52562,9.383287],[76.525746,9.383369],[76.525894,9.38342],[76.526126,9.383428],[76.52606,9.383096],[76.525897,9.382842],[76.52572,9.38274],[76.525698,9.382566],[76.525593,9.382314],[76.525447,9.382039],[76.525181,9.381554],[76.525075,9.381274],[76.5248,9.380663],[76.524513,9.380393],[76.524473,9.380208],[76.524345,9.380013],[76.524225,9.379583],[76.524071,9.379251],[76.524481,9.379299],[76.524609,9.379441],[76.524907,9.37937],[76.525044,9.379344],[76.525253,9.379272],[76.525423,9.379255],[76.5255,9.379333],[76.525618,9.379343],[76.525833,9.379281],[76.526301,9.379239],[76.526413,9.379244],[76.526554,9.379264],[76.526705,9.379318],[76.526832,9.379305],[76.527011,9.379302],[76.527196,9.379356],[76.527394,9.379449],[76.527561,9.379492],[76.527577,9.379658],[76.527557,9.379833],[76.527568,9.380042],[76.527598,9.380309],[76.527688,9.380398],[76.527855,9.380624],[76.527975,9.38085],[76.528332,9.380813],[76.52829,9.380947],[76.528228,9.381286],[76.528362,9.381552],[76.528502,9.381941],[76.528746,9.382152],[76.528727,9.382711],[76.528683,9.383049],[76.528608,9.383239],[76.528514,9.383363],[76.528504,9.38349],[76.528795,9.383563],[76.528936,9.383655],[76.528973,9.383825],[76.52907,9.384039],[76.529224,9.384343],[76.52941,9.384425],[76.529495,9.384591],[76.529555,9.384938],[76.52961,9.38509],[76.529894,9.384918],[76.530455,9.384888],[76.530869,9.384988],[76.531208,9.384873],[76.531365,9.384732],[76.531587,9.384554],[76.531673,9.384428],[76.531944,9.384232],[76.532248,9.384005],[76.532494,9.383915],[76.53261,9.383797],[76.532708,9.383822],[76.532979,9.383821],[76.533314,9.38378],[76.533614,9.383839],[76.533755,9.383757],[76.533769,9.383647],[76.533876,9.383655],[76.534137,9.383753],[76.534088,9.383456],[76.534214,9.383205],[76.534492,9.383227],[76.534457,9.383319],[76.534561,9.383473],[76.534685,9.383768],[76.534683,9.383922],[76.534706,9.384335],[76.534724,9.384668],[76.534664,9.384935],[76.534575,9.385012],[76.534521,9.385233],[76.534653,9.385571],[76.534746,9.385731],[76.534991,9.385715],[76.535089,9.3857],[76.535258,9.385725],[76.535574,9.385671],[76.535955,9.385585],[76.536702,9.385276],[76.537021,9.385117],[76.537551,9.385016],[76.537715,9.384976],[76.537841,9.38496],[76.537929,9.384986],[76.538058,9.385025],[76.538194,9.385023],[76.538392,9.385065],[76.538627,9.385142],[76.538897,9.385207],[76.539046,9.385235],[76.539314,9.385234],[76.539564,9.38525],[76.53979,9.385219],[76.540044,9.385221],[76.540272,9.385223],[76.540527,9.385225],[76.540583,9.385443],[76.540596,9.385691],[76.540761,9.38582],[76.540769,9.386144],[76.540795,9.386443],[76.540827,9.38684],[76.540875,9.387035],[76.540722,9.387145],[76.540594,9.387304],[76.540566,9.387534],[76.540597,9.387687],[76.540745,9.387798],[76.540744,9.388024],[76.540811,9.38823],[76.540905,9.388301],[76.541137,9.388349],[76.541246,9.388578],[76.541378,9.388857],[76.541292,9.388918],[76.541157,9.389096],[76.540952,9.389276],[76.540784,9.389332],[76.540614,9.389327],[76.540472,9.389268],[76.54032,9.389116],[76.540086,9.388934],[76.539757,9.388866],[76.539413,9.388849],[76.539152,9.388905],[76.538977,9.388959],[76.538815,9.388892],[76.53863,9.388895],[76.538546,9.389002],[76.538485,9.389215],[76.538444,9.389375],[76.538343,9.389421],[76.538024,9.389319],[76.537768,9.389235],[76.537506,9.389156],[76.537286,9.389034],[76.536872,9.388973],[76.536662,9.389035],[76.536422,9.389096],[76.536193,9.389204],[76.536119,9.389331],[76.536067,9.389571],[76.536015,9.389837],[76.535983,9.389939],[76.535743,9.390008],[76.535576,9.390027],[76.535405,9.389952],[76.535323,9.389806],[76.535212,9.389529],[76.535105,9.389362],[76.534911,9.389413],[76.534748,9.3895],[76.534408,9.389495],[76.534218,9.389581],[76.534025,9.389751],[76.533757,9.389653],[76.533575,9.389536],[76.533167,9.389645],[76.532863,9.389545],[76.532346,9.389485],[76.532009,9.389386],[76.531807,9.389361],[76.531639,9.389451],[76.53154,9.389583],[76.531531,9.389767],[76.531579,9.390034],[76.531522,9.390165],[76.531412,9.390564],[76.531105,9.390199]]]},\"properties\":{\"Created_Da\":\"2024-10-22T11:59:02.039Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Remarks\":\"Chathenkary Town\",\"Surveyor\":\"ashitha\",\"Ward_Name\":\"CHATHENKARY TOWN\",\"Ward_No\":\"13\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.533071,9.395119],[76.532843,9.395171],[76.532632,9.395218],[76.532445,9.395261],[76.532158,9.395293],[76.5318,9.395384],[76.531111,9.395528],[76.530815,9.395581],[76.530541,9.395626],[76.530266,9.395673],[76.529968,9.395742],[76.529773,9.395789],[76.529684,9.39581],[76.529518,9.395845],[76.529279,9.395895],[76.529029,9.39595],[76.528819,9.395994],[76.528596,9.396039],[76.528262,9.396129],[76.528137,9.396182],[76.528282,9.395599],[76.528346,9.395372],[76.52852,9.394753],[76.528699,9.394389],[76.528923,9.39392],[76.529344,9.393433],[76.530578,9.39292],[76.531139,9.392034],[76.531179,9.391749],[76.531206,9.391564],[76.531234,9.391395],[76.531318,9.390903],[76.531412,9.390564],[76.531522,9.390165],[76.531579,9.390034],[76.531531,9.389767],[76.53154,9.389583],[76.531639,9.389451],[76.531807,9.389361],[76.532009,9.389386],[76.532346,9.389485],[76.532863,9.389545],[76.533167,9.389645],[76.533575,9.389536],[76.533757,9.389653],[76.534025,9.389751],[76.534218,9.389581],[76.534408,9.389495],[76.534748,9.3895],[76.534911,9.389413],[76.535105,9.389362],[76.535212,9.389529],[76.535323,9.389806],[76.535405,9.389952],[76.535576,9.390027],[76.535743,9.390008],[76.535983,9.389939],[76.536015,9.389837],[76.536067,9.389571],[76.536119,9.389331],[76.536193,9.389204],[76.536422,9.389096],[76.536662,9.389035],[76.536872,9.388973],[76.537286,9.389034],[76.537506,9.389156],[76.537768,9.389235],[76.538024,9.389319],[76.538343,9.389421],[76.538444,9.389375],[76.538485,9.389215],[76.538546,9.389002],[76.53863,9.388895],[76.538815,9.388892],[76.538977,9.388959],[76.539152,9.388905],[76.539413,9.388849],[76.539757,9.388866],[76.540086,9.388934],[76.54032,9.389116],[76.540472,9.389268],[76.540614,9.389327],[76.540784,9.389332],[76.540952,9.389276],[76.541157,9.389096],[76.541292,9.388918],[76.541378,9.388857],[76.541599,9.388719],[76.541793,9.388666],[76.542255,9.388359],[76.542383,9.388543],[76.542422,9.388717],[76.542526,9.388789],[76.5428,9.388686],[76.543065,9.388559],[76.543323,9.388466],[76.543605,9.388407],[76.543859,9.388352],[76.544068,9.388362],[76.544332,9.38833],[76.544426,9.388314],[76.544672,9.388272],[76.545063,9.388194],[76.545153,9.388177],[76.54554,9.388127],[76.545895,9.388041],[76.546191,9.387953],[76.546443,9.387919],[76.54655,9.387932],[76.54665,9.387944],[76.546886,9.387931],[76.547076,9.387914],[76.547107,9.38804],[76.547139,9.388167],[76.547156,9.388428],[76.547194,9.38872],[76.54723,9.388882],[76.547294,9.389215],[76.547371,9.389563],[76.547479,9.389738],[76.54755,9.389945],[76.547532,9.390127],[76.547512,9.390285],[76.547433,9.390553],[76.547196,9.390496],[76.546968,9.390428],[76.546859,9.39031],[76.546562,9.390205],[76.546439,9.3904],[76.546364,9.390522],[76.546033,9.390557],[76.545827,9.390648],[76.545396,9.390825],[76.545371,9.391094],[76.545318,9.391216],[76.545226,9.391277],[76.545087,9.391276],[76.544919,9.391337],[76.544785,9.391426],[76.544605,9.391518],[76.544413,9.391596],[76.544274,9.391674],[76.544228,9.391837],[76.544151,9.392011],[76.544134,9.392171],[76.544167,9.392457],[76.543956,9.392429],[76.54355,9.392385],[76.543131,9.392416],[76.542849,9.392453],[76.54254,9.392555],[76.542259,9.392651],[76.541752,9.392762],[76.541414,9.39283],[76.541221,9.392877],[76.541092,9.392921],[76.54096,9.392927],[76.540726,9.392881],[76.540208,9.392788],[76.539992,9.392778],[76.539707,9.392861],[76.539321,9.393103],[76.539013,9.393256],[76.538706,9.393356],[76.538401,9.393401],[76.538099,9.39339],[76.537902,9.393391],[76.537731,9.393447],[76.537285,9.393788],[76.537077,9.393978],[76.536796,9.394249],[76.536603,9.394443],[76.536458,9.394502],[76.536187,9.394499],[76.535913,9.394491],[76.535789,9.394499],[76.53561,9.394579],[76.535366,9.394583],[76.534851,9.394462],[76.534487,9.394693],[76.534244,9.39485],[76.534005,9.39493],[76.533625,9.394989],[76.533232,9.395042],[76.533071,9.395119]]]},\"properties\":{\"Created_Da\":\"2024-10-19T09:48:12.632Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Peringara\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9400085144\",\"Surveyor\":\"vineetha\",\"Ward_Name\":\"MEPRAL\",\"Ward_No\":\"9\",\"Mandal\":\"Thiruvalla\"}}]}");
@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.648111,9.405767],[76.647934,9.405801],[76.647651,9.405878],[76.647335,9.405822],[76.647198,9.405799],[76.647095,9.405772],[76.646854,9.405713],[76.646615,9.405655],[76.646449,9.405509],[76.646289,9.405429],[76.645923,9.405094],[76.645762,9.404946],[76.645654,9.404832],[76.64521,9.404264],[76.644924,9.4039],[76.644546,9.403662],[76.644399,9.40357],[76.644279,9.403397],[76.643979,9.403149],[76.643632,9.402862],[76.64342,9.402697],[76.643331,9.402624],[76.642833,9.402272],[76.642233,9.401846],[76.642078,9.401789],[76.64163,9.401504],[76.64146,9.401489],[76.641069,9.401345],[76.640797,9.401245],[76.640398,9.401069],[76.640194,9.401057],[76.639885,9.400991],[76.63942,9.400921],[76.639244,9.400895],[76.63888,9.400798],[76.638335,9.400608],[76.638163,9.400547],[76.638064,9.400504],[76.637844,9.400166],[76.637715,9.399956],[76.637702,9.399719],[76.637727,9.399174],[76.637761,9.398629],[76.637785,9.398239],[76.63781,9.39784],[76.637837,9.397396],[76.637883,9.397008],[76.637952,9.396636],[76.63821,9.396409],[76.63834,9.396296],[76.638516,9.396198],[76.638646,9.396126],[76.638826,9.396023],[76.63907,9.395874],[76.639365,9.395695],[76.640058,9.395449],[76.64041,9.395318],[76.640763,9.395187],[76.640883,9.395155],[76.641047,9.395081],[76.641164,9.395046],[76.641628,9.394778],[76.641888,9.394572],[76.642156,9.394359],[76.642355,9.394202],[76.642604,9.394005],[76.642733,9.393825],[76.643186,9.394207],[76.643384,9.394261],[76.643827,9.394382],[76.644256,9.394515],[76.644675,9.394646],[76.64521,9.39486],[76.645457,9.394919],[76.645982,9.395043],[76.64614,9.395101],[76.646234,9.39513],[76.646435,9.395167],[76.646748,9.39518],[76.646874,9.395175],[76.647008,9.395212],[76.647147,9.395249],[76.647287,9.395285],[76.647537,9.395359],[76.647631,9.395398],[76.64776,9.39523],[76.647989,9.395096],[76.648268,9.394892],[76.648817,9.394617],[76.648925,9.394507],[76.649067,9.394438],[76.649468,9.39399],[76.649542,9.393929],[76.649666,9.393834],[76.6498,9.393793],[76.649889,9.393762],[76.65006,9.393714],[76.65017,9.39368],[76.650249,9.394026],[76.650232,9.394204],[76.650238,9.394354],[76.650164,9.394543],[76.650057,9.394666],[76.649935,9.394746],[76.649843,9.394861],[76.649752,9.394922],[76.649628,9.394989],[76.649493,9.3951],[76.649448,9.395272],[76.64938,9.39545],[76.649296,9.395701],[76.649188,9.395929],[76.649012,9.396335],[76.649018,9.396426],[76.649112,9.39671],[76.649107,9.39692],[76.649112,9.397062],[76.64905,9.397193],[76.648995,9.397389],[76.64901,9.397481],[76.649019,9.397623],[76.649029,9.397768],[76.649031,9.397883],[76.649043,9.397979],[76.649067,9.398161],[76.649085,9.398288],[76.649066,9.398482],[76.649028,9.398607],[76.648976,9.398715],[76.648919,9.398847],[76.648864,9.39895],[76.648814,9.399053],[76.648752,9.399181],[76.6487,9.399284],[76.648683,9.399512],[76.648703,9.399664],[76.648698,9.399834],[76.64868,9.399983],[76.648648,9.400145],[76.648615,9.400309],[76.648556,9.400466],[76.648501,9.400614],[76.648471,9.400731],[76.648484,9.400849],[76.648486,9.400967],[76.648516,9.401188],[76.648548,9.401482],[76.648553,9.401708],[76.648531,9.401872],[76.648484,9.402044],[76.648461,9.402304],[76.648422,9.402566],[76.648374,9.402785],[76.648359,9.402983],[76.648327,9.403148],[76.648265,9.403462],[76.648093,9.404284],[76.648004,9.404725],[76.647989,9.405051],[76.648042,9.405448],[76.648111,9.405767]]]},\"properties\":{\"Created_Da\":\"2024-10-17T10:21:08.987Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"GYALAXI NAGAR\",\"Ward_No\":\"1\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.676142,9.383878],[76.676225,9.383787],[76.676344,9.383645],[76.676659,9.383348],[76.676763,9.383265],[76.676944,9.38321],[76.677418,9.382959],[76.677557,9.382817],[76.67772,9.382668],[76.677892,9.382502],[76.67794,9.382347],[76.678121,9.382172],[76.678407,9.381903],[76.678518,9.38182],[76.678626,9.381798],[76.678657,9.381898],[76.678663,9.381996],[76.678617,9.382083],[76.67863,9.382214],[76.67874,9.382272],[76.678913,9.382296],[76.679038,9.382311],[76.679144,9.382309],[76.679256,9.382271],[76.67939,9.382246],[76.67952,9.382283],[76.679634,9.38241],[76.679718,9.382573],[76.67976,9.382711],[76.679787,9.382836],[76.679774,9.383009],[76.679788,9.383202],[76.679879,9.383322],[76.680057,9.383305],[76.680051,9.383545],[76.680038,9.384032],[76.680023,9.384585],[76.679929,9.385472],[76.680059,9.385528],[76.679983,9.385881],[76.679979,9.386164],[76.679973,9.386656],[76.67981,9.387445],[76.679442,9.387882],[76.679691,9.388168],[76.680164,9.388244],[76.680678,9.388326],[76.680491,9.388522],[76.680057,9.388855],[76.680107,9.389159],[76.68016,9.389474],[76.68018,9.389595],[76.6802,9.389714],[76.680236,9.389932],[76.67997,9.389952],[76.679768,9.39],[76.678529,9.390186],[76.678326,9.390221],[76.678148,9.390248],[76.677964,9.390203],[76.677798,9.390096],[76.678055,9.389897],[76.678139,9.389564],[76.678193,9.389245],[76.678154,9.388902],[76.678134,9.388569],[76.677895,9.387976],[76.677538,9.387681],[76.677241,9.38773],[76.677107,9.387597],[76.676783,9.387027],[76.676649,9.386908],[76.676547,9.386834],[76.676318,9.386847],[76.67614,9.386896],[76.675888,9.387037],[76.67575,9.387119],[76.675614,9.387185],[76.675502,9.387243],[76.67533,9.387287],[76.675155,9.387245],[76.674588,9.387142],[76.674168,9.387071],[76.673789,9.387059],[76.67349,9.38712],[76.673226,9.387247],[76.67279,9.387473],[76.672522,9.387689],[76.67231,9.387779],[76.671915,9.387943],[76.671656,9.388058],[76.671452,9.388216],[76.67127,9.388349],[76.671121,9.388444],[76.670931,9.388537],[76.670621,9.388643],[76.670512,9.388969],[76.670458,9.389111],[76.670138,9.389831],[76.67004,9.390065],[76.669951,9.390291],[76.669806,9.390618],[76.6697,9.390951],[76.669665,9.391284],[76.669633,9.391631],[76.669592,9.392031],[76.669523,9.392264],[76.669337,9.392622],[76.669189,9.393077],[76.669017,9.393392],[76.668808,9.393682],[76.668606,9.393965],[76.668313,9.394367],[76.668245,9.394625],[76.668263,9.395042],[76.668218,9.395317],[76.668063,9.395602],[76.667822,9.396053],[76.66779,9.396375],[76.667754,9.39677],[76.667384,9.396595],[76.667322,9.396424],[76.667173,9.396404],[76.667089,9.396331],[76.666871,9.396183],[76.66667,9.396052],[76.666476,9.39593],[76.666236,9.395853],[76.666133,9.395848],[76.665921,9.395825],[76.665791,9.395478],[76.665364,9.395381],[76.665296,9.395223],[76.665156,9.394971],[76.665031,9.395005],[76.664799,9.395093],[76.664674,9.395137],[76.664583,9.39515],[76.664443,9.395159],[76.664314,9.395162],[76.664161,9.395161],[76.66405,9.395104],[76.663976,9.395038],[76.66388,9.395009],[76.663766,9.394994],[76.663646,9.394996],[76.663481,9.394977],[76.663369,9.39496],[76.663378,9.394816],[76.663408,9.394709],[76.663459,9.394555],[76.663523,9.394414],[76.663561,9.394315],[76.663671,9.39413],[76.66372,9.394004],[76.663762,9.393855],[76.663836,9.393572],[76.663877,9.393362],[76.663962,9.393189],[76.664046,9.39297],[76.664111,9.392751],[76.664189,9.392627],[76.664291,9.392465],[76.664407,9.392262],[76.664477,9.392173],[76.664549,9.392021],[76.664587,9.39182],[76.664598,9.391648],[76.664602,9.391448],[76.664634,9.39127],[76.664715,9.391077],[76.664735,9.390822],[76.664751,9.39062],[76.664808,9.390231],[76.664919,9.389856],[76.665058,9.389601],[76.664947,9.38945],[76.664835,9.389298],[76.664723,9.388968],[76.664824,9.38842],[76.665013,9.387805],[76.665279,9.387602],[76.665556,9.387171],[76.665658,9.386827],[76.66573,9.386122],[76.666051,9.385789],[76.666156,9.385549],[76.666228,9.38543],[76.66635,9.385258],[76.666431,9.384981],[76.666449,9.384762],[76.666593,9.3844],[76.666741,9.384176],[76.667138,9.383438],[76.667132,9.383347],[76.667203,9.383163],[76.667262,9.383042],[76.66744,9.382892],[76.667639,9.382909],[76.668181,9.382954],[76.668298,9.382962],[76.668587,9.38298],[76.668774,9.382912],[76.668979,9.382713],[76.669106,9.382401],[76.669105,9.382077],[76.668961,9.381729],[76.668858,9.38156],[76.668767,9.381412],[76.668497,9.38129],[76.66823,9.381258],[76.668197,9.381061],[76.668067,9.380639],[76.668007,9.380446],[76.667961,9.380184],[76.667872,9.379669],[76.667854,9.379565],[76.667833,9.379439],[76.667829,9.379231],[76.667793,9.379042],[76.667615,9.378177],[76.667716,9.378188],[76.667858,9.378202],[76.668003,9.378217],[76.668321,9.378173],[76.66844,9.378168],[76.668568,9.378162],[76.6687,9.378157],[76.668831,9.378151],[76.668947,9.378146],[76.669028,9.378198],[76.669126,9.378263],[76.669204,9.378313],[76.669305,9.378379],[76.669288,9.378513],[76.669269,9.378655],[76.669386,9.378803],[76.669483,9.378901],[76.669622,9.37904],[76.669688,9.379112],[76.669814,9.379249],[76.669906,9.379349],[76.670149,9.379639],[76.670052,9.379766],[76.670173,9.379823],[76.670511,9.379983],[76.670669,9.380058],[76.670652,9.380199],[76.670696,9.380406],[76.670838,9.380297],[76.67075,9.380708],[76.670657,9.381188],[76.670597,9.381458],[76.670481,9.381758],[76.670378,9.382146],[76.670135,9.383834],[76.670066,9.384085],[76.67004,9.384231],[76.670035,9.384322],[76.67002,9.38462],[76.670016,9.384775],[76.670017,9.384915],[76.670024,9.385056],[76.670103,9.385206],[76.670162,9.385411],[76.670179,9.385547],[76.670195,9.385686],[76.670212,9.385847],[76.670258,9.386327],[76.67024,9.386824],[76.670301,9.38713],[76.670415,9.386997],[76.670492,9.386898],[76.670543,9.386804],[76.670644,9.38669],[76.670804,9.386652],[76.670884,9.386874],[76.670984,9.386773],[76.671085,9.38664],[76.671143,9.38652],[76.671225,9.386462],[76.671267,9.386627],[76.671391,9.38657],[76.671431,9.386474],[76.671576,9.386317],[76.671978,9.386143],[76.672275,9.386001],[76.672599,9.385745],[76.672722,9.385615],[76.672796,9.385536],[76.673014,9.385488],[76.673185,9.385515],[76.673279,9.385599],[76.673397,9.385757],[76.673496,9.385829],[76.673649,9.385827],[76.673799,9.385784],[76.673907,9.385728],[76.673981,9.385657],[76.674159,9.385642],[76.674396,9.38566],[76.674493,9.385658],[76.674689,9.385656],[76.67486,9.385602],[76.67499,9.385575],[76.675105,9.385526],[76.675184,9.385457],[76.675278,9.385353],[76.675368,9.385121],[76.675423,9.384942],[76.675512,9.384722],[76.675612,9.384545],[76.675731,9.38442],[76.675852,9.384324],[76.675909,9.384219],[76.676002,9.384021],[76.676142,9.383878]]]},\"properties\":{\"Created_Da\":\"2024-10-21T07:34:41.260Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"KOTHAKULAM\",\"Ward_No\":\"9\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.649613,9.382989],[76.649622,9.382898],[76.649626,9.382359],[76.649661,9.381755],[76.649667,9.381656],[76.649765,9.381401],[76.649866,9.381365],[76.649834,9.381176],[76.649782,9.380861],[76.649747,9.380774],[76.649661,9.380558],[76.649454,9.380044],[76.649507,9.37958],[76.649529,9.379382],[76.649544,9.379254],[76.649556,9.379146],[76.649575,9.378988],[76.649425,9.378909],[76.649423,9.378683],[76.649358,9.378512],[76.649465,9.378303],[76.649527,9.37819],[76.649593,9.378071],[76.649674,9.377923],[76.649754,9.377777],[76.649785,9.377666],[76.649953,9.377339],[76.64999,9.377253],[76.649967,9.37703],[76.649855,9.376237],[76.649832,9.376088],[76.649792,9.375831],[76.64978,9.375736],[76.649764,9.375593],[76.649736,9.375312],[76.649978,9.375331],[76.650221,9.37535],[76.650435,9.374614],[76.65068,9.374698],[76.650938,9.374765],[76.651415,9.374914],[76.651714,9.374978],[76.652015,9.375042],[76.652284,9.375086],[76.652375,9.375101],[76.652561,9.375137],[76.652847,9.375167],[76.652961,9.37521],[76.6531,9.375231],[76.653257,9.375256],[76.653771,9.375273],[76.653936,9.375247],[76.654058,9.375227],[76.654334,9.37524],[76.654648,9.375194],[76.654742,9.375179],[76.655122,9.375137],[76.655156,9.375317],[76.65518,9.375447],[76.655149,9.375587],[76.655128,9.375683],[76.655102,9.375797],[76.655046,9.376051],[76.654984,9.376342],[76.65496,9.376454],[76.654955,9.376646],[76.65503,9.376785],[76.65518,9.377061],[76.655262,9.377207],[76.655332,9.377342],[76.65544,9.377584],[76.655464,9.377741],[76.655563,9.378464],[76.655587,9.378638],[76.655612,9.378808],[76.655635,9.378961],[76.655652,9.379121],[76.655675,9.379333],[76.655627,9.379576],[76.655602,9.379689],[76.655512,9.380017],[76.655491,9.380183],[76.655419,9.380375],[76.655347,9.380566],[76.655295,9.380732],[76.655207,9.381014],[76.655158,9.381214],[76.655155,9.38133],[76.655156,9.381583],[76.655143,9.381777],[76.655134,9.381923],[76.655123,9.382094],[76.655112,9.382252],[76.655147,9.382401],[76.655181,9.38255],[76.655212,9.382692],[76.655254,9.382874],[76.65515,9.382877],[76.6549,9.382886],[76.654784,9.382924],[76.654503,9.383051],[76.654506,9.383228],[76.654509,9.383446],[76.654494,9.383561],[76.654464,9.383798],[76.654414,9.383989],[76.654339,9.384277],[76.65415,9.384202],[76.653975,9.38414],[76.653875,9.384098],[76.653774,9.384056],[76.653564,9.384],[76.6534,9.384014],[76.653249,9.384039],[76.653092,9.384075],[76.652923,9.384116],[76.652745,9.384209],[76.652575,9.384259],[76.65245,9.384271],[76.652288,9.384241],[76.652179,9.384179],[76.652086,9.384112],[76.651867,9.383934],[76.651763,9.383825],[76.651664,9.383765],[76.651573,9.383663],[76.651284,9.383491],[76.651012,9.38381],[76.650825,9.38391],[76.650578,9.383903],[76.650385,9.383907],[76.650101,9.383867],[76.650055,9.383783],[76.64998,9.383694],[76.649916,9.383604],[76.649857,9.383517],[76.649743,9.383354],[76.649585,9.383257],[76.649613,9.382989]]]},\"properties\":{\"Created_Da\":\"2024-10-19T05:03:31.572Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"PURAMATTOM\",\"Ward_No\":\"13\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.659195,9.391661],[76.659201,9.391511],[76.659205,9.391278],[76.659224,9.391138],[76.65924,9.390998],[76.659299,9.390758],[76.659362,9.390437],[76.659422,9.390133],[76.659488,9.38996],[76.659543,9.389777],[76.659596,9.389607],[76.659713,9.38938],[76.659766,9.389258],[76.659801,9.389169],[76.65983,9.38898],[76.659849,9.388831],[76.659881,9.388637],[76.659941,9.388485],[76.660023,9.388328],[76.660099,9.388187],[76.660155,9.388085],[76.660204,9.387967],[76.66033,9.387788],[76.660533,9.387623],[76.660569,9.387517],[76.66057,9.387374],[76.660574,9.387161],[76.660628,9.386855],[76.660683,9.386708],[76.660742,9.386591],[76.660809,9.386466],[76.660869,9.386337],[76.660942,9.386213],[76.660923,9.386041],[76.660756,9.38597],[76.660565,9.386052],[76.660484,9.386094],[76.660351,9.386147],[76.660209,9.386254],[76.660119,9.386416],[76.660023,9.386578],[76.659906,9.386757],[76.659833,9.386879],[76.659715,9.387061],[76.659635,9.387178],[76.659562,9.387293],[76.65947,9.387407],[76.659411,9.387508],[76.659356,9.387625],[76.659281,9.38779],[76.659237,9.3879],[76.659168,9.388017],[76.65912,9.388103],[76.659048,9.388184],[76.658971,9.388327],[76.658861,9.388472],[76.658707,9.388506],[76.658615,9.388518],[76.658375,9.388467],[76.658164,9.388473],[76.65798,9.388469],[76.657873,9.388463],[76.657692,9.388479],[76.657472,9.388445],[76.657323,9.388408],[76.657125,9.38845],[76.657002,9.388287],[76.656942,9.388195],[76.656855,9.388072],[76.656768,9.387932],[76.656705,9.387785],[76.656653,9.387611],[76.656638,9.387459],[76.656639,9.387325],[76.656634,9.387229],[76.656631,9.387124],[76.656631,9.386989],[76.656617,9.386847],[76.656628,9.386694],[76.656656,9.386506],[76.65668,9.386405],[76.65674,9.38626],[76.656867,9.386033],[76.657054,9.385757],[76.65718,9.38563],[76.657258,9.385525],[76.657402,9.385395],[76.657597,9.385229],[76.65774,9.385087],[76.657881,9.385014],[76.658068,9.384906],[76.658153,9.384857],[76.658236,9.38481],[76.658329,9.384755],[76.658424,9.3847],[76.6586,9.384598],[76.658847,9.384454],[76.658983,9.384397],[76.659106,9.384346],[76.659444,9.384205],[76.659805,9.383786],[76.65989,9.383672],[76.660094,9.383366],[76.660253,9.383143],[76.660298,9.383035],[76.660364,9.382875],[76.660455,9.382745],[76.660516,9.382654],[76.660599,9.382525],[76.660653,9.382441],[76.660736,9.382294],[76.660898,9.382147],[76.661037,9.382021],[76.66112,9.381961],[76.661166,9.381731],[76.661179,9.381559],[76.661165,9.381429],[76.661155,9.381333],[76.661144,9.381236],[76.661074,9.380961],[76.661021,9.380827],[76.660989,9.380676],[76.660942,9.380496],[76.66089,9.380388],[76.660838,9.380282],[76.660796,9.380194],[76.660739,9.380079],[76.660632,9.37986],[76.660554,9.379676],[76.660467,9.379471],[76.660412,9.379321],[76.660371,9.379193],[76.660331,9.379068],[76.660294,9.378578],[76.660276,9.378341],[76.660278,9.378165],[76.66028,9.37799],[76.660289,9.377792],[76.660304,9.377529],[76.660288,9.377367],[76.660284,9.377228],[76.660251,9.377096],[76.660191,9.37684],[76.66013,9.376581],[76.660104,9.376469],[76.660076,9.376312],[76.660041,9.376155],[76.660002,9.375992],[76.659959,9.375873],[76.659875,9.375645],[76.659788,9.375505],[76.659716,9.375388],[76.659574,9.375225],[76.659432,9.375063],[76.659815,9.374962],[76.660016,9.374941],[76.660155,9.374934],[76.660669,9.374911],[76.660983,9.374897],[76.661233,9.374886],[76.66119,9.375155],[76.661214,9.375408],[76.661251,9.375791],[76.661459,9.376093],[76.661659,9.376327],[76.661833,9.376493],[76.661995,9.376629],[76.662109,9.376725],[76.662236,9.376914],[76.662359,9.377097],[76.662423,9.377416],[76.662556,9.377533],[76.662647,9.377837],[76.662751,9.378189],[76.662768,9.378428],[76.662786,9.378685],[76.662679,9.378813],[76.662567,9.378948],[76.662469,9.379062],[76.662437,9.379205],[76.66284,9.379311],[76.663333,9.379052],[76.663479,9.378975],[76.663717,9.378811],[76.664049,9.378697],[76.66421,9.378642],[76.664457,9.378556],[76.664556,9.378544],[76.66475,9.378521],[76.665111,9.37862],[76.665276,9.378673],[76.66554,9.378479],[76.665575,9.378324],[76.666024,9.378009],[76.666119,9.377915],[76.666206,9.377828],[76.666327,9.377704],[76.666445,9.377658],[76.666587,9.37766],[76.666683,9.377623],[76.666777,9.377766],[76.666838,9.377846],[76.666902,9.377931],[76.666963,9.37801],[76.667043,9.378115],[76.667196,9.378143],[76.667322,9.378156],[76.667426,9.378164],[76.667615,9.378177],[76.667793,9.379042],[76.667829,9.379231],[76.667833,9.379439],[76.667854,9.379565],[76.667872,9.379669],[76.667961,9.380184],[76.668007,9.380446],[76.668067,9.380639],[76.668197,9.381061],[76.66823,9.381258],[76.668497,9.38129],[76.668767,9.381412],[76.668858,9.38156],[76.668961,9.381729],[76.669105,9.382077],[76.669106,9.382401],[76.668979,9.382713],[76.668774,9.382912],[76.668587,9.38298],[76.668298,9.382962],[76.668181,9.382954],[76.667639,9.382909],[76.66744,9.382892],[76.667262,9.383042],[76.667203,9.383163],[76.667132,9.383347],[76.667138,9.383438],[76.666741,9.384176],[76.666593,9.3844],[76.666449,9.384762],[76.666431,9.384981],[76.66635,9.385258],[76.666228,9.38543],[76.666156,9.385549],[76.666051,9.385789],[76.66573,9.386122],[76.665658,9.386827],[76.665556,9.387171],[76.665279,9.387602],[76.665013,9.387805],[76.664824,9.38842],[76.664723,9.388968],[76.664835,9.389298],[76.664947,9.38945],[76.665058,9.389601],[76.664919,9.389856],[76.66472,9.389903],[76.664463,9.390032],[76.664387,9.390108],[76.664307,9.390242],[76.664248,9.390392],[76.664177,9.390492],[76.664051,9.390599],[76.663892,9.390783],[76.66368,9.391079],[76.663649,9.391204],[76.663626,9.391304],[76.663582,9.391401],[76.663525,9.391473],[76.663448,9.391576],[76.6633,9.391776],[76.663247,9.391891],[76.663172,9.391978],[76.663037,9.392112],[76.662943,9.392271],[76.662877,9.392363],[76.662675,9.392688],[76.662612,9.392806],[76.662576,9.392892],[76.662549,9.393001],[76.662484,9.393184],[76.662469,9.393277],[76.662467,9.393412],[76.662493,9.393589],[76.662346,9.393682],[76.662201,9.393791],[76.662023,9.393954],[76.661873,9.394066],[76.661665,9.394214],[76.661608,9.394315],[76.661479,9.394411],[76.661289,9.394529],[76.661177,9.394589],[76.661007,9.394621],[76.660835,9.39467],[76.660717,9.394703],[76.660547,9.394689],[76.660539,9.394351],[76.660527,9.394246],[76.660514,9.394131],[76.660496,9.393957],[76.660491,9.393735],[76.660456,9.393563],[76.660431,9.393356],[76.660253,9.393158],[76.660153,9.393164],[76.659919,9.393178],[76.659785,9.393215],[76.659606,9.39327],[76.659466,9.393307],[76.659341,9.393309],[76.659133,9.39329],[76.659113,9.393186],[76.659104,9.392997],[76.659125,9.392834],[76.659171,9.392751],[76.659226,9.392654],[76.659265,9.392562],[76.659291,9.392456],[76.659276,9.392311],[76.659242,9.39214],[76.659224,9.392006],[76.659203,9.391847],[76.659195,9.391661]]]},\"properties\":{\"Created_Da\":\"2024-10-21T08:01:52.218Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"MUNDAMALA\",\"Ward_No\":\"11\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.651657,9.389828],[76.651635,9.390052],[76.651612,9.390213],[76.651585,9.390394],[76.651567,9.390545],[76.65157,9.390697],[76.651554,9.390954],[76.651558,9.391067],[76.651552,9.391187],[76.651553,9.391354],[76.651449,9.391749],[76.651302,9.392174],[76.651201,9.392425],[76.651156,9.392518],[76.651072,9.392621],[76.650952,9.39279],[76.650856,9.39289],[76.650784,9.393009],[76.650634,9.393159],[76.650487,9.393319],[76.650437,9.39341],[76.65017,9.39368],[76.65006,9.393714],[76.649889,9.393762],[76.6498,9.393793],[76.649666,9.393834],[76.649542,9.393929],[76.649468,9.39399],[76.649067,9.394438],[76.648925,9.394507],[76.648817,9.394617],[76.648268,9.394892],[76.647989,9.395096],[76.64776,9.39523],[76.647631,9.395398],[76.647537,9.395359],[76.647287,9.395285],[76.647147,9.395249],[76.647008,9.395212],[76.646874,9.395175],[76.646748,9.39518],[76.646435,9.395167],[76.646234,9.39513],[76.64614,9.395101],[76.645982,9.395043],[76.645457,9.394919],[76.64521,9.39486],[76.644675,9.394646],[76.644256,9.394515],[76.643827,9.394382],[76.643384,9.394261],[76.643186,9.394207],[76.642733,9.393825],[76.642821,9.3937],[76.643013,9.393431],[76.643191,9.393088],[76.643371,9.392741],[76.643507,9.39236],[76.643558,9.392216],[76.64349,9.391985],[76.643443,9.391756],[76.643411,9.391632],[76.643235,9.390868],[76.643,9.389889],[76.6436,9.389608],[76.64403,9.389389],[76.64404,9.389069],[76.64405,9.388743],[76.644214,9.388697],[76.644471,9.388626],[76.644499,9.388501],[76.644566,9.388201],[76.64459,9.388095],[76.644686,9.387978],[76.645018,9.38757],[76.645441,9.387401],[76.645553,9.387356],[76.645674,9.387307],[76.645998,9.387263],[76.646337,9.387217],[76.646516,9.387193],[76.64687,9.387116],[76.646881,9.386909],[76.646895,9.386633],[76.646919,9.386537],[76.647019,9.386144],[76.647447,9.386119],[76.647521,9.385945],[76.647609,9.385739],[76.647741,9.385745],[76.647978,9.385757],[76.648425,9.385659],[76.648564,9.385453],[76.649043,9.385313],[76.649113,9.385207],[76.649196,9.385082],[76.649265,9.384977],[76.649319,9.384895],[76.649391,9.384786],[76.649412,9.384679],[76.649502,9.384205],[76.649521,9.384102],[76.649555,9.383922],[76.649565,9.383715],[76.649572,9.383558],[76.649581,9.383361],[76.649585,9.383257],[76.649743,9.383354],[76.649857,9.383517],[76.649916,9.383604],[76.64998,9.383694],[76.650055,9.383783],[76.650101,9.383867],[76.650129,9.383989],[76.650159,9.384089],[76.650246,9.384343],[76.650268,9.38446],[76.65033,9.38457],[76.650498,9.384719],[76.650659,9.384886],[76.650708,9.384996],[76.650727,9.385183],[76.650749,9.385323],[76.650745,9.385508],[76.65074,9.38563],[76.650716,9.385773],[76.6507,9.385927],[76.650709,9.38611],[76.650746,9.386273],[76.650829,9.386424],[76.65095,9.386581],[76.651044,9.386701],[76.651175,9.387043],[76.651259,9.387266],[76.651301,9.38754],[76.651315,9.387737],[76.651321,9.387862],[76.651398,9.388008],[76.6514,9.388124],[76.651618,9.388555],[76.65175,9.388852],[76.65183,9.389019],[76.6519,9.389121],[76.651961,9.389214],[76.651913,9.389377],[76.651865,9.389493],[76.651819,9.38958],[76.651748,9.389664],[76.651679,9.389734],[76.651657,9.389828]]]},\"properties\":{\"Created_Da\":\"2024-10-17T10:52:25.249Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"UMIKKUNNU\",\"Ward_No\":\"14\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.669059,9.406268],[76.669091,9.40645],[76.669132,9.406689],[76.669228,9.406873],[76.669358,9.407012],[76.669584,9.407147],[76.669777,9.407256],[76.670024,9.407396],[76.670095,9.407497],[76.670149,9.407575],[76.67015,9.407695],[76.67015,9.407814],[76.669986,9.407866],[76.669735,9.407954],[76.669531,9.408062],[76.669426,9.408088],[76.669258,9.408143],[76.669153,9.408192],[76.668992,9.40831],[76.668874,9.40844],[76.668762,9.408612],[76.668699,9.408704],[76.668566,9.4089],[76.668362,9.409234],[76.668169,9.409544],[76.668087,9.409711],[76.667987,9.409926],[76.667968,9.410046],[76.667962,9.410145],[76.668049,9.410474],[76.668189,9.410905],[76.668255,9.411133],[76.668282,9.411299],[76.66831,9.411597],[76.668378,9.412018],[76.668386,9.41232],[76.6684,9.412602],[76.668493,9.412954],[76.668556,9.413086],[76.668648,9.413326],[76.668738,9.413524],[76.668819,9.413877],[76.668862,9.414017],[76.668928,9.414233],[76.669015,9.414633],[76.669065,9.414983],[76.669161,9.415289],[76.669241,9.415448],[76.669341,9.415639],[76.669574,9.415795],[76.669685,9.415935],[76.669751,9.416223],[76.669693,9.416437],[76.669616,9.416667],[76.66947,9.416958],[76.669371,9.417187],[76.669372,9.417301],[76.66943,9.417452],[76.669491,9.41753],[76.669595,9.417662],[76.669873,9.418013],[76.669918,9.418185],[76.669819,9.418177],[76.669664,9.418197],[76.66955,9.41822],[76.669412,9.418246],[76.669166,9.418295],[76.668953,9.41848],[76.668825,9.418591],[76.668477,9.418303],[76.668313,9.418245],[76.668207,9.418232],[76.667746,9.418234],[76.666973,9.41834],[76.666569,9.418395],[76.665798,9.418519],[76.665707,9.418517],[76.665192,9.418509],[76.665003,9.418511],[76.664875,9.418474],[76.664515,9.418385],[76.664277,9.418311],[76.663902,9.418117],[76.663544,9.417903],[76.663138,9.417604],[76.663131,9.417482],[76.663123,9.417353],[76.663111,9.417146],[76.663123,9.416859],[76.663131,9.416539],[76.663127,9.416308],[76.663127,9.416212],[76.66308,9.415748],[76.663038,9.415331],[76.663052,9.414897],[76.663063,9.414574],[76.663105,9.413909],[76.663115,9.413643],[76.663125,9.41334],[76.663106,9.413037],[76.663082,9.412722],[76.66301,9.412413],[76.66287,9.411815],[76.662633,9.41151],[76.662387,9.411194],[76.662247,9.411135],[76.66187,9.410749],[76.661668,9.410542],[76.6616,9.410472],[76.661408,9.410306],[76.661174,9.410083],[76.661009,9.409926],[76.660939,9.409851],[76.660691,9.409566],[76.660536,9.409387],[76.660432,9.40929],[76.660279,9.40901],[76.660091,9.408522],[76.65998,9.408235],[76.659824,9.407829],[76.659889,9.407684],[76.659951,9.407548],[76.660027,9.407191],[76.659983,9.407087],[76.660119,9.406705],[76.660375,9.406365],[76.660422,9.406266],[76.660409,9.406146],[76.660813,9.405609],[76.661161,9.4052],[76.661227,9.405095],[76.661794,9.404572],[76.662013,9.404274],[76.662126,9.403787],[76.662107,9.40363],[76.662087,9.403466],[76.662237,9.403466],[76.662403,9.40349],[76.662526,9.403494],[76.662709,9.403503],[76.66282,9.403506],[76.662921,9.403536],[76.663055,9.403577],[76.663188,9.403626],[76.663508,9.403942],[76.663642,9.404183],[76.663729,9.404339],[76.663965,9.40448],[76.664205,9.404623],[76.664292,9.4048],[76.664466,9.404888],[76.664611,9.404985],[76.664812,9.405133],[76.665443,9.404995],[76.665649,9.404909],[76.665885,9.404754],[76.665987,9.404687],[76.666099,9.404614],[76.66629,9.404543],[76.666451,9.404555],[76.666636,9.404568],[76.666807,9.404581],[76.667019,9.40472],[76.667204,9.404841],[76.66748,9.404683],[76.667664,9.404578],[76.668025,9.405343],[76.668099,9.405452],[76.668205,9.405606],[76.668314,9.405567],[76.668356,9.40572],[76.66842,9.405958],[76.668625,9.405976],[76.668876,9.405985],[76.668988,9.405953],[76.669059,9.406268]]]},\"properties\":{\"Created_Da\":\"2024-10-21T05:19:33.102Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"VALANKARA\",\"Ward_No\":\"4\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.67502,9.394077],[76.675078,9.39434],[76.675244,9.394717],[76.675343,9.395109],[76.67517,9.395605],[76.675462,9.395738],[76.675648,9.395823],[76.675822,9.396127],[76.675751,9.39622],[76.675581,9.396445],[76.675486,9.396641],[76.675433,9.396834],[76.675344,9.397016],[76.675217,9.397165],[76.67509,9.397315],[76.674871,9.397574],[76.67486,9.397723],[76.674744,9.39784],[76.674625,9.397945],[76.674535,9.398035],[76.67444,9.398115],[76.674144,9.398398],[76.673961,9.398423],[76.673756,9.398451],[76.673672,9.39857],[76.673478,9.3986],[76.673182,9.398575],[76.672904,9.398535],[76.672731,9.398524],[76.672619,9.398495],[76.672412,9.398441],[76.672203,9.39822],[76.672049,9.397961],[76.67209,9.397602],[76.672129,9.397435],[76.672346,9.397023],[76.672369,9.396892],[76.672393,9.396745],[76.672404,9.396604],[76.672414,9.396461],[76.672424,9.396263],[76.672601,9.396156],[76.672741,9.396071],[76.672821,9.396023],[76.6729,9.395975],[76.673055,9.395883],[76.673237,9.395773],[76.673514,9.395608],[76.673686,9.39547],[76.673846,9.395343],[76.673948,9.39524],[76.67411,9.395078],[76.67422,9.39488],[76.674196,9.394605],[76.674176,9.39437],[76.674046,9.394181],[76.673931,9.394014],[76.673599,9.394278],[76.673377,9.394532],[76.673216,9.394773],[76.673069,9.39496],[76.672877,9.395113],[76.672715,9.395231],[76.672613,9.395308],[76.672519,9.395364],[76.672349,9.395402],[76.672084,9.395438],[76.671646,9.395585],[76.671289,9.395763],[76.670588,9.396152],[76.6697,9.39654],[76.669608,9.396674],[76.669476,9.396746],[76.669372,9.396734],[76.668538,9.39695],[76.668447,9.396867],[76.667754,9.39677],[76.66779,9.396375],[76.667822,9.396053],[76.668063,9.395602],[76.668218,9.395317],[76.668263,9.395042],[76.668245,9.394625],[76.668313,9.394367],[76.668606,9.393965],[76.668808,9.393682],[76.669017,9.393392],[76.669189,9.393077],[76.669337,9.392622],[76.669523,9.392264],[76.669592,9.392031],[76.669633,9.391631],[76.669665,9.391284],[76.6697,9.390951],[76.669806,9.390618],[76.669951,9.390291],[76.67004,9.390065],[76.670138,9.389831],[76.670458,9.389111],[76.670512,9.388969],[76.670621,9.388643],[76.670931,9.388537],[76.671121,9.388444],[76.67127,9.388349],[76.671452,9.388216],[76.671656,9.388058],[76.671915,9.387943],[76.67231,9.387779],[76.672522,9.387689],[76.67279,9.387473],[76.673226,9.387247],[76.67349,9.38712],[76.673789,9.387059],[76.674168,9.387071],[76.674588,9.387142],[76.675155,9.387245],[76.67533,9.387287],[76.675502,9.387243],[76.675614,9.387185],[76.67575,9.387119],[76.675888,9.387037],[76.67614,9.386896],[76.676318,9.386847],[76.676547,9.386834],[76.676649,9.386908],[76.676783,9.387027],[76.677107,9.387597],[76.677241,9.38773],[76.677538,9.387681],[76.677895,9.387976],[76.678134,9.388569],[76.678154,9.388902],[76.678193,9.389245],[76.678139,9.389564],[76.678055,9.389897],[76.677798,9.390096],[76.677964,9.390203],[76.678148,9.390248],[76.678326,9.390221],[76.678529,9.390186],[76.679768,9.39],[76.67997,9.389952],[76.680236,9.389932],[76.680415,9.390419],[76.680542,9.390763],[76.680589,9.390892],[76.680556,9.391003],[76.680497,9.391086],[76.680356,9.391127],[76.680344,9.39127],[76.680323,9.391544],[76.680322,9.391656],[76.680237,9.391735],[76.680086,9.391774],[76.67986,9.391833],[76.679606,9.391827],[76.679583,9.391697],[76.679226,9.391783],[76.679083,9.391817],[76.678981,9.391864],[76.678786,9.391892],[76.678463,9.391976],[76.678215,9.392012],[76.678001,9.392044],[76.677778,9.392062],[76.677606,9.392103],[76.677458,9.392149],[76.677326,9.39219],[76.677121,9.392271],[76.676992,9.392324],[76.676865,9.392377],[76.676667,9.392445],[76.676535,9.392498],[76.676305,9.392592],[76.676295,9.392788],[76.676059,9.392862],[76.675896,9.392914],[76.675632,9.393024],[76.675413,9.393115],[76.67511,9.393242],[76.674813,9.393366],[76.674902,9.393612],[76.67494,9.393718],[76.674982,9.393907],[76.67502,9.394077]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:58:31.061Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"VELLARA\",\"Ward_No\":\"8\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.65742,9.39646],[76.657501,9.396634],[76.657518,9.396779],[76.657214,9.397158],[76.656965,9.39742],[76.656799,9.397322],[76.656638,9.397226],[76.656527,9.397161],[76.656091,9.397233],[76.655889,9.397361],[76.655681,9.397509],[76.655487,9.397638],[76.655338,9.397823],[76.655074,9.398056],[76.655,9.398282],[76.654925,9.398507],[76.655045,9.398878],[76.655158,9.399231],[76.655209,9.399325],[76.655527,9.399919],[76.655757,9.400418],[76.65577,9.40092],[76.655791,9.401012],[76.655646,9.401324],[76.654955,9.401585],[76.654451,9.401877],[76.653941,9.402075],[76.653847,9.402179],[76.653249,9.402299],[76.653137,9.402321],[76.652741,9.402471],[76.652524,9.402525],[76.652201,9.402606],[76.651995,9.40262],[76.651846,9.402631],[76.651727,9.402653],[76.651426,9.402748],[76.651098,9.402921],[76.650915,9.403018],[76.650546,9.403254],[76.650406,9.4034],[76.650229,9.403586],[76.650102,9.403743],[76.649797,9.404129],[76.649662,9.404295],[76.649424,9.404604],[76.649316,9.404736],[76.648914,9.405165],[76.648827,9.405258],[76.648578,9.405457],[76.648426,9.405579],[76.648313,9.405668],[76.648216,9.405746],[76.648111,9.405767],[76.648042,9.405448],[76.647989,9.405051],[76.648004,9.404725],[76.648093,9.404284],[76.648265,9.403462],[76.648327,9.403148],[76.648359,9.402983],[76.648374,9.402785],[76.648422,9.402566],[76.648461,9.402304],[76.648484,9.402044],[76.648531,9.401872],[76.648553,9.401708],[76.648548,9.401482],[76.648516,9.401188],[76.648486,9.400967],[76.648484,9.400849],[76.648471,9.400731],[76.648501,9.400614],[76.648556,9.400466],[76.648615,9.400309],[76.648648,9.400145],[76.64868,9.399983],[76.648698,9.399834],[76.648703,9.399664],[76.648683,9.399512],[76.6487,9.399284],[76.648752,9.399181],[76.648814,9.399053],[76.648864,9.39895],[76.648919,9.398847],[76.648976,9.398715],[76.649028,9.398607],[76.649066,9.398482],[76.649085,9.398288],[76.649067,9.398161],[76.649043,9.397979],[76.649031,9.397883],[76.649029,9.397768],[76.649019,9.397623],[76.64901,9.397481],[76.648995,9.397389],[76.64905,9.397193],[76.649112,9.397062],[76.649107,9.39692],[76.649112,9.39671],[76.649018,9.396426],[76.649012,9.396335],[76.649188,9.395929],[76.649296,9.395701],[76.64938,9.39545],[76.649448,9.395272],[76.649493,9.3951],[76.649628,9.394989],[76.649752,9.394922],[76.649843,9.394861],[76.649935,9.394746],[76.650057,9.394666],[76.650164,9.394543],[76.650238,9.394354],[76.650232,9.394204],[76.650249,9.394026],[76.65017,9.39368],[76.650437,9.39341],[76.650487,9.393319],[76.650634,9.393159],[76.650784,9.393009],[76.650856,9.39289],[76.650952,9.39279],[76.651072,9.392621],[76.651156,9.392518],[76.651201,9.392425],[76.651302,9.392174],[76.651449,9.391749],[76.651553,9.391354],[76.651552,9.391187],[76.651558,9.391067],[76.651554,9.390954],[76.65157,9.390697],[76.651567,9.390545],[76.651585,9.390394],[76.651612,9.390213],[76.651635,9.390052],[76.651657,9.389828],[76.651679,9.389734],[76.651748,9.389664],[76.651819,9.38958],[76.651865,9.389493],[76.651913,9.389377],[76.651961,9.389214],[76.6519,9.389121],[76.65183,9.389019],[76.65175,9.388852],[76.651618,9.388555],[76.6514,9.388124],[76.651398,9.388008],[76.651321,9.387862],[76.651315,9.387737],[76.651301,9.38754],[76.651259,9.387266],[76.651175,9.387043],[76.651044,9.386701],[76.65095,9.386581],[76.650829,9.386424],[76.650746,9.386273],[76.650709,9.38611],[76.6507,9.385927],[76.650716,9.385773],[76.65074,9.38563],[76.650745,9.385508],[76.650749,9.385323],[76.650727,9.385183],[76.650708,9.384996],[76.650659,9.384886],[76.650498,9.384719],[76.65033,9.38457],[76.650268,9.38446],[76.650246,9.384343],[76.650159,9.384089],[76.650129,9.383989],[76.650101,9.383867],[76.650385,9.383907],[76.650578,9.383903],[76.650825,9.38391],[76.651012,9.38381],[76.651284,9.383491],[76.651573,9.383663],[76.651664,9.383765],[76.651763,9.383825],[76.651867,9.383934],[76.652086,9.384112],[76.652179,9.384179],[76.652288,9.384241],[76.65245,9.384271],[76.652575,9.384259],[76.652745,9.384209],[76.652923,9.384116],[76.653092,9.384075],[76.653249,9.384039],[76.6534,9.384014],[76.653564,9.384],[76.653774,9.384056],[76.653875,9.384098],[76.653975,9.38414],[76.65415,9.384202],[76.654339,9.384277],[76.654414,9.383989],[76.654464,9.383798],[76.654494,9.383561],[76.654509,9.383446],[76.654506,9.383228],[76.654503,9.383051],[76.654784,9.382924],[76.6549,9.382886],[76.65515,9.382877],[76.655254,9.382874],[76.655434,9.382791],[76.655393,9.382558],[76.655399,9.382309],[76.655632,9.382256],[76.655783,9.38221],[76.655925,9.382176],[76.656109,9.382146],[76.656322,9.382111],[76.656444,9.382149],[76.656581,9.382196],[76.656697,9.382239],[76.656804,9.38222],[76.656911,9.3822],[76.657108,9.382221],[76.657241,9.382265],[76.65741,9.382321],[76.657525,9.382229],[76.657722,9.38211],[76.657913,9.382221],[76.657936,9.382401],[76.657958,9.382561],[76.657932,9.382689],[76.657888,9.382799],[76.657791,9.383037],[76.657718,9.383117],[76.657623,9.383177],[76.657411,9.383245],[76.657318,9.383283],[76.657168,9.383396],[76.657214,9.383704],[76.657305,9.384004],[76.657358,9.384175],[76.657385,9.384266],[76.657427,9.384409],[76.657486,9.384604],[76.657522,9.384704],[76.657586,9.384776],[76.657672,9.384856],[76.65775,9.384943],[76.657881,9.385014],[76.65774,9.385087],[76.657597,9.385229],[76.657402,9.385395],[76.657258,9.385525],[76.65718,9.38563],[76.657054,9.385757],[76.656867,9.386033],[76.65674,9.38626],[76.65668,9.386405],[76.656656,9.386506],[76.656628,9.386694],[76.656617,9.386847],[76.656631,9.386989],[76.656631,9.387124],[76.656634,9.387229],[76.656639,9.387325],[76.656638,9.387459],[76.656653,9.387611],[76.656705,9.387785],[76.656768,9.387932],[76.656855,9.388072],[76.656942,9.388195],[76.657002,9.388287],[76.657125,9.38845],[76.657241,9.388622],[76.657403,9.38892],[76.657458,9.38906],[76.657498,9.3892],[76.657529,9.389358],[76.657564,9.389588],[76.65758,9.389799],[76.657612,9.389914],[76.657631,9.39004],[76.657702,9.390199],[76.657734,9.390386],[76.657715,9.39054],[76.657673,9.390749],[76.657629,9.390919],[76.657558,9.391119],[76.657514,9.391372],[76.657486,9.39156],[76.657461,9.391812],[76.657454,9.391956],[76.657485,9.392094],[76.657475,9.392273],[76.657446,9.392405],[76.657385,9.392491],[76.657312,9.392558],[76.657207,9.392639],[76.657115,9.392719],[76.657036,9.392782],[76.656915,9.392932],[76.656859,9.393079],[76.656818,9.393208],[76.656688,9.393397],[76.656536,9.393547],[76.656482,9.393625],[76.656383,9.393812],[76.65625,9.393965],[76.656135,9.39407],[76.655963,9.394282],[76.656008,9.394457],[76.656012,9.394643],[76.656041,9.394895],[76.656072,9.395017],[76.656145,9.395172],[76.656197,9.395261],[76.656318,9.395445],[76.656451,9.395545],[76.656614,9.395656],[76.656778,9.395806],[76.656876,9.395895],[76.657068,9.396095],[76.657317,9.396352],[76.65742,9.39646]]]},\"properties\":{\"Created_Da\":\"2024-10-20T15:34:12.793Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"KAVUNGUMPRAYAR\",\"Ward_No\":\"2\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.675833,9.40988],[76.67593,9.40998],[76.675998,9.410048],[76.6762,9.410254],[76.676403,9.410462],[76.676469,9.410529],[76.676681,9.410619],[76.676799,9.410662],[76.676953,9.410718],[76.67724,9.410762],[76.677718,9.410791],[76.677973,9.410835],[76.678329,9.41091],[76.678391,9.411007],[76.678453,9.41116],[76.678489,9.411295],[76.678548,9.411517],[76.678603,9.411619],[76.678757,9.411685],[76.678974,9.411672],[76.679181,9.411757],[76.679351,9.411824],[76.679678,9.411901],[76.679808,9.411921],[76.679903,9.411927],[76.68,9.411943],[76.680126,9.411963],[76.680367,9.412132],[76.680292,9.412217],[76.679926,9.412369],[76.67901,9.412749],[76.678251,9.413059],[76.677665,9.413303],[76.67752,9.413364],[76.676344,9.413964],[76.676102,9.414087],[76.676212,9.414533],[76.675967,9.414654],[76.675658,9.414808],[76.675422,9.414911],[76.674897,9.415143],[76.674811,9.415599],[76.674882,9.415875],[76.674908,9.415976],[76.674996,9.416095],[76.67506,9.416182],[76.6753,9.416353],[76.67517,9.416504],[76.675122,9.416616],[76.675058,9.416766],[76.674921,9.416875],[76.674831,9.417172],[76.674589,9.417104],[76.674469,9.417109],[76.674343,9.417147],[76.674185,9.417127],[76.674062,9.417074],[76.673896,9.417003],[76.67373,9.41693],[76.673556,9.416887],[76.673419,9.416888],[76.673181,9.416905],[76.673057,9.416917],[76.672909,9.417033],[76.672813,9.417195],[76.672791,9.417343],[76.672651,9.417363],[76.672419,9.417397],[76.67221,9.417398],[76.672146,9.417578],[76.672081,9.417679],[76.672007,9.417795],[76.671777,9.417836],[76.671642,9.417784],[76.671529,9.417783],[76.671405,9.417829],[76.671256,9.417912],[76.670937,9.418092],[76.670686,9.418106],[76.670502,9.418116],[76.670209,9.418163],[76.669918,9.418185],[76.669873,9.418013],[76.669595,9.417662],[76.669491,9.41753],[76.66943,9.417452],[76.669372,9.417301],[76.669371,9.417187],[76.66947,9.416958],[76.669616,9.416667],[76.669693,9.416437],[76.669751,9.416223],[76.669685,9.415935],[76.669574,9.415795],[76.669341,9.415639],[76.669241,9.415448],[76.669161,9.415289],[76.669065,9.414983],[76.669015,9.414633],[76.668928,9.414233],[76.668862,9.414017],[76.668819,9.413877],[76.668738,9.413524],[76.668648,9.413326],[76.668556,9.413086],[76.668493,9.412954],[76.6684,9.412602],[76.668386,9.41232],[76.668378,9.412018],[76.66831,9.411597],[76.668282,9.411299],[76.668255,9.411133],[76.668189,9.410905],[76.668049,9.410474],[76.667962,9.410145],[76.667968,9.410046],[76.667987,9.409926],[76.668087,9.409711],[76.668169,9.409544],[76.668362,9.409234],[76.668566,9.4089],[76.668699,9.408704],[76.668762,9.408612],[76.668874,9.40844],[76.668992,9.40831],[76.669153,9.408192],[76.669258,9.408143],[76.669426,9.408088],[76.669531,9.408062],[76.669735,9.407954],[76.669986,9.407866],[76.67015,9.407814],[76.670304,9.40795],[76.670404,9.40804],[76.670667,9.408376],[76.670806,9.408555],[76.670989,9.408897],[76.671218,9.409123],[76.671457,9.409161],[76.67156,9.409473],[76.671824,9.409973],[76.671958,9.410129],[76.672093,9.410286],[76.672171,9.410391],[76.67251,9.410846],[76.672819,9.411144],[76.672994,9.411307],[76.673471,9.411479],[76.673291,9.410658],[76.673328,9.410323],[76.673214,9.409714],[76.673511,9.409573],[76.673642,9.409521],[76.673774,9.409468],[76.67392,9.409461],[76.674198,9.409318],[76.674531,9.409057],[76.674609,9.408996],[76.674692,9.408931],[76.674776,9.408866],[76.674859,9.408801],[76.674956,9.408938],[76.675053,9.409076],[76.675272,9.409341],[76.675377,9.409466],[76.675707,9.409752],[76.675833,9.40988]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:15:55.943Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"PADUTHODU\",\"Ward_No\":\"5\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.661166,9.381731],[76.66112,9.381961],[76.661037,9.382021],[76.660898,9.382147],[76.660736,9.382294],[76.660653,9.382441],[76.660599,9.382525],[76.660516,9.382654],[76.660455,9.382745],[76.660364,9.382875],[76.660298,9.383035],[76.660253,9.383143],[76.660094,9.383366],[76.65989,9.383672],[76.659805,9.383786],[76.659444,9.384205],[76.659106,9.384346],[76.658983,9.384397],[76.658847,9.384454],[76.6586,9.384598],[76.658424,9.3847],[76.658329,9.384755],[76.658236,9.38481],[76.658153,9.384857],[76.658068,9.384906],[76.657881,9.385014],[76.65775,9.384943],[76.657672,9.384856],[76.657586,9.384776],[76.657522,9.384704],[76.657486,9.384604],[76.657427,9.384409],[76.657385,9.384266],[76.657358,9.384175],[76.657305,9.384004],[76.657214,9.383704],[76.657168,9.383396],[76.657318,9.383283],[76.657411,9.383245],[76.657623,9.383177],[76.657718,9.383117],[76.657791,9.383037],[76.657888,9.382799],[76.657932,9.382689],[76.657958,9.382561],[76.657936,9.382401],[76.657913,9.382221],[76.657722,9.38211],[76.657525,9.382229],[76.65741,9.382321],[76.657241,9.382265],[76.657108,9.382221],[76.656911,9.3822],[76.656804,9.38222],[76.656697,9.382239],[76.656581,9.382196],[76.656444,9.382149],[76.656322,9.382111],[76.656109,9.382146],[76.655925,9.382176],[76.655783,9.38221],[76.655632,9.382256],[76.655399,9.382309],[76.655393,9.382558],[76.655434,9.382791],[76.655254,9.382874],[76.655212,9.382692],[76.655181,9.38255],[76.655147,9.382401],[76.655112,9.382252],[76.655123,9.382094],[76.655134,9.381923],[76.655143,9.381777],[76.655156,9.381583],[76.655155,9.38133],[76.655158,9.381214],[76.655207,9.381014],[76.655295,9.380732],[76.655347,9.380566],[76.655419,9.380375],[76.655491,9.380183],[76.655512,9.380017],[76.655602,9.379689],[76.655627,9.379576],[76.655675,9.379333],[76.655652,9.379121],[76.655635,9.378961],[76.655612,9.378808],[76.655587,9.378638],[76.655563,9.378464],[76.655464,9.377741],[76.65544,9.377584],[76.655332,9.377342],[76.655262,9.377207],[76.65518,9.377061],[76.65503,9.376785],[76.654955,9.376646],[76.65496,9.376454],[76.654984,9.376342],[76.655046,9.376051],[76.655102,9.375797],[76.655128,9.375683],[76.655149,9.375587],[76.65518,9.375447],[76.655156,9.375317],[76.655122,9.375137],[76.654742,9.375179],[76.654648,9.375194],[76.654334,9.37524],[76.654058,9.375227],[76.653936,9.375247],[76.653771,9.375273],[76.653257,9.375256],[76.6531,9.375231],[76.652961,9.37521],[76.652847,9.375167],[76.652561,9.375137],[76.652375,9.375101],[76.652284,9.375086],[76.652015,9.375042],[76.651714,9.374978],[76.651415,9.374914],[76.650938,9.374765],[76.65068,9.374698],[76.650435,9.374614],[76.650461,9.374524],[76.65062,9.374393],[76.650678,9.374161],[76.650396,9.374073],[76.650408,9.373845],[76.650424,9.373549],[76.650391,9.373419],[76.650358,9.373288],[76.650321,9.373143],[76.650492,9.373103],[76.650594,9.37308],[76.650763,9.373042],[76.651038,9.372979],[76.651478,9.373063],[76.651641,9.373095],[76.652112,9.373039],[76.652414,9.373003],[76.652749,9.372781],[76.653084,9.372558],[76.653832,9.372474],[76.654083,9.372446],[76.65461,9.372386],[76.654942,9.372403],[76.655345,9.372585],[76.655369,9.372745],[76.655405,9.3729],[76.655456,9.373119],[76.656198,9.372916],[76.656343,9.372877],[76.656861,9.37309],[76.65738,9.373303],[76.657657,9.373383],[76.657725,9.373476],[76.657755,9.373667],[76.657663,9.373949],[76.657658,9.374121],[76.657764,9.374228],[76.657744,9.374576],[76.657978,9.374607],[76.658164,9.374499],[76.658227,9.374339],[76.65874,9.374291],[76.65894,9.374264],[76.659234,9.374252],[76.659334,9.374248],[76.659707,9.37423],[76.659858,9.374223],[76.660191,9.374207],[76.660527,9.374191],[76.66069,9.374251],[76.660913,9.374334],[76.661121,9.374476],[76.661243,9.374631],[76.661233,9.374886],[76.660983,9.374897],[76.660669,9.374911],[76.660155,9.374934],[76.660016,9.374941],[76.659815,9.374962],[76.659432,9.375063],[76.659574,9.375225],[76.659716,9.375388],[76.659788,9.375505],[76.659875,9.375645],[76.659959,9.375873],[76.660002,9.375992],[76.660041,9.376155],[76.660076,9.376312],[76.660104,9.376469],[76.66013,9.376581],[76.660191,9.37684],[76.660251,9.377096],[76.660284,9.377228],[76.660288,9.377367],[76.660304,9.377529],[76.660289,9.377792],[76.66028,9.37799],[76.660278,9.378165],[76.660276,9.378341],[76.660294,9.378578],[76.660331,9.379068],[76.660371,9.379193],[76.660412,9.379321],[76.660467,9.379471],[76.660554,9.379676],[76.660632,9.37986],[76.660739,9.380079],[76.660796,9.380194],[76.660838,9.380282],[76.66089,9.380388],[76.660942,9.380496],[76.660989,9.380676],[76.661021,9.380827],[76.661074,9.380961],[76.661144,9.381236],[76.661155,9.381333],[76.661165,9.381429],[76.661179,9.381559],[76.661166,9.381731]]]},\"properties\":{\"Created_Da\":\"2024-10-21T08:05:06.687Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"NEELAVATHUKKAL\",\"Ward_No\":\"12\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.67724,9.410762],[76.676953,9.410718],[76.676799,9.410662],[76.676681,9.410619],[76.676469,9.410529],[76.676403,9.410462],[76.6762,9.410254],[76.675998,9.410048],[76.67593,9.40998],[76.675833,9.40988],[76.675707,9.409752],[76.675377,9.409466],[76.675272,9.409341],[76.675053,9.409076],[76.674956,9.408938],[76.674859,9.408801],[76.674646,9.408523],[76.674345,9.408428],[76.674065,9.408176],[76.674096,9.408049],[76.674164,9.407694],[76.674129,9.407601],[76.674064,9.40743],[76.673984,9.407231],[76.67389,9.407],[76.673754,9.40688],[76.673384,9.406916],[76.673203,9.406539],[76.672869,9.405842],[76.672759,9.405614],[76.672735,9.405435],[76.673368,9.405581],[76.673622,9.405586],[76.673888,9.40559],[76.673987,9.405592],[76.674082,9.405554],[76.674214,9.405454],[76.674269,9.405337],[76.67415,9.405208],[76.67403,9.405077],[76.674042,9.404825],[76.674112,9.404749],[76.674182,9.404672],[76.67439,9.40446],[76.674207,9.404287],[76.67404,9.404103],[76.673856,9.403862],[76.673637,9.403613],[76.673305,9.403235],[76.673291,9.40302],[76.673379,9.402942],[76.673457,9.402856],[76.673659,9.402634],[76.673733,9.402563],[76.67381,9.40265],[76.674005,9.402602],[76.674085,9.402548],[76.674183,9.402539],[76.67456,9.402288],[76.674771,9.402146],[76.675078,9.40188],[76.6752,9.401779],[76.675275,9.401727],[76.675558,9.40153],[76.675792,9.401369],[76.676188,9.401282],[76.676362,9.401169],[76.676421,9.401494],[76.676469,9.401615],[76.676494,9.401855],[76.676584,9.402055],[76.676652,9.40244],[76.676665,9.402588],[76.676688,9.40285],[76.676658,9.403088],[76.676701,9.403486],[76.677529,9.403815],[76.677769,9.403885],[76.677952,9.403939],[76.67805,9.403968],[76.678212,9.404036],[76.678532,9.404186],[76.679055,9.40443],[76.679219,9.404462],[76.679389,9.404542],[76.679525,9.404607],[76.679685,9.404652],[76.679858,9.4047],[76.680102,9.40474],[76.680263,9.404808],[76.68036,9.404849],[76.680499,9.405006],[76.680563,9.405079],[76.680504,9.405383],[76.680615,9.405437],[76.680893,9.405572],[76.680945,9.405941],[76.680998,9.406315],[76.681098,9.406516],[76.681201,9.406725],[76.681174,9.407124],[76.681184,9.407449],[76.681192,9.407696],[76.681208,9.407999],[76.681217,9.408159],[76.681306,9.408392],[76.681409,9.40865],[76.681485,9.408902],[76.681536,9.409136],[76.681576,9.40932],[76.681666,9.409614],[76.681708,9.409733],[76.681799,9.409799],[76.681877,9.409865],[76.681851,9.41009],[76.681821,9.410184],[76.68175,9.41041],[76.681967,9.410611],[76.682351,9.410531],[76.682525,9.410494],[76.683151,9.410499],[76.683384,9.410406],[76.683553,9.410339],[76.683803,9.410138],[76.684011,9.409962],[76.68421,9.409859],[76.684339,9.409792],[76.684604,9.4097],[76.684816,9.409616],[76.685027,9.409533],[76.685134,9.409467],[76.685303,9.409363],[76.685473,9.409258],[76.685691,9.409124],[76.685781,9.409068],[76.685941,9.408958],[76.686104,9.408845],[76.686268,9.40881],[76.686298,9.4089],[76.686402,9.409211],[76.686556,9.409736],[76.686597,9.409877],[76.686716,9.410088],[76.686754,9.410205],[76.68685,9.41038],[76.687043,9.410727],[76.687074,9.411071],[76.687085,9.411192],[76.687037,9.411702],[76.686705,9.411625],[76.686567,9.411606],[76.686311,9.411577],[76.68612,9.411672],[76.686004,9.41176],[76.685834,9.411883],[76.685601,9.412052],[76.685271,9.412359],[76.685185,9.412459],[76.685061,9.412602],[76.684728,9.412964],[76.684621,9.41308],[76.684354,9.413155],[76.684055,9.413237],[76.683658,9.413371],[76.683473,9.413474],[76.68311,9.413681],[76.682875,9.413764],[76.682622,9.413854],[76.682409,9.414038],[76.682299,9.414133],[76.682208,9.414215],[76.68213,9.414286],[76.681952,9.414448],[76.681762,9.414592],[76.68163,9.414691],[76.681423,9.414785],[76.681296,9.414842],[76.681151,9.414909],[76.680924,9.414959],[76.680672,9.415014],[76.680458,9.41506],[76.680232,9.415129],[76.680125,9.415174],[76.68002,9.415217],[76.679889,9.415266],[76.679531,9.415379],[76.679377,9.415442],[76.679219,9.415492],[76.679075,9.415538],[76.678911,9.41559],[76.67877,9.415635],[76.678623,9.415739],[76.678525,9.415766],[76.678336,9.415818],[76.678141,9.415964],[76.677894,9.41616],[76.677731,9.41629],[76.677632,9.416369],[76.677415,9.416398],[76.677201,9.416426],[76.676802,9.416479],[76.676739,9.416192],[76.676423,9.416247],[76.676089,9.416271],[76.675913,9.416284],[76.675703,9.416415],[76.675505,9.416427],[76.6753,9.416353],[76.67506,9.416182],[76.674996,9.416095],[76.674908,9.415976],[76.674882,9.415875],[76.674811,9.415599],[76.674897,9.415143],[76.675422,9.414911],[76.675658,9.414808],[76.675967,9.414654],[76.676212,9.414533],[76.676102,9.414087],[76.676344,9.413964],[76.67752,9.413364],[76.677665,9.413303],[76.678251,9.413059],[76.67901,9.412749],[76.679926,9.412369],[76.680292,9.412217],[76.680367,9.412132],[76.680126,9.411963],[76.68,9.411943],[76.679903,9.411927],[76.679808,9.411921],[76.679678,9.411901],[76.679351,9.411824],[76.679181,9.411757],[76.678974,9.411672],[76.678757,9.411685],[76.678603,9.411619],[76.678548,9.411517],[76.678489,9.411295],[76.678453,9.41116],[76.678391,9.411007],[76.678329,9.41091],[76.677973,9.410835],[76.677718,9.410791],[76.67724,9.410762]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:32:18.030Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9847774042\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"MUTHUPALA\",\"Ward_No\":\"6\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.67389,9.407],[76.673984,9.407231],[76.674064,9.40743],[76.674129,9.407601],[76.674164,9.407694],[76.674096,9.408049],[76.674065,9.408176],[76.674345,9.408428],[76.674646,9.408523],[76.674859,9.408801],[76.674776,9.408866],[76.674692,9.408931],[76.674609,9.408996],[76.674531,9.409057],[76.674198,9.409318],[76.67392,9.409461],[76.673774,9.409468],[76.673642,9.409521],[76.673511,9.409573],[76.673214,9.409714],[76.673328,9.410323],[76.673291,9.410658],[76.673471,9.411479],[76.672994,9.411307],[76.672819,9.411144],[76.67251,9.410846],[76.672171,9.410391],[76.672093,9.410286],[76.671958,9.410129],[76.671824,9.409973],[76.67156,9.409473],[76.671457,9.409161],[76.671218,9.409123],[76.670989,9.408897],[76.670806,9.408555],[76.670667,9.408376],[76.670404,9.40804],[76.670304,9.40795],[76.67015,9.407814],[76.67015,9.407695],[76.670149,9.407575],[76.670095,9.407497],[76.670024,9.407396],[76.669777,9.407256],[76.669584,9.407147],[76.669358,9.407012],[76.669228,9.406873],[76.669132,9.406689],[76.669091,9.40645],[76.669059,9.406268],[76.668988,9.405953],[76.668876,9.405985],[76.668625,9.405976],[76.66842,9.405958],[76.668356,9.40572],[76.668314,9.405567],[76.668205,9.405606],[76.668099,9.405452],[76.668025,9.405343],[76.667664,9.404578],[76.66748,9.404683],[76.667204,9.404841],[76.667019,9.40472],[76.666807,9.404581],[76.666636,9.404568],[76.666451,9.404555],[76.66629,9.404543],[76.666099,9.404614],[76.665987,9.404687],[76.665885,9.404754],[76.665649,9.404909],[76.665443,9.404995],[76.664812,9.405133],[76.664611,9.404985],[76.664466,9.404888],[76.664292,9.4048],[76.664205,9.404623],[76.664427,9.404289],[76.664554,9.404232],[76.664653,9.404108],[76.664642,9.403972],[76.66466,9.403878],[76.664823,9.403697],[76.665076,9.40349],[76.665167,9.403345],[76.665239,9.403216],[76.665322,9.403071],[76.665451,9.402926],[76.665495,9.402762],[76.665341,9.402819],[76.665093,9.402925],[76.664999,9.402922],[76.664912,9.402862],[76.664913,9.402731],[76.665106,9.402427],[76.665278,9.402163],[76.665312,9.40199],[76.665359,9.401682],[76.665275,9.401357],[76.665094,9.401282],[76.664942,9.401273],[76.664573,9.401327],[76.664462,9.401343],[76.664203,9.40136],[76.664066,9.401362],[76.664004,9.400996],[76.664152,9.400939],[76.664256,9.400899],[76.664609,9.400768],[76.66482,9.400692],[76.664992,9.400627],[76.665167,9.400586],[76.665339,9.400502],[76.665483,9.400426],[76.665608,9.400403],[76.665845,9.400362],[76.665995,9.400364],[76.666086,9.400359],[76.666202,9.400297],[76.666304,9.400291],[76.666477,9.400247],[76.666676,9.400103],[76.666667,9.399923],[76.666598,9.399762],[76.666531,9.399605],[76.666278,9.399219],[76.66631,9.398928],[76.666427,9.398892],[76.666549,9.39885],[76.666817,9.398865],[76.667287,9.398891],[76.667459,9.398897],[76.667589,9.398901],[76.667621,9.398323],[76.667632,9.398204],[76.667643,9.398065],[76.667664,9.397876],[76.667674,9.397782],[76.667688,9.397648],[76.667698,9.397499],[76.667713,9.397281],[76.667721,9.397172],[76.667736,9.39692],[76.667754,9.39677],[76.668447,9.396867],[76.668538,9.39695],[76.669372,9.396734],[76.669476,9.396746],[76.669608,9.396674],[76.6697,9.39654],[76.670588,9.396152],[76.671289,9.395763],[76.671646,9.395585],[76.672084,9.395438],[76.672349,9.395402],[76.672519,9.395364],[76.672613,9.395308],[76.672715,9.395231],[76.672877,9.395113],[76.673069,9.39496],[76.673216,9.394773],[76.673377,9.394532],[76.673599,9.394278],[76.673931,9.394014],[76.674046,9.394181],[76.674176,9.39437],[76.674196,9.394605],[76.67422,9.39488],[76.67411,9.395078],[76.673948,9.39524],[76.673846,9.395343],[76.673686,9.39547],[76.673514,9.395608],[76.673237,9.395773],[76.673055,9.395883],[76.6729,9.395975],[76.672821,9.396023],[76.672741,9.396071],[76.672601,9.396156],[76.672424,9.396263],[76.672414,9.396461],[76.672404,9.396604],[76.672393,9.396745],[76.672369,9.396892],[76.672346,9.397023],[76.672129,9.397435],[76.67209,9.397602],[76.672049,9.397961],[76.672203,9.39822],[76.672412,9.398441],[76.672619,9.398495],[76.672731,9.398524],[76.672904,9.398535],[76.673182,9.398575],[76.673478,9.3986],[76.673672,9.39857],[76.673762,9.398715],[76.673855,9.398889],[76.673826,9.399094],[76.673897,9.399216],[76.673981,9.399423],[76.67407,9.399587],[76.674202,9.399823],[76.674044,9.399966],[76.673846,9.400065],[76.673686,9.40013],[76.673228,9.400212],[76.672986,9.400275],[76.672877,9.400291],[76.672734,9.400346],[76.67232,9.400471],[76.672129,9.400528],[76.67193,9.400668],[76.671653,9.400804],[76.671313,9.400981],[76.670942,9.401169],[76.670809,9.401282],[76.670563,9.401425],[76.670442,9.401513],[76.670203,9.40162],[76.670118,9.401696],[76.669796,9.401794],[76.669583,9.401859],[76.669395,9.401915],[76.669245,9.401961],[76.668947,9.402051],[76.668744,9.402089],[76.668468,9.40214],[76.668185,9.402156],[76.667869,9.402174],[76.667916,9.40237],[76.667942,9.402469],[76.667966,9.40256],[76.668055,9.402828],[76.668092,9.402938],[76.668185,9.402857],[76.668284,9.402771],[76.668468,9.402682],[76.668751,9.402612],[76.668999,9.402588],[76.669263,9.402658],[76.66943,9.402698],[76.669545,9.402735],[76.669694,9.402821],[76.669873,9.402926],[76.670063,9.402947],[76.67001,9.403136],[76.669929,9.40343],[76.67001,9.40363],[76.670177,9.403557],[76.670354,9.403577],[76.670547,9.403599],[76.670859,9.403696],[76.670983,9.403732],[76.671165,9.403785],[76.671258,9.403811],[76.671413,9.404071],[76.671477,9.404174],[76.671512,9.404393],[76.671512,9.404606],[76.671673,9.404647],[76.6718,9.404527],[76.671938,9.404398],[76.672013,9.40434],[76.672229,9.40422],[76.672335,9.404233],[76.67249,9.403633],[76.672466,9.403501],[76.672691,9.403445],[76.672782,9.403423],[76.672898,9.403394],[76.673093,9.403305],[76.673305,9.403235],[76.673637,9.403613],[76.673856,9.403862],[76.67404,9.404103],[76.674207,9.404287],[76.67439,9.40446],[76.674182,9.404672],[76.674112,9.404749],[76.674042,9.404825],[76.67403,9.405077],[76.67415,9.405208],[76.674269,9.405337],[76.674214,9.405454],[76.674082,9.405554],[76.673987,9.405592],[76.673888,9.40559],[76.673622,9.405586],[76.673368,9.405581],[76.672735,9.405435],[76.672759,9.405614],[76.672869,9.405842],[76.673203,9.406539],[76.673384,9.406916],[76.673754,9.40688],[76.67389,9.407]]]},\"properties\":{\"Created_Da\":\"2024-10-21T06:02:12.346Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9847774042\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"VENNIKULAM\",\"Ward_No\":\"7\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.665451,9.402926],[76.665322,9.403071],[76.665239,9.403216],[76.665167,9.403345],[76.665076,9.40349],[76.664823,9.403697],[76.66466,9.403878],[76.664642,9.403972],[76.664653,9.404108],[76.664554,9.404232],[76.664427,9.404289],[76.664205,9.404623],[76.663965,9.40448],[76.663729,9.404339],[76.663642,9.404183],[76.663508,9.403942],[76.663188,9.403626],[76.663055,9.403577],[76.662921,9.403536],[76.66282,9.403506],[76.662709,9.403503],[76.662526,9.403494],[76.662403,9.40349],[76.662237,9.403466],[76.662087,9.403466],[76.661914,9.403343],[76.661741,9.403219],[76.661323,9.403197],[76.661194,9.40317],[76.660824,9.403091],[76.660634,9.403055],[76.660483,9.403011],[76.660304,9.402958],[76.660158,9.402903],[76.659791,9.402755],[76.659414,9.40259],[76.659303,9.402534],[76.65894,9.402118],[76.658721,9.401855],[76.658562,9.401512],[76.658444,9.401313],[76.658286,9.401044],[76.658276,9.400945],[76.658117,9.400615],[76.658102,9.400436],[76.657953,9.399985],[76.657832,9.399621],[76.657847,9.399423],[76.657729,9.399133],[76.657579,9.398764],[76.657465,9.398439],[76.657366,9.398161],[76.657312,9.398069],[76.657238,9.397898],[76.657133,9.397714],[76.657014,9.397505],[76.656965,9.39742],[76.657214,9.397158],[76.657518,9.396779],[76.657501,9.396634],[76.65742,9.39646],[76.657317,9.396352],[76.657068,9.396095],[76.656876,9.395895],[76.656778,9.395806],[76.656614,9.395656],[76.656451,9.395545],[76.656318,9.395445],[76.656197,9.395261],[76.656145,9.395172],[76.656072,9.395017],[76.656041,9.394895],[76.656012,9.394643],[76.656008,9.394457],[76.655963,9.394282],[76.656135,9.39407],[76.65625,9.393965],[76.656383,9.393812],[76.656482,9.393625],[76.656536,9.393547],[76.656688,9.393397],[76.656818,9.393208],[76.656859,9.393079],[76.656915,9.392932],[76.657036,9.392782],[76.657115,9.392719],[76.657207,9.392639],[76.657312,9.392558],[76.657385,9.392491],[76.657446,9.392405],[76.657475,9.392273],[76.657485,9.392094],[76.657454,9.391956],[76.657461,9.391812],[76.657486,9.39156],[76.657514,9.391372],[76.657558,9.391119],[76.657629,9.390919],[76.657673,9.390749],[76.657715,9.39054],[76.657734,9.390386],[76.657702,9.390199],[76.657631,9.39004],[76.657612,9.389914],[76.65758,9.389799],[76.657564,9.389588],[76.657529,9.389358],[76.657498,9.3892],[76.657458,9.38906],[76.657403,9.38892],[76.657241,9.388622],[76.657125,9.38845],[76.657323,9.388408],[76.657472,9.388445],[76.657692,9.388479],[76.657873,9.388463],[76.65798,9.388469],[76.658164,9.388473],[76.658375,9.388467],[76.658615,9.388518],[76.658707,9.388506],[76.658861,9.388472],[76.658971,9.388327],[76.659048,9.388184],[76.65912,9.388103],[76.659168,9.388017],[76.659237,9.3879],[76.659281,9.38779],[76.659356,9.387625],[76.659411,9.387508],[76.65947,9.387407],[76.659562,9.387293],[76.659635,9.387178],[76.659715,9.387061],[76.659833,9.386879],[76.659906,9.386757],[76.660023,9.386578],[76.660119,9.386416],[76.660209,9.386254],[76.660351,9.386147],[76.660484,9.386094],[76.660565,9.386052],[76.660756,9.38597],[76.660923,9.386041],[76.660942,9.386213],[76.660869,9.386337],[76.660809,9.386466],[76.660742,9.386591],[76.660683,9.386708],[76.660628,9.386855],[76.660574,9.387161],[76.66057,9.387374],[76.660569,9.387517],[76.660533,9.387623],[76.66033,9.387788],[76.660204,9.387967],[76.660155,9.388085],[76.660099,9.388187],[76.660023,9.388328],[76.659941,9.388485],[76.659881,9.388637],[76.659849,9.388831],[76.65983,9.38898],[76.659801,9.389169],[76.659766,9.389258],[76.659713,9.38938],[76.659596,9.389607],[76.659543,9.389777],[76.659488,9.38996],[76.659422,9.390133],[76.659362,9.390437],[76.659299,9.390758],[76.65924,9.390998],[76.659224,9.391138],[76.659205,9.391278],[76.659201,9.391511],[76.659195,9.391661],[76.659203,9.391847],[76.659224,9.392006],[76.659242,9.39214],[76.659276,9.392311],[76.659291,9.392456],[76.659265,9.392562],[76.659226,9.392654],[76.659171,9.392751],[76.659125,9.392834],[76.659104,9.392997],[76.659113,9.393186],[76.659133,9.39329],[76.659341,9.393309],[76.659466,9.393307],[76.659606,9.39327],[76.659785,9.393215],[76.659919,9.393178],[76.660153,9.393164],[76.660253,9.393158],[76.660431,9.393356],[76.660456,9.393563],[76.660491,9.393735],[76.660496,9.393957],[76.660514,9.394131],[76.660527,9.394246],[76.660539,9.394351],[76.660547,9.394689],[76.660717,9.394703],[76.660835,9.39467],[76.661007,9.394621],[76.661177,9.394589],[76.661289,9.394529],[76.661479,9.394411],[76.661608,9.394315],[76.661665,9.394214],[76.661873,9.394066],[76.662023,9.393954],[76.662201,9.393791],[76.662346,9.393682],[76.662493,9.393589],[76.662467,9.393412],[76.662469,9.393277],[76.662484,9.393184],[76.662549,9.393001],[76.662576,9.392892],[76.662612,9.392806],[76.662675,9.392688],[76.662877,9.392363],[76.662943,9.392271],[76.663037,9.392112],[76.663172,9.391978],[76.663247,9.391891],[76.6633,9.391776],[76.663448,9.391576],[76.663525,9.391473],[76.663582,9.391401],[76.663626,9.391304],[76.663649,9.391204],[76.66368,9.391079],[76.663892,9.390783],[76.664051,9.390599],[76.664177,9.390492],[76.664248,9.390392],[76.664307,9.390242],[76.664387,9.390108],[76.664463,9.390032],[76.66472,9.389903],[76.664919,9.389856],[76.664808,9.390231],[76.664751,9.39062],[76.664735,9.390822],[76.664715,9.391077],[76.664634,9.39127],[76.664602,9.391448],[76.664598,9.391648],[76.664587,9.39182],[76.664549,9.392021],[76.664477,9.392173],[76.664407,9.392262],[76.664291,9.392465],[76.664189,9.392627],[76.664111,9.392751],[76.664046,9.39297],[76.663962,9.393189],[76.663877,9.393362],[76.663836,9.393572],[76.663762,9.393855],[76.66372,9.394004],[76.663671,9.39413],[76.663561,9.394315],[76.663523,9.394414],[76.663459,9.394555],[76.663408,9.394709],[76.663378,9.394816],[76.663369,9.39496],[76.663481,9.394977],[76.663646,9.394996],[76.663766,9.394994],[76.66388,9.395009],[76.663976,9.395038],[76.66405,9.395104],[76.664161,9.395161],[76.664314,9.395162],[76.664443,9.395159],[76.664583,9.39515],[76.664674,9.395137],[76.664799,9.395093],[76.665031,9.395005],[76.665156,9.394971],[76.665296,9.395223],[76.665364,9.395381],[76.665791,9.395478],[76.665921,9.395825],[76.666133,9.395848],[76.666236,9.395853],[76.666476,9.39593],[76.66667,9.396052],[76.666871,9.396183],[76.667089,9.396331],[76.667173,9.396404],[76.667322,9.396424],[76.667384,9.396595],[76.667754,9.39677],[76.667736,9.39692],[76.667721,9.397172],[76.667713,9.397281],[76.667698,9.397499],[76.667688,9.397648],[76.667674,9.397782],[76.667664,9.397876],[76.667643,9.398065],[76.667632,9.398204],[76.667621,9.398323],[76.667589,9.398901],[76.667459,9.398897],[76.667287,9.398891],[76.666817,9.398865],[76.666549,9.39885],[76.666427,9.398892],[76.66631,9.398928],[76.666278,9.399219],[76.666531,9.399605],[76.666598,9.399762],[76.666667,9.399923],[76.666676,9.400103],[76.666477,9.400247],[76.666304,9.400291],[76.666202,9.400297],[76.666086,9.400359],[76.665995,9.400364],[76.665845,9.400362],[76.665608,9.400403],[76.665483,9.400426],[76.665339,9.400502],[76.665167,9.400586],[76.664992,9.400627],[76.66482,9.400692],[76.664609,9.400768],[76.664256,9.400899],[76.664152,9.400939],[76.664004,9.400996],[76.664066,9.401362],[76.664203,9.40136],[76.664462,9.401343],[76.664573,9.401327],[76.664942,9.401273],[76.665094,9.401282],[76.665275,9.401357],[76.665359,9.401682],[76.665312,9.40199],[76.665278,9.402163],[76.665106,9.402427],[76.664913,9.402731],[76.664912,9.402862],[76.664999,9.402922],[76.665093,9.402925],[76.665341,9.402819],[76.665495,9.402762],[76.665451,9.402926]]]},\"properties\":{\"Created_Da\":\"2024-10-20T16:25:38.444Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Remarks\":\"Kallupalam\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"KALLUPALAM\",\"Ward_No\":\"3\",\"Mandal\":\"Mallappally\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.670017,9.384915],[76.670016,9.384775],[76.67002,9.38462],[76.670035,9.384322],[76.67004,9.384231],[76.670066,9.384085],[76.670135,9.383834],[76.670378,9.382146],[76.670481,9.381758],[76.670597,9.381458],[76.670657,9.381188],[76.67075,9.380708],[76.670838,9.380297],[76.671013,9.380218],[76.671185,9.380197],[76.671306,9.380178],[76.671479,9.380172],[76.671598,9.380215],[76.671729,9.380262],[76.671906,9.380249],[76.671998,9.380243],[76.672111,9.380234],[76.672224,9.380226],[76.67227,9.380146],[76.672329,9.380045],[76.672585,9.379886],[76.672798,9.379752],[76.672938,9.379675],[76.672962,9.379389],[76.672875,9.379218],[76.672774,9.379021],[76.672774,9.378886],[76.67292,9.378677],[76.672956,9.378583],[76.673094,9.378423],[76.673156,9.378302],[76.673213,9.378191],[76.673311,9.37819],[76.673369,9.378043],[76.673434,9.37794],[76.673468,9.377855],[76.673377,9.377758],[76.673569,9.377496],[76.673666,9.377413],[76.673897,9.377385],[76.674046,9.377377],[76.674172,9.37737],[76.674346,9.377368],[76.674435,9.377463],[76.674536,9.377493],[76.67479,9.377567],[76.675063,9.377573],[76.675186,9.377576],[76.675429,9.377745],[76.675492,9.377952],[76.675572,9.37811],[76.675718,9.378202],[76.675922,9.378262],[76.67617,9.378271],[76.676271,9.378274],[76.676398,9.378279],[76.676644,9.378292],[76.676805,9.378301],[76.677122,9.378384],[76.677302,9.378374],[76.677471,9.378364],[76.677639,9.378362],[76.677839,9.378454],[76.677928,9.378495],[76.678065,9.378537],[76.678342,9.378622],[76.678462,9.378719],[76.678656,9.378876],[76.679248,9.379057],[76.679226,9.379239],[76.679167,9.379731],[76.679198,9.380214],[76.679155,9.380473],[76.679136,9.380762],[76.679279,9.381236],[76.679454,9.381476],[76.679802,9.381508],[76.679839,9.381647],[76.679936,9.382013],[76.679977,9.382168],[76.680043,9.382416],[76.680051,9.382909],[76.680053,9.383039],[76.680055,9.383159],[76.680057,9.383305],[76.679879,9.383322],[76.679788,9.383202],[76.679774,9.383009],[76.679787,9.382836],[76.67976,9.382711],[76.679718,9.382573],[76.679634,9.38241],[76.67952,9.382283],[76.67939,9.382246],[76.679256,9.382271],[76.679144,9.382309],[76.679038,9.382311],[76.678913,9.382296],[76.67874,9.382272],[76.67863,9.382214],[76.678617,9.382083],[76.678663,9.381996],[76.678657,9.381898],[76.678626,9.381798],[76.678518,9.38182],[76.678407,9.381903],[76.678121,9.382172],[76.67794,9.382347],[76.677892,9.382502],[76.67772,9.382668],[76.677557,9.382817],[76.677418,9.382959],[76.676944,9.38321],[76.676763,9.383265],[76.676659,9.383348],[76.676344,9.383645],[76.676225,9.383787],[76.676142,9.383878],[76.676002,9.384021],[76.675909,9.384219],[76.675852,9.384324],[76.675731,9.38442],[76.675612,9.384545],[76.675512,9.384722],[76.675423,9.384942],[76.675368,9.385121],[76.675278,9.385353],[76.675184,9.385457],[76.675105,9.385526],[76.67499,9.385575],[76.67486,9.385602],[76.674689,9.385656],[76.674493,9.385658],[76.674396,9.38566],[76.674159,9.385642],[76.673981,9.385657],[76.673907,9.385728],[76.673799,9.385784],[76.673649,9.385827],[76.673496,9.385829],[76.673397,9.385757],[76.673279,9.385599],[76.673185,9.385515],[76.673014,9.385488],[76.672796,9.385536],[76.672722,9.385615],[76.672599,9.385745],[76.672275,9.386001],[76.671978,9.386143],[76.671576,9.386317],[76.671431,9.386474],[76.671391,9.38657],[76.671267,9.386627],[76.671225,9.386462],[76.671143,9.38652],[76.671085,9.38664],[76.670984,9.386773],[76.670884,9.386874],[76.670804,9.386652],[76.670644,9.38669],[76.670543,9.386804],[76.670492,9.386898],[76.670415,9.386997],[76.670301,9.38713],[76.67024,9.386824],[76.670258,9.386327],[76.670212,9.385847],[76.670195,9.385686],[76.670179,9.385547],[76.670162,9.385411],[76.670103,9.385206],[76.670024,9.385056],[76.670017,9.384915]]]},\"properties\":{\"Created_Da\":\"2024-10-21T07:39:19.095Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Puramattom\",\"Lsgd_Type\":\"Grama Panchayat\",\"Mob_No\":\"9447184727\",\"Surveyor\":\"Muhammad Shafi A\",\"Ward_Name\":\"MEMALA\",\"Ward_No\":\"10\",\"Mandal\":\"Mallappally\"}}]}");
@@ -0,0 +1 @@
+export default JSON.parse("{\"type\":\"FeatureCollection\",\"features\":[{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.578139,9.401468],[76.577676,9.401446],[76.577413,9.401406],[76.577072,9.401927],[76.576628,9.402603],[76.576016,9.403216],[76.575034,9.404128],[76.574628,9.403619],[76.57584,9.402592],[76.576383,9.401775],[76.576648,9.401526],[76.576561,9.401448],[76.576405,9.401594],[76.575888,9.401418],[76.575782,9.40137],[76.5759,9.401023],[76.574984,9.400416],[76.574323,9.399402],[76.574523,9.399278],[76.574684,9.399242],[76.574707,9.399041],[76.574617,9.398817],[76.574527,9.398594],[76.574422,9.398162],[76.573855,9.398214],[76.573639,9.398234],[76.572444,9.398346],[76.572301,9.398359],[76.572154,9.398373],[76.571762,9.398376],[76.571797,9.397871],[76.571753,9.39727],[76.571674,9.396853],[76.571558,9.396457],[76.570955,9.396437],[76.570396,9.396235],[76.570383,9.395938],[76.570397,9.395729],[76.570223,9.395402],[76.57028,9.395302],[76.570562,9.395014],[76.571017,9.394313],[76.571082,9.394213],[76.571291,9.393832],[76.571506,9.393454],[76.571605,9.393342],[76.571903,9.393434],[76.572029,9.393436],[76.572153,9.393437],[76.572371,9.393467],[76.572564,9.393489],[76.572695,9.393493],[76.572785,9.393478],[76.572889,9.393434],[76.573115,9.393386],[76.573217,9.393384],[76.573349,9.393362],[76.573681,9.393424],[76.573774,9.39336],[76.573879,9.393359],[76.574018,9.394373],[76.574146,9.394381],[76.574311,9.394376],[76.574803,9.394463],[76.574818,9.394608],[76.574846,9.394742],[76.57485,9.395125],[76.574938,9.395214],[76.574956,9.395365],[76.574991,9.395518],[76.575003,9.395618],[76.575041,9.395771],[76.575093,9.395939],[76.575227,9.395919],[76.575936,9.395889],[76.57684,9.396072],[76.577311,9.396199],[76.577409,9.396213],[76.577618,9.396269],[76.578315,9.39615],[76.578432,9.396097],[76.578609,9.396615],[76.578675,9.396875],[76.578727,9.397073],[76.578798,9.397242],[76.57891,9.397467],[76.579063,9.397814],[76.579121,9.397949],[76.579211,9.398155],[76.579355,9.398499],[76.579366,9.398661],[76.579355,9.398812],[76.579343,9.398964],[76.579291,9.399204],[76.579323,9.399355],[76.579368,9.39958],[76.579414,9.399767],[76.579425,9.39993],[76.579416,9.400026],[76.579436,9.400173],[76.579471,9.400298],[76.579507,9.400422],[76.579539,9.400575],[76.579558,9.400715],[76.579576,9.400851],[76.579594,9.400988],[76.579619,9.401191],[76.579644,9.401396],[76.579671,9.401572],[76.579698,9.401749],[76.579346,9.401656],[76.578923,9.401545],[76.578467,9.401433],[76.578286,9.401451],[76.578139,9.401468]]]},\"properties\":{\"Created_Da\":\"2024-10-21T10:44:42.278Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"athulya m g\",\"Ward_Name\":\"J P NAGAR\",\"Ward_No\":\"37\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.56801,9.3672],[76.568105,9.367044],[76.568793,9.367455],[76.568943,9.367545],[76.569318,9.367705],[76.569762,9.367893],[76.570003,9.367996],[76.570265,9.368061],[76.570511,9.368121],[76.57102,9.368236],[76.571225,9.368283],[76.571426,9.368325],[76.571715,9.368385],[76.572081,9.368461],[76.572208,9.368479],[76.572435,9.368513],[76.572591,9.368535],[76.572765,9.368505],[76.573077,9.368449],[76.573324,9.368367],[76.573485,9.368292],[76.573697,9.368193],[76.573972,9.368144],[76.574179,9.368148],[76.574273,9.368154],[76.574475,9.368194],[76.574566,9.368212],[76.574687,9.368224],[76.574859,9.36825],[76.575076,9.368283],[76.575186,9.368283],[76.575542,9.368282],[76.575802,9.368251],[76.57618,9.368252],[76.575923,9.368548],[76.575514,9.368501],[76.575184,9.36859],[76.575126,9.368805],[76.575082,9.368972],[76.575008,9.369231],[76.574923,9.369386],[76.574877,9.369467],[76.574739,9.369515],[76.574562,9.36957],[76.574395,9.36959],[76.574296,9.369601],[76.574093,9.369618],[76.573889,9.369636],[76.573734,9.369663],[76.573598,9.369863],[76.573498,9.370021],[76.573338,9.370101],[76.572995,9.370081],[76.572793,9.37007],[76.572518,9.36998],[76.572403,9.370222],[76.572527,9.370592],[76.572586,9.370841],[76.572613,9.371013],[76.572627,9.37115],[76.572639,9.371315],[76.572642,9.371429],[76.572434,9.371421],[76.572314,9.371384],[76.571751,9.371227],[76.571429,9.371219],[76.571147,9.371213],[76.571042,9.37137],[76.571107,9.37155],[76.571142,9.371676],[76.571058,9.372204],[76.571094,9.372819],[76.571276,9.373249],[76.571167,9.37353],[76.571225,9.373708],[76.57132,9.373994],[76.571423,9.374134],[76.571585,9.37417],[76.571723,9.374223],[76.571873,9.374256],[76.572187,9.374326],[76.572616,9.374383],[76.572609,9.374616],[76.572604,9.374752],[76.57257,9.374968],[76.572386,9.375374],[76.572385,9.375611],[76.572385,9.375948],[76.572386,9.37615],[76.571885,9.376289],[76.571763,9.376313],[76.57161,9.376365],[76.571352,9.376407],[76.571194,9.376444],[76.571072,9.376509],[76.570927,9.376574],[76.570928,9.376466],[76.570951,9.376283],[76.570845,9.376283],[76.570574,9.376258],[76.570571,9.376062],[76.570568,9.375901],[76.570566,9.375754],[76.570723,9.375267],[76.570853,9.374817],[76.570901,9.374712],[76.570926,9.374599],[76.570949,9.374499],[76.570855,9.37446],[76.569973,9.374026],[76.569787,9.37393],[76.569602,9.373834],[76.569335,9.373697],[76.568451,9.373441],[76.56833,9.373406],[76.56822,9.373374],[76.567636,9.373273],[76.567623,9.37309],[76.567609,9.372897],[76.567598,9.372748],[76.5676,9.372624],[76.567632,9.372537],[76.567721,9.372301],[76.567751,9.372082],[76.567813,9.371764],[76.567757,9.371649],[76.567637,9.37158],[76.567506,9.371444],[76.567416,9.371384],[76.567313,9.371327],[76.567187,9.371294],[76.567083,9.371297],[76.566986,9.371299],[76.56684,9.371271],[76.566697,9.371166],[76.566564,9.371148],[76.566369,9.371054],[76.566172,9.37098],[76.566043,9.370829],[76.565965,9.370522],[76.565976,9.370427],[76.566002,9.370215],[76.566038,9.37004],[76.56607,9.369891],[76.566307,9.369556],[76.566441,9.369335],[76.56696,9.368956],[76.567072,9.368733],[76.567161,9.368555],[76.567343,9.368289],[76.567526,9.368021],[76.567617,9.367889],[76.567706,9.36758],[76.567881,9.367375],[76.567962,9.36728],[76.56801,9.3672]]]},\"properties\":{\"Created_Da\":\"2024-10-21T11:55:26.236Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"athulya m g\",\"Ward_Name\":\"THUKALLASSERY\",\"Ward_No\":\"24\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.549505,9.384216],[76.549813,9.383969],[76.550094,9.383745],[76.550425,9.383527],[76.550417,9.383306],[76.550403,9.382915],[76.550355,9.382595],[76.550478,9.382138],[76.550573,9.381972],[76.550799,9.381754],[76.55109,9.381709],[76.551391,9.381644],[76.551493,9.380889],[76.551788,9.380801],[76.552183,9.380683],[76.552368,9.380596],[76.552523,9.380526],[76.552735,9.380376],[76.553026,9.380159],[76.553181,9.380007],[76.553299,9.379892],[76.55341,9.379754],[76.553564,9.379461],[76.553748,9.379109],[76.553951,9.379191],[76.554366,9.379232],[76.554565,9.379252],[76.554592,9.379369],[76.554573,9.379659],[76.554549,9.379898],[76.55449,9.380165],[76.554453,9.38039],[76.554426,9.380554],[76.554715,9.380631],[76.554847,9.380679],[76.554979,9.380728],[76.555138,9.380718],[76.55527,9.380691],[76.55544,9.38066],[76.555597,9.380642],[76.555869,9.380654],[76.555894,9.380774],[76.555919,9.380963],[76.55587,9.381181],[76.555585,9.381259],[76.555497,9.381298],[76.555362,9.381357],[76.555282,9.381508],[76.555284,9.381629],[76.555336,9.381772],[76.555387,9.381935],[76.555448,9.382103],[76.555442,9.382212],[76.555438,9.382334],[76.555664,9.382521],[76.55581,9.382558],[76.555928,9.38259],[76.556063,9.382564],[76.556179,9.382552],[76.556279,9.382542],[76.556312,9.382682],[76.556407,9.382802],[76.556618,9.382799],[76.556778,9.382724],[76.556766,9.382476],[76.556769,9.382367],[76.556843,9.382275],[76.557168,9.382194],[76.557265,9.382167],[76.557443,9.382148],[76.557531,9.382118],[76.557626,9.382116],[76.557757,9.38204],[76.557975,9.382065],[76.558061,9.381872],[76.558101,9.381693],[76.558129,9.381595],[76.558168,9.381506],[76.558273,9.381541],[76.55845,9.381712],[76.55849,9.381814],[76.558567,9.381928],[76.558669,9.38209],[76.55876,9.382202],[76.558808,9.382289],[76.558867,9.382542],[76.558863,9.382662],[76.558857,9.382826],[76.55887,9.383076],[76.558866,9.383272],[76.558887,9.383545],[76.558894,9.383785],[76.558898,9.383879],[76.558891,9.384076],[76.558884,9.384208],[76.558891,9.384308],[76.558914,9.384509],[76.558927,9.384827],[76.558936,9.384937],[76.558951,9.385144],[76.558961,9.385345],[76.558988,9.385522],[76.558897,9.385587],[76.558783,9.385646],[76.558609,9.38574],[76.558545,9.385823],[76.558505,9.386006],[76.55849,9.386152],[76.558494,9.386395],[76.558492,9.386525],[76.558477,9.386755],[76.558481,9.386863],[76.558406,9.387036],[76.558237,9.387307],[76.55819,9.387486],[76.558191,9.387796],[76.558207,9.387907],[76.558215,9.388007],[76.558243,9.388107],[76.558137,9.388269],[76.55803,9.388344],[76.557877,9.388415],[76.557751,9.388435],[76.557647,9.388452],[76.557482,9.3885],[76.557315,9.388637],[76.55725,9.388716],[76.557087,9.388912],[76.556899,9.38912],[76.556661,9.389313],[76.556678,9.389517],[76.556692,9.389655],[76.55669,9.389749],[76.556545,9.389863],[76.556254,9.389863],[76.556039,9.389842],[76.555572,9.389779],[76.555386,9.389731],[76.555464,9.389588],[76.555556,9.389485],[76.555648,9.389381],[76.555654,9.389248],[76.55566,9.389112],[76.555664,9.388976],[76.555658,9.38883],[76.555663,9.388667],[76.555675,9.388561],[76.55569,9.38842],[76.555713,9.388257],[76.555726,9.388089],[76.555716,9.387952],[76.555712,9.387805],[76.555682,9.387667],[76.555635,9.387549],[76.555559,9.387418],[76.555422,9.387382],[76.555305,9.387357],[76.555182,9.387405],[76.555047,9.387393],[76.554886,9.387371],[76.554862,9.387208],[76.554844,9.387035],[76.55483,9.386768],[76.554607,9.386598],[76.554483,9.386426],[76.55449,9.386239],[76.554409,9.386079],[76.554329,9.385878],[76.55428,9.385702],[76.554241,9.385559],[76.55404,9.385496],[76.553839,9.385477],[76.553667,9.385578],[76.553474,9.385676],[76.553401,9.385604],[76.553272,9.385502],[76.553159,9.385472],[76.55301,9.385489],[76.552901,9.385516],[76.552685,9.385576],[76.552454,9.385586],[76.552213,9.38561],[76.551932,9.385619],[76.5518,9.385624],[76.551696,9.385727],[76.551694,9.385897],[76.551697,9.386009],[76.5517,9.386114],[76.551703,9.386218],[76.551708,9.38633],[76.551726,9.386577],[76.551729,9.38667],[76.551727,9.386814],[76.551725,9.387005],[76.551717,9.387096],[76.551703,9.387225],[76.551684,9.387356],[76.551665,9.3875],[76.551475,9.387488],[76.551349,9.387465],[76.551164,9.387413],[76.55106,9.387384],[76.550847,9.387369],[76.550612,9.387302],[76.550339,9.387165],[76.550551,9.387005],[76.551074,9.386679],[76.551247,9.386572],[76.551331,9.386179],[76.551343,9.386074],[76.551368,9.385843],[76.551382,9.385707],[76.551365,9.385399],[76.551357,9.385102],[76.551287,9.385001],[76.551144,9.384837],[76.550986,9.384699],[76.550829,9.38461],[76.550347,9.384651],[76.550253,9.384708],[76.550097,9.384802],[76.549853,9.385047],[76.549721,9.385083],[76.549473,9.385152],[76.549236,9.385004],[76.549184,9.384763],[76.549199,9.384658],[76.549337,9.384447],[76.549431,9.384285],[76.549505,9.384216]]]},\"properties\":{\"Created_Da\":\"2024-10-17T11:03:17.621Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"8086543055\",\"Surveyor\":\"Dipin raj rv\",\"Ward_Name\":\"UTHRAMEL\",\"Ward_No\":\"29\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.567236,9.390696],[76.567141,9.390676],[76.567058,9.390618],[76.566988,9.390521],[76.56696,9.39043],[76.566994,9.390237],[76.567024,9.390085],[76.567065,9.389931],[76.567111,9.389751],[76.567154,9.389559],[76.567186,9.389397],[76.567228,9.389081],[76.567232,9.388969],[76.567272,9.388746],[76.567655,9.388803],[76.56794,9.388846],[76.568087,9.388868],[76.568258,9.388902],[76.568701,9.388939],[76.568964,9.38889],[76.569287,9.38876],[76.569474,9.388731],[76.569663,9.3887],[76.569778,9.388704],[76.569943,9.388644],[76.570072,9.38852],[76.570171,9.388463],[76.57027,9.388411],[76.570353,9.388276],[76.570426,9.388157],[76.571372,9.387874],[76.571475,9.387848],[76.571978,9.387943],[76.572716,9.388118],[76.573466,9.388038],[76.573664,9.38802],[76.573862,9.388003],[76.574476,9.387954],[76.575031,9.387909],[76.575157,9.388862],[76.574941,9.389118],[76.574841,9.389235],[76.574601,9.389575],[76.574375,9.389859],[76.574201,9.390079],[76.574039,9.390154],[76.573878,9.390229],[76.573708,9.390279],[76.573428,9.390362],[76.57327,9.390409],[76.5731,9.390456],[76.572908,9.390562],[76.572799,9.390757],[76.572695,9.391005],[76.572651,9.391128],[76.572595,9.391344],[76.572568,9.391433],[76.572531,9.391571],[76.572425,9.391764],[76.572216,9.392224],[76.572125,9.39238],[76.572004,9.392537],[76.571922,9.392718],[76.571792,9.392923],[76.571701,9.393096],[76.571605,9.393342],[76.571506,9.393454],[76.571291,9.393832],[76.571082,9.394213],[76.571017,9.394313],[76.570562,9.395014],[76.57028,9.395302],[76.570223,9.395402],[76.570117,9.395468],[76.569508,9.395841],[76.568818,9.396322],[76.568372,9.396598],[76.568015,9.396825],[76.567302,9.397095],[76.566838,9.397517],[76.565919,9.398255],[76.565427,9.398887],[76.565136,9.39926],[76.564177,9.40013],[76.563893,9.400452],[76.563647,9.400765],[76.56337,9.401197],[76.563133,9.401537],[76.562863,9.402175],[76.562022,9.403253],[76.561858,9.403301],[76.56176,9.40315],[76.561637,9.402961],[76.561577,9.402798],[76.561513,9.402625],[76.561454,9.402492],[76.561377,9.402319],[76.561286,9.402093],[76.561251,9.401919],[76.561292,9.401743],[76.561289,9.401549],[76.561305,9.40138],[76.561276,9.401241],[76.561238,9.401062],[76.561261,9.400874],[76.561209,9.400742],[76.561131,9.400647],[76.560884,9.400407],[76.560677,9.400142],[76.560602,9.399812],[76.560554,9.399678],[76.560526,9.399578],[76.560498,9.399483],[76.560417,9.399351],[76.560348,9.399238],[76.560217,9.399113],[76.560101,9.399004],[76.559973,9.398882],[76.559919,9.398797],[76.560094,9.398677],[76.560293,9.398605],[76.56049,9.398473],[76.560675,9.398456],[76.56097,9.398444],[76.561079,9.398449],[76.561232,9.398455],[76.561406,9.398468],[76.561555,9.398457],[76.561705,9.398446],[76.562005,9.398447],[76.562125,9.398448],[76.562628,9.398444],[76.562762,9.398453],[76.562862,9.398461],[76.563197,9.39838],[76.563356,9.398342],[76.563376,9.398117],[76.56339,9.397963],[76.563463,9.397532],[76.563442,9.397102],[76.563502,9.396729],[76.56353,9.396555],[76.563639,9.396384],[76.563688,9.39625],[76.563751,9.396101],[76.563777,9.395784],[76.563773,9.39567],[76.563768,9.395557],[76.563777,9.395361],[76.563781,9.395269],[76.563786,9.395168],[76.563796,9.394958],[76.563762,9.394863],[76.563669,9.394648],[76.563461,9.394414],[76.563291,9.394208],[76.563166,9.394056],[76.563039,9.3939],[76.56308,9.393715],[76.563101,9.393575],[76.563119,9.393463],[76.563184,9.39332],[76.563342,9.393381],[76.563645,9.393579],[76.564454,9.393697],[76.565487,9.393466],[76.566014,9.393499],[76.566112,9.393195],[76.566537,9.393146],[76.566655,9.392614],[76.566697,9.392532],[76.56675,9.392429],[76.567067,9.392114],[76.567147,9.392026],[76.567284,9.392008],[76.56743,9.391979],[76.567496,9.391909],[76.567473,9.391721],[76.56744,9.391526],[76.567408,9.391414],[76.567324,9.391122],[76.567236,9.390696]]]},\"properties\":{\"Created_Da\":\"2024-10-18T17:45:42.596Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Remarks\":\"Nill\",\"Surveyor\":\"ATHULYA M G\",\"Ward_Name\":\"MUTHOOR\",\"Ward_No\":\"39\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.593251,9.371862],[76.593097,9.371895],[76.593003,9.371916],[76.592847,9.371942],[76.592741,9.371947],[76.592603,9.371929],[76.592492,9.371903],[76.592165,9.371816],[76.591839,9.37179],[76.591647,9.371715],[76.591581,9.37165],[76.591389,9.371464],[76.591308,9.37138],[76.591169,9.371246],[76.59094,9.371162],[76.590789,9.371188],[76.590517,9.371252],[76.590322,9.371249],[76.590186,9.371218],[76.590043,9.371147],[76.589965,9.371099],[76.58974,9.3709],[76.589496,9.37066],[76.589344,9.370536],[76.589233,9.370445],[76.589116,9.370358],[76.589034,9.370284],[76.588916,9.370193],[76.588798,9.370105],[76.588709,9.370017],[76.58862,9.36995],[76.588349,9.36983],[76.588187,9.369785],[76.588014,9.369738],[76.58787,9.36969],[76.58771,9.369622],[76.587595,9.369573],[76.587432,9.36951],[76.587211,9.369419],[76.587076,9.369365],[76.586935,9.36931],[76.586783,9.369252],[76.586614,9.369164],[76.586496,9.369056],[76.586406,9.368946],[76.586206,9.368742],[76.586119,9.368651],[76.585993,9.368532],[76.585856,9.36847],[76.585739,9.36845],[76.585643,9.368452],[76.585443,9.368461],[76.58528,9.368477],[76.58513,9.368457],[76.58495,9.368376],[76.584714,9.368274],[76.584572,9.368227],[76.584432,9.368188],[76.5843,9.368166],[76.58415,9.368165],[76.583998,9.368142],[76.583825,9.368125],[76.58371,9.368113],[76.58361,9.368079],[76.583369,9.368017],[76.583159,9.367963],[76.582974,9.367917],[76.582776,9.367856],[76.582688,9.367829],[76.582996,9.367673],[76.583114,9.367613],[76.583263,9.367474],[76.583411,9.367336],[76.583607,9.367137],[76.583763,9.366718],[76.583804,9.366611],[76.583979,9.365954],[76.584209,9.365399],[76.583821,9.365357],[76.583823,9.365082],[76.583818,9.364935],[76.583813,9.364798],[76.583577,9.364564],[76.583404,9.364392],[76.583292,9.364372],[76.583159,9.36435],[76.582668,9.364269],[76.582353,9.364365],[76.581718,9.364396],[76.581657,9.364098],[76.581586,9.363894],[76.581179,9.364025],[76.580996,9.363984],[76.580888,9.363888],[76.580799,9.363833],[76.580612,9.363904],[76.579616,9.364553],[76.579405,9.364144],[76.579335,9.364024],[76.579247,9.363944],[76.579056,9.363795],[76.578498,9.362886],[76.578392,9.362884],[76.578186,9.36288],[76.578033,9.362899],[76.577831,9.362926],[76.577594,9.362956],[76.576902,9.363033],[76.57663,9.363045],[76.57627,9.362922],[76.576168,9.36289],[76.576041,9.362915],[76.57587,9.362933],[76.57551,9.36313],[76.575736,9.36379],[76.575819,9.36403],[76.575494,9.364182],[76.57526,9.364336],[76.575135,9.364064],[76.574904,9.363552],[76.574877,9.362778],[76.574879,9.362585],[76.574892,9.362313],[76.57491,9.362091],[76.574959,9.361714],[76.575059,9.361344],[76.575119,9.361124],[76.575255,9.360811],[76.575492,9.360264],[76.57553,9.360175],[76.5762,9.360216],[76.576372,9.360226],[76.576752,9.360295],[76.577022,9.360385],[76.577896,9.360804],[76.578703,9.361153],[76.578923,9.361265],[76.579415,9.361529],[76.579715,9.361702],[76.580155,9.361962],[76.580233,9.36201],[76.580548,9.362229],[76.580716,9.362346],[76.580993,9.362563],[76.58114,9.362679],[76.581756,9.36307],[76.582321,9.363264],[76.582697,9.363268],[76.582839,9.363236],[76.58311,9.363154],[76.583264,9.363073],[76.583428,9.36296],[76.584073,9.362445],[76.584287,9.362263],[76.584812,9.361793],[76.584895,9.361727],[76.585466,9.361258],[76.585707,9.361129],[76.585918,9.361016],[76.586234,9.360924],[76.586327,9.360929],[76.586648,9.360947],[76.58683,9.360975],[76.586957,9.361068],[76.587123,9.36119],[76.587311,9.3613],[76.587515,9.361508],[76.587798,9.361795],[76.588065,9.362051],[76.588438,9.362409],[76.588695,9.362646],[76.589023,9.362947],[76.589277,9.36318],[76.589673,9.363792],[76.589692,9.36389],[76.589803,9.364455],[76.589781,9.364774],[76.589828,9.365069],[76.589781,9.365619],[76.589817,9.365828],[76.589881,9.366535],[76.590098,9.367302],[76.590198,9.367669],[76.590297,9.368036],[76.590465,9.368282],[76.59056,9.36834],[76.590821,9.368501],[76.591257,9.368603],[76.591445,9.368638],[76.591795,9.3687],[76.592416,9.368796],[76.592513,9.368812],[76.592947,9.368943],[76.593334,9.36906],[76.593487,9.369108],[76.593786,9.369273],[76.59417,9.369513],[76.594494,9.369716],[76.594907,9.369935],[76.595063,9.37003],[76.595326,9.370175],[76.595571,9.370322],[76.596052,9.370623],[76.596168,9.370654],[76.596081,9.370818],[76.595957,9.370941],[76.595863,9.371018],[76.595717,9.371099],[76.595632,9.371147],[76.595521,9.371219],[76.595357,9.371365],[76.595288,9.371432],[76.595214,9.371504],[76.595127,9.371588],[76.595014,9.371702],[76.594881,9.371716],[76.594751,9.371724],[76.594499,9.371724],[76.594397,9.371729],[76.594259,9.371741],[76.594149,9.371752],[76.594053,9.371742],[76.593949,9.371787],[76.593845,9.371802],[76.593823,9.371669],[76.593251,9.371862]]]},\"properties\":{\"Created_Da\":\"2024-10-18T04:47:27.890Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"Mary Sincy K G\",\"Ward_Name\":\"THONDARA\",\"Ward_No\":\"18\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.594909,9.399268],[76.593755,9.399817],[76.593637,9.399908],[76.593022,9.399958],[76.592912,9.399979],[76.592558,9.40009],[76.592276,9.400088],[76.59215,9.40015],[76.591712,9.400337],[76.59128,9.400519],[76.59113,9.400597],[76.590252,9.401268],[76.58965,9.401856],[76.589458,9.402044],[76.589124,9.40253],[76.588937,9.40299],[76.588813,9.403254],[76.588631,9.403622],[76.588457,9.404007],[76.588251,9.404382],[76.588132,9.404727],[76.588082,9.404838],[76.587993,9.405031],[76.587948,9.405123],[76.587703,9.405619],[76.587534,9.405897],[76.58724,9.405655],[76.586988,9.405394],[76.58692,9.405299],[76.586775,9.405109],[76.5866,9.404934],[76.586526,9.404872],[76.586415,9.404738],[76.586303,9.404604],[76.586139,9.404432],[76.586022,9.404365],[76.585903,9.404142],[76.585432,9.403979],[76.585579,9.403598],[76.585554,9.403392],[76.584904,9.402997],[76.584815,9.402954],[76.584575,9.402772],[76.584178,9.402519],[76.583888,9.402727],[76.583648,9.402979],[76.583396,9.403247],[76.583179,9.403477],[76.583019,9.403419],[76.582936,9.403278],[76.582648,9.403073],[76.582426,9.402934],[76.582071,9.403234],[76.581822,9.403364],[76.58169,9.403489],[76.581563,9.403633],[76.581687,9.403868],[76.581744,9.403971],[76.581966,9.404377],[76.582096,9.404633],[76.582177,9.404765],[76.582236,9.404854],[76.582407,9.405072],[76.582588,9.405313],[76.582683,9.405412],[76.582773,9.405589],[76.582455,9.405386],[76.582105,9.405154],[76.581954,9.405061],[76.581802,9.404967],[76.581625,9.404871],[76.581354,9.404692],[76.581109,9.40455],[76.580904,9.404431],[76.580633,9.404274],[76.580396,9.404122],[76.580208,9.403925],[76.580126,9.403762],[76.580053,9.403642],[76.579983,9.40348],[76.579909,9.403256],[76.579848,9.403057],[76.579808,9.402922],[76.579773,9.402818],[76.579729,9.402689],[76.579729,9.402531],[76.579726,9.402386],[76.579723,9.402291],[76.579715,9.402198],[76.579712,9.402017],[76.579709,9.401879],[76.579698,9.401749],[76.579671,9.401572],[76.579644,9.401396],[76.579619,9.401191],[76.579594,9.400988],[76.579576,9.400851],[76.579558,9.400715],[76.579539,9.400575],[76.579507,9.400422],[76.579471,9.400298],[76.579436,9.400173],[76.579416,9.400026],[76.579425,9.39993],[76.579414,9.399767],[76.579368,9.39958],[76.579323,9.399355],[76.579291,9.399204],[76.579343,9.398964],[76.579519,9.39893],[76.579723,9.398959],[76.57986,9.398976],[76.580078,9.39898],[76.58027,9.398984],[76.580377,9.398983],[76.580521,9.398983],[76.580664,9.39898],[76.580763,9.398979],[76.581089,9.398974],[76.581196,9.398992],[76.581378,9.39897],[76.581584,9.399005],[76.581743,9.399032],[76.581866,9.399052],[76.582077,9.399087],[76.582171,9.399126],[76.582335,9.399173],[76.582492,9.399144],[76.582493,9.399023],[76.582495,9.398874],[76.582506,9.398754],[76.582571,9.398473],[76.582636,9.398344],[76.582767,9.398145],[76.582858,9.398102],[76.582992,9.398043],[76.583147,9.397917],[76.583233,9.397815],[76.583344,9.397709],[76.583456,9.397612],[76.583588,9.397473],[76.583797,9.397297],[76.583869,9.39724],[76.58401,9.397148],[76.584087,9.39699],[76.584107,9.396826],[76.584229,9.396678],[76.584305,9.396568],[76.584363,9.396299],[76.584468,9.396019],[76.584487,9.395881],[76.584505,9.395744],[76.584512,9.395609],[76.584494,9.395517],[76.584469,9.395422],[76.58445,9.395238],[76.584476,9.395076],[76.584475,9.394893],[76.584466,9.394705],[76.58446,9.394575],[76.584451,9.394391],[76.584647,9.39438],[76.584827,9.394371],[76.585033,9.394363],[76.585132,9.394369],[76.585233,9.394425],[76.58538,9.394653],[76.58548,9.394939],[76.585522,9.395086],[76.585568,9.395236],[76.585594,9.395403],[76.585646,9.395501],[76.585972,9.3959],[76.58604,9.395975],[76.58621,9.39611],[76.586418,9.396277],[76.58658,9.396393],[76.586741,9.396493],[76.586883,9.396547],[76.587026,9.396601],[76.587138,9.396637],[76.587269,9.39668],[76.587393,9.396712],[76.587536,9.396771],[76.588194,9.397059],[76.588403,9.397005],[76.588519,9.396984],[76.588756,9.396918],[76.58899,9.396775],[76.589284,9.396484],[76.589454,9.396286],[76.58954,9.396338],[76.589793,9.396492],[76.589934,9.396577],[76.590041,9.396695],[76.590201,9.39687],[76.590426,9.397116],[76.590908,9.397569],[76.591002,9.397657],[76.591346,9.397456],[76.591596,9.397295],[76.591731,9.397208],[76.591826,9.397148],[76.592019,9.397028],[76.592499,9.39673],[76.592597,9.396669],[76.59309,9.396377],[76.593676,9.396136],[76.593678,9.396334],[76.594036,9.396701],[76.594313,9.396837],[76.594385,9.396909],[76.594395,9.397265],[76.5945,9.3974],[76.594667,9.397623],[76.594594,9.397839],[76.594724,9.397899],[76.594819,9.397936],[76.594973,9.397991],[76.595043,9.398226],[76.59513,9.398499],[76.595169,9.39862],[76.594909,9.399268]]]},\"properties\":{\"Created_Da\":\"2024-10-17T08:20:44.472Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9074124773\",\"Remarks\":\"Nil\",\"Surveyor\":\"Suresh c\",\"Ward_Name\":\"COLLEGE WARD\",\"Ward_No\":\"8\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.578432,9.396097],[76.578315,9.39615],[76.577618,9.396269],[76.577409,9.396213],[76.577311,9.396199],[76.57684,9.396072],[76.575936,9.395889],[76.575227,9.395919],[76.575093,9.395939],[76.575041,9.395771],[76.575003,9.395618],[76.574991,9.395518],[76.574956,9.395365],[76.574938,9.395214],[76.57485,9.395125],[76.574846,9.394742],[76.574818,9.394608],[76.574803,9.394463],[76.574311,9.394376],[76.574146,9.394381],[76.574018,9.394373],[76.573879,9.393359],[76.573774,9.39336],[76.573681,9.393424],[76.573349,9.393362],[76.573217,9.393384],[76.573115,9.393386],[76.572889,9.393434],[76.572785,9.393478],[76.572695,9.393493],[76.572564,9.393489],[76.572371,9.393467],[76.572153,9.393437],[76.572029,9.393436],[76.571903,9.393434],[76.571605,9.393342],[76.571701,9.393096],[76.571792,9.392923],[76.571922,9.392718],[76.572004,9.392537],[76.572125,9.39238],[76.572216,9.392224],[76.572425,9.391764],[76.572531,9.391571],[76.572568,9.391433],[76.572595,9.391344],[76.572651,9.391128],[76.572695,9.391005],[76.572799,9.390757],[76.572908,9.390562],[76.5731,9.390456],[76.57327,9.390409],[76.573428,9.390362],[76.573708,9.390279],[76.573878,9.390229],[76.574039,9.390154],[76.574201,9.390079],[76.574375,9.389859],[76.574601,9.389575],[76.574841,9.389235],[76.574941,9.389118],[76.575157,9.388862],[76.575325,9.388886],[76.5756,9.388971],[76.575894,9.389277],[76.576482,9.389352],[76.576787,9.389338],[76.576969,9.38934],[76.577073,9.389336],[76.577177,9.389546],[76.577208,9.389686],[76.577228,9.389854],[76.577246,9.389997],[76.577279,9.390139],[76.57736,9.390292],[76.577482,9.390508],[76.57758,9.390661],[76.577678,9.390813],[76.577787,9.391011],[76.577922,9.391312],[76.577909,9.391468],[76.577897,9.391618],[76.577887,9.391719],[76.577873,9.391864],[76.577852,9.392099],[76.57785,9.39219],[76.577846,9.392434],[76.577842,9.392625],[76.577818,9.39278],[76.577791,9.392956],[76.577772,9.393079],[76.577697,9.393525],[76.577681,9.393631],[76.577715,9.393798],[76.577782,9.393978],[76.577837,9.394125],[76.577894,9.394276],[76.57795,9.394425],[76.578017,9.394604],[76.578053,9.394695],[76.578091,9.394792],[76.578143,9.394924],[76.5782,9.395068],[76.578261,9.395223],[76.57831,9.395347],[76.57833,9.39544],[76.578357,9.395567],[76.578416,9.395865],[76.578432,9.396097]]]},\"properties\":{\"Created_Da\":\"2024-10-18T08:06:48.403Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Remarks\":\"Nill\",\"Surveyor\":\"ATHULYA M G\",\"Ward_Name\":\"RAMANCHIRA\",\"Ward_No\":\"36\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.562577,9.370872],[76.562683,9.370552],[76.562858,9.370295],[76.562832,9.369898],[76.562819,9.3697],[76.56281,9.369289],[76.563008,9.368811],[76.56304,9.368465],[76.563053,9.36824],[76.563078,9.368103],[76.563255,9.367647],[76.563667,9.367216],[76.564054,9.36706],[76.564239,9.366986],[76.564384,9.366925],[76.564579,9.366846],[76.564836,9.366747],[76.565082,9.366654],[76.565327,9.366595],[76.565619,9.366547],[76.565907,9.366521],[76.56636,9.366563],[76.566478,9.366574],[76.566959,9.366573],[76.567364,9.366717],[76.567512,9.366761],[76.567631,9.366817],[76.56789,9.366923],[76.568016,9.366985],[76.568105,9.367044],[76.56801,9.3672],[76.567962,9.36728],[76.567881,9.367375],[76.567706,9.36758],[76.567617,9.367889],[76.567526,9.368021],[76.567343,9.368289],[76.567161,9.368555],[76.567072,9.368733],[76.56696,9.368956],[76.566441,9.369335],[76.566307,9.369556],[76.56607,9.369891],[76.566038,9.37004],[76.566002,9.370215],[76.565976,9.370427],[76.565965,9.370522],[76.566043,9.370829],[76.566172,9.37098],[76.566369,9.371054],[76.566564,9.371148],[76.566697,9.371166],[76.56684,9.371271],[76.566986,9.371299],[76.567083,9.371297],[76.567187,9.371294],[76.567313,9.371327],[76.567416,9.371384],[76.567506,9.371444],[76.567637,9.37158],[76.567757,9.371649],[76.567813,9.371764],[76.567751,9.372082],[76.567721,9.372301],[76.567632,9.372537],[76.5676,9.372624],[76.567598,9.372748],[76.567609,9.372897],[76.567623,9.37309],[76.567636,9.373273],[76.56767,9.37343],[76.567892,9.373867],[76.567996,9.374001],[76.568147,9.374229],[76.56812,9.374431],[76.56801,9.374705],[76.567542,9.374963],[76.567355,9.375093],[76.567269,9.375212],[76.567182,9.375346],[76.566983,9.375583],[76.566679,9.375724],[76.566584,9.375724],[76.566224,9.375714],[76.566017,9.375638],[76.565777,9.375503],[76.565606,9.375473],[76.565341,9.375459],[76.564927,9.375428],[76.564883,9.37527],[76.564792,9.374712],[76.564753,9.374129],[76.564733,9.373903],[76.564656,9.373689],[76.564545,9.37369],[76.564419,9.373692],[76.564146,9.373687],[76.563757,9.373691],[76.563513,9.37369],[76.563225,9.373689],[76.563207,9.373463],[76.5632,9.373213],[76.563211,9.373093],[76.563212,9.372985],[76.563017,9.372913],[76.562877,9.372914],[76.562736,9.372915],[76.56256,9.372917],[76.562367,9.372917],[76.562077,9.372909],[76.561863,9.372897],[76.561598,9.372869],[76.561284,9.37275],[76.561165,9.372689],[76.561176,9.372536],[76.561229,9.372421],[76.56127,9.372333],[76.561413,9.372329],[76.561557,9.372326],[76.56159,9.372133],[76.561611,9.372012],[76.561633,9.371878],[76.561696,9.37174],[76.561728,9.371625],[76.561759,9.37151],[76.561785,9.371363],[76.561779,9.371093],[76.561786,9.370922],[76.562116,9.370876],[76.562339,9.37087],[76.562577,9.370872]]]},\"properties\":{\"Created_Da\":\"2024-10-18T05:35:36.603Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Surveyor\":\"Dipin raj rv\",\"Ward_Name\":\"MATHIL BHAGAM\",\"Ward_No\":\"25\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.594523,9.393974],[76.594563,9.394261],[76.594685,9.394275],[76.595769,9.394439],[76.595862,9.394582],[76.596358,9.395349],[76.596453,9.395495],[76.597068,9.396666],[76.597663,9.397829],[76.597648,9.398244],[76.597633,9.39867],[76.597569,9.39894],[76.597494,9.399253],[76.597389,9.399136],[76.597076,9.399024],[76.596977,9.398997],[76.596749,9.398927],[76.596401,9.398814],[76.596265,9.398769],[76.596069,9.398741],[76.595879,9.398717],[76.595276,9.39864],[76.595169,9.39862],[76.59513,9.398499],[76.595043,9.398226],[76.594973,9.397991],[76.594819,9.397936],[76.594724,9.397899],[76.594594,9.397839],[76.594667,9.397623],[76.5945,9.3974],[76.594395,9.397265],[76.594385,9.396909],[76.594313,9.396837],[76.594036,9.396701],[76.593678,9.396334],[76.593676,9.396136],[76.59309,9.396377],[76.592597,9.396669],[76.592499,9.39673],[76.592019,9.397028],[76.591826,9.397148],[76.591731,9.397208],[76.591596,9.397295],[76.591346,9.397456],[76.591002,9.397657],[76.590908,9.397569],[76.590426,9.397116],[76.590201,9.39687],[76.590041,9.396695],[76.589934,9.396577],[76.589793,9.396492],[76.58954,9.396338],[76.589454,9.396286],[76.589284,9.396484],[76.58899,9.396775],[76.588756,9.396918],[76.588519,9.396984],[76.588403,9.397005],[76.588194,9.397059],[76.587536,9.396771],[76.587393,9.396712],[76.587269,9.39668],[76.587138,9.396637],[76.587026,9.396601],[76.586883,9.396547],[76.586741,9.396493],[76.58658,9.396393],[76.586418,9.396277],[76.58621,9.39611],[76.58604,9.395975],[76.585972,9.3959],[76.585646,9.395501],[76.585594,9.395403],[76.585568,9.395236],[76.585522,9.395086],[76.58548,9.394939],[76.58538,9.394653],[76.585233,9.394425],[76.585132,9.394369],[76.585033,9.394363],[76.584827,9.394371],[76.584647,9.39438],[76.584451,9.394391],[76.584055,9.393977],[76.583988,9.393886],[76.583832,9.393668],[76.583763,9.393484],[76.583565,9.393213],[76.583571,9.393072],[76.583581,9.392893],[76.583687,9.39261],[76.584009,9.392586],[76.584455,9.392389],[76.584775,9.392247],[76.585177,9.392068],[76.585434,9.391956],[76.585604,9.391917],[76.58586,9.391921],[76.586056,9.391949],[76.586293,9.391879],[76.586273,9.391583],[76.586299,9.391461],[76.586618,9.391422],[76.586841,9.39134],[76.587097,9.391249],[76.587214,9.391217],[76.587892,9.391025],[76.587771,9.390538],[76.587584,9.390123],[76.58751,9.389956],[76.586836,9.39015],[76.586691,9.390191],[76.586512,9.390249],[76.586429,9.390081],[76.585275,9.390517],[76.585152,9.390554],[76.584964,9.390606],[76.584874,9.390376],[76.584264,9.390323],[76.584318,9.389783],[76.584335,9.389629],[76.584381,9.389203],[76.584324,9.389104],[76.584241,9.389024],[76.584234,9.388838],[76.584269,9.388669],[76.584327,9.388524],[76.584384,9.38838],[76.584524,9.388107],[76.584598,9.387964],[76.58467,9.387853],[76.5848,9.387738],[76.584891,9.387704],[76.584924,9.387806],[76.585121,9.387811],[76.585224,9.38777],[76.585326,9.38773],[76.585457,9.38769],[76.585586,9.38765],[76.585921,9.387579],[76.586125,9.387526],[76.586278,9.38749],[76.586486,9.387431],[76.586615,9.387394],[76.586759,9.387354],[76.587017,9.387353],[76.587153,9.387376],[76.587298,9.387408],[76.587342,9.387501],[76.587443,9.387935],[76.587585,9.387969],[76.587824,9.387966],[76.58805,9.387963],[76.588231,9.38796],[76.588459,9.387984],[76.588615,9.387992],[76.588762,9.388008],[76.588873,9.387998],[76.588969,9.387889],[76.589147,9.387664],[76.589265,9.387503],[76.589435,9.38767],[76.589715,9.387851],[76.58983,9.387919],[76.589927,9.387978],[76.590097,9.388108],[76.590189,9.388244],[76.590266,9.388313],[76.590442,9.388431],[76.590694,9.388749],[76.590914,9.389002],[76.591069,9.388941],[76.591222,9.388814],[76.591366,9.388724],[76.591492,9.388652],[76.591647,9.388557],[76.591809,9.38849],[76.592008,9.388426],[76.592611,9.388378],[76.59262,9.388634],[76.592621,9.388734],[76.592595,9.388898],[76.592634,9.389025],[76.592682,9.38918],[76.592713,9.389279],[76.593316,9.389723],[76.593443,9.389919],[76.593265,9.390734],[76.593357,9.390829],[76.593536,9.391015],[76.593655,9.391139],[76.593778,9.391265],[76.593932,9.391419],[76.594086,9.391572],[76.594123,9.391748],[76.594281,9.392516],[76.594305,9.392631],[76.594338,9.39279],[76.594384,9.393012],[76.594486,9.393718],[76.594523,9.393974]]]},\"properties\":{\"Created_Da\":\"2024-10-22T08:58:19.590Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"suresh c\",\"Ward_Name\":\"AMALLOOR EAST\",\"Ward_No\":\"10\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.571793,9.405051],[76.57186,9.405125],[76.572327,9.405054],[76.573062,9.404888],[76.573519,9.404542],[76.573627,9.404457],[76.574047,9.404105],[76.574628,9.403619],[76.575034,9.404128],[76.575262,9.404591],[76.575896,9.404417],[76.575952,9.404724],[76.576001,9.405069],[76.576075,9.405434],[76.575712,9.405551],[76.575517,9.405581],[76.575166,9.405634],[76.574935,9.405652],[76.574644,9.405673],[76.574525,9.405682],[76.57437,9.405702],[76.57421,9.405722],[76.573966,9.405774],[76.573764,9.405832],[76.573892,9.40668],[76.573928,9.406921],[76.573667,9.407184],[76.573646,9.407299],[76.573616,9.407461],[76.573576,9.407675],[76.573556,9.407781],[76.573391,9.407842],[76.573302,9.407874],[76.573127,9.407939],[76.572596,9.408133],[76.572318,9.408235],[76.572392,9.408786],[76.572414,9.408948],[76.572436,9.40913],[76.572482,9.409479],[76.572508,9.410056],[76.572522,9.410318],[76.572515,9.410941],[76.572622,9.411231],[76.573362,9.411867],[76.57299,9.413134],[76.572174,9.413034],[76.572008,9.413045],[76.571842,9.413055],[76.571289,9.413101],[76.570911,9.413139],[76.570516,9.413184],[76.569886,9.413226],[76.568822,9.413937],[76.568579,9.413735],[76.567808,9.412842],[76.567093,9.412302],[76.566646,9.412007],[76.566176,9.411691],[76.565532,9.411108],[76.564877,9.410631],[76.564669,9.41046],[76.564293,9.410477],[76.564045,9.410575],[76.563716,9.410623],[76.563615,9.41044],[76.564001,9.410086],[76.564073,9.41002],[76.56416,9.409957],[76.564367,9.409775],[76.564498,9.40967],[76.564606,9.40959],[76.564745,9.409437],[76.565061,9.409102],[76.565412,9.408731],[76.565708,9.408425],[76.565769,9.408157],[76.565863,9.407743],[76.56576,9.407197],[76.565744,9.406706],[76.565729,9.406241],[76.566035,9.406163],[76.566339,9.406085],[76.566551,9.406052],[76.566764,9.406019],[76.566975,9.405992],[76.56733,9.40593],[76.567554,9.405891],[76.567647,9.405867],[76.567968,9.405786],[76.568091,9.40576],[76.568306,9.405737],[76.568631,9.405708],[76.568833,9.40566],[76.568929,9.405641],[76.569242,9.405593],[76.569573,9.405521],[76.56978,9.405481],[76.570043,9.40543],[76.570252,9.40539],[76.570766,9.405291],[76.570878,9.405267],[76.57136,9.405171],[76.571584,9.40512],[76.571793,9.405051]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:43:28.971Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"suresh c\",\"Ward_Name\":\"CHUMATHRA\",\"Ward_No\":\"2\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.596376,9.407928],[76.596271,9.407931],[76.596006,9.407937],[76.59556,9.408038],[76.595469,9.408075],[76.595435,9.408166],[76.595358,9.408418],[76.59532,9.408536],[76.595246,9.408603],[76.595124,9.408692],[76.59497,9.408669],[76.594825,9.408562],[76.594534,9.408663],[76.594342,9.408726],[76.594223,9.408746],[76.593857,9.408804],[76.593476,9.408865],[76.593335,9.408885],[76.592806,9.40891],[76.592385,9.408953],[76.59238,9.408778],[76.592334,9.408612],[76.592045,9.408724],[76.591882,9.408815],[76.591744,9.408791],[76.591605,9.408767],[76.591108,9.409277],[76.590831,9.409561],[76.590848,9.409691],[76.590875,9.409897],[76.590887,9.410045],[76.590897,9.410168],[76.589974,9.41037],[76.589695,9.410421],[76.589414,9.409869],[76.589067,9.40908],[76.588781,9.409111],[76.588338,9.409158],[76.587442,9.409253],[76.587103,9.409289],[76.586929,9.409317],[76.586366,9.409416],[76.585705,9.409558],[76.585485,9.409001],[76.585409,9.408805],[76.585137,9.408211],[76.585014,9.407941],[76.584946,9.407797],[76.584878,9.40765],[76.584676,9.407217],[76.584607,9.407071],[76.58452,9.406983],[76.584223,9.406687],[76.584029,9.406494],[76.583625,9.406176],[76.583286,9.405957],[76.582773,9.405589],[76.582683,9.405412],[76.582588,9.405313],[76.582407,9.405072],[76.582236,9.404854],[76.582177,9.404765],[76.582096,9.404633],[76.581966,9.404377],[76.581744,9.403971],[76.581687,9.403868],[76.581563,9.403633],[76.58169,9.403489],[76.581822,9.403364],[76.582071,9.403234],[76.582426,9.402934],[76.582648,9.403073],[76.582936,9.403278],[76.583019,9.403419],[76.583179,9.403477],[76.583396,9.403247],[76.583648,9.402979],[76.583888,9.402727],[76.584178,9.402519],[76.584575,9.402772],[76.584815,9.402954],[76.584904,9.402997],[76.585554,9.403392],[76.585579,9.403598],[76.585432,9.403979],[76.585903,9.404142],[76.586022,9.404365],[76.586139,9.404432],[76.586303,9.404604],[76.586415,9.404738],[76.586526,9.404872],[76.5866,9.404934],[76.586775,9.405109],[76.58692,9.405299],[76.586988,9.405394],[76.58724,9.405655],[76.587534,9.405897],[76.587703,9.405619],[76.587948,9.405123],[76.587993,9.405031],[76.588082,9.404838],[76.588132,9.404727],[76.588251,9.404382],[76.588457,9.404007],[76.588631,9.403622],[76.588813,9.403254],[76.588937,9.40299],[76.589124,9.40253],[76.589458,9.402044],[76.58965,9.401856],[76.590252,9.401268],[76.59113,9.400597],[76.59128,9.400519],[76.591712,9.400337],[76.59215,9.40015],[76.592276,9.400088],[76.592558,9.40009],[76.592912,9.399979],[76.593022,9.399958],[76.593637,9.399908],[76.593755,9.399817],[76.594909,9.399268],[76.595169,9.39862],[76.595276,9.39864],[76.595879,9.398717],[76.596069,9.398741],[76.596265,9.398769],[76.596401,9.398814],[76.596749,9.398927],[76.596977,9.398997],[76.597076,9.399024],[76.597389,9.399136],[76.597494,9.399253],[76.597525,9.399529],[76.597543,9.399685],[76.597563,9.400172],[76.597445,9.400408],[76.597397,9.400503],[76.597318,9.400647],[76.597139,9.400904],[76.597037,9.401046],[76.596973,9.401132],[76.596845,9.401321],[76.596761,9.401445],[76.596476,9.402042],[76.596441,9.402332],[76.596403,9.402643],[76.596371,9.403083],[76.596356,9.403223],[76.596268,9.404032],[76.596278,9.404132],[76.596289,9.404237],[76.59632,9.404554],[76.596373,9.405084],[76.596385,9.405203],[76.596422,9.405425],[76.596492,9.405848],[76.596545,9.406169],[76.596522,9.40641],[76.596487,9.406776],[76.596478,9.406869],[76.596469,9.406961],[76.596456,9.407095],[76.596447,9.407188],[76.596438,9.407284],[76.596419,9.40748],[76.596376,9.407928]]]},\"properties\":{\"Created_Da\":\"2024-10-21T09:12:54.308Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"Suresh c\",\"Ward_Name\":\"NATTUKADAVU\",\"Ward_No\":\"7\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.565919,9.398255],[76.566838,9.397517],[76.567424,9.397614],[76.567582,9.39764],[76.567882,9.397686],[76.56836,9.397758],[76.568404,9.397907],[76.56845,9.398028],[76.568685,9.398855],[76.568831,9.399347],[76.568973,9.399339],[76.568989,9.399441],[76.569094,9.399684],[76.569224,9.399968],[76.569291,9.400114],[76.569265,9.400332],[76.569292,9.400578],[76.569318,9.400808],[76.569486,9.400922],[76.569579,9.401203],[76.569586,9.401733],[76.569631,9.401937],[76.569521,9.402057],[76.569453,9.402353],[76.569504,9.402673],[76.569538,9.402824],[76.569586,9.403037],[76.569618,9.403231],[76.569601,9.403558],[76.569601,9.403709],[76.56988,9.40368],[76.570043,9.40371],[76.570202,9.403743],[76.570463,9.40382],[76.570584,9.403876],[76.570769,9.403986],[76.571038,9.404074],[76.571159,9.404095],[76.571418,9.404175],[76.571628,9.404267],[76.571724,9.404374],[76.571735,9.404565],[76.571718,9.404727],[76.571738,9.404911],[76.571793,9.405051],[76.571584,9.40512],[76.57136,9.405171],[76.570878,9.405267],[76.570766,9.405291],[76.570252,9.40539],[76.570043,9.40543],[76.56978,9.405481],[76.569573,9.405521],[76.569242,9.405593],[76.568929,9.405641],[76.568833,9.40566],[76.568631,9.405708],[76.568306,9.405737],[76.568091,9.40576],[76.567968,9.405786],[76.567647,9.405867],[76.567554,9.405891],[76.56733,9.40593],[76.566975,9.405992],[76.566764,9.406019],[76.566551,9.406052],[76.566339,9.406085],[76.566035,9.406163],[76.565729,9.406241],[76.565489,9.405477],[76.565253,9.405183],[76.565078,9.404987],[76.564954,9.404867],[76.564833,9.404773],[76.564707,9.404695],[76.564489,9.404573],[76.564193,9.404406],[76.564084,9.404345],[76.563918,9.404172],[76.563808,9.404091],[76.563672,9.403991],[76.563485,9.403971],[76.563347,9.403952],[76.563148,9.403925],[76.562862,9.403875],[76.562761,9.403854],[76.562643,9.403829],[76.562403,9.403771],[76.562288,9.403709],[76.562194,9.403632],[76.562037,9.403506],[76.561959,9.403428],[76.561858,9.403301],[76.562022,9.403253],[76.562863,9.402175],[76.563133,9.401537],[76.56337,9.401197],[76.563647,9.400765],[76.563893,9.400452],[76.564177,9.40013],[76.565136,9.39926],[76.565427,9.398887],[76.565919,9.398255]]]},\"properties\":{\"Created_Da\":\"2024-10-17T05:28:09.278Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Remarks\":\"Ok\",\"Surveyor\":\"Suresh\",\"Ward_Name\":\"MUTHOOR NORTH\",\"Ward_No\":\"1\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.574562,9.36957],[76.574739,9.369515],[76.574877,9.369467],[76.574923,9.369386],[76.575008,9.369231],[76.575082,9.368972],[76.575126,9.368805],[76.575184,9.36859],[76.575514,9.368501],[76.575923,9.368548],[76.576115,9.368536],[76.576137,9.368673],[76.576128,9.36892],[76.576203,9.368994],[76.576344,9.369132],[76.576501,9.369072],[76.576797,9.368933],[76.57747,9.368883],[76.577778,9.368897],[76.577929,9.369323],[76.578049,9.369616],[76.5781,9.369733],[76.578185,9.369878],[76.578307,9.370338],[76.578344,9.370681],[76.57848,9.370861],[76.578694,9.371229],[76.578807,9.371568],[76.578844,9.371687],[76.578609,9.371864],[76.578271,9.372009],[76.578088,9.372077],[76.577916,9.37214],[76.577532,9.372338],[76.577269,9.372479],[76.576882,9.372686],[76.576783,9.372697],[76.576555,9.372721],[76.576445,9.372726],[76.576267,9.372733],[76.576121,9.372746],[76.575745,9.372609],[76.575541,9.372616],[76.575399,9.372634],[76.575225,9.372691],[76.574997,9.372663],[76.574853,9.372645],[76.574485,9.372729],[76.574364,9.372756],[76.574246,9.372775],[76.574138,9.372841],[76.574272,9.37301],[76.574328,9.373158],[76.574371,9.373424],[76.574171,9.373733],[76.573944,9.373911],[76.573564,9.373963],[76.5734,9.373986],[76.572973,9.374037],[76.572777,9.374059],[76.572665,9.374133],[76.572616,9.374383],[76.572187,9.374326],[76.571873,9.374256],[76.571723,9.374223],[76.571585,9.37417],[76.571423,9.374134],[76.57132,9.373994],[76.571225,9.373708],[76.571167,9.37353],[76.571276,9.373249],[76.571094,9.372819],[76.571058,9.372204],[76.571142,9.371676],[76.571107,9.37155],[76.571042,9.37137],[76.571147,9.371213],[76.571429,9.371219],[76.571751,9.371227],[76.572314,9.371384],[76.572434,9.371421],[76.572642,9.371429],[76.572639,9.371315],[76.572627,9.37115],[76.572613,9.371013],[76.572586,9.370841],[76.572527,9.370592],[76.572403,9.370222],[76.572518,9.36998],[76.572793,9.37007],[76.572995,9.370081],[76.573338,9.370101],[76.573498,9.370021],[76.573598,9.369863],[76.573734,9.369663],[76.573889,9.369636],[76.574093,9.369618],[76.574296,9.369601],[76.574395,9.36959],[76.574562,9.36957]]]},\"properties\":{\"Created_Da\":\"2024-10-18T10:55:16.598Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"Dipin raj rv\",\"Ward_Name\":\"SREE RAMAKRISHNA ASRAMAM\",\"Ward_No\":\"22\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.593845,9.371802],[76.591758,9.376428],[76.591609,9.376479],[76.591493,9.376519],[76.591318,9.377136],[76.591069,9.377738],[76.590537,9.378557],[76.590457,9.378632],[76.590169,9.378871],[76.589885,9.378861],[76.589782,9.378858],[76.589167,9.378837],[76.588817,9.378825],[76.588602,9.378817],[76.588391,9.37881],[76.587978,9.378741],[76.587784,9.37854],[76.587567,9.378316],[76.587396,9.378139],[76.587232,9.37797],[76.586588,9.377294],[76.586287,9.376973],[76.586501,9.37644],[76.586572,9.376165],[76.586538,9.376052],[76.586439,9.375713],[76.587946,9.374084],[76.588041,9.374026],[76.588125,9.373986],[76.588281,9.373926],[76.588361,9.373879],[76.588284,9.373761],[76.58816,9.373668],[76.588082,9.37356],[76.588064,9.373414],[76.58803,9.37332],[76.587936,9.37314],[76.587866,9.37296],[76.588044,9.372823],[76.588132,9.372797],[76.588225,9.372763],[76.588311,9.372725],[76.588373,9.372616],[76.588307,9.372498],[76.588258,9.372352],[76.588254,9.372174],[76.588222,9.372078],[76.587915,9.372046],[76.587729,9.372058],[76.587636,9.372061],[76.587397,9.372045],[76.58732,9.371971],[76.58728,9.371797],[76.587233,9.371652],[76.587188,9.371535],[76.587147,9.371422],[76.587096,9.37116],[76.587232,9.3709],[76.587225,9.370804],[76.587233,9.370682],[76.587252,9.370528],[76.587206,9.370328],[76.587184,9.370192],[76.587179,9.370068],[76.587194,9.36994],[76.587193,9.369805],[76.587168,9.369592],[76.58712,9.369498],[76.587076,9.369365],[76.587211,9.369419],[76.587432,9.36951],[76.587595,9.369573],[76.58771,9.369622],[76.58787,9.36969],[76.588014,9.369738],[76.588187,9.369785],[76.588349,9.36983],[76.58862,9.36995],[76.588709,9.370017],[76.588798,9.370105],[76.588916,9.370193],[76.589034,9.370284],[76.589116,9.370358],[76.589233,9.370445],[76.589344,9.370536],[76.589496,9.37066],[76.58974,9.3709],[76.589965,9.371099],[76.590043,9.371147],[76.590186,9.371218],[76.590322,9.371249],[76.590517,9.371252],[76.590789,9.371188],[76.59094,9.371162],[76.591169,9.371246],[76.591308,9.37138],[76.591389,9.371464],[76.591581,9.37165],[76.591647,9.371715],[76.591839,9.37179],[76.592165,9.371816],[76.592492,9.371903],[76.592603,9.371929],[76.592741,9.371947],[76.592847,9.371942],[76.593003,9.371916],[76.593097,9.371895],[76.593251,9.371862],[76.593823,9.371669],[76.593845,9.371802]]]},\"properties\":{\"Created_Da\":\"2024-10-20T05:27:29.196Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"mary sincy k g\",\"Ward_Name\":\"ERUVELLIPRA\",\"Ward_No\":\"17\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.592508,9.382909],[76.59253,9.383077],[76.592551,9.383191],[76.592649,9.38322],[76.592745,9.38329],[76.592829,9.383488],[76.592872,9.383603],[76.592937,9.383729],[76.592989,9.383842],[76.593,9.383953],[76.593014,9.384073],[76.593031,9.384239],[76.593044,9.384379],[76.59302,9.384546],[76.59292,9.384603],[76.592872,9.384809],[76.592856,9.384905],[76.592833,9.385094],[76.59279,9.385262],[76.592813,9.385408],[76.592879,9.385584],[76.592921,9.385739],[76.592941,9.385942],[76.592918,9.386139],[76.592887,9.386326],[76.592848,9.386475],[76.592855,9.386568],[76.592866,9.386661],[76.592916,9.386844],[76.592964,9.387014],[76.592983,9.387211],[76.592808,9.387238],[76.59266,9.387239],[76.592552,9.387247],[76.592397,9.387239],[76.592217,9.38723],[76.592048,9.387226],[76.591858,9.387133],[76.591797,9.387024],[76.591731,9.386908],[76.591453,9.386988],[76.591355,9.38702],[76.591227,9.38708],[76.591117,9.387142],[76.591008,9.387221],[76.590783,9.387356],[76.590634,9.387423],[76.590505,9.38749],[76.590427,9.387542],[76.590309,9.3876],[76.590348,9.387683],[76.590389,9.387819],[76.590235,9.387949],[76.590146,9.388016],[76.590097,9.388108],[76.589927,9.387978],[76.58983,9.387919],[76.589715,9.387851],[76.589435,9.38767],[76.589265,9.387503],[76.589147,9.387664],[76.588969,9.387889],[76.588873,9.387998],[76.588762,9.388008],[76.588615,9.387992],[76.588459,9.387984],[76.588231,9.38796],[76.58805,9.387963],[76.587824,9.387966],[76.587585,9.387969],[76.587443,9.387935],[76.587342,9.387501],[76.587298,9.387408],[76.587153,9.387376],[76.587017,9.387353],[76.586759,9.387354],[76.586615,9.387394],[76.586486,9.387431],[76.586278,9.38749],[76.586125,9.387526],[76.585921,9.387579],[76.585586,9.38765],[76.585457,9.38769],[76.585326,9.38773],[76.585224,9.38777],[76.585121,9.387811],[76.584924,9.387806],[76.584891,9.387704],[76.584874,9.38734],[76.584808,9.387051],[76.584766,9.386905],[76.584724,9.38676],[76.58471,9.386539],[76.584657,9.38639],[76.584623,9.386286],[76.584565,9.386107],[76.584438,9.385717],[76.584381,9.385544],[76.584552,9.385492],[76.584644,9.385119],[76.584923,9.385238],[76.585151,9.385329],[76.585382,9.385401],[76.585556,9.385391],[76.585745,9.385379],[76.586029,9.385339],[76.586153,9.385321],[76.586377,9.385282],[76.587125,9.385064],[76.587274,9.385001],[76.587475,9.384916],[76.587691,9.384831],[76.587833,9.384774],[76.588045,9.384702],[76.588174,9.384657],[76.588261,9.384613],[76.588445,9.384544],[76.588803,9.384407],[76.588985,9.384344],[76.589141,9.384288],[76.589358,9.384156],[76.589608,9.383961],[76.589811,9.383795],[76.589921,9.38371],[76.590009,9.383664],[76.590294,9.383583],[76.5905,9.383568],[76.590607,9.38356],[76.590805,9.383548],[76.590896,9.383531],[76.590997,9.383499],[76.591187,9.383417],[76.591354,9.383293],[76.591443,9.3832],[76.591608,9.383043],[76.591755,9.382954],[76.591957,9.382893],[76.592053,9.382878],[76.592187,9.382862],[76.592351,9.382842],[76.592508,9.382909]]]},\"properties\":{\"Created_Da\":\"2024-10-22T06:52:22.688Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9074124773\",\"Surveyor\":\"mary sincy k g\",\"Ward_Name\":\"MANJADI\",\"Ward_No\":\"12\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.585743,9.409693],[76.585705,9.409558],[76.586366,9.409416],[76.586929,9.409317],[76.587103,9.409289],[76.587442,9.409253],[76.588338,9.409158],[76.588781,9.409111],[76.589067,9.40908],[76.589414,9.409869],[76.589695,9.410421],[76.589974,9.41037],[76.590897,9.410168],[76.590887,9.410045],[76.590875,9.409897],[76.590848,9.409691],[76.590831,9.409561],[76.591108,9.409277],[76.591605,9.408767],[76.591744,9.408791],[76.591882,9.408815],[76.592045,9.408724],[76.592334,9.408612],[76.59238,9.408778],[76.592385,9.408953],[76.592806,9.40891],[76.593335,9.408885],[76.593476,9.408865],[76.593857,9.408804],[76.594223,9.408746],[76.594342,9.408726],[76.594534,9.408663],[76.594825,9.408562],[76.59497,9.408669],[76.595124,9.408692],[76.595246,9.408603],[76.59532,9.408536],[76.595358,9.408418],[76.595435,9.408166],[76.595469,9.408075],[76.59556,9.408038],[76.596006,9.407937],[76.596271,9.407931],[76.596376,9.407928],[76.596362,9.408125],[76.596347,9.408346],[76.59633,9.408495],[76.596312,9.408685],[76.596302,9.408834],[76.596282,9.409218],[76.596266,9.409347],[76.596199,9.409906],[76.596185,9.410006],[76.59634,9.410103],[76.596509,9.410208],[76.59641,9.410449],[76.596154,9.411073],[76.595698,9.41131],[76.595613,9.411399],[76.595403,9.411245],[76.595172,9.411287],[76.594875,9.411375],[76.594603,9.411517],[76.594464,9.411597],[76.59411,9.411801],[76.59401,9.411943],[76.593758,9.412343],[76.593692,9.412492],[76.59349,9.41294],[76.593271,9.413096],[76.593122,9.413342],[76.592919,9.413677],[76.592746,9.413982],[76.592651,9.414149],[76.592604,9.414236],[76.592538,9.414352],[76.59242,9.414558],[76.59227,9.414768],[76.59212,9.415091],[76.591995,9.415251],[76.591852,9.415557],[76.591801,9.415665],[76.591625,9.415791],[76.59157,9.415877],[76.591397,9.41615],[76.591265,9.416374],[76.591243,9.416468],[76.591169,9.416561],[76.591072,9.416797],[76.59103,9.416899],[76.590967,9.417021],[76.59089,9.417207],[76.590862,9.417322],[76.590841,9.417411],[76.590756,9.417537],[76.590777,9.417636],[76.590968,9.417893],[76.590955,9.418007],[76.590765,9.418183],[76.590614,9.418323],[76.590649,9.418461],[76.590495,9.418615],[76.590418,9.418693],[76.590261,9.418849],[76.590184,9.418926],[76.590231,9.419354],[76.590268,9.419689],[76.589467,9.419864],[76.589344,9.419069],[76.589301,9.419047],[76.589274,9.418978],[76.589223,9.419003],[76.589089,9.418948],[76.589012,9.419117],[76.588119,9.419425],[76.588091,9.419515],[76.58749,9.419811],[76.587327,9.419924],[76.586996,9.420114],[76.586652,9.420376],[76.586497,9.420252],[76.586159,9.420271],[76.585897,9.420128],[76.585659,9.419864],[76.585027,9.420106],[76.584884,9.420116],[76.584712,9.420095],[76.584142,9.420099],[76.584172,9.419895],[76.584189,9.419791],[76.584233,9.419501],[76.584277,9.419212],[76.5843,9.41897],[76.584346,9.418492],[76.584392,9.418009],[76.584415,9.417768],[76.584527,9.417382],[76.5847,9.416787],[76.584824,9.416358],[76.584856,9.416201],[76.58492,9.415884],[76.584999,9.415495],[76.585086,9.415065],[76.58512,9.414903],[76.585152,9.414696],[76.585216,9.414285],[76.585248,9.414078],[76.585311,9.413669],[76.585343,9.413464],[76.585335,9.41321],[76.585316,9.412655],[76.585308,9.412469],[76.585302,9.412333],[76.585277,9.412107],[76.585267,9.412012],[76.58527,9.411883],[76.585274,9.411669],[76.585438,9.411518],[76.585844,9.411141],[76.586006,9.410991],[76.585963,9.410777],[76.585918,9.410557],[76.585822,9.410082],[76.585743,9.409693]]]},\"properties\":{\"Created_Da\":\"2024-10-20T10:29:19.416Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9074124773\",\"Surveyor\":\"Suresh\",\"Ward_Name\":\"ANNAVATTOM\",\"Ward_No\":\"6\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.562275,9.379395],[76.561969,9.379503],[76.561615,9.37959],[76.561396,9.379635],[76.56125,9.379663],[76.561035,9.37965],[76.56082,9.379772],[76.560617,9.37982],[76.560279,9.379893],[76.560078,9.379925],[76.559894,9.379964],[76.559734,9.38],[76.559518,9.380045],[76.55933,9.380085],[76.559101,9.380164],[76.558922,9.38022],[76.558764,9.380259],[76.558489,9.380332],[76.558084,9.380379],[76.557893,9.380294],[76.557894,9.380174],[76.557896,9.38003],[76.557895,9.37993],[76.557894,9.379807],[76.557851,9.37959],[76.55783,9.379493],[76.557786,9.379293],[76.557764,9.379002],[76.557748,9.378797],[76.557751,9.378502],[76.557751,9.377821],[76.557756,9.377704],[76.557772,9.377439],[76.557852,9.37728],[76.55795,9.377301],[76.558102,9.377206],[76.55844,9.376958],[76.558749,9.376735],[76.558879,9.376682],[76.559252,9.376539],[76.559471,9.376454],[76.559191,9.375881],[76.558804,9.375435],[76.558494,9.374917],[76.55818,9.37431],[76.558061,9.373994],[76.557942,9.373691],[76.557693,9.373273],[76.557666,9.37294],[76.557891,9.372889],[76.558138,9.372792],[76.558246,9.37278],[76.558354,9.372767],[76.558497,9.37275],[76.558697,9.372754],[76.55881,9.372766],[76.559076,9.372848],[76.559226,9.372845],[76.55934,9.372768],[76.559556,9.372694],[76.559774,9.372682],[76.559997,9.372703],[76.560118,9.372793],[76.560208,9.372859],[76.560299,9.372925],[76.560512,9.37294],[76.560753,9.372925],[76.561,9.372811],[76.561165,9.372689],[76.561284,9.37275],[76.561598,9.372869],[76.561863,9.372897],[76.562077,9.372909],[76.562367,9.372917],[76.56256,9.372917],[76.562736,9.372915],[76.562877,9.372914],[76.563017,9.372913],[76.563212,9.372985],[76.563211,9.373093],[76.5632,9.373213],[76.563207,9.373463],[76.563225,9.373689],[76.563513,9.37369],[76.563757,9.373691],[76.564146,9.373687],[76.564419,9.373692],[76.564545,9.37369],[76.564656,9.373689],[76.564733,9.373903],[76.564753,9.374129],[76.564792,9.374712],[76.564883,9.37527],[76.564927,9.375428],[76.564998,9.375726],[76.565034,9.375941],[76.565077,9.37614],[76.565165,9.376402],[76.565208,9.376661],[76.565245,9.376869],[76.565236,9.377092],[76.565237,9.377386],[76.565287,9.37773],[76.565317,9.377918],[76.565384,9.378198],[76.565162,9.37824],[76.564892,9.378335],[76.56451,9.378443],[76.56442,9.378468],[76.563942,9.378624],[76.563763,9.378702],[76.563438,9.378845],[76.563189,9.378959],[76.56286,9.379153],[76.562618,9.379299],[76.562275,9.379395]]]},\"properties\":{\"Created_Da\":\"2024-10-19T09:06:33.339Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"dipin raj r v\",\"Ward_Name\":\"SREEVALLABHA\",\"Ward_No\":\"27\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.572515,9.410941],[76.572522,9.410318],[76.572508,9.410056],[76.572482,9.409479],[76.573674,9.409458],[76.574682,9.40939],[76.574875,9.409378],[76.575068,9.409365],[76.576097,9.409286],[76.577009,9.408913],[76.57731,9.40879],[76.578217,9.408444],[76.579224,9.408164],[76.580062,9.407936],[76.580847,9.407528],[76.580576,9.406982],[76.580887,9.406802],[76.581616,9.406429],[76.582773,9.405589],[76.583286,9.405957],[76.583625,9.406176],[76.584029,9.406494],[76.584223,9.406687],[76.58452,9.406983],[76.584607,9.407071],[76.584676,9.407217],[76.584878,9.40765],[76.584946,9.407797],[76.585014,9.407941],[76.58409,9.408626],[76.583993,9.408714],[76.5834,9.40926],[76.582918,9.40972],[76.582754,9.409912],[76.581853,9.410966],[76.581056,9.410999],[76.580922,9.411011],[76.580642,9.411633],[76.580444,9.412208],[76.580281,9.412188],[76.580179,9.412176],[76.580019,9.41216],[76.579361,9.413133],[76.579538,9.413083],[76.579782,9.41312],[76.580074,9.413482],[76.580477,9.413981],[76.58055,9.414357],[76.580449,9.414514],[76.580388,9.41461],[76.579934,9.414475],[76.579784,9.414483],[76.579633,9.414491],[76.579113,9.41458],[76.578713,9.414747],[76.578474,9.414847],[76.578354,9.414874],[76.577963,9.414962],[76.577527,9.415094],[76.577246,9.415236],[76.577123,9.415328],[76.577,9.415419],[76.576876,9.415515],[76.576538,9.415739],[76.576313,9.415791],[76.576253,9.415686],[76.576155,9.415518],[76.576019,9.415366],[76.575883,9.415216],[76.575649,9.415342],[76.575469,9.415495],[76.575305,9.415764],[76.575002,9.415983],[76.574882,9.41601],[76.57465,9.416072],[76.574525,9.416107],[76.574181,9.416109],[76.573829,9.41609],[76.573716,9.416252],[76.573644,9.416363],[76.573561,9.416534],[76.573477,9.416706],[76.573394,9.416982],[76.573326,9.417136],[76.573104,9.417041],[76.572918,9.416979],[76.572654,9.416852],[76.572373,9.416717],[76.572157,9.416598],[76.571868,9.416455],[76.571604,9.41617],[76.57136,9.416027],[76.571088,9.415893],[76.570788,9.415756],[76.570516,9.415638],[76.570326,9.415552],[76.570053,9.415358],[76.569884,9.415231],[76.569799,9.415102],[76.569746,9.414902],[76.569569,9.414707],[76.569241,9.414376],[76.569046,9.414162],[76.568822,9.413937],[76.569886,9.413226],[76.570516,9.413184],[76.570911,9.413139],[76.571289,9.413101],[76.571842,9.413055],[76.572008,9.413045],[76.572174,9.413034],[76.57299,9.413134],[76.573362,9.411867],[76.572622,9.411231],[76.572515,9.410941]]]},\"properties\":{\"Created_Da\":\"2024-10-21T10:21:29.967Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"suresh c\",\"Ward_Name\":\"KIZHAKKAN MUTHOOR\",\"Ward_No\":\"4\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.567636,9.373273],[76.56822,9.373374],[76.56833,9.373406],[76.568451,9.373441],[76.569335,9.373697],[76.569602,9.373834],[76.569787,9.37393],[76.569973,9.374026],[76.570855,9.37446],[76.570949,9.374499],[76.570926,9.374599],[76.570901,9.374712],[76.570853,9.374817],[76.570723,9.375267],[76.570566,9.375754],[76.569562,9.376149],[76.568997,9.376357],[76.569194,9.376524],[76.569326,9.376718],[76.569198,9.376758],[76.569339,9.377093],[76.569137,9.37716],[76.568921,9.377301],[76.56866,9.377578],[76.56872,9.377773],[76.5684,9.377885],[76.568224,9.377946],[76.568145,9.377991],[76.568062,9.378038],[76.567956,9.378284],[76.568164,9.378616],[76.568046,9.378656],[76.567856,9.378719],[76.567464,9.378861],[76.567107,9.378923],[76.566542,9.379026],[76.565579,9.379099],[76.565599,9.379216],[76.565626,9.379392],[76.565607,9.37951],[76.565547,9.379655],[76.565418,9.379967],[76.565607,9.38022],[76.565752,9.380461],[76.56578,9.380617],[76.565813,9.380816],[76.565775,9.381307],[76.565764,9.381455],[76.565681,9.381944],[76.565649,9.382132],[76.565552,9.382373],[76.565442,9.382733],[76.565162,9.382988],[76.565078,9.383253],[76.565007,9.383512],[76.564963,9.384006],[76.564879,9.383886],[76.564799,9.383803],[76.564429,9.383801],[76.56429,9.383776],[76.564162,9.383724],[76.563968,9.383659],[76.563785,9.383663],[76.563592,9.383681],[76.563357,9.383715],[76.563225,9.383683],[76.56313,9.383624],[76.563056,9.383528],[76.563031,9.383417],[76.563006,9.383299],[76.563019,9.383208],[76.563006,9.383112],[76.562997,9.383015],[76.562934,9.382756],[76.562834,9.382483],[76.562793,9.382372],[76.562717,9.382165],[76.562657,9.382029],[76.562588,9.381835],[76.56255,9.381673],[76.562517,9.381573],[76.562457,9.381395],[76.56241,9.38126],[76.562351,9.381172],[76.562288,9.381079],[76.562253,9.380984],[76.562239,9.380803],[76.562238,9.380707],[76.562258,9.380557],[76.562298,9.380413],[76.562286,9.380287],[76.562214,9.380141],[76.562138,9.380006],[76.562105,9.379889],[76.562085,9.379747],[76.562066,9.3796],[76.561969,9.379503],[76.562275,9.379395],[76.562618,9.379299],[76.56286,9.379153],[76.563189,9.378959],[76.563438,9.378845],[76.563763,9.378702],[76.563942,9.378624],[76.56442,9.378468],[76.56451,9.378443],[76.564892,9.378335],[76.565162,9.37824],[76.565384,9.378198],[76.565317,9.377918],[76.565287,9.37773],[76.565237,9.377386],[76.565236,9.377092],[76.565245,9.376869],[76.565208,9.376661],[76.565165,9.376402],[76.565077,9.37614],[76.565034,9.375941],[76.564998,9.375726],[76.564927,9.375428],[76.565341,9.375459],[76.565606,9.375473],[76.565777,9.375503],[76.566017,9.375638],[76.566224,9.375714],[76.566584,9.375724],[76.566679,9.375724],[76.566983,9.375583],[76.567182,9.375346],[76.567269,9.375212],[76.567355,9.375093],[76.567542,9.374963],[76.56801,9.374705],[76.56812,9.374431],[76.568147,9.374229],[76.567996,9.374001],[76.567892,9.373867],[76.56767,9.37343],[76.567636,9.373273]]]},\"properties\":{\"Created_Da\":\"2024-10-20T12:09:09.868Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"athulya m g\",\"Ward_Name\":\"M G M WARD\",\"Ward_No\":\"33\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.584389,9.384797],[76.584644,9.385119],[76.584304,9.385001],[76.584201,9.384961],[76.58396,9.384867],[76.583636,9.384762],[76.583435,9.384781],[76.583211,9.384838],[76.582617,9.384988],[76.582369,9.385066],[76.582239,9.385105],[76.582082,9.385174],[76.581033,9.385575],[76.580546,9.385677],[76.580382,9.385716],[76.580259,9.385742],[76.579848,9.385679],[76.579338,9.385602],[76.579154,9.385561],[76.579049,9.385504],[76.578892,9.385484],[76.578779,9.385476],[76.578604,9.385476],[76.578447,9.385468],[76.578175,9.385499],[76.578062,9.385529],[76.577963,9.385566],[76.577612,9.385677],[76.577499,9.385555],[76.577349,9.385414],[76.577204,9.385362],[76.57705,9.385308],[76.57666,9.385403],[76.576303,9.385543],[76.576115,9.385593],[76.575886,9.385529],[76.575638,9.385442],[76.575524,9.385398],[76.575409,9.385354],[76.574908,9.385142],[76.574471,9.384643],[76.574328,9.384411],[76.574268,9.384299],[76.574209,9.384187],[76.574174,9.383883],[76.57415,9.383682],[76.574046,9.383124],[76.574084,9.382837],[76.574055,9.382614],[76.574021,9.38236],[76.574013,9.382215],[76.574017,9.3821],[76.57408,9.381855],[76.574146,9.381679],[76.574245,9.381457],[76.574335,9.381342],[76.574447,9.381171],[76.574561,9.38097],[76.57468,9.380825],[76.574769,9.380689],[76.57491,9.380536],[76.57505,9.380454],[76.575154,9.380414],[76.575334,9.38035],[76.575508,9.380253],[76.575674,9.380013],[76.575782,9.379817],[76.575854,9.379686],[76.575943,9.379469],[76.575962,9.379348],[76.575971,9.379226],[76.575947,9.37909],[76.575929,9.378994],[76.57589,9.378885],[76.57581,9.378746],[76.575747,9.378566],[76.575697,9.378434],[76.575694,9.378284],[76.575734,9.378111],[76.575787,9.377993],[76.575878,9.377866],[76.57613,9.377593],[76.576272,9.377459],[76.576412,9.377328],[76.576529,9.377219],[76.576602,9.377136],[76.576799,9.376945],[76.576928,9.376846],[76.577235,9.376606],[76.577264,9.376778],[76.577292,9.37695],[76.577304,9.377077],[76.577342,9.377518],[76.577341,9.377638],[76.57734,9.377759],[76.577328,9.377972],[76.577288,9.378678],[76.578305,9.37908],[76.578649,9.379188],[76.578977,9.379171],[76.57914,9.379134],[76.579287,9.379104],[76.579434,9.379075],[76.579783,9.379056],[76.580004,9.379082],[76.580266,9.379146],[76.580399,9.37919],[76.580529,9.379232],[76.580851,9.379312],[76.580967,9.379341],[76.58124,9.379321],[76.581593,9.379277],[76.581847,9.379231],[76.582101,9.379163],[76.582145,9.379335],[76.582173,9.379469],[76.5822,9.379603],[76.582215,9.379751],[76.582248,9.379945],[76.582268,9.380034],[76.58229,9.380153],[76.582395,9.38034],[76.582505,9.38049],[76.582663,9.380655],[76.582736,9.38073],[76.58283,9.380856],[76.58296,9.381031],[76.583055,9.381175],[76.583093,9.381277],[76.583131,9.381378],[76.583134,9.381472],[76.583108,9.381741],[76.583119,9.381909],[76.583197,9.382136],[76.583268,9.382384],[76.583297,9.382544],[76.583329,9.382691],[76.583381,9.382788],[76.583444,9.382913],[76.583543,9.383053],[76.583655,9.38318],[76.583725,9.383269],[76.583821,9.383404],[76.583874,9.383509],[76.583928,9.383613],[76.583952,9.383753],[76.58395,9.383919],[76.583949,9.384021],[76.583992,9.384151],[76.584066,9.38427],[76.584121,9.384362],[76.584201,9.384503],[76.584252,9.384602],[76.584389,9.384797]]]},\"properties\":{\"Created_Da\":\"2024-10-19T04:52:22.849Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"Mary Sincy K G\",\"Ward_Name\":\"PUSHPAGIRI WARD\",\"Ward_No\":\"14\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.576405,9.401594],[76.576561,9.401448],[76.576648,9.401526],[76.576383,9.401775],[76.57584,9.402592],[76.574628,9.403619],[76.574047,9.404105],[76.573627,9.404457],[76.573519,9.404542],[76.573062,9.404888],[76.572327,9.405054],[76.57186,9.405125],[76.571793,9.405051],[76.571738,9.404911],[76.571718,9.404727],[76.571735,9.404565],[76.571724,9.404374],[76.571628,9.404267],[76.571418,9.404175],[76.571159,9.404095],[76.571038,9.404074],[76.570769,9.403986],[76.570584,9.403876],[76.570463,9.40382],[76.570202,9.403743],[76.570043,9.40371],[76.56988,9.40368],[76.569601,9.403709],[76.569601,9.403558],[76.569618,9.403231],[76.569586,9.403037],[76.569538,9.402824],[76.569504,9.402673],[76.569453,9.402353],[76.569521,9.402057],[76.569631,9.401937],[76.569586,9.401733],[76.569579,9.401203],[76.569486,9.400922],[76.569318,9.400808],[76.569292,9.400578],[76.569265,9.400332],[76.569291,9.400114],[76.569224,9.399968],[76.569094,9.399684],[76.568989,9.399441],[76.568973,9.399339],[76.568831,9.399347],[76.568685,9.398855],[76.56845,9.398028],[76.568404,9.397907],[76.56836,9.397758],[76.567882,9.397686],[76.567582,9.39764],[76.567424,9.397614],[76.566838,9.397517],[76.567302,9.397095],[76.568015,9.396825],[76.568372,9.396598],[76.568818,9.396322],[76.569508,9.395841],[76.570117,9.395468],[76.570223,9.395402],[76.570397,9.395729],[76.570383,9.395938],[76.570396,9.396235],[76.570955,9.396437],[76.571558,9.396457],[76.571674,9.396853],[76.571753,9.39727],[76.571797,9.397871],[76.571762,9.398376],[76.572154,9.398373],[76.572301,9.398359],[76.572444,9.398346],[76.573639,9.398234],[76.573855,9.398214],[76.574422,9.398162],[76.574527,9.398594],[76.574617,9.398817],[76.574707,9.399041],[76.574684,9.399242],[76.574523,9.399278],[76.574323,9.399402],[76.574984,9.400416],[76.5759,9.401023],[76.575782,9.40137],[76.575888,9.401418],[76.576405,9.401594]]]},\"properties\":{\"Created_Da\":\"2024-10-21T18:14:12.543Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"athulya m g\",\"Ward_Name\":\"KOTTALIL\",\"Ward_No\":\"38\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.58006,9.422614],[76.57964,9.422635],[76.579335,9.422324],[76.579329,9.422323],[76.578235,9.421336],[76.576659,9.420036],[76.57513,9.418025],[76.573326,9.417136],[76.573394,9.416982],[76.573477,9.416706],[76.573561,9.416534],[76.573644,9.416363],[76.573716,9.416252],[76.573829,9.41609],[76.574181,9.416109],[76.574525,9.416107],[76.57465,9.416072],[76.574882,9.41601],[76.575002,9.415983],[76.575305,9.415764],[76.575469,9.415495],[76.575649,9.415342],[76.575883,9.415216],[76.576019,9.415366],[76.576155,9.415518],[76.576253,9.415686],[76.576313,9.415791],[76.576538,9.415739],[76.576876,9.415515],[76.577,9.415419],[76.577123,9.415328],[76.577246,9.415236],[76.577527,9.415094],[76.577963,9.414962],[76.578354,9.414874],[76.578474,9.414847],[76.578713,9.414747],[76.579113,9.41458],[76.579633,9.414491],[76.579784,9.414483],[76.579934,9.414475],[76.580388,9.41461],[76.580449,9.414514],[76.58055,9.414357],[76.580477,9.413981],[76.580074,9.413482],[76.579782,9.41312],[76.579538,9.413083],[76.579361,9.413133],[76.580019,9.41216],[76.580179,9.412176],[76.580281,9.412188],[76.580444,9.412208],[76.580642,9.411633],[76.580922,9.411011],[76.581056,9.410999],[76.581853,9.410966],[76.582754,9.409912],[76.582918,9.40972],[76.5834,9.40926],[76.583993,9.408714],[76.58409,9.408626],[76.585014,9.407941],[76.585137,9.408211],[76.585409,9.408805],[76.585485,9.409001],[76.585705,9.409558],[76.585743,9.409693],[76.585822,9.410082],[76.585918,9.410557],[76.585963,9.410777],[76.586006,9.410991],[76.585844,9.411141],[76.585438,9.411518],[76.585274,9.411669],[76.58527,9.411883],[76.585267,9.412012],[76.585277,9.412107],[76.585302,9.412333],[76.585308,9.412469],[76.585316,9.412655],[76.585335,9.41321],[76.585343,9.413464],[76.585311,9.413669],[76.585248,9.414078],[76.585216,9.414285],[76.585152,9.414696],[76.58512,9.414903],[76.585086,9.415065],[76.584999,9.415495],[76.58492,9.415884],[76.584856,9.416201],[76.584824,9.416358],[76.5847,9.416787],[76.584527,9.417382],[76.584415,9.417768],[76.584392,9.418009],[76.584346,9.418492],[76.5843,9.41897],[76.584277,9.419212],[76.584233,9.419501],[76.584189,9.419791],[76.584172,9.419895],[76.584142,9.420099],[76.583461,9.420255],[76.582757,9.421003],[76.582574,9.421006],[76.582625,9.421168],[76.582477,9.421515],[76.581939,9.421683],[76.581959,9.421853],[76.581612,9.42201],[76.580981,9.422156],[76.58072,9.422303],[76.580286,9.422466],[76.580282,9.422466],[76.58006,9.422614]]]},\"properties\":{\"Created_Da\":\"2024-10-21T10:26:30.625Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9074124773\",\"Surveyor\":\"suresh c\",\"Ward_Name\":\"VARIKAD\",\"Ward_No\":\"5\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.584644,9.385119],[76.584389,9.384797],[76.584252,9.384602],[76.584201,9.384503],[76.584121,9.384362],[76.584066,9.38427],[76.583992,9.384151],[76.583949,9.384021],[76.58395,9.383919],[76.583952,9.383753],[76.583928,9.383613],[76.583874,9.383509],[76.583821,9.383404],[76.583725,9.383269],[76.583655,9.38318],[76.583543,9.383053],[76.583444,9.382913],[76.583381,9.382788],[76.583329,9.382691],[76.583297,9.382544],[76.583268,9.382384],[76.583197,9.382136],[76.583119,9.381909],[76.583108,9.381741],[76.583134,9.381472],[76.583131,9.381378],[76.583093,9.381277],[76.583055,9.381175],[76.58296,9.381031],[76.58283,9.380856],[76.582736,9.38073],[76.582663,9.380655],[76.582505,9.38049],[76.582395,9.38034],[76.58229,9.380153],[76.582268,9.380034],[76.582248,9.379945],[76.582215,9.379751],[76.5822,9.379603],[76.582173,9.379469],[76.582145,9.379335],[76.582101,9.379163],[76.582071,9.378639],[76.582066,9.378528],[76.58206,9.378417],[76.582028,9.378262],[76.581953,9.378043],[76.581916,9.377853],[76.581896,9.377691],[76.581881,9.377569],[76.58187,9.377336],[76.581994,9.377326],[76.582097,9.37731],[76.582229,9.377286],[76.582384,9.377261],[76.582474,9.377235],[76.582637,9.377182],[76.582735,9.377148],[76.582973,9.377066],[76.583163,9.377012],[76.583334,9.376964],[76.583503,9.376955],[76.583607,9.376974],[76.583692,9.377016],[76.583878,9.377017],[76.584047,9.376985],[76.584318,9.376914],[76.584463,9.37687],[76.584619,9.376832],[76.584776,9.376791],[76.585013,9.376733],[76.585439,9.37662],[76.585641,9.376587],[76.585772,9.376664],[76.586287,9.376973],[76.586588,9.377294],[76.587232,9.37797],[76.587396,9.378139],[76.587567,9.378316],[76.587784,9.37854],[76.587978,9.378741],[76.588391,9.37881],[76.588602,9.378817],[76.588817,9.378825],[76.589167,9.378837],[76.589782,9.378858],[76.589885,9.378861],[76.590169,9.378871],[76.590401,9.378904],[76.59054,9.378936],[76.59068,9.378986],[76.590714,9.379071],[76.590801,9.379198],[76.590877,9.379343],[76.591021,9.379345],[76.591302,9.379328],[76.591562,9.379283],[76.591781,9.379236],[76.591885,9.379212],[76.591988,9.379197],[76.592147,9.379152],[76.592341,9.379113],[76.592432,9.379111],[76.592466,9.379228],[76.592471,9.379514],[76.592474,9.37962],[76.592544,9.37986],[76.592572,9.379949],[76.592603,9.380174],[76.592613,9.380369],[76.592746,9.380446],[76.592811,9.380595],[76.592843,9.380813],[76.592866,9.380982],[76.592876,9.381131],[76.592883,9.381231],[76.592881,9.381359],[76.592882,9.381513],[76.59288,9.381694],[76.592875,9.381864],[76.592874,9.38205],[76.592749,9.382124],[76.592652,9.382147],[76.592556,9.382177],[76.592459,9.382303],[76.592504,9.382495],[76.592548,9.382719],[76.592508,9.382909],[76.592351,9.382842],[76.592187,9.382862],[76.592053,9.382878],[76.591957,9.382893],[76.591755,9.382954],[76.591608,9.383043],[76.591443,9.3832],[76.591354,9.383293],[76.591187,9.383417],[76.590997,9.383499],[76.590896,9.383531],[76.590805,9.383548],[76.590607,9.38356],[76.5905,9.383568],[76.590294,9.383583],[76.590009,9.383664],[76.589921,9.38371],[76.589811,9.383795],[76.589608,9.383961],[76.589358,9.384156],[76.589141,9.384288],[76.588985,9.384344],[76.588803,9.384407],[76.588445,9.384544],[76.588261,9.384613],[76.588174,9.384657],[76.588045,9.384702],[76.587833,9.384774],[76.587691,9.384831],[76.587475,9.384916],[76.587274,9.385001],[76.587125,9.385064],[76.586377,9.385282],[76.586153,9.385321],[76.586029,9.385339],[76.585745,9.385379],[76.585556,9.385391],[76.585382,9.385401],[76.585151,9.385329],[76.584923,9.385238],[76.584644,9.385119]]]},\"properties\":{\"Created_Da\":\"2024-10-17T12:09:46.189Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"Mary Sincy K G\",\"Ward_Name\":\"THYMALA\",\"Ward_No\":\"15\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.558898,9.383879],[76.558894,9.383785],[76.559112,9.383755],[76.559258,9.383738],[76.559397,9.383721],[76.559559,9.383685],[76.559684,9.383639],[76.559798,9.383904],[76.559933,9.383886],[76.560111,9.38386],[76.560216,9.383969],[76.560372,9.383997],[76.560601,9.383989],[76.560776,9.384011],[76.560664,9.3843],[76.560562,9.384508],[76.560477,9.384678],[76.56056,9.384937],[76.560624,9.38505],[76.56085,9.385292],[76.560953,9.38535],[76.561066,9.385424],[76.56122,9.385507],[76.561327,9.385572],[76.561612,9.385767],[76.561706,9.385769],[76.561989,9.385781],[76.562465,9.385775],[76.562543,9.385835],[76.562563,9.385973],[76.562537,9.386192],[76.562492,9.386436],[76.562501,9.386694],[76.562506,9.386927],[76.562514,9.387176],[76.562545,9.387448],[76.562633,9.387664],[76.562667,9.387831],[76.562105,9.388522],[76.562001,9.388829],[76.56209,9.388994],[76.562261,9.389003],[76.562458,9.389103],[76.562644,9.389166],[76.562805,9.38922],[76.563053,9.38941],[76.563164,9.389495],[76.563397,9.389825],[76.563789,9.389846],[76.563687,9.389521],[76.563695,9.389413],[76.563867,9.388644],[76.564146,9.388614],[76.564314,9.38859],[76.564556,9.388588],[76.564667,9.38843],[76.564745,9.38835],[76.564851,9.388335],[76.565041,9.388338],[76.56526,9.388349],[76.565455,9.388349],[76.56558,9.388363],[76.565741,9.388399],[76.565991,9.388444],[76.566216,9.388491],[76.566342,9.388527],[76.566514,9.388576],[76.566675,9.388625],[76.567272,9.388746],[76.567232,9.388969],[76.567228,9.389081],[76.567186,9.389397],[76.567154,9.389559],[76.567111,9.389751],[76.567065,9.389931],[76.567024,9.390085],[76.566994,9.390237],[76.56696,9.39043],[76.566988,9.390521],[76.567058,9.390618],[76.567141,9.390676],[76.567236,9.390696],[76.567324,9.391122],[76.567408,9.391414],[76.56744,9.391526],[76.567473,9.391721],[76.567496,9.391909],[76.56743,9.391979],[76.567284,9.392008],[76.567147,9.392026],[76.567067,9.392114],[76.56675,9.392429],[76.566697,9.392532],[76.566655,9.392614],[76.566537,9.393146],[76.566112,9.393195],[76.566014,9.393499],[76.565487,9.393466],[76.564454,9.393697],[76.563645,9.393579],[76.563342,9.393381],[76.563184,9.39332],[76.563119,9.393463],[76.563101,9.393575],[76.56308,9.393715],[76.563039,9.3939],[76.563166,9.394056],[76.563291,9.394208],[76.563461,9.394414],[76.562979,9.394427],[76.562913,9.394563],[76.562814,9.394768],[76.56251,9.394834],[76.562219,9.395094],[76.562111,9.395192],[76.562051,9.39533],[76.561919,9.395503],[76.561486,9.39547],[76.561281,9.39549],[76.561153,9.3955],[76.561017,9.39551],[76.560811,9.395725],[76.56051,9.395771],[76.560374,9.395706],[76.560447,9.395558],[76.560534,9.395383],[76.560645,9.395325],[76.560786,9.395262],[76.560577,9.394914],[76.56051,9.394705],[76.560491,9.394557],[76.560499,9.394424],[76.560508,9.394283],[76.560437,9.393972],[76.560455,9.393883],[76.560493,9.393708],[76.560652,9.393642],[76.560643,9.393461],[76.560686,9.393217],[76.560704,9.393114],[76.56084,9.393099],[76.561002,9.393151],[76.561079,9.393036],[76.561165,9.392994],[76.561166,9.392872],[76.561168,9.39255],[76.561302,9.39251],[76.561374,9.392399],[76.561265,9.392142],[76.561127,9.392163],[76.560952,9.391946],[76.560519,9.391407],[76.560314,9.391185],[76.560208,9.39106],[76.560121,9.390956],[76.559998,9.39072],[76.559691,9.390871],[76.559632,9.391006],[76.5595,9.391054],[76.559327,9.391118],[76.559122,9.391075],[76.559101,9.390899],[76.559049,9.390694],[76.55889,9.390752],[76.558827,9.390608],[76.558996,9.390549],[76.558945,9.390327],[76.558938,9.389698],[76.558935,9.389592],[76.558886,9.389373],[76.558853,9.389269],[76.558785,9.389033],[76.558735,9.388933],[76.558711,9.388748],[76.558717,9.388543],[76.55868,9.388428],[76.558632,9.388297],[76.558524,9.388173],[76.558243,9.388107],[76.558215,9.388007],[76.558207,9.387907],[76.558191,9.387796],[76.55819,9.387486],[76.558237,9.387307],[76.558406,9.387036],[76.558481,9.386863],[76.558477,9.386755],[76.558492,9.386525],[76.558494,9.386395],[76.55849,9.386152],[76.558505,9.386006],[76.558545,9.385823],[76.558609,9.38574],[76.558783,9.385646],[76.558897,9.385587],[76.558988,9.385522],[76.558961,9.385345],[76.558951,9.385144],[76.558936,9.384937],[76.558927,9.384827],[76.558914,9.384509],[76.558891,9.384308],[76.558884,9.384208],[76.558891,9.384076],[76.558898,9.383879]]]},\"properties\":{\"Created_Da\":\"2024-10-21T13:20:06.078Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"athulya m g\",\"Ward_Name\":\"MANNANKARACHIRA\",\"Ward_No\":\"31\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.57613,9.377593],[76.575798,9.376779],[76.575543,9.376168],[76.575503,9.37608],[76.57519,9.375966],[76.574695,9.375753],[76.574536,9.375737],[76.574426,9.37591],[76.573874,9.375814],[76.573747,9.375809],[76.573381,9.375809],[76.573273,9.375876],[76.573138,9.375961],[76.573166,9.376072],[76.573235,9.376346],[76.57334,9.376525],[76.573358,9.376613],[76.573369,9.376768],[76.573403,9.376978],[76.573448,9.37716],[76.573256,9.377216],[76.573076,9.377249],[76.572895,9.377282],[76.572837,9.3774],[76.572883,9.37751],[76.572961,9.37774],[76.573004,9.377866],[76.573092,9.378093],[76.57319,9.378345],[76.573311,9.378612],[76.573381,9.378844],[76.57341,9.378942],[76.57349,9.379233],[76.573517,9.379386],[76.573545,9.379539],[76.573481,9.379773],[76.573396,9.380084],[76.573287,9.380161],[76.573127,9.380175],[76.572924,9.380192],[76.572615,9.380169],[76.572343,9.380153],[76.572049,9.380158],[76.571594,9.380171],[76.571285,9.380182],[76.571113,9.380175],[76.570995,9.380174],[76.570795,9.3802],[76.570662,9.380255],[76.570502,9.380324],[76.570384,9.380225],[76.570271,9.380122],[76.570059,9.379931],[76.569854,9.37975],[76.569222,9.379561],[76.569064,9.37942],[76.568934,9.379317],[76.568865,9.379243],[76.568164,9.378616],[76.567956,9.378284],[76.568062,9.378038],[76.568145,9.377991],[76.568224,9.377946],[76.5684,9.377885],[76.56872,9.377773],[76.56866,9.377578],[76.568921,9.377301],[76.569137,9.37716],[76.569339,9.377093],[76.569198,9.376758],[76.569326,9.376718],[76.569194,9.376524],[76.568997,9.376357],[76.569562,9.376149],[76.570566,9.375754],[76.570568,9.375901],[76.570571,9.376062],[76.570574,9.376258],[76.570845,9.376283],[76.570951,9.376283],[76.570928,9.376466],[76.570927,9.376574],[76.571072,9.376509],[76.571194,9.376444],[76.571352,9.376407],[76.57161,9.376365],[76.571763,9.376313],[76.571885,9.376289],[76.572386,9.37615],[76.572385,9.375948],[76.572385,9.375611],[76.572386,9.375374],[76.57257,9.374968],[76.572604,9.374752],[76.572609,9.374616],[76.572616,9.374383],[76.572665,9.374133],[76.572777,9.374059],[76.572973,9.374037],[76.5734,9.373986],[76.573564,9.373963],[76.573944,9.373911],[76.574171,9.373733],[76.574371,9.373424],[76.574328,9.373158],[76.574272,9.37301],[76.574138,9.372841],[76.574246,9.372775],[76.574364,9.372756],[76.574485,9.372729],[76.574853,9.372645],[76.574997,9.372663],[76.575225,9.372691],[76.575399,9.372634],[76.575541,9.372616],[76.575745,9.372609],[76.576121,9.372746],[76.576267,9.372733],[76.576445,9.372726],[76.576555,9.372721],[76.576783,9.372697],[76.576682,9.373004],[76.57671,9.373147],[76.576741,9.373307],[76.576857,9.373596],[76.576931,9.373782],[76.577024,9.374123],[76.577011,9.374223],[76.576914,9.375009],[76.576942,9.375484],[76.57703,9.37602],[76.577235,9.376606],[76.576928,9.376846],[76.576799,9.376945],[76.576602,9.377136],[76.576529,9.377219],[76.576412,9.377328],[76.576272,9.377459],[76.57613,9.377593]]]},\"properties\":{\"Created_Da\":\"2024-10-20T06:13:58.912Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"dipin raj r v\",\"Ward_Name\":\"KULAKKAD\",\"Ward_No\":\"23\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.574013,9.382215],[76.574021,9.38236],[76.574055,9.382614],[76.574084,9.382837],[76.574046,9.383124],[76.573126,9.38254],[76.571803,9.382984],[76.571411,9.383036],[76.571023,9.383323],[76.571224,9.383931],[76.570694,9.384594],[76.570413,9.384928],[76.567626,9.386554],[76.566744,9.387061],[76.566487,9.38719],[76.567245,9.384129],[76.567227,9.383988],[76.567191,9.38382],[76.567195,9.383704],[76.567154,9.383479],[76.567032,9.383399],[76.566883,9.383414],[76.566724,9.383428],[76.566594,9.383455],[76.566453,9.383508],[76.566252,9.383604],[76.566095,9.383613],[76.565935,9.383663],[76.56579,9.383717],[76.565694,9.383755],[76.56547,9.383847],[76.565339,9.383911],[76.565216,9.383976],[76.565063,9.383992],[76.564963,9.384006],[76.565007,9.383512],[76.565078,9.383253],[76.565162,9.382988],[76.565442,9.382733],[76.565552,9.382373],[76.565649,9.382132],[76.565681,9.381944],[76.565764,9.381455],[76.565775,9.381307],[76.565813,9.380816],[76.56578,9.380617],[76.565752,9.380461],[76.565607,9.38022],[76.565418,9.379967],[76.565547,9.379655],[76.565607,9.37951],[76.565626,9.379392],[76.565599,9.379216],[76.565579,9.379099],[76.566542,9.379026],[76.567107,9.378923],[76.567464,9.378861],[76.567856,9.378719],[76.568046,9.378656],[76.568164,9.378616],[76.568865,9.379243],[76.568934,9.379317],[76.569064,9.37942],[76.569222,9.379561],[76.569854,9.37975],[76.570059,9.379931],[76.570271,9.380122],[76.570384,9.380225],[76.570502,9.380324],[76.570662,9.380255],[76.570795,9.3802],[76.570995,9.380174],[76.571113,9.380175],[76.571285,9.380182],[76.571594,9.380171],[76.572049,9.380158],[76.572343,9.380153],[76.572615,9.380169],[76.572924,9.380192],[76.573127,9.380175],[76.573287,9.380161],[76.573396,9.380084],[76.573481,9.379773],[76.573545,9.379539],[76.573517,9.379386],[76.57349,9.379233],[76.57341,9.378942],[76.573381,9.378844],[76.573311,9.378612],[76.57319,9.378345],[76.573092,9.378093],[76.573004,9.377866],[76.572961,9.37774],[76.572883,9.37751],[76.572837,9.3774],[76.572895,9.377282],[76.573076,9.377249],[76.573256,9.377216],[76.573448,9.37716],[76.573403,9.376978],[76.573369,9.376768],[76.573358,9.376613],[76.57334,9.376525],[76.573235,9.376346],[76.573166,9.376072],[76.573138,9.375961],[76.573273,9.375876],[76.573381,9.375809],[76.573747,9.375809],[76.573874,9.375814],[76.574426,9.37591],[76.574536,9.375737],[76.574695,9.375753],[76.57519,9.375966],[76.575503,9.37608],[76.575543,9.376168],[76.575798,9.376779],[76.57613,9.377593],[76.575878,9.377866],[76.575787,9.377993],[76.575734,9.378111],[76.575694,9.378284],[76.575697,9.378434],[76.575747,9.378566],[76.57581,9.378746],[76.57589,9.378885],[76.575929,9.378994],[76.575947,9.37909],[76.575971,9.379226],[76.575962,9.379348],[76.575943,9.379469],[76.575854,9.379686],[76.575782,9.379817],[76.575674,9.380013],[76.575508,9.380253],[76.575334,9.38035],[76.575154,9.380414],[76.57505,9.380454],[76.57491,9.380536],[76.574769,9.380689],[76.57468,9.380825],[76.574561,9.38097],[76.574447,9.381171],[76.574335,9.381342],[76.574245,9.381457],[76.574146,9.381679],[76.57408,9.381855],[76.574017,9.3821],[76.574013,9.382215]]]},\"properties\":{\"Created_Da\":\"2024-10-21T08:56:22.640Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"athulya m g\",\"Ward_Name\":\"MARY GIRI\",\"Ward_No\":\"34\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.562373,9.36745],[76.56253,9.367629],[76.56277,9.367681],[76.563026,9.367601],[76.563314,9.367375],[76.563406,9.367334],[76.563667,9.367216],[76.563255,9.367647],[76.563078,9.368103],[76.563053,9.36824],[76.56304,9.368465],[76.563008,9.368811],[76.56281,9.369289],[76.562819,9.3697],[76.562832,9.369898],[76.562858,9.370295],[76.562683,9.370552],[76.562577,9.370872],[76.562339,9.37087],[76.562116,9.370876],[76.561786,9.370922],[76.561779,9.371093],[76.561785,9.371363],[76.561759,9.37151],[76.561728,9.371625],[76.561696,9.37174],[76.561633,9.371878],[76.561611,9.372012],[76.56159,9.372133],[76.561557,9.372326],[76.561413,9.372329],[76.56127,9.372333],[76.561229,9.372421],[76.561176,9.372536],[76.561165,9.372689],[76.561,9.372811],[76.560753,9.372925],[76.560512,9.37294],[76.560299,9.372925],[76.560208,9.372859],[76.560118,9.372793],[76.559997,9.372703],[76.559774,9.372682],[76.559556,9.372694],[76.55934,9.372768],[76.559226,9.372845],[76.559076,9.372848],[76.55881,9.372766],[76.558697,9.372754],[76.558497,9.37275],[76.558354,9.372767],[76.558246,9.37278],[76.558138,9.372792],[76.557891,9.372889],[76.557666,9.37294],[76.557473,9.372733],[76.5575,9.372296],[76.557556,9.372056],[76.557613,9.371816],[76.557637,9.371698],[76.557682,9.37155],[76.557744,9.37134],[76.55779,9.371202],[76.557842,9.371079],[76.557877,9.370986],[76.557911,9.370893],[76.557941,9.370793],[76.55803,9.37048],[76.558088,9.370281],[76.558022,9.370195],[76.557713,9.369992],[76.557518,9.369919],[76.557441,9.369844],[76.55721,9.369648],[76.557022,9.369753],[76.556768,9.369768],[76.556499,9.369589],[76.556407,9.36955],[76.556315,9.36951],[76.556085,9.369416],[76.555997,9.369389],[76.555873,9.369734],[76.555806,9.370113],[76.5557,9.370277],[76.555603,9.370276],[76.555321,9.370277],[76.555157,9.370395],[76.555052,9.370738],[76.554966,9.3707],[76.554523,9.370508],[76.554146,9.370321],[76.554045,9.370278],[76.553544,9.370062],[76.553214,9.370167],[76.55278,9.370156],[76.552807,9.370018],[76.552848,9.369818],[76.552812,9.369718],[76.552749,9.369539],[76.552665,9.3693],[76.552636,9.369192],[76.552585,9.369004],[76.552533,9.368769],[76.552685,9.368611],[76.552874,9.368764],[76.553293,9.369104],[76.553485,9.369148],[76.553678,9.369192],[76.553793,9.369203],[76.553902,9.369169],[76.554123,9.36907],[76.554279,9.369],[76.554397,9.368948],[76.554472,9.368883],[76.554694,9.368747],[76.554869,9.36864],[76.555096,9.368501],[76.55522,9.368305],[76.555358,9.368088],[76.555464,9.367921],[76.555597,9.367682],[76.555863,9.367206],[76.556085,9.367093],[76.556323,9.366973],[76.556593,9.366768],[76.55692,9.366637],[76.557122,9.366473],[76.557199,9.366411],[76.5573,9.366357],[76.557491,9.366128],[76.557617,9.365977],[76.558081,9.365844],[76.55843,9.365744],[76.558759,9.365649],[76.559082,9.365499],[76.559509,9.3653],[76.559653,9.365233],[76.559912,9.364918],[76.560169,9.36462],[76.560212,9.36454],[76.56035,9.364339],[76.560444,9.364203],[76.560615,9.364019],[76.560672,9.363923],[76.560847,9.363709],[76.5611,9.363707],[76.561374,9.363705],[76.561711,9.363745],[76.561907,9.363981],[76.561892,9.364304],[76.561875,9.364662],[76.561813,9.364988],[76.561748,9.365329],[76.561713,9.365578],[76.561664,9.365925],[76.56174,9.366202],[76.561848,9.366593],[76.561903,9.366792],[76.56194,9.366934],[76.56214,9.367183],[76.562373,9.36745]]]},\"properties\":{\"Created_Da\":\"2024-10-21T07:44:55.074Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"dipin raj r v\",\"Ward_Name\":\"KIZHAKKUMMURI\",\"Ward_No\":\"26\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.577916,9.37214],[76.578088,9.372077],[76.578271,9.372009],[76.578609,9.371864],[76.578844,9.371687],[76.579052,9.371609],[76.579327,9.37136],[76.579408,9.370896],[76.579471,9.370181],[76.579919,9.369622],[76.580346,9.368634],[76.580458,9.368529],[76.580569,9.368423],[76.580771,9.368278],[76.581337,9.368184],[76.581962,9.368109],[76.582503,9.367922],[76.582688,9.367829],[76.582776,9.367856],[76.582974,9.367917],[76.583159,9.367963],[76.583369,9.368017],[76.58361,9.368079],[76.58371,9.368113],[76.583674,9.368284],[76.583676,9.368392],[76.583683,9.368524],[76.583696,9.368689],[76.583746,9.36878],[76.583925,9.368794],[76.583969,9.368906],[76.583928,9.369062],[76.583884,9.369221],[76.583838,9.369394],[76.583828,9.369489],[76.583827,9.369668],[76.583805,9.37001],[76.583756,9.370331],[76.583733,9.37042],[76.583728,9.370522],[76.583717,9.370679],[76.583677,9.370875],[76.583663,9.370971],[76.583654,9.371162],[76.581955,9.371227],[76.581082,9.371307],[76.5811,9.371581],[76.581097,9.371693],[76.581173,9.371802],[76.581291,9.371855],[76.581301,9.371998],[76.581275,9.372109],[76.581243,9.372226],[76.581123,9.372264],[76.581009,9.372294],[76.580934,9.372439],[76.580935,9.37254],[76.580928,9.372652],[76.580915,9.372767],[76.580903,9.372869],[76.580868,9.373111],[76.580852,9.373274],[76.580827,9.373565],[76.58112,9.374209],[76.581191,9.374346],[76.581252,9.374467],[76.581414,9.374801],[76.581464,9.374915],[76.581513,9.375029],[76.581674,9.375389],[76.581725,9.375485],[76.581819,9.37566],[76.581877,9.37593],[76.581886,9.376044],[76.581897,9.376209],[76.581913,9.376465],[76.581921,9.376621],[76.581922,9.376718],[76.581891,9.376909],[76.581869,9.377003],[76.58187,9.377336],[76.581881,9.377569],[76.581896,9.377691],[76.581916,9.377853],[76.581953,9.378043],[76.582028,9.378262],[76.58206,9.378417],[76.582066,9.378528],[76.582071,9.378639],[76.582101,9.379163],[76.581847,9.379231],[76.581593,9.379277],[76.58124,9.379321],[76.580967,9.379341],[76.580851,9.379312],[76.580529,9.379232],[76.580399,9.37919],[76.580266,9.379146],[76.580004,9.379082],[76.579783,9.379056],[76.579434,9.379075],[76.579287,9.379104],[76.57914,9.379134],[76.578977,9.379171],[76.578649,9.379188],[76.578305,9.37908],[76.577288,9.378678],[76.577328,9.377972],[76.57734,9.377759],[76.577341,9.377638],[76.577342,9.377518],[76.577304,9.377077],[76.577292,9.37695],[76.577264,9.376778],[76.577235,9.376606],[76.57703,9.37602],[76.576942,9.375484],[76.576914,9.375009],[76.577011,9.374223],[76.577024,9.374123],[76.576931,9.373782],[76.576857,9.373596],[76.576741,9.373307],[76.57671,9.373147],[76.576682,9.373004],[76.576783,9.372697],[76.576882,9.372686],[76.577269,9.372479],[76.577532,9.372338],[76.577916,9.37214]]]},\"properties\":{\"Created_Da\":\"2024-10-18T10:12:06.776Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"Mary Sincy K G\",\"Ward_Name\":\"ANJILIMOOD\",\"Ward_No\":\"20\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.57551,9.36313],[76.57587,9.362933],[76.576041,9.362915],[76.576168,9.36289],[76.57627,9.362922],[76.57663,9.363045],[76.576902,9.363033],[76.577594,9.362956],[76.577831,9.362926],[76.578033,9.362899],[76.578186,9.36288],[76.578392,9.362884],[76.578498,9.362886],[76.579056,9.363795],[76.579247,9.363944],[76.579335,9.364024],[76.579405,9.364144],[76.579616,9.364553],[76.580612,9.363904],[76.580799,9.363833],[76.580888,9.363888],[76.580996,9.363984],[76.581179,9.364025],[76.581586,9.363894],[76.581657,9.364098],[76.581718,9.364396],[76.582353,9.364365],[76.582668,9.364269],[76.583159,9.36435],[76.583292,9.364372],[76.583404,9.364392],[76.583577,9.364564],[76.583813,9.364798],[76.583818,9.364935],[76.583823,9.365082],[76.583821,9.365357],[76.584209,9.365399],[76.583979,9.365954],[76.583804,9.366611],[76.583763,9.366718],[76.583607,9.367137],[76.583411,9.367336],[76.583263,9.367474],[76.583114,9.367613],[76.582996,9.367673],[76.582776,9.367856],[76.582688,9.367829],[76.582503,9.367922],[76.581962,9.368109],[76.581337,9.368184],[76.580771,9.368278],[76.580569,9.368423],[76.580458,9.368529],[76.580346,9.368634],[76.579919,9.369622],[76.579471,9.370181],[76.579408,9.370896],[76.579327,9.37136],[76.579052,9.371609],[76.578844,9.371687],[76.578807,9.371568],[76.578694,9.371229],[76.57848,9.370861],[76.578344,9.370681],[76.578307,9.370338],[76.578185,9.369878],[76.5781,9.369733],[76.578049,9.369616],[76.577929,9.369323],[76.577778,9.368897],[76.57747,9.368883],[76.576797,9.368933],[76.576501,9.369072],[76.576344,9.369132],[76.576203,9.368994],[76.576128,9.36892],[76.576137,9.368673],[76.576115,9.368536],[76.575923,9.368548],[76.57618,9.368252],[76.576559,9.368083],[76.576789,9.36798],[76.576965,9.367644],[76.577103,9.367381],[76.577053,9.367097],[76.577029,9.366961],[76.576957,9.36684],[76.576862,9.366682],[76.57665,9.366371],[76.57643,9.366028],[76.576336,9.365882],[76.575861,9.365371],[76.57567,9.365166],[76.575497,9.364822],[76.575351,9.364526],[76.57526,9.364336],[76.575494,9.364182],[76.575819,9.36403],[76.575736,9.36379],[76.57551,9.36313]]]},\"properties\":{\"Created_Da\":\"2024-10-18T09:20:32.508Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"Dipin raj rv\",\"Ward_Name\":\"THIRUMOOLAPURAM WEST\",\"Ward_No\":\"21\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.558243,9.388107],[76.558524,9.388173],[76.558632,9.388297],[76.55868,9.388428],[76.558717,9.388543],[76.558711,9.388748],[76.558735,9.388933],[76.558785,9.389033],[76.558853,9.389269],[76.558886,9.389373],[76.558935,9.389592],[76.558938,9.389698],[76.558945,9.390327],[76.558761,9.390326],[76.558759,9.390493],[76.558678,9.390651],[76.558444,9.390863],[76.558424,9.391104],[76.558141,9.391056],[76.558044,9.39104],[76.557802,9.390989],[76.557595,9.390882],[76.557511,9.390764],[76.557411,9.390787],[76.557405,9.390884],[76.557018,9.390808],[76.55694,9.391176],[76.556937,9.391827],[76.557181,9.391946],[76.557216,9.392205],[76.557131,9.392402],[76.557033,9.392683],[76.556847,9.392656],[76.556754,9.392676],[76.556472,9.392625],[76.556259,9.392608],[76.556017,9.392758],[76.555696,9.392854],[76.555602,9.392882],[76.555497,9.392913],[76.555277,9.392963],[76.555107,9.393084],[76.555014,9.39322],[76.555092,9.393339],[76.555114,9.393616],[76.555098,9.39375],[76.555078,9.393917],[76.555197,9.394079],[76.555208,9.394204],[76.554904,9.394228],[76.554746,9.393961],[76.554642,9.393963],[76.554629,9.394224],[76.554455,9.39424],[76.554208,9.394262],[76.553889,9.394291],[76.553716,9.394247],[76.553321,9.394145],[76.553207,9.393839],[76.553194,9.393676],[76.553361,9.393673],[76.553485,9.393233],[76.553553,9.393085],[76.553556,9.392916],[76.553526,9.392737],[76.55344,9.392509],[76.553136,9.392587],[76.552984,9.392625],[76.55288,9.392658],[76.552764,9.392658],[76.55263,9.392682],[76.552383,9.392727],[76.552148,9.392724],[76.552043,9.39249],[76.552046,9.392359],[76.551779,9.392305],[76.551695,9.392688],[76.5516,9.39288],[76.551387,9.392939],[76.551358,9.392755],[76.551333,9.392599],[76.550934,9.392621],[76.550858,9.392928],[76.550695,9.392912],[76.550463,9.39289],[76.55023,9.392899],[76.549854,9.392914],[76.549695,9.392984],[76.549638,9.392564],[76.549331,9.392609],[76.549272,9.392693],[76.549044,9.392698],[76.548816,9.392704],[76.548721,9.392669],[76.548582,9.392618],[76.548602,9.392388],[76.548601,9.392171],[76.548611,9.392072],[76.548564,9.391983],[76.548487,9.391725],[76.548372,9.39153],[76.548328,9.391441],[76.548268,9.391276],[76.548234,9.391183],[76.548186,9.391028],[76.548169,9.390854],[76.548153,9.390699],[76.548098,9.390368],[76.548112,9.390239],[76.548311,9.390021],[76.548741,9.390052],[76.54884,9.389987],[76.548982,9.389833],[76.549097,9.389798],[76.549249,9.389734],[76.549442,9.389821],[76.549432,9.389612],[76.549645,9.38944],[76.549705,9.389171],[76.549757,9.388941],[76.549716,9.388625],[76.549656,9.388499],[76.549569,9.388317],[76.54959,9.388212],[76.549616,9.388086],[76.549711,9.38803],[76.549954,9.388008],[76.550064,9.387848],[76.550168,9.387467],[76.550188,9.387279],[76.550166,9.387173],[76.550339,9.387165],[76.550612,9.387302],[76.550847,9.387369],[76.55106,9.387384],[76.551164,9.387413],[76.551349,9.387465],[76.551475,9.387488],[76.551665,9.3875],[76.551684,9.387356],[76.551703,9.387225],[76.551717,9.387096],[76.551725,9.387005],[76.551727,9.386814],[76.551729,9.38667],[76.551726,9.386577],[76.551708,9.38633],[76.551703,9.386218],[76.5517,9.386114],[76.551697,9.386009],[76.551694,9.385897],[76.551696,9.385727],[76.5518,9.385624],[76.551932,9.385619],[76.552213,9.38561],[76.552454,9.385586],[76.552685,9.385576],[76.552901,9.385516],[76.55301,9.385489],[76.553159,9.385472],[76.553272,9.385502],[76.553401,9.385604],[76.553474,9.385676],[76.553667,9.385578],[76.553839,9.385477],[76.55404,9.385496],[76.554241,9.385559],[76.55428,9.385702],[76.554329,9.385878],[76.554409,9.386079],[76.55449,9.386239],[76.554483,9.386426],[76.554607,9.386598],[76.55483,9.386768],[76.554844,9.387035],[76.554862,9.387208],[76.554886,9.387371],[76.555047,9.387393],[76.555182,9.387405],[76.555305,9.387357],[76.555422,9.387382],[76.555559,9.387418],[76.555635,9.387549],[76.555682,9.387667],[76.555712,9.387805],[76.555716,9.387952],[76.555726,9.388089],[76.555713,9.388257],[76.55569,9.38842],[76.555675,9.388561],[76.555663,9.388667],[76.555658,9.38883],[76.555664,9.388976],[76.55566,9.389112],[76.555654,9.389248],[76.555648,9.389381],[76.555556,9.389485],[76.555464,9.389588],[76.555386,9.389731],[76.555572,9.389779],[76.556039,9.389842],[76.556254,9.389863],[76.556545,9.389863],[76.55669,9.389749],[76.556692,9.389655],[76.556678,9.389517],[76.556661,9.389313],[76.556899,9.38912],[76.557087,9.388912],[76.55725,9.388716],[76.557315,9.388637],[76.557482,9.3885],[76.557647,9.388452],[76.557751,9.388435],[76.557877,9.388415],[76.55803,9.388344],[76.558137,9.388269],[76.558243,9.388107]]]},\"properties\":{\"Created_Da\":\"2024-10-21T10:54:43.151Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"dipin raj r v\",\"Ward_Name\":\"AZHIYIDATHUCHIRA\",\"Ward_No\":\"30\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.566216,9.388491],[76.565991,9.388444],[76.565741,9.388399],[76.56558,9.388363],[76.565455,9.388349],[76.56526,9.388349],[76.565041,9.388338],[76.564851,9.388335],[76.564745,9.38835],[76.564667,9.38843],[76.564556,9.388588],[76.564314,9.38859],[76.564146,9.388614],[76.563867,9.388644],[76.563695,9.389413],[76.563687,9.389521],[76.563789,9.389846],[76.563397,9.389825],[76.563164,9.389495],[76.563053,9.38941],[76.562805,9.38922],[76.562644,9.389166],[76.562458,9.389103],[76.562261,9.389003],[76.56209,9.388994],[76.562001,9.388829],[76.562105,9.388522],[76.562667,9.387831],[76.562633,9.387664],[76.562545,9.387448],[76.562514,9.387176],[76.562506,9.386927],[76.562501,9.386694],[76.562492,9.386436],[76.562537,9.386192],[76.562563,9.385973],[76.562543,9.385835],[76.562465,9.385775],[76.561989,9.385781],[76.561706,9.385769],[76.561612,9.385767],[76.561327,9.385572],[76.56122,9.385507],[76.561066,9.385424],[76.560953,9.38535],[76.56085,9.385292],[76.560624,9.38505],[76.56056,9.384937],[76.560477,9.384678],[76.560562,9.384508],[76.560664,9.3843],[76.560776,9.384011],[76.560601,9.383989],[76.560372,9.383997],[76.560216,9.383969],[76.560111,9.38386],[76.559933,9.383886],[76.559798,9.383904],[76.559684,9.383639],[76.559559,9.383685],[76.559397,9.383721],[76.559258,9.383738],[76.559112,9.383755],[76.558894,9.383785],[76.558887,9.383545],[76.558866,9.383272],[76.55887,9.383076],[76.558857,9.382826],[76.558863,9.382662],[76.558867,9.382542],[76.558808,9.382289],[76.55876,9.382202],[76.558669,9.38209],[76.558567,9.381928],[76.55849,9.381814],[76.55845,9.381712],[76.558273,9.381541],[76.558168,9.381506],[76.558129,9.381595],[76.558101,9.381693],[76.558061,9.381872],[76.557975,9.382065],[76.557757,9.38204],[76.557626,9.382116],[76.557531,9.382118],[76.557443,9.382148],[76.557265,9.382167],[76.557168,9.382194],[76.556843,9.382275],[76.556769,9.382367],[76.556766,9.382476],[76.556778,9.382724],[76.556618,9.382799],[76.556407,9.382802],[76.556312,9.382682],[76.556279,9.382542],[76.556179,9.382552],[76.556063,9.382564],[76.555928,9.38259],[76.55581,9.382558],[76.555664,9.382521],[76.555438,9.382334],[76.555442,9.382212],[76.555448,9.382103],[76.555387,9.381935],[76.555336,9.381772],[76.555284,9.381629],[76.555282,9.381508],[76.555362,9.381357],[76.555497,9.381298],[76.555585,9.381259],[76.55587,9.381181],[76.555919,9.380963],[76.555894,9.380774],[76.555869,9.380654],[76.555866,9.38046],[76.555846,9.380333],[76.555814,9.380171],[76.555755,9.379995],[76.555704,9.379809],[76.55569,9.379665],[76.555691,9.379522],[76.555693,9.379296],[76.555689,9.379131],[76.555648,9.378953],[76.555609,9.378778],[76.555703,9.378674],[76.555888,9.37853],[76.555967,9.378479],[76.556114,9.378377],[76.556261,9.378274],[76.556483,9.378112],[76.556662,9.377945],[76.556722,9.377826],[76.556808,9.37757],[76.556857,9.377387],[76.556906,9.377203],[76.556935,9.377084],[76.557064,9.377091],[76.55716,9.377099],[76.557259,9.37711],[76.5574,9.37714],[76.557648,9.377217],[76.557852,9.37728],[76.557772,9.377439],[76.557756,9.377704],[76.557751,9.377821],[76.557751,9.378502],[76.557748,9.378797],[76.557764,9.379002],[76.557786,9.379293],[76.55783,9.379493],[76.557851,9.37959],[76.557894,9.379807],[76.557895,9.37993],[76.557896,9.38003],[76.557894,9.380174],[76.557893,9.380294],[76.558084,9.380379],[76.558489,9.380332],[76.558764,9.380259],[76.558922,9.38022],[76.559101,9.380164],[76.55933,9.380085],[76.559518,9.380045],[76.559734,9.38],[76.559894,9.379964],[76.560078,9.379925],[76.560279,9.379893],[76.560617,9.37982],[76.56082,9.379772],[76.561035,9.37965],[76.56125,9.379663],[76.561396,9.379635],[76.561615,9.37959],[76.561969,9.379503],[76.562066,9.3796],[76.562085,9.379747],[76.562105,9.379889],[76.562138,9.380006],[76.562214,9.380141],[76.562286,9.380287],[76.562298,9.380413],[76.562258,9.380557],[76.562238,9.380707],[76.562239,9.380803],[76.562253,9.380984],[76.562288,9.381079],[76.562351,9.381172],[76.56241,9.38126],[76.562457,9.381395],[76.562517,9.381573],[76.56255,9.381673],[76.562588,9.381835],[76.562657,9.382029],[76.562717,9.382165],[76.562793,9.382372],[76.562834,9.382483],[76.562934,9.382756],[76.562997,9.383015],[76.563006,9.383112],[76.563019,9.383208],[76.563006,9.383299],[76.563031,9.383417],[76.563056,9.383528],[76.56313,9.383624],[76.563225,9.383683],[76.563357,9.383715],[76.563592,9.383681],[76.563785,9.383663],[76.563968,9.383659],[76.564162,9.383724],[76.56429,9.383776],[76.564429,9.383801],[76.564799,9.383803],[76.564879,9.383886],[76.564963,9.384006],[76.565063,9.383992],[76.565216,9.383976],[76.565339,9.383911],[76.56547,9.383847],[76.565694,9.383755],[76.56579,9.383717],[76.565935,9.383663],[76.566095,9.383613],[76.566252,9.383604],[76.566453,9.383508],[76.566594,9.383455],[76.566724,9.383428],[76.566883,9.383414],[76.567032,9.383399],[76.567154,9.383479],[76.567195,9.383704],[76.567191,9.38382],[76.567227,9.383988],[76.567245,9.384129],[76.566487,9.38719],[76.566259,9.387713],[76.566157,9.387999],[76.566128,9.388161],[76.566161,9.388321],[76.566216,9.388491]]]},\"properties\":{\"Created_Da\":\"2024-10-20T09:28:11.862Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"athulya m g\",\"Ward_Name\":\"ANCHALKUTTY\",\"Ward_No\":\"32\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.566487,9.38719],[76.566744,9.387061],[76.567626,9.386554],[76.570413,9.384928],[76.570694,9.384594],[76.571224,9.383931],[76.571023,9.383323],[76.571411,9.383036],[76.571803,9.382984],[76.573126,9.38254],[76.574046,9.383124],[76.57415,9.383682],[76.574174,9.383883],[76.574209,9.384187],[76.574268,9.384299],[76.574328,9.384411],[76.574471,9.384643],[76.574908,9.385142],[76.575409,9.385354],[76.575524,9.385398],[76.575638,9.385442],[76.575886,9.385529],[76.576115,9.385593],[76.576303,9.385543],[76.57666,9.385403],[76.57705,9.385308],[76.577204,9.385362],[76.577349,9.385414],[76.577499,9.385555],[76.577612,9.385677],[76.577747,9.385869],[76.577825,9.38598],[76.577896,9.38608],[76.578029,9.386252],[76.578221,9.386518],[76.578369,9.386798],[76.578441,9.386935],[76.578499,9.387083],[76.578475,9.387348],[76.578497,9.387531],[76.578516,9.387689],[76.578532,9.387893],[76.57872,9.387942],[76.578975,9.388],[76.579146,9.388047],[76.579266,9.388079],[76.579391,9.388112],[76.579599,9.388131],[76.579733,9.388143],[76.579868,9.388155],[76.580148,9.388196],[76.580159,9.388433],[76.580161,9.388587],[76.580164,9.388806],[76.580092,9.389202],[76.580021,9.389342],[76.579511,9.389435],[76.578801,9.389398],[76.578028,9.389347],[76.577916,9.389339],[76.577352,9.389326],[76.577073,9.389336],[76.576969,9.38934],[76.576787,9.389338],[76.576482,9.389352],[76.575894,9.389277],[76.5756,9.388971],[76.575325,9.388886],[76.575157,9.388862],[76.575031,9.387909],[76.574476,9.387954],[76.573862,9.388003],[76.573664,9.38802],[76.573466,9.388038],[76.572716,9.388118],[76.571978,9.387943],[76.571475,9.387848],[76.571372,9.387874],[76.570426,9.388157],[76.570353,9.388276],[76.57027,9.388411],[76.570171,9.388463],[76.570072,9.38852],[76.569943,9.388644],[76.569778,9.388704],[76.569663,9.3887],[76.569474,9.388731],[76.569287,9.38876],[76.568964,9.38889],[76.568701,9.388939],[76.568258,9.388902],[76.568087,9.388868],[76.56794,9.388846],[76.567655,9.388803],[76.567272,9.388746],[76.566675,9.388625],[76.566514,9.388576],[76.566342,9.388527],[76.566216,9.388491],[76.566161,9.388321],[76.566128,9.388161],[76.566157,9.387999],[76.566259,9.387713],[76.566487,9.38719]]]},\"properties\":{\"Created_Da\":\"2024-10-17T12:37:18.983Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Remarks\":\"Nil\",\"Surveyor\":\"ATHULYA M G\",\"Ward_Name\":\"TOWN WARD\",\"Ward_No\":\"35\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.552594,9.3709],[76.552614,9.370748],[76.55263,9.370626],[76.552708,9.3705],[76.552709,9.370381],[76.55278,9.370156],[76.553214,9.370167],[76.553544,9.370062],[76.554045,9.370278],[76.554146,9.370321],[76.554523,9.370508],[76.554966,9.3707],[76.555052,9.370738],[76.555157,9.370395],[76.555321,9.370277],[76.555603,9.370276],[76.5557,9.370277],[76.555806,9.370113],[76.555873,9.369734],[76.555997,9.369389],[76.556085,9.369416],[76.556315,9.36951],[76.556407,9.36955],[76.556499,9.369589],[76.556768,9.369768],[76.557022,9.369753],[76.55721,9.369648],[76.557441,9.369844],[76.557518,9.369919],[76.557713,9.369992],[76.558022,9.370195],[76.558088,9.370281],[76.55803,9.37048],[76.557941,9.370793],[76.557911,9.370893],[76.557877,9.370986],[76.557842,9.371079],[76.55779,9.371202],[76.557744,9.37134],[76.557682,9.37155],[76.557637,9.371698],[76.557613,9.371816],[76.557556,9.372056],[76.5575,9.372296],[76.557473,9.372733],[76.557666,9.37294],[76.557693,9.373273],[76.557942,9.373691],[76.558061,9.373994],[76.55818,9.37431],[76.558494,9.374917],[76.558804,9.375435],[76.559191,9.375881],[76.559471,9.376454],[76.559252,9.376539],[76.558879,9.376682],[76.558749,9.376735],[76.55844,9.376958],[76.558102,9.377206],[76.55795,9.377301],[76.557852,9.37728],[76.557648,9.377217],[76.5574,9.37714],[76.557259,9.37711],[76.55716,9.377099],[76.557064,9.377091],[76.556935,9.377084],[76.556906,9.377203],[76.556857,9.377387],[76.556808,9.37757],[76.556722,9.377826],[76.556662,9.377945],[76.556483,9.378112],[76.556261,9.378274],[76.556114,9.378377],[76.555967,9.378479],[76.555888,9.37853],[76.555703,9.378674],[76.555609,9.378778],[76.555648,9.378953],[76.555689,9.379131],[76.555693,9.379296],[76.555691,9.379522],[76.55569,9.379665],[76.555704,9.379809],[76.555755,9.379995],[76.555814,9.380171],[76.555846,9.380333],[76.555866,9.38046],[76.555869,9.380654],[76.555597,9.380642],[76.55544,9.38066],[76.55527,9.380691],[76.555138,9.380718],[76.554979,9.380728],[76.554847,9.380679],[76.554715,9.380631],[76.554426,9.380554],[76.554453,9.38039],[76.55449,9.380165],[76.554549,9.379898],[76.554573,9.379659],[76.554592,9.379369],[76.554565,9.379252],[76.554366,9.379232],[76.553951,9.379191],[76.553748,9.379109],[76.553917,9.378608],[76.553905,9.378514],[76.553905,9.378106],[76.553789,9.377639],[76.553545,9.377427],[76.553365,9.377232],[76.553334,9.37701],[76.553306,9.376812],[76.553013,9.376422],[76.552847,9.376253],[76.552721,9.376143],[76.552584,9.376023],[76.552118,9.376095],[76.551926,9.376125],[76.551387,9.375879],[76.551387,9.375735],[76.551397,9.375639],[76.551414,9.375495],[76.551496,9.375244],[76.551509,9.374881],[76.551617,9.374615],[76.551851,9.374269],[76.552213,9.374142],[76.552675,9.373981],[76.552811,9.373893],[76.553065,9.373589],[76.553152,9.37346],[76.553048,9.373143],[76.553006,9.373],[76.552941,9.372783],[76.55282,9.372381],[76.552692,9.372058],[76.552594,9.37181],[76.55251,9.371646],[76.552603,9.371473],[76.552604,9.371379],[76.552659,9.371194],[76.552594,9.3709]]]},\"properties\":{\"Created_Da\":\"2024-10-21T08:54:17.930Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"dipin raj r v\",\"Ward_Name\":\"KAVUMBHAGOM\",\"Ward_No\":\"28\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.585641,9.376587],[76.585439,9.37662],[76.585013,9.376733],[76.584776,9.376791],[76.584619,9.376832],[76.584463,9.37687],[76.584318,9.376914],[76.584047,9.376985],[76.583878,9.377017],[76.583692,9.377016],[76.583607,9.376974],[76.583503,9.376955],[76.583334,9.376964],[76.583163,9.377012],[76.582973,9.377066],[76.582735,9.377148],[76.582637,9.377182],[76.582474,9.377235],[76.582384,9.377261],[76.582229,9.377286],[76.582097,9.37731],[76.581994,9.377326],[76.58187,9.377336],[76.581869,9.377003],[76.581891,9.376909],[76.581922,9.376718],[76.581921,9.376621],[76.581913,9.376465],[76.581897,9.376209],[76.581886,9.376044],[76.581877,9.37593],[76.581819,9.37566],[76.581725,9.375485],[76.581674,9.375389],[76.581513,9.375029],[76.581464,9.374915],[76.581414,9.374801],[76.581252,9.374467],[76.581191,9.374346],[76.58112,9.374209],[76.580827,9.373565],[76.580852,9.373274],[76.580868,9.373111],[76.580903,9.372869],[76.580915,9.372767],[76.580928,9.372652],[76.580935,9.37254],[76.580934,9.372439],[76.581009,9.372294],[76.581123,9.372264],[76.581243,9.372226],[76.581275,9.372109],[76.581301,9.371998],[76.581291,9.371855],[76.581173,9.371802],[76.581097,9.371693],[76.5811,9.371581],[76.581082,9.371307],[76.581955,9.371227],[76.583654,9.371162],[76.583663,9.370971],[76.583677,9.370875],[76.583717,9.370679],[76.583728,9.370522],[76.583733,9.37042],[76.583756,9.370331],[76.583805,9.37001],[76.583827,9.369668],[76.583828,9.369489],[76.583838,9.369394],[76.583884,9.369221],[76.583928,9.369062],[76.583969,9.368906],[76.583925,9.368794],[76.583746,9.36878],[76.583696,9.368689],[76.583683,9.368524],[76.583676,9.368392],[76.583674,9.368284],[76.58371,9.368113],[76.583825,9.368125],[76.583998,9.368142],[76.58415,9.368165],[76.5843,9.368166],[76.584432,9.368188],[76.584572,9.368227],[76.584714,9.368274],[76.58495,9.368376],[76.58513,9.368457],[76.58528,9.368477],[76.585443,9.368461],[76.585643,9.368452],[76.585739,9.36845],[76.585856,9.36847],[76.585993,9.368532],[76.586119,9.368651],[76.586206,9.368742],[76.586406,9.368946],[76.586496,9.369056],[76.586614,9.369164],[76.586783,9.369252],[76.586935,9.36931],[76.587076,9.369365],[76.58712,9.369498],[76.587168,9.369592],[76.587193,9.369805],[76.587194,9.36994],[76.587179,9.370068],[76.587184,9.370192],[76.587206,9.370328],[76.587252,9.370528],[76.587233,9.370682],[76.587225,9.370804],[76.587232,9.3709],[76.587096,9.37116],[76.587147,9.371422],[76.587188,9.371535],[76.587233,9.371652],[76.58728,9.371797],[76.58732,9.371971],[76.587397,9.372045],[76.587636,9.372061],[76.587729,9.372058],[76.587915,9.372046],[76.588222,9.372078],[76.588254,9.372174],[76.588258,9.372352],[76.588307,9.372498],[76.588373,9.372616],[76.588311,9.372725],[76.588225,9.372763],[76.588132,9.372797],[76.588044,9.372823],[76.587866,9.37296],[76.587936,9.37314],[76.58803,9.37332],[76.588064,9.373414],[76.588082,9.37356],[76.58816,9.373668],[76.588284,9.373761],[76.588361,9.373879],[76.588281,9.373926],[76.588125,9.373986],[76.588041,9.374026],[76.587946,9.374084],[76.586439,9.375713],[76.586538,9.376052],[76.586572,9.376165],[76.586501,9.37644],[76.586287,9.376973],[76.585772,9.376664],[76.585641,9.376587]]]},\"properties\":{\"Created_Da\":\"2024-10-18T07:26:31.679Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"Mary Sincy K G\",\"Ward_Name\":\"THIRUMOOLAPURAM EAST\",\"Ward_No\":\"19\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.597789,9.396975],[76.597772,9.397088],[76.597743,9.397288],[76.597707,9.397532],[76.597663,9.397829],[76.597068,9.396666],[76.596453,9.395495],[76.596358,9.395349],[76.595862,9.394582],[76.595769,9.394439],[76.594685,9.394275],[76.594563,9.394261],[76.594523,9.393974],[76.594486,9.393718],[76.594384,9.393012],[76.594338,9.39279],[76.594305,9.392631],[76.594281,9.392516],[76.594123,9.391748],[76.594086,9.391572],[76.593932,9.391419],[76.593778,9.391265],[76.593655,9.391139],[76.593536,9.391015],[76.593357,9.390829],[76.593265,9.390734],[76.593443,9.389919],[76.593316,9.389723],[76.592713,9.389279],[76.592682,9.38918],[76.592634,9.389025],[76.592595,9.388898],[76.592621,9.388734],[76.59262,9.388634],[76.592611,9.388378],[76.592008,9.388426],[76.591809,9.38849],[76.591647,9.388557],[76.591492,9.388652],[76.591366,9.388724],[76.591222,9.388814],[76.591069,9.388941],[76.590914,9.389002],[76.590694,9.388749],[76.590442,9.388431],[76.590266,9.388313],[76.590189,9.388244],[76.590097,9.388108],[76.590146,9.388016],[76.590235,9.387949],[76.590389,9.387819],[76.590348,9.387683],[76.590309,9.3876],[76.590427,9.387542],[76.590505,9.38749],[76.590634,9.387423],[76.590783,9.387356],[76.591008,9.387221],[76.591117,9.387142],[76.591227,9.38708],[76.591355,9.38702],[76.591453,9.386988],[76.591731,9.386908],[76.591797,9.387024],[76.591858,9.387133],[76.592048,9.387226],[76.592217,9.38723],[76.592397,9.387239],[76.592552,9.387247],[76.59266,9.387239],[76.592808,9.387238],[76.592983,9.387211],[76.592964,9.387014],[76.592916,9.386844],[76.592866,9.386661],[76.592855,9.386568],[76.592848,9.386475],[76.592887,9.386326],[76.592918,9.386139],[76.592941,9.385942],[76.592921,9.385739],[76.592879,9.385584],[76.592813,9.385408],[76.59279,9.385262],[76.592833,9.385094],[76.592856,9.384905],[76.592872,9.384809],[76.59292,9.384603],[76.59302,9.384546],[76.593044,9.384379],[76.593031,9.384239],[76.593014,9.384073],[76.593,9.383953],[76.592989,9.383842],[76.592937,9.383729],[76.592872,9.383603],[76.592829,9.383488],[76.592745,9.38329],[76.592649,9.38322],[76.592551,9.383191],[76.59253,9.383077],[76.592508,9.382909],[76.592548,9.382719],[76.592647,9.382822],[76.592851,9.382876],[76.59296,9.382906],[76.593144,9.382966],[76.593291,9.383019],[76.593453,9.383075],[76.593609,9.383099],[76.593758,9.383117],[76.593938,9.38313],[76.59412,9.383157],[76.594298,9.383193],[76.594452,9.383226],[76.594659,9.383244],[76.59494,9.383293],[76.595196,9.383335],[76.595362,9.383361],[76.595638,9.383375],[76.59573,9.383383],[76.595952,9.383404],[76.596085,9.383429],[76.596262,9.383464],[76.596457,9.383529],[76.596662,9.383619],[76.596828,9.383703],[76.596911,9.383756],[76.597011,9.383842],[76.59721,9.384024],[76.597297,9.384086],[76.597422,9.384181],[76.597577,9.384277],[76.597697,9.384352],[76.597796,9.384415],[76.597991,9.384491],[76.59822,9.384562],[76.598389,9.384623],[76.598551,9.384682],[76.598671,9.384733],[76.598808,9.384801],[76.598926,9.38486],[76.599071,9.384959],[76.599207,9.385053],[76.599391,9.385181],[76.599579,9.385337],[76.599749,9.385476],[76.599921,9.38558],[76.600009,9.385612],[76.600182,9.385656],[76.600376,9.385663],[76.600532,9.385654],[76.600843,9.385654],[76.600981,9.385659],[76.601039,9.385771],[76.601102,9.385894],[76.601145,9.385977],[76.601127,9.386069],[76.601084,9.386282],[76.601063,9.386382],[76.600969,9.386656],[76.600865,9.386959],[76.600831,9.387083],[76.600742,9.387406],[76.60066,9.387703],[76.600625,9.387824],[76.600424,9.388174],[76.600406,9.388329],[76.600384,9.388534],[76.59984,9.388831],[76.599601,9.389014],[76.599167,9.389345],[76.598951,9.389588],[76.598708,9.389739],[76.59852,9.389924],[76.598341,9.390067],[76.597932,9.390393],[76.597523,9.390741],[76.59746,9.390822],[76.597208,9.391061],[76.597006,9.391251],[76.597156,9.391445],[76.59723,9.391541],[76.597383,9.391806],[76.597466,9.391949],[76.59741,9.392256],[76.597385,9.392612],[76.597376,9.392747],[76.597384,9.392926],[76.597404,9.393125],[76.597435,9.393441],[76.597485,9.393545],[76.597517,9.393959],[76.59763,9.394329],[76.597672,9.394441],[76.597904,9.394987],[76.597834,9.39606],[76.597807,9.396465],[76.597851,9.396591],[76.59781,9.396834],[76.597789,9.396975]]]},\"properties\":{\"Created_Da\":\"2024-10-20T11:51:04.773Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"mary sincy k g\",\"Ward_Name\":\"MEENTHALAKARA\",\"Ward_No\":\"11\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.582105,9.405154],[76.582455,9.405386],[76.582773,9.405589],[76.581616,9.406429],[76.580887,9.406802],[76.580576,9.406982],[76.580847,9.407528],[76.580062,9.407936],[76.579224,9.408164],[76.578217,9.408444],[76.57731,9.40879],[76.577009,9.408913],[76.576097,9.409286],[76.575068,9.409365],[76.574875,9.409378],[76.574682,9.40939],[76.573674,9.409458],[76.572482,9.409479],[76.572436,9.40913],[76.572414,9.408948],[76.572392,9.408786],[76.572318,9.408235],[76.572596,9.408133],[76.573127,9.407939],[76.573302,9.407874],[76.573391,9.407842],[76.573556,9.407781],[76.573576,9.407675],[76.573616,9.407461],[76.573646,9.407299],[76.573667,9.407184],[76.573928,9.406921],[76.573892,9.40668],[76.573764,9.405832],[76.573966,9.405774],[76.57421,9.405722],[76.57437,9.405702],[76.574525,9.405682],[76.574644,9.405673],[76.574935,9.405652],[76.575166,9.405634],[76.575517,9.405581],[76.575712,9.405551],[76.576075,9.405434],[76.576001,9.405069],[76.575952,9.404724],[76.575896,9.404417],[76.575262,9.404591],[76.575034,9.404128],[76.576016,9.403216],[76.576628,9.402603],[76.577072,9.401927],[76.577413,9.401406],[76.577676,9.401446],[76.578139,9.401468],[76.578286,9.401451],[76.578467,9.401433],[76.578923,9.401545],[76.579346,9.401656],[76.579698,9.401749],[76.579709,9.401879],[76.579712,9.402017],[76.579715,9.402198],[76.579723,9.402291],[76.579726,9.402386],[76.579729,9.402531],[76.579729,9.402689],[76.579773,9.402818],[76.579808,9.402922],[76.579848,9.403057],[76.579909,9.403256],[76.579983,9.40348],[76.580053,9.403642],[76.580126,9.403762],[76.580208,9.403925],[76.580396,9.404122],[76.580633,9.404274],[76.580904,9.404431],[76.581109,9.40455],[76.581354,9.404692],[76.581625,9.404871],[76.581802,9.404967],[76.581954,9.405061],[76.582105,9.405154]]]},\"properties\":{\"Created_Da\":\"2024-10-21T08:16:14.145Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Surveyor\":\"Suresh c\",\"Ward_Name\":\"ATTUCHIRA\",\"Ward_No\":\"3\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.58298,9.388601],[76.583347,9.388583],[76.583414,9.387883],[76.583242,9.387875],[76.583052,9.387864],[76.582891,9.387892],[76.582715,9.38794],[76.582629,9.387975],[76.58248,9.38802],[76.58203,9.388152],[76.581856,9.388147],[76.581862,9.387948],[76.581871,9.387774],[76.581922,9.387175],[76.581931,9.387053],[76.582012,9.386676],[76.582112,9.386654],[76.582279,9.386626],[76.582382,9.386602],[76.58251,9.386551],[76.582482,9.386316],[76.582469,9.386145],[76.582527,9.385977],[76.582592,9.385831],[76.582568,9.385741],[76.58254,9.385655],[76.582369,9.385066],[76.582617,9.384988],[76.583211,9.384838],[76.583435,9.384781],[76.583636,9.384762],[76.58396,9.384867],[76.584201,9.384961],[76.584304,9.385001],[76.584644,9.385119],[76.584552,9.385492],[76.584381,9.385544],[76.584438,9.385717],[76.584565,9.386107],[76.584623,9.386286],[76.584657,9.38639],[76.58471,9.386539],[76.584724,9.38676],[76.584766,9.386905],[76.584808,9.387051],[76.584874,9.38734],[76.584891,9.387704],[76.5848,9.387738],[76.58467,9.387853],[76.584598,9.387964],[76.584524,9.388107],[76.584384,9.38838],[76.584327,9.388524],[76.584269,9.388669],[76.584234,9.388838],[76.584241,9.389024],[76.584324,9.389104],[76.584381,9.389203],[76.584335,9.389629],[76.584318,9.389783],[76.584264,9.390323],[76.584874,9.390376],[76.584964,9.390606],[76.585152,9.390554],[76.585275,9.390517],[76.586429,9.390081],[76.586512,9.390249],[76.586691,9.390191],[76.586836,9.39015],[76.58751,9.389956],[76.587584,9.390123],[76.587771,9.390538],[76.587892,9.391025],[76.587214,9.391217],[76.587097,9.391249],[76.586841,9.39134],[76.586618,9.391422],[76.586299,9.391461],[76.586273,9.391583],[76.586293,9.391879],[76.586056,9.391949],[76.58586,9.391921],[76.585604,9.391917],[76.585434,9.391956],[76.585177,9.392068],[76.584775,9.392247],[76.584455,9.392389],[76.584009,9.392586],[76.583687,9.39261],[76.583581,9.392893],[76.583571,9.393072],[76.583565,9.393213],[76.583763,9.393484],[76.583832,9.393668],[76.583988,9.393886],[76.584055,9.393977],[76.584451,9.394391],[76.58446,9.394575],[76.584466,9.394705],[76.584475,9.394893],[76.584476,9.395076],[76.58445,9.395238],[76.584469,9.395422],[76.584494,9.395517],[76.584512,9.395609],[76.584505,9.395744],[76.584487,9.395881],[76.584468,9.396019],[76.584363,9.396299],[76.584305,9.396568],[76.584229,9.396678],[76.584107,9.396826],[76.584087,9.39699],[76.58401,9.397148],[76.583869,9.39724],[76.583797,9.397297],[76.583588,9.397473],[76.583456,9.397612],[76.583344,9.397709],[76.583233,9.397815],[76.583147,9.397917],[76.582992,9.398043],[76.582858,9.398102],[76.582767,9.398145],[76.582636,9.398344],[76.582571,9.398473],[76.582506,9.398754],[76.582495,9.398874],[76.582493,9.399023],[76.582492,9.399144],[76.582335,9.399173],[76.582171,9.399126],[76.582077,9.399087],[76.581866,9.399052],[76.581743,9.399032],[76.581584,9.399005],[76.581378,9.39897],[76.581196,9.398992],[76.581089,9.398974],[76.580763,9.398979],[76.580664,9.39898],[76.580521,9.398983],[76.580377,9.398983],[76.58027,9.398984],[76.580078,9.39898],[76.57986,9.398976],[76.579723,9.398959],[76.579519,9.39893],[76.579343,9.398964],[76.579355,9.398812],[76.579366,9.398661],[76.579355,9.398499],[76.579423,9.398288],[76.579454,9.398194],[76.579485,9.398099],[76.579536,9.39793],[76.579573,9.397811],[76.579625,9.397634],[76.579683,9.397286],[76.579714,9.397107],[76.579737,9.396972],[76.579786,9.39668],[76.5798,9.396584],[76.57985,9.39618],[76.579883,9.395739],[76.579896,9.395547],[76.57994,9.394936],[76.579987,9.394563],[76.580031,9.394217],[76.580043,9.394071],[76.580055,9.393924],[76.580071,9.393699],[76.580121,9.393223],[76.580154,9.393029],[76.580184,9.39281],[76.580213,9.392591],[76.580236,9.392381],[76.580293,9.392059],[76.580319,9.391912],[76.580378,9.391484],[76.580404,9.391211],[76.58042,9.390929],[76.580895,9.391005],[76.581129,9.391043],[76.581414,9.391082],[76.581487,9.391006],[76.581545,9.390906],[76.581771,9.390531],[76.582146,9.390602],[76.582194,9.390434],[76.582195,9.390285],[76.582086,9.389983],[76.58203,9.389842],[76.581892,9.389496],[76.581777,9.389033],[76.581918,9.388957],[76.582095,9.388934],[76.5823,9.388889],[76.582504,9.388803],[76.582885,9.388642],[76.58298,9.388601]]]},\"properties\":{\"Created_Da\":\"2024-10-20T07:43:28.781Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9074124773\",\"Surveyor\":\"Suresh\",\"Ward_Name\":\"AMALLOOR WEST\",\"Ward_No\":\"9\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.590714,9.379071],[76.59068,9.378986],[76.59054,9.378936],[76.590401,9.378904],[76.590169,9.378871],[76.590457,9.378632],[76.590537,9.378557],[76.591069,9.377738],[76.591318,9.377136],[76.591493,9.376519],[76.591609,9.376479],[76.591758,9.376428],[76.593845,9.371802],[76.593949,9.371787],[76.594053,9.371742],[76.594149,9.371752],[76.594259,9.371741],[76.594397,9.371729],[76.594499,9.371724],[76.594751,9.371724],[76.594881,9.371716],[76.595014,9.371702],[76.595127,9.371588],[76.595214,9.371504],[76.595288,9.371432],[76.595357,9.371365],[76.595521,9.371219],[76.595632,9.371147],[76.595717,9.371099],[76.595863,9.371018],[76.595957,9.370941],[76.596081,9.370818],[76.596168,9.370654],[76.596634,9.370808],[76.596909,9.371003],[76.597124,9.371156],[76.597197,9.371253],[76.597367,9.371483],[76.597438,9.371579],[76.597553,9.371735],[76.597563,9.371839],[76.5976,9.371926],[76.597665,9.372083],[76.597755,9.372298],[76.597933,9.372724],[76.598022,9.372938],[76.59808,9.373077],[76.598529,9.374476],[76.598637,9.374778],[76.599027,9.375776],[76.599299,9.376446],[76.599433,9.376801],[76.599307,9.377823],[76.599455,9.378667],[76.599656,9.378916],[76.599796,9.379034],[76.600084,9.37929],[76.600411,9.379411],[76.600618,9.379665],[76.600753,9.37983],[76.600809,9.379924],[76.601173,9.380529],[76.601502,9.381297],[76.601548,9.381404],[76.6017,9.381768],[76.601792,9.381947],[76.601998,9.382332],[76.602052,9.382434],[76.602211,9.382732],[76.602294,9.382882],[76.602443,9.383187],[76.602728,9.383774],[76.602801,9.383926],[76.602441,9.384009],[76.602289,9.384134],[76.60215,9.384161],[76.601937,9.38431],[76.601808,9.384502],[76.601747,9.384581],[76.601675,9.384672],[76.60155,9.384815],[76.601385,9.385027],[76.601274,9.385277],[76.601155,9.385433],[76.601066,9.38555],[76.600981,9.385659],[76.600843,9.385654],[76.600532,9.385654],[76.600376,9.385663],[76.600182,9.385656],[76.600009,9.385612],[76.599921,9.38558],[76.599749,9.385476],[76.599579,9.385337],[76.599391,9.385181],[76.599207,9.385053],[76.599071,9.384959],[76.598926,9.38486],[76.598808,9.384801],[76.598671,9.384733],[76.598551,9.384682],[76.598389,9.384623],[76.59822,9.384562],[76.597991,9.384491],[76.597796,9.384415],[76.597697,9.384352],[76.597577,9.384277],[76.597422,9.384181],[76.597297,9.384086],[76.59721,9.384024],[76.597011,9.383842],[76.596911,9.383756],[76.596828,9.383703],[76.596662,9.383619],[76.596457,9.383529],[76.596262,9.383464],[76.596085,9.383429],[76.595952,9.383404],[76.59573,9.383383],[76.595638,9.383375],[76.595362,9.383361],[76.595196,9.383335],[76.59494,9.383293],[76.594659,9.383244],[76.594452,9.383226],[76.594298,9.383193],[76.59412,9.383157],[76.593938,9.38313],[76.593758,9.383117],[76.593609,9.383099],[76.593453,9.383075],[76.593291,9.383019],[76.593144,9.382966],[76.59296,9.382906],[76.592851,9.382876],[76.592647,9.382822],[76.592548,9.382719],[76.592504,9.382495],[76.592459,9.382303],[76.592556,9.382177],[76.592652,9.382147],[76.592749,9.382124],[76.592874,9.38205],[76.592875,9.381864],[76.59288,9.381694],[76.592882,9.381513],[76.592881,9.381359],[76.592883,9.381231],[76.592876,9.381131],[76.592866,9.380982],[76.592843,9.380813],[76.592811,9.380595],[76.592746,9.380446],[76.592613,9.380369],[76.592603,9.380174],[76.592572,9.379949],[76.592544,9.37986],[76.592474,9.37962],[76.592471,9.379514],[76.592466,9.379228],[76.592432,9.379111],[76.592341,9.379113],[76.592147,9.379152],[76.591988,9.379197],[76.591885,9.379212],[76.591781,9.379236],[76.591562,9.379283],[76.591302,9.379328],[76.591021,9.379345],[76.590877,9.379343],[76.590801,9.379198],[76.590714,9.379071]]]},\"properties\":{\"Created_Da\":\"2024-10-20T05:52:20.410Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9656681184\",\"Surveyor\":\"mary sincy k g\",\"Ward_Name\":\"KATTODE\",\"Ward_No\":\"16\",\"Mandal\":\"Thiruvalla\"}},{\"type\":\"Feature\",\"geometry\":{\"type\":\"Polygon\",\"coordinates\":[[[76.58298,9.388601],[76.582885,9.388642],[76.582504,9.388803],[76.5823,9.388889],[76.582095,9.388934],[76.581918,9.388957],[76.581777,9.389033],[76.581892,9.389496],[76.58203,9.389842],[76.582086,9.389983],[76.582195,9.390285],[76.582194,9.390434],[76.582146,9.390602],[76.581771,9.390531],[76.581545,9.390906],[76.581487,9.391006],[76.581414,9.391082],[76.581129,9.391043],[76.580895,9.391005],[76.58042,9.390929],[76.580404,9.391211],[76.580378,9.391484],[76.580319,9.391912],[76.580293,9.392059],[76.580236,9.392381],[76.580213,9.392591],[76.580184,9.39281],[76.580154,9.393029],[76.580121,9.393223],[76.580071,9.393699],[76.580055,9.393924],[76.580043,9.394071],[76.580031,9.394217],[76.579987,9.394563],[76.57994,9.394936],[76.579896,9.395547],[76.579883,9.395739],[76.57985,9.39618],[76.5798,9.396584],[76.579786,9.39668],[76.579737,9.396972],[76.579714,9.397107],[76.579683,9.397286],[76.579625,9.397634],[76.579573,9.397811],[76.579536,9.39793],[76.579485,9.398099],[76.579454,9.398194],[76.579423,9.398288],[76.579355,9.398499],[76.579211,9.398155],[76.579121,9.397949],[76.579063,9.397814],[76.57891,9.397467],[76.578798,9.397242],[76.578727,9.397073],[76.578675,9.396875],[76.578609,9.396615],[76.578432,9.396097],[76.578416,9.395865],[76.578357,9.395567],[76.57833,9.39544],[76.57831,9.395347],[76.578261,9.395223],[76.5782,9.395068],[76.578143,9.394924],[76.578091,9.394792],[76.578053,9.394695],[76.578017,9.394604],[76.57795,9.394425],[76.577894,9.394276],[76.577837,9.394125],[76.577782,9.393978],[76.577715,9.393798],[76.577681,9.393631],[76.577697,9.393525],[76.577772,9.393079],[76.577791,9.392956],[76.577818,9.39278],[76.577842,9.392625],[76.577846,9.392434],[76.57785,9.39219],[76.577852,9.392099],[76.577873,9.391864],[76.577887,9.391719],[76.577897,9.391618],[76.577909,9.391468],[76.577922,9.391312],[76.577787,9.391011],[76.577678,9.390813],[76.57758,9.390661],[76.577482,9.390508],[76.57736,9.390292],[76.577279,9.390139],[76.577246,9.389997],[76.577228,9.389854],[76.577208,9.389686],[76.577177,9.389546],[76.577073,9.389336],[76.577352,9.389326],[76.577916,9.389339],[76.578028,9.389347],[76.578801,9.389398],[76.579511,9.389435],[76.580021,9.389342],[76.580092,9.389202],[76.580164,9.388806],[76.580161,9.388587],[76.580159,9.388433],[76.580148,9.388196],[76.579868,9.388155],[76.579733,9.388143],[76.579599,9.388131],[76.579391,9.388112],[76.579266,9.388079],[76.579146,9.388047],[76.578975,9.388],[76.57872,9.387942],[76.578532,9.387893],[76.578516,9.387689],[76.578497,9.387531],[76.578475,9.387348],[76.578499,9.387083],[76.578441,9.386935],[76.578369,9.386798],[76.578221,9.386518],[76.578029,9.386252],[76.577896,9.38608],[76.577825,9.38598],[76.577747,9.385869],[76.577612,9.385677],[76.577963,9.385566],[76.578062,9.385529],[76.578175,9.385499],[76.578447,9.385468],[76.578604,9.385476],[76.578779,9.385476],[76.578892,9.385484],[76.579049,9.385504],[76.579154,9.385561],[76.579338,9.385602],[76.579848,9.385679],[76.580259,9.385742],[76.580382,9.385716],[76.580546,9.385677],[76.581033,9.385575],[76.582082,9.385174],[76.582239,9.385105],[76.582369,9.385066],[76.58254,9.385655],[76.582568,9.385741],[76.582592,9.385831],[76.582527,9.385977],[76.582469,9.386145],[76.582482,9.386316],[76.58251,9.386551],[76.582382,9.386602],[76.582279,9.386626],[76.582112,9.386654],[76.582012,9.386676],[76.581931,9.387053],[76.581922,9.387175],[76.581871,9.387774],[76.581862,9.387948],[76.581856,9.388147],[76.58203,9.388152],[76.58248,9.38802],[76.582629,9.387975],[76.582715,9.38794],[76.582891,9.387892],[76.583052,9.387864],[76.583242,9.387875],[76.583414,9.387883],[76.583347,9.388583],[76.58298,9.388601]]]},\"properties\":{\"Created_Da\":\"2024-10-20T14:28:24.364Z\",\"District\":\"Pathanamthitta\",\"LSGD\":\"Thiruvalla\",\"Lsgd_Type\":\"Municipality\",\"Mob_No\":\"9605006167\",\"Surveyor\":\"mary sincy k g\",\"Ward_Name\":\"RAILWAY STATION\",\"Ward_No\":\"13\",\"Mandal\":\"Thiruvalla\"}}]}");
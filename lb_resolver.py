@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Indexed resolver from local body names to ward JSON files
+Exact clean-name lookup first, then a trigram index ranks fuzzy candidates
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+RESOLUTION_CACHE = 'data/cache/lb_resolution.json'
+
+# Number of trigram-ranked candidates scored with SequenceMatcher
+MAX_CANDIDATES = 8
+
+
+def clean_name(name):
+    """Clean name for comparison"""
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+def trigrams(text):
+    """Padded character trigrams of a cleaned name"""
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class LocalBodyResolver:
+    """Resolves local body names against the JSON files of one type folder."""
+
+    def __init__(self, search_dir, threshold=0.8, cached=None):
+        self.search_dir = search_dir
+        self.threshold = threshold
+
+        filenames = sorted(f for f in os.listdir(search_dir) if f.endswith('.json'))
+        self.fingerprint = hashlib.sha1('\n'.join(filenames).encode('utf-8')).hexdigest()
+
+        self._exact = {}
+        self._names = []
+        self._grams = defaultdict(set)
+        for filename in filenames:
+            clean_file = clean_name(filename.replace('.json', ''))
+            self._exact.setdefault(clean_file, filename)
+            idx = len(self._names)
+            self._names.append((clean_file, filename))
+            for gram in trigrams(clean_file):
+                self._grams[gram].add(idx)
+
+        # Previous resolutions are only reused while the folder listing is unchanged
+        self.resolved = {}
+        if cached and cached.get('fingerprint') == self.fingerprint:
+            self.resolved = dict(cached.get('resolved', {}))
+
+    def candidates(self, clean_lb):
+        """Filenames sharing trigrams with the name, best overlap first"""
+        counts = defaultdict(int)
+        for gram in trigrams(clean_lb):
+            for idx in self._grams.get(gram, ()):
+                counts[idx] += 1
+        ranked = sorted(counts, key=lambda idx: (-counts[idx], idx))
+        return [self._names[idx] for idx in ranked[:MAX_CANDIDATES]]
+
+    def _best_match(self, clean_lb, names):
+        best, best_ratio = None, self.threshold
+        for clean_file, filename in names:
+            matcher = SequenceMatcher(None, clean_lb, clean_file)
+            if matcher.real_quick_ratio() < best_ratio or matcher.quick_ratio() < best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio >= best_ratio and (best is None or ratio > best_ratio):
+                best, best_ratio = filename, ratio
+        return best
+
+    def resolve(self, lb_name):
+        """Return the matching JSON path for a local body, or None"""
+        clean_lb = clean_name(lb_name)
+
+        if clean_lb in self.resolved:
+            filename = self.resolved[clean_lb]
+        elif clean_lb in self._exact:
+            filename = self._exact[clean_lb]
+        else:
+            filename = self._best_match(clean_lb, self.candidates(clean_lb))
+            if filename is None:
+                # Names too short to share trigrams still get the full scan
+                filename = self._best_match(clean_lb, self._names)
+            self.resolved[clean_lb] = filename
+
+        return os.path.join(self.search_dir, filename) if filename else None
+
+    def to_cache(self):
+        return {'fingerprint': self.fingerprint, 'resolved': self.resolved}
+
+
+class ResolverRegistry:
+    """One resolver per type folder, with the resolution table persisted to disk."""
+
+    def __init__(self, cache_path=RESOLUTION_CACHE, threshold=0.8):
+        self.cache_path = cache_path
+        self.threshold = threshold
+        self._resolvers = {}
+        self._cached = {}
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    self._cached = json.load(f)
+            except (OSError, ValueError):
+                self._cached = {}
+
+    def get(self, search_dir):
+        resolver = self._resolvers.get(search_dir)
+        if resolver is None:
+            resolver = LocalBodyResolver(search_dir, self.threshold,
+                                         self._cached.get(search_dir))
+            self._resolvers[search_dir] = resolver
+        return resolver
+
+    def export(self):
+        """Resolution table of every folder resolved in this process"""
+        return {search_dir: resolver.to_cache()
+                for search_dir, resolver in self._resolvers.items()}
+
+    def merge(self, table):
+        """Adopt resolution tables exported by worker processes"""
+        self._cached.update(table)
+
+    def save(self):
+        if not self.cache_path:
+            return
+        table = dict(self._cached)
+        table.update(self.export())
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(table, f, indent=2, sort_keys=True)
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Shared model of the LSG mapping CSV (org district → AC → mandal → local body → ward)
+The CSV is parsed once into slotted objects with interned names and parent
+pointers; a pickled snapshot keyed by the CSV's hash lets every tool start from
+the identical structure without re-parsing.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import pickle
+import re
+import sys
+
+WARD_JSONS_PATH = '/Users/devandev/Desktop/ward_jsons'
+CSV_FILE = f'{WARD_JSONS_PATH}/LSG Mapped - Sheet1.csv'
+SNAPSHOT_PATH = 'data/cache/lsg_hierarchy.pickle'
+SNAPSHOT_VERSION = 2
+
+# LB type codes; the names double as ward source folder names
+LB_TYPES = {'C': 'Corporation', 'M': 'Municipality'}
+
+
+def clean_id(text):
+    """Remove all spaces and special characters, convert to lowercase"""
+    cleaned = re.sub(r'[^\w\s-]', '', text or '')
+    cleaned = re.sub(r'[-\s]+', '_', cleaned)
+    return cleaned.lower().strip('_')
+
+
+class _Slotted:
+    """Pickles as a plain tuple of the slot values, which loads much faster than slot dicts"""
+
+    __slots__ = ()
+    _state = ()
+
+    def __getstate__(self):
+        return tuple(getattr(self, slot) for slot in self._state)
+
+    def __setstate__(self, state):
+        for slot, value in zip(self._state, state):
+            setattr(self, slot, value)
+
+
+class Ward:
+    __slots__ = ('number', 'local_body')
+
+    def __init__(self, number, local_body):
+        self.number = number
+        self.local_body = local_body
+
+    def __repr__(self):
+        return f'<Ward {self.local_body.name} #{self.number}>'
+
+
+class LocalBody(_Slotted):
+    __slots__ = ('name', 'id', 'code', 'type_code', 'ward_count', 'row', 'mandal', '_wards')
+    _state = __slots__[:-1]
+
+    def __init__(self, name, code, type_code, ward_count, row, mandal):
+        self.name = name
+        self.id = clean_id(name)
+        self.code = code
+        self.type_code = type_code
+        # The CSV's 'Ward Number' cell as written; see total_wards
+        self.ward_count = ward_count
+        # Position in the CSV, for tools that depend on row order
+        self.row = row
+        self.mandal = mandal
+        self._wards = None
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._wards = None
+
+    @property
+    def total_wards(self):
+        """Ward count as a number, or None when the CSV cell is blank or not numeric"""
+        try:
+            return int(self.ward_count)
+        except ValueError:
+            return None
+
+    @property
+    def wards(self):
+        """Wards 1..total_wards (none for an unreadable count), created on first use"""
+        if self._wards is None:
+            self._wards = tuple(Ward(number, self) for number in range(1, (self.total_wards or 0) + 1))
+        return self._wards
+
+    @property
+    def type(self):
+        return LB_TYPES.get(self.type_code, 'Panchayat')
+
+    @property
+    def folder(self):
+        """Ward source folder; anything but a corporation or municipality is a grama panchayat"""
+        return LB_TYPES.get(self.type_code, 'Grama Panchayat')
+
+    @property
+    def ac(self):
+        return self.mandal.ac
+
+    @property
+    def district(self):
+        return self.mandal.ac.district
+
+    def __repr__(self):
+        return f'<LocalBody {self.name} ({self.code})>'
+
+
+class Mandal(_Slotted):
+    __slots__ = _state = ('name', 'id', 'ac', 'local_bodies')
+
+    def __init__(self, name, ac):
+        self.name = name
+        self.id = clean_id(name)
+        self.ac = ac
+        self.local_bodies = {}
+
+    @property
+    def district(self):
+        return self.ac.district
+
+    def __repr__(self):
+        return f'<Mandal {self.name}>'
+
+
+class AC(_Slotted):
+    __slots__ = _state = ('name', 'id', 'district', 'mandals')
+
+    def __init__(self, name, district):
+        self.name = name
+        self.id = clean_id(name)
+        self.district = district
+        self.mandals = {}
+
+    def __repr__(self):
+        return f'<AC {self.name}>'
+
+
+class District(_Slotted):
+    __slots__ = _state = ('name', 'id', 'acs')
+
+    def __init__(self, name):
+        self.name = name
+        self.id = clean_id(name)
+        self.acs = {}
+
+    def __repr__(self):
+        return f'<District {self.name}>'
+
+
+class Hierarchy(_Slotted):
+    """Org districts keyed by their CSV names, children likewise, in CSV order."""
+
+    __slots__ = _state = ('digest', 'districts', 'codes')
+
+    def __init__(self, digest):
+        self.digest = digest
+        self.districts = {}
+        self.codes = {}
+
+    def acs(self):
+        for district in self.districts.values():
+            yield from district.acs.values()
+
+    def mandals(self):
+        for ac in self.acs():
+            yield from ac.mandals.values()
+
+    def local_bodies(self):
+        for mandal in self.mandals():
+            yield from mandal.local_bodies.values()
+
+    def wards(self):
+        for lb in self.local_bodies():
+            yield from lb.wards
+
+
+def parse(text, digest=None):
+    """Build the model from the CSV text; a repeated LB name in a mandal replaces the earlier row"""
+    hierarchy = Hierarchy(digest)
+    for row_number, row in enumerate(csv.DictReader(io.StringIO(text))):
+        name = sys.intern(row['Org District'].strip())
+        district = hierarchy.districts.get(name)
+        if district is None:
+            district = hierarchy.districts[name] = District(name)
+
+        name = sys.intern(row['AC'].strip())
+        ac = district.acs.get(name)
+        if ac is None:
+            ac = district.acs[name] = AC(name, district)
+
+        name = sys.intern(row['Org Mandal'].strip())
+        mandal = ac.mandals.get(name)
+        if mandal is None:
+            mandal = ac.mandals[name] = Mandal(name, ac)
+
+        name = sys.intern(row['LBName'].strip())
+        # The ward count is only converted where it is used, so one bad cell
+        # does not stop the tools that never need it
+        lb = LocalBody(name, row['LBCode'].strip(), sys.intern(row['LBType'].strip()),
+                       (row['Ward Number'] or '').strip(), row_number, mandal)
+        replaced = mandal.local_bodies.get(name)
+        if replaced is not None and hierarchy.codes.get(replaced.code) is replaced:
+            del hierarchy.codes[replaced.code]
+        mandal.local_bodies[name] = lb
+        hierarchy.codes[lb.code] = lb
+    return hierarchy
+
+
+def load_hierarchy(csv_file=CSV_FILE, snapshot_path=SNAPSHOT_PATH, verbose=True):
+    """The model for csv_file, from the snapshot while the CSV's hash is unchanged"""
+    with open(csv_file, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+
+    if os.path.exists(snapshot_path):
+        try:
+            with open(snapshot_path, 'rb') as f:
+                version, snapshot_digest, hierarchy = pickle.load(f)
+            if version == SNAPSHOT_VERSION and snapshot_digest == digest:
+                return hierarchy
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError):
+            pass
+
+    hierarchy = parse(data.decode('utf-8-sig'), digest)
+    if os.path.dirname(snapshot_path):
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    tmp_path = f'{snapshot_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump((SNAPSHOT_VERSION, digest, hierarchy), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, snapshot_path)
+    if verbose:
+        print(f"🗂️  LSG hierarchy snapshot written: {snapshot_path} ({len(hierarchy.codes)} local bodies)")
+    return hierarchy
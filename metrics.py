@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Stage metrics for the generators
+Timers for nested stages with CPU time, peak RSS, geometry / vertex counts and
+bytes written, appended as JSON lines so runs can be compared; with --profile
+each top-level stage is also captured with cProfile.
+Run `python metrics.py` to summarise the recorded runs.
+"""
+
+import argparse
+import atexit
+import cProfile
+import io
+import json
+import os
+import pstats
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+import shapely
+
+METRICS_PATH = 'data/cache/metrics.jsonl'
+PROFILE_DIR = 'data/cache/profiles'
+# Functions listed when a profiled stage finishes
+PROFILE_TOP = 15
+
+_current = None
+
+
+def add_arguments(parser):
+    parser.add_argument('--profile', action='store_true',
+                        help=f'cProfile each top-level stage into {PROFILE_DIR}/')
+    parser.add_argument('--metrics', default=METRICS_PATH,
+                        help='JSON-lines file the stage metrics are appended to')
+
+
+def peak_rss_mb():
+    """High-water resident set size of this process and its finished children"""
+    scale = 1 if sys.platform == 'darwin' else 1024  # ru_maxrss is bytes on macOS, KiB on Linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return round(max(own, children) / 1024 / 1024, 1)
+
+
+class Run:
+    """One script invocation; stages nest, and counts go to every open stage and the run."""
+
+    def __init__(self, script, path=METRICS_PATH, profile=False):
+        self.script = script
+        self.path = path
+        self.profile = profile
+        self.id = f"{script}-{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self.started = time.perf_counter()
+        self.cpu_started = time.process_time()
+        self.totals = {}
+        self.records = 0
+        self._stack = []
+        self._closed = False
+
+    def _emit(self, record):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.records += 1
+
+    def _name(self, name):
+        return '/'.join([frame['name'] for frame in self._stack] + [name])
+
+    @contextmanager
+    def stage(self, name):
+        """Time a stage; stages opened inside it are recorded as <outer>/<inner>"""
+        full_name = self._name(name)
+        frame = {'name': name, 'counts': {}}
+        self._stack.append(frame)
+        profiler = None
+        # Only one profiler can be active at a time, so nested stages share the outer one
+        if self.profile and len(self._stack) == 1:
+            profiler = cProfile.Profile()
+            profiler.enable()
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield frame['counts']
+        finally:
+            seconds = time.perf_counter() - start
+            cpu_seconds = time.process_time() - cpu_start
+            if profiler is not None:
+                profiler.disable()
+            self._stack.pop()
+            record = {'run': self.id, 'script': self.script, 'stage': full_name,
+                      'depth': len(self._stack), 'seconds': round(seconds, 4),
+                      'cpu_seconds': round(cpu_seconds, 4), 'peak_rss_mb': peak_rss_mb(),
+                      'counts': frame['counts']}
+            if profiler is not None:
+                record['profile'] = self._dump_profile(profiler, full_name)
+            self._emit(record)
+
+    def add_stage(self, name, seconds, cpu_seconds=None, counts=None):
+        """Record a stage timed elsewhere (e.g. in a worker process) under the open stages"""
+        counts = counts or {}
+        for key, n in counts.items():
+            self.count(key, n)
+        self._emit({'run': self.id, 'script': self.script, 'stage': self._name(name),
+                    'depth': len(self._stack), 'seconds': round(seconds, 4),
+                    'cpu_seconds': round(cpu_seconds, 4) if cpu_seconds is not None else None,
+                    'peak_rss_mb': None, 'counts': counts})
+
+    def _dump_profile(self, profiler, stage_name):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in stage_name)
+        path = os.path.join(PROFILE_DIR, f'{self.id}.{safe_name}.prof')
+        profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(PROFILE_TOP)
+        print(f"🔬 Profile of '{stage_name}': {path}")
+        lines = out.getvalue().strip().splitlines()
+        # Skip the pstats header, keep the column titles and the top rows
+        start = next((i for i, line in enumerate(lines) if line.lstrip().startswith('ncalls')), 0)
+        for line in lines[start:]:
+            print(f"   {line}")
+        return path
+
+    def count(self, key, n=1):
+        """Add n to a counter of every open stage and of the run"""
+        for frame in self._stack:
+            frame['counts'][key] = frame['counts'].get(key, 0) + n
+        self.totals[key] = self.totals.get(key, 0) + n
+
+    def geometries(self, geoms, kind='geometries'):
+        """Count shapely geometries as `kind` and their vertices as `kind.vertices` (missing ones are skipped)"""
+        array = np.empty(len(geoms), dtype=object)
+        array[:] = list(geoms)
+        present = array[~shapely.is_missing(array)]
+        self.count(kind, len(present))
+        self.count(f'{kind}.vertices', int(shapely.get_num_coordinates(present).sum()))
+
+    def written(self, path, nbytes):
+        self.count('files_written')
+        self.count('bytes_written', int(nbytes))
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        global _current
+        if _current is self:
+            _current = None
+        seconds = time.perf_counter() - self.started
+        record = {'run': self.id, 'script': self.script, 'stage': None, 'depth': -1,
+                  'seconds': round(seconds, 4),
+                  'cpu_seconds': round(time.process_time() - self.cpu_started, 4),
+                  'peak_rss_mb': peak_rss_mb(), 'counts': self.totals}
+        self._emit(record)
+        print(f"📈 Metrics: {self.records - 1} stages, {seconds:.1f}s, "
+              f"peak RSS {record['peak_rss_mb']:.0f} MB → {self.path}")
+
+
+class _NoRun:
+    """Stand-in when no run was started, so library code can report unconditionally."""
+
+    @contextmanager
+    def stage(self, name):
+        yield {}
+
+    def add_stage(self, name, seconds, cpu_seconds=None, counts=None):
+        pass
+
+    def count(self, key, n=1):
+        pass
+
+    def geometries(self, geoms, kind='geometries'):
+        pass
+
+    def written(self, path, nbytes):
+        pass
+
+
+class _Tally(_NoRun):
+    """Counts without stages or output, for work whose counts another process records."""
+
+    def __init__(self):
+        self.totals = {}
+
+    def count(self, key, n=1):
+        self.totals[key] = self.totals.get(key, 0) + n
+
+    geometries = Run.geometries
+    written = Run.written
+
+
+@contextmanager
+def tally():
+    """
+    Collect the counts reported inside the block (e.g. in a worker process) into
+    a dict instead of the current run; the caller hands it to Run.add_stage.
+    """
+    global _current
+    previous, counter = _current, _Tally()
+    _current = counter
+    try:
+        yield counter.totals
+    finally:
+        _current = previous
+
+
+def start_run(script, args=None):
+    """
+    Start collecting metrics for a script (closed automatically at exit).
+    args: parsed arguments carrying --profile / --metrics from add_arguments.
+    """
+    global _current
+    if _current is not None:
+        _current.close()
+    _current = Run(script, getattr(args, 'metrics', METRICS_PATH), getattr(args, 'profile', False))
+    atexit.register(_current.close)
+    return _current
+
+
+def current():
+    """The active run, or a no-op stand-in"""
+    return _current or _NoRun()
+
+
+def summarise(path=METRICS_PATH, last=5):
+    """Print the last runs per script with their slowest stages"""
+    runs = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            runs.setdefault(record['run'], []).append(record)
+
+    by_script = {}
+    for run_id, records in runs.items():
+        by_script.setdefault(records[0]['script'], []).append(records)
+
+    for script, script_runs in sorted(by_script.items()):
+        print(f"\n📜 {script}")
+        for records in script_runs[-last:]:
+            total = next((r for r in records if r['stage'] is None), None)
+            stages = sorted((r for r in records if r['stage'] is not None and r['depth'] == 0),
+                            key=lambda r: -r['seconds'])
+            if total:
+                counts = ', '.join(f"{key} {value:,}" for key, value in sorted(total['counts'].items()))
+                print(f"   {records[0]['run']}: {total['seconds']:.1f}s, "
+                      f"peak RSS {total['peak_rss_mb']:.0f} MB" + (f", {counts}" if counts else ''))
+            else:
+                print(f"   {records[0]['run']}: incomplete")
+            for record in stages[:3]:
+                print(f"      {record['stage']:<30} {record['seconds']:>8.2f}s "
+                      f"(cpu {record['cpu_seconds']:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarise recorded generator metrics')
+    parser.add_argument('--metrics', default=METRICS_PATH)
+    parser.add_argument('--last', type=int, default=5, help='Runs shown per script')
+    args = parser.parse_args()
+    summarise(args.metrics, args.last)
+
+
+if __name__ == '__main__':
+    main()
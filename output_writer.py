@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Shared JSON writer for the generator outputs
+Rounds coordinates to a fixed precision, drops repeated vertices and writes
+compact JSON (optionally with precompressed .gz/.br siblings)
+"""
+
+import argparse
+import gzip
+import json
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from metrics import current as current_run
+
+# 6 decimals ≈ 0.1 m at Kerala's latitude
+COORD_PRECISION = 6
+COMPRESSIONS = ('gz', 'br')
+
+
+def _ring(ring, scale):
+    """
+    Quantize a closed ring, dropping only vertices repeated after rounding.
+    Collinear vertices stay: they are often the T-junctions where a neighbour's
+    edge ends, and removing them breaks the shared coverage.
+    """
+    points = []
+    for point in ring:
+        p = (int(round(point[0] * scale)), int(round(point[1] * scale)))
+        if not points or points[-1] != p:
+            points.append(p)
+    if len(points) > 1 and points[0] == points[-1]:
+        points.pop()
+
+    if len(points) < 3:
+        return None
+    points.append(points[0])
+    return [[x / scale, y / scale] for x, y in points]
+
+
+def _line(line, scale):
+    points = []
+    for point in line:
+        p = [round(point[0] * scale) / scale, round(point[1] * scale) / scale]
+        if not points or points[-1] != p:
+            points.append(p)
+    return points
+
+
+def quantize_geometry(geometry, precision=COORD_PRECISION):
+    """Copy of a GeoJSON geometry with rounded coordinates and no redundant vertices"""
+    if not geometry or 'type' not in geometry:
+        return geometry
+    scale = 10 ** precision
+    geom_type = geometry['type']
+
+    if geom_type == 'GeometryCollection':
+        return dict(geometry, geometries=[quantize_geometry(g, precision) for g in geometry['geometries']])
+    coords = geometry.get('coordinates')
+    if coords is None:
+        return geometry
+
+    def polygon(rings):
+        rings = [_ring(ring, scale) for ring in rings]
+        if not rings or rings[0] is None:
+            return None
+        return [ring for ring in rings if ring is not None]
+
+    if geom_type == 'Point':
+        coords = [round(c * scale) / scale for c in coords]
+    elif geom_type in ('MultiPoint', 'LineString'):
+        coords = _line(coords, scale)
+    elif geom_type == 'MultiLineString':
+        coords = [_line(line, scale) for line in coords]
+    elif geom_type == 'Polygon':
+        coords = polygon(coords)
+        if coords is None:
+            # Collapsed below the precision: keep the original rather than emit an invalid ring
+            return geometry
+    elif geom_type == 'MultiPolygon':
+        polygons = [p for p in (polygon(rings) for rings in coords) if p is not None]
+        if not polygons:
+            return geometry
+        coords = polygons
+    return dict(geometry, coordinates=coords)
+
+
+def quantize(data, precision=COORD_PRECISION):
+    """Walk any JSON structure and quantize every GeoJSON geometry found in it"""
+    if isinstance(data, list):
+        return [quantize(item, precision) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if 'coordinates' in data and isinstance(data.get('type'), str):
+        return quantize_geometry(data, precision)
+    if data.get('type') == 'GeometryCollection' and 'geometries' in data:
+        return quantize_geometry(data, precision)
+    return {key: quantize(value, precision) for key, value in data.items()}
+
+
+def _size(n):
+    if n >= 1024 * 1024:
+        return f"{n / 1024 / 1024:.2f} MB"
+    return f"{n / 1024:.1f} KB" if n >= 1024 else f"{n} B"
+
+
+def write_json(path, data, precision=COORD_PRECISION, compress=(), report=True, ensure_ascii=True):
+    """
+    Write data as compact JSON with quantized geometry.
+    compress: any of 'gz', 'br' to also write precompressed siblings.
+    report: print the size written (no extra serialization).
+    Returns the number of bytes written to path.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    if precision is not None:
+        data = quantize(data, precision)
+    payload = json.dumps(data, separators=(',', ':'), ensure_ascii=ensure_ascii).encode('utf-8')
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+    extras = []
+    for kind in compress:
+        if kind == 'gz':
+            compressed = gzip.compress(payload, compresslevel=9, mtime=0)
+        elif kind == 'br':
+            if brotli is None:
+                print("⚠️  brotli not installed; skipping .br output")
+                continue
+            compressed = brotli.compress(payload, quality=11)
+        else:
+            raise ValueError(f"Unknown compression: {kind}")
+        with open(f'{path}.{kind}', 'wb') as f:
+            f.write(compressed)
+        extras.append(f".{kind} {_size(len(compressed))}")
+
+    current_run().written(path, len(payload))
+    if report:
+        line = f"💾 {path}: {_size(len(payload))}"
+        if extras:
+            line += f", {', '.join(extras)}"
+        print(line)
+    return len(payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rewrite JSON outputs compactly with quantized coordinates')
+    parser.add_argument('paths', nargs='+', help='JSON/GeoJSON files to rewrite in place')
+    parser.add_argument('--precision', type=int, default=COORD_PRECISION,
+                        help=f'Coordinate decimals (default {COORD_PRECISION})')
+    parser.add_argument('--compress', nargs='*', choices=COMPRESSIONS, default=[],
+                        help='Also write precompressed siblings')
+    args = parser.parse_args()
+
+    total_before = total_after = 0
+    for path in args.paths:
+        before = os.path.getsize(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        after = write_json(path, data, args.precision, args.compress, report=False)
+        total_before += before
+        total_after += after
+        print(f"💾 {path}: {_size(before)} → {_size(after)}")
+
+    if total_before:
+        print(f"\n✅ {len(args.paths)} files: {_size(total_before)} → {_size(total_after)} "
+              f"({(1 - total_after / total_before) * 100:.0f}% smaller)")
+
+
+if __name__ == '__main__':
+    main()
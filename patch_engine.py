@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Batched geometry patches for the 14 district files
+Reads a declarative patch list (CSV), groups it by district and applies every
+patch of a district against an in-memory id index in one pass, so each district
+file is loaded and written (atomically) once and each source ward file is read once.
+Patched districts get fresh shards (and topology); the geometry store, hierarchy
+index and a persisted spatial index are rebuilt once at the end.
+"""
+
+import argparse
+import csv
+import json
+import os
+from collections import OrderedDict
+
+from shapely.geometry import mapping
+
+from consolidate_14_districts import clean_id, write_shards
+from dissolve_engine import merge_parts
+from geojson_stream import iter_features
+from geometry_array import from_geojson, validity
+from geostore import build_store
+from hierarchy_index import HierarchyIndex
+from output_writer import write_json
+from spatial_index import INDEX_DIR, load_locator
+from ward_ingest import WARD_JSONS_PATH
+
+PATCHES_PATH = 'data/geometry_patches.csv'
+DISTRICTS_DIR = 'data/14_districts'
+PATCH_COLUMNS = ('kind', 'district', 'ac', 'mandal', 'local_body', 'ward_number', 'ward_name', 'source')
+# local_body: LB outline = union of the source file's wards; ward: one ward's geometry
+KINDS = ('local_body', 'ward')
+
+
+def load_patches(path=PATCHES_PATH, kinds=KINDS):
+    """Patch rows of the given kinds, in file order"""
+    with open(path, newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    missing = set(PATCH_COLUMNS) - set(rows[0] if rows else PATCH_COLUMNS)
+    if missing:
+        raise ValueError(f"{path}: missing columns {', '.join(sorted(missing))}")
+    for row in rows:
+        if row['kind'] not in KINDS:
+            raise ValueError(f"{path}: unknown patch kind {row['kind']!r}")
+    return [row for row in rows if row['kind'] in kinds]
+
+
+def _matches(wanted, name):
+    """Loose name match of the old fix scripts: either name contains the other"""
+    wanted, name = wanted.lower(), (name or '').lower()
+    return bool(name) and (wanted in name or name in wanted)
+
+
+def _number(props):
+    number = props.get('ward_number') or props.get('ward_no') or props.get('WARD_NO')
+    return str(number) if number is not None else None
+
+
+class SourceFiles:
+    """Ward source files, each read once however many patches point at it"""
+
+    def __init__(self, root=WARD_JSONS_PATH):
+        self.root = root
+        self.features = {}
+        self.outlines = {}
+
+    def _load(self, source):
+        if source not in self.features:
+            path = os.path.join(self.root, source)
+            self.features[source] = list(iter_features(path))
+            print(f"   📂 {source}: {len(self.features[source])} ward features")
+        return self.features[source]
+
+    def ward(self, source, ward_number, ward_name):
+        """Geometry of one ward, by number first and then by name"""
+        features = [f for f in self._load(source) if f.get('geometry')]
+        for feature in features:
+            if _number(feature.get('properties') or {}) == ward_number:
+                return feature['geometry']
+        for feature in features:
+            props = feature.get('properties') or {}
+            if _matches(ward_name, props.get('ward_name') or props.get('name') or props.get('WARD_NAME')):
+                return feature['geometry']
+        return None
+
+    def outline(self, source):
+        """Union of the valid ward geometries of a source file (None when there are none)"""
+        if source not in self.outlines:
+            geoms = from_geojson([f.get('geometry') for f in self._load(source)])
+            valid = geoms[validity(geoms)]
+            self.outlines[source] = mapping(merge_parts(valid)[0]) if len(valid) else None
+        return self.outlines[source]
+
+
+class DistrictIndex:
+    """
+    Local bodies and wards of a loaded district. Ids are resolved through the
+    persisted hierarchy index when there is one; a scan of the district keyed
+    by clean ids covers anything the index does not know.
+    """
+
+    def __init__(self, district, district_id, hierarchy=None):
+        self.district = district
+        self.district_id = district_id
+        self.hierarchy = hierarchy
+        self.local_bodies = None
+        self.wards = {}
+
+    def _indexed(self, ac_name, mandal_name, lb_name):
+        lb_id = self.hierarchy.find(self.district_id, ac_name, mandal_name, lb_name)
+        if not lb_id:
+            return None
+        try:
+            lb = self.hierarchy.locate(self.district, lb_id)
+        except (IndexError, KeyError):
+            return None
+        # An index built before the district file changed may point elsewhere
+        return lb if clean_id(lb.get('name')) == clean_id(lb_name) else None
+
+    def local_body(self, ac_name, mandal_name, lb_name):
+        if self.hierarchy is not None:
+            lb = self._indexed(ac_name, mandal_name, lb_name)
+            if lb is not None:
+                return lb
+        if self.local_bodies is None:
+            self.local_bodies = {}
+            for ac in self.district.get('acs', []):
+                for mandal in ac.get('mandals', []):
+                    for lb in mandal.get('local_bodies', []):
+                        key = (clean_id(ac['name']), clean_id(mandal['name']), clean_id(lb['name']))
+                        self.local_bodies.setdefault(key, (ac, mandal, lb))
+        key = (clean_id(ac_name), clean_id(mandal_name), clean_id(lb_name))
+        if key in self.local_bodies:
+            return self.local_bodies[key][2]
+        # Patch lists may use shortened names, e.g. 'Attingal' for 'Attingal (SC)'
+        for ac, mandal, lb in self.local_bodies.values():
+            if (ac_name.lower() in ac['name'].lower() and mandal_name.lower() in mandal['name'].lower()
+                    and lb_name.lower() in lb['name'].lower()):
+                self.local_bodies[key] = (ac, mandal, lb)
+                return lb
+        return None
+
+    def ward(self, lb, ward_number, ward_name):
+        """Ward of a local body, by number first and then by name"""
+        if id(lb) not in self.wards:
+            numbers = {}
+            for i, ward in enumerate(lb.get('wards', [])):
+                number = ward.get('ward_number') or ward.get('ward_no') or (i + 1)
+                numbers.setdefault(str(number), ward)
+            self.wards[id(lb)] = numbers
+        ward = self.wards[id(lb)].get(ward_number)
+        if ward is None:
+            ward = next((w for w in lb.get('wards', [])
+                         if _matches(ward_name, w.get('ward_name') or w.get('name'))), None)
+        return ward
+
+
+def apply_patch(index, sources, patch):
+    """Apply one patch to an indexed district; returns an error message or None"""
+    lb = index.local_body(patch['ac'], patch['mandal'], patch['local_body'])
+    if lb is None:
+        return 'local body not found in district JSON'
+
+    if patch['kind'] == 'local_body':
+        geometry = sources.outline(patch['source'])
+        if geometry is None:
+            return 'no valid ward geometries in source'
+        lb['geometry'] = geometry
+        return None
+
+    ward = index.ward(lb, patch['ward_number'], patch['ward_name'])
+    if ward is None:
+        return 'ward not found in district JSON'
+    geometry = sources.ward(patch['source'], patch['ward_number'], patch['ward_name'])
+    if geometry is None:
+        return 'ward not found in source'
+    ward['geometry'] = geometry
+    return None
+
+
+def store_dir_for(districts_dir):
+    return os.path.join(os.path.dirname(districts_dir), '14_districts_store')
+
+
+def refresh_derived(districts_dir, index_dir=INDEX_DIR):
+    """Rebuild the geometry store (and with it the hierarchy index) and an existing spatial index"""
+    build_store(districts_dir, store_dir_for(districts_dir))
+    if os.path.exists(os.path.join(index_dir, 'index.json')):
+        load_locator(districts_dir, index_dir)
+
+
+def apply_patches(patches, districts_dir=DISTRICTS_DIR, source_root=WARD_JSONS_PATH, index_dir=INDEX_DIR):
+    """Apply patches district by district; returns (applied, failed) counts"""
+    by_district = OrderedDict()
+    for patch in patches:
+        by_district.setdefault(patch['district'], []).append(patch)
+
+    sources = SourceFiles(source_root)
+    try:
+        hierarchy = HierarchyIndex(store_dir_for(districts_dir))
+    except (OSError, ValueError):
+        hierarchy = None
+    applied = failed = 0
+    patched = []
+    for district_id, district_patches in by_district.items():
+        print(f"\n📍 {district_id.upper()}: {len(district_patches)} patches")
+        district_file = os.path.join(districts_dir, f'{district_id}.json')
+        try:
+            with open(district_file, 'r', encoding='utf-8') as f:
+                district = json.load(f)
+        except (OSError, ValueError) as e:
+            failed += len(district_patches)
+            print(f"   ❌ Could not read {district_file}: {e}")
+            continue
+        index = DistrictIndex(district, district_id, hierarchy)
+
+        changed = 0
+        for patch in district_patches:
+            label = patch['local_body']
+            if patch['kind'] == 'ward':
+                label += f" ward #{patch['ward_number']} {patch['ward_name']}"
+            try:
+                error = apply_patch(index, sources, patch)
+            except (OSError, ValueError) as e:
+                error = str(e)
+            if error:
+                failed += 1
+                print(f"   ❌ {label}: {error}")
+            else:
+                changed += 1
+                print(f"   ✅ {label}")
+
+        if changed:
+            write_json(district_file, district)
+            # The pages and WardIndex read the shards first
+            write_shards(districts_dir, district_id, district)
+            patched.append(district_id)
+        applied += changed
+
+    if patched:
+        print(f"\n🧩 Rewrote shards of {', '.join(patched)}")
+        refresh_derived(districts_dir, index_dir)
+    return applied, failed
+
+
+def main(kinds=KINDS):
+    parser = argparse.ArgumentParser(description='Apply geometry patches to the 14 district files')
+    parser.add_argument('--patches', default=PATCHES_PATH, help='Patch list CSV')
+    parser.add_argument('--districts-dir', default=DISTRICTS_DIR)
+    parser.add_argument('--source-root', default=WARD_JSONS_PATH, help='Root the patch sources are relative to')
+    parser.add_argument('--index-dir', default=INDEX_DIR, help='Spatial index refreshed when it exists')
+    args = parser.parse_args()
+
+    print('=' * 80)
+    print('🔧 APPLYING GEOMETRY PATCHES')
+    print('=' * 80)
+    patches = load_patches(args.patches, kinds)
+    applied, failed = apply_patches(patches, args.districts_dir, args.source_root, args.index_dir)
+
+    print('\n' + '=' * 80)
+    print(f'✅ Applied {applied} of {len(patches)} patches' + (f' ({failed} failed)' if failed else ''))
+    print('=' * 80)
+
+
+if __name__ == '__main__':
+    main()
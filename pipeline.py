@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Make-like runner for the build pipeline
+Each stage declares the files it reads and writes; dependencies follow from
+those paths. A stage is skipped while its inputs (including its script and the
+local modules it imports) and outputs are unchanged since its last successful
+run, independent stages run in parallel, and a critical-path report shows
+where the wall time went. Stages that rewrite an earlier stage's files in
+place (patches, cleaning) declare them as updates, so the earlier stage does
+not mistake their edits for outside changes.
+"""
+
+import argparse
+import ast
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from lsg_hierarchy import CSV_FILE, WARD_JSONS_PATH
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+STATE_PATH = 'data/cache/pipeline/state.json'
+LOG_DIR = 'data/cache/pipeline/logs'
+STATE_VERSION = 1
+
+
+class Stage:
+    """
+    One script run: inputs and outputs are files, directories or globs.
+    updates: paths rewritten in place, read and written after the stages before it.
+    """
+
+    def __init__(self, name, script, inputs=(), outputs=(), updates=()):
+        self.name = name
+        self.script = script
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.updates = list(updates)
+
+    @property
+    def reads(self):
+        return self.inputs + self.updates
+
+    @property
+    def writes(self):
+        return self.outputs + self.updates
+
+
+STAGES = [
+    Stage('structure', 'generate_kerala_structure.py',
+          inputs=[CSV_FILE], outputs=['config/kerala_complete.json']),
+    # The ward store is shared by every generator that parses ward files
+    Stage('ingest', 'ward_ingest.py',
+          inputs=[WARD_JSONS_PATH], outputs=['data/cache/ward_store']),
+    Stage('complete_hierarchy', 'create_complete_hierarchy.py',
+          inputs=[CSV_FILE, WARD_JSONS_PATH, 'data/cache/ward_store'],
+          outputs=['data/complete_hierarchy']),
+    Stage('consolidate', 'consolidate_14_districts.py',
+          inputs=['data/complete_hierarchy'],
+          outputs=['data/14_districts', 'data/14_districts_store']),
+    Stage('patches', 'patch_engine.py',
+          inputs=['data/geometry_patches.csv', WARD_JSONS_PATH],
+          updates=['data/14_districts', 'data/14_districts_store']),
+    Stage('clean', 'coverage_cleaner.py',
+          updates=['data/14_districts', 'data/14_districts_store']),
+    Stage('resolutions', 'generate_resolutions.py',
+          inputs=['data/14_districts/*.json'],
+          outputs=['data/14_districts/*/lod/*.json', 'data/kerala_lod_z8.json'],
+          updates=['data/14_districts/*/index.json']),
+    Stage('adjacency', 'generate_adjacency.py',
+          inputs=['data/14_districts/*.json'], outputs=['data/adjacency.json']),
+    Stage('vector_tiles', 'export_vector_tiles.py',
+          inputs=['data/14_districts/*.json'], outputs=['tiles']),
+    Stage('kerala_geojson', 'create_kerala_geojson.py',
+          inputs=['data/14_districts/*.json'], outputs=['data/kerala_14_districts.geojson']),
+    Stage('district_gaps', 'fix_district_gaps.py',
+          inputs=['data/kerala_14_districts.geojson'], outputs=['data/kerala_14_districts_fixed.geojson']),
+    Stage('corporation_mandals', 'create_corporation_mandal_shapes.py',
+          inputs=['data/corporation_ward_mapping.csv', 'data/14_districts'],
+          outputs=['data/corporation_mandals.json', 'data/corporation_mandals.topojson',
+                   'data/thiruvananthapuram_south/kovalam/kovalam/tvm_corporation_kovalam.geojson'],
+          updates=['data/corporation_ward_aliases.csv']),
+    # Thiruvalla map modules, written outside the repo like process_geometry.py always has
+    Stage('thiruvalla_bundle', 'process_geometry.py',
+          inputs=[f'{WARD_JSONS_PATH}/Pathanamthitta', 'data/cache/ward_store'],
+          outputs=['/Users/devandev/Desktop/Thiruvalla/layers']),
+]
+
+
+def expand(pattern):
+    """Files under a path, directory or glob, sorted"""
+    if glob.has_magic(pattern):
+        return sorted(p for p in glob.glob(pattern) if os.path.isfile(p))
+    if os.path.isdir(pattern):
+        files = []
+        for dirpath, dirs, names in os.walk(pattern):
+            dirs.sort()
+            files.extend(os.path.join(dirpath, name) for name in sorted(names) if not name.startswith('.'))
+        return files
+    return [pattern] if os.path.isfile(pattern) else []
+
+
+def _covers(output, path):
+    """An output path, directory or glob produces path"""
+    output_glob = glob.has_magic(output)
+    output = os.path.normpath(output)
+    path = os.path.normpath(path)
+    if output_glob:
+        # A glob inside a plain directory writes into that directory
+        return fnmatch.fnmatch(path, output) or (not glob.has_magic(path) and output.startswith(path + os.sep))
+    return path == output or path.startswith(output + os.sep) or output.startswith(path + os.sep)
+
+
+def local_modules(script, root=ROOT):
+    """The script plus every module of this repo it imports, directly or not"""
+    found, pending = set(), [script]
+    while pending:
+        path = pending.pop()
+        if path in found:
+            continue
+        found.add(path)
+        with open(os.path.join(root, path), 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read(), path)
+        for node in ast.walk(tree):
+            names = []
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            for name in names:
+                module = f"{name.split('.')[0]}.py"
+                if os.path.exists(os.path.join(root, module)):
+                    pending.append(module)
+    return sorted(found)
+
+
+class Signatures:
+    """
+    File signatures from the last successful run of each stage. A file counts
+    as changed when its size differs, or its mtime differs and so does its hash.
+    """
+
+    def __init__(self, path=STATE_PATH):
+        self.path = path
+        self.stages = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get('version') == STATE_VERSION:
+                    self.stages = state['stages']
+            except (OSError, ValueError):
+                self.stages = {}
+
+    @staticmethod
+    def _hash(path):
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def snapshot(self, files, previous=None):
+        """{path: [size, mtime_ns, sha1]}, reusing hashes of files whose mtime is unchanged"""
+        previous = previous or {}
+        result = {}
+        for path in files:
+            stat = os.stat(path)
+            old = previous.get(path)
+            if old and old[0] == stat.st_size and old[1] == stat.st_mtime_ns:
+                result[path] = old
+            else:
+                result[path] = [stat.st_size, stat.st_mtime_ns, self._hash(path)]
+        return result
+
+    def changed(self, files, recorded):
+        """Paths added, removed or changed since recorded"""
+        changes = sorted(set(recorded) ^ set(files))
+        for path in files:
+            old = recorded.get(path)
+            if old is None:
+                continue
+            stat = os.stat(path)
+            if stat.st_size != old[0]:
+                changes.append(path)
+            elif stat.st_mtime_ns != old[1] and self._hash(path) != old[2]:
+                changes.append(path)
+        return changes
+
+    def accept(self, stage_name, patterns, inputs, outputs):
+        """
+        Take the current state of the files under patterns as this stage's own,
+        after a later stage rewrote them in place
+        """
+        recorded = self.stages.get(stage_name)
+        if recorded is None:
+            return
+        for section, files in (('inputs', inputs), ('outputs', outputs)):
+            old = recorded[section]
+            kept = {path: sig for path, sig in old.items()
+                    if not any(_covers(pattern, path) for pattern in patterns)}
+            current = [path for path in files if any(_covers(pattern, path) for pattern in patterns)]
+            kept.update(self.snapshot(current, old))
+            recorded[section] = kept
+
+    def record(self, stage_name, inputs, outputs):
+        previous = self.stages.get(stage_name, {})
+        self.stages[stage_name] = {
+            'inputs': self.snapshot(inputs, previous.get('inputs')),
+            'outputs': self.snapshot(outputs, previous.get('outputs')),
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATE_VERSION, 'stages': self.stages}, f, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+
+class Pipeline:
+    def __init__(self, stages=STAGES, state_path=STATE_PATH):
+        self.stages = {stage.name: stage for stage in stages}
+        self.signatures = Signatures(state_path)
+        # A stage depends on every earlier stage writing one of the paths it reads
+        self.deps = {}
+        for i, stage in enumerate(stages):
+            self.deps[stage.name] = [
+                other.name for other in stages[:i]
+                if any(_covers(output, pattern) for output in other.writes for pattern in stage.reads)
+            ]
+
+    def selected(self, targets):
+        """The targets plus everything they depend on, in declaration order"""
+        if not targets:
+            return list(self.stages)
+        unknown = [t for t in targets if t not in self.stages]
+        if unknown:
+            raise SystemExit(f"❌ Unknown stage(s): {', '.join(unknown)} (see --list)")
+        needed, pending = set(), list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.deps[name])
+        return [name for name in self.stages if name in needed]
+
+    def input_files(self, stage):
+        files = set(local_modules(stage.script))
+        for pattern in stage.reads:
+            files.update(expand(pattern))
+        return sorted(files)
+
+    def output_files(self, stage):
+        return sorted({path for pattern in stage.writes for path in expand(pattern)})
+
+    def earlier_writers(self, stage):
+        """Stages declared before this one that write any of the paths it writes"""
+        names = list(self.stages)
+        return [self.stages[other] for other in names[:names.index(stage.name)]
+                if any(_covers(a, b) for a in self.stages[other].writes for b in stage.writes)]
+
+    def stale_reason(self, stage):
+        """Why a stage has to run, or None when it is up to date"""
+        missing = [p for p in stage.writes if not expand(p)]
+        if missing:
+            return f"missing {missing[0]}"
+        recorded = self.signatures.stages.get(stage.name)
+        if recorded is None:
+            return 'no previous run'
+        changes = self.signatures.changed(self.input_files(stage), recorded['inputs'])
+        if changes:
+            more = f" (+{len(changes) - 1} more)" if len(changes) > 1 else ''
+            return f"changed {changes[0]}{more}"
+        changes = self.signatures.changed(self.output_files(stage), recorded['outputs'])
+        if changes:
+            return f"output modified {changes[0]}"
+        return None
+
+    def _execute(self, stage):
+        os.makedirs(LOG_DIR, exist_ok=True)
+        log_path = os.path.join(LOG_DIR, f'{stage.name}.log')
+        start = time.perf_counter()
+        with open(log_path, 'w', encoding='utf-8') as log:
+            result = subprocess.run([sys.executable, stage.script], cwd=ROOT,
+                                    stdout=log, stderr=subprocess.STDOUT)
+        return result.returncode, time.perf_counter() - start, log_path
+
+    def run(self, targets=(), jobs=1, force=False, dry_run=False):
+        """Run stale stages (dependencies first); returns {stage: (status, seconds)}"""
+        order = self.selected(targets)
+        results = {}
+        # Staleness is decided once a stage's dependencies have finished, so an
+        # upstream rerun that reproduced identical files does not cascade
+        pending = list(order)
+        running = {}
+        wall_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            while pending or running:
+                for name in list(pending):
+                    deps = [d for d in self.deps[name] if d in order]
+                    if any(d not in results for d in deps):
+                        continue
+                    pending.remove(name)
+                    stage = self.stages[name]
+                    if any(results[d][0] in ('failed', 'blocked') for d in deps):
+                        results[name] = ('blocked', 0.0)
+                        print(f"⏭️  {name}: blocked by a failed dependency")
+                        continue
+                    if force:
+                        reason = 'forced'
+                    elif any(results[d][0] == 'would run' for d in deps):
+                        reason = 'dependency would run'
+                    else:
+                        reason = self.stale_reason(stage)
+                    if reason is None:
+                        results[name] = ('up to date', 0.0)
+                        print(f"✅ {name}: up to date")
+                        continue
+                    missing = [p for p in stage.reads
+                               if not expand(p) and not any(_covers(o, p) for d in deps for o in self.stages[d].writes)]
+                    if missing:
+                        results[name] = ('failed', 0.0)
+                        print(f"❌ {name}: input not found: {missing[0]}")
+                        continue
+                    if dry_run:
+                        results[name] = ('would run', 0.0)
+                        print(f"🔸 {name}: would run ({reason})")
+                        continue
+                    print(f"▶️  {name}: {stage.script} ({reason})")
+                    running[pool.submit(self._execute, stage)] = name
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    stage = self.stages[name]
+                    code, seconds, log_path = future.result()
+                    if code == 0:
+                        self.signatures.record(name, self.input_files(stage), self.output_files(stage))
+                        # Its edits are not outside changes to the earlier writers of the
+                        # same files; later writers still see them and rerun
+                        for other in self.earlier_writers(stage):
+                            self.signatures.accept(other.name, stage.writes,
+                                                   self.input_files(other), self.output_files(other))
+                        self.signatures.save()
+                        results[name] = ('ran', seconds)
+                        print(f"✅ {name}: done in {seconds:.1f}s")
+                    else:
+                        results[name] = ('failed', seconds)
+                        print(f"❌ {name}: exit code {code} after {seconds:.1f}s, log: {log_path}")
+                        with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
+                            for line in f.readlines()[-10:]:
+                                print(f"   │ {line.rstrip()}")
+
+        self.report(order, results, time.perf_counter() - wall_start)
+        return results
+
+    def critical_path(self, order, results):
+        """(seconds, [stages]) of the longest chain of run times through the DAG"""
+        finish, via = {}, {}
+        for name in order:
+            deps = [d for d in self.deps[name] if d in finish]
+            prev = max(deps, key=lambda d: finish[d], default=None)
+            finish[name] = results.get(name, ('', 0.0))[1] + (finish[prev] if prev else 0.0)
+            via[name] = prev
+        if not finish:
+            return 0.0, []
+        name = max(finish, key=finish.get)
+        total, chain = finish[name], []
+        while name:
+            chain.append(name)
+            name = via[name]
+        return total, chain[::-1]
+
+    def report(self, order, results, wall):
+        print("\n" + "=" * 70)
+        print("📊 PIPELINE TIMING")
+        print("=" * 70)
+        for name in order:
+            status, seconds = results.get(name, ('not run', 0.0))
+            print(f"   {name:<22} {status:<12} {seconds:>8.1f}s")
+        total, chain = self.critical_path(order, results)
+        busy = sum(seconds for _, seconds in results.values())
+        print(f"\n🧭 Critical path ({total:.1f}s): {' → '.join(chain) if total else 'nothing ran'}")
+        print(f"⏱️  Wall time {wall:.1f}s, stage time {busy:.1f}s")
+        print("=" * 70)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the stale stages of the build pipeline')
+    parser.add_argument('targets', nargs='*', help='Stages to bring up to date (default: all)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='Stages run at the same time')
+    parser.add_argument('--force', action='store_true', help='Run the selected stages even when up to date')
+    parser.add_argument('-n', '--dry-run', action='store_true', help='Only show what would run')
+    parser.add_argument('--list', action='store_true', help='List the stages and their dependencies')
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    pipeline = Pipeline()
+    if args.list:
+        for name, stage in pipeline.stages.items():
+            deps = ', '.join(pipeline.deps[name]) or '-'
+            print(f"{name:<22} {stage.script:<38} after: {deps}")
+        return
+
+    results = pipeline.run(args.targets, jobs=args.jobs, force=args.force, dry_run=args.dry_run)
+    if any(status == 'failed' for status, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
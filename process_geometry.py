@@ -1,8 +1,10 @@
-import json
 import os
-from shapely.geometry import shape, mapping
+from shapely.geometry import mapping
 from shapely.ops import unary_union
 
+from data_bundle import write_bundle
+from ward_ingest import WARD_JSONS_PATH, load_store
+
 # List of source files
 source_files = [
     "/Users/devandev/Desktop/ward_jsons/Pathanamthitta/Municipality/Thiruvalla.json",
@@ -44,45 +46,51 @@ mandal_geoms = {}    # Key: Mandal Name
 ac_geoms = []
 
 print("Reading source files...")
+# Ward files are parsed once into the shared ingest store (see ward_ingest.py)
+store = load_store(WARD_JSONS_PATH)
+
 for file_path in source_files:
     if not os.path.exists(file_path):
         print(f"Warning: File not found: {file_path}")
         continue
         
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            features = data.get('features', [])
+        wards = store.wards_for(file_path)
+        if wards is None:
+            raise ValueError("file could not be ingested")
+        
+        for ward in wards:
+            props = dict(ward['properties'])
+            lsgd_name = props.get('LSGD')
+            
+            # Normalize LSGD name
+            mandal = lsgd_to_mandal.get(lsgd_name, 'Unknown')
+            
+            # Add Mandal info to properties
+            props['Mandal'] = mandal
+            
+            geom = ward['shape']
+            
+            # Add to all wards list
+            all_wards.append({
+                "type": "Feature",
+                "properties": props,
+                "geometry": mapping(geom)
+            })
+            
+            # Collect geometry for Panchayat aggregation
+            if lsgd_name not in panchayat_geoms:
+                panchayat_geoms[lsgd_name] = {'geoms': [], 'mandal': mandal}
+            panchayat_geoms[lsgd_name]['geoms'].append(geom)
+            
+            # Collect geometry for Mandal aggregation
+            if mandal not in mandal_geoms:
+                mandal_geoms[mandal] = []
+            mandal_geoms[mandal].append(geom)
+            
+            # Collect geometry for AC aggregation
+            ac_geoms.append(geom)
             
-            for feature in features:
-                props = feature.get('properties', {})
-                lsgd_name = props.get('LSGD')
-                
-                # Normalize LSGD name
-                mandal = lsgd_to_mandal.get(lsgd_name, 'Unknown')
-                
-                # Add Mandal info to properties
-                props['Mandal'] = mandal
-                feature['properties'] = props
-                
-                # Add to all wards list
-                all_wards.append(feature)
-                
-                geom = shape(feature['geometry'])
-                
-                # Collect geometry for Panchayat aggregation
-                if lsgd_name not in panchayat_geoms:
-                    panchayat_geoms[lsgd_name] = {'geoms': [], 'mandal': mandal}
-                panchayat_geoms[lsgd_name]['geoms'].append(geom)
-                
-                # Collect geometry for Mandal aggregation
-                if mandal not in mandal_geoms:
-                    mandal_geoms[mandal] = []
-                mandal_geoms[mandal].append(geom)
-                
-                # Collect geometry for AC aggregation
-                ac_geoms.append(geom)
-                
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
 
@@ -159,10 +167,9 @@ final_data = {
     }
 }
 
-output_path = "/Users/devandev/Desktop/Thiruvalla/data.js"
-with open(output_path, 'w') as f:
-    f.write("const thiruvallaData = ")
-    json.dump(final_data, f)
-    f.write(";")
+# Per-layer modules (wards split per panchayat) instead of one data.js, so the
+# page can paint the AC before the wards are even downloaded
+output_dir = "/Users/devandev/Desktop/Thiruvalla/layers"
+write_bundle(output_dir, final_data)
 
-print(f"Successfully wrote data to {output_path}")
+print(f"Successfully wrote data to {output_dir}")
@@ -0,0 +1,103 @@
+// Loaders for the per-level shards written by consolidate_14_districts.py:
+// data/14_districts/<district>/index.json (names, ids, counts, bboxes) plus one
+// file per district, AC, mandal and local body, and the coarse resolutions that
+// generate_resolutions.py lists in the index. Every loader resolves to null when
+// its file is missing, so pages can fall back to the full district file.
+
+const SHARD_ROOT = 'data/14_districts';
+const STATE_RESOLUTION = 'data/kerala_lod_z8.json';
+
+async function fetchShardJSON(url) {
+    try {
+        const response = await fetch(url);
+        if (response.ok) return await response.json();
+    } catch (error) {
+        console.warn(`Unable to load ${url}`, error);
+    }
+    return null;
+}
+
+function loadDistrictFile(districtId) {
+    return fetchShardJSON(`${SHARD_ROOT}/${districtId}.json`);
+}
+
+function loadShardIndex(districtId) {
+    return fetchShardJSON(`${SHARD_ROOT}/${districtId}/index.json`);
+}
+
+function loadShard(districtId, shardPath) {
+    return fetchShardJSON(`${SHARD_ROOT}/${districtId}/${shardPath}`);
+}
+
+// Features of one level at the first resolution available (z11 before z8)
+async function loadResolution(districtId, index, level, zooms = ['z11', 'z8']) {
+    const lod = index.lod || {};
+    for (const zoom of zooms) {
+        if (!lod[zoom]) continue;
+        const resolution = await loadShard(districtId, lod[zoom]);
+        const collection = resolution && resolution.levels[level];
+        if (collection) return collection.features;
+    }
+    return null;
+}
+
+// Coarse district outlines for the state view, or the full-resolution state
+// file when the resolutions have not been generated
+async function loadStateDistricts(fallbackUrl) {
+    return await fetchShardJSON(STATE_RESOLUTION) || fetchShardJSON(fallbackUrl);
+}
+
+// Index entries only count their wards; pages test lb.wards for the wards themselves
+function indexLocalBody(entry) {
+    const { wards, ...localBody } = entry;
+    return { ...localBody, ward_count: wards };
+}
+
+// Full local bodies (with wards) for index entries; loaded ones, entries without
+// a shard, or whose shard is missing, are kept as they are
+function loadLocalBodies(districtId, localBodies) {
+    return Promise.all(localBodies.map(async lb => {
+        if (!lb.shard || Array.isArray(lb.wards)) return lb;
+        const full = await loadShard(districtId, lb.shard);
+        return full ? { ...full, shard: lb.shard } : lb;
+    }));
+}
+
+// An AC from the index with its mandals; geometries come from the AC shard
+async function loadShardAC(districtId, acEntry) {
+    const shard = await loadShard(districtId, acEntry.shard);
+    if (!shard) return null;
+    const geometries = {};
+    shard.mandals.forEach(mandal => { geometries[mandal.id] = mandal.geometry; });
+    return {
+        id: acEntry.id,
+        name: acEntry.name,
+        shard: acEntry.shard,
+        geometry: shard.geometry,
+        mandals: acEntry.mandals.map(mandal => ({
+            id: mandal.id,
+            name: mandal.name,
+            shard: mandal.shard,
+            geometry: geometries[mandal.id] || null,
+            local_bodies: mandal.local_bodies.map(indexLocalBody)
+        }))
+    };
+}
+
+// A district shaped like its consolidated file, with geometry down to one level
+// ('ac', 'mandal' or 'local_body', no wards) read from the shards of that level
+async function loadDistrictLevel(districtId, level) {
+    const index = await loadShardIndex(districtId);
+    if (!index) return null;
+    if (level === 'ac') return loadShard(districtId, index.shard);
+    if (level === 'mandal') {
+        const acs = await Promise.all(index.acs.map(ac => loadShardAC(districtId, ac)));
+        return acs.every(Boolean) ? { id: index.id, name: index.name, acs } : null;
+    }
+    const acs = await Promise.all(index.acs.map(async ac => ({
+        id: ac.id,
+        name: ac.name,
+        mandals: await Promise.all(ac.mandals.map(mandal => loadShard(districtId, mandal.shard)))
+    })));
+    return acs.every(ac => ac.mandals.every(Boolean)) ? { id: index.id, name: index.name, acs } : null;
+}
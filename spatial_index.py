@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Spatial index over the ward geometries of the 14 district files
+Answers "which ward / local body / mandal / AC contains this point" and bbox
+queries in batches through a Shapely STRtree. The parsed wards are persisted
+(WKB + parent tables) so startup does not re-read the district JSONs.
+"""
+
+import argparse
+import csv
+import json
+import os
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from geojson_stream import LOCAL_BODIES, iter_items
+
+DISTRICTS_DIR = 'data/14_districts'
+INDEX_DIR = 'data/cache/spatial_index'
+INDEX_VERSION = 1
+
+# Parent tables, each row pointing at its parent by position
+TABLES = {
+    'acs': ('district', 'name'),
+    'mandals': ('ac', 'name'),
+    'local_bodies': ('mandal', 'name', 'code', 'type'),
+    'wards': ('local_body', 'ward_number', 'ward_name'),
+}
+
+
+def district_files(districts_dir):
+    return sorted(f for f in os.listdir(districts_dir) if f.endswith('.json'))
+
+
+def _sources(districts_dir):
+    """(file, mtime, size) of every district file, to tell when the index is stale"""
+    sources = []
+    for file in district_files(districts_dir):
+        stat = os.stat(os.path.join(districts_dir, file))
+        sources.append([file, stat.st_mtime, stat.st_size])
+    return sources
+
+
+class WardLocator:
+    """STRtree over ward polygons with the AC → mandal → local body chain of each ward."""
+
+    def __init__(self, geometries, tables):
+        self.geometries = geometries
+        self.tables = tables
+        shapely.prepare(self.geometries)
+        self.tree = shapely.STRtree(self.geometries)
+
+    def __len__(self):
+        return len(self.geometries)
+
+    def record(self, ward_idx):
+        """Parent chain of one ward as a flat dict"""
+        wards, lbs = self.tables['wards'], self.tables['local_bodies']
+        mandals, acs = self.tables['mandals'], self.tables['acs']
+        lb = wards['local_body'][ward_idx]
+        mandal = lbs['mandal'][lb]
+        ac = mandals['ac'][mandal]
+        return {
+            'district': acs['district'][ac],
+            'ac': acs['name'][ac],
+            'mandal': mandals['name'][mandal],
+            'local_body': lbs['name'][lb],
+            'local_body_code': lbs['code'][lb],
+            'local_body_type': lbs['type'][lb],
+            'ward_number': wards['ward_number'][ward_idx],
+            'ward_name': wards['ward_name'][ward_idx],
+        }
+
+    def locate(self, xy):
+        """
+        Ward index for each (lon, lat) row of xy, -1 where no ward contains it.
+        Points on a shared edge go to the lower-numbered ward.
+        """
+        xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        result = np.full(len(xy), -1, dtype=np.int64)
+        if not len(xy) or not len(self.geometries):
+            return result
+
+        points = shapely.points(xy)
+        point_idx, ward_idx = self.tree.query(points, predicate='intersects')
+        if len(point_idx):
+            order = np.lexsort((ward_idx, point_idx))
+            point_idx, ward_idx = point_idx[order], ward_idx[order]
+            first = np.unique(point_idx, return_index=True)[1]
+            result[point_idx[first]] = ward_idx[first]
+        return result
+
+    def locate_records(self, xy):
+        return [self.record(i) if i >= 0 else None for i in self.locate(xy)]
+
+    def query_bbox(self, bounds):
+        """
+        Wards intersecting each (minx, miny, maxx, maxy) box.
+        Returns (box index, ward index) arrays, like STRtree.query.
+        """
+        bounds = np.asarray(bounds, dtype=float).reshape(-1, 4)
+        boxes = shapely.box(bounds[:, 0], bounds[:, 1], bounds[:, 2], bounds[:, 3])
+        return self.tree.query(boxes, predicate='intersects')
+
+    def save(self, index_dir, sources):
+        os.makedirs(index_dir, exist_ok=True)
+        blobs = shapely.to_wkb(self.geometries)
+        offsets = np.cumsum([0] + [len(b) for b in blobs]).tolist()
+        tmp_path = os.path.join(index_dir, 'geometries.wkb.tmp')
+        with open(tmp_path, 'wb') as f:
+            for blob in blobs:
+                f.write(blob)
+        os.replace(tmp_path, os.path.join(index_dir, 'geometries.wkb'))
+
+        index_path = os.path.join(index_dir, 'index.json')
+        with open(f'{index_path}.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'sources': sources, 'offsets': offsets,
+                       'tables': self.tables}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(f'{index_path}.tmp', index_path)
+
+    @classmethod
+    def load(cls, index_dir):
+        with open(os.path.join(index_dir, 'index.json'), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        with open(os.path.join(index_dir, 'geometries.wkb'), 'rb') as f:
+            data = f.read()
+        offsets = index['offsets']
+        blobs = np.array([data[a:b] for a, b in zip(offsets, offsets[1:])], dtype=object)
+        return cls(shapely.from_wkb(blobs), index['tables']), index
+
+
+def build(districts_dir=DISTRICTS_DIR):
+    """Parse the district files into ward geometries and parent tables"""
+    tables = {name: {column: [] for column in columns} for name, columns in TABLES.items()}
+    geometries = []
+    skipped = 0
+
+    for file in district_files(districts_dir):
+        district_id = file[:-len('.json')]
+        # Local bodies are streamed one at a time; a new AC / mandal starts
+        # whenever the enclosing object changes
+        ac_fields = mandal_fields = None
+        for (_, ac, mandal), lb in iter_items(os.path.join(districts_dir, file), LOCAL_BODIES):
+            if ac is not ac_fields:
+                ac_fields = ac
+                ac_idx = len(tables['acs']['name'])
+                tables['acs']['district'].append(district_id)
+                tables['acs']['name'].append(ac.get('name'))
+            if mandal is not mandal_fields:
+                mandal_fields = mandal
+                mandal_idx = len(tables['mandals']['name'])
+                tables['mandals']['ac'].append(ac_idx)
+                tables['mandals']['name'].append(mandal.get('name'))
+
+            lb_idx = len(tables['local_bodies']['name'])
+            tables['local_bodies']['mandal'].append(mandal_idx)
+            tables['local_bodies']['name'].append(lb['name'])
+            tables['local_bodies']['code'].append(lb.get('code'))
+            tables['local_bodies']['type'].append(lb.get('type'))
+
+            for ward in lb.get('wards', []):
+                try:
+                    geom = shape(ward['geometry'])
+                except Exception:
+                    skipped += 1
+                    continue
+                if geom.is_empty:
+                    skipped += 1
+                    continue
+                geometries.append(geom)
+                tables['wards']['local_body'].append(lb_idx)
+                tables['wards']['ward_number'].append(ward.get('ward_number'))
+                tables['wards']['ward_name'].append(ward.get('ward_name'))
+
+    if skipped:
+        print(f"⚠️  Skipped {skipped} wards without usable geometry")
+    return WardLocator(np.array(geometries, dtype=object), tables)
+
+
+def load_locator(districts_dir=DISTRICTS_DIR, index_dir=INDEX_DIR, rebuild=False):
+    """Open the persisted index, rebuilding it when any district file changed"""
+    sources = _sources(districts_dir)
+    if not rebuild and os.path.exists(os.path.join(index_dir, 'index.json')):
+        try:
+            locator, index = WardLocator.load(index_dir)
+            if index.get('version') == INDEX_VERSION and index.get('sources') == sources:
+                return locator
+        except (OSError, ValueError, KeyError):
+            pass
+
+    locator = build(districts_dir)
+    locator.save(index_dir, sources)
+    print(f"🗂️  Spatial index built: {len(locator)} wards ({index_dir})")
+    return locator
+
+
+def tag_csv(locator, input_path, output_path, lon_column='lon', lat_column='lat'):
+    """Append the containing ward and its parents to every row of a points CSV"""
+    with open(input_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+        fieldnames = list(reader.fieldnames or [])
+
+    xy = np.array([[float(row[lon_column]), float(row[lat_column])] for row in rows]).reshape(-1, 2)
+    ward_idx = locator.locate(xy)
+
+    extra = ['district', 'ac', 'mandal', 'local_body', 'local_body_code',
+             'local_body_type', 'ward_number', 'ward_name']
+    with open(output_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames + [c for c in extra if c not in fieldnames])
+        writer.writeheader()
+        for row, i in zip(rows, ward_idx):
+            if i >= 0:
+                row.update(locator.record(i))
+            writer.writerow(row)
+
+    matched = int((ward_idx >= 0).sum())
+    print(f"📍 Tagged {matched}/{len(rows)} points → {output_path}")
+    return matched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Point-in-ward lookups over the 14 district files')
+    parser.add_argument('--districts-dir', default=DISTRICTS_DIR)
+    parser.add_argument('--index-dir', default=INDEX_DIR)
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the persisted index')
+    parser.add_argument('--tag', metavar='CSV', help='Points CSV to tag with ward/LB/mandal/AC')
+    parser.add_argument('--output', help='Tagged CSV path (default: <input>_tagged.csv)')
+    parser.add_argument('--lon', default='lon', help='Longitude column (default: lon)')
+    parser.add_argument('--lat', default='lat', help='Latitude column (default: lat)')
+    parser.add_argument('--point', nargs=2, type=float, metavar=('LON', 'LAT'),
+                        help='Look up a single coordinate')
+    args = parser.parse_args()
+
+    locator = load_locator(args.districts_dir, args.index_dir, args.rebuild)
+    print(f"✅ {len(locator)} wards indexed")
+
+    if args.point:
+        record = locator.locate_records([args.point])[0]
+        print(json.dumps(record, ensure_ascii=False, indent=2) if record else "❌ No ward contains that point")
+
+    if args.tag:
+        output = args.output or os.path.splitext(args.tag)[0] + '_tagged.csv'
+        tag_csv(locator, args.tag, output, args.lon, args.lat)
+
+
+if __name__ == '__main__':
+    main()
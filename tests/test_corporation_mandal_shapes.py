@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+import create_corporation_mandal_shapes as shapes
+
+
+@pytest.fixture
+def ward_index(tmp_path, monkeypatch):
+    square = {
+        "type": "Polygon",
+        "coordinates": [[[76, 10], [76.01, 10], [76.01, 10.01], [76, 10.01], [76, 10]]],
+    }
+    district = {
+        "acs": [
+            {
+                "name": "Nemom",
+                "mandals": [
+                    {
+                        "name": "Nemom",
+                        "local_bodies": [
+                            {
+                                "name": "Thiruvananthapuram",
+                                "type": "Corporation",
+                                "wards": [
+                                    {"ward_number": 1, "ward_name": "Kovalam",
+                                     "geometry": square},
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+    (tmp_path / "thiruvananthapuram.json").write_text(json.dumps(district))
+    monkeypatch.setattr(shapes, "DISTRICT_DATA_DIR", str(tmp_path))
+    index = shapes.WardIndex()
+    index.load_aliases(str(tmp_path / "aliases.csv"))
+    return index
+
+
+def test_unmatched_ward_is_skipped(ward_index, capsys):
+    row = {
+        "District Name": "Thiruvananthapuram",
+        "AC": "Nemom",
+        "Organisational Mandal": "Nemom",
+        "Corporation": "Thiruvananthapuram",
+        "Ward Name": "Zzzyx",
+    }
+    groups = shapes.group_by_mandal(
+        [row, dict(row, **{"Ward Name": "Kovalam"})], ward_index
+    )
+    assert "Missing wards: 1" in capsys.readouterr().out
+    (group,) = groups.values()
+    assert [ward["ward_name"] for ward in group["wards"]] == ["Kovalam"]
+    # The miss stays automatic, so the next run matches it again
+    (alias,) = ward_index.aliases.values()
+    assert alias["ward_key"] == "" and alias["source"] == shapes.AUTO
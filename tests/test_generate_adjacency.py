@@ -0,0 +1,15 @@
+import numpy as np
+from shapely.geometry import Polygon, box
+
+from generate_adjacency import adjacency
+
+
+def test_nearly_coincident_edges_are_neighbours():
+    # The shared edge is skewed by 1e-9° on one side, as in uncleaned ward data
+    left = Polygon([(76, 10), (76.01, 10), (76.01 + 1e-9, 10.01), (76, 10.01)])
+    right = Polygon([(76.01, 10), (76.02, 10), (76.02, 10.01), (76.01 + 1e-9, 10.01)])
+    corner = box(76.02, 10.01, 76.03, 10.02)
+    edges = adjacency(np.array([left, right, corner, None], dtype=object))
+    assert len(edges) == 1
+    i, j, length = edges[0]
+    assert (i, j) == (0, 1) and abs(length - 1106) <= 1
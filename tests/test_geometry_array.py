@@ -0,0 +1,26 @@
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from geometry_array import from_geojson
+
+
+def test_3d_positions_match_shape():
+    # 12 values: reshaping them to pairs used to interleave x/y with z silently
+    polygon = {'type': 'Polygon', 'coordinates': [[[0, 0, 5], [1, 0, 5], [1, 1, 5], [0, 0, 5]]]}
+    multi = {'type': 'MultiPolygon', 'coordinates': [[[[2, 0, 1], [3, 0, 1], [3, 1, 1], [2, 0, 1]]]]}
+    parsed = from_geojson([polygon, multi])
+    for geometry, geom in zip([polygon, multi], parsed):
+        expected = shape(geometry)
+        assert geom.geom_type == expected.geom_type
+        np.testing.assert_array_equal(shapely.get_coordinates(geom, include_z=True),
+                                      shapely.get_coordinates(expected, include_z=True))
+
+
+def test_mixed_dimensions_fall_back_per_geometry():
+    flat = {'type': 'Polygon', 'coordinates': [[[0, 0], [2, 0], [2, 2], [0, 0]]]}
+    raised = {'type': 'Polygon', 'coordinates': [[[0, 0, 5], [1, 0, 5], [1, 1, 5], [0, 0, 5]]]}
+    parsed = from_geojson([flat, raised, None])
+    assert parsed[0].equals(shape(flat)) and not parsed[0].has_z
+    assert parsed[1].equals(shape(raised)) and parsed[1].has_z
+    assert parsed[2] is None
@@ -0,0 +1,19 @@
+import shapely
+from shapely.geometry import Polygon, box, mapping, shape
+
+from output_writer import quantize_geometry
+
+
+def test_quantizing_keeps_t_junctions():
+    # (1, 1) is collinear on A's top edge but is where B and C meet it
+    coverage = [Polygon([(0, 0), (2, 0), (2, 1), (1, 1), (0, 1)]), box(0, 1, 1, 2), box(1, 1, 2, 2)]
+    quantized = [shape(quantize_geometry(mapping(g))) for g in coverage]
+    assert shapely.coverage_is_valid(coverage)
+    assert shapely.coverage_is_valid(quantized)
+    assert (1.0, 1.0) in quantized[0].exterior.coords
+
+
+def test_quantizing_drops_repeated_vertices():
+    ring = [[0, 0], [1, 0], [1.0000000001, 0], [1, 1], [0, 0]]
+    quantized = quantize_geometry({'type': 'Polygon', 'coordinates': [ring]})
+    assert quantized['coordinates'] == [[[0, 0], [1, 0], [1, 1], [0, 0]]]
@@ -0,0 +1,53 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from ward_ingest import ingest
+
+
+def _ward(i):
+    x = 76 + i * 0.01
+    ring = [[x, 10], [x + 0.01, 10], [x + 0.01, 10.01], [x, 10.01], [x, 10]]
+    return {"type": "Feature", "properties": {"ward_no": i},
+            "geometry": {"type": "Polygon", "coordinates": [ring]}}
+
+
+@pytest.fixture
+def sources(tmp_path):
+    root = tmp_path / "wards"
+    root.mkdir()
+    for i in range(20):
+        collection = {"type": "FeatureCollection", "features": [_ward(i), _ward(i + 100)]}
+        (root / f"lb_{i:02d}.json").write_text(json.dumps(collection))
+    (root / "broken.json").write_text("{")
+    return str(root), str(tmp_path / "store")
+
+
+def _ingest_count(root, store_dir):
+    store = ingest(root, store_dir, verbose=False)
+    return len(store.geometries(range(len(store.wards["offset"]))))
+
+
+def test_unchanged_sources_are_not_rewritten(sources):
+    root, store_dir = sources
+    first = ingest(root, store_dir, verbose=False)
+    index_mtime = os.stat(os.path.join(store_dir, "index.json")).st_mtime_ns
+    second = ingest(root, store_dir, verbose=False)
+    assert second.blob_name == first.blob_name
+    assert os.stat(os.path.join(store_dir, "index.json")).st_mtime_ns == index_mtime
+    assert list(second.skipped) == ["broken.json"]
+
+
+def test_concurrent_ingests(sources):
+    root, store_dir = sources
+    for _ in range(2):
+        with ProcessPoolExecutor(4) as pool:
+            counts = list(pool.map(_ingest_count, [root] * 4, [store_dir] * 4))
+        assert counts == [40] * 4
+        # Touching a file forces the next round to rewrite the store
+        os.utime(os.path.join(root, "lb_00.json"), ns=(0, 0))
+    # Only the lock, the index and the blob it names are left
+    store = ingest(root, store_dir, verbose=False)
+    assert sorted(os.listdir(store_dir)) == [".lock", store.blob_name, "index.json"]
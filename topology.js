@@ -0,0 +1,68 @@
+// Decoder for the shared-arc topologies written by topology.py
+
+function topologyArcs(topology) {
+    const [kx, ky] = topology.transform.scale;
+    const [tx, ty] = topology.transform.translate;
+    return topology.arcs.map(arc => {
+        let x = 0, y = 0;
+        return arc.map(([dx, dy]) => {
+            x += dx;
+            y += dy;
+            return [x * kx + tx, y * ky + ty];
+        });
+    });
+}
+
+function topologyRing(arcs, indexes) {
+    const ring = [];
+    indexes.forEach(index => {
+        const points = index < 0 ? arcs[~index].slice().reverse() : arcs[index];
+        // Consecutive arcs share their joint point
+        ring.push(...(ring.length ? points.slice(1) : points));
+    });
+    return ring;
+}
+
+function topologyFeatures(topology, name) {
+    const arcs = topologyArcs(topology);
+    const object = topology.objects[name];
+    const features = (object ? object.geometries : []).map(geometry => {
+        let decoded = null;
+        if (geometry.type === 'Polygon') {
+            decoded = { type: 'Polygon', coordinates: geometry.arcs.map(ring => topologyRing(arcs, ring)) };
+        } else if (geometry.type === 'MultiPolygon') {
+            decoded = {
+                type: 'MultiPolygon',
+                coordinates: geometry.arcs.map(polygon => polygon.map(ring => topologyRing(arcs, ring)))
+            };
+        }
+        return { type: 'Feature', properties: geometry.properties || {}, geometry: decoded };
+    });
+    return { type: 'FeatureCollection', features };
+}
+
+// Rebuilds the corporation_mandals.json shape (wards nested in ward_features)
+// from data/corporation_mandals.topojson; resolves to null when it is unavailable
+async function loadCorporationTopology(url = 'data/corporation_mandals.topojson') {
+    try {
+        const response = await fetch(url);
+        if (!response.ok) return null;
+        const topology = await response.json();
+
+        const wardsByMandal = {};
+        topologyFeatures(topology, 'wards').features.forEach(ward => {
+            const { mandal_key, ...properties } = ward.properties;
+            (wardsByMandal[mandal_key] = wardsByMandal[mandal_key] || []).push({ ...ward, properties });
+        });
+
+        const mandals = topologyFeatures(topology, 'mandals');
+        mandals.features.forEach(feature => {
+            const { mandal_key, ...properties } = feature.properties;
+            feature.properties = { ...properties, ward_features: wardsByMandal[mandal_key] || [] };
+        });
+        return mandals;
+    } catch (error) {
+        console.warn('Unable to load corporation topology', error);
+        return null;
+    }
+}
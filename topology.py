@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+TopoJSON writer with shared-arc encoding
+Rings are quantized to an integer grid, cut at junctions and deduplicated, so a
+boundary shared by two wards is stored once; topology.js decodes it in the pages
+"""
+
+from output_writer import write_json
+
+DEFAULT_QUANTIZATION = 1e6
+
+
+def _polygons(geometry):
+    """Rings of every polygon in a GeoJSON (Multi)Polygon, Feature or collection"""
+    if not geometry:
+        return None, []
+    if geometry.get('type') == 'Feature':
+        return _polygons(geometry.get('geometry'))
+    if geometry['type'] == 'Polygon':
+        return 'Polygon', [geometry['coordinates']]
+    if geometry['type'] == 'MultiPolygon':
+        return 'MultiPolygon', geometry['coordinates']
+    if geometry['type'] in ('GeometryCollection', 'FeatureCollection'):
+        parts = geometry.get('geometries') or [f.get('geometry') for f in geometry.get('features', [])]
+        polygons = []
+        for part in parts:
+            polygons.extend(_polygons(part)[1])
+        return 'MultiPolygon', polygons
+    return None, []
+
+
+class TopologyBuilder:
+    """Collects named objects and encodes them into one TopoJSON topology."""
+
+    def __init__(self, quantization=DEFAULT_QUANTIZATION):
+        self.quantization = int(quantization)
+        self.objects = {}
+
+    def add(self, name, properties, geometry):
+        self.objects.setdefault(name, []).append((properties, geometry))
+
+    def _transform(self):
+        x0 = y0 = float('inf')
+        x1 = y1 = float('-inf')
+        for items in self.objects.values():
+            for _, geometry in items:
+                for polygon in _polygons(geometry)[1]:
+                    for ring in polygon:
+                        for x, y in (point[:2] for point in ring):
+                            x0, y0 = min(x0, x), min(y0, y)
+                            x1, y1 = max(x1, x), max(y1, y)
+        if x0 == float('inf'):
+            return [0, 0, 0, 0], [1, 1], [0, 0]
+        q = self.quantization - 1
+        kx = (x1 - x0) / q if x1 > x0 else 1
+        ky = (y1 - y0) / q if y1 > y0 else 1
+        return [x0, y0, x1, y1], [kx, ky], [x0, y0]
+
+    def build(self):
+        bbox, scale, translate = self._transform()
+        kx, ky = scale
+        x0, y0 = translate
+
+        def quantize_ring(ring):
+            points = []
+            for point in ring:
+                p = (int(round((point[0] - x0) / kx)), int(round((point[1] - y0) / ky)))
+                if not points or points[-1] != p:
+                    points.append(p)
+            if len(points) > 1 and points[0] == points[-1]:
+                points.pop()
+            return points if len(points) >= 3 else None
+
+        # Quantize every ring (open form, no closing point)
+        shapes = []  # (name, properties, type, [[ring, ...] per polygon])
+        for name, items in self.objects.items():
+            for properties, geometry in items:
+                geom_type, polygons = _polygons(geometry)
+                quantized = []
+                for polygon in polygons:
+                    rings = [quantize_ring(ring) for ring in polygon]
+                    if rings and rings[0] is not None:
+                        quantized.append([ring for ring in rings if ring is not None])
+                shapes.append((name, properties, geom_type, quantized))
+
+        # Junctions: points reached from different neighbours by different rings
+        neighbours = {}
+        junctions = set()
+        for _, _, _, polygons in shapes:
+            for polygon in polygons:
+                for ring in polygon:
+                    n = len(ring)
+                    for i, point in enumerate(ring):
+                        prev, nxt = ring[i - 1], ring[(i + 1) % n]
+                        pair = (prev, nxt) if prev <= nxt else (nxt, prev)
+                        seen = neighbours.setdefault(point, pair)
+                        if seen != pair:
+                            junctions.add(point)
+
+        arcs = []
+        arc_index = {}
+
+        def add_arc(points):
+            key = tuple(points)
+            if key in arc_index:
+                return arc_index[key]
+            reverse_key = key[::-1]
+            if reverse_key in arc_index:
+                return ~arc_index[reverse_key]
+            arc_index[key] = len(arcs)
+            arcs.append(points)
+            return arc_index[key]
+
+        def ring_arcs(ring):
+            cuts = [i for i, point in enumerate(ring) if point in junctions]
+            if not cuts:
+                # Closed ring without junctions: canonical start so shared rings match
+                start = ring.index(min(ring))
+                rotated = ring[start:] + ring[:start]
+                return [add_arc(rotated + rotated[:1])]
+
+            rotated = ring[cuts[0]:] + ring[:cuts[0]]
+            offsets = [i - cuts[0] for i in cuts] + [len(ring)]
+            closed = rotated + rotated[:1]
+            return [add_arc(closed[a:b + 1]) for a, b in zip(offsets, offsets[1:])]
+
+        objects = {}
+        for name, properties, geom_type, polygons in shapes:
+            encoded = [[ring_arcs(ring) for ring in polygon] for polygon in polygons]
+            if not encoded:
+                geometry = {'type': None}
+            elif geom_type == 'Polygon' and len(encoded) == 1:
+                geometry = {'type': 'Polygon', 'arcs': encoded[0]}
+            else:
+                geometry = {'type': 'MultiPolygon', 'arcs': encoded}
+            if properties:
+                geometry['properties'] = properties
+            objects.setdefault(name, {'type': 'GeometryCollection', 'geometries': []})
+            objects[name]['geometries'].append(geometry)
+
+        # Delta-encode arcs
+        encoded_arcs = []
+        for points in arcs:
+            px, py = 0, 0
+            deltas = []
+            for x, y in points:
+                deltas.append([x - px, y - py])
+                px, py = x, y
+            encoded_arcs.append(deltas)
+
+        return {
+            'type': 'Topology',
+            'bbox': bbox,
+            'transform': {'scale': scale, 'translate': translate},
+            'objects': objects,
+            'arcs': encoded_arcs,
+        }
+
+
+def write_topology(path, builder):
+    """Encode and write a topology; returns its size in bytes"""
+    # Coordinates are already integer deltas, so no quantizing on write
+    return write_json(path, builder.build(), precision=None, report=False, ensure_ascii=False)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Single ingest pass over the ward JSON sources
+Parses every ward file once into a compact columnar store (WKB geometries + ward
+attributes) that the boundary generators read instead of re-parsing GeoJSON
+"""
+
+import fcntl
+import json
+import mmap
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import shapely
+
+from build_cache import file_digest
+from geometry_array import from_geojson
+
+WARD_JSONS_PATH = '/Users/devandev/Desktop/ward_jsons'
+STORE_DIR = 'data/cache/ward_store'
+STORE_VERSION = 2
+LOCK_NAME = '.lock'
+
+FILE_COLUMNS = ('path', 'digest', 'mtime', 'size', 'first', 'count')
+WARD_COLUMNS = ('offset', 'length', 'valid', 'properties')
+
+
+def source_files(root):
+    """Relative paths of every ward JSON file under root, in a stable order"""
+    paths = []
+    for dirpath, dirs, files in os.walk(root):
+        dirs.sort()
+        for file in sorted(files):
+            if file.endswith('.json') and not file.startswith('.'):
+                paths.append(os.path.relpath(os.path.join(dirpath, file), root))
+    return paths
+
+
+def read_features(data):
+    """Features of a ward file, whether it is a collection or a single feature"""
+    if 'features' in data:
+        return data['features']
+    if 'geometry' in data:
+        return [data]
+    return []
+
+
+class WardStore:
+    """Read side of the ingest store: ward geometries and attributes by source file."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        # A writer may swap in a new index and delete the blob of the one just read
+        for attempt in range(3):
+            with open(os.path.join(store_dir, 'index.json'), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') != STORE_VERSION:
+                raise ValueError(f"ward store version {index.get('version')}, "
+                                 f"expected {STORE_VERSION}")
+            try:
+                self._blob = self._open_blob(os.path.join(store_dir, index['blob']))
+                break
+            except FileNotFoundError:
+                if attempt == 2:
+                    raise
+
+        self.root = index['root']
+        self.blob_name = index['blob']
+        self.files = index['files']
+        self.wards = index['wards']
+        self.skipped = index['skipped']
+        self._by_path = {path: i for i, path in enumerate(self.files['path'])}
+
+    @staticmethod
+    def _open_blob(blob_path):
+        with open(blob_path, 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        if self._blob is not None:
+            self._blob.close()
+            self._blob = None
+
+    def up_to_date(self, root, paths):
+        """True when the sources are exactly the ingested and skipped files, all unchanged"""
+        if len(paths) != len(self.files['path']) + len(self.skipped):
+            return False
+        for rel_path in paths:
+            stat = os.stat(os.path.join(root, rel_path))
+            i = self._by_path.get(rel_path)
+            if i is not None:
+                recorded = [self.files['mtime'][i], self.files['size'][i]]
+            else:
+                recorded = self.skipped.get(rel_path)
+            if recorded != [stat.st_mtime, stat.st_size]:
+                return False
+        return True
+
+    def _file_index(self, path):
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.root)
+        return self._by_path.get(path)
+
+    def paths(self):
+        """Relative paths of all ingested files"""
+        return list(self.files['path'])
+
+    def has(self, path):
+        return self._file_index(path) is not None
+
+    def digest(self, path):
+        """Content hash of the source file, or None if it was not ingested"""
+        i = self._file_index(path)
+        return None if i is None else self.files['digest'][i]
+
+    def wkb_bytes(self, ward_idx):
+        offset = self.wards['offset'][ward_idx]
+        return self._blob[offset:offset + self.wards['length'][ward_idx]]
+
+    def wards_for(self, path):
+        """Wards of one source file as dicts with properties, shape and validity"""
+        i = self._file_index(path)
+        if i is None:
+            return None
+
+        first = self.files['first'][i]
+        ward_range = range(first, first + self.files['count'][i])
+        shapes = self.geometries(ward_range)
+        return [{
+            'properties': self.wards['properties'][ward_idx],
+            'shape': geom,
+            'valid': self.wards['valid'][ward_idx],
+        } for ward_idx, geom in zip(ward_range, shapes)]
+
+    def geometries(self, ward_indexes):
+        """Geometry array for the given ward indexes, decoded in one from_wkb call"""
+        blobs = np.empty(len(ward_indexes), dtype=object)
+        blobs[:] = [self.wkb_bytes(ward_idx) for ward_idx in ward_indexes]
+        return shapely.from_wkb(blobs)
+
+
+@contextmanager
+def store_lock(store_dir):
+    """Exclusive lock on the store, held by whoever checks and rewrites it"""
+    os.makedirs(store_dir, exist_ok=True)
+    with open(os.path.join(store_dir, LOCK_NAME), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def open_previous(root, store_dir):
+    """The current store for root, or None if there is none (or it is unreadable)"""
+    if not os.path.exists(os.path.join(store_dir, 'index.json')):
+        return None
+    try:
+        previous = WardStore(store_dir)
+    except (OSError, ValueError, KeyError):
+        return None
+    if previous.root != root:
+        previous.close()
+        return None
+    return previous
+
+
+def remove_stale(store_dir, blob_name):
+    """Blobs of replaced indexes and temp files of interrupted writers"""
+    for name in os.listdir(store_dir):
+        stale_blob = name.startswith('geometries.') and name.endswith('.wkb')
+        if (stale_blob and name != blob_name) or name.endswith('.tmp'):
+            try:
+                os.remove(os.path.join(store_dir, name))
+            except FileNotFoundError:
+                pass
+
+
+def ingest(root=WARD_JSONS_PATH, store_dir=STORE_DIR, verbose=True):
+    """Bring the store up to date with the sources; only changed files are parsed"""
+    with store_lock(store_dir):
+        previous = open_previous(root, store_dir)
+        paths = source_files(root)
+        if previous is not None and previous.up_to_date(root, paths):
+            if verbose:
+                print(f"📦 Ward store up to date: {len(paths)} files, "
+                      f"{len(previous.wards['offset'])} wards")
+            return previous
+
+        files = {column: [] for column in FILE_COLUMNS}
+        wards = {column: [] for column in WARD_COLUMNS}
+        skipped = {}
+        parsed = reused = failed = 0
+
+        # The index names its blob, so a reader never pairs a new blob with an old index
+        blob_name = f'geometries.{time.time_ns():x}.wkb'
+        tmp_blob_path = os.path.join(store_dir, f'{blob_name}.{os.getpid()}.tmp')
+
+        with open(tmp_blob_path, 'wb') as blob:
+            for rel_path in paths:
+                abs_path = os.path.join(root, rel_path)
+                stat = os.stat(abs_path)
+                old = previous._file_index(rel_path) if previous else None
+
+                # Unchanged stat → reuse without even hashing; otherwise hash, then parse if needed
+                digest = None
+                if old is not None and previous.files['mtime'][old] == stat.st_mtime \
+                        and previous.files['size'][old] == stat.st_size:
+                    digest = previous.files['digest'][old]
+                else:
+                    with open(abs_path, 'rb') as f:
+                        raw = f.read()
+                    digest = file_digest(raw)
+                    if old is not None and previous.files['digest'][old] != digest:
+                        old = None
+
+                first = len(wards['offset'])
+                if old is not None:
+                    old_first = previous.files['first'][old]
+                    for ward_idx in range(old_first, old_first + previous.files['count'][old]):
+                        geom_bytes = previous.wkb_bytes(ward_idx)
+                        wards['offset'].append(blob.tell())
+                        wards['length'].append(len(geom_bytes))
+                        wards['valid'].append(previous.wards['valid'][ward_idx])
+                        wards['properties'].append(previous.wards['properties'][ward_idx])
+                        blob.write(geom_bytes)
+                    reused += 1
+                else:
+                    try:
+                        features = read_features(json.loads(raw))
+                        geoms = from_geojson([feature.get('geometry') for feature in features])
+                        if shapely.is_missing(geoms).any():
+                            raise ValueError('feature without a readable geometry')
+                    except Exception as e:
+                        failed += 1
+                        # Remembered by stat, so an unchanged bad file does not force a rewrite
+                        skipped[rel_path] = [stat.st_mtime, stat.st_size]
+                        if verbose:
+                            print(f"❌ Error ingesting {abs_path}: {e}")
+                        continue
+
+                    valid = shapely.is_valid(geoms)
+                    for feature, geom_bytes, is_valid in zip(features, shapely.to_wkb(geoms), valid):
+                        wards['offset'].append(blob.tell())
+                        wards['length'].append(len(geom_bytes))
+                        wards['valid'].append(bool(is_valid))
+                        wards['properties'].append(feature.get('properties') or {})
+                        blob.write(geom_bytes)
+                    parsed += 1
+
+                files['path'].append(rel_path)
+                files['digest'].append(digest)
+                files['mtime'].append(stat.st_mtime)
+                files['size'].append(stat.st_size)
+                files['first'].append(first)
+                files['count'].append(len(wards['offset']) - first)
+
+        if previous is not None:
+            previous.close()
+        os.replace(tmp_blob_path, os.path.join(store_dir, blob_name))
+
+        index_path = os.path.join(store_dir, 'index.json')
+        tmp_index_path = f'{index_path}.{os.getpid()}.tmp'
+        with open(tmp_index_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STORE_VERSION, 'root': root, 'blob': blob_name,
+                       'files': files, 'wards': wards, 'skipped': skipped},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_index_path, index_path)
+        remove_stale(store_dir, blob_name)
+
+        if verbose:
+            print(f"📦 Ward store: {len(files['path'])} files, {len(wards['offset'])} wards "
+                  f"({parsed} parsed, {reused} reused, {failed} failed)")
+        return WardStore(store_dir)
+
+
+def load_store(root=WARD_JSONS_PATH, store_dir=STORE_DIR):
+    """Open the ward store, ingesting any new or changed source files first"""
+    return ingest(root, store_dir)
+
+
+if __name__ == '__main__':
+    ingest(sys.argv[1] if len(sys.argv) > 1 else WARD_JSONS_PATH)